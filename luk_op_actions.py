@@ -0,0 +1,111 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''Реестр действий выполняемого сценария.
+
+Каждое действие - запись с явным состоянием:
+    PENDING  - ждет окончания задержки старта
+    ARMED    - однократное действие ждет выполнения своего условия
+    PERIODIC - повторяемое действие в работе
+    DONE     - однократное действие выполнено и больше не проверяется
+    DISABLED - отключено во время выполнения (enable возвращает его в PENDING)
+Записи разложены по корзинам состояний, поэтому число живых действий известно сразу,
+а выполненные и отключенные не попадают ни в очередь сроков, ни в ожидание изменений.
+Действие доступно по ключу сценария.
+
+Повторяемые действия идут по сетке номинальных сроков last_time + k * period. Если цикл отстал
+на несколько периодов, пропущенные сроки обрабатываются по политике догона (catch_up):
+    SKIP  - выполнить один раз и вернуться на сетку
+    BURST - выполнить за каждый пропущенный срок
+    MERGE - один объединенный вызов за все пропущенные сроки (если функция его поддерживает: func.merge(n))
+Период повторяемого действия не меньше MIN_PERIOD: при периоде 0 следующий срок совпадал бы с текущим
+моментом, и цикл контроллера выполнял бы действие без конца, не доходя до ожидания.
+'''
+
+PENDING, ARMED, PERIODIC, DONE, DISABLED = 'pending', 'armed', 'periodic', 'done', 'disabled'
+STATES = (PENDING, ARMED, PERIODIC, DONE, DISABLED)
+LIVE_STATES = (PENDING, ARMED, PERIODIC)
+
+SKIP, BURST, MERGE = 'skip', 'burst', 'merge'
+CATCH_UP_POLICIES = (SKIP, BURST, MERGE)
+
+MIN_PERIOD = 0.01  # наименьший период повторяемого действия, с
+
+
+def due_periods(last, period, now):
+    '''Сколько сроков повторяемого действия наступило к моменту now после номинального срока last (не меньше 1)'''
+    if period <= 0:
+        return 1
+    return max(1, int((now - last) // period))
+
+
+# Запись действия: кортеж сценария (функция, условие, период, задержка) разобран по полям
+class ActionRecord:
+    __slots__ = ('index', 'key', 'func', 'cond', 'period', 'delay', 'state', 'runs', 'last_time', 'due', 'deps',
+                 'catch_up', 'fresh', 'fired', 'overruns', 'missed', 'max_lag')
+
+    def __init__(self, index, key, action, now):
+        self.index = index
+        self.key = key
+        self.func, cond, period, self.delay = action
+        self.period = period if period == -1 else max(period, MIN_PERIOD)
+        self.cond = cond if callable(cond) else None
+        self.state = PENDING
+        self.runs = 0  # сколько раз действие выполнялось
+        self.last_time = now  # номинальный срок последнего выполнения (для периода повторяемых действий)
+        self.due = None  # срок ближайшей проверки в очереди контроллера (None - не запланировано)
+        self.deps = ()  # ключи, изменения которых ждет условие
+        self.catch_up = getattr(self.func, 'catch_up', None)  # политика догона (None - политика контроллера)
+        self.fresh = True  # следующее срабатывание начинает отсчет периода заново (первое или после ожидания условия)
+        self.fired = 0  # срабатываний по сроку
+        self.overruns = 0  # срабатываний с отставанием на период и больше
+        self.missed = 0  # пропущенных при этом сроков
+        self.max_lag = 0.0  # наибольшее отставание срабатывания от номинального срока, с
+
+    @property
+    def periodic(self):
+        return self.period != -1
+
+    def __repr__(self):
+        return '<ActionRecord %s %s>' % (self.key, self.state)
+
+
+class ActionRegistry:
+    def __init__(self):
+        self.records = []  # индекс -> запись (индекс хранится в очереди сроков и в зависимостях)
+        self.by_key = {}
+        self.buckets = {state: set() for state in STATES}  # состояние -> индексы записей
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, key):
+        return self.by_key[key]
+
+    def __contains__(self, key):
+        return key in self.by_key
+
+    def add(self, key, action, now):
+        record = ActionRecord(len(self.records), key, action, now)
+        self.records.append(record)
+        self.by_key[key] = record
+        self.buckets[PENDING].add(record.index)
+        return record
+
+    def move(self, record, state):
+        '''Перевести запись в состояние state'''
+        if record.state != state:
+            self.buckets[record.state].discard(record.index)
+            self.buckets[state].add(record.index)
+            record.state = state
+
+    def in_state(self, state):
+        return [self.records[i] for i in sorted(self.buckets[state])]
+
+    @property
+    def live(self):
+        '''Число действий, которые еще могут выполниться'''
+        return sum(len(self.buckets[state]) for state in LIVE_STATES)
+
+    def counts(self):
+        return {state: len(self.buckets[state]) for state in STATES}
@@ -0,0 +1,302 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''Архив журналов сеансов (luk_op_journal) для запросов по тысячам сеансов без разбора текстовых журналов.
+
+Архив - каталог с колонками в файлах .npy, которые открываются отображением в память:
+    session.npy (uint32), time.npy (float64), kind.npy (uint8), name.npy (int16), value.npy (float64)
+Строки упорядочены по сеансу и времени. Индексы:
+    session_start.npy - смещение первой строки каждого сеанса (и общее число строк в конце)
+    by_key.npy - номера строк, упорядоченные по ключу (вид, имя), внутри ключа - по сеансу и времени;
+                 диапазон ключа в by_key записан в archive.json
+archive.json - таблица имен (коды элементов, переменные, кнопки), сеансы и диапазоны ключей.
+
+Условия запросов - сравнение имени (код элемента или переменная temp, crit_t, timer) с числом
+или другим именем: "temp > crit_t", "зугт == 1". Значение имени между записями - последнее записанное.
+
+Примеры:
+    python luk_op_archive.py build archive/ runs/*.lukj
+    python luk_op_archive.py info archive/
+    python luk_op_archive.py between archive/ "temp > crit_t" "зугт == 1"
+    python luk_op_archive.py first archive/ "сс == 1"
+'''
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import operator
+
+import numpy as np
+
+from luk_op_journal import JournalReader, STATE, VAR, CLICK, END, SNAPSHOT, KIND_NAMES
+
+COLUMNS = (('session', np.uint32), ('time', np.float64), ('kind', np.uint8), ('name', np.int16), ('value', np.float64))
+FORMAT_VERSION = 1
+
+_COMPARE_OPS = {'==': operator.eq, '!=': operator.ne, '<': operator.lt, '<=': operator.le,
+                '>': operator.gt, '>=': operator.ge}
+_CONDITION = re.compile(r'^\s*(\w+)\s*(==|!=|<=|>=|<|>)\s*(\S+)\s*$')
+
+
+def _journal_rows(reader, names):
+    '''Строки журнала без повторных снимков: первый снимок дает начальное состояние, остальные
+    дублируют уже записанные изменения. Возвращает (время, вид, индекс имени, значение)'''
+    records = reader.records
+    kind = records['kind']
+    keep = kind != SNAPSHOT
+    snapshots = reader.snapshots
+    for start, n in zip(snapshots[1:], records['arg'][snapshots[1:]]):
+        keep[start + 1:start + 1 + n] = False
+    records = records[keep]
+    kind = records['kind']
+    arg = records['arg']
+    name = np.full(len(records), -1, dtype=np.int16)
+    for k, table in ((STATE, reader.codes), (VAR, reader.variables), (CLICK, reader.buttons)):
+        if table:
+            lookup = np.array([names.setdefault(n, len(names)) for n in table], dtype=np.int16)
+            mask = kind == k
+            name[mask] = lookup[arg[mask]]
+    value = records['value'].copy()
+    value[kind == END] = arg[kind == END]  # код завершения
+    return records['time'], kind, name, value
+
+
+def _merge(a, b):
+    '''Слияние двух возрастающих массивов без общих элементов за линейное время'''
+    out = np.empty(len(a) + len(b), dtype=np.result_type(a, b))
+    at = np.searchsorted(a, b) + np.arange(len(b))
+    taken = np.zeros(len(out), dtype=bool)
+    taken[at] = True
+    out[at] = b
+    out[~taken] = a
+    return out
+
+
+def _group_starts(keys):
+    '''Индексы первых элементов групп равных значений в упорядоченном массиве keys'''
+    return np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1]))) if len(keys) else np.empty(0, np.int64)
+
+
+def _group_ends(keys):
+    '''Индексы последних элементов групп равных значений в упорядоченном массиве keys'''
+    return np.flatnonzero(np.concatenate((keys[1:] != keys[:-1], [True]))) if len(keys) else np.empty(0, np.int64)
+
+
+def build_archive(path, journals):
+    '''Собрать архив в каталоге path из файлов журналов; вернуть число строк'''
+    names = {}
+    sessions = []
+    columns = {column: [] for column, _ in COLUMNS}
+    for n, journal in enumerate(journals):
+        reader = JournalReader(journal)
+        t, kind, name, value = _journal_rows(reader, names)
+        columns['session'].append(np.full(len(t), n, dtype=np.uint32))
+        columns['time'].append(t)
+        columns['kind'].append(kind)
+        columns['name'].append(name)
+        columns['value'].append(value)
+        sessions.append({'journal': os.path.abspath(journal), 'started': reader.header['started'],
+                         'meta': reader.header['meta'], 'rows': len(t)})
+    os.makedirs(path, exist_ok=True)
+    data = {}
+    for column, dtype in COLUMNS:
+        data[column] = np.concatenate(columns[column]).astype(dtype) if columns[column] else np.empty(0, dtype)
+        np.save(os.path.join(path, column + '.npy'), data[column])
+    counts = np.array([s['rows'] for s in sessions], dtype=np.int64)
+    np.save(os.path.join(path, 'session_start.npy'), np.concatenate(([0], np.cumsum(counts))))
+    key = data['kind'].astype(np.int64) * 65536 + data['name'].astype(np.int64) + 1  # имя -1 (END) -> 0
+    by_key = np.argsort(key, kind='stable')  # устойчивая сортировка сохраняет порядок сеанса и времени
+    np.save(os.path.join(path, 'by_key.npy'), by_key)
+    sorted_key = key[by_key]
+    keys, starts = np.unique(sorted_key, return_index=True)
+    stops = np.append(starts[1:], len(sorted_key))
+    table = {}
+    name_list = sorted(names, key=names.get)
+    for k, start, stop in zip(keys.tolist(), starts.tolist(), stops.tolist()):
+        kind, name = divmod(k, 65536)
+        table['%d:%d' % (kind, name - 1)] = (start, stop)
+    with open(os.path.join(path, 'archive.json'), 'w', encoding='utf-8') as f:
+        json.dump({'version': FORMAT_VERSION, 'names': name_list, 'sessions': sessions, 'keys': table},
+                  f, ensure_ascii=False)
+    return len(key)
+
+
+class Archive:
+    def __init__(self, path):
+        with open(os.path.join(path, 'archive.json'), encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('version') != FORMAT_VERSION:
+            raise ValueError('%s: неподдерживаемая версия архива' % path)
+        self.path = path
+        self.names = meta['names']
+        self.name_index = {name: i for i, name in enumerate(self.names)}
+        self.sessions = meta['sessions']
+        self.keys = {tuple(map(int, k.split(':'))): tuple(v) for k, v in meta['keys'].items()}
+        load = lambda name: np.load(os.path.join(path, name + '.npy'), mmap_mode='r')
+        for column, _ in COLUMNS:
+            setattr(self, column, load(column))
+        self.session_start = load('session_start')
+        self.by_key = load('by_key')
+
+    def __len__(self):
+        return len(self.time)
+
+    def rows(self, kind=None, name=None, session=None):
+        '''Номера строк (по возрастанию) с видом kind, именем name (код или переменная) и в сеансе session'''
+        if kind is None and name is not None:  # имена уникальны: коды элементов, переменные и кнопки не совпадают
+            i = self.name_index.get(name)
+            kind = next((k for k, n in self.keys if n == i), STATE)
+        if kind is not None:
+            if name is None:
+                parts = [self.by_key[a:b] for (k, _), (a, b) in self.keys.items() if k == kind]
+                rows = np.sort(np.concatenate(parts)) if parts else np.empty(0, np.int64)
+            else:
+                i = self.name_index.get(name)
+                a, b = self.keys.get((kind, i), (0, 0)) if i is not None else (0, 0)
+                rows = np.asarray(self.by_key[a:b])
+            if session is not None:
+                lo, hi = self.session_start[session], self.session_start[session + 1]
+                rows = rows[(rows >= lo) & (rows < hi)]
+            return rows
+        if session is not None:
+            return np.arange(self.session_start[session], self.session_start[session + 1])
+        return np.arange(len(self))
+
+    def _value_at(self, rows, points):
+        '''Последнее значение из строк rows на моменты строк points того же сеанса (NaN - еще не записано)'''
+        if not len(rows):
+            return np.full(len(points), np.nan)
+        i = np.searchsorted(rows, points, side='right') - 1
+        source = rows[np.maximum(i, 0)]
+        valid = (i >= 0) & (self.session[source] == self.session[points])
+        return np.where(valid, self.value[source], np.nan)
+
+    def where(self, condition):
+        '''Строки, на которых условие "имя оп имя|число" становится или остается выполненным'''
+        points, satisfied = self.evaluate(condition)
+        return points[satisfied]
+
+    def evaluate(self, condition):
+        '''Строки, меняющие значения операндов условия, и выполнено ли условие после каждой из них'''
+        match = _CONDITION.match(condition)
+        if match is None:
+            raise ValueError('условие должно иметь вид "имя оп значение": %s' % condition)
+        left, op, right = match.groups()
+        try:
+            right = float(right)
+        except ValueError:
+            pass
+        operands = [left] + ([right] if isinstance(right, str) and right != left else [])
+        for name in operands:
+            if name not in self.name_index:
+                raise ValueError('в архиве нет имени "%s"' % name)
+        sources = [self.rows(name=name) for name in operands]
+        points = _merge(*sources) if len(sources) > 1 else sources[0]  # строки разных ключей не совпадают
+        a = self._value_at(sources[0], points)
+        if len(sources) > 1:
+            b = self._value_at(sources[1], points)
+        else:
+            b = a if right == left else right  # имя, сравниваемое с самим собой, - один источник строк
+        with np.errstate(invalid='ignore'):
+            return points, _COMPARE_OPS[op](a, b) & ~np.isnan(a) & ~np.isnan(b)
+
+    def first(self, rows, after=None):
+        '''Время первой из строк rows в каждом сеансе (не раньше after[сеанс], если задано); NaN - не было'''
+        result = np.full(len(self.sessions), np.nan)
+        if after is not None:
+            limit = after[self.session[rows]]
+            rows = rows[self.time[rows] >= limit]  # сравнение с NaN ложно - сеансы без начала отбрасываются
+        first = rows[_group_starts(self.session[rows])]
+        result[self.session[first]] = self.time[first]
+        return result
+
+    def between(self, start, stop):
+        '''Для каждого сеанса: момент первого выполнения условия start и первого выполнения stop после него.
+        Возвращает (начала, концы, длительности) - массивы по сеансам с NaN, если момента не было'''
+        t0 = self.first(self.where(start))
+        points, satisfied = self.evaluate(stop)
+        t1 = self.first(points[satisfied], after=t0)
+        # условие stop могло выполниться раньше start и держаться: тогда оно выполнено уже в момент start
+        sessions = self.session[points]
+        with np.errstate(invalid='ignore'):
+            before = self.time[points] <= t0[sessions]
+        before = np.flatnonzero(before)
+        held = before[_group_ends(sessions[before])]  # последняя строка до start в каждом сеансе
+        held = held[satisfied[held]]
+        t1[sessions[held]] = t0[sessions[held]]
+        return t0, t1, t1 - t0
+
+    def results(self):
+        '''Код завершения каждого сеанса (NaN - не завершен) и время завершения'''
+        rows = self.rows(kind=END)
+        codes = np.full(len(self.sessions), np.nan)
+        first = rows[_group_starts(self.session[rows])]
+        codes[self.session[first]] = self.value[first]
+        return codes, self.first(rows)
+
+
+def _summary(values):
+    done = values[~np.isnan(values)]
+    if not len(done):
+        return 'нет данных'
+    return 'n=%d, мин %.3f, медиана %.3f, p90 %.3f, макс %.3f' % (
+        len(done), done.min(), np.median(done), np.percentile(done, 90), done.max())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Архив журналов сеансов тренажера и запросы к нему')
+    commands = parser.add_subparsers(dest='command', required=True)
+    build = commands.add_parser('build', help='собрать архив из журналов (перезаписывает архив)')
+    build.add_argument('archive')
+    build.add_argument('journals', nargs='+')
+    info = commands.add_parser('info', help='сводка архива')
+    info.add_argument('archive')
+    first = commands.add_parser('first', help='момент первого выполнения условия в каждом сеансе')
+    first.add_argument('archive')
+    first.add_argument('condition')
+    between = commands.add_parser('between', help='время от выполнения условия start до условия stop')
+    between.add_argument('archive')
+    between.add_argument('start')
+    between.add_argument('stop')
+    for command in (first, between):
+        command.add_argument('-v', '--verbose', action='store_true', help='вывести значение по каждому сеансу')
+    args = parser.parse_args(argv)
+    started = time.perf_counter()
+    try:
+        if args.command == 'build':
+            rows = build_archive(args.archive, args.journals)
+            print('%s: сеансов %d, строк %d за %.2f с' % (args.archive, len(args.journals), rows,
+                                                          time.perf_counter() - started))
+            return 0
+        archive = Archive(args.archive)
+        if args.command == 'info':
+            kinds = np.bincount(archive.kind, minlength=max(KIND_NAMES) + 1)
+            codes, _ = archive.results()
+            print('%s: сеансов %d, строк %d' % (args.archive, len(archive.sessions), len(archive)))
+            print('  ' + ', '.join('%s: %d' % (KIND_NAMES[k], kinds[k]) for k in (STATE, VAR, CLICK, END)))
+            print('  успех %d, провал %d, не завершено %d' % ((codes == 0).sum(), (codes == 1).sum(),
+                                                             np.isnan(codes).sum()))
+            print('  имена: ' + ', '.join(archive.names))
+            return 0
+        if args.command == 'first':
+            values = archive.first(archive.where(args.condition))
+            title = args.condition
+        else:
+            t0, t1, values = archive.between(args.start, args.stop)
+            title = '%s -> %s' % (args.start, args.stop)
+    except (ValueError, OSError) as e:
+        print(e, file=sys.stderr)
+        return 2
+    if args.verbose:
+        for n, value in enumerate(values):
+            print('%6d %s %s' % (n, '-' if np.isnan(value) else '%.3f' % value,
+                                 os.path.basename(archive.sessions[n]['journal'])))
+    print('%s: %s (%.3f с)' % (title, _summary(values), time.perf_counter() - started))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
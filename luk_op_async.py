@@ -0,0 +1,280 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''Контроллер сценариев на asyncio - альтернатива потоку ScenarioController.
+
+Каждое действие сценария - сопрограмма: задержка старта - await asyncio.sleep, условие - ожидание
+изменения прочитанных им значений (будущий объект на ключ, а не поток или опрос), действие может само
+быть сопрограммой. Цикл asyncio выполняется в GUI-потоке через мост QtAsyncioBridge, поэтому сигналы
+контроллера доходят до окна прямым вызовом, без передачи между потоками.
+
+Шаги, ждущие действий оператора, пишутся линейно, например:
+
+    async def guided_steps(sc):
+        await sc.until(lambda: sc.temp > sc.crit_t)
+        sc.log("Шаг 1: закрыть запорное устройство газовой турбины")
+        await sc.wait_state('зугт', 1)
+
+Запуск тренажера с этим контроллером: python luk_op_proto.py --asyncio
+'''
+
+import math
+import asyncio
+
+from PyQt5 import QtCore
+
+from luk_op_engine import ScenarioEngine
+from luk_op_actions import ActionRegistry, PENDING, ARMED, PERIODIC, DONE
+from luk_op_logpipe import LogPipeline
+from luk_op_display import DisplayChannel
+from luk_op_elements import BUTTONS
+
+
+# Мост между циклами событий: цикл asyncio выполняется порциями по таймеру Qt в GUI-потоке.
+# После каждой порции таймер взводится к ближайшему сроку цикла asyncio, в простое процессор не тратится
+class QtAsyncioBridge(QtCore.QObject):
+    def __init__(self, loop, parent=None):
+        QtCore.QObject.__init__(self, parent)
+        self.loop = loop
+        self.timer = QtCore.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(lambda: self.run_once())  # через атрибут: профилировщик оборачивает run_once
+
+    def wake(self):
+        '''Выполнить готовые обратные вызовы asyncio при ближайшем возврате в цикл Qt'''
+        self.timer.start(0)
+
+    def run_once(self):
+        loop = self.loop
+        loop.call_soon(loop.stop)
+        loop.run_forever()  # выполняет одну итерацию: все готовые к этому моменту обратные вызовы
+        interval = self.next_interval()
+        if interval is not None:
+            self.timer.start(interval)
+
+    def next_interval(self):
+        '''Мс до следующего срока цикла asyncio (None - ждать внешнего пробуждения).
+        Очереди цикла - детали реализации BaseEventLoop; без них опрашиваем раз в 10 мс'''
+        ready = getattr(self.loop, '_ready', None)
+        scheduled = getattr(self.loop, '_scheduled', None)
+        if ready is None or scheduled is None:
+            return 10
+        if ready:
+            return 0
+        if scheduled:
+            return max(0, int(math.ceil((scheduled[0].when() - self.loop.time()) * 1000)))
+        return None
+
+
+class AsyncScenarioController(ScenarioEngine, QtCore.QObject):
+
+    sig_scenario_ended = QtCore.pyqtSignal(int)
+    sig_highlight = QtCore.pyqtSignal(object)
+    sig_reset_style = QtCore.pyqtSignal(object)
+    sig_reset_all_styles = QtCore.pyqtSignal()
+
+    def __init__(self, temp=60, critical_temp=200, timer=60.0, log_file=None, loop=None):
+        QtCore.QObject.__init__(self)
+        self.log_pipeline = LogPipeline(path=log_file)
+        self.display = DisplayChannel()
+        self.loop = loop if loop is not None else asyncio.new_event_loop()
+        self.bridge = None  # QtAsyncioBridge, если цикл выполняется внутри Qt
+        self._waiters = {}  # ключ значения -> будущие объекты условий, ждущих его изменения
+        self._tasks = []
+        self._done = None
+        ScenarioEngine.__init__(self, temp, critical_temp, timer)
+        self.mode = 'test'
+        self.elems = {}
+        self.scenarios = {}  # режим -> связанный сценарий
+        self.coroutines = {}  # режим -> линейные сопрограммы, выполняемые вместе со сценарием
+
+    def attach_qt(self, parent=None):
+        '''Выполнять цикл asyncio контроллера в цикле событий Qt'''
+        self.bridge = QtAsyncioBridge(self.loop, parent)
+        return self.bridge
+
+    def notify_change(self, key):
+        if self.conditions is not None:
+            self.conditions.invalidate(key)
+        waiters = self._waiters.pop(key, None)
+        if waiters:
+            for fut in waiters:
+                if not fut.done():
+                    fut.set_result(None)
+            if self.bridge is not None:
+                self.bridge.wake()
+
+    async def until(self, cond, poll=None):
+        '''Дождаться выполнения условия cond. Перепроверка - при изменении прочитанных им значений,
+        а для условий, читающих время, - не реже чем раз в poll секунд.
+        Возвращает True, если условие пришлось ждать'''
+        waited = False
+        while True:
+            self.current_time = self.clock.now()
+            satisfied, deps = self.evaluate(cond)
+            if satisfied:
+                return waited
+            waited = True
+            fut = self.loop.create_future()
+            for key in deps:
+                self._waiters.setdefault(key, set()).add(fut)
+            handle = None
+            if self.TIME_KEY in deps:
+                handle = self.loop.call_later(poll or self.TIME_POLL_INTERVAL, self._resolve, fut)
+            try:
+                await fut
+            finally:
+                if handle is not None:
+                    handle.cancel()
+                for key in deps:
+                    waiters = self._waiters.get(key)
+                    if waiters is not None:
+                        waiters.discard(fut)
+
+    @staticmethod
+    def _resolve(fut):
+        if not fut.done():
+            fut.set_result(None)
+
+    async def wait_state(self, code, state):
+        '''Дождаться, пока элемент code перейдет в состояние state (например, по кнопке оператора)'''
+        elem = self.elems[code]
+        await self.until(lambda: elem.state == state)
+
+    async def sleep(self, seconds):
+        await asyncio.sleep(seconds)
+
+    async def sleep_until(self, deadline):
+        '''Дождаться срока deadline по часам контроллера (здесь профилировщик замеряет отставание от срока)'''
+        await asyncio.sleep(deadline - self.clock.now())
+
+    async def call(self, func):
+        result = func()
+        if asyncio.iscoroutine(result):
+            await result
+
+    async def run_action(self, record):
+        '''Сопрограмма одного действия сценария (запись реестра действий luk_op_actions).
+        Сроки повторяемого действия и догон пропущенных - как в ScenarioEngine.periodic_calls'''
+        cond = record.cond
+        if not record.periodic:
+            while True:
+                await self.start_delay(record)
+                self.actions.move(record, ARMED)
+                if cond is not None:
+                    await self.until(cond, self.TIME_POLL_INTERVAL)
+                if self.clock.now() >= self.start_time + record.delay:  # таймер мог быть сброшен, пока ждали условия
+                    break
+            await self.call(record.func)
+            record.runs += 1
+            self.actions.move(record, DONE)
+            return
+        while True:
+            await self.start_delay(record)  # задержка проверяется на каждом проходе, как в process_action
+            self.actions.move(record, PERIODIC)
+            if cond is not None and await self.until(cond, record.period):
+                record.fresh = True  # после ожидания условия период отсчитывается заново
+            now = self.clock.now()
+            if now < self.start_time + record.delay:  # таймер сброшен, пока ждали условия
+                continue
+            if now < record.last_time + record.period:
+                await self.sleep_until(record.last_time + record.period)
+                continue
+            self.current_time = now
+            for call in self.periodic_calls(record):
+                await self.call(call)
+
+    async def start_delay(self, record):
+        '''Дождаться окончания задержки старта действия (таймер мог быть сброшен и во время ожидания)'''
+        while self.clock.now() < self.start_time + record.delay:
+            self.actions.move(record, PENDING)
+            await self.sleep_until(self.start_time + record.delay)
+
+    async def run_scenario(self, scenario, coroutines=()):
+        '''Выполнить сценарий (словарь действий) и линейные сопрограммы coroutines(controller) до остановки'''
+        if self.profiler is not None:
+            scenario = self.profiler.instrument(scenario)
+        self.start_time = self.clock.now()
+        self.current_time = self.start_time
+        self.started_at = self.start_time
+        self._waiters = {}
+        self._done = self.loop.create_future()
+        self.active = True
+        self.actions = ActionRegistry()
+        records = [self.actions.add(key, action, self.start_time) for key, action in scenario.items()]
+        self._tasks = [self.loop.create_task(self.run_action(record)) for record in records]
+        self._tasks += [self.loop.create_task(coroutine(self)) for coroutine in coroutines]
+        for task in self._tasks:
+            task.add_done_callback(self._task_done)
+        try:
+            await self._done
+        finally:
+            for task in self._tasks:
+                task.cancel()
+            self._tasks = []
+
+    def _task_done(self, task):
+        if not task.cancelled() and task.exception() is not None:
+            self.log("Ошибка в действии сценария: %r" % task.exception(), 'error')
+
+    def stop(self):
+        self.active = False
+        if self._done is not None and not self._done.done():
+            self._done.set_result(None)
+        if self.bridge is not None:
+            self.bridge.wake()
+
+    def exit(self):
+        '''Совместимость с ScenarioController (поток завершать не нужно)'''
+
+    def start_mode(self, mode):
+        if self.active:
+            return
+        self.mode = mode
+        self.loop.create_task(self.run_scenario(self.scenarios[mode], self.coroutines.get(mode, ())))
+        self.log("=== Сценарий начат ===")
+        if self.bridge is not None:
+            self.bridge.wake()
+
+    def start_demo(self):
+        self.start_mode('demo')
+
+    def start_test(self):
+        self.start_mode('test')
+
+    # Вывод в интерфейс - те же сигналы, что у ScenarioController, но из GUI-потока (прямой вызов слотов)
+    def log(self, msg, level='info', code=None):
+        self.log_pipeline.write(msg, level, code)
+
+    def display_temp(self):
+        self.display.post('temp', (self.temp, self.crit_t))
+
+    def end_scenario(self, code):
+        self.sig_scenario_ended.emit(code)
+
+    def highlight(self, button):
+        self.sig_highlight.emit(button)
+
+    def style_reset(self, button):
+        self.sig_reset_style.emit(button)
+
+    def global_style_reset(self):
+        self.sig_reset_all_styles.emit()
+
+
+async def guided_steps(sc, window=None):
+    '''Пошаговая подсказка оператору: после превышения Ткрит каждый шаг ждет, пока оператор его выполнит'''
+    steps = ("Шаг 1: закрыть запорное устройство газовой турбины",
+             "Шаг 2: закрыть запорное устройство котла-утилизатора",
+             "Шаг 3: включить вентиляцию",
+             "Шаг 4: открыть запорную арматуру ПГ",
+             "Шаг 5: открыть запорную арматуру ГБ")
+    await sc.until(lambda: sc.temp > sc.crit_t)
+    sc.log("Температура превысила критическую. Необходимо принять меры", 'warning')
+    for text, (button, code, state) in zip(steps, BUTTONS):
+        sc.log(text)
+        widget = getattr(window, button) if window is not None else button
+        sc.highlight(widget)
+        await sc.wait_state(code, state)
+        sc.style_reset(widget)
+    sc.log("Все шаги выполнены. Сообщите диспетчеру")
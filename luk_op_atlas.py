@@ -0,0 +1,162 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''Сборка атласа спрайтов (выполняется заранее, а не при запуске тренажера).
+
+Читает img/*.png и raw_img/*.png. Для каждого спрайта из img готовит варианты всех состояний
+(STATE_COLORS из luk_op_sprites) в размерах виджетов, которые его показывают (по описанию окна .ui,
+с учетом множителей --scale); спрайты raw_img - статичные картинки, для них готовится только
+неокрашенный вариант. Окрашивание и растяжение - те же, что у SpriteCache, поэтому картинка не
+отличается от окрашенной на лету. У вариантов отрезаются прозрачные поля, и они укладываются
+полками в одну картинку img/atlas.png; положение каждого варианта - в индексе img/atlas.json.
+
+Пример:
+    python luk_op_atlas.py --scale 1 --scale 1.5
+    pyrcc5 luk_op_resources.qrc -o luk_op_resources_rc.py
+'''
+
+import os
+import sys
+import json
+import glob
+import argparse
+import xml.etree.ElementTree as ET
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')  # окно для сборки не нужно
+
+import numpy as np
+from PyQt5 import QtGui, QtCore
+
+from luk_op_sprites import SpriteCache, STATE_COLORS, PLAIN, FALLBACK_SPRITE
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+UI_FILE = os.path.join(BASE_DIR, 'luk_operator_prototype_upd_2.ui')
+OUTPUT = os.path.join(BASE_DIR, 'img', 'atlas')
+TINTED_DIR = 'img'  # спрайты элементов - все состояния
+PLAIN_DIR = 'raw_img'  # статичные картинки - без окрашивания
+ATLAS_WIDTH = 2048
+PADDING = 2  # промежуток между вариантами, чтобы при растяжении не захватывать соседей
+
+
+def used_sizes(ui_file=UI_FILE):
+    '''Размеры виджетов, показывающих спрайты: имя спрайта (img/втг) -> множество (ширина, высота).
+    Виджет элемента показывает спрайт элемента (или заглушку), остальные - картинку из дизайнера'''
+    from luk_op_elements import ELEMENTS
+    element_sprites = {}
+    for code, widget_name, _ in ELEMENTS:
+        name = '%s/%s' % (TINTED_DIR, code)
+        element_sprites[widget_name] = name if os.path.exists(os.path.join(BASE_DIR, name + '.png')) else \
+            '%s/%s' % (TINTED_DIR, FALLBACK_SPRITE)
+    sizes = {}
+    for widget in ET.parse(ui_file).iter('widget'):
+        rect = widget.find("property[@name='geometry']/rect")
+        if widget.get('class') != 'QLabel' or rect is None:
+            continue
+        name = element_sprites.get(widget.get('name'))
+        pixmap = widget.find("property[@name='pixmap']/pixmap")
+        if name is None and pixmap is not None:
+            name = os.path.splitext(pixmap.text.strip().lstrip(':/'))[0]
+        if name is not None:
+            sizes.setdefault(name, set()).add((int(rect.find('width').text), int(rect.find('height').text)))
+    return sizes
+
+
+def opaque_bounds(image):
+    '''Прямоугольник непрозрачной части картинки (x, y, ширина, высота); None - картинка пустая'''
+    image = image.convertToFormat(QtGui.QImage.Format_ARGB32_Premultiplied)
+    bits = image.constBits()
+    bits.setsize(image.byteCount())
+    pixels = np.frombuffer(bits, np.uint8).reshape(image.height(), image.bytesPerLine() // 4, 4)
+    alpha = pixels[:, :image.width(), 3 if sys.byteorder == 'little' else 0]
+    rows, cols = np.nonzero(alpha.any(axis=1))[0], np.nonzero(alpha.any(axis=0))[0]
+    if not len(rows):
+        return None
+    return int(cols[0]), int(rows[0]), int(cols[-1] - cols[0] + 1), int(rows[-1] - rows[0] + 1)
+
+
+def render_variants(sizes, scales=(1.0,), base_dir=BASE_DIR):
+    '''Варианты спрайтов: список (имя, (ш, в) виджета, ключ состояния, QImage непрозрачной части, смещение)'''
+    cache = SpriteCache(img_dir=os.path.join(base_dir, TINTED_DIR))
+    variants = []
+    paths = sorted(glob.glob(os.path.join(base_dir, TINTED_DIR, '*.png')) +
+                   glob.glob(os.path.join(base_dir, PLAIN_DIR, '*.png')))
+    for path in paths:
+        rel = os.path.relpath(path, base_dir).replace(os.sep, '/')
+        name = os.path.splitext(rel)[0]
+        if name == TINTED_DIR + '/atlas':  # сам атлас
+            continue
+        targets = sorted({(round(w * s), round(h * s)) for w, h in sizes.get(name, ()) for s in scales})
+        if not targets:
+            print('%s: не используется в окне, пропущен' % rel, file=sys.stderr)
+            continue
+        tinted = name.startswith(TINTED_DIR + '/')
+        for state in (STATE_COLORS if tinted else (None,)):
+            full = cache.render(path, state) if tinted else QtGui.QPixmap(path)
+            for width, height in targets:
+                image = full.scaled(width, height, QtCore.Qt.IgnoreAspectRatio,
+                                    QtCore.Qt.SmoothTransformation).toImage()
+                bounds = opaque_bounds(image)
+                if bounds is None:
+                    continue
+                x, y, w, h = bounds
+                variants.append((name, (width, height), PLAIN if state is None else str(state),
+                                 image.copy(x, y, w, h), (x, y)))
+    return variants
+
+
+def pack(variants, width=ATLAS_WIDTH, padding=PADDING):
+    '''Уложить варианты полками (по убыванию высоты); вернуть (позиции по порядку вариантов, высота атласа)'''
+    order = sorted(range(len(variants)), key=lambda i: -variants[i][3].height())
+    positions = [None] * len(variants)
+    x = y = shelf = 0
+    for i in order:
+        image = variants[i][3]
+        if image.width() > width:
+            raise ValueError('вариант %s шире атласа (%d > %d)' % (variants[i][0], image.width(), width))
+        if x + image.width() > width:
+            x, y, shelf = 0, y + shelf + padding, 0
+        positions[i] = (x, y)
+        x += image.width() + padding
+        shelf = max(shelf, image.height())
+    return positions, y + shelf
+
+
+def build_atlas(output=OUTPUT, scales=(1.0,), ui_file=UI_FILE, base_dir=BASE_DIR):
+    '''Собрать атлас: output.png и output.json. Возвращает (число вариантов, ширина, высота)'''
+    variants = render_variants(used_sizes(ui_file), scales, base_dir)
+    positions, height = pack(variants)
+    width = min(ATLAS_WIDTH, max((x + v[3].width() for v, (x, _) in zip(variants, positions)), default=1))
+    atlas = QtGui.QImage(width, max(height, 1), QtGui.QImage.Format_ARGB32_Premultiplied)
+    atlas.fill(QtCore.Qt.transparent)
+    painter = QtGui.QPainter(atlas)
+    painter.setCompositionMode(QtGui.QPainter.CompositionMode_Source)
+    sprites = {}
+    for (name, size, key, image, (ox, oy)), (x, y) in zip(variants, positions):
+        painter.drawImage(x, y, image)
+        entries = sprites.setdefault(name, {})
+        entries.setdefault(size, {})[key] = [x, y, image.width(), image.height(), ox, oy]
+    painter.end()
+    if not atlas.save(output + '.png'):
+        raise OSError('не удалось записать %s.png' % output)
+    index = {'version': 1, 'states': {str(s): c for s, c in STATE_COLORS.items()},
+             'sprites': {name: [{'size': list(size), 'rects': rects} for size, rects in sorted(entries.items())]
+                         for name, entries in sprites.items()}}
+    with open(output + '.json', 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+    return len(variants), width, height
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Сборка атласа окрашенных спрайтов')
+    parser.add_argument('--scale', action='append', type=float, metavar='МНОЖИТЕЛЬ',
+                        help='масштаб окна, для которого готовятся варианты (по умолчанию 1; можно несколько)')
+    parser.add_argument('-o', '--output', default=OUTPUT, help='путь атласа без расширения')
+    args = parser.parse_args(argv)
+    app = QtGui.QGuiApplication(sys.argv[:1])
+    count, width, height = build_atlas(args.output, tuple(args.scale or (1.0,)))
+    print('%s.png: вариантов %d, %dx%d' % (args.output, count, width, height))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,138 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''Пакетный прогон сценария по сетке параметров в нескольких процессах.
+
+Каждая точка сетки выполняется без интерфейса на виртуальном времени (luk_op_headless),
+результаты (код завершения и время) пишутся в CSV-файл, по строке на прогон.
+
+Параметры сетки (--grid имя=значение1,значение2,...):
+    critical_temp - Ткрит, устанавливаемая сценарием
+    raise_temp, lower_temp - шаг нагрева и охлаждения
+    timer - время на выполнение задания после превышения Ткрит, с
+    react - секунда, на которой оператор нажимает все кнопки устранения (none - не реагирует)
+    call - секунда, на которой оператор звонит диспетчеру (none - не звонит)
+
+Пример:
+    python luk_op_batch.py scenarios/test.json --grid critical_temp=180,200,220 --grid react=20,40,none \
+        --grid call=90 -j 4 -o results.csv
+'''
+
+import os
+import sys
+import csv
+import time
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+from luk_op_scenario import load_scenario, ScenarioError
+from luk_op_headless import HeadlessController
+from luk_op_elements import BUTTONS
+from luk_op_journal import Recorder
+
+PARAMETERS = ('critical_temp', 'raise_temp', 'lower_temp', 'timer', 'react', 'call')
+
+_plan = None  # план сценария в процессе-исполнителе (передается один раз при запуске процесса)
+
+
+def _init_worker(plan):
+    global _plan
+    _plan = plan
+
+
+def point_plan(plan, params):
+    '''План с аргументами операций из параметров точки сетки (ScenarioError - параметр нечему подставить)'''
+    if params.get('critical_temp') is not None:
+        plan = plan.with_crit_t(params['critical_temp'])
+    op_args = {}
+    if params.get('raise_temp') is not None:
+        op_args['raise_temp'] = (params['raise_temp'],)
+    if params.get('lower_temp') is not None:
+        op_args['lower_temp'] = (params['lower_temp'],)
+    if params.get('timer') is not None:
+        op_args['reset_timer'] = (params['timer'],)
+    if op_args:
+        plan = plan.with_args(**op_args)
+    return plan
+
+
+def run_point(params, plan=None, time_limit=600.0, record=None):
+    '''Выполнить один прогон с параметрами params (словарь); вернуть (код завершения, время завершения).
+    record - файл для журнала событий прогона (luk_op_journal)'''
+    plan = point_plan(plan if plan is not None else _plan, params)
+    clicks = []
+    if params.get('react') is not None:
+        clicks += [(params['react'], button) for button, _, _ in BUTTONS]
+    if params.get('call') is not None:
+        clicks.append((params['call'], 'btn_call'))
+    sc = HeadlessController(timer=params.get('timer') or 60.0, time_limit=time_limit, keep_log=False)
+    recorder = None
+    if record is not None:
+        meta = {name: value for name, value in params.items() if value is not None}
+        recorder = Recorder(record, scenario=plan.name, **meta).attach(sc, [b for b, _, _ in BUTTONS] + ['btn_call'])
+    result = sc.run_plan(plan, clicks)
+    if recorder is not None:
+        recorder.detach()
+    return result, sc.end_time
+
+
+def parse_grid(items):
+    '''Разобрать ["имя=з1,з2", ...] в упорядоченный словарь списков значений'''
+    grid = {}
+    for item in items:
+        name, _, values = item.partition('=')
+        if name not in PARAMETERS:
+            raise ValueError('неизвестный параметр сетки "%s" (допустимы: %s)' % (name, ', '.join(PARAMETERS)))
+        grid[name] = [None if v.strip().lower() == 'none' else float(v) for v in values.split(',')]
+    return grid
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Пакетный прогон сценария тренажера по сетке параметров')
+    parser.add_argument('scenario', help='файл сценария (scenarios/*.json)')
+    parser.add_argument('--grid', action='append', default=[], metavar='ИМЯ=З1,З2,...',
+                        help='значения параметра: ' + ', '.join(PARAMETERS))
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(), help='число процессов')
+    parser.add_argument('-o', '--output', default='results.csv', help='файл результатов (CSV)')
+    parser.add_argument('--limit', type=float, default=600.0, help='предел виртуального времени одного прогона, с')
+    parser.add_argument('--record-dir', metavar='КАТАЛОГ', help='записать журнал каждого прогона (для luk_op_archive)')
+    args = parser.parse_args(argv)
+    try:
+        grid = parse_grid(args.grid)
+        plan = load_scenario(args.scenario)
+    except (ValueError, ScenarioError, OSError) as e:
+        print(e, file=sys.stderr)
+        return 2
+    names = list(grid)
+    points = [dict(zip(names, values)) for values in itertools.product(*(grid[n] for n in names))]
+    try:  # параметры, которым нечего заменить в сценарии, - ошибка до запуска процессов
+        for point in points:
+            point_plan(plan, point)
+    except ScenarioError as e:
+        print(e, file=sys.stderr)
+        return 2
+    records = itertools.repeat(None)
+    if args.record_dir:
+        os.makedirs(args.record_dir, exist_ok=True)
+        records = [os.path.join(args.record_dir, 'run-%05d.lukj' % n) for n in range(len(points))]
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.jobs, initializer=_init_worker, initargs=(plan,)) as pool:
+        chunksize = max(1, len(points) // (4 * (args.jobs or 1)))
+        results = list(pool.map(run_point, points, itertools.repeat(None), itertools.repeat(args.limit), records,
+                                chunksize=chunksize))
+    with open(args.output, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['run'] + names + ['result', 'end_time'])
+        for n, (point, (result, end_time)) in enumerate(zip(points, results)):
+            writer.writerow([n] + ['' if point[name] is None else point[name] for name in names] +
+                            ['' if result is None else result, '' if end_time is None else '%.3f' % end_time])
+    elapsed = time.perf_counter() - started
+    summary = {code: sum(1 for r, _ in results if r == code) for code in (0, 1, None)}
+    print('%d прогонов за %.2f с: успех %d, провал %d, не завершено %d -> %s' %
+          (len(points), elapsed, summary[0], summary[1], summary[None], args.output))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
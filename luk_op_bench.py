@@ -0,0 +1,401 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''Набор замеров производительности горячих путей тренажера.
+
+Замеры:
+    tick[N]         - одна итерация цикла execute_scenario при N действиях в сценарии (виртуальное время)
+    conditions[N]   - перепроверка N условий с общими подусловиями после изменения температуры
+    set_state       - Element.set_state с перерисовкой спрайта
+    display.post    - Element.set_state с записью в канал состояния (как в потоке контроллера при интерфейсе)
+    apply_states    - сброс всех элементов установки и температуры одной групповой операцией
+    update_colors   - Element.update_colors (вариант из атласа или спрайт из кеша)
+    atlas.draw      - отрисовка спрайта элемента копированием из атласа (виджет 914x594)
+    log.write       - запись в журнал из потока контроллера (LogPipeline.write), на запись
+    log.flush       - выдача пачки из 1000 записей в модель журнала интерфейса
+    scale_elems[N]  - масштабирование окна с N виджетами
+    labels.frame[N] - кадр мнемосхемы с N символами-QLabel: смена состояния 10 символов и перерисовка
+    scene.frame[N]  - то же на сцене (--scene): перерисовываются только области измененных символов
+
+Для каждого замера выводятся медиана (p50) и 99-й перцентиль (p99) в микросекундах.
+Результаты можно сохранить как базовые (--save) и сравнивать с ними последующие прогоны (--compare):
+замер, у которого p50 вырос больше допуска, считается регрессией, и программа завершается с кодом 1.
+
+Пример:
+    python luk_op_bench.py --save bench_baseline.json
+    python luk_op_bench.py --compare bench_baseline.json --tolerance 0.25
+'''
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')  # окна для замеров не показываются
+
+from PyQt5 import QtWidgets, QtGui, QtCore
+
+from luk_op_engine import VirtualClock
+from luk_op_headless import HeadlessController
+from luk_op_log import LogPipeline, LogModel
+from luk_op_display import DisplayChannel
+from luk_op_scenario import compile_scenario
+from luk_op_proto import LukWidget, ScenarioController, Element, ELEMENTS
+from luk_op_sprites import sprite_atlas
+
+BENCHMARKS = []  # (имя, функция, аргументы); функция возвращает список длительностей одной операции в секундах
+
+SEED = 1  # замеры со случайностью воспроизводимы
+
+
+def benchmark(name, *variants):
+    '''Зарегистрировать замер; для каждого значения из variants - отдельный замер name[значение]'''
+    def register(func):
+        if variants:
+            for v in variants:
+                BENCHMARKS.append(('%s[%s]' % (name, v), func, (v,)))
+        else:
+            BENCHMARKS.append((name, func, ()))
+        return func
+    return register
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q / 100.0 * len(ordered)))]
+
+
+# Виртуальные часы, засекающие реальное время между ожиданиями: одно ожидание - одна итерация цикла
+class TickClock(VirtualClock):
+    def __init__(self, start=0.0):
+        VirtualClock.__init__(self, start)
+        self.samples = []
+        self._last = None
+
+    def wait_until(self, condition, deadline):
+        now = time.perf_counter()
+        if self._last is not None:
+            self.samples.append(now - self._last)
+        self._last = now
+        return VirtualClock.wait_until(self, condition, deadline)
+
+
+@benchmark('tick', 10, 100, 1000)
+def bench_tick(n_actions, duration=30.0):
+    '''Сценарий из n_actions действий: половина периодических, четверть ждет условия по состоянию элемента,
+    четверть - однократные по времени; сроки разнесены, поэтому в итерации срабатывает несколько действий'''
+    rnd = random.Random(SEED)
+    clock = TickClock()
+    sc = HeadlessController(time_limit=duration, keep_log=False, clock=clock)
+    elem = sc.elems['сс']
+    counter = [0]
+
+    def act():
+        counter[0] += 1
+
+    scenario = {}
+    for i in range(n_actions):
+        kind = i % 4
+        if kind in (0, 1):
+            scenario['periodic %d' % i] = (act, None, rnd.choice((0.5, 1.0, 2.0)), rnd.random())
+        elif kind == 2:
+            scenario['waiting %d' % i] = (act, lambda: elem.state == 1, -1, rnd.random())
+        else:
+            scenario['timed %d' % i] = (act, lambda: sc.current_time >= sc.start_time + duration / 2, -1, 0)
+    sc.call_at(duration, sc.stop)
+    sc.execute_scenario(scenario)
+    return clock.samples
+
+
+@benchmark('conditions', 10, 100, 1000)
+def bench_conditions(n_actions, repeat=200):
+    '''n_actions шагов сценария, ждущих нескольких общих условий (как шаги аварийной инструкции):
+    одна итерация - изменение температуры и перепроверка всех зависящих от нее условий'''
+    predicates = ('temp > crit_t', 'temp > crit_t and сс == 1',
+                  'зугт == 0 and зуку == 0 and втг == 1 and запг == 1 and загб == 1 and temp > crit_t')
+    actions = {'шаг %d' % i: {'do': ['log', 'шаг %d' % i], 'when': predicates[i % len(predicates)]}
+               for i in range(n_actions)}
+    sc = HeadlessController(keep_log=False)
+    sc.begin_scenario(sc.bind(compile_scenario({'name': 'bench', 'actions': actions})))
+    sc.step()
+    samples = []
+    for i in range(repeat):
+        t = time.perf_counter()
+        sc.temp = 60 + i % 2
+        sc.step()
+        samples.append(time.perf_counter() - t)
+    return samples
+
+
+def make_element(code='сс'):
+    '''Элемент, привязанный к виджету, при контроллере без журнала'''
+    sc = HeadlessController(keep_log=False)
+    return Element(sc, code, QtWidgets.QLabel(), 0)
+
+
+@benchmark('set_state')
+def bench_set_state(repeat=2000):
+    elem = make_element()
+    samples = []
+    for i in range(repeat):
+        t = time.perf_counter()
+        elem.set_state(i % 2)
+        samples.append(time.perf_counter() - t)
+    return samples
+
+
+@benchmark('display.post')
+def bench_display_post(repeat=2000):
+    elem = make_element()
+    elem.controller.display = DisplayChannel()
+    samples = []
+    for i in range(repeat):
+        t = time.perf_counter()
+        elem.set_state(i % 2)
+        samples.append(time.perf_counter() - t)
+    return samples
+
+
+@benchmark('apply_states')
+def bench_apply_states(repeat=500):
+    sc = HeadlessController(keep_log=False)
+    sc.display = DisplayChannel()
+    resets = [{code: (i + n) % 2 for n, (code, _, _) in enumerate(ELEMENTS)} for i in range(2)]
+    samples = []
+    for i in range(repeat):
+        values = dict(resets[i % 2], temp=60 + i % 2)
+        t = time.perf_counter()
+        sc.apply_states(values, 'Сброс')
+        samples.append(time.perf_counter() - t)
+    return samples
+
+
+@benchmark('update_colors')
+def bench_update_colors(repeat=2000):
+    elem = make_element()
+    samples = []
+    for i in range(repeat):
+        t = time.perf_counter()
+        elem.update_colors(i % 2)
+        samples.append(time.perf_counter() - t)
+    return samples
+
+
+@benchmark('atlas.draw')
+def bench_atlas_draw(repeat=500):
+    atlas = sprite_atlas()  # собран luk_op_atlas и входит в ресурсы
+    target = QtGui.QPixmap(914, 594)
+    rect = QtCore.QRectF(target.rect())
+    samples = []
+    for i in range(repeat):
+        target.fill(QtCore.Qt.transparent)
+        t = time.perf_counter()
+        painter = QtGui.QPainter(target)
+        atlas.draw(painter, 'img/втг', i % 5, rect)
+        painter.end()
+        samples.append(time.perf_counter() - t)
+    return samples
+
+
+@benchmark('log.write')
+def bench_log_write(blocks=200, block=1000):
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline = LogPipeline(console=False, path=os.path.join(tmp, 'bench.log'))
+        samples = []
+        for b in range(blocks):
+            t = time.perf_counter()
+            for i in range(block):
+                pipeline.write('Температура повысилась на 15 (тек. знач.: %d)' % i, 'info', 'сс')
+            samples.append((time.perf_counter() - t) / block)
+            pipeline.drain()
+        pipeline.close()
+    return samples
+
+
+@benchmark('log.flush')
+def bench_log_flush(blocks=200, block=1000):
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline = LogPipeline(console=False, path=os.path.join(tmp, 'bench.log'))
+        model = LogModel(history=5000, spill_path=os.path.join(tmp, 'spill.log'))
+        samples = []
+        for b in range(blocks):
+            for i in range(block):
+                pipeline.write('Температура повысилась на 15 (тек. знач.: %d)' % i, 'info', 'сс')
+            t = time.perf_counter()
+            model.append(pipeline.drain())
+            samples.append(time.perf_counter() - t)
+        model.close()
+        pipeline.close()
+    return samples
+
+
+@benchmark('scale_elems', 0, 100, 1000)
+def bench_scale_elems(n_widgets, repeat=50):
+    '''Масштабирование окна, в которое добавлено n_widgets виджетов сверх макета; размер чередуется'''
+    with tempfile.TemporaryDirectory() as tmp:
+        sc = ScenarioController(log_file=None)
+        sc.log_pipeline.writer.console = False
+        window = LukWidget(sc, log_spill_path=os.path.join(tmp, 'spill.log'))
+        window.log_timer.stop()
+        for code, widget_name, initial_state in ELEMENTS:
+            elem = Element(sc, code, getattr(window, widget_name), initial_state)
+            elem.update_colors(initial_state)
+            window.add_sprite_element(elem)
+        rnd = random.Random(SEED)
+        for i in range(n_widgets):
+            label = QtWidgets.QLabel(window.centralwidget)
+            label.setObjectName('bench_%d' % i)
+            label.setGeometry(rnd.randrange(0, 1000), rnd.randrange(0, 600), 20, 20)
+        width, height = window.width(), window.height()
+        samples = []
+        for i in range(repeat):
+            scale = 1.25 if i % 2 == 0 else 1.0
+            window.resize(round(width * scale), round(height * scale))
+            t = time.perf_counter()
+            window.scale_elems()
+            samples.append(time.perf_counter() - t)
+        window.close()
+        window.deleteLater()
+    return samples
+
+
+def bench_frame(n_symbols, scene, repeat=100, changed=10):
+    '''Окно с мнемосхемой и n_symbols символами (спрайт-заглушка) в случайных местах;
+    один кадр - смена состояния changed символов и обработка событий с перерисовкой'''
+    with tempfile.TemporaryDirectory() as tmp:
+        sc = ScenarioController(log_file=None)
+        sc.log_pipeline.writer.console = False
+        window = LukWidget(sc, log_spill_path=os.path.join(tmp, 'spill.log'))
+        window.log_timer.stop()
+        for code, widget_name, initial_state in ELEMENTS:
+            window.add_sprite_element(Element(sc, code, getattr(window, widget_name), initial_state))
+        rnd = random.Random(SEED)
+        symbols = []
+        for i in range(n_symbols):
+            label = QtWidgets.QLabel(window.centralwidget)
+            label.setObjectName('bench_%d' % i)
+            label.setGeometry(rnd.randrange(0, 880), rnd.randrange(0, 560), 24, 24)
+            label.setScaledContents(True)
+            symbols.append(Element(sc, 'символ %d' % i, label, 0))
+            window.add_sprite_element(symbols[-1])
+        if scene:
+            window.setup_scene()
+        for elem in window.sprite_elements:
+            elem.update_colors(0)
+        window.show()
+        app = QtWidgets.QApplication.instance()
+        app.processEvents()
+        samples = []
+        for i in range(repeat):
+            t = time.perf_counter()
+            for elem in rnd.sample(symbols, min(changed, n_symbols)):
+                elem.update_colors(rnd.randrange(5))
+            app.processEvents()
+            samples.append(time.perf_counter() - t)
+        window.close()
+        window.deleteLater()
+    return samples
+
+
+@benchmark('labels.frame', 100, 1000)
+def bench_labels_frame(n_symbols):
+    return bench_frame(n_symbols, False)
+
+
+@benchmark('scene.frame', 100, 1000)
+def bench_scene_frame(n_symbols):
+    return bench_frame(n_symbols, True)
+
+
+def run(names=None, rounds=1):
+    '''Выполнить замеры (все или с именами, содержащими одну из подстрок names); вернуть словарь результатов'''
+    results = {}
+    for name, func, args in BENCHMARKS:
+        if names and not any(n in name for n in names):
+            continue
+        samples = []
+        try:
+            for r in range(rounds):
+                samples += func(*args)
+        except Exception as e:  # замер сломанного пути не должен прерывать остальные
+            results[name] = {'error': '%s: %s' % (type(e).__name__, ' '.join(str(e).split()))}
+            continue
+        results[name] = {'n': len(samples), 'p50': percentile(samples, 50), 'p99': percentile(samples, 99)}
+    return results
+
+
+def compare(results, baseline, tolerance, names=None):
+    '''Вывести сравнение с базовыми результатами; вернуть список имен замеров с регрессией.
+    Регрессия - и замер, завершившийся ошибкой, и замер из базы (выбранный подстроками names), которого нет в результатах'''
+    regressions = []
+    print('%-18s %12s %12s %12s %8s' % ('замер', 'p50, мкс', 'база p50', 'p99, мкс', 'p50/база'))
+    for name, res in results.items():
+        base = baseline.get(name)
+        if 'error' in res:
+            regressions.append(name)
+            print('%-18s %s  ОШИБКА' % (name, res['error']))
+            continue
+        if base is None or 'p50' not in base:
+            print('%-18s %12.2f %12s %12.2f %8s' % (name, res['p50'] * 1e6, '-', res['p99'] * 1e6, '-'))
+            continue
+        ratio = res['p50'] / base['p50'] if base['p50'] > 0 else float('inf')
+        mark = ''
+        if ratio > 1 + tolerance:
+            regressions.append(name)
+            mark = '  РЕГРЕССИЯ'
+        print('%-18s %12.2f %12.2f %12.2f %8.2f%s' % (name, res['p50'] * 1e6, base['p50'] * 1e6, res['p99'] * 1e6,
+                                                      ratio, mark))
+    for name in baseline:
+        if name not in results and (not names or any(n in name for n in names)):
+            regressions.append(name)
+            print('%-18s %s' % (name, 'нет в результатах (замер удален или переименован)  ОШИБКА'))
+    return regressions
+
+
+def report(results):
+    print('%-18s %8s %12s %12s' % ('замер', 'n', 'p50, мкс', 'p99, мкс'))
+    for name, res in results.items():
+        if 'error' in res:
+            print('%-18s %s' % (name, res['error']))
+        else:
+            print('%-18s %8d %12.2f %12.2f' % (name, res['n'], res['p50'] * 1e6, res['p99'] * 1e6))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Замеры производительности горячих путей тренажера')
+    parser.add_argument('-k', action='append', default=[], metavar='ПОДСТРОКА', help='выполнить только эти замеры')
+    parser.add_argument('--rounds', type=int, default=3, help='число повторов каждого замера')
+    parser.add_argument('--save', metavar='ФАЙЛ', help='сохранить результаты как базовые')
+    parser.add_argument('--compare', metavar='ФАЙЛ', help='сравнить с сохраненными базовыми результатами')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='допустимый рост p50 относительно базы (доля)')
+    parser.add_argument('-l', '--list', action='store_true', help='перечислить замеры')
+    args = parser.parse_args(argv)
+    if args.list:
+        for name, func, _ in BENCHMARKS:
+            print(name)
+        return 0
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    results = run(args.k, args.rounds)
+    status = 0
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.tolerance, args.k)
+        if regressions:
+            print('Регрессии и ошибки: ' + ', '.join(regressions))
+            status = 1
+    else:
+        report(results)
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump({'python': platform.python_version(), 'platform': platform.platform(),
+                       'date': time.strftime('%Y-%m-%d %H:%M:%S'), 'results': results}, f, ensure_ascii=False, indent=1)
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
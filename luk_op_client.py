@@ -0,0 +1,152 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''Тонкий клиент тренажера: интерфейс обучаемого, сеанс которого выполняется на сервере (luk_op_server).
+
+Клиент только показывает события сеанса и передает нажатия кнопок; сценарии, таймеры и состояние
+установки живут на сервере.
+
+Пример:
+    python luk_op_client.py --host 127.0.0.1 --port 8765
+'''
+
+import sys
+import json
+import argparse
+
+from PyQt5 import QtCore, QtWidgets, QtNetwork
+
+from luk_op_logpipe import LogPipeline
+from luk_op_display import DisplayChannel
+from luk_op_state import StateStore
+from luk_op_proto import LukWidget, Element, ELEMENTS, BUTTONS
+from luk_op_server import DEFAULT_PORT
+
+
+# Контроллер, который только показывает события сеанса (см. luk_op_session): для LukWidget выглядит
+# как ScenarioController (те же сигналы и журнал), но состояние установки получает извне
+class EventController(QtCore.QObject):
+
+    sig_scenario_ended = QtCore.pyqtSignal(int)
+    sig_highlight = QtCore.pyqtSignal(object)
+    sig_reset_style = QtCore.pyqtSignal(object)
+    sig_reset_all_styles = QtCore.pyqtSignal()
+
+    headless = False
+    _reads = None  # условия на клиенте не вычисляются
+
+    def __init__(self):
+        QtCore.QObject.__init__(self)
+        self.log_pipeline = LogPipeline()
+        self.display = DisplayChannel()
+        self.window = None
+        self.elems = {}
+        self.states = StateStore()
+
+    def handle(self, event):
+        kind = event['event']
+        if kind == 'state':
+            elem = self.elems[event['code']]
+            elem.state = event['state']
+            elem.change_sprite()
+        elif kind == 'temp':
+            self.display.post('temp', (event['temp'], event['crit_t']))
+        elif kind == 'log':
+            self.log_pipeline.write(event['msg'], event['level'], event['code'])
+        elif kind == 'highlight':
+            self.sig_highlight.emit(getattr(self.window, event['button']))
+        elif kind == 'style_reset':
+            self.sig_reset_style.emit(getattr(self.window, event['button']))
+        elif kind == 'global_style_reset':
+            self.sig_reset_all_styles.emit()
+        elif kind == 'ended':
+            self.sig_scenario_ended.emit(event['code'])
+
+    def notify_change(self, key):
+        '''Состояние элементов меняется только событиями'''
+
+    def log(self, msg, level='info', code=None):
+        self.log_pipeline.write(msg, level, code)
+
+    def stop(self):
+        '''Сценарий выполняется не здесь'''
+
+    def exit(self):
+        '''Сценарий выполняется не здесь'''
+
+
+# Контроллер-представитель сеанса на сервере: события получает из сокета, а действия оператора отправляет на сервер
+class RemoteController(EventController):
+
+    def __init__(self, host, port):
+        EventController.__init__(self)
+        self.session = None
+        self.socket = QtNetwork.QTcpSocket(self)
+        self.socket.readyRead.connect(self.receive)
+        self.socket.disconnected.connect(lambda: self.log("Соединение с сервером разорвано", 'error'))
+        self.socket.connectToHost(host, port)
+
+    def send(self, msg):
+        self.socket.write((json.dumps(msg, ensure_ascii=False) + '\n').encode('utf-8'))
+
+    def receive(self):
+        while self.socket.canReadLine():
+            self.handle(json.loads(bytes(self.socket.readLine()).decode('utf-8')))
+
+    def handle(self, event):
+        kind = event['event']
+        if kind == 'opened':
+            self.session = event['session']
+            self.log("Подключен к серверу, сеанс %s" % self.session)
+        elif kind == 'error':
+            self.log("Ошибка сервера: " + event['msg'], 'error')
+        else:
+            EventController.handle(self, event)
+
+    def press(self, button):
+        self.send({'op': 'press', 'button': button})
+
+    def make_call(self):
+        self.press('btn_call')
+
+    def start_test(self):
+        self.send({'op': 'start', 'scenario': 'test'})
+
+    def start_demo(self):
+        self.send({'op': 'start', 'scenario': 'demo'})
+
+
+def build_window(sc, scene=False):
+    '''Окно тренажера с элементами установки, которые показывает контроллер событий sc;
+    scene - мнемосхема на QGraphicsScene (LukWidget.setup_scene)'''
+    main_window = LukWidget(sc)
+    sc.window = main_window
+    for code, widget_name, initial_state in ELEMENTS:
+        sc.elems[code] = Element(sc, code, getattr(main_window, widget_name), initial_state)
+        main_window.add_sprite_element(sc.elems[code])
+        main_window.add_log_filter_code(code)
+    if scene:
+        main_window.setup_scene()
+    return main_window  # спрайты окрашиваются при первой смене состояния - события приходят в GUI-поток
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Тонкий клиент тренажера')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--scene', action='store_true', help='мнемосхема на QGraphicsScene')
+    args, qt_args = parser.parse_known_args(argv)
+    app = QtWidgets.QApplication(sys.argv[:1] + qt_args)
+    sc = RemoteController(args.host, args.port)
+    main_window = build_window(sc, args.scene)
+    for button, code, new_state in BUTTONS:
+        getattr(main_window, button).clicked.connect(lambda checked=False, button=button: sc.press(button))
+    main_window.btn_call.clicked.connect(sc.make_call)
+    main_window.btn_start_demo.clicked.connect(sc.start_demo)
+    main_window.btn_start_test.clicked.connect(sc.start_test)
+    main_window.show()
+    return app.exec_()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
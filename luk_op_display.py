@@ -0,0 +1,59 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''Канал состояния между контроллером и интерфейсом.
+
+Контроллер из своего потока только записывает последние значения (состояние элемента, показания табло)
+в заднюю половину двойного буфера; промежуточные значения одного ключа сливаются в последнее.
+GUI-поток не чаще раза в кадр меняет половины местами и применяет к виджетам только то, что отличается
+от уже показанного. Виджеты трогает только GUI-поток, а объем его работы ограничен частотой кадров,
+как бы часто контроллер ни менял состояние.
+'''
+
+import threading
+
+
+class DisplayChannel:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.back = {}  # заполняет контроллер: ключ -> последнее значение
+        self.front = {}  # разбирает GUI-поток
+        self.shown = {}  # ключ -> значение, показанное интерфейсом
+        self.on_post = None  # вызывается, когда в пустой буфер пришло первое значение (будит GUI-поток)
+        self.posted = 0
+        self.merged = 0  # значений, замененных более новыми до показа
+        self.held = 0  # пока больше нуля, GUI-поток ничего не забирает (групповое изменение еще не закончено)
+
+    def post(self, key, value):
+        '''Записать новое значение ключа (из любого потока)'''
+        with self.lock:
+            first = not self.back
+            if key in self.back:
+                self.merged += 1
+            self.back[key] = value
+            self.posted += 1
+        if first and self.on_post is not None:
+            self.on_post()
+
+    def hold(self):
+        '''Придержать выдачу: значения, записанные до release, интерфейс покажет одним обновлением'''
+        with self.lock:
+            self.held += 1
+
+    def release(self):
+        with self.lock:
+            self.held -= 1
+            wake = not self.held and bool(self.back)
+        if wake and self.on_post is not None:
+            self.on_post()  # GUI-поток мог уже проснуться и ничего не забрать
+
+    def take(self):
+        '''Забрать накопленное (GUI-поток): пары (ключ, значение), отличающиеся от показанных'''
+        with self.lock:
+            if self.held:
+                return []
+            self.front, self.back = self.back, self.front
+        changes = [(key, value) for key, value in self.front.items() if self.shown.get(key) != value]
+        self.front.clear()
+        self.shown.update(changes)
+        return changes
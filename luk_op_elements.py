@@ -0,0 +1,105 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''Элементы установки без интерфейса: таблицы элементов и кнопок оператора и класс элемента.
+
+Модуль не зависит от Qt, поэтому его используют и окно тренажера (luk_op_proto, там элемент
+дополнен отрисовкой спрайта), и прогоны без интерфейса, пакетные прогоны и сервер сеансов.
+'''
+
+import sys
+
+# Элементы установки: (код, виджет в интерфейсе, начальное состояние)
+ELEMENTS = (
+    ('сс', 'ss', 0),
+    ('зугт', 'zugt', 0),
+    ('зуку', 'zuku', 0),
+    ('зуку2', 'zuku_2', 0),
+    ('зуку3', 'zuku_3', 0),
+    ('втг', 'vtg', 1),
+    ('втг2', 'vtg_2', 1),
+    ('запг', 'zapg', 1),
+    ('загб', 'zagb', 1),
+)
+
+# Кнопки оператора: (кнопка, код элемента, устанавливаемое состояние); btn_call - звонок диспетчеру
+BUTTONS = (
+    ('btn_gt', 'зугт', 1),
+    ('btn_ku', 'зуку', 1),
+    ('btn_vtg', 'втг', 0),
+    ('btn_pg', 'запг', 0),
+    ('btn_gb', 'загб', 0),
+)
+
+
+# Класс, минимально описыващий элементы установки для реализации логики
+# Элемент - представление своей ячейки в хранилище состояний контроллера (luk_op_state.StateStore)
+class Element:
+    __slots__ = ('controller', 'code', 'widget', 'color_state', 'store', 'index')
+
+    def __init__(self, controller, code, widget, initial_state=0):
+        self.controller = controller
+        self.code = code
+        self.widget = widget
+        self.color_state = None  # состояние, в цвет которого окрашен показанный спрайт (None - спрайт из дизайнера)
+        self.store = controller.states
+        self.index = self.store.add(code, initial_state)
+
+    @property
+    def state(self):
+        '''Состояние элемента; чтение запоминается контроллером как зависимость вычисляемого условия'''
+        reads = self.controller._reads
+        if reads is not None:
+            reads.add(self.code)
+        return self.store.values[self.index]
+
+    @state.setter
+    def state(self, new_state):
+        if self.store.set(self.index, new_state):
+            self.controller.notify_change(self.code)
+
+    def change_sprite(self):
+        '''В интерфейсе заменить спрайт одного состояния на спрайт другого состояния.
+        Если у контроллера есть канал состояния, спрайт сменит GUI-поток в ближайшем кадре'''
+        if self.widget is not None:
+            display = self.controller.display
+            if display is not None:
+                display.post(self, self.state)
+            else:
+                self.update_colors(self.state)
+        elif not self.controller.headless:
+            print('Warning: Nothing to change', file=sys.stderr)
+    
+    def update_colors(self, color_state = 0):
+        '''Перерисовываем спрайт с наложением соответствующего состоянию цвета (в интерфейсе - luk_op_proto.Element)'''
+        print('Warning: Nothing to update', file=sys.stderr)
+    
+    def set_state(self, new_state, condition=None, *args, **kwargs):
+        '''Установить состояние вручную'''
+        if condition is not None and callable(condition):
+            cond = condition(*args, **kwargs)
+            if cond[0]:
+                self.state = new_state
+                self.change_sprite()
+                self.controller.log(self.code + ': состояние установлено на ' + str(self.state) + ' по условию ' + str(cond[1]), code=self.code)
+            else:
+                pass #self.controller.log(self.code + ': был запрос на установку состояния ' + str(new_state) + '; не выполнено условие ' + str(cond[1]))
+        else:
+            self.state = new_state
+            self.change_sprite()
+            self.controller.log(self.code + ': состояние установлено на ' + str(self.state) + ' без условия', code=self.code)
+
+    def change_state(self, condition=None, *args, **kwargs):
+        '''Проверить, выполняется ли некое условие (или его отсутствие), после чего поменять состояние на противположное'''
+        if condition is not None and callable(condition):
+            cond = condition(*args, **kwargs)
+            if cond[0]:
+                self.state = 1 - self.state
+                self.change_sprite()
+                self.controller.log(self.code + ': состояние с ' + str(1 - self.state) + ' изменено на ' + str(self.state) + ' по условию ' + str(cond[1]), code=self.code)
+            else:
+                pass #self.controller.log(self.code + ': был запрос на изменение состояния с ' + str(self.state) + ' на ' + str(1 - self.state) + '; не выполнено условие ' + str(cond[1]))
+        else:
+            self.state = 1 - self.state
+            self.change_sprite()
+            self.controller.log(self.code + ': состояние с ' + str(1 - self.state) + ' изменено на ' + str(self.state) + ' без условия', code=self.code)
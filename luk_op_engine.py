@@ -0,0 +1,502 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''Ядро контроллера сценариев без зависимости от Qt: планировщик действий, переменные процесса
+и сменные часы (реальное время для тренажера, виртуальное - для прогонов без интерфейса)'''
+
+import time
+import heapq
+import threading
+import contextlib
+
+from luk_op_logpipe import LogEntry
+from luk_op_state import StateStore
+from luk_op_actions import ActionRegistry, PENDING, ARMED, PERIODIC, DONE, DISABLED, SKIP, MERGE, due_periods
+
+BATCH_VARIABLES = ('temp', 'crit_t', 'timer')  # переменные, которые можно задать в apply_states
+
+
+# Часы реального времени: монотонные (не зависят от перевода системных часов), ожидание - сон потока
+# до срока или до пробуждения по условию. Отсчет - в секундах от произвольного начала
+class WallClock:
+    def now(self):
+        return time.monotonic_ns() * 1e-9
+
+    def wait_until(self, condition, deadline):
+        '''Ждать на condition (захваченном вызывающим) до момента deadline (None - без срока).
+        Возвращает False, если часы не могут дойти до следующего события'''
+        timeout = None if deadline is None else deadline - self.now()
+        if timeout is None or timeout > 0:
+            condition.wait(timeout)
+        return True
+
+
+# Виртуальные часы: время не течет само, а сразу переводится на ближайший срок,
+# поэтому сценарий выполняется так быстро, как позволяет процессор
+class VirtualClock:
+    def __init__(self, start=0.0):
+        self.t = start
+
+    def now(self):
+        return self.t
+
+    def wait_until(self, condition, deadline):
+        if deadline is None:
+            return False  # внешних событий нет - ничего больше не произойдет
+        if deadline > self.t:
+            self.t = deadline
+        return True
+
+
+# Переменная контроллера: чтение записывается в зависимости вычисляемого условия,
+# изменение (если notify) будит поток контроллера для перепроверки зависимых условий
+class TrackedVar:
+    def __init__(self, notify=True):
+        self.notify = notify
+
+    def __set_name__(self, owner, name):
+        self.attr = '_' + name
+        self.key = 'sc.' + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        if obj._reads is not None:
+            obj._reads.add(self.key)
+        return getattr(obj, self.attr)
+
+    def __set__(self, obj, value):
+        old_value = getattr(obj, self.attr, None)
+        setattr(obj, self.attr, value)
+        if self.notify and old_value != value:
+            obj.notify_change(self.key)
+
+
+# Связанные сценарии по режимам, которые загружаются и связываются при первом обращении (при запуске режима),
+# а не при старте тренажера; build(режим) возвращает связанный сценарий
+class LazyScenarios(dict):
+    def __init__(self, build):
+        dict.__init__(self)
+        self.build = build
+
+    def __missing__(self, mode):
+        scenario = self[mode] = self.build(mode)
+        return scenario
+
+
+# Ядро контроллера: выполняет сценарий и хранит состояние процесса.
+# Вывод в интерфейс (табло, подсветка кнопок, завершение) делается через методы-хуки,
+# которые переопределяют наследники (ScenarioController посылает сигналы Qt)
+class ScenarioEngine:
+
+    # Переменные, от которых могут зависеть условия действий
+    temp = TrackedVar()
+    crit_t = TrackedVar()
+    timer = TrackedVar()
+    start_time = TrackedVar()
+    current_time = TrackedVar(notify=False)  # условия, читающие время, перепроверяются по периоду, а не по событию
+    TIME_KEY = 'sc.current_time'
+    TIME_POLL_INTERVAL = 0.1  # период перепроверки однократных условий, зависящих от времени
+
+    headless = False  # без интерфейса элементы не перерисовываются и не предупреждают об этом
+    log_entries = None  # список для накопления записей журнала в памяти (None - не накапливать)
+    profiler = None  # подключенный профилировщик (luk_op_profile.Profiler)
+    display = None  # канал состояния для интерфейса (luk_op_display.DisplayChannel), если он есть
+    conditions = None  # сеть условий связанных сценариев (luk_op_network.ConditionNetwork), создается при связывании
+    catch_up = SKIP  # политика догона пропущенных сроков повторяемых действий (luk_op_actions)
+    MAX_BURST = 10  # не больше стольких выполнений подряд при догоне BURST
+    elems = None  # элементы установки по кодам (заполняет наследник); нужны apply_states
+
+    def __init__(self, temp=60, critical_temp=200, timer=60.0, clock=None, wakeup=None):
+        self.clock = clock if clock is not None else WallClock()
+        self._reads = None  # множество ключей, прочитанных вычисляемым сейчас условием
+        self._batch = None  # ключи, упоминаемые в сводной записи текущего группового изменения (None - его нет)
+        self.states = StateStore()  # состояния элементов установки
+        self._queue = []
+        self._timers = []  # внешние события по абсолютному времени: (срок, номер, функция)
+        self._timer_seq = 0
+        self._waiting = {}
+        self._dependents = {}
+        self._changed = set()
+        self._switches = []  # запрошенные из других потоков включения/отключения действий: (ключ, включить)
+        self._wakeup = wakeup if wakeup is not None else threading.Condition()  # общий у сеансов одного планировщика
+        self.active = False
+        self.temp = temp
+        self.crit_t = critical_temp
+        self.actions = ActionRegistry()
+        self.start_time = self.clock.now()
+        self.current_time = self.start_time
+        self.started_at = self.start_time  # момент запуска сценария (в отличие от start_time не сбрасывается таймером)
+        self.timer = timer
+
+    # Описание действия в scenario:
+    # "человекочитаемый ключ": (функция-действие, граничное условие, периодичность проверки выполненности граничного условия в секундах (-1 для однократной проверки), задержка старта от начала сценария в секундах)
+    def execute_scenario(self, scenario): # выполнять действия сценария scenario по мере наступления их сроков и выполнения условий
+        self.begin_scenario(scenario)
+        while self.active:
+            deadline = self.step()
+            with self._wakeup:
+                if self.active and not self._changed:
+                    # спим до ближайшего срока или до изменения состояния
+                    if not self.clock.wait_until(self._wakeup, deadline):
+                        self.active = False
+
+    def begin_scenario(self, scenario):
+        '''Подготовить действия сценария к выполнению; дальше их выполняет execute_scenario
+        или внешний планировщик, вызывающий step (сервер с несколькими сеансами)'''
+        if self.profiler is not None:
+            scenario = self.profiler.instrument(scenario)
+        self.start_time = self.clock.now()
+        self.current_time = self.start_time
+        self.started_at = self.start_time
+        self.actions = ActionRegistry()  # записи действий по индексу и ключу сценария
+        self._queue = []  # очередь с приоритетом из пар (срок, индекс действия)
+        self._waiting = set()  # индексы условных действий, ожидающих изменения состояния
+        self._dependents = {}  # ключ переменной или элемента -> индексы ожидающих его изменения действий
+        for key, action in scenario.items():
+            record = self.actions.add(key, action, self.current_time)
+            self.schedule(record, self.start_time + record.delay)
+        with self._wakeup:
+            self._changed = set()
+            self._switches = []
+        self.active = True
+
+    def step(self):
+        '''Одна итерация: перепроверить условия, прочитавшие изменившиеся значения, выполнить наступившие
+        внешние события и действия. Возвращает срок следующей итерации (None - только по изменению состояния)'''
+        self.current_time = self.clock.now()
+        with self._wakeup:
+            changed, self._changed = self._changed, set()
+            switches, self._switches = self._switches, []
+        for key, enabled in switches:
+            self.switch_action(key, enabled)
+        for key in changed:  # перепроверяем только условия, прочитавшие изменившиеся значения
+            for i in self._dependents.pop(key, ()):
+                self.wake(i)
+            if self.conditions is not None:
+                self.wake_roots(key)
+        while self.active and self._timers and self._timers[0][0] <= self.current_time:
+            heapq.heappop(self._timers)[2]()
+        records = self.actions.records
+        while self.active and self._queue and self._queue[0][0] <= self.current_time:
+            due, i = heapq.heappop(self._queue)
+            record = records[i]
+            if record.due == due:  # устаревшие записи очереди (и записи снятых действий) пропускаем
+                record.due = None
+                self.process_action(record, due)
+        if self._queue or self._timers:
+            return min(self._queue[0][0] if self._queue else float('inf'),
+                       self._timers[0][0] if self._timers else float('inf'))
+        return None
+
+    def call_at(self, due, func):
+        '''Выполнить func в момент due по часам контроллера (например, действие оператора в прогоне без интерфейса)'''
+        self._timer_seq += 1
+        heapq.heappush(self._timers, (due, self._timer_seq, func))
+
+    def schedule(self, record, due):
+        '''Запланировать проверку действия на момент due (более ранний срок вытесняет поздний)'''
+        if record.due is None or due < record.due:
+            record.due = due
+            heapq.heappush(self._queue, (due, record.index))
+
+    def wait_for_change(self, record, deps):
+        '''Отложить действие до изменения одной из прочитанных его условием переменных.
+        Действие с условием из сети условий ждет не переменных, а истинности самого условия'''
+        if self.conditions is not None and self.conditions.watches(record.cond):
+            deps = (record.cond,)
+        record.deps = deps
+        self._waiting.add(record.index)
+        for key in deps:
+            self._dependents.setdefault(key, set()).add(record.index)
+
+    def unwait(self, record):
+        '''Снять действие с ожидания изменений'''
+        if record.index in self._waiting:
+            self._waiting.discard(record.index)
+            for key in record.deps:
+                waiters = self._dependents.get(key)
+                if waiters is not None:
+                    waiters.discard(record.index)
+            record.deps = ()
+
+    def wake(self, i):
+        '''Поставить условие ожидающего действия с индексом i на перепроверку'''
+        record = self.actions.records[i]
+        self.unwait(record)
+        self.schedule(record, self.current_time)
+
+    def wake_roots(self, key):
+        '''Вычислить по разу условия сети, читающие key, и разбудить ждущие их действия, если условие выполнено'''
+        for root in self.conditions.watched.get(key, ()):
+            if self._dependents.get(root) and root():
+                for i in self._dependents.pop(root):
+                    self.wake(i)
+
+    def retire(self, record, state):
+        '''Вывести действие из работы (выполнено или отключено): из очереди и ожиданий оно уходит'''
+        self.unwait(record)
+        record.due = None  # оставшиеся в очереди записи действия станут устаревшими
+        self.actions.move(record, state)
+
+    def set_action_enabled(self, key, enabled=True):
+        '''Включить или отключить действие сценария по ключу (из любого потока; применяется на следующей итерации)'''
+        with self._wakeup:
+            self._switches.append((key, enabled))
+            self._wakeup.notify()
+
+    def switch_action(self, key, enabled):
+        '''Включить или отключить действие (поток контроллера). Выполненное однократное действие не меняется.
+        Включенное действие заново отсчитывает задержку старта от start_time'''
+        record = self.actions.by_key.get(key)
+        if record is None:
+            self.log("Нет действия сценария: %s" % key, 'warning')
+            return
+        if not enabled and record.state not in (DONE, DISABLED):
+            self.retire(record, DISABLED)
+        elif enabled and record.state == DISABLED:
+            self.actions.move(record, PENDING)
+            record.fresh = True
+            self.schedule(record, max(self.current_time, self.start_time + record.delay))
+
+    def evaluate(self, cond):
+        '''Вычислить условие и вернуть результат вместе с ключами прочитанных им значений.
+        Условие может заранее объявить свои зависимости атрибутом deps'''
+        deps = getattr(cond, 'deps', None)
+        if deps is not None:
+            return cond(), deps
+        self._reads = reads = set()
+        try:
+            return cond(), reads
+        finally:
+            self._reads = None
+
+    def process_action(self, record, due=None):
+        '''Проверить условие действия, выполнить его и запланировать следующую проверку.
+        due - срок, на который была запланирована проверка (нужен профилировщику для замера отставания)'''
+        self.unwait(record)
+        if self.current_time < self.start_time + record.delay:  # задержка старта еще не истекла (таймер мог быть сброшен)
+            self.actions.move(record, PENDING)
+            self.schedule(record, self.start_time + record.delay)
+            return
+        self.actions.move(record, PERIODIC if record.periodic else ARMED)
+        if record.cond is not None:
+            satisfied, deps = self.evaluate(record.cond)  # условие проверяется один раз за проход
+        else:
+            satisfied, deps = True, ()
+        if record.periodic:
+            if satisfied:
+                if self.current_time >= record.last_time + record.period:  # прошло достаточно времени для повтора (сравниваем с тем же сроком, что планируем)
+                    for call in self.periodic_calls(record):
+                        call()
+                        if not self.active or record.state != PERIODIC:
+                            break
+                if record.state == PERIODIC:  # действие могло отключить само себя
+                    self.schedule(record, record.last_time + record.period)
+            else:
+                # условие не выполняется - ждем изменения прочитанных им значений
+                record.fresh = True
+                self.wait_for_change(record, deps)
+                if self.TIME_KEY in deps:  # от хода времени события не приходят, проверяем по периоду
+                    self.schedule(record, self.current_time + record.period)
+        elif satisfied:
+            record.func()
+            record.runs += 1
+            self.retire(record, DONE)  # выполненное однократное действие больше не проверяется
+        else:
+            self.wait_for_change(record, deps)
+            if self.TIME_KEY in deps:
+                self.schedule(record, self.current_time + self.TIME_POLL_INTERVAL)
+
+    def periodic_calls(self, record):
+        '''Срок повторяемого действия наступил: сдвинуть его номинальный срок и вернуть вызовы, которые надо
+        выполнить. Сроки идут по сетке от номинального, а не фактического времени срабатывания, поэтому
+        задержки цикла не накапливаются в периоде. Если цикл отстал на несколько периодов, пропущенные сроки
+        обрабатываются по политике догона (record.catch_up или catch_up контроллера)'''
+        now = self.current_time
+        record.fired += 1
+        if record.fresh:  # отсчет периода начинается от момента срабатывания
+            record.fresh = False
+            record.last_time = now
+            record.runs += 1
+            return (record.func,)
+        n = due_periods(record.last_time, record.period, now)
+        lag = now - (record.last_time + record.period)
+        if lag > record.max_lag:
+            record.max_lag = lag
+        record.last_time += n * record.period
+        if n == 1:
+            record.runs += 1
+            return (record.func,)
+        record.overruns += 1
+        record.missed += n - 1
+        policy = record.catch_up or self.catch_up
+        merge = getattr(record.func, 'merge', None)
+        if policy == SKIP:
+            calls = (record.func,)
+        elif policy == MERGE and merge is not None:
+            calls = (lambda: merge(n),)
+        else:  # BURST, а также MERGE для функций без объединенного вызова
+            calls = (record.func,) * min(n, self.MAX_BURST)
+        record.runs += len(calls)
+        return calls
+
+    def overrun_stats(self):
+        '''Статистика сроков повторяемых действий: срабатывания, отставания на период и больше,
+        пропущенные сроки, наибольшее отставание (с) и действие с наибольшим отставанием'''
+        periodic = [r for r in self.actions.records if r.periodic]
+        worst = max(periodic, key=lambda r: r.max_lag, default=None)
+        return {'fired': sum(r.fired for r in periodic), 'overruns': sum(r.overruns for r in periodic),
+                'missed': sum(r.missed for r in periodic), 'max_lag': worst.max_lag if worst is not None else 0.0,
+                'worst': worst.key if worst is not None and worst.max_lag > 0 else None}
+
+    def notify_change(self, key):
+        '''Сообщить потоку контроллера об изменении значения key, чтобы он перепроверил зависящие от него условия'''
+        if self.conditions is not None:
+            self.conditions.invalidate(key)
+        with self._wakeup:
+            self._changed.add(key)
+            self._wakeup.notify()
+
+    def stop(self):
+        '''Остановить выполнение сценария и разбудить поток контроллера'''
+        with self._wakeup:
+            self.active = False
+            self._wakeup.notify()
+
+    def log(self, msg, level='info', code=None):
+        '''Журналирование; по умолчанию записи копятся в памяти (если включены), наследники выводят их'''
+        if self.log_entries is not None:
+            self.log_entries.append(LogEntry(self.clock.now(), msg, level, code))
+
+    @contextlib.contextmanager
+    def batch(self, title=None):
+        '''Групповое изменение состояний и переменных (with sc.batch(): ...). Пока оно идет, изменения
+        только копятся: зависимые условия перепроверяются один раз после всех изменений, интерфейс
+        получает их одним обновлением, а вместо записей журнала об отдельных изменениях пишется одна
+        сводная (предупреждения и ошибки пишутся как обычно). Вложенная группа сливается с внешней.
+        Изменения из других потоков (нажатия оператора) в группу не попадают'''
+        if self._batch is not None:
+            yield
+            return
+        changes = {}  # измененные ключи (упорядоченное множество)
+        touched = self._batch = {}  # ключи для сводной записи: измененные и явно заданные в apply_states
+        owner = threading.get_ident()
+        saved = {name: self.__dict__[name] for name in ('notify_change', 'log') if name in self.__dict__}
+        notify_change, log = self.notify_change, self.log  # с учетом подмен на экземпляре (журнал сеанса)
+
+        def collect_change(key):
+            if threading.get_ident() != owner:
+                return notify_change(key)
+            if self.conditions is not None:
+                self.conditions.invalidate(key)  # условия внутри группы видят новые значения
+            changes[key] = touched[key] = None
+
+        def collect_log(msg, level='info', code=None):
+            if level != 'info' or threading.get_ident() != owner:
+                log(msg, level, code)
+
+        self.notify_change, self.log = collect_change, collect_log
+        if self.display is not None:
+            self.display.hold()
+        try:
+            yield
+        finally:
+            for name in ('notify_change', 'log'):
+                if name in saved:
+                    setattr(self, name, saved[name])
+                else:
+                    delattr(self, name)
+            self._batch = None
+            for key in changes:
+                notify_change(key)
+            if self.display is not None:
+                self.display.release()
+            if touched:
+                log('%s: %s' % (title or 'Групповое изменение',
+                                ', '.join('%s=%s' % (key[3:] if key.startswith('sc.') else key, self.value_of(key))
+                                          for key in touched)))
+
+    def value_of(self, key):
+        '''Текущее значение по ключу изменения (переменная 'sc.имя' или код элемента)'''
+        if key.startswith('sc.'):
+            return getattr(self, '_' + key[3:])
+        return self.states.value(key)
+
+    def apply_states(self, values, title=None):
+        '''Задать одной операцией (см. batch) состояния элементов и переменные BATCH_VARIABLES:
+        values - словарь {код элемента или имя переменной: значение}'''
+        with self.batch(title):
+            for key, value in values.items():
+                if key in BATCH_VARIABLES:
+                    setattr(self, key, value)
+                    self._batch['sc.' + key] = None
+                else:
+                    self.elems[key].set_state(value)
+                    self._batch[key] = None
+            if 'temp' in values or 'crit_t' in values:
+                self.display_temp()
+
+    def reset_timer(self, new_timer=60.0):
+        self.timer = new_timer
+        self.start_time = self.clock.now()
+        self.log("Был сброшен таймер, новое время для выполнения задания: " + str(self.timer) + " сек.", 'warning')
+
+    def set_crit_t(self, new_crit_t):
+        self.crit_t = new_crit_t
+        self.log('Значение Ткрит установлено на ' + str(self.crit_t))
+
+    def display_temp(self):
+        '''Показать температуру на табло (хук интерфейса)'''
+
+    def set_temp(self, new_temp):
+        '''Вручную установить температуру'''
+        self.temp = new_temp
+        self.display_temp()
+        self.log("Значение температуры установлено на %s" % new_temp)
+
+    def check(self, cond_desc='[условие перехода без описания]', condition=None, *args, **kwargs):
+        '''Проверить выполнения условия перехода и вернуть результат проверки и описание условия для журнала'''
+        if condition is not None and callable(condition):
+            cond = condition(*args, **kwargs)
+            if cond:
+                return (True, cond_desc)
+            else:
+                return (False, cond_desc)
+        else:
+            return (False, cond_desc)
+
+    def raise_temp(self, raise_by=15):
+        '''Повышение температуры'''
+        self.temp += raise_by
+        self.display_temp()
+        self.log("Температура повысилась на %s (тек. знач.: %s)" % (raise_by, self.temp))
+
+    def lower_temp(self, lower_by=15):
+        '''Снижение температуры'''
+        self.temp -= lower_by
+        self.display_temp()
+        self.log("Температура снизилась на %s (тек. знач.: %s)" % (lower_by, self.temp))
+
+    def make_call(self):
+        '''Сымитировать звонок диспетчеру'''
+        self.log("Сделан звонок диспетчеру")
+        self.end_scenario(0)
+
+    def fail(self):
+        '''Провал задания по таймеру'''
+        self.log("Задание не выполнено в срок", 'error')
+        self.end_scenario(1)
+
+    def end_scenario(self, code):
+        '''Завершить сценарий с кодом code (0 - успех, 1 - провал)'''
+        self.stop()
+
+    def highlight(self, button):
+        '''Подсветить кнопку (хук интерфейса)'''
+
+    def style_reset(self, button):
+        '''Сбросить стиль кнопки после подсветки (хук интерфейса)'''
+
+    def global_style_reset(self):
+        '''Сбросить стиль всех виджетов (хук интерфейса)'''
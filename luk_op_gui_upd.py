@@ -75,7 +75,7 @@ class Ui_MainWindow(object):
         self.vtg.setSizePolicy(sizePolicy)
         self.vtg.setMinimumSize(QtCore.QSize(914, 594))
         self.vtg.setText("")
-        self.vtg.setPixmap(QtGui.QPixmap("img/втг.png"))
+        self.vtg.setPixmap(QtGui.QPixmap(":/img/втг.png"))
         self.vtg.setScaledContents(True)
         self.vtg.setObjectName("vtg")
         self.log = QtWidgets.QTextBrowser(self.centralwidget)
@@ -95,7 +95,7 @@ class Ui_MainWindow(object):
         self.gtu_static.setSizePolicy(sizePolicy)
         self.gtu_static.setMinimumSize(QtCore.QSize(914, 594))
         self.gtu_static.setText("")
-        self.gtu_static.setPixmap(QtGui.QPixmap("raw_img/гту_0.png"))
+        self.gtu_static.setPixmap(QtGui.QPixmap(":/raw_img/гту_0.png"))
         self.gtu_static.setScaledContents(True)
         self.gtu_static.setObjectName("gtu_static")
         self.label_8 = QtWidgets.QLabel(self.centralwidget)
@@ -174,14 +174,14 @@ class Ui_MainWindow(object):
         self.zugt = QtWidgets.QLabel(self.frame)
         self.zugt.setGeometry(QtCore.QRect(100, 10, 48, 48))
         self.zugt.setMinimumSize(QtCore.QSize(48, 48))
-        self.zugt.setPixmap(QtGui.QPixmap("img/temp.png"))
+        self.zugt.setPixmap(QtGui.QPixmap(":/img/temp.png"))
         self.zugt.setScaledContents(True)
         self.zugt.setObjectName("zugt")
         self.zuku_2 = QtWidgets.QLabel(self.frame)
         self.zuku_2.setGeometry(QtCore.QRect(100, 70, 48, 48))
         self.zuku_2.setMinimumSize(QtCore.QSize(48, 48))
         self.zuku_2.setText("")
-        self.zuku_2.setPixmap(QtGui.QPixmap("img/temp.png"))
+        self.zuku_2.setPixmap(QtGui.QPixmap(":/img/temp.png"))
         self.zuku_2.setScaledContents(True)
         self.zuku_2.setObjectName("zuku_2")
         self.label_3 = QtWidgets.QLabel(self.frame)
@@ -196,14 +196,14 @@ class Ui_MainWindow(object):
         self.zapg.setGeometry(QtCore.QRect(100, 130, 48, 48))
         self.zapg.setMinimumSize(QtCore.QSize(48, 48))
         self.zapg.setText("")
-        self.zapg.setPixmap(QtGui.QPixmap("img/temp.png"))
+        self.zapg.setPixmap(QtGui.QPixmap(":/img/temp.png"))
         self.zapg.setScaledContents(True)
         self.zapg.setObjectName("zapg")
         self.zagb = QtWidgets.QLabel(self.frame)
         self.zagb.setGeometry(QtCore.QRect(100, 190, 48, 48))
         self.zagb.setMinimumSize(QtCore.QSize(48, 48))
         self.zagb.setText("")
-        self.zagb.setPixmap(QtGui.QPixmap("img/temp.png"))
+        self.zagb.setPixmap(QtGui.QPixmap(":/img/temp.png"))
         self.zagb.setScaledContents(True)
         self.zagb.setObjectName("zagb")
         self.label_4 = QtWidgets.QLabel(self.frame)
@@ -218,7 +218,7 @@ class Ui_MainWindow(object):
         self.ss.setGeometry(QtCore.QRect(100, 250, 48, 48))
         self.ss.setMinimumSize(QtCore.QSize(48, 48))
         self.ss.setText("")
-        self.ss.setPixmap(QtGui.QPixmap("img/temp.png"))
+        self.ss.setPixmap(QtGui.QPixmap(":/img/temp.png"))
         self.ss.setScaledContents(True)
         self.ss.setObjectName("ss")
         self.label_5 = QtWidgets.QLabel(self.frame)
@@ -278,7 +278,7 @@ class Ui_MainWindow(object):
         self.gtu_static_2.setSizePolicy(sizePolicy)
         self.gtu_static_2.setMinimumSize(QtCore.QSize(914, 594))
         self.gtu_static_2.setText("")
-        self.gtu_static_2.setPixmap(QtGui.QPixmap("raw_img/гту_2.png"))
+        self.gtu_static_2.setPixmap(QtGui.QPixmap(":/raw_img/гту_2.png"))
         self.gtu_static_2.setScaledContents(True)
         self.gtu_static_2.setObjectName("gtu_static_2")
         self.zuku = QtWidgets.QLabel(self.centralwidget)
@@ -290,7 +290,7 @@ class Ui_MainWindow(object):
         self.zuku.setSizePolicy(sizePolicy)
         self.zuku.setMinimumSize(QtCore.QSize(914, 594))
         self.zuku.setText("")
-        self.zuku.setPixmap(QtGui.QPixmap("img/зуку.png"))
+        self.zuku.setPixmap(QtGui.QPixmap(":/img/зуку.png"))
         self.zuku.setScaledContents(True)
         self.zuku.setObjectName("zuku")
         self.vtg_2 = QtWidgets.QLabel(self.centralwidget)
@@ -302,7 +302,7 @@ class Ui_MainWindow(object):
         self.vtg_2.setSizePolicy(sizePolicy)
         self.vtg_2.setMinimumSize(QtCore.QSize(914, 594))
         self.vtg_2.setText("")
-        self.vtg_2.setPixmap(QtGui.QPixmap("img/втг2.png"))
+        self.vtg_2.setPixmap(QtGui.QPixmap(":/img/втг2.png"))
         self.vtg_2.setScaledContents(True)
         self.vtg_2.setObjectName("vtg_2")
         self.zuku_3 = QtWidgets.QLabel(self.centralwidget)
@@ -314,7 +314,7 @@ class Ui_MainWindow(object):
         self.zuku_3.setSizePolicy(sizePolicy)
         self.zuku_3.setMinimumSize(QtCore.QSize(914, 594))
         self.zuku_3.setText("")
-        self.zuku_3.setPixmap(QtGui.QPixmap("img/зуку3.png"))
+        self.zuku_3.setPixmap(QtGui.QPixmap(":/img/зуку3.png"))
         self.zuku_3.setScaledContents(True)
         self.zuku_3.setObjectName("zuku_3")
         self.vtg_2.raise_()
@@ -355,4 +355,4 @@ class Ui_MainWindow(object):
 "диспетчеру"))
         self.btn_start_test.setText(_translate("MainWindow", "Запустить\n"
 "тестирование"))
-
+import luk_op_resources_rc
@@ -0,0 +1,103 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''Прогон сценария без интерфейса на виртуальном времени - быстрее реального.
+
+Пример: оператор закрывает все устройства на 25-й секунде и звонит диспетчеру на 90-й
+    python luk_op_headless.py scenarios/test.json --click 25:btn_gt --click 25:btn_ku --click 25:btn_vtg \
+        --click 25:btn_pg --click 25:btn_gb --click 90:btn_call
+'''
+
+import os
+import sys
+import argparse
+
+from luk_op_engine import VirtualClock
+from luk_op_actions import CATCH_UP_POLICIES
+from luk_op_scenario import load_scenario, ScenarioError
+from luk_op_session import Session
+from luk_op_profile import Profiler
+from luk_op_journal import Recorder
+from luk_op_elements import BUTTONS
+
+RESULT_NAMES = {0: 'звонок диспетчеру', 1: 'провал по таймеру', None: 'не завершен'}
+
+
+# Контроллер без интерфейса: сеанс на виртуальных часах с журналом в памяти
+class HeadlessController(Session):
+
+    def __init__(self, temp=60, critical_temp=200, timer=60.0, time_limit=600.0, keep_log=True, clock=None):
+        Session.__init__(self, None, temp, critical_temp, timer, clock if clock is not None else VirtualClock())
+        self.time_limit = time_limit
+        self.log_entries = [] if keep_log else None
+
+    def run_plan(self, plan, clicks=(), disabled=()):
+        '''Выполнить скомпилированный сценарий; clicks - пары (секунда от начала, кнопка),
+        disabled - ключи действий, отключенных с начала прогона.
+        Возвращает код завершения (None - не завершился за time_limit)'''
+        scenario = self.bind(plan)
+        start = self.clock.now()
+        for key in disabled:
+            self.call_at(start, lambda key=key: self.switch_action(key, False))
+        for at, button in clicks:
+            self.call_at(start + at, lambda button=button: self.press(button))
+        self.call_at(start + self.time_limit, self.stop)
+        self.log("=== Сценарий начат ===")
+        self.execute_scenario(scenario)
+        return self.result
+
+
+def parse_click(text):
+    '''Разобрать "секунда:кнопка"'''
+    at, _, button = text.partition(':')
+    return float(at), button
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Прогон сценария тренажера без интерфейса на виртуальном времени')
+    parser.add_argument('scenario', help='файл сценария (scenarios/*.json)')
+    parser.add_argument('--click', action='append', default=[], type=parse_click, metavar='СЕК:КНОПКА',
+                        help='нажатие кнопки оператором, например 25:btn_gt')
+    parser.add_argument('--disable', action='append', default=[], metavar='КЛЮЧ',
+                        help='отключить действие сценария по ключу')
+    parser.add_argument('--catch-up', choices=CATCH_UP_POLICIES, default=HeadlessController.catch_up,
+                        help='догон пропущенных сроков повторяемых действий (если не задан в сценарии)')
+    parser.add_argument('--critical-temp', type=float,
+                        help='Ткрит вместо той, что сценарий устанавливает при сбросе состояний')
+    parser.add_argument('--timer', type=float,
+                        help='время на выполнение задания вместо того, что задает сброс таймера в сценарии, с')
+    parser.add_argument('--limit', type=float, default=600.0, help='предел виртуального времени, с')
+    parser.add_argument('-v', '--verbose', action='store_true', help='вывести журнал прогона')
+    parser.add_argument('--profile', action='store_true', help='замерить время действий и условий')
+    parser.add_argument('--record', metavar='ФАЙЛ', help='записать журнал событий сеанса (luk_op_journal)')
+    args = parser.parse_args(argv)
+    try:
+        plan = load_scenario(args.scenario)
+        if args.critical_temp is not None:
+            plan = plan.with_crit_t(args.critical_temp)
+        if args.timer is not None:
+            plan = plan.with_args(reset_timer=(args.timer,))
+    except (ScenarioError, OSError) as e:
+        print('%s: %s' % (args.scenario, e), file=sys.stderr)
+        return 2
+    sc = HeadlessController(timer=args.timer or 60.0, time_limit=args.limit)
+    sc.catch_up = args.catch_up
+    profiler = Profiler().attach(sc) if args.profile else None
+    recorder = None
+    if args.record:
+        recorder = Recorder(args.record, scenario=plan.name).attach(sc, [b for b, _, _ in BUTTONS] + ['btn_call'])
+    result = sc.run_plan(plan, args.click, args.disable)
+    if recorder is not None:
+        recorder.detach()
+    if args.verbose:
+        for entry in sc.log_entries:
+            print('%9.3f %s' % (entry.time - sc.started_at, entry.msg))
+    end = '%.3f с' % sc.end_time if sc.end_time is not None else '-'
+    print('%s: результат %s (%s), время %s' % (os.path.basename(args.scenario), result, RESULT_NAMES[result], end))
+    if profiler is not None:
+        print(profiler.report())
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
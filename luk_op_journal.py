@@ -0,0 +1,388 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''Журнал событий сеанса в двоичном формате и его воспроизведение.
+
+Записываются изменения состояний элементов (set_state, change_state, кнопки), переменных процесса
+(temp, crit_t, timer), нажатия кнопок и завершение сценария. Время записи - секунды от начала журнала
+по часам контроллера (не убывает). Записи пишет фоновый поток пачками, контроллер только кладет их в очередь.
+
+Формат файла: заголовок b'LUKJ', версия и длина JSON (<HI), JSON с таблицами кодов, затем записи
+фиксированного размера RECORD (время, вид, аргумент, значение). Через каждые SNAPSHOT_INTERVAL секунд
+пишется снимок - запись SNAPSHOT с числом следующих за ней записей полного состояния, поэтому
+переход к любому моменту часового сеанса читает не больше одного интервала записей.
+
+Примеры:
+    python luk_op_headless.py scenarios/test.json --record run.lukj
+    python luk_op_journal.py info run.lukj
+    python luk_op_journal.py state run.lukj --at 30
+    python luk_op_journal.py replay run.lukj --speed 10
+    python luk_op_replay.py run.lukj                    (воспроизведение в интерфейсе тренажера)
+'''
+
+import sys
+import json
+import time
+import queue
+import struct
+import atexit
+import argparse
+import threading
+
+import numpy as np
+
+MAGIC = b'LUKJ'
+VERSION = 1
+HEADER = struct.Struct('<HI')  # версия, длина JSON
+RECORD = struct.Struct('<dBxhd')  # время, вид, аргумент, значение
+RECORD_DTYPE = np.dtype([('time', '<f8'), ('kind', 'u1'), ('pad', 'u1'), ('arg', '<i2'), ('value', '<f8')])
+
+# Виды записей; аргумент: STATE - индекс кода элемента, VAR - индекс переменной, CLICK - индекс кнопки,
+# END - код завершения, SNAPSHOT - число следующих за ним записей STATE и VAR
+STATE, VAR, CLICK, END, SNAPSHOT = 1, 2, 3, 4, 5
+KIND_NAMES = {STATE: 'state', VAR: 'var', CLICK: 'click', END: 'end', SNAPSHOT: 'snapshot'}
+
+VARIABLES = ('temp', 'crit_t', 'timer')  # записываемые переменные контроллера
+SNAPSHOT_INTERVAL = 10.0  # секунд журнала между снимками состояния
+SPEEDS = {'1': 1.0, '10': 10.0, 'max': None}  # скорости воспроизведения (None - без ожидания)
+
+
+# Фоновый поток, дописывающий записи журнала в файл пачками
+class JournalWriter(threading.Thread):
+    def __init__(self, f):
+        threading.Thread.__init__(self, name='luk-journal-writer', daemon=True)
+        self.file = f
+        self.queue = queue.SimpleQueue()
+
+    def run(self):
+        while True:
+            records = [self.queue.get()]
+            try:
+                while len(records) < 4096:
+                    records.append(self.queue.get_nowait())
+            except queue.Empty:
+                pass
+            stop = None in records
+            buf = bytearray(RECORD.size * len(records))
+            n = 0
+            for record in records:
+                if record is not None:
+                    RECORD.pack_into(buf, n * RECORD.size, *record)
+                    n += 1
+            if n:
+                self.file.write(buf[:n * RECORD.size])
+                self.file.flush()
+            if stop:
+                break
+        self.file.close()
+
+    def close(self):
+        '''Дописать накопленные записи и закрыть файл'''
+        if self.is_alive():
+            self.queue.put(None)
+            self.join()
+
+
+# Запись журнала сеанса: attach подменяет на экземпляре контроллера notify_change, end_scenario
+# и press (если есть), как профилировщик; контроллер без записи выполняет исходный код
+class Recorder:
+    def __init__(self, path, snapshot_interval=SNAPSHOT_INTERVAL, **meta):
+        self.path = path
+        self.snapshot_interval = snapshot_interval
+        self.meta = meta
+        self.controller = None
+        self.writer = None
+        self.lock = threading.Lock()  # события приходят из потока контроллера и из GUI-потока (кнопки)
+        self.t0 = 0.0
+        self.last = 0.0
+        self.next_snapshot = 0.0
+
+    def attach(self, controller, buttons=()):
+        '''Начать запись событий контроллера; buttons - имена кнопок оператора (для записей CLICK)'''
+        self.controller = controller
+        self.codes = list(controller.states.codes)
+        self.code_index = {code: i for i, code in enumerate(self.codes)}
+        self.buttons = list(buttons)
+        self.button_index = {name: i for i, name in enumerate(self.buttons)}
+        self.var_index = {'sc.' + name: i for i, name in enumerate(VARIABLES)}
+        header = json.dumps({'codes': self.codes, 'buttons': self.buttons, 'variables': VARIABLES,
+                             'started': time.time(), 'snapshot_interval': self.snapshot_interval,
+                             'meta': self.meta}, ensure_ascii=False).encode('utf-8')
+        f = open(self.path, 'wb')
+        f.write(MAGIC + HEADER.pack(VERSION, len(header)) + header)
+        self.writer = JournalWriter(f)
+        self.writer.start()
+        atexit.register(self.writer.close)
+        self.t0 = controller.clock.now()
+        self.last = 0.0
+        self.next_snapshot = 0.0
+        notify_change, end_scenario = controller.notify_change, controller.end_scenario
+
+        def recorded_notify_change(key):
+            notify_change(key)
+            if key in self.code_index:
+                self.record(STATE, self.code_index[key], controller.states.value(key))
+            elif key in self.var_index:
+                self.record(VAR, self.var_index[key], self.variable(key[3:]))
+
+        def recorded_end_scenario(code):
+            self.record(END, code, 0.0)
+            end_scenario(code)
+
+        controller.notify_change = recorded_notify_change
+        controller.end_scenario = recorded_end_scenario
+        press = getattr(controller, 'press', None)
+        if press is not None:
+            def recorded_press(button):
+                self.click(button)
+                press(button)
+            controller.press = recorded_press
+        return self
+
+    def detach(self):
+        '''Остановить запись и дописать журнал'''
+        controller = self.controller
+        for name in ('notify_change', 'end_scenario', 'press'):
+            controller.__dict__.pop(name, None)
+        self.writer.close()
+        atexit.unregister(self.writer.close)
+
+    def watch_window(self, window):
+        '''Записывать нажатия кнопок окна (в интерфейсе кнопки меняют элементы напрямую, минуя press)'''
+        for name in self.buttons:
+            widget = getattr(window, name, None)
+            if widget is not None:
+                widget.clicked.connect(lambda checked=False, name=name: self.click(name))
+
+    def variable(self, name):
+        return getattr(self.controller, '_' + name)  # без записи в зависимости вычисляемого условия
+
+    def click(self, button):
+        if button in self.button_index:
+            self.record(CLICK, self.button_index[button], 0.0)
+
+    def record(self, kind, arg, value):
+        with self.lock:
+            t = max(self.controller.clock.now() - self.t0, self.last)  # время журнала не убывает
+            self.last = t
+            if t >= self.next_snapshot:
+                self.snapshot(t)
+            self.writer.queue.put((t, kind, arg, value))
+
+    def snapshot(self, t):
+        '''Записать полное состояние на момент t (вызывается под self.lock)'''
+        store = self.controller.states
+        put = self.writer.queue.put
+        put((t, SNAPSHOT, len(self.codes) + len(VARIABLES), 0.0))
+        for i, code in enumerate(self.codes):
+            put((t, STATE, i, store.value(code)))
+        for i, name in enumerate(VARIABLES):
+            put((t, VAR, i, self.variable(name)))
+        self.next_snapshot = t + self.snapshot_interval
+
+
+# Чтение журнала: записи загружаются одним массивом NumPy, снимки индексируются по времени
+class JournalReader:
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError('%s: не журнал тренажера' % path)
+            version, size = HEADER.unpack(f.read(HEADER.size))
+            if version != VERSION:
+                raise ValueError('%s: неподдерживаемая версия журнала %d' % (path, version))
+            self.header = json.loads(f.read(size).decode('utf-8'))
+            offset = f.tell()
+        # недописанная последняя запись (сеанс прерван) отбрасывается
+        self.records = np.fromfile(path, dtype=RECORD_DTYPE, offset=offset)
+        self.codes = self.header['codes']
+        self.buttons = self.header['buttons']
+        self.variables = self.header['variables']
+        self.snapshots = np.flatnonzero(self.records['kind'] == SNAPSHOT)
+        self.snapshot_times = self.records['time'][self.snapshots]
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def duration(self):
+        return float(self.records['time'][-1]) if len(self.records) else 0.0
+
+    def find(self, t):
+        '''Индекс первой записи позже момента t'''
+        return int(np.searchsorted(self.records['time'], t, side='right'))
+
+    def state_at(self, t):
+        '''Состояния элементов и переменные на момент t: последний снимок до t и записи после него'''
+        states, variables = {}, {}
+        k = int(np.searchsorted(self.snapshot_times, t, side='right')) - 1
+        start = int(self.snapshots[k]) + 1 if k >= 0 else 0
+        for time_, kind, arg, value in self.records[start:self.find(t)][['time', 'kind', 'arg', 'value']].tolist():
+            if kind == STATE:
+                states[self.codes[arg]] = int(value)
+            elif kind == VAR:
+                variables[self.variables[arg]] = value
+        return states, variables
+
+    def events(self, start, stop):
+        '''События интерфейса (как у luk_op_session) для записей с индексами [start, stop)'''
+        records = self.records[start:stop][['time', 'kind', 'arg', 'value']].tolist()
+        skip = 0
+        for time_, kind, arg, value in records:
+            if skip:  # записи снимка дублируют уже воспроизведенное состояние
+                skip -= 1
+                continue
+            if kind == SNAPSHOT:
+                skip = arg
+            elif kind == STATE:
+                yield time_, {'event': 'state', 'code': self.codes[arg], 'state': int(value)}
+            elif kind == VAR:
+                yield time_, {'event': 'var', 'name': self.variables[arg], 'value': value}
+            elif kind == CLICK:
+                yield time_, {'event': 'log', 'time': time_, 'msg': 'Оператор нажал кнопку %s' % self.buttons[arg],
+                              'level': 'info', 'code': None}
+            elif kind == END:
+                yield time_, {'event': 'ended', 'code': arg}
+
+
+# Воспроизведение журнала в приемник событий sink (RemoteController.handle интерфейса или apply_event
+# для контроллера без интерфейса). Не привязано к циклу событий: tick() выдает записи, время которых
+# наступило, и возвращает, через сколько секунд реального времени вызвать его снова
+class Replayer:
+    def __init__(self, reader, sink, speed=1.0):
+        self.reader = reader
+        self.sink = sink
+        self.speed = speed  # None - максимальная скорость
+        self.position = 0.0  # время журнала
+        self.index = 0  # следующая воспроизводимая запись
+        self.playing = False
+        self.variables = {}
+        self._wall = None
+
+    def emit(self, event):
+        if event['event'] == 'var':  # табло показывает температуру вместе с Ткрит
+            self.variables[event['name']] = event['value']
+            if event['name'] in ('temp', 'crit_t') and len(self.variables) > 1:
+                self.sink({'event': 'temp', 'temp': self.variables.get('temp', 0.0),
+                           'crit_t': self.variables.get('crit_t', 0.0)})
+            return
+        self.sink(event)
+
+    def seek(self, t):
+        '''Перейти к моменту t: выставить состояние из ближайшего снимка без воспроизведения промежуточных событий'''
+        t = min(max(t, 0.0), self.reader.duration)
+        self.position = t
+        states, variables = self.reader.state_at(t)
+        for code, state in states.items():
+            self.sink({'event': 'state', 'code': code, 'state': state})
+        self.variables.update(variables)
+        if variables:
+            self.sink({'event': 'temp', 'temp': self.variables.get('temp', 0.0),
+                       'crit_t': self.variables.get('crit_t', 0.0)})
+        self.index = self.reader.find(t)
+        self._wall = None
+
+    def play(self):
+        self.playing = True
+        self._wall = None
+
+    def set_speed(self, speed):
+        self.speed = speed
+        self._wall = None
+
+    def pause(self):
+        self.playing = False
+
+    @property
+    def finished(self):
+        return self.index >= len(self.reader)
+
+    def tick(self, now=None):
+        '''Воспроизвести наступившие записи; вернуть секунды реального времени до следующей (None - конец или пауза)'''
+        if not self.playing or self.finished:
+            return None
+        now = time.monotonic() if now is None else now
+        if self._wall is None:
+            self._wall = (now, self.position)
+        wall0, position0 = self._wall
+        if self.speed is None:
+            target = self.reader.duration
+        else:
+            target = position0 + (now - wall0) * self.speed
+        stop = self.reader.find(target)
+        for self.position, event in self.reader.events(self.index, stop):
+            self.emit(event)
+        self.index = stop
+        self.position = min(target, self.reader.duration)
+        if self.finished:
+            self.playing = False
+            return None
+        if self.speed is None:
+            return 0.0
+        return max(0.0, (float(self.reader.records['time'][self.index]) - self.position) / self.speed)
+
+    def run(self):
+        '''Воспроизвести до конца, ожидая между записями (без цикла событий)'''
+        self.play()
+        delay = self.tick()
+        while delay is not None:
+            if delay > 0:
+                time.sleep(delay)
+            delay = self.tick()
+
+
+def apply_event(controller, event):
+    '''Применить событие воспроизведения к контроллеру без интерфейса (luk_op_session.Session)'''
+    kind = event['event']
+    if kind == 'state':
+        controller.elems[event['code']].state = event['state']
+    elif kind == 'temp':
+        controller.temp = event['temp']
+        controller.crit_t = event['crit_t']
+        controller.display_temp()
+    elif kind == 'log':
+        controller.log(event['msg'], event['level'], event['code'])
+    elif kind == 'ended':
+        controller.end_scenario(event['code'])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Просмотр и воспроизведение журнала сеанса тренажера')
+    commands = parser.add_subparsers(dest='command', required=True)
+    info = commands.add_parser('info', help='сводка журнала')
+    info.add_argument('journal')
+    state = commands.add_parser('state', help='состояние установки на момент времени')
+    state.add_argument('journal')
+    state.add_argument('--at', type=float, required=True, help='секунда от начала журнала')
+    replay = commands.add_parser('replay', help='воспроизвести события в консоль')
+    replay.add_argument('journal')
+    replay.add_argument('--speed', choices=sorted(SPEEDS), default='max')
+    replay.add_argument('--from', dest='start', type=float, default=0.0, help='начать с секунды')
+    args = parser.parse_args(argv)
+    try:
+        reader = JournalReader(args.journal)
+    except (ValueError, OSError) as e:
+        print(e, file=sys.stderr)
+        return 2
+    if args.command == 'info':
+        kinds = np.bincount(reader.records['kind'], minlength=max(KIND_NAMES) + 1)
+        print('%s: записей %d, длительность %.3f с, снимков %d' % (args.journal, len(reader), reader.duration,
+                                                                   len(reader.snapshots)))
+        print('  ' + ', '.join('%s: %d' % (name, kinds[kind]) for kind, name in sorted(KIND_NAMES.items())))
+        if reader.header['meta']:
+            print('  ' + json.dumps(reader.header['meta'], ensure_ascii=False))
+    elif args.command == 'state':
+        states, variables = reader.state_at(args.at)
+        for name, value in variables.items():
+            print('%s = %s' % (name, value))
+        for code, value in states.items():
+            print('%s: %d' % (code, value))
+    else:
+        replayer = Replayer(reader, lambda event: print('%9.3f %s' % (replayer.position, event)), SPEEDS[args.speed])
+        replayer.seek(args.start)
+        replayer.run()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
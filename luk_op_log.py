@@ -0,0 +1,95 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''Журнал контроллера в интерфейсе: модель для виртуализированного просмотра и фильтр.
+Записи и буферизованный журнал (LogPipeline) - в luk_op_logpipe, без зависимости от Qt'''
+
+import os
+from collections import deque
+
+from PyQt5 import QtCore, QtGui
+
+from luk_op_logpipe import LogEntry, LEVELS, format_entry, LogWriter, LogPipeline
+
+LEVEL_COLORS = {'warning': (170, 85, 0), 'error': (170, 0, 0)}
+
+
+# Модель журнала для QListView: хранит не больше history последних записей в кольцевом буфере,
+# вытесняемые записи дописываются в файл spill_path. Текст строки формируется только для видимых строк
+class LogModel(QtCore.QAbstractListModel):
+    def __init__(self, history=5000, spill_path=None, parent=None):
+        super(LogModel, self).__init__(parent)
+        self.history = history
+        self.spill_path = spill_path
+        self._entries = deque()
+        self._spill_file = None
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self._entries[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            return format_entry(entry)
+        if role == QtCore.Qt.ForegroundRole and entry.level in LEVEL_COLORS:
+            return QtGui.QBrush(QtGui.QColor(*LEVEL_COLORS[entry.level]))
+        return None
+
+    def entry(self, row):
+        return self._entries[row]
+
+    def append(self, entries):
+        '''Добавить пачку записей, вытеснив на диск самые старые сверх глубины истории'''
+        if not entries:
+            return
+        if len(entries) > self.history:
+            self.spill(entries[:-self.history])
+            entries = entries[-self.history:]
+        overflow = len(self._entries) + len(entries) - self.history
+        if overflow > 0:
+            self.beginRemoveRows(QtCore.QModelIndex(), 0, overflow - 1)
+            self.spill([self._entries.popleft() for _ in range(overflow)])
+            self.endRemoveRows()
+        first = len(self._entries)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(entries) - 1)
+        self._entries.extend(entries)
+        self.endInsertRows()
+
+    def spill(self, entries):
+        if self.spill_path is None:
+            return
+        if self._spill_file is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.spill_path)), exist_ok=True)
+            self._spill_file = open(self.spill_path, 'a', encoding='utf-8')
+        self._spill_file.write(''.join(format_entry(e) + '\n' for e in entries))
+        self._spill_file.flush()
+
+    def close(self):
+        '''Сбросить на диск всю историю (например, при закрытии окна)'''
+        self.spill(list(self._entries))
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+
+# Фильтр журнала по коду элемента и минимальной важности
+class LogFilterModel(QtCore.QSortFilterProxyModel):
+    def __init__(self, parent=None):
+        super(LogFilterModel, self).__init__(parent)
+        self.code = None
+        self.min_level = 0
+
+    def set_filter(self, code=None, level='info'):
+        self.code = code or None
+        self.min_level = LEVELS.index(level)
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, row, parent):
+        if self.code is None and self.min_level == 0:
+            return True
+        entry = self.sourceModel().entry(row)
+        if self.code is not None and entry.code != self.code:
+            return False
+        return LEVELS.index(entry.level) >= self.min_level
@@ -0,0 +1,107 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''Журнал контроллера без зависимости от Qt: записи, запись без блокировок с пакетной выдачей в интерфейс,
+вывод в консоль и файл из фонового потока. Модели для просмотра в интерфейсе - в luk_op_log'''
+
+import sys
+import time
+import queue
+import atexit
+import datetime
+import threading
+from collections import deque, namedtuple
+
+# level - важность записи (см. LEVELS), code - код элемента, к которому относится запись (или None)
+LogEntry = namedtuple('LogEntry', 'time msg level code', defaults=('info', None))
+
+LEVELS = ('info', 'warning', 'error')  # по возрастанию важности
+
+
+def format_entry(entry):
+    '''Строка журнала с отметкой времени'''
+    return datetime.datetime.fromtimestamp(entry.time).strftime("%Y-%m-%d %H:%M:%S") + ' ' + str(entry.msg)
+
+
+# Фоновый поток, пишущий записи журнала в консоль и (необязательно) в файл пачками
+class LogWriter(threading.Thread):
+    def __init__(self, console=True, path=None):
+        threading.Thread.__init__(self, name='luk-log-writer', daemon=True)
+        self.console = console
+        self.file = open(path, 'a', encoding='utf-8') if path is not None else None
+        self.queue = queue.SimpleQueue()
+
+    def run(self):
+        while True:
+            entries = [self.queue.get()]
+            try:
+                while len(entries) < 1000:
+                    entries.append(self.queue.get_nowait())
+            except queue.Empty:
+                pass
+            stop = None in entries
+            text = ''.join(format_entry(e) + '\n' for e in entries if e is not None)
+            if text:
+                if self.console:
+                    sys.stdout.write(text)
+                    sys.stdout.flush()
+                if self.file is not None:
+                    self.file.write(text)
+                    self.file.flush()
+            if stop:
+                break
+        if self.file is not None:
+            self.file.close()
+
+    def close(self):
+        '''Дописать накопленные записи и остановить поток'''
+        if self.is_alive():
+            self.queue.put(None)
+            self.join()
+
+
+# Журнал: запись из любого потока - append в кольцевой буфер (deque с maxlen атомарен и не требует блокировок),
+# интерфейс забирает накопленное пачкой по таймеру. Если интерфейс не успевает, самые старые непоказанные
+# записи вытесняются из буфера (в консоли и файле журнала они остаются): вытесненные считаются,
+# и следующая пачка для интерфейса начинается с предупреждения о них
+class LogPipeline:
+    def __init__(self, console=True, path=None, gui_capacity=10000):
+        self.gui_buffer = deque(maxlen=gui_capacity)
+        self.path = path
+        self.dropped = 0  # записей, вытесненных из буфера до показа (счет приблизительный при гонке потоков)
+        self._reported = 0
+        self.writer = LogWriter(console, path)
+        self.writer.start()
+        atexit.register(self.writer.close)
+
+    def write(self, msg, level='info', code=None):
+        entry = LogEntry(time.time(), msg, level, code)
+        buffer = self.gui_buffer
+        if len(buffer) == buffer.maxlen:  # append вытеснит самую старую непоказанную запись
+            self.dropped += 1
+        buffer.append(entry)
+        self.writer.queue.put(entry)
+        return entry
+
+    def drain(self):
+        '''Забрать все накопленные для интерфейса записи (с предупреждением о вытесненных, если они были)'''
+        entries = []
+        buffer = self.gui_buffer
+        try:
+            while True:
+                entries.append(buffer.popleft())
+        except IndexError:
+            pass
+        dropped = self.dropped - self._reported
+        if dropped > 0:
+            self._reported += dropped
+            msg = 'Журнал выводится с отставанием: не показано записей - %d' % dropped
+            if self.path is not None:
+                msg += ' (полный журнал - в %s)' % self.path
+            warning = LogEntry(entries[0].time if entries else time.time(), msg, 'warning', None)
+            self.writer.queue.put(warning)
+            entries.insert(0, warning)
+        return entries
+
+    def close(self):
+        self.writer.close()
@@ -0,0 +1,107 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''Сеть условий сценария (в духе Rete): общие подусловия вычисляются один раз на изменение состояния.
+
+При связывании плана сравнения и логические узлы условий (and/or/not) с одинаковой структурой
+становятся одним узлом сети, общим для всех действий контроллера - например, "temp > crit_t"
+из десятков шагов или одна и та же проверка пяти задвижек в нескольких действиях.
+Узел запоминает свое значение до изменения любого из прочитанных им ключей: контроллер сообщает
+об изменении (invalidate), и сбрасываются сразу все узлы, зависящие от ключа, вместе с их предками.
+Узлы, читающие текущее время, не запоминаются - об изменении времени событий нет.
+
+Условия действий - корни сети (watch). Действие, условие которого не выполнено, контроллер
+подписывает на корень, а не на каждую прочитанную переменную: после изменения корень вычисляется
+один раз, и подписанные действия будятся, только если он стал истинным.
+'''
+
+TIME_KEY = 'sc.current_time'
+
+
+def signature(node):
+    '''Структурный ключ узла условия: одинаковые выражения дают равные ключи'''
+    if isinstance(node, (list, tuple)):
+        return tuple(signature(item) for item in node)
+    slots = getattr(type(node), '__slots__', None)
+    if slots is None:
+        return node  # константа или операция из модуля operator
+    return (type(node).__name__,) + tuple(signature(getattr(node, name)) for name in slots)
+
+
+def _memo(compute, cell):
+    '''Запоминающая обертка: cell = [значение действительно, значение]'''
+    def cached():
+        if cell[0]:
+            return cell[1]
+        cell[0] = True  # сброс, пришедший во время вычисления, снова сделает значение недействительным
+        try:
+            value = compute()
+        except Exception:
+            cell[0] = False
+            raise
+        cell[1] = value
+        return value
+    return cached
+
+
+class ConditionNetwork:
+    def __init__(self):
+        self.nodes = {}  # структурный ключ -> связанный узел (общий для всех условий)
+        self.by_dep = {}  # ключ зависимости -> ячейки узлов, читающих его прямо или через потомков
+        self.refs = 0  # сколько раз узлы запрашивались при связывании (refs - len(nodes) - сэкономлено)
+        self.memos = set()  # запоминающие узлы
+        self.roots = set()  # запоминающие узлы, служащие условиями действий
+        self.watched = {}  # ключ зависимости -> корни, читающие его
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def bind(self, node, ctx, deps):
+        '''Связать узел условия через сеть. deps - ключи зависимостей узла (имена из node.names())'''
+        self.refs += 1
+        key = signature(node)
+        func = self.nodes.get(key)
+        if func is None:
+            func = node.bind(ctx)  # потомки связываются через ctx.bind и тоже попадают в сеть
+            if TIME_KEY not in deps:
+                cell = [False, None]
+                func = _memo(func, cell)
+                func.keys = frozenset(deps)
+                self.memos.add(func)
+                for dep in deps:
+                    self.by_dep.setdefault(dep, []).append(cell)
+            self.nodes[key] = func
+        return func
+
+    def watch(self, func):
+        '''Сделать связанный узел корнем - условием действия, на которое подписываются ожидающие действия'''
+        if func in self.memos and func not in self.roots:
+            self.roots.add(func)
+            for dep in func.keys:
+                self.watched.setdefault(dep, []).append(func)
+
+    def watch_as(self, func, wrapper):
+        '''Сделать корнем обертку wrapper над корнем func (например, замер времени профилировщиком):
+        ожидающие действия подписываются на обертку, и при изменении ключей func вычисляется она'''
+        if func in self.roots and wrapper not in self.roots:
+            wrapper.keys = func.keys
+            self.roots.add(wrapper)
+            for dep in wrapper.keys:
+                self.watched.setdefault(dep, []).append(wrapper)
+            return True
+        return False
+
+    def unwatch(self, func):
+        '''Перестать считать func корнем'''
+        if func in self.roots:
+            self.roots.discard(func)
+            for dep in func.keys:
+                self.watched[dep].remove(func)
+
+    def watches(self, cond):
+        return cond in self.roots
+
+    def invalidate(self, key):
+        '''Значение key изменилось: запомненные значения зависящих от него узлов недействительны'''
+        for cell in self.by_dep.get(key, ()):
+            cell[0] = False
@@ -0,0 +1,154 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''Модель технологического процесса: набор переменных (температуры, давления, расходы),
+интегрируемых с постоянным шагом по времени в зависимости от состояний элементов установки.
+
+Модель задается в сценарии разделом "process":
+
+    "process": {
+        "dt": 0.1,                       шаг интегрирования, с
+        "delay": 0,                      задержка запуска модели от начала сценария, с
+        "variables": {
+            "temp": {"init": 60.5, "tau": 50, "base": 490, "inputs": {"зугт": -300, "зуку": -120}},
+            "pressure": {"init": 1.0, "tau": 5, "base": 0.8, "couple": {"temp": 0.004}}
+        }
+    }
+
+Каждая переменная стремится к своему равновесному значению с постоянной времени tau:
+    dx/dt = (base + sum(inputs[код] * состояние элемента) + sum(couple[переменная] * значение) - x) / tau
+Система линейная, поэтому шаг (метод Рунге-Кутты 4-го порядка) сводится к двум умножениям
+заранее вычисленных матриц на вектор - для любого числа связанных переменных.
+Переменная temp передается контроллеру (sc.temp), остальные доступны через sc.process.value(имя).
+'''
+
+import numpy as np
+
+CONTROLLER_VARIABLES = ('temp',)  # переменные модели, значения которых выставляются контроллеру
+RESERVED_NAMES = ('crit_t', 'timer', 'start_time', 'current_time')
+
+
+def validate_process(spec):
+    '''Проверить описание модели; вернуть список ошибок (пустой - описание корректно)'''
+    errors = []
+    if not isinstance(spec, dict):
+        return ['раздел "process" должен быть объектом']
+    unknown = set(spec) - {'dt', 'delay', 'variables'}
+    if unknown:
+        errors.append('неизвестные поля ' + ', '.join(sorted(unknown)))
+    for field in ('dt', 'delay'):
+        value = spec.get(field, 0.1 if field == 'dt' else 0)
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0 or field == 'dt' and value == 0:
+            errors.append('поле "%s" должно быть %s числом' % (field, 'положительным' if field == 'dt' else 'неотрицательным'))
+    variables = spec.get('variables')
+    if not isinstance(variables, dict) or not variables:
+        return errors + ['поле "variables" должно быть непустым объектом']
+    for name, var in variables.items():
+        if name in RESERVED_NAMES:
+            errors.append('%s: имя занято переменной контроллера' % name)
+            continue
+        if not isinstance(var, dict):
+            errors.append('%s: описание переменной должно быть объектом' % name)
+            continue
+        unknown = set(var) - {'init', 'tau', 'base', 'inputs', 'couple'}
+        if unknown:
+            errors.append('%s: неизвестные поля %s' % (name, ', '.join(sorted(unknown))))
+        for field in ('init', 'tau', 'base'):
+            value = var.get(field, 0 if field != 'tau' else 1)
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                errors.append('%s: поле "%s" должно быть числом' % (name, field))
+            elif field == 'tau' and value <= 0:
+                errors.append('%s: постоянная времени tau должна быть положительной' % name)
+        for field in ('inputs', 'couple'):
+            table = var.get(field, {})
+            if not isinstance(table, dict) or any(isinstance(k, bool) or not isinstance(k, (int, float))
+                                                  for k in table.values()):
+                errors.append('%s: поле "%s" должно быть объектом с числовыми коэффициентами' % (name, field))
+            elif field == 'couple':
+                for other in table:
+                    if other not in variables:
+                        errors.append('%s: связь с неизвестной переменной "%s"' % (name, other))
+    return errors
+
+
+class ProcessModel:
+    def __init__(self, spec):
+        self.dt = float(spec.get('dt', 0.1))
+        self.delay = spec.get('delay', 0)
+        variables = spec['variables']
+        self.names = list(variables)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.input_codes = sorted({code for var in variables.values() for code in var.get('inputs', {})})
+        n, m = len(self.names), len(self.input_codes)
+        A = np.zeros((n, n))
+        B = np.zeros((n, m))
+        c = np.zeros(n)
+        self.initial = np.zeros(n)
+        for i, name in enumerate(self.names):
+            var = variables[name]
+            tau = float(var.get('tau', 1))
+            self.initial[i] = var.get('init', 0)
+            A[i, i] -= 1 / tau
+            c[i] = var.get('base', 0) / tau
+            for other, k in var.get('couple', {}).items():
+                A[i, self.index[other]] += k / tau
+            for code, k in var.get('inputs', {}).items():
+                B[i, self.input_codes.index(code)] = k / tau
+        # Шаг Рунге-Кутты 4-го порядка для x' = A x + b при постоянном на шаге b: x <- P x + Q b
+        hA = self.dt * A
+        I = np.eye(n)
+        hA2 = hA @ hA
+        hA3 = hA2 @ hA
+        self.P = I + hA + hA2 / 2 + hA3 / 6 + hA3 @ hA / 24
+        self.Q = self.dt * (I + hA / 2 + hA2 / 6 + hA3 / 24)
+        self.B = B
+        self.c = c
+        self.x = self.initial.copy()
+        self.controller = None
+        self.t = None  # время контроллера, до которого проинтегрирована модель
+
+    def value(self, name):
+        return float(self.x[self.index[name]])
+
+    def values(self):
+        return dict(zip(self.names, self.x.tolist()))
+
+    def step(self, u, steps=1):
+        '''Проинтегрировать steps шагов при векторе состояний входных элементов u'''
+        b = self.B @ u + self.c
+        Qb = self.Q @ b
+        x, P = self.x, self.P
+        for _ in range(steps):
+            x = P @ x + Qb
+        self.x = x
+
+    def bind(self, controller):
+        '''Связать модель с контроллером; вернуть функцию-действие, продвигающую модель до текущего времени'''
+        self.controller = controller
+        self.x = self.initial.copy()
+        self.t = None
+        store = controller.states
+        input_index = np.array([store.index[code] for code in self.input_codes], dtype=np.intp)
+        dtype = np.dtype('i%d' % store.values.itemsize)
+        mapped = [(name, self.index[name]) for name in CONTROLLER_VARIABLES if name in self.index]
+        written = {}
+        controller.process = self
+
+        def advance():
+            now = controller.current_time
+            if self.t is None:
+                self.t = now
+            steps = int((now - self.t) / self.dt + 1e-9)
+            for name, i in mapped:  # значение, заданное сценарием напрямую (например, set_temp), переносим в модель
+                current = getattr(controller, name)
+                if written.get(name) != current:
+                    self.x[i] = current
+            if steps > 0:
+                u = np.frombuffer(store.values, dtype=dtype)[input_index]
+                self.step(u, steps)
+                self.t += steps * self.dt
+            for name, i in mapped:
+                written[name] = float(self.x[i])
+                setattr(controller, name, written[name])
+            controller.display_temp()
+        return advance
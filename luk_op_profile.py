@@ -0,0 +1,220 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''Профилировщик контроллера сценариев (включается по требованию).
+
+Собирает гистограммы: время выполнения каждого действия, время вычисления каждого условия,
+отставание от расписания (момент проверки минус срок) и интервал между итерациями цикла контроллера.
+Пока профилировщик не подключен, код контроллера не меняется и не платит ничего: подключение
+оборачивает функции сценария, метод process_action и часы контроллера (у контроллера на asyncio - ожидание
+срока sleep_until и итерацию моста с циклом Qt), отключение возвращает их на место.
+'''
+
+import math
+import time
+
+
+# Гистограмма длительностей с логарифмическими корзинами: 4 корзины на октаву от 1 мкс до ~17 мин
+class Histogram:
+    __slots__ = ('counts', 'n', 'total', 'max')
+
+    MIN_VALUE = 1e-6
+    PER_OCTAVE = 4
+    BUCKETS = 30 * PER_OCTAVE
+
+    def __init__(self):
+        self.counts = [0] * self.BUCKETS
+        self.n = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value):
+        if value > self.MIN_VALUE:
+            b = min(int(math.log2(value / self.MIN_VALUE) * self.PER_OCTAVE), self.BUCKETS - 1)
+        else:
+            b = 0
+        self.counts[b] += 1
+        self.n += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def bucket_value(self, b):
+        '''Верхняя граница корзины b'''
+        return self.MIN_VALUE * 2 ** ((b + 1) / self.PER_OCTAVE)
+
+    def percentile(self, q):
+        '''Оценка q-го перцентиля (с точностью до корзины, ~19%)'''
+        if self.n == 0:
+            return 0.0
+        rank = q / 100.0 * self.n
+        seen = 0
+        for b, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(self.bucket_value(b), self.max)
+        return self.max
+
+    @property
+    def mean(self):
+        return self.total / self.n if self.n else 0.0
+
+
+class Profiler:
+    def __init__(self):
+        self.actions = {}  # ключ действия -> гистограмма времени выполнения
+        self.conditions = {}  # ключ действия -> гистограмма времени вычисления условия
+        self.lag = Histogram()  # отставание проверки действия от ее срока
+        self.ticks = Histogram()  # интервал между итерациями цикла контроллера
+        self.tick_count = 0
+        self.started = None
+        self.engine = None
+        self._last_tick = None
+        self._roots = []  # обертки условий, зарегистрированные корнями сети условий контроллера
+
+    def attach(self, engine):
+        '''Подключить профилировщик к контроллеру (до запуска сценария)'''
+        self.engine = engine
+        self.started = time.perf_counter()
+        engine.profiler = self
+        if hasattr(engine, 'sleep_until'):  # AsyncScenarioController: process_action и wait_until не вызываются
+            return self.attach_async(engine)
+        process_action = engine.process_action
+        clock_wait = engine.clock.wait_until
+
+        def profiled_process_action(record, due=None):
+            if due is not None:
+                self.lag.add(max(0.0, engine.clock.now() - due))
+            process_action(record, due)
+
+        def profiled_wait_until(condition, deadline):
+            self.tick()
+            return clock_wait(condition, deadline)
+
+        engine.process_action = profiled_process_action
+        engine.clock.wait_until = profiled_wait_until
+        return self
+
+    def attach_async(self, engine):
+        '''Подключение к контроллеру на asyncio: отставание - после ожидания срока действия,
+        итерации - порции цикла asyncio, выполняемые мостом в цикле Qt (без моста итерации не считаются)'''
+        sleep_until = engine.sleep_until
+
+        async def profiled_sleep_until(deadline):
+            await sleep_until(deadline)
+            self.lag.add(max(0.0, engine.clock.now() - deadline))
+
+        engine.sleep_until = profiled_sleep_until
+        bridge = engine.bridge
+        if bridge is not None:
+            run_once = bridge.run_once
+
+            def profiled_run_once():
+                self.tick()
+                run_once()
+            bridge.run_once = profiled_run_once
+        return self
+
+    def tick(self):
+        '''Очередная итерация цикла контроллера'''
+        now = time.perf_counter()
+        if self._last_tick is not None:
+            self.ticks.add(now - self._last_tick)
+        self._last_tick = now
+        self.tick_count += 1
+
+    def detach(self):
+        '''Отключить профилировщик: контроллер возвращается к исходным методам'''
+        engine = self.engine
+        if engine is None:
+            return
+        if hasattr(engine, 'sleep_until'):
+            del engine.sleep_until
+            if engine.bridge is not None and 'run_once' in vars(engine.bridge):
+                del engine.bridge.run_once
+        else:
+            del engine.process_action
+            del engine.clock.wait_until
+        self.unwatch_roots()
+        engine.profiler = None
+        self.engine = None
+
+    def instrument(self, scenario):
+        '''Вернуть копию сценария, в которой функции и условия действий замеряют свое время.
+        Обертка условия из сети условий регистрируется в ней корнем вместо исходного условия, иначе
+        действие ждало бы переменных условия, а не его истинности'''
+        self.unwatch_roots()  # обертки прошлого запуска
+        network = getattr(self.engine, 'conditions', None)
+        instrumented = {}
+        for key, (func, cond, period, delay) in scenario.items():
+            timed_func = self.timed(func, self.actions.setdefault(key, Histogram()))
+            for name in ('catch_up', 'merge'):  # политика догона и объединенный вызов повторяемого действия
+                if hasattr(func, name):
+                    setattr(timed_func, name, getattr(func, name))
+            func = timed_func
+            if callable(cond):
+                timed_cond = self.timed(cond, self.conditions.setdefault(key, Histogram()))
+                if getattr(cond, 'deps', None) is not None:
+                    timed_cond.deps = cond.deps
+                if network is not None and network.watch_as(cond, timed_cond):
+                    self._roots.append(timed_cond)
+                cond = timed_cond
+            instrumented[key] = (func, cond, period, delay)
+        return instrumented
+
+    def unwatch_roots(self):
+        network = getattr(self.engine, 'conditions', None)
+        if network is not None:
+            for root in self._roots:
+                network.unwatch(root)
+        self._roots = []
+
+    @staticmethod
+    def timed(func, hist):
+        perf_counter = time.perf_counter
+
+        def wrapper():
+            t = perf_counter()
+            try:
+                return func()
+            finally:
+                hist.add(perf_counter() - t)
+        return wrapper
+
+    def tick_rate(self):
+        '''Средняя частота итераций цикла контроллера, 1/с'''
+        if self.started is None:
+            return 0.0
+        elapsed = time.perf_counter() - self.started
+        return self.tick_count / elapsed if elapsed > 0 else 0.0
+
+    def slowest(self, n=10, q=99):
+        '''n самых медленных действий и условий: (вид, ключ, гистограмма), по убыванию q-го перцентиля'''
+        rows = [('действие', key, hist) for key, hist in self.actions.items() if hist.n] + \
+               [('условие', key, hist) for key, hist in self.conditions.items() if hist.n]
+        rows.sort(key=lambda row: row[2].percentile(q), reverse=True)
+        return rows[:n]
+
+    def overrun_line(self):
+        '''Строка отчета о сроках повторяемых действий (см. ScenarioEngine.overrun_stats)'''
+        if self.engine is None:
+            return 'сроки повторяемых действий: нет данных'
+        stats = self.engine.overrun_stats()
+        line = 'сроки повторяемых действий: срабатываний %d, с отставанием на период %d, пропущено сроков %d, ' \
+               'макс. отставание %.3f мс' % (stats['fired'], stats['overruns'], stats['missed'], stats['max_lag'] * 1e3)
+        if stats['worst'] is not None:
+            line += ' (%s)' % stats['worst']
+        return line
+
+    def report(self, n=10):
+        '''Текстовый отчет'''
+        lines = ['итераций: %d (%.1f/с), интервал p50 %.3f мс, p99 %.3f мс' %
+                 (self.tick_count, self.tick_rate(), self.ticks.percentile(50) * 1e3, self.ticks.percentile(99) * 1e3),
+                 'отставание от расписания: p50 %.3f мс, p99 %.3f мс, макс. %.3f мс' %
+                 (self.lag.percentile(50) * 1e3, self.lag.percentile(99) * 1e3, self.lag.max * 1e3),
+                 self.overrun_line(),
+                 '%-9s %-40s %7s %10s %10s %10s' % ('вид', 'ключ', 'n', 'p50, мкс', 'p99, мкс', 'макс, мкс')]
+        for kind, key, hist in self.slowest(n):
+            lines.append('%-9s %-40s %7d %10.1f %10.1f %10.1f' % (kind, key[:40], hist.n, hist.percentile(50) * 1e6,
+                                                                  hist.percentile(99) * 1e6, hist.max * 1e6))
+        return '\n'.join(lines)
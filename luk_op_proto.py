@@ -4,38 +4,162 @@
 import os
 import sys
 import time
-import math
+STARTUP_STARTED = time.perf_counter()  # отчет о запуске считает импорт от этой точки
 import datetime
 
-from PyQt5 import QtGui, QtCore, QtWidgets
-import luk_op_gui_upd as gui
+from PyQt5 import QtGui, QtCore, QtWidgets, sip
+import luk_op_gui_upd as gui  # вместе с ресурсами Qt (картинки - в luk_op_resources_rc)
+from luk_op_sprites import sprite_cache, sprite_atlas
+from luk_op_log import LogPipeline, LogModel, LogFilterModel, LEVELS
+from luk_op_engine import ScenarioEngine, LazyScenarios
+from luk_op_actions import CATCH_UP_POLICIES
+from luk_op_display import DisplayChannel
+from luk_op_elements import ELEMENTS, BUTTONS, Element as BaseElement
+
+# Статичные картинки мнемосхемы: (виджет, спрайт в атласе) - переносятся на сцену вместе с элементами (--scene)
+STATIC_SPRITES = (
+    ('gtu_static', 'raw_img/гту_0'),
+    ('gtu_static_2', 'raw_img/гту_2'),
+)
 
-elems = {}
 
 # Override-класс интерфейса для реализации обработки кастомных сигналов
 class LukWidget(QtWidgets.QMainWindow, gui.Ui_MainWindow):
 
     resized = QtCore.pyqtSignal()
+    display_posted = QtCore.pyqtSignal()  # контроллер записал в канал состояния первое значение после показа
+
+    LOG_FLUSH_INTERVAL = 33  # мс между выдачами накопленного журнала в интерфейс (~30 кадров/с)
+    PROFILE_REFRESH_INTERVAL = 500  # мс между обновлениями панели профилировщика
+    RELAYOUT_INTERVAL = 16  # мс: серия событий изменения размера сливается в одно масштабирование за кадр
+    DISPLAY_INTERVAL = 16  # мс: изменения состояния от контроллера применяются не чаще раза в кадр
 
-    def __init__(self, controller):
+    def __init__(self, controller, max_log_entries=5000, log_spill_path=None):
         super(LukWidget, self).__init__()
         self.setupUi(self)
-        self.resized.connect(self.scale_elems)
         self.sc = controller
-        self.sc.sig_new_log_entry.connect(self.new_log_entry)  # соединяем один слот с сигналом
-        self.sc.sig_new_temp_value.connect(self.new_temp_value)  # другой слот с сигналом
         self.sc.sig_scenario_ended.connect(self.stop_controller)
         self.sc.sig_highlight.connect(self.highlight_button)
         self.sc.sig_reset_style.connect(self.reset_stylesheet)
         self.sc.sig_reset_all_styles.connect(self.reset_global_stylesheets)
-        self.w = self.window().width()
-        self.h = self.window().height()
         children = self.findChildren(QtWidgets.QWidget)
         for child in children:
             child.setMouseTracking(True)
+        if log_spill_path is None:
+            log_spill_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs',
+                                          datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S') + '.log')
+        self.setup_log_view(max_log_entries, log_spill_path)
+        self.setup_scaling()
+        self.log_timer = QtCore.QTimer(self)
+        self.log_timer.timeout.connect(self.flush_log)
+        self.log_timer.start(self.LOG_FLUSH_INTERVAL)
+        self.setup_display()
+
+    def setup_display(self):
+        '''Табло и спрайты элементов обновляются из канала состояния контроллера, только в GUI-потоке'''
+        self.display = self.sc.display
+        self.display_timer = QtCore.QTimer(self)
+        self.display_timer.setSingleShot(True)
+        self.display_timer.setInterval(self.DISPLAY_INTERVAL)
+        self.display_timer.timeout.connect(self.apply_display)
+        self.display_posted.connect(self.schedule_display)  # из потока контроллера - через очередь событий
+        self.display.on_post = self.display_posted.emit
+
+    def schedule_display(self):
+        if not self.display_timer.isActive():
+            self.display_timer.start()
+
+    def apply_display(self):
+        '''Применить к виджетам накопленные с прошлого кадра изменения'''
+        for key, value in self.display.take():
+            if key == 'temp':
+                self.new_temp_value(*value)
+            else:  # элемент установки
+                key.update_colors(value)
+
+    def setup_log_view(self, history, spill_path):
+        '''Заменить текстовый журнал из дизайнера на список, отрисовывающий только видимые строки,
+        и добавить фильтры по важности и коду элемента'''
+        self.log_model = LogModel(history, spill_path, self)
+        self.log_filter = LogFilterModel(self)
+        self.log_filter.setSourceModel(self.log_model)
+        self.log_view = QtWidgets.QListView(self.centralwidget)
+        self.log_view.setGeometry(self.log.geometry())
+        self.log_view.setMinimumSize(self.log.minimumSize())
+        self.log_view.setObjectName("log_view")
+        self.log_view.setUniformItemSizes(True)  # высота строк не пересчитывается для каждой записи
+        self.log_view.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.log_view.setModel(self.log_filter)
+        self.log.hide()
+        self.log.setParent(None)  # убираем из дерева виджетов сразу, чтобы его не масштабировать
+        self.log.deleteLater()
+        self.log = None
+        self.log_level = QtWidgets.QComboBox(self.centralwidget)
+        self.log_level.setGeometry(QtCore.QRect(110, 590, 140, 25))
+        self.log_level.setObjectName("log_level")
+        for level, title in zip(LEVELS, ("Все записи", "Предупреждения", "Ошибки")):
+            self.log_level.addItem(title, level)
+        self.log_code = QtWidgets.QComboBox(self.centralwidget)
+        self.log_code.setGeometry(QtCore.QRect(110, 620, 140, 25))
+        self.log_code.setObjectName("log_code")
+        self.log_code.addItem("Все элементы", None)
+        self.log_level.currentIndexChanged.connect(self.apply_log_filter)
+        self.log_code.currentIndexChanged.connect(self.apply_log_filter)
+        self.log_view.raise_()
+
+    def setup_profiler_dock(self, profiler, rows=15):
+        '''Добавить отладочную панель с самыми медленными действиями и условиями контроллера'''
+        self.profiler = profiler
+        dock = QtWidgets.QDockWidget("Профилировщик контроллера", self)
+        dock.setObjectName("profiler_dock")
+        panel = QtWidgets.QWidget(dock)
+        layout = QtWidgets.QVBoxLayout(panel)
+        self.profiler_summary = QtWidgets.QLabel(panel)
+        layout.addWidget(self.profiler_summary)
+        self.profiler_table = QtWidgets.QTableWidget(rows, 6, panel)
+        self.profiler_table.setHorizontalHeaderLabels(["Вид", "Ключ", "n", "p50, мкс", "p99, мкс", "Макс, мкс"])
+        self.profiler_table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.profiler_table.verticalHeader().hide()
+        layout.addWidget(self.profiler_table)
+        dock.setWidget(panel)
+        self.addDockWidget(QtCore.Qt.RightDockWidgetArea, dock)
+        self.profiler_timer = QtCore.QTimer(self)
+        self.profiler_timer.timeout.connect(self.refresh_profiler_dock)
+        self.profiler_timer.start(self.PROFILE_REFRESH_INTERVAL)
+
+    def refresh_profiler_dock(self):
+        profiler = self.profiler
+        self.profiler_summary.setText("Итераций: %d (%.1f/с)\nОтставание: p50 %.2f мс, p99 %.2f мс, макс. %.2f мс" %
+                                      (profiler.tick_count, profiler.tick_rate(), profiler.lag.percentile(50) * 1e3,
+                                       profiler.lag.percentile(99) * 1e3, profiler.lag.max * 1e3))
+        table = self.profiler_table
+        table.clearContents()
+        for row, (kind, key, hist) in enumerate(profiler.slowest(table.rowCount())):
+            values = (kind, key, str(hist.n), '%.1f' % (hist.percentile(50) * 1e6),
+                      '%.1f' % (hist.percentile(99) * 1e6), '%.1f' % (hist.max * 1e6))
+            for column, value in enumerate(values):
+                table.setItem(row, column, QtWidgets.QTableWidgetItem(value))
+
+    def add_log_filter_code(self, code):
+        '''Добавить код элемента в список фильтра журнала'''
+        self.log_code.addItem(code, code)
+
+    def apply_log_filter(self):
+        self.log_filter.set_filter(self.log_code.currentData(), self.log_level.currentData())
     
-    def new_log_entry(self, msg):
-        self.log.append(str(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")) + ' ' + str(msg))
+    def flush_log(self):
+        '''Вывести накопленные записи журнала в модель одной пачкой'''
+        entries = self.sc.log_pipeline.drain()
+        if entries:
+            scrollbar = self.log_view.verticalScrollBar()
+            at_bottom = scrollbar.value() == scrollbar.maximum()
+            self.log_model.append(entries)
+            if at_bottom:
+                self.log_view.scrollToBottom()
+
+    def closeEvent(self, event):
+        self.log_model.close()
+        return super(LukWidget, self).closeEvent(event)
     
     def new_temp_value(self, value, crit_t):
         if value >= crit_t:
@@ -53,33 +177,125 @@ class LukWidget(QtWidgets.QMainWindow, gui.Ui_MainWindow):
         tmp_plt.setBrush(QtGui.QPalette.Active, QtGui.QPalette.WindowText, brush)
         self.ctgt.setPalette(tmp_plt)
         self.label_8.setPalette(tmp_plt)
-        self.ctgt.display(value)
+        self.ctgt.display(round(value, 1))  # при модели процесса температура меняется непрерывно
     
     def stop_controller(self, code):
-        self.sc.active = False
-        self.log.append("=== Сценарий завершен ===")
-        self.log.append("Код завершения: " + str(code))
+        self.sc.stop()
+        self.sc.log("=== Сценарий завершен ===")
+        self.sc.log("Код завершения: " + str(code), 'info' if code == 0 else 'error')
+        self.flush_log()
         self.sc.exit()
     
     def resizeEvent(self, event):
         self.resized.emit()
         return super(LukWidget, self).resizeEvent(event)
     
-    def scale_elems(self):
+    def setup_scaling(self):
+        '''Запомнить размер окна и геометрию виджетов из дизайнера: масштаб всегда считается от них,
+        а не от текущей геометрии, поэтому ошибки округления не накапливаются'''
+        self.design_height = self.window().height()
+        self.design_geometry = {}  # виджет -> (x, y, ширина, высота) при масштабе 1
+        self.design_scanned = 0  # число дочерних виджетов при последнем обходе
+        self.scale = 1.0
+        self.sprite_elements = []  # элементы, спрайты которых готовятся под размер виджета
+        self.sprite_widgets = {}  # виджет -> элемент (для отрисовки из атласа)
+        self.mimic = None  # вид мнемосхемы на сцене (setup_scene); None - картинки показывают QLabel из дизайнера
+        self.relayout_timer = QtCore.QTimer(self)
+        self.relayout_timer.setSingleShot(True)
+        self.relayout_timer.setInterval(self.RELAYOUT_INTERVAL)
+        self.relayout_timer.timeout.connect(self.scale_elems)
+        self.resized.connect(self.schedule_relayout)
+
+    def schedule_relayout(self):
+        '''Отложить масштабирование до конца кадра; события изменения размера до этого момента сливаются'''
+        if not self.relayout_timer.isActive():
+            self.relayout_timer.start()
+
+    def add_sprite_element(self, elem):
+        '''Перерисовывать спрайт элемента под новый размер виджета при масштабировании
+        и рисовать его из атласа, если там есть вариант'''
+        self.sprite_elements.append(elem)
+        self.sprite_widgets[elem.widget] = elem
+        elem.widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        '''Отрисовка виджета элемента копированием варианта из атласа вместо отрисовки QLabel'''
+        if event.type() == QtCore.QEvent.Paint:
+            elem = self.sprite_widgets.get(obj)
+            if elem is not None and elem.atlas is not None:
+                painter = QtGui.QPainter(obj)
+                drawn = sprite_atlas().draw(painter, elem.atlas, elem.color_state, QtCore.QRectF(obj.rect()))
+                painter.end()
+                if drawn:
+                    return True
+        return super().eventFilter(obj, event)
+
+    def setup_scene(self):
+        '''Перенести картинки мнемосхемы (элементы и статичные картинки) на одну сцену (luk_op_scene):
+        смена состояния элемента перерисовывает только его область. Вызывать после add_sprite_element.
+        Переносятся картинки, лежащие прямо в окне; картинки во вложенных панелях (frame) должны
+        оставаться поверх панели и остаются виджетами (рисуются из атласа)'''
+        from luk_op_scene import MimicView
+        root = self.centralwidget
+        scale = self.scale
+        self.mimic = MimicView(root, QtCore.QRect(0, 0, round(self.width() / scale), round(self.height() / scale)))
+        elements = {elem.widget: elem for elem in self.sprite_elements}
+        statics = {getattr(self, name): (name, sprite) for name, sprite in STATIC_SPRITES}
+        for label in root.children():  # порядок дочерних виджетов - порядок наложения
+            elem, static = elements.get(label), statics.get(label)
+            if elem is None and static is None:
+                continue
+            g = label.geometry()
+            rect = QtCore.QRectF(g.x() / scale, g.y() / scale, g.width() / scale, g.height() / scale)
+            if elem is not None:
+                elem.item = self.mimic.add_label(label, rect, sprite_cache.sprite_name(elem.code), elem.code,
+                                                 elem.color_state)
+                self.sprite_widgets.pop(label, None)
+                label.hide()
+                label.setParent(None)  # виджет остается у элемента, но не масштабируется и не рисуется
+            else:
+                self.mimic.add_label(label, rect, static[1])
+                setattr(self, static[0], None)
+                label.setParent(None)
+                label.deleteLater()
+            self.design_geometry.pop(label, None)
+        self.design_scanned = 0
+        self.mimic.set_scale(scale)
+        self.mimic.lower()
+        self.mimic.show()
+
+    def scan_design_geometry(self):
+        '''Учесть виджеты, добавленные в окно после последнего обхода, и забыть удаленные.
+        Масштабируются только именованные виджеты (из дизайнера и созданные тренажером), внутренние
+        виджеты Qt (полосы прокрутки, области просмотра) раскладывают их владельцы'''
         children = self.centralwidget.findChildren(QtWidgets.QWidget)
-        w1 = self.window().width()
-        h1 = self.window().height()
-        h_scale_rate = h1 / self.h
+        if len(children) == self.design_scanned:
+            return
+        self.design_scanned = len(children)
+        known = self.design_geometry
+        for widget in [w for w in known if sip.isdeleted(w)]:
+            del known[widget]
         for widget in children:
-            if widget.height() > 0:
-                aspect =  widget.width() / widget.height()
-            else:
-                aspect = 1
-            new_height = widget.height() * h_scale_rate
-            new_width = new_height * aspect
-            widget.setGeometry(round(widget.geometry().x() * h_scale_rate), round(widget.geometry().y() * h_scale_rate), new_width, new_height)
-        self.w = w1
-        self.h = h1
+            name = widget.objectName()
+            if widget not in known and name and not name.startswith('qt_'):
+                g = widget.geometry()
+                known[widget] = (g.x() / self.scale, g.y() / self.scale, g.width() / self.scale, g.height() / self.scale)
+
+    def scale_elems(self):
+        '''Масштабировать виджеты по высоте окна относительно геометрии из дизайнера'''
+        self.scan_design_geometry()
+        scale = self.window().height() / self.design_height
+        if scale == self.scale:
+            return
+        self.scale = scale
+        targets = [(widget, round(x * scale), round(y * scale), round(w * scale), round(h * scale))
+                   for widget, (x, y, w, h) in self.design_geometry.items()]
+        for widget, x, y, w, h in targets:
+            widget.setGeometry(x, y, w, h)
+        if self.mimic is not None:
+            self.mimic.set_scale(scale)
+        for elem in self.sprite_elements:  # спрайт нового размера из атласа или кеша, а не масштабирование при каждой отрисовке
+            elem.update_colors(elem.color_state)
     
     def highlight_button(self, button):
         button.setStyleSheet('background-color:rgb(255, 255, 127)')
@@ -99,184 +315,84 @@ class LukWidget(QtWidgets.QMainWindow, gui.Ui_MainWindow):
         #self.log(pos)
 
 
-# Класс, минимально описыващий элементы установки для реализации логики
-class Element:
+# Отчет о времени запуска (ключ --startup-report): длительность этапов от начала импорта до первого кадра
+class StartupReport:
+    def __init__(self, started=STARTUP_STARTED):
+        self.started = started
+        self.last = started
+        self.stages = []  # (этап, секунды)
+
+    def mark(self, stage):
+        '''Завершить этап stage, начатый предыдущей отметкой'''
+        now = time.perf_counter()
+        self.stages.append((stage, now - self.last))
+        self.last = now
+
+    def text(self):
+        return 'Запуск за %.3f с: %s' % (self.last - self.started,
+                                         ', '.join('%s %.3f с' % stage for stage in self.stages))
+
+
+# Элемент в окне тренажера: спрайт виджета окрашивается в цвет состояния
+class Element(BaseElement):
+    __slots__ = ('atlas', 'item')
+
     def __init__(self, controller, code, widget, initial_state=0):
-        self.controller = controller
-        self.code = code
-        self.widget = widget
-        self.state = initial_state
+        BaseElement.__init__(self, controller, code, widget, initial_state)
+        self.atlas = None  # имя спрайта, если виджет рисуется из атласа (None - показывает свой QPixmap)
+        self.item = None  # объект сцены мнемосхемы, заменивший виджет (LukWidget.setup_scene)
 
-    def change_sprite(self):
-        '''В интерфейсе заменить спрайт одного состояния на спрайт другого состояния'''
-        if self.widget is not None:
-            self.update_colors(self.state)
-        else:
-            print('Warning: Nothing to change', file=sys.stderr)
-    
     def update_colors(self, color_state = 0):
         '''Перерисовываем спрайт с наложением соответствующего состоянию цвета'''
         if self.widget is not None:
-            if os.path.exists(os.path.dirname(os.path.abspath(__file__)) + '/img/' + self.code + '.png'):
-                pxm = QtGui.QPixmap(os.path.dirname(os.path.abspath(__file__)) + '/img/' + self.code + '.png')
-            else:
-                pxm = QtGui.QPixmap(os.path.dirname(os.path.abspath(__file__)) + '/img/temp.png')
-            if color_state == 0:
-                widget_color = QtGui.QColor(170, 255, 0, 150)
+            if color_state is None:
+                return
+            self.color_state = color_state
+            if self.item is not None:  # перерисуется только область спрайта на сцене
+                self.item.set_state(color_state)
+                return
+            atlas = sprite_atlas()
+            name = sprite_cache.sprite_name(self.code)
+            if atlas is not None and atlas.has(name, color_state):
+                self.atlas = name  # готовый вариант нарисует LukWidget.eventFilter
+                self.widget.update()
             else:
-                widget_color = QtGui.QColor(255, 170, 170, 150)
-            p = QtGui.QPainter(pxm)
-            p.setCompositionMode(QtGui.QPainter.CompositionMode_SourceAtop)
-            p.fillRect(pxm.rect(), widget_color)
-            p.end()
-            self.widget.setPixmap(pxm)
+                self.atlas = None
+                self.widget.setPixmap(sprite_cache.get(self.code, color_state, self.widget.size()))
         else:
             print('Warning: Nothing to update', file=sys.stderr)
-    
-    def set_state(self, new_state, condition=None, *args, **kwargs):
-        '''Установить состояние вручную'''
-        if condition is not None and callable(condition):
-            cond = condition(*args, **kwargs)
-            if cond[0]:
-                self.state = new_state
-                self.change_sprite()
-                self.controller.log(self.code + ': состояние установлено на ' + str(self.state) + ' по условию ' + str(cond[1]))
-            else:
-                pass #self.controller.log(self.code + ': был запрос на установку состояния ' + str(new_state) + '; не выполнено условие ' + str(cond[1]))
-        else:
-            self.state = new_state
-            self.change_sprite()
-            self.controller.log(self.code + ': состояние установлено на ' + str(self.state) + ' без условия')
-
-    def change_state(self, condition=None, *args, **kwargs):
-        '''Проверить, выполняется ли некое условие (или его отсутствие), после чего поменять состояние на противположное'''
-        if condition is not None and callable(condition):
-            cond = condition(*args, **kwargs)
-            if cond[0]:
-                self.state = 1 - self.state
-                self.change_sprite()
-                self.controller.log(self.code + ': состояние с ' + str(1 - self.state) + ' изменено на ' + str(self.state) + ' по условию ' + str(cond[1]))
-            else:
-                pass #self.controller.log(self.code + ': был запрос на изменение состояния с ' + str(self.state) + ' на ' + str(1 - self.state) + '; не выполнено условие ' + str(cond[1]))
-        else:
-            self.state = 1 - self.state
-            self.change_sprite()
-            self.controller.log(self.code + ': состояние с ' + str(1 - self.state) + ' изменено на ' + str(self.state) + ' без условия')
 
 
 # Класс-контроллер, работает в отдельном потоке и посылает сигналы интерфейсу
-class ScenarioController(QtCore.QThread):
+class ScenarioController(ScenarioEngine, QtCore.QThread):
 
-    sig_new_log_entry = QtCore.pyqtSignal(object)  # сигнал для обновления лога
-    sig_new_temp_value = QtCore.pyqtSignal(float, float)  # сигнал для обновления цифрового табло
     sig_scenario_ended = QtCore.pyqtSignal(int)  # сигнал для завершения сценария
     sig_highlight = QtCore.pyqtSignal(object)
     sig_reset_style = QtCore.pyqtSignal(object)
     sig_reset_all_styles = QtCore.pyqtSignal()
 
-    def __init__(self, temp=60, critical_temp=200, timer=60.0):
+    def __init__(self, temp=60, critical_temp=200, timer=60.0, log_file=None):
         QtCore.QThread.__init__(self)
-        self.active = False
-        self.temp = temp
-        self.crit_t = critical_temp
-        self.action_handler = []
-        self.start_time = datetime.datetime.now().timestamp()
-        self.current_time = self.start_time
-        self.timer = timer
+        self.log_pipeline = LogPipeline(path=log_file)  # журнал в консоль, файл и (пачками) в интерфейс
+        self.display = DisplayChannel()  # табло и спрайты элементов - в интерфейс раз в кадр
+        ScenarioEngine.__init__(self, temp, critical_temp, timer)
         self.mode = 'test'
+        self.elems = {}  # код -> элемент установки
+        self.scenarios = {}  # режим (test, demo) -> связанный с элементами сценарий
     
     def __del__(self):
         self.wait()
 
-    def execute_scenario(self, scenario): # последовательно выполнить все действия, если выполнены их условия, в сценарии scenario
-        self.start_time = datetime.datetime.now().timestamp()
-        self.current_time = self.start_time
-        self.action_handler = []
-        for action in scenario.keys():
-            self.action_handler.append([scenario[action], 0, self.current_time])
-        self.active = True
-        while self.active:
-            for action in self.action_handler:
-                if self.current_time - self.start_time >= action[0][3]:  # если прошло достаточно времени с момента старта сценария
-                    if action[0][2] != -1:  # если действие повторяемое
-                        if action[0][1] is not None and callable(action[0][1]):  # если действие выполняется по условию
-                            if action[0][1]() and (self.current_time - action[2]) >= action[0][2]:  # если условие выполнено и при этом прошло достаточно времени для повтора
-                                action[0][0]()  # выполняем действие
-                                action[2] = self.current_time  # указываем время последнего выполнения
-                            elif not action[0][1]():  # если условие больше не выполняется
-                                action[1] += 1  # помечаем, что действие больше не нужно выполнять
-                            else:
-                                continue  # если нет, идем дальше
-                    else:
-                        if action[1] == 0 and action[0][1] is None:  # если действие не повторяется и не выполнялось еще ни разу
-                            action[0][0]()  # выполняем действие
-                            action[1] += 1  # помечаем, что оно выполнялось
-                        elif action[1] == 0 and action[0][1] is not None and callable(action[0][1]):
-                            if action[0][1]():  # проверяем условие
-                                action[0][0]()
-                                action[1] += 1
-                        else:
-                            continue  # если нет, идем дальше
-                else:
-                    continue
-            self.current_time = datetime.datetime.now().timestamp()
-            self.sleep(0.01)
-    
-    def log(self, msg):
-        '''Логирование в консоль и в интерфейс'''
-        print(str(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")) + ' ' + str(msg))
-        self.sig_new_log_entry.emit(msg)
-    
-    def reset_timer(self, new_timer=60.0):
-        self.timer = new_timer
-        self.start_time = datetime.datetime.now().timestamp()
-        self.log("Был сброшен таймер, новое время для выполнения задания: " + str(self.timer) + " сек.")
-    
-    def set_crit_t(self, new_crit_t):
-        self.crit_t = new_crit_t
-        self.log('Значение Ткрит установлено на ' + str(self.crit_t))
+    def log(self, msg, level='info', code=None):
+        '''Логирование в консоль и в интерфейс (через буфер, без ожидания вывода).
+        level - важность записи (info, warning, error), code - код элемента, к которому относится запись'''
+        self.log_pipeline.write(msg, level, code)
     
     def display_temp(self):
-        self.sig_new_temp_value.emit(self.temp, self.crit_t)
+        self.display.post('temp', (self.temp, self.crit_t))
 
-    def set_temp(self, new_temp):
-        '''Вручную установить температуру'''
-        self.temp = new_temp
-        self.display_temp()
-        self.log("Значение температуры установлено на %s" % new_temp)
-    
-    def check(self, cond_desc='[условие перехода без описания]', condition=None, *args, **kwargs):
-        '''Проверить выполнения условия перехода и вернуть результат проверки и описание условия для журнала'''
-        if condition is not None and callable(condition):
-            cond = condition(*args, **kwargs)
-            if cond:
-                return (True, cond_desc)
-            else:
-                return (False, cond_desc)
-        else:
-            return (False, cond_desc)
-
-    def raise_temp(self, raise_by=15):
-        '''Повышение температуры'''
-        self.temp += raise_by
-        self.display_temp()
-        self.log("Температура повысилась на %s (тек. знач.: %s)" % (raise_by, self.temp))
-
-    def lower_temp(self, lower_by=15):
-        '''Снижение температуры'''
-        self.temp -= lower_by
-        self.display_temp()
-        self.log("Температура снизилась на %s (тек. знач.: %s)" % (lower_by, self.temp))
-
-    def make_call(self):
-        '''Сымитировать звонок диспетчеру'''
-        self.log("Сделан звонок диспетчеру")
-        self.sig_scenario_ended.emit(0)
-    
-    def fail(self):
-        '''Провал задания по таймеру'''
-        self.log("Задание не выполнено в срок")
-        self.sig_scenario_ended.emit(1)
+    def end_scenario(self, code):
+        self.sig_scenario_ended.emit(code)  # контроллер останавливает интерфейс (stop_controller)
     
     def highlight(self, button):
         '''Послать сигнал для подсветки кнопки'''
@@ -303,140 +419,106 @@ class ScenarioController(QtCore.QThread):
     def run(self):
         '''Запуск сценария'''
         self.log("=== Сценарий начат ===")
-        if self.mode == 'test':
-            self.execute_scenario(test_scenario)
-        elif self.mode == 'demo':
-            self.execute_scenario(demo_scenario)
+        self.execute_scenario(self.scenarios[self.mode])
 
 
 
+def option_value(name, choices=None):
+    '''Значение ключа командной строки name (None - ключа нет). Без значения или с недопустимым значением -
+    сообщение об ошибке и выход с кодом 2, как при разборе argparse'''
+    if name not in sys.argv:
+        return None
+    i = sys.argv.index(name) + 1
+    if i >= len(sys.argv) or sys.argv[i].startswith('--'):
+        print('%s: требуется значение' % name, file=sys.stderr)
+        sys.exit(2)
+    value = sys.argv[i]
+    if choices is not None and value not in choices:
+        print('%s: недопустимое значение "%s" (допустимо: %s)' % (name, value, ', '.join(choices)), file=sys.stderr)
+        sys.exit(2)
+    return value
+
+
 if __name__ == '__main__':
     # Создаем экземпляр приложения, интерфейса и контроллера, 
     # а также наполняем elems экземплярами Элементов, 
     # связывая их с условными обозначениями и элементами интерфейса
+    report = StartupReport()
+    report.mark('импорт')
+    catch_up = option_value('--catch-up', CATCH_UP_POLICIES)  # ключи со значениями проверяются до создания окна
+    record_path = option_value('--record')
     app = QtWidgets.QApplication(sys.argv)
-    sc = ScenarioController()
+    if '--asyncio' in sys.argv:  # контроллер на asyncio в GUI-потоке вместо отдельного потока
+        import functools
+        from luk_op_async import AsyncScenarioController, guided_steps
+        sc = AsyncScenarioController()
+        sc.attach_qt(app)
+    else:
+        sc = ScenarioController()
+    report.mark('контроллер')
     main_window = LukWidget(sc)
-    elems['сс'] = Element(sc, 'сс', main_window.ss)
-    elems['зугт'] = Element(sc, 'зугт', main_window.zugt)
-    elems['зуку'] = Element(sc, 'зуку', main_window.zuku)
-    elems['зуку2'] = Element(sc, 'зуку2', main_window.zuku_2)
-    elems['зуку3'] = Element(sc, 'зуку3', main_window.zuku_3)
-    elems['втг'] = Element(sc, 'втг', main_window.vtg, 1)
-    elems['втг2'] = Element(sc, 'втг2', main_window.vtg_2, 1)
-    elems['запг'] = Element(sc, 'запг', main_window.zapg, 1)
-    elems['загб'] = Element(sc, 'загб', main_window.zagb, 1)
+    report.mark('интерфейс')
+    elems = sc.elems
+    for code, widget_name, initial_state in ELEMENTS:
+        elems[code] = Element(sc, code, getattr(main_window, widget_name), initial_state)
+        main_window.add_sprite_element(elems[code])
+    for code in elems:
+        main_window.add_log_filter_code(code)
+    # Мнемосхема на QGraphicsScene вместо картинок-QLabel - по ключу --scene
+    if '--scene' in sys.argv:
+        main_window.setup_scene()
 
     
-    # Прописанное начало сценария, пока без корутин с проверками условий (состояние элементов, таймер и т.д.), 
-    # все действия надо делать В РУЧНОМ РЕЖИМЕ
-    # Описание действия: 
-    # "человекочитаемый ключ": (анонимная функция-действие, граничное условие, периодичность проверки выполненности граничного условия в секундах (-1 для однократной проверки), задержка старта от начала сценария в секундах)
-    test_scenario = {
-        "сброс_журналирование": (lambda: sc.log(' === Сброс состояний начат ==='), None, -1, 0), 
-        "установка_значения_т_крит": (lambda: sc.set_crit_t(200), None, -1, 0),
-        "сброс_температуры": (lambda: sc.set_temp(60.5), None, -1, 0),
-        "сброс_состояния_сс": (lambda: elems['сс'].set_state(0), None, -1, 0),
-        "сброс_состояния_зугт": (lambda: elems['зугт'].set_state(0), None, -1, 0),
-        "сброс_состояния_зуку":(lambda: elems['зуку'].set_state(0), None, -1, 0),
-        "сброс_состояния_зуку2":(lambda: elems['зуку2'].set_state(0), None, -1, 0),
-        "сброс_состояния_зуку3":(lambda: elems['зуку3'].set_state(0), None, -1, 0),
-        "сброс_состояния_втг": (lambda: elems['втг'].set_state(1), None, -1, 0),
-        "сброс_состояния_втг2": (lambda: elems['втг2'].set_state(1), None, -1, 0),
-        "сброс_состояния_запг": (lambda: elems['запг'].set_state(1), None, -1, 0),
-        "сброс_состояния_загб": (lambda: elems['загб'].set_state(1), None, -1, 0),
-        "сброс_завершение": (lambda: sc.log(' === Сброс состояний завершен ==='), None, -1, 0),
-        "сс_при_критическом_т": (lambda: elems['сс'].set_state(1, lambda: sc.check('Т > Ткрит', lambda: sc.temp > sc.crit_t)), lambda: elems['сс'].state != 1, 0.1, 0),
-        "повышение_температуры": (lambda: sc.raise_temp(60.45), lambda: sc.temp < sc.crit_t and 
-                                                                        elems['зугт'].state == 0 and 
-                                                                        elems['зуку'].state == 0 and
-                                                                        elems['втг'].state == 1 and
-                                                                        elems['запг'].state == 1 and
-                                                                        elems['загб'].state == 1, 2, 15),
-        "сброс_таймера": (lambda: sc.reset_timer(), lambda: sc.temp > sc.crit_t, -1, 0),
-        "снижение_температуры_при_правильных_действиях": (lambda: sc.lower_temp(10.25), lambda: sc.temp > 60 and 
-                                                                                                elems['зугт'].state == 1 and 
-                                                                                                elems['зуку'].state == 1 and
-                                                                                                elems['втг'].state == 0 and
-                                                                                                elems['запг'].state == 0 and
-                                                                                                elems['загб'].state == 0, 2, 0),
-        "дублирование_сигнала_зуку": (lambda: elems['зуку2'].set_state(elems['зуку'].state), lambda: elems['зуку'].state != elems['зуку2'].state, 0.1, 0),
-        "дублирование_сигнала_зуку_вентили": (lambda: elems['зуку3'].set_state(elems['зуку'].state), lambda: elems['зуку'].state != elems['зуку3'].state, 0.1, 0),
-        "комплексное_отображение_втг": (lambda: elems['втг2'].set_state(elems['втг'].state), lambda: elems['втг'].state != elems['втг2'].state, 0.1, 0),
-        "возврат_сс_в_норму": (lambda: elems['сс'].set_state(0, lambda: sc.check('Т < Ткрит', lambda: sc.temp < sc.crit_t)), lambda: elems['сс'].state == 1, 0.1, 0),
-        "провал_задания_по_таймеру": (lambda: sc.fail(), lambda: sc.current_time >= sc.start_time + sc.timer and sc.temp >= sc.crit_t, 0.1, 0)
-    }
-
-    demo_scenario = {
-        "сброс_журналирование": (lambda: sc.log(' === Сброс состояний начат ==='), None, -1, 0), 
-        "сброс_подсветки": (lambda: sc.global_style_reset(), None, -1, 0),
-        "установка_значения_т_крит": (lambda: sc.set_crit_t(200), None, -1, 0),
-        "сброс_температуры": (lambda: sc.set_temp(60.5), None, -1, 0),
-        "сброс_состояния_сс": (lambda: elems['сс'].set_state(0), None, -1, 0),
-        "сброс_состояния_зугт": (lambda: elems['зугт'].set_state(0), None, -1, 0),
-        "сброс_состояния_зуку":(lambda: elems['зуку'].set_state(0), None, -1, 0),
-        "сброс_состояния_зуку2":(lambda: elems['зуку2'].set_state(0), None, -1, 0),
-        "сброс_состояния_зуку3":(lambda: elems['зуку3'].set_state(0), None, -1, 0),
-        "сброс_состояния_втг": (lambda: elems['втг'].set_state(1), None, -1, 0),
-        "сброс_состояния_втг2": (lambda: elems['втг2'].set_state(1), None, -1, 0),
-        "сброс_состояния_запг": (lambda: elems['запг'].set_state(1), None, -1, 0),
-        "сброс_состояния_загб": (lambda: elems['загб'].set_state(1), None, -1, 0),
-        "сброс_завершение": (lambda: sc.log(' === Сброс состояний завершен ==='), None, -1, 0),
-        "сс_при_критическом_т": (lambda: elems['сс'].set_state(1, lambda: sc.check('Т > Ткрит', lambda: sc.temp > sc.crit_t)), lambda: elems['сс'].state != 1, 0.1, 0),
-        "повышение_температуры": (lambda: sc.raise_temp(60.44), lambda: sc.temp < sc.crit_t and 
-                                                                        elems['зугт'].state == 0 and 
-                                                                        elems['зуку'].state == 0 and
-                                                                        elems['втг'].state == 1 and
-                                                                        elems['запг'].state == 1 and
-                                                                        elems['загб'].state == 1, 2, 15),
-        "инф_0":(lambda: sc.log("Температура превысила критическую. Необходимо принять меры"), lambda: sc.temp > sc.crit_t, -1, 15),
-        "инф_1":(lambda: sc.log("Шаг 1: закрыть запорное устройство газовой турбины"), lambda: sc.temp > sc.crit_t, -1, 20),
-        "инф_1_1":(lambda: sc.highlight(main_window.btn_gt), lambda: sc.temp > sc.crit_t, -1, 20),
-        "инф_1_2":(lambda: elems['зугт'].set_state(1), lambda: sc.temp > sc.crit_t, -1, 25),
-        "инф_2":(lambda: sc.log("Шаг 2: закрыть запорное устройство котла-утилизатора"), lambda: sc.temp > sc.crit_t, -1, 30),
-        "инф_2_0":(lambda: sc.style_reset(main_window.btn_gt), lambda: sc.temp > sc.crit_t, -1, 30),
-        "инф_2_1":(lambda: sc.highlight(main_window.btn_ku), lambda: sc.temp > sc.crit_t, -1, 30),
-        "инф_2_2":(lambda: elems['зуку'].set_state(1), lambda: sc.temp > sc.crit_t, -1, 35),
-        "инф_3":(lambda: sc.log("Шаг 3: включить вентиляцию"), lambda: sc.temp > sc.crit_t, -1, 40),
-        "инф_3_0":(lambda: sc.style_reset(main_window.btn_ku), lambda: sc.temp > sc.crit_t, -1, 40),
-        "инф_3_1":(lambda: sc.highlight(main_window.btn_vtg), lambda: sc.temp > sc.crit_t, -1, 40),
-        "инф_3_2":(lambda: elems['втг'].set_state(0), lambda: sc.temp > sc.crit_t, -1, 45),
-        "инф_4":(lambda: sc.log("Шаг 4: открыть запорную арматуру ПГ"), lambda: sc.temp > sc.crit_t, -1, 50),
-        "инф_4_0":(lambda: sc.style_reset(main_window.btn_vtg), lambda: sc.temp > sc.crit_t, -1, 50),
-        "инф_4_1":(lambda: sc.highlight(main_window.btn_pg), lambda: sc.temp > sc.crit_t, -1, 50),
-        "инф_4_2":(lambda: elems['запг'].set_state(0), lambda: sc.temp > sc.crit_t, -1, 55),
-        "инф_5":(lambda: sc.log("Шаг 5: открыть запорную арматуру ГБ"), lambda: sc.temp > sc.crit_t, -1, 60),
-        "инф_5_0":(lambda: sc.style_reset(main_window.btn_pg), lambda: sc.temp > sc.crit_t, -1, 60),
-        "инф_5_1":(lambda: sc.highlight(main_window.btn_gb), lambda: sc.temp > sc.crit_t, -1, 60),
-        "инф_5_2":(lambda: elems['загб'].set_state(0), lambda: sc.temp > sc.crit_t, -1, 65),
-        "снижение_температуры_при_правильных_действиях": (lambda: sc.lower_temp(10.22), lambda: sc.temp > 60 and 
-                                                                                                elems['зугт'].state == 1 and 
-                                                                                                elems['зуку'].state == 1 and
-                                                                                                elems['втг'].state == 0 and
-                                                                                                elems['запг'].state == 0 and
-                                                                                                elems['загб'].state == 0, 2, 0),
-        "инф_6":(lambda: sc.log("Шаг 6: после снижения температуры сообщить диспетчеру"), lambda: sc.temp <= 70, -1, 100),
-        "инф_6_0":(lambda: sc.style_reset(main_window.btn_gb), lambda: sc.temp <= 70, -1, 100),
-        "инф_6_1":(lambda: sc.highlight(main_window.btn_call), lambda: sc.temp <= 70, -1, 100),
-        "инф_6_3":(lambda: sc.global_style_reset(), lambda: sc.temp <= 70, 1, 102),
-        "инф_6_2":(lambda: sc.make_call(), lambda: sc.temp <= 70, -1, 105),
-        "дублирование_сигнала_зуку": (lambda: elems['зуку2'].set_state(elems['зуку'].state), lambda: elems['зуку'].state != elems['зуку2'].state, 0.1, 0),
-        "дублирование_сигнала_зуку_вентили": (lambda: elems['зуку3'].set_state(elems['зуку'].state), lambda: elems['зуку'].state != elems['зуку3'].state, 0.1, 0),
-        "комплексное_отображение_втг": (lambda: elems['втг2'].set_state(elems['втг'].state), lambda: elems['втг'].state != elems['втг2'].state, 0.1, 0),
-        "возврат_сс_в_норму": (lambda: elems['сс'].set_state(0, lambda: sc.check('Т < Ткрит', lambda: sc.temp < sc.crit_t)), lambda: elems['сс'].state == 1, 0.1, 0)
-    }
+    # Сценарии описаны декларативно в каталоге scenarios (формат - см. luk_op_scenario), 
+    # компилируются один раз (с кешем на диске) и связываются с контроллером, элементами и кнопками окна
+    # при первом запуске режима, а не при старте тренажера
+    scenario_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scenarios')
+
+    def build_scenario(mode):
+        from luk_op_scenario import load_scenario
+        name = mode + '_process' if mode == 'test' and '--process' in sys.argv else mode  # тест с моделью процесса
+        return load_scenario(os.path.join(scenario_dir, name + '.json')).bind(sc, elems, main_window)
+
+    sc.scenarios = LazyScenarios(build_scenario)
+    if '--asyncio' in sys.argv and '--guided' in sys.argv:  # пошаговые подсказки в тестовом режиме
+        sc.coroutines['test'] = [functools.partial(guided_steps, window=main_window)]
 
     # Пока руками приписывание кнопкам действия
-    main_window.btn_gt.clicked.connect(lambda: elems['зугт'].set_state(1))
-    main_window.btn_ku.clicked.connect(lambda: elems['зуку'].set_state(1))
-    main_window.btn_vtg.clicked.connect(lambda: elems['втг'].set_state(0))
-    main_window.btn_pg.clicked.connect(lambda: elems['запг'].set_state(0))
-    main_window.btn_gb.clicked.connect(lambda: elems['загб'].set_state(0))
+    for button, code, new_state in BUTTONS:
+        getattr(main_window, button).clicked.connect(lambda checked=False, code=code, new_state=new_state: elems[code].set_state(new_state))
     main_window.btn_call.clicked.connect(sc.make_call)
     main_window.btn_start_demo.clicked.connect(sc.start_demo)
     main_window.btn_start_test.clicked.connect(sc.start_test)
 
+    # Профилировщик контроллера с отладочной панелью - только по ключу --profile
+    if '--profile' in sys.argv:
+        from luk_op_profile import Profiler
+        main_window.setup_profiler_dock(Profiler().attach(sc))
+
+    # Догон пропущенных сроков повторяемых действий (skip, burst, merge) - по ключу --catch-up ПОЛИТИКА
+    if catch_up is not None:
+        sc.catch_up = catch_up
+
+    # Журнал событий сеанса для воспроизведения (luk_op_replay) - по ключу --record ФАЙЛ
+    if record_path is not None:
+        from luk_op_journal import Recorder
+        recorder = Recorder(record_path).attach(sc, [b for b, _, _ in BUTTONS] + ['btn_call'])
+        recorder.watch_window(main_window)
+
+    report.mark('элементы')
+
+    def first_frame():
+        report.mark('первый кадр')
+        # атлас окрашенных спрайтов собран заранее (luk_op_atlas); без него спрайты окрашиваются
+        # в GUI-потоке сразу после показа окна, до первого запуска сценария
+        if sprite_atlas() is None:
+            sprite_cache.preload(elems.keys())
+        report.mark('спрайты')
+        if '--startup-report' in sys.argv:
+            print(report.text(), file=sys.stderr, flush=True)
+
     # Запуск
     main_window.show()
+    QtCore.QTimer.singleShot(0, first_frame)
     sys.exit(app.exec_())
 
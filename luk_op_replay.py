@@ -0,0 +1,130 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''Воспроизведение записанного сеанса (luk_op_journal) в интерфейсе тренажера.
+
+Панель воспроизведения: пуск/пауза, скорость (1x, 10x, максимальная) и ползунок времени -
+переход к любому моменту выставляет состояние установки из ближайшего снимка журнала сразу,
+без воспроизведения промежуточных событий.
+
+Пример:
+    python luk_op_replay.py run.lukj --speed 10
+'''
+
+import sys
+import argparse
+
+from PyQt5 import QtCore, QtWidgets
+
+from luk_op_client import EventController, build_window
+from luk_op_journal import JournalReader, Replayer, SPEEDS
+
+
+# Контроллер воспроизведения: события журнала выдаются в окно по таймеру Qt
+class ReplayController(EventController):
+
+    SLIDER_STEPS = 10  # делений ползунка на секунду журнала
+
+    def __init__(self, reader, speed=1.0):
+        EventController.__init__(self)
+        self.replayer = Replayer(reader, self.handle, speed)
+        self.timer = QtCore.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.tick)
+
+    def tick(self):
+        delay = self.replayer.tick()
+        if delay is not None:
+            self.timer.start(int(delay * 1000))
+        self.update_panel()
+
+    def play(self):
+        if self.replayer.finished:
+            self.seek(0.0)
+        self.replayer.play()
+        self.tick()
+
+    def pause(self):
+        self.replayer.pause()
+        self.timer.stop()
+        self.update_panel()
+
+    def toggle(self):
+        if self.replayer.playing:
+            self.pause()
+        else:
+            self.play()
+
+    def set_speed(self, speed):
+        self.replayer.set_speed(speed)
+        if self.replayer.playing:
+            self.tick()
+
+    def seek(self, t):
+        self.replayer.seek(t)
+        if self.replayer.playing:
+            self.tick()
+        else:
+            self.update_panel()
+
+    def stop(self):
+        '''Завершение сценария в журнале останавливает воспроизведение'''
+        self.pause()
+
+    def setup_panel(self, window):
+        '''Добавить в окно панель воспроизведения'''
+        dock = QtWidgets.QDockWidget("Воспроизведение сеанса", window)
+        dock.setObjectName("replay_dock")
+        panel = QtWidgets.QWidget(dock)
+        layout = QtWidgets.QHBoxLayout(panel)
+        self.play_button = QtWidgets.QPushButton(panel)
+        self.play_button.clicked.connect(self.toggle)
+        layout.addWidget(self.play_button)
+        self.speed_box = QtWidgets.QComboBox(panel)
+        for title, speed in (("1x", SPEEDS['1']), ("10x", SPEEDS['10']), ("Макс.", SPEEDS['max'])):
+            self.speed_box.addItem(title, speed)
+        self.speed_box.setCurrentIndex(max(0, self.speed_box.findData(self.replayer.speed)))
+        self.speed_box.currentIndexChanged.connect(lambda i: self.set_speed(self.speed_box.itemData(i)))
+        layout.addWidget(self.speed_box)
+        self.slider = QtWidgets.QSlider(QtCore.Qt.Horizontal, panel)
+        self.slider.setRange(0, int(self.replayer.reader.duration * self.SLIDER_STEPS))
+        self.slider.sliderMoved.connect(lambda value: self.seek(value / self.SLIDER_STEPS))
+        layout.addWidget(self.slider, 1)
+        self.time_label = QtWidgets.QLabel(panel)
+        layout.addWidget(self.time_label)
+        dock.setWidget(panel)
+        window.addDockWidget(QtCore.Qt.BottomDockWidgetArea, dock)
+        self.update_panel()
+
+    def update_panel(self):
+        replayer = self.replayer
+        self.play_button.setText("Пауза" if replayer.playing else "Пуск")
+        if not self.slider.isSliderDown():
+            self.slider.setValue(int(replayer.position * self.SLIDER_STEPS))
+        self.time_label.setText("%.1f / %.1f с" % (replayer.position, replayer.reader.duration))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Воспроизведение записанного сеанса тренажера')
+    parser.add_argument('journal', help='файл журнала (luk_op_journal)')
+    parser.add_argument('--speed', choices=sorted(SPEEDS), default='1')
+    parser.add_argument('--at', type=float, default=0.0, help='начать с секунды')
+    parser.add_argument('--scene', action='store_true', help='мнемосхема на QGraphicsScene')
+    args, qt_args = parser.parse_known_args(argv)
+    try:
+        reader = JournalReader(args.journal)
+    except (ValueError, OSError) as e:
+        print(e, file=sys.stderr)
+        return 2
+    app = QtWidgets.QApplication(sys.argv[:1] + qt_args)
+    sc = ReplayController(reader, SPEEDS[args.speed])
+    main_window = build_window(sc, args.scene)
+    sc.setup_panel(main_window)
+    sc.seek(args.at)
+    main_window.show()
+    sc.play()
+    return app.exec_()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,11398 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\xee\x2e\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x03\x92\x00\x00\x02\x52\x08\x06\x00\x00\x00\xb1\xee\xfa\x12\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\
+\x0e\xc4\x01\x95\x2b\x0e\x1b\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
+\xe2\x06\x0e\x12\x00\x14\xfd\xbf\x31\xd9\x00\x00\x20\x00\x49\x44\
+\x41\x54\x78\xda\xec\xdd\x59\x90\x64\xd9\x7d\xdf\xf7\xdf\x39\x27\
+\xb3\xf6\x5e\xa7\xb7\x59\x31\x0b\xb1\x0c\x00\x12\x4d\x80\x04\x47\
+\xa2\xcc\x25\x24\x86\x21\x45\xd8\x86\xd9\xd3\xc6\x58\x40\xe8\x8d\
+\xc2\x03\x4d\x52\x22\x2d\xb4\x61\x08\x5d\x53\x2d\xc1\xe3\xa6\x69\
+\x87\x04\x99\x8e\x70\x50\x41\xbd\x88\xa1\x96\x1b\x0d\x3b\xec\x90\
+\xc3\xe1\x30\x4c\x5a\x84\x48\xca\x02\x89\x01\x89\xc1\xe6\xc1\xcc\
+\x60\x06\xdd\x3d\x3d\xbd\x6f\xb5\xe5\xbd\xe7\xf8\xe1\x9c\x9b\xf7\
+\x66\x56\x56\x75\x2d\x99\x59\xb9\x7c\x3f\x11\xd5\x55\x9d\x95\x79\
+\xf3\xe6\xc9\x5b\x99\xf7\x97\xff\xb3\x48\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\xfa\xca\xd0\x04\x00\x00\x60\xd4\xcd\xcf\xcf\x87\xdd\
+\xb8\xdf\x85\x85\x05\xce\xb5\x00\x8c\xa4\x1a\x4d\x00\x00\x00\x46\
+\x3d\x2c\x3e\xfd\xf4\xd3\xb2\xd6\xca\x58\x23\x6b\xad\xac\xb1\x32\
+\x26\xfd\x6c\xad\xac\xb3\xb2\xb2\xb2\xce\xc8\x5a\x27\x6b\x8c\x8c\
+\xb5\x32\xd6\xca\xd9\x74\x5d\x63\x65\x9c\x95\x33\x56\xc6\xa5\xff\
+\x5b\x2b\x97\xae\x1b\xb7\x55\x5e\xcf\x1a\x2b\x49\x0f\x0c\xb0\x84\
+\x4d\x00\x04\x49\x00\x00\x80\x5d\x0a\x8d\x47\x8e\x1c\x89\x01\x30\
+\x85\x38\x9b\x82\xa0\x35\xa6\xd9\x05\xcb\xc8\xc8\x04\x23\x59\xc9\
+\x18\x53\xe9\x9b\x55\xfc\x6c\x14\x14\x54\xfc\xc2\x48\x52\x08\x92\
+\x31\x32\xb6\xdc\x8e\x82\xa9\xdc\xc4\xc4\xdf\x37\xb7\x13\xef\xc3\
+\x18\xa3\x4f\x7c\xe2\x13\x29\xb8\x56\xc3\x66\xda\x37\x63\x64\xdd\
+\xfa\x61\x93\x80\x09\x80\x20\x09\x00\x00\xd0\xc5\xf0\xb8\x77\xcf\
+\x9e\x66\xc5\xd0\xa6\xca\x62\x33\x2a\x06\x23\xd9\x4a\x10\x34\xaa\
+\x44\xc3\xf8\xb3\x0d\x29\xff\xc9\xc8\x94\x29\xb3\x19\x36\x9b\x37\
+\x2c\x82\x62\xf3\x96\x95\xf0\x69\x4c\x19\x38\x83\x14\xac\x91\x4d\
+\xd7\x0d\x26\x5d\xd8\xbc\x4e\x25\x78\x16\xff\x1a\x23\x13\xa4\x4f\
+\x7f\xfa\xd3\x95\x80\x99\x02\x67\x87\x6a\x26\xc1\x12\x00\x41\x12\
+\x00\x00\x60\x8b\x01\x72\x6a\x6a\x2a\x86\x46\x67\x15\x64\x64\x8b\
+\x88\x56\xa9\x38\xaa\x08\x70\x21\xc8\x18\xdb\x0c\x96\xa6\x1a\xfa\
+\x4c\x35\x56\x1a\x29\xb4\xdd\xbe\x88\x93\xa6\xbd\x32\xd9\x9e\x2d\
+\x43\xf3\xc2\x54\xe4\x94\xd2\x9e\x99\x32\x92\x56\xf6\xd1\x28\xb4\
+\x6d\x57\x6d\xf7\x1b\x82\x91\x4d\x1b\xfb\xf5\x5f\xff\xf5\xb2\x1b\
+\xae\x6d\xde\x21\x81\x12\x00\x41\x12\x00\x00\xe0\x41\x21\xb2\x5e\
+\xaf\x37\x2b\x7d\x32\x29\xf8\x35\xab\x7d\x29\x5e\xd9\xd6\x8a\x9f\
+\x31\x46\xc1\x84\xb6\x82\x60\x28\xa3\x9d\x31\x31\x02\xa6\xed\x84\
+\x94\x3f\x4d\x4b\xc0\x33\x65\x61\xd2\xd8\xd6\xea\xa2\x8a\x6a\x66\
+\xb5\x5b\x6b\xba\x72\xdb\xbe\x05\xdb\x1a\x40\x4d\xb1\xbf\xe9\x82\
+\x72\xab\x95\xea\x68\x79\xef\x31\xa4\x1a\xa3\xff\xf2\xb3\x9f\x95\
+\xb1\x96\x40\x09\x80\x20\x09\x00\x00\xb0\x51\x88\xac\xb9\x5a\x25\
+\x66\x95\x61\xac\x19\x28\xad\x69\x96\x0b\x4d\xb0\x0a\x36\x65\xb4\
+\x90\x42\x5d\x08\x45\x35\x2f\x15\x1f\x8d\x9a\x9d\x60\x8b\xb1\x8c\
+\x69\xec\xa3\x31\xed\x5d\x59\xcb\xfb\x91\x0d\x29\xa0\x16\x5d\x62\
+\x2b\xe1\x30\xb4\xde\xa4\xac\x96\x16\x21\x33\x56\x2e\x8d\xb1\x6d\
+\x3d\x66\xab\xf7\x67\xca\x82\xa7\x29\x1e\x6d\x28\x1f\x77\x50\x2a\
+\x79\x1a\x7d\xfe\xf3\x9f\x2f\xba\xf2\x06\xc2\x24\x80\xdd\x62\x69\
+\x02\x00\x00\x30\x88\x21\xd2\x58\x1b\x27\xbe\x31\x65\xc2\x32\xa6\
+\x18\x38\x18\xbb\x93\x36\xf3\x5e\x73\x0c\x62\xac\x3b\x16\xd5\x49\
+\x63\x8c\x42\xa8\xd6\xfc\x42\x9a\x27\xa7\xac\xf6\xc5\xfb\x68\x49\
+\x82\x2d\x49\xd1\x54\xd3\x5f\x79\x87\x71\x2c\x66\x11\x50\x5b\x2a\
+\x95\x6a\x06\xc3\xea\x38\xca\xea\xff\x4d\xe8\x30\xc3\x8e\x69\xdd\
+\x0d\xa9\x9a\x3a\x2b\xd7\x49\x3f\xbc\xf8\xe2\x8b\xbb\xb6\xac\x09\
+\x00\x10\x24\x01\x00\xc0\x40\x32\x6a\x0b\x56\x2d\x99\x2a\xb4\x9c\
+\xc4\x84\xe6\xa5\xa9\xfa\x57\xad\xe9\xb5\x54\x10\xd3\x6f\x52\x19\
+\xd1\x94\x97\x54\xc6\x33\x56\x27\xdc\x69\x0d\x97\xd5\xf9\x5f\x83\
+\x09\x1d\xe6\xdd\x69\xad\x9c\xc6\xbb\x29\x2b\xaa\x21\x04\x95\x33\
+\xbb\xaa\xd9\x35\xb6\x25\xaa\x9a\xb2\xfb\x6d\x25\x87\xa6\x19\x67\
+\x55\x8d\xa9\x00\x40\x90\x04\x00\x00\xd0\xda\xdc\x58\xe9\xee\x59\
+\x04\x38\xd3\xda\x45\xb4\x32\xb6\xd0\xa8\x98\xd4\x46\x2d\x13\xac\
+\x06\x05\x55\xe7\xb8\x09\xed\x95\xbe\x4a\x20\x2d\x27\x69\xad\x4c\
+\xb6\xd3\xa9\x03\x69\xa8\x46\xd6\x4a\xc0\x6b\xe9\x1a\x1b\x52\x78\
+\x2c\x32\xa2\xa9\x16\x58\x8b\xab\xb4\xc4\x59\xd3\x16\xa2\xcb\xb1\
+\x98\xaa\x2c\x51\x02\x00\x04\x49\x00\x00\x80\x35\x72\xef\xe3\x24\
+\x37\x4a\xdd\x48\xab\x95\xbb\x62\x82\x1c\xb5\xad\x05\x59\x9d\x20\
+\x27\x98\xd6\xf1\x88\x69\xe6\x54\xd3\xbe\xae\x64\xb3\x9b\x6b\xea\
+\x3a\x1b\x2a\xa1\xcf\x54\xc3\x5f\x6b\xff\xd2\x22\xdc\x05\xa3\x96\
+\x35\x25\x43\x08\x2d\xd1\xb2\x25\x3c\x36\x77\xb3\x3a\x05\xac\xd2\
+\x76\x42\x4b\x8a\x0e\x61\x6d\x68\xad\xde\xf7\x8b\x2f\xbe\xc8\x41\
+\x02\x80\x20\x09\x00\x00\x50\xf5\x83\x1f\xfc\x40\x59\xa3\xd1\x56\
+\x7d\xac\x66\xad\xd6\x2e\xa1\xc6\xb4\x57\x31\x43\x33\xdc\x55\x03\
+\x99\x42\x68\x99\x69\xb5\x18\x73\x69\xab\x29\xae\xe5\xea\x41\xc1\
+\xb4\x86\xbe\x62\xc9\x90\xe6\x72\x91\xa1\x6d\xbf\x9a\xdd\x52\xab\
+\xb7\xab\xee\x87\x69\x09\x93\x26\x84\x96\x6d\x94\x7b\x51\xad\x44\
+\x96\x95\xcc\x17\x5f\x7c\x91\x20\x09\x80\x20\x09\x00\x00\xd0\x2e\
+\x84\xa0\xb7\xde\x7a\x4b\x2b\xab\xab\x45\x7a\x2b\xd3\x62\x7b\xbf\
+\xd7\x4a\xfa\x6a\x86\xbe\xa2\x5c\x18\xb4\xe6\xf7\xed\x19\x4f\x26\
+\x34\xaf\x66\x4c\x6b\x48\x6d\x9f\xcd\xb5\x39\x69\x6c\x73\xbc\x65\
+\xb1\xcd\x6a\x35\xb4\xa8\x20\x86\xb6\xc9\x77\xca\xfd\x28\xa7\xe0\
+\x31\xe5\x24\x3c\xa6\x35\x19\x57\xc7\x77\x16\xdf\xcf\x2c\x9c\xd1\
+\xfc\xfc\x3c\x07\x08\x80\x5d\xc5\xf2\x1f\x00\x00\x60\x20\x15\x41\
+\xeb\x87\x17\x2f\xea\xb1\x47\x1f\x95\x24\xcd\xcd\xcd\xa5\x49\x67\
+\xda\xca\x8f\xed\x83\x18\x2b\x29\xd1\x98\x62\xe9\x8d\xd6\x2e\xa6\
+\x21\xa8\xb9\x7c\x48\xeb\x38\x4b\xad\x59\xa2\x23\x56\x1e\x2b\x4b\
+\x89\x28\x6e\x37\x54\x27\xf6\x69\x4b\xa7\x71\xd9\x0e\xa3\xb4\x16\
+\x48\xf9\x7f\x63\x2a\xeb\x5d\x56\x16\xfe\x48\xdd\x59\x6d\x30\x65\
+\x78\x4d\x5e\xfa\xaf\x5e\x6a\xfe\xfc\xf9\xcf\x7f\x9e\x83\x03\x00\
+\x41\x12\x00\x00\x60\xa3\x38\x69\x24\x5d\xbe\x7c\x59\xd6\xb5\x76\
+\xa4\x3a\x78\xf0\x40\x4b\xe8\x6c\xa9\x22\xa6\x30\xd9\x8c\x8e\x29\
+\xab\x15\xd5\xc8\x72\x36\xd7\x50\x09\x6d\xa6\x59\x43\xac\x2c\x16\
+\xd2\x32\x86\xb2\xbc\x56\x75\x66\xd5\xb5\x5d\x6c\xdb\x2b\xa6\xa6\
+\xa5\xf0\x18\x14\x8c\x4d\xdd\xc2\x5a\x97\x0d\x69\x8e\xbb\x94\xf4\
+\xdf\xfe\xd6\x6f\x35\x1f\xdf\x67\x3e\xf3\x19\x59\x6b\x65\x5d\x5a\
+\x12\x05\x00\x08\x92\x00\x00\x00\x6b\x05\x63\x5a\x42\x93\x09\xd2\
+\xd5\xab\xd7\xe4\x9c\x95\xb3\x6b\x47\xe7\x1c\x7b\xf8\x98\x8c\x6c\
+\x73\xdd\x47\x93\x96\x02\x51\x71\x59\x65\x39\x8e\xe6\xec\xae\xe9\
+\x2a\xa6\xa5\x3b\x69\x59\x21\x34\xa1\x32\x49\x4f\x8a\x7b\xed\xc5\
+\x50\x49\x2d\x33\xb7\x76\x9a\x79\x35\xa8\x6d\xb8\x64\x2c\x87\xb6\
+\x6c\xe4\x8b\xff\xe4\x9f\xb4\x3c\x9e\x5f\xfb\xb5\x5f\x93\xb5\x4e\
+\xce\xb5\xae\x4f\xb9\x66\xaa\x59\x00\x20\x48\x02\x00\x00\x94\xc1\
+\xb1\x1a\xd0\x82\x91\x6c\x73\xfc\xa1\x74\xe7\xce\x1d\x39\x67\x65\
+\xac\x93\xb3\x56\x6f\x5f\x7e\x7b\xcd\x36\x9e\x7e\xea\xe9\xd4\x05\
+\xb5\x7d\xc9\x90\x34\xe7\xab\x31\x29\xb0\x9a\x96\xe8\x69\x2a\x4b\
+\x8c\xc4\x60\x19\x03\x69\x33\xca\x99\xd0\xa1\x3b\x6d\x6b\xb4\x0c\
+\x46\xb2\x41\x1d\x17\xc4\xfc\x9d\x7f\xfa\x4f\xd7\xec\xeb\xdf\xfe\
+\xf4\xdf\x96\x33\x4e\xd6\x19\x59\xeb\x8a\xbe\xb0\xcd\xfb\x0d\xcd\
+\x36\x01\x00\x82\x24\x00\x00\xc0\x3a\x49\xb2\xba\x04\x46\xec\x1e\
+\x1a\x14\x5a\xcb\x81\xa1\x8c\x9a\x8d\x46\x43\xce\xba\x66\x17\x50\
+\x6b\x9d\x5e\x7b\xfd\xb5\x4d\xdd\xd5\x4f\x7c\xe4\x27\x2a\xf3\xf8\
+\x98\xca\x6c\xaf\x95\xb5\x3d\x2a\x4b\x7c\x54\xbb\xb6\x16\xa9\xd7\
+\xc8\xea\xc2\x85\x2f\x6d\xea\xfe\x3e\xf9\xa9\x4f\xca\x1a\x27\xe7\
+\x6c\xdc\x5f\x6b\x63\x40\xb6\x95\x30\x1a\x4c\x2c\x5a\x16\x39\x36\
+\xdd\x0f\x5d\x5b\x01\x10\x24\x01\x00\x00\xd6\x15\x8a\xb9\x4e\x25\
+\x85\xe6\xcc\xa8\x95\x5f\x2b\xd8\x50\x49\x9b\xa6\x2d\x64\x05\x4d\
+\x4c\x4c\xca\x35\x83\x65\x0c\x97\x36\x75\x8d\x2d\x02\x9c\x75\x56\
+\x5f\xfb\xd3\xaf\x75\x65\x8f\x7f\xe1\x17\x7e\xa1\x12\x64\x6d\x19\
+\x6c\x6d\xbc\x4f\xe3\x5c\xb3\x5b\xae\x31\x41\x6b\x33\x61\x50\x19\
+\x25\x83\x82\x6c\x4b\x19\xb2\x1c\xbb\x49\x65\x12\x00\x41\x12\x00\
+\x00\xa0\x03\xd3\x9a\x96\xc2\xda\x31\x89\xd5\x75\x22\x63\x07\x55\
+\xdb\xb6\x1a\x48\x68\x5b\xfd\xa3\x08\x9e\x95\xc0\x16\xa4\xc7\x1f\
+\x7f\xbc\x0c\x80\xc6\xc9\x5a\x23\xe7\xca\xea\xa6\x33\x56\xd6\xb9\
+\x96\xf0\xe9\x6c\xba\xae\xb3\xb1\xb2\x68\x5c\x75\xcf\xdb\x82\x9e\
+\xa9\x74\x52\x55\xb9\x3c\x48\xb1\xec\x48\x73\x7d\xca\xb2\x00\x19\
+\xf7\xad\xda\xa5\xd6\x54\xda\x81\x28\x09\x60\x77\xb1\x8e\x24\x00\
+\x00\x18\x48\xa1\x43\xae\x2c\x2e\x2f\xeb\x94\xa6\x3a\x1d\x8f\x82\
+\xe9\xd0\xf1\xb3\x72\x59\x28\x02\x59\xa8\x2e\xe8\x58\xd9\x46\x48\
+\x5b\x6d\x1b\xff\x18\x4c\x99\xee\x4c\x75\x27\x4c\xb9\x1f\xd5\x3d\
+\x8e\x59\x75\x9d\x14\x5c\x49\xb0\xa1\xe8\x9a\x1b\x62\xe1\xb1\xac\
+\x37\x96\x4b\x66\x96\x5b\x08\x6a\xce\xf4\x13\x08\x91\x00\x08\x92\
+\x00\x00\x00\x4d\xf3\xf3\xf3\x21\xe5\x3f\x85\xd0\x3e\x63\x69\x68\
+\x76\xfb\x5c\x33\xd9\x4d\x2a\xe7\x99\xd0\x9e\x23\x5b\xd7\x6d\x0c\
+\x69\x09\x8e\x6a\x38\x35\x1d\x02\x6b\xfb\x36\x9a\x15\xc3\xe6\x60\
+\xca\xb6\x6e\xb6\xa6\x8c\xbf\xc6\xa8\xe3\x48\xc6\x96\xc0\x1a\x2a\
+\x97\x14\xd7\x37\x65\x3a\x0d\x9d\x02\x6a\xa7\x50\x0a\x00\xbb\x80\
+\xae\xad\x00\x00\x60\x60\xc2\xa3\x24\x9d\x38\x75\xfa\x85\x0b\x67\
+\xcf\x9c\x93\x09\xad\xcb\x67\x84\xb6\xee\x9c\xa1\x35\x53\x05\x49\
+\xb6\x43\x25\xb1\x25\x86\x05\xdb\xd2\x2d\x34\x74\x0a\x9e\xad\x91\
+\xaf\x32\x71\x6a\xba\x2c\x84\x72\xe9\x90\xca\x6d\x4c\x71\x87\xcd\
+\x9c\x1b\x5a\xb7\x19\xca\x6a\x63\xa7\x20\x2a\x6b\x5a\x2a\x8d\xa6\
+\x79\xbf\x95\xcb\xd2\xcc\xb0\xd5\x96\x28\xda\x6e\x61\x61\x81\x78\
+\x09\x80\x20\x09\x00\x00\xc6\x2f\x40\x66\xab\xab\xb5\x96\x14\xd8\
+\x2e\x14\x55\x49\x53\x26\xc0\x50\xed\x52\x1a\x9a\xfd\xad\x8c\xd1\
+\x9a\xc2\x65\x30\xb1\x74\x58\xd4\x35\x8d\x09\xaa\x14\x12\x53\x40\
+\x34\x6b\xaa\x89\x21\x74\x1a\x93\xd8\x3a\xb1\x4f\x68\x1f\xd3\xa9\
+\x32\xc5\x06\x63\x64\xcb\xb2\x65\x6b\x78\x4c\x57\x35\x21\xa4\x4a\
+\x66\x68\xcd\xaf\x65\x94\x56\xb3\xea\x5a\xb9\x97\x13\xa7\x4e\xbf\
+\x50\xdd\x21\x02\x25\x00\x82\x24\x00\x00\x18\xe9\x00\x59\x09\x41\
+\xf1\xc4\x64\x62\x22\x5b\xbe\x77\x6f\x7a\x6d\x50\x53\x65\xdc\x62\
+\x9c\x42\xc7\xa6\xe5\x31\x42\xd9\x71\xb5\x75\x4c\x61\x90\x8c\x35\
+\x6b\xf3\x9f\x29\x2b\x83\x71\x2e\x9b\x72\xd4\x65\x50\x88\xe1\x32\
+\xd8\x96\x3c\xd8\x32\x7d\x8e\x89\x5d\x6e\xad\xad\x5e\x21\x2e\x4f\
+\x52\x2e\xd3\xd1\x96\x85\xc3\xda\x21\x93\x31\x77\x86\xca\xff\x4d\
+\xba\xac\x72\x3f\xcd\x58\x59\xce\xd5\xba\xde\xf0\x48\x02\x25\x00\
+\x82\x24\x00\x00\x18\xd9\xf0\xd8\x29\x40\x56\x4d\xcd\xcd\x2d\x95\
+\x69\xac\x32\x86\x30\x84\x14\xfa\xca\x00\x17\x82\x9a\x81\x2e\xa4\
+\xf2\x63\x4b\x97\xd3\xd0\xba\xc4\x46\x11\xf6\x5a\x22\x6a\x30\x0a\
+\xb6\x32\xf9\x4e\xb1\xac\x48\xe5\x36\xc6\x56\xd6\x6f\x2c\xfe\x5f\
+\x49\x89\xc1\xa8\x65\x76\x9c\x10\x62\xf5\xb3\xa5\xa2\x68\x6c\x65\
+\xcc\x63\x5b\xd2\x34\x45\xb5\xb4\xba\x64\xa4\x59\x67\x28\x64\x68\
+\xd9\x44\x63\x65\xa5\x5e\x9f\x9c\x6c\x10\x28\x01\x10\x24\x01\x00\
+\xc0\xc8\x05\xc8\x8d\xc2\x63\xe7\xb8\x54\x59\xfa\x22\x14\x13\xd8\
+\xb4\xac\x2c\xd9\xec\x19\x2a\xa9\x65\xa6\xd5\x96\xb9\x5b\xdb\x87\
+\x55\x1a\xc9\xb6\x4c\xdf\x13\xd6\x16\x2d\x2b\x65\xbf\x90\xee\xd7\
+\xb6\xec\x9b\x69\x1d\x8f\x19\xda\x07\x5a\x9a\xb6\x99\x5f\x8d\x4c\
+\x33\x46\xa6\x7f\x4d\xeb\x00\xcf\xa2\xbb\x6e\xb9\x98\x49\x48\x9d\
+\x78\x43\xb9\x5c\x48\x30\xc5\x03\x68\xfa\x5f\xff\xd1\xd9\xdf\x38\
+\x71\xea\xf4\x7f\xdd\xde\x7e\x04\x4a\x00\x04\x49\x00\x00\x30\x36\
+\x01\x72\xe3\x74\x19\x5a\xc2\x5a\x68\x1f\xa7\x18\xac\x4c\x65\x82\
+\x9a\xd0\x32\x15\x4f\xd1\x09\x35\x34\x37\x53\x64\x32\xd3\x16\x02\
+\xcb\xdb\x98\x0e\x55\x4c\xd3\x21\x38\x6a\xc3\x69\x5a\x8b\x71\x98\
+\xc1\x96\x55\xca\xd0\xde\x47\xb5\x65\x1c\x66\x28\xd7\xca\x2c\xf2\
+\xb4\x29\xa2\x75\xdc\xe8\x8b\x2f\xbe\x28\x49\xfa\x8f\xfe\xee\x7f\
+\xf1\x5b\x17\xce\x9e\x39\xb7\x5e\x5b\x13\x28\x01\x10\x24\x01\x00\
+\xc0\xd8\x04\xc8\x27\x9f\x7c\x52\x92\x74\xf1\xe2\xc5\x14\x08\x4d\
+\x73\xa4\x62\x73\xed\x45\x55\x27\xa7\x89\x13\xda\x14\x85\xbe\xd8\
+\xdb\xb4\x08\x8d\xa6\x19\x1c\x8b\x65\x40\x8a\x68\x15\x4c\x25\x18\
+\xb6\x2c\xea\xd8\x3a\x6b\x4f\x4b\x47\x53\x63\xd2\x04\x3c\x65\x92\
+\x0c\xa6\x75\x13\x65\x0a\x4c\xdd\x56\x65\x5b\x2a\x9d\xcd\xf0\xbb\
+\x26\x91\x56\x03\xab\xca\x6e\xb7\x69\x26\xd8\x7f\xf0\x0f\xbf\xd0\
+\x1e\x10\x9b\x3f\x13\x28\x01\xf4\x0b\x2f\x20\x00\x00\xa0\x6b\xe1\
+\xb1\x1b\x01\xf2\xc2\xd9\x33\xe7\xaa\xdb\xb8\x70\xf6\xcc\xb9\xcb\
+\x6f\x5f\x96\xb5\x56\xd6\x38\x39\x67\xe3\xcf\xc5\x97\x73\x72\xd6\
+\xc6\xcb\x8d\x95\x49\xff\x8f\xbf\xef\x70\x7d\xeb\xe4\x9c\x49\xdf\
+\x9d\x8c\x31\xf1\xfa\xce\xc9\x5a\x1b\x2f\xb3\x56\xce\x1a\x59\x5b\
+\x93\xb5\xa6\x65\x3b\x2e\x6d\x23\xde\x77\xfc\xbf\x69\xfb\xbd\xa9\
+\xec\x57\xbc\xae\xa9\xec\x9f\x95\xb3\x2e\xfe\xde\xc4\x6d\x58\x67\
+\xe5\x8c\x93\x75\x26\x6e\xab\xe5\x7e\x8c\xac\x73\xfa\xcd\xdf\xfc\
+\xcd\x4d\xb7\x6f\x7b\x1b\xae\x77\x1d\x02\x25\x00\x82\x24\x00\x00\
+\xd8\xb5\x00\xd9\x8d\xee\xab\x1b\x55\xd3\x8a\xdf\x15\x6e\xdf\xba\
+\x25\x63\x8b\xe0\xd7\x1a\x14\x9d\x73\xb2\xc6\xca\xd6\xd6\x06\x4f\
+\x97\xc2\x9f\x35\x45\x70\x74\xe5\x65\xd5\xe0\x66\x5d\x33\x24\x96\
+\xdb\x6d\x0f\x90\xae\x12\x66\xdb\xfe\xdf\x0c\xa4\xa6\xbc\xbc\x72\
+\x1d\x67\x63\xe0\xb5\xc6\xc4\xfd\xed\x74\x1f\xd6\xe9\x1f\xff\xe3\
+\x7f\xa4\xed\x06\xf4\x8d\xda\x93\x40\x09\x80\x20\x09\x00\x00\x86\
+\x3a\x40\x16\x61\x66\x2b\xdb\x6a\x0f\x96\x2b\x2b\xab\x29\x9c\xa5\
+\xe0\x66\xac\x5c\x2d\x55\x1b\x9d\x6b\xa9\x46\xc6\xea\xa0\x6b\x0d\
+\x9e\x45\x78\x2c\x2a\x96\xcd\x70\xe9\x5a\xc2\x64\x59\x81\xb4\xcd\
+\x6d\x14\xbf\x6f\xad\x84\x76\x0e\x9b\xd6\x16\x55\xc8\xd6\x10\xfc\
+\xbb\xbf\xfb\xbb\x1d\x1f\x67\xaf\x03\x3a\x81\x12\x00\x41\x12\x00\
+\x00\xf4\x25\x3c\x76\x3b\x40\x76\x63\x7b\xed\xc1\xb2\xdd\xec\xec\
+\x6c\xa5\x2a\xe9\xca\xc0\xd9\x5e\xc9\x5c\xaf\x3b\x6c\x35\x24\xba\
+\xd6\xee\xad\xce\x59\x99\x0e\x5d\x6e\xab\xdd\x65\xad\xb5\xfa\xf2\
+\x97\xbf\xbc\xee\xfe\x75\x75\x42\xa2\x1d\x86\x75\x02\x25\x00\x82\
+\x24\x00\x00\xe8\x5a\x80\xec\x76\xd8\xd9\x6a\x15\xb2\x97\x41\xb3\
+\x1f\xfa\xf5\x58\xbb\x15\xdc\x09\x94\x00\x08\x92\x00\x00\x60\xa0\
+\x02\xe4\xa0\x04\xab\x71\x45\xa0\x04\x40\x90\x04\x00\x00\x43\x11\
+\x20\x8b\x50\x42\x80\x1c\xac\x40\xb9\xd9\xe7\x83\x40\x09\x80\x20\
+\x09\x00\x00\xd6\x0d\x90\x85\x8f\x7d\xfa\x57\x3e\x31\xb3\x77\x9f\
+\x35\xd6\x86\x6e\x04\x16\x49\xfa\xc5\xbf\xf7\xf7\xff\x53\x49\xea\
+\xc6\x36\xb1\x75\xc1\x7b\x53\xb4\x7d\xf0\xde\x48\xd2\x97\xff\x9b\
+\x7f\xf8\x2f\x36\xf3\xc1\xc1\xf2\xbd\x7b\xd3\xff\xea\xb7\xff\xbb\
+\x7f\x56\xfc\x9f\x40\x09\x10\x24\x01\x00\x00\xba\x56\x89\x0c\xde\
+\x1b\xef\x73\xeb\x6a\xf5\x9c\x6e\xac\xc3\x63\xab\xd5\x49\x82\x24\
+\x30\xde\x6a\x34\x01\x00\x00\xe8\x26\x63\x6d\x70\xd6\xe6\x17\xce\
+\x9e\x39\xf7\xf1\xdf\xf8\xec\x27\x5d\xad\x9e\xd3\x2a\x83\xef\xc4\
+\xa9\xd3\x2f\x10\xfc\x01\x6c\xfa\xb5\x9e\x26\x00\x00\x00\x52\xac\
+\x48\x16\x61\xa2\x1b\xcb\x71\xec\x64\x1b\xd5\x2e\x98\xe8\xbf\xcd\
+\x04\x4a\xaa\x92\x00\x41\x12\x00\x00\xa0\x19\x24\x77\x12\x04\xa9\
+\x68\x8d\x5e\xa0\x24\x4c\x02\xe8\x84\xae\xad\x00\x00\xa0\x2f\xa1\
+\x03\xc3\x87\xee\xae\x00\xd6\xc3\x27\x48\x00\x00\x40\x52\x6b\x45\
+\x72\x2b\xc1\x90\xa0\x31\x3e\x1f\x14\x74\x7a\x9e\xa9\x4a\x02\xe3\
+\x89\x8a\x24\x00\x00\xd8\x51\xb8\x20\x40\x8e\x87\x6a\xb7\xe7\x4e\
+\x81\x12\xc0\x78\xe1\xd3\x23\x00\x00\x20\x69\x6d\x45\x72\xa3\xa0\
+\x48\x98\x40\xf5\xd8\xa0\x2a\x09\x8c\x1f\x4b\x13\x00\x00\x80\xf5\
+\x54\xc7\xc8\xb5\x07\x08\x42\xe4\x40\x86\xbb\x7f\x7d\xff\xd6\xcd\
+\xb0\xb2\xb4\x38\x99\xad\xae\xd6\xf2\xac\xe1\x82\xf7\xa6\xf8\xf2\
+\x79\x6e\xf3\xac\xe1\x56\x96\x16\x27\x97\xee\xde\x9d\x59\xbe\x77\
+\x6f\x7a\xa7\xc7\x46\x11\x22\x8b\x75\x48\x01\x8c\x07\xba\xb6\x02\
+\x00\x80\xcd\x86\x94\x8e\x55\xc8\xc6\xca\x4a\xbd\xf8\xd9\x3a\xeb\
+\xd7\xbb\xbd\x31\x36\x18\x63\x02\xcb\x7a\xf4\x34\xf8\xff\x4c\xfa\
+\x71\xa5\xe3\x73\x20\x05\xc9\xa9\xba\xb6\xa7\xcf\x73\x1b\x82\xef\
+\x58\x4d\x0c\x3e\x18\x49\x0a\x21\xb4\xfc\xbe\x3e\x39\xd9\x68\x3b\
+\x16\x78\x4e\x81\x31\x43\x17\x04\x00\x00\x20\xa9\x73\xd7\xd6\xf6\
+\x10\x09\x3c\x08\x5d\x5c\x81\xf1\x40\x45\x12\x00\x00\x6c\x0a\x5d\
+\x59\xf1\x20\x7c\xe0\x00\x8c\x0f\xc6\x48\x02\x00\x00\x00\x00\x08\
+\x92\x00\x00\x00\x00\x00\x82\x24\x00\x00\xd8\x84\xf9\xf9\x79\xc6\
+\xa7\x01\x00\x7a\x8e\x31\x92\x00\x00\x8c\x16\x3f\x3f\x3f\xbf\xed\
+\x1b\x07\xef\x8d\xb1\x36\xf8\x3c\xb7\xd6\x39\x2f\x95\xb3\xb2\x56\
+\x2f\x03\xda\x15\x4b\x89\x74\x58\x06\xc4\x2e\x2c\x2c\x30\xab\x2b\
+\x40\x90\x04\x00\x00\x83\x6e\x3b\x13\xe3\x5c\x38\x7b\xe6\x5c\xb1\
+\x34\x47\x35\x30\x16\x4b\x3d\x10\x22\xb1\x91\xa9\xb9\xb9\xa5\xf6\
+\x63\x2f\x4d\xbe\xe3\xc5\x4a\x01\xc0\xc8\xa1\x6b\x2b\x00\x00\x23\
+\x18\x22\x99\x3d\x13\x83\x72\x2c\xd2\x0a\x00\x41\x12\x00\x00\x00\
+\xd8\x72\x98\xec\xd0\xdd\x15\x00\x41\x12\x00\x00\x0c\xe2\xc9\x3b\
+\x55\x49\x00\x40\xaf\x30\x46\x72\x93\xf8\x24\x0d\xc3\x60\x61\x61\
+\x81\x31\x28\x00\xd6\x84\xc9\xcd\x76\x2f\xdc\xea\xf5\x81\xad\x1c\
+\x8b\x92\x02\xef\x53\x00\x41\x72\xec\x02\xe4\x89\x53\xa7\x4f\x5e\
+\x38\x7b\xe6\xfc\x89\x53\xa7\x4f\xd2\x2a\x18\x24\x2f\x7f\xe9\xf7\
+\xce\x1f\x7f\xfe\x93\xc5\x71\xc9\x9b\x34\x00\x80\x30\x09\xa0\xe7\
+\xe8\xda\xba\x41\x80\x9c\x9f\x9f\x0f\x27\x4e\x9d\x3e\x59\x84\xc7\
+\x22\x4c\xd2\x3a\x18\x94\x00\xd9\x16\x22\x75\xe2\xd4\xe9\x93\x54\
+\xcf\x01\xb4\x9f\xbc\x6f\xa5\x8b\x2b\x5d\x62\x01\x00\x9b\x41\x45\
+\x72\x9d\x10\xb9\x5e\xe5\xb1\x1a\x26\xa9\x4e\x62\xb7\x02\xa4\x24\
+\x55\x03\x64\xfb\x31\x2a\x29\x48\x74\x75\x05\xd0\x1a\x0e\xe9\xe2\
+\x8a\x41\x38\x16\x45\x55\x12\x20\x48\x8e\x62\x80\xdc\x4c\x40\x2c\
+\x7e\x4f\x57\x57\xec\x46\x88\x5c\x2f\x40\x76\x3a\x46\x79\xb3\x06\
+\xd0\xaf\xf0\x09\x00\x18\x2f\x74\x6d\xad\x84\xc8\x6a\x37\xd6\x4d\
+\xbe\xc9\xd2\xd5\x15\x7d\x0b\x90\x9b\x0d\x91\xed\xc7\x28\x5d\x5d\
+\x01\x54\x83\x21\x2d\x81\x41\x38\x16\x79\x6f\x02\x08\x92\x23\x11\
+\x20\x37\xea\xca\x4a\x98\xc4\x20\x84\xc8\xe3\xcf\x7f\xf2\xe4\x56\
+\x43\x24\x61\x12\x00\xe1\x13\x84\x49\x00\xbd\x32\xb6\x5d\x5b\x37\
+\xdb\x8d\x75\x2b\x61\x92\x6e\xae\xe8\x76\x80\x94\xd6\x1f\x0b\xb9\
+\xd5\x63\x54\x74\x73\x05\x38\x79\xdf\x46\x77\x55\xc2\x24\x00\x80\
+\x20\x59\x09\x91\xdd\x0e\x7d\xff\xc1\xaf\xfc\xc6\xa7\xbe\xfc\x9b\
+\xff\xe0\xbc\xb5\x56\x4f\x3e\xf9\x24\x47\x16\x76\xac\x1b\x01\xb2\
+\x53\x98\x94\x98\x84\x07\x20\x4c\x32\xf6\x11\x83\x71\x2c\x8a\x0f\
+\x39\x01\x82\xe4\xb8\x9b\x98\x99\x5d\xf9\xc5\xcf\x7c\x9e\x49\x78\
+\xd0\x15\x45\x35\xb2\x07\x6f\xda\x4c\xc2\x03\x60\xdb\xe1\x93\xca\
+\x24\x00\x80\x20\xd9\xdb\x37\x5c\xba\xba\x62\xe0\x8f\x51\xc2\x24\
+\x40\x30\xdc\x6a\x17\x57\x5a\x0e\xbd\x38\x16\x79\x3f\x02\x86\x13\
+\xb3\xb6\xf6\x38\x4c\xd2\x12\x18\xe4\x63\x94\x89\x0e\x00\xc2\x24\
+\x2d\x81\x41\x38\x16\x79\x3f\x02\x08\x92\x20\x4c\x82\x30\x09\x00\
+\x00\x00\x82\x24\xba\x11\x26\x09\x94\x18\xf4\x30\x49\xa0\x04\xc6\
+\xf2\xef\x9f\xaa\x24\x06\xe6\x58\xe4\x7d\x08\x18\x2e\x8c\x91\xec\
+\xd3\x89\xba\xc4\x24\x3c\x18\xfc\x63\x54\x8c\x53\x01\xc6\x12\x61\
+\x12\x83\x62\x7e\x7e\x9e\xf7\x21\x80\x20\x89\x4e\x27\xeb\x84\x49\
+\x0c\x41\xa0\xe4\x4d\x1c\x18\xaf\xbf\x7b\x96\x03\xc1\xc0\xe0\x43\
+\x0d\x60\x78\xd0\xb5\x75\x13\xba\xb9\x14\x03\xe3\x26\x31\x0c\x61\
+\x92\xee\x45\x00\x00\x00\x20\x48\x12\x26\x01\xc2\x24\x00\x00\x00\
+\xba\x86\xae\xad\x5b\x0c\x93\xc7\x9f\xff\x64\x57\xba\xa5\x56\xc3\
+\x24\x5d\x5d\x31\xa8\x61\x52\x52\x90\x24\xba\xba\x02\x00\x00\x80\
+\x20\x39\x40\x61\x52\x62\x12\x1e\x0c\x7c\x98\x94\x18\x37\x09\x00\
+\x00\x80\x0a\xba\xb6\x6e\x33\x4c\xd2\xd5\x15\xe3\x16\x28\xe9\xea\
+\x0a\x00\x00\x00\x82\x64\x97\x02\x25\x61\x12\x84\x49\x00\x00\x00\
+\x10\x24\x41\x98\x04\x08\x93\x00\x00\x00\xd8\x00\x63\x24\xbb\x14\
+\x26\x99\x84\x07\xe3\x14\x26\xc5\x24\x3c\x00\x00\x00\x04\x49\x0c\
+\x5e\x98\x94\x98\x84\x07\x03\x1f\x26\x25\x26\xe1\x01\x00\x00\x18\
+\x4b\x74\x6d\xed\x72\x98\xa4\xab\x2b\xc6\x2d\x50\xd2\xd5\x15\x00\
+\x00\x80\x20\x89\x2e\x05\x4a\xc2\x24\x08\x93\x00\x00\x00\x20\x48\
+\x82\x30\x09\x10\x26\x01\x00\x00\x20\xc6\x48\xf6\x3c\x4c\x32\x09\
+\x0f\xc6\x29\x4c\x8a\x49\x78\x00\x00\x00\x08\x92\x18\xbc\x30\x29\
+\x31\x09\x0f\x06\x3e\x4c\x4a\x4c\xc2\x03\x00\x00\x30\xd2\xe8\xda\
+\xda\xa7\x30\x49\x57\x57\x8c\x5b\xa0\xa4\xab\x2b\x00\x00\xc0\xe8\
+\xa2\x22\xd9\xe7\x40\xd9\xad\xea\xa4\x14\x2b\x93\xb4\xea\xe8\xfa\
+\xfe\x08\x3c\xbf\xf3\xf3\xf3\x54\x26\x01\x00\x00\x08\x92\x18\x94\
+\x30\x59\x54\x25\x7b\xd2\xc5\xf5\xd5\x57\xca\x00\xf3\x23\x1f\xa0\
+\x0b\xed\x2e\xf8\xfd\xdf\xf9\xef\xcf\xff\xfc\x2f\xfd\x67\xa3\xd2\
+\xf6\x84\x49\x00\x00\x80\x11\x43\xd7\xd6\x5d\x0a\x93\x43\xb3\xb3\
+\xd5\x50\x89\xee\xb4\x67\xf1\xb5\x81\x03\x07\x0e\xd0\x56\x00\x00\
+\x00\x20\x48\xa2\xfb\x61\xb2\x6f\x63\x25\x09\x93\xb4\xeb\x0e\x8f\
+\x53\xc6\x4b\x02\x00\x00\x10\x24\xd1\xc5\x30\x39\x90\xd5\xc9\x4e\
+\xdd\x59\x09\x93\x84\x49\x00\x00\x00\x80\x20\x39\x58\x81\x72\xbb\
+\xb7\xed\x59\x55\x92\x30\x49\x48\xef\x22\xaa\x92\x00\x00\x00\x04\
+\x49\x10\x26\x41\xbb\x02\x00\x00\x80\x20\x89\x61\x0f\x93\x84\x1e\
+\xc2\xe4\xa0\xa3\x2a\x09\x00\x00\x40\x90\xc4\x80\x85\xc9\x9e\x4e\
+\xbc\x43\x98\x24\x4c\x02\x00\x00\x00\x04\xc9\xc1\x0f\x93\x03\x57\
+\x9d\x24\xf4\xd0\xae\x5d\x40\x55\x12\x00\x00\x80\x20\x89\x3e\x04\
+\xca\xad\x9e\xa4\xf7\x74\x39\x10\xc2\x64\xdf\xda\xf5\xf8\xf1\xe3\
+\xb4\x0b\x00\x00\x00\x08\x92\xe8\x4f\x98\xdc\x8d\xd0\x03\x42\xfa\
+\x56\x50\x95\x04\x00\x00\x20\x48\x62\xc0\xc2\x64\xcf\xab\x92\x84\
+\x49\xda\x15\x00\x00\x00\x04\x49\x9a\x60\xf4\xf4\x25\x4c\x82\x30\
+\xb9\xc3\x63\x94\xaa\x24\x00\x00\x00\x41\x12\x00\x00\x00\x00\x40\
+\x90\x44\xe1\xf8\xf3\x9f\x1c\xba\x2a\xd1\x8e\xaa\x92\xaf\xbe\x72\
+\xbe\xf9\x05\xf4\xf0\x18\xa5\x2a\x09\x00\x00\x40\x90\x24\x4c\x8e\
+\x22\xc2\x64\xf7\xdb\x93\x90\x0e\x00\x00\x80\x21\x57\xa3\x09\xb6\
+\x16\x26\x07\x6e\x16\xd5\x0d\x74\x6f\xac\xe4\x85\xf3\x3b\xfb\x3d\
+\xb6\xda\x6e\xd6\x5a\x79\xef\xc7\xa2\x6d\xe7\xe7\xe7\xc3\xc2\xc2\
+\x82\xe1\x78\x00\x00\x00\x20\x48\x8e\x74\x98\x94\x06\x70\x59\x8e\
+\x0d\xfc\xf2\xe7\xe6\x5f\xda\xea\x6d\xde\xfe\xce\x37\x3f\xdb\x7e\
+\xd9\xb1\xf7\x7d\xf0\xa5\x4e\xbf\xaf\x5e\x8e\x9d\xb5\xeb\x38\xb6\
+\xed\x6f\x7f\x61\xe1\xb3\x1c\x19\x00\x00\x00\xc3\x85\xae\xad\x3b\
+\x0c\x94\xa3\xaa\x53\x80\xe9\x14\x82\x40\xbb\x02\x00\x00\x80\x20\
+\x09\xc2\x64\x4f\x42\xcf\xdb\xdf\xf9\xe6\x67\x8b\x2f\xc2\x24\x61\
+\x12\x00\x00\x00\xc3\x6d\x2c\xbb\xb6\xa6\xf1\x58\xe1\xc4\xa9\xd3\
+\x3b\x0e\x82\x83\x3e\x6e\x72\x62\x62\x42\xbf\xff\xbf\x5c\xf8\xa5\
+\x95\xe5\xa5\x43\xdb\x7e\x8c\xc7\x8f\x6f\x18\x7a\xfe\x8f\x73\xff\
+\xfc\xb3\x5b\xd9\xc6\xdb\xdf\xf9\xe6\x67\x5f\x7e\xf9\xe5\xb1\xff\
+\xe3\xeb\xd4\xae\x2f\xbf\xfc\xf2\x9a\xcb\x37\x13\xd2\x37\x0a\xa9\
+\x00\x00\x00\x00\x41\x72\x10\x03\xc1\x00\x87\xc9\xd5\xd5\x55\xfd\
+\xfc\xc7\x4f\xfc\xce\x4e\xb7\xb3\x51\xc5\xec\x63\x2f\x7c\xea\xa5\
+\xad\xde\xfe\xf8\xf1\xe3\x84\x9e\x75\xda\x65\xa7\xdb\xa3\x5d\x01\
+\x5c\x38\x7b\xe6\xdc\x89\x53\xa7\x5f\xa0\x25\x00\x00\xbd\x32\xb6\
+\x5d\x5b\x17\x16\x16\x4c\x77\x66\x34\x2d\xc3\xe4\x28\x77\x75\xed\
+\x45\x38\xa1\x3b\x27\xed\x0a\x00\x00\x00\x82\x24\x34\xda\xe3\x26\
+\x09\x3d\xfd\x6f\xd7\xcd\x74\x1b\xa6\x5d\x01\xb4\x3b\x71\xea\xf4\
+\x0b\x17\xce\x9e\x39\x47\x4b\x00\x00\x08\x92\x3d\xd0\xed\xaa\x24\
+\x61\x92\x30\x49\xbb\x02\x20\x4c\x02\x00\x08\x92\x20\x4c\xf6\x20\
+\xf4\x30\x6b\xe9\xe6\xdb\xe5\x63\x2f\x7c\xea\xa5\xed\x56\x25\x69\
+\x57\x00\x00\x00\x10\x24\x7b\xa4\x57\x55\xc9\x51\x0f\x93\xbd\x08\
+\x4d\x84\x1e\x42\x3a\x80\xee\xa2\x2a\x09\x00\x20\x48\x0e\x29\xc2\
+\x24\xa1\x67\xa7\xb6\x5a\x95\xa4\x5d\x01\x10\x26\x01\x00\x04\xc9\
+\x11\x09\x93\x04\x4a\x42\x0f\xed\x0a\x00\x00\x00\x82\xe4\x08\xe9\
+\x65\xf7\xd6\xf6\x40\x49\x6b\x13\x7a\xb6\x63\x3b\x63\x25\x69\x57\
+\x00\x05\xaa\x92\x00\x00\x82\xe4\x90\x23\x4c\x12\x7a\x68\x57\x00\
+\x84\x49\x00\x00\x41\x72\x44\xf4\xab\x2a\x49\x98\x24\xf4\x6c\xd7\
+\x76\x67\x70\xa5\x5d\x01\x00\x00\x40\x90\x1c\x11\x84\x49\x42\x0f\
+\xed\x0a\xa0\xdf\xa8\x4a\x02\x00\x08\x92\x3d\xd0\xcf\xaa\x64\x11\
+\x26\x09\x94\x84\x9e\xad\xd8\xc9\xba\x92\xb4\x2b\x00\xc2\x24\x00\
+\x80\x20\x39\x42\x08\x93\x84\x1e\xda\x15\x00\x00\x00\x04\xc9\x21\
+\xd6\xef\xaa\xe4\x38\x86\xc9\xcd\x06\x97\x4e\xa1\x07\x3b\xab\x4a\
+\x12\x26\x01\x48\x54\x25\x01\x00\x04\xc9\x91\x42\x98\x24\x4c\xd2\
+\xae\x00\x00\x00\x20\x48\x0e\xa9\xdd\xaa\x4a\x12\x26\xd7\x0f\x3d\
+\xc5\x17\x47\x67\xb4\x51\x55\x92\x30\x09\x60\x33\xa8\x4a\x02\x00\
+\x08\x92\x23\x18\x26\xc7\x25\x50\xd2\xa5\x72\xf7\xc3\x24\x21\x1d\
+\x20\x4c\xd2\x12\x00\x80\xad\xaa\xd1\x04\x83\xeb\xf8\xf3\x9f\x3c\
+\xf9\xf2\x97\x7e\x6f\x47\x61\x76\x6a\x6a\x4a\xff\xd7\x97\xfe\xe5\
+\xaf\x66\x59\x63\xb6\xab\xfb\x76\xfc\x78\xf3\xe7\xcd\x8c\xd7\xab\
+\x5e\xbf\x53\xe8\x79\xf9\xe5\x97\x79\xc2\xb7\xd9\xb6\x1b\xb5\x2b\
+\x01\x11\x00\x00\x00\x04\xc9\x3e\x5b\x58\x58\x30\x92\xc2\x89\x53\
+\xa7\x77\xad\x3a\xb8\xd3\x30\xb9\xbc\xbc\xac\xbf\xf6\xfc\x27\xbe\
+\xd8\xed\xfd\xaa\x56\xbc\x3e\xf6\xc2\xa7\x5e\xda\xca\xf5\x8f\xbd\
+\xef\x83\x2f\xb5\x57\xcc\x8e\x1f\x3f\x4e\x57\xcb\x2e\xb4\x2d\x61\
+\x12\xc0\x56\x15\x55\x49\x2a\x93\x00\x00\x82\xe4\x08\x86\xc9\x51\
+\x6b\xd7\x4e\x61\x92\xd0\x43\xbb\x02\xd8\xdd\x40\x49\x2b\x60\xb7\
+\x5d\x38\x7b\xe6\xdc\xfc\xfc\x7c\x6d\x61\x61\x21\xa3\x35\x80\xc1\
+\xc6\x18\xc9\x4d\x86\xc9\xdd\x1a\x2f\x39\xea\xa1\xa7\xfd\x32\xc6\
+\x4c\xd2\xae\x00\x80\xb1\x3f\xef\x22\x44\x02\x04\x49\xc2\xe4\x28\
+\x79\xfb\x3b\xdf\xfc\x6c\xf1\xb5\x99\xcb\x09\x3d\xfd\x57\x8c\xa9\
+\xa4\x5d\x01\x00\x00\x40\x90\x24\x4c\x8e\x34\x42\x4f\xf7\x42\x7a\
+\x75\x26\x57\xda\x15\x00\x00\x00\x04\x49\x0c\x64\xe0\xdb\xca\xef\
+\x09\x93\x84\x74\x00\x00\x00\x10\x24\xc7\x12\x55\x49\x42\xcf\xa0\
+\x87\xf4\xf6\xf5\x25\x09\x93\x00\x00\x00\x20\x48\x12\x26\x09\x93\
+\x20\x4c\x02\x00\x00\x80\x20\x49\x98\x1c\xee\xa0\xb7\xd1\xe5\x84\
+\x49\xc2\x24\x00\x00\x00\x08\x92\x20\x4c\xee\x5a\x60\x1d\xf5\xd0\
+\xd3\x8b\x90\x4e\x98\x04\x00\x00\x00\x41\x12\x03\x19\x78\xd6\x0b\
+\x3a\x3b\x9d\x89\xb4\x9b\x55\x4e\x8c\x77\x48\x07\x00\x00\x00\x41\
+\x72\xa0\x50\x95\xec\x7f\xe8\x21\xa4\x6f\x2d\xa4\xb7\x57\x25\x09\
+\xe9\x00\x00\x00\x20\x48\x12\x26\x87\x36\x04\x6e\x36\xcc\x1c\x7b\
+\xdf\x07\x5f\x2a\xbe\x68\xd5\xed\x21\x4c\x02\x00\x00\x80\x20\x49\
+\x98\x1c\x98\x90\x48\x18\x19\x9e\x90\xbe\x5e\x98\x24\xa4\x03\x00\
+\x00\x80\x20\x49\x98\x04\x21\x7d\x5d\x9d\xc2\x24\x00\x00\x00\x40\
+\x90\x24\x4c\xf6\x3d\xf0\x6c\xe7\x3a\x54\xc0\x00\x00\x00\x00\x82\
+\x24\x80\x5d\x08\xe9\xae\x5e\x7f\xbb\xfa\xb5\x99\xdb\x52\x95\x04\
+\x00\x00\xc0\x4e\xd5\x68\x82\xee\x5b\x58\x58\x30\x92\xc2\x89\x53\
+\xa7\x4f\xee\xe6\x7e\x14\x95\xd1\xdf\xfe\xc2\xc2\x00\x86\x86\x0b\
+\x04\x99\x5d\x6e\xdb\xc1\x3c\x2e\x00\x00\x00\x40\x90\x24\x4c\xee\
+\x4a\x98\xac\x76\xad\xfd\xe5\xcf\xcd\x0f\x4c\x17\xd2\x10\x82\x31\
+\xc6\x04\x8e\x8e\xc1\xb1\xb2\xbc\x34\x31\x39\x35\xbd\xba\x9b\xfb\
+\x40\xa0\x05\x00\x00\x20\x48\x62\x17\xc3\xe4\xa0\x06\xc8\x02\x21\
+\xb2\x87\x21\xdd\x7b\x67\xac\xcd\xb7\x7a\xbb\xdd\x0c\x91\x45\x80\
+\x4c\x7f\x27\x00\x00\x00\x20\x48\xa2\x9f\x61\x72\xd0\x03\x64\xa1\
+\xb1\xb4\xb4\xaf\x3e\x3d\x7d\x9b\xa3\xa2\x07\x21\x7d\x1b\x21\xb2\
+\x19\x42\x43\x90\x31\xfd\xcb\x72\x04\x48\x00\x00\x00\x82\x24\x76\
+\xd1\xb0\x04\xc8\x82\x9b\x98\x58\xe4\x59\xeb\x8d\x6c\x65\x79\xae\
+\x36\x39\x75\x6f\x5b\x21\xd4\x98\xbe\x84\x49\x02\x24\x00\x00\x00\
+\x41\x12\x5b\xd0\xed\xaa\xe4\xb0\x05\xc8\x82\x75\xae\xc1\xd1\xb0\
+\x2d\x37\xdb\xbe\x4b\xd2\xd3\xdd\xbc\x83\x5e\x86\x48\x02\x24\x00\
+\x00\x00\x41\x12\xbb\x14\x26\x87\x35\x3c\xa2\x67\xbe\x22\xe9\xaf\
+\x4a\xfa\x92\xa4\x87\x6b\x93\x53\x92\xf4\x70\xb7\x03\x26\x01\x12\
+\x00\x00\x00\x04\xc9\x21\x0c\x93\x45\x80\x24\x3c\x8e\xb5\x03\x6d\
+\xdf\x95\x02\xe3\x57\x24\x7d\x58\xd2\xe5\x74\xd9\x9f\xa5\xcb\xda\
+\x6f\xf7\x70\xe5\x7b\xcf\x83\x26\x01\x12\x00\x00\x80\x20\x89\x5d\
+\x0a\x93\x04\x48\x6c\xc2\x5f\xad\x84\xca\x4e\x5e\x4b\xdf\x2f\x6f\
+\x65\xa3\xdb\x5d\xa6\x85\x00\x09\x00\x00\x40\x90\xc4\x2e\x85\x49\
+\x02\x24\xba\xe8\xe9\x07\x04\xcd\x8e\xb6\x1a\x22\x09\x90\x00\x00\
+\x00\x04\x49\xec\x12\x02\x24\x06\xcd\x83\x66\x72\x25\x40\x02\x00\
+\x00\x10\x24\xd1\x67\x45\x55\xb2\x7a\x19\x21\x12\x83\xa4\x3d\x44\
+\x16\xc1\xb1\xed\x18\x06\x00\x00\x00\x41\x12\xfd\x0e\x93\xf3\xf3\
+\xf3\x61\xbd\x13\x75\x60\x50\x8f\x5b\x5a\x01\x00\x00\x80\x20\x89\
+\x01\x3d\x29\x9f\x9f\x9f\x0f\x27\x4e\x9d\xfe\x33\x49\x0f\xac\x54\
+\x5e\x38\x7b\xe6\x7c\xb7\xd6\xa9\xc4\x68\xbb\x70\xf6\xcc\x79\xc2\
+\x20\x00\x00\x00\x08\x92\xa3\xed\x97\x34\x40\x6b\x03\x62\x34\x54\
+\x2b\xe1\xe3\x84\x00\x0d\x00\x00\x40\x90\x1c\x17\x84\x48\x74\xdd\
+\x18\x57\xaf\x03\x61\x12\x00\x00\x60\xe7\x2c\x4d\x00\x60\x9c\x02\
+\xf4\xb8\x56\x63\x01\x00\x00\x08\x92\x00\x40\x98\x04\x00\x00\x20\
+\x48\x02\x00\x61\x12\x00\x00\x80\x20\x09\x00\x84\x49\x00\x00\x00\
+\x82\x24\x00\x10\x26\x01\x00\x00\x08\x92\x00\x40\x98\x24\x4c\x02\
+\x00\x00\x6c\x01\xcb\x7f\x00\x20\x4c\xc6\xe5\x50\x82\xc4\x5a\x93\
+\x00\x00\x00\x9b\x41\x45\x12\x00\x52\x98\xa4\x3a\x89\x51\x71\xe1\
+\xec\x99\x73\xb4\x02\x00\x80\x20\x09\x00\x7d\x0c\x94\x84\x49\x8c\
+\xc0\x71\xfc\x02\x61\x12\x00\xd0\x4b\x74\x6d\x05\xc6\xd0\x85\xb3\
+\x67\xce\x8f\x42\xe0\xeb\xf1\xb6\x03\xdd\x5c\x31\x0a\x61\xf2\xc4\
+\xa9\xd3\x2f\xd0\x1a\x00\x00\x82\x24\x80\x81\x0e\x61\xfd\x0c\xc3\
+\x84\x49\x00\x00\x80\xdd\x41\xd7\x56\x00\x43\x1b\x86\x7b\x5d\x59\
+\xa5\x9b\x2b\x46\xe0\xef\x84\x2e\xae\x00\x00\x82\x24\x00\x10\x26\
+\x01\xc2\x24\x00\x80\x20\x09\x00\x84\x49\x00\x00\x00\x82\x24\x00\
+\x10\x26\x81\x01\xfb\x1b\xa1\x2a\x09\x00\x20\x48\x02\xc0\x7a\x61\
+\xb2\x97\x81\x92\x30\x09\x00\x00\x40\x90\x04\x30\x82\x61\xb2\xd7\
+\xd5\x49\xc2\x24\x86\xf8\xef\x83\xaa\x24\x00\x80\x20\x09\x00\x1b\
+\x85\x3d\xc2\x24\x40\x98\x04\x00\x10\x24\x01\x80\x30\x09\x00\x00\
+\x40\x90\x04\x00\xc2\x24\xb0\x0b\x7f\x17\x54\x25\x01\x00\x04\x49\
+\x00\x20\x4c\x02\x84\x49\x00\x00\x41\x12\x00\x08\x93\x00\x00\x00\
+\x04\x49\x00\x20\x4c\x02\x03\xf6\x37\x41\x55\x12\x00\xb0\x6d\x35\
+\x9a\x00\x18\x3f\xbd\x0c\x54\xfd\x0c\x86\xdb\x0d\x93\xdb\xb9\xed\
+\x16\xf6\x29\x48\xd2\xc2\xc2\x82\xe1\x48\x03\x61\x12\x00\x40\x90\
+\x04\x30\x32\x46\x24\xe4\x84\x01\x0e\x93\x92\x14\x08\x93\x00\x00\
+\x60\x54\xd1\xb5\x15\xc0\xd0\x86\xe1\xed\x56\x56\x7b\xdd\xcd\xb5\
+\xb8\x0f\xba\xba\x62\x18\x9c\x38\x75\xfa\x05\x5a\x01\x00\xb0\x55\
+\x54\x24\x31\x94\x1a\x2b\xcb\xae\x56\x9f\xf0\xc6\x5a\x4e\xd4\xc7\
+\x3c\x4c\x6a\x87\x95\xc9\xe2\xe7\x5e\x85\x49\x51\x99\xc4\x90\xa0\
+\x8b\x2b\x00\x80\x20\x09\x80\x30\xb9\xf9\xa0\xa7\x7e\x8c\x9b\x24\
+\x4c\x62\xd0\x51\x99\xc4\x20\xb8\x70\xf6\xcc\xb9\xf9\xf9\xf9\xda\
+\xc2\xc2\x42\x46\x6b\x00\x83\x8d\xae\xad\x18\x4a\xf5\xc9\xa9\x9c\
+\x6a\x24\xaa\x61\x72\x27\x5d\x55\x99\xd1\x15\x00\x06\xea\x35\x9d\
+\x10\x09\x10\x24\x01\x80\x30\x49\x98\x04\x00\x00\x04\x49\x00\x20\
+\x4c\x12\x26\x01\x00\xc0\x58\x63\x8c\x24\x80\x91\x0b\x93\xda\xe6\
+\x98\xc9\x7e\x84\x49\x49\x9a\x9f\x9f\x67\xcc\x24\x00\x00\x20\x48\
+\x02\xc0\x20\x86\xc9\x22\x18\x6e\x37\x50\xf6\x6a\xff\x7a\x1d\x54\
+\x01\x00\x00\x08\x92\x00\xb0\xfd\x30\x29\xed\xa0\x3a\x09\x00\x00\
+\x80\xce\x18\x23\x09\x60\xe4\x03\x25\x15\x40\x00\x00\x00\x82\x24\
+\x00\x10\x26\x01\x00\x00\x08\x92\x00\x40\x98\x04\x00\x00\x20\x48\
+\x02\x00\x61\x12\x00\x00\x80\x20\x09\x00\x84\x49\x00\x00\x00\x10\
+\x24\x01\x10\x26\x01\x00\x00\x40\x90\x04\x00\xc2\x24\x00\x00\x00\
+\x41\x12\x00\x08\x93\x00\x00\x00\x03\xa2\x46\x13\x00\xe3\x67\x7e\
+\x7e\x3e\xd0\x0a\x3c\x07\xdb\x0d\xdf\x3c\x7b\x00\x00\x80\x20\x09\
+\x8c\xa1\x13\xa7\x4e\x9f\xa4\x15\xa2\xdd\xaa\x48\x0e\xf1\x73\x10\
+\x08\x93\x00\x00\x80\xae\xad\x00\x00\x00\x00\x00\x82\x24\x00\xa0\
+\x37\x4e\x9c\x3a\x7d\x92\xae\xd1\x00\x00\x80\x20\x09\x00\x20\x4c\
+\x02\x00\x00\x82\x24\x00\x80\x30\x09\x00\x00\x08\x92\x00\x00\x00\
+\x00\x00\x82\x24\x00\x60\x98\x51\x95\x04\x00\x80\x20\x09\x00\x00\
+\x61\x12\x00\x00\x10\x24\x01\x60\x33\x41\x68\xb7\xd6\x92\x24\x4c\
+\x02\x00\x00\x82\x24\x00\x10\x26\x01\x00\x00\x08\x92\x00\x40\x98\
+\x1c\x0d\x79\xa3\xe1\xf2\x46\xc3\xf5\xb2\xfd\xa8\x4a\x02\x00\x30\
+\x3e\x6a\x34\x01\x00\x8c\x7e\x98\xb4\xb5\x9a\xef\x47\xfb\x49\x0a\
+\x0b\x0b\x0b\x86\xa3\x09\x00\x00\x82\x24\x00\x8c\x5d\x98\x1c\xb5\
+\x40\x69\x8c\xa1\x5a\x08\x00\x00\x08\x92\x00\xd0\xcb\x30\x49\x2b\
+\xec\xa8\xed\xa8\x4a\x02\x00\x30\xe2\x18\x23\x09\x00\xe8\x7a\x98\
+\x64\xbc\x24\x00\x00\x04\x49\x00\x00\x08\x93\x00\x00\x80\x20\x09\
+\x00\x00\x00\x00\xd8\x1e\xc6\x48\x02\x63\x88\x35\x13\xd1\x2f\xf3\
+\xf3\xf3\x8c\x97\xdc\x9d\xbf\xf1\x73\x27\x4e\x9d\x7e\x81\x96\x00\
+\x00\x10\x24\x01\x74\xcd\xb8\x4c\x26\x73\xe1\xec\x99\xf3\x5b\x7d\
+\xac\xdb\xb9\xcd\x98\x05\x94\x2d\xb5\xcf\x85\xb3\x67\xce\xf7\xbb\
+\x8b\x2b\xc1\x15\x00\x00\x82\x24\x00\x60\xc8\xed\x42\x30\x1f\xfb\
+\x2a\xe8\x89\x53\xa7\x5f\xa0\x2a\x09\x00\xe8\x25\xc6\x48\x02\x00\
+\x46\x2e\xb8\x32\xd1\x4f\x19\x26\x39\x22\x00\x00\x04\x49\x00\x00\
+\x08\x93\x00\x00\x10\x24\xb1\xbe\x85\x85\x05\xc3\xa4\x28\x00\x40\
+\x98\xdc\x41\x1b\x50\x95\x04\x00\x10\x24\x01\x00\xd8\x8a\xff\xf0\
+\xef\x7c\xe6\x6f\x12\x26\x09\x93\x00\x00\x82\xe4\xd8\xa1\x2a\x09\
+\x00\xdb\x57\x9f\x9c\x6a\xfc\x8d\x5f\xfe\xbb\x7f\x8b\x6e\xae\x00\
+\x00\x10\x24\xc7\x46\x71\xe2\x43\x98\x04\x80\xed\x9b\x9e\xdb\xb3\
+\x34\xee\xdd\x5c\xa9\x4a\x02\x00\x08\x92\x84\x49\x00\xc0\xf6\xc2\
+\x14\x61\x92\x30\x09\x00\x20\x48\x72\xe2\x03\x00\xe0\x35\x15\x00\
+\x00\x82\x24\x36\x44\x55\x12\x00\x08\x93\x3b\x7c\xec\x54\x25\x01\
+\x00\x04\xc9\x71\x3c\xe9\x21\x4c\x02\x9b\xf7\x8b\x7f\xef\xef\xff\
+\x27\xb4\x02\x08\x93\x84\x49\x00\x40\xf7\xd5\x68\x82\xe1\x39\xe9\
+\x91\x14\x16\x16\x16\xcc\xc2\xc2\x82\x91\x14\xd2\x65\x00\xd6\x61\
+\xac\xa5\x0b\xe3\x00\x18\xe4\x0f\xbf\xe6\xe7\xe7\x43\x7a\x4d\x05\
+\x00\x00\x04\xc9\xd1\x0f\x93\xb4\x06\x80\x21\x7b\xed\xea\x5b\x68\
+\xfd\xd5\xcf\x9d\xbe\xbd\xd9\xeb\x7f\xf1\x0b\x67\xf6\x8d\xe9\x73\
+\xf2\xc2\x85\xb3\x67\xce\x9d\x38\x75\xfa\x05\x8e\x50\x00\xc0\x76\
+\xd0\xb5\xe7\x96\x0f\xa8\x00\x00\x20\x00\x49\x44\x41\x54\x75\x48\
+\xd1\xc5\x15\x00\x00\x00\x00\x41\x12\x9b\xc2\x78\x49\x00\x40\x97\
+\xde\x4f\x18\x2b\x09\x00\xd8\x36\xba\xb6\x0e\x69\x98\x54\xdb\x78\
+\x49\x5a\x05\x63\xe8\x86\xa4\xb7\x24\xdd\x4b\xff\x9f\x93\xf4\xb8\
+\xa4\x83\x34\x0d\x40\x98\x04\x00\x10\x24\xf1\x80\x30\x49\x6b\x60\
+\x0c\xfd\xb1\xa4\xbf\xdc\x21\x34\x5a\x49\x5f\x97\xf4\x21\x9a\x08\
+\x00\x00\x80\x20\x89\x0d\x2c\x2c\x2c\x98\xf9\xf9\xf9\x40\x37\x57\
+\x0c\x23\x9f\xe7\xc6\x3a\xb7\xd9\xaa\xfa\x1d\x49\xfb\x25\xfd\x25\
+\x75\xae\xc4\x7b\x49\xc7\x25\xbd\xdc\xa7\x30\x79\x53\xd2\x55\x49\
+\x59\xfa\xff\x01\x49\x87\x79\x6d\xc5\x30\x29\xaa\x92\x54\x26\x01\
+\x00\x04\xc9\xf1\x79\xf3\x6f\xef\xe2\x0a\x3c\xd0\xa0\xad\x9d\xb7\
+\x85\x10\xf9\x4d\x49\x1f\x4c\x61\x71\x23\xa1\x4f\x61\xf2\x4f\x25\
+\x7d\x34\x85\xc7\xaa\x49\x49\x97\x24\x3d\xc4\xd1\x86\x61\x0b\x94\
+\xb4\x02\x76\xdb\x85\xb3\x67\xce\xcd\xcf\xcf\xd7\x17\x16\x16\x1a\
+\xb4\x06\x40\x90\x44\x1f\xc2\x24\x2d\x81\x61\xd5\x58\x5d\x35\xf5\
+\x89\x89\x07\x1d\xc3\x4b\x29\x44\x6e\x56\x90\xf4\x9c\xa4\x8b\xea\
+\xcd\x98\xc9\x22\x44\xe6\x1d\x7e\xb7\x22\xe9\x90\xa4\xef\x49\x7a\
+\x37\xcf\x30\x00\x6c\x0d\x21\x12\x20\x48\xa2\xff\x81\x12\x78\xa0\
+\x21\xeb\x02\xbd\x2c\x69\x46\xd2\xf4\x36\x6e\xbb\xaa\xd8\xf5\xb4\
+\xdb\x41\x72\xa3\x10\x59\x0d\xb2\xef\x96\xf4\x47\x92\x7e\x52\x52\
+\x9d\x23\x0f\x00\x00\x8c\x12\x96\xff\x00\xb0\xab\x36\xa8\x46\xbe\
+\x22\x69\x4a\x0f\xee\xca\xba\x51\x98\xf3\x5d\xde\xdd\x9b\x92\x7e\
+\xfa\x01\x21\xb2\xea\x2f\xa7\xc7\xf0\x75\xc5\xee\xae\x4b\x3c\xe3\
+\x00\x00\x60\x14\x50\x91\x04\x30\x88\xa6\x25\x7d\x60\x00\xf7\xeb\
+\xa6\xa4\x23\x5b\xbc\x4d\x2e\xe9\xc7\x25\x19\x49\x4e\xd2\x84\xa4\
+\xdf\x4f\xdf\xa7\x24\xed\x93\xb4\x27\x3d\x66\x5e\x93\x01\x00\x00\
+\x41\x12\x00\xb6\xa1\xae\xee\x54\xee\xac\xe2\x0c\xaf\xdd\xb6\x93\
+\x0a\x69\x96\xbe\x7e\x2a\x5d\x56\x4c\x92\xe5\xd2\xe5\xaf\x48\x7a\
+\x52\xd2\x2c\x87\x01\x00\x00\x18\x64\x74\x6d\x05\x30\x48\x26\x25\
+\x75\x6b\x92\x85\x3f\xd4\xe0\xcf\x9c\x1a\x2a\x01\x53\x8a\x55\xd8\
+\x3d\x8a\x33\xd4\x02\x00\x00\x10\x24\x01\xe0\x01\xfe\xad\xe2\x8c\
+\xa7\xdd\x0a\xa4\x1f\xe9\xc1\x6b\xdc\x81\x3e\xbc\x6e\x7a\xc5\x19\
+\x6a\xa7\x38\x24\x00\x00\x00\x41\x12\x00\xd6\x77\x57\x71\x62\x9a\
+\x6e\x98\x48\xdb\x9b\xe8\xc1\x7e\x1e\x90\xf4\xaf\xfb\xd4\x26\xcb\
+\x62\xb6\x57\x00\x00\x40\x90\x04\x80\x75\xdd\x54\xf7\x66\x58\xbd\
+\xd7\xa3\x10\x59\xf8\x4b\x8a\x15\xcf\x7e\x68\x88\xca\x24\x00\x00\
+\x20\x48\x02\x40\x47\x59\x17\xb6\xf1\xfd\x14\x46\x27\xfa\xb0\xbf\
+\x4b\x7d\x7c\xfd\x5c\x96\xf4\x0d\x75\x7f\x29\x13\x00\x00\x00\x82\
+\x24\x80\xb1\x7e\x1d\xbb\x2f\xe9\x99\x3e\xbe\xa6\xd9\x14\xf0\xfa\
+\x75\x7f\x1f\x92\xf4\x17\x92\x16\x79\xba\x01\x00\x00\x41\x12\x00\
+\xa2\xbd\xda\xfe\x72\x44\xab\xda\x9d\xe5\x32\x26\xd4\xdf\x71\x8c\
+\x1f\x52\x9c\xd1\xf5\x75\x0e\x17\x00\x00\x40\x90\x04\x80\xb8\xde\
+\xe3\x57\x55\xae\xab\xf8\x20\x46\xd2\x95\xf4\xf3\x6e\xae\x87\x3b\
+\xa1\x58\x0d\x7d\x6b\x0b\xfb\xbe\x13\xb9\xa4\xa7\x14\xbb\xba\x02\
+\x00\x00\x10\x24\x01\x8c\xb5\x9a\xe2\x92\x17\x7f\xbc\x89\x40\xe6\
+\x14\xc7\x0b\x1e\x1d\x90\x7d\x9f\x90\xf4\xa8\xa4\xd7\x14\x27\xc6\
+\xe9\x47\xa0\xfc\x90\x98\xd1\x15\x00\x00\x10\x24\x01\x40\xb3\x92\
+\x7e\xf4\x01\x61\x72\x4a\x71\x62\x1e\x33\x60\xfb\x6e\x15\x2b\x85\
+\x77\x25\xbd\xa9\x58\x31\xac\xf5\x78\x3f\x1b\x69\xfb\x4c\xc2\x03\
+\x00\x00\x08\x92\x00\x08\x93\x29\x8c\xfd\x1b\x49\xd3\xe9\xeb\x7b\
+\x92\xbe\xab\x38\x5b\xaa\x19\xe0\xfd\xaf\x4b\x7a\x3c\x3d\x86\x1b\
+\x92\x7e\x20\xe9\xdf\xa5\xc7\xe0\xd2\xbe\x77\x73\xff\x43\xda\xee\
+\x2a\x87\x0e\x00\x00\xe8\xa7\x1a\x4d\x00\x60\x00\xc3\xe4\xa4\xa4\
+\xc3\x8a\xeb\x4b\x4a\xb1\xda\xd7\xeb\x0a\x5f\x37\x59\xc5\x09\x84\
+\xf6\x4a\x7a\x42\xb1\x52\xb9\x94\xbe\xdf\x56\x9c\xa4\x67\x55\xd2\
+\x73\x29\x0c\xee\x34\x4c\x4e\x4a\x5a\x51\x7f\x96\x3e\x01\x00\x00\
+\x20\x48\x02\x18\xd8\xd7\xa6\xda\x88\x3d\x9e\x3d\xe9\xeb\x91\xb6\
+\x10\x68\xba\x14\x26\xa7\x52\x40\x25\x4c\x02\x00\x80\x9e\xa3\x6b\
+\x2b\x00\xec\xae\xd0\xa5\xed\x78\x49\x73\x62\xcc\x24\x00\x00\x20\
+\x48\x02\x00\xb6\x60\x35\x85\x49\x00\x00\x00\x82\x24\x80\xdd\xe1\
+\xf3\xdc\xbc\xf5\xda\xf7\xa7\x87\x75\xff\x2f\x9c\x3d\x73\x7e\xc8\
+\x76\xb9\x1b\x63\x40\x17\x25\xbd\xcc\xd1\x0b\x00\x00\x08\x92\x00\
+\x76\xe7\x05\xc2\xb9\xf0\xf8\xd3\xcf\x2c\x3d\xe0\x6a\x99\xe2\xd8\
+\xbc\xe2\xab\x41\xcb\x6d\x5b\x31\x71\xce\x4e\x1d\x57\x9c\xf9\x96\
+\x6e\xae\x00\x00\x80\x20\x09\x60\xa0\x5c\x93\xf4\xa7\x29\x38\xee\
+\x93\x74\x40\xd2\xd7\x24\xbd\x26\xe9\x96\xba\x37\xf6\x6f\xdc\xac\
+\x48\x7a\xbd\x0b\xaf\xcf\x4f\x48\xfa\x33\xc5\x99\x62\x01\x00\x00\
+\x08\x92\x00\x76\xdd\x9f\x48\x3a\x22\xe9\x23\x8a\x6b\x24\xae\x28\
+\x2e\x6f\xf1\x57\x24\xbd\x57\xd2\x31\x49\x57\x08\x93\xdb\xf6\x94\
+\xe2\x78\xc7\x9d\x76\x2b\xfe\x09\x49\xfb\x25\x7d\x4b\xb1\x72\x0c\
+\x00\x00\x40\x90\x04\xb0\x2b\x26\x15\xd7\x3f\xdc\xa8\xdb\xe4\xb2\
+\xa4\x27\x77\x3b\x4c\x9e\x38\x75\xfa\xe4\x10\xb7\x73\x2d\x85\xf3\
+\x3f\xd9\xe1\x76\x72\x49\xef\x97\x34\x23\xe9\x2a\x87\x2f\x00\x00\
+\x20\x48\x02\xe8\x17\x2f\xe9\x72\xfa\x79\x65\x93\xb7\x29\xc2\xe4\
+\x6d\x9a\x6f\x47\x9e\x53\xec\xa2\xba\x53\xab\x92\x0e\x8b\x89\x78\
+\x00\x00\x00\x41\x12\x40\x1f\xac\x4a\xba\x21\xe9\xe1\x6d\xdc\x76\
+\x59\xb1\x2a\xc9\x04\x3c\x3b\xf3\x61\x49\xdf\xe8\xd2\xb6\x8e\x6b\
+\xe7\x5d\x66\x01\x00\xc0\x98\xab\xd1\x04\x00\x1e\x10\x22\x67\x24\
+\x4d\xec\x60\x1b\xb7\x15\xbb\x57\xd6\x69\xce\x1d\xf9\x40\x6a\xc3\
+\x6e\x84\xf2\x25\x49\x2e\x3d\x2f\x00\x00\x00\x5b\x46\x45\x12\xc0\
+\x46\x21\x72\x52\x4c\xd2\x32\x28\x6a\x92\x2e\xa9\x3b\x6b\x4d\xaa\
+\x12\x22\x6f\x89\x65\x42\x00\x00\x00\x41\x12\x40\x17\x43\x64\x37\
+\x26\xca\xa1\xe7\x43\xf7\x1c\x96\xf4\x9d\x2e\x6f\x73\xbf\xa4\xaf\
+\xa7\xe7\x1c\x00\x00\x80\x20\x09\x60\x5b\xee\x77\x31\x44\x1a\x49\
+\x07\x09\x93\x5d\xf5\x5e\x49\xaf\x74\x79\x9b\x1f\x91\xb4\x97\x30\
+\x09\x00\x00\x08\x92\x00\xb6\x1b\x22\xf7\x76\x31\x44\xfe\xa1\x62\
+\x15\x8d\x20\xd9\x5d\x1f\x50\xf7\x26\xdf\x29\x2c\x2b\x4e\xc2\x43\
+\x98\x1c\x72\x0b\x0b\x0b\xe6\xc2\xd9\x33\xe7\x68\x09\x00\x00\x41\
+\x12\x40\xbf\x42\xe4\x41\x75\x6f\x02\x96\x3f\x94\xf4\xe3\x92\x66\
+\x47\xad\xa1\xfe\xe0\x5f\xfd\x6f\x87\x07\x60\x37\x3e\x24\xe9\x4d\
+\x75\x6f\xcc\xa4\xd2\x73\x3f\x29\xc6\x4c\x02\x00\x00\x82\x24\x80\
+\x4d\xc8\x24\xfd\x40\x9b\x5f\x23\x72\x23\x46\xd2\xbf\x19\xd5\x10\
+\x29\x49\x3f\xf3\xb1\xbf\x71\x6d\x40\x76\xe5\x09\x49\x6f\x4b\x7a\
+\xab\x8b\x81\x32\x68\xc8\x66\xd8\x0d\xde\x9b\xe2\x8b\x3f\xe5\x88\
+\xaa\x24\x00\x80\x20\x09\xa0\x5f\x41\xf2\xa9\x2e\x6c\x67\x52\x71\
+\x66\xd1\x9f\x1a\xd5\x10\x29\x49\xd6\xb9\x30\x40\xbb\x73\x54\xb1\
+\xfb\xf0\x1b\x92\xa6\xba\xb4\xcd\xa2\x32\x39\x14\x8c\xb5\xa1\xf8\
+\x2a\x2f\xa4\x8b\x2e\x61\x12\x00\x40\x90\x04\xd0\x0f\x07\x77\x78\
+\xfb\x37\x14\xc7\xd9\x3d\x2c\xc6\x44\xf6\xdb\x94\xa4\x77\x49\xba\
+\x97\x82\x7c\x37\x2a\x8a\x2b\x92\xbe\x39\x94\xad\x61\xb4\x1a\xc2\
+\x8e\xd6\x3e\x05\x00\x00\x04\x49\x00\x3d\x3f\x6d\x97\x1a\x29\xc8\
+\xd0\xb5\x70\x77\xd5\x24\x3d\x92\x9e\x8f\x6f\x77\x61\x7b\x3f\xa6\
+\x38\x76\x76\xb8\x04\xd5\x4c\x51\x91\x1c\xf3\xca\x24\x55\x49\x00\
+\x00\x41\x12\x40\x2f\x39\x49\x5f\xd9\xe6\xed\x8a\x31\x75\x84\xc8\
+\xc1\xf2\xac\xa4\x2b\x3b\xdc\x86\x57\xf7\x97\x1a\xe9\xcf\x7b\x5b\
+\x51\x91\x0c\x9a\x08\xe5\x63\x21\x4c\x02\x00\x40\x90\x04\xd0\x45\
+\x75\x49\x4f\x6d\x71\xb2\x12\xa7\xee\xcd\xf0\x8a\xde\x38\x2a\xe9\
+\xd6\x0e\x43\xfe\x73\x1a\xc6\xaa\x64\x3b\xa3\x8c\xc3\x01\x00\x80\
+\xee\x61\x1c\x13\x80\xc2\x31\x63\xed\x37\x14\x97\x95\x78\xd0\x64\
+\x32\x75\xc5\xee\x93\x18\x7c\xfb\xd3\x73\x35\xab\xed\xcd\xca\xeb\
+\x25\xbd\x9a\x8e\x8b\x6d\xb9\x70\xf6\xcc\xf9\x7e\x3e\xe0\x2f\x7e\
+\xe1\xcc\xbe\x4e\x97\xff\xea\xe7\x4e\xdf\x1e\xd7\x83\x60\x61\x61\
+\xc1\x48\x0a\x27\x4e\x9d\x7e\x81\x3f\x09\x00\x00\x41\x12\x40\x37\
+\x19\x49\x3f\xaa\xb8\xd0\xfd\x83\xc2\x24\x21\x72\xf8\x5e\xeb\x57\
+\x24\xfd\xbf\x92\x3e\xba\x8d\xdb\x1f\x97\x74\x55\xd2\xa1\xed\xdc\
+\xf9\x89\x53\xa7\x4f\x0e\x42\x23\x7c\xf1\x0b\x67\xce\x13\x26\x09\
+\x93\x00\x80\xee\xa0\x6b\x2b\x80\x4e\x61\xf2\x15\x49\x33\x8a\xdd\
+\x57\x6d\xfa\x9a\x94\xf4\x75\x9a\x68\xa8\x7d\x54\xd2\xd2\x36\x6e\
+\x17\x24\x5d\x1e\xf6\x07\x7f\xe2\xd4\xe9\x93\xeb\x55\x2b\x01\x00\
+\x00\x41\x12\xc0\xce\xc3\xe4\xb3\x8a\x0b\xdd\xbf\xa9\xb8\xd8\xfd\
+\x5b\x8a\x15\xa9\x1f\xa7\x79\x86\xde\x92\xb6\x37\x66\x72\x79\x14\
+\x1e\xfc\xb8\x87\x49\x26\xde\x01\x00\x10\x24\x01\xf4\x3a\x4c\xee\
+\x95\xf4\x68\xe5\x6b\x2f\xcd\x32\x12\xf6\x48\xfa\xa3\x71\x6e\x00\
+\x2a\x93\x00\x00\x10\x24\x01\x00\x5b\x53\x97\xf4\xa4\xb6\x5e\x95\
+\x1c\xa9\xe0\x35\xce\x61\x92\xaa\x24\x00\xa0\x1b\x98\x6c\x07\x00\
+\xc6\xcf\x31\x49\x5f\x93\xf4\x91\x2d\x84\xcf\x47\xb7\x7b\x67\xfd\
+\x9e\xb5\x15\x9b\x0b\x93\x62\xe2\x1d\x00\x00\x41\x12\x00\xb0\x05\
+\x46\xd2\x87\x25\x7d\x55\xd2\x5f\xd9\x44\x88\x7c\x55\xd2\xbb\xb6\
+\x7b\x67\xfd\x9c\xb5\xf5\xc2\xd9\x33\xe7\x3b\xdd\xdf\x85\xb3\x67\
+\xce\xa7\xf0\x04\x00\x00\xba\x80\xae\xad\x00\x30\xbe\x61\xf2\xa7\
+\x25\xfd\xb1\xd6\xef\xe6\xba\xe3\x10\x89\xc1\x45\x17\x57\x00\xc0\
+\x4e\x50\x91\x04\x80\xf1\x0e\x93\xcf\x49\xfa\x96\xe2\xb8\xc9\x62\
+\xcc\xa0\x93\xf4\x7f\x4b\x7a\x38\x5d\x8e\x11\x0e\x93\xda\x78\xcd\
+\x58\x00\x00\x08\x92\x00\x80\x8e\x61\xf2\x59\x49\xf7\x25\x5d\xac\
+\x5c\xfe\x63\x92\x66\x69\x1e\x00\x00\x40\x90\x04\xb0\xab\x7c\x9e\
+\x1b\xeb\x1c\xd5\x8f\xc1\x34\x4b\x70\x1c\x4f\x0b\x0b\x0b\x66\x7e\
+\x7e\x3e\xd0\xcd\x15\x00\x40\x90\x04\x30\x90\x2e\xfe\xe0\x8d\xa9\
+\xc7\x9f\x7e\x66\x89\x96\x00\x06\x33\x4c\x32\x8b\x2b\x76\xd3\x85\
+\xb3\x67\xce\x31\x29\x16\x30\x3c\x98\x6c\x07\x18\x63\x8d\xd5\xd5\
+\xbe\xbe\x61\x13\x22\x81\xc1\x0e\x93\x54\x25\x41\x88\x04\x40\x90\
+\x04\xf0\x40\x7f\xf2\xfb\x5f\x79\x68\xc4\x4f\x4c\x58\xbf\x10\x20\
+\x4c\x82\x10\x09\x80\x20\x09\xa0\x9b\xfe\xbd\x7f\xff\xaf\x5f\xa3\
+\x15\x00\x10\x26\x41\x88\x04\xb0\x55\x8c\x91\x04\x00\x00\x6b\xc2\
+\xa4\x24\xc6\x4c\xa2\xa7\x01\xb2\x72\xac\x01\x20\x48\x02\x00\x00\
+\xc2\x24\xb0\x71\x88\x24\x40\x02\xc3\x8f\xae\xad\x00\x00\x60\xdd\
+\x30\x49\x37\x57\x10\x22\x01\x10\x24\x01\x00\x00\x61\x12\x84\x48\
+\x00\x3b\x46\xd7\x56\x00\xc0\x58\x98\x9f\x9f\x0f\xb4\xc2\xce\x42\
+\x00\xdd\x5c\x41\x88\x04\x40\x90\x04\xc6\xfb\x0d\x9d\x65\x31\x68\
+\x9f\xb1\x43\x08\x22\x4c\x82\x10\x09\x80\x20\x09\x80\x13\xea\x4d\
+\x9d\xbc\xd0\x3e\xbd\x09\xda\x27\x4e\x9d\x3e\x49\x30\x1f\xcf\xd7\
+\x8e\xe2\xef\x8a\xbf\x13\x10\x22\x01\x82\x24\x00\x8c\xf2\x49\xef\
+\xf9\xf4\xf3\x49\x5a\x64\x77\xda\xb5\xdf\x6d\xbf\xd5\xa0\x8b\xad\
+\x3f\xff\x45\x40\x20\x4c\x82\x10\x09\x8c\x2f\x26\xdb\x01\x30\xf2\
+\x27\xbd\x45\xf0\xa1\x32\xd6\x9b\x76\x1d\xc0\x7d\x3b\xc9\x73\xdd\
+\xb7\x0f\x14\x98\x84\x07\x84\x48\x80\x20\x09\x00\x04\x1f\x6c\x2b\
+\x4c\x10\x26\x09\x93\x00\x21\x12\x20\x48\x02\xc0\xe8\x07\x1f\x42\
+\x06\x6d\x8a\xee\x86\x49\x02\x25\x08\x91\x00\x41\x12\x00\x46\xfe\
+\xc4\x97\xea\x64\xf7\xdb\x34\x9d\x44\x9e\x1f\xa0\x7d\xa2\x2a\xd9\
+\xff\xbf\x29\xc2\xe4\x18\x07\x48\x42\x24\x30\x5e\x98\x6c\x07\xc0\
+\x58\x9f\xfc\x32\x19\x4f\x6f\xc2\xe4\xa3\xef\x7d\xbf\x9e\xfb\xf8\
+\xf3\x27\x07\x60\x9f\x08\x93\xfd\xff\x9b\x62\x12\x9e\x31\x0c\x91\
+\x04\x48\x80\x20\x09\x00\x63\x1b\x7e\x68\x8d\xee\x86\x89\xa2\x4d\
+\x69\x5b\xc2\x24\x08\x91\x00\x08\x92\x00\x30\xea\x81\x92\xae\x79\
+\x5d\x6c\x4f\x8c\x77\x98\xe4\x58\x20\x44\x02\x20\x48\x02\x18\xb1\
+\x37\x7f\x5a\x81\xf6\x01\xf8\x7b\xc2\x4e\x10\x22\x01\x82\x24\x80\
+\x31\x43\x85\x00\x40\x3f\x83\xe4\x7f\xfc\x9f\x7f\xee\x6f\x5a\xe7\
+\x3c\xad\xd1\x5f\x2f\x7f\xe9\xf7\xce\x1d\x7f\xfe\x93\x2f\xf4\xe2\
+\x39\xa5\x75\x01\x30\x6b\x2b\x00\x00\xe8\xed\xc9\x06\x21\x72\xe4\
+\x50\x8d\x04\x40\x90\x04\x00\x00\x18\x31\xbd\xaa\x46\x02\x00\x41\
+\x72\x48\x30\xdb\x21\x00\x00\x18\xa0\xf3\x12\x26\xd8\x01\x40\x90\
+\x04\x00\x00\x18\x35\x54\x23\x01\x10\x24\xa1\x47\xdf\xfb\x7e\xaa\
+\x92\x00\x00\x00\x00\x08\x92\xd8\xbc\xe7\x3e\xfe\xfc\x49\x5a\x01\
+\x00\x00\xec\x36\xba\xb5\x02\x20\x48\x0e\x19\xaa\x92\x00\x00\x60\
+\x33\xe8\xd6\x0a\x80\x20\x89\x26\xaa\x92\x00\x80\x61\x16\xbc\xa7\
+\x8a\x35\xe4\xa8\x46\x02\x20\x48\x0e\xa9\x13\xa7\x4e\x9f\xa4\x2a\
+\x09\x00\x00\xd6\x43\x35\x12\x00\x41\x12\x00\x00\x8c\x8c\x10\x02\
+\x95\x2c\x00\x20\x48\x62\xb7\x50\x95\x04\x00\x00\xfd\x46\xb7\x56\
+\x00\x04\xc9\x11\xc0\xc4\x3b\x00\x80\x61\x13\x02\x63\x24\x7b\x8d\
+\x6e\xad\x00\xfa\xad\x46\x13\x0c\x97\xe7\x3e\xfe\x3c\x55\x49\xec\
+\xd8\x85\xb3\x67\xce\xd1\x0a\x00\x80\xcd\xbc\x5f\x50\x8d\x04\x40\
+\x90\x1c\x11\x45\x55\xf2\xc4\xa9\xd3\xcc\xe6\x8a\x6d\xe1\xa4\x00\
+\x40\xbf\xcc\xcf\xcf\x07\x5a\xa1\xb7\xa8\x46\x02\xd8\x0d\x74\x6d\
+\x1d\x42\x2c\x07\x02\x00\x18\x26\xc6\x58\xc2\x24\x00\x10\x24\x31\
+\x08\x98\x78\x07\x00\x30\x2c\x18\x23\x39\x9c\xe8\xd6\x0a\x80\x20\
+\x09\x00\x00\x76\xef\x64\xc3\x3a\x4f\x2b\xf4\x06\xdd\x5a\x01\x10\
+\x24\xb1\x65\x54\x25\x01\x00\x00\x00\x10\x24\x01\x00\xc0\xc8\x31\
+\x96\x31\x92\xbd\xd0\xcb\x6a\x24\xdd\x5a\x01\x3c\x08\xb3\xb6\x0e\
+\xb9\xa2\x2a\x49\x65\x12\xc0\xa0\x66\x88\xb6\xff\x13\x28\x00\x00\
+\x20\x48\x62\x90\x02\x25\xad\x80\xcd\xe0\x43\x07\xf4\x39\x44\x3e\
+\x29\x69\x9f\xa4\x49\x49\xaf\x48\xba\x47\xb3\x8c\x9f\xe0\xbd\xa1\
+\x2a\x39\x54\xef\x13\x54\x23\x01\x10\x24\x01\x00\xbb\xc6\x49\xfa\
+\x49\x49\x73\xe9\xeb\x1d\x49\xf7\x45\x55\x12\xd8\x31\x26\xd9\x01\
+\x40\x90\x04\x00\x8c\x2a\x9b\x42\xe3\x25\x49\x87\x2b\xe1\x72\xd0\
+\xe4\x03\x18\x6e\x6d\x6a\xab\x3d\x92\x96\xd3\xd7\xd0\xce\x7c\x4a\
+\x35\x12\x00\x08\x92\x00\x86\x94\xcf\xf3\x6a\x37\xa5\x61\xec\xb2\
+\xc4\x89\xe8\x90\x64\x06\x49\x33\x92\x9e\x50\xec\xd6\xfa\xa8\xa4\
+\x3b\x92\x0e\x49\xfa\x79\x49\xb7\x3a\x04\x26\xdf\x76\xfb\xd0\x61\
+\x9b\x61\x93\xf7\x1d\xb6\xb1\xbf\x6f\x4b\xfa\x96\xa4\xdb\xbb\x14\
+\xd6\x4c\x0a\x8d\x93\x8a\x95\xdb\x83\x92\x0e\xa4\xaf\x23\x92\x1a\
+\x29\x8c\x5f\x54\x59\xd5\x6d\xf0\x37\x31\xbe\x98\x64\x07\x00\x41\
+\x12\x40\x5f\xac\x2c\x2d\xd9\x7f\xf1\x3f\xfe\x0f\xcf\xdc\xbc\x7a\
+\x75\x36\xbb\xf6\xb6\x24\xfd\xb5\x0d\xc2\x5a\xb7\x4e\x4e\xc3\x26\
+\xb7\xd7\x48\x5f\xeb\x9d\x60\x2b\x9d\x64\xdf\x96\xb4\x9a\x4e\xf4\
+\x8b\xed\x7a\x49\x4b\x6d\xf7\xe1\x24\xdd\x55\x59\x65\x0a\x95\x70\
+\xb0\x99\x7d\xe2\xe4\x7c\xfb\x41\xe8\xa0\xa4\x77\x4b\x7a\x3c\xfd\
+\x5c\xaf\x84\x9e\x6f\x4b\x5a\x69\xbb\xdd\xa4\x64\x3f\x2c\xeb\x97\
+\xe4\x95\xa5\xed\x64\x92\x5e\x6d\x3b\x26\xde\x9d\xc2\xe9\xa2\x24\
+\x23\xab\xba\xbc\xee\x4a\x7a\xb3\xfa\x7e\x66\x65\x3f\xe4\xa5\x4c\
+\xf2\x79\xdb\xfb\xdc\xb2\xa4\x2b\x4e\xee\x6e\xae\x3c\xeb\xb0\xef\
+\x47\x24\x1d\x52\x4d\xd7\x94\xe9\x8d\x14\x2c\x7d\x0f\x8e\x05\x53\
+\x09\xcf\x35\x49\xb3\x29\x2c\x1e\x94\x74\x54\xd2\xfe\xca\x75\x42\
+\x3a\x86\x97\xd3\xff\xf7\x29\x56\x75\x43\x6a\xc7\x8b\x92\xae\x4a\
+\xba\xa6\xb2\x5a\xc9\xb1\x0b\x00\x20\x48\x02\xe8\x9e\x46\xa3\x61\
+\xbe\xfb\xe7\x2f\x3f\xea\xbd\x37\xb3\x3e\x53\x3a\x79\x7d\xd0\xc9\
+\x6e\x37\x4e\x9a\xed\x26\xb6\x57\xd3\xfa\x4b\x11\x15\xb7\x9d\x4a\
+\x27\xcf\x59\x25\xb4\x14\x81\xb0\x91\x4e\xb8\xf3\xb4\x9d\xfd\xe9\
+\xc4\x7a\x35\x7d\x5f\xa9\x84\xca\x2c\x5d\xdf\xa7\x9f\x57\xd3\xef\
+\x7d\xfa\x5a\x4c\xc1\xb4\x08\xac\x8d\x74\xbd\xd0\x16\x32\x39\x61\
+\x2f\x9f\x9f\x29\x49\x8f\x49\xfa\x11\xc5\xaa\xe3\xa4\xa4\x49\xe7\
+\xb4\x9c\xe7\xba\x2e\xe9\x46\x87\xb0\x5f\x3c\xf3\x99\x32\x3f\x21\
+\xaf\x6b\x4e\x6e\x35\x57\x5e\x1c\x9b\x8f\xc9\xb9\xdb\xca\xf3\x25\
+\xe7\x94\xe7\xb9\x0e\xca\xca\xcb\x6b\x45\xb2\x41\xde\x37\x62\xb0\
+\x74\x87\xa5\xfc\x66\x11\x4a\xbd\xfc\x5e\x49\x3f\x4c\xcf\x77\xf3\
+\x83\x05\x2b\x4d\x7b\xe9\xa9\xa0\x7c\x55\x71\xb2\x9f\x6b\x92\x6e\
+\xaa\xac\xea\xdd\x93\x54\x57\xa6\x03\x72\xee\xa8\xf2\xfc\x96\xa4\
+\xef\x49\xba\xdc\xb6\xad\xf5\x8e\xcf\xb0\x89\xe0\x38\x2d\x69\x6f\
+\x0a\x8d\x87\x53\x30\x9c\x49\xd7\x31\x95\xe3\xed\xa1\x74\xcc\x79\
+\x49\xab\x72\xb2\xca\xe5\x53\xbb\x1a\x27\x35\xf2\x72\x12\xa3\x1f\
+\x49\x6d\x7b\x2f\x85\xca\x4b\x8a\x15\xdf\x9c\x63\x14\xdb\x41\x35\
+\x12\x00\x41\x12\xc0\x1a\x33\x73\x7b\x96\x6f\xdf\xb8\x31\xb7\x9a\
+\xad\x4a\xd2\x31\xc5\x0a\x5f\xbb\x62\x4c\xd6\x8d\x75\x37\xe4\x64\
+\x94\x6b\xc6\x4a\x07\x7c\x73\xdc\x53\xea\x9d\xe8\xbd\x14\xab\x39\
+\xb9\x9a\xdd\x0c\x9d\x49\xe7\xe2\xc7\x64\x6d\x79\x82\xed\xbd\xad\
+\x9c\xa8\xb7\x77\x27\x9c\xd2\xc4\xc4\x43\xca\xb2\x15\x79\x35\x24\
+\x7f\x2d\x5d\xcf\xa5\xaf\x5c\x92\x9c\x93\xc9\x73\x4d\x54\x42\x66\
+\x9e\x4e\xac\x57\x54\x56\xb4\x26\xd3\xf7\x2c\x9d\xb8\xd7\xd2\x36\
+\x8a\xaa\x50\x11\x30\xa7\x2a\xdb\xf6\x29\x84\x16\x27\xf4\xc5\x36\
+\x17\xd3\xf7\xd5\x4a\x58\x9d\x48\x27\xf1\x45\x98\x2d\x6e\x33\xca\
+\x27\xf2\x26\x85\xa2\xa7\x15\xbb\xb0\x16\xd5\xc7\x46\x6a\x97\xdb\
+\x26\xaf\xbd\x23\x65\xd3\x92\x7b\x42\xca\x0f\x4b\xba\xe3\xe4\x2e\
+\xe5\xd5\x5c\x16\xdc\x84\x94\x37\x24\x5d\xcc\x95\x2f\x3b\x39\x93\
+\xcb\xbc\x25\x65\x87\x94\xe7\x0f\xcb\x5a\xe5\xb9\x97\xa4\x19\x19\
+\xf7\xe7\x52\x7e\x5b\xf2\x45\xbb\x4e\x48\xf9\x93\x92\x1e\x91\x94\
+\x59\xd9\x9a\x97\x77\x31\x4c\xb9\x54\x75\x8c\x87\x8c\x77\x92\x94\
+\x1b\x13\x8f\x95\x7d\x8a\xdd\x6d\x9f\x95\xb5\x8b\xf2\xfe\xb2\xa4\
+\xeb\xaa\xd5\x96\x25\xdd\x52\xd6\xfc\xa0\xe5\xa3\x29\x94\xbd\x96\
+\x02\xda\x6a\xdb\xe3\x7f\x38\x85\xb9\xef\xb4\xfd\xbd\xd8\x74\x4c\
+\xcc\xa6\x50\x78\x28\x7d\xb8\x31\x57\x39\xee\x8a\x0f\x28\xac\x95\
+\x1e\xf3\x4e\xd7\x95\x6b\x25\xb5\xe3\xde\x14\x62\x6b\x92\xf6\x2a\
+\x57\x5d\xd2\x5f\x48\xb2\xb5\x9a\x26\x43\xa6\xa3\x4e\x9a\xce\x9d\
+\xea\xca\xb5\x9c\xb6\x37\x99\xc2\xfc\x8f\xa5\xbf\xeb\xab\x8a\x5d\
+\x60\xdf\x49\xc7\x6e\xce\x2b\xe0\xe8\x60\x92\x1d\x00\x04\x49\x00\
+\xfd\x0b\x91\xb3\xb3\xfe\x6f\xfd\xca\xdf\xf9\xc6\xad\x1b\x37\x26\
+\xfe\x9f\xdf\xfb\x67\x9f\x96\xd3\x1d\x99\xda\x45\x65\x59\x7b\xd8\
+\xd9\x9b\x02\xc1\x45\x49\x41\xb5\x9a\x55\x96\x1d\x72\x72\x2b\xf1\
+\xb4\x3c\x97\xe4\x26\xa4\x3c\xf7\xfb\x0f\x4e\xe9\xd0\xd1\x7b\x9a\
+\x98\xb6\x72\x13\x41\x7e\x55\x7a\xfd\x7b\x75\x2d\xde\xbb\x92\x4e\
+\xb2\x7d\x79\x32\xaf\x86\xe6\xf6\xdd\xd6\x33\xef\x5b\x94\x9c\x14\
+\x32\xab\x8b\xaf\xef\x73\xd7\x6f\x5c\x31\xca\x43\x16\xbb\xf5\xc5\
+\x2b\x3b\x17\x94\xe7\xd7\xf5\xd8\x93\x75\xed\x3f\x74\x47\x6f\xbd\
+\xfe\x90\xbb\x7a\x79\x2a\x8f\xfb\x56\xb3\xb2\xc6\x5b\x2d\x6a\xff\
+\xa1\x99\xbc\x5e\xf7\xba\x7b\x73\x4e\x8b\x8b\x37\xd2\xc9\xba\xac\
+\xd5\x94\x97\xbd\xad\x87\x0e\xd7\x74\xff\x7e\x4d\x8b\x8b\x4b\x92\
+\x5f\xb2\x92\xf3\x92\x97\xb5\xfb\x55\x9b\xf0\x5a\x5d\x6e\x28\x76\
+\x81\x8d\x13\xc2\x58\x3b\x23\x69\x49\xde\x17\x01\x31\xa4\x70\x59\
+\x74\x8d\x9d\x4d\xa1\xc0\xa5\xd7\x4e\x93\xbe\x1f\x94\x74\x5d\xb1\
+\x2a\x94\x55\x02\xe5\xfd\x14\x3c\x8b\xaa\xe8\x4a\xfa\x39\xaf\x7c\
+\xcf\x2a\x21\xb7\x19\xaf\x06\x38\x3c\x4e\xa4\x10\xf6\xae\x14\x92\
+\xf6\x48\xaa\xcb\xb9\x5c\x79\xbe\x14\x03\x99\xee\x28\xd3\xc1\x4c\
+\xd9\xbb\x63\xfb\xe4\x35\x59\xfb\xa4\xa4\xc5\xdc\xe7\xf5\x4a\xdc\
+\x32\xca\xf3\xba\x62\x37\xd8\xaf\x4a\xba\x55\x09\x99\xd7\x24\x7d\
+\x57\x3e\x85\x46\x6b\x7f\x52\x79\x7e\x27\xb5\x73\xb5\x6b\xf2\xdb\
+\x92\xb2\x7a\x5d\x6a\x34\xfc\x44\x0a\x7f\xd7\x14\x2b\x8f\xcd\x43\
+\xaa\xd8\x6c\xfa\xf6\x56\x7a\x2c\x1f\x96\x34\x25\xab\x03\xf2\x3a\
+\x6c\xb3\x2c\xf7\x31\xec\xde\x30\xb5\xfc\x4e\x96\x29\x4f\x7f\x0f\
+\x3f\x91\x9e\xdb\x8b\x92\xbe\x9f\x82\x59\x4d\xd2\x73\x8a\x5d\x6e\
+\xef\xa5\xfd\x39\x90\x8e\x8f\x83\xe9\x58\x99\x48\x97\xaf\x2a\x56\
+\x23\x8b\x6a\xf9\xdd\xf4\x37\xe6\x25\xcd\x78\xc9\x28\xd7\x0f\x15\
+\xc7\x91\x1e\x91\x34\x63\xa5\x67\x25\x65\x3e\x76\xe3\x9d\x96\xd7\
+\x37\x25\x35\xb2\x4c\x59\x6c\x73\x6b\x94\xfb\xc5\x74\x9b\x39\x49\
+\x93\x2e\x3e\x09\x4a\xcf\xc9\x8c\xa4\xf7\xa6\xfb\xbe\x2f\xe9\x4a\
+\x7a\xdc\x37\xd3\x71\x18\x44\xc5\x12\x00\x40\x90\x04\xf0\x20\xd6\
+\xb9\xf0\xae\x77\xbf\x67\xe9\xf1\x3c\x5f\xfe\x77\xff\xf3\xbf\x94\
+\x72\xdd\x93\xb2\xe5\x0e\x27\x93\xb5\x74\x72\x1a\x83\x54\x08\x8f\
+\x4a\xfa\xa9\xa0\x70\x53\x45\x95\x2d\xe4\xfb\x24\x7d\x5f\x8f\x3c\
+\x79\x55\x4f\xbd\xff\x6e\xf3\x96\x7e\xd5\xea\xd2\x9b\x33\x5a\xbc\
+\x37\xa7\x78\x22\x5c\x74\x39\x8c\x27\xd4\xd9\xca\xf7\x75\xf0\xa1\
+\xbb\x9a\x39\x18\x14\xbc\xd1\xf5\xab\xc1\xe8\xe6\x72\x16\x2b\x29\
+\xef\x4b\x27\xd8\x4e\x79\x3e\x27\xe7\xfe\xad\x66\xf6\xdd\xd1\xc3\
+\x4f\xdf\xd1\xcd\x6b\x36\x5c\xbf\xfc\x98\xbc\xf6\x4b\xba\xef\xe5\
+\x0f\xab\x36\xf1\x47\x7a\xe6\xfd\x37\x74\xf8\x91\x65\x7d\xfd\xab\
+\x7b\xb5\xf8\x66\xac\xec\x48\xb7\xbc\x97\xd1\xd4\xf4\x35\x7d\xf0\
+\xa3\x77\xf5\xfa\x77\x6b\x7a\xe3\x7b\xb9\xa4\x83\xbe\xa8\x28\xed\
+\x7f\xe8\xb2\x8e\x3e\xd6\xd0\x77\xbf\xb1\x57\xde\x1f\x4c\x27\xf8\
+\x57\x75\xe8\x98\x55\xad\x3e\xab\xb7\xdf\xda\x23\xef\x73\x49\xb3\
+\xaa\xd9\x5c\x13\x53\x46\x8b\x8b\xb7\x2a\x27\xe0\x07\x64\xed\x11\
+\x79\x7f\x2b\xed\xf3\x0d\x49\xfb\x64\xed\x21\x79\x7f\x35\x5d\xc7\
+\x95\xb9\x45\x21\xb5\x6b\xd1\x75\x31\xa4\x20\x93\xa7\xcb\x57\x52\
+\x70\x5a\x4a\x6d\x5f\x84\xcf\x65\x95\xe3\x47\x8b\x8a\xad\xef\x62\
+\xe0\x34\x0f\xf8\x9d\xa9\xfc\xbc\x57\xe5\xc4\x39\x0f\xa9\xac\xe4\
+\xe6\x92\x6e\xc9\x98\x6b\x29\x0c\x1f\x50\xa6\x67\xd3\xe5\x97\xd2\
+\xd7\x7b\xe4\xfd\xdb\x92\x7e\xa0\x58\xbd\x8b\x07\x5a\x1c\xcc\x38\
+\xad\xf8\x21\xc2\x35\xad\x9d\x84\xa7\xb2\x37\x29\x34\x4d\x4e\x5e\
+\xd7\xca\x4a\xfb\x38\xd7\xd0\x68\x28\x68\x72\x72\x4a\x2b\x2b\xcb\
+\x92\xae\x4f\x6a\x72\x79\x65\xcd\x70\xcc\x56\x4e\xee\x6e\xee\xf3\
+\xd7\x25\x5d\x52\x5d\x75\xdf\x88\x63\x10\x73\xe5\x8f\x29\x93\x93\
+\xdc\xb2\x73\xf9\x8d\xd4\x3d\xb7\x26\xe7\xde\xab\x3c\x7f\x5c\xb1\
+\xeb\xec\x0f\xd3\xfd\x5f\x97\xf4\xd3\xe9\x58\x2f\x9e\x9b\x29\x27\
+\x67\x73\xe5\x21\x85\x3a\x97\x8e\x11\xab\x58\x0d\x5d\x4c\xed\xb9\
+\x27\x85\xc0\x6b\x35\xa5\x3a\x68\xd1\xde\x56\xc1\x7b\x5d\x91\xb4\
+\x57\x5e\x13\xed\x7f\xce\x92\x2f\xba\xc0\x06\x49\xff\x9f\x24\x93\
+\x2b\x9f\x4c\x21\x76\x9f\xca\xb1\xa8\xf5\x14\x5e\x0f\xa4\xbf\xb1\
+\xfb\xa9\xad\x2f\x2b\x56\x2b\xef\x55\x3e\xc4\x20\x58\x0e\x01\x26\
+\xd9\x01\x40\x90\x04\xb0\xcb\x9c\xa4\x3c\xa8\x56\xbe\x08\x64\x59\
+\xa7\x2a\x45\x3e\x21\xe9\xba\x97\xbf\xdc\x0c\x16\x5e\x46\xd6\x9a\
+\x35\x41\xa4\xec\x3c\x57\x4f\xa1\xe0\x72\x25\x48\x1e\x91\xf7\x52\
+\xc3\xdb\xf2\x9a\xc1\x48\x59\x48\xbf\xbf\x56\x39\xd9\x7e\x42\xf9\
+\x9a\x90\x53\x4f\x27\xc8\x75\x6b\xb5\xc7\x4b\x92\x6b\x59\x45\x22\
+\xf8\x78\x52\x5c\x8c\xcb\xf4\xf2\xc1\xcb\x98\xe0\x9c\xf6\x85\xa0\
+\xa7\xbd\xd7\xf5\x18\x0e\x6b\xaf\x6a\x76\x6e\x59\xd2\x21\x59\xbb\
+\x27\x55\xbd\x26\x74\xe4\xf1\x2b\x72\x2e\xe8\xed\xb7\x9e\x95\xd4\
+\xb0\xd2\x8c\x9f\x98\xfd\x8e\x8e\x3e\x96\xe9\xf5\xef\x3e\x2b\x79\
+\x6b\xad\xbc\xb7\xb5\x1b\x9a\xda\xf3\xaa\x16\x6f\x4f\xc9\xfb\x18\
+\x84\x6a\xb5\x25\xd5\x6a\xb9\x96\x97\xf7\xab\xb9\x6c\x83\x9d\x91\
+\x95\x95\xf7\x6f\xa5\x76\x3d\x24\xd9\x43\x92\xbf\xe6\xe4\xae\xe5\
+\xca\xf7\x48\x9a\x90\xb5\x41\xde\xef\x51\xd9\x1d\xd6\xa5\xc7\xb1\
+\xa4\xb2\xc2\x79\x3f\x85\xd6\xe5\x74\xf2\x3f\x9d\xda\xf8\xae\xca\
+\x31\xa2\x5e\xad\xdd\x84\x6d\xe5\x35\xbe\x18\x57\x5a\x2c\x29\x51\
+\x53\xec\x0e\x59\x74\x15\x9e\x49\x6d\x5c\x4f\xbf\x9b\x48\x3f\x87\
+\x14\x7a\xa6\xd2\xe5\x45\xb7\xe0\x55\xc5\x2e\x94\x37\x6a\x52\x08\
+\x59\x76\x38\x8f\x5d\x4c\xaf\x4b\x7a\x45\xd2\xeb\x69\xbf\x66\xd3\
+\xb6\x2f\xa6\xeb\xbf\x5e\x3c\x61\x29\xbd\xcc\xa5\x60\x75\x2b\x1d\
+\x03\x9d\x43\x6d\xae\x45\xd5\x75\x57\x2b\x2b\xd7\xf6\x6b\xbf\x6e\
+\xe9\x56\x3c\x56\xe3\xc7\x00\x41\xd7\x14\xb4\xb2\x32\x9d\x02\xd4\
+\x8d\x15\xad\x14\xc7\xc2\x7a\xe1\xc8\xe6\xb1\x6a\x79\x49\xd2\x0f\
+\xab\xd3\xfa\xcc\xce\xaa\x76\xff\xbe\xf6\x48\xf9\xa3\x79\xae\x47\
+\x62\xd0\x75\xb9\xf2\xfc\xb6\x8b\x8f\xfd\x3d\x79\xec\xd2\xfb\x3e\
+\x49\x6f\xb4\xb5\x65\x5d\x52\x48\x95\xc1\x59\xc9\x66\x92\xbf\xaf\
+\xd8\x3d\x76\x8f\xac\x7d\x42\xde\x3f\x96\x1e\xef\x62\xba\x5d\x68\
+\x9f\xfd\xc7\x7b\xd9\x14\xda\xe7\xd4\x79\x16\xd9\xa2\x0b\x77\x3d\
+\xde\x7d\xe6\x55\xab\x2d\x2b\xcb\x66\x52\xc0\x5c\x54\x39\x1e\xb8\
+\x51\x69\x8b\xd9\xf4\x5c\x3e\x9a\x7e\x7f\x3f\x05\xca\x4b\x29\x0c\
+\x2f\xa9\x73\xb5\x72\xa3\x70\x41\x00\x45\x37\x3c\xa6\xd8\x3b\xa1\
+\x1b\xc7\x93\x11\xdd\xb9\x07\x2d\x6b\x64\xdb\x78\x0e\x4d\xdb\xeb\
+\x9f\x93\xf4\x72\x7a\x9d\x02\x41\x12\xc0\xee\xc9\x83\x24\x5f\xcb\
+\x6a\xca\x54\xed\xde\x5a\x0b\xad\xaf\xf7\x6e\x32\x75\x13\xf4\xe9\
+\x45\x3c\x8e\xf9\xf2\xba\xaf\xa5\xd5\xfb\xad\xa7\x93\xc1\x48\x32\
+\x2e\xf6\x4d\x5d\xf5\x65\x28\x9a\x2d\x4e\x98\x15\x5a\x4f\x48\xd3\
+\x3d\x4d\xa9\x75\x26\xd6\x20\xd7\xba\xd6\xa0\xf7\x0a\xe9\xcd\xe3\
+\x1d\xef\x35\xd1\xe1\x14\xc1\x4a\x7a\x4a\xe5\x58\xc5\xf2\x91\xe6\
+\xf2\xb2\xcd\xb1\x71\xae\xf2\xdb\x90\xba\xb1\x4e\xc5\xb1\x9b\x69\
+\x08\xa6\xf7\x35\x49\x53\x5e\x9a\x96\x51\x88\xd3\x00\xf9\xbd\x8a\
+\xdd\x28\x1f\x91\x74\x5f\x53\xd3\xb7\x75\xef\xf6\xa3\x8a\x5d\x11\
+\x1f\x96\xec\xd7\x34\x35\x7b\x49\xcb\xcb\x1f\x96\xec\xac\xe4\x6f\
+\x68\x66\xea\x75\xd5\x6a\x56\x77\xee\x3c\xa2\xd8\xa5\x76\x42\x53\
+\xd3\x41\xcb\x4b\xb5\xdc\xe7\x56\xd2\x1e\x4d\xcf\x1a\x4d\xcf\x4e\
+\xe9\xd6\xb5\x2c\x05\xda\x39\xd5\x6a\x13\x36\xcb\x1a\xbe\xac\x0c\
+\xcf\xa4\xfd\xbd\x57\x79\x83\x7d\x38\xfd\xff\x6e\x6a\xbb\xa2\xeb\
+\x6c\xa8\x04\x1a\x5b\x79\x33\x2e\xc2\xa1\x69\x8b\xfd\x45\xb7\xdd\
+\xa2\xab\x65\x11\x38\x56\x2b\xcf\xc7\x4c\xe5\x7a\x0d\xc5\x6e\x92\
+\xb7\xd2\xfd\x3c\xe1\xa5\xd9\x54\xed\x35\xd2\x9e\xff\xf3\xa4\xee\
+\xde\x3c\x5f\x36\xff\x07\xd2\x36\xef\xa7\x10\x7c\xad\xed\x44\xb1\
+\x08\x3a\xcb\xe9\x3a\x6b\xfc\x9c\xe4\xfe\x40\xca\xd5\xd0\x92\xa4\
+\xbb\x29\x44\x46\x37\xd6\x04\x99\x2c\x85\xa8\xfb\x0f\xf8\x03\x28\
+\x9e\xf0\x77\x54\x56\xce\x25\x49\xf7\xe3\x2d\xaf\xa6\xf0\x57\x93\
+\x74\x40\xca\x1f\x95\xf4\x58\x1e\x27\xc9\xa9\x8e\x05\xdd\xeb\xe4\
+\xee\xe4\xca\xab\xfb\xff\x63\x69\xfb\xc7\x24\x7f\x25\x3d\x47\x92\
+\x9c\x49\x93\xc9\xee\x4d\x7f\x0f\x13\x92\xac\xac\xbd\x9d\xc6\x16\
+\x57\x4f\xa0\x8e\xa6\xfd\xba\x9c\xfe\x7e\xaa\x26\xe2\x87\x12\xaa\
+\xa7\xfd\x6c\x7e\x12\x94\x9e\xa3\x3b\x69\xff\xf6\xa4\xe7\xf1\xd5\
+\x74\xdd\x69\x27\xed\xcf\xcb\xfb\x6e\xa4\x0f\x24\x0e\x48\x7a\x4f\
+\xe5\xc3\x8a\xeb\x69\x1b\x45\xc5\xdc\x56\x3e\xdc\x30\x95\x0f\x1c\
+\xf6\xa4\xeb\x7e\x93\x93\xf6\xe1\xb7\xcb\xd5\x48\x13\xff\xd4\xf5\
+\xb3\xed\x7f\x8f\xd5\x3f\x58\xbf\x89\xcb\xd2\x31\x7d\xd0\x4a\xdf\
+\xf7\x03\xb0\xee\xaa\xb5\x32\x71\x2f\xac\x7c\x39\xbe\xbb\xf8\x65\
+\xfa\x9d\x2f\x5f\xc7\xac\x35\xcd\xdd\xf6\x6d\x1f\xd6\xd8\xe6\x87\
+\xb9\x0f\x6a\x83\x41\xb2\x37\xbd\x6f\xbe\xbe\xc5\x0f\x09\x1e\x4a\
+\x1f\xa4\xfd\xa0\xed\x75\xf1\xb7\xd2\x87\x95\x20\x48\x02\xe8\xc2\
+\x9b\xff\xf9\x13\xa7\x4e\x9f\xdc\xc6\x4d\x83\x24\x9f\xb5\x84\xc6\
+\xba\x54\x0b\x41\x99\x54\xab\xc9\x64\x99\x82\xf2\x7c\x22\xbd\x4e\
+\x3c\x9e\x4e\x68\x43\x3c\x81\xf6\x41\xcb\x77\xbd\xf2\x4c\x72\xad\
+\x2f\x23\xb9\xf2\x09\x1b\x97\x67\x78\x58\xd2\xbe\xb4\x54\x83\x14\
+\x42\xad\xe3\x09\x84\xd5\x84\xbc\xf2\xca\x49\xed\x9c\xcb\x73\x9f\
+\xdf\x4b\x2b\x35\xe4\x92\x95\xf5\x5e\xfe\xaa\x8a\xe5\x1f\x3a\x3f\
+\x9e\x9b\xe9\x4d\xe7\xa0\xf2\xbc\x7c\xc3\x72\x72\xca\x35\x93\x4e\
+\x8e\x97\x9b\x11\xd5\xda\x29\x79\xff\xb8\xa4\x86\xbc\xbf\x54\x79\
+\x73\xaf\xcb\xfb\xbb\x6a\x7e\xea\x69\x8b\x7f\x9e\xf0\xbe\x39\x71\
+\x8f\x24\x3f\x95\xee\x33\xc8\x2a\x97\x6c\x3a\xc9\xf6\x13\xf1\x44\
+\xdd\x7a\xe5\x61\x4e\xb1\x7a\x75\x5d\x5e\x53\x9a\x9c\xf9\xa1\x96\
+\x97\x9f\x91\xf4\x7e\x49\x73\xb2\xf6\x6b\x9a\xdd\xb3\xa8\x1b\xef\
+\xc4\x13\x79\x6b\xef\x6a\xf6\xc0\x3b\xfe\xee\xf5\x63\xf2\x7e\x42\
+\xd2\xaa\x26\xa7\x67\x95\xe7\x35\x65\xab\x07\xd2\x09\xbd\x54\xab\
+\xd5\x6c\x96\x29\x55\x61\x67\x14\x3f\xcd\xbf\x93\xc6\xd3\xcd\xa9\
+\x9c\x48\x69\xb5\x12\x02\x8b\x4f\xe9\x8b\x49\x8b\x26\x55\x4e\x44\
+\x54\x04\xf5\x2c\x7d\xd9\x4a\xa8\x74\xa9\xed\x2e\x55\x6e\xfb\x78\
+\xba\xdf\x03\x3e\x86\xb1\xff\x49\xd2\xc7\xa4\xd5\x87\xce\x97\xe3\
+\x18\x0f\x4a\x7a\xac\x56\xd3\xa5\x2c\x6b\x76\xc3\xf4\x6d\xe7\x3d\
+\x0f\xec\xaa\xfb\x07\x52\x88\x4f\x61\x1e\xb4\xf1\x24\x46\xd5\x19\
+\x75\x1f\x74\xc2\x52\x54\x10\xef\x3e\xe0\x3c\x6c\x35\x05\xe7\x2b\
+\x8a\x9f\x84\xef\x91\xf4\x2e\x2b\xfb\x73\x5e\xf6\x5b\x52\x76\xdf\
+\xc4\x0c\x15\x6a\xaa\x99\x4c\xd9\x5c\x0a\x79\x45\x78\x0b\xe5\x61\
+\x18\x07\xe2\x7a\xf9\x5a\x0a\x80\xb7\x25\x1d\xed\x70\xef\x41\xd2\
+\x0d\x39\xbd\xa1\xbc\xb9\x44\x48\xfb\x49\xf7\xfd\xf4\x7c\x2d\xb7\
+\xfd\xae\x6e\xa5\x63\x3e\x3e\x4f\x45\xe0\x2d\x1e\xc7\x6a\x2e\xdd\
+\x76\x72\x8f\xe6\xca\x6b\x72\xce\xa5\xbf\xef\xca\x67\x3a\xda\x27\
+\xe9\x83\xe9\x3e\x16\x2b\xfb\xef\xdb\xbe\x8a\xea\xe6\x6a\x3a\xe1\
+\xfb\x8b\x0e\x1f\x12\xa0\xcb\x46\x7c\x92\x9d\x4c\x71\x0c\xf2\xa5\
+\x4e\xbf\xf4\x9b\xbc\xcc\xca\xee\xf1\xf2\xcf\x78\xe9\xcf\xcb\xe3\
+\x31\xf5\x25\x68\xff\xbc\xa3\x0f\x1f\x7f\x14\x9f\x11\x39\x99\xb5\
+\x3d\x24\xfc\xda\x47\xe0\xbc\x31\x72\x52\x9e\xa7\x89\xea\x9c\xd4\
+\x7c\x3f\x33\x32\xca\xe3\xd0\x08\xe7\xca\x57\x63\x97\x77\x78\x28\
+\x6e\x77\x3f\xde\x89\x13\xa7\xe5\xa9\x27\x8e\x26\x14\x27\x10\x0b\
+\x9b\xbc\xb1\x94\xeb\x51\x6b\x75\xc4\x7b\x7d\xaf\x7c\xdd\xb3\x13\
+\x92\xcf\x78\x25\x20\x48\x02\xe8\x72\x98\x94\xa4\x6d\x04\xca\x20\
+\x29\xd4\x55\x37\x0d\x35\x82\xd4\x90\x32\x79\x39\xa7\x2c\xcb\x8b\
+\x13\xe3\x23\xe9\x8d\xe0\xba\xe2\xb8\xb0\xfb\x8a\x63\xae\x6a\x6a\
+\xac\x4a\x36\x94\x6f\x8e\x21\xa4\x73\x6a\x3d\xe4\xbd\x1e\x4d\xb7\
+\xb9\x22\xaf\x45\x2b\x3d\xe4\x9d\x0b\x8a\x6f\x8b\x59\xf9\x02\x54\
+\x33\x99\xfc\x5e\xc9\xef\x4b\x97\xaf\xa4\x13\x5e\xa7\xa5\xfb\xbe\
+\x78\x53\xf1\xf2\x26\x85\xa5\xa5\x74\x32\xdf\xe9\xb1\x2c\x4a\x3a\
+\x6a\x65\xeb\xbe\x2d\xd9\x2a\x56\x13\x2f\xa7\xc7\x92\xde\xc4\xcd\
+\x8a\x64\x2f\xc7\xae\x87\x69\xf6\xd9\x18\xd3\x96\xd2\x49\xf1\xbb\
+\x8a\x4f\x80\xad\x6c\xf0\xf2\x37\x52\x68\x0c\xe9\x7a\xc5\x0c\xae\
+\x8f\x16\xf5\x5a\x1b\x4f\x0d\x6e\xaa\xa8\x42\x95\xb3\xd4\xd6\x24\
+\x6f\x62\xd5\x31\xec\x4f\x6d\x13\xbb\xad\x86\xdc\x49\xf6\x88\xe4\
+\xef\xc9\xcb\x68\x72\xf2\xa2\xee\x6a\x5f\x3a\xa9\xbf\xa6\x5a\xfd\
+\xa2\xe4\xe6\x94\xad\x3e\x25\xa9\xa6\xd9\xd9\x77\xf4\xd0\xb1\x2b\
+\xfe\x87\xaf\x1f\x91\xf7\x1f\x94\x94\xab\x5e\x9f\xd6\xd1\xc7\x17\
+\x95\x37\xbc\xae\x5c\x9e\x90\xcf\xde\x54\x59\xed\xcb\x2b\x01\xa4\
+\xa8\x36\x16\xc1\xd2\x3c\x28\x84\xd5\xe2\x00\x3e\x9f\x4e\x06\x1e\
+\x73\x4e\xd3\x79\xae\x2b\x92\xfe\x28\x3d\xfe\x9f\x56\xac\x2a\xbf\
+\x25\xad\x3c\xa5\x34\x66\x4f\x71\xe2\x9b\x7a\x96\xe9\x5e\x0a\x1b\
+\xdb\x96\x77\xff\x8c\xa8\xe8\xba\xbb\xd9\x0d\x17\x6d\x77\x47\xd2\
+\xb7\xbd\xfc\x8f\xa6\xb5\x2a\x43\x39\x5b\x52\x16\x2a\xc7\x61\xb1\
+\x3e\xe4\xd5\x0e\xa7\x95\xd7\x24\x77\x55\xca\x5d\xf1\x09\x85\x6f\
+\x3d\x13\x96\xbc\x96\xd3\x9e\xcd\x76\xf8\xe0\xa4\x98\xb4\xa9\xbe\
+\xe6\xfc\xcb\x29\xe4\x71\x26\xd7\x3b\x69\x4b\x8b\x6d\xcf\xa5\xc9\
+\xb2\x3c\x8e\xcd\xcc\xf3\xe2\x10\xcd\xbd\xd7\x72\x3a\xee\x0f\xa6\
+\xdd\xb9\xa7\xd6\xf5\x57\x8b\x4a\x64\x51\xd5\x7e\x58\xd6\x5e\x91\
+\xf7\xf7\x15\xab\x04\x87\x52\x00\xf8\xf3\x74\xec\x13\x28\xb1\x9d\
+\x0f\x37\x77\x3c\x09\x94\x8f\x7f\x63\x6d\x1f\x5a\xe5\x72\xb9\x33\
+\xf9\x26\xb6\xed\xe4\x4c\xe5\x75\x27\x8e\x67\x2f\x86\x51\xe4\x79\
+\x87\xc4\xb3\xb9\x44\xba\xd9\xd7\xb0\x5c\xd5\x54\xd8\x96\x10\x2b\
+\x3f\x37\x77\x25\x5f\x27\xc0\xe5\xcd\xd7\x04\x53\xdd\x9c\x93\x53\
+\xee\xf2\x94\x4f\x3b\x24\xce\x22\xa1\xee\xf0\x25\xb7\xf2\x78\xb7\
+\x3e\xae\x3f\x6f\xbe\x5a\x56\x8f\x07\xa3\xf6\x8a\x2e\x08\x92\x00\
+\x76\xee\x67\x7f\xf6\x67\xb7\x1e\x28\x9d\x42\x5a\x9b\x2e\x34\x5a\
+\xd6\x7d\x57\x48\x9f\x7e\x86\x4c\x99\x4d\x27\xad\xaf\x29\x76\x65\
+\xac\x56\x27\x6a\xcd\xde\xae\xc5\xfb\x90\xf1\x21\xbd\x03\xac\xa6\
+\xdb\xdc\x48\xb7\xa9\x79\x29\xc8\x2b\x57\x08\xa6\xb9\x02\xa4\x4c\
+\xc8\x94\xc5\x31\x97\xf1\x84\xfb\x7a\x0c\x3e\xf6\x61\xe7\xbc\xcb\
+\x9d\xf2\xf4\x3e\x1d\x52\x55\x33\x4b\x81\xb0\xac\xf4\x18\x9f\xba\
+\x9e\xaa\x2e\xd9\x63\x92\xbf\xe2\xe5\x17\xe5\x5c\x7c\x43\x2c\x3b\
+\xc8\x1e\xb5\xb2\x33\x5e\x5e\xf2\x79\x68\x8e\x11\x8d\x01\x76\x8f\
+\xe4\x5f\x93\x4c\x65\x59\x09\x3d\x25\x69\x56\xf1\x8d\xac\x7a\x72\
+\x72\x20\x86\x69\x27\xc5\x2e\x3b\x4e\x45\xd7\xd8\xdc\x87\x74\xf2\
+\xbe\x47\xd6\x4a\xde\x87\xf8\x21\x74\x33\x44\x15\x27\xf5\xc5\xb2\
+\x22\xc5\x8c\xb0\x56\xf2\xd3\x92\xee\xca\x2a\x93\xc9\x83\xbc\x37\
+\x8a\x15\xda\x18\x9a\xeb\xce\xd8\x15\x65\xde\xaa\x21\x6f\x96\x34\
+\x35\xbb\x92\xee\xfb\x29\x49\xef\x68\x62\xea\x96\xde\xf3\xc1\x4b\
+\xf2\x0d\xab\x1b\xd7\x8c\x56\xb2\x6b\xda\xfa\x98\x94\x8e\xb2\x4c\
+\x33\x8a\x5d\x69\x4d\x4d\xb5\x2b\x59\x9e\xbd\x92\x42\x43\x11\x46\
+\xef\x29\x76\x61\x7d\x45\xb1\xfa\xba\x37\x5d\xf6\x50\x7a\x4e\x3b\
+\x85\x32\x6d\xe1\xf2\xf6\xeb\xac\x77\x3d\xbb\xce\x75\xcc\x3a\xd7\
+\xf5\x6d\xbf\x37\xeb\xee\xd3\xcf\xc9\xe8\x0f\x5a\xce\x1e\x37\xda\
+\xd7\x63\x2a\xc7\x9c\x86\xea\x89\x95\x55\x11\xc8\xf3\xbd\xe9\x83\
+\x82\x7d\x6a\x1f\xef\xe3\xad\x24\x5f\xcc\xfc\x6a\xb5\xb6\xea\xd8\
+\xfe\x0c\x85\xe2\xcd\x3c\xcb\x95\xa9\x1c\x7f\x39\xd5\x7c\x97\xcf\
+\x3a\x9e\xb4\x7b\x49\x93\xde\x6b\x5f\xfa\xc0\xe1\x55\xc5\xca\x6b\
+\x5d\xeb\x57\x69\x8b\xb6\x9d\x90\xf7\xdf\x4f\x01\x72\x2a\xdd\xfe\
+\xa9\xf4\xd8\xef\x48\xfa\x8a\xe8\xee\xda\x55\x63\x32\xc9\x4e\xd0\
+\xce\x7b\x6a\x16\xe1\xa3\x65\x59\xa9\x2d\x05\xb9\x35\x17\xb6\x04\
+\x2d\xe3\x94\x2b\xcf\x15\x5c\x7a\x1d\xc8\x8b\x65\xae\x52\x69\xd0\
+\xa5\x37\xc5\x7c\xdd\x72\x61\xef\xb4\xef\x7f\x9e\xc7\x7d\x4e\xff\
+\x0b\x79\x5c\xbe\x2b\xe4\x45\xc8\x4c\x8f\xcd\x49\xca\x5d\x2c\x85\
+\xb6\x0e\x2c\xd9\xb1\x6d\x3e\x9f\x43\xd0\x69\x17\x04\x49\x60\x54\
+\x03\xe5\x46\x61\x32\x66\x1b\xad\xd7\x4d\xd0\xc7\x17\x86\x9a\x32\
+\x65\x71\x22\x93\x58\xad\x08\x6d\x6f\xd4\x35\xc9\xa6\xf0\x58\x8f\
+\x6f\x3c\xcb\xf7\x82\x96\x97\x8b\xf5\x23\x97\x3a\xdc\x26\xc4\x09\
+\x76\x5a\x5f\x7a\x52\x45\xe4\x6a\x3a\xdd\x35\x92\x0f\xb1\x5b\x4f\
+\x71\xbd\x5a\x88\x6b\x49\xea\x72\x33\x8c\x39\x29\x7e\x3a\x59\x93\
+\xbc\x82\x9c\x6b\x28\xcf\xdf\x56\xac\x9a\x1e\x4e\x63\x40\xa5\xe6\
+\x76\xd4\xf0\xf2\x31\x84\xda\x89\xe2\x8d\xb2\x18\xc8\xbf\x1a\xbb\
+\xa6\x2a\x86\xbf\x18\x02\x6f\xab\xe8\xda\x17\xaf\x3b\x6d\x63\x20\
+\x4e\xe7\x0d\x79\xb0\x56\xf7\xbc\xd7\xad\x14\xaa\x83\x9c\x95\x8f\
+\xef\x7e\xf7\xe4\xfd\xcd\xca\xe3\xbe\x9d\xf6\x6b\x5f\x5c\x68\x24\
+\xcc\xa8\x9c\x0c\x45\x92\xf1\xe9\xe4\xff\xba\xbc\x42\xa5\x12\x55\
+\x2c\x48\x1f\x97\xe8\x94\x8e\xc9\x6b\x51\xca\xdf\xa9\xec\x7f\x90\
+\xb4\xa2\x10\x32\x19\x13\x9a\xcb\x65\xc4\xf4\xd0\x8d\x4f\x6f\x1f\
+\x49\x61\xf6\x4d\x49\xdf\xca\x94\x5d\xaf\x04\x48\x27\x49\x53\x53\
+\xfa\x76\xa3\xa1\x9f\xcc\x73\x7d\x23\x86\x6c\x3d\x2b\xe9\xbb\x65\
+\x48\x8e\xcf\x7d\x5a\xf3\xb3\xf8\xbf\xa9\x7c\x2f\x9e\xd1\xda\x03\
+\x02\xa2\x5d\xe7\x3a\xcd\x6d\x38\x27\x9b\xc7\xee\xa0\xf5\x07\x04\
+\xc9\x99\x74\xcc\x14\x95\x36\xf3\xe4\x93\x32\x6f\xbc\xb1\xe6\x36\
+\xf1\xfb\xb7\xe3\xf7\xc3\x87\x65\xae\x5e\x95\x4b\xdd\xa5\x43\xcb\
+\xdf\x4a\xf9\x7c\xdf\x54\x9c\x84\xe7\x48\xf5\x8d\x36\x93\xee\xa7\
+\x6e\xc0\x3f\x55\x09\x5f\x59\xfa\x94\xbd\xf2\x5c\xf9\xa2\x6d\x6f\
+\x2b\x56\xf7\x0e\x54\xb2\x60\xd1\x66\x07\xd2\x31\xd2\x9c\xa0\x28\
+\x2b\x8e\xd5\xbc\x25\xf0\x99\x5a\xd6\xba\xc6\x8c\xb5\x9a\xf3\x5e\
+\x87\xd3\x73\x55\x2c\x0f\xb2\x5c\x2b\xb6\x11\x2f\x2b\xba\x3e\x4b\
+\xb5\x9a\x29\x96\x09\x4a\x5d\xde\x6b\x8a\x1d\xda\x57\x54\xd3\x1b\
+\x59\x56\x9b\x92\xb2\xa3\xe9\xfa\x7b\x14\xd7\x15\xfd\xaa\xda\xaa\
+\xa1\xc0\x26\x43\x87\xef\xc2\x36\xd6\x04\xc9\xee\x25\xb5\x32\xaa\
+\xe5\xed\xe5\xc2\xbc\xe5\x72\xd3\x8d\xca\x5e\xb7\xf6\xb9\xd3\xcf\
+\xcd\x1f\x9d\x33\xcd\x41\x0f\xea\xfa\x47\x40\xb9\xb6\x55\x69\x5e\
+\x53\x7d\xa4\x1a\x49\x90\x04\xd0\xaf\x40\xb9\x51\x75\x32\x04\xc9\
+\xc5\x4f\x24\x7d\x31\x8a\x2a\x9e\x75\xd7\xd5\x50\x08\x2a\xbb\xe8\
+\x59\x79\x39\x95\xe3\xac\x8a\x93\xd3\x69\x49\x33\xc5\x34\x34\xcd\
+\xf0\x92\x49\xca\x73\x6f\xe3\x38\xb0\xd5\xca\xc9\xb8\xb5\xb2\x53\
+\x3e\x6f\x18\xdd\xbf\xeb\x75\xe0\x68\x50\x68\x4e\x2e\x50\xf7\xbe\
+\x25\x54\x4c\x2b\x56\x04\xf3\xe6\xcc\xad\x46\xc1\xc6\x41\x92\x47\
+\x55\xac\xd1\x97\xe7\x5e\xde\xa4\x90\x67\x8a\x2a\xaa\x4f\xc1\x67\
+\xaa\xf2\x91\x6a\x70\x52\xc8\xe3\x09\x77\xac\x92\xf9\x3c\xdc\x6e\
+\x04\xb0\x00\x00\x20\x00\x49\x44\x41\x54\x5e\xdf\xc9\x2b\x06\x58\
+\x2b\xaf\x20\x9f\x87\x38\x04\xc3\x17\xcb\x71\x3c\xa6\xdc\x07\x79\
+\x13\x64\xb5\xe4\xbd\xde\x56\xb3\x4a\xe9\xe4\x63\x85\x74\x46\xb1\
+\xab\xef\x0f\x53\x45\x72\x35\x7d\x4d\xca\xba\xe2\x31\xae\xc6\xb0\
+\x62\x8d\xbc\x82\x82\x59\x94\xc2\x25\xc5\x2e\x81\xc5\xe3\x9e\x93\
+\xb5\x47\x24\x5d\x91\x33\x45\x17\xca\xfb\xa9\x1d\x82\x4c\x1a\xb3\
+\x66\x6d\xac\xf2\xe6\xa6\x78\xbc\x77\x24\x65\xb2\x56\x32\x75\x2f\
+\x35\x6c\x7c\x56\xca\x2a\x55\xfb\x4b\x7e\x56\x99\xa6\xb7\x48\x38\
+\x65\x50\xa9\x49\xb5\x4c\x95\xf0\xb1\x5f\xb1\xab\xea\x9f\xa5\x5b\
+\x4d\x4a\xb1\x0c\x75\x2d\xbd\xb1\x2f\x2f\xeb\x96\x73\x6a\x48\x7a\
+\x52\x13\x13\xaf\x69\x75\xf5\x67\x24\xf7\x23\x56\xf9\x23\xc6\xe9\
+\x7b\xb9\xa9\xa5\xdd\xc9\xad\x54\x1d\x63\x2a\xa9\x98\x70\xa6\x9c\
+\xf9\x54\x1b\x84\xc9\xf6\x09\x83\xda\x4d\xa4\xa0\x3a\xd1\xb6\xad\
+\x4e\xd7\x3f\xa8\x3c\x5f\x51\x39\x13\xad\xde\x78\x43\x46\xfb\x65\
+\x2a\x8b\x90\x94\x61\xf2\x8a\xb4\x67\x8f\xcc\xd5\xd8\x51\xb5\xe6\
+\x24\x97\xc7\x46\x0b\x2d\xe3\x8c\xe3\x65\xcb\x95\x53\xb1\x55\x49\
+\x4b\x29\xa0\x65\x8a\x6b\x39\x3e\xa2\x58\xd1\x35\x92\x1e\xf1\x52\
+\xa8\x84\xb8\xe2\x79\xbd\x9a\xbe\xea\x56\x56\x59\x19\x36\x8b\xbf\
+\x91\xc9\xf8\x61\x8d\x5b\x56\xcd\x28\x05\x3d\xa3\x5c\x75\xc5\xaa\
+\x60\x51\xf1\x7e\x27\x2b\xb6\x9f\xf6\xd7\xc7\x70\x5a\x9d\x9c\xa9\
+\xa8\x8c\x87\xd8\x8d\xb9\x26\x29\x7b\x42\xd2\x23\x56\x6a\x78\x5f\
+\x4e\x04\x92\xc5\xbf\xd5\x49\x49\x87\x33\xe9\xeb\xca\x14\xa4\x6c\
+\x29\x05\xe7\x69\xc5\xca\xf5\x34\xe7\x16\xc3\x63\xc0\x96\xfc\xf0\
+\x71\xb9\xdf\x7c\xfd\x21\x7e\xa9\xc8\xb7\x41\xde\x29\xc2\x68\xf7\
+\x83\x64\xe5\x43\x95\x8d\xaf\x26\x93\xed\xfa\x48\x3e\x67\x9a\x1f\
+\xa8\x16\xff\x77\x69\x50\x65\x9e\xc7\x0a\xaa\x94\x96\x00\xce\x7b\
+\x96\x77\x5d\x1c\x03\xb0\x9d\x6e\xcb\x6b\x6f\x43\x91\x92\x20\x09\
+\xa0\x7f\x61\x32\x9d\x24\x74\xac\x4e\xe6\xc5\x09\x6b\x8a\x88\x8d\
+\xe6\x79\x73\xc3\xc7\x4c\x98\x15\x93\xac\x14\xeb\x05\xba\x14\xe2\
+\x0e\xa8\xd9\xf5\x2d\xb7\xb2\xd6\xc8\x16\x63\x24\x1b\x56\xca\x83\
+\x8f\x93\xcd\x18\xc5\x8a\xc9\x21\x2b\xcd\x78\x79\x27\x39\xaf\xc6\
+\x72\x68\x76\x6d\x75\x29\xbd\xc6\xfb\x38\xa2\xa2\xab\xa8\x8d\xd3\
+\xdb\x49\xaa\x35\xf3\x60\x8c\xbc\x93\xe9\xe4\x7a\xb2\xd9\xa5\xd6\
+\x37\xdf\x28\x9d\xe2\x92\x06\x69\x42\x9e\x3c\xc8\xc4\xae\xaa\xe9\
+\xb1\x1e\x55\x73\x29\x05\x1f\xeb\x29\x31\xa8\xbe\x2b\x3e\x7c\x7b\
+\x5b\xce\x29\x75\x65\x35\x8a\x55\x95\x7d\x72\x36\x8e\xcb\xf0\xcd\
+\x6e\xad\x7b\x64\x75\x4f\xf1\xec\x7a\x5f\x3a\x69\x9e\xaa\xbc\xe1\
+\xd5\xd2\xe3\xb8\x59\x79\x03\x3c\x92\xde\x02\x57\x24\x13\x52\x95\
+\x77\x6f\xba\x9e\x69\x56\x69\xbd\x5f\x94\xb5\x8d\x54\xe9\xca\x63\
+\x05\xd4\xe6\x92\x0b\x32\x3e\x97\x74\x43\xde\xe7\xf2\x26\xc4\xee\
+\xaf\xcd\xca\x54\x43\xde\x2f\xeb\xd6\xb5\x09\x35\x96\xea\xca\xf3\
+\x5a\x11\xfa\x2b\x83\x51\x7d\x4d\x52\x96\x65\xad\xdd\x1c\xb3\x96\
+\x6f\xf1\xa7\xf2\x2a\xd5\x31\x95\xd3\xd5\xe3\xe7\x9a\xa4\x39\xcd\
+\xe9\x9e\xee\xc5\x36\xce\x75\x49\xd2\x33\x5a\x5d\xfd\xdf\x25\x5d\
+\x97\xf2\xdc\x4b\x3f\xaf\x5c\x41\x35\x05\xc5\xb1\x7b\x4e\x45\x77\
+\xcb\xd2\xa4\xe2\xd4\xc0\x13\x2b\xd2\xe4\x9e\x3d\xd2\xdd\xbb\xeb\
+\x9d\x8f\x94\x41\x72\x9d\xeb\x15\xa1\xb4\xde\x29\x70\xce\x69\xce\
+\xdc\x6b\x4e\x7c\xab\x7d\xe9\xb1\x4d\xb6\x04\xc6\x5b\xd2\xac\x64\
+\xee\x4b\x9a\xd1\x8c\x59\x8c\x45\x35\x23\x35\xef\xcf\x48\x72\x65\
+\x65\xb5\xa6\x5a\x2d\x4b\x2d\x57\x2b\x02\x5d\x48\xed\xb5\x3f\x05\
+\xc6\x69\x39\xf7\x94\xf2\x3c\x3e\x06\x6b\x1b\x32\xde\xa7\xd0\x17\
+\x24\x5d\xca\xd4\xd2\xbf\xbc\xfc\x20\x47\x9a\x4d\x93\xf3\x54\xc7\
+\xb0\xde\x57\xec\x36\x5e\x97\xf2\x10\xc3\x5c\xfa\x9d\x73\x5e\x79\
+\xbe\xa8\x58\xcd\xb4\x4a\x3d\x03\xb2\xd6\x27\x39\xb4\x7d\x2f\x9e\
+\xf9\xa0\x74\x45\xe7\x54\xcb\x73\xdd\xf7\xd2\x62\xcb\x84\x20\xf1\
+\xc7\x69\x75\x18\xf3\x5a\x53\x6d\x39\x93\x2e\x4a\x59\x43\xc5\x9a\
+\xad\xe8\x8a\x11\x9f\x64\xa7\x2d\x04\xc6\x3a\xd9\xba\xc1\xe6\xc1\
+\x45\xbe\x22\x40\x66\x69\x16\xf2\xb0\xe6\x03\xa5\xed\x2c\x46\x51\
+\x7c\xf8\xb6\x89\xb0\x99\x65\x59\xa8\xd5\xe2\xeb\x6f\xf3\x73\xbb\
+\xe2\x4e\xb3\xf8\x61\x9d\x5a\x7f\xd9\x03\x79\xdb\xdf\xa7\x31\x59\
+\xae\x50\x29\x3b\x9a\x9a\x6a\xca\xf2\x34\x51\x58\xad\xd8\x91\xea\
+\xaa\xb6\x69\x5f\xab\xfb\xb8\xc5\xb6\xcb\x5b\x2b\x92\xa1\xe3\x2b\
+\x7b\xde\xf1\x03\x82\xb5\xb7\xf1\x54\x25\x09\x92\x00\xfa\x1e\x28\
+\xd7\xa9\x4e\x76\x78\x61\x5f\x6d\xbf\xbc\x98\xfa\xff\x58\x0a\x61\
+\xc5\x02\xec\x77\x25\x1d\x55\x1e\xd2\x52\x1a\xa6\x9c\x19\xaf\xb9\
+\x5c\x82\xf6\xa7\xeb\xdf\xf3\xd2\x1b\xd6\xea\xa0\xcf\xf3\xd0\x7c\
+\x03\xf2\xa6\x08\x67\x13\x8a\x4b\x2a\xdc\x4c\x27\xc7\xb7\x14\xbb\
+\xdd\x49\xca\x63\x95\x30\x6e\x7f\x49\x71\x7c\xe4\x75\xc9\x1e\x8a\
+\x13\x02\xb8\x62\xc6\xd8\x90\xb2\xf0\xdb\x8a\x15\x9f\x87\x9a\x15\
+\xc9\x18\x26\x8b\xd9\x4a\xaf\x5a\xc9\x78\xe7\x82\x56\x57\xa4\xb8\
+\x2a\x64\x5a\x8b\xd1\xe7\xba\x76\x65\x4e\x35\x57\x53\xec\x9e\x77\
+\x5f\xd2\x75\xe5\xb9\xd5\xad\x9b\x33\x69\x36\x54\x27\xd9\x38\x1b\
+\xe6\xd2\xdd\x23\x31\xb0\xea\x62\x9a\x62\x67\x46\x2b\x8b\x07\xd3\
+\xa3\xbb\x21\xe9\x8e\xf2\xd5\x69\x05\x33\xa9\x58\x35\xbc\x2c\xab\
+\x59\xad\x2e\x1d\x54\x08\xb3\x8a\xd5\xd1\x86\x1a\x0d\xa7\xbb\xb7\
+\xf7\xa6\x13\xff\x25\x79\x5f\xd7\xdd\x9b\x8f\x48\xf6\x21\xc9\x4f\
+\x58\xe9\xa2\x0f\x2b\xfb\xb5\x9a\x17\xeb\x03\xae\xa8\xb1\x7c\x57\
+\x17\xdf\x3c\x26\xf9\x7a\xda\xf6\x3b\x5a\xbc\xb7\xa8\x97\xbf\xfa\
+\x98\x42\x78\xb7\xf2\x7c\x2a\x3d\x6f\x99\x64\xff\x7f\xf6\xde\x2c\
+\xc6\x92\x2c\xbd\xef\xfb\x9d\x73\x22\xee\xbd\x79\x33\x2b\x33\x6b\
+\x5f\xba\xaa\xbb\x7a\x9b\x99\xee\x59\x38\x1b\x97\x19\x92\x26\x65\
+\x8a\xb6\x20\x42\x90\x0d\x58\x80\x65\x48\x20\x20\xfa\xc1\x0f\x7e\
+\xb1\x1e\xf4\x2a\x03\x84\x01\x83\xd6\x93\x5f\x68\x3f\xc8\x30\x0c\
+\x2d\x0f\xb4\x4c\xca\xa4\x29\x8a\x14\xc6\xa4\x38\x33\x26\x45\x4e\
+\xf7\x74\xcf\x4c\xef\xd3\x4b\x55\xd7\x9a\x55\x95\xdb\x5d\x23\xce\
+\xe2\x87\xf3\x9d\x88\x73\x6f\xde\xcc\xaa\xea\xea\xc6\x0c\xbb\xef\
+\x07\xe4\x72\x6f\x44\x9c\x88\x38\x71\xe2\x9c\xef\xff\x2d\xff\x0f\
+\x0d\xb5\xb7\x7e\x6c\xe3\x39\x06\xc4\x9c\x3b\xf1\x9a\x95\x61\x16\
+\xc3\xcc\x2f\x0f\x36\x01\xb4\x15\x80\x5e\x0f\x26\x93\x38\x66\x32\
+\x50\x96\xee\xf9\xf3\xc0\x7f\x46\xf2\xc8\xc2\xb3\xc0\x2b\x19\xb8\
+\x3a\x0c\x48\xea\xa9\x80\xbf\x45\x20\xb2\x0f\x6a\x34\x0b\x24\x5b\
+\x10\xd9\x47\xf5\x47\x4d\x0c\x65\x29\x0f\xa8\x33\xaf\x45\xad\xac\
+\xa0\x06\xe3\x41\x1e\x4a\x9b\x3c\x96\x72\x3d\x3d\x95\x52\x11\x87\
+\xb2\xcf\x88\xd1\xa2\xdc\x49\x3d\x6b\x60\xb1\xa1\xd5\x2d\x93\x66\
+\x68\xcf\xcb\xfb\xb2\x02\x9c\x62\x6d\x63\x83\x0b\x8f\xdf\x64\xb8\
+\xb7\xc1\x8d\xab\x5d\x31\x00\x5c\x68\x0d\x09\xc5\x55\x01\x5f\xc8\
+\x7b\xf0\x3e\xf0\x75\x79\x8f\x0c\x30\x95\xf0\xd9\x40\x51\x28\x6d\
+\xbd\xd8\x59\x28\x69\x59\x79\xe5\x95\x71\xb5\x46\xef\x79\xfc\x98\
+\x54\x72\x67\x4e\x79\x93\x3e\x5a\x97\x71\xde\x91\x3e\xb8\x9e\xef\
+\xd7\x86\x96\x3f\xb8\xe2\x96\x95\x11\x9a\x2c\x67\xde\xa5\x7c\x00\
+\x49\xde\xf8\x47\x75\x8e\x65\xa1\xad\xd6\x1f\x32\x58\x17\xcc\x76\
+\x85\x4a\xef\x58\x9c\xb3\x0a\x55\x14\x36\xd9\x56\x42\x41\xa1\xb2\
+\xb1\x7e\x5f\xb0\x69\xe7\x8d\x74\x05\xaa\x49\x39\xc8\x63\xcd\x8b\
+\x42\x35\x11\x24\x89\x2d\x3d\xbf\x1e\x0a\x15\x0f\x6b\xc1\xe9\x1c\
+\xa8\x0b\x3c\x40\x7e\xf9\xa2\x6b\x4e\xdf\x59\x72\x03\xe3\x9c\xa5\
+\x31\x0f\xb8\x28\xe2\x79\x2c\xc4\x7e\x6a\xef\x39\x50\xa0\x0e\xe9\
+\x96\x1c\x48\xfa\x43\xf1\xee\x41\x03\xc1\xfc\x31\x9a\x65\x78\xeb\
+\x12\x48\x2e\x65\x29\x4b\xf9\xd1\x80\x49\x68\xc9\x78\x32\x33\xe0\
+\x81\x1c\xc9\xa2\x20\x29\xc6\xc1\x18\xfa\xce\x71\x86\xe8\x80\xba\
+\x21\x20\xc4\x37\xf3\x46\x70\x1a\xef\x43\xa3\x56\x47\xd0\x96\x42\
+\x61\xb7\xe5\xc7\x02\xca\xfb\x94\xe9\x17\x14\x5e\xc5\x5c\xc9\x7a\
+\x9a\xd6\x8d\x04\x00\x53\xee\x5d\xf4\x2a\x99\x8e\x8f\x0d\xbb\x10\
+\x6b\x52\xea\xf5\x58\x5a\xc3\xc7\xba\x86\x29\x27\xd0\x34\x21\xa4\
+\x53\xe0\x0c\xe8\x7e\xeb\x91\x34\x98\x98\x6c\x71\xc7\xc3\x8e\x87\
+\x4d\x76\x76\x36\xa8\xde\xd8\xc1\xda\x4a\xc0\xe0\x0a\x30\xe4\xc6\
+\x95\x00\xa6\x03\xfe\xaa\x00\xd7\x53\x4c\x46\x15\x93\xd1\xba\xd6\
+\xec\x79\xb8\x03\x7e\x15\xeb\x87\x0c\xf6\x4a\x01\x9b\x27\xc1\xaf\
+\x61\xfd\xdb\x58\x3b\x94\x3e\xda\x00\x60\x3a\xbd\x2a\x2c\xae\x03\
+\xc0\xe2\xfd\x4d\xc6\xc3\xbb\x40\x17\xcd\x04\xcf\x2a\xd5\x64\x87\
+\x6a\xd2\x11\x50\x01\xf0\x06\xb6\xda\x8b\xa4\x41\x74\xc0\x6f\x31\
+\x1a\xc5\x3c\xcc\xe8\xa9\xad\xf0\xfe\x36\x83\xbd\x42\xee\xf7\x71\
+\xe9\xb7\x17\xb1\x76\xa8\x35\x1d\x1f\x41\xfc\xd9\x06\x20\xc7\x7b\
+\x59\x15\xc0\xde\xe4\x55\x6a\x98\x78\xea\x3d\x01\xa3\x23\xd9\xaf\
+\x05\x26\xa5\x82\xba\xf1\xda\xad\x00\x4c\x0e\x81\x08\xb1\x4e\x09\
+\x3f\x00\x8e\x15\x14\xce\x46\x8b\xfb\xd9\x19\x25\xc2\x50\xe0\x66\
+\x3d\x9b\x65\xc9\x8a\xab\x31\xfe\x60\x38\x6a\x23\xa3\x76\xc0\x1e\
+\x0c\x6d\x1d\xcd\x24\xe2\x75\x1c\x4d\x68\x6b\xae\xb0\xa8\xf1\x7c\
+\xf9\x6a\xc3\x2a\x8e\xba\xdb\xa5\x37\x9d\x36\xd8\x67\x16\x38\x76\
+\x3a\x8a\xaa\x71\xac\x15\x06\x73\x09\xe3\x2e\x00\xca\xb9\xe6\x79\
+\xcd\x2a\x36\x85\x0d\x58\xf6\x88\xa1\x9e\x27\x81\x9a\xfe\xea\x75\
+\x3e\xf5\xc5\xab\x5c\x7f\x77\x83\x1b\x57\x2f\x82\xbf\x48\xcc\x89\
+\xbd\x89\xd6\x2b\x68\x72\xaf\xe2\xd4\x60\x76\x1c\x6e\xac\x35\xd7\
+\x7c\x8c\x19\xd8\x68\x18\x61\x23\x7d\x6e\x57\x9e\xa5\x01\x5d\xe7\
+\xb9\x44\x52\x26\x25\x29\x5d\x59\x44\xab\xb4\x5f\x14\xca\x59\xdb\
+\x8d\xf8\xbc\xa9\x43\xba\x0f\x8c\xe2\x7e\x4d\x6e\xed\x91\x0a\x9b\
+\xd6\xf1\xc7\x2e\x89\xf8\x3f\x72\xf9\x84\x90\xec\xe4\xb0\xc2\xce\
+\x92\xd8\xa4\xc1\x6d\xd4\x4c\x59\xa7\xa3\x30\x13\x78\x8a\xc2\x61\
+\xad\x5b\x04\x18\x93\xe1\xa3\x00\xd5\xda\xcb\xec\x0c\x10\x04\x3b\
+\x33\xbe\xed\xa3\xb8\x0d\xe7\x43\x62\x8b\x42\x40\x97\x0d\x85\xb5\
+\x6d\xe4\x88\x2d\x9a\xcb\xb1\x39\xda\x9c\xbf\xb4\x23\x00\xf1\x07\
+\x94\x86\xbb\xa0\x38\xe2\x5e\x67\xce\x3f\x7f\x31\xf6\xc8\x67\xba\
+\xa8\xf4\xd3\x83\x1a\x04\x1e\x9e\xf5\x75\x29\x4b\x20\xb9\x94\xa5\
+\x7c\x5c\x65\x16\xcc\x7d\x38\xf2\x27\x7f\xf2\x27\x0f\x7d\x8c\xc1\
+\xc5\x1c\x49\x08\x9d\x0e\x2a\x05\xa2\x55\x16\x2f\xc4\x6d\x5e\xbc\
+\x12\x09\xe4\x1d\x9c\xc0\x47\xa3\x9a\xc9\xd0\xd3\xe9\x86\xcc\x94\
+\xa8\x62\xe8\x27\x77\x39\x58\x2f\x30\x96\xfe\x50\x2a\x30\x1e\x04\
+\x26\x43\x2b\x4a\xbf\x9d\x6b\x3f\x1e\xe7\xbd\x47\xa9\x14\xa2\x5a\
+\x82\x3f\x26\xca\x6f\x24\xf2\x71\x3e\x50\x98\x94\xa3\x59\x10\xcb\
+\x83\x6c\x83\x1f\xe3\x55\x60\xb0\x63\x18\x0f\xba\xa2\x8c\x9c\x14\
+\xa0\x32\x61\x3a\xda\x62\x3a\xba\x25\xe7\xfe\x82\x2c\x74\xe7\x81\
+\x5d\x70\x25\xe8\x13\xc4\x1c\xcf\x33\xc0\x4d\x8d\x2e\xbd\xf7\xc7\
+\x04\x20\x9f\xa6\x65\x5d\x3d\x43\x5b\x16\xe1\x04\x6d\x7d\xc5\x31\
+\x9a\x1e\x9e\xb3\x3e\x02\xb0\xb3\xa2\xd8\x8f\xb5\xa6\xc2\x73\x4e\
+\xca\x2d\x9c\xa2\x0d\x15\xee\x01\xb7\x40\x9f\x93\xd0\xd4\x75\x01\
+\x1b\x8f\x47\x10\xa8\x8f\x49\x38\x6d\x57\xa3\x9f\x97\x70\xc7\x95\
+\xe6\x7c\xd1\xc3\x95\xca\x4e\x4c\xd0\x7a\x0b\xe5\xdf\xc0\xb1\xe1\
+\xe3\x77\x7d\x39\x47\xb2\xea\x76\x7c\xac\x39\x78\xdc\xa7\x05\x3b\
+\x86\xdc\x8e\x8c\x61\xe0\x1c\x03\xea\x7a\x20\xe7\xb8\x4c\xc1\x18\
+\x55\x0e\xa8\x17\x7b\x2f\xe5\xe1\x55\xc0\x5d\x8b\xa5\xc9\xe9\xcc\
+\x3d\xdc\x91\x04\x67\xc6\x23\x59\xd7\x74\xd1\xda\x48\xcd\xcc\x4e\
+\x97\xae\x9a\x32\x0d\x5d\x50\x53\x08\xdd\x2e\x2a\x02\xbd\x59\x8f\
+\xe4\x62\x25\xa8\x09\x6d\x6d\x80\x64\x07\x54\x75\x10\xf5\x2a\xa9\
+\x2b\x7a\x6f\x3a\x6d\xc0\xab\x3a\xf0\x37\x82\xc8\xae\x3c\xbf\xd3\
+\x80\x76\x8e\x7d\x31\x20\xdc\x92\x70\xd5\x82\xe4\xd2\x35\x46\x61\
+\xdd\x4d\x8d\x1e\x79\x7c\x2d\xef\x42\x0b\x83\xdb\xb1\x9d\x4a\xd1\
+\x18\xbc\xef\xe2\x7d\xa7\xa0\xd0\x02\x16\x55\x2c\x9e\xca\xb6\xf7\
+\xec\xd3\x86\xde\xa6\x52\x3d\xd4\xd4\x2e\x8e\x55\xa6\xe0\x67\x88\
+\xb0\x1c\xae\x27\xef\x41\x2d\xe3\xea\xa6\xca\xbd\x92\x51\x99\x1d\
+\xc9\x35\x24\xb3\x40\x8f\x18\xfe\x1a\xe4\xf6\xc3\x7d\x8a\xd0\x19\
+\xef\x29\x7d\x0c\xcf\x2e\x23\xc8\xa6\xe7\x62\x3b\x27\x39\xa4\xa0\
+\xfc\x52\x96\xf2\x80\x20\xd0\x2e\x1c\x79\xce\x3d\x4c\x1b\x12\xda\
+\x3a\x1f\xdf\x59\x28\x1b\x01\x50\x90\x1d\x33\x32\xaa\x8f\x30\xce\
+\xf4\x00\xe8\xb2\xe2\x89\x2c\x32\x47\xa0\x7d\x34\xb0\xfa\x68\x40\
+\x40\xd9\x8f\xea\xde\x0d\x4e\x3b\x82\xd4\xb6\x0d\x47\x97\xb7\x94\
+\xad\xf1\x8f\x9f\x03\x9f\x1f\x4a\x79\x98\xa5\x2c\x81\xe4\x52\x96\
+\xf2\x57\x5e\xfe\xf1\x3f\xfe\xef\x51\x84\x18\x8f\xa2\x80\xa0\x08\
+\x2a\x44\x6d\x31\xe4\xba\x6c\xd4\xeb\x54\xc6\x75\x9a\x7d\x1d\xff\
+\x95\x7f\x54\x76\x5c\x50\xe9\x73\x98\x99\x71\x95\x8a\x98\xeb\x1f\
+\xfe\xc3\xff\x8e\xc6\xd2\xd7\xed\xa2\x98\x06\xba\x51\x2d\x05\x84\
+\x31\xb5\x0c\x50\xf7\x58\xc0\xec\x6a\x30\xde\xe1\x14\x38\x83\xf7\
+\x9a\xa2\x70\x38\x17\xf0\x41\xa3\x75\x97\xda\x1d\x4c\x89\xd7\xda\
+\xa3\x14\x98\x10\x2d\xc0\x11\xad\x7a\x03\xfd\x90\x12\x33\xe5\x32\
+\x35\xba\xa3\xf0\x91\x8a\x5c\x35\x24\x23\x53\x62\xf8\xdd\x4d\x8d\
+\x3e\xe6\x9d\xf3\x28\x12\xc8\x4c\xd7\xb7\x07\xbc\x07\x6c\x52\x4d\
+\x4f\xf0\xd2\x5f\x6c\x51\x8d\x77\x99\x2d\x3e\x3f\x21\x06\xb5\x3e\
+\x2f\xe4\x3d\x3b\xc0\xbe\xd6\x9c\xc7\x63\x22\xeb\xaa\xbf\x4c\xca\
+\x6d\x83\xd3\x02\x0a\xce\x4a\x07\xaf\x0b\x00\xac\x05\xb0\xbc\x4d\
+\x0c\x11\x2c\x40\x5b\x8d\x37\x3e\xd6\xce\xec\x0b\x31\x80\x27\x7a\
+\x08\xf7\xd2\xa2\xe8\x5b\x30\x91\x00\x63\x2d\xca\xfd\x24\x7a\x5c\
+\xf5\x38\x6e\xf3\x27\x64\x9f\x11\xda\x2b\x3c\x67\xa2\xd2\xef\xf7\
+\x35\xdc\xf4\x11\x64\x0e\x04\x24\xfe\x12\x70\xcf\x7b\x3a\x5a\x73\
+\xd3\x47\xd0\x39\x00\xae\x97\x25\xaa\xae\x1b\x92\x94\x1e\x2d\x41\
+\x50\xdf\xc7\xcf\x3d\x81\x38\x46\xc3\x86\x73\x6c\xd2\x86\x03\xf7\
+\x80\x75\x2c\xa7\xa1\xbe\x26\xfd\x32\x98\x51\xbb\x8a\x46\x2b\x6b\
+\xc3\xb3\x22\xb4\x2a\x0d\x66\xcd\x95\xee\xa6\x78\x36\x0f\x84\xb6\
+\x16\xd0\xb3\xb1\xde\x45\x09\x74\xa7\x32\x08\xa7\xb2\x5d\x40\x24\
+\x06\x53\x38\x5c\x0b\x24\x93\xb7\x50\x5c\xa1\x00\x65\x49\xa7\xae\
+\x1b\x20\x19\x12\xb2\x2d\x41\xcd\xc0\xdf\x0a\x0d\xf4\x29\x8a\xed\
+\xd2\xaa\x5e\x56\xfe\x46\xd1\xec\x5f\x02\xf5\x05\xe0\xa2\xc1\x8c\
+\x1c\xee\xba\xc3\x49\xde\xab\x39\x03\xee\x31\x9c\x5b\x07\x06\x5a\
+\xd3\xf3\x1e\x70\xee\x14\xb0\xe7\xf1\x01\x83\xd6\x4e\xf7\xbc\xf7\
+\xfb\xa0\x22\x61\x53\xeb\x39\x8f\x2e\x43\x4d\xd7\x7b\x56\x80\x2f\
+\xdb\xb5\x7e\x8f\xb2\xac\xd8\xdf\x37\xd8\xea\x75\x19\x7b\x17\x88\
+\xde\xed\x26\xd7\x2b\xd6\x7b\xa5\xca\x80\xe2\xbc\x62\x35\x21\x46\
+\x10\xec\xcb\xf6\x61\x7d\xd0\x0b\x30\x57\x9b\xad\x79\x1f\x03\xd4\
+\x8a\xa2\x28\x88\x5e\xcb\xc3\x44\x4b\x58\xf8\xa7\xc4\x10\xf2\xbe\
+\x03\x8b\xa1\xc2\x31\xe5\xf0\x58\xe9\xa5\xfc\x78\x19\x35\x7f\xdc\
+\xbc\x91\x41\x1c\xea\x75\x1b\xd6\x39\x1b\xee\xf9\xc0\x40\x52\x6b\
+\x8f\xb5\xf5\x81\x75\xc8\xda\x85\xa8\x33\xfd\x27\x73\x65\x73\xae\
+\xf4\xb9\xa4\x54\x00\x75\x09\xd4\x75\x28\x4b\x14\x75\x49\x4d\x1d\
+\xeb\x30\x97\x35\x65\x0d\x75\x46\x5b\x77\xdf\x97\xe0\x28\x77\x7e\
+\x19\xc3\x41\x22\x17\x5e\x29\x6f\x94\x4c\xaa\xc9\x08\x47\x79\xe0\
+\x3c\xf1\x1b\x1e\xfa\x15\x54\x31\xfc\x24\xcc\x43\xc9\xa6\x3f\xca\
+\x52\x51\xd7\xa1\x04\xf5\x80\x77\x97\x19\x00\xb0\x3e\x23\x3f\x8a\
+\xe9\x90\x46\x35\xe5\x51\x70\xa1\xf5\x36\xbb\xbc\x54\x89\xcf\x0c\
+\x02\x69\xae\x5a\x52\xed\x2c\x81\xe4\x52\x96\xb2\x14\xe7\x13\x1d\
+\x69\x68\xd1\xa0\x4a\x2b\x69\x22\xe8\x6c\x3f\xc5\x19\x74\x76\x4b\
+\x44\xa1\xe9\xbb\x20\x60\x34\xd7\x0c\x17\x34\x1f\x42\x5e\x60\x2b\
+\xd0\xed\x06\xa6\xd3\x30\x9d\xbd\x3c\x01\x8e\x75\x52\xfc\xa7\xb4\
+\x1e\x11\x59\x17\x5c\x9b\x3f\x69\x00\xe5\x42\x9c\x49\x1c\x38\x67\
+\xd0\xba\x16\x82\x8e\xe4\xad\xdb\xc4\xfb\x53\xc0\x55\x42\x08\xe2\
+\x65\x04\xa7\xbc\x83\x42\xa3\xbd\xd4\x51\xdc\x04\x8e\x79\xfc\xa6\
+\xc1\xbc\x0d\xae\xce\x3c\x92\x41\x6b\x4a\xef\x39\xe9\xb5\x8f\x5e\
+\xb5\x6a\x5c\xf0\xd6\x9b\x9a\xbd\x6d\x8f\x31\x35\x21\xec\xe2\xbd\
+\x30\x5a\xfa\xeb\x8c\x27\xbb\x94\xfa\x2e\xce\x5d\x24\x96\x5d\x18\
+\x02\xcf\x13\x73\xd0\x92\x87\xb4\x04\x4e\xf8\xe8\x41\xbd\x26\x20\
+\x73\xc3\x7b\xde\x93\xdb\xdd\x12\xc5\xfd\x36\x70\x15\xad\xa7\xe0\
+\xef\xe1\xb9\x25\x4a\xfe\x2a\x31\x1f\xee\x0a\xf8\x1d\x1f\x01\xe1\
+\x19\xb1\xa7\x26\x10\x7b\x8f\xe8\x81\xea\x48\xb9\x90\x91\x80\xcf\
+\x55\x8d\x1e\x80\x9f\x4a\x68\xe7\x29\xe0\x2e\xa8\x3d\x22\x68\x2a\
+\x89\xde\x9d\x3d\xc9\x27\x35\xc0\x54\x58\x37\x07\xb4\x25\x44\x2e\
+\x28\x54\x19\x08\x43\x60\x55\x8a\x38\xaf\x03\xcf\x14\x05\xdf\xa7\
+\x2e\xa7\xf2\x3c\x2d\x29\xf7\x33\x7a\x99\xb5\xfc\x24\x30\xb9\x26\
+\x61\xb1\x6b\xb4\xb9\x73\xb5\x80\x47\x03\x3c\xa7\xd1\x67\x3d\x7e\
+\x07\xb8\x63\x11\x7e\xd3\x19\xde\x88\xa6\x14\x46\x88\x20\xdd\xad\
+\x09\x88\x4c\x63\x66\x65\x6e\x09\xea\xe1\xad\xa6\xa0\x8b\x3d\x9c\
+\xb5\x35\x68\x67\xf0\x94\x94\x65\x17\x6a\x08\xc9\x85\xde\xee\x53\
+\xd7\x74\xd0\x18\xfc\x9c\xd7\xb2\x44\xe5\x7a\x4f\x51\x60\xac\xa5\
+\x4b\x08\xba\xc6\x36\x64\x3b\xc9\x2a\x2f\x8a\xd8\x39\x63\xe8\x39\
+\xc7\x0f\x1d\xee\x0e\x2d\x31\xcf\xd3\xe0\x36\xe4\xcc\xd7\xc1\x68\
+\xef\x1d\xd2\x5f\x5b\x05\xc5\x9e\xc7\x1e\xf7\x8e\x55\x8f\xdf\xd0\
+\x9a\xbb\x1e\x2f\xef\x87\x0f\xa0\x83\x84\x66\x5f\xf6\x5e\x3c\xc4\
+\x5a\xdf\xe1\x99\xe7\xaf\x73\xe6\xf1\x21\xdf\xfd\xe6\xb3\xdc\xbe\
+\xae\xe5\x5d\xd8\x11\x50\xa8\xe6\xc0\x5f\xca\x89\xea\x80\x99\xce\
+\x32\x33\x92\x42\x99\x6b\xb2\xd2\x2b\x49\x11\x13\x50\x5d\x88\x31\
+\x61\x55\xae\x7b\x55\xbc\x3d\x25\xd0\xd5\xde\x6a\x4f\x13\xd2\xbe\
+\x58\x51\xf7\xfe\x5d\x19\x17\x9a\x58\x7b\x32\x10\xe3\x8a\x7b\x7e\
+\xe9\x31\xf8\xd0\xe4\x13\x44\xb2\x93\x46\x6f\x5d\x40\x6d\xb1\x50\
+\x14\xe2\x9f\x4c\xff\x3f\x60\x39\xa3\x58\xd6\xc7\xc9\x3b\xf0\x50\
+\xc0\x63\x3e\xe0\x22\xfb\xac\xe4\x0b\x01\x95\xb5\x80\x4a\x01\x55\
+\x35\x0d\xc8\xab\x9b\x6d\x0f\x89\xe5\xe2\xd1\x21\xce\x57\x32\x0b\
+\x95\xe5\x81\x8b\xaa\x1b\x90\x57\x2f\x08\x10\xf9\xc0\x36\x9c\x38\
+\xc7\xcc\xcd\x95\xf5\xdc\x7f\xf5\x07\x3b\x47\xf2\x0c\x8b\xa7\x38\
+\x02\xc5\x58\xb3\x32\x85\xe3\x47\x5b\x16\xce\x24\xaa\xa5\x30\x77\
+\xdc\x12\x48\x2e\x81\xe4\x52\x96\xb2\x94\x84\xe7\xfc\x4c\x88\x8e\
+\x42\x29\x4f\xf0\x31\x1a\x30\xa8\x70\x40\x0d\x53\x29\x36\x6d\xc6\
+\x5b\x99\xe3\xbe\x99\xd6\x5a\x62\xb3\x19\xf8\x17\x3f\x84\x20\xed\
+\x1b\x03\xd3\x69\x04\x8d\x5d\x54\x17\x98\x4e\xa5\xde\x1f\xe0\xa2\
+\x47\xb2\xd4\x68\xeb\x67\xeb\x39\x6d\x12\xc3\xd7\x36\x80\x9b\x11\
+\xe8\xe9\xb8\xdd\x68\x85\xd6\xab\x58\xab\x05\xc8\x9c\x10\xe0\x50\
+\x93\x6a\xd6\x55\x75\xcc\xa9\x54\x2a\x44\x04\xcc\xba\xc7\x3f\x4d\
+\x4b\x02\xb3\x05\x8c\x1d\xce\xe2\x88\x41\x73\x6d\x28\xe6\x79\xe0\
+\x26\x1e\x07\x55\x8f\x57\xbf\x1b\xa8\xa7\x3b\x92\x9b\x78\x86\x18\
+\xd2\xb7\x23\x0b\xcf\x18\xfc\x13\xd4\xfe\x32\x91\x2c\x28\x79\xfe\
+\x1c\x70\x4b\x4a\x77\x5c\x04\x4e\x69\x4d\xed\x85\xbd\x44\x6a\x1d\
+\x22\xa0\x6e\x6d\x6e\xa1\x3d\xad\xbd\x3f\x8e\x66\xcb\x47\x04\xb0\
+\xe6\xf1\x09\x74\xa5\x3e\xea\x64\x20\xef\xc0\x53\x20\x1e\xd7\x97\
+\x3e\xad\x7d\x44\xdc\xc9\x8b\x36\x89\xd7\xe8\xa0\x2d\xff\xd1\xcb\
+\x1e\xf4\x3d\x5a\x67\x9d\x90\x05\x85\x55\x08\x3a\x10\xde\x02\x5e\
+\x92\x7b\x7a\x5d\xc3\x69\x0f\x27\xad\xe5\x53\xc0\xab\x2c\x66\xd1\
+\x4c\x95\xc3\x6a\x22\x38\xdd\x12\x4d\x28\x11\xca\x24\xaf\xd8\x71\
+\xe9\xbf\x71\x64\xdf\xe5\xbc\x00\x91\x33\x72\x9d\xfb\x80\xb3\x86\
+\x38\x52\xb3\x7c\x3f\x17\xf7\x49\xfd\x73\xc0\x23\x69\x23\x90\x33\
+\xd8\xa2\x03\xb6\x73\xd8\xbb\xe3\xbd\x5c\x53\x5d\x97\xf3\xdb\x32\
+\x2f\x42\x29\x44\x36\xe5\x02\x65\xb0\x25\xca\xb0\x52\xf2\xc3\x39\
+\x05\x45\x0f\xec\x3c\x5d\xff\x39\x00\xe7\xb8\x02\x0c\xa4\xfd\x0b\
+\x44\xaf\x74\x57\x80\xb8\xb4\xe9\x52\x5e\xef\x2a\xb0\x6d\xb1\xa9\
+\x9f\xef\x11\x89\xa6\x1c\x46\x13\xcb\xb5\x68\x04\xe8\xae\xc9\x38\
+\xbd\x22\x63\xcc\x51\x76\x6a\x56\x7b\x16\x63\x9c\x94\x04\xbf\x49\
+\xfc\x89\x86\x18\xac\x2f\x21\xd4\x80\xd6\xac\x7a\xcf\x46\x5c\xbf\
+\x43\x3d\x37\xbe\x52\x8e\x71\x57\x9e\xd9\x9a\x81\xa1\x84\x9d\xf6\
+\x04\x44\x3e\x23\xcf\x7c\x8f\x36\x4c\x5b\x61\xcc\x3d\x9c\xb3\xf2\
+\x6e\xa4\x71\x79\x98\x4c\x04\xb0\xa6\xbf\x41\x06\xe9\x84\x07\x20\
+\xfe\x58\xca\x52\x16\xd9\x8b\x80\xda\xa6\xb9\xca\x66\xc1\x96\xf7\
+\x4b\xc6\x4d\xa0\xb3\xb0\x60\x5d\x05\x38\x3a\x1d\x47\x55\x7d\x28\
+\x55\x2d\xea\x19\x48\x25\xc0\xb1\xa3\x54\x3e\xad\xce\x80\xac\xfa\
+\x83\x9d\xe5\xc0\xb1\x75\x1d\xa3\x2f\x00\xaa\x2a\x40\xa7\x39\xe7\
+\xa2\x2c\x83\xfa\x51\xef\xaf\x69\x20\x9e\xb3\xa3\xaa\x78\xb6\x87\
+\x6f\xb8\x98\x9b\x93\xf2\x65\x27\xe4\xb4\xbc\xe9\x7f\x47\xf6\xe5\
+\xc2\xe3\xee\xfb\xfd\x52\x96\x40\x72\x29\x4b\xf9\x78\x4b\x5d\x57\
+\x3a\x2a\xc5\xbe\x59\x35\x11\x6f\x22\x6a\x26\xa0\x55\xc2\x59\xc5\
+\x07\x19\x5a\x6f\x64\x90\x14\xa6\xe4\x9b\x0c\x21\xa4\xf8\x58\x69\
+\x50\xc9\xc7\xf8\x7d\x08\xe2\xb3\x54\xa0\x42\x68\x41\xa6\xd4\x5d\
+\x14\x00\xe9\x13\x3a\x11\x65\x35\x45\x9b\x1a\x01\x3c\x4a\x14\x5e\
+\x21\xf8\x60\x0f\x18\xe3\x88\x45\x8c\xa5\xcc\x06\x93\x89\x97\xba\
+\x93\x17\x69\xbd\x66\xef\x8a\xb2\x79\x02\x70\x4c\xa7\x9e\xda\x7a\
+\x94\x16\x13\x24\x46\x14\xe6\xeb\xb4\xb9\x92\x1d\x41\xbd\x05\xb7\
+\x6f\x75\xd8\xdf\x89\xc4\x32\x9e\xeb\xc0\x55\x09\x4b\x9d\x32\x1e\
+\xde\x06\xf6\x29\xcb\x40\x5d\x5f\x10\x90\x75\x8b\xc8\x16\xfa\x0c\
+\x31\x64\x72\x24\xcb\xe0\x59\xd0\xc2\xbb\xd3\xa0\x6f\x8b\xe6\xb6\
+\x80\x14\xe9\x16\x10\x90\x2c\xe1\xb9\x5a\x6e\xdf\x95\x44\x6f\x60\
+\x9d\x51\x90\x0f\x89\x5e\x9b\xdc\x93\x56\x11\xf3\xd7\x56\x32\x4b\
+\x40\x49\x08\x27\xb4\x66\x12\xe3\x5a\xfd\x98\xe8\xa1\x2c\x32\x2b\
+\xeb\x2e\xb0\x2d\x21\x83\xe9\xec\xfd\x39\x4b\x81\x91\xe7\x70\x8f\
+\x76\x20\x6d\x4b\x3b\x95\xf4\xf3\x08\xb8\xe3\x31\x7b\xe0\x2e\x47\
+\xd0\x57\x97\xc0\x7b\x05\x45\xc8\x98\x35\x8f\xd4\x65\x32\xd9\x92\
+\x7b\x5c\x25\x96\x57\xd9\x00\xad\x24\x84\x57\x42\x7a\x39\x11\xcb\
+\x96\xf8\x6d\x70\x2e\x86\x26\x39\x70\x04\x8d\x56\x1e\x7f\x92\x59\
+\x8f\x64\x7e\x0d\xdd\xd8\xd7\xb6\x03\x74\x17\x65\x29\x15\x14\xca\
+\x6a\x5b\xe0\xb3\x1c\xc9\x8c\xbc\x42\xc2\x76\x81\xa2\x03\x36\x81\
+\x72\x9d\x29\x99\x2a\x27\xd3\x28\xa0\xb4\xf1\xbc\x05\xe2\x91\x8c\
+\xa1\x73\x66\x45\x13\xce\x7b\xfc\x08\x78\x45\xc6\x53\xbf\xae\xb9\
+\xac\x35\xeb\xde\xb3\x27\x7d\x2f\x9e\xdc\x88\x10\xe5\x19\x1a\xa2\
+\xd7\xda\x0b\xd0\xbc\x03\x9c\xc7\x13\x70\x04\x4a\x15\x28\x7c\xc0\
+\xfb\x5a\xf6\xbb\x25\xc7\xac\xc6\x4a\x6b\x3e\xd5\x06\x0d\xae\x0d\
+\x7f\x55\xf1\x1a\xb5\x92\x4a\x3d\x86\x48\x5c\x65\xe5\xb9\x58\x8d\
+\xef\xfa\x58\xc2\x46\x4a\x9e\xe8\x67\xc4\xbb\xbf\x2f\xfd\x3d\x14\
+\x1d\x6d\x47\xee\x27\x81\xc4\x14\x6d\x10\xb4\x66\x45\x29\x2a\xa5\
+\xdc\x5d\xdb\x3e\x9b\x89\x3c\x2b\x75\x88\x22\x37\x94\x9f\xb1\xbc\
+\xe7\x62\x4c\x32\x13\x9c\x3b\x23\x60\x7c\x9a\x4d\x69\x4b\x79\x48\
+\xf9\x84\x91\xec\xe4\x33\x50\x66\xf4\xca\x5c\x7b\x33\x35\x8f\xe3\
+\xe7\x18\x76\x99\x56\xcf\xba\xf1\x1b\x02\x86\xaa\xea\xf2\x21\x7b\
+\xb0\xca\x32\x9e\xa1\xae\x21\x23\xe2\xfa\x68\xa4\x8c\xe1\xb4\x65\
+\x15\x10\xf3\x59\x28\xcb\x4a\xd5\x94\x94\x75\xfd\xd1\xc6\x8f\x97\
+\x41\x51\x47\x35\x62\xae\xbf\x1f\x04\x55\x1c\xdf\xb0\xfc\x7c\xa7\
+\x65\x6e\x5f\xb1\x70\x51\xc3\xe9\x59\xcb\x94\xce\xcc\xe1\xad\xb1\
+\x5a\x6b\x94\xf7\x84\x00\xab\x01\xd6\xb4\x18\xf6\x64\x06\x3f\x37\
+\x82\xb7\xea\xa8\x57\xe4\x11\x1a\xcb\x70\xfa\x25\x90\x5c\xca\x52\
+\x3e\xfe\xa2\xc4\x73\xe7\x16\x92\x06\xa8\xfb\xeb\x5b\x47\x05\x76\
+\xc8\xe1\x4a\x41\xf0\xb3\x09\x50\x3e\xdb\x27\xb4\xf3\x75\xe8\xd1\
+\x0b\x13\x26\x01\x7a\xd0\x9b\xc0\x04\x24\x9f\x2a\x94\x94\xc1\xe1\
+\x3a\x52\x13\xf2\xb2\x28\xe7\xfb\xa2\x04\x3b\xe0\x34\x06\x85\x56\
+\xed\x6a\xb0\xb7\x5f\xe3\xed\x40\x40\xe1\xcd\xcc\xbc\xa8\x9a\x42\
+\xc2\xe3\xa1\x8d\xb5\xa9\x1c\x58\xa7\x32\xb0\x92\x2f\x04\x0e\xd0\
+\xdc\xb9\xee\xd8\xbf\x5b\x31\x1a\x8d\x89\x9e\xad\x29\xa0\xbd\x6f\
+\x94\xdb\xf3\x18\xce\x50\xd7\x3d\xe0\x69\x51\x6c\x53\x91\xf5\x5d\
+\x51\x86\x43\xab\xe4\xfb\x77\x88\x79\x85\xb2\x8c\xe9\xc2\x7b\x7f\
+\x51\xa3\x6b\x8f\x7f\x5f\x14\x61\x70\x6e\x8f\x18\xfe\x7a\x51\x43\
+\xf0\xf1\x36\x2a\xe0\x86\x46\x3f\xe6\x13\x17\x50\xfc\xab\x89\x45\
+\xe3\x95\x6f\xf8\x5d\x38\xd7\x54\xc2\x8c\x68\xbf\x0f\x94\xde\x33\
+\xce\x16\xbe\x58\x83\xb2\xcd\x26\xf5\x40\x17\xef\x2b\x00\xed\xf5\
+\x71\x1f\x81\xf0\x76\xfb\xf4\xf4\x69\x22\x08\xcd\x07\x4a\x07\x45\
+\x9f\xc0\x2d\x0c\x5e\x6a\x50\x06\x70\x57\x45\xf5\xea\x4a\xdf\x9d\
+\xfb\x00\x44\x0e\x39\x0b\xef\x1f\x02\x57\x8c\xe1\x09\xe7\xfc\x45\
+\xdf\x82\xed\x4a\xa3\xc7\xde\x7b\x0b\x9c\x02\x6d\x70\x6e\x0f\x63\
+\x3c\xb8\x80\xf6\x35\x9e\xd3\x06\xb6\x03\xda\x78\xfc\x7c\xf9\x8f\
+\x52\x86\x69\x37\x29\x90\x07\x89\x09\x6d\x02\xd1\x11\x48\x0a\x88\
+\x4c\x8c\x8b\x8d\xb3\xc2\x84\x0e\xae\xf1\xee\xb6\xf4\x36\xad\x37\
+\x23\x31\xc9\xa4\x70\xd6\x0e\xd0\x31\x98\x15\x87\xdb\x44\xbb\x89\
+\x8f\xc6\x8a\x2b\x94\x38\x6a\x1e\x23\x86\x42\x07\xe5\xcd\x1b\xe2\
+\x7d\x94\x2a\xa8\x26\xc8\xe7\x74\x3e\x2b\x60\xad\xcc\x40\x7f\x4f\
+\xc3\xae\x37\xc9\x6b\x5f\xc8\x71\xde\x65\xeb\xaf\x01\xe7\xe9\x18\
+\x81\xd1\xd1\x03\xaf\x35\xe7\x7d\x2c\x83\xa3\xc1\x8f\x31\x7c\x1e\
+\x4c\x8d\x73\x27\x88\x11\x01\x57\x80\xc2\xc7\x3e\x4b\x20\xb1\x26\
+\xda\x84\x4e\x89\x41\x21\xbd\xb3\xef\xcc\x28\xa7\x75\x3d\x24\x1a\
+\x01\xa2\x17\x31\x8e\xd4\x61\x59\xb2\x97\x8d\xad\x7d\xda\x5a\x9b\
+\x2c\x78\x66\x03\x5a\xaf\x79\x7b\x9c\x73\x56\x3e\x1b\xa2\xd7\xda\
+\x00\x1b\xb7\x6f\xdf\xe6\xdf\xfd\xce\xff\x75\xee\xd9\xcf\x7d\x7e\
+\xf7\xd2\x93\x4f\x4d\xb4\x31\x4b\x70\xb9\x94\x45\xf3\x4d\xcd\x4c\
+\xf9\x98\x83\x71\x96\xf5\xfc\xa6\xfa\xc0\xc6\x0a\x78\x12\xf8\xe5\
+\xb9\x15\x53\xc9\xbb\xa5\xd2\x8c\xeb\x5b\xf0\x32\x53\x2e\xf5\x70\
+\x63\xf0\x47\x79\xfb\xd1\x60\xd4\x2c\x09\x75\x7d\xf0\xf6\x6a\xd0\
+\x7a\x1e\x44\x6a\xd0\x32\x15\x79\x1f\xc8\xee\x4f\xcb\x76\xff\xb0\
+\x78\x3a\x9d\xbb\x3e\xc4\xc8\xa8\x63\xe8\x53\xb3\xee\xb5\xeb\x58\
+\x71\xcc\xf2\x13\x3f\x03\x77\x37\x60\x7c\x12\xf6\x0d\xec\x7a\xb8\
+\x79\x30\xbc\xe1\x90\x6b\x9a\x2b\x5b\x9b\x1f\x37\x85\x9b\x7f\x02\
+\x7f\xe3\x0d\xf8\xb4\xcc\x33\x5a\xd6\xea\x7f\xbe\x04\x93\x4b\x20\
+\xb9\x94\xa5\x7c\x62\xc4\xbb\xe4\x91\xcc\xc8\x74\x90\xd0\x56\x02\
+\x2a\xc5\xb2\x22\x1e\x48\x71\x51\xc6\xfd\x54\xab\x11\x37\xd8\x33\
+\x85\xb2\xca\xf1\x41\xcd\xb4\x1d\xdb\x89\x3e\xcc\xe4\x0d\x2d\x5a\
+\x5a\xed\x90\x40\x64\xb6\x98\x87\x3a\x7a\x24\xcf\x12\xc3\x1a\xb7\
+\x64\xb2\xae\xb3\x05\xd9\x11\x42\x07\x1c\xe8\xe0\x1b\x2f\x54\x54\
+\x68\x07\xcc\x13\xb3\x79\x56\x30\xac\xe1\x5d\xcc\xbb\x52\x45\x80\
+\x90\x42\x28\xed\x42\xa5\xc2\xb9\x7d\x46\xa3\x04\x48\x9f\x26\x86\
+\x54\xae\x11\xc3\x2d\x9f\x40\xb3\x22\xc0\x69\x2a\x0b\x4a\x9f\xe8\
+\x0d\x4d\x0c\xea\xb9\xb2\x5a\x01\x1b\x92\x67\x99\x80\xa0\x13\x60\
+\xdc\x56\x2f\x14\x4f\x2d\x6d\xf9\x84\x7c\xae\x7c\xdc\xe3\x37\x05\
+\x24\x27\xe2\x9d\x0d\xa2\xb7\xf5\xdd\x6c\xb9\xdd\xa2\xf5\x72\x26\
+\x6f\xd0\xb5\xb8\xaf\x51\xe0\x9a\x50\xcf\x8c\x95\xe8\x8c\xf4\xc5\
+\x35\xb9\xb6\xa1\x5c\x57\x27\x12\x11\x04\x88\xb9\x89\x7b\x33\x8a\
+\x91\x52\x6b\x04\x89\x46\x76\x8d\xb7\x29\x11\x24\xbd\x4d\xcb\x1a\
+\x3b\x21\x5a\x88\x3b\x3c\x98\x87\xa8\x4b\xf4\x36\xdd\xa2\xb5\x2c\
+\x57\xce\xf1\xa6\xdc\xeb\x25\x79\x1e\xa7\x3d\xfe\xa4\x46\xdf\xf5\
+\xf8\x6d\x51\xc7\x36\xb4\x73\x5d\x0f\x03\xef\xa9\x80\x75\x87\x19\
+\x81\xeb\x32\x1b\x2e\x9c\xfa\x35\xe5\x83\x76\x66\x06\x82\xc1\xe0\
+\x84\xc5\xcf\x37\xfb\x75\x66\x43\xde\x1a\xd0\x76\x4c\x18\x54\xbb\
+\x72\x8f\xce\x60\x54\x16\x2e\xb5\x2a\xcf\x0a\x17\xfb\x64\x43\xee\
+\xa1\x70\xb8\x1d\x79\x66\xef\x0a\x30\x5a\xa3\xe6\x09\x03\x6b\x2e\
+\x7a\x17\x4b\x47\x78\x42\xc0\xd9\xdd\x78\x56\xa7\x01\x6d\x30\x21\
+\x86\x8d\xba\x1d\x62\xc8\xe8\xe3\xc0\x73\x32\x36\x8e\xf9\x94\x3f\
+\x18\x11\x5b\xc8\xf2\x19\x4f\xcb\xbb\x15\x43\x96\x6b\xef\xf1\x2e\
+\xe0\xad\x97\xd7\x74\x9f\xe8\xfd\x74\x40\x5f\x07\xd6\xbd\x77\xdf\
+\x90\x6b\xb6\x02\x26\x57\x80\x37\x81\xb7\xb2\x5e\x4b\x35\x5c\x93\
+\x91\x63\x24\x46\x95\x90\x69\x86\x09\x48\x1a\xe9\xaf\x35\xe0\x76\
+\x5d\xcf\xb0\xad\xbe\x48\x0c\x89\x0e\x87\x98\xad\x26\xb4\x04\x56\
+\x3b\x73\x00\xf4\x86\x8c\xbd\xc6\x9e\x75\xfc\xf8\x71\x8a\xb2\xf4\
+\x2f\x7c\xeb\x4f\x4f\xbf\xf0\xad\x3f\x65\xf3\xe4\xc9\xc9\xe7\xbf\
+\xfa\x53\x3b\x27\x4e\x9f\xa9\x97\xa0\x72\x29\x73\xf3\x74\x5c\x8d\
+\xba\x5d\xc5\x74\x1a\xe2\x64\x14\xd9\x9c\x8f\x9c\xb0\xba\x71\x59\
+\x9c\x4e\x99\x10\x23\x0a\xfe\x75\xb7\x8b\x93\x94\x0d\x00\xd5\xed\
+\xb6\x04\x5e\x33\xcb\xd3\x87\xe7\xb7\x7c\x04\x2f\xaf\x9f\xc1\x51\
+\xf1\x9e\xdb\xc9\x38\xb2\x59\x77\x55\x13\x3f\xd4\x4d\xe9\x28\x09\
+\x11\x0b\x2f\x81\x3f\xac\xc5\x23\x27\x7b\x35\xed\xa6\x33\xc9\x32\
+\x3e\xbd\xef\xa5\xb6\x00\xd5\x37\x86\xaa\xf5\x93\x75\xfd\xc4\x17\
+\xe0\xea\xb7\xe1\x73\x1b\x30\x3a\x93\x72\xe9\x3f\x1c\x4b\x83\xda\
+\x8c\x57\x96\xc8\xe4\x56\x65\x4e\x5c\x86\xbb\x2e\x81\xe4\x52\x96\
+\xf2\xf1\x97\xa4\x30\x39\xef\x0e\x9b\x24\xb3\xd9\xf0\x81\x6a\x0c\
+\x2f\xd8\x37\x1c\xbe\x9e\x85\x96\xc7\xd5\x42\xb0\x4c\x22\xe0\x98\
+\x1c\x68\x2c\x10\xd9\x53\xc7\xbe\x05\x2f\x61\x6e\x1f\x80\x0e\x93\
+\xa9\x43\x97\x21\x23\x88\xb5\x0b\x16\xd6\x18\x76\xe7\xf0\x68\x5d\
+\x70\xf3\x6a\x60\xb0\x53\x10\x6c\x97\xd6\x83\xa3\x88\x79\x5c\x9b\
+\xf2\x73\x5b\xce\x93\xc2\x5a\xce\x89\x62\x7c\x97\x18\xca\xd7\xc1\
+\x37\xde\x51\x2f\x20\xb2\x4f\xf4\xe0\x8d\xe6\xbb\x9e\x18\x96\x79\
+\xc7\x7b\x54\xa2\x1f\x8f\x65\x19\xfd\x44\xbc\x64\x13\x68\x72\x24\
+\xfb\x44\x8b\xf6\x6a\x1b\x72\xa3\x01\xbf\x9b\x81\xb4\xa0\x35\x03\
+\xef\xb9\x03\x14\x68\x1f\x68\x23\x96\x8f\xcb\xfd\xa4\x87\x50\x0a\
+\x70\x08\xb4\xde\xcd\x5b\x68\x56\xb3\x25\x7e\x0f\xd8\x42\x6b\x2b\
+\x5a\x4d\x52\xa8\xba\x12\x6f\x9b\x00\xf3\x9a\xf4\x41\x04\xbc\x21\
+\x6c\xd3\x32\xac\xd6\x19\x90\x4c\x4d\xbf\x22\xe7\xbf\x2c\xc0\xe4\
+\x65\xa0\xa6\x40\x15\x36\x16\xb9\x8f\x45\xae\x8b\xbc\x20\x75\x00\
+\xfd\x25\xf0\xa7\x98\xad\xff\xe5\x5b\x2d\x83\xb7\x88\x5e\xb1\x27\
+\x80\x8b\x68\x7f\x92\x58\x0e\xe2\x2e\xb0\x25\x89\x3c\x17\x05\x50\
+\x75\xc1\xd5\xf2\x7c\xe7\xd6\x1c\xad\xc1\x2b\x88\x3e\xb9\xec\xcd\
+\x58\xc5\xb1\xd9\x02\x2f\x7d\x51\xfa\xbf\x8d\x27\x8b\xec\x7e\x1a\
+\xe7\xce\xd1\x7a\x4e\x7b\xb4\xe5\x3f\xd2\xb3\x5e\x01\x94\x31\xdc\
+\x74\x4e\xc6\x46\x41\x8d\x65\x58\x14\x68\x6b\x9b\xfa\xa8\x5a\x80\
+\xe0\x09\xa2\xdb\xf0\x5d\xc9\x9d\x54\xe0\xd7\xb4\xe6\xa4\xf7\x3c\
+\x46\xeb\x7d\x1c\xb9\x08\x28\x7b\x06\xae\x3b\xad\x9f\xc6\xfb\xe3\
+\x72\x0d\x5b\xa0\x63\x1d\x4f\x2f\xec\xc2\x8a\x20\xa1\xcb\x8f\x09\
+\xe0\xba\x13\xcf\x69\xa4\x26\x2a\x3e\x92\xf1\xe0\xb5\x66\xcf\x47\
+\xb2\xa6\x52\x43\x4f\xbc\x86\xf7\x04\x00\xa6\x6b\xdd\x93\x36\x76\
+\xb3\x49\xc0\x8a\xa1\x25\xbd\x53\x37\xe6\x80\x5e\x1a\x97\x97\x68\
+\x73\x64\x93\x52\xb6\x0b\x84\x4d\x50\x3b\x33\xef\xfb\xa6\x82\x9d\
+\xfc\xf8\xf4\x7f\x4f\xee\x63\x37\x1b\x1b\x83\xb9\x77\x3f\x96\x2d\
+\x29\x4b\x7e\xf1\x57\xfe\xd6\x6d\xef\x9c\xba\x76\xe5\xbd\xde\x2b\
+\x2f\xfc\xe5\xe6\x1f\xff\xfe\xef\x9d\xd7\x5a\x87\xf3\x97\x1e\x1f\
+\x3e\xf7\xc5\x2f\xef\xad\x6f\x6e\xda\x25\xa8\x8c\xf2\x09\x0d\x6b\
+\x4d\x1e\xc9\xf8\x8e\x67\x88\x6f\x7a\x24\xaa\x61\x7e\xf7\x4a\x7e\
+\x06\xd3\xe9\xac\x41\x73\x3a\x05\x56\x57\x15\xc3\x61\x38\x04\x00\
+\x86\x0f\x07\x14\x3e\x3a\xb8\xcc\xef\x79\x9a\x7f\xd7\xef\x2b\x46\
+\xa3\x30\xd7\x25\x8f\x74\xad\xd3\xd9\x5f\x51\xfa\xfd\xd8\xe6\x68\
+\x14\x9a\x73\xf6\x51\xfd\x51\x9f\xd1\x81\x25\x36\x99\x51\x6b\x5d\
+\xd2\xa4\x55\x96\xea\xa3\x09\x6b\x0f\x32\xef\x24\x26\xf4\xf5\xe5\
+\x8c\xb1\x04\x92\x4b\x59\xca\x27\x42\x94\xe4\x12\xc6\xca\x15\x08\
+\xb1\x4e\xee\x92\xcc\x74\xb4\xc6\xc9\xa8\x84\x64\x47\x3c\x8c\x92\
+\x33\x99\x96\x8e\x80\x42\x65\x79\x92\x41\xb6\xab\x43\x66\xdf\x10\
+\x42\xfe\xb1\x2d\xed\xb1\x82\x82\x15\x18\x8f\xd3\x77\xda\xe3\x6d\
+\x2c\x45\xe1\x17\x2d\x06\x0e\xeb\x3d\xd3\x91\x6d\xa6\x91\x42\xe5\
+\x6d\xe6\x79\x95\xd1\x4b\x64\x70\xdc\xbd\x5d\xf2\xc2\x37\x07\x4c\
+\xa7\x5b\xf2\xfd\xa7\x88\xde\xa1\xe3\x32\x1f\x4d\x05\x08\x6e\x8a\
+\x52\x7c\x5c\x00\xe2\x63\xa2\x48\x27\x30\x31\x20\x0b\x65\xd1\x1a\
+\xeb\x3d\x37\x81\x5b\x5a\xb3\x39\x63\x61\x8e\x91\x3d\xb7\x88\x21\
+\x7e\x97\x5b\x27\x97\xd7\x02\x84\xa6\x68\xae\xe3\xc1\x39\x02\x5a\
+\x4f\xf1\xfe\x2e\x70\x3c\x66\x48\x9a\xe0\x22\x10\xda\x21\x82\x12\
+\x8f\x21\xf8\x58\xf9\xbd\x03\xac\x64\xf4\xe6\xa9\xae\xe0\x48\x40\
+\xa1\x52\xd0\x0d\xc9\x3b\x64\x8c\x25\x38\x83\xe7\x12\x9e\x0d\xb4\
+\xb6\xe0\x6b\xd0\x23\xf0\x4a\x72\xe8\x52\x78\xee\x05\xe9\xcf\x69\
+\x04\x4a\xfa\x54\xdc\x37\x92\x9c\x68\x4d\x25\x05\xeb\x57\xe5\xdc\
+\x15\xad\x27\xd6\x67\x4a\xd5\x6b\xa2\xf4\x9f\x91\x7e\x7c\x09\x4b\
+\x48\xa1\xae\xd6\x1e\xc0\xff\x67\xc0\x97\x02\x64\x57\x73\x30\xd9\
+\xa1\xa3\xe8\x54\x54\x74\xa0\xaa\x26\xc0\xeb\xc0\xbb\xde\xf3\x84\
+\xf4\xe5\x79\xe0\x8c\x90\xc5\xbc\x25\x7d\x16\x6b\x4a\x96\xa5\xa6\
+\xae\xe7\xc6\x92\x37\xa0\x2b\xf0\x85\x6b\x6b\x44\x1a\xe9\xd7\xd7\
+\xe4\x99\x2b\xf0\x01\x4d\x61\x3c\xa7\x5d\x02\x88\x11\x60\x77\x89\
+\x0c\xb4\xef\xc8\x31\x5f\x4f\xc6\x89\xf8\x78\x1a\xe6\xd9\x1f\x1a\
+\xc3\x9d\x26\xaa\xfc\x40\x81\xef\x62\x03\xec\x65\x69\xe3\x96\xf4\
+\xb1\xb6\xb6\x49\x92\xdd\xf7\x9e\x81\x9c\xef\x04\x70\x52\xa3\x4f\
+\xfa\x08\x6e\xad\xa6\xbc\xe3\x7c\x7d\x49\x47\x82\x9d\x7b\xf1\xbe\
+\xfd\x19\x8d\x8e\x91\xe6\x4a\x87\x18\x56\xa0\x9c\xdc\xd3\x35\x69\
+\x77\x33\xe6\x93\x56\x25\x93\x51\x29\x5c\x86\xc1\xf9\x86\x4d\x37\
+\x19\x1b\x12\x1b\xeb\x44\x14\xa8\x2a\x7b\x5f\x86\x59\x87\x26\x4f\
+\xe6\x84\x36\x5f\x73\x38\xf7\xee\xa6\xf3\xa7\x71\x66\xe4\x7d\x1a\
+\xc2\x22\xf7\xc1\xa1\x0e\x05\x2f\xe7\x19\x92\xe7\x56\x16\xf4\x89\
+\x84\x46\x9e\xb9\xf2\x24\xda\x98\x70\xe9\xc9\xa7\xc6\x97\x9e\x7c\
+\x6a\x5c\x57\x95\x7a\xef\xcd\x37\xfa\x3f\x7c\xed\x95\xf5\x6f\xfc\
+\xee\xef\x9c\x07\x78\xfc\xe9\x67\xf6\x3f\xfb\xe5\xaf\xee\x75\x7b\
+\x3d\xbf\x04\x95\x9f\x48\xa9\x9b\x79\x7d\x75\xc1\xc8\xbd\xaf\xac\
+\x12\x2b\xde\x34\x86\xb5\x79\xc3\xe6\x29\x86\xc3\xa7\xf8\x08\xd8\
+\x3f\x0b\x50\xf6\x40\x92\x77\xc1\x87\x5e\x9b\x71\x34\x0b\xe2\x8a\
+\x02\x85\x7d\xb4\xb3\x14\x14\x8a\xa2\x59\x0f\x02\x05\xaa\x18\x8d\
+\xb0\x45\x91\xce\x59\x03\x2f\x33\x62\x06\x44\xae\xb1\xa6\x06\x0c\
+\xe2\x7a\xbf\x06\x0c\xa8\x83\xf4\xed\x1a\xec\x7f\x14\x40\x52\xea\
+\x1f\x9f\xf3\x2d\xc9\x99\x5d\xbe\x36\x4b\x20\xb9\x94\xa5\x7c\xa2\
+\xc4\xc7\x42\x8d\x11\xfb\x09\xb8\x53\x2a\x33\x2a\xb6\xfc\x3b\xb2\
+\x4d\xcd\xa0\xc1\x90\xd5\x96\x6c\xcc\xa8\x29\x3f\x72\xae\x7c\x48\
+\xfc\xd3\xee\xe8\x73\x20\xd9\x27\x30\x92\x9d\xc6\x04\x18\xd3\xe9\
+\x10\xaa\xe8\xa7\xf0\x8d\x02\x7f\x50\x36\x22\x60\xf0\xb7\xb1\x96\
+\x86\xb5\xd5\x35\x8b\xc6\x59\xf9\x31\xa2\x0a\x5c\x07\xd6\x25\xf4\
+\xf2\x1e\xd3\xe9\x35\xba\x5d\xc7\x74\xba\x2e\xc0\xe3\xae\x00\xc4\
+\x7b\xb2\xf8\x9f\x07\x9e\x94\xa4\xfb\x91\x28\xc7\x89\x31\xf3\x2c\
+\xa8\x6e\xe4\x24\x89\x48\x21\xa6\x35\x62\x05\xb8\x9e\xf2\x5e\x72\
+\xd6\x8c\xb1\xb1\xbe\x65\x03\x38\xe3\x35\xb9\x26\x34\x66\x42\xf4\
+\x7c\xee\xca\x3e\x93\x08\x3b\xfd\x44\xce\x79\xcc\xc3\xd8\x40\x2d\
+\xde\xcb\x4b\xa0\xd7\xc1\xbf\x87\x63\x04\xba\x0b\xfe\x58\x04\xba\
+\x7a\x42\x24\x69\x11\xcf\x8e\x2e\xf1\x7e\x08\x74\x42\xf4\x92\xde\
+\x04\xba\x38\x06\x02\x08\xc6\x40\x25\xfb\x4c\x89\x21\xb3\x86\x18\
+\x46\x3c\xa0\xcd\x3a\xd9\x8b\x9f\x4d\x20\x96\xa1\x48\x04\x27\xfb\
+\xde\x33\x24\x11\x20\x69\xed\x25\xbf\xb2\x07\x3c\xdb\x85\x9b\x99\
+\x6d\x79\x97\x18\x02\xb9\x4a\x0c\x11\x76\x9d\x0e\x2f\x57\x11\x66\
+\x86\x4e\xcb\xcd\x97\x80\xd9\xb3\xb4\xac\x9f\x8e\xe4\x71\xea\x10\
+\xa8\x08\x95\x1c\x18\x61\x5f\x27\x82\x87\xaa\x7a\x8d\x18\xf2\xfa\
+\x38\xf0\x98\x86\xc7\x3d\x9c\xc1\xf0\x3e\x8e\x1f\x02\xf7\x0e\x49\
+\x30\x32\xd2\x6f\x9b\xb4\x8c\xae\xbd\xd8\x56\xe7\xdd\x78\x9e\x8e\
+\xa2\xaa\x6e\x18\xcf\x31\x17\xc1\x4f\xc2\x83\x86\xe8\x91\x7b\x33\
+\xb5\xa5\x35\x2b\xde\x37\xf9\x91\x5a\xfa\xeb\x87\xc0\x16\x55\x47\
+\x41\x15\xe8\xa0\x32\xbf\xa6\x02\x9e\x02\x7b\x0c\x98\x52\xf0\x2e\
+\x2d\x78\x4c\x20\x48\x67\xfb\x4e\xe4\x59\x1a\x1f\xeb\x7c\x5e\xd0\
+\xe0\x6b\xea\x01\x31\x69\x32\x11\xe5\x74\xe5\x9e\x46\xec\xde\x5b\
+\xe3\x5b\x7f\xb4\xce\x68\xb8\x42\x5d\x07\x0d\x13\x15\x07\xb0\x06\
+\xb4\xf6\xbe\xeb\x5f\xfd\xde\x65\x5e\xfd\xfe\x98\xe9\xa8\x27\x1e\
+\xd4\x4b\xb4\x9e\x95\x1d\xad\x09\x62\x34\x48\x94\xf8\x29\x94\x7b\
+\xde\x0a\x50\xc9\x3d\x5b\xda\xb0\x71\xbb\x40\x59\xaf\x98\x2d\xf4\
+\xed\x3e\x80\x42\x66\xb3\x9f\x36\x22\xc1\xfa\x32\x4b\x7a\x00\x00\
+\x20\x00\x49\x44\x41\x54\x36\x86\x80\xe4\xed\xf4\x21\x04\xea\xaa\
+\x52\x26\x12\x6c\xa1\x8d\x09\x65\xa7\x13\x9e\xf9\xec\xe7\x86\xcf\
+\x7c\xf6\x73\xc3\xba\xaa\xd4\xab\x2f\xbd\x78\xec\xed\xd7\x5e\xdd\
+\x78\xf7\xcd\x37\xd6\xbb\xbd\x9e\x7b\xf2\xd3\x9f\xd9\x7b\xf6\xb3\
+\x9f\x1b\x74\x7b\x2b\x9f\x28\xca\xff\x4f\xa8\x37\x32\x8e\xc3\x58\
+\x3d\x28\xbe\x9d\xc3\x0f\xd2\xc4\x30\x8d\x6f\xbf\x00\x48\x76\x81\
+\xbf\x0f\x7c\x11\x78\xe3\xc8\x66\x74\xcc\x57\x8c\xe9\x7f\xa9\x20\
+\xb0\x3e\x12\x7f\x1e\xb4\xc7\xf1\x91\x60\x1c\x0d\xca\xa7\x19\xc9\
+\x6b\xac\x7d\xf4\xd7\xc3\xce\x23\x51\x3b\xc3\x96\xbb\x42\x8c\x08\
+\xfa\x1f\xc5\x70\xd8\x3c\xaf\x01\x83\x76\x2c\xc5\x58\x84\x5a\x47\
+\xe6\x77\xf7\x45\x78\x7b\x8d\x07\x70\x25\x3f\xf4\x20\x01\x1f\xe7\
+\xe0\x1b\x32\x0f\x6e\x31\x9f\x4a\xb3\x94\x25\x90\x5c\xca\x52\x3e\
+\xce\xe2\x7c\xee\xb4\x23\xfb\xdf\x67\xfa\x6a\x68\xff\xe6\x09\x91\
+\x61\xfe\x98\x59\x9c\x37\x5b\x70\x4e\xcd\xfc\x47\xbe\x0c\x16\x05\
+\x8c\xba\x1e\x66\x43\x7c\xaa\x2a\x7a\xdb\xc4\x7b\x54\xce\x5d\xd4\
+\x06\x31\x37\x4b\xcb\xc4\x3d\x64\x32\x51\x6c\xdf\xd6\x6c\x6f\x19\
+\xf6\xee\x25\x05\xb2\x2b\xe0\x31\x0f\x79\x4b\xab\x70\xf4\x54\x4e\
+\xa7\x63\x01\x2a\x77\x89\x9e\x2b\x3f\xa7\x0c\xdf\xf1\x9e\xf7\x67\
+\xd7\x0e\x4e\x44\x45\x3e\x24\xaf\xe5\x80\x16\x55\x08\x33\x2b\xdb\
+\xf2\xff\x00\xe7\x2a\x01\x99\xc7\x44\xa9\x77\xd9\x71\x5e\xb4\x0e\
+\x27\xd7\xf1\xbe\x80\x47\x2d\x60\xe1\x1c\xd0\x35\x30\x70\xb8\x0a\
+\xad\x2b\x3c\x95\x00\x6b\xc9\x5f\xf4\xb7\x13\xf8\xd4\xde\x0f\xa5\
+\xbe\xa3\x27\xb2\xd3\x0d\x3d\x0c\x30\xa6\x8b\xf7\x05\x21\xc8\xb5\
+\xb9\x7d\x5a\xc6\xcb\x53\x18\x33\xc2\xb9\xe4\x55\xda\x96\x6b\xd8\
+\xa7\x25\xd9\x29\x68\x59\x31\x27\x68\xd6\xf1\x8c\x29\x8a\x01\xde\
+\x4f\x04\xf4\x56\x78\x5f\x53\x14\x13\xac\x1f\x6a\xed\x1f\x9f\x7a\
+\xbe\x0e\x7c\xb3\x2b\x39\x2f\x53\xa6\x57\x05\x48\x3e\x03\x9c\xa9\
+\x2a\x2e\xd0\xed\x5e\x85\x29\x19\x88\xd4\xc0\xe7\x89\x5e\x60\x27\
+\x0b\x75\xbf\x19\x3a\x15\xae\xca\x09\x15\xab\xe6\x57\x92\x11\xd1\
+\x8b\xf8\x8e\x87\xa7\x80\x27\x71\x7c\x0a\xb8\x88\xe1\x5d\x62\x7e\
+\xe5\xdd\x05\x9a\xd6\x9f\x93\x91\xe3\x94\x25\xa6\xae\xd9\x83\x2a\
+\xc8\xa0\x0c\xc0\xcb\x6e\x76\x98\x2f\x92\xca\x7b\xde\x31\x86\x52\
+\x6c\x35\x52\xe3\xb0\xb3\x05\x15\x55\xd3\x5e\xf3\xd2\xa4\x3c\x49\
+\x5d\x14\x5c\x51\x8a\x29\x35\x9a\x92\x50\xd7\x28\x0a\x02\xb6\x09\
+\x23\x4d\x3f\xf9\x2b\x76\x27\x82\x47\xd3\x01\xe7\x34\x28\xdf\x1a\
+\x2c\x46\xc0\x59\x8f\x0f\x4c\x46\x3b\x5c\x7b\x37\x91\x09\x95\x3e\
+\x82\x7f\x21\x27\xe2\x1c\xf0\x12\xe3\x61\x52\x9b\x1d\xf0\x3c\xe8\
+\x13\xe0\xff\xbd\x9c\x67\x4d\x42\x5b\xd3\x7d\xaf\x13\xbd\xd5\x2a\
+\xef\xb7\x83\xfa\x66\xc3\x0a\x7c\x94\xa4\x36\x3e\x28\xb8\x98\x3f\
+\x4e\x15\x31\xd7\xb5\x97\x01\x49\xe7\x9c\x63\xb8\xbf\x5f\x14\x65\
+\xe9\xcb\x4e\x19\xb4\x33\xcc\x83\xca\x2f\xfc\xe4\x4f\xef\x7d\xee\
+\xcb\x5f\xdd\x9f\x4e\x26\xfa\x95\xef\xbe\x70\xec\xad\x57\x7e\xb0\
+\xf1\xc6\xf7\x5e\xde\xec\xad\xf4\xed\x53\x9f\x79\x6e\xff\xe9\xe7\
+\x9e\x1f\x94\x9d\xce\xd2\x4b\xf9\x31\x96\x32\x56\x50\xac\x0e\xc1\
+\x0f\x0f\x3a\x46\x2b\xda\xb0\xed\x1c\x60\xfc\x32\x31\x7f\xd9\x3d\
+\x00\xf0\x68\xea\x68\x79\x3c\x39\x41\x0f\x73\x80\xf2\x68\x78\xf9\
+\x11\x18\xa2\x67\x16\x72\x3f\xf7\xd2\x6b\xd5\xa4\x63\x68\xad\xf0\
+\x3e\xe4\xdf\x69\x21\xf4\x89\xbc\x3c\x84\x06\x94\x7a\x40\xeb\x96\
+\x96\xc7\x6b\xb9\xb1\xe6\x6c\x27\x81\xaf\xb3\xbe\xfe\x16\x7b\x7b\
+\x93\x23\x2e\xaf\x29\x47\x74\x0c\x26\x1f\xc5\xfd\x77\x60\xbf\x80\
+\x6f\xda\x98\xc3\x9d\x0c\x8a\xcb\xfa\x92\x4b\x20\xb9\x94\xa5\x7c\
+\x72\xc4\x7b\xd7\x84\xab\x2a\x61\x2e\x0f\x2d\x5f\x4e\x43\x98\x33\
+\xa3\xa6\xc9\x32\xda\xae\xa6\xe9\x8b\x40\x50\x6a\x21\xee\x0c\xcd\
+\x3e\x1e\xe7\x3c\x5a\x69\x76\xf7\x76\xa8\xeb\x1a\xac\xed\x48\xe9\
+\x83\x79\xc5\xac\x87\xa3\x83\xab\x57\x88\xca\x60\x10\x10\x76\x4a\
+\x26\xec\x54\x24\xfd\x18\xd0\xe1\xdd\xd7\xbb\x5c\x7f\xe7\x1e\xd3\
+\xe9\x98\xba\x4e\x0b\xf8\x9a\x80\xa1\x3c\xaf\xca\xd1\x96\xaf\x78\
+\x26\x2e\x55\x7a\xd5\xe3\x57\x17\x5c\x83\x27\x2b\x2b\x50\x50\xe0\
+\xf1\x7b\x42\x8e\x73\x15\xcd\x29\x62\x98\xe1\x40\x02\x87\x12\x4b\
+\xeb\xfb\x02\x60\xcf\x62\xcc\x00\xa5\x2a\x67\x6d\xc0\xd0\xc7\x71\
+\x43\xb6\x6d\xd2\x02\xbe\xb4\x40\x4e\x30\x8c\x0a\xc7\xc0\x46\x03\
+\x74\x47\x8a\xda\xef\xab\x82\x01\x96\x29\xde\x27\x86\xca\x0b\x02\
+\x12\xf6\xe5\x1a\x21\x72\xe6\x0d\x69\xeb\x47\x0e\x3c\x7e\x20\x60\
+\xd6\xd2\xe6\xec\xed\x51\x14\x03\xac\x75\xc0\x45\xad\xe9\x7b\xe7\
+\x06\x44\xab\xed\x0e\x30\xc6\x30\xc6\xb1\x2f\xca\x50\x57\xc2\x57\
+\xf7\x41\x29\xb4\x3e\x8e\xf7\x0a\xd8\xc3\xda\x54\x5e\x65\x5b\x2c\
+\xc6\x15\xd6\xc6\x73\xc7\x10\xdf\xc7\x80\x72\xca\x34\x5f\xcc\x5f\
+\x95\x3c\xc4\xa7\x81\x4f\x31\x9d\x0e\xe8\x72\x37\xb3\x19\x7f\x9e\
+\x36\xbf\xee\x96\x00\xc9\x2f\x83\x0e\x1d\x0a\x5f\x51\xf9\x2e\x5d\
+\xd9\x7d\x0a\x5d\xe8\x4e\xbb\x31\x6f\x27\xe3\x68\x00\xc6\x5d\xf8\
+\xc1\x34\x12\xae\x3c\x0d\x3c\x8e\xe3\xe7\x80\xa7\x30\xe6\x0d\x21\
+\x34\x3a\x5c\x13\x79\x34\xee\xbd\x54\x07\x34\xbd\x39\x67\xa0\x3a\
+\xb3\x60\xbf\x73\xc0\xbd\xa2\xe0\xba\xb5\xdc\x88\x79\x90\x11\x2c\
+\x96\xb5\x00\x46\xdb\x80\xc7\x40\x51\x04\x31\xfd\xcf\x7c\x8e\x76\
+\x0a\x67\x45\xe5\x4a\x6f\xe1\x5d\xa2\x97\x74\x87\xd6\x1b\x9c\xbc\
+\xe7\xeb\xce\xf1\xd7\xe5\x7d\x1a\x02\x57\x94\xe1\x0d\xdc\x0c\xe3\
+\xe0\x49\xf0\x8f\xd3\x7a\x15\x43\xa3\x27\x96\xa5\xa1\xae\x47\x32\
+\x96\x55\xb6\x4f\x92\xbe\x80\xe3\x74\xad\xef\xce\x6d\x4f\x39\xcb\
+\x9b\xf2\xb7\x14\x3d\xe0\xed\x0f\xa0\x0f\x94\xd2\x76\xf9\x3c\x84\
+\x57\x44\xa9\xb3\xf1\xfb\x19\x20\x69\xad\x65\x77\xfb\x5e\x51\x94\
+\x65\x28\xcb\x32\x14\x65\xe9\xe3\xff\x9d\x50\x94\xa5\x4f\xa0\x12\
+\x60\x65\x75\xd5\x7d\xe5\x67\x7f\x7e\xe7\x4b\x3f\xf3\xf5\xdd\xbd\
+\x9d\x9d\xe2\xd5\xef\xbe\xb0\xfe\xda\xcb\xdf\xdd\x7c\xe5\xc5\xef\
+\x1c\x5f\x3d\x76\xac\xfe\xd4\xe7\x7f\x62\xf7\xe2\xe5\x27\xc7\x4b\
+\x50\xf9\xb1\x93\x50\xd7\xd4\x3c\x4f\xc5\x2b\x8f\xd4\x4e\x45\xeb\
+\x65\x4f\x80\xf1\xa7\x80\x67\xb5\xe6\x6d\xef\xf9\xac\x16\xc6\x6c\
+\x2f\xc0\x50\xcf\x81\x32\x3f\xc7\xbe\xe3\x67\xd0\x9b\x3f\x08\xec\
+\x3e\x80\x44\x80\x77\xa0\x85\x87\x01\xcc\x0b\x40\xa6\x9f\xbf\xe8\
+\x99\xef\xe6\xc9\x71\xbc\xce\xce\x25\xfb\x27\xff\x6b\x76\xd8\x0a\
+\x8a\x2d\x02\xe7\x19\x0e\x7f\x01\xf8\xfd\x43\x2f\x60\x6d\xcd\x33\
+\x18\x7c\xa4\x83\x64\x1a\x6b\x24\xff\x7d\x5a\x76\xe8\x29\xf0\x1b\
+\xa4\xb2\x58\x4b\x59\x02\xc9\xa5\x2c\xe5\x63\x0b\x20\x5d\x2c\x77\
+\xe1\xbc\x9b\x81\x4e\x0f\x50\xf8\x23\x73\x58\xde\x7f\xef\x10\x02\
+\xde\x7b\xea\xda\x32\x18\xec\x73\xeb\xd6\x2d\x6e\xdf\xbe\x4d\x08\
+\x81\x37\xde\x78\x83\xb7\xdf\x7e\x9b\x08\x10\x1a\xd0\x90\xcb\x2a\
+\x91\x68\xe6\x55\x51\x4a\x9f\x92\xb5\x65\x57\x00\x64\x6e\xc9\x1d\
+\x51\x55\x37\xa9\xaa\xeb\xd9\x45\x5d\x5c\x74\x49\x40\x17\xad\x3f\
+\x8d\xf7\xef\x1a\xc3\xb6\x73\xec\x28\x94\x26\x7a\xbf\x58\xa0\xe8\
+\x56\xc0\x7e\x51\x80\xb5\x36\x68\xcd\x58\x43\xd7\x47\xf8\x67\x05\
+\x44\xed\xdb\xb6\xfd\xa1\x58\x43\xd7\x88\x04\x2c\xfb\x8d\x42\xe1\
+\x58\x95\x76\xcf\x02\x53\x4a\x06\x50\x7a\xea\xfa\x1e\x5a\x5f\xc5\
+\xfb\x0a\xc7\xd0\x26\x8f\xa4\x67\x4b\x7a\x7b\xc5\xda\x06\xd4\x95\
+\xc4\xb0\xcd\xbe\x80\xbd\xe4\x25\xfc\x14\xd1\x53\x3a\xa6\x09\x43\
+\x6d\xd8\x51\x07\x05\x85\xb5\xd8\x6d\x1d\xeb\x55\x8e\xd1\x7a\x9f\
+\x68\xa9\xdd\x96\xd0\xd4\xbc\x64\xc9\x9a\x71\x4c\x1c\x0c\xd0\xda\
+\xe1\xfd\x19\xef\xb9\x01\x0c\x28\xad\xa2\xe6\xf6\x5c\xb8\xef\x50\
+\xee\x77\x8d\x36\x57\x6d\x0a\xec\x62\xcc\x2a\xce\x55\xf3\x5a\x8a\
+\x8b\x64\x3b\xc9\xf3\x58\x33\xe5\xdb\x72\xed\x17\xe4\x27\x95\x4c\
+\xf9\x1e\x0d\x5b\xab\xf7\x15\x31\xe0\x79\x86\xf4\x62\x9a\x11\x42\
+\x4c\x0f\x2c\xf6\x48\x5f\xbc\x04\xbc\x49\x51\xbc\x86\xb5\x63\xf1\
+\xbe\x3e\x9a\xc4\x12\x16\x8f\x02\x22\x0c\xe8\xcd\x02\xfd\xb6\xb1\
+\xf6\xa6\x9d\xf5\x38\xea\xba\xf5\x3c\x9a\x06\x90\x59\x1b\xb7\x17\
+\xc4\x32\x1e\x36\x7a\x3c\x5d\x9b\x17\x9b\x93\x11\x8d\x69\x2d\xf3\
+\x57\x69\x59\x7e\x71\xae\xa8\xc0\xde\x16\x20\xe8\x81\x13\xce\xb1\
+\x45\x89\xa5\xce\x00\x63\x6c\xf3\x8c\x8e\xcf\x76\xec\xe3\x73\xe9\
+\x50\xd7\x45\x66\x98\x69\x99\x6c\x67\xdf\xb5\x1d\xe9\x7b\x25\x8f\
+\xa2\x3b\x77\xff\x12\x8e\xdd\x94\xee\xf0\x32\xc6\x3b\x0b\x7b\xeb\
+\x34\x8a\xad\xd3\xc4\x08\xb2\x19\xe9\xa4\x9f\x57\xda\xf7\x3f\x81\
+\x53\xa9\xe1\xd7\xf3\x30\x49\x40\xb2\xec\x74\xba\xa1\x28\x0a\x5f\
+\x76\xbb\xbe\x28\xcb\xa0\xb5\x0e\x65\x59\x86\x4e\xaf\xe7\xb5\x36\
+\x61\xde\x5b\xb9\xbe\xb9\x69\xbf\xf6\x4b\xbf\x7c\xd7\x3b\x77\xef\
+\xde\xd6\xed\xf2\x95\x17\x5f\xd8\x78\xe9\xcf\xff\xbf\x93\x2f\x7e\
+\xfb\x9b\xea\xf8\xa9\x53\x93\x4f\x7d\xfe\x27\xf6\xce\x5f\xbc\x34\
+\xfd\xb8\xe4\x53\x7e\x82\xc3\x5a\x93\x58\x5e\x79\xe4\x32\x0e\x39\
+\x7b\xb5\x93\x79\xff\x2b\xa0\xef\x78\xef\x57\x88\x39\xed\xab\xb9\
+\x57\x6f\x11\x18\x8c\x73\xad\x9e\xab\xd0\xf4\xc1\x0d\x5c\x90\xca\
+\x65\xa4\x73\x7e\xf0\xf6\xb4\x46\x35\xc4\xe0\x8f\x42\x39\xeb\xb9\
+\x2f\x28\xd6\x50\xfa\x40\x57\xa3\xdf\xf6\xce\x7d\x1a\xf8\x81\x18\
+\x9e\x0e\xca\x60\xe0\xf8\x88\xeb\xc6\x16\xb0\xef\xe3\xbc\x7a\x43\
+\x0c\x56\x89\xc9\x7a\x29\x4b\x20\xb9\x94\xa5\x7c\xbc\x45\x1b\xb1\
+\x7b\x5a\xd7\x44\xa8\x2a\x49\x78\x0c\xf2\x77\x26\xbf\x31\x64\x81\
+\xa9\x31\x61\x92\xa6\x48\x48\x2a\xed\x21\x84\x3b\xc9\xa5\xe9\x9c\
+\xe3\xca\x95\xf7\xf8\xe1\x0f\xdf\xe6\xf6\xed\xdb\x58\x6b\x31\x46\
+\x53\xd7\x96\x6e\xb7\xcb\xf6\xf6\x36\xdd\x6e\x17\xe0\x86\x91\x82\
+\x76\x91\x7b\xc6\x80\x71\xe0\xd8\x23\xe6\x8f\x8c\x45\x21\xdc\xa6\
+\xad\x1d\x39\x2f\x89\xd4\xc0\x66\x8b\xe5\x3a\x6d\x89\x89\x54\xab\
+\xef\x38\x70\x0a\xef\x5f\x01\x5e\x96\xb0\x43\x54\xe1\x56\xa5\x48\
+\x60\x02\x8f\xeb\xf2\x73\x3c\x2a\xdf\xe5\xc0\xda\x3a\x00\x41\x6a\
+\x30\x3e\x9e\x29\xce\x03\xf2\x42\xe8\x51\xd1\x7e\x42\xae\x37\x6d\
+\x9b\x76\x3a\x50\x55\xd4\xc0\x69\xb4\xde\xc6\xfb\x7b\xd4\xec\xd3\
+\xad\x63\x68\xab\xf7\xc7\x74\x4c\x30\x7c\x03\xd8\xef\x74\x30\x55\
+\xc5\x44\xc0\x99\x01\x06\x5d\xa8\xa6\x51\xe9\x16\x16\xd5\x14\xda\
+\xca\x3e\xd1\x73\x97\x40\x53\x2a\xcd\xb1\x96\x94\x79\x15\x93\x4c\
+\xa6\xde\xb3\x02\xdc\xa6\xaa\xd2\x71\x56\xee\x67\x24\xca\xfe\x09\
+\x62\x94\x6e\x04\x89\xde\xa7\xfe\x1b\x00\xfb\xd4\x28\x60\xc5\x7b\
+\x12\xc3\x6c\x02\xa4\x64\x20\x76\x28\x80\x60\x8a\x73\x9b\x40\xe8\
+\xf5\xf0\x93\xc9\xcc\xc2\xee\x3a\xf0\xfd\x2a\x02\x89\x67\x80\xbd\
+\x0e\xbc\x5a\xc5\xbc\xc8\x14\x0e\xfa\x7d\x5a\x86\xd0\x14\xc6\xe9\
+\xa0\xe7\x7b\xbd\x49\x3c\xe9\xc3\x05\x2d\x0d\xb0\xf6\xf5\x1e\x1f\
+\x52\xac\xd3\xa3\x17\x73\x33\xe0\xef\x59\xfc\xbe\x8d\x63\x58\x1f\
+\xf2\x33\x1b\xd6\x5a\xa2\x09\xe9\xb3\x4d\xdf\x47\xaf\x47\x59\xae\
+\x53\xd7\xab\x19\x10\x3c\x0f\x9c\x33\x86\x97\x9c\x6b\xb2\xbd\x02\
+\x58\xad\x61\xdb\xc7\xf3\x76\x35\xda\x79\xfc\x80\xd9\xd2\x70\xa7\
+\xe4\x1d\xe8\x7b\x18\x6b\xcd\x58\x34\xbc\xae\xfc\xf4\x64\x9f\x15\
+\x31\xee\xf4\x1a\xde\xc2\x3d\x8a\xcc\xa8\x52\xd2\x86\x9a\xe7\x52\
+\x09\xb8\xad\x17\x80\xbf\x4c\x7f\x14\x4d\x75\x2b\xfe\x5a\x65\x55\
+\x0d\x19\x06\xf9\x9b\xf4\x87\x74\x5c\x0e\x24\x8b\x16\x48\x4e\x7c\
+\x97\xae\xb7\xd6\xb2\xbf\xb3\xd3\x31\x45\xe1\xcb\x4e\xc7\x17\x9d\
+\x22\x94\x45\xc7\x17\x45\x19\xca\x6e\xd7\x17\xe3\x71\x04\x98\x65\
+\x19\x8a\xb2\x13\xb4\xd1\xa1\x94\xbf\x09\x58\x9e\x38\x7d\xa6\xfe\
+\xb9\xff\xe4\x6f\xdc\x01\xb8\x76\xe5\xbd\xde\x1b\xdf\x7b\x79\xfd\
+\x5b\x7f\xf8\x07\xe7\x94\xd2\x9c\xbb\x74\x69\xf0\xd9\x2f\x7f\x65\
+\x77\xf3\xc4\xc9\x25\xf3\xeb\x5f\x7d\x09\x1f\x62\x3b\x86\x18\xd2\
+\xda\x05\x75\x85\x18\x81\x72\x1b\xb8\x72\xbf\x98\xd4\xe4\x85\xf4\
+\x47\x83\xc3\x07\x07\x7e\x3e\xad\x89\x3e\xb4\x61\xf0\x0f\x11\x18\
+\xab\xb5\x6a\x4b\x36\xfa\x47\xad\x59\xa2\x1e\xe2\xcc\x6b\x40\xe1\
+\xf1\x03\xad\xd9\xf0\x9e\xff\x88\x18\xe9\x50\xdf\x1f\x9a\x7e\x44\
+\xba\x54\xcc\x47\x4f\x1e\xe7\xe5\xfb\xbe\x04\x92\x4b\x59\xca\x27\
+\x43\x94\x90\xa9\xba\x6c\x01\x98\x2f\xf9\xd1\x40\xc9\x20\x60\x31\
+\x23\xe0\x99\x49\x9d\x9c\x93\xe1\x70\xc8\xed\xdb\xb7\x79\xfd\xf5\
+\xd7\xb9\x72\xe5\x0a\xab\xab\xab\x9c\x38\x71\x82\x6e\xb7\x8b\xd6\
+\x1a\xa5\x14\xd6\x5a\xb6\xb7\xef\xd1\xef\xf7\x01\x6e\x3a\x63\x14\
+\x0e\x1c\x2e\x18\xe3\x54\xe2\x00\x32\xb0\xee\x62\xe8\xdf\x9e\x28\
+\x9c\xe1\x08\x7b\xe6\x1a\x6d\xed\xc6\xe3\x44\x0f\xa6\x93\xff\x4f\
+\x8a\x22\x9b\x4a\x59\xdc\xeb\xc2\xfe\x34\x56\xc5\x0a\xd6\x36\xc7\
+\x3f\x23\xc7\x3b\x39\xe7\x48\xc3\xa8\xec\xd6\x83\xe9\x94\x04\x9d\
+\x52\xc8\xec\x2e\xad\xe7\x6f\xbf\xd7\x03\x01\x4a\x03\xad\xb9\xe3\
+\x3d\xef\x65\x00\x6c\x12\x89\x61\xd8\x06\xae\xe1\xfd\x0d\xc0\xae\
+\xb0\x32\x18\x4f\xc7\xae\xa0\x70\x16\xdb\xf3\x91\xec\x65\x1f\xd8\
+\xaf\xaa\x58\x48\x9e\x78\xff\x3b\xc0\x60\xda\x86\x9e\xf6\x88\x00\
+\x2c\xe5\x59\x0e\xe5\xfb\x93\xb4\xe1\xae\x3b\xb4\x54\x7d\xc3\x3a\
+\xde\xd3\x86\x28\xd8\x6f\xd1\xe6\x67\x5e\x10\x65\x3b\x91\xe7\xdc\
+\x92\x3e\x1a\x65\xa0\xf4\xa6\x6c\xdb\x97\xe3\x3d\x2d\xed\x79\x7e\
+\xfe\xc4\xb0\x3a\x90\xbe\x1e\x11\x43\x5b\xbf\x36\x99\xf0\xc7\xf3\
+\xcf\xaf\x8a\xc7\x7f\x1f\xd8\x40\xeb\x4f\x57\xde\x9f\x97\x7d\xfa\
+\xa2\x64\xbd\xd6\x00\xc8\x46\x6b\xc1\xc3\xc4\x4d\xee\x83\x04\x57\
+\x58\x51\x63\xc6\x0b\x6b\xd0\xa8\x15\x58\x19\xb7\xf1\xc0\x3f\xca\
+\x57\xd1\x60\x70\xb8\xbe\x80\x78\xdd\xa1\xa3\x03\x41\xd7\x65\xad\
+\x4b\xd0\x75\x8d\x2a\x33\xef\x64\x51\x50\xda\x3a\x85\xbf\x36\x20\
+\x32\x8d\x95\xb3\xd4\xf5\x67\x80\xcf\x00\x6f\xa2\x39\x89\x67\x0f\
+\xd8\x75\x8e\x6d\x66\x6b\x7f\x6a\x61\x1b\x7c\x0c\x38\xe6\xf1\x7b\
+\xb2\xbd\x55\xca\xca\xf2\x2e\x75\x7d\x5d\x94\x35\x2d\xc6\x03\x45\
+\x5b\x23\xb3\x07\x4d\x39\x90\x0a\xe8\x66\x67\x98\xf7\x2a\x96\x0b\
+\x80\x64\x39\xa7\x0c\xeb\xac\x5d\x51\x0c\x8a\x2f\x58\xec\xc5\x7c\
+\xec\x08\x78\x64\xc8\x30\xbd\x5f\xdf\xcb\x80\x6a\x58\x01\x35\x8e\
+\x9f\x93\xb1\xc7\x03\x7e\xca\xd4\xa7\x1c\x49\x53\x14\xa1\x2c\x4b\
+\x6f\x8a\x22\x98\xa2\xf0\x45\x51\x84\xb2\xd3\xf1\xa6\x28\x42\xa7\
+\xd3\xf5\x45\x59\x04\x53\xa4\xb0\xd7\x36\x04\xb6\xf1\x56\x6a\x13\
+\x8c\x31\x3c\xf6\xf8\x13\x93\xc7\x1e\x7f\x62\x02\xf0\xee\x9b\xaf\
+\xf7\x5f\x7b\xe9\xa5\x8d\x6f\xfc\xee\xbf\xbe\x60\x8c\x09\x67\x2e\
+\x3c\x36\xfa\xec\x97\xbf\xba\xfb\x57\xad\x9c\xc8\xd2\x1b\xf9\x91\
+\xc8\x7f\x4a\xf4\x48\xbe\x9c\x95\x5e\x42\xa3\x83\x7f\x28\x20\xa6\
+\x15\xda\xcf\x43\xa5\x30\x87\x6e\xd4\x61\x30\xca\xb7\xf9\x96\x61\
+\x36\xdf\xf2\x21\xae\x21\x1a\x17\x63\x38\xaa\x7f\x74\x70\xdb\x92\
+\x17\x68\xe5\x0f\x50\x19\xcc\xec\x97\xb4\x8e\xca\x7b\xde\x04\x3e\
+\x07\xfc\xc7\xc0\x1f\xfc\x28\x1e\xa8\x6b\x8d\xa0\x67\x68\xf3\xc0\
+\x97\x58\x66\x09\x24\x97\xb2\x94\x4f\x8e\xc4\xf2\x1f\x2d\x32\xf4\
+\xe2\x71\x4c\x2c\xad\x09\x75\xc6\xf2\x7a\xa1\xf1\x40\xe2\x1b\x7f\
+\x24\x0a\x85\x0f\x81\xba\x9e\xf2\xee\x7b\xef\xf1\xc3\x37\xdf\xc2\
+\x05\xcf\xe6\xc6\x71\xbe\xf4\xa5\x2f\x53\x94\x26\x5b\x59\xe2\xda\
+\x52\xd7\x35\xfd\xd5\x55\xd6\xd6\xd6\x00\x6e\x36\xdc\x97\x90\xff\
+\x8b\x8b\x8a\xe1\x53\x1c\xcd\xb8\xa6\x89\x5e\xb4\xa4\x98\xde\x25\
+\x7a\x47\x26\xc4\x70\xcf\x7b\xa2\x20\x5f\x11\x25\xf9\x0c\xb1\x8c\
+\xd7\xbe\x34\x9b\x3c\x5d\x09\x1c\x25\xa5\x38\x00\xab\xca\x30\x9e\
+\x4e\x25\x97\x31\x82\x97\x5d\xe0\x3d\x39\x47\x0a\xcb\xdb\x17\x60\
+\x13\x80\x91\xf7\xec\xd0\xe6\x65\xed\xd3\x86\x8c\x0e\x75\x24\x39\
+\x39\x0f\xbc\x3f\x66\xbc\x0f\x78\x8b\xbd\x2b\xd7\x17\x8a\x82\xb1\
+\xd4\x13\x4c\x4c\xb3\xb7\x69\xbd\x9b\xa9\xf8\xfa\x93\xa2\x20\x4f\
+\x69\xf3\x2c\x9f\x26\xe5\x59\xd2\x1c\x7f\x1e\x24\x24\xb5\xad\x79\
+\xb5\x95\x81\x3f\x2b\x7d\xb3\x0b\x4c\xba\x5d\x26\xd3\x69\x83\xaf\
+\x12\x91\x50\xdd\x00\xd2\x67\x9e\x19\xf3\xd6\x5b\x23\xb9\xf7\x8e\
+\x9c\x2b\x85\x4f\x76\x89\x9e\xa9\x1a\x18\x19\xa8\x5d\x87\x09\x15\
+\xdf\x35\x50\x3a\xf8\x99\x3e\xfd\x6f\x8d\x18\xcd\x2b\xd4\xd7\x80\
+\x1f\xe0\xfd\x67\xe5\x73\x5f\xda\x59\x91\xf3\x4e\x00\xa7\xbd\x0e\
+\x1e\x1f\x7a\x3d\xbc\xd6\xf8\xd1\xe8\x68\xeb\xaf\xea\x8f\xd5\x61\
+\x25\xc6\xc6\x47\x20\xc8\x7e\x3f\x0e\x52\x69\x5f\x09\x5e\x0f\x7d\
+\xfa\x2a\x36\x27\xb5\xcc\x80\xfe\x28\xfe\xba\xdf\xb5\x1c\xa1\x5c\
+\x05\x87\xdb\x25\x7a\x84\x2f\x46\xed\xb2\x8a\xfb\xd5\xf1\x35\x33\
+\x2d\xb2\x4b\x76\x1d\x23\x7d\x3d\xc0\x18\x85\x73\xa5\x46\x9f\xf0\
+\xf8\x3b\x44\x2f\xfa\x13\xcd\x98\xf6\x4d\xe9\x93\x94\x07\x99\x03\
+\xc9\x54\x2b\x55\xc9\x33\x18\x1e\x00\x92\x75\x9d\x88\xa1\xe6\x15\
+\xd6\x04\x24\x6b\x19\x0b\x29\xb4\x35\x07\x8a\x5d\x19\x8f\x09\x54\
+\x0e\x7a\xd0\x9b\xcc\xe6\x2b\xaf\xc8\x3e\x29\x12\xa0\x90\xb1\xd8\
+\xcd\x4c\x5a\xeb\xcc\xab\xcd\xb3\xfd\xd9\x07\xb4\x31\x74\x9c\x8b\
+\x40\x72\xdc\x9e\xb3\x28\x29\x3b\x75\x59\x7b\xea\x08\x26\x9d\x73\
+\x4c\x46\xa3\x42\x17\x26\x54\xc6\x04\x63\x8a\x08\x26\x8d\x09\x8d\
+\x97\x32\x03\x95\x45\x51\x86\x4e\xb7\xe3\x73\x50\xa9\xb5\x3e\xe8\
+\xad\xd4\x26\x5c\x7a\xea\x99\xd1\xe5\x67\x3f\x3d\x72\xce\xf1\xc3\
+\x57\x5f\x59\x7b\xed\xe5\xef\x6e\xfe\xd1\x6f\xff\xab\xb5\x6e\xaf\
+\x67\xcf\x5d\xba\x34\xba\xfc\xec\xa7\x0e\xe5\xff\xec\xaf\x1d\xb3\
+\x6b\xeb\xeb\x4b\xc6\xc7\x8f\xa7\x7c\x91\x18\xf6\xf8\x17\x40\x2d\
+\xd6\xbd\x09\x30\xf1\xf8\xe1\x83\x00\xc0\x19\x38\xe5\xef\x03\xd2\
+\x0e\xdb\x1e\x49\x6f\xd2\x9a\xa9\xfd\xfc\x7e\xed\xf6\x07\x45\x80\
+\x6a\xd1\x39\xb4\xe4\x35\xfa\xc3\xe7\x40\xb5\x68\x5e\xf4\x33\xcc\
+\xec\x9e\x05\xe0\x38\x85\x09\x4f\x64\xee\x79\x45\xd6\xf8\x57\x65\
+\x4d\x9e\x39\x62\x0a\xea\x26\x6c\xac\x44\x8b\x9b\x53\xe2\x7d\xb5\
+\x44\x56\xb2\xfc\x4c\x21\xce\xb5\x41\x16\x3e\x5d\x46\x9a\x9f\x43\
+\x65\x0c\xc5\x3e\xec\x28\xf8\x3d\x5a\x06\xd9\x82\x23\x6a\x14\x2d\
+\x65\x09\x24\x97\xb2\x94\x8f\x93\xc4\x89\x3b\xe5\x48\xce\x13\xb0\
+\x66\x1a\xa3\x6a\x70\x66\x5e\x23\xb2\x05\x86\xce\x59\x5e\x7d\xe5\
+\x35\xf6\xf6\xf6\xd0\x46\xf3\xf4\xd3\xcf\xd0\xeb\xaf\xa0\x55\x0b\
+\x34\x53\x20\x6c\xaa\x1e\x52\xd5\x35\xab\xab\x6b\x2d\x90\x9c\x93\
+\x95\x15\x18\xc7\x5a\x92\x9b\x1a\x7d\xd3\xc7\x5a\x82\x8b\x00\xe4\
+\x49\x51\x86\xdf\x03\xfe\x83\x00\xae\x04\xda\x2e\x89\x42\x7a\x93\
+\x83\x34\xb4\xc9\xbb\x96\xf7\xc7\x1d\xf9\x09\xb3\x60\x9b\x29\x9c\
+\x1f\xc0\x8d\x3c\xef\x2c\x45\xe2\xa6\x9c\xc8\x41\xd6\x83\x13\x51\
+\x62\x2f\x08\xa8\x1d\xc1\x57\x26\xf0\x9d\x00\xd4\x1e\xd6\xd0\xec\
+\x13\xf3\x12\x47\xb4\x75\xf9\x4a\xe0\x98\xb5\x0d\xa3\xab\x91\xfb\
+\xe9\xd2\x32\xb8\x26\x70\x77\x43\xb6\xa7\x70\xd4\xe4\xa9\x4c\x09\
+\xff\xa9\x06\xe4\x6d\xa2\x87\x31\xd5\x44\x1b\xd1\xe6\xed\x58\x5a\
+\x4f\xe2\x39\x20\x48\xd1\x6c\x45\x0c\x25\x4d\x6b\x6c\x5f\xee\xe5\
+\x26\x6f\xbd\x95\x68\x7e\x8f\x93\xc8\x5e\xda\xfe\x5a\xa3\xf5\xe6\
+\x56\x0e\x2c\x15\x0e\x18\x38\xf8\x33\xe0\x6b\x23\x46\x5f\x03\x5e\
+\x5c\x61\xc5\x8e\x19\xbb\x0c\xb4\xbc\x2c\xe7\xfa\x29\xe0\xd3\xc0\
+\x1f\x91\xbc\x65\x6b\xbc\x59\x4e\xf1\x75\xed\x03\x10\xc4\xeb\x7b\
+\xdf\x30\xa2\xd1\xe8\xf0\x6d\x59\xcd\x31\xd6\xd6\x50\x39\x27\x43\
+\x3a\x6e\xad\x79\xa8\x02\x1f\x73\x54\x3a\x1a\xb5\x5b\x46\x8f\xfc\
+\x2e\xbe\xc0\x21\x8c\xa7\x6e\xa1\xf1\x27\x7a\xde\x3b\x70\xa7\x32\
+\x26\xe0\xdc\x86\x47\xed\x88\x92\x7a\x4f\x6b\x2e\x4a\xd9\x99\x40\
+\x5b\x0e\x43\xd1\x7a\xe3\x93\x0c\x89\xa4\x50\xa9\x84\x87\xcd\xc6\
+\x4d\x12\x2b\xdb\x8e\x11\xbd\xd9\x56\xc6\x4b\x87\x96\xe0\x26\xc8\
+\xb6\xfd\x39\x20\x99\x0c\x01\xa9\xcc\x8c\x9d\xcc\x7a\x29\x13\x90\
+\x34\xd9\x38\x24\x33\x4a\x48\x1f\xb8\x62\x0e\xc4\x2e\xd2\x1d\xba\
+\xce\x2d\x0e\x6d\xad\xa9\x4b\x01\x91\xa1\x01\x92\xe3\x51\xa1\x94\
+\xc6\x14\xc6\xeb\xd2\x84\x52\x75\x82\x32\xca\x9b\xc2\x84\xa2\xec\
+\xf8\x04\x2a\x8b\xa2\x08\xa6\xd3\x09\x65\x03\x30\xcb\x50\x14\x85\
+\x37\xd1\x43\x19\xff\x37\x86\xa2\x2c\xbd\xd6\x86\x1c\x58\x3e\xfd\
+\xdc\xf3\x83\xa7\x9f\x7b\x7e\x60\xeb\x5a\xbf\xf2\xdd\x17\x8e\xfd\
+\xfb\xdf\xff\xbd\xcb\xaf\x7e\xf7\xc5\xe1\x4a\xbf\x5f\x1f\x7c\xa6\
+\x4e\x1b\x63\xfc\x7f\xfe\xab\xff\xe0\xbd\x1f\x35\x71\xcf\x47\xe9\
+\x8d\xfc\x84\xca\x71\xe0\x79\x22\xd1\xd5\x56\x7a\xa9\xc4\x68\xb3\
+\x8f\xe1\x6e\xf3\xa2\xfb\xfb\x1a\x9e\x1a\x31\x18\xe5\x16\xcf\x12\
+\xea\xd0\x35\xbf\x05\x89\x96\xd9\x70\x50\x15\xf3\x4a\x7c\xdb\xb6\
+\x71\x0b\x27\x20\x03\xca\x1d\x65\x24\xf3\x59\x08\xae\x41\x2d\x68\
+\xc3\x1b\x8c\x73\xb8\xb0\xb8\x2d\xa3\x16\xcd\x7e\xc6\x1b\xe5\x70\
+\xeb\x44\xee\x84\x01\xb1\xd8\xe4\x10\xec\x26\xf0\x0b\xc0\xbf\x60\
+\x36\x3f\xf1\xde\xfb\xf0\x87\xff\x06\x3e\x5b\x45\x20\xdf\x53\x71\
+\x1e\x52\x0e\x4e\xf6\xe0\xcf\x95\xcc\x75\x0e\xce\x54\xf0\xac\x89\
+\xeb\xb5\xaa\xe1\xcc\x0a\xbc\xa8\xc5\xf0\xe6\xe0\xb8\x87\x8d\x32\
+\x46\x66\xa4\x44\xee\xc7\xf7\xe1\x0f\x1c\xfc\x2e\x4b\xa6\xd6\x25\
+\x90\x5c\xca\x52\x3e\xa9\xd2\xd4\x91\x44\xf2\x1b\x8f\xd0\xcd\xe7\
+\x0a\x81\x00\x30\xd8\xdf\xe7\xed\x77\xde\x61\x34\x1a\xf1\xe4\x93\
+\x4f\xb2\xb9\xb1\x29\xe0\x71\x16\x97\x06\x52\xc1\xc9\xf8\x45\x35\
+\xad\x58\xed\xf7\x53\x68\xeb\x01\xe6\x8c\xe8\x31\x1a\x03\x3c\xe6\
+\xf1\x5b\xb2\x18\xe7\x97\x90\xc2\x55\x11\xe5\xf8\x75\x62\x8d\xbe\
+\xfc\xb4\x63\x51\xf3\xf3\x49\x3e\x01\x9f\x29\xb3\x91\x8d\x9d\x43\
+\xf4\x76\x01\x2d\x37\x52\xbd\xc7\x74\x6b\x4f\x48\xdb\x5d\xf2\xc2\
+\xd5\xcd\x5a\xcb\x19\x01\x81\x52\xd6\xe3\x3b\x36\x5b\xc0\x6f\xe2\
+\xb9\x43\x5b\x3f\x2f\xe5\xbf\x9d\x26\xa5\x89\xb6\xdf\x75\x89\xde\
+\xaa\xad\xec\xda\x13\x20\x3c\x3e\xa7\xf0\xdf\xc9\x00\x60\x52\xc8\
+\xd7\x49\x35\x29\xa3\xf4\xa4\xcd\xb7\x33\x65\xfb\x09\xda\x5c\x52\
+\xe4\xda\xf3\x1a\x30\x4e\xda\x1e\x65\xf7\xd7\x91\xfe\x0b\x99\x0a\
+\xb4\x25\xc0\x20\xcc\x01\x4c\x2f\x20\xe1\x1b\xc0\xaf\x01\xc7\xc6\
+\x8c\x93\x55\xf9\x1b\xac\xaf\x07\xf6\xf6\x10\xeb\xf2\xaf\x00\xb7\
+\xbb\x74\x5f\x98\x32\x7d\x5c\xc3\xcf\xfa\x01\x37\xea\x4e\xe3\x89\
+\x3d\x01\x7c\x4d\x8e\xfd\x33\xa0\xe2\xd8\x31\xc5\xfe\xfe\x43\x29\
+\xdf\x03\x5a\xe4\x38\x47\xec\xd7\x0c\xef\xc1\x03\x2a\x74\x1f\x8a\
+\x1c\x3b\xe6\xd8\xdf\x07\xd0\x6b\xac\xc1\xda\x60\xee\xba\x12\xac\
+\x5d\x03\x06\x43\xc0\x56\x70\x82\xaa\xba\x19\xfb\xc5\xdd\x4a\x06\
+\x02\xd1\x15\x93\xd5\xbf\x10\x23\xc1\x09\x0e\x32\xa6\xa6\x71\x93\
+\xc8\x7c\x0a\x0e\x7a\x0b\x56\x88\x5e\xed\x44\x9e\x34\xd4\xe8\x20\
+\x86\x9d\x52\xda\xcd\x43\xba\xe6\xc9\x76\xb6\x48\xf9\xbc\x73\xdb\
+\x3b\x1d\x94\x73\x38\xe7\xb8\x93\x81\xd7\x76\x3f\x49\x2a\xbe\xbf\
+\x6e\xa0\x0d\xf8\x12\x63\x4a\x9c\xcb\xc7\x71\x11\xef\xab\x28\xc1\
+\xce\x01\xc9\x71\x61\x8c\x09\xc6\x69\xcd\xd4\x84\xda\x54\xc1\x14\
+\xc6\x6b\x63\x82\x31\x53\xf1\x52\x9a\x60\x4c\x11\x4c\x61\x7c\x51\
+\xce\x7a\x29\x13\xc8\x2c\x8a\x32\xe4\x21\xb0\x5a\x97\xa1\x2c\x27\
+\x41\x1b\x13\x52\x18\xac\x31\x86\xe7\xbf\xf8\xe5\xfd\x37\xbe\xf7\
+\xf2\xde\x2f\xfe\xca\xdf\xba\x76\xf6\xc2\x63\x55\x06\x20\x01\xd8\
+\xbd\x77\xb7\xfc\xb7\xff\xea\xb7\x2e\x7d\xdc\xd7\x9b\x4f\x60\x58\
+\xab\x02\x2e\x03\x6f\xf5\xe9\xbf\x32\x9a\xb5\x3a\x45\x83\xa3\x6b\
+\xc3\xb8\x67\x46\x75\xcc\x65\x3c\x54\x9c\x71\x4e\x18\x96\xd5\x07\
+\xbc\x2e\x7d\x88\xd5\x4a\x39\x0e\x80\x48\xb5\x60\x5d\x0c\xb3\xa0\
+\xd6\x3d\xe8\x1c\x1c\xd2\xbe\xee\xa0\xc2\xa1\x58\xd4\x8e\x31\xca\
+\xb5\x0c\xdb\x93\x08\xc2\x6d\x5a\x53\xbf\x03\x7c\x9d\x18\xe2\xfa\
+\x47\xd9\x75\x05\x07\xbf\x7b\x0b\xfe\x10\xf8\x7b\x62\xa4\x9c\x88\
+\x51\xf4\x07\xbb\xf0\xbf\x66\x46\xec\x9f\x96\xb5\x69\x47\xee\x75\
+\xba\x0f\xff\x4c\xd6\x24\x88\x84\x70\x97\x89\xa0\x31\x19\xb1\xff\
+\x4b\xe0\x2f\x97\x20\x72\x09\x24\x97\xb2\x94\x4f\xb4\xa4\x3a\x92\
+\x33\x04\x3b\xa9\x8c\x47\xbe\x82\x48\x89\x90\xb8\x59\x11\xf0\xec\
+\xee\xec\xf2\xc6\x1b\x6f\xb2\xb6\xd6\xe7\x2b\x5f\xfe\x4a\x43\xe0\
+\x13\x32\x48\xaa\xa4\x85\x10\x42\x72\x66\x46\x64\x51\xc6\x98\x18\
+\xad\x35\x70\x24\x33\x5e\xb2\x9c\xfa\x4c\xa3\x3e\x2b\x13\xf9\x36\
+\x31\x0c\x75\x95\x96\x15\x2f\x5d\x6d\x9e\x3b\xb6\x68\x01\x75\x73\
+\x8b\xe1\x7c\xc6\xa7\xca\x00\x66\x8e\x8b\xd3\x92\xbb\x4b\xf4\xf6\
+\x1d\x9f\xdb\x96\xee\xe7\x86\x6c\x9f\xcc\x6d\x0f\x19\xd0\x1c\xcf\
+\x2d\xe3\xd7\xe7\xee\x23\xe5\xa2\x0d\xe6\xc0\xf6\x26\x31\xdc\xb7\
+\xcc\xee\xaf\x23\xdf\x9d\xce\xae\xb7\x27\xf7\xba\x9f\x81\xe0\x9e\
+\x00\xc2\x2a\x3b\xc7\xfe\x1c\x88\xde\x9b\xbb\xb6\xe4\x05\x2d\xe6\
+\x8e\x99\xce\x29\x16\xa9\xf0\xbd\x9a\x53\x36\xd2\xbd\xef\x13\x3d\
+\x8f\xaf\x01\x9b\x06\x3e\xe7\xc0\xa1\xf7\xf2\xfe\xb9\x05\x7c\x7b\
+\xca\xf4\x4d\xe0\xba\x8f\xf9\x7b\x15\x15\x53\x5a\x0f\xec\x59\x01\
+\xc8\x2f\x02\x13\x01\x60\xb0\x09\x9b\x3b\x07\xe2\x8a\x72\x65\x49\
+\x6d\x82\x3b\x2c\xee\x68\x63\x03\xb5\xbb\x3b\xa7\x14\xac\xd1\x61\
+\x70\xa8\x75\x65\x46\xb9\x8a\xce\xf5\x16\x98\xae\xb1\x16\x01\xeb\
+\xda\x41\x54\xda\xa7\x6f\x66\x94\xca\xfd\x7d\x4a\xb8\x50\xc3\xf3\
+\x03\x06\xbb\x0c\x0e\x42\xdf\xd9\xbf\x94\x02\xf2\xd6\x89\xde\xc0\
+\xb1\x8c\xa9\xcf\x48\xff\x0c\xa5\x4f\xcf\x48\x9f\x25\x83\x8a\x99\
+\xeb\x9b\x0e\x31\xec\x75\x5d\xde\x27\x33\xb7\x4f\x25\xcf\xe4\xcd\
+\xa4\xd2\xf9\x18\xf1\xd5\x91\x70\xe5\x94\x8f\x9b\xbc\xd3\x9d\xb9\
+\x35\x5d\xcd\x7d\x6e\xb6\x4b\xce\xf0\xa2\xf7\x33\x12\xe7\x54\x55\
+\x6e\x98\x39\x42\x59\x8e\xd7\x83\x73\x89\x70\x67\x0e\x48\xda\xa2\
+\xa0\x08\x56\xc0\xa4\xf7\x9e\x6a\x3a\x2d\x8c\x31\x5e\x55\x0a\x6d\
+\x8c\x37\xc6\x04\x55\x6b\x2d\xc0\xaf\x01\x95\x5a\xe9\xa0\x0b\x13\
+\x73\x29\x05\x54\x1a\x33\x0b\x28\x25\x14\x56\x6b\x6d\x58\xe4\xad\
+\xd4\x5a\x07\x6d\x4c\xa8\xab\x4a\x8f\x87\x83\x62\x6f\x67\xa7\xe5\
+\xe8\xf4\xf1\xb5\xdb\xdf\xdb\x2b\x9c\x30\x69\x2f\xe5\x63\x05\x22\
+\xbf\x42\x8c\x38\xf8\x77\x6d\x48\xff\x69\x75\xfa\xf4\x16\x5b\x5b\
+\xdc\xd3\x9a\x2b\xde\xf3\xfd\x45\x73\x4a\x06\x22\x17\x86\x81\xe2\
+\xd2\xf8\x3e\x7a\x5e\x3a\xe4\xdd\xd1\x07\x80\xe4\xc1\x7d\xd5\x41\
+\x3c\x87\x72\xae\x09\x43\x37\xed\xe2\xe5\x32\x40\x09\x02\x06\x93\
+\x37\x72\xbe\x9d\x14\x39\xf0\x20\xd7\x99\x20\x61\xbe\xa6\xa5\x89\
+\xb0\xce\x8e\xfb\x36\x6d\xf8\xf0\x95\xec\xfb\x04\x00\x27\xc4\x1a\
+\xc1\xc9\xa0\xf6\x3a\xf0\x25\xe0\x9b\xc0\xcf\xc8\xbc\xf4\x17\xd9\
+\x3a\x58\xc8\x7a\xfa\xae\x80\xcb\x5a\x74\x91\x2a\x9b\x93\x96\x61\
+\xe8\x4b\x20\xb9\x94\xa5\x2c\xc5\x39\x77\xc4\x2a\xa8\x66\x40\x61\
+\x33\xa7\x87\xc0\x8d\xeb\xd7\xd9\xde\xd9\xe1\xfc\xf9\x73\x5c\xb8\
+\x70\x21\xf2\xbf\xcd\x99\x4f\x83\x52\x92\x67\x19\xe4\xb8\x76\x7a\
+\xf7\x2e\xe0\x9b\x2f\x8e\x54\xd4\x53\x03\x7d\x62\x5e\xa0\x91\x45\
+\xe4\x96\x4c\xe4\xea\x88\xc5\xd0\x67\x6d\x1b\x01\x9c\x27\x44\x01\
+\x57\x73\xe7\x50\xcc\x92\x7d\x1c\x27\x7a\xf7\x7a\xcc\xe6\x95\xa5\
+\xeb\xbd\x27\xca\xfa\xe6\x21\xd7\x5e\xb3\xb8\x08\xbb\x11\x8b\xe8\
+\xee\x82\x85\xc8\xca\x7d\xea\xec\x3c\x7b\x02\x22\xf5\x1c\xb0\xbb\
+\x49\x1b\x46\x9a\xf6\xdd\xa5\x0d\x6d\x45\xc0\xc3\xd5\x05\xfb\xec\
+\x66\xd7\x55\x11\xc3\x79\x4e\x64\xed\x4f\x16\xdc\xef\x09\xa2\x57\
+\x32\x07\x67\x7a\xee\xbe\x36\x68\x3d\xac\x81\x59\x07\x76\xee\x9d\
+\x1c\x03\x3d\x17\xfb\xe8\x22\xfb\x7c\x55\xfa\xd2\x10\xbd\xaf\xdf\
+\xa6\x2d\x7b\x51\x74\x60\xa3\x8a\x5e\xb1\xa7\xa4\xdf\x9d\xec\xf7\
+\x75\x62\x1d\xb1\x78\x7f\xb3\x20\x52\x11\x2d\xd0\xc7\xb2\xc5\x7f\
+\x6d\x1c\xad\xd7\xb7\x17\x3d\xb0\xdd\xdd\xe6\x5e\x0b\x60\xa3\x28\
+\xb8\x68\x07\x7c\x45\xfa\x67\x9f\xfb\x58\xfe\xe7\x4b\x96\x35\x5e\
+\xcf\x83\xa5\xcc\x94\x80\xc8\x44\xb4\x83\xe4\x41\xae\xcb\x18\xf8\
+\x0b\x66\xf3\x08\xb9\xcf\xfb\x91\xbf\xa2\x3d\xe0\xaf\x65\xcf\xe0\
+\x36\xd1\x53\x7f\x9c\xd6\xeb\x48\x66\x7c\x78\x4c\xbe\xbf\x99\x01\
+\x42\xb3\x60\x2c\x27\x0f\x79\x32\x48\x94\xae\x6d\x2b\x85\xc6\x26\
+\x20\x97\x2b\x8c\x6b\xf2\xde\xad\x81\xbe\xc5\xc1\x10\xf5\x82\xd9\
+\xd2\x21\xc7\xa4\xbd\x72\x0e\x58\xae\x1e\xf2\xbe\x47\x02\x22\x28\
+\x2d\x14\x14\x99\x67\xdd\x52\xb4\xd7\x65\x53\x0e\x74\x70\xde\x61\
+\xeb\x5a\x3b\x6b\xb5\x36\xc6\x2b\x6b\xb5\x31\xc6\x2b\xa5\x50\x02\
+\xfa\x8c\x31\x5e\x6b\x13\xb4\x56\x11\x04\x4a\x2e\xa5\x2e\x04\x68\
+\x9a\xc2\x9b\x4e\x27\x94\xc6\x78\xd3\x7a\x2a\x7d\x51\x14\x3a\xe5\
+\x55\x16\x45\xe1\xb5\xd1\x98\xa2\xf4\xda\x18\xaa\xe9\xb4\xb8\xb3\
+\xb5\xd5\xb5\xb5\x8d\x69\x05\x0a\x95\x42\x09\x07\x7b\xbb\x85\x77\
+\x4e\xff\xa8\xd7\x83\x4f\x38\xc9\x8e\x9a\x7b\x37\x1e\x55\x3e\x2d\
+\xf3\xf9\x6f\xcf\x1a\xe6\xb6\xd8\xda\x6a\xc0\xe2\x25\xe0\x0b\x8f\
+\x70\x9d\x8f\xb2\xbf\x7a\xd8\x63\x42\x38\x72\xbd\x6d\x00\xe5\x23\
+\x5f\x47\x9b\xab\x19\xe7\xb7\x56\xb5\x48\x11\x0b\xf3\x40\x72\x40\
+\x5c\x23\xbe\x26\x06\xd9\x74\x21\x3f\x29\xeb\xc6\xf5\x6c\x4d\x7c\
+\x43\xe6\xb8\xbf\x2e\x7a\xc4\x2f\xcb\x1c\xe9\x92\x69\xdb\xc7\x93\
+\xff\x35\x31\x7a\x2e\x73\x1e\x97\x40\x72\x29\x4b\x59\xca\xa1\x40\
+\xd2\xbb\x16\x32\x06\xd5\x78\x0d\x83\x78\x1f\x93\x87\x32\xf7\x31\
+\x0d\x87\x23\xde\xbf\x76\x8d\x73\xe7\xce\x71\xf6\xcc\xd9\x8c\xf9\
+\x35\x34\x25\x44\x62\x1b\x92\x1d\x99\x9a\x10\x60\xa9\x00\xe7\x2c\
+\xde\xfb\x44\xe8\x73\x3f\x05\x2a\xe5\xec\xe5\x84\x39\x8b\xf6\xd1\
+\x0b\x80\x59\xca\x55\x3c\x26\xdb\x07\x02\xa4\xc2\x1c\x98\x4c\xa1\
+\xa5\x29\xac\x73\x22\x00\x62\x9a\x01\x2f\x9d\xed\x9f\x14\x5c\xbd\
+\xe0\xdc\x9a\x48\x9c\x32\x14\x8b\x66\xbe\xdd\x8b\x72\x7f\x4d\xee\
+\x23\x07\xb0\x8f\xcb\xdf\xb2\x6d\xd7\x00\xee\x0c\x6d\x2d\xbe\x14\
+\xb2\x3b\x90\x7b\x4a\xdf\x25\xd2\x93\x55\x66\x3d\x85\xa7\x32\x60\
+\xa0\x64\x7b\x0f\x78\x27\x53\x98\x2e\x67\xed\x78\xe9\x87\xdc\x23\
+\xb9\x21\x80\xa0\xca\xbe\xdb\x94\xcf\x79\xdb\x3b\xb4\x39\x2a\xc9\
+\x43\x95\xf7\x8f\x9e\x7b\x5e\x8f\x03\xe7\x88\x04\x29\xd7\xa4\xad\
+\x14\xc2\x9a\x72\xf0\x4e\x56\xd1\xcb\xd6\x13\x80\xf9\x6f\xa4\xdd\
+\xbf\x0d\xfc\x84\x9c\xef\x16\xd1\x9b\x36\x0f\x30\x9e\x23\x5a\xa1\
+\xaf\x24\x60\x39\x05\x73\x1e\xdc\x8d\x04\x36\xce\xcb\x18\xb8\x41\
+\x41\x0c\x95\x3e\x4f\x04\x74\xde\x5a\x76\xa4\x1f\x5e\xc8\x14\x91\
+\x0f\x4b\x59\xad\x00\x9f\x14\x2f\x17\xbf\x7f\x52\xae\xe1\xce\x81\
+\xa3\x9e\x47\x1d\x52\x18\x5d\xcd\x01\xfe\x6d\x51\xa2\x82\xa0\x3e\
+\x9b\x6d\x9b\xf1\x08\xf6\x7a\x98\xaa\x62\x4b\x6a\x88\x26\x00\xd9\
+\x39\x7e\x1c\xc5\xf6\x71\xb6\x63\x97\x96\xd9\xd8\x88\xac\xc7\xb1\
+\xe1\xe4\x0d\x49\xe3\x75\x1d\xad\x77\xf0\xbe\xc8\x1e\xc0\x9a\x8f\
+\x7d\x29\x75\x46\x7d\x5d\x50\x94\x36\x82\xba\x74\xed\xc7\x65\x8c\
+\x26\xf2\x8c\x94\xbf\x5b\x12\x0b\xb7\xc6\xa7\x63\xe8\xe2\x66\xea\
+\x63\xce\x3c\x6b\x2b\xf7\x57\x58\x0a\x3b\x6b\x3c\xd2\x80\xb1\x98\
+\x00\x4e\x53\x14\x21\xf8\x80\xad\x2b\xa3\x94\x0e\xda\x3b\xa5\x94\
+\x0e\xc1\x5a\x8d\x80\x49\x63\x8c\x77\x4a\x45\x90\xa9\x35\x09\x54\
+\x1a\x63\xb5\xd1\x2a\xa8\x04\x2a\xab\x69\x43\xd6\x53\x76\x92\xc7\
+\xf2\x20\xa8\xd4\x5a\xeb\xa2\x28\x43\x5d\x4d\xcd\xfe\xbd\xad\x4e\
+\xa8\x2a\x35\x7f\x13\xc3\xfd\x61\xe9\xfd\x87\xeb\x91\xbc\xb7\x75\
+\xbb\x7c\xf9\x3f\xfc\xf9\xf1\xaf\xfe\xfc\x2f\xdc\x5d\x92\xf8\xdc\
+\x57\xba\x44\x06\xd0\xb4\x2e\x3c\x45\xf4\xc2\x7f\xd0\x67\xb2\x06\
+\x7c\x56\x80\xc8\xf6\x21\xed\xec\x12\xf3\xfa\xff\x80\x8f\xb6\x6c\
+\xc4\x03\xdf\x43\x24\x14\x3b\x3c\xe9\xfb\x08\x2f\xe9\x43\x9f\x7f\
+\x85\x15\x05\xe3\xc5\xcc\xd9\x8b\x63\x7a\x95\xcc\x8f\xbf\x44\x1b\
+\x55\x93\xb7\xfd\x4d\xe0\x6f\x02\x3f\x0b\xfc\xe9\xdf\xf9\x3b\xa8\
+\xdf\xfa\x2d\x86\xc0\xb7\x80\x37\xe8\x76\x91\x82\xc3\x01\xba\x06\
+\xa6\xa9\x36\xef\x55\x31\x48\xda\xac\xc4\x8a\x42\xa3\xe5\xa3\x7a\
+\x04\x10\xbf\x94\x25\x90\x5c\xca\x52\x3e\xde\xe2\xdd\x61\xe1\xfd\
+\x59\xf9\x8f\x4c\x4d\x9d\x4c\x27\xbc\xfd\xce\xdb\xac\xaf\xaf\x73\
+\xf2\xe4\x49\xa6\xd3\x29\xe8\x04\x38\xe3\x34\xab\xd4\xec\x5c\x1b\
+\x3f\x66\xa1\xb2\x52\xfe\xc3\x5a\x9b\xbc\x98\xe5\x11\x97\x98\x94\
+\xc1\x5b\xb4\x79\x82\x73\x57\xd5\x00\x16\xb3\x60\x31\x7f\x8c\xe8\
+\xc5\xba\x49\x5b\xee\x62\x33\x6b\x5b\x2e\x6c\xcd\xc0\x20\x81\xb1\
+\x41\x52\xc6\xd1\xf4\x84\x99\xce\x64\xe0\xa8\x10\xf0\x35\xcc\x40\
+\xdf\x7c\xc8\xe0\x54\xae\x79\x34\xb7\x3d\x6d\xdb\xc0\x30\x16\x67\
+\x54\x52\x64\x2a\x51\x2e\x2c\x4d\x88\xa1\x3b\x4d\xf4\xa0\x6e\x33\
+\x1b\xae\x7b\x9e\x96\xe5\x52\x67\x80\x70\x93\xd6\xf3\xb4\x2a\xca\
+\xf9\x76\x76\xfd\xc9\x2a\x3b\xcd\xda\xda\xcd\x16\xc9\x15\x69\x2b\
+\x79\x7c\x53\x38\xe9\xfb\xb1\xef\x2e\x1b\x78\x37\x67\xd7\x4c\xa1\
+\xba\x69\x20\x1d\x63\x36\xdf\xae\x03\x68\x4e\x63\xd8\x6a\xce\xa7\
+\x33\xe0\x59\x8a\x35\xf8\x4f\xe5\x98\xe7\xe4\x98\x55\xe9\x93\x5b\
+\xa2\x08\x9c\x23\xb2\xd2\xe6\xe1\xc5\xf7\x80\x67\xb5\xe6\xac\x31\
+\xfc\x65\x5d\xcf\x8c\x8d\x74\x8e\x44\x68\x94\xfe\x0f\x37\xda\x6b\
+\xed\x72\x83\x4d\x19\x23\x6b\xb4\x79\xa6\x6f\xf0\x3c\x7b\x11\xb8\
+\x99\x27\xc1\xa5\x5a\xa0\x0f\xa2\x2c\x85\x23\x14\x8f\xd9\xfc\xc3\
+\xcb\xa8\x48\xdd\x30\x73\x6c\x97\xd9\x3c\xd7\x28\x19\x88\x3c\xc6\
+\x31\xb5\x3f\xc3\x13\x35\x73\xdf\x29\xf4\x2b\xf8\xb6\x1f\x7a\x44\
+\x8f\xf2\xaa\xfc\x00\x30\x99\xb0\x02\x33\x5c\xfb\x5d\x60\x75\xba\
+\x4d\x3d\x6a\x71\xf9\xaa\x18\x16\x3e\x2d\xfb\xbc\x4f\xac\xa3\x9a\
+\xbc\x88\xc9\xc8\xa0\xf1\x5e\xde\x87\xc8\x49\xe9\xe3\x78\xbe\x21\
+\x60\xbc\xab\xc1\x58\x6c\xd1\x14\xa4\x69\xc7\xe2\xb5\xcc\x70\x91\
+\xc2\xb1\x8b\x36\x05\x8a\x21\x6d\xfd\xcb\xc3\x94\x87\xae\x05\x63\
+\xe3\xc9\xf3\xd0\x56\x19\x73\x2e\xce\x13\xd6\x06\xef\x3d\xb6\xae\
+\xb5\x52\x1a\xe3\x4c\x40\x13\x9c\xd2\x41\x39\xab\xb4\x36\xc1\x59\
+\xab\x95\x56\x41\x6b\xa3\xb5\x56\xc1\x69\xa3\x0f\x7a\x2a\x2b\x2d\
+\x9f\x83\x31\x85\xaf\x2a\x13\x0a\xa3\x83\x36\x65\xc3\x00\x9b\x01\
+\xca\x60\x8a\x22\xd4\x55\x65\xf6\x76\xf6\x3a\xd6\xfa\x2c\x7c\x51\
+\x29\x70\x4c\x27\x13\x33\x1e\x8e\xca\xc3\xe7\x69\xa7\x8e\x2a\x1f\
+\xe2\xb3\xb0\x58\xe7\x1c\xbf\xf7\x2f\xff\xd9\xa5\xb2\xdb\x75\x6f\
+\x7e\xef\xe5\xd3\x00\x17\x2f\x3f\x39\xbc\xdf\x5a\x10\x82\x37\x6b\
+\xcf\xfd\xc4\xaf\xbd\xf5\x83\xef\xaf\x1e\xb5\xdf\x9f\xff\x9f\xff\
+\xe2\x9f\x02\xfc\xf4\x7f\xf1\x5f\xfd\xda\xc3\xac\x35\x93\x48\x6b\
+\x7d\xfc\xc7\x74\x29\x3c\x26\x73\x51\x0a\x33\xfd\x92\x18\xaa\x7a\
+\x73\x73\xca\x8b\xdc\xbf\x04\xad\x16\xb0\xb3\x97\xbd\xb9\xe1\x90\
+\x73\x7e\x86\x83\x11\x2f\x3f\x32\x19\x7d\x08\xcc\x61\x0f\x2a\x0b\
+\x20\xe4\x83\x80\xb4\x35\xa2\x97\x77\xba\xc0\xa0\xac\x64\xad\xf8\
+\x59\xe0\xc2\x6f\xfd\xd6\x57\x6e\xc1\x77\xbc\x18\x01\xdf\x61\x9a\
+\xdb\x57\xa7\x26\x33\x10\xa7\xf5\x6d\x96\x7c\xc8\xb3\x9b\xad\x91\
+\x5d\xa2\xe7\x78\x9a\x9d\xeb\xd3\x32\x66\xde\xe3\x68\x56\xf9\xa5\
+\x2c\x81\xe4\x52\x96\xf2\xf1\x15\xe7\x7d\xeb\x71\x0c\x82\xfa\x24\
+\xe4\x54\xa1\xf0\x19\x41\x8e\x77\x9e\xef\xbd\xfc\x3d\x9c\x77\x7c\
+\xee\x73\x9f\xa3\x9e\x56\x04\xad\x50\xb2\xff\xcc\x4a\xa9\xf4\xac\
+\x06\xad\xa5\x45\x61\x7e\xad\xa6\x15\xd6\x35\x40\xb2\xb8\xcf\xa2\
+\xac\x69\xbd\x77\xe1\x88\xfd\xcc\xf9\xf3\xa8\x1b\x37\x9a\xef\xf6\
+\x05\xa4\xec\x32\x1b\x2a\x18\x68\x43\xf1\x44\x06\x8a\xb6\x0c\x46\
+\x7b\x8e\xb6\x52\xb3\x61\xd6\xd3\xb1\x27\x0b\xd4\x19\x58\x29\x60\
+\x5c\xcc\x29\xf6\x77\x44\x5d\x5e\xc9\x80\x55\x02\xa1\x97\x34\x7a\
+\xcf\x3b\x7f\x87\xb3\x18\x6e\x35\xc0\xe8\x76\xa6\x48\xa7\x63\x12\
+\x20\xad\xb2\xef\xd6\xe4\xff\x31\x2d\x51\x4a\xaa\x91\x39\x6c\x41\
+\x68\xe3\xb9\xdc\xcc\x00\xef\x58\x68\xd4\x53\x88\x50\x2a\xff\x71\
+\x21\x3b\x66\x67\x0e\x00\xa7\xbe\xea\xc3\xbb\x45\x06\xb8\xa6\x34\
+\x79\x68\x0d\x70\x4d\xcf\x33\x79\xb2\x22\xe8\x9c\xd0\xa3\xcd\xa1\
+\x4b\xa5\x23\x86\x19\x78\xd8\x90\x76\x4a\x83\xe9\x3a\xdc\xaa\xec\
+\x93\xea\x23\xa6\xe3\x36\xe4\x71\x77\xc5\x82\xbc\xef\x3d\x6f\x79\
+\xcf\xf7\x16\x8c\x87\x8b\xa2\x74\x6c\xc8\xb5\x5c\x12\xa0\x7a\x9d\
+\x96\x44\xe6\x65\xe9\xf7\xb7\x4f\x73\x7a\xb0\xc5\x96\x13\xe0\x26\
+\xf7\xe4\x12\xc0\xea\x37\x8a\xce\xf1\xe3\x8a\xed\x6d\x0e\x05\x88\
+\xd9\xe7\x63\xf2\x57\x60\x9f\x5a\x03\xd5\x20\xd2\xad\x19\x8f\x78\
+\x02\x6d\x7d\xa2\x17\xef\x50\x99\x03\x91\xa9\x0b\x15\xbd\x49\x20\
+\x82\xc3\x1c\xd0\x5e\xc8\xc6\x61\xaf\xdb\x65\x35\xd3\xa7\x56\xe5\
+\xf9\x94\x71\x1c\x53\x13\x2b\x9a\xd8\x39\x60\x9a\x14\xad\xc4\x0e\
+\x5c\x1a\x43\xe1\x5c\x63\x64\xd8\xca\x8c\x32\x45\x76\xb8\x99\x7d\
+\x67\xb5\x01\xf1\x58\xb6\x60\x32\x85\xcb\x86\x39\xe3\xd1\x43\xe9\
+\x03\xb6\x1d\xf3\x05\x0b\x3c\x92\x99\xc1\x29\x78\xef\x71\xd6\x1a\
+\xb4\x09\xde\xbb\xa0\x94\x0a\x4a\x69\x94\x56\x41\x29\x1b\xb4\x36\
+\x41\xfe\x47\x29\x1d\xb4\xd1\x41\x29\x1d\x8c\xd1\xc1\x2a\xad\xb5\
+\x31\x91\x4c\x47\x29\x09\x79\x95\x7c\xca\x16\x6c\x8a\x97\xd2\x04\
+\x65\x8a\x50\x44\x70\xe9\xab\xe9\xb4\x18\x0d\x06\x65\x08\x01\x3c\
+\x2a\x2f\x2f\x3f\x1e\x4d\x4a\x5b\xd7\x46\xbc\x92\x61\x1e\x1c\x3e\
+\x08\x98\x4c\x72\xf5\xed\xb7\xfa\xdb\x77\xb6\x56\xfe\xee\x7f\xf3\
+\xdf\xbe\xb5\x7d\xe7\xce\xca\x3b\xaf\xbf\xb6\xb9\x7d\x67\xab\xf7\
+\x61\xad\x19\xfd\xcb\xcf\xfc\xa3\x9b\x2f\xbf\xf0\x1b\x7f\xf4\xbf\
+\xfd\x2f\xff\xf4\xdc\x17\xe0\xa7\x8a\xfe\x00\x00\x20\x00\x49\x44\
+\x41\x54\xbe\xfc\x8f\x1e\xe4\x98\x9b\x2f\xbf\xf0\x1b\xbf\xf9\x9b\
+\xbf\xf9\x05\x79\x27\x7f\x1c\xa5\x4f\xcb\x1e\x9c\xde\x9f\x0b\xcc\
+\x46\xa1\x7c\x51\x40\xe4\x4b\xf7\x69\xeb\xe7\x64\xff\xff\x97\xa3\
+\x3d\x8d\x95\xbc\x3b\x57\xf8\xd1\x16\xb2\x57\x1f\xd1\x71\x47\x54\
+\x9b\x7e\xe8\x70\xdb\xf4\xfd\x71\x8d\x3e\xeb\xf1\xb9\xf1\xb2\xdd\
+\xe7\x22\x77\x8b\x9b\xdc\xb1\x96\x9f\x85\xef\xfc\xdf\x99\xf1\x97\
+\x05\x06\xe8\xdc\xe0\x38\x3f\x07\xa9\x6c\x7b\x41\x5b\x2f\x37\x9f\
+\x7c\xff\x84\x98\x3e\x71\x9c\x05\xcc\xf3\x4b\x59\x02\xc9\xa5\x2c\
+\xe5\x13\x21\xde\x3a\x9a\x68\xd4\xf8\xab\x29\xd1\xd1\xb0\xaf\x06\
+\x45\x50\xb0\xbb\xb3\x83\xf7\x9e\x8b\x97\x2e\x31\x9e\x8c\x63\x39\
+\x0f\x54\x73\x7c\x04\x8c\xaa\xa9\x12\xa2\x54\x5b\xa1\x32\xfd\x93\
+\x3e\xd7\x75\x4d\x5d\x1d\xe6\x91\x6c\x58\x53\x92\xb7\xab\xe4\xf0\
+\xf0\x57\x95\x29\x01\xe6\xc6\x8d\x6c\x21\x32\x46\xe3\x5c\xcd\x62\
+\x2f\xe6\x3c\xa9\x88\xc9\x00\x40\x58\x04\x52\x99\x25\xcc\xd9\x11\
+\xa5\x42\xc1\x58\x2f\x68\xeb\x71\x51\x4a\x6e\xa5\x73\x9d\x8e\x5a\
+\x83\x01\x06\x1e\x1f\xad\x98\xb7\x72\x05\x9c\xc4\xda\xd8\xe1\x34\
+\x05\x5b\x4d\xa8\x67\x9f\xb6\xb8\xba\x93\xef\xae\x65\xf7\x5d\xd0\
+\x12\xfc\x3c\x9e\x29\xd0\x2b\x02\x10\xee\x66\x80\xf3\xa4\x94\x1d\
+\x09\xd9\xb1\x17\x65\x5f\xd5\xed\x62\xa6\xb5\x06\xef\x57\xb3\x3e\
+\xea\x0b\xe8\xda\xcd\x9e\xc7\x4c\xbf\xcb\xe7\xbd\xe6\xfa\xc5\x13\
+\x59\x14\x94\xd6\x52\xb2\xdf\x94\x65\x48\x24\x31\x69\x9f\x14\xf6\
+\xba\x9e\x00\xb1\xc3\x95\xd2\x76\xa9\xd1\xa5\xc7\xaf\x03\x7d\x03\
+\x5d\x17\x41\x34\x92\x6b\x97\xd8\x6d\xbb\x73\xe0\x2b\x3d\xc7\x6e\
+\x01\x7d\xdb\x86\x00\x07\x8d\xee\x79\xfc\x49\x59\xfc\xfb\xc4\xd0\
+\xb3\x0a\x50\x5b\x6c\xcd\x7b\x02\x13\x40\x3f\x36\x63\x89\x8e\x20\
+\x52\x2d\x50\x7c\xd4\xfc\xf7\x52\x0f\x23\x7e\xd7\xed\xaa\xc1\x74\
+\x0a\xdd\xae\x8a\xfc\xa7\xd3\x79\xa5\xe5\x18\xb0\x42\xa7\xb3\x96\
+\x11\xcd\x3c\xa0\x4c\x92\x9f\x64\x65\xee\x9a\x06\x44\x8b\xf9\x26\
+\xd0\x0d\xd3\x06\x68\xa6\x7d\x2f\xd1\xd6\x1d\xb5\x94\x65\x9f\x5a\
+\xd5\x6d\x14\x73\xd1\x05\x3b\xa2\xf5\xc8\x7a\xa2\xd3\xcb\xa0\x75\
+\x81\xf7\x49\x09\x33\xa0\x0d\x46\x15\x38\x17\xa4\xbe\x65\x32\x02\
+\xa4\x5c\xc9\x01\xc6\x14\xd8\xc4\xbe\x68\x14\xb8\xa4\x10\xa6\x71\
+\xb1\x01\x0c\x31\x14\xb8\x07\x57\xae\x33\x60\x6b\xee\x07\x24\x43\
+\x08\x38\xe7\x14\x2e\x28\xaf\x10\x00\xa9\x82\x52\x0a\xad\xb5\xf7\
+\xca\xcf\x7c\xa7\x6c\x04\x93\x4e\xfe\x2a\xab\x83\x52\x0a\x2b\x00\
+\x32\xd6\x11\x89\xe0\x32\x02\xce\x48\xd6\x53\x55\x2d\xa8\x2c\x74\
+\x41\x35\x9d\x16\xa3\xe1\xb0\xf4\x21\x34\xcf\x27\x48\x08\x9f\xad\
+\x2b\xd3\x5d\x59\xa9\xb5\x36\xc1\x1f\x41\xba\xe3\x1f\x80\x90\x47\
+\x69\x13\xfa\x6b\xeb\x95\xf7\x95\x5a\x5d\x5b\xab\xbe\xf0\x93\x3f\
+\x7d\xf7\xa9\xcf\x3c\x77\x5f\x57\x53\x08\x5e\x29\xa5\x1f\xb0\xcf\
+\x7f\xf5\xef\xfe\xf6\x3f\xf9\x1f\xfe\xe5\xdf\xfe\x7b\xbf\x7a\xf5\
+\x41\xf6\xfe\xed\x7f\xf2\x3e\x30\x43\x2a\xf3\xe3\x26\xc7\x88\x11\
+\x1d\x0d\xb6\x27\x86\x9c\xbe\x98\xad\x01\xff\x00\x08\x5c\xa6\x90\
+\x48\x82\x45\x7d\x75\x99\x18\xaa\xfd\xc7\x1c\x9e\xc3\x9f\xa4\x16\
+\x20\xf9\xee\x47\x08\x02\x1f\x34\x0f\x52\x7d\xc0\x7d\x1e\x14\x10\
+\xaa\x87\x3d\xae\x07\x6a\x32\x63\xd1\xea\xa9\x09\x93\xca\xe3\xbf\
+\x20\xf3\xca\x41\x12\xae\xf7\xc1\x46\xa0\xff\x37\x05\xd0\x17\x32\
+\xaf\xac\x2e\x98\xdb\xbb\xd9\x1a\xd8\x67\x96\xb3\x20\x19\x10\x8b\
+\x53\xa7\x28\xef\xdc\x41\x13\xeb\xf1\x7e\x3b\xdb\xa7\x43\x4c\x47\
+\x08\xf7\x31\x72\x2f\x65\x09\x24\x97\xb2\x94\x8f\xaf\x24\xd6\xd6\
+\x43\xe7\x73\x15\x50\x01\x7c\x08\xbc\x77\xe5\x3d\x8a\xc2\xa0\x89\
+\xe5\x3b\x48\xa1\xaf\x29\xb1\x72\x66\x2a\x55\x28\x25\x88\x32\x1c\
+\x0c\x6f\xad\x6b\x8b\x75\x35\xde\x7b\xd6\x58\x2b\xa3\xc6\x3b\x90\
+\xa3\x33\xd6\x94\x02\x83\xa5\xd4\xe8\xae\xc7\xcf\x2f\x6a\xab\x44\
+\x86\xca\x98\xf7\xb7\x49\x31\x93\x16\x1f\xc9\x2b\x0e\x5b\xb0\x32\
+\x20\xb9\xa9\x60\x27\x79\x3d\xe7\x49\x4e\x8a\x05\x40\x52\xcf\xb5\
+\x31\xcf\x9e\x57\x64\x60\x6f\x5f\x3e\xdb\x8c\x76\x75\x87\x96\xa0\
+\xc4\x64\x20\x6f\x44\x62\xdb\x9c\x0d\x03\xbd\x44\xaa\x2b\xb9\x81\
+\x61\xb7\x01\x71\x27\x98\xf5\x08\x9e\x88\x8a\x78\x59\x48\xcd\x6b\
+\x4f\xf4\x1c\xee\xf4\x7a\x14\x13\x4f\x49\xc5\x1e\xd1\x03\x97\x87\
+\xeb\xee\x09\x50\x30\xd3\x29\x06\xfc\xd9\x0c\x00\xa4\xbc\xba\xa1\
+\x28\x57\xe9\x7a\x4f\x12\x7d\x4a\x79\xae\x5c\xfa\x2e\x81\x4d\x63\
+\x6d\xe3\xf1\xca\x3d\x92\x2b\xb2\x48\x97\xd9\xb1\xc7\x28\x4b\x43\
+\x5d\x97\x19\xa8\x28\xc5\xf2\xbc\x06\xac\xb8\xf8\xfd\x6a\x01\xca\
+\xc6\xff\x13\xf3\x6e\x8f\x9c\xf4\xa8\xd3\x51\x54\x95\x22\x86\x3b\
+\xf6\x64\x7c\x28\x22\xe3\xe8\xbe\xdc\x47\xf2\x8a\x26\x82\x1b\x95\
+\x1d\x9f\x28\x45\x0d\xd0\x29\xe0\x98\xcd\xf2\x71\x3a\xa0\xaa\x23\
+\x14\xad\xb2\x44\xd5\x6d\x90\x94\x9a\xc6\x2f\x55\x13\x5a\x35\x9d\
+\x66\xc7\x94\x2a\x8b\xa8\x8a\xe3\xb8\xaa\x56\x1f\xe1\x95\xee\x31\
+\x9b\x93\x9b\xc2\x98\x15\xd0\xab\xa0\x07\xa5\x2a\x81\x9a\x7a\x05\
+\xad\x6b\xbc\x4f\xb5\x24\x4f\x51\xd7\x3d\x66\xf2\x5e\x6d\x77\xee\
+\x5d\x68\x0d\x31\xde\xa7\x90\xea\x33\x40\x0f\xcd\x08\x9c\xc1\x44\
+\x42\x43\xad\x59\xf3\x9e\xe3\x32\xb6\x9c\xc7\x07\x09\xe5\x96\xf7\
+\xc8\xa5\xdc\xe7\xc4\x3a\xdb\xe6\x73\x3a\x4c\xc3\x8b\x28\x57\x63\
+\x5c\x7c\x24\x0e\x77\x80\x33\x51\x40\x64\xf2\x1e\xe4\xef\x69\xfa\
+\x69\x08\x9f\xbc\xf7\x38\xe7\xb4\x52\x1e\xa5\x54\xc0\xa3\x92\x57\
+\xd2\x6b\xaf\x1a\x00\xa9\x12\x98\x2c\xd0\xde\xf9\x04\x2a\x05\x64\
+\x12\x43\x5e\x55\xa8\xb5\x09\x46\xab\xa0\xb4\x09\x46\xeb\xd6\x4b\
+\xa9\x4d\x28\xb4\x09\x18\x13\x8c\x51\xc1\xb9\xca\x54\x93\x49\x31\
+\x0f\xde\x22\x90\xac\xf5\xed\xeb\xd7\x36\x7f\xe7\xff\xf8\xdf\x9f\
+\x30\x85\x79\xa4\x72\x02\xbb\xf7\xee\xf5\xae\x5f\x79\xef\xf8\xd5\
+\xb7\xdf\xbb\x33\xd8\xdb\xeb\x54\xd5\x54\x4f\x27\x13\xfd\x80\x20\
+\xf2\x81\xbd\x53\xde\x7b\xee\xd7\x2e\xc0\xef\xfd\xcf\xff\xd3\x3f\
+\xff\xf5\x5f\xff\xf5\x92\x43\x6a\xa5\xfe\x98\x48\x9a\xb3\xba\xd9\
+\x67\xe6\x8c\x87\xd1\x80\xf6\xee\xa1\xf7\xb1\x4a\x24\x70\xf9\x8e\
+\xcc\xfb\x9d\xfb\x00\xac\x93\xc4\x30\xcc\xb5\x87\x04\x81\x0f\xf2\
+\x8c\x0e\xdd\x47\xc7\x88\x94\xc5\xc9\xc6\x47\x6c\xfb\x00\x60\x71\
+\xc1\x09\x50\xda\x6b\x69\xdf\xdf\xcf\x34\xa6\x66\x3f\x57\x29\x55\
+\xe2\x09\xe9\xb3\xc9\xfc\x39\x57\x56\x50\xb1\x74\x18\xd7\x80\xff\
+\x5a\xe6\xbf\x3b\xc0\x49\x7a\xe4\x41\xc9\x5a\xd6\x8c\xe7\x64\xfe\
+\x39\xbb\x00\x48\x9e\x02\x7e\xf1\xce\x1d\x3e\x43\xcc\x99\x3d\xce\
+\x2c\x4f\xc0\x31\x39\x3e\xf1\x28\xfc\x3f\x1c\xcd\x40\xbf\x94\x25\
+\x90\x5c\xca\x52\x3e\x8e\x40\xd2\x92\xc8\x76\xda\xb5\x20\x7a\x26\
+\x9b\x55\x54\x41\x3d\x9d\x72\xef\xee\x3d\x1e\x7b\xec\x31\x26\xe2\
+\x2d\x69\xfc\x8d\x8a\x96\x64\x87\x58\x1e\x44\xeb\x86\x61\xa7\x25\
+\xf0\x51\x6d\x2a\x98\xad\x6b\x9c\xe4\x48\x0e\x18\x1c\xae\x60\xd8\
+\xa8\x1c\x0a\xa0\x48\x92\x4a\x80\xa4\x50\xa4\x7b\x80\x65\x87\x79\
+\xe0\xa8\x0f\x2c\x63\x51\xd1\x3e\xc9\x0c\x7d\xf9\x4e\xda\x96\x80\
+\x51\xf2\x70\xf5\xe5\xc7\xce\x01\xc9\x52\xc0\x5d\xca\x3b\x5b\x94\
+\x9f\xb9\x15\x95\x63\xa3\x25\x3c\xd2\x64\x0a\xca\x86\x1c\x77\x8d\
+\x59\x4f\x68\x2a\xf4\x9e\x83\xd3\x93\xb2\xc2\xdf\xc3\x7b\xc3\x2e\
+\x46\x16\xb0\xf3\xb4\x61\x39\xa9\x4d\xc9\x8f\xac\xd3\x77\x0e\xad\
+\x4b\xbc\x5f\x9b\x4c\x1a\x85\x7a\x22\xe7\x2e\xb2\x7b\xda\xa7\x65\
+\xef\xd4\xb2\x28\x5e\xcf\xae\x77\x4c\xf4\x6a\xa6\xfb\x48\x61\x3e\
+\x77\xe7\x00\xf5\x1e\x6d\x89\x89\x32\x53\xec\x0b\x3a\x9d\x2e\x55\
+\x15\x32\x65\xad\xcc\x80\xaa\x2e\x28\x56\x09\xb5\xb1\x71\xb1\x4e\
+\x84\x40\x45\x63\x2d\x36\xa6\x87\x73\x25\xb0\x62\xdb\xf5\xc2\x69\
+\x50\x7e\x3e\xaf\x30\x82\xc8\xa4\x74\x74\xa1\xe8\x53\xa0\xb0\xb6\
+\x6c\x01\x85\x26\x7a\x35\x8b\x75\xb0\xb6\x14\x40\x57\xc7\xe3\x73\
+\x8f\x56\x69\xa1\x5f\x42\x95\x34\x84\x2a\x1f\x63\x45\xa1\x52\x2e\
+\x5f\x41\xa1\x2c\x96\x1c\x44\x66\x96\x93\xec\x18\x54\x1b\xfd\x59\
+\xe7\xfb\x25\x4f\x6d\x6f\x76\x1c\x67\x49\x85\x45\xf3\x5e\xc0\xc1\
+\xb0\xb1\x94\x63\x79\x80\x18\x4a\x6b\x56\x7d\x0c\x67\xee\x36\xf7\
+\x09\x25\xde\xef\x8b\x72\x94\x3c\xc4\xdd\xa2\x88\x63\x55\x6e\x2b\
+\x31\x18\x3f\x2b\xff\xdf\x00\xb6\x0d\xc6\xb8\x38\xae\x4b\x51\xd6\
+\xf6\x88\xa4\x8d\x3a\xe9\x63\x3e\x8e\xb5\x1b\x02\x24\x93\xf1\x60\
+\xfe\x9d\x1c\xcb\x3b\xbc\x9f\xf5\x41\x1c\x3b\x49\xad\x73\xf9\x9f\
+\x99\x0f\xb1\x38\xba\x01\x30\x46\x3c\xa0\x3a\x53\x8a\x8d\xf7\x4d\
+\x5f\xc8\x73\x37\x84\x10\xf0\x11\x04\x67\x60\x51\x29\x15\x63\xf4\
+\x23\x90\x0c\x3a\xf3\x4a\x7a\xbc\x57\xca\x28\x15\x82\xd2\x68\xa3\
+\xbd\x52\x0a\xaf\x7c\x88\xb9\x94\x3e\x38\xa5\x50\xda\xa6\xba\x91\
+\x0d\x59\x4f\x2d\x64\x3d\x4a\x29\xea\xca\x9a\x6a\x3a\x29\x16\x81\
+\x38\x67\x9d\x5e\xdf\x3c\x3e\xfa\xec\x57\xbe\x72\x57\x6b\xd3\x94\
+\x05\x79\x18\x49\xf9\x96\x6f\xbf\xfa\xea\xfa\xeb\xdf\x7b\xe9\xb1\
+\xf7\xdf\x79\x7b\x75\x7f\x67\xa7\x37\xd8\xdb\x2b\x77\xee\xdd\xbd\
+\x8f\x7e\x95\xc7\x95\x3c\xe0\xda\xe1\x1c\xf7\x6f\xb7\x61\x06\xef\
+\xfe\x98\x2f\x85\x5d\x59\x57\x52\x0e\x67\x7f\x01\x48\x9a\x33\x6d\
+\x1c\x90\x35\x99\x87\xdf\x99\x03\x87\x87\x01\xac\x89\xc1\xfc\x99\
+\xc3\xfd\xfe\x7d\xf7\xed\xa3\x16\xa6\x2f\xc6\xef\x17\x1b\x00\x56\
+\x50\x8c\x0f\x6e\xeb\x76\x51\x8c\x59\x48\x72\x93\xd5\xa0\x7d\x30\
+\x60\xda\xeb\x29\x26\x93\x07\x07\xb3\x1e\x7c\xaf\x73\xe0\x98\x2e\
+\x5d\x45\x77\x3a\x9b\xc6\xd8\x5e\xb0\x18\xe1\x3c\xf2\x7c\x7e\x85\
+\xd9\xb2\x5c\x6d\xf3\xe3\xae\x92\xe0\x11\xad\x50\x67\x03\xe1\x16\
+\xb0\x51\x96\x9c\xa8\x27\x6d\x5f\x94\x25\xa6\xae\xb9\x04\x7c\x0e\
+\x74\x05\xfa\x34\x58\x97\x4d\xb9\x9a\x68\x04\xbd\x25\x86\xd7\x3d\
+\x39\x67\x9e\x2b\x3f\x22\x92\xbf\x95\xc4\x12\x22\xdf\x58\x02\xc9\
+\x25\x90\x5c\xca\x52\x3e\x31\x52\xdb\x38\xdf\x45\xb2\x9d\xfb\x47\
+\x65\xf8\x10\x08\x21\x50\xd7\x35\x5a\x16\x81\x44\xaa\xa3\x04\x4c\
+\xce\xac\x20\x39\xe1\xce\x5c\xf3\x4a\x29\x6c\x5d\x53\xd7\x0f\x4c\
+\xb6\xd3\x7a\xad\x5a\x2f\x5c\x0a\x1b\x75\xb4\x8c\xac\x05\xc0\xea\
+\x2a\x6a\x38\x9c\xa9\x25\x99\x6a\xed\xad\x65\x0a\x81\x9a\x9b\x73\
+\x4a\x62\x88\x67\xba\xda\x94\x2b\x78\x8f\xe4\x0d\x9c\x9d\xab\xa2\
+\x92\xac\xf5\x39\xbc\xcf\x73\xba\x02\x45\x61\xb0\xb6\x13\xc1\xae\
+\x4b\xf5\x17\x93\xf7\x2c\xe5\x12\xde\xc6\x30\x12\x0f\x4d\xca\x25\
+\xbc\x4c\x5b\xfa\x20\xdd\xf7\x00\xb8\x26\x2b\x7c\x9e\xfb\xf8\x1e\
+\x6d\x78\x8f\x11\x45\xfc\x3d\x69\x23\x7d\xb7\xae\x3d\xc7\x3d\x4c\
+\xbb\x74\x8b\x29\x53\xa3\xe1\xb4\x8f\xc7\x27\x50\xb8\x42\x0c\x87\
+\xed\x67\xdf\x4d\x99\xcd\xd5\xec\x48\xdf\x38\xb9\x7e\x2f\x7d\x93\
+\x87\xc7\x26\x50\xbb\x91\x01\xc0\x16\x48\x56\x55\x07\x08\x06\x53\
+\x3a\x5c\xca\x79\x4c\x60\x52\x59\x6c\x0f\xdb\x5c\x4f\x02\x9b\x02\
+\x76\xcd\x0a\xce\x75\x24\xcc\xb5\x97\x3d\x83\x4a\x6c\xda\x1d\x60\
+\x35\x02\xb9\x06\x65\xa5\x3e\xed\x10\xdb\x06\x28\x35\xd4\x1e\xd0\
+\xda\xe3\x3d\x45\x01\xab\x16\x6c\x4d\x7d\x50\xe9\x29\x0a\x2d\xe0\
+\x73\x25\xc5\x7a\xce\x9d\x03\xac\x55\xad\xcd\xc3\xce\x81\xc4\x59\
+\x65\xaa\x28\x50\xd6\x42\x61\x99\xdb\x65\xa6\xee\x67\x02\x92\x09\
+\x98\x06\x40\x15\x14\xf1\x18\x6b\x43\x51\xa0\x2c\x84\x22\x3b\x97\
+\xfc\x09\x1a\x3a\x7e\x16\x48\x6e\x00\x4f\x79\xcf\x29\x63\xe8\x39\
+\x57\x74\x9b\xbd\x8d\xe9\x08\x38\x3f\x27\xfb\x25\x2f\xad\x6e\x79\
+\x6e\x28\x69\x19\x81\x13\xe8\x33\xce\x38\x1d\x41\x23\x53\xd9\x56\
+\xe2\x7d\xaf\x39\x6f\x0c\x6d\xd5\x73\x6e\x87\x38\x9e\x66\xbd\x89\
+\xa9\x8d\x70\x60\xbf\x07\x01\x33\xed\xaf\x9c\x88\x4a\x3c\x8f\x8d\
+\x81\x26\x0b\x59\x77\x41\x80\xa4\xd2\x92\x03\xae\x64\xb2\x52\x4a\
+\x05\xe5\x5b\x50\xa9\x7c\x4c\x00\x4f\xf9\x93\x3e\x03\x95\x4a\xa9\
+\x60\x94\x06\xa3\xbd\x57\x0e\xa5\xc4\x53\x69\x2c\xce\x1a\xad\x0a\
+\x15\xb4\x9d\x25\xeb\x71\xd6\x9a\xba\xaa\x8c\x52\xb3\x80\x2d\x84\
+\xa0\x9c\x73\x3a\xf8\xa0\x6e\x5c\xbd\xda\x3f\xa0\x8d\xc7\xfb\xc0\
+\xdf\xc7\x83\x93\xca\x2f\xdd\xdb\xba\xdd\x1f\x0f\x87\xdd\xad\x9b\
+\x37\xfa\xc3\xfd\xbd\xee\xf6\x9d\xad\x6e\xb7\xd7\xfb\xd0\x59\x5b\
+\xab\xaa\xe2\xf6\xf5\x6b\xbd\x07\xd9\x8f\xc3\xbd\x6e\x3f\x2e\x12\
+\x4b\xd4\x74\x04\x48\x56\x33\x21\xe0\xf3\x60\xf2\xa8\xb1\x39\xa5\
+\x25\xee\x9a\xc5\x5c\x73\xa1\x9a\xc0\xba\xc3\x9d\x22\x7a\xd8\x0e\
+\x4a\x89\xa2\x96\xd7\x6f\xb4\x68\x1b\x1c\xc9\x8d\x33\x5e\x0c\xe6\
+\xc4\x63\xa7\x8b\x38\x15\x1d\xa6\x8d\xab\x05\xf3\x54\x3e\x8f\xc5\
+\x31\x3c\x99\xa8\x83\x87\xb6\xf3\xd6\x62\xf8\x3c\x99\x63\x39\x2f\
+\xd4\x34\xb2\xa9\x1e\xd2\xa3\xd3\x5c\x19\x38\xee\xe2\x1a\xb1\xb2\
+\x00\x33\xa8\xd0\x36\xd2\x0d\x84\x3a\x82\x75\xd6\xea\x7a\x36\xef\
+\xbc\xae\x85\x2f\x00\xee\x80\x3f\x4d\x4c\x9f\xf0\x99\x01\x3b\x12\
+\xcf\x19\x73\x1b\xe7\x6e\xb1\x38\x95\x81\x4e\x07\x55\x55\x74\x58\
+\x92\xed\x2c\x81\xe4\x52\x96\xf2\x49\x15\x9f\x42\x5b\x83\x6a\xbc\
+\x8f\x8a\x54\xbe\xa3\x8d\x5a\x0d\xc1\xe3\x9d\x63\x3a\x15\x6f\xa4\
+\xa2\xe5\x74\x55\xa0\x94\x9e\x39\x26\x96\xfa\x68\xa7\xf7\xe4\xe1\
+\x54\xf2\xbf\x75\x16\x67\xad\x58\xab\xbb\xe5\xec\x3c\xdc\x05\xa6\
+\xb9\x57\xa8\x40\xeb\x0b\x78\xdf\x27\x7a\xcb\xb6\x64\xa1\x5e\xa4\
+\x7c\xaa\xe1\x30\x1d\x68\x8e\x3b\xdc\x33\x99\x02\x7c\x4d\x96\xde\
+\x94\x33\x67\xfa\x7d\xd4\x68\x44\xe8\xd2\xd5\x53\xa6\xfb\xa2\x14\
+\x57\xb4\xc9\xf7\xfd\x0c\x74\x36\xb5\x10\xb5\xe6\xae\xf7\x0c\xb5\
+\x47\xf9\x79\xe5\xc2\xda\x3e\x2d\x5b\xec\xa0\xd7\xc3\x4c\x26\x98\
+\x3e\x7d\x46\x8c\x94\x00\xe0\x5b\xc4\xc2\xce\x45\xbf\x8f\xaf\x46\
+\x28\xdb\x2a\xeb\x39\x68\xf4\xd9\x35\x98\x95\x15\x8a\xf1\x38\x86\
+\x29\x66\xa0\x3a\x81\xd3\xa7\x69\x59\x5b\x0d\x30\xf1\xf8\x6b\x40\
+\x35\x8d\x2c\x75\xc6\xc7\x7e\xb8\x19\x8d\xd9\xfd\x42\x58\xfa\xb6\
+\x05\x88\xa6\xe3\x4e\xd1\x7a\x0d\xb5\xf4\xc7\x0e\xe8\x3d\xf0\xa6\
+\x03\xda\xa2\x57\x3d\x7e\x8d\xd6\x83\x9a\xf2\xe0\x74\x06\xe2\x72\
+\xc0\xde\x01\x82\xc3\x25\x8f\x6f\x47\x43\xe9\x5b\x23\x42\x8f\xd9\
+\xb2\x1f\x1d\xa2\x3b\xd7\x78\xdc\xff\xcf\xde\x9b\xc5\x4a\x92\x64\
+\x67\x7a\x9f\x99\xb9\xc7\x72\xd7\xdc\x33\x2b\x33\x6b\xcb\xea\xda\
+\x9a\xd5\xad\x16\xd9\x24\x07\x03\x0e\x28\x08\x23\x62\x08\x48\x0f\
+\xd2\x88\x12\x21\xe9\x45\x20\x30\x80\x34\x90\x00\x09\x82\xe6\x61\
+\x80\x81\x38\x80\x1e\xa8\x27\x09\x84\x9e\x04\x81\x4f\x02\x06\x43\
+\xf1\x45\x03\x82\x9a\x91\x30\x3d\x4d\x89\x23\x0e\xc9\x5e\xc9\xde\
+\xaa\xba\xba\xba\x96\xac\xac\x5c\x6e\xde\xfd\x46\x84\xbb\xdb\x31\
+\x3d\xd8\x31\x77\xf3\x88\xb8\x37\xb3\xd6\xae\xee\x0a\x4b\xdc\xbc\
+\x37\x22\x3c\x7c\x31\x37\x37\x3b\xff\x39\xff\xf9\xcf\x90\x8e\xe6\
+\x3a\xc8\xfa\xc7\x62\x71\x5a\x8a\x62\xdc\xd0\x80\x73\xc6\xf9\xb6\
+\x9c\x46\xc9\x1c\x5d\x4d\x92\xc7\x58\x2c\x20\x2e\xb8\x66\xec\x3c\
+\xcb\xab\xa9\x36\x8d\xb1\x96\x42\x8c\x1b\xe1\xfd\x0c\xe7\x4c\x4c\
+\xef\xcb\x8b\x6f\xcf\x7d\x33\x38\x13\x81\x52\x0a\x99\x39\xe3\x88\
+\x07\x68\x72\xd0\x17\x81\xd6\xfc\x11\x07\x74\x62\x43\x11\x98\x76\
+\x10\xb5\xbd\xec\x46\x1d\xe7\x4d\x4f\xd3\x26\x05\x4a\x7c\x39\x67\
+\xf8\x96\x7a\x6f\xab\x78\xb8\xa6\xfb\xdc\xfb\x01\x31\xb2\xfd\x40\
+\xc7\xe4\x39\xa0\x6c\x9a\x9e\xb1\x54\xe8\x33\xb3\xdb\x3a\x4a\x62\
+\xa1\x71\x4b\x3f\x22\x3e\xd4\x9c\x49\xa7\xfb\x4e\x27\xb6\xae\x46\
+\xdf\x86\x02\x52\x3b\x47\x20\xb3\x48\xaf\x3c\xcc\x5a\xf6\x3c\xbf\
+\x9f\x66\xb1\xd6\x2a\xdd\x76\x5e\x48\xc3\x92\xe5\x31\x85\x10\x08\
+\xe2\x8d\x00\xc6\x58\x93\x80\x5d\x87\x27\x13\xad\x55\x42\x04\x99\
+\x82\x02\xcc\x4c\x94\xc7\x04\x31\x82\x51\x50\xd9\xbe\xdf\xc4\x08\
+\xa5\xf1\xfa\x5b\x23\x95\xc6\xd8\xd0\x34\x8d\xad\xeb\xba\x30\x66\
+\xf1\xd2\xbc\x6f\xec\x74\x72\x32\x78\xf5\x2f\xbf\x75\x29\xcf\x53\
+\x34\xb1\xa2\xd2\xfb\x8a\x14\xee\x3e\xb8\xbf\x3e\x9b\x4c\x46\xfb\
+\x0f\x1f\x8e\x4e\x8e\x8f\x46\xbb\x0f\x76\x46\xce\x15\x1f\x79\xfe\
+\xd6\x6c\x36\xe3\xfe\x9d\x3b\xe3\xb3\xb6\x79\xe3\xff\xfb\xe3\xff\
+\xf1\x77\x7f\xf7\x77\x9f\x67\x99\x12\xf1\xa7\x0f\x48\xae\x51\xb5\
+\xe7\x39\x3c\x75\x9c\x65\xb6\x6a\x42\xc7\x47\x64\xf9\xfc\x83\xc1\
+\x1a\x55\xb5\x80\xc1\x5a\xaa\x66\x92\x45\x8b\x6c\x93\x5f\x60\x31\
+\x7f\x4f\xd1\x4e\xfc\xcf\x62\xa3\x30\x53\x5e\x40\xea\xf1\xe3\x5e\
+\xa6\x7b\xcc\x7a\x8e\x08\x69\x3a\xe7\xe6\x92\xb9\x6f\x09\x88\xd4\
+\xda\x8e\x4d\x73\xf6\x01\x1b\x1a\x2c\xd6\xa4\x93\x5d\xe2\xfe\x10\
+\x7a\xc7\x6e\xf2\xde\x35\xf1\x52\x6d\xbb\x61\x8e\xef\x82\x65\x0d\
+\xe1\x22\x30\x2a\x4b\x0a\xea\x7e\x57\x54\x3d\xdc\x1e\x9f\x7f\xbf\
+\x3c\x47\x32\xb1\x29\x92\x73\x77\x6d\xce\xe9\x15\xd7\x58\xef\x2f\
+\x2c\x83\xeb\x9a\x5e\x91\x52\xd9\x4b\x2c\x43\x84\x55\x5b\x01\xc9\
+\x55\x5b\xb5\xcf\x5e\xf3\x8d\xcf\xea\x3c\x2a\xe0\x33\x99\xc5\xa8\
+\xe6\x97\xf7\x42\xe3\x3d\x55\x55\x61\x2d\xbd\xed\xfa\xd1\xc7\x80\
+\xd1\x45\x20\xc5\x2b\x43\xb6\x56\xa5\x5c\xc9\xa6\xa9\xa9\xdb\xf2\
+\x1f\xb3\x62\xd1\xa9\x1b\xc1\x64\x51\x50\x88\x50\x88\xc8\x11\x51\
+\x94\x60\xf2\x08\x4f\x71\x5e\x1c\x39\x09\xd0\xdc\xcb\x80\x61\xae\
+\xda\xea\x4e\x4e\xe2\xeb\x19\x33\xab\x60\x73\xb6\x64\x41\xe9\x45\
+\x3a\x1c\x38\x2f\x31\x19\x5f\x90\x24\x82\xe3\xfa\xcb\x30\xb7\x15\
+\xb0\xb9\xe9\x34\x9e\x9b\x82\xb6\x14\x5d\xbd\x14\xc1\x19\x56\xcf\
+\xc1\x66\xb6\x49\x1e\xe5\xbb\x48\xcc\x41\x3b\x00\x5c\x98\xe0\xb0\
+\x6c\x21\x2d\xb5\xd7\x66\x48\xe2\x2e\xbd\xd2\x21\xad\xb1\x72\x9c\
+\x6d\x3b\x4b\x20\xef\x84\x93\xf4\xbd\x89\xb5\xdc\x94\xae\x36\xe0\
+\x44\xc1\x7a\x3a\xdf\x59\xb4\x95\xc4\x02\xae\x82\x42\xc5\x6e\x1a\
+\xfa\x79\x9e\x6d\x39\x90\x01\x83\xb2\xa2\xb2\xad\xe1\x55\x30\xa0\
+\x21\x68\x54\x71\x10\x81\x21\x4e\xa9\xb7\xc1\xc1\xc0\xa7\x7d\x59\
+\x0a\x24\x9e\xa3\x44\xa9\xcf\x81\xef\x80\x69\xd9\x9e\x97\x55\xa0\
+\x19\xe3\x5e\xc3\x16\xc0\x38\x8c\x82\x74\x87\x73\xa5\x46\xdd\x4c\
+\xd6\x27\x49\x31\xd3\x79\xcf\xc0\x9d\x9e\xac\x63\x44\xb0\x0a\xce\
+\x86\x09\xf8\x25\x00\xb9\xbc\xf8\xf6\x9c\x18\x8a\xd7\xad\xe6\x81\
+\xe3\x3c\x88\x8c\x9f\xab\x53\xc0\x9f\x11\xa1\xf7\x67\xbc\xe7\xf3\
+\x75\x34\x3d\x74\xbb\x3a\xfe\x6f\x64\xc0\x9a\xac\x0f\x77\x11\x7e\
+\xa4\x7d\x73\xc1\x41\x89\xc3\x78\xdf\x2b\xa1\xd1\xeb\x13\x35\x6c\
+\xf3\x68\x7f\x1c\x5b\x22\x93\x39\x00\x38\x56\x03\x6d\x97\xae\x0e\
+\xaa\x9d\x33\x29\xc7\x44\xba\x5a\x9d\x81\xe9\xa3\xb9\xed\xb6\x38\
+\x9b\xb5\x10\x85\x9e\xa2\xf0\xcf\x32\x20\x69\x74\x4c\x74\xda\x5f\
+\x22\xb6\x85\x95\x89\x59\x61\x6c\x1b\x99\xc4\x1a\x63\x84\x36\x57\
+\x92\xf8\x46\x30\x66\x0e\x54\x02\xc6\x59\xc9\xdf\xef\xc4\x7a\x24\
+\x58\x6b\xda\x9c\x4a\xf1\x62\xa5\xa9\x6d\x13\x6b\x9e\xcf\x0d\x13\
+\x6f\x67\xd3\x69\xb9\x73\xef\xde\x06\x56\x89\xd7\xd2\x09\x9f\x2d\
+\xc2\x19\x9d\x63\x43\x08\xc1\x04\x93\x17\x71\x39\xdc\x3f\x58\x6b\
+\x9a\xa6\x38\x3a\xd8\x1f\x4d\x27\x93\xc1\xe1\xfe\xde\xd0\xda\x33\
+\x69\xab\x0b\x94\x94\x25\xc0\x63\xa1\x55\x55\xc5\xc3\xfb\xf7\x46\
+\x8f\xda\x26\x07\x91\x25\x9f\x56\xee\x5f\xb1\x06\xcd\x18\x8a\x0d\
+\x05\x36\x79\x6e\x30\x4b\x1c\x96\x09\x40\xf6\x9e\x62\x22\xfb\x62\
+\xb4\xf4\x41\x8d\x51\xc4\x50\x56\x18\x4a\xa8\x6b\xa6\xc0\xd7\x29\
+\xf9\x6a\x04\x8e\xcb\x7b\x47\xef\x83\x79\x2c\xa0\x92\xa8\xf6\xfd\
+\x12\x3b\xed\xbd\xcc\x18\x15\x81\xc7\x12\x87\x29\x4c\x91\x1c\x59\
+\x4b\x6a\x3b\x16\x60\x9a\xb9\x63\x9d\x0a\x1f\xc1\x64\x27\xb6\xfc\
+\xd8\xd1\xa9\x14\xa4\x05\xa2\x7d\x20\x29\xc2\x36\xf0\x37\x8b\x82\
+\x51\x5d\xe7\x9d\x55\x98\xb9\x93\x18\x90\x89\xae\xe9\x5c\x94\xdd\
+\x28\x67\x03\xbe\x94\xee\xbe\x0d\x17\xd6\x7d\x4b\x89\xb0\xc1\xa2\
+\x90\xdb\xfc\xe5\x96\xea\xcc\x5c\xb5\x15\x90\x5c\xb5\x55\xfb\x0c\
+\x02\xc9\xe0\xbb\xe9\x73\xbe\x04\x48\x66\x5e\x78\x2f\x78\xef\x79\
+\x70\xff\x1e\x57\xae\x5e\xd1\x68\x63\xcc\xad\x34\x64\xf9\x8f\x09\
+\x5f\xaa\xc8\x4e\xda\xaa\x5b\x92\xe3\xdf\xbe\xa9\x97\xd6\x91\x1c\
+\x30\xa0\xa2\x62\x40\xa0\x1a\x0c\x68\xaa\x4a\x41\x91\x9d\x82\x9c\
+\x25\x65\xb9\xac\x64\x40\x4d\x57\x13\x32\x6f\x61\xc9\xf6\x8e\xe5\
+\xe2\x01\x45\x0e\xcc\x46\x23\x98\x4e\x29\x88\x74\xd0\xc3\x04\xfc\
+\x46\x8c\x8a\xe8\x75\x9e\x26\x90\xda\xd0\x53\x35\x1d\x15\xc4\xcf\
+\x12\x85\x76\x4f\x81\x57\xa2\x8a\x0e\x88\x11\xc6\x5c\x51\x36\xa9\
+\xb6\xde\xd1\x6d\x8a\x29\x78\xad\xe3\xf7\x26\xd8\xf5\x04\xee\xf4\
+\xf3\x03\x05\x8e\xe9\xda\x52\x6d\xb4\x69\xf6\xde\x15\xf5\xce\xde\
+\xcd\x16\xd0\xab\x9a\x3f\x67\xb2\x63\x36\x73\xfb\x79\x8a\x98\xfb\
+\x93\x8c\xa8\x1d\xfa\x65\x54\x92\x71\xbc\x0e\xd6\x55\x54\x29\x0a\
+\x19\x73\x26\x9b\x74\x8f\x25\xbd\x5f\x60\xdb\x68\xaa\xf7\xb8\xb2\
+\xa5\x27\x8a\x4d\x40\xd5\x02\xd6\xeb\x3d\x88\xd1\x49\x0a\xe7\xc0\
+\x7b\x2c\x82\xcd\x9c\xd7\x83\x1e\x46\x8b\x8a\xbd\x29\x6f\xae\xcc\
+\x54\x44\x3b\xaa\x63\x4c\x46\x1b\x70\x0a\x90\x74\x38\xe3\xad\x77\
+\x0a\x6a\x07\x99\x83\x62\x61\xbb\xf6\xdd\xd3\x08\x84\xde\xc7\xfd\
+\x69\xb8\x74\xd9\xe7\x40\x61\xb1\x85\xd7\x12\x19\xce\x61\x3c\x0e\
+\xbc\x0f\x2e\x82\x21\xda\xd7\x11\xec\xcd\xb7\x20\xfd\x9c\xdb\xf9\
+\xe7\xa3\x3f\xe6\x23\xc8\x6e\x74\x5f\x9b\x16\x46\x3e\xaa\xd9\xcc\
+\xaf\xcb\x29\xb7\x78\x1b\xd8\x97\xf8\x1c\xa6\x63\x1c\x13\x4b\x83\
+\x24\xe1\x1c\x3b\xe7\x11\x3a\xd4\x9f\x35\xba\x88\xf5\x3c\x0a\xde\
+\x57\xb0\xe9\x33\xf0\x99\x6f\x77\x4d\xef\xd1\xec\x14\xc3\x7e\x8b\
+\x4e\x78\x23\x07\x92\xdd\xbd\x8e\x68\xde\x24\x6a\x6b\x08\xca\xba\
+\xb0\xc6\x18\x51\x11\x2f\x13\xe5\x54\xc5\x18\x4c\xb0\x51\x23\x2c\
+\x46\x2b\x4d\x1b\x9d\xb4\x16\x23\xd2\xe6\x4e\xc6\x10\x4a\xd0\xbc\
+\x4a\x83\x71\x04\x83\x09\xc6\x38\x8c\x69\x82\x71\x45\xb0\x71\x83\
+\x20\xe2\x6d\xe3\xbd\xb5\x4d\xb3\xa0\xa6\x23\xe2\x8d\x78\xb1\xd3\
+\xc9\xc9\x20\x5e\xb9\x05\x89\x14\xec\x4c\xe4\xf5\x74\x24\x18\x4c\
+\x9c\x09\x80\x6a\x32\x29\x45\xc4\x4c\x4e\x4e\x06\x75\x55\x15\x93\
+\xa3\xfd\xa1\x39\x0d\x91\xaa\x96\x71\x5b\xe7\xc8\x9e\x56\x0b\x7e\
+\x39\x48\x3c\xd8\xdb\x1b\x75\xb7\x41\xda\x5a\x2e\x58\x38\xfc\xd1\
+\x0f\xff\xbb\xdf\xfb\xbd\xdf\xfb\x1b\xa4\x68\x50\xa1\x30\xa9\x79\
+\x3c\x63\xb0\x79\x1f\x9f\x15\x05\x8f\x8c\x94\x9d\xdd\x9a\x31\x96\
+\x31\xd2\xac\x67\x40\xe4\x34\x10\xe9\x4e\x01\xe0\xe9\xf9\x5a\x0a\
+\x24\x8b\x3a\x52\x3e\xeb\x24\x2f\xe0\x18\xe2\x19\x52\x27\x90\x53\
+\xb7\xf4\xf7\xc7\xe9\x87\xec\xda\x13\xd5\xd4\xf4\x69\x0f\x4b\xae\
+\xb2\xfb\xe0\x31\x45\x95\x1a\x9a\x33\xb6\x6d\xba\x63\x3d\xae\x48\
+\x93\x79\xbc\xeb\x6a\x96\x7e\x8f\xae\x64\x51\x9b\x6f\x9d\x72\xd3\
+\xe7\x5a\x0e\x24\xcb\xf9\xfb\xe9\xf1\x16\x6b\x5d\x74\x8c\x89\x35\
+\x42\xe9\xc1\xb7\xf3\xaa\xae\x17\x16\x3b\x16\x64\xed\x11\xd7\xf4\
+\x69\x17\x92\x5a\x01\xc9\x55\x5b\xb5\x55\xfb\xf8\x9a\x34\x9e\xbe\
+\xdb\x3b\x74\xbf\x0c\x04\xad\xfd\x68\x2c\x5c\xb9\x72\x85\xd7\x5e\
+\x7b\x8d\xad\x73\xe7\xd4\x5f\x68\x4e\xa9\xbe\x6e\x3a\xcd\x1e\x42\
+\x14\xde\xa1\x2b\x0b\x02\xd0\x78\xdf\x8a\xed\xe4\xcf\x7e\x8a\x5e\
+\x56\x04\x62\x8a\x43\x5a\xb8\xe5\xac\x85\x6a\x7e\x81\x87\x21\x86\
+\xd9\x99\xf4\xb8\xde\xf6\x03\x28\xaa\xce\x10\x48\x6a\x9e\xeb\x58\
+\xd6\x2d\xbc\x29\x12\xb7\x9d\x86\x61\xb2\x67\x1f\xa8\x01\xfd\x1c\
+\xe0\xa6\xc3\xa9\x53\x33\x37\x09\x9e\x3c\xab\x06\xf4\x1e\xe0\x86\
+\x4c\xdd\xac\x8b\x88\xde\x8f\x40\x70\x01\xc0\xde\x06\x7c\x0b\x82\
+\xe2\x67\xa9\x7e\xe6\x1a\x0c\x1c\x54\x69\x7b\x01\x71\x2a\x7a\x92\
+\x72\x0b\x9f\xb1\xd8\x4b\x12\x81\x48\x8a\x2c\xde\x9e\xbb\xde\x43\
+\x62\x84\xca\x67\x86\xcf\x51\x06\x36\x13\xe5\xe7\x02\x50\x32\x1c\
+\x16\x9a\xa3\xf2\x80\x3e\xfd\x35\x95\xdd\xc8\x41\xef\x95\x39\x70\
+\x39\xc2\xb9\xba\x05\x73\x1d\xd0\x89\x0b\x6f\xb4\x3b\x9d\xc5\x3a\
+\x89\x6a\x9f\x2e\xe6\xd5\x49\xdc\x9f\xc3\x45\x0a\xa5\x2b\xc0\x3b\
+\x01\xe3\x1c\x4e\xa3\x65\x56\x81\xa0\x6d\x9d\xed\xf9\x9d\x8d\x65\
+\x12\x6c\xdb\x3f\xfa\xba\x07\x2e\xe2\xf1\x8b\x53\xa0\x1d\xde\x61\
+\xf1\x94\x1a\x35\xcd\x0c\x85\x08\x1c\x15\xd0\xf6\x80\xa5\xeb\x47\
+\xf3\x7a\xef\x83\x3f\x1d\x68\xea\x66\xd2\x39\x06\x14\x5b\x66\x12\
+\x33\xf9\x6b\xbf\x04\xf4\xe2\x43\x06\xc0\x7c\x36\x16\x9f\xd1\x7b\
+\xb3\xd7\x7b\x46\xbc\xb7\x58\xb6\xbc\xe7\x39\x62\x84\x78\xe4\x62\
+\x7f\x04\x8d\xe0\x91\xdd\xd7\x67\x75\x8c\xec\xda\x98\x61\x9a\xa8\
+\xa4\xc9\xea\x2b\x01\xe3\x22\xf0\x0f\x59\x54\x78\xfe\x39\xb5\x2a\
+\xea\x9a\xcb\xe6\x1c\x31\x57\x0c\xbc\xdd\x4f\x67\xac\x3f\x3c\x03\
+\x48\x8e\x33\x10\x99\x97\xf0\x31\x3d\x50\xad\xc7\x55\x20\x69\xda\
+\x8e\xec\x72\x16\xe3\x1f\x21\xc4\xdc\x48\x1b\xa3\x82\x11\x5c\x25\
+\x0a\xac\x60\x82\xc9\xf2\x2a\x25\xb4\xaf\xad\xc5\xd4\xa1\x05\x99\
+\xc6\x9a\x60\x44\x82\x68\x54\x53\xbc\xb7\xde\x7b\xeb\x8b\x26\x84\
+\x36\x82\x18\x91\x9b\x88\x18\x11\x31\xe2\xbd\xcd\xef\xf3\xfb\xd2\
+\xdc\xd1\x6d\xc5\x7b\x1b\x44\x6c\x53\x57\xae\xae\xea\xe2\xe4\x78\
+\x32\x30\xb6\x58\x0e\x0f\x8d\x71\x84\xe0\xbb\x97\xc1\x84\xf0\x68\
+\xd1\x9d\xe9\x9d\x77\xfe\xfe\xe8\x89\x9b\xff\xfd\xe4\xf8\xe8\xd4\
+\x48\x71\x13\x41\xcd\xf8\x74\x6c\xf0\x3e\x60\xc4\x23\x3e\x7b\x14\
+\x88\xec\xe5\xf5\x2d\x6f\x63\xa4\xcb\x4f\xd6\x9a\xa7\xf3\x40\x26\
+\x67\x80\x9c\xe5\xcc\x1c\x2e\x03\x92\x0d\x4d\x04\x3d\x05\xd0\x34\
+\x41\x9d\x7e\xbf\x4c\x64\xa7\xe4\xd7\x61\x14\x90\x07\x79\x0c\x80\
+\xf6\x41\x00\x74\x64\x15\x64\xb3\x85\x7c\x78\x5e\xa6\xb5\x18\xc1\
+\x62\xa5\x8d\x47\x06\x3d\x58\x16\x4d\x6d\x1e\x7b\x28\x28\xf3\xa1\
+\xdd\x47\x54\x7b\x15\x07\x5c\x6b\x9a\x4e\x90\x6c\x01\x44\xc6\xb9\
+\xa7\x6c\x9f\xfb\xb8\x4e\xb8\x85\xdd\x47\x07\x52\x7a\x14\x6d\x6f\
+\x5e\xd5\xf5\x42\xd7\xd2\x53\xc7\xb8\xce\xf7\x05\x1f\xbc\x16\xe7\
+\xaa\xad\x80\xe4\xaa\xad\xda\x4f\x77\xf3\x69\x01\x51\xe5\xd5\xb0\
+\xac\x24\x92\xc2\x96\x2b\x57\xaf\xf2\xd6\x5b\x6f\xb1\xbf\xb7\xcf\
+\xda\xda\x18\x8c\x6d\xa1\xa4\x49\xf8\xe1\x14\x1b\xc4\x60\xa2\x8e\
+\x1a\xd1\x90\xf3\x4d\x43\xe3\xfd\x02\x90\xec\xf4\x24\xdb\xe4\x87\
+\x79\x0f\xf0\xfc\xc2\x7d\x89\x18\xb1\x38\xe8\x2d\xf0\xb3\x76\x71\
+\x98\xc7\xb9\x23\xfd\xce\x9d\x7c\xfb\x2a\x6e\xfb\x84\xee\xab\x51\
+\xa3\x79\x0f\x61\x57\x72\xb1\x9d\x6e\xbf\xc7\xba\x9d\x29\x29\x9d\
+\xa5\x76\xb3\x0c\x82\x5b\xcb\x43\x11\xde\x4c\xa0\x69\xd6\x2d\xd9\
+\x29\xc9\x3f\x07\xbf\xc9\x08\x8e\x6a\xaa\x1d\x88\x74\x16\x5b\x08\
+\xf2\x74\x3c\x56\x8a\xce\x32\x02\xae\x59\xcb\xc8\x8b\x2f\x19\x52\
+\x30\xb3\x43\x90\x4a\xcb\x5b\xe4\x46\xcf\x1a\x50\x96\x94\x65\x4d\
+\x6d\x33\x63\x3c\xaf\x3f\xb9\x07\xf6\x9a\x02\xb8\x92\x48\x35\xec\
+\xf6\x63\xad\x47\xe4\x84\x2e\x8f\xad\x20\x52\x25\x93\xe7\x37\x9d\
+\xd7\x5e\xdc\xbf\x74\xaa\xb3\x31\x09\xb6\x8d\x84\x59\x4b\x61\x0c\
+\xa5\xf7\xe9\x9a\xc5\x66\xe2\x30\x89\xd4\x17\xfb\xc6\xa7\xfb\xd7\
+\x0a\xa9\x18\xef\x31\x2e\xe6\xbd\x98\x68\xe5\x63\x11\x0b\x4e\x5c\
+\xaa\x3b\xd8\x7e\x0e\xd6\xf7\x15\x73\x4b\xe0\x32\xa9\x5c\x88\xe5\
+\x1c\x62\xd7\x41\x26\xe8\x49\xfb\x7c\x68\x45\x63\x22\x95\xb9\x70\
+\xf3\x16\xfb\xf2\xc4\x4a\x8c\xd3\xef\xfb\xfc\x1b\xfe\xb1\x10\x81\
+\xe9\xc6\x42\x04\xab\x7d\x70\xdc\x9d\x84\x5f\xc0\x10\x9e\x0c\xc4\
+\xe7\x5e\xa1\x2d\x75\x26\x3c\xcc\xf6\x94\x76\x38\x50\x6a\xe9\x7b\
+\x7a\xef\x9e\x69\xe9\xc5\x7d\x31\x9c\x5d\xe0\x35\x1d\xef\x41\xa9\
+\xc9\x26\x7b\x9e\xae\xc7\xbe\xb5\xe2\xa3\xc3\x27\x81\xd0\x14\x2d\
+\x1c\xd3\xe5\x25\xcf\x47\x52\xe7\x45\x2c\x0a\x1b\x07\x9c\xe1\x14\
+\x81\x8b\x33\xfa\x6d\x3e\x1f\xf2\xd4\xef\x87\x2c\xcc\x67\x42\x84\
+\x4f\x21\x04\xba\x7c\xc9\x60\xc4\x1b\x0c\xc6\x48\x08\x01\xfd\x3f\
+\x46\x2a\x43\x2a\x11\x12\x89\xb1\xaa\xce\x83\x08\x4a\x85\x8d\x62\
+\x3d\xc1\x74\x74\x59\x6b\x82\x88\x98\x20\x62\x7d\x23\x3d\xae\x5e\
+\xfc\x25\xb6\x69\x6a\x67\xad\x0d\xf3\x28\x59\xce\x34\xb6\x0d\x92\
+\xcd\xd5\x36\x8e\x35\x0b\xd0\x88\x38\x11\x6f\x67\xd5\xac\x74\x27\
+\x8b\x40\xf2\x5f\xfe\xd1\x3f\xf9\xfe\x5f\xff\xf5\x7f\xe7\x25\x3e\
+\x40\x34\xa5\x69\x1a\xa6\x27\x93\xc1\xa3\xb6\xe9\x80\xd9\x4f\xb6\
+\x3d\x06\xd8\xca\x95\xa4\xa1\x3f\xfe\x7a\x8e\x90\x33\xfa\x2b\x7d\
+\xb6\x58\xf7\x38\x52\x4e\x43\x43\x93\x8b\x71\x4d\x80\x6f\x03\x7f\
+\xba\xe0\xe0\x9d\xfb\xfd\x98\xcf\x01\x8f\x00\x3c\xd9\xfe\x65\xe9\
+\x01\xce\xf0\xba\x46\x46\xc4\x19\xd3\x58\x1c\xca\x4b\x48\xad\xd2\
+\x03\x78\x8f\x75\xae\xd1\xd1\x24\xbd\x7d\x08\x02\x8e\x2d\x3c\x7f\
+\x8d\x45\xb1\xbc\xf9\xe9\xb9\x73\x0a\x77\x94\xf7\xf9\x7b\xb5\x45\
+\xa2\xbd\x46\xa7\x61\x58\x32\xa7\x5c\xcc\x70\xef\xc2\xe3\xa8\x20\
+\x32\xad\x83\xab\xb6\x02\x92\xab\xb6\x6a\x9f\x41\x20\xe9\x55\xef\
+\x5b\xd9\xac\x9a\x41\x14\xa1\xe1\x5c\x69\xc8\xc1\xa0\xe4\xd6\xad\
+\x67\xf9\xc1\x0f\x5e\x8d\x08\xa3\x2c\x88\xa5\x22\xbb\x3c\xc8\xc4\
+\x68\x35\xc1\x10\x8c\x52\x5f\x33\xe1\x9d\x14\x91\xf4\xbe\xa1\x69\
+\x9a\x48\x31\x5b\xe6\xf1\xab\x7b\xf3\x82\x65\x51\x58\xe7\x22\x51\
+\x1c\x24\x00\x87\xce\x71\xe4\xfd\x02\x3d\xd5\x66\x46\xc2\x79\xba\
+\x7c\x2e\xf5\x56\x0e\x8a\xae\xf2\x41\x95\xca\x57\x68\xd9\x8e\x36\
+\xa7\x72\xa3\x03\x4f\x03\x60\x16\xa2\xc0\x8b\x2d\x40\xd6\x81\xa2\
+\xa6\x76\xcc\x70\x5a\xbf\x30\xe0\x1c\xe2\xfd\x31\x70\x59\x97\x9e\
+\x22\xb3\xfd\x13\xf8\xdd\xa2\xab\x31\x99\xa8\xad\xe7\xf4\x6f\x0b\
+\x14\x03\x06\xae\xa2\xda\xd0\xf7\xf6\xe9\x2b\xd8\xee\x89\x60\x70\
+\x0e\x66\xde\x29\x18\x7a\x97\x4e\xb4\xa6\xd0\x73\xbf\x00\x1c\xd5\
+\x5d\x49\x90\x0b\x7a\xac\xfd\x0c\xc4\x5e\x02\x39\xaf\xfd\x32\x53\
+\xe0\x10\x95\xea\x66\xc1\x29\x1d\xf5\x8a\xb5\xf8\x98\x47\x59\x0c\
+\xa0\xa9\xf4\xfc\xc3\x60\x40\x51\x55\x58\x6b\x39\x96\xe8\xd5\xcf\
+\xe9\xae\x1a\x5d\x74\x25\xde\x07\x11\x9b\xf6\x67\xe6\xae\xc7\x46\
+\xe0\x66\x59\x78\xbf\x2f\x9a\x92\x47\xaa\xf4\x38\x22\xaa\x7e\x9b\
+\x03\x3c\x33\xf7\x7d\x14\x54\x07\x6b\x99\x8a\x30\x43\xe4\x35\xa2\
+\x93\xe0\x1c\x11\x7c\x4e\x71\xae\xc2\x23\xae\x53\xe0\x69\xd5\x7f\
+\x4f\x8b\x36\xce\x19\x16\x6d\x74\xd0\x79\xa5\xb2\xe2\x48\xe1\x4b\
+\xc7\x99\x41\x49\xab\x21\x2a\xeb\x9c\x37\x3d\xaa\xac\xe6\xf7\xf9\
+\x05\x3f\x8a\x9f\x7f\x65\xe7\x0c\xa1\x87\xc0\x5b\xc4\x72\x35\xd6\
+\xb5\xe5\x18\x7d\xda\xe7\x8e\xde\xeb\xfc\x9e\xe4\xc8\xc4\x22\xd4\
+\x74\xb5\x36\x97\x28\xa1\x72\xac\xa6\xde\x5c\xd9\x12\x86\x3a\x1e\
+\x77\xe9\xe4\xf3\xe7\x8d\xe1\x81\x3a\x6f\xea\xe4\x24\x11\x24\xd5\
+\xbd\x8c\x06\x70\x78\xac\xfc\xb0\x94\xbb\xd9\xee\xdf\xc6\xe0\x48\
+\x77\x9e\xf1\x86\x9a\xa4\xda\x9a\x40\xa3\xc7\x93\xb2\x11\x23\x2e\
+\x0c\x21\x06\x2a\x09\x01\x4f\x9c\xc2\xcc\x02\xfd\x15\x30\xc6\x58\
+\x8c\x31\xc1\x5a\x22\x74\xcc\x15\x60\x5b\xd8\x19\x30\x62\x42\x08\
+\xc1\xc6\xc8\xa3\xf2\x56\x7b\x46\xb8\x98\xf5\xcd\xcd\xc9\x8b\x5f\
+\xfc\xd2\x1d\xe7\x3e\x5c\x1d\xc9\xc3\xbd\xbd\xd1\xf7\xbe\xf9\xf5\
+\xa7\x42\x04\xae\xa6\x9a\x4e\x0b\x67\xdd\xc2\xb0\x9b\x4c\x26\x76\
+\xb6\xa4\x1c\xc9\xe3\xb4\xd0\x34\xf8\x33\xbe\x1b\xf6\x76\xfe\xab\
+\xdf\xff\xfd\xdf\xff\x0d\x3e\xfd\x65\x3f\xf2\xb1\x9a\x3b\x2d\xed\
+\x12\x67\x85\xe3\x6c\xd5\xd6\x54\xff\x76\x84\xa3\xee\x3d\xe8\xcb\
+\x91\x6c\x49\xa4\x8b\x5f\x39\x1d\xc0\xe5\x74\xf8\x47\xcc\x1e\x0b\
+\xb3\x89\x35\x69\x9c\xf9\x0f\xa9\xd9\x1b\xb0\x06\x2f\x8f\xf6\x6c\
+\x9c\x39\x39\x2e\x78\x40\x96\xee\xee\xcc\x73\xf5\x6c\x92\x52\x23\
+\x96\x00\xe4\xac\x9d\xd3\xb9\x7d\x69\x7e\xb5\x7e\xaf\x22\xb2\x73\
+\xae\x9e\xd2\xad\x6b\x40\x89\xb5\x43\x44\xd2\x7d\xfa\x7f\x72\x93\
+\x08\x78\x05\xf8\x4b\xe0\xf5\x0f\xd1\x33\xab\xb6\x02\x92\xab\xb6\
+\x6a\x3f\xbd\xed\xfd\xd6\x2b\xbb\x72\xe5\x2a\x3b\x3b\x0f\xb9\x73\
+\xe7\x0e\x9b\x9b\x9b\xe4\xba\x11\x79\x2e\x64\x57\x99\xb2\x4b\x57\
+\xca\x19\xb4\xde\x7b\x9a\xa6\x49\x42\x3d\xc5\x99\xf3\x42\x54\xe6\
+\xf4\xba\x98\x5f\x50\x10\x19\x88\x74\xcb\x7d\xe0\x3c\xde\xd5\x44\
+\x45\xd0\x84\x7a\x0d\x55\x35\x26\x52\x4f\x27\x6a\xa8\xee\x28\xf8\
+\xd1\x02\xf5\x95\x1a\x04\x15\x25\x65\x51\x53\xcf\x74\x5b\xbf\x60\
+\xe0\x0f\x06\x45\xac\x2f\x38\x20\x8a\x32\xc8\x53\xc4\x28\xce\xb8\
+\xa0\x70\x0d\x8d\xa3\x6a\x0d\xd6\x21\x70\xd3\x62\x1f\x8a\xc8\x7e\
+\x06\xec\x42\x41\x31\x68\x68\x52\xf4\xee\x90\x3e\xb5\xf5\x8e\x12\
+\x83\x54\xd4\xa6\x72\xba\x18\x4e\xf4\x9c\xd3\x7e\x1a\x7d\x7f\x3d\
+\x45\xcd\xb4\x66\xde\x65\x05\xcc\x29\xa7\xb0\x96\xb8\x50\x36\x14\
+\x45\x41\xd3\x38\xfd\xee\x1e\x1d\xb5\x75\x53\x8d\x9f\xe9\x1c\x90\
+\x50\xaf\x7a\xe5\xac\x65\x4b\x04\x27\x42\x15\x3f\x6f\x2c\x1d\x1d\
+\xd1\x56\x55\x04\xe7\x22\x5c\x89\xfb\xb0\x05\x48\xa1\xe7\x14\xb3\
+\x81\xbc\xc6\xe7\xe2\xbd\x74\x19\xa8\xd5\x5c\x17\x3b\x8e\x91\x48\
+\x71\x89\x3a\xa9\xf4\xc6\x92\xae\x2c\x86\xcd\x40\x83\x15\xe4\x22\
+\xc2\xc8\x46\x05\xd9\x7b\x58\x82\xed\x17\xd3\x5e\xb7\xd8\xfb\xd2\
+\x66\x8f\xb1\x03\x7c\x45\xa4\xa5\xfb\xa6\x52\x31\xe7\x81\x1b\x0e\
+\x9e\xf2\xde\x9f\x57\x63\x66\x92\xf5\x49\x1e\x49\x7b\x64\x54\x40\
+\xa3\x83\x51\xd1\x75\x2e\x71\xf2\xd1\x4f\x9b\x18\x87\xb3\xf3\x11\
+\xcc\xb6\x5e\xa2\x3f\xcd\x32\x6b\x5f\xcd\x47\x52\xf2\x82\xea\xc6\
+\xa3\x11\x5d\x4f\x50\xd0\x9a\x72\x88\xce\x03\xeb\xda\xe7\x36\x8b\
+\x04\xe4\xfb\x1b\x66\x8e\x0e\x13\x43\x10\xb6\x06\xd9\xa7\xbb\x4f\
+\xf9\xb1\xab\x6c\x9c\xaf\x75\x0e\x9c\x85\x36\xd5\xed\x6a\xdd\xc7\
+\x86\x73\x58\xef\x09\x31\xf2\x8c\xd3\xf3\x3b\x8d\xda\xba\x46\xa4\
+\xa1\xf5\xee\xcf\x1c\x5b\xef\xcc\xa8\x64\xd7\x4f\xbe\x75\x77\x29\
+\xa6\x0c\xfa\x77\x2b\x6c\x63\x82\xe9\x10\x67\xf0\x04\x13\x59\xd2\
+\x26\x04\x83\x35\x98\x18\xb2\x04\x8b\x91\x20\x29\xca\x19\xa9\xab\
+\x60\x32\x26\x29\xb1\xb8\x48\xfc\xe3\xf2\xb5\xeb\xfb\xbf\xf9\x77\
+\xfe\xb3\xd7\x9d\xfb\x70\xe9\x56\x6f\xbe\xfe\xc3\xf1\xed\x37\xdf\
+\xb8\x50\x37\x4d\x11\x42\xb0\x52\xd7\xae\xa9\xab\x85\x39\xf6\xe6\
+\xcd\x9b\xb7\x96\xbd\xff\x48\xc4\x7e\xb8\xff\x5f\x84\xcd\xed\xdf\
+\xe5\x8c\xef\x9a\x47\x97\x75\xfa\xb4\xb5\x72\xce\xe9\xb4\x2c\x5f\
+\xbe\xe4\xec\x88\xe4\x21\x31\xfa\xff\x05\x3c\xdf\x7e\x8c\x63\x8e\
+\xd5\xc1\xd3\xc4\xd4\x5b\x02\x58\x63\x6d\xa7\x55\xea\x25\xb4\x0f\
+\xb6\x55\x9f\x96\xd8\xc5\x68\xe2\x52\x7c\x27\x1f\x1d\xae\x11\x04\
+\x8b\x35\x49\x82\x49\xc5\x98\xe2\xf9\xea\x3b\xf2\x3e\x70\x94\x8d\
+\xeb\x84\xe2\x5d\xe9\xb2\x6b\xa5\xbb\x9a\xee\x18\x71\xfb\xac\xd4\
+\x53\x72\x7a\x66\xe2\xd8\x7a\xbf\xe2\x94\x5b\x5a\xcb\x58\x8c\xfb\
+\x5f\xf0\xfe\xc5\x65\xcf\xbe\x3a\x04\x8f\x81\x1f\x2a\x98\x5f\x72\
+\x8e\xf6\x50\x90\x3f\x2b\xc4\xbe\xd3\x20\xcf\x01\xb7\x80\xff\x89\
+\x2e\x42\xb9\x06\xfc\x47\xc0\x3f\xd6\xf5\x70\x55\x02\x64\x05\x24\
+\x57\x6d\xd5\x3e\x7b\xcd\x8b\xa8\x32\x6b\x4a\x8a\xcc\x12\x19\xb3\
+\x90\xa4\xf2\xbd\x30\x21\xf0\xfc\xf3\x9f\x63\x32\x99\xf0\xee\xbb\
+\xef\x72\xe1\xc2\x05\xa2\x57\x7e\x89\x31\xd1\xe6\x4a\xb6\xaa\x3b\
+\x1a\xbd\x04\x69\x04\xdf\x78\x6c\x61\x5b\x83\x43\x11\x52\x48\x75\
+\xa8\x34\xaf\xc5\xa9\x31\xbb\xa9\x13\xb9\x27\x46\x38\x1e\xea\xda\
+\x69\x88\x65\x25\x72\x55\x4e\xca\x50\x99\x3a\xa9\x39\xc6\xc5\x3d\
+\xd5\xaa\x33\x2c\xa9\x07\x16\x8a\xda\xd1\x2c\x35\x72\x23\xb0\x0a\
+\x41\x01\x56\x05\x42\x43\xa4\x03\xbe\x0d\xbc\x1c\x81\x61\xa9\xd1\
+\xcd\x54\xf8\x9c\x7b\x82\xbc\x4d\x57\x8e\xc3\x96\x94\x46\xa9\xbb\
+\xf7\xc1\x3d\x80\x50\x2a\xa3\xd2\x68\x1e\xe0\x55\x5d\x38\xdf\xa4\
+\xef\xfd\x7e\x42\xcf\xdf\x64\x60\xf2\xaa\xfe\x2e\xca\x92\xc2\xd7\
+\x9c\x27\x2f\xb1\xa0\x8a\xa7\xc4\xe8\x67\x05\x4d\x41\x51\x04\x9a\
+\xe6\x40\xfb\x2d\xd5\x7b\x9c\xe9\xb5\x5c\xa5\x53\x4d\x1d\x82\xbd\
+\xac\x79\x25\x4e\x84\x03\xba\x88\x54\xde\x6f\xf9\x39\x0e\xf5\xd8\
+\x95\x82\x93\xf9\x7c\x22\xa7\xc6\x4d\xae\xf2\xfa\x96\x7e\xf6\xb2\
+\xf6\xc3\x06\x86\x9b\x12\xe4\xdb\x74\x11\xc5\xb1\xf6\xe7\x05\xbd\
+\xff\x5b\x44\x7a\xe5\x8b\xc0\x8f\x80\x3f\x12\x64\x87\xc8\x84\xb2\
+\x73\xb6\xd5\xaf\x0b\xbc\x1c\x0d\x06\x6b\x34\x62\x56\xe4\x36\x97\
+\x96\x8a\x79\x00\x3c\xf0\xf0\x5d\xa2\x72\xe9\x33\x3e\xf6\x79\x52\
+\xcc\x4d\x06\x4c\x4f\x8c\x24\x37\xde\x5a\x7d\x94\xec\x0d\xdb\xb3\
+\xe5\x72\xed\xfe\x45\x24\x24\xf1\x1a\xb7\x2d\x36\xf4\x72\x2e\x73\
+\x8a\xab\x27\x24\xc1\x98\x4c\xe0\x67\x5e\x6d\x33\x8f\xca\x85\xcc\
+\xe0\xb9\x80\xb5\x33\x44\xac\xa7\x8d\x9a\x5a\xbd\xef\xed\x3d\xf2\
+\x73\x40\x54\x01\xfb\x90\x28\xb6\x34\xd6\xbe\x3a\xe9\x9e\x23\x31\
+\x3a\xee\xf2\xd2\x2f\xf9\xb9\xa4\x4b\x4c\x51\x84\xf9\x67\x2c\x39\
+\x36\x92\xc4\xfe\xc0\x62\x8d\x32\x25\x12\x15\x6e\xf7\x0c\x10\x9a\
+\xf2\x27\xfd\x12\x10\x3d\x1f\x39\xcd\x51\x64\x57\x16\x21\xd2\x5a\
+\x17\x41\x65\x0c\x4b\xe6\xb9\x94\x31\xc7\x32\x86\x28\x13\xad\x35\
+\xa2\xc1\xd0\x22\xce\x38\x83\x1a\x6b\x90\x18\x99\xb4\xca\x9e\x05\
+\x31\x78\x31\xa1\x68\xf3\x7a\xdb\x11\x21\x60\x26\xd3\xe3\x81\x88\
+\x37\xce\xb9\x60\x9d\x5b\x88\x7c\x8b\xf7\x26\xbd\x2f\xd1\x81\x84\
+\x75\x2e\x2c\xfb\xbb\xae\x22\xc8\xf3\xe2\xed\xe1\xd1\xd1\x5a\xd5\
+\x34\x05\x21\x74\x92\xd5\xd6\x96\xdb\x37\x9e\x5a\x3b\xdc\xdf\xe7\
+\x71\xea\x08\xa7\x2d\x06\xd5\xf4\xb7\xaa\xe1\xe8\x7f\x65\x7f\xff\
+\x54\x01\x92\x41\x35\xfd\xad\x3f\xfc\xc3\x3f\xfc\xcf\x75\xee\x3b\
+\x1b\x4e\xb4\x7e\x09\x39\x1d\x10\x7d\x02\xcd\xc2\x50\x74\x7c\x66\
+\x91\xfd\xa9\x36\xf8\x83\x00\x00\x20\x00\x49\x44\x41\x54\x67\x74\
+\x6c\x26\x27\xca\x26\x05\x4e\xeb\xdd\xce\x5d\xb4\xf2\x5a\x2a\xbe\
+\x02\xfc\x5b\x3a\x57\xbd\xf5\x88\xc3\xd6\xc0\x0f\x80\x3f\xef\xe6\
+\x09\x99\xc3\x7f\xd2\x03\x73\xa7\x4c\x21\x4b\xde\x8a\x65\x87\x94\
+\x8e\x1a\xb2\x09\xc5\xf0\x01\xa3\x93\x42\xe7\xa5\x8b\x34\xd3\x58\
+\x6a\x29\x45\x4a\x9d\xfe\xf9\x38\xd1\xcf\x44\x83\xed\x4e\x5e\xda\
+\xf9\xce\xe3\x03\xce\x19\xf1\x3e\xe0\x68\x8f\x11\x17\x60\xbf\x29\
+\xf0\xd7\xe6\x01\xbd\xef\xee\x5b\x00\x5e\x12\xe1\x2e\x03\xff\x2a\
+\x9a\xff\x7d\xc6\xa9\xb8\x33\xaf\x97\x5e\x0e\xe6\x05\xe0\x0b\x19\
+\x90\x5c\xd7\x31\xee\x57\x20\x72\x05\x24\x57\x6d\xd5\x3e\xb3\x4d\
+\x1e\x9b\xf3\xd2\x95\x06\x09\x18\x5e\x7a\xe9\x45\x8c\x31\xdc\xbd\
+\x7b\x97\xc1\x60\x40\x51\x14\x73\x26\x07\x6d\xde\x65\xca\x9b\x8c\
+\xc0\x32\xd9\x65\x9e\xc6\x37\x14\xa6\xa0\x28\x28\x23\xf3\xa7\x80\
+\x02\x9a\x28\x44\x90\xd8\x40\x2e\x33\x44\x8f\x14\xf4\xf8\x25\x76\
+\x4e\xaf\xfc\x47\x5d\xa7\xf5\x85\x07\xc4\x88\x07\x73\xc6\xf5\xbc\
+\x67\x39\x8f\x0c\xa6\xfa\x77\xdb\xea\xfd\xbc\x4f\x5d\xdb\xcc\xe8\
+\xb0\x12\xf7\x29\x0a\x2d\x1c\xd4\xae\xf5\x6b\xc7\x62\xc7\x53\x35\
+\xd2\x37\x51\x15\x3f\x05\x91\x9a\xe3\xe8\x9f\xb4\x30\x11\x70\x25\
+\xd8\x3a\x66\xd4\xd5\xfa\xbd\x00\x38\x8d\x92\x26\x2a\xea\x43\xca\
+\xd2\x51\xd7\x41\x5f\xd7\x09\x5c\xd6\x35\x4e\xbd\xab\x6f\xa9\xf1\
+\x93\xfa\x62\xa0\x8b\xde\x31\x4d\x61\xa1\x19\x18\xcc\xf5\x40\xd8\
+\x55\xe3\x3c\x19\xf6\x97\xe8\x22\x99\x23\x84\x6d\x90\x23\xc0\x94\
+\x50\xd4\xf1\x7c\x12\x68\x4f\xe2\x03\x17\xb5\x7f\x87\x59\x3f\xee\
+\x2b\xd8\x88\xc5\xae\xa5\x85\x53\xa9\x56\x57\x98\xf3\xfa\x3f\x00\
+\xfe\x58\xfb\xba\x01\x86\x04\xfe\x0e\x51\x54\xc7\xea\xd0\x7c\x0f\
+\xf8\xe7\xc0\x97\xf4\x7a\x8e\xf5\x3c\x6e\x03\xff\x64\x1d\xfe\xea\
+\x38\xbb\x89\xeb\xba\x81\x8e\x26\xd7\x20\xdb\x38\x1a\x22\x30\x71\
+\x7a\x4c\x77\xaa\xed\x10\x01\xe5\x03\x3d\xdf\x6b\xc4\x28\xe6\x14\
+\xe7\xf6\x22\x35\x97\xbe\xc1\x43\xdf\x16\x6a\xe9\xaf\xb2\x40\x5e\
+\x3c\xc3\x40\x6b\xdb\x0d\x41\xbe\xac\x51\x5b\x1d\xc0\x8b\xd9\x90\
+\x71\x10\x07\x23\x6d\xf6\x72\x27\x82\x28\xc8\x0d\x3a\x0a\x69\xca\
+\xfb\xd5\x88\x60\x97\xf7\xa5\xfb\x4d\xf9\xba\x6f\xc6\x51\x6b\x5f\
+\xd0\x7c\x22\x43\x1f\x6c\xae\xeb\xbd\x7b\x4b\x8f\x93\xe7\x48\x6e\
+\x64\x4e\x1a\x9f\x03\x39\x05\xa0\x17\xf4\x18\xc3\xcc\x91\x33\xff\
+\xec\xf6\x80\xdf\x7c\x64\x31\x33\xe6\x4f\xb7\x06\x1d\x03\xcd\xbb\
+\x35\x67\x60\xa1\xce\x41\x96\x1b\x8b\x21\xfb\x4c\x01\x62\x0b\xfd\
+\x4d\x20\x13\x9f\xc9\xf2\x2a\x63\x6c\x32\x84\xa0\x2a\x23\xaa\xe0\
+\x6a\xc4\x18\x2c\xc1\xf8\x80\x85\x20\x1a\xad\x34\xc1\x88\x60\x42\
+\x04\x9d\xf1\x4e\x64\x0e\x89\x20\x72\x26\x7d\x37\x01\xc4\xf4\x7b\
+\xfe\xfd\xbc\x5d\xbb\x71\x73\xf6\xf2\x97\x7e\xfe\x9d\x37\x7f\xf8\
+\xda\xa5\xfd\xdd\x5d\xff\xc5\x5f\xfc\xa5\x1f\x5d\xba\x7a\xed\x78\
+\xae\x33\x8a\xf0\x98\xf2\x37\xef\x7d\xfb\xeb\xff\x43\xbb\xef\x2f\
+\xfe\xfc\x7f\xfb\x18\xdb\x03\xfc\xc9\xe3\x40\x93\x45\xb0\xf4\x93\
+\x69\x16\x36\x25\xd6\x74\x4c\x4f\xdc\x39\xe0\xdf\x06\x7e\x25\x5b\
+\x13\xc6\x34\x98\x01\xb8\x54\x0b\xb2\xa2\x55\x87\x4b\x35\x0c\xa7\
+\xc0\xb7\x88\x22\x3a\x5b\xd9\x74\xb4\xac\xa5\x94\x8b\x27\x3e\x06\
+\x17\xf1\x72\x15\x69\x7f\x6a\x07\x18\x84\x60\xb1\x46\xac\xcc\x39\
+\xc1\x4e\x3b\xc4\x92\x02\x48\xfe\x71\xfa\x5a\x85\x7e\x92\x90\xce\
+\xe2\x59\x77\x68\xd4\x43\xb0\x18\x11\x1f\xb2\xf9\xa6\x88\x7e\x13\
+\xdc\x92\x8a\x4a\x57\xe3\xdd\xe0\x2f\xa8\xb0\x1a\xd6\x3c\xcb\x3f\
+\xe2\x38\x9b\x65\x92\xa7\x59\x9c\x03\x7e\x3d\x9b\xc7\x9e\x05\xbe\
+\x4e\xaf\x7c\xe5\xaa\xad\x80\xe4\xaa\xad\xda\x67\x0d\x48\x4a\x4c\
+\x05\x0c\x0a\xb1\x96\x54\xfe\xe8\x59\x50\x6d\x71\x39\x57\xf0\xe2\
+\x8b\x2f\x02\x70\xfb\xf6\x6d\xc0\x30\x1e\x8f\x7a\x40\x32\xd5\x8c\
+\x5c\x7e\x5c\x8f\xf7\x1e\x6b\x2d\x4d\x88\xcf\x7e\x43\x13\x96\x98\
+\x36\x71\xa2\xb7\xec\x21\xdc\x3d\x73\x29\xec\x03\x84\x65\x09\xf6\
+\x64\xa0\xb4\xb7\x7d\xd3\x60\x33\xd0\x97\x0c\xe5\xc3\x16\x48\x64\
+\xdb\x4a\x04\x8f\x43\xe0\x32\xc8\x1a\x14\x8e\x48\x57\x4d\x46\x6d\
+\xe9\x3d\xcf\xe8\x77\x8f\x48\x25\x30\x22\xca\x1c\xc5\xef\x71\x5b\
+\xb4\xbe\x63\xdd\x2d\x4c\x0f\x89\x05\xe9\x0b\x8f\x77\x2a\x8e\x73\
+\xa8\xa0\xcf\x29\x98\x4d\x80\x73\x4f\xcf\xd7\x51\xe2\xa8\xdb\x48\
+\xe8\xa8\x5b\xfc\x6c\x0d\x32\x8d\x73\x6b\x63\x01\x1b\x08\x07\x44\
+\xb5\xd9\xd4\xb7\x29\x92\x74\xa0\x00\x2e\x78\xcf\x9e\xee\xdf\xd6\
+\x9d\x3a\xea\x65\x60\xb7\x2c\x71\x75\xdd\x52\xbc\x26\x73\x0b\xed\
+\x55\x62\x4e\xc9\x1b\x4d\x8c\x3c\xaa\x18\x4e\x0f\x3c\x6e\xe8\xf5\
+\x3b\x62\x6e\x5e\x4d\x57\xec\xfe\x24\x01\x23\xef\x31\x51\x8e\x9f\
+\x62\x30\x40\xaa\x0a\x4f\xa4\x21\xa5\xf3\xf5\x25\x3c\x90\x31\x8e\
+\x49\x37\x54\x73\xab\xad\x81\x57\x01\xd6\x86\x70\x72\x42\xc4\x52\
+\x31\xf0\xf5\x18\xc5\xee\xd7\x84\xb5\x93\x77\x39\xd1\xd2\x2b\xc3\
+\xa1\xe1\xe4\x24\x2c\x18\x3c\x8b\xb6\xd5\x87\x69\x6f\x01\x01\x79\
+\xb4\x61\x22\x48\x1a\xab\x07\x6a\xe0\x3c\xd0\x67\x43\xe8\x8a\x6f\
+\x07\x05\xf7\x3f\x02\xae\xa9\x8b\x7d\x3e\xf2\x76\xa8\x9d\x52\xa8\
+\xe5\xd8\x07\x9b\x31\x44\xb4\x47\x8c\xbe\x27\x7a\x5f\x0e\xd8\x8e\
+\x14\xd4\x17\x0a\x1a\x4d\x52\xb3\xc5\x52\x23\xec\xe8\xb8\x4e\x94\
+\xb4\x38\x41\x74\x75\x35\x13\x6d\x75\x4b\xf7\x31\x3e\x05\x70\xf6\
+\xa6\x04\x37\x77\x07\xce\x14\xf0\x89\xc7\x0a\xf9\x45\x6b\xfc\x10\
+\x8b\xa5\x27\x52\x9a\x40\xa4\x05\x09\x26\x44\x23\x34\xcc\x4f\x7f\
+\x04\x62\xf6\x23\x58\xac\x0f\xba\x0f\x1f\x21\x66\xca\xb9\x6c\x05\
+\xb1\x7d\xc4\xae\xba\xef\x79\x03\x3d\xbd\x1c\xaf\xad\x57\xd6\x2e\
+\x8f\x46\x2e\x7b\x6f\xe9\x24\xe8\x5c\x18\xaf\xaf\xfb\xff\xe4\xef\
+\xfe\x97\xaf\x7f\xff\xdb\xdf\xbc\xfb\x67\xff\xe2\x2b\x4f\xfc\xca\
+\xaf\xfd\xad\xdb\x9f\xfb\xb9\x57\xda\x47\xe3\x9b\xff\xfb\xff\xf6\
+\x8f\xbe\xf4\xef\xff\xc7\xbf\xf9\xf8\xc3\xf2\xb7\x7e\xf3\xfd\x0c\
+\xe2\x3f\xf8\x9d\xdb\xc0\x63\x51\x3b\x3f\x35\xad\x89\xe3\xef\xcb\
+\x3a\xbf\x28\x34\xe4\x5f\x02\xdf\x9f\x1b\x57\xb3\x0a\xec\xf2\x27\
+\xb4\xad\x03\x79\x5b\x9f\x97\xe7\x89\xf9\x73\x4b\xef\x9d\xb5\x8c\
+\x44\x78\xc2\x62\x27\x2d\x31\x3b\x0e\x88\x30\xb7\xa1\x49\xa5\x55\
+\x90\xf7\x47\x21\x7d\x7c\x43\x20\x73\xac\xc8\xc7\x0c\xe8\xad\x64\
+\x0a\x51\xd6\x90\x29\xb3\x2e\x8d\xb6\xf6\x83\xd6\x43\x5d\xf7\xac\
+\xcf\xd5\x78\x7c\x7b\x03\x2e\xe3\xdc\x37\xf1\xbe\xa2\x2c\x1d\xbe\
+\x2e\x14\xf0\x6d\x65\x2a\xb0\x6b\x7a\x7f\x2f\xea\x77\xce\xe9\xbd\
+\xf2\x73\xf7\xfa\x32\xfd\x1a\xd1\xdf\x03\xfe\x7c\x0e\x84\xfe\x53\
+\x3a\x36\xc5\xaa\xad\x80\xe4\xaa\xad\xda\x67\xa7\x05\x49\xec\xad\
+\x54\xa5\x3b\xb4\x8e\x79\x93\xdb\x4c\x21\xaf\x01\x19\x92\x0c\x0f\
+\x84\x98\xf3\xf8\xc2\x0b\x2f\x70\xfe\xdc\x79\x7e\xf4\xc6\x8f\xb8\
+\x77\xef\x1e\x5b\x5b\x5b\x14\x45\xd1\x6e\xd9\x46\x32\xdb\x1d\x07\
+\x42\x30\x11\x48\x36\x1e\x67\x1d\xf8\xd3\x9e\x7d\x87\x16\x61\x70\
+\x73\xb9\x5a\xf3\x6d\xac\x20\xe6\x3e\x5d\x44\x2f\x01\x06\x93\xad\
+\xf2\xe7\xf4\x67\x40\xcc\x1d\x74\x89\x46\x4b\x27\xdb\x9e\xa2\x9e\
+\x29\x57\x32\x4f\xee\xd7\xfd\xca\x98\xa8\x5a\x7a\x97\x7e\xdd\x47\
+\xa8\xdb\xd5\x68\x17\xf8\x31\x1d\xb5\xd5\xa9\x91\x21\xf1\xd8\xee\
+\x5d\x4b\x58\x57\x79\xf1\x24\xb6\xf3\x34\x91\xa6\xfb\x4e\x01\x45\
+\xd3\x17\x19\x2a\xb4\x5a\x5a\x9a\x2b\x9f\xd0\x05\xf1\x87\xd4\x6d\
+\x04\xf5\x3a\x70\xae\x2b\x09\x22\x29\xff\xf1\x30\x5b\x0c\x4f\x80\
+\x31\x96\xaa\x90\xc2\x35\x34\x33\x05\x1b\x4f\x03\xce\xfb\xa4\x51\
+\x12\xe9\xa9\x05\x45\xd1\x48\x73\x4e\x41\x4b\x53\x87\x76\x3f\x7b\
+\xba\x18\xa7\x05\x35\x01\x8c\x3d\x4d\xbc\x8d\xd7\x2c\x12\x34\x82\
+\x5b\x10\xf3\x55\x53\x8d\xcd\x99\xc3\x3d\xf0\x78\xcb\x18\x14\x0c\
+\xbe\x44\xa4\x92\x3e\xa3\x56\xcd\x35\x60\xbf\xaa\x18\xa8\xaa\x5e\
+\xa2\x38\x7f\x13\x78\x58\xc3\x6e\x01\x76\x3c\x86\x89\x82\xc9\x31\
+\x63\x33\x61\xd2\x33\xc4\x4e\xda\x65\xfe\xfd\xac\xf7\x27\xf9\xe6\
+\x2e\xdb\xc9\xc7\xd3\x46\xd8\x11\x1c\x4e\xa7\xfc\xb3\xd1\x08\x33\
+\x9d\x9e\xc1\x35\x1c\x52\x32\xe3\xe9\x02\x06\x0d\xc5\x04\x9a\x0d\
+\x60\x32\x84\x37\x1b\x38\xf0\x71\x6c\x26\x40\x36\xa1\x8b\x3c\x75\
+\xcf\x8f\x73\x06\x1f\x92\x18\xc7\x90\x54\x5f\xd4\xe5\x75\x17\x5b\
+\xe3\x6d\x99\x9a\xe1\xbc\x97\xc8\x2c\x80\xba\x68\x2c\x9e\xa8\x75\
+\x5d\xf6\xb6\xed\x90\xdf\x40\x45\x9c\xf6\xf5\xd9\x3b\xd6\x71\x7d\
+\x46\x5b\x0a\xe3\x4f\xa5\xb1\xba\x53\x61\x7f\x1b\x91\x54\xc7\x97\
+\xe9\x1b\xaf\x69\xe2\xb2\x16\x42\x9f\xfe\x1a\xe2\xbf\x90\x14\x8b\
+\x42\x72\x9b\xcd\x29\xc0\x86\x10\x4c\x02\xab\x21\x04\xc2\x27\x54\
+\x24\xc0\x3a\x17\x3e\xff\xaf\xff\xc2\xe1\x4b\x5f\xfc\xd2\xd1\xe3\
+\x82\xd0\x8f\xa2\xfd\xc1\xef\xfc\xc3\x7f\xf4\xdb\xbf\xfd\xdb\x3f\
+\x8d\xa5\x10\xa6\x3a\xaf\x24\x27\xe2\x05\x1d\xb7\x7e\xc9\xa2\x14\
+\x75\xb0\x89\xca\xe2\xea\x08\xa4\x2c\xeb\xc4\x86\x09\xc4\x48\xd5\
+\x45\x22\x15\xf2\xaf\x96\x3b\x53\x99\x00\xaf\x0b\xf2\xb5\x33\x91\
+\x9b\x48\xf6\x28\x9e\xb1\xa1\x73\x89\xee\xa3\x14\x78\x92\xb4\x56\
+\x7e\x15\xa1\x65\x4d\x38\xa5\x83\xfa\x4f\xb6\xa3\x4f\xa3\xee\xe6\
+\x7f\x26\x11\x9d\x56\x01\x5b\x12\x81\xd6\x6f\x00\xbf\x78\x8a\xa3\
+\xf8\x45\xe0\x01\xde\xff\x48\x1d\xaf\x00\xdf\x00\xde\x71\x8e\x10\
+\xb3\x5f\x18\x01\xbf\xa4\xce\xd4\x3b\xfa\xfb\xfb\xcb\x1d\xd4\xf6\
+\x35\x10\x55\x83\xb7\x4e\xd5\xc4\xed\x9c\x6d\x11\x58\xb5\x15\x90\
+\x5c\xb5\x55\xfb\x4c\x02\xc9\x10\xf3\xa8\xfc\x12\x57\x7e\x54\x24\
+\x8c\x89\x91\x26\x99\x53\x31\x49\x52\x01\x67\x48\x2f\x21\xc0\xc5\
+\xcb\x97\xd8\xda\xde\xe2\xd5\x57\x5f\xe5\xc1\x83\x07\x1c\x1c\x1c\
+\x30\x1a\x8d\x28\x8a\x42\x23\x9c\x1a\xa1\x6c\xcb\x8b\x04\x44\x02\
+\x5e\x3c\x5e\x3c\x0e\x4a\xef\x34\xca\xe0\xbb\x85\xce\x81\x09\xd8\
+\x42\x62\xd1\xf8\x86\xe5\x91\xa4\x14\x0a\x70\xc0\xb3\xd6\x52\xa8\
+\x51\x7a\x40\x57\x13\xf2\x26\xd1\xd3\xec\x89\xd1\x91\x14\x41\x2b\
+\x52\xfe\x43\x51\xe0\x9a\x86\x3d\xa2\xf2\x69\xbf\x53\xac\xb5\x58\
+\x29\x68\x08\xca\x21\x6c\xc0\xbe\x0b\xf2\xa6\xc5\x6e\x09\x8d\x4b\
+\x20\x2f\x7e\xee\x1c\xf8\x7d\xda\x48\x64\x9b\x97\x17\xb4\x56\xa2\
+\x07\x7f\x31\x5a\xa8\x3d\x6a\xcd\xfd\x08\xce\x9c\x34\x78\x17\xa9\
+\x99\xac\x13\x23\x36\x93\x2c\xea\x99\xa2\x8e\x95\xe6\xcc\xa5\xeb\
+\xd9\xa5\x2b\x79\x51\xa8\x71\xb4\x03\x94\x38\x97\xca\x8a\x44\xa1\
+\x02\xe1\x41\x43\xe3\x6c\xac\x08\x7a\x5d\x90\xed\xd4\x2f\x0a\x22\
+\xc7\xc4\xe3\x3b\xba\x3a\x93\x68\x7e\x50\xd0\x68\x67\x8a\x1c\x25\
+\x8a\xec\x2e\x91\xe6\x68\x35\xaa\x5a\x00\x5e\x22\x88\x78\x5e\x01\
+\xfa\x1f\x33\x1a\x1d\x32\x9d\x86\x96\x5e\x39\x01\xbd\x47\xb7\x80\
+\xbf\x00\xbe\x80\xb5\xdb\x88\xdc\x01\xfe\x08\x38\xa0\xa3\x2d\x7a\
+\xa2\xb7\xff\x3e\xc0\x64\xd2\x1f\x13\x13\xdd\xd9\x4f\xaa\x8d\xe8\
+\xf3\xa8\x1f\xf5\xbe\xb6\xcf\x51\xbb\x2b\x53\x7d\x18\xa7\xd3\x79\
+\xcb\xd5\x99\x0c\x0a\x19\x66\x51\xe1\xb7\x81\x5d\xc5\x88\x0e\x38\
+\x3f\x8b\xce\x80\xcb\xf4\xa9\xa7\xc9\xea\x19\x4a\x97\x67\x9b\xac\
+\x47\xa3\x0e\x98\xf4\x0c\x55\xf3\xe6\x54\x26\x72\x61\x81\xf3\x58\
+\x7c\x2f\xb2\x69\x59\x43\xb8\x99\x8d\x01\x93\xc5\x0b\x93\x93\x61\
+\x08\x6c\xc6\x7a\xa1\x92\x1b\x5f\x06\x98\x8a\xb0\x4b\x17\x4c\x5e\
+\x57\x20\x69\x80\xd0\x2a\xe0\x9e\xaa\x98\x1b\x73\x46\x4f\xe9\x57\
+\xc3\xfb\x30\x94\x43\xe8\x97\xd1\x08\x09\x58\xca\x1c\xd5\xd6\x98\
+\x90\x53\x62\x7d\xac\x7a\x74\xba\x02\xac\x66\x6e\x45\x5a\xeb\x27\
+\x3b\x1e\x3f\x49\x10\xf9\x53\xde\x2a\x22\xcd\x3e\xb5\x2d\xce\x52\
+\x68\xad\xeb\x5e\xe1\x53\x7d\x6b\xbe\xfd\x09\xf0\x37\xd5\x49\xf7\
+\x76\xbf\x76\x8f\x03\xfc\x08\x78\x81\x2e\x0a\xfa\xe1\x5a\x6f\xa0\
+\x2f\x00\xc8\xc5\xcd\x3c\xf8\x4f\xe9\xcd\xf0\xbd\xd3\xcf\xff\x6f\
+\x4b\x38\x15\x73\xa8\xfa\x8a\xae\x3d\x7f\x91\xdb\x09\x25\xe5\x83\
+\x9a\xfa\x7e\xdc\x9f\x35\x59\x9f\xbf\xae\x8e\x02\x1c\xee\x6b\x7e\
+\xe9\x1c\x22\x5d\x4a\x71\x74\x86\xe6\x3a\x0c\xa7\x31\x9e\x56\x6d\
+\x05\x24\x57\x6d\xd5\x3e\x5b\xad\xa5\xb6\x86\xbe\xaa\xaa\x16\xe6\
+\xce\x94\x58\x55\x83\x35\xd1\x5f\xe7\x84\x79\x5c\xe1\x78\xe9\xe5\
+\x97\x38\x39\x9e\x70\xfb\xf6\xdb\xbc\xf5\xd6\x5b\x1c\x1d\xd6\x8c\
+\xc6\x23\xca\x72\x80\x96\x53\xc3\x24\xe1\x9e\x10\x6b\x48\x8a\x08\
+\x3e\xd6\x4e\x24\x55\x4f\x9c\xab\x77\x15\x88\xd1\xc3\xe1\x29\xf6\
+\xf9\x15\x60\x80\x73\xaf\x82\xaf\xc4\x33\x50\xe3\xf3\xaa\x82\x97\
+\x52\x01\xcc\x3b\xc4\xe8\x48\x20\xe6\x04\xb6\x94\x95\x82\xc2\x34\
+\x51\xd1\xf4\x34\x4f\xba\x4d\x00\xaa\x69\xed\x4c\xa9\xf4\xfc\x74\
+\x71\x69\xf2\xaa\x81\x56\x8f\x7b\x43\x8d\x62\x07\xb8\xa2\x80\xa6\
+\xf1\x85\x82\xa6\xfb\xa2\xde\xce\x02\x6c\xd3\x2d\x90\x1e\xfc\xfd\
+\x0c\xc4\x95\xf1\xbc\xed\xb1\x0a\xd2\x00\x54\xd6\xf2\x40\x84\xf3\
+\xe0\x6d\x51\x50\x34\x0d\x95\x5e\xdf\x25\xfa\x22\x38\xd7\x23\x40\
+\xf0\x5d\xe1\x76\x6b\xef\x6b\x2e\x9c\x93\x58\xc2\x44\x12\xc0\x76\
+\x8e\xc2\x7b\xce\xd3\x96\x63\x68\xfb\x45\x00\x1b\x15\x7b\x82\xf3\
+\xf8\xf3\x6a\x7c\xe5\xf5\x30\x6b\xfa\xf5\x1b\xd3\x9c\x7e\x1d\x6b\
+\xff\x14\x91\x7f\x01\xd4\x8a\x94\xcc\x90\xa1\x99\x31\x0b\xc4\xa8\
+\xed\x4b\x0a\x6a\x04\x78\x8f\x58\x27\xe4\x87\x3e\x02\xe1\xdc\x13\
+\x1c\x3e\xcd\x8b\xf8\xf4\x14\xd4\x78\x06\x88\xb4\xc0\x65\xbc\x7f\
+\xa8\xa0\x3f\x19\x40\x46\x4b\xb6\xb4\xb5\x30\x8b\x22\xf6\x73\xd3\
+\x60\x1d\xec\xf8\xce\x51\x61\x9d\xe3\xc0\x7b\x9e\xd7\x67\xe5\x4d\
+\x1d\xfb\x46\x81\xd9\x2d\x89\x7d\xbb\x2c\xac\x7a\xa2\xc0\xbc\x26\
+\x7a\xf4\xfb\xf3\x43\xfc\xb5\xad\x20\xdf\x5a\xe1\xa1\xe4\x11\xce\
+\x48\xc3\xdd\xd5\xfb\xb2\x99\xc0\x94\xb6\x35\x75\x5c\x1c\x01\x65\
+\x26\x23\xb2\x34\x92\x49\x3f\xaa\x08\x49\xf9\xf6\x4c\xc5\x5c\x4f\
+\x06\x6a\x8d\x32\x17\x3e\xfc\xbc\x98\x26\xbb\xb4\xe3\x25\xf4\x57\
+\x75\x32\x81\x2c\xc4\x1a\x17\x14\x60\x23\xfe\x8c\x39\x95\x73\xc2\
+\x3e\x2d\x88\x15\xf1\x1f\x7b\x24\xef\xfd\xd3\x5a\x3f\x5b\xfe\xd5\
+\xb9\x31\xe9\x32\x16\x48\x74\x12\x2a\x55\x44\x5d\x86\x8f\x02\xe9\
+\x0d\x51\x4c\xe7\xd7\x80\x7d\x3c\x87\xf9\xb8\x55\xe6\xc7\x7d\xe0\
+\x8d\xcf\x7a\xc7\x67\xb4\xd3\xde\xdf\xfa\x88\x19\x04\x24\x2a\x9d\
+\x6d\x68\x39\x8e\x9c\xfe\x9e\xc4\xe7\xbe\xa5\x6b\x52\xbb\x16\xd7\
+\xd4\x5d\x02\x79\xc4\x8d\x36\x73\x70\xf9\x6c\xbe\x3a\x33\xb7\x5a\
+\xd7\xf9\x79\x55\x5f\xb3\x7a\x64\x56\x40\x72\xd5\x56\xed\x33\xdb\
+\x8c\x89\x85\xaf\x7b\x11\xc9\x8f\x80\xa8\x31\x1e\x8f\x78\xee\xb9\
+\xcf\x71\xf5\xea\x35\x76\x77\x77\xd9\xd9\xd9\xe1\xe0\xe0\x80\xc9\
+\x64\xd2\x8a\xf2\x58\x6b\xd5\x70\x12\x05\xb2\x94\x73\x95\x0d\x34\
+\x02\xe1\x53\xa4\xe4\xfb\x0a\x18\x73\xc1\x97\x2b\x44\x4f\xee\x14\
+\xcb\x21\xde\x9b\x82\xe2\xa0\xa1\x79\xaf\x18\x7a\xef\x67\xad\x28\
+\xcc\x39\x22\x05\x35\xbf\xca\x64\xea\xbb\xa2\xc0\x68\x8c\x31\x07\
+\x92\x86\x18\xd5\xd9\x54\x70\x37\xa3\x5f\x5f\xcf\xce\x6d\xdb\x7a\
+\xae\xd5\xc2\x1e\x02\x37\x14\xb0\xa5\xfc\x4a\xa7\xe2\x41\x56\x01\
+\xc3\x8f\x81\x6d\xb5\x4b\x92\x60\xca\x31\xb4\x0a\xa9\xa9\x0e\xe3\
+\x24\x1a\xfb\xb2\xa6\x80\x11\x60\x28\xc2\x33\x5a\x32\xe3\xf5\xa6\
+\xe9\x29\xb9\x5e\xc8\x40\x72\x2a\xd7\x30\xd1\xf7\x3c\x70\x88\x48\
+\x45\x2c\x5b\x52\x88\x6d\x2a\x11\x1e\x12\xa9\xb2\xce\x7b\xe7\xc0\
+\x9f\x00\xfb\x5a\xd4\x30\x51\x6c\x2f\x03\x13\x2d\x5d\x32\xcc\x80\
+\xa3\xd3\xf3\x4a\x39\xa6\x86\x98\xaf\x67\xb3\xc5\xfa\xfb\x0a\x22\
+\x7d\x0e\x00\x67\x51\xe8\xae\x04\xbe\x48\xa4\x81\xed\x11\x23\x8d\
+\x97\x23\xe8\x75\x07\x31\xa0\xd9\x57\x03\x9d\x5b\xd0\x3f\x3d\x46\
+\xe8\x10\xc3\x6c\x39\x6a\x1c\x32\x27\xeb\xd7\xbd\x91\xfa\x69\x67\
+\x08\xbb\x0c\x61\x36\x03\xcd\x8f\x8d\xe3\x6a\x80\xa3\xc2\xea\x7d\
+\x76\x80\x33\x51\x3d\xd2\x16\x45\xbc\xd7\x4d\x83\xb5\xb1\xb3\xf6\
+\xe8\xd3\xbb\x87\x0a\x16\xef\xb0\x28\xae\x92\x72\x24\xd3\xf8\x58\
+\x62\x18\xb5\x39\x4c\x0f\x80\x03\x89\xcf\xce\x30\xdb\xd6\xeb\xb8\
+\x8d\xeb\x77\x97\x8f\x68\xf4\xb8\x3b\x7a\x5f\xc7\xc0\x45\x17\x4b\
+\x90\x74\x06\xbb\xb5\x06\x91\x35\xba\xdc\xe4\xf5\x0f\x38\x1b\x9d\
+\x26\x56\xf3\x11\x18\x7b\x92\xe9\xf3\x44\x1d\xdb\x16\x0b\xe6\xd1\
+\xca\x05\x0a\xac\x25\x04\xc1\x46\x55\x1e\x06\xc3\x61\x35\x5a\x1b\
+\x57\xc3\xd1\x78\x21\xc3\xce\x37\xb5\x1b\x8e\xc7\xb5\x82\xc9\x9f\
+\xca\x28\xe2\x4f\x31\xad\xf5\xb4\x71\xd3\x73\x10\x36\xfa\x5f\x03\
+\x3c\xa6\x4e\x11\x3a\x9f\x8f\xd4\x11\xf3\x9d\x7c\x99\x93\xa8\x22\
+\x7d\x59\x1d\x2d\x59\x1e\xe0\x47\xa1\x5d\xfb\x31\xea\xdf\x7e\x0c\
+\xbb\x96\x65\xea\xb4\xe4\x8f\x58\xfb\xc7\x10\x91\xf5\xb9\x35\xe1\
+\xf3\x3a\x3f\xbd\xb1\x6c\x5d\x68\x16\xcf\xde\x2c\xac\x21\x5d\xf9\
+\x90\xa4\x8c\x3d\x5f\xbb\xba\x98\x73\x60\xda\x15\x90\x5c\x01\xc9\
+\x55\x5b\xb5\xcf\x36\x90\xb4\x9d\x7a\x6a\x2e\xb0\x13\x03\x8d\x26\
+\x13\xd7\x09\x9d\xfa\x2a\xc4\xe2\xda\xca\x6b\xcd\x45\x2a\x4c\xab\
+\xe8\x1a\xa3\x8e\xeb\xeb\x6b\xac\xad\xaf\x73\xfd\xfa\x75\x26\x27\
+\x27\xdc\x7e\xf7\x0e\x27\x27\xc7\x54\x55\xc5\x6c\x56\x31\xab\x66\
+\x1c\x1e\x1e\xb2\xb5\xb5\x05\xb0\xee\x23\x3f\x33\x52\xc5\x5c\x0f\
+\x56\x6e\x01\xb5\xb5\x34\x5a\x5c\xfc\x8a\xbe\xd7\x10\x23\x29\x27\
+\x08\xe7\x80\xb2\xa1\x11\x20\xcc\x66\xed\x52\x77\xc2\xf2\x48\xa6\
+\x03\xb6\x70\xee\x46\xd3\xf8\xbd\xcc\x8b\x39\x22\x2a\x75\x6e\xe8\
+\xeb\x26\xfb\x71\x99\xf1\xed\xd4\x30\xbe\x6a\x2d\x1b\x22\x0b\x14\
+\xa8\x00\xdc\x47\xe4\xcd\x04\xd0\xe8\x17\xba\x3e\xd1\xef\x8f\x55\
+\x4e\x3e\x19\x8f\x27\xf4\x0b\x63\x27\x30\x71\x0d\xa8\x43\x48\x51\
+\x4d\x00\x76\xb1\x1c\xeb\x9a\x5b\xd0\x51\xb1\x26\xd9\xf7\x66\x6a\
+\xe4\x0f\xe8\x47\x29\xaf\x44\x10\xd8\x38\xed\xd3\x31\xd6\x6e\x21\
+\x52\xe8\x02\x5a\x13\x41\x89\x95\x28\x24\x74\x5e\x0d\xfc\x23\xa5\
+\xc8\x06\x62\x14\x2a\x46\x24\x3b\x80\x33\x26\x8b\x92\xd9\x58\x76\
+\xdd\x10\xa9\xc6\xcc\x2f\xf2\x43\x30\xb3\x08\x22\xaf\xe8\xbe\x7e\
+\x48\x14\xc8\xf9\x39\xe0\x25\x8f\x7f\xb6\x80\xc3\x86\xe1\xed\x28\
+\x16\xd4\x7a\x8e\x3f\x1c\x90\x1c\x0c\x4a\xaa\xea\xd2\x07\x34\x87\
+\xe4\xd4\xef\xcd\x80\xa2\x30\x34\x8b\x91\x8a\x1e\x88\x2c\x0a\xc3\
+\xac\xdd\x26\x8e\xc5\x12\x37\xab\xb1\xcc\xda\xeb\x73\x30\x70\x50\
+\x59\x2a\x5c\x19\x45\x99\x3a\x70\x19\xfb\x3c\x07\x97\x56\xe2\xf8\
+\x39\x80\xf2\x9f\x59\xfc\x81\x20\xe7\xf4\x3e\xdd\x21\xd6\xab\x3b\
+\xad\x25\x83\x76\x49\x6e\xa2\x24\xb0\xb9\x47\x57\xbf\xd3\xcc\x3d\
+\x4b\xdb\x7a\xef\x9d\x5b\xa4\xcb\x35\x67\x02\x23\x91\xb1\x8e\xf9\
+\x03\xba\x7c\xce\x4f\x71\x11\xfb\x14\x57\x4d\x5a\x21\x16\x93\x50\
+\x66\x02\x95\xc6\x04\xdf\x34\xce\x18\x13\xc6\xeb\x1b\xb3\x8b\x97\
+\xaf\x1c\x3e\x79\xeb\xb9\xbd\x67\x5e\x7c\xf1\xe0\xa9\x5b\x9f\x3b\
+\x95\x7b\x5d\xcd\xa6\x76\x38\x1a\x7f\x6c\x3a\x27\xab\x68\xe4\x07\
+\x82\x4c\xee\x43\xee\xc3\x01\xaf\x59\x68\x24\x46\xfc\xbf\xd7\xbd\
+\xed\x27\xba\x86\x7d\xa7\x9d\x59\xfa\x7f\x7c\xa8\x71\xfa\x31\x3e\
+\x02\x1f\xae\x53\xdb\x9a\x99\x67\x6e\xa4\x8e\xa1\x4c\x88\x07\x8d\
+\x48\xc6\xf5\x2c\x7d\xff\x9a\x4e\xaf\x7f\x56\x80\x6b\x51\x44\xb3\
+\x08\x24\x35\x32\x99\x00\x60\x06\x0a\x33\x31\x2e\xe7\x2c\xde\x8f\
+\x29\xcb\xbf\xc1\xda\x66\x77\x8e\x21\xac\x73\xb0\xfb\x30\x7d\x47\
+\xeb\xed\xae\x80\xe4\x0a\x48\xae\xda\xaa\x7d\x76\x5b\x12\xdb\x91\
+\xe4\xee\xcb\x89\x22\xa9\xa4\x64\x0e\x3c\x59\xdc\x2c\x7f\x27\xe8\
+\x07\x66\xee\x7d\x80\xd1\x78\xc4\xad\x5b\xcf\xea\x7c\x1c\x98\x55\
+\x15\x87\x07\x07\x0c\x07\x03\x1e\x3c\x78\x00\xd8\x6d\x87\xb9\xd7\
+\xc9\x89\xb7\x59\xf6\x1b\x44\x1a\xe8\xae\x08\x17\xd4\x58\xad\x89\
+\x11\xc6\xc3\xb9\xd3\x19\xe2\xdc\x55\xca\xb2\x60\x3a\x4d\x06\xe9\
+\x3c\xe0\xe8\x72\x04\xe1\x36\xde\x0f\x89\xf9\x2b\x69\xbd\x51\x6a\
+\x29\x0f\xd5\x70\x6e\x80\x0d\x44\xa2\x60\x4e\x87\x6f\xd7\x15\xfc\
+\x34\x91\x99\x1b\x8d\xf9\x2c\x8f\x2b\x01\xba\x6d\x12\xb5\xb5\x03\
+\x60\x56\xcf\x61\x94\x01\x81\x14\x01\xbd\x92\x81\x56\x47\xcc\xb5\
+\xdc\xd6\xef\x4c\x7c\x04\x10\xa9\x14\xc7\x11\x22\x57\x32\xc0\x79\
+\x4c\x8c\xe6\x8d\x32\x03\x68\x48\x47\x69\x4c\x74\xdb\x4d\x5d\x78\
+\xeb\xd0\x81\xbf\x52\x6b\x46\xb6\xf5\x1f\x2d\x76\x4d\x10\xe7\x68\
+\x9c\x8f\x1e\xf3\x03\x6b\x19\x48\xa4\xc8\x5a\x3d\xce\x3a\x30\x68\
+\xba\x73\xd8\xcd\xee\x89\x11\x51\xa3\xa1\x5b\xb4\x43\x06\x22\x99\
+\x45\x35\xbd\x9b\xd6\xe2\x8c\xe1\x5d\xef\x79\x1d\x70\x0c\x06\xaf\
+\x52\x55\x25\xf0\x7c\x03\xcf\xc1\xec\x20\xbb\xcf\x49\xbb\xcf\x32\
+\x63\x49\xa8\xef\x4c\x04\xe9\xa0\xba\x41\x55\xbd\x42\x8c\x54\x7f\
+\xbf\x67\xf1\x39\x62\x1a\xe9\x1c\x1a\x9a\x8b\x96\x5b\x35\x36\x52\
+\xfe\x1e\x9d\xdf\xc3\x75\xe4\xe7\x4c\xe2\x45\x73\x06\x83\x73\x18\
+\xbc\xc3\xf7\x81\xa6\x01\xce\x53\xf3\x94\x82\xa9\x78\x0f\x4a\x1c\
+\x75\x95\x14\x79\x6d\x0b\x22\xb5\x8e\x5d\x13\x4b\xac\xb8\xa6\xbb\
+\xd7\xb6\xfb\xa9\x0f\x15\x54\x9e\xcf\xee\xc7\x90\x56\x1c\xa9\xcd\
+\x2b\xb4\x6a\x88\xe9\x43\x47\x6d\xc1\x1a\x9c\xd5\x73\xcf\xeb\xae\
+\x02\x14\x82\xb8\xb6\xda\x45\x77\x2b\x47\xe9\xbe\xf8\xc5\x3e\x1b\
+\xa8\x93\x63\x9b\xe5\xf5\xdc\x4e\xf4\x79\x4b\xb4\xf3\xf5\x45\x20\
+\x99\xd5\xd2\xfc\xd4\xe1\xca\x68\x11\x7b\xef\x2d\x01\x63\x9d\x95\
+\xf3\x17\x2f\x1d\x5d\xbd\xf9\xe4\xc1\xb3\x2f\xbc\xb8\xf7\xfc\x2b\
+\x5f\x38\xb8\x7a\xfd\x46\x05\x3f\xdb\xf9\x8a\x3f\x63\xd1\xc8\xfc\
+\xd1\xff\x28\x80\x24\x02\x7f\x46\x2c\x25\xf2\x14\xf0\x96\x8e\xe7\
+\x21\xf0\x6c\x7c\x94\x13\xad\x33\xe6\x24\x5b\x9b\xfb\x26\xe2\xd2\
+\x99\x01\xb0\x44\xe5\xc6\x8a\xed\x26\xc5\x58\xb3\x23\x44\x8a\x77\
+\x2c\xbb\x94\xef\xaf\x0f\xde\xac\xb1\x80\x58\x01\xb1\x5d\x95\x5b\
+\xdb\x1b\xdb\x01\xac\xc1\x0a\xa9\x34\x08\x56\x10\x21\xd8\xa8\xc8\
+\x8d\x48\x5a\x60\x2d\x62\x05\x2b\xf1\x77\xee\x37\x8c\x5f\x6f\xa9\
+\xaa\x71\x5d\x50\x5f\x6f\x6b\x7d\x64\x8a\xad\xd1\x01\x29\x73\x78\
+\x5e\x40\x04\x8b\x2d\x05\x39\xaf\x6f\x0f\x10\x2e\x03\xdf\xa1\x28\
+\x3c\x0d\xb6\x69\x9a\x50\x50\x98\xb8\xa0\x37\x99\xc7\x07\xd3\xf4\
+\x9d\x99\x99\x6d\xe0\x69\x55\xa4\x35\x99\x92\x4b\x4f\x0c\xf8\x5b\
+\xff\xe1\x37\x28\x8b\x38\xf1\xdc\x7d\xe7\x1c\xff\xfc\xff\x18\x72\
+\xb8\xaf\x3a\xcc\x2b\x10\xb9\x02\x92\xab\xb6\x6a\x9f\xf1\x96\x22\
+\x92\xb1\x8e\xa4\x06\xc4\x4c\xaf\xc4\x5a\xdf\xd4\x9d\x33\x7d\xdb\
+\x5c\xc7\xf6\xc3\x30\x87\x36\x4d\x2c\x4c\x15\xb2\x5d\xe8\xa6\xc3\
+\xc1\x80\xc1\xc5\x4b\x6c\x6d\x45\x81\x1e\x90\x3f\xf7\xb1\x44\x41\
+\xdb\xbc\x07\x4a\x2e\x52\xf3\x1e\x31\xe7\xeb\x29\x22\x7d\x65\x67\
+\xc1\x27\x1a\xe9\x71\x0d\x37\x6f\x09\x4f\x3e\xbb\xc1\xc1\xee\x06\
+\xef\xbc\x39\xe0\xe1\xbd\x14\x21\x4b\x75\x0f\x37\x13\x68\x74\x8e\
+\x77\xb5\xee\x5c\xa1\x86\xf0\x9a\x1a\xf2\x3f\x52\xb0\x9a\x5f\xbd\
+\x4d\x40\x50\x0d\x64\x0f\xed\x79\x25\x30\x57\x24\x96\xb0\x0a\xfe\
+\x3c\xad\x06\x72\x19\x51\x85\x4f\xe7\x3c\x52\x80\x7c\x87\x4e\x04\
+\xc7\x6b\xaf\xbd\x8b\xb5\x35\xb1\x74\x86\x53\x48\x73\x44\x54\x55\
+\xdd\x4e\x35\x9f\x49\x35\x2e\x63\x79\x8c\xbc\x7e\xe6\x9a\x5e\x63\
+\x81\xa3\x50\x41\xc9\x1d\x85\x5a\x89\xee\x7a\xa8\xe7\xbe\xed\x3b\
+\xba\xee\x4e\x76\xde\x05\x70\x49\x4c\x98\x10\x70\xbe\x33\xa4\xbc\
+\x48\x6b\x18\x6d\x10\x29\xb4\x87\x73\x06\x97\x90\xf2\x30\xa3\x3d\
+\x60\x44\x28\x54\xe8\xa5\x07\x24\x67\x05\x17\x68\x78\x06\x28\x45\
+\xdc\x0e\xf8\xef\x30\x50\x59\xfd\xaa\x82\x98\x5b\x34\x04\x5e\x8e\
+\x22\xb4\xbe\xa5\x1e\x17\x05\xd6\x06\x6c\x45\x1f\x44\x0e\xf4\x77\
+\x05\x0c\x52\xa1\xb7\xf8\xbf\x03\x6e\x62\x9b\x67\x80\xcb\x08\x1b\
+\xc0\x6b\xc0\xb7\x06\x10\xaa\xc1\x00\xaa\x0a\xef\x09\x03\x9c\xa9\
+\xd4\x3b\x3d\x18\xe8\x88\xae\x22\xb7\xb4\x4a\xe3\xc1\x27\x77\x87\
+\xef\xc6\x6a\x32\x48\xf2\xbf\xdb\xbf\xf2\xed\x96\x02\xa2\x1f\x10\
+\x95\x6a\xbf\x48\x2c\x1d\x70\xa2\x4a\xbc\x4e\x6b\x92\x2e\x44\x22\
+\x89\x79\xb5\xae\x1d\x27\x11\xdc\xea\x67\x03\x0b\x95\xcd\xc6\xdb\
+\xb3\xc4\x88\xe4\x49\x74\x2c\xf8\xe3\xac\xcb\x52\x7d\x48\x6f\x2d\
+\x5f\x16\xe1\x06\x51\x24\x29\x5e\x6b\x7c\xb6\x86\x0a\x38\x37\x89\
+\xe2\x38\x27\x73\x40\xf0\xae\x8e\xaf\x8b\x73\xc2\x18\x6b\x0a\x22\
+\x8f\xe8\x84\x92\x4e\xf5\x6d\x9d\x36\x55\x81\xbf\x42\x4f\x35\xb9\
+\x67\x63\x1a\xad\x8c\x70\xef\x13\x73\xc2\xa5\x32\x1e\x5e\x2c\x86\
+\xb0\xb6\xbe\x3e\xbb\x70\xf9\xca\xe1\xcd\x67\x6f\xed\xdf\x7a\xe9\
+\xe5\xfd\xe7\x5e\xfe\xb9\xa3\xb5\xf5\x75\x59\x09\xdd\xfc\xd4\xb7\
+\x8f\x2a\x22\x69\x8b\x82\xba\x69\xf8\x0e\xb1\x1e\xee\xa6\xce\x9d\
+\x53\xe0\x07\x38\xf9\x06\x2a\x32\x97\xca\xc4\x8a\x51\xd5\xd5\x56\
+\x04\xc6\x19\x95\xc7\x8b\xdb\xc5\xf9\x24\x24\xf1\x2a\xe7\x30\xba\
+\x3c\x84\xb6\xa8\x6d\xb6\x50\x1a\x93\xad\xe2\x4a\x3f\x17\xc0\x49\
+\x14\xb3\x32\x49\xe5\xd5\x40\x72\x92\x81\xc3\xbb\xd6\x29\x14\x0c\
+\xc6\x78\x05\xa3\x26\x13\xbf\x8a\x7f\x4b\x88\xf4\x13\x63\x30\xae\
+\xf5\xc5\x39\x00\xe7\x71\x5e\x9d\x69\x38\xe3\x9d\x47\xbc\x68\x09\
+\x20\xbd\x46\x13\x15\x64\xe3\x42\x93\x3f\xe7\xd1\x89\xa4\xae\xa4\
+\xa0\x65\x8f\xbe\xac\x17\xf7\x3c\x49\x1d\xbd\x69\x6c\xa3\x10\xa2\
+\x39\x9b\x76\x9c\x47\x24\x4d\xdf\xe0\xc8\xb6\x29\x0a\xcf\xd5\xeb\
+\x87\x0c\x86\xf1\x83\xba\x72\x84\x30\x60\x95\x23\xb9\x02\x92\xab\
+\xb6\x6a\xab\x96\xc0\x8e\x93\x1c\x1d\xa8\x94\x4e\x4b\x51\x55\x8b\
+\x49\xab\x7f\xf4\xe3\x91\x89\xbe\xda\x52\x59\xf5\xb3\x94\x1a\x64\
+\x92\x38\x4f\x30\x19\xae\x0c\x2d\xc0\x4c\x3b\xb0\xd6\x46\xfe\x23\
+\xf8\x31\xc8\x24\x3f\x08\x84\x12\x7c\x0d\x9e\x92\x86\x9a\x13\x5d\
+\x7c\x17\x89\x35\xf1\x1a\x0a\xb6\xcf\xd5\x5c\x7f\xba\xe2\xfa\xd3\
+\x70\x7c\x54\xf0\xf0\x5e\xa9\x06\xb4\x57\x70\x78\x5f\xc1\xe2\xa5\
+\xac\x06\xd5\x9d\x78\xcc\xb2\xb0\xf8\x27\x8c\xd6\xae\x98\x6b\x23\
+\x8d\x5e\x26\x80\x29\x74\x74\x58\x37\xef\xb9\x96\x68\xd8\x1e\x2a\
+\xd0\xbc\x9e\x40\x96\x2e\xc8\x62\xb1\xf7\x54\x68\xe7\x4a\x06\x02\
+\x1d\x70\x49\xaf\xa5\x52\xd5\xd3\xb4\xe8\x8d\xe7\x8e\x11\xaf\x45\
+\xb4\xa6\x62\x04\xa3\x89\x5e\x38\x04\x6c\x04\x9d\x16\x90\xb2\x05\
+\xb3\x9d\xd2\xdd\x56\xf6\x9e\x28\x1c\x1b\x49\x57\xef\x71\x8f\x10\
+\xf6\xd4\x37\xec\xe8\x6a\x00\xce\x54\x8c\xa7\xd1\xbe\xf4\x19\x40\
+\x4d\x75\x24\xdb\x21\xa6\x25\x3f\x9c\x44\x85\xbc\x7c\xe1\x1d\xd1\
+\xf0\x92\x02\xd2\x43\xf0\xdf\x07\xea\x81\x2e\xd2\x55\xd7\xc7\xaf\
+\x01\x6b\x78\x7f\xcb\x42\x21\x91\x06\x46\x13\x8b\x82\xdb\x3e\x82\
+\x1c\x44\x00\x59\x25\xf0\x58\x85\x01\x14\x55\xec\xff\x67\x81\x1b\
+\xda\xb7\xef\x02\x7f\x59\xc2\xbb\x75\xfc\x9a\x85\x0a\x22\x98\x0c\
+\x55\x21\x57\xd2\x60\xaf\x04\xe5\x45\x55\x47\xc0\x04\x06\x7a\xfe\
+\x55\x12\x96\x69\xe6\x1c\x0e\x53\x06\x83\x40\x55\xc5\xc7\x69\x30\
+\xb0\x54\xd5\xc5\x0e\x00\x15\x0e\x9a\x87\x73\x8e\x0a\x14\x68\x7d\
+\x57\x9d\x25\x4f\xe9\xe7\xef\xd1\xd1\xa8\xfb\x60\x72\xee\xb5\x07\
+\xab\x62\x4a\xa9\x4c\x4d\x9e\xbf\xb3\xa6\xf7\x37\xe6\x0f\x95\xe5\
+\x93\x6c\x9e\xdf\xa1\x9a\x0e\x38\x3a\x38\x26\x52\x89\x4f\x00\x27\
+\xc2\x8f\x2c\x1c\xca\xd6\xb9\xf3\x14\x45\x60\xef\xa1\xc1\xc8\x77\
+\x88\xd1\xc4\x91\xde\xf3\xc0\xf2\xc8\xa2\x6d\xcd\x66\xdf\x03\x99\
+\x47\xfa\x2c\x8c\x81\x8b\xfe\xd1\x46\xfb\x26\x8b\xb4\xe5\x35\x75\
+\xa6\x2c\xc6\x9e\xe3\x98\x7d\xe2\x23\x30\xf8\x1f\xd9\xbc\xf7\x36\
+\x48\xb0\xd6\x59\x39\x77\xe1\xf2\xd1\x95\xeb\xd7\x0e\x6e\xbd\xf4\
+\xf9\xdd\xe7\x5f\xf9\xc2\xc1\x95\x27\xae\xcf\x9c\x73\x9f\xda\xa8\
+\xe3\x8a\xd6\xfa\xfe\x7d\xad\x2c\x8d\x48\xba\x0e\xf0\xe0\x43\x2a\
+\xb9\xe1\x32\x27\x92\x5f\x04\x92\x89\x91\x71\x4f\x9f\xeb\x67\xf4\
+\x79\x1f\x03\x9f\x4b\xe5\xaf\xfc\x19\x85\x51\x73\x27\x95\x3f\x55\
+\x89\xd5\x9f\x31\x76\x97\xbf\xe8\x38\x40\xfd\x93\xcf\x5f\xfb\xb9\
+\x6d\xe7\xf7\xd7\xfb\x5b\xbf\xe0\x73\x77\x5a\x76\x6e\xbe\xf7\xa1\
+\x5f\x76\x79\x8b\xd7\xdd\xdf\x74\xa8\x4e\xcc\x27\xe2\x87\xee\x5b\
+\x60\x6c\x97\x81\x92\xc3\x89\xa6\xf7\xff\x1c\x90\xec\xe6\xc8\xac\
+\x6c\x8a\xb2\x4c\x96\x00\x44\x49\xae\x70\xb3\x04\x90\xae\xda\x0a\
+\x48\xae\xda\xaa\x7d\xf6\x5a\xf2\xaa\x7b\xf1\x19\x74\xeb\x56\xd0\
+\xd6\x1a\x32\x06\x42\xd4\xb8\x89\xef\x77\x55\xd3\x82\xcc\x2d\xbb\
+\xed\x7e\x96\x87\x36\xe7\x03\x9b\x49\x6e\xbf\x00\x33\x59\xac\x4d\
+\x67\xea\x5a\x27\xea\xfa\xd1\x79\x71\x0e\x9c\x37\x26\xe0\xac\xd1\
+\x24\xc2\x40\x97\xb3\xf7\x0e\x91\xfa\x99\xce\xb0\x04\x04\xc7\x58\
+\x17\xf1\x1a\xea\x42\xda\xd0\x6a\xbb\xcd\x26\x70\xde\x5a\x36\x63\
+\xa4\x06\x7c\xdc\xcf\x88\xa8\x8e\x3a\x22\x97\x89\xef\x0b\x8d\xec\
+\xd2\xd1\x54\x0b\x20\x01\x54\x27\x91\x40\x74\x23\x8a\xe5\xb4\x86\
+\x46\x69\x63\x97\x1e\x03\x8d\xef\x4a\x7a\xc4\xfd\x5b\x2a\x8d\x3e\
+\x42\xcc\x55\x5b\x17\xe4\x22\xf0\xae\x46\xa2\x66\xc4\xc8\x62\x06\
+\x6c\x25\x96\x51\xb0\xf6\x44\xa9\xab\x0e\x63\x2e\x11\x82\x07\x6a\
+\x05\xab\x49\xd9\x35\x97\xbb\x17\xb0\xa5\x12\x9d\x52\x09\x15\xb5\
+\xa5\x5b\x20\x73\x3e\x03\x92\xe9\x67\x02\x4c\x92\x7a\xa6\xc5\x16\
+\xc6\xc9\xeb\xde\xf1\x57\x54\xbd\x05\xf8\x0b\xda\x7f\x95\x83\x77\
+\x7c\xec\x2b\x53\x2d\x16\xf9\x3e\x01\x5e\x53\x9a\xed\xcd\x6c\x8d\
+\xb0\x1a\xbd\x0c\xb4\xc8\xb3\x22\x03\xa1\x25\xf0\x44\x15\x41\xd9\
+\x45\xbd\x4f\x0f\x88\xd1\xbe\x1f\x03\x13\x45\x72\xb6\x3b\x66\x15\
+\xbf\x27\xf2\x8b\x88\x0a\xc8\xd8\x16\xa6\x1e\x97\x94\xdf\xa8\xa9\
+\xf4\x6b\xe5\x18\xea\x7f\x13\xa8\x2d\xb6\x96\x8e\x58\x76\x8f\xaa\
+\xfa\xab\xd6\xfa\x89\x20\xf2\xcb\xb4\x6a\xa9\x8d\x9e\x47\xf9\x7d\
+\xa8\x97\xe5\xca\xbd\x45\x8c\x62\x3f\x0d\xee\x39\xf0\xbb\x0a\xc4\
+\xac\x8e\x2f\x87\xf7\xd6\x39\x9c\xc7\x59\x3c\x56\x4b\xbf\xac\xd1\
+\xd1\xa8\x37\xa1\xca\xeb\x29\xee\x2a\x78\xbe\x62\xb1\xb5\xac\x6f\
+\xae\xf1\x6f\xfc\xda\xd7\x79\xeb\xcd\x4d\xbe\xf5\xa7\xd7\xa8\xeb\
+\x24\x70\x73\x11\xb0\x62\xed\x0e\x2f\x7c\xfe\x3b\x5c\xb9\x3e\xe5\
+\x2b\x7f\xf8\x0c\x93\x49\xfa\xfe\x1d\x52\x3e\x67\xdf\x78\xda\x88\
+\xe7\xab\xc7\x5b\xb4\x06\x03\x67\x8b\xc7\x0c\xe2\xb3\x40\xa5\xdb\
+\x0d\xbb\xdb\xd8\xb3\xe2\x8e\x59\x4e\x62\xb6\x4b\x80\xf9\x47\x32\
+\x3f\x86\x10\x4c\x90\x38\x4f\x8e\xd7\xd7\x66\x97\xae\x5e\x3b\xb8\
+\x79\xeb\xb9\xbd\x5b\x2f\xbd\xbc\xff\xcc\xf3\x2f\x9c\x6c\x6c\x6e\
+\xf9\x55\xd4\xf1\x67\x96\xd6\x8a\x8d\x4e\xb0\x62\x1e\xd8\xf8\x25\
+\x08\xed\x0c\x07\x89\x03\x8c\x8a\x91\x41\xac\x29\xb9\x6d\xe1\x65\
+\x89\xf3\xe5\x7b\xea\x30\x5b\xb5\xc7\xbb\x27\x9b\x02\xeb\xd6\x72\
+\x45\x84\xef\x80\x9f\x2d\xb7\x0b\x9a\xec\xc6\x35\xf3\xf3\x45\x3f\
+\x47\xb2\x43\xa9\xa6\x53\x70\x5d\x52\xf1\x35\xd2\xb8\x72\x3b\x65\
+\x05\x22\x57\x40\x72\xd5\x56\xed\xb3\x0c\x24\xbb\x3a\x92\x3d\x65\
+\x7b\xd3\x81\x40\x2d\xb1\xdd\x45\x20\xdb\x6d\xf2\xa0\x65\x2a\x11\
+\x12\x5a\xab\xd1\x68\xa8\x32\x10\xba\x22\xdf\x21\xff\x5e\x7c\x21\
+\x7a\x9c\xa6\x9d\x98\x47\x86\xd1\x34\x12\x7e\x46\x23\x98\x4e\x53\
+\x3e\x97\x51\xca\xe7\xa9\xf4\x37\x6f\xcb\x82\xcd\x8d\x92\xa6\x69\
+\xb0\xed\x84\x3f\x55\x23\xf8\xa8\xbf\x1a\x59\x87\x08\x94\xeb\x5b\
+\x5c\xbb\x32\xe0\xf8\xa0\x66\x6f\x6f\x04\x7e\xa8\x06\xf5\x96\x82\
+\x8f\x28\x3a\x23\xfc\x90\x28\x04\x73\xc1\xc2\x58\xe2\xe7\x16\xb8\
+\x6f\x2d\xd7\x44\x28\x62\xa4\xce\xe7\x02\x2a\x85\x1a\xc8\x9b\x2e\
+\x72\x33\x13\x08\x2c\x15\x44\xbd\x0b\x72\xa2\xf4\x55\x95\x18\xe7\
+\x3e\x6d\xd9\x8d\x16\xb0\xcd\x80\x03\x84\x0d\x9c\x2b\xc0\x1b\x82\
+\x5d\x97\x58\xbe\xa3\xc9\x8e\x97\x14\x6e\x15\x9c\xba\x02\x7c\x05\
+\xec\x21\x92\xea\x4e\x96\x10\x66\x44\xcf\xf8\x79\x3d\xa7\x71\x04\
+\x80\x76\x17\xc4\x69\xe4\xef\x32\xc8\x1e\xd6\x16\x0a\x40\xa7\x0a\
+\x70\x36\xb3\x6b\xab\x80\x23\x05\x8d\x09\x0c\x1f\x44\x30\xa6\x39\
+\x92\xc8\x31\x9e\xb7\x23\xe0\x51\xc8\xe0\xdd\x4b\x78\x7f\x59\x25\
+\xde\xef\x59\xca\xb7\x3c\xb5\x4d\x58\x75\xd0\x51\x48\x53\xdb\x11\
+\xe4\x4d\xa2\x17\xfa\x44\x41\x8f\xa9\x2a\xcc\x80\x81\xa9\x00\x06\
+\x91\xcc\x4a\x55\x15\xc4\x08\xf4\x0d\x62\x0e\xe4\x48\xc1\xf5\x1b\
+\x7a\x6e\x97\x80\x7f\x8d\x4e\x19\x57\x16\x8c\x3e\x91\x82\x18\x2d\
+\x38\xa2\x0b\xd6\x3f\x59\x53\xbf\x02\x3c\x8c\xf9\x8e\x75\xa9\x7d\
+\xfd\x3d\x41\xea\xcc\xb0\xb8\x4c\x2c\xbb\xf1\x0e\x31\x52\x7c\x19\
+\xef\xa7\x28\x6d\xbb\x28\x20\x34\x5c\xf4\xd4\xb7\x14\xd4\x26\x75\
+\x55\x01\xc2\x20\xd6\x94\x39\x8e\xc7\xf7\xd7\x81\xab\x0e\x77\xd9\
+\xe3\xef\x10\x29\xb5\xd6\xe1\x9c\xf7\x3e\x01\xc8\x73\x0a\xe4\x44\
+\xf7\x75\x44\x97\x03\xbc\xe0\x31\x17\xc4\x60\xdc\x0c\x3b\x10\x06\
+\x03\xf0\x18\x8b\xbd\x29\xb1\x94\xcd\x4c\x1d\x01\x60\x0a\xc1\x5a\
+\xd1\x9a\x17\x69\x0c\x2e\x4b\x99\x06\xcb\x09\xc2\x7b\xfa\xde\xf6\
+\x29\x40\x71\x53\x9f\xab\x65\x51\x43\xaf\xa2\x51\x29\x52\x9b\x4a\
+\x86\xfc\xe4\x9c\x6b\x8d\x77\xae\x70\xfe\xdc\x85\x8b\x47\xd7\x6e\
+\x3e\xb9\x7f\xeb\xa5\x97\x77\x9f\x7d\xe9\xe5\xa3\x1b\x4f\x3d\x3d\
+\xfd\x69\x04\x8e\xab\x68\xe4\x07\x6b\xf2\x11\x51\x5b\xad\xc5\x1a\
+\x83\xf5\x9e\x50\x14\x98\xa6\xe1\x6b\xc0\x5f\xb7\xb1\x2c\xcf\x15\
+\xde\x87\x04\xec\xea\x9e\x30\x00\x5e\x14\xe1\x07\xc0\x8f\xb5\x74\
+\x56\x06\x1f\x9a\xe5\xf0\x71\x71\xee\x32\xaa\x20\xad\x73\xbc\x92\
+\x67\x23\xa3\xe2\xac\x52\x20\x66\x61\x0e\x5c\xb5\x15\x90\x5c\xb5\
+\x55\xfb\x2c\x36\x5f\xd5\x16\x40\xbc\xfc\x64\x4e\xc0\x74\x82\x3f\
+\x9d\x77\x70\xda\x95\x4e\x98\xa6\xf7\xbd\xda\xc0\x12\x96\x7b\x1e\
+\x19\x03\x97\x70\xc4\x94\xb1\x10\x62\x0e\x5b\x34\x0a\x8b\x25\x60\
+\xc1\x2a\xdd\xd3\xb0\xbe\x7e\xc4\x97\x7f\x65\xca\x64\x12\xf8\x93\
+\x7f\xba\xcd\xf1\xe1\x4d\x62\xe4\x6a\x4f\x01\xe8\x54\x8d\xe0\x01\
+\x31\x52\x72\x57\xa2\xe8\xcc\xba\x08\x17\x81\x43\x11\x46\xc0\x75\
+\xef\x39\x50\x43\x7e\x42\x17\x65\x79\x00\x54\xde\x79\xe7\xbc\x2b\
+\x3c\x3e\x89\x0a\xec\x00\x77\xb0\xf6\x49\xef\x7b\x22\x37\x49\x2d\
+\x76\x27\x03\x92\x09\x68\x0c\x22\x90\x00\x8f\x24\x80\x7c\x99\xce\
+\xd8\x29\xac\xe5\xba\x08\x2a\x8d\xee\xad\x2a\x6c\x5e\xd5\x6d\x0a\
+\xf5\x0a\x9c\x24\x34\x8d\x33\x8e\xe0\xab\x78\x3e\x72\x8e\x48\x47\
+\xb5\x7a\x1d\xbb\xf4\x85\x5c\x2e\x64\xe7\x69\x81\x03\x8b\x75\xa2\
+\x91\x4e\x6b\x71\xda\x27\x23\xe0\x9e\x8b\x82\x2d\xfd\x5c\x94\x8a\
+\x27\xc0\xdf\x00\xd6\x05\xd9\x70\x8e\x7b\xb5\xaf\xbf\x98\xf0\x44\
+\xdc\x84\x36\x07\x28\xa3\x3b\x0d\xe8\x44\x84\x52\x09\x18\xd3\x42\
+\xce\x50\x96\xd4\xd5\x0d\x62\x04\xf2\x1c\x5d\x44\x38\xd6\x0e\x75\
+\x6e\x93\x10\x9e\x54\xd6\xf2\x55\x1b\xa9\xae\x47\xc4\x72\x16\xf3\
+\x86\xc2\x80\x08\xe6\x52\x1e\x60\x20\x46\x0c\x9e\x54\xf0\x1d\xe8\
+\xe8\xa3\x07\xf4\xa3\x67\x7b\xc4\x62\xd7\xbf\x04\x78\xbc\x1f\x27\
+\xc0\x5d\xc4\xa8\x04\xc0\x91\x73\x3c\xe5\x3d\x5f\xd4\xe3\x5d\x00\
+\x2a\xac\x3d\xae\x44\x0e\x15\xe4\xef\x13\x23\x80\x3b\x1e\xff\x9c\
+\x8e\xa5\x19\x70\xe0\xf1\x43\x0b\x97\xb0\x8c\x24\x2a\x65\xec\x67\
+\x8e\x12\x6b\xb1\xd7\x05\xb9\xa2\x60\x72\x5d\xcf\x75\x0c\x5c\xb0\
+\x96\x5d\x31\x21\x9e\xaf\xf7\x80\x0f\x82\xec\xd0\xd2\xbb\xb9\x08\
+\x18\xac\x33\x04\x1b\x7f\xfa\x54\xae\xed\x79\x70\xaa\xaa\x18\xb3\
+\x53\xd6\xef\x94\x23\x99\x28\xe9\xb2\x14\x48\x0a\x87\x2c\x46\x21\
+\xdf\x4f\xfb\x50\xa5\x60\x7c\xe3\x1d\x86\x30\x5e\x5b\xab\xce\x5f\
+\xbc\x7c\x74\xe3\xd9\x67\xf7\x5e\xf8\xc2\x17\x77\x9f\xff\xfc\x2b\
+\xc7\xc3\xd1\x68\x95\xeb\x78\x46\xfb\x59\x8d\x46\xb6\xe3\xca\xa9\
+\x96\x96\xe6\x03\x66\x82\x6a\x99\xf7\xc9\xa9\x00\x8b\x5f\x78\xdf\
+\xe3\x63\x21\xfb\x08\x4e\xac\xce\x01\xb5\x44\x4a\xf9\x0b\x3a\xdf\
+\x94\x3f\x91\x6b\xfb\xc9\x45\xd5\x3e\xcc\x31\xd7\x89\xa9\x12\xdf\
+\xa0\x13\xd0\x59\x0a\x1b\xf3\x5c\xd2\x25\xd7\x4d\xbf\xf0\x99\xef\
+\x28\xae\x9c\x52\xcf\x35\x2f\xf5\xb3\x8a\x48\xae\x80\xe4\xaa\xad\
+\xda\xaa\xe9\x94\xe9\x63\xe0\x21\x04\x65\xb1\x86\x18\x5d\x6c\xf3\
+\x22\x7b\x4b\x63\xc7\x81\xed\x88\x1f\x49\xde\x35\x8b\x4c\x06\x13\
+\xa3\x91\x68\x14\x32\xf4\xa9\xb2\x26\x11\x64\x33\x20\x39\x1c\x62\
+\x67\x33\x68\x65\x38\x87\x53\x90\xd2\xba\xba\x36\x7e\x4e\xa8\x25\
+\x5b\x10\xae\xea\xc2\x12\x45\x43\x9c\x83\x20\xf3\x1e\xc3\x32\x7b\
+\x7d\x1e\x38\x4f\x04\x7f\x71\xe5\x09\xc1\xe0\x5c\xc0\x84\x09\x31\
+\x4a\x74\x9b\x3e\x85\xae\xb0\x96\x20\xc6\x95\x4a\x5b\x1d\x22\xb6\
+\x01\x51\x71\x11\xf6\x15\xb0\xac\x03\x97\xc0\x06\x90\x0b\xc4\x08\
+\xde\x1b\xc4\x1c\x18\xe7\x89\x88\x31\x88\x75\x12\x59\xae\xd7\x55\
+\xca\xdc\x81\xb3\xe0\x53\x1e\x62\x05\xd6\x38\x4c\xca\x91\x3c\x07\
+\x6c\x62\x29\x11\x0a\x0f\x5e\x01\xe2\x46\xfc\xcc\x3e\xd0\x3c\xc6\
+\x35\x11\x26\x16\x1e\x4a\xaa\xb5\x69\x65\xcd\x0a\x95\x44\xc0\x93\
+\x40\xa1\x1e\x43\x1c\x1e\x87\x65\xa0\x20\xe9\x42\xb6\xc8\x36\x80\
+\x49\xa2\x3f\xfa\x1d\x67\xe1\x50\x3a\x20\x79\x51\x29\x9d\xb7\x89\
+\xf9\x75\x29\xba\x09\x50\x64\x04\x30\x13\x59\xbb\xf5\x26\xf0\x39\
+\x3a\xd1\x95\x03\xef\x39\x97\xb0\xa1\xc5\xb7\x04\x51\x1f\x3a\x25\
+\xc0\x88\x3d\xac\x01\xd9\xc5\x52\x58\x18\x58\x8b\x6d\x9a\x96\x7e\
+\x7c\x93\xba\x7e\x42\x41\x8e\x03\x7b\xa0\xe0\xaa\x06\x06\x0e\xb7\
+\xed\xbd\x7f\x18\x81\xa5\xdb\x8a\xe0\x09\x9c\xe3\xa1\xf7\x3c\x98\
+\x5b\x81\x06\x34\xbc\xa8\xc0\xec\x04\x62\xea\x24\x15\x54\x03\xbe\
+\x37\x88\xbf\xa1\xa2\x54\x90\x74\xc2\x62\xd5\xc8\x6f\x00\xc5\x20\
+\x86\x83\xaf\x11\x7f\x8e\x33\x8b\x23\x78\xcf\x77\x33\x40\xfe\x79\
+\x87\x33\x5e\xfc\x3b\xea\xb4\xb8\x41\xac\x39\xb7\xa3\xe3\x48\x0d\
+\x7f\xa5\x00\x00\x20\x00\x49\x44\x41\x54\xea\x07\x71\x5c\x71\x93\
+\x28\xd4\x11\x6b\x45\x0a\x77\x1d\x66\xe6\xe7\x8c\x42\x41\x66\xc4\
+\xfc\xa1\x34\x86\xcf\xeb\x3e\xc7\x22\xec\x80\x35\x04\x31\xf1\x41\
+\x77\x46\x53\x93\x1b\xab\x8e\x06\x49\xb4\xae\x10\x0c\x9d\x23\xe0\
+\x82\xee\x27\x46\x9d\xe3\x6d\x71\xd9\x71\x93\x82\xaf\x9b\x7b\x42\
+\x27\x0a\x12\xdb\x1c\xc9\x47\x18\x97\x49\x5d\xd6\x2c\xf9\x6c\x74\
+\x8a\xe1\x66\x1f\xd3\x10\xef\x22\xb3\x22\x34\x75\x53\x58\x67\x65\
+\xfb\xfc\x85\xa3\xab\x37\x6e\x1c\x3c\xfd\xfc\x8b\x7b\x2f\x7c\xe1\
+\x8b\x07\xd7\x6e\xdc\x9c\x7e\x9a\x73\x1d\x57\xed\x13\x05\x3b\x16\
+\x8f\x3d\x33\x75\x91\x05\xb2\xeb\xfc\xfb\x56\xe7\xaf\x79\x67\xc7\
+\x5d\xe0\x2b\x3a\x6f\xcd\x3e\xae\x8b\xb0\x58\x65\xbb\xf4\xd9\x3c\
+\x16\x2b\xca\xa6\x08\xca\xe0\xa1\x65\xfc\x44\x81\xad\xe5\xe3\xdf\
+\x5a\x63\x49\xca\xad\xd6\x80\x20\x9d\xc4\x6c\xc8\xbf\xab\x8a\xdd\
+\x9d\x97\x47\xda\x5f\x62\xb1\x7e\xfe\x9c\xde\xc7\x7d\x99\xea\x8f\
+\x3d\xdb\xb6\x59\x0a\x5c\x4f\x07\x82\xfe\x11\xca\xd0\xd6\xae\xc0\
+\xe3\x0a\x48\xae\xda\xaa\xad\xda\xe2\x64\xeb\x31\xf3\x53\x63\xab\
+\xa0\xb3\xa4\x26\xc8\xdc\xdf\xb9\xf0\xce\x92\xda\x20\x4b\x77\xdc\
+\x6e\xde\xe5\x51\x9a\xd9\x2c\x7d\x73\xd6\xfd\x2a\xeb\x44\x3d\x49\
+\xe0\x23\xed\x7d\x93\x18\x8d\x83\x18\x4d\x39\x8f\xf7\x05\xa6\x08\
+\x34\x89\xac\x12\xd2\x82\x93\x14\x46\x53\x44\xed\x10\x98\x16\x05\
+\xa1\x09\xe9\x22\x42\x52\xcb\x3b\x5a\x02\x58\x63\xde\xe2\xfa\x66\
+\xc9\x13\xcf\x6e\x71\xef\xf6\x50\x76\xef\x6d\x11\xf3\x0a\xef\xea\
+\xf6\x33\xfd\xfb\x84\xa8\xa2\xf7\x8a\x1a\xde\x17\x80\x73\x58\xbb\
+\x8d\xc8\xa1\xef\x0c\xf6\x6b\x74\x11\xcf\x44\x4b\x0d\x7a\x2d\x33\
+\x62\xae\x86\xd5\xba\x11\x15\xf0\x00\x61\x4b\x5f\x27\xaf\x6c\x34\
+\xae\x2d\x16\xc1\x59\x98\x09\xdc\x93\x78\xcc\xa0\xe0\xae\x02\xee\
+\x62\xed\x46\x06\x0a\x1b\x92\x0a\x2c\x38\x15\x2b\xd9\x27\x89\xf4\
+\x74\xf5\x34\xb7\xf5\x9a\x1c\xd8\xa9\x45\x0e\x24\x95\x32\xb1\x76\
+\x84\xc8\x00\xad\x2d\xe8\xa0\xf0\x49\xa4\x47\x9d\xc1\xf4\x94\xf1\
+\xea\x12\x78\x99\x18\x9d\x4a\xfd\x55\xe5\xd6\x85\x2c\x1a\x1b\xd9\
+\xbb\x12\xe9\x95\x62\x07\x82\x1c\xa8\x28\xd0\x2d\x05\x57\xe7\x74\
+\xa3\x43\x8b\x9d\x09\x92\xca\xbe\x34\xc0\x8f\x3d\xfe\x50\x45\x59\
+\x01\x7f\xd5\xc1\x81\x87\x75\x8d\x20\x3f\xec\xdd\xe9\xa6\x1c\x42\
+\x5d\x2b\x40\x3c\x86\xf4\x3d\x05\x93\xb4\x67\x3d\xd0\xfd\x9f\x24\
+\xc0\x39\x1a\x61\xa6\xd3\xee\x09\xa8\xba\x71\x3a\x05\x8e\xfa\x49\
+\x7c\x6d\xcd\x92\x00\xdc\x03\xbf\x05\xbc\xcb\x60\x60\xa8\xaa\x57\
+\x15\xa4\xde\x74\x8e\x17\xbd\xe7\x90\x48\xab\xde\xd7\x67\xe0\xb2\
+\x1e\x7b\x96\x45\x7c\xf3\xe8\xc2\xb1\xde\xbb\xaf\x51\x14\x3f\xa4\
+\x69\x82\xc5\xbe\x0d\x9c\x13\x24\x16\x7c\x4d\xcf\x48\x26\x1e\x21\
+\x49\x7c\xa9\x2c\x4b\x06\x03\x3a\xa0\xd9\xe6\xbf\xde\x23\x3a\x24\
+\xb6\x2c\x9c\x28\xbd\x7b\xac\xce\x9c\x64\x08\xaf\xeb\x98\x4f\xe2\
+\x56\x83\x6c\x3c\xac\x9d\x62\xf8\x59\x05\x98\xe7\xf5\x38\x43\x16\
+\x53\xce\xaa\xf8\xb9\x0d\xa7\x14\xb1\xab\x58\x9e\x87\x59\x68\x5f\
+\xbc\x95\xcd\x1f\x66\x6b\x6b\x8b\x5b\xbf\xfc\x2b\xaf\xdf\x7a\xf9\
+\xe5\xbd\xe7\x7f\xee\x95\xa3\x9f\xe5\x5c\xc7\x15\xad\xf5\x23\x00\
+\x93\x1f\x16\xcb\x49\x9b\x43\x3d\xdf\x7e\xfc\x71\x5f\x80\x9c\x52\
+\xf4\xb1\xf7\xbe\xcc\xf3\x32\x8c\x71\x99\x4f\x28\x45\x5a\xa3\xc3\
+\x0b\xc4\xa5\x85\x48\xf0\x10\xe2\xf7\x5d\x0f\x8c\x3a\x30\x5e\xd2\
+\x1f\xae\x95\xda\x71\x73\xc7\x6f\x85\x8b\xf2\x12\x4a\xd9\xe3\xef\
+\xb2\x32\x4a\x4b\xe6\x8d\xf9\xd2\x4c\x8f\x77\x3f\x96\xa9\xb6\x9e\
+\xe2\x74\x5a\x68\xa9\x4c\xc8\x0a\x50\xae\x80\xe4\xaa\xad\xda\xaa\
+\xa5\x35\x44\x98\x2f\xe4\x81\x31\x18\x09\xf4\x88\xa7\x3d\x21\x1e\
+\xd3\x19\xf9\x73\x9f\x65\x1a\xae\x3d\xdc\x99\x52\x2f\x63\x94\x32\
+\x46\x25\x45\xda\x3a\x96\xae\x37\xb1\x0f\xf5\xbf\xd9\xcc\xe0\x5a\
+\x5a\x50\x52\xb0\xbc\xa9\x40\x27\xd1\x00\x01\xce\xe3\xdc\x31\x5e\
+\xa2\xd8\x0e\xed\xea\xe2\x2c\xf6\x19\x41\x76\x15\xe4\xec\xe8\x42\
+\x72\xb5\x69\x30\xb8\xd2\xb6\x40\x32\xca\xc7\xce\x2f\x0e\x25\x70\
+\x01\x61\x9f\xf5\x6d\xcf\x0b\x5f\x98\x32\x9b\x94\xec\xde\x9b\x11\
+\x23\x71\x6f\x2b\x50\x4d\x11\x91\x29\x94\x1e\xe4\x3e\xf8\x57\xd4\
+\xf0\x3e\x42\xa4\x06\x7b\x29\x2e\x9f\x12\xa9\x7e\xd6\xde\x45\xe4\
+\xa9\x78\x4c\x1f\x25\x6c\x45\xae\x02\x0d\x56\x76\x90\x56\x0a\xbe\
+\x52\xb0\xb2\x0d\xce\xe0\xbc\xc1\xcb\x94\x14\x39\xed\xd3\x6d\x52\
+\x64\x2e\x07\x18\x4f\x5a\x11\x91\x28\x6d\x67\x24\xe6\xb4\xcd\xe8\
+\x45\x1f\xed\x0c\x64\x90\x7d\x6f\x03\x62\xad\x30\x03\xd6\x23\x8d\
+\xa4\x65\x14\x67\xbd\x04\x4f\x57\x56\xc4\xf8\xee\x7b\x8d\x02\xbb\
+\x07\x73\x9e\xdf\x97\x88\x51\xb5\x89\x1a\x4f\xef\x3c\xfe\x08\x2d\
+\x29\xa9\xa9\xc1\x28\x25\xf9\x09\xe0\x05\x6c\x1b\x59\x3e\x02\x66\
+\x58\x5b\x8b\xc8\x3e\x70\x7f\xc0\xe0\x2d\x17\x95\x56\x61\x8c\x99\
+\x4c\x60\x08\x83\x19\xac\x19\x78\xdb\xe1\x36\x3c\xfe\x10\x78\xc8\
+\x18\x43\x2b\x7b\x53\x0f\x9d\xa3\xf6\xe5\x68\xc2\x74\x7a\xc2\xe9\
+\x22\x31\x4d\x07\x24\x37\x8f\xe1\x90\xe9\x74\xe9\x76\x13\xfd\xe9\
+\xe7\xe8\x66\x01\x88\xb2\xe4\x41\x5d\x73\x1e\x38\xc1\xda\xe4\x50\
+\x38\x04\xee\x7a\xcf\x26\xf0\x39\x07\x2f\x7a\xf8\x71\x59\xf2\xdd\
+\xba\x2e\xb6\x21\xdc\x82\x70\x83\xa8\xfc\x3b\x89\x7d\xec\xac\x73\
+\xde\xa8\xa2\x6e\x09\x5c\xa6\x69\x76\x80\x7d\x89\x51\xc7\x73\xed\
+\xfd\x75\x36\x46\x1d\x23\xcd\x7a\x43\x01\xe1\x86\xc5\x8a\x14\x83\
+\x09\x83\xb1\x7a\xe7\x83\x71\x10\x7c\xcc\x9f\xdd\x21\x45\x2d\x85\
+\xaf\x65\xcf\xe3\x2f\x28\x58\x4e\x51\xda\x77\xf4\xf7\x90\x48\xb3\
+\x56\x65\x5e\xc6\x74\x0a\xb2\xb5\x3e\xa1\x8d\xbe\x77\xac\xcf\xca\
+\x44\x9f\xfe\x73\x73\xde\xa7\x3b\xf4\xdd\x0d\xcb\x07\xca\x62\x3b\
+\xd1\xe7\xfe\xff\xcc\x3b\xfd\xb9\xe7\x9e\xe3\xdf\xfb\x4f\x7f\xeb\
+\xcd\x55\xd4\xf1\xc3\xb5\x9f\x71\x5a\x6b\x02\x1d\x8f\x09\x24\x33\
+\x48\xd3\x47\x37\xd6\xc6\xf0\xdf\xd9\xa0\xf4\x03\x20\xa2\x8f\xd1\
+\xbb\x3c\x7f\x2a\x89\xba\x9b\x90\xe5\x1c\x2d\x94\xfc\xe4\xfb\xb4\
+\x51\x3f\xa7\xf6\x3a\x7f\xa8\xd3\xff\xa0\x77\xcc\xd3\x4e\x55\xc1\
+\x5d\x84\x9b\x0e\x7c\x46\x2f\x8e\xb6\x43\x2c\x65\xe2\x7c\xa2\xb8\
+\x3e\xfa\x7e\x5a\x6b\x96\x4e\x35\x22\x3d\x61\x9e\xd5\x0c\xb0\x02\
+\x92\xab\xb6\x6a\xab\x06\x84\x4c\x7a\x35\x74\x6f\x2e\x32\x5a\x7b\
+\x7f\x86\xf7\xff\x59\xc8\xde\xca\xf6\x2f\x9d\xb7\xd6\xf6\xed\xec\
+\x19\x94\xa5\x45\xea\x04\x52\xd6\x14\x44\x24\x2a\xe9\x34\x9b\xd0\
+\x0d\x42\x85\xb3\x89\xb2\x17\x17\x11\x10\x41\x1e\x28\x78\x91\xd6\
+\xe0\x4c\xb5\x90\x37\x37\x4b\x70\x30\x18\x18\xd6\xd7\x0b\x8e\x0f\
+\xd2\x92\xbe\x49\x8c\xac\xa4\x1c\xaf\x57\x31\x12\xb0\x6a\x7c\xc7\
+\x63\xd6\xed\xa2\xe3\x9c\xe5\xca\xcd\x0b\x34\xcd\x26\x77\xdf\x4e\
+\x2b\xcd\x8e\x02\xcd\x71\x04\x7d\x66\x0c\xcc\x2c\xf6\x69\x41\xd6\
+\x15\x44\x5e\x06\x46\xce\x31\x8d\x84\x4b\x1a\x8b\x3d\x11\x11\x0d\
+\x68\x39\x03\xde\x82\xbd\x09\x32\x76\x29\xd8\x6a\x09\xb1\xfa\x33\
+\x6b\x9d\x37\xd9\xae\x11\xa9\x4a\x93\x39\xf3\xe4\x58\x62\x5f\xa5\
+\x85\x6f\x00\x5c\xb1\x30\xd0\x6f\x8e\x40\x2e\x1b\x18\x67\xb7\x6b\
+\x1f\x78\xd0\xf9\x8c\xc3\x08\x64\x03\x6b\xc5\x8b\x57\xb0\x63\x9d\
+\x52\x78\x77\xb2\xe3\x5d\xd3\x79\x3c\xa8\xc0\x50\x41\xcc\x47\x5c\
+\x07\x6a\xe7\x78\xcf\x7b\xde\xa2\x2c\x4d\x59\x43\x4d\x1d\x96\xc0\
+\x81\xa4\xd4\x3b\x28\x60\xd0\x50\x6f\xd4\xf1\x7e\xa4\x9f\x18\x39\
+\x8b\xd1\xd6\xa9\x5e\xef\xbb\x88\x7b\x7b\x0b\x79\xed\x00\x26\x55\
+\xa7\x5a\xca\xe5\x09\x66\x12\x47\xd3\x93\x8a\x00\x0f\xd5\xfc\x38\
+\x04\x76\xdb\xde\xba\x7a\xd5\x70\xf7\xee\xd8\x7b\x2a\xfc\x74\xa2\
+\xe0\xa6\x83\xe7\x77\x7a\x8f\x44\x02\x41\x13\x38\x3c\x02\xb8\xc9\
+\x4d\xf3\x4e\x1f\x1f\x07\x3d\xb7\x24\x82\x63\x00\x2e\x5d\x8a\x30\
+\xfb\x81\x3e\x0a\xd6\xb2\xdb\x82\x9e\xe9\x74\x3e\xd1\xe7\x08\xb8\
+\xeb\xe1\x97\x81\x17\xea\x9a\x37\xa0\x39\xa0\x2c\xbf\x4d\x5d\x5f\
+\x07\xae\x83\xdd\x8a\x20\xcf\x27\x1b\xc7\x6a\xc4\xf0\x2a\x05\x7b\
+\x91\xc0\x6d\xc7\xc4\x22\xde\xbb\x51\xd6\x27\x18\xf5\x06\xa5\xb1\
+\xbe\x0b\xbc\x2d\x48\x8c\x74\x87\x10\xf3\x23\x45\xf0\x50\x6b\xb1\
+\xf4\x82\x18\x35\x1c\xd2\x09\x3b\xa5\x7e\x48\xed\x01\x31\x7f\x29\
+\xb5\x24\x70\x74\xac\xdf\x2f\x71\xbc\x83\x67\xa0\xcf\xc5\x58\x9f\
+\xa3\x5d\xba\x9a\xa4\x63\x7d\xe6\xa6\x19\x60\xf7\x19\xf8\x5c\x98\
+\xc2\x1e\x31\xc5\x9d\xe8\x78\x6e\xa1\xbe\x31\xe6\x33\x41\x5d\x5d\
+\x45\x23\x3f\x74\x7b\x1f\x54\x46\xcf\x29\x68\xc9\xe8\x14\x6d\xcf\
+\xf4\x84\x7c\x42\x20\x72\x49\xde\xa0\x69\x71\xac\x73\x09\x28\x69\
+\x19\x8c\x74\x62\x11\xe5\xba\x0c\xed\xfa\x6e\x7f\x8f\x64\x84\x7e\
+\x72\xc0\x77\x2e\x52\x18\xdf\x34\x59\xc9\x11\xb3\xe4\x67\x09\x60\
+\x3c\x03\x60\x2e\xa7\xc9\xae\xda\x0a\x48\xae\xda\xaa\x7d\xf6\xda\
+\x70\x7d\xbd\xfe\xdb\x7f\xef\x1f\xfc\xc6\x47\xbd\xdf\x3f\xf8\x9d\
+\x7f\xf8\xfb\xbf\xfa\xab\xbf\xfa\x58\xdb\x7e\xf5\xab\x5f\xed\xe8\
+\xad\x83\x41\x07\x24\x13\x9f\xb0\xae\xf3\x09\xbb\x21\x46\x17\xde\
+\x9c\x33\x1e\x63\xb9\x0a\x67\x9a\x6e\x45\xf3\xba\xba\x59\x40\x8e\
+\xe6\x96\x86\xb4\xa0\x07\x5c\x49\x0b\x3c\x47\x6b\x09\xac\xde\xa4\
+\x8b\x22\xbd\x09\x5c\x70\x50\x79\x8f\x8d\x8b\x51\x4b\x07\xd4\x68\
+\xa5\x8c\x30\xa6\xe2\x99\x17\x4f\x18\x8d\x2b\x8e\x77\x37\x38\x3a\
+\x12\x35\x8c\x13\x95\x73\xa0\x32\xe5\x77\x25\x22\xbf\x17\xd4\x78\
+\x06\xd8\xf2\x9e\xf3\x6a\x70\xef\x08\x52\x59\xec\x50\x90\xa1\xb5\
+\xde\x01\x9b\x22\x72\x64\xb1\x8d\xc7\x0f\xc0\x8a\x15\x19\x80\x3c\
+\x8d\x70\x01\xec\x7b\x16\x19\x61\xa5\x46\x78\x07\x18\x2b\xf5\x74\
+\x1a\xd3\x73\xd8\xd5\x5c\xcc\xa1\xc0\xc0\x04\xb6\x02\xec\x49\x5c\
+\x5a\x13\x28\xb8\x1f\x62\x94\x77\xa8\x6a\xaa\xa2\x06\xfd\x40\x95\
+\x6c\x87\xc0\x21\x22\x16\xcb\x08\xec\x18\x91\xcb\xc0\x04\x6b\x4b\
+\x2d\x58\x3f\xcc\x8c\xf5\x67\x14\x44\x5e\x53\x23\xfe\xc7\x0e\xf7\
+\xba\xf7\xfe\x35\xc0\x94\x35\x26\x82\xc8\xd2\x41\x9d\xea\x54\xae\
+\x83\xdb\xa6\xf6\x63\x05\x9e\x6b\x4d\xb7\xd8\x0b\x49\x34\xc6\xda\
+\x09\x22\x06\xcb\x14\xe1\x2d\xa2\x68\xc5\xeb\x50\xcf\x0e\x96\x8c\
+\xb1\xfb\xdd\x3d\x7f\xda\xe1\x8e\xdb\xda\x6f\xde\xf7\x41\xf7\xdd\
+\xbb\x69\xbb\x00\x2d\x48\x8d\xad\x0f\x22\xb9\x7c\x19\x77\xff\x3e\
+\x41\xc1\xcd\x0c\xe0\x9d\xe5\x41\xd6\xf4\x79\x7b\x9c\x07\x0f\xfa\
+\xe0\x67\x36\x6b\xe9\xd4\x27\xf4\xcb\x58\x04\x80\xcf\x83\xf9\x2e\
+\xfc\x5f\xc0\x2b\xe0\x9e\x2b\xf0\x47\x4d\x5d\xef\x44\xe7\x04\x0f\
+\x41\x9e\xd3\xb1\x33\xd3\x73\xf6\x12\xf7\x75\x95\x86\x6d\xe0\x2a\
+\x11\x20\x8e\xb4\x27\x4c\x0b\xcd\x5a\x6a\x2d\xef\x69\xff\x6e\x30\
+\x9b\x94\xfc\xe5\x9f\x5f\xc7\xd8\x0a\x5f\x9f\xa3\xa3\x9e\xa6\x88\
+\xe6\x49\xf7\x0c\x95\xc6\xda\x7a\xa8\x22\x4b\x03\x62\xe4\xd0\xcc\
+\x5d\x43\x02\x80\x05\x70\x80\xe7\x76\xeb\x33\x28\x31\x75\xac\x0f\
+\x3b\xce\xbe\x53\xe9\xb5\xdd\xd1\x31\xb5\x46\x2c\x2f\x92\x44\x7d\
+\x24\xdb\xaf\xe8\xef\x10\x19\xde\x62\x57\xc6\xdd\x27\xd3\x3e\x03\
+\xd1\x48\x00\xe3\x1c\x36\x45\xba\xe6\x22\x5b\xa7\x83\xcf\x88\xca\
+\xa2\x1e\xb7\x9f\x2b\x35\xf1\x71\x82\xc4\x28\xee\x13\x52\x84\x2e\
+\x09\x85\x7b\xd7\xc2\x3e\x8d\xf0\x29\x20\x9c\x47\x81\x73\xf5\x25\
+\xe7\x61\xe3\xb2\xe8\xa0\xf7\x3f\x65\x77\x34\x5e\xd4\x23\x22\x93\
+\xb2\xdc\x3f\xd5\xa7\x00\xaf\xe6\x99\x15\x90\x5c\xb5\x55\x5b\xb5\
+\x9f\x64\xfb\xea\x57\xbf\xca\xbf\xfb\xdf\xfc\xfd\xff\xe0\x7f\xfe\
+\xaf\xff\xee\x3f\x06\x8c\x82\xc7\x65\x22\x1b\x94\x60\xea\x08\x22\
+\x9b\xa5\x0b\xb7\x22\x26\x8c\x95\xae\x20\x86\x43\x4b\x37\xce\x2f\
+\x18\xc6\x0a\x8d\x05\xd7\x38\xa3\x42\x03\xed\x6a\x98\x72\x1d\xef\
+\xe8\xea\x69\xb1\xd6\x7a\x11\xcd\xf7\x6a\xd2\xa6\x43\x05\x9c\xf7\
+\xe3\xf1\x5d\x20\xd4\x16\x36\xd2\x6a\x5b\x10\x8b\x4e\xef\x03\xbb\
+\x8c\x46\x8e\x2b\x37\x46\xec\xed\xac\x71\xb0\x97\xf2\xcd\x6e\x13\
+\x69\x7f\x0f\xe3\xca\x65\xbd\x82\x02\xaf\x82\x29\x97\x34\x17\x50\
+\x80\x7b\x82\xdc\x02\x9e\xd0\xf2\x1c\xeb\xd6\xf2\x4e\x14\x3c\xe0\
+\x9c\x40\x69\xa5\x2d\xe4\x9e\xa2\xa9\x1b\x20\x17\x90\x36\xf7\xb1\
+\x02\x08\x81\x89\x9e\xf7\x0b\xc4\x3c\xcf\x14\x15\x1a\x00\x1b\x62\
+\xc5\x23\x2d\x00\x3c\xb0\x70\x81\x28\xcc\xd0\x00\x97\x11\xce\x13\
+\x85\x7e\x52\x69\x91\x2d\x3d\xe6\xb6\x82\xef\x23\xac\x1d\x22\xd2\
+\x68\x3f\x0e\xb0\xf6\xc4\x5b\xff\x06\x0d\x6b\xc0\x5a\x4d\xbd\x11\
+\x01\x42\xbd\xa5\x7d\xe9\xc0\x3a\x4b\x40\xba\x9b\x11\x88\xb4\x30\
+\x44\x5a\xba\x27\x88\x1c\x03\x3f\x40\x78\x8d\x28\x66\xe4\x79\x74\
+\x54\xaa\x00\x2e\x7b\x7c\x2c\x53\xd1\xb7\x7e\x96\x29\x2d\xc2\x19\
+\xd1\x03\x05\x91\xe9\xbb\x67\x1d\x3b\x7d\x2e\xa7\x1d\x4f\xfb\xac\
+\xce\xc0\x51\xaf\x7d\xb7\xfb\xf3\x9b\x83\x81\x9f\x56\x15\x5f\x26\
+\x96\x0c\xb8\xad\xa0\xee\xbb\x0a\xd8\x3f\x47\x2b\xa4\x84\x60\xb9\
+\x88\x70\x5d\x5f\xdf\x01\x4e\xac\xd5\xe8\x88\x0d\x91\xde\x1a\x0d\
+\xa3\x98\xd7\x69\xed\x1a\x22\x63\x9a\xe6\x5b\xee\xe1\x9d\xa4\x4c\
+\xb9\x47\xa4\x0d\x83\xc8\x7d\x3d\xd7\x6d\x28\x0c\x34\x06\xea\x64\
+\x5b\x25\xc0\x3c\x63\xd1\x63\xbf\xa5\xe3\x7c\x6d\x1e\x68\x76\x7e\
+\xa2\x56\xa8\x69\x44\x2c\x97\xf3\xae\xc7\xff\x78\xce\xf9\x93\x72\
+\x6b\x53\xce\xa6\xa5\x53\x53\x7e\x4a\x90\xb7\x88\xc9\xb4\x97\xa5\
+\x73\x16\x6d\xeb\x38\x5e\xb5\x55\xfb\x40\x40\xd2\xa7\xdc\xbf\x08\
+\x9b\x8c\xf7\xdd\x3c\x91\xca\x45\xcc\x01\x4b\xd3\x42\x36\xdf\x8e\
+\xdd\x67\xd4\xf1\xf8\xb1\x46\xc1\x3b\xea\xa9\xef\xc7\x0d\x17\x68\
+\xa3\x7e\x09\x70\x5c\xb6\xbf\x4f\x79\x53\x61\x9f\xd3\x04\x85\xc0\
+\x9a\x2e\x0c\xac\x9f\x79\x0c\xc6\x5c\x5d\x56\xe7\x7a\xee\xab\x2b\
+\xa0\xb8\x02\x92\xab\xb6\x6a\xab\xf6\x69\x06\x91\x7f\xfb\xef\xfd\
+\x83\xdf\x10\x1f\x65\xb6\x9d\xc3\x3a\x3f\x70\xd5\x62\x05\x00\x43\
+\x04\x91\x2d\xa5\x64\x09\x95\x26\xae\x15\xe5\x20\xaa\xb6\xda\x56\
+\x38\x27\x10\x6b\x60\x98\xcc\x91\x38\x04\xfb\x84\x20\x07\x52\x14\
+\x2e\xea\xfe\x68\xa9\x10\x2f\xc1\x46\x59\xf6\x69\x6f\x0d\x95\x39\
+\xb5\x3d\x8b\xd1\x22\xf4\x29\x47\x72\x0d\x88\x54\x40\x17\x0c\xae\
+\xcd\x3d\x3c\x20\x46\x34\xd7\x30\xa6\xe6\xb9\x9f\x9b\xf2\xe3\x1f\
+\x58\x8e\x0f\xd7\x35\x1a\x76\xce\xc2\x58\xca\x72\x86\x1b\x1c\x30\
+\x3d\x3e\x52\xb0\x74\x42\x2c\x37\x11\xe8\x72\xca\xbc\x82\xa6\xef\
+\x08\x72\x91\x28\xa4\xf3\xd0\x5a\xb6\x44\xe4\x36\xd0\x48\x34\x9a\
+\x2f\xea\x39\x7f\x37\xae\xb3\x0c\x25\xae\xb0\x91\xfe\x19\xdb\x96\
+\x1a\xe0\xef\x12\x29\xbf\x23\xa5\x47\x7a\xe0\x87\x08\x39\xd0\xfd\
+\xb6\xc1\xed\x78\xfc\x36\x96\x6d\xe0\x0d\x84\xef\x28\x60\x99\xea\
+\x9c\xfd\x5d\x3a\x0a\xf0\x97\x80\x87\x18\xf9\x26\x8e\x0a\xcf\xcb\
+\xc0\x10\x91\x6d\x84\x5f\x22\x46\x3c\x93\xd0\x42\x45\x2f\x8f\x52\
+\xac\x82\xc8\x0a\x98\x38\xd8\xf7\x8e\x13\xf1\x1c\x53\x14\x33\x9a\
+\xa6\x21\x8a\x18\xbd\x0a\xfc\xbf\x73\xe0\xec\x51\x8b\x7e\xa0\xa3\
+\x48\xea\xb6\x43\x03\xb3\x05\x7a\x93\xe7\x7d\xe4\xc0\x6c\x63\xd8\
+\xcf\xb6\xeb\xb4\xa4\x96\x7d\xff\x34\xcb\x25\xd5\x0d\x5d\xa7\x2b\
+\x39\xb2\xb4\x55\x15\xdf\x27\x46\xb2\x5f\x24\x96\x3a\xb9\x10\xa3\
+\xac\xa1\xa0\x90\xaf\xd3\xe0\x0b\x28\x28\x62\xe2\xab\x33\x0c\xa2\
+\x32\x6e\xcc\xb1\x6d\x9f\x03\xaf\xff\x45\x43\x6c\x1b\xd8\x40\x64\
+\x80\xc5\x21\xdc\xf1\xbe\x07\x68\x47\x88\xec\x29\xa8\xd4\x5c\xe6\
+\x26\xf6\x5b\x59\x1a\x6a\x5f\x83\x1c\xd3\x57\x47\x4e\x2d\x45\x97\
+\x0f\x81\x63\x9c\xab\xf1\x7d\x69\xfd\x38\x86\xb9\x9e\x01\xd1\x99\
+\xc7\xd7\xa7\xf4\x7f\x02\xdb\xe9\xfc\x8e\xf5\x9c\x2e\x13\xd5\x72\
+\x67\x52\x14\x8e\xa6\x49\x25\x15\xb6\xf9\x70\x65\x45\x7e\x6a\xdb\
+\x8a\xd6\xfa\xd1\x00\xc9\x6c\xbc\x1a\xdf\x03\x98\x3d\x90\x66\xe6\
+\x11\x58\x96\x22\x69\x62\xce\x3c\xdf\xe3\x11\x49\xbe\x1f\x3d\xce\
+\xc2\xa8\x13\xee\xb1\xb7\xb1\x51\xb9\x39\x7b\x6d\x7b\xd7\x26\xb6\
+\x55\x43\x0b\x69\x3d\x8c\x44\x00\xe9\xe6\x38\xcd\x31\x4c\x19\x24\
+\xed\xb3\x1b\x73\xb2\xb3\x65\x9b\x58\x70\x2a\xbd\x12\xd5\xe8\x7e\
+\x9c\x8e\xb2\xb4\x11\x42\x59\x56\xe1\x4b\xab\x0d\xc9\xb2\x7b\x1a\
+\xc2\x40\x95\xcf\x1f\x5f\x6c\x47\x1e\x7b\xad\x59\xb5\x15\x90\x5c\
+\xb5\x55\x5b\xb5\x4f\x02\x44\xf6\xd6\x5d\xdf\x0a\xb6\x10\x8b\xcc\
+\x57\x41\x67\x04\x4b\x03\x14\x18\x17\x30\xde\xb3\x8c\x56\x54\x00\
+\x35\xa3\x91\x65\x7d\xdd\xb6\x48\x20\xe5\x48\xc6\xa8\xde\x1a\x91\
+\xfe\x37\x02\x19\x01\xf7\x69\x30\x78\x09\xb1\x56\x9e\x4f\x6b\xc5\
+\x2c\x03\x1b\x49\x81\x33\x15\x64\x1f\x10\x9c\xc9\x16\xae\x4e\x29\
+\xd2\x86\xb8\x8f\xd1\xd8\xb0\xb6\x59\x70\x74\x14\x50\x45\x50\x6b\
+\x71\xb1\xa4\x82\x35\x0c\xc6\x49\x38\xe8\x12\xb0\x2f\x30\x61\xeb\
+\xe2\x11\xcf\xbf\x5c\xf1\x9d\xaf\x6f\xd9\xc3\xfd\x5d\x49\xf9\xa0\
+\x57\xae\x19\xaa\xfa\x02\x7b\x3b\xa9\x2c\xc7\x31\xce\x6d\xe2\xca\
+\x9b\x54\xd3\x6b\xc0\x54\x84\x6d\xe0\x98\xf1\xfa\xa1\x9d\x1d\x5f\
+\xd6\x75\x75\x1f\x18\x30\x1e\x6f\xc9\x64\x92\x94\x6b\xd7\x28\x8a\
+\xcb\x80\xa7\x69\x2e\x69\x9f\x55\x8c\xc7\xe7\x98\xcd\x9e\x20\xd6\
+\x2f\x8c\x35\x33\x6d\xe1\xac\x34\x27\x7a\x1e\x9b\xde\x86\x0d\x04\
+\x8b\xf0\x2e\xe0\xb1\xf6\xaa\x82\xc3\x27\xb4\x0f\xb6\x19\x0e\x0b\
+\x66\x33\x47\x8c\x84\x1e\xe1\x39\xc6\xb9\xca\x5a\x5f\xc6\x34\xbb\
+\x36\xc7\xd5\x29\x6d\x56\x80\x12\x6b\x1b\x3d\x76\xfa\x39\x2e\x0a\
+\xaa\x26\x92\x94\x43\x6b\x8d\xc5\xe2\x6b\x49\xb9\x57\x15\x66\x9f\
+\x00\xee\x84\x53\x80\x5a\x20\xe6\x44\x5e\xd1\x6b\x5d\x27\x46\x05\
+\xee\xd3\x3a\x25\x66\x76\x09\xf8\x29\xba\x7b\xfe\x0b\x05\x7c\xed\
+\xb4\x61\xec\x00\xb3\x15\x30\x07\xb9\x61\x61\x16\x0c\x8d\xc7\x2a\
+\x60\xed\x1c\xde\xfb\xa5\x65\x2f\x96\xb5\xbb\x0a\xf4\xc7\xc0\x25\
+\x1f\xa9\xc7\xbf\xa6\x91\xf8\xaa\x81\x2a\x45\xe5\x7d\x8c\x04\xa6\
+\xf3\xdd\x02\x8e\xc0\x97\x9c\xec\x8f\x38\x39\x19\x01\x03\xcd\x95\
+\x4d\xb5\x24\xcf\xf5\xce\xb5\xd0\xd2\x1a\x4d\xfb\xde\x26\x9d\x62\
+\xb0\xe6\x23\x0b\xda\x8f\x5b\xa4\xb2\x31\x5d\x9b\x5a\xec\x7b\x82\
+\x9c\x00\x43\x15\xc2\xe8\x1b\xa6\xc2\x31\x5d\x74\x35\x3a\x7b\xa2\
+\xb7\xe8\xfd\x1a\x6c\x31\xf2\xdb\x34\x92\x01\xcd\x89\x9e\xd7\xaa\
+\x7d\x84\xed\x33\x42\x6b\xed\x9e\x5f\xa7\x22\x2e\x0e\xe3\x7c\x2f\
+\x97\x70\x41\x63\x14\xd7\x01\xcc\xb8\x99\xe8\x38\x74\x0f\x23\xeb\
+\xfc\x93\x6b\x22\xef\x7f\x1b\x59\xc0\x4f\x8f\xdc\x60\xf1\x4d\x99\
+\x53\xe2\x8e\xa9\x04\xa1\xbf\x59\x0b\x48\x0d\x51\x19\x1d\x17\x15\
+\xc0\xb5\x1f\xf5\xab\xbe\xa3\xd9\x82\x32\x86\xa3\xcd\x10\x5c\x02\
+\xf7\x89\xa9\x7b\x0a\xae\x5f\x72\x4f\x1b\x79\xbf\x98\xde\x42\x5b\
+\x26\x65\x05\x28\x57\x40\x72\xd5\x56\x6d\xd5\x3e\x3d\x20\xb2\x05\
+\x7d\xbe\x32\x50\x9a\x8a\x00\x94\x06\x6a\x68\x74\xb2\x8e\x8c\xd2\
+\x54\x63\x2e\x9f\xc8\x87\x0a\x18\xf6\xe2\xaa\x4d\xa6\x27\xde\x03\
+\x14\x1b\x6a\x54\x26\x45\xc9\x19\x34\xb4\x11\xc9\x58\xee\x2b\x01\
+\x95\x14\x51\x5c\x07\x2e\x5b\xec\xa6\xd6\x7d\x24\x63\xd6\xda\xde\
+\x79\x08\x68\xf1\x76\x70\xa5\x75\x31\xbc\x77\x01\xd8\x96\x16\x98\
+\x7a\xd8\xdc\x74\x94\x76\x40\xed\xad\x02\xcd\x98\x4f\xb3\x71\xb1\
+\xd1\xc5\xf4\x49\x40\xb0\xf6\x80\xcb\x37\x1f\x32\x39\x1e\xb2\xb7\
+\x73\xc9\x62\xf7\x04\x39\xa2\x1c\xae\xb1\x7d\xa1\xe6\xde\xed\x4d\
+\x42\xb8\x06\x58\xd6\x36\x2c\xcf\xbc\xb0\x2f\xaf\x7e\xfb\x22\xd2\
+\x1c\x00\x37\x19\xad\x05\xce\x5f\x9d\x30\x7b\x73\x80\xc8\x79\xa0\
+\x66\x63\xeb\x18\xef\x67\x1c\xee\xcf\x14\x88\x6c\x72\xe9\xda\x94\
+\xbb\x77\x2a\xaa\xe9\x7b\xd6\xf2\xb4\x0c\x46\x05\xeb\xdb\x85\xec\
+\xdc\xd5\x9a\x8c\xbc\xcd\xfa\xe6\x43\x8e\x0f\x45\x23\x57\x53\xc6\
+\xeb\xef\x81\x19\xd9\xe3\x83\x20\xb0\x8f\xb5\xb0\x7d\x61\x8f\x7b\
+\x77\xae\xeb\x35\x3d\xa4\x1c\x5e\xe3\xea\xf5\x63\x99\x9d\x9c\xb0\
+\x73\xbf\x44\xe4\x5d\xed\xbc\x44\x4f\x3c\x00\xa6\x4a\x7f\xed\xd1\
+\x95\x9b\xe6\xcc\x85\xda\x28\x80\xda\x88\xb8\x67\x03\x38\x0a\x4b\
+\x80\xa4\x23\x0a\xd4\xec\x2a\xf0\x9a\x58\xec\x44\xb0\x85\x1e\xce\
+\x00\x03\xce\x33\x6a\x33\x55\xbb\xf1\x64\xe3\x5a\xf4\xb5\xc1\xe2\
+\xe1\x2f\x1b\xcd\xba\x2c\x01\x7b\x20\x1b\x05\x1c\x95\x67\x18\x15\
+\x85\x9e\x4b\xf9\x08\x13\x65\xa2\x17\x33\x78\x1f\x8f\x53\x43\xcc\
+\x6d\x74\x68\xd9\x95\xa2\x57\xa0\x3b\x5d\x93\x5d\x07\x79\x4a\x41\
+\xe0\x9b\xec\x1f\x08\xff\xea\x2b\xcf\xe0\x7d\x49\xd3\x34\x19\x88\
+\x2c\xd4\xb6\x2a\x0b\x7d\x22\x9a\x86\x1b\xc4\xe8\xf3\x96\x3e\x0f\
+\x05\xe0\x0b\x35\xb0\x63\x90\x98\x6d\xbd\x27\x46\xcf\xc3\xc4\xcd\
+\x62\x3f\x2b\xdd\xac\x27\x70\x51\x14\xd0\x34\x04\xa5\xc8\x26\xe1\
+\x9e\x90\x7b\x96\x00\x83\x6e\xc8\xe9\xf5\x25\xd3\xbd\x76\xa7\xf6\
+\x7e\xf3\xd9\x33\xf8\x56\xd1\xc8\x8f\xa0\x39\x8c\x0d\xca\x66\x49\
+\xe3\x31\x2d\x15\xa7\x52\x42\xfd\x82\xd0\x4e\x37\x66\xfd\xc7\x52\
+\x83\x30\xe5\x45\x6a\x95\x8d\x94\xff\x97\x1f\x3f\x53\x31\xcd\x68\
+\xba\x3e\x2e\x96\x2e\x22\xe3\x5e\xfe\xa3\x73\xfd\x4b\x59\x00\xcb\
+\x73\xaf\xd2\x7b\x8b\xd5\x3b\x5c\xff\x79\x3e\x1b\xdc\xf5\xb5\x5d\
+\xe7\x58\xb9\x7e\xf1\x23\x33\xcf\xd8\x3d\x9b\xa8\xfb\xd1\x03\x40\
+\x8d\xde\xae\xda\x0a\x48\xae\xda\xaa\xad\xda\x27\x01\x20\x81\xa5\
+\x20\x32\x84\x90\x04\x09\xec\x92\x14\xb1\x7c\xf1\xad\x35\xf7\x2e\
+\x19\xdf\xd7\x89\x39\x55\xb1\x14\x48\x72\x31\xda\x60\xba\x45\xd3\
+\x19\xf0\x7b\x44\x5a\x68\x05\x60\x2d\xdb\x5a\x5f\xd1\x51\xaa\xc6\
+\x87\x15\x43\x97\x5f\x71\x3d\x3b\x6e\x2d\xb1\xb8\x7d\x37\x45\x99\
+\x58\x16\x43\x62\xf4\xa6\xb0\x96\x4d\x49\xe7\xe8\x49\xf9\x29\xa5\
+\x9e\xd7\x7b\x08\x35\xce\x99\xa8\xf8\x6a\x8d\x02\xc5\x87\x88\x1c\
+\x2b\x5d\x34\x2d\x7c\x42\x54\xbd\x3c\x06\x2a\x8c\x11\x95\xb4\x3d\
+\x89\x65\x1e\xec\x10\x04\x9c\xf3\x18\x73\x4c\x08\x51\x11\xd6\xda\
+\x40\x31\x08\x80\x58\xcb\x48\x84\x2d\xbc\x18\x86\x65\xa5\xd6\xfc\
+\xdb\xc4\xda\x8f\x9e\x5a\x1a\x0b\x13\x49\x51\x37\x57\x1c\x6b\x91\
+\x91\xad\x10\xd8\xc2\x38\x61\xb8\x36\xa5\x2b\xc9\x20\x8c\xd7\xa6\
+\x1c\x1f\x6e\xa8\x4a\xeb\x1e\x18\x4f\x90\x5a\x22\x48\x8b\x37\xac\
+\x28\xbc\xd2\x24\x8d\x85\x35\x59\x1f\xd7\x7c\xfe\xe7\x8f\xf0\xfe\
+\xfb\xfc\xab\xff\x7b\xc8\xd1\xd1\x3b\xf4\xdc\xd6\x85\x81\x26\xc1\
+\x0d\x53\xb0\x98\xfc\x5a\x00\x4d\xc1\x1c\x7e\xc7\x50\xb0\x46\xc3\
+\x26\xc0\x90\x23\x66\xb0\x0c\x48\x3e\xa5\xa0\xe6\x9f\x97\x25\x2f\
+\xd5\x35\x1b\x82\x0c\xe9\xc4\x58\xa2\x58\xd2\x6e\x06\x4e\xd6\xd7\
+\x0d\xc7\xc7\xc3\x0c\xf8\x0d\x16\xc7\xe2\xfd\xf4\xf7\x00\x70\x1c\
+\x1d\x95\x73\xce\x8d\x65\x6b\x5a\x79\x89\x4b\xc3\x07\x3c\x00\x08\
+\x97\xc0\x3c\x98\x7b\x04\xbc\x67\x4a\x51\x5c\xa2\x69\xee\x7c\xa0\
+\x75\xd3\x51\xe0\x17\x40\xa4\x3e\x27\xb2\xae\x80\xf3\x5d\x60\x82\
+\x34\xaf\x73\x7c\x98\x68\xc9\x57\x89\x91\x5a\x74\x2c\x6d\x22\xf2\
+\xb9\x26\x52\x9e\x8f\xe8\x44\xa5\x4a\xed\xcf\x3d\x60\xbb\xe9\x3f\
+\x9f\x07\x3a\x6e\xb3\xdb\xd8\xe4\x9f\xa7\xfc\xd9\x75\x8b\x7d\x20\
+\x88\x89\x20\x12\x93\x81\xfa\xf4\x4c\x0f\x14\xb8\xd6\x05\x85\x69\
+\x9a\x26\xdd\xd3\x07\xba\x0f\xda\x68\x45\x27\xf3\x9f\xc4\x91\xc2\
+\xc2\xfd\x6a\x38\x4f\xa4\xbd\xda\xd5\x2c\xfc\xd1\xb4\xcf\x4c\x34\
+\xd2\xf7\x0a\x5c\x7d\xb0\x5d\x2c\x28\x85\x3a\xeb\x00\x9c\x6f\xd9\
+\xe5\x0a\x06\x59\x26\x65\xb3\x00\xd2\x96\x9e\xa6\xef\x40\xd5\xf2\
+\x70\x9c\x99\x3f\xa1\xde\xb7\xfd\x12\x38\xec\x17\xba\xe2\x11\xaf\
+\x4e\x53\xac\xfd\x54\x66\x59\x7e\x64\x80\x5e\x1e\x8f\x84\xbb\x6a\
+\x2b\x20\xb9\x6a\xab\xb6\x6a\x1f\x16\x44\x3e\x86\x3a\xac\x01\x8c\
+\x8a\xea\xd0\x05\x70\xea\x9c\x16\x78\xa8\xc5\x8e\x2f\xe8\x4f\x20\
+\x52\xe2\xb6\x1d\x54\x1e\x09\x18\x09\xad\x17\x74\xb8\x66\x71\x34\
+\x04\xbb\x13\xeb\x38\xc6\xfd\x68\x3d\xaf\x19\x6b\x6b\x25\xeb\x5b\
+\x76\x6e\xd5\x1e\x5b\xcb\x9a\x08\x6f\xab\xd1\x5c\x92\xd4\x2a\x9d\
+\x0b\xd0\x40\x70\x46\xe2\x5c\x75\x09\x38\x12\xe1\x24\x71\x6d\xb0\
+\x62\xb0\x2e\x95\x06\x79\x8f\x18\xed\xd9\xc6\x7b\x83\x84\x8e\xef\
+\x23\x12\x0b\xcb\x0b\x43\x02\xf7\xdb\xda\x97\x70\x1c\x53\x3f\x24\
+\x2e\xc2\xa5\x05\x6b\x37\x45\x64\x0d\xe4\x04\xec\x4e\x04\xca\x12\
+\x88\x51\xa2\x4d\x84\xa9\x26\x97\x6c\x46\x21\x15\x1b\x70\x36\x07\
+\x56\x5b\x7a\x75\x3b\x58\x8c\xc4\xbe\xab\x5b\xe3\xda\x30\xc6\x52\
+\x07\x69\x45\x55\x4c\x06\x1a\x52\xbe\xe9\x44\x6b\x16\xd6\x51\xa4\
+\xa5\x8d\x10\x8d\x80\x9d\x68\x79\x08\xc0\x55\x81\x23\x82\x8d\xa0\
+\xb9\x69\xe6\x65\xd7\x7b\xc8\xb0\x59\xc0\x89\x73\x5b\x34\x4b\x0c\
+\x80\x86\x27\xca\x92\xdd\xba\x8e\x32\xb8\x39\x20\xcb\x00\xc9\x4d\
+\xe0\xcf\x80\x57\xea\x9a\x5f\x21\x46\x4a\x87\x73\x86\x44\x12\x6a\
+\x31\x23\x30\x1c\x1f\x33\x85\xa1\x12\xd2\x96\x01\xc9\xbc\x95\x7a\
+\x9c\x92\x7e\xb4\xb1\xbd\xc6\x4d\xe0\x30\x7e\x56\x3c\xe0\x41\xbb\
+\xcd\x83\x53\xec\x41\x17\x9a\x2d\x9f\x94\x55\xdf\x5f\x73\xca\xb5\
+\x5b\x66\x44\x06\x1d\x83\xef\x01\xd7\x2d\xdc\x14\xa8\x0b\x78\x23\
+\xc0\x05\x1f\x23\xe0\x23\xa2\x2a\xea\x18\x91\x34\xde\xf3\x7d\x09\
+\xff\x7f\x7b\x77\xf3\x63\x47\x96\xe6\x75\xfc\x1b\x27\xee\xbd\x99\
+\xe9\x97\xb4\x5d\x7e\x29\xd7\x4b\xbf\x54\x97\x34\xdd\x62\x58\xa0\
+\x19\x16\xec\x58\x22\xd6\xd3\x48\x48\x2c\x06\x24\xfe\x02\x16\xb0\
+\x9b\x56\xcd\x6a\x46\x48\x48\xec\xd8\xcc\x6a\x40\x83\x80\x11\x42\
+\x42\x48\x83\x06\x34\x62\xd4\x23\x1a\x04\xf4\x74\x37\x43\x75\x4f\
+\xd7\x4b\x57\xb9\xab\x5c\x7e\xcd\xb4\x9d\x99\xf7\x25\xce\x09\x16\
+\xe7\x9c\x7b\x23\xd3\x69\x3b\xd3\x76\x55\x39\x5d\xdf\x8f\xe4\x4a\
+\x97\xf3\xbe\x65\xdc\xc8\x1b\xf1\x8b\xe7\x9c\xf3\xe4\x8b\x06\x37\
+\xca\x7e\xd4\x94\xca\xe7\x61\x3d\x57\x0f\xce\x6d\x5c\x2f\x17\x25\
+\x1e\x90\x57\x24\x7e\xc0\xc3\x27\xe7\xeb\xc0\x1b\xac\x2a\xd6\xb4\
+\x40\x57\x43\x66\x8e\xa7\xd7\x58\xf6\x1e\x7d\xa8\xea\x53\xde\xab\
+\x51\x3f\xd8\x61\x36\xca\x67\xc4\xfa\xe0\x67\x90\x8e\xe5\x39\x57\
+\x9c\x72\xbf\xe0\x96\xba\x90\x15\x6d\xfd\x3d\x28\x55\xc1\x65\xc8\
+\x2c\xc3\x34\x69\x97\x85\xc3\xe5\xaf\x7a\x1b\x6b\x74\x7b\x44\xe3\
+\xc9\x17\xa9\x1f\xe5\x8b\xe9\x39\x5e\x04\xf1\x63\xc5\x20\x29\xe9\
+\x45\x08\x91\xf5\xc3\x3d\xac\xea\x91\x8b\x83\x1f\xfa\x35\x9c\x7d\
+\x9d\x5c\x16\xba\x5d\x4e\x6e\x09\xf9\x84\x78\xba\x0c\x12\xf5\x20\
+\x3a\x59\x2f\xfd\x25\x53\x38\xf0\x3c\x93\x96\x76\x11\xbb\x3e\x30\
+\x6a\xfb\xe5\xa0\xba\x7c\xbf\x9d\x94\xc2\xc7\x90\xee\x94\x7f\xdd\
+\x58\x7e\xe7\xd4\xf9\xd1\xe0\x23\xaa\xae\x48\x7a\x0d\xb8\x48\xa8\
+\x4d\xde\x81\xb4\x9c\x07\x96\x96\x61\xad\x0f\x0d\x69\x54\xe7\x88\
+\x34\x10\xde\x20\xf7\xb7\xdc\xa1\xa1\x27\xa6\xda\xdc\xfd\xeb\x29\
+\xcf\x43\xdc\x83\x70\x9f\xd4\xd4\xc7\xba\x4b\x9d\x43\x16\x09\xa4\
+\xba\x88\x49\x88\x84\xe5\x5c\xc2\x19\xb0\x9d\xab\x6e\xcb\x03\xdc\
+\x69\x60\x4a\x08\xb3\xb2\x16\x42\xcb\xaa\x6f\xdf\x05\x62\x1f\x48\
+\xcc\x48\xdc\x64\x35\x3c\xb1\xfe\xdc\x9b\x40\x28\xab\x7b\x46\x72\
+\xc3\xfa\x51\x22\x41\x4c\xa1\xac\x16\x7b\x9f\xe5\xb0\xdf\x30\x82\
+\x7e\x06\xfd\x81\x2e\x1c\x87\x2c\x5e\x53\xb7\x64\xc7\xb2\x8e\xd5\
+\xd5\x7f\x2c\x09\x72\x50\x8c\xec\x47\xd0\x74\x79\x98\xe3\x75\xe0\
+\xcd\xc5\x82\xbf\x0e\xdc\x19\x31\xba\xd5\x95\xb1\x8f\x23\x46\x74\
+\x79\x98\xe4\x25\xf2\xfe\xf0\x09\x2d\xbf\x46\xe4\xda\x08\xee\x26\
+\xc2\xa5\x65\xd1\x3a\xb7\x38\x99\xc0\xda\x06\xcc\x96\x7d\x3e\x26\
+\xb0\x3e\xcf\x6b\xe6\x4f\xc8\xf3\x6e\x1b\xa6\xd3\x7e\x9d\xf5\x66\
+\x3a\xe8\x06\x42\x9e\x5b\xd8\x8e\xd7\x98\xcc\x66\x87\x57\x24\xef\
+\x2f\x1f\x92\x11\x4f\x1e\xb2\xda\xc7\xc8\x69\x9e\x36\x48\xe6\xd7\
+\xbc\xff\x04\x69\x34\x6a\xe8\xba\x86\x10\x7a\x52\xa2\x5c\x20\x99\
+\x0e\xf2\x79\x6d\xa9\x52\x3a\x5b\xf2\x71\x09\x91\x75\xc8\xe9\x21\
+\x17\x00\x98\x00\xeb\x07\x2a\x92\xa7\x59\xcd\x45\xbd\x5e\x42\x66\
+\x5f\x9e\x7f\x5a\x02\xe8\x2e\xab\x56\x33\xcd\xf0\x60\xdf\xad\xda\
+\xfa\x6c\x95\xef\x6f\x96\x62\x50\xde\x17\xbb\x03\xc3\xf3\x1e\x6f\
+\x03\xda\x57\xcb\x85\x80\xda\x2a\xe4\x1e\x5f\xa1\xf9\x4c\x0e\x6b\
+\x7d\xee\x31\xe1\x99\xf6\x9d\xb2\x98\xcd\xfe\xde\x85\x2d\x0d\x91\
+\x7e\x30\x74\xb4\x0c\x4f\x6d\x9b\xb8\xaa\x40\xf6\xd0\xe6\x39\x83\
+\xb1\x86\xca\xe1\xf0\xd1\xd8\x53\x56\x94\x6d\x0f\x54\x2c\x1f\x97\
+\x25\x9f\x3a\x67\xbe\x3c\x01\xd5\xb9\x8d\x06\x49\x49\x2f\x59\x88\
+\x84\xb6\x0d\xc4\xf0\xd0\xd0\xd6\x11\x84\x41\xe5\x63\xaf\x9c\x6c\
+\x7e\x54\x4e\x12\x21\x5f\x31\x2e\xf1\x23\x34\xcb\xc6\x1b\xf9\x08\
+\xde\x40\xdb\x41\xac\xc3\x19\xcf\x90\x87\xb9\x5d\x8c\x6d\xed\x23\
+\xd5\x1c\x3c\x41\x8d\x21\xa4\xd1\x60\x01\x82\x11\xb5\x35\xc3\xfa\
+\xb8\x39\xfc\x3c\x63\xb0\x12\x5d\x84\x52\x91\x6c\xca\x49\xf9\xd9\
+\xe5\xe1\x37\x84\x3c\xbc\xb5\x8f\x23\x48\x7b\xe5\xc4\xfd\xec\xea\
+\x99\x13\xe4\xe1\xa4\xf7\xc9\xed\x3f\xea\xb3\xd4\x86\xea\x67\xe8\
+\xa9\xd5\xc0\x07\x39\xc4\xa6\xb3\xab\xc7\x66\x51\x16\xc5\x39\x93\
+\x17\x41\x09\x0d\x79\x21\x93\x6d\x12\xa7\xcb\x4b\x8d\x65\x3b\x9e\
+\x05\x5a\x02\x0d\x7d\xdf\x95\xed\x92\x87\x0e\x36\x4d\xbb\x0c\xc2\
+\xb5\x35\x4a\x08\x97\x48\x69\x9c\x48\x1f\x12\xe9\x69\x88\x29\xaf\
+\x88\xdb\x27\xc2\x24\x37\xe9\xe0\x16\xf4\x7f\x16\x08\xbb\x69\x31\
+\x1d\xf1\xc1\xcf\xce\xd3\x75\x91\x94\x36\x80\x2d\x46\x44\xf2\xbc\
+\xb8\x05\x5d\xd7\x2f\xdf\xd7\xae\xb6\xc8\xc8\x91\xa2\xbc\x99\xfd\
+\x30\xac\xe4\x6c\xd9\x41\xae\x2c\x6e\x03\xaf\x04\xb8\xda\xd1\xbd\
+\x06\x3c\x68\xf3\x85\x85\x79\x59\x7c\xe1\xd5\x09\xfc\xf7\x39\x5c\
+\x26\xf2\x0a\xf0\x41\x07\x63\xf2\x0a\x7d\xa7\x81\x7b\x29\xa4\x86\
+\xc4\x04\x66\x6b\x4c\x26\xb5\xf5\x0c\xf3\x65\x2b\x92\x12\x24\xa7\
+\x39\x3c\x4e\x73\xad\xb2\x61\x36\x08\x54\x81\x76\x36\xe3\x28\x95\
+\xcb\x27\xdd\x86\x12\x7c\x4f\x03\x1b\x4c\x80\xf9\x2a\x38\x4d\x26\
+\xab\x13\x9f\x39\x13\x98\xcf\x0f\xee\xb3\xed\x32\xe0\x0f\x4f\x92\
+\xca\x64\xd3\x90\x98\x24\xf8\x46\x4a\xbc\x02\x5c\x2f\x73\xaa\x56\
+\xfd\x39\x03\x37\x49\x65\xf8\xf3\xf2\xfe\x39\x44\x0e\x5a\xa1\xb4\
+\xe4\x21\xdf\x67\x06\xb7\x6b\x4a\x58\x9c\x95\xa0\x98\xc8\x8b\xfd\
+\xe4\xd7\xb1\x9a\xdb\x18\xca\x85\x89\x73\xac\x7a\xa7\x0e\x8b\xcd\
+\x79\x86\x71\xe0\x6c\x1e\x72\xde\xde\x83\x78\xbb\xdc\xfe\x95\xb2\
+\xed\x1e\x94\xc7\x18\xb1\x9a\x67\x1b\x59\xad\x7b\x72\x0a\xba\x6f\
+\xe6\x87\x8d\x91\xd5\xca\xae\xbf\x00\x7e\x0e\xfb\xaf\x02\xe8\xe9\
+\x7c\x85\x16\xd9\x79\x7e\x61\x74\xdf\x6a\x9f\x6d\x88\xf1\xe1\x0b\
+\x6b\x75\x08\x6c\xdc\x37\x31\x31\xb7\x17\x79\xa8\x73\xc7\xea\xef\
+\xcd\x21\x03\x4b\x0f\x29\xd8\x3f\xe2\xb2\xde\x71\x1d\x35\xa9\x1a\
+\x24\x65\x90\xd4\xa3\x94\x03\x48\xff\x79\x34\xb1\xd7\x57\x38\x44\
+\xe6\x23\x69\x53\x16\x23\x80\x31\x0d\x8c\x61\xb1\xe8\x0f\x0c\x9f\
+\x5b\x90\xab\x0b\xfd\x21\x07\x86\x29\x2d\x1b\x0f\x2d\xb9\x91\x0f\
+\x78\xeb\xe4\x79\x60\xa3\x12\xd4\x6e\x13\x99\xd1\xb2\x4e\x68\xe3\
+\xfe\x3c\x4b\x17\x23\xa1\xdc\xf3\x3c\xf0\x1a\x81\x8f\x69\xda\x30\
+\x68\xeb\x50\x9d\x01\xde\x20\x84\x33\x84\xd5\xd9\x40\xb9\x5d\x6d\
+\x7b\xf0\x49\x08\xe4\x85\x4b\xd3\x22\x0f\xbb\x6d\xdb\x8e\x94\xee\
+\xb2\x6f\x91\x90\xbe\xa1\x09\x89\x1c\x88\x58\x86\xe2\xb6\x4d\x04\
+\x4e\x93\x78\x8b\x3c\x9a\xe9\x4e\x59\x3d\x2e\x95\xfe\x8d\xe7\x4b\
+\x6b\x0f\x58\xb5\xe0\x28\xc3\x28\x9b\x9e\xc0\x59\x12\x67\x20\xcd\
+\x09\xec\x10\xfb\xda\x5c\x7e\x4c\x08\xb3\xbc\x84\x51\x73\xaa\xdc\
+\x7f\x87\x94\x12\x29\xae\x95\x6d\xbd\x0d\xdc\x63\x91\x36\x4a\x00\
+\x18\x01\x33\xd2\xe2\xf5\x9c\x2d\xb9\x9f\x12\x1d\x81\x0b\xdc\xbd\
+\xb5\x49\x4a\xb3\x96\xf6\x66\x24\x2e\xd8\xdd\xbd\xc0\x4f\xff\x7c\
+\x93\xd5\xf0\xcf\x09\x1d\xe5\x04\xbf\xab\x3d\x2b\x37\xca\x7b\xb9\
+\x97\x33\x5c\x1e\xda\xd8\xe7\xcb\xeb\x11\x58\xa3\x25\x95\xbf\xe7\
+\xa6\xf6\x6d\x5b\x6a\xba\xcd\x76\xea\xba\xdb\xb4\x9c\x87\xf6\x6a\
+\x8c\xf1\x5b\xd0\x75\x21\x10\x49\x6c\xcd\x73\x8b\x90\xbf\xc9\xfe\
+\xe5\x97\xee\x40\xb8\x08\xe9\x33\x12\xd0\xb6\x13\x62\x5c\x63\x3e\
+\x2f\xfb\xdd\xb8\xa1\x5f\x4c\xe8\x06\xaf\x79\x95\x1b\x1b\x66\xfb\
+\xba\x48\x4c\xca\x6a\xc0\x8f\x0c\x89\x6b\x6b\x34\x25\x68\x1e\xa5\
+\x22\xd9\x95\xed\x71\x66\x3c\x1f\x77\x79\x67\x5f\xf4\x30\x6e\xfa\
+\x7e\xc1\x62\x51\xf7\xbd\xfe\x60\x75\xae\x01\x26\x29\xaf\x44\x7c\
+\xf8\x89\x2c\xe9\x15\x72\x15\xff\x3a\x83\x0e\x73\x2b\xa1\x2b\xd7\
+\x44\xce\x93\x2b\xa2\xcb\x16\x24\xb1\x8d\x94\x05\x47\x2e\xe4\x0b\
+\x1c\x5c\x67\x58\x35\xcd\x61\x31\x96\xa0\x36\xce\x07\xf1\x51\x53\
+\x2a\xc3\x94\xdf\x81\x37\xd9\xdf\xd6\x64\xf5\x33\xe4\x20\xba\x57\
+\x4e\xb8\xf3\xdc\x60\xe2\x46\xd9\x47\x17\xac\x56\x81\xad\xf3\x20\
+\x67\x83\xbf\x27\xa0\x89\x91\x31\xb9\xea\x49\xd9\xce\x73\xf2\x7c\
+\xd0\x1f\xe5\x8b\x1b\x9f\x6f\xef\xbe\x17\x89\xd5\xc8\x17\x3a\xbc\
+\x34\xc7\x49\x5f\xed\x63\xe6\x45\x7e\xe9\xe2\x89\x7f\x2f\x64\x90\
+\x94\xf4\x22\x7b\x8a\x8b\x0d\xc3\xa1\x3f\xb5\x30\x79\x70\x58\x5d\
+\x5d\xd6\x7f\x18\x17\x03\x79\xbc\x66\x8a\xb1\xe9\x49\x4d\xbf\xef\
+\xbb\xb9\x85\x40\xed\x63\x77\xad\x9c\x98\x7e\x2d\x4f\xc5\x8c\x1b\
+\x65\xce\xe5\xe0\xe6\xc4\x72\xe2\x7b\xae\x1c\x2e\x17\x24\xee\xe5\
+\x90\x3b\xea\x0f\x3c\xef\xe9\x1c\xb0\xd2\x14\xda\x9e\x26\x84\xc1\
+\xe3\xcd\xca\x49\xf7\x34\xa5\xd2\x82\xa1\x56\xf7\xd2\x72\x7e\xe3\
+\x38\xd4\x3a\x64\x04\xfa\x7e\x94\x5f\x1b\xb9\x6a\xd8\x02\x61\x92\
+\x80\x51\x59\xb5\x75\x87\x48\x4f\x08\x94\x93\xf9\x73\xac\x1a\xde\
+\x97\xe7\x0c\x73\x48\x6b\xcb\x10\x9d\xc3\xe0\xa9\x1c\xd6\x42\x60\
+\x3c\xde\x06\x7e\x40\x20\x41\x3a\x4d\xea\xc7\xb4\xcd\x0f\x81\xfb\
+\x84\xb0\x49\x5c\x4c\x78\x70\xef\x14\xf0\xa7\xc0\x3d\x52\xba\xc8\
+\xbd\xdb\x57\x03\xe9\x4e\x59\xdd\xb3\x63\x6f\xef\x3c\x70\x2f\xe5\
+\xf9\xa9\x1d\x29\x4d\x98\x4e\x1b\x60\x1e\x57\x33\x7a\xb6\xca\xeb\
+\xdb\x2b\x21\xe2\xd4\xe0\x7d\x1e\x97\xf7\x72\xa7\x7c\xad\xc1\x1b\
+\x60\x1e\x63\x59\xc8\x26\x84\x51\x19\xf2\x4b\xb9\x4d\x20\xc6\x8e\
+\x5c\xa5\xba\xd3\xb6\xdc\x8d\x91\x9b\x10\xff\x5f\x79\xfc\x37\x52\
+\xe2\x1b\x65\x9b\x7e\x93\xba\x9a\x6f\x0d\xd6\x2d\xdb\x44\xbe\x06\
+\xed\xd5\x7c\xd9\x3e\x4e\xca\x76\x2c\xfb\xdc\xa2\x06\x91\x5a\x91\
+\x1c\x9c\x2e\xcd\xcb\x35\x8e\xbc\x9a\xf0\x02\xc6\x21\xd0\xa6\x34\
+\xbc\xdd\x84\x61\xcb\xc2\xd9\x6c\xf9\x8f\x23\x60\x32\x81\x66\xf9\
+\xdd\x49\xfe\xcf\x84\x39\xf3\xf9\x84\x5c\x4c\xad\xe1\x7a\x91\x5f\
+\xc9\xb8\xbc\xa6\x7d\x45\xfa\x45\xdd\x86\x6b\xc0\x85\xb6\xe5\x42\
+\x8c\xe1\x34\xa4\x31\xb9\x1f\xca\x36\xf0\x00\x46\x09\xba\xda\x76\
+\x65\x4e\x9d\xab\xcb\x21\xc5\x84\x94\xd6\x81\xb7\x38\xac\x61\x7a\
+\x1e\x63\x5a\x5b\xd9\x5c\x2b\x77\x3f\x2c\xb4\x86\xb2\x4f\x6f\x2d\
+\x2b\x8d\x39\x24\xd6\xd6\x1e\x3b\xe5\xf7\x25\x96\xb0\x19\x3a\xba\
+\x96\xae\x3b\x4b\x1e\xea\x97\x88\xed\xa8\xfc\x3a\x94\xf6\x2e\x8c\
+\x06\x5f\xe7\xd4\x91\x01\xab\xe7\xab\x23\x0d\xea\x7d\x2e\x95\xc0\
+\xfc\x03\xf2\xb0\xf3\x47\x4e\x60\x7a\xfb\xed\xb7\xf9\xe1\xbf\xfb\
+\x57\xff\xda\x4f\xea\xa3\xb3\x1a\xf9\xec\x01\xa6\xcd\xf1\x30\x0f\
+\x49\x6d\x63\xee\x14\xb2\xfc\x85\x6c\x6b\x7d\xb1\x2f\x17\x48\x56\
+\xed\x2d\x96\x9f\x81\xb9\x4a\xf9\xe8\xe9\x91\x8f\x8b\x9f\x47\x2c\
+\x23\x3e\x8f\x6a\xe3\xcb\x32\x0c\xd6\x25\xba\x0c\x92\x7a\xfe\xac\
+\x4a\xea\x73\x08\x91\xf9\xe4\xb8\xf6\x8c\x5c\xac\x92\x64\xfd\x28\
+\xcf\x55\x0e\x22\x74\xf3\x72\x72\xb9\x57\x4e\x22\x47\x40\x8c\x6d\
+\x9b\x38\x7b\xb6\xa5\x1d\x7c\x84\xe4\x0a\x5f\x1b\xe0\x6e\xca\x27\
+\x96\x75\x7e\xd6\x22\x97\x52\x26\xcd\x81\x57\xd0\x43\xdb\x93\x9b\
+\xa1\x7f\x4a\xae\x7e\xbe\x0a\x2c\x68\xdb\xc0\x68\xdf\xba\x0b\x89\
+\x5c\x05\xb9\x46\xe2\xe2\xb2\x8d\xc8\xfe\x60\xfc\xf5\xf2\x18\xfb\
+\xd7\x84\xe9\xc3\x08\xe2\x29\xe0\x4e\xaa\x3f\x68\xbb\xef\x71\x77\
+\x49\x69\x9a\x33\x59\xe8\x73\x68\x4b\x75\xe1\x87\xda\xd2\xf9\xc1\
+\x32\x54\x87\xda\xbd\xb0\xf9\x65\x19\x05\x7a\x93\xa6\x59\xb0\xb7\
+\xb7\x49\xd3\xbc\x5b\x1e\xf7\x2c\x3b\xf7\xbf\x59\x46\xf2\xbe\x47\
+\x62\x14\xe0\x42\xba\x79\xe3\x12\xf3\xd9\x1d\x60\x8f\x94\x16\xcc\
+\xe7\xeb\xcc\xe7\x9f\x95\xed\x3b\x03\xb6\x88\xf1\xfd\xb4\xaf\xbf\
+\x22\xf7\xd8\x37\xc5\x8d\x07\x25\x2c\xee\x96\xef\xd5\xca\xd1\xbc\
+\x3c\x4e\x8d\x45\x4d\xf9\x49\x6b\xc5\x77\x3c\x78\x9c\x1a\x8e\xea\
+\xbf\xb7\xa4\xd4\xb2\x5a\xd0\xa7\x86\x9c\xb6\x7c\x1d\xc5\xc8\x55\
+\x42\x38\x4b\xd3\x2c\x88\xf1\x0e\x79\x08\xe3\x47\x0d\xed\x6b\x10\
+\xff\x36\x84\xd7\x21\xfd\xdf\xe5\x49\x58\x5e\x18\xf7\x1e\x79\x3e\
+\x5f\xd3\xb6\x4c\x62\xc3\x3a\x1d\x8c\x46\x34\x65\x24\xe8\x70\x11\
+\x9d\x6e\xf0\xda\x4a\x8c\x5b\xee\x97\xc3\x8a\x64\x37\x08\x9b\xcd\
+\x78\x18\xf9\x56\x3f\xe3\x64\x5f\x3d\x73\x9e\xff\x33\x1f\x84\xd4\
+\xf2\xbc\xa7\x16\x75\x7f\x59\xe4\x7b\x2e\xf2\xa3\x4f\xda\x96\xb3\
+\x31\xb2\xc9\xaa\x2f\xe2\x2c\x46\xee\x41\xaa\x73\x5e\x7f\x85\xdc\
+\xea\x64\x0a\xdd\xa4\xbc\x07\xd3\x40\xf8\x34\x91\x46\xe4\x8a\xe3\
+\xfd\xf8\xf0\xea\xfd\x57\x4a\xd8\xbb\x56\xfe\xbe\xff\x5c\x2a\xcf\
+\xf1\x7a\xdc\xaa\x12\xe7\xca\x7b\x14\x80\x6d\x46\x65\xd6\x63\x5e\
+\x71\x75\x44\xae\xdc\x37\x65\x3b\x45\xe0\xb5\x8e\xee\x42\x79\x1f\
+\x17\xc0\x0e\x91\x45\x79\x51\x75\x28\xf0\x36\xb9\xaa\x78\xab\x5c\
+\x04\x5a\x1c\x72\x6a\x17\x0e\x9c\x33\xb4\x25\xb0\x76\x4f\xfa\xb0\
+\x79\xef\xbd\xf7\xf8\x8d\x7f\xf2\x5b\x2f\x65\xe5\xce\xaa\xe4\x0b\
+\xaa\x6d\x9b\xb8\xec\xa3\x1a\x57\x43\x50\x1f\x1e\xbb\xba\x5c\x17\
+\x20\x3e\x74\xb1\xf5\xa1\x3e\x17\x07\xae\xdb\xe8\x15\x0e\x00\x00\
+\x0d\x67\x49\x44\x41\x54\xfb\x3c\x87\x41\xad\xf1\x68\x3f\x0b\x31\
+\xd6\xa0\x9b\xe7\x76\xe6\x86\x8f\xab\x75\x0a\x6a\xab\x91\x18\xfb\
+\x3a\x4c\xb7\xf6\x7f\xac\x81\xb8\x5d\x26\xce\x61\x00\xae\x2d\x49\
+\xf6\x27\xd3\xd5\xd0\x92\x38\x78\x0a\x88\x71\x15\x9f\xf7\x2d\x50\
+\xb4\x0a\xb4\xcb\x79\xd9\xc7\xc8\xb7\x0d\xbb\xbb\xe7\xf8\xd3\x3f\
+\xfa\x95\xe5\x28\x98\xed\xed\x4d\xba\x6e\xe1\x8e\x6c\x90\x94\xf4\
+\x62\x6a\xca\xa2\x1a\xcd\xbe\x4f\x82\xd2\x03\xae\x1b\xe5\x13\xd3\
+\x40\xd8\x49\x70\x29\x57\x01\x01\xca\xdc\xbf\x48\x64\xfd\xd4\x21\
+\x57\xcb\x03\x89\x65\xe5\x29\x2d\x43\x4a\xbd\xba\x3b\x09\x83\xe3\
+\x4a\x93\x97\xdc\x09\x61\x87\x94\xd6\xc8\xf3\x06\x2f\xb4\xf0\x61\
+\x8c\xb1\x29\x1d\xc5\x86\x87\xa2\x53\xe4\x21\x78\x81\x40\x0b\x6d\
+\x47\x08\x0d\x79\xfe\xe5\x28\x40\x48\x21\x4c\x49\x65\xbe\x63\x4a\
+\x7d\x59\x3c\xa7\x06\xc1\xbc\x90\x4f\xdf\x8f\x98\x4e\x03\x81\x2d\
+\xe0\x41\x20\x84\xd4\x36\x0f\xd8\xbe\x7d\x9e\xa6\x19\xd3\x34\xef\
+\xd2\x72\xb3\x89\x74\xd0\x7f\x87\x9d\x07\x17\x49\xe9\x2f\x4a\x48\
+\x9b\xb0\x98\xad\xf1\xf1\xcf\xde\x22\xc6\x50\x16\x09\xda\x62\x3a\
+\xdd\xe4\xb3\x4f\xc7\xc4\x38\x2e\xb7\xbb\xc3\x6c\x6f\xa7\x84\x8b\
+\x1d\xa0\x4d\xb0\xc3\x74\xb7\x56\x07\x6b\x3f\xc7\x3a\x64\xf0\x02\
+\xab\x05\x8d\xee\x97\x90\xb8\x37\xf8\xd3\xb1\x9a\x17\xd7\xb3\xbf\
+\x32\xba\x8c\xcc\x8f\x7c\xaf\x8f\xbb\x6f\xec\xbf\xcf\x08\xb8\x0a\
+\xbc\x4d\x4a\x57\xcb\xfb\x74\xba\x04\xa5\xbd\x48\xbc\x0e\x7c\x0c\
+\xe9\x7a\xf9\xde\xa5\xf2\x5a\xb7\x81\x59\x20\x5c\x4e\xa4\x73\x31\
+\xb2\x55\x82\x2a\xfd\xaa\xd7\x60\xdd\x3f\x26\x3c\x7e\x49\xbe\x49\
+\x0d\x9c\x23\x46\xa9\x1b\x64\x97\x03\x67\x1a\x25\x18\x8d\x27\x87\
+\xb4\xb6\x39\xf8\x33\xc6\xe5\xfe\x9c\xff\x7f\x9d\xbe\x3d\x07\x71\
+\xb3\x04\xe7\x79\xdb\x72\x2f\x46\xde\x87\xd1\x0c\xba\xcd\xf2\x74\
+\x9f\x95\x10\x7d\xb7\x84\xba\x11\xab\xa1\xa4\xa3\x44\xba\x5d\x7e\
+\xa6\x6b\xc0\x06\x91\x73\xac\x7a\x56\x8e\xc8\x55\xdb\x45\x80\xcd\
+\x14\xc2\xe8\x60\x87\xf2\x94\x96\x27\x62\x79\xce\x62\xa0\x25\xec\
+\x8b\x6b\xf7\xc8\x95\xc0\x31\xd4\x79\xb0\xcb\x9f\xe1\x36\xab\x15\
+\x82\x17\x65\x7b\x9f\x1e\xec\x3b\xf5\x12\xca\x76\x09\x8d\x75\xa5\
+\xe3\xf9\x23\xf6\x29\x3d\xc1\x5f\xfb\xee\xdf\xfb\xbb\x86\xc9\x17\
+\xd0\x93\x7b\x29\x9e\xb8\x9f\x65\xd5\xcf\x31\x3e\xdc\x7a\x64\x38\
+\x17\x34\xee\x9b\xcb\x39\x98\xdb\x19\x0f\x49\xaf\xf1\xe1\x2e\x25\
+\x87\xcd\x05\x5d\x3e\xc5\x81\x47\x39\x74\x2e\x29\xfb\x9f\x3f\x0c\
+\xd6\x35\x38\xdc\x8c\xdb\x9f\x7d\xc0\xf7\xff\xb8\xcd\xc7\x76\x20\
+\xa5\xd3\x81\x34\x4d\x1c\x6b\xf1\x2f\x19\x24\x75\x18\xab\x92\x7a\
+\x16\x29\xc6\xe6\xd3\x8f\x3f\x5a\xfb\xe5\x2f\x3e\xdc\xb8\x7c\xf5\
+\xb5\x59\x19\xc8\x37\x82\xd1\xe4\xc0\x32\x9e\xb4\x30\x8e\xb0\x36\
+\xea\x68\xc9\xc3\xe1\xb6\x81\x73\x04\x36\x72\x8b\xbc\x14\xf2\x89\
+\x67\x1c\xb3\xb3\xb3\xc1\x9d\xcf\x56\x8b\x6a\x3c\xd8\x5a\xa3\x6d\
+\xe6\xe4\xc0\xb0\x11\xf2\xc2\x22\x4d\x4a\x6c\xe7\xf0\xd7\x6c\xb2\
+\x75\x1f\xa6\x8b\x7c\xe4\xea\xa6\x13\x88\xb7\x48\xed\xfb\x83\x83\
+\xcf\xdd\x98\x87\xf5\xbd\xc2\xd6\xdd\x0d\x46\x9f\xb4\x4c\xf7\x4e\
+\x01\xef\x02\x1f\x95\xc5\x48\xae\x93\x9a\x8e\x8f\x7f\x7e\x86\x5b\
+\x9f\xc1\xf6\xf6\x06\xf0\x69\x82\xff\x4a\x4a\x1d\x30\x21\xc6\xcb\
+\xfc\xfc\x27\x33\xa6\xd3\x4d\x9a\x74\x0b\xf8\x51\x4b\xdb\x47\xe8\
+\xb9\x7d\xf3\x4d\xfe\xcf\xf7\x2f\xb1\xb3\x03\x70\x3f\x91\x16\xd0\
+\xb6\x5c\xbf\x96\x87\x5d\xa6\x74\x0e\x58\x8b\xb0\xcb\x6c\x6f\x97\
+\xc5\xec\x17\x2d\xdc\x8f\x35\x18\xcf\x66\xf7\x98\xcd\x6e\x94\x60\
+\xda\x91\xe7\xab\x45\xba\x59\x5b\x4e\xd6\xa7\xe5\x6b\x9d\x8b\x38\
+\xac\x1a\xce\x0e\x84\xc3\x3d\x56\x2d\x1c\xe6\x3c\x5c\xdd\x79\x1e\
+\x07\xd0\xfe\x19\x6f\x1f\xc9\x8b\xa8\x7c\x44\x5e\x34\xe8\x6d\x72\
+\xf5\xf7\xd5\x12\x1a\xeb\x7c\xbe\x2d\xe0\xb3\x96\xf6\x5c\x24\x5e\
+\x25\x0f\xfd\x24\xe5\xa4\x74\xa5\x84\x97\x75\x80\x58\x4e\x2c\x42\
+\x60\x94\x60\x92\x17\xe2\x39\xfc\x54\xa3\x54\x2f\xc7\x01\xda\x34\
+\x62\x32\xe8\x75\x78\x98\x71\x80\x71\x62\xf1\xa4\x39\x92\x4d\xb9\
+\x20\x71\xa5\x3c\x6b\x5e\x41\xb7\x8f\x0f\xc8\xd5\xc2\xed\x11\xa3\
+\x79\x17\xbb\x71\xfe\xf9\xba\x86\xd5\x42\x32\x5b\xac\xda\x99\xbc\
+\x0e\xfc\x45\x09\x76\xe7\x4b\xf8\x9b\xb3\xea\xf7\x98\x2b\xc2\x6d\
+\xfb\x1a\x31\xd6\xa1\xd1\xef\x02\x6b\x09\xce\x93\x52\x5b\x86\xec\
+\x66\xab\x4b\xf8\xaf\x97\xf0\xb7\x45\x22\x1e\xb2\x65\xce\x96\x7d\
+\x69\x97\x5c\x31\xad\x55\xca\x76\xb0\x6f\xd5\x7d\x70\x54\x5e\xcb\
+\x0d\x72\xe5\xff\x76\xf9\xf7\xe4\x09\xda\x8b\xc9\x61\xad\xcf\xe9\
+\x62\x69\xbb\x2a\x97\xb5\x94\xb5\x96\x0f\x56\xcc\xda\x43\xb2\xd5\
+\xc0\xc3\x55\xb5\xc3\xeb\x6c\x8f\x7e\x98\x47\x0d\x80\xfd\x02\x87\
+\xbe\x7e\xc9\x42\x7a\x62\xe3\x8e\x0e\xf8\x11\xa9\x1b\xde\xf0\x8d\
+\x94\x2f\x4c\xfa\x19\x65\x90\x94\xf4\x65\xfb\x93\xff\xf4\x1f\x5f\
+\xff\xb3\x3f\xfe\xcf\x7f\xe5\xe2\x95\x2b\x5b\xf1\xee\x1d\xf2\x89\
+\x67\xb7\xb6\xfc\x0c\xef\x96\x07\xc1\x75\xe0\x4c\x59\xbc\xa3\x7e\
+\x80\xdf\xc8\x1f\xee\xfb\x0e\x05\x6f\xf1\xc9\xfb\xe7\xf8\xf4\x83\
+\x32\x17\x2f\x40\x1f\x47\x74\xdd\x2e\x39\x08\x1e\xbc\xcb\x1b\x4c\
+\x77\x2f\xf1\xe3\xff\x71\x26\x47\x88\x04\x31\x8e\xf2\x49\x36\xdd\
+\x72\x88\x4e\x76\x15\xb8\xc4\x87\xef\xad\xf1\xd1\x7b\x33\xba\x6e\
+\x54\x0e\xa5\x8b\x3c\xdf\x85\x29\x71\x7e\x81\x4f\xaf\x9d\x82\x74\
+\x8a\xd5\x1c\xc0\xf5\x12\xe2\x66\x2c\x16\x3d\xbf\xfc\xb0\x1e\x86\
+\xd7\x80\x3e\xe6\xf9\x60\x7b\x24\x3e\x64\xe7\x7e\x3d\x34\xe7\x57\
+\x18\x63\x4b\xae\x5a\xd6\x20\xb5\x56\x82\xc1\x0e\x29\xcd\xe2\x6a\
+\x5b\xd4\x39\x88\xd3\x72\x22\x3f\x65\x35\x2c\xb5\x86\xc2\xba\x40\
+\xc9\x62\x10\x0c\x1f\x55\x45\x3c\x49\xfa\x12\x48\x7e\x08\xfc\xa4\
+\x84\x9d\xb7\xcb\xd7\x1a\x28\x77\x23\x71\xbb\x04\xae\xda\x2f\x71\
+\x52\xc2\x4b\x20\xaf\x78\xda\xa4\x94\xfa\xf2\x75\xc4\x6a\xf8\xed\
+\x30\xfc\xd5\x45\x8a\xd6\xba\x2e\xcf\xe7\x4c\xb0\x41\xf7\xd0\xbc\
+\xc2\x8d\xf2\xa7\x56\xdb\x36\x53\x60\x44\x60\xf2\x88\x01\x97\x2d\
+\xb9\x42\x77\x21\x10\xde\x4c\x29\x6d\x95\x70\x75\x9d\xbc\xda\x6e\
+\x99\x17\x38\x5a\xeb\xe8\x2e\xb3\x7f\x25\xd2\xed\x03\xcf\x7d\xad\
+\xec\x27\x3f\x2e\x7f\x0f\xe5\xff\xcf\x96\xd7\x7e\xb9\x84\xbc\x8d\
+\x52\xa9\xde\x2a\x8f\xb1\x5b\xc2\xe6\x0e\x70\x36\x25\x5e\x03\xde\
+\xa0\x6d\x6f\x13\xe3\x29\x02\x2d\x89\x4f\xc8\x7d\x65\x42\x5a\xcd\
+\x67\x05\x08\x2d\xed\x8d\x98\x87\x6a\xe7\xf9\xbc\x81\x6f\xa4\xb4\
+\xdc\xe7\xf6\xca\xef\x4a\xad\x08\x7f\x4a\xae\x3c\x3e\x60\xd0\x37\
+\x52\xcf\x97\x55\xc9\x17\x28\x3c\xae\x7a\xf3\x0e\xab\x74\xc3\xea\
+\x59\x73\xe0\xdf\x1e\x5b\xf1\x8a\x47\xf8\x17\x1e\x9b\xf5\xe2\xb1\
+\xef\xf1\x34\x37\x7b\x91\xa5\xd5\x67\x7a\x73\xac\xf7\x72\xff\x7d\
+\xbc\xb0\x62\x90\xd4\xb3\xb0\x2a\xa9\x67\x71\xf5\xcd\x37\x77\xce\
+\x5f\xbc\x78\xef\xca\x6b\x6f\x6c\x4d\xf3\xc7\xfa\xcf\x9e\xf1\x21\
+\x3f\xa6\xeb\xea\x01\xb8\x2e\xc4\xf1\x24\x9f\xd2\xcd\x1e\x3e\x60\
+\xc7\x43\x8f\x94\xd7\xcb\xd5\xc9\xf6\x11\x8f\x75\xf3\x40\xb0\xad\
+\x07\x9d\x3a\xaf\xef\x3e\xab\xf9\x85\xf5\x7b\x75\xa8\x6d\x7d\xad\
+\xb3\x41\xd8\x8b\xe5\xeb\x7d\x56\xf3\x0d\xeb\xa2\x22\xb5\x9a\x58\
+\x6f\x57\x03\x61\x3a\x24\x68\x7d\x15\xd4\x90\xfc\x11\xb9\xa5\xca\
+\x26\x79\xb1\x9d\x6f\x92\xab\x94\x57\xc9\x0b\xf4\xec\x00\x7f\x09\
+\xec\x95\xa2\x77\xb9\xb6\x90\x18\x7c\xdd\x20\x84\x5f\x27\x35\xa7\
+\xca\x8e\x50\xe7\xf9\x5d\x2e\xdb\x77\x37\x10\xc6\x29\x50\x4f\x0e\
+\xd7\x06\xef\x5f\x6d\x2f\x33\x29\xaf\xe7\x62\x08\xac\xa5\xc4\x1e\
+\x89\x8b\x75\x3e\xd1\x20\x70\x9e\x09\xb9\x12\x98\x80\xad\x86\xe6\
+\xfb\xe4\xe1\xa9\xc3\x31\xb0\x93\x1c\x02\xbb\x79\xf9\xd9\xfe\xf2\
+\x90\x00\x59\xb7\xc1\xff\x2a\xa1\xba\x06\xb4\x1a\xe0\x76\xc9\xd5\
+\xbf\x77\x59\x2d\x96\xb3\x59\xb6\xc9\xa5\xf2\xba\x19\x04\xec\xbb\
+\xf9\xbe\xf1\x6c\xde\x3f\x43\x0b\xe9\x1a\x79\x8e\x6e\xdd\x5f\x4f\
+\xd7\x3f\x31\xb7\xd7\xa1\xec\xcb\xf3\xdc\xc2\x83\x79\xb9\x80\xf3\
+\x31\x79\xe8\x6d\xad\x82\x7f\x95\xf6\x4b\xc3\xe4\xc9\x36\xa7\xf6\
+\x08\xae\x97\x50\x28\xd5\xac\xbc\xe0\x19\xe1\x51\x93\x87\x73\x78\
+\x04\xb8\x4c\x4a\x57\xca\xef\xdb\x88\x27\x77\xb0\xaf\xf3\xc8\xaf\
+\xf1\xb2\x74\x6d\xfc\x62\x9c\x2e\x9f\x67\xe9\x89\xb7\x0c\x8c\x49\
+\x7c\xa7\x81\xd7\x7a\xf8\xf0\x48\xf7\xc9\xce\x96\xe7\xf9\xab\x83\
+\xf7\xaa\x7e\xde\xcb\x20\x29\xe9\x8b\xb4\xb7\xb3\x3b\xda\xdb\xd9\
+\x59\xbf\x73\xeb\xe6\x99\x90\x7b\xf5\x5d\x78\xcc\x81\xf5\x28\x27\
+\x9f\xcd\x81\x93\xea\xcf\xeb\x64\xf5\xa8\x57\x21\xeb\x1c\xb4\xbc\
+\x90\xcd\xea\xcf\x94\x55\x95\xb0\x06\xc4\x69\x39\x69\x48\x07\xbe\
+\x1e\x75\xce\xa1\xf6\xbf\xef\x5b\xc0\x9f\x03\x3f\x25\xaf\xc0\xfb\
+\x0d\x72\x95\xf2\x4a\x39\x19\xd8\xa3\x5b\x0e\x7d\x9d\x1f\x38\x02\
+\xf5\x74\x69\x04\x7c\x0b\x48\xa1\xf4\x59\x21\x0f\x2f\xfd\x70\x19\
+\x38\x13\x6b\x01\xae\x24\xf8\x76\x80\x2e\xad\x56\x0f\x7d\x2f\x5f\
+\x54\xc8\x27\x84\x29\x71\x0e\x78\x9b\xc0\xd5\x98\xc2\xf2\x9c\xa5\
+\x3c\xee\x56\x6a\xf9\x80\xc8\x0e\x07\xda\x72\x8c\x18\x4d\xfa\xb6\
+\xbb\x1c\x23\x33\x72\x05\xf2\xa7\xe5\xa2\xc2\xe3\xf6\x81\xf4\x98\
+\x93\xa2\xe1\xc5\x86\x45\x79\xac\x4f\x06\x01\x70\xad\xfc\x0e\x5e\
+\x21\x57\xbe\x37\x4b\x65\x64\x97\x94\xea\x90\xe8\x71\xd9\x57\x2f\
+\x96\x6d\xba\x33\xb8\x68\x13\x59\x0d\x55\xfd\x65\xd9\xb6\x7b\x38\
+\xcf\xf1\xc4\x87\xc9\xaf\xe8\xb0\xd6\x1e\xf8\x2f\xc0\xbb\xcb\xa1\
+\x2c\x69\xf5\x4b\x56\xe7\x11\x3f\x32\x81\xa4\x65\x4f\xd7\xdf\x04\
+\xbe\xcb\x6a\x91\xb0\xa3\xf8\x31\xf0\x07\xac\x5a\xda\xe8\xc9\xc7\
+\xe4\xef\x02\x7f\x9f\x65\xeb\xab\x27\x7c\x4a\xe6\x55\xf5\x7e\x00\
+\xfc\x53\xf2\x45\xae\xa7\x35\x21\x5f\xdc\x93\x41\x52\x4f\xc3\xaa\
+\xa4\x9e\x46\x68\xdb\xfe\x6f\xfd\xc6\xdf\xf9\xe4\x57\x7f\xed\xd7\
+\xef\x4e\xd6\xd6\xd2\x7f\xfb\xfd\xdf\x03\xf8\xa3\xe7\xf8\x14\xb5\
+\x9a\xf7\x79\x48\xc7\xb8\xed\x70\x36\x49\xff\x05\x84\x5c\xed\x3f\
+\x11\xdc\x2b\x07\xf9\xf7\xc8\x57\xab\xbf\x45\x9e\x27\xf9\xf5\x10\
+\xb8\x98\x52\x08\x90\x76\x4a\x20\x2a\xf7\x6a\x81\x78\xa3\xf6\xaf\
+\x2c\xf5\x86\x40\xdb\xc6\x36\xc6\xaf\x2d\x57\x0f\xcc\xed\x47\x3f\
+\x69\xcb\x6c\xc1\xe5\xd4\xa7\x96\x35\x62\xfb\x66\xdb\xc6\x2e\x42\
+\xd7\xc6\x96\x48\x7c\x9f\x04\xed\xf2\x1a\x44\x5d\xe6\x9f\xbe\x8d\
+\xac\xc5\xb6\x5d\xab\x2b\x20\x42\x1b\x68\xe3\xc5\x2e\x76\x9f\x10\
+\x79\xbf\x04\xc8\x07\x9f\xd3\x3e\x53\x1f\xb3\x56\x10\xef\x93\x2b\
+\x88\xb5\x45\x4b\xed\x4b\x7a\xa5\x84\xcc\xcd\x72\x81\x24\x94\xdb\
+\x6e\x97\xc0\x58\x57\x57\x7d\x80\xf3\x1c\x5f\xca\x30\xf9\x15\xb5\
+\x5d\xfe\x3c\x4b\xc0\xb9\xce\x6a\xa8\xfc\x51\x75\xe4\xd1\x03\xd7\
+\x7d\x0b\x8e\xbc\x9d\xaf\x95\xfc\xd0\x1e\xe3\x7e\x73\xf2\x7c\xf2\
+\x2d\x37\xa1\x41\x52\x86\x49\x9d\x30\xe3\xc9\xa4\x7f\xeb\xdb\xdf\
+\xd9\x05\x98\x4c\x26\xb0\x9a\x0f\xf8\x32\x71\x68\xd2\x8b\x21\x95\
+\xa0\x73\x9b\x7c\x05\xf9\x6f\xa4\xc4\xb7\x21\xcd\xc8\xc3\x61\x7f\
+\xbe\x7a\xc7\xf6\x2d\xaf\xdf\x2e\x4f\x4c\x96\xf5\xc2\xb8\xef\x66\
+\x0f\xbd\xd3\x79\x92\x53\x13\x63\x5e\xad\x75\x58\x65\x3c\x6c\x85\
+\xc2\x38\x78\xb0\xf2\xdf\x0d\x22\x37\xc8\x43\x54\x77\xbe\x84\x50\
+\x56\x2f\x74\xd4\x8a\xf9\x5d\x72\x45\xb4\xb6\x6c\xa9\xc1\xf2\x3a\
+\xf9\x4a\xbe\xc1\xf1\x25\xe6\x22\x3b\x92\x0c\x92\x92\x24\xad\x02\
+\xd2\x07\xc0\xaf\x92\x87\x69\xe6\x5e\xa0\x87\x87\xa1\xe6\x4b\x7e\
+\xad\x2f\x5a\x18\x4f\x25\x8c\xdf\x31\x3c\x9e\x2c\x56\x25\x25\x7d\
+\x55\x04\x37\xc1\xc9\xf3\xce\x3b\xef\x34\x7f\xf8\xbb\xbf\xfd\x6f\
+\xdd\x12\x92\x4e\x80\x19\x79\x01\x98\xbd\x27\x04\xa2\xfe\x4b\xfc\
+\xf3\xa2\x07\x72\x9d\xd0\x30\xe9\x96\x90\x64\x90\x94\x24\xe9\xe9\
+\xdc\x00\xfe\x03\xf0\xef\xc9\x73\x91\x0c\x46\x32\x4c\x1e\xe0\xb0\
+\x56\xcf\x69\x4f\x90\xc9\x53\x7e\x8e\xfb\xd9\xff\x12\x72\x68\xeb\
+\x09\xe5\x5c\x49\x49\x27\x44\xcf\xe7\xb7\x18\x93\x24\x41\x1e\x1a\
+\x3f\x03\xfe\x25\xa5\x97\xf1\x11\x83\xe7\x79\xec\x51\x78\xdc\xed\
+\x9c\x80\x7f\x43\x5e\x31\xfb\xa8\xdb\x79\x93\xa3\xac\xf2\x2a\x83\
+\xa4\x24\x49\x92\x8e\x36\x5f\xd2\x6a\xe4\x73\xd1\x93\xe7\x14\xff\
+\x33\xe0\x27\x47\xbc\xcf\x18\xf8\x07\x58\x29\x3b\xee\x76\xbe\x09\
+\xfc\x73\xe0\x7f\x1f\x63\x3b\xff\x26\xfb\x7b\xf6\xca\x20\xa9\x2f\
+\x5b\xad\x4a\xba\x25\x24\x49\x3a\xb9\x61\x52\xcf\x4d\xed\x0b\x7c\
+\x14\xc7\xe9\x37\xa9\x67\xdb\xce\x0d\x56\x7e\x5f\x4a\x8e\x27\x97\
+\x24\x49\xfa\x02\xc2\xa4\x5b\x42\x5f\x51\x06\xf6\x97\x94\x15\xc9\
+\x13\xee\x9d\x77\xde\x69\xbe\xf7\xbd\xef\xf5\xae\xe2\x2a\x49\xd2\
+\x8b\x1f\x26\x87\x95\x49\x87\xb5\x4a\x32\x48\xea\x4b\x0f\x93\x6e\
+\x05\x49\x92\x24\x49\x06\x49\x49\x92\xa4\x97\xc8\xb0\x2a\x69\x35\
+\xf2\x73\xf1\x26\xb0\x7d\xc4\xdb\x8e\x81\x53\x6e\xb2\xa7\x72\x0e\
+\xb8\x70\x8c\xed\xec\x8a\xad\x06\x49\x49\x92\xa4\xe3\xfb\xc3\xdf\
+\xfd\x6d\xe7\x07\x0e\x39\x5f\xf2\xf3\xf0\x2a\xf0\x5b\x1c\x7d\x11\
+\x18\x80\xeb\xc0\x1f\xb8\xe9\x8e\xe5\x15\xe0\x1f\x03\xf3\x63\xdc\
+\x67\x1b\x70\x9f\x97\x24\x49\x92\xf4\x42\x69\x80\x7f\x54\x42\x64\
+\x7f\x8c\x3f\xff\x13\xb8\xea\xe6\x3b\xd6\x76\xfe\x87\xe4\x56\x1e\
+\xc7\xd9\xce\x7f\x42\xae\x62\xea\x25\xe3\xaa\xad\x92\x24\x49\x92\
+\x8e\xe2\x69\x56\x60\x0d\xd8\xfe\xc3\x20\x29\x49\x92\x24\x49\x92\
+\x41\x52\x92\x24\x49\x92\x74\x2c\x2e\xb6\x23\x49\x92\xa4\x93\x2e\
+\x70\xfc\x61\x97\x0e\xb7\x3c\xbe\x96\x3c\x17\x35\xb8\x9d\x65\x90\
+\x94\x24\x49\xd2\x49\xf7\x63\xe0\x5f\x70\xf4\x55\x5b\x1b\xe0\x16\
+\x90\xdc\x74\xc7\xf2\x13\xe0\x77\x80\xee\x98\xdb\xb9\x73\xd3\xbd\
+\x7c\xbc\x42\x20\x49\x92\xa4\x93\x2e\x90\xab\x65\xc7\x3d\x0f\x9e\
+\xbb\xe9\x8e\xbd\xcd\xc2\x53\xbc\x37\x0b\x37\x9d\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x4e\xae\xff\x0f\x81\x33\x5b\xb9\x88\xbc\xe9\
+\xe4\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x0d\xe4\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x03\x92\x00\x00\x02\x52\x08\x06\x00\x00\x00\xb1\xee\xfa\x12\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\
+\x0e\xc4\x01\x95\x2b\x0e\x1b\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
+\xe2\x06\x0e\x12\x02\x04\xd2\x3e\x43\x3f\x00\x00\x0d\x71\x49\x44\
+\x41\x54\x78\xda\xed\xdd\x31\x6e\xdb\x76\x14\xc0\xe1\xe7\xd2\x20\
+\x22\x80\xb0\x1b\x27\x93\x07\x81\xbd\x41\x01\x0f\x59\x7d\x01\x4f\
+\x3d\x40\x4e\xd0\xa0\x37\xa0\x39\xb5\x73\x73\x82\x9c\xc1\x43\x66\
+\x1d\x20\x43\x4e\x50\x42\x43\x46\x01\x02\x08\x08\x10\x40\xb0\x43\
+\xa5\x20\x69\xa4\x58\x32\x14\x9b\x22\xbf\x6f\x8c\x01\xc3\x79\x22\
+\x0c\xfd\xf8\xfe\xa6\x22\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x80\x81\x3a\x31\x02\x00\xa0\x6b\x8a\xa2\x68\xcb\xb2\x3c\
+\xe9\xf3\xff\xef\x50\xdf\xab\xcf\x73\x02\xba\xeb\xd4\x08\x00\x80\
+\xbe\x47\x69\xd7\x7e\xa6\xe9\x74\x7a\x90\xef\x33\x1e\x8f\xbd\xc0\
+\x80\x90\x04\x00\x38\x74\x00\x1e\x2a\xda\x00\x10\x92\x00\x40\xc7\
+\x09\x40\x80\xee\xfa\xc9\x08\x00\x00\x00\x10\x92\x00\x00\x00\x08\
+\x49\x00\x00\x00\x84\x24\x00\x00\x00\x42\x12\x00\x00\x00\x21\x09\
+\x00\x00\x00\x42\x12\x00\x00\x00\x21\x09\x00\x00\x80\x90\x04\x00\
+\x00\x40\x48\x02\x00\x00\x20\x24\x01\x00\x00\x10\x92\x00\x00\x00\
+\x20\x24\x01\x00\x00\x10\x92\x00\x00\x00\x08\x49\x00\x00\x00\x84\
+\x24\x00\x00\x00\x42\x12\x00\x00\x00\x21\x09\x00\x00\x00\x42\x12\
+\x00\x00\x00\x21\x09\x00\x00\x80\x90\x04\x00\x00\x40\x48\x02\x00\
+\x00\x20\x24\x01\x00\x00\x40\x48\x02\x00\x00\x20\x24\x01\x00\x00\
+\x10\x92\x00\x00\x00\x08\x49\x00\x00\x00\x84\x24\x00\x00\x00\x42\
+\x12\x00\x00\x00\x84\x24\x00\x00\x00\x42\x12\x00\x00\x00\x21\x09\
+\x00\x00\x80\x90\x04\x00\x00\x40\x48\x02\x00\x00\x20\x24\x01\x00\
+\x00\x40\x48\x02\x00\x00\x20\x24\x01\x00\x00\x10\x92\x00\x00\x00\
+\x08\x49\x00\x00\x00\x84\x24\x00\x00\x00\x42\x12\x00\x00\x00\x84\
+\x24\x00\x00\x00\x42\x12\x00\x00\x00\x21\x09\x00\x00\x80\x90\x04\
+\x00\x00\x40\x48\x02\x00\x00\x80\x90\x04\x00\x00\x40\x48\x02\x00\
+\x00\x20\x24\x01\x00\x00\x10\x92\x00\x00\x00\x08\x49\x00\x00\x00\
+\x84\x24\x00\x00\x00\x08\x49\x00\x00\x00\x84\x24\x00\x00\x00\x42\
+\x12\x00\x00\x00\x21\x09\x00\x00\x80\x90\x04\x00\x00\x40\x48\x02\
+\x00\x00\x80\x90\x04\x00\x00\x40\x48\x02\x00\x00\x20\x24\x01\x00\
+\x00\x10\x92\x00\x00\x00\x08\x49\x00\x00\x00\x84\x24\x00\x00\x00\
+\x08\x49\x00\x00\x00\x84\x24\x00\x00\x00\x42\x12\x00\x00\x80\x63\
+\x73\x6a\x04\x00\x40\x17\x8d\xc7\x63\x43\x00\x10\x92\x00\x00\xbb\
+\x9b\x4e\xa7\x86\x20\xb6\x81\x8e\x3a\x31\x02\x00\xa0\x4b\x8a\xa2\
+\x68\x45\xe4\x7e\x31\x59\x96\xa5\xf7\x74\xc0\xa3\xf2\x37\x92\x00\
+\x00\x00\xec\xc5\xdd\x2b\x00\xa0\x33\x6c\x23\x1f\xc6\x56\x12\x78\
+\x6c\x36\x92\x00\x00\x00\x08\x49\x00\x80\x21\x99\x4e\xa7\x51\x14\
+\x45\x6b\x12\x80\x90\x04\x00\x06\xc5\xb1\x56\x00\x21\x09\x00\xc0\
+\x23\xb2\x95\x04\x84\x24\x00\x30\x28\xb6\x91\x00\x42\x12\x00\x00\
+\x80\x1e\xf3\x98\x68\x00\xe0\x49\xd9\x46\x1e\x96\x8f\x02\x01\x1e\
+\x83\x8d\x24\x00\x00\x00\x42\x12\x00\x60\xa8\x3c\x74\x07\x10\x92\
+\x00\x40\xaf\x39\xd6\x0a\x20\x24\x01\x00\xe8\x00\x5b\x49\x40\x48\
+\x02\x00\xbd\x64\x1b\x09\x20\x24\x01\x00\x00\x10\x92\x00\x00\x1c\
+\x2b\xc7\x5b\x01\x21\x09\x00\xf4\x8a\x63\xad\x00\x42\x12\x00\x80\
+\x0e\xb2\x95\x04\x84\x24\x00\xd0\x0b\xb6\x91\x00\x42\x12\x00\x80\
+\x0e\xb3\x95\x04\x84\x24\x00\x70\xd4\x6c\x23\x01\x84\x24\x00\x00\
+\x47\xc0\x56\x12\x10\x92\x00\x00\x00\x08\x49\x00\xa0\xff\x1c\x6b\
+\x05\x10\x92\x00\x00\x1c\x11\xc7\x5b\x01\x21\x09\x00\x1c\x15\xdb\
+\x48\x00\x21\x09\x00\xc0\x11\xb2\x95\x04\x84\x24\x00\x00\x00\x4f\
+\xe2\xc4\x08\x00\x80\x1f\xc9\xb1\xd6\xee\x19\x8f\xc7\x51\x96\xa5\
+\xf7\x81\xc0\x83\xd9\x48\x02\x00\x00\x20\x24\x01\x80\x6e\xb0\x8d\
+\x04\x10\x92\x00\x00\xf4\x80\x87\xee\x00\x42\x12\x00\xe8\x24\xdb\
+\x48\x00\x21\x09\x00\x40\x8f\xd8\x4a\x02\x42\x12\x00\x00\x80\x47\
+\xe3\xb1\xcf\x00\xc0\xc1\x39\xd6\x7a\x3c\x7c\x14\x08\xf0\x10\x36\
+\x92\x00\x00\x00\xec\xc5\xdd\x27\x00\xe0\xa0\x6c\x23\x8f\x8f\xad\
+\x24\xb0\x2f\x1b\x49\x00\x00\x00\x84\x24\x00\x00\x00\x3f\x8e\x23\
+\x0c\x00\xc0\xc1\x38\xd6\x7a\xbc\x1c\x6f\x05\xf6\x61\x23\x09\x00\
+\x00\xc0\x5e\xdc\x75\x02\x00\x0e\xc2\x36\xf2\xf8\xd9\x4a\x02\xbb\
+\xb2\x91\x04\x00\x00\x60\x2f\xee\x38\x01\x00\x3b\x2b\x8a\xe2\x75\
+\x44\xdc\x44\xc4\x55\x44\x5c\x46\x44\x6a\x2a\xbd\x56\x45\xc4\x87\
+\x88\xb8\x2b\xcb\xf2\x9d\x71\x00\x42\x12\x00\xd8\x37\x20\x6f\x23\
+\x22\xaf\xeb\x3a\x16\x8b\x45\x2c\x97\xcb\x68\x9a\xc6\x70\x7a\x2a\
+\x49\x92\x48\xd3\x34\x46\xa3\x51\x64\x59\xb6\x8e\xca\x5b\x41\x09\
+\x08\x49\x00\x60\x97\x88\xfc\x3b\x22\x7e\xaf\xeb\x3a\xe6\xf3\xb9\
+\x78\x1c\x68\x54\x9e\x9f\x9f\xaf\x83\xf2\x6d\x59\x96\x6f\x4c\x05\
+\x06\xfe\x7b\xc1\x08\x00\x80\xfb\x22\x72\x36\x9b\xc5\x7c\x3e\x8f\
+\xb6\x6d\x0d\x65\x80\xda\xb6\x8d\xc5\x62\x11\x4d\xd3\xc4\x68\x34\
+\x7a\x75\x7d\x7d\xfd\x62\x32\x99\xbc\x37\x19\x10\x92\x00\x00\xff\
+\x8f\xc8\xd7\x11\xf1\xe7\x6c\x36\x8b\xba\xae\x0d\x84\xcf\xc7\x99\
+\x57\x31\x59\x4d\x26\x93\x8f\xa6\x02\xc3\xe4\xa9\xad\x00\xc0\x36\
+\xb7\x75\x5d\x8b\x48\xbe\xf2\xc5\x35\x71\x6b\x1a\x20\x24\x01\x00\
+\x3e\x5b\x6d\x23\xf3\xf9\x7c\x6e\x18\x7c\x63\x75\x5d\xe4\xab\xeb\
+\x04\x10\x92\x00\x00\x11\x11\x71\x53\xd7\xb5\x07\xeb\xb0\x51\xd3\
+\x34\xeb\xad\xe4\x8d\x69\xc0\x30\x9d\x1a\x01\x00\xb0\xc1\xd5\x62\
+\xb1\xd8\xf8\x85\xaa\xaa\x4c\x67\x60\xf2\x3c\xff\xe6\xdf\x16\x8b\
+\x45\x64\x59\x76\x65\x3a\x20\x24\x01\x00\xd6\x2e\x97\xcb\xe5\xde\
+\x71\x41\xbf\x7c\xef\xa6\xc1\xea\xfa\xb8\x34\x25\x18\x26\x47\x5b\
+\x01\x80\x4d\xd2\xef\x1d\x6b\xcd\xf3\xdc\x66\x72\x00\x11\xf9\xbd\
+\x9b\x05\xab\xeb\x23\x35\x29\x10\x92\x00\x00\x3b\x13\x93\xc3\x8d\
+\x48\x00\x21\x09\x00\x88\x49\x44\x24\x20\x24\x01\x00\x31\x89\x88\
+\x04\x84\x24\x00\x20\x26\x11\x91\x80\x90\x04\x00\xc4\x24\x22\x12\
+\x10\x92\x00\xc0\xe0\x63\x12\xaf\x1b\x20\x24\x01\x00\x00\x40\x48\
+\x02\x00\x00\x20\x24\x01\x00\x00\x10\x92\x00\x00\x00\x08\x49\x00\
+\x00\x00\x84\x24\x00\x00\x00\x42\x12\x00\x00\x00\x84\x24\x00\x00\
+\x00\x42\x12\x00\x00\x00\x21\x09\x00\x00\x80\x90\x04\x00\x00\x40\
+\x48\x02\x00\x00\x20\x24\x01\x00\x00\x40\x48\x02\x00\x00\x20\x24\
+\x01\x00\x00\x10\x92\x00\x00\x00\x08\x49\x00\x00\x00\x84\x24\x00\
+\x00\x00\x08\x49\x00\x00\x00\x84\x24\x00\xf0\x74\xaa\xaa\x32\x04\
+\xaf\x1b\x20\x24\x01\x00\x76\x8f\x91\x3c\xcf\x0d\xe2\x08\xe5\x79\
+\x2e\x26\x01\x21\x09\x00\x88\x48\xc4\x24\x20\x24\x01\x00\x11\x89\
+\x98\x04\x84\x24\x00\x20\x22\x11\x93\x80\x90\x04\x00\x44\x24\x62\
+\x12\x10\x92\x00\x00\x22\x52\x4c\x02\x7c\xe9\xd4\x08\x00\x80\x87\
+\xc6\x24\x00\x42\x12\x00\xe0\x5e\x36\x91\x00\x38\xda\x0a\x00\x00\
+\x80\x90\x04\x00\x00\x40\x48\x02\x00\x00\x20\x24\x01\x00\x00\x10\
+\x92\x00\x00\x00\xf4\x9e\xa7\xb6\x02\x00\x7b\xf1\xb1\x1f\xc3\xe3\
+\x49\xbd\x80\x90\x04\x00\xc4\x05\x3b\x71\xd3\x00\xd8\xc6\xd1\x56\
+\x00\xe0\x41\x11\x29\x32\xfa\x1f\x91\x6e\x16\x00\x42\x12\x00\x10\
+\x93\x88\x48\x40\x48\x02\x00\x62\x12\x11\x09\x08\x49\x00\x40\x4c\
+\x22\x22\x01\x21\x09\x00\x88\x49\x44\x24\x20\x24\x01\x00\xc4\xa4\
+\x88\x04\x84\x24\x00\xc0\x21\x62\x12\xaf\x1b\x20\x24\x01\x00\x00\
+\x40\x48\x02\x00\x00\x20\x24\x01\x00\x00\x10\x92\x00\x00\x00\x08\
+\x49\x00\x00\x00\x84\x24\x00\x00\x00\x42\x12\x00\x00\x00\x84\x24\
+\x00\x00\x00\x42\x12\x00\x00\x00\x21\x09\x00\x00\x80\x90\x04\x00\
+\x00\x40\x48\x02\x00\x00\x20\x24\x01\x00\x00\x40\x48\x02\x00\x00\
+\x20\x24\x01\x00\x00\x10\x92\x00\x00\x00\x08\x49\x00\x00\x00\x84\
+\x24\x00\x00\x00\x08\x49\x00\x00\x00\x84\x24\x00\x00\x00\x42\x12\
+\x00\x00\x00\x21\x09\x00\x00\x80\x90\x04\x00\x00\x40\x48\x02\x00\
+\x00\x80\x90\x04\x00\x00\x40\x48\x02\x00\x00\x20\x24\x01\x00\x00\
+\x10\x92\x00\x00\x00\x08\x49\x00\x00\x00\x84\x24\x00\x00\x00\x08\
+\x49\x00\x00\x00\x84\x24\x00\x00\x00\x42\x12\x00\x00\x00\x21\x09\
+\x00\x00\x80\x90\x04\x00\x00\x40\x48\x02\x00\x00\x80\x90\x04\x00\
+\x00\x40\x48\x02\x00\x00\x20\x24\x01\x00\x00\x10\x92\x00\x00\x00\
+\x08\x49\x00\x00\x00\x10\x92\x00\x00\x00\x08\x49\x00\x00\x00\x84\
+\x24\x00\x00\x00\x42\x12\x00\x00\x00\x21\x09\x00\x00\x80\x90\x04\
+\x00\x00\x00\x21\x09\x00\x00\x80\x90\x04\x00\x00\x40\x48\x02\x00\
+\x00\x20\x24\x01\x00\x00\x10\x92\x00\x00\x00\x08\x49\x00\x00\x00\
+\x10\x92\x00\x00\x00\x08\x49\x00\x00\x00\x84\x24\x00\x00\x00\x42\
+\x12\x00\x00\x00\x21\x09\x00\x00\x80\x90\x04\x00\x00\x00\x21\x09\
+\x00\x00\x80\x90\x04\x00\x00\x40\x48\x02\x00\x00\x20\x24\x01\x00\
+\x00\x10\x92\x00\x00\x00\x20\x24\x01\x00\x00\x10\x92\x00\x00\x00\
+\x08\x49\x00\x00\x00\x84\x24\x00\x00\x00\x42\x12\x00\x00\x00\x21\
+\x09\x00\x00\x00\x42\x12\x00\x00\x00\x21\x09\x00\x00\x80\x90\x04\
+\x00\x00\x40\x48\x02\x00\x00\x20\x24\x01\x00\xbe\x51\x55\x95\x21\
+\x78\xdd\x00\x21\x09\x00\xb0\x7b\x8c\xe4\x79\x6e\x10\x47\x28\xcf\
+\x73\x31\x09\x08\x49\x00\x40\x44\x22\x26\x01\x21\x09\x00\x88\x48\
+\xc4\x24\x20\x24\x01\x80\x0e\x5b\x26\x49\x22\x22\xc5\xe4\x56\xab\
+\xeb\x63\x69\x62\x20\x24\x01\x00\xd6\x3e\xa5\x69\x2a\x22\xc5\xe4\
+\x56\xab\xeb\xe3\x93\x69\x81\x90\x04\x00\x58\xfb\x30\x1a\x8d\x44\
+\xa4\x98\xdc\xfa\xf5\xd5\xf5\xf1\xc1\xa4\x60\x98\x4e\x8d\x00\x00\
+\xd8\xe0\x2e\xcb\xb2\xdf\xe6\xf3\x79\x34\x4d\xb3\x35\x26\x19\xa6\
+\x24\x49\x22\xcb\xb2\x88\x88\x3b\xd3\x80\x61\x3a\x31\x02\x00\x60\
+\x93\xa2\x28\xfe\xa9\xeb\x3a\x9f\xcd\x66\x86\xc1\x57\x2e\x2e\x2e\
+\x22\xcb\xb2\xaa\x2c\xcb\x5f\x4c\x03\x86\xc9\xd1\x56\x00\x60\x9b\
+\xdb\x2c\xcb\xd6\x9b\x27\x88\x88\x88\x2f\xae\x89\x5b\xd3\x80\xe1\
+\x4a\x8c\x00\x00\xd8\x64\x32\x99\x7c\xbc\xbe\xbe\x7e\x31\x1a\x8d\
+\x5e\x35\x4d\x13\xcb\xa5\x07\x74\x8a\xc8\x2c\x2e\x2e\x2e\x22\x22\
+\xde\x96\x65\xf9\x97\x89\x80\x90\x04\x00\xd8\x14\x93\xef\xd7\x31\
+\x99\x24\x49\x2c\x97\xcb\x68\xdb\xd6\x60\x86\xf6\x86\x31\x49\xe2\
+\xf9\xf3\xe7\x71\x7e\x7e\xbe\x8e\xc8\x37\xa6\x02\x42\x12\x00\xe0\
+\xbe\x98\xac\xd2\x34\xfd\xf5\xec\xec\xec\xe7\xf5\xe7\x4b\xb6\x6d\
+\x2b\x2a\x7b\x1e\x8f\xcf\x9e\x3d\x8b\xb3\xb3\xb3\x78\xf9\xf2\x65\
+\xa4\x69\x5a\x45\xc4\x1f\x36\x91\x40\x84\x87\xed\x00\x00\x7b\x28\
+\x8a\xe2\x75\x44\xdc\x44\xc4\x55\x44\x5c\x46\x44\x6a\x2a\xbd\x56\
+\xc5\x7f\x1f\xf1\x71\x57\x96\xe5\x3b\xe3\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\xa7\xf0\x2f\x40\
+\xf2\x47\x87\x01\xa4\xb7\xe7\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
+\x42\x60\x82\
+\x00\x01\x73\xb9\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x07\xe5\x00\x00\x02\xe2\x08\x06\x00\x00\x00\x0f\x68\x04\x04\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0f\x61\x00\x00\x0f\x61\
+\x01\xa8\x3f\xa7\x69\x00\x00\x20\x00\x49\x44\x41\x54\x78\x9c\xec\
+\xdd\x7f\x8c\x65\xe7\x79\x1f\xf6\xe7\x3d\x67\xf6\x17\x35\x2b\x52\
+\x1b\xd9\x91\x25\x99\x58\x8a\x49\x05\x58\x2e\xb4\x25\x25\xd5\x49\
+\x8a\xa0\x45\x22\x40\x45\xe1\x26\x5d\xef\x46\x8c\x15\xd4\x29\x90\
+\xd8\x8a\xdd\xd8\x80\x12\x78\x2a\x37\xc3\xe1\x70\x93\xd0\x5b\x24\
+\x29\x6a\xc3\xb6\x6a\x0b\x68\xfc\x87\x55\xba\xbb\x66\xd1\x18\x05\
+\x0c\x38\x46\x8a\xa4\x68\x52\x49\x64\x48\x34\x32\xea\xc2\x94\xd6\
+\x74\x68\x51\x72\x40\x91\xde\xa5\x96\xfb\xe3\xde\xb7\x7f\xdc\x7b\
+\xee\x3d\x33\x3b\x33\x7b\xcf\xcc\xbd\xf7\x9c\x7b\xef\xe7\x03\x50\
+\x9c\xb9\x3f\xce\x79\xf6\xdd\xe1\x4b\x6a\xbf\xf7\x79\xde\x14\x00\
+\xc0\x4a\xd9\xda\xda\xca\x6d\xdc\x77\x7b\x7b\x3b\xb5\x71\x5f\x60\
+\xbe\xb6\xb6\xb6\xf2\x32\xff\xf3\x3e\xcd\x3d\xb4\x2b\xeb\xf4\xb9\
+\x2f\x7e\xa4\x95\x7f\x2f\xb0\xba\x3e\xfd\xb1\x2f\x77\xe2\x67\x1f\
+\x96\xd5\x17\x3f\xf7\x39\xfb\x3a\x73\xf5\xb1\x4f\x7f\xda\xbe\x0e\
+\x33\xf4\xc5\xdf\xfc\x1b\xf6\x75\xe6\xea\x63\x1f\xff\x05\xfb\x3a\
+\xcc\xc0\x5a\xdb\x05\x00\x00\xd3\x77\x50\x68\xf4\x81\x0f\x7c\x20\
+\x8a\xa2\x88\x54\xa4\x28\x8a\x22\x8a\x54\x44\x4a\xc3\xaf\x8b\x22\
+\x8a\xb2\x88\x22\x8a\x28\xca\x14\x45\x51\x46\x91\x52\xa4\xa2\x88\
+\x54\x14\x51\x16\xc3\xd7\xa6\x22\x52\x59\x44\x99\x8a\x48\xe5\xf0\
+\xfb\xa2\x88\x72\xf8\xda\xc1\xb5\xc6\xaf\x2b\x52\x11\x11\x71\xdf\
+\xff\x13\xd9\x95\x80\x0a\xe8\x86\xb6\x3e\x44\x74\x90\x57\x5e\x79\
+\x65\x2a\xd7\x79\xf8\xe1\x87\xa7\x72\x9d\x69\x10\x90\x02\x2c\x17\
+\x01\x29\xc0\x72\x11\x90\x02\x2c\x07\xa1\x3c\x00\x2c\xb8\xbd\x42\
+\xab\xef\xfc\xce\xef\x1c\x84\xe9\xc3\x40\xbc\x18\x86\xea\x45\x4a\
+\x51\xfd\x3f\xb9\x14\x29\x52\x4e\x11\x45\x44\x4a\x29\x46\x4f\x44\
+\xf5\x75\x8a\x1c\x39\xaa\x27\x52\x44\x44\xce\x11\x29\x45\x2a\xc6\
+\xd7\x89\x9c\x6a\x6f\x49\x83\xe7\x47\xd7\x19\xdc\x23\xa5\x14\x9f\
+\xfc\xe4\x27\x87\x1f\x02\xa8\x07\xf7\xc3\xda\x52\x8a\xa2\xdc\x3f\
+\xb8\x17\xd6\xc3\x62\x99\x56\x98\x3e\xad\x00\x1c\x00\x00\x00\x00\
+\xda\x24\x94\x07\x80\x05\x54\x0f\xbc\xde\x79\xfa\xf4\xa8\x93\xbd\
+\x18\x76\xbc\x0f\x54\xa1\x7b\x2d\x54\x4f\x51\x8b\xd9\x07\x5f\x17\
+\x79\x98\xa5\x47\x8a\x34\x4e\xec\xab\x2b\x8c\xdf\x18\x11\xe3\x17\
+\x0c\xaf\x32\x7a\x7d\x1a\xbd\x26\xe5\x88\x5c\xa4\x28\x86\xaf\xcd\
+\x69\xf8\xe0\xe8\x35\xb5\x10\xbf\xfa\xdf\x94\x22\xe5\x88\x1f\xf9\
+\x91\x1f\xa9\x85\xf5\xc3\xf0\x7e\x8f\x2e\x7b\x21\x3d\x74\x9b\x30\
+\x1d\x00\x00\x00\x00\xc6\x84\xf2\x00\xb0\x40\xaa\x30\xfe\xe4\xc9\
+\x93\x83\x00\xbe\x2c\x22\x47\x8a\x22\x86\x71\x77\xad\x13\x3e\xaa\
+\x30\x3c\xe7\x48\x69\xf0\x8a\xaa\x6b\x7d\x1c\x86\xd7\x23\xfa\x14\
+\x91\x77\xbd\x7f\xf8\x45\xfd\x75\x83\x8e\xf9\xd8\x95\xd3\xe7\xd1\
+\x83\xc3\xe6\xfb\x88\x61\x65\xd5\xbb\x46\x91\x7c\x4a\x91\x22\x45\
+\xde\x75\xdd\x91\xe1\xb7\x39\xa7\x28\x86\x17\xfb\xcc\x67\x3e\x33\
+\x1e\xb5\x5f\x8c\x6e\x28\x9c\x07\x00\x00\x00\x00\xa0\xf3\x84\xf2\
+\x00\xb0\x20\xb6\xb6\xb6\xf2\xb1\x63\xc7\x46\x1d\xe8\x91\x86\x21\
+\xfa\xa8\x0b\x3d\x86\xad\xef\x3b\x3b\xd1\x53\x4a\x91\x53\xde\xd5\
+\xa8\x9e\xc7\x31\x79\x4a\x83\x38\x7d\x78\x9d\x1c\xc3\xc6\xf6\x1d\
+\x61\x79\x1a\x37\xcc\xa7\x62\x67\xd7\x7b\x54\x5d\xf6\xf5\xd1\xf5\
+\xc3\x17\xef\xaa\x2d\x17\xa3\xb7\x0c\xba\xf3\xab\x7a\x87\x0f\x8c\
+\xaf\x5a\xeb\xda\x1f\xdf\x7d\x10\xf8\xa7\x14\x3f\xf5\xd9\xcf\x46\
+\x2a\xc6\x1d\xf4\xc2\x79\x00\x00\x00\x00\x00\xba\x4a\x28\x0f\x00\
+\x0b\x60\x6b\x6b\x2b\xaf\x95\x6b\x31\x8e\xac\x07\x06\xd9\xf8\x30\
+\x9c\x2f\xaa\x24\x3e\x47\xca\x45\xe4\x62\x98\x77\xe7\x18\xbc\x2f\
+\xe7\xaa\xcb\x7c\xd8\x14\x9f\x62\x34\xe8\xbe\x3a\xfb\x7d\x78\x56\
+\x7c\xaa\x07\xff\x51\xbb\x59\x4e\x83\x79\xf7\xc3\xd0\x7c\x74\x14\
+\x7d\xf5\xf2\xbc\xf3\x2d\xe3\x2e\xfe\x2a\xb0\x1f\x74\xd4\xa7\x54\
+\xec\x9a\x8a\x5f\xbf\x5f\x1a\x37\xe2\xa7\xea\x57\x9b\xc7\xbf\xee\
+\x1c\xc3\x56\xfc\x14\x9b\x9b\x9b\xd5\xb8\xfe\x2c\x98\x07\x00\x00\
+\x00\x00\xa0\x8b\x8a\xfb\xbf\x04\x00\x68\xd3\xd6\xd6\x56\x4e\x45\
+\x11\x39\x72\xad\x39\x7d\x10\x8a\x0f\x0e\x5a\x1f\x8c\x8c\xaf\x54\
+\xe7\xc0\x57\x23\xe2\xab\xae\xf9\x94\x52\xe4\x5c\xef\x45\xcf\x91\
+\x47\xa1\xf7\x20\x6f\x1f\xdc\x63\x47\xaa\xbe\x23\x75\x4f\xf5\x24\
+\x7d\x7c\xc3\xc1\xd9\xf5\xc3\xaf\xf3\x8e\x0e\xfa\x61\x7d\xa3\x37\
+\xa7\xd1\x65\xab\xef\x53\xde\x75\x60\x7c\x75\xcd\x7b\x22\xf6\xb4\
+\xe3\x6f\xf5\x69\x00\x4f\x3d\xf5\xd4\x68\xb4\x3f\x00\x00\x00\x00\
+\x00\x74\x89\x50\x1e\x00\x16\x40\xd5\x10\xbf\xe3\x81\x18\x47\xdc\
+\xf5\x7f\xa1\xe7\xd1\xa3\xc3\xae\xf4\x7a\xaf\xf9\x8e\xce\xf6\xe1\
+\x33\xc3\xf6\xf6\x34\x7e\xa4\x76\xfe\xfb\x38\xe4\xaf\xdd\xa0\xd6\
+\xc1\x3e\xb8\x4e\x4e\x79\xfc\x5d\xfd\x83\x03\xb5\xc7\x06\xb7\x19\
+\x77\xfa\xe7\x5c\x5d\x28\x8d\x9f\x4b\xf5\x30\xbf\x76\xb1\x94\xea\
+\x99\xfe\xa0\xce\x3c\xba\xfb\xa4\xcb\x08\x00\x00\x00\x00\x00\x73\
+\x27\x94\x07\x80\x05\x90\xea\x7f\xaf\x75\x88\xe7\xea\x0c\xf7\x7a\
+\x58\x5d\xff\x7a\xd4\xa5\x3e\xbe\x46\x8e\x3c\x08\xb4\x47\x47\xbd\
+\xef\xea\x40\x8f\xf1\xe3\xa3\x0f\x02\xe4\xf1\x1b\xee\xed\x60\x8f\
+\xc1\x79\xf1\xa3\x48\xbf\xba\xdc\xae\xae\xfb\x94\x87\x41\xfc\xf0\
+\xdb\xda\x19\xf2\xf5\xf1\xf7\xf5\x8f\x06\xd4\x3f\x1c\x30\xfe\xf5\
+\x55\xad\xff\xa3\xbb\x00\x00\x00\x00\x00\x40\x67\x09\xe5\x01\x60\
+\x01\xf4\xfa\xfd\x88\x34\xf8\xd7\x76\xca\xbb\x3a\xca\x53\x1a\x9f\
+\xb8\x3e\x6e\x31\xaf\x1e\x19\x7c\x99\xc7\xcf\x55\x1d\xe9\x55\xc0\
+\x3d\x0e\xfc\xc7\xa1\x7a\x1e\x76\xa6\x57\x19\x7a\x4a\xd5\x19\xf2\
+\xf5\xb8\x7c\x78\xf1\x14\xa3\xa0\xbc\x9a\x8e\x3f\xaa\x2b\x8f\x3b\
+\xe8\xa3\x76\xbf\x9d\x65\xd6\x3e\x21\x30\x7c\x32\xa7\x5a\xd4\x5e\
+\xab\x63\x50\x5c\x6d\x44\xfe\xf0\xde\x4f\x3d\xf5\x54\xb3\x05\x05\
+\x00\x00\x00\x00\x80\x39\x11\xca\x03\xc0\x02\xf8\xbd\xdf\xfb\xbd\
+\xb8\x7b\xe7\xce\xae\xae\xf8\xb1\x2a\x24\xdf\x31\x2e\x3e\x6a\xaf\
+\xab\xc6\xcb\xef\x3e\x2f\x3e\x8f\x47\xd7\x57\x0f\x45\xa4\xda\x7f\
+\x20\xa4\x5d\x2f\xcf\x91\xd3\xce\x00\x3d\x72\xad\xa3\x3d\x47\xec\
+\xcc\xd3\xeb\xa3\xe7\xeb\xef\xab\xd7\x91\x76\x04\xf3\x29\xe7\x1d\
+\xd7\x18\x57\x51\xef\x90\x1f\x77\xd8\x3f\xf5\xd4\x53\x42\x79\x00\
+\x00\x00\x00\x00\x3a\x4b\x28\x0f\x00\x0b\x20\xe7\x1c\xbf\xff\xfb\
+\xbf\x1f\xb7\x6e\xdf\x8e\x61\x12\x3e\x4e\xde\x77\xcf\xb6\x8f\xf1\
+\xf7\xa3\x00\xbd\x6a\x63\xaf\x87\xdd\xc3\xe7\x77\xe7\xe5\x91\xf2\
+\xe8\x65\xa3\x33\xe5\xa3\xca\xd2\xd3\xf8\x89\x18\xe7\xeb\xa3\xd1\
+\xf5\xa3\x6b\xd6\xbb\xf4\xab\xce\xf6\x3c\xba\x52\x1e\xdd\x2c\x6a\
+\xa3\xf5\xc7\x67\xcc\x47\x35\x3a\xbf\xf6\x29\x83\xd1\x07\x0d\x6a\
+\x7f\x7f\x7a\xfb\xe9\xd8\xda\xda\x6a\xb4\x96\x00\x00\x00\x00\x00\
+\x30\x4f\x6b\x6d\x17\x00\x00\xdc\x5f\x15\x5a\xff\xdb\x57\x5f\x8d\
+\xf7\xbf\xef\x7d\x11\x11\xb1\xbe\xbe\x3e\x08\xbf\x6b\xa3\xe9\xef\
+\xe9\x42\x8f\xd8\x91\xb8\xa7\x94\x23\xa5\xa2\x76\x6a\xfb\x40\xce\
+\x11\xa9\x18\x8e\x83\xaf\x02\xf1\x18\x87\xdf\x83\xcb\xd4\x82\xf8\
+\x9c\x07\xaf\x1f\xdd\x22\x0f\xce\xaa\x1f\x5e\x37\xef\x4a\xfa\x53\
+\x0c\x1f\x2c\x76\x7d\x9f\xc6\x91\xff\x20\x74\xcf\xa3\x17\xe4\x1c\
+\x51\xe4\x34\xfe\x20\xc0\xd0\x33\x7f\xff\x99\xd1\xd7\x9b\x9b\x9b\
+\x93\x2f\x22\x00\x00\x00\x00\x00\xb4\x40\x28\x0f\x00\x0b\x63\x10\
+\x60\x7f\xfd\xeb\x5f\x8f\xa2\xdc\x39\xec\xe6\xcc\x99\x77\xd5\x5e\
+\xb5\xab\xbb\x3d\x62\x74\x86\xfc\x20\xed\x8e\x1d\x5d\xf2\x39\x62\
+\x14\x88\xa7\x5a\x67\x7d\xd5\xdb\x5e\x5d\x2f\x8f\xbe\x1b\x77\xe0\
+\xd7\x06\xd7\x0f\xbb\xd9\xef\x1d\xa3\xbf\xbb\x93\x3f\xed\x68\x88\
+\xcf\x91\x53\x31\x1c\xdd\x33\x7e\xf1\xa8\x2b\x7f\x58\xee\x3f\xfc\
+\x07\xff\x60\xf4\xeb\xfb\xc9\x9f\xfc\xc9\x28\x8a\x22\x8a\xb2\x88\
+\x1c\xbb\xe6\xdc\x03\x00\x00\x00\x00\x40\xc7\x08\xe5\x01\x60\x01\
+\xe4\x94\x76\x04\xd0\x29\x47\xfc\xe1\x1f\xfe\xbb\x28\xcb\x22\xca\
+\xe2\xde\xd3\x68\xde\xf3\x5d\xef\x89\x14\xc5\xb0\x59\x3d\x0d\x3b\
+\xd0\x73\x44\xf5\xd8\xf0\x18\xf7\x34\x1a\x35\x9f\x22\x0f\x5f\x92\
+\x6a\x89\x7a\x4a\xe3\xce\xf5\x34\xea\x6c\x1f\x47\xfe\xbb\x9b\xf4\
+\xab\xbb\x8d\xd5\x62\xfb\xe1\xc3\xb9\xf6\x75\xd5\x75\x1f\xa9\xd8\
+\x71\x91\x9f\xf9\xd9\x9f\xdd\xf1\xeb\xf9\x89\x9f\xf8\x89\x28\x8a\
+\x32\xca\xb2\x1e\xfa\xd7\x13\x7f\x00\x00\x00\x00\x00\xe8\x26\xa1\
+\x3c\x00\x2c\x80\x94\x77\x86\xdd\x39\x45\x14\xa3\xf3\xda\x23\xfe\
+\xe8\x8f\xfe\x28\xca\xb2\x88\x54\x94\x51\x16\x45\xbc\xf6\xf5\xd7\
+\xee\xb9\xc6\x07\x1e\xf9\xc0\x70\xcc\x7c\xed\xbc\xf7\x18\x8f\x8c\
+\x4f\x29\x0d\xc3\xff\xb4\x23\xc6\x4f\x69\xfc\xfa\x41\x48\x3f\x08\
+\xf7\xab\x4b\xa4\x54\x4f\xf2\xab\x82\x6b\x37\x18\x86\xf7\x45\x8e\
+\x9d\xe9\xfc\xf0\xb9\x5f\xfa\xfc\xe7\xef\xa9\xf5\x87\x7f\xe4\x87\
+\xa3\x4c\x65\x14\x65\x8a\xa2\x28\xab\x79\xf7\xa3\xfb\xe6\xd1\x9a\
+\x00\x00\x00\x00\x00\x40\xb7\x09\xe5\x01\x60\x11\x0c\xcf\x58\xaf\
+\xbe\x49\x39\x06\x9d\xf3\xf5\x36\xf5\x3c\x8e\xed\xef\xdc\xb9\x13\
+\x65\x51\x8e\xc6\xbc\x17\x45\x19\x5f\xfd\xda\x57\x27\xba\xd5\x47\
+\x1e\xff\xc8\x70\x9c\x7d\x8c\xbb\xe2\x47\x73\xe8\xd3\x8e\xbf\xed\
+\x7c\xbc\x4a\xf9\x73\xa4\x28\xe2\xd7\x7e\xed\xea\x44\xf7\xfb\xd4\
+\x5f\xf9\x54\x14\xa9\x8c\xb2\x2c\x06\xf5\x16\xc5\xe0\xc3\x06\x45\
+\xf5\x0b\x1b\xfe\xda\x8a\x88\xd1\x27\x05\x86\xf7\x31\xbe\x1e\x00\
+\x00\x00\x00\x80\xae\x13\xca\x03\xc0\x42\xc8\xc3\xde\xf5\xc1\xd7\
+\x39\x8d\x87\xc8\x0f\x1f\x8a\x5c\xe4\x5a\x72\x9f\x76\x05\xd6\x39\
+\x8e\x1f\x3f\x11\xe5\x28\xa4\x1f\x04\xf5\xc5\x70\xfc\x7d\x15\x86\
+\x17\x65\x11\x5f\x7e\xfe\xcb\x53\xa9\xf8\xe3\x1f\xff\x78\xed\x43\
+\x01\xc5\xf8\x43\x02\xc5\xe0\x9e\xa9\x2c\x47\xa3\xf7\x53\xca\x71\
+\x6f\xbe\x9e\x87\xbf\x92\xe1\xaf\x39\x8a\x1d\xed\xf1\xe3\xb3\xee\
+\x75\xcc\x03\x00\x00\x00\x00\xd0\x5d\x42\x79\x00\x58\x08\x69\x67\
+\xf2\xbc\xa3\x49\xbe\x76\xce\x7a\x1a\x9d\xf6\x1e\x29\x8a\x1d\xef\
+\xd9\x1d\xd3\xa7\xa8\x42\xfc\x5a\xf8\x9d\x23\xbe\xfb\xbb\xbf\x7b\
+\x1c\xa6\xa7\x32\x8a\x22\x45\x59\x8e\xbb\xee\xcb\x54\x44\x51\x96\
+\x3b\x82\xfc\xb2\x18\xbe\xb6\x2c\x06\x1d\xef\xa9\xac\x57\xbe\x2b\
+\x34\x4f\xb5\x41\xf4\x31\x1c\xc1\x9f\x86\x9d\xef\xb5\x37\xe4\x71\
+\x63\xfc\xa0\xb6\xfa\xd8\xfc\xf1\x01\xf5\x62\x79\x00\x00\x00\x00\
+\x00\xba\xac\xb8\xff\x4b\x00\x80\xb6\xdd\xd3\x44\x3e\xce\xa4\x6b\
+\xfd\xf3\xa9\xf6\xba\x14\x39\xed\x31\xdc\xbd\xf6\xd8\xf0\x24\xf9\
+\xc1\x01\xf5\xd5\x45\x53\xed\x1a\x79\x78\xd5\x5d\xe7\xc5\xe7\x34\
+\x7a\xf3\xf8\xa8\xf7\x5a\x2e\x9e\xab\x44\xbd\x7a\x7d\x8e\xda\x3d\
+\x86\x6f\xd8\x79\xac\x7c\x44\xe4\xc8\xd5\xf8\xfd\x3c\x68\x88\x1f\
+\xf7\xc1\xc7\x68\x9c\xfe\xf8\x0a\x79\x70\xcd\xb4\xfb\xda\x00\x00\
+\x00\x00\x00\xd0\x2d\x42\x79\x00\xe8\xb0\xad\xad\xad\x41\x3c\x9d\
+\x23\x72\xae\x75\xc4\x0f\x83\xef\x6a\xb4\x7b\xa4\xdd\xc1\x74\xae\
+\x85\xdb\x63\x29\x8f\xfb\xea\x53\x95\xc7\x57\x2f\x4a\x3b\xfe\xb6\
+\xc7\x37\xe3\x6b\x8c\x3a\xd9\x47\x87\xcf\xef\x1a\xa5\x3f\x4a\xeb\
+\x07\x4f\xed\x75\xf2\xfb\x8e\xf0\x3f\xd7\x1e\xa9\x5e\x9f\xc6\x49\
+\x7f\x8e\x3d\xc2\xfe\xd1\xaf\x7d\x8f\x8b\x03\x00\x00\x00\x00\x40\
+\x47\x18\x5f\x0f\x00\x1d\x53\x05\xf1\x11\x11\x17\x36\x36\x9f\xb8\
+\x7a\xf9\xd2\xb3\x91\xf2\x28\xf7\xce\x11\x91\xf2\xae\x91\xed\xc3\
+\x60\x3b\xd5\xbe\x2d\xf6\xe8\x70\xdf\x11\x69\xe7\x62\xc7\xe8\xf7\
+\xbc\x57\x88\x3f\xba\x5a\xfd\xc2\xb5\xc7\x72\x1e\xf4\xb3\xe7\x9d\
+\xef\x49\xd5\x0d\x87\x2f\x4d\xb5\x0b\x57\xcf\xa5\x5a\x08\xbf\x3b\
+\xd4\x8f\xa2\xde\xc1\x3f\xac\xab\x18\x57\x14\xa3\xb7\xec\x1c\x5e\
+\x5f\xad\xdd\xf6\xf6\xb6\xa8\x1e\x00\x00\x00\x00\x80\x4e\x10\xca\
+\x03\x40\x47\xec\x0e\xe3\xef\xde\xb9\x33\xfe\xf7\xf4\x5e\x23\xda\
+\x73\xd5\x2d\x9f\xc6\x69\x7a\x2d\x1d\xcf\x39\x8f\x66\xe2\xa4\x61\
+\x93\xf9\x8e\xec\x3b\x0d\x5a\xda\xab\x7e\xfb\x94\x72\xd4\x1a\xdc\
+\x87\x61\x7b\xba\xa7\xcb\x3d\xef\xfe\x40\x40\xd4\xde\x34\xfc\x3a\
+\x8f\x66\xdb\x57\xc6\x9f\x08\xc8\x29\x45\x31\x6e\xa7\x1f\xbf\xbd\
+\x18\xb7\xea\xa7\x9c\x87\x1d\xf6\x79\xfc\xf4\x8e\x17\x8f\x0f\x9d\
+\xaf\xdf\xe6\xc2\xc6\xe6\x13\xf5\x82\x84\xf3\x00\x00\x00\x00\x00\
+\xb4\x4d\x28\x0f\x00\x2d\xab\xc2\xf8\x5a\xa0\x1c\x11\x11\x6b\xc7\
+\x8e\xdd\xbd\x79\xe3\xdb\xa7\x06\xdf\xed\x8c\xc6\xc7\xe7\xbc\xa7\
+\xc8\x91\xa3\xc8\x29\x52\x31\x1e\x68\x9f\x22\xed\x08\xab\x73\x8e\
+\x48\xc5\xee\xa0\x3c\x22\xd2\xb8\x63\x3d\xe7\x88\x28\xc6\xa7\xd4\
+\xe7\xc8\x83\xa0\x3e\xd7\x4e\xbb\x49\xd5\xff\x8c\x03\xf4\x9c\x53\
+\x14\x45\xfd\x05\x69\xf0\x19\x81\x5c\x7f\x4f\x2d\x83\xdf\x95\xc7\
+\x8f\xcf\xa7\xcf\xb5\xef\xd3\xf0\xb1\xda\x7d\x46\x11\x7d\x55\x73\
+\xda\xf7\x38\x79\xe1\x3c\x00\x00\x00\x00\x00\x5d\x21\x94\x07\x80\
+\x16\xec\xee\x8a\xdf\xef\x75\xa7\xd6\x1f\xb8\x39\xf8\xaa\x76\x9e\
+\x7a\xaa\xba\xe0\xeb\x41\xfd\x60\x84\x7c\x15\x8e\xe7\x61\x5b\xfc\
+\x8e\xb1\xf2\x39\xef\xc8\xf6\xab\xe0\x7c\x47\xdc\x9f\x53\xe4\x62\
+\x1c\xf8\x0f\xa6\xdc\xe7\x1d\xef\x49\xc5\x38\x1e\x8f\xea\xfb\x5a\
+\xe2\x9e\xab\x71\xf4\x55\x18\x9f\x07\x5d\xf9\x3b\x3a\xdd\x53\x51\
+\x3b\x23\x7e\x57\x6a\x9f\xaa\x2e\xfe\x5a\xae\x9f\xd3\x3d\x9f\x27\
+\x18\x5d\xab\x76\x89\xdb\x6f\xdf\x39\x76\xfc\xe4\xb1\x3b\xd5\xb3\
+\xc2\x79\x00\x00\x00\x00\x00\xda\x26\x94\x07\x80\x39\xda\xaf\x2b\
+\xfe\x7e\x72\x6d\x80\x7b\x1a\x8e\xa1\xcf\xe3\xde\xf2\x41\xb7\x7c\
+\x2d\x6e\x4e\xb5\x39\xf5\x79\x47\x12\x5f\xbf\xe6\x20\x07\x2f\x46\
+\xdd\xf5\xa3\xc1\xf3\x3b\xa4\x5a\x3b\x7a\x1e\xde\xb7\xd6\x3b\x3f\
+\xf8\x7e\xc7\x5c\xfc\xdd\x07\xd3\xa7\x1d\xf5\x54\x9d\xee\xd5\xf0\
+\xfd\x18\x76\xe4\xc7\x38\xd7\x1f\x8d\xe4\xaf\x2a\xcb\xc3\xca\x52\
+\x54\x61\xfd\xf0\xcc\xf9\xc1\x2f\x60\xe4\x9f\xfc\x0f\x3f\xfd\xb7\
+\x2e\x6c\x6c\xfe\xf4\xae\x5f\x82\x70\x1e\x00\x00\x00\x00\x80\xd6\
+\x08\xe5\x01\x60\x0e\x0e\x1b\xc6\x1f\x68\x47\x1b\x7c\xda\x19\xbe\
+\x47\x8e\x9c\x8b\x48\x45\x44\x95\x76\xe7\x7a\xea\x1d\xd5\xa0\xf9\
+\x3c\xba\x4c\x95\x6f\xef\x3c\x0a\xbe\xfe\x9e\xb4\x47\x77\x7d\xda\
+\x23\x84\x8f\x88\x5d\x0f\xd5\x6e\x3b\x3a\xb7\x3e\x17\xe3\xee\xf9\
+\xbc\x7b\x0e\xfd\x8e\x73\xeb\xf3\x68\x8c\x7d\xaa\x3e\x9b\x90\xaa\
+\x8f\x29\x0c\x2e\xfa\xd4\x53\x4f\x45\x44\xc4\x5f\xfc\xcc\x7f\xf3\
+\x0f\xae\x5e\xbe\xf4\x6c\xc4\xde\x6b\x2d\x9c\x07\x00\x00\x00\x00\
+\x60\xde\x84\xf2\x00\x30\x43\xd3\x0a\xe3\xcf\x9e\x3d\x1b\x11\x11\
+\xaf\xbe\xfa\xea\x30\x5c\x4f\xa3\x93\xdd\xab\x90\xbb\xea\x74\x1f\
+\x7c\x9b\xa2\x88\x1c\x55\x03\xfa\x60\xa2\x7c\x15\xc0\x0f\x43\xfa\
+\xe1\xf9\xf0\xf5\xdc\x3d\xa7\x5a\xc8\x3e\xba\xf0\xb8\x4b\x7f\xf0\
+\xe2\x71\x48\x5e\x3d\x96\x77\x04\xf3\xa9\x3e\x89\xbe\x3e\x83\x7e\
+\x78\xdf\xc1\xf5\xd2\x3d\x07\xc2\xe7\x5d\x59\xfe\xce\xee\xfa\x41\
+\x90\x5f\x8d\xba\x1f\xfc\x7a\x2e\xfd\xdd\xbf\x17\x11\x3b\xd7\xb7\
+\xfa\x5a\x38\x0f\x00\x00\x00\x00\x40\x17\x08\xe5\x01\x60\xca\x26\
+\x3d\x2f\x7e\x12\x57\x2f\x5f\x7a\xb6\x7e\x8d\xab\x97\x2f\x3d\xfb\
+\xf5\xd7\xbe\x1e\x39\xe5\xa8\xfa\xcc\x07\x3d\xe5\x83\x73\xdd\x47\
+\x1d\xe5\xd5\xa3\xe3\x0c\x3b\x72\x4e\xa3\x33\xe7\xab\x07\x07\x59\
+\xfa\xb0\x73\x3e\xed\x3e\xe3\x7d\x14\xed\x8f\x5e\x93\x73\x8e\x94\
+\xc6\xfd\xf4\xa9\x0a\xfe\xd3\x78\x04\x7e\xf5\x01\x81\xfa\x8d\xea\
+\xbd\xf9\x83\x16\xf7\x3c\x7c\xbc\xf6\x01\x80\xea\xdc\xf8\xd1\xff\
+\xd4\x43\xfa\x41\x2d\x69\x18\xfe\xff\xf4\x4f\x0f\x26\xd4\x1f\xb4\
+\xbe\xf5\x70\x7e\xbf\xd7\x09\xe7\x01\x00\x00\x00\x00\x98\x35\xa1\
+\x3c\x00\x4c\xc9\x34\x47\xd4\xef\xd7\xe5\x7d\x61\x63\xf3\x89\xea\
+\xb9\xca\x9b\x6f\xbc\x11\x55\xe0\x3d\x6a\x7a\xcf\xb5\xe3\xd6\xeb\
+\x93\xe0\x6b\xaa\xee\xf9\x2a\xb9\xcf\x39\x06\x67\xc3\x8f\x5a\xe7\
+\x07\x1d\xf0\xa9\x3a\xc3\x7d\x74\xa1\xe1\x0c\xfb\xea\xab\xda\x79\
+\xf0\xb9\xba\x66\xd4\xbe\x8f\x7a\xc4\x5e\x7d\x84\x20\x06\x67\xcd\
+\xd7\x6b\xae\x22\xf8\x5c\x75\xd3\xd7\x9f\x4b\xf1\x8f\xfe\xfb\x7f\
+\xb4\x63\x1d\xf6\x5b\xbb\xdd\xea\x6b\x26\x9c\x07\x00\x00\x00\x00\
+\x60\xde\x84\xf2\x00\x70\x44\xd3\x3e\x2f\xfe\xa0\xce\xee\xbd\xee\
+\xb3\x3b\xa4\xbf\x75\xeb\xf6\x20\xce\xae\x4f\x98\xdf\xe3\xa0\xf7\
+\x1c\x69\xd0\x29\x5f\x8c\xa3\xef\x9d\xf3\xe6\x87\x63\xe6\x63\xdc\
+\x17\x3f\x8a\xd1\xf3\xce\xce\xf8\xf1\x7d\x62\x18\xe2\xef\x34\xe8\
+\xeb\x2f\x76\x3d\x16\xc3\xf3\xe9\x07\x67\xd5\xa7\x61\x1d\x9f\xff\
+\xfc\xe7\x27\xfa\x75\x37\x31\xc9\x48\xfb\x5d\x8f\x0b\xe7\x01\x96\
+\xd4\x3f\xc9\x3f\xfc\xee\xf7\x46\xbc\xf9\x91\xf4\x8b\x77\xda\xae\
+\x05\x80\xa3\x7b\xf5\xcb\x5f\x7e\xf7\x7b\x23\xde\x4c\x1f\xf9\x88\
+\x7d\x1d\x60\x09\xbc\xfa\xea\xff\xf8\xee\xf7\xbe\x37\xde\x4c\xe9\
+\x47\xec\xeb\xc0\x52\xf1\x07\xcd\x00\x70\x08\xd3\x1c\x51\x5f\xb9\
+\x5f\x60\xdc\xf4\x3a\xfb\x79\xc7\x3b\xde\x11\x45\x51\x44\x51\x14\
+\x51\x16\x65\xa4\x32\x45\x59\x94\xa3\xc7\x8a\xa2\x88\xb2\xac\xbe\
+\x2f\xa3\x2c\x8b\x1d\xcf\x15\x65\x19\xe5\xe8\xeb\x62\xf8\x75\x39\
+\x7c\x5f\x11\x29\xdd\xfb\x9e\x72\xf8\xbe\xea\xfb\xe7\x9e\x7b\x6e\
+\xdf\xfa\xa6\xb5\x9e\x07\xb9\xdf\x07\x1f\xea\xaf\x8b\x10\xce\x43\
+\x13\x5b\x5b\x5b\xf9\x95\x57\x5e\x69\xbb\x8c\xce\x7b\xf8\xe1\x87\
+\xed\x2d\x00\x00\x00\x00\x2b\x42\xa7\x3c\x00\x34\x30\xed\xae\xf8\
+\xca\xa4\x21\xf1\x24\xee\x77\x9d\xfb\x85\xf6\xf3\x30\x8f\xe0\xfd\
+\x7e\xf7\x9f\xe4\x43\x10\x3a\xe7\x01\x00\x00\x00\x00\x38\x2a\xa1\
+\x3c\x00\x4c\x60\x96\x61\xfc\x2c\xae\x7b\x90\xb6\x03\xf1\xae\x98\
+\x74\xa4\xfd\xae\xe7\x84\xf3\x00\x00\x00\x00\x00\x34\x22\x94\x07\
+\x80\x03\xcc\x2a\x8c\x8f\x98\x6e\x77\x3c\x87\x57\x0f\xe7\xef\xf7\
+\xfb\x21\x9c\x07\x00\x00\x00\x00\xa0\x29\xa1\x3c\x00\xec\xa1\x7e\
+\x66\x7c\x44\xc4\x8d\x37\xdf\xcc\x0f\xac\x3f\x58\x14\x65\xe4\xfd\
+\xde\x33\xa9\xaa\x33\xfb\xfc\xdf\xde\xfc\xcb\xfd\x5e\xa4\x69\x5c\
+\x93\xe6\xea\x6b\xdf\xef\x45\x3a\xff\xb7\x37\xff\xf2\xa4\x93\x0b\
+\xfe\xb3\x1f\xfb\x5b\xff\xd5\xff\xfe\x73\xff\xf0\x7f\xaa\x7e\x4e\
+\x84\xf3\x00\x00\x00\x00\x00\xec\x47\x28\x0f\x00\x07\xa8\x85\xb3\
+\x29\xa2\x79\x78\xde\xef\x45\xea\xf7\x7b\xc5\xda\xb1\xb2\xd7\xc6\
+\xa8\x7a\xf6\x57\xff\x30\x44\xf5\xf5\xa4\x5d\xf3\xa7\xd6\x1f\xb8\
+\xb9\x7b\xfc\x3d\x00\x00\x00\x00\x00\xec\x45\x28\x0f\x00\x33\x54\
+\x94\x91\x8b\x72\x10\xc8\xff\xc5\xcf\xfc\xd4\xa7\xd6\x8e\x95\xbd\
+\xb6\x6b\xe2\xfe\x2e\x6c\x6c\x3e\xe1\x43\x14\x00\x00\x00\x00\x00\
+\x4c\x83\x50\x1e\x00\xf6\x51\x05\xb3\x47\x0d\x65\x8f\x7a\x0d\x23\
+\xee\xdb\xb1\xbb\x13\x7e\xbf\xdf\xc3\xe1\xe3\xd9\x08\x7b\x00\x00\
+\x00\x00\x00\xf6\x52\xb4\x5d\x00\x00\x74\x59\xbd\x63\xba\xa9\xab\
+\x97\x2f\x3d\x3b\x8d\x50\x5f\x20\xdf\xae\x0b\x1b\x9b\x4f\xdc\xef\
+\xe7\xe0\xc2\xc6\xe6\x13\xd5\xf9\xf2\x00\x00\x00\x00\x00\x50\xa7\
+\x53\x1e\x00\x66\x60\x1a\x61\x3c\xdd\x62\xa4\x3d\x00\x00\x00\x00\
+\x00\x87\x21\x94\x07\x80\xfb\x68\x32\xc6\x5e\x68\xbb\xdc\x0e\x1a\
+\x69\x6f\x8c\x3d\x00\x00\x00\x00\x00\x7b\x11\xca\x03\xc0\x94\xe8\
+\x8e\x5f\x1d\x93\x9e\x37\x0f\x00\x00\x00\x00\x00\xce\x94\x07\x80\
+\x09\x1c\x74\xa6\xf8\xb4\xce\x8e\x67\xf1\xec\x3e\x6f\xde\xd9\xf2\
+\x00\x00\x00\x00\x00\xec\x26\x94\x07\x80\x09\xed\x15\xcc\x57\x61\
+\xbc\x40\xbe\x7b\xfe\xe7\xbf\xfb\xe4\x3f\xbf\xf1\xe6\x9b\xf9\xed\
+\x6f\xbf\x7d\xe2\xee\x9d\x3b\x6b\x77\xef\xf4\xca\x7e\x2f\xd2\xe8\
+\xaf\x7e\xaf\xb8\x7b\xa7\x57\xbe\xfd\xed\xb7\x4f\xbc\x75\xe3\xfa\
+\x03\x37\x6f\x7c\xfb\xd4\x61\xef\x55\xfd\x6c\x5c\xbd\x7c\xe9\xd9\
+\xed\xed\xed\x24\x98\x07\x00\x00\x00\x00\xa0\x62\x7c\x3d\x00\x1c\
+\xc2\x7e\x63\xcb\x6f\xbf\x7d\xe7\x58\xf5\x75\x51\x16\xfd\xfd\xde\
+\x5f\x94\x91\x23\x97\xb9\x28\x43\x78\x3b\x23\x7f\xf9\xef\x3c\xfd\
+\x67\x87\x5f\xde\xda\xfb\x15\x65\x2e\x8a\x88\xb5\x63\x65\x2f\xe2\
+\x64\x44\x44\xf4\xfb\xbd\xa2\xdf\x8b\x7d\xce\x84\xef\xa7\x88\x88\
+\xdd\xcf\x1f\x3f\x79\xec\x4e\xc4\x8e\x9f\x05\xbf\xa7\x00\x00\x00\
+\x00\x00\x8c\x08\xe5\x01\xa0\x81\xdd\xdd\xf2\xfb\x8d\xb4\x87\xad\
+\xad\xad\xbc\xbd\xbd\xbd\x4f\xc0\x0f\x00\x00\x00\x00\xc0\xaa\x10\
+\xca\x03\xc0\x21\x18\x57\xcf\xfd\xf8\xc0\x06\x00\x00\x00\x00\x00\
+\x11\xce\x94\x07\x00\x00\x00\x00\x00\x00\x80\x99\x11\xca\x03\x00\
+\x00\x00\x00\x00\x00\xc0\x8c\x08\xe5\x01\x58\x66\xce\xf3\x06\x00\
+\x00\x00\x00\x00\x5a\xe5\x4c\x79\x00\x96\xd6\xd6\xd6\x56\xff\x28\
+\xef\xef\xf7\x22\x15\x65\xe4\x7e\xbf\x57\x14\x45\xd9\x8f\x88\xb8\
+\xfd\xf6\x9d\x63\x11\x11\xf5\xc7\x60\xb7\x9b\x37\xbe\x7d\x2a\x22\
+\x62\x6b\x6b\x2b\xd7\x1f\xdf\xde\xde\x2e\x22\x22\xef\xf9\x26\x00\
+\x00\x00\x00\x00\x96\x92\x50\x1e\x80\xa5\x77\x61\x63\xf3\x89\xa6\
+\xef\xb9\x7a\xf9\xd2\xb3\x45\x39\x08\x4f\xeb\xe1\xfb\xf1\x93\xc7\
+\xee\xec\x7e\x0c\x76\x3b\xb5\xfe\xc0\xcd\x88\x9d\x3f\x7b\x57\x2f\
+\x5f\x7a\x76\x6b\x6b\xab\xbf\xbd\xbd\x6d\x82\x03\x00\x00\x00\x00\
+\xc0\x0a\x31\xbe\x1e\x80\xa5\x76\x61\x63\xf3\x89\xab\x97\x2f\x3d\
+\xdb\x76\x1d\x70\x98\x0f\x87\x00\x00\x00\x00\x00\xb0\xf8\x84\xf2\
+\x00\x00\x73\x72\x61\x63\xf3\x89\xdd\x23\xed\x01\x00\x00\x00\x00\
+\x58\x6e\x42\x79\x00\x96\x9e\x6e\x79\x00\x00\x00\x00\x00\xa0\x2d\
+\x87\x3a\x53\x5e\x87\x17\x8b\xc0\x99\xbd\x40\x5d\x15\xcc\x4f\x3a\
+\x42\xbc\xe9\xeb\x61\x52\xc3\x9f\xa9\xec\xdf\x53\x00\x00\x00\x00\
+\x00\xab\xa1\x51\x28\x5f\x85\xf1\xe7\x37\x36\x2f\x3e\x77\xf9\xd2\
+\x95\xf3\x1b\x9b\x17\x67\x53\x16\x1c\xce\x4b\x57\xbf\x70\xe5\xc3\
+\x17\x7e\xb0\xfa\xb9\x14\x78\x00\xd0\x49\x82\x79\x00\x00\x00\x00\
+\x80\xd5\x31\xd1\xf8\xfa\xad\xad\xad\xbc\xb5\xb5\x95\xcf\x6f\x6c\
+\x5e\xac\x82\xf8\x2a\x98\x9f\x6d\x79\x30\x99\x97\xae\x7e\xe1\xca\
+\xae\x40\x3e\xce\x6f\x6c\x5e\x34\xd5\x01\xa8\x6b\x3a\xc6\xde\xd8\
+\x7b\x00\x00\x00\x00\x00\xe0\xa8\xee\xdb\x29\x5f\x85\xf1\x7b\x3d\
+\x57\x0f\xe6\x75\xcd\xd3\x86\x97\xae\x7e\xe1\x4a\x44\x44\x3d\x8c\
+\xaf\x1b\xfe\x5c\xe6\x08\xe3\xec\x81\x01\x63\xec\xe9\x0a\xdd\xf2\
+\x00\x00\x00\x00\x00\xab\x61\xdf\x50\xbe\x3e\xaa\xfe\xa0\x0b\x54\
+\xcf\x1b\x67\xcf\xbc\xed\xee\x8c\xdf\x4f\xed\xe7\x52\xf0\x01\x1c\
+\x8a\x60\x1e\x00\x00\x00\x00\x00\x38\xac\x3d\xc7\xd7\xef\x1e\x55\
+\x3f\x09\xe3\xec\x99\x97\xbd\x46\xd5\x4f\xc2\x38\x7b\xa0\x62\x2c\
+\x3d\x5d\x71\x61\x63\xf3\x09\xff\x6e\x02\x00\x00\x00\x00\x58\x6e\
+\x3b\x42\xf9\xfa\xd9\xf1\x87\xb9\x98\x60\x9e\x59\xab\xc2\xf8\xa6\
+\x81\x7c\x45\x30\x0f\x1c\x96\x20\x9f\x59\x11\xcc\x03\x00\x00\x00\
+\x00\x2c\xb7\xb5\x88\xc9\x47\xd5\x4f\xa2\x0a\xe6\x8d\xb2\x67\x9a\
+\xee\x77\x76\x7c\x13\xd5\x39\xf3\x46\xd9\xc3\x6a\x3b\xcc\x48\x7a\
+\xc1\x3c\x00\x00\x00\x00\x00\xd0\xd4\xda\x51\x3a\xe3\xf7\xf3\x9f\
+\xff\xd7\x9f\xf9\x2b\xff\xeb\x7f\xf7\x77\xaf\x14\x45\x11\x67\xcf\
+\x9e\x9d\xe6\xa5\x59\x51\xd3\x08\xe3\xeb\xaa\x60\x3e\x22\x42\x38\
+\x0f\xab\xcb\x59\xf1\x74\xc5\xf0\x67\xd0\x07\xc6\x00\x00\x00\x00\
+\x00\x96\xd0\xda\x4c\x2e\xfa\x8e\x77\xdc\xfa\x2f\x7e\xf2\xef\x5c\
+\x8c\x88\xd0\x35\xcf\x51\x55\x5d\xf2\xd3\x56\xfb\xb9\x14\x82\x00\
+\x13\xab\x82\x7c\x1d\xf3\x00\x00\x00\x00\x00\xc0\x24\x66\x12\xca\
+\xd7\x19\x67\x4f\xd7\x19\x67\x0f\xab\xed\xb0\x63\xec\x67\x59\x13\
+\xab\x49\xb7\x3c\x00\x00\x00\x00\xc0\x72\x2a\xe6\x71\x93\x2a\x98\
+\x9f\xc7\xbd\xe0\x30\xce\x6f\x6c\x5e\xdc\xda\xda\xca\x6d\xd7\x01\
+\xb4\xc3\x59\xf1\x74\xc5\x85\x8d\xcd\x27\xfc\xfb\x08\x00\x00\x00\
+\x00\x60\xb9\xcc\x25\x94\x8f\x10\xcc\xd3\x7d\x82\x79\x00\x00\x00\
+\x00\x00\x00\x60\xda\xe6\x16\xca\x47\x8c\x83\x79\xe1\x3c\x5d\x55\
+\x05\xf3\xc2\x79\x58\x3d\xba\xe5\xe9\x0a\xdd\xf2\x00\x00\x00\x00\
+\x00\xcb\x65\xe6\x67\xca\xef\x56\x9d\x2d\xef\x9c\x79\xba\xaa\xf6\
+\x73\xe9\x5c\x5f\x58\x41\x82\x79\xba\x62\x6b\x6b\xcb\xbf\x87\x58\
+\x58\x0f\x3f\xfc\x70\xdb\x25\x00\x00\x00\x00\x40\x67\xcc\x3d\x94\
+\xaf\x54\x5d\xf3\x82\x79\xba\x6a\xf8\xb3\x29\x10\x81\x15\x52\x75\
+\xcb\x5f\xd8\xd8\x7c\xa2\xed\x5a\xc0\x07\x44\x58\x64\xaf\xbc\xf2\
+\x4a\xdb\x25\x74\x9e\x0f\x2e\x00\x00\x00\x00\xac\x8e\xc6\xe3\xeb\
+\x5f\xba\xfa\x85\xa9\x8d\x9e\x77\xce\x3c\x5d\xe7\x9c\x79\x00\x80\
+\xc9\x6d\x6d\x6d\x65\x81\xfc\x64\x5e\x79\xe5\x95\xf0\xdf\x99\x00\
+\x00\x00\x00\xab\xe1\x50\x67\xca\x0b\xe6\x59\x25\x82\x79\x00\x00\
+\x00\x00\x00\x00\xe0\xb0\x0e\x3d\xbe\xfe\xa5\xab\x5f\xb8\xf2\xe1\
+\x0b\x3f\x38\x95\xd1\xf3\xf5\x60\xde\x38\x7b\xba\xa8\x1a\x65\x1f\
+\x11\x61\x9c\x3d\x00\xc0\xbd\x74\xc9\x37\x57\x75\xcb\xfb\xef\x4b\
+\x56\xc9\xe7\xbe\xf8\x91\xb9\x7f\xe0\xf9\xd3\x1f\xfb\xf2\x3d\xff\
+\x8c\xcd\xb3\x8e\xbd\xee\xdf\x54\xdb\xeb\xd6\xf6\xfd\x81\xee\xfa\
+\xe2\xe7\x3e\x37\xf7\xfd\xe1\x63\x9f\xfe\xf4\x3d\xfb\xc3\x3c\xeb\
+\xd8\xeb\xfe\x4d\xb5\xbd\x6e\x6d\xdf\x1f\xe8\xae\x2f\xfe\xe6\xdf\
+\x98\xff\xfe\xf0\xf1\x5f\xb8\x77\x5f\x9f\x63\x1d\x7b\xdd\xbf\xa9\
+\xb6\xd7\xad\xed\xfb\x33\x99\x23\x9d\x29\x3f\xed\x60\x3e\x22\xc2\
+\x39\xf3\x74\x55\xed\xe7\xd2\x1f\x9c\x02\x00\x00\x1c\x52\x2a\xf2\
+\x7b\xcf\x9e\xfb\xc8\x9f\x99\xc7\xbd\xbe\xf6\xc2\xf3\xfb\x4e\xe6\
+\x7b\xe4\xb1\xc7\x67\xfe\x67\x0f\x07\xdd\xbf\xa9\xb6\xd7\x6d\x5e\
+\xf7\xff\xe6\x57\xbf\x76\xe5\xad\x37\x5e\x9f\xf5\x6d\x80\x29\x2a\
+\x52\x7a\xef\x23\x1f\x7e\x6c\x2e\xfb\xd3\xcb\x2f\xee\xbf\xaf\x3e\
+\x7a\x6e\xf6\xfb\xfa\x41\xf7\x6f\xaa\xed\x75\x9b\xd7\xfd\x5f\xbb\
+\x66\x5f\x87\x45\x53\xf4\x7a\xef\x7d\xe4\xa3\xdf\x37\x9f\xfd\xe9\
+\x85\x2f\xed\xbf\xaf\x3f\xf6\xd1\xd9\xef\xeb\x07\xdc\xbf\xa9\xb6\
+\xd7\x6d\x5e\xf7\x7f\xed\xab\x2f\xdb\xd7\x0f\xe9\x50\xe3\xeb\xeb\
+\x5e\xba\xfa\x85\x2b\xc6\xd9\xb3\x4a\x8c\xb3\x07\x00\x60\x5a\x9c\
+\x2d\xcf\x2a\x9a\x57\xb0\xbc\x6c\xda\x5e\xb7\xb6\xef\x0f\x74\xd7\
+\xbc\x82\xe5\x65\xd3\xf6\xba\xb5\x7d\x7f\xa0\xbb\xe6\x15\x2c\x2f\
+\x9b\xb6\xd7\xad\xed\xfb\x73\x7f\x47\x0e\xe5\x2b\x82\x79\x56\x89\
+\x60\x1e\x00\x60\xcc\xe8\x7a\x00\x00\x00\x00\xd8\xdf\xd4\x42\xf9\
+\x08\xc1\x3c\xab\x45\x30\x0f\x00\xc0\x34\xe8\x96\x07\x00\x00\x00\
+\x58\x6e\x47\x3a\x53\x7e\x2f\xd3\x3e\x67\xbe\x0a\xe6\x9d\x33\x4f\
+\x17\x0d\x7f\x2e\x73\x44\x84\x73\xe6\x01\x80\x55\xa4\x4b\x1e\x00\
+\x00\x00\x00\x0e\x36\xf5\x50\x3e\x62\xfa\xc1\x7c\x44\xc4\x73\x97\
+\x2f\x5d\x11\xcc\xd3\x45\xb5\x9f\xcb\x2c\x98\x07\x00\x00\x00\x00\
+\x00\x00\xea\xa6\x3a\xbe\xbe\xee\xa5\xab\x5f\xb8\x62\x9c\x3d\xab\
+\xc4\x38\x7b\x00\x60\xd5\xe8\x92\x9f\x1e\x23\xec\x01\x00\x00\x00\
+\x96\xd7\x4c\x3a\xe5\xeb\x66\x31\xce\x5e\xc7\x3c\x5d\x55\x8d\xb3\
+\xd7\x31\x0f\x00\x00\x70\x78\x5f\x7b\xe1\xf9\x7d\x3f\x94\xff\xc8\
+\x63\x8f\xcf\xed\xcf\x04\xba\x52\x47\x13\x6d\xd6\xbc\x88\xeb\x05\
+\xcc\xc7\xcb\x2f\xee\xbf\x3f\x3c\x7a\x6e\x7e\xfb\x43\x57\xea\x68\
+\xa2\xcd\x9a\x17\x71\xbd\x80\xf9\x78\xf9\x85\x2f\xed\xbf\x3f\x3c\
+\xf6\xd1\xf9\xed\xeb\x1d\xa9\xa3\x89\x36\x6b\x5e\xc4\xf5\x5a\x26\
+\x33\x0f\xe5\x23\x04\xf3\xac\x16\xc1\x3c\x00\x00\x87\x51\x75\xcb\
+\xfb\xef\x48\x56\xd9\x41\xa1\xee\xee\xd7\xcc\x32\xe4\xed\x4a\x1d\
+\x4d\xb4\x59\xf3\x22\xae\x17\x30\x1f\x07\x85\xba\xbb\x5f\x33\xcb\
+\x90\xb7\x2b\x75\x34\xd1\x66\xcd\x8b\xb8\x5e\xc0\x7c\x1c\x14\xea\
+\xee\x7e\xcd\x2c\x43\xde\xae\xd4\xd1\x44\x9b\x35\x2f\xe2\x7a\x2d\
+\xa3\x99\x8d\xaf\xdf\x6d\x16\xa3\xec\x8d\xb3\xa7\xab\xaa\x51\xf6\
+\x46\x90\x02\x00\xcb\xca\xe8\x7a\x60\xda\x26\x09\x76\x8f\xf2\xfa\
+\x45\xab\x63\x96\x35\x4c\xb3\xe6\x45\x5c\x2f\x60\x3e\x26\x09\x76\
+\x8f\xf2\xfa\x45\xab\x63\x96\x35\x4c\xb3\xe6\x45\x5c\x2f\x60\x3e\
+\x26\x09\x76\x8f\xf2\xfa\x45\xab\x63\x96\x35\x4c\xb3\xe6\x45\x5c\
+\xaf\x65\x35\x97\x4e\xf9\xca\xb4\x3b\xe6\x23\x22\x74\xcd\xd3\x55\
+\xb5\x9f\x4b\xdd\x4e\x00\x00\x4c\x44\xb7\x3c\xab\xaa\x1e\xd4\xde\
+\xbe\x7d\x3b\xbe\xf9\xcd\x6f\xee\x78\x3e\xa5\x14\x65\x59\xc6\x89\
+\x13\x27\xe2\x9d\xef\x7c\x67\x94\x65\x39\x7a\xdf\x34\x3b\xaf\xbb\
+\x52\x47\x13\x6d\xd6\xbc\x88\xeb\x05\xcc\x47\x3d\xa8\x6d\xb2\x3f\
+\xbc\xfc\xe2\xf3\x57\xa6\xd9\x79\xdd\x95\x3a\x9a\x68\xb3\xe6\x45\
+\x5c\x2f\x60\x3e\xea\x41\x6d\xa3\xfd\xe1\x85\x2f\x5d\x99\x66\xe7\
+\x75\x57\xea\x68\xa2\xcd\x9a\x17\x71\xbd\x96\xd9\xdc\x3a\xe5\x2b\
+\x2f\x5d\xfd\xc2\x95\x59\x74\xcd\x4f\xeb\x7a\x30\x6d\x55\xd7\x7c\
+\xdb\x75\x00\x00\x4c\x8b\x2e\x79\x60\x9a\x26\xe9\x9c\xce\x39\xc7\
+\xdd\xbb\x77\xe3\xad\xb7\xde\x8a\x6f\x7c\xe3\x1b\xd1\xeb\xf5\x1a\
+\xbd\x7f\x91\xea\x68\xa2\xcd\x9a\x17\x71\xbd\x80\xf9\x98\xa4\x73\
+\xfa\xa0\xfd\x61\x5a\x9d\xd7\x5d\xa9\xa3\x89\x36\x6b\x5e\xc4\xf5\
+\x02\xe6\x63\x92\xce\xe9\x03\xf7\x87\x29\x75\x5e\x77\xa5\x8e\x26\
+\xda\xac\x79\x11\xd7\x6b\xd9\xcd\xb5\x53\xbe\x6e\x9a\x5d\xf3\x11\
+\x83\x8e\xf9\x69\x5d\x8b\xee\x79\x79\x09\x7e\x7f\x75\x3c\x01\x00\
+\x00\x4c\xee\xf4\xe9\xd3\xf1\xe0\x83\x0f\x8e\xbe\xbf\x73\xe7\x4e\
+\xbc\xf1\xc6\x1b\x71\xeb\xd6\xad\xb8\x79\xf3\x66\xac\xaf\xaf\xaf\
+\x54\x1d\x4d\xb4\x59\xf3\x22\xae\x17\x30\x1f\x5d\xd9\x1f\xba\x52\
+\x47\x13\xf6\x75\xa0\x8b\xba\xb2\x3f\x74\xa5\x8e\x26\xec\xeb\xab\
+\xa9\xb5\x50\x3e\x62\x7a\xc1\x7c\xd5\x2d\x3f\x8b\x31\xf6\xe9\x77\
+\x7f\x7b\x14\x06\xe7\x3f\xf1\x3d\x46\x35\xb4\xe0\xff\xf8\xa5\x9f\
+\xbb\xf2\x1f\xff\xf5\x1f\x5b\x96\xb5\x17\xcc\x03\x00\x70\x20\x23\
+\xec\x59\x25\x4d\xba\xa5\x8f\x1d\x3b\x16\xa7\x4f\x9f\x8e\x5b\xb7\
+\x6e\x45\xce\x3b\x87\x91\x1d\x75\x1c\x7a\x57\xea\x68\xa2\xcd\x9a\
+\x17\x71\xbd\x80\xf9\x68\xd2\x2d\x7d\xd0\xfe\x70\xd4\x71\xe8\x5d\
+\xa9\xa3\x89\x36\x6b\x5e\xc4\xf5\x02\xe6\xa3\x49\xb7\xf4\x81\xfb\
+\xc3\x11\xc7\xa1\x77\xa5\x8e\x26\xda\xac\x79\x11\xd7\x6b\x15\xcc\
+\x7d\x7c\xfd\x6e\xd3\x1c\x65\x3f\x6b\xf5\x80\x9e\xa3\x4b\xbf\xfb\
+\xdb\x57\xaa\xbf\x0e\x7a\xdd\xbb\xde\xf5\xae\x79\x95\x04\x00\xc0\
+\x7d\x18\x5d\x0f\xb4\xa1\x1a\xab\x78\xe3\xc6\x8d\x88\x88\x38\x71\
+\xe2\xc4\x4a\xd7\xd1\x44\x9b\x35\x2f\xe2\x7a\x01\xf3\xd1\x95\xfd\
+\xa1\x2b\x75\x34\x61\x5f\x07\xba\xa8\x2b\xfb\x43\x57\xea\x68\xc2\
+\xbe\xbe\x3a\x5a\xed\x94\xaf\x4c\xa3\x63\x7e\x96\xdd\xf2\x75\xe9\
+\x77\x7f\xfb\x8a\x8e\xf9\xe9\x5b\x95\x75\x1d\xfe\x7c\xea\x7a\x02\
+\x00\xe0\x40\xba\xe5\x21\xe2\xfa\xf5\xeb\x71\xfd\xfa\xf5\x1d\x8f\
+\xad\xad\xad\xc5\x99\x33\x67\xe2\xf8\xf1\xe3\x2b\x57\x47\x13\x6d\
+\xd6\xbc\x88\xeb\x05\xcc\x47\x57\xf6\x87\xae\xd4\xd1\x84\x7d\x1d\
+\xe8\xa2\xae\xec\x0f\x5d\xa9\xa3\x09\xfb\xfa\x6a\x6a\xbd\x53\xbe\
+\xf2\xd2\xd5\x2f\x5c\xe9\x62\xd7\xfc\x5e\x41\xb1\x8e\xf9\xd9\xb0\
+\xae\x00\x00\xdd\xa6\x4b\x1e\x68\x5b\xaf\xd7\xdb\x73\xac\xe2\xaa\
+\xd6\xd1\x44\x9b\x35\x2f\xe2\x7a\x01\xf3\xd1\x95\xfd\xa1\x2b\x75\
+\x34\x61\x5f\x07\xba\xa8\x2b\xfb\x43\x57\xea\x68\xc2\xbe\xbe\xfc\
+\x3a\xd1\x29\x5f\x77\x94\xae\xf9\x59\x75\xcb\xe7\x3f\xf1\x3d\x17\
+\x77\x07\xc6\xab\xd2\xd9\x3d\x4b\xab\xba\xae\xba\xe5\x01\x00\x98\
+\x84\x6e\x79\x56\xdd\xe9\xd3\xa7\xe3\xc1\x07\x1f\x1c\x7d\xdf\xeb\
+\xf5\xe2\xfa\xf5\xeb\x71\xe3\xc6\x8d\x48\x29\xc5\x43\x0f\x3d\xb4\
+\x52\x75\x34\xd1\x66\xcd\x8b\xb8\x5e\xc0\x7c\x74\x65\x7f\xe8\x4a\
+\x1d\x4d\xd8\xd7\x81\x2e\xea\xca\xfe\xd0\x95\x3a\x9a\xb0\xaf\xaf\
+\xa6\xce\x74\xca\xd7\x1d\xa5\x63\xbe\x0a\xe6\xa7\x59\x4f\x84\x8e\
+\xf9\x59\xb1\xae\x00\x00\x8b\x41\x97\x3c\xd0\xb6\xb2\x2c\xe3\xa1\
+\x87\x1e\x8a\xb2\x2c\xe3\xad\xb7\xde\x5a\xf9\x3a\x9a\x68\xb3\xe6\
+\x45\x5c\x2f\x60\x3e\xba\xb2\x3f\x74\xa5\x8e\x26\xec\xeb\x40\x17\
+\x75\x65\x7f\xe8\x4a\x1d\x4d\xd8\xd7\x57\x43\x27\x43\xf9\x88\xa3\
+\x05\xf3\xb3\x22\x40\x9e\x8d\x55\x5c\xd7\xf3\x1b\x9b\x17\xb7\xb6\
+\xb6\xcc\x01\x01\x00\xe0\x40\x55\xb7\x7c\xdb\x75\x40\xd7\xe4\x9c\
+\x3b\x31\x5a\xb1\x2b\x75\x34\xd1\x66\xcd\x8b\xb8\x5e\xc0\x7c\x74\
+\x65\x7f\xe8\x4a\x1d\x4d\xd8\xd7\x81\x2e\xea\xca\xfe\xd0\x95\x3a\
+\x9a\xb0\xaf\x2f\xaf\xce\x86\xf2\x11\x87\x0f\xe6\x67\xd5\x2d\x1f\
+\xb1\x9a\x01\xf2\x3c\x58\x57\x00\x00\x80\xd5\xf3\xc8\x63\x8f\x4f\
+\x7c\x7c\x59\xaf\xd7\x8b\x37\xde\x78\x23\x7a\xbd\x5e\x94\x65\x19\
+\x29\x8d\x4f\x76\x68\x72\x9d\x2e\xd7\xd1\x44\x9b\x35\x2f\xe2\x7a\
+\x01\xf3\xf1\xe8\xb9\xe9\xec\x0f\x4d\xae\xd3\xe5\x3a\x9a\x68\xb3\
+\xe6\x45\x5c\x2f\x60\x3e\x1e\x7d\xec\xa3\xd3\xd9\x1f\x1a\x5c\xa7\
+\xcb\x75\x34\xd1\x66\xcd\x8b\xb8\x5e\xab\xa0\x73\x67\xca\xef\x56\
+\x05\xf3\x87\x3d\x67\x7e\x16\x56\xf5\x2c\xf4\x59\xdb\x6f\x5d\xdb\
+\xaa\x67\xd6\x9c\x2d\x0f\x00\x2c\x0a\xa3\xeb\x81\x36\x5c\xbf\x7e\
+\x3d\xae\x5f\xbf\xbe\xe7\x73\xf5\x33\x10\x57\xa5\x8e\x26\xda\xac\
+\x79\x11\xd7\x0b\x98\x8f\xae\xec\x0f\x5d\xa9\xa3\x09\xfb\x3a\xd0\
+\x45\x5d\xd9\x1f\xba\x52\x47\x13\xf6\xf5\xd5\xd4\xe9\x4e\xf9\xba\
+\xa6\x5d\xf3\xb3\xec\x96\x8f\xd0\xd9\x3d\x2b\x7b\xad\xeb\xb9\x73\
+\xe7\xda\x28\x05\x00\x00\x3a\xc1\x08\x7b\x96\xdd\xa4\xdd\xd2\x45\
+\x51\xc4\xc9\x93\x27\xe3\xdd\xef\x7e\x77\x3c\xf0\xc0\x03\x8d\xdf\
+\xbf\x28\x75\x34\xd1\x66\xcd\x8b\xb8\x5e\xc0\x7c\x4c\xda\x2d\xbd\
+\xdf\xfe\x30\xad\x6e\xeb\xae\xd4\xd1\x44\x9b\x35\x2f\xe2\x7a\x01\
+\xf3\x31\x69\xb7\xf4\xbe\xfb\xc3\x94\xba\xad\xbb\x52\x47\x13\x6d\
+\xd6\xbc\x88\xeb\xb5\xec\x3a\xdf\x29\x5f\xf7\xd2\xd5\x2f\x5c\xe9\
+\x7a\xc7\x3c\x47\xb7\x4a\x93\x08\x74\xcb\x03\x00\x5d\xa7\x4b\x1e\
+\x98\x87\x47\x1e\x7b\xfc\xe2\xd7\x5e\x78\xfe\x4a\x44\xc4\xf1\xe3\
+\xc7\xe3\xfd\xef\x7f\xff\xc4\xef\x5b\xc6\x3a\x9a\x68\xb3\xe6\x45\
+\x5c\x2f\x60\x3e\x1e\x3d\xf7\xf8\xc5\x97\x5f\x6c\xbe\x3f\x4c\x3b\
+\xd8\xed\x4a\x1d\x4d\xb4\x59\xf3\x22\xae\x17\x30\x1f\x8f\x3e\xf6\
+\xd1\x8b\x2f\xbf\xf0\xa5\xe6\xfb\xc3\x94\x83\xdd\xae\xd4\xd1\x44\
+\x9b\x35\x2f\xe2\x7a\x2d\xb3\x85\xe9\x94\xaf\x34\xe9\x98\x9f\x75\
+\xb7\x7c\xc4\xde\x9d\xdd\x1c\x9d\x75\x05\x00\x80\x31\xdd\xf2\xac\
+\x82\xa6\x41\xed\xac\x82\xdd\xae\xd4\x31\xcb\x1a\xa6\x59\xf3\x22\
+\xae\x17\x30\x1f\x4d\x83\xda\x59\x05\xbb\x5d\xa9\x63\x96\x35\x4c\
+\xb3\xe6\x45\x5c\x2f\x60\x3e\x9a\x06\xb5\xb3\x0a\x76\xbb\x52\xc7\
+\x2c\x6b\x98\x66\xcd\x8b\xb8\x5e\xcb\x6a\xa1\x3a\xe5\x0f\xa3\x0a\
+\xe6\x87\x1d\xc9\x2c\x90\x55\x99\x44\xa0\x5b\x1e\x00\x00\x60\xa0\
+\x0a\x6c\xab\xee\xeb\x83\x5e\xb3\x0a\x75\x34\xd1\x66\xcd\x8b\xb8\
+\x5e\xc0\x7c\x54\x81\x6d\xd5\x7d\x7d\xd0\x6b\x56\xa1\x8e\x26\xda\
+\xac\x79\x11\xd7\x0b\x98\x8f\x2a\xb0\xad\xba\xaf\x0f\x7a\xcd\x2a\
+\xd4\xd1\x44\x9b\x35\x2f\xe2\x7a\x2d\xa3\xa5\x0f\xe5\x01\x00\x80\
+\xc3\x31\xba\xbe\x5b\xaa\x6e\x79\x1f\xe6\x64\x15\x74\x25\xc0\xed\
+\x4a\x1d\x4d\xb4\x3d\x4a\xbf\xad\x7b\x03\xdd\xd6\x95\x00\xb7\x2b\
+\x75\x34\xd1\xf6\x28\xfd\xb6\xee\x0d\x74\x5b\x57\x02\xdc\xae\xd4\
+\xd1\x44\xdb\xa3\xf4\xdb\xba\x37\x87\x18\x5f\xdf\xa5\x33\xdd\x27\
+\x75\x94\x31\xf6\xe9\x77\x7f\xfb\x4a\xf5\xd7\xb4\xeb\x82\xca\xf9\
+\x8d\xcd\x8b\xc6\x91\x02\x00\x00\x00\x00\x00\xc0\xf2\x39\xd4\x99\
+\xf2\x8b\x18\xcc\x4f\x83\x60\x7e\xba\x7c\xe0\x01\x00\xa0\xbb\x74\
+\xc9\x03\x00\x00\x00\xc0\x74\x1c\x7a\x7c\xfd\x87\x2f\xfc\xe0\xc5\
+\x97\xae\x7e\x61\x61\xc2\xd4\xa3\x74\xcb\xef\xf4\x6b\xf7\xb9\xc6\
+\xfd\x9e\x67\x6f\xfb\xaf\x5b\x51\x14\xd1\xef\xf7\x0f\x7c\xcd\xb2\
+\x30\x8e\x14\x00\x80\x83\x18\x61\xcf\x32\x38\xe8\xdc\xf1\x79\xea\
+\x4a\x1d\x93\x6a\xbb\xde\xb6\xef\x0f\x74\xd7\x41\xe7\x8e\xcf\x53\
+\x57\xea\x98\x54\xdb\xf5\xb6\x7d\x7f\xa0\xbb\x0e\x3a\x77\x7c\x9e\
+\xba\x52\xc7\xa4\xda\xae\xb7\xed\xfb\x73\x7f\x47\x3a\x53\xbe\xea\
+\x98\x5f\xa4\x70\xfe\xc7\x7e\xea\xc9\x67\x9a\xbe\xe7\xb5\xdf\xf9\
+\xca\x67\x77\x3f\xf6\x9e\x0f\x7e\xe8\x99\xbd\x9e\xaf\x3f\xce\xc1\
+\xee\xb7\xae\xbb\x5f\xb3\x0a\x6b\xfb\x73\x7f\xff\xe9\x7b\xd6\x04\
+\x00\x60\xde\x74\xc9\x03\xb3\xf2\xe9\x8f\x7d\x79\xbe\x1f\x28\xc9\
+\xb1\xe7\xfd\xe6\x5e\xc7\x11\xb5\xbd\x6e\x6d\xdf\x1f\xe8\xae\x8f\
+\x7d\xfa\xd3\x73\xfd\xe7\x35\xc7\xde\xfb\xc3\xbc\xeb\x38\xaa\xb6\
+\xd7\xad\xed\xfb\x03\xdd\xf5\xb1\x8f\xff\xc2\x7c\xf7\x87\x7d\xfe\
+\xbb\x6f\xde\x75\x1c\x55\xdb\xeb\xd6\xf6\xfd\x99\xcc\xa1\xc6\xd7\
+\xef\xb6\xec\xe3\xec\xf7\x0a\x83\xf7\x0a\x94\x69\xc6\xba\x02\x00\
+\x40\x73\x55\xb7\x7c\xdb\x75\xc0\x42\x48\xe1\x9f\x95\xc3\x68\x7b\
+\xdd\xda\xbe\x3f\xd0\x59\x29\xec\x0f\x87\xd1\xf6\xba\xb5\x7d\x7f\
+\xa0\xbb\x92\xff\xee\x3b\x94\xb6\xd7\xad\xed\xfb\x2f\xaa\x23\x75\
+\xca\xd7\x2d\xda\x38\xfb\xa6\xde\xf3\xc1\x0f\x3d\xb3\x3b\x30\x7e\
+\xed\x77\xbe\xf2\xd9\xc3\x74\x6f\xaf\x5a\xf7\xf7\x41\xa6\xb9\xae\
+\x00\x00\x00\x74\xdb\xe7\xbe\xf8\x91\xb9\xff\xe1\xcd\x5e\x5d\xde\
+\x9f\xfb\xd2\x47\x9e\x8f\x1c\x8f\xb5\x75\xff\xa6\xda\x5e\xb7\xb6\
+\xef\x0f\x74\xd7\x17\x3f\xf7\xb9\xb9\xef\x0f\x7b\x75\x79\x7f\xe9\
+\x73\x9f\x7b\x3e\xc7\x7c\xf6\xf5\x69\x74\x99\xb7\xbd\x6e\x6d\xdf\
+\x1f\xe8\xae\x2f\xfe\xe6\xdf\x98\xff\xfe\xb0\x47\x97\xf7\x97\xfe\
+\xe9\x8f\x3e\x9f\x73\x9e\xcf\xbe\x3e\x85\x2e\xf3\xb6\xd7\xad\xed\
+\xfb\x33\x99\xb5\xe1\x59\x84\xf9\xfc\xc6\xe6\x91\xbb\xdd\xbb\x1e\
+\xcc\x1f\x3f\x7e\x3c\xfe\xd9\xff\xf6\xdc\x5f\xbf\xf5\xf6\xcd\x77\
+\x1f\xf6\x1a\xe7\xce\x9d\xdb\xf1\xfd\xee\x40\xf9\x37\x1b\x43\xcd\
+\xa3\x00\x00\x20\x00\x49\x44\x41\x54\x7e\xf5\x57\xee\xdb\xe9\x5d\
+\xbf\xc6\x6b\xbf\xf3\x95\xcf\xbe\xf8\xe2\x8b\x87\x2d\x67\x69\xec\
+\xb5\xae\x2f\xbe\xf8\xe2\x3d\x8f\xdf\x8f\x0f\x3c\x00\x00\x1c\x8d\
+\xd1\xf5\x8b\xc1\xd9\xf2\x2c\xb2\x47\x1e\x7b\x7c\x6e\xd3\xf6\xf6\
+\x3d\x07\x3d\xc7\x63\xf3\xa8\x63\x9a\xe7\xb0\xb7\xbd\x6e\xf3\xba\
+\xff\x37\xbf\xfa\xb5\x2b\x6f\xbd\xf1\xfa\x3c\x6e\x05\x4c\xc9\xa3\
+\xe7\xe6\xb7\x3f\xed\x77\x0e\x7a\x8e\x78\x6c\x1e\x75\x4c\xf3\x1c\
+\xf6\xb6\xd7\x6d\x5e\xf7\x7f\xed\x9a\x7d\x1d\x16\xcd\xa3\x8f\x7d\
+\x74\x7e\xfb\xd3\x3e\xe7\xa0\xe7\x9c\x1f\x9b\x47\x1d\xd3\x3c\x87\
+\xbd\xed\x75\x9b\xd7\xfd\x5f\xfb\xea\xcb\xf6\xf5\x43\x9a\x5a\xa7\
+\x7c\xa5\xcb\xc1\xfc\xed\xdb\xb7\xe3\x3f\xf9\x0b\xe7\x7f\xe9\xa8\
+\xd7\x39\x68\xc4\xfa\x27\x3e\xf9\xa9\xfb\x06\xc1\xbb\xdf\x7f\xee\
+\xdc\x39\x01\x72\xec\xbd\x2e\x47\xbd\x9e\x75\x05\xae\x5e\xbe\xf4\
+\xec\x85\x8d\xcd\x27\xda\xae\x03\x00\x00\x00\x00\x00\x58\x4d\x45\
+\x44\xc4\xf6\xf6\x76\x7a\xee\xf2\xa5\xa9\x05\xe9\x1f\xbe\xf0\x83\
+\x17\x97\xf9\x9c\xf9\x59\x04\xbd\xce\x52\xb7\xae\x00\x00\x6d\xd3\
+\x25\xbf\x58\x9c\x2d\x0f\x00\x00\x00\xb0\x18\x8a\x59\x5e\x5c\x30\
+\xdf\x8c\x00\xf9\xe0\x75\x9d\xe4\x68\x80\xbd\x58\x57\x58\x6d\x17\
+\x36\x36\x9f\xb8\x7a\xf9\xd2\xb3\x6d\xd7\x01\x00\x00\x00\x00\x00\
+\xac\xa6\x51\x28\x3f\xed\x6e\xf9\x8a\x60\xbe\x19\x01\xb2\x75\x05\
+\xa6\x4f\x30\x0f\x00\x00\x00\x00\x00\xb4\x65\xa6\x9d\xf2\x15\xc1\
+\x7c\xb3\xf7\x0b\x90\xf7\x5e\x97\x4f\x7c\xf2\x53\xcf\x1c\xb6\x5b\
+\x3e\xc2\xba\x02\x00\x1c\xc4\xe8\xfa\xc5\x64\x84\x3d\x00\x00\x00\
+\x40\xf7\xed\x08\xe5\x67\xd5\x2d\x1f\xb1\xdc\xc1\xfc\x51\x09\xe6\
+\xf7\xe6\x03\x0f\xc0\x34\xe9\x96\x07\x00\x00\x00\x00\x00\xda\xb0\
+\x36\xcf\x9b\x7d\xf8\xc2\x0f\x5e\x7c\xe9\xea\x17\x66\x12\xfa\x2f\
+\xba\xf7\x7c\xf0\x43\xcf\xec\x0e\x8c\x5f\xfb\x9d\xaf\x7c\x76\x16\
+\xa3\xdc\x17\x59\xd5\x2d\xff\x89\x4f\x7e\x6a\xa2\x75\xb1\xae\x40\
+\x5d\x15\xcc\x5f\xd8\xd8\x7c\xa2\xed\x5a\x00\xba\x44\x97\xfc\x62\
+\xab\xba\xe5\xb7\xb7\xb7\x53\xdb\xb5\xc0\xb4\x7c\xed\x85\xe7\xf7\
+\xfd\xb3\x83\x47\x1e\x7b\x7c\x6e\x1f\xfa\xef\x4a\x1d\x4d\xb4\x59\
+\xf3\x22\xae\x17\x30\x1f\x2f\xbf\xb8\xff\xfe\xf0\xe8\xb9\xf9\xed\
+\x0f\x5d\xa9\xa3\x89\x36\x6b\x5e\xc4\xf5\x02\xe6\xe3\xe5\x17\xbe\
+\xb4\xff\xfe\xf0\xd8\x47\xe7\xb7\xaf\x77\xa4\x8e\x26\xda\xac\x79\
+\x11\xd7\x6b\x99\xcc\x35\x94\x8f\x18\x77\xcc\x0b\xe7\xef\x25\x40\
+\x9e\x0d\xeb\x0a\x00\x00\xb0\x18\x0e\x0a\x75\x77\xbf\x66\x96\x21\
+\x6f\x57\xea\x68\xa2\xcd\x9a\x17\x71\xbd\x80\xf9\x38\x28\xd4\xdd\
+\xfd\x9a\x59\x86\xbc\x5d\xa9\xa3\x89\x36\x6b\x5e\xc4\xf5\x02\xe6\
+\xe3\xa0\x50\x77\xf7\x6b\x66\x19\xf2\x76\xa5\x8e\x26\xda\xac\x79\
+\x11\xd7\x6b\x19\xdd\x13\xca\x0f\xbb\x2b\xf2\xf9\x8d\xcd\x99\x2e\
+\xba\xae\xf9\xbd\x09\x90\xef\xaf\x69\xb7\x7c\x84\x75\x05\xc6\x74\
+\xcb\x03\xab\xea\xc9\x27\x9f\xfc\xa1\x94\xd2\xf7\x47\xc4\xe3\x11\
+\xf1\xde\x88\x38\x5e\x7f\xfe\xe1\x87\x1f\x6e\xa5\x2e\xa6\x67\xd7\
+\xd9\xf2\xd7\x22\xe2\xf9\x9c\xf3\xaf\x3f\xfd\xf4\xd3\xbf\xdc\x52\
+\x49\xd0\xc8\x24\xc1\xee\xee\xd7\xcf\x22\xe0\xed\x4a\x1d\x4d\x6b\
+\x68\xfa\xfa\x69\xd5\xbc\x88\xeb\x05\xcc\xc7\x24\xc1\xee\xee\xd7\
+\xcf\x22\xe0\xed\x4a\x1d\x4d\x6b\x68\xfa\xfa\x69\xd5\xbc\x88\xeb\
+\x05\xcc\xc7\x24\xc1\xee\xee\xd7\xcf\x22\xe0\xed\x4a\x1d\x4d\x6b\
+\x68\xfa\xfa\x69\xd5\xbc\x88\xeb\xb5\xac\xe6\xde\x29\x5f\x27\x98\
+\xdf\x9b\x00\x79\x36\xac\x2b\x50\x11\xcc\x03\xab\x64\x18\xc6\x3f\
+\x15\x11\x67\x6f\xdc\xb8\x11\x37\x6f\xde\x8c\xdb\xb7\x6f\x47\xaf\
+\xd7\x6b\xbb\x34\x66\xa4\x2c\xcb\x38\x7e\xfc\xf8\xd9\x53\xa7\x4e\
+\x9d\x5d\x5f\x5f\xff\x81\xad\xad\xad\xa7\x72\xce\x4f\x09\xe7\xe9\
+\xb2\x7a\xb0\x7b\xfb\xf6\xed\xf8\xe6\x37\xbf\xb9\xe3\xf9\x94\x52\
+\x94\x65\x19\x27\x4e\x9c\x88\x77\xbe\xf3\x9d\x51\x96\xe5\xe8\x7d\
+\xd3\x0c\x78\xbb\x52\x47\x13\x6d\xd6\xbc\x88\xeb\x05\xcc\x47\x3d\
+\xd8\x6d\xb2\x3f\x4c\x3b\xe0\xed\x4a\x1d\x4d\xb4\x59\xf3\x22\xae\
+\x17\x30\x1f\xf5\x60\xb7\xd1\xfe\x30\xe5\x80\xb7\x2b\x75\x34\xd1\
+\x66\xcd\x8b\xb8\x5e\xcb\xac\xd8\xeb\xc1\xed\xed\xed\xf4\xdc\xe5\
+\x4b\x73\x09\xcb\xab\x71\xf6\xec\xb4\x57\x50\xbc\x3b\x50\x5e\x65\
+\x55\xb7\x7c\xd3\xf7\x59\x57\x00\x60\x95\x6c\x6d\x6d\xfd\x4c\x4a\
+\xe9\x1f\xdf\xb8\x71\xe3\xec\xab\xaf\xbe\x1a\xaf\xbf\xfe\x7a\xdc\
+\xbc\x79\x53\x20\xbf\xe4\x7a\xbd\x5e\xdc\xbc\x79\x33\x5e\x7f\xfd\
+\xf5\x78\xf5\xd5\x57\xe3\xc6\x8d\x1b\x67\x53\x4a\xff\x78\x6b\x6b\
+\xeb\x67\xda\xae\x0d\xf6\x32\x49\xa7\x75\xce\x39\xee\xde\xbd\x1b\
+\x6f\xbd\xf5\x56\x7c\xe3\x1b\xdf\xd8\xb1\x8f\x35\xed\xd4\xee\x7a\
+\x1d\x4d\xb4\x59\xf3\x22\xae\x17\x30\x1f\x93\x74\x5a\x1f\xb4\x3f\
+\x34\xed\xd4\xee\x7a\x1d\x4d\xb4\x59\xf3\x22\xae\x17\x30\x1f\x93\
+\x74\x5a\x1f\xb8\x3f\x34\xec\xd4\xee\x7a\x1d\x4d\xb4\x59\xf3\x22\
+\xae\xd7\xb2\x6b\xb5\x53\xbe\xa2\x63\x7e\x6f\x3a\xbb\x67\xc3\xba\
+\x02\x11\xba\xe5\x81\xe5\x37\x0c\x60\xff\xe6\xeb\xaf\xbf\x1e\x37\
+\x6e\xdc\x68\xbb\x1c\x5a\xd2\xeb\xf5\xe2\xf5\xd7\x5f\x8f\xdb\xb7\
+\x6f\xc7\x99\x33\x67\xfe\xe6\xd6\xd6\x56\x6c\x6f\x6f\xff\x78\xdb\
+\x75\xc1\x24\x4e\x9f\x3e\x1d\x0f\x3e\xf8\xe0\xe8\xfb\x3b\x77\xee\
+\xc4\x1b\x6f\xbc\x11\xb7\x6e\xdd\x8a\x9b\x37\x6f\xc6\xfa\xfa\xfa\
+\x4a\xd5\xd1\x44\x9b\x35\x2f\xe2\x7a\x01\xf3\xd1\x95\xfd\xa1\x2b\
+\x75\x34\x61\x5f\x07\xba\xa8\x2b\xfb\x43\x57\xea\x68\xc2\xbe\xbe\
+\x9a\xf6\xec\x94\x8f\x98\x6f\xb7\x7c\xc4\x20\x98\xd7\x35\x7f\x2f\
+\x9d\xdd\xfb\x3b\x6c\xb7\x7c\x84\x75\x05\x06\xaa\x60\xbe\xed\x3a\
+\x00\xa6\xed\xc9\x27\x9f\xfc\xa1\x10\xc8\x53\x73\xe3\xc6\x8d\x78\
+\xfd\xf5\xd7\x23\x22\xfe\xe6\xf0\xe7\x03\x3a\xa1\x49\xb7\xf4\xb1\
+\x63\xc7\xe2\xf4\xe9\xd3\x11\x31\xe8\xe8\x38\xec\x75\xba\x5c\x47\
+\x13\x6d\xd6\xbc\x88\xeb\x05\xcc\x47\x93\x6e\xe9\x83\xf6\x87\xa3\
+\x76\x5d\x77\xa5\x8e\x26\xda\xac\x79\x11\xd7\x0b\x98\x8f\x26\xdd\
+\xd2\x07\xee\x0f\x47\xec\xba\xee\x4a\x1d\x4d\xb4\x59\xf3\x22\xae\
+\xd7\x2a\xd8\x37\x94\x6f\x8b\x60\xfe\x5e\x02\xe4\xd9\xb0\xae\x00\
+\xc0\xb2\x4a\x29\x3d\x75\xe3\xc6\x0d\x81\x3c\x3b\x54\x3f\x13\x29\
+\xa5\xa7\xda\xae\x05\x9a\xaa\xc6\x2a\x56\xfb\xda\x89\x13\x27\x56\
+\xba\x8e\x26\xda\xac\x79\x11\xd7\x0b\x98\x8f\xae\xec\x0f\x5d\xa9\
+\xa3\x09\xfb\x3a\xd0\x45\x5d\xd9\x1f\xba\x52\x47\x13\xf6\xf5\xd5\
+\x71\xe0\xf8\xfa\xed\xed\xed\x14\x11\xf9\xfc\xc6\xe6\x5c\x83\xf2\
+\x55\x1a\x67\x3f\xe9\xd8\xf4\xbd\x46\xae\x33\xee\x96\xff\xc4\x27\
+\x3f\x75\xa8\xd1\xf3\x46\xd9\x03\xc6\xd8\x03\xcb\x66\xd8\x05\x7d\
+\xf6\xcd\x37\xdf\x6c\xbb\x14\x3a\xe8\xcd\x37\xdf\x8c\xf5\xf5\xf5\
+\xb3\x4f\x3e\xf9\xe4\x0f\x3d\xfd\xf4\xd3\xbf\xdc\x76\x3d\x70\x90\
+\xeb\xd7\xaf\xc7\xf5\xeb\xd7\x77\x3c\xb6\xb6\xb6\x16\x67\xce\x9c\
+\x89\xe3\xc7\x8f\xaf\x5c\x1d\x4d\xb4\x59\xf3\x22\xae\x17\x30\x1f\
+\x5d\xd9\x1f\xba\x52\x47\x13\xf6\x75\xa0\x8b\xba\xb2\x3f\x74\xa5\
+\x8e\x26\xec\xeb\xab\xa9\x73\x9d\xf2\x95\x55\xea\x98\x9f\x34\x6c\
+\x17\x14\x37\x63\x5d\x01\x80\x55\x94\x52\xfa\xfe\x1b\x37\x6e\x44\
+\xaf\xd7\x6b\xbb\x14\x3a\xa8\xd7\xeb\x55\xdd\xf2\xdf\xdf\x76\x2d\
+\x70\x18\xbd\x5e\x2f\x6e\xdd\xba\x75\xcf\x58\xc5\x55\xad\xa3\x89\
+\x36\x6b\x5e\xc4\xf5\x02\xe6\xa3\x2b\xfb\x43\x57\xea\x68\xc2\xbe\
+\x0e\x74\x51\x57\xf6\x87\xae\xd4\xd1\x84\x7d\x7d\xf9\x1d\xd8\x29\
+\x1f\xd1\x5e\xb7\x7c\x84\x8e\xf9\xbd\x08\x90\xef\x75\x50\xb7\xbc\
+\x49\x04\xc0\x24\x74\xcb\x03\x4b\xe6\xf1\x9b\x37\x6f\xee\xf9\xc4\
+\xb5\x6b\xd7\xe6\x5b\x09\xad\x3b\x7b\xf6\xec\x3d\x8f\xdd\xbc\x79\
+\x33\xd6\xd7\xd7\x1f\x9f\x7f\x35\xd0\xcc\xe9\xd3\xa7\xe3\xc1\x07\
+\x1f\x1c\x7d\xdf\xeb\xf5\xe2\xfa\xf5\xeb\xd5\x07\x4b\xe2\xa1\x87\
+\x1e\x5a\xa9\x3a\x9a\x68\xb3\xe6\x45\x5c\x2f\x60\x3e\xba\xb2\x3f\
+\x74\xa5\x8e\x26\xec\xeb\x40\x17\x75\x65\x7f\xe8\x4a\x1d\x4d\xd8\
+\xd7\x57\xd3\x7d\x43\xf9\x88\xf6\x83\xf9\x88\x88\x55\x08\xe7\x8d\
+\x4d\x3f\xbc\x2a\x98\x3f\x77\xee\xdc\x3d\xcf\xf9\xc0\x03\x30\x89\
+\x2a\x98\x6f\xbb\x0e\x80\x29\x78\xef\xed\xdb\xb7\x0f\x7c\xc1\x5e\
+\x41\x2d\xcb\xe5\xa0\x0f\x60\x0c\x7f\x3e\xde\x3b\xaf\x5a\x60\x5a\
+\xca\xb2\x8c\x87\x1e\x7a\x28\x6e\xde\xbc\x19\x6f\xbd\xf5\x56\x6b\
+\x7f\x58\xd4\x95\x3a\x9a\x68\xb3\xe6\x45\x5c\x2f\x60\x3e\xba\xb2\
+\x3f\x74\xa5\x8e\x26\xec\xeb\x40\x17\x75\x65\x7f\xe8\x4a\x1d\x4d\
+\xd8\xd7\x57\xc3\x44\xa1\x7c\x17\x4c\xa3\x6b\xfe\xe4\xc9\x93\xf1\
+\x4f\x7f\xed\x7f\xf9\xf1\xbb\x77\xef\xbc\x63\x5a\x75\x45\x44\xd4\
+\x83\xe0\xdf\xf8\xd5\x5f\xb9\x6f\xb7\xf5\x5e\xc1\x71\xe5\xb5\xdf\
+\xf9\xca\x67\x5f\x7c\xf1\xc5\xe9\x14\xb6\x04\x9a\xae\xed\x7e\x7c\
+\xe0\x01\x00\x58\x21\xc7\x0f\x1a\x5d\x7f\xf6\xec\xd9\xb8\x76\xed\
+\x9a\x60\x7e\x89\x55\xbf\xbf\xfb\x05\xf3\xc3\x9f\x0f\x07\xc5\xb1\
+\xd0\x72\xce\x91\x73\x8e\x94\x92\x3a\x1a\x6a\xb3\xe6\x45\x5c\x2f\
+\x60\x3e\xba\xb2\x3f\x74\xa5\x8e\x26\xec\xeb\x40\x17\x75\x65\x7f\
+\xe8\x4a\x1d\x4d\xd8\xd7\x97\xd7\xc4\xa1\x7c\x9b\xdd\xf2\x95\xa3\
+\x06\xf3\x6f\xbf\xfd\x76\xfc\xf9\x1f\xf8\x4b\x3f\x33\xcd\x9a\x22\
+\x76\x9e\x5d\xbe\xd7\x08\xf5\x83\x5e\xbf\xd7\xd8\xf4\x73\xe7\xce\
+\xe9\xda\x1e\x3a\xca\xda\xee\xf5\x9c\x75\x05\x0e\x52\x75\xcb\xeb\
+\x98\x07\x96\x9d\x60\x7e\x79\xf9\x7d\x65\xd1\x3c\xf2\xd8\xe3\x17\
+\xbf\xf6\xc2\xf3\x13\xfd\xff\xfc\x6a\xac\x62\xaf\xd7\x8b\xb2\x2c\
+\x77\xfc\x41\xd1\x23\x8f\x3d\x7e\xa4\x3f\xab\xe8\x4a\x1d\x4d\xb4\
+\x59\xf3\x22\xae\x17\x30\x1f\x8f\x9e\x7b\xfc\xe2\xcb\x2f\x1e\x7d\
+\x7f\x78\xf4\xdc\xd1\xf6\x87\xae\xd4\xd1\x44\x9b\x35\x2f\xe2\x7a\
+\x01\xf3\xf1\xe8\x63\x1f\xbd\xf8\xf2\x0b\x5f\x3a\xfa\xfe\xf0\xd8\
+\x47\x8f\xb6\xaf\x77\xa4\x8e\x26\xda\xac\x79\x11\xd7\x6b\x15\x34\
+\xea\x94\xef\x4a\x30\xdf\xd6\xbd\x67\x65\xaf\x60\x5e\x80\x7c\x74\
+\xd6\x15\x38\x2c\x67\xcb\xd3\x05\x57\x2f\x5f\x7a\x76\x6b\x6b\x6b\
+\x6d\x7b\x7b\xfb\x6e\xdb\xb5\xb0\x9c\x04\xf3\xcb\xc7\xef\x27\xcb\
+\xe6\xfa\xf5\xeb\x71\xfd\xfa\xf5\x3d\x9f\xab\x9f\x81\xb8\x2a\x75\
+\x34\xd1\x66\xcd\x8b\xb8\x5e\xc0\x7c\x74\x65\x7f\xe8\x4a\x1d\x4d\
+\xd8\xd7\x81\x2e\xea\xca\xfe\xd0\x95\x3a\x9a\xb0\xaf\xaf\xa6\xa2\
+\xe9\x1b\xb6\xb7\xb7\xd3\x73\x97\x2f\x2d\xfd\xf9\xee\xf3\xb6\x57\
+\x50\x7c\x50\xd7\x37\x93\xb1\xae\x00\x2c\x32\x81\x3c\xb3\x76\xd0\
+\x88\x73\x16\x8b\x40\x9e\x45\x36\x69\xb7\x74\x51\x14\x71\xf2\xe4\
+\xc9\x78\xf7\xbb\xdf\x1d\x0f\x3c\xf0\x40\xe3\xf7\x2f\x4a\x1d\x4d\
+\xb4\x59\xf3\x22\xae\x17\x30\x1f\x93\x76\x4b\xef\xb7\x3f\x4c\xab\
+\xdb\xba\x2b\x75\x34\xd1\x66\xcd\x8b\xb8\x5e\xc0\x7c\x4c\xda\x2d\
+\xbd\xef\xfe\x30\xa5\x6e\xeb\xae\xd4\xd1\x44\x9b\x35\x2f\xe2\x7a\
+\x2d\xbb\x43\x9d\x29\xdf\x85\x8e\xf9\xb6\xed\x17\xec\xee\x1e\x4d\
+\xdf\xe4\x9a\x3a\xbb\xa7\xeb\x37\x7e\xf5\x57\x3e\xfb\x89\x4f\x7e\
+\xea\x19\xeb\x0a\x00\xb0\x3f\x1d\xf3\x8b\xcf\xef\x1f\xcb\xa0\x3e\
+\x0e\xfd\xf8\xf1\xe3\xf1\xfe\xf7\xbf\x7f\xe2\xf7\x2d\x63\x1d\x4d\
+\xb4\x59\xf3\x22\xae\x17\x30\x1f\xf5\x71\xe8\x4d\xf6\x87\x69\x07\
+\xbb\x5d\xa9\xa3\x89\x36\x6b\x5e\xc4\xf5\x02\xe6\xa3\x3e\x0e\xbd\
+\xd1\xfe\x30\xe5\x60\xb7\x2b\x75\x34\xd1\x66\xcd\x8b\xb8\x5e\xcb\
+\xac\x71\xa7\x7c\x45\xc7\xfc\x6c\xe8\xec\x1e\xfc\x7a\xab\xbf\x26\
+\x79\x7c\x3f\x9f\xf8\xe4\xa7\x9e\xf9\x8d\x5f\xfd\x95\xcf\x46\x58\
+\x57\x00\x80\x83\xe8\x98\x5f\x5c\x02\x79\x96\x49\xd3\xa0\x76\x56\
+\xc1\x6e\x57\xea\x98\x65\x0d\xd3\xac\x79\x11\xd7\x0b\x98\x8f\xa6\
+\x41\xed\xac\x82\xdd\xae\xd4\x31\xcb\x1a\xa6\x59\xf3\x22\xae\x17\
+\x30\x1f\x4d\x83\xda\x59\x05\xbb\x5d\xa9\x63\x96\x35\x4c\xb3\xe6\
+\x45\x5c\xaf\x65\x75\xa8\x4e\x79\xf6\xee\x6a\xdf\xfd\xfc\x34\xaf\
+\xad\xb3\xfb\xe8\xac\x2b\x00\xc0\xfe\x04\xbb\x8b\xc9\xef\x1b\xcb\
+\xa6\x0a\x6c\xab\xee\xeb\x83\x5e\xb3\x0a\x75\x34\xd1\x66\xcd\x8b\
+\xb8\x5e\xc0\x7c\x54\x81\x6d\xd5\x7d\x7d\xd0\x6b\x56\xa1\x8e\x26\
+\xda\xac\x79\x11\xd7\x0b\x98\x8f\x2a\xb0\xad\xba\xaf\x0f\x7a\xcd\
+\x2a\xd4\xd1\x44\x9b\x35\x2f\xe2\x7a\x2d\xa3\x23\x85\xf2\xc6\xd8\
+\xcf\xce\x2a\x07\xc8\xd3\xfc\xc0\x43\xd5\x2d\xff\x89\x4f\x7e\xea\
+\x99\xfd\xae\xbd\x2a\xeb\x0a\x00\x00\xb0\x28\xba\x12\xe0\x76\xa5\
+\x8e\x26\xda\x1e\xa5\xdf\xd6\xbd\x81\x6e\xeb\x4a\x80\xdb\x95\x3a\
+\x9a\x68\x7b\x94\x7e\x5b\xf7\x06\xba\xad\x2b\x01\x6e\x57\xea\x68\
+\xa2\xed\x51\xfa\x6d\xdd\x9b\x23\x8c\xaf\xaf\x18\x63\x3f\x3b\x46\
+\xae\x4f\x47\x7d\x8c\x7d\x84\x75\x05\x00\x00\x00\x00\x00\x00\xe6\
+\xe7\xc8\xa1\x7c\xc4\xea\x06\xf3\xfb\x75\x57\x4f\xb3\xeb\x5a\x80\
+\x3c\x1d\x82\x79\x00\x00\x00\x00\x00\x00\xa0\x0d\x53\x3b\x53\xde\
+\x28\xfb\xd9\x59\xc5\x91\xeb\xfb\x8d\xb0\x3f\xca\xaf\xd9\x28\x7b\
+\x00\x00\x80\xf6\x1d\x74\xee\xf8\x3c\x75\xa5\x8e\x49\xb5\x5d\x6f\
+\xdb\xf7\x07\xba\xeb\xa0\x73\xc7\xe7\xa9\x2b\x75\x4c\xaa\xed\x7a\
+\xdb\xbe\x3f\xd0\x5d\x07\x9d\x3b\x3e\x4f\x5d\xa9\x63\x52\x6d\xd7\
+\xdb\xf6\xfd\xb9\xbf\xa9\x85\xf2\xab\x6a\x77\xb0\xbb\x5f\xa0\xbb\
+\x5f\x17\xf6\x24\xef\xdd\xeb\x3e\x4c\x87\x60\x1e\x00\x00\x60\x7e\
+\x3e\xfd\xb1\x2f\xa7\xb6\x6b\x88\xe8\x4e\x1d\x93\x6a\xbb\xde\xb6\
+\xef\x0f\x74\xd7\xc7\x3e\xfd\xe9\x4e\xec\x0f\x5d\xa9\x63\x52\x6d\
+\xd7\xdb\xf6\xfd\x81\xee\xfa\xd8\xc7\x7f\xa1\x13\xfb\x43\x57\xea\
+\x98\x54\xdb\xf5\xb6\x7d\x7f\x26\x33\x95\xf1\xf5\x95\x55\x1d\x63\
+\x3f\x2f\xab\x16\x14\xef\xfe\xf5\x1e\xf4\x81\x87\xea\xaf\xfb\x3d\
+\xbe\x7b\x8c\xfd\x41\xd7\x05\x00\x00\x00\x00\x00\x00\x38\xaa\xa9\
+\x86\xf2\x11\x82\xf9\xfd\xdc\x2f\xf8\x9d\x34\x18\x7e\xcf\x07\x3f\
+\xf4\x4c\xf5\xd7\x74\x2a\x5b\x3d\x82\x79\x00\x00\x00\x00\x00\x00\
+\x60\x5e\xa6\x1e\xca\x47\xac\x5e\x30\x5f\x05\xba\x82\xdd\x76\x1c\
+\xe6\x03\x0f\xfb\x05\xf3\x3e\xf0\x00\x00\x00\x00\x00\x00\x00\x4c\
+\xd3\x4c\x42\xf9\x88\xd5\x0b\xe6\x99\x8d\x59\x7e\xe0\x61\xaf\x60\
+\x1e\x00\x00\x00\x00\x00\x00\x60\x9a\x66\x16\xca\x47\xac\x56\x30\
+\x3f\x49\x68\xbc\xdf\x6b\x74\x66\x03\x00\x00\x00\x00\x00\x00\x2c\
+\xa7\x99\x86\xf2\x30\x0d\x93\x7e\xe0\xa1\x3c\x76\xec\xb5\xfa\x5f\
+\x93\xbc\x57\xb7\x3c\x00\x00\x00\x00\x00\x00\x30\x4b\x6b\xb3\xbe\
+\xc1\xf6\xf6\x76\x8a\x88\x7c\x7e\x63\xf3\xe2\xac\xef\x75\x90\xaa\
+\x63\xff\xe7\xfe\xfe\xd3\x1d\x0c\x60\x7f\xad\x83\x35\x2d\x8b\xc9\
+\xd6\xb6\x9b\x3f\x17\x00\x00\x00\x00\x00\x00\xc0\xa2\x9b\x79\x28\
+\x1f\xd1\x6e\x30\x5f\x1f\x9f\xff\x63\x3f\xf5\x64\x67\xc6\xc4\xf7\
+\x23\x52\x11\x91\xdb\xae\x83\xb1\xdb\xb7\x6e\x1d\x3f\x7e\xe2\xc4\
+\xed\x36\x6b\xf0\xe1\x00\x00\x00\x00\x00\x00\x00\x58\x2e\x73\x09\
+\xe5\x23\xe6\x1f\xcc\x77\x35\x8c\xaf\x08\xe4\x67\x27\xe7\x7e\x99\
+\x52\xd1\x6b\xfa\xbe\x36\x03\xf9\x2a\x8c\x1f\xfe\x73\x02\x00\x00\
+\x00\x00\x00\x00\x2c\x89\xb9\x85\xf2\x11\xf3\x09\xe6\xbb\x1e\xc6\
+\x57\xee\xbc\xfd\xf6\x83\xc7\x4e\x9e\x7c\xb3\xed\x3a\x96\xd1\x61\
+\x02\xf9\x4a\x3f\x22\x8a\x29\xd6\x72\x3f\xc2\x78\x00\x00\x00\x00\
+\x00\x00\x58\x6e\x73\x0d\xe5\x67\x69\x51\xc2\xf8\x4a\x71\xe2\xf8\
+\xb7\xdb\xae\x61\x59\xf5\x6e\xdf\x5a\x2f\x8f\x9f\xb8\x71\x98\xf7\
+\x16\x31\x9f\x60\x5e\x18\x0f\x00\x00\x00\x00\x00\x00\xab\x61\xee\
+\xa1\xfc\xb4\xbb\xe5\x17\x2d\x8c\xaf\x94\xa9\xb8\xd3\x76\x0d\x8b\
+\x28\x17\xc5\xb7\x22\x22\x8a\x1c\xdf\x1a\x3d\x96\xfb\x1f\x98\xe6\
+\x3d\x66\x19\xc8\x0b\xe3\x01\x00\x00\x00\x00\x00\x60\xb5\xb4\xd2\
+\x29\x7f\xd4\x60\x7e\x51\x83\x78\x66\xa3\x5f\x14\xbf\x55\xf4\xfb\
+\x7f\x2e\xa5\xe2\x6a\x14\xf1\x5d\x6b\xa7\x4e\x45\xf4\xe3\xbb\xa6\
+\x1d\xd6\x1f\x85\x30\x1e\x00\x00\x00\x00\x00\x00\x56\x53\x6b\xe3\
+\xeb\x0f\x13\xcc\x57\x61\xbc\x20\x7e\x75\xa5\x7e\xff\x5d\x11\x11\
+\x39\xe2\x5d\xd5\x63\x45\x8e\x0f\xf4\x8b\xe2\xb7\xca\x1c\x8f\x45\
+\xc4\xd7\x87\x0f\xbf\xd0\xef\x17\xbf\x55\xbd\xa6\x2c\x87\xaf\x2f\
+\xe2\xbb\x22\x62\x6e\xa1\xbd\x30\x1e\x00\x00\x00\x00\x00\x00\x56\
+\x5b\xab\x67\xca\x4f\x1a\xcc\x0b\xe3\xb9\x9f\xa2\xdf\xff\x73\x39\
+\x22\xa2\x17\xa3\xa0\xbd\xd8\x31\x87\xbe\xf8\xea\xf0\x8b\xaf\x47\
+\x03\xfd\x88\x54\x44\xe4\xa6\xf5\x08\xe3\x01\x80\x45\x73\xed\xda\
+\xb5\x38\x7b\xf6\x6c\xdb\x65\xd0\x90\xdf\x37\x00\x00\x00\x80\xee\
+\x6b\x35\x94\x8f\x38\x38\x98\x17\xc6\x33\x2d\xa3\xae\xf8\x5a\x68\
+\x3f\x89\xa6\x81\xbc\x30\x1e\x00\x58\x44\x82\xdd\xc5\x75\xf6\xec\
+\x59\xbf\x7f\x00\x00\x00\x00\x1d\xd7\x7a\x28\xbf\x17\x61\x3c\x5d\
+\xd3\x8f\x88\xe2\x80\xe7\x85\xf1\x00\xc0\xa2\x12\xe8\x2e\x3e\xc1\
+\x3c\x00\x00\x00\x40\xb7\x75\x22\x94\xaf\xba\xe5\xeb\x8f\x09\xe4\
+\xe9\x92\xdd\x81\x7c\x15\xc2\x57\x84\xf1\x00\xc0\x22\x12\xe4\x2e\
+\x0f\xc1\x3c\x00\x00\x00\x40\x77\x75\x22\x94\x8f\x18\x84\x9a\x5b\
+\x5b\x5b\xa3\x60\x7e\x77\xe8\x09\x5d\x24\x8c\x07\x00\x16\x95\x00\
+\x77\xf9\x08\xe6\x01\x00\x00\x00\xba\xa9\x33\xa1\x7c\xc4\xc1\x01\
+\xe7\xd6\xd6\x56\xfe\x81\x8d\x27\x5f\xc8\x91\xef\xdb\x41\xff\xdc\
+\xe5\x4b\x57\xf6\x3a\xa3\x1e\x76\x7b\xee\xf2\xa5\x2b\x82\x75\x00\
+\x60\xd5\x08\x6e\x97\x97\x60\x1e\x00\x00\x00\xa0\x7b\x3a\x15\xca\
+\xdf\x4f\xce\xc5\x5f\x8f\xd4\xfb\x40\xdb\x75\xb0\x5c\xea\x13\x1a\
+\x56\x89\x0f\x23\x00\xc0\x6a\x12\xd8\x2e\xbf\x2a\x98\x07\x00\x00\
+\x00\xa0\x1b\x16\x2a\x94\x17\xc8\x33\x0b\x2b\x3c\x55\x21\x0b\xe6\
+\x01\x60\x35\x09\x6c\x01\x00\x00\x00\x60\x7e\x16\x2b\x94\x07\xa6\
+\x66\xf8\x61\x04\xc1\x3c\x00\xac\x10\x1d\xf2\x00\x00\x00\x00\x30\
+\x7f\x45\xdb\x05\x00\xed\x39\xbf\xb1\x79\x71\x55\xc7\xf7\x03\x00\
+\x00\x00\x00\x00\xc0\x3c\x08\xe5\x61\xc5\x09\xe6\x01\x00\x00\x00\
+\x00\x00\x60\x76\x84\xf2\x80\x60\x1e\x00\x00\x00\x00\x00\x00\x66\
+\x44\x28\x0f\x44\x84\x60\x1e\x00\x00\x00\x00\x00\x00\x66\x41\x28\
+\x0f\x8c\x08\xe6\x01\x00\x00\x00\x00\x00\x60\xba\xd6\xda\x2e\x00\
+\xe8\x96\xf3\x1b\x9b\x17\x23\x22\x47\x44\x6c\x6f\x6f\xa7\x96\xcb\
+\x01\x00\xa6\xe8\xda\xb5\x6b\x6d\x97\xc0\x9c\x9d\x3d\x7b\xb6\xed\
+\x12\x00\x00\x00\x00\x56\x9e\x50\x1e\xb8\xc7\x30\x98\x8f\x88\xc8\
+\x82\x79\x16\xdd\xd5\xcb\x97\x9e\xbd\xb0\xb1\xf9\x44\xdb\x75\x00\
+\x74\x89\xa0\x76\xf9\xf9\x00\x06\x00\x00\x00\x40\x77\x18\x5f\x0f\
+\xec\xcb\x38\x7b\x96\xc1\x85\x8d\xcd\x27\xae\x5e\xbe\xf4\x6c\xdb\
+\x75\x00\x74\xc5\xd9\xb3\x67\x05\xb6\x4b\xee\xda\xb5\x6b\x3e\x78\
+\x01\x00\x00\x00\xd0\x21\x3a\xe5\x59\x79\xcf\x5d\xbe\x74\xa5\xed\
+\x1a\x8e\xaa\xd6\xd9\x3e\xab\x6b\xeb\x98\x67\xa1\x55\xc1\xbc\x8e\
+\x79\x80\x81\x2a\x98\x17\xdc\x2e\x1f\xbf\xaf\x00\x00\x00\x00\xdd\
+\x23\x94\x67\xe5\xcd\x32\xd0\x9e\x97\xe7\x2e\x5f\xba\x22\x98\x07\
+\x00\x9a\x10\xcc\x2f\x1f\xbf\x9f\xc0\x34\xfc\xb5\x9f\x8f\xfc\xf9\
+\x1f\x0d\xff\xdf\xaf\xa1\xb6\xd7\xad\xed\xfb\x03\xdd\xf5\xf3\x7f\
+\xed\xaf\xe5\x1f\xfd\xfc\xe7\xed\x0f\x0d\xb5\xbd\x6e\x6d\xdf\x1f\
+\xe8\xae\x9f\x7f\xe6\xa3\xf9\x47\x3f\xfb\x25\xfb\x43\x43\x6d\xaf\
+\xdb\xcf\x3f\xf3\xd1\x6c\x7c\x3d\x2c\x81\xf3\x1b\x9b\x17\x67\xdd\
+\xf1\x6f\x94\x3d\x8b\xce\x18\x7b\x80\x7b\x19\x65\xbf\x3c\x04\xf2\
+\xc0\xb4\x08\x76\x0f\xa7\xed\x75\x6b\xfb\xfe\x40\x77\x09\x76\x0f\
+\xa7\xed\x75\x6b\xfb\xfe\x40\x77\x09\xe4\x0f\xa7\xed\x75\xfb\xd1\
+\xcf\x7e\x29\x09\xe5\x61\x49\x08\xe6\xe1\xfe\x04\xf3\x00\xf7\x12\
+\xcc\x2f\x3e\x81\x3c\x00\x00\x00\x40\xb7\x09\xe5\x61\x89\x08\xe6\
+\x01\x80\xc3\x10\xcc\x2f\x2e\x81\x3c\x00\x00\x00\x40\xf7\x09\xe5\
+\x61\xc9\x08\xe6\xe1\x60\xba\xe5\x01\xf6\x26\xd8\x5d\x4c\x7e\xdf\
+\x00\x00\x00\x00\xba\x4f\x28\x0f\x4b\xa8\x0a\xe6\x67\x19\xce\x0b\
+\xe6\x01\x00\x00\x00\x00\x00\xe0\xfe\x84\xf2\xb0\xa4\xce\x6f\x6c\
+\x5e\x9c\x75\xd7\xbc\x60\x9e\x45\xa5\x5b\x1e\x00\x00\x00\x00\x00\
+\x98\x17\xa1\x3c\x2c\x39\xc1\x3c\xec\x4d\x30\x0f\x00\x00\x00\x00\
+\x00\xcc\x83\x50\x1e\x56\x80\x60\x1e\x00\x00\x00\x00\x00\x00\xda\
+\x21\x94\x87\x15\x21\x98\x87\x7b\xe9\x96\x07\x00\x00\x00\x00\x00\
+\x66\x4d\x28\x0f\x2b\x44\x30\x0f\xf7\x12\xcc\x03\x00\x00\x00\x00\
+\x00\xb3\x24\x94\x87\x15\x23\x98\x07\x00\x00\x00\x00\x00\x80\xf9\
+\x11\xca\xc3\x0a\x12\xcc\xc3\x4e\xba\xe5\x01\x00\x00\x00\x00\x80\
+\x59\x59\x6b\xbb\x00\x68\xdb\x2c\xc3\xe9\x79\x39\xbf\xb1\x79\xf1\
+\x30\xef\x79\xee\xf2\xa5\x2b\x87\x79\x6f\x83\x9a\x72\x44\xc4\xf6\
+\xf6\x76\x9a\xc5\x3d\x60\x9a\x04\xf3\x00\x00\x00\x00\x00\xc0\x2c\
+\x08\xe5\x59\x79\x4b\x12\x18\xe7\x0e\x07\xf3\x11\x11\x79\x49\xd6\
+\x19\x00\x00\x00\x00\x00\x00\x1a\x31\xbe\x1e\x96\xc0\xf6\xf6\x76\
+\x3a\x6c\xc7\xff\xac\x47\xd9\x57\xf7\x30\xce\x9e\x45\x70\x61\x63\
+\xf3\x89\xb6\x6b\x00\x00\x00\x00\x00\x00\x96\x8b\x4e\xf9\x25\x70\
+\xf7\xf6\xed\xf2\x58\x79\xbc\x9f\xcb\x10\x7a\xae\xb0\x61\x27\xfa\
+\x91\x3a\xe6\xab\xaf\xa7\x5e\xdc\xf8\xba\x3a\xe6\x59\x08\xc6\xd8\
+\x03\x00\x00\x00\x00\x00\xd3\x22\x94\x87\x25\x72\xd4\x60\x3e\x22\
+\x62\x1e\xe7\xcc\x0b\xe6\xe9\x3a\x1d\xf3\x74\xc1\xd5\xcb\x97\x9e\
+\xdd\xda\xda\x5a\xdb\xde\xde\xbe\xdb\x76\x2d\x00\x00\x00\x00\x00\
+\x1c\x9e\xf1\xf5\x4b\x60\xed\xf8\xf1\x9e\x2e\x79\x2a\x47\x19\x65\
+\x1f\x31\xfb\x71\xf6\x46\xd9\x03\x4c\x4e\x20\x0f\x00\x00\x00\x00\
+\xb0\xf8\x84\xf2\xb0\x84\x04\xf3\x00\x00\x00\x00\x00\x00\xd0\x0d\
+\x42\x79\x58\x52\x82\x79\x00\x00\x00\x00\x00\x00\x68\x9f\x33\xe5\
+\x61\x89\x1d\xe5\x8c\xf9\x88\xd9\x07\xf3\x11\x11\x5b\x5b\x5b\xce\
+\x98\x07\x00\x00\x00\x00\x00\x60\x69\x09\xe5\x61\xc9\x55\xc1\x7c\
+\xc4\x20\x64\x3f\xcc\x35\x0e\xfb\xbe\x49\xcc\x3a\xf4\x07\x00\x00\
+\x00\x00\x00\x80\x36\x09\xe5\x61\x05\xd4\x3a\xd1\x0f\xdd\x35\x0f\
+\x00\x00\x00\x00\x00\x00\x34\xe7\x4c\x79\x58\x21\x47\x3d\x67\x1e\
+\x00\x00\x00\x00\x00\x00\x68\x46\x28\x0f\x2b\x46\x30\x0f\x00\x00\
+\x00\x00\x00\x00\xf3\x23\x94\x87\x15\x24\x98\x07\x00\x00\x00\x00\
+\x00\x80\xf9\x10\xca\xc3\x8a\x12\xcc\x03\x00\x00\x00\x00\x00\xc0\
+\xec\x09\xe5\x61\x85\x09\xe6\x01\x00\x00\x00\x00\x00\x60\xb6\x84\
+\xf2\xb0\xe2\x04\xf3\x00\x00\x00\x00\x00\x00\x30\x3b\x42\x79\x40\
+\x30\x0f\x00\x00\x00\x00\x00\x00\x33\x22\x94\x07\x22\x42\x30\x0f\
+\x00\x00\x00\x00\x00\x00\xb3\xb0\xd6\x76\x01\xd0\xb6\xad\xad\xad\
+\xdc\x76\x0d\xab\x6e\x51\x7f\x0f\xb6\xb7\xb7\x53\xdb\x35\x00\x00\
+\x00\x00\x00\x00\xd0\x6d\x42\x79\x56\xde\xf9\x8d\xcd\x8b\x6d\xd7\
+\xd0\x15\x6d\x75\xca\x2f\xf0\xef\x41\x16\xcc\x03\x00\x00\x00\x00\
+\x00\x70\x10\xe3\xeb\x01\x00\x00\x00\x00\x00\x00\x60\x46\x84\xf2\
+\x00\x87\x74\x7e\x63\xf3\xe2\xa2\x8e\xde\x07\x00\x00\x00\x00\x00\
+\x60\x3e\x84\xf2\x00\x47\x20\x98\x07\x00\x00\x00\x00\x00\xe0\x20\
+\x42\x79\x80\x23\x12\xcc\x03\x00\x00\x00\x00\x00\xb0\x1f\xa1\x3c\
+\x00\x00\x00\x00\x00\x00\x00\xcc\x88\x50\x1e\x60\x0a\x74\xcb\x03\
+\x00\x00\x00\x00\x00\xb0\x17\xa1\x3c\xc0\x94\x08\xe6\x01\x00\x00\
+\x00\x00\x00\xd8\x4d\x28\x0f\x8c\x9c\xdf\xd8\xbc\xf8\xdc\xe5\x4b\
+\x57\xda\xae\x63\x91\x09\xe6\x01\x00\x00\x00\x00\x00\xa8\x13\xca\
+\x03\x3b\x08\xe6\x01\x00\x00\x00\x00\x00\x60\x7a\x84\xf2\xc0\x3d\
+\x96\x3d\x98\xcf\xb7\x7b\x65\xbe\xdd\x2b\x67\x75\x7d\xdd\xf2\x00\
+\x00\x00\x00\x00\x00\x54\xd6\xda\x2e\x00\xe8\xa6\x65\x0e\xe6\x8b\
+\xe3\x65\x3f\x22\x62\x96\xa9\xf9\xf9\x8d\xcd\x8b\x11\x91\xb7\xb7\
+\xb7\xd3\x0c\x6f\x03\x00\x00\x00\x00\x00\x40\xc7\x09\xe5\x81\x7d\
+\x55\xc1\xfc\xb2\x85\xf3\x79\xb6\x79\x3c\x00\x00\x00\x00\x00\x00\
+\x8c\x08\xe5\x81\x03\x0d\x3b\xbe\x39\x04\xdd\xf2\x00\x00\x00\x00\
+\x00\x00\x38\x53\x1e\x60\x86\x9c\x2f\x0f\x00\x00\x00\x00\x00\xb0\
+\xda\x84\xf2\x00\x33\x26\x98\x07\x00\x00\x00\x00\x00\x58\x5d\x42\
+\x79\x00\x00\x00\x00\x00\x00\x00\x98\x11\x67\xca\xb3\xf2\x9e\xbb\
+\x7c\xe9\x4a\xdb\x35\xb0\x1a\xb6\xb6\xb6\x9c\x2f\xdf\x82\xab\x97\
+\x2f\x3d\x7b\x61\x63\xf3\x89\xb6\xeb\x00\x00\x00\x00\x00\x00\x56\
+\x93\x50\x9e\x95\x77\x7e\x63\xf3\x62\xdb\x35\xcc\xc3\x73\x97\x2f\
+\x5d\x69\xfa\x6b\x3d\xcc\x7b\x56\x49\xd3\xf5\x79\xee\xf2\xa5\x2b\
+\xf3\x1e\x63\xef\x43\x00\x00\x00\x00\x00\x00\x00\xed\x12\xca\x03\
+\xcc\x51\x0b\x1f\x72\x58\xf9\xee\xfc\x0b\x1b\x9b\x4f\xe8\x96\x07\
+\x00\x00\x00\x00\x00\xda\xe2\x4c\x79\x80\x25\x76\x7e\x63\xf3\xe2\
+\xbc\xbb\xf3\xbb\xa8\x0a\xe6\xdb\xae\x03\x00\x00\x00\x00\x00\x58\
+\x3d\x42\x79\x80\x25\x27\x98\x07\x00\x00\x00\x00\x00\x68\xcf\xc2\
+\x84\xf2\xdb\xdb\xdb\xe9\xb9\xcb\x97\xae\xb4\x5d\x07\xc0\x22\x12\
+\xcc\xeb\x96\x07\x00\x00\x00\x00\x00\xda\xb1\x30\xa1\x3c\x00\x47\
+\xf3\x17\x7e\x62\xe3\x07\x05\xf3\x82\x79\x00\x00\x00\x00\x00\x60\
+\xbe\x16\x2a\x94\xd7\x2d\x0f\x70\x78\xe5\xc9\xe3\x77\xfe\xd3\x1f\
+\xfd\xcc\x7f\xb9\xea\xc1\x3c\x00\x00\x00\x00\x00\xc0\x3c\x2d\x4c\
+\x28\x5f\x85\x48\x82\x79\x80\xc3\x3b\x75\xfa\x1d\x37\x57\x7d\x94\
+\xbd\x6e\x79\x00\x00\x00\x00\x00\x60\x9e\x16\x26\x94\x8f\x10\xcc\
+\x03\x4c\x8b\x60\x5e\x30\x0f\x00\x00\x00\x00\x00\xcc\xc7\x42\x85\
+\xf2\xab\x1e\x22\x01\x4c\x93\x3d\x15\x00\x00\x00\x00\x00\x60\xf6\
+\x16\x2a\x94\xaf\xd3\x2d\x0f\x70\x74\xab\x1c\xcc\xeb\x96\x07\x00\
+\x00\x00\x00\x00\xe6\x61\xe1\x42\xf9\x7a\x80\x24\x98\x87\xc9\xfd\
+\xc0\xdf\xde\xfc\x4b\x6d\xd7\x40\x37\x09\xe6\x05\xf3\x00\x00\x00\
+\x00\x00\xc0\xec\xac\xb5\x5d\xc0\x61\x9c\xdf\xd8\xbc\x18\x11\x79\
+\x7b\x7b\x3b\x6d\x6f\x6f\xa7\x88\xc8\xc3\xc7\x80\x7d\xe4\x32\x56\
+\x32\x74\xed\x9a\x2e\x7f\x90\x68\x6b\x6b\x2b\x0f\xf7\x54\x00\x00\
+\x00\x00\x00\x00\xa6\x64\x21\x43\xf9\x88\x9d\xc1\x7c\xdb\xb5\x00\
+\x4c\x6a\x9e\x1f\x20\x7a\xee\xf2\xa5\x2b\x3f\xfe\xdf\x3e\xf9\xe6\
+\xa4\xaf\xff\x99\xbf\xf7\xf4\x83\xb3\xac\xa7\xab\xaa\x6e\xf9\x0b\
+\x1b\x9b\x4f\xb4\x5d\x0b\x00\x00\x00\x00\x00\xb0\x7c\x16\x6e\x7c\
+\xfd\x5e\x8c\xb1\x07\x00\x00\x00\x00\x00\x00\xa0\x8b\x16\x3a\x94\
+\x77\xbe\x3c\x00\xd3\xe0\x6c\x79\x00\x00\x00\x00\x00\x60\x56\x16\
+\x76\x7c\x7d\x65\xaf\xf3\xe5\xdb\xae\x09\xe6\x2e\xe5\xd7\xfb\x69\
+\xed\xf7\x4f\xf4\xe2\x46\x44\xc4\xad\x32\xd6\x8b\x7c\xf7\xbb\x23\
+\xa7\x33\x6d\x97\x06\x8b\x42\x30\x0f\x00\x00\x00\x00\x00\xcc\xc2\
+\xc2\x87\xf2\x11\xce\x97\x67\xb5\xe5\x28\xff\x65\x91\x7b\x7f\xba\
+\xc8\xbd\x33\x77\x86\xff\x04\x14\xfd\x88\x22\x52\x71\xb7\x28\xff\
+\x75\xd1\xef\x7d\xb8\xdd\x0a\x01\x00\x00\x00\x00\x00\x60\x75\x2d\
+\x45\x28\x5f\xb7\xbd\xbd\x9d\xb6\xb6\xb6\xb2\x51\xf6\x2c\xa2\x7e\
+\xaf\x97\x8a\xb2\x9c\x68\xda\x43\x51\xe4\x3f\x8a\x7e\x7a\xa8\x1f\
+\xbd\x3f\x95\xf7\x98\x10\xd1\x8f\xe8\x97\xfd\xde\xb9\x5e\x51\xbe\
+\x38\x97\x60\x3e\xe5\x6f\x15\xbd\xb5\x3f\x4c\xc7\xe2\x6e\x44\x44\
+\xf4\xe2\x5d\xfd\xdc\xfb\x8e\x9c\x96\x6f\x9f\x61\x79\x55\xdd\xf2\
+\x3a\xe6\x01\x00\x00\x00\x00\x80\x69\x59\x9a\xb0\x6c\x8f\x31\xf6\
+\x70\x5f\x5b\x5b\x5b\x9d\x3a\xee\x60\xd2\x40\x3e\x95\xe5\xbf\xe9\
+\xf7\x7a\xdf\x1b\x11\xfd\x83\x5e\x97\x23\xf2\x5c\x82\xf9\x54\x3e\
+\x5f\xe4\xde\xc7\xfa\x45\xef\x5d\xd1\xab\x3d\x5c\xc4\x89\x32\xf2\
+\x1f\xf4\x72\xfa\x63\x33\xbb\x37\xcc\xc0\x85\x8d\xcd\x27\xda\xae\
+\x01\xae\x5e\xbe\xf4\xec\x0f\xff\xf0\x0f\x1f\xfb\xc5\x5f\xfc\xc5\
+\x3b\x6d\xd7\x02\x00\x00\x00\x00\xc0\xe1\x2d\x4d\x28\x1f\x31\x0e\
+\xe6\xdb\xae\x03\x0e\xeb\xce\xed\xdb\xe9\xd8\xf1\xe3\x07\xfe\x0c\
+\x17\x39\x6e\x0e\x03\xf9\x89\xe4\x88\xbc\x96\x7b\xdf\xd7\x4f\xf9\
+\xd5\x99\x9c\x31\x5f\x05\xf2\x51\x8f\xe3\x87\xf7\xce\x71\xab\x1f\
+\xe9\xdd\x65\xbf\xfc\xff\x7a\x45\xef\x4f\x4e\xfd\xde\x00\x4b\x4e\
+\x20\x0f\x00\x00\x00\x00\xb0\xf8\x96\x2a\x94\xaf\x0c\xc3\x79\xb8\
+\xaf\x45\x3a\xe6\xa0\xc8\xf1\x76\xa4\x78\xa0\x9f\xe2\x54\xe3\x37\
+\xe7\xb8\x9d\xf3\xda\xb7\x52\xea\x4d\x37\x94\x3f\x20\x90\x1f\xdf\
+\x3a\x72\xaf\xe8\xfd\xc9\x5e\x2e\xff\xaf\xb5\xe8\x7d\x34\xa7\x38\
+\x36\xd5\x1a\x00\x00\x00\x00\x00\x00\xa0\xc3\x8a\xb6\x0b\x00\xc6\
+\xf6\xeb\x92\x2f\xca\xf2\x2b\xfd\x14\x27\xfb\xf7\x19\x57\x7f\x80\
+\xbc\x96\x0f\xfd\xde\xbd\xa5\xfc\xad\x22\x7a\x7f\xe6\xa0\x40\xbe\
+\xae\x4c\xbd\x3f\x9d\x52\x9c\x2c\x8a\xf2\x5f\x17\x51\xfe\x41\x91\
+\xe3\xe6\x54\xeb\x01\x00\x00\x00\x00\x00\x80\x0e\x5a\xca\x4e\x79\
+\x58\x26\x45\x8a\x53\xfd\x5e\xef\x43\x6d\xd7\x71\x8f\xfe\xda\xb7\
+\xfa\xa9\xf7\x9d\x8d\xde\x12\xd1\x8b\x7e\xef\x3f\x48\x11\x29\xa7\
+\x28\x23\xc5\xf1\x22\x97\xff\x2c\x8a\x38\xde\xbb\x13\x27\xcb\x32\
+\x1e\xec\xf5\xef\x9e\x2e\x52\x3a\x95\x93\xfd\x09\x00\x00\x00\x00\
+\x00\x80\xc5\x27\xf4\x82\x6e\x3b\xd6\x9f\x42\x47\x79\x3f\xa2\x48\
+\x65\x3c\x14\x07\x9e\x56\xdf\x5c\x11\xd1\x3f\x4c\xfb\x7d\x8e\xc8\
+\x11\x71\x37\x72\xdc\xed\x47\xef\x3f\x8c\x7e\x44\x51\x46\xca\x11\
+\x91\x8a\x54\xe6\x88\xbb\x45\x59\x7e\x25\xdf\xed\x9d\xcd\x29\xde\
+\x31\xdd\xaa\x01\x00\x00\x00\x00\x00\x60\x7e\x8c\xaf\x87\x8e\x4a\
+\x29\x4e\x44\xc4\x9d\x69\x5c\x2b\x47\xf9\x2f\x52\xee\xfd\xb1\x69\
+\x5c\x6b\x56\x72\x44\x1e\x85\xf5\x11\xd1\xef\xf5\x3e\x94\x52\x9c\
+\x4e\x65\xf9\x6f\x5a\x2e\x0d\x00\x00\x00\x00\x00\x00\x0e\x4d\x28\
+\x0f\x1d\x54\x44\xf9\x7f\xe7\x1c\xb7\xa6\x71\xad\x94\xe2\x44\xca\
+\xbd\xc7\xfb\xd3\xfe\xe7\xbd\xb8\xfb\xae\xa9\x5f\x73\x97\x7e\x44\
+\x3f\xf7\x7a\xdf\x5b\xa4\x38\x39\xcb\xfb\x00\x00\x00\x00\x00\x00\
+\xc0\xac\x08\xe5\xa1\x63\x72\x3f\x5f\x8f\xe8\xfd\xe9\x69\x5c\x2b\
+\x45\x1c\xcf\xfd\xb8\x1e\x29\x8e\x4f\xe3\x7a\x3b\xe4\xf4\xae\x1c\
+\xe5\x3f\x9f\xfa\x75\xf7\xd0\xcf\xf1\x76\x44\x1c\x9b\xc7\xbd\x00\
+\x00\x00\x00\x00\x00\x60\x9a\x84\xf2\xd0\x35\xc5\xda\xb7\x72\xc4\
+\x61\x8e\x6a\xbf\x47\xce\x71\x63\x26\x81\xfc\x50\x8a\xde\x9f\x1a\
+\x8e\xd9\x9f\x87\x3b\x3a\xe6\x01\x60\x76\xae\x5d\xbb\xd6\x76\x09\
+\x1c\x82\xdf\x37\x00\x00\x00\x80\xee\x13\xca\x43\xc7\xa4\x3c\x38\
+\x53\xfd\x28\x72\x2e\x5f\x2e\x22\xfa\xb3\x0c\xe4\x2b\x29\xc7\xcd\
+\x62\x4e\x7b\x49\x3f\xc7\xdb\xfd\xa2\x7c\xa9\x98\xd2\x87\x16\x00\
+\x80\x81\x6b\xd7\xae\xc5\xd9\xb3\x67\xdb\x2e\x83\x43\x38\x7b\xf6\
+\xac\x60\x1e\x00\x00\x00\xa0\xe3\x84\xf2\xb0\x44\x8a\x88\x22\xe5\
+\x78\x2b\xa5\xde\xa3\xb3\x3e\xef\xbd\xd2\x8f\x28\xfa\x39\xde\x9e\
+\x57\x30\x5f\xf4\x7b\x1f\xbe\x5b\x94\xff\x4f\xca\xf1\xed\x79\xdc\
+\x0f\x00\x96\x9d\x40\x7e\xf1\x09\xe6\x01\x00\x00\x00\xba\x4d\x28\
+\x0f\x1d\x53\x14\x77\xdf\x99\x23\xd6\x0e\xf3\xde\x9c\xe3\x76\x4e\
+\xf1\x8e\x69\xd7\x74\x5f\x29\x8e\xcf\xf3\xdc\xf7\xa2\xdf\xfb\x70\
+\x4a\x71\x3a\xe5\xf2\x6b\xf3\xb8\x1f\x00\x2c\x2b\x81\xfc\xf2\x10\
+\xcc\x03\x00\x00\x00\x74\x97\x50\x1e\x3a\x26\xf7\xd3\x43\x45\x94\
+\xff\x67\x8a\x48\x93\xbc\x3e\x45\xa4\x48\xe5\x37\x22\x22\x72\x3a\
+\x5c\x98\x3f\x15\x29\x8e\x47\x8e\xb7\x22\xca\xdf\x9f\xb4\xf6\xa3\
+\xe8\x47\xf4\x72\xea\x3d\xd2\x2f\xca\x97\x66\x7d\x2f\x00\x58\x30\
+\xb7\xcb\xb2\xbc\xef\x8b\x04\xf2\xcb\x67\xd2\x60\x7e\xf8\xf3\x71\
+\x7b\xd6\xf5\x00\x00\x00\x00\x30\x20\x94\x87\x8e\xc9\x29\xd6\x72\
+\xee\x7d\x6f\x8e\xf2\x5f\xde\x2f\xdc\x2e\x22\xca\x1c\xd1\x8f\xdc\
+\xfb\xe3\xf3\xaa\xef\x40\x29\x8e\x17\xd1\x7b\x5f\xe4\xf2\xab\x45\
+\x8a\x93\xf3\x08\xe7\x8b\x7e\xef\xc3\x31\xa7\x0e\x7d\x00\x58\x10\
+\x7f\x70\xfc\xf8\xf1\x03\x5f\x20\x90\x5f\x5e\x93\x04\xf3\xc3\x9f\
+\x8f\x3f\x98\x47\x3d\x00\x00\x00\x00\x08\xe5\xa1\x93\x72\x8a\x77\
+\xa4\xdc\xfb\xf7\x0f\x0a\xe6\x8b\x14\x27\xfb\x11\x77\x63\x0e\xc1\
+\x77\x13\xfd\x88\x22\xa7\xde\x23\xb9\x1f\xd7\x73\x94\xaf\x0c\x3b\
+\xd9\xd7\x66\x1c\xd0\xdf\x49\x11\xa9\x88\xe8\xcf\xf0\x1e\x00\xb0\
+\x28\x9e\x3f\x75\xea\xd4\xbe\x4f\x0a\xe4\x97\xdf\xfd\x82\xf9\xe1\
+\xcf\xc7\xf3\xf3\xaa\x07\x00\x00\x00\x60\xd5\xb5\x37\xea\x1a\x38\
+\xd0\x28\x98\x4f\xe5\x2b\xc7\x72\xbc\xd2\x2b\x7a\x7f\x3e\x22\x22\
+\x7a\xe5\x4b\x39\x22\xf7\x8b\xde\xbf\x17\x1d\x0b\xe4\xeb\x72\x8a\
+\x63\x11\xbd\xef\x5e\xeb\xc7\xfb\xa2\xc8\xaf\xf7\xfa\x6b\x6f\x1c\
+\x4f\xf1\x8d\x5e\xf4\xfe\x6c\xe4\xb8\x9d\x87\x01\x7a\x8e\xc8\x53\
+\xb9\xdf\xe0\x3a\x65\xe4\xb8\x15\x29\x0e\x6e\x0f\x04\x80\x25\x96\
+\x73\xfe\xf5\xf5\xf5\xf5\x1f\x78\xf3\xcd\x37\xa3\xd7\xeb\xed\xf9\
+\x1a\x67\x8f\xaf\xae\xb2\x2c\x63\x7d\x7d\x3d\x72\xce\xbf\xde\x76\
+\x2d\x00\x00\x00\x00\xab\x42\x28\x0f\x1d\x36\x0c\xe6\x4f\xf4\x22\
+\xbe\x23\xfa\xf1\xad\xc1\x63\xbd\x47\x86\x67\xc7\x77\x36\x90\xaf\
+\xeb\x47\x14\xd1\x4f\xef\x4c\xd1\x7b\xe7\x9d\x1c\x0f\xa7\x1c\xd7\
+\xfb\x39\xdf\x2c\x8b\xb5\xeb\xbd\x5e\xbc\x59\x1e\x8b\xb7\xa3\x1f\
+\xb7\x73\xf4\xbe\xef\xa8\x01\x7d\x8e\xc8\x29\xc5\x89\x2c\x98\x07\
+\x60\x85\x3d\xfd\xf4\xd3\xbf\xbc\xb5\xb5\xf5\xd4\x83\x0f\x3e\x78\
+\xf6\xf5\xd7\x5f\xdf\xf1\x9c\x0e\x79\x1e\x7c\xf0\xc1\x88\x88\x6b\
+\x4f\x3f\xfd\xf4\x2f\xb7\x5d\x0b\x00\x00\x00\xc0\xaa\x10\xca\x43\
+\xc7\xe5\x14\x6b\x79\x89\xfe\x59\xcd\x29\xd6\x52\x4a\xa7\xfb\xd1\
+\x3b\x9d\xca\x78\x6f\xbf\x5f\x7f\x2a\xd2\x34\x82\xf9\x22\xc5\xc9\
+\x7e\x8e\xb7\x05\xf3\x00\xac\xaa\x9c\xf3\x53\xeb\xeb\xeb\xff\xf8\
+\xf6\xed\xdb\x71\xe3\xc6\x8d\xb6\xcb\xa1\x23\xd6\xd7\xd7\xab\x2e\
+\xf9\xa7\xda\xae\x05\x00\x00\x00\x60\x95\x38\x53\x1e\xe8\x8c\x69\
+\x8d\xb2\xef\x47\xf4\x53\x8a\x75\x67\xcc\x03\xb0\xaa\x86\x5d\xd0\
+\x3f\x7b\xe6\xcc\x99\x58\x5f\x5f\x6f\xbb\x1c\x3a\x60\x7d\x7d\x3d\
+\xce\x9c\x39\x13\x11\xf1\xb3\xba\xe4\x01\x00\x00\x00\xe6\x4b\x28\
+\x0f\x2c\xa5\x1c\x71\xbb\x9f\x42\x0a\x01\xc0\xca\xda\xde\xde\xfe\
+\xf1\x18\x06\xf3\x67\xce\x9c\x89\xb2\x2c\xdb\x2e\x89\x16\x94\x65\
+\x19\xd5\xcf\x40\x44\xfc\xec\xf0\xe7\x02\x00\x00\x00\x80\x39\x12\
+\xca\xc3\x84\xfa\xbd\x5e\xfa\xb7\x2f\x7f\xed\x54\xdb\x75\x1c\xd6\
+\x73\x97\x2f\x5d\x69\xbb\x86\x26\x52\x44\x3a\xf2\x45\x72\x7c\xbb\
+\x2c\xca\x17\xa7\x50\x0e\x00\x2c\xa4\xed\xed\xed\x1f\xcf\x39\xff\
+\xd5\xf5\xf5\xf5\x6b\xef\x7b\xdf\xfb\xe2\xcc\x99\x33\x71\xea\xd4\
+\x29\x01\xfd\x92\x2b\xcb\x32\x4e\x9d\x3a\x15\x67\xce\x9c\x89\xf7\
+\xbd\xef\x7d\xb1\xbe\xbe\x7e\x2d\xe7\xfc\x57\x05\xf2\x00\x00\x00\
+\x00\xed\x58\x9a\x73\xaa\x61\xd6\x8a\xb2\xcc\xef\x7f\xf4\x91\x9b\
+\x07\xbd\x26\xe5\xb8\x9b\x22\xee\x56\xdf\xe7\x88\x32\xa7\x38\x36\
+\xfb\xea\x96\x4f\x8e\xc8\x29\xc5\x89\x9c\xe3\xd6\x51\xae\xd3\xeb\
+\xf7\xce\xe5\x28\x5f\x29\xa3\xf7\xfe\xbe\x0f\x22\x01\xb0\x82\x86\
+\xa3\xca\x7f\xf9\xc9\x27\x9f\xfc\xa1\xf5\xf5\xf5\xef\x5f\x5f\x5f\
+\x7f\x3c\x22\xde\x1b\x11\xc7\x5b\x2e\x8d\xd9\xba\x16\x11\xcf\xe7\
+\x9c\x7f\xdd\xb8\x7a\x00\x00\x00\x80\x76\x09\xe5\x61\x0a\x8a\x94\
+\xff\x5d\x3f\xd6\x7e\x2f\xe5\xde\xf7\xe4\x22\x1e\x4a\x11\x45\xea\
+\x95\xbf\x99\x23\xbe\x23\x15\x77\xff\x78\xce\xe9\xc1\x98\x46\xe7\
+\xf7\x8a\xc9\x39\x6e\xa5\x5c\x7e\x2d\xa5\xde\xa3\xfd\x23\x9c\x0f\
+\x9f\xa2\xf7\xf0\xdd\x54\x7e\x39\xf5\xee\x7e\x30\x15\xe9\xf4\x34\
+\x6b\x04\x80\x45\x51\x85\xf3\x6d\xd7\x01\x00\x00\x00\x00\xab\x46\
+\xd7\x28\x1c\x59\xf9\xaf\x22\xa7\xef\x8c\xdc\x7b\xbc\x9f\xe2\x54\
+\xce\x71\xab\x9f\xe3\x66\xaf\xe8\xfd\x47\xb9\xe8\x7d\x30\x45\x7a\
+\x4f\x8e\xf2\x1b\x11\x91\xdb\xae\x74\x11\xe5\xd4\x7b\x24\xe7\xb8\
+\x5d\xa4\x38\xd2\xd1\x01\x45\xee\x7d\xa4\x2c\xd2\x43\x65\x59\xfe\
+\x76\xca\xe3\x69\x06\x00\x00\x00\x00\x00\x00\x30\x4b\x42\x79\x38\
+\x82\x94\xe2\x44\x44\xef\xfb\x0e\xea\xe2\xee\xe7\x78\xbb\x4c\xbd\
+\xb3\x6d\x07\xf3\xe7\x37\x36\x2f\xb6\x75\xef\xa3\xca\x29\xd6\xfa\
+\x39\x6e\x46\x94\xff\xea\x28\xd7\xe9\x47\xf4\x7a\xbd\xde\xf7\x44\
+\x8a\x07\x52\x2a\xff\x70\x5a\xf5\x01\x00\x00\x00\x00\x00\xc0\x7e\
+\x84\xf2\xd0\x50\x11\xd1\x2f\xa3\xfc\x7a\xc4\x60\xbc\xfa\x24\xef\
+\xa9\x82\xf9\x94\xf2\x9b\xb3\xad\x6e\xd9\xf5\xbe\x2f\xa5\xf2\x85\
+\xa3\x5e\x25\x47\xdc\xce\xb9\xf7\x1d\x65\x51\xbe\x38\x8d\xaa\x00\
+\x00\x00\x00\x00\x00\x60\x3f\x42\x79\x68\x22\xc7\xed\x48\xf9\xf5\
+\x5e\xf4\xbe\xab\xe9\x5b\xfb\x39\xde\x8e\xde\xda\x37\x52\x8e\x3b\
+\xb3\x28\x6d\x55\xe4\xdc\x7b\xac\x5f\x94\x2f\x4d\xe3\x5a\xbd\x7e\
+\xef\xdc\x51\xc7\xe2\x03\x00\x00\x00\x00\x00\xc0\x41\x84\xf2\x30\
+\xa9\x1c\xb7\x23\xc5\x03\xfd\x9c\xde\x7d\xd8\x4b\x14\x45\xbc\x99\
+\x22\x7a\xd3\x2c\x6b\x15\x95\xbd\xde\x87\x22\xe2\xd8\x34\xae\xd5\
+\xcf\x71\xb3\x88\x28\xa7\x71\x2d\x00\x00\x00\x00\x00\x00\xd8\x4d\
+\x28\x0f\x93\xc8\x71\x7b\x70\x7e\x7c\xdc\x6d\xbb\x14\x06\x67\xcc\
+\xa7\x54\xfe\x41\x8a\x48\xd3\xb8\x5e\x7f\xf8\x41\x89\x94\xf2\x1b\
+\x45\x44\x7f\x1a\xd7\x04\x00\x00\x00\x00\x00\x80\x08\xa1\x3c\xdc\
+\xdf\x30\x90\xcf\x11\xf9\xa8\x97\xea\xa7\x58\x9b\x46\x49\x44\xe4\
+\xdc\xfb\x8e\xe8\x97\xff\xef\x74\xaf\x99\x1e\xea\xa7\xf2\x5f\x47\
+\x8e\xdb\xd3\xbc\x2e\x00\x00\x00\x00\x00\x00\xab\x4b\x28\x0f\x07\
+\x48\x39\xde\x9a\x56\x20\x9f\x22\x52\xea\xc7\x99\x1c\x82\xf9\x69\
+\xc9\x45\xef\x83\x45\x59\x7e\x65\xba\x17\xed\x3d\x5e\x14\xf1\x4e\
+\xc1\x3c\x00\x00\x00\x00\x00\x00\xd3\x20\x94\x87\x7d\x0c\x03\xf9\
+\x77\x4e\x2b\x90\x2f\xfa\xe5\xbf\xc8\xd1\xfb\x8e\xac\x5b\x7e\xaa\
+\xfa\xbd\xde\x87\xfa\x45\xf9\xd2\x54\xaf\x99\xe3\xed\x22\xc5\x29\
+\xc1\xfc\xe2\xdb\xde\xde\x4e\x57\x2f\x9f\x11\x28\x2b\x00\x00\x20\
+\x00\x49\x44\x41\x54\x5f\x7a\xb6\xed\x3a\x00\x80\xff\x9f\xbd\x3b\
+\x8b\x91\x2c\xbb\xef\xfc\xfe\x3d\xe7\xdc\x88\xc8\xa5\xf6\xbd\xbb\
+\xaa\x37\x71\x13\x69\x52\x1a\x69\x2c\x51\x18\x79\x4c\x8d\x17\x40\
+\x63\xc3\x80\x40\xb1\x01\x62\xe0\x77\xbf\x18\x03\x78\x00\xa3\x01\
+\x1b\x6d\xba\xa7\x31\x0f\x0d\xf8\x69\x1e\xfc\xe0\x27\xbf\x8c\x41\
+\x4c\x13\x3d\x30\xc6\xf6\xc3\x18\x1a\x48\x36\x47\x86\xc7\xc2\x50\
+\xd4\x88\xa4\x48\x91\xec\x66\x37\xbb\xba\xf6\xca\xca\x3d\xf2\xde\
+\xf3\x3f\x7e\xf8\x9f\x1b\x11\xb9\x54\x75\x2d\x59\x95\x55\x95\xbf\
+\x0f\x90\x9d\x99\x11\x37\xee\x3d\x71\xe3\x46\x54\x23\x7f\xe7\xff\
+\x3f\x22\x22\x22\x22\x22\x22\x22\x22\x87\x97\x42\x79\x91\x3d\x84\
+\xc2\x1a\x91\x53\xfd\x5a\xe3\x8f\x2a\x5a\xfa\xbf\x2d\xe4\xdf\x28\
+\x81\xc5\xfd\xd8\xdf\xd3\xe4\x4f\xfe\xb7\x7f\x7e\xf6\xa0\xc7\x10\
+\x2d\xff\x7a\x21\x7d\xb8\x5f\x6b\xcc\x83\xaf\x33\x1f\x02\x23\xad\
+\x31\x2f\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x8f\x42\
+\xa1\xbc\xc8\x0e\xa1\xd0\xc5\x26\xfd\xa2\x14\xc6\x8f\xbc\x2f\x08\
+\x83\x92\xfe\xd5\xf3\x1a\xc8\x03\xfc\xed\xbf\xfb\x9f\xdc\x38\xe8\
+\x31\x00\x04\xf2\xcb\x25\xa4\x2b\x90\x3e\xda\xaf\x70\xbe\x76\x49\
+\x18\xec\xc7\xbe\x9e\x94\x90\x09\xfd\xd7\x41\x8f\xe5\x69\xa1\x6a\
+\x79\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x39\x48\x0a\xe5\
+\x45\x76\x08\xd0\x95\x2e\xbf\xf6\xc8\xfb\x09\x8c\x22\xe9\x72\x47\
+\xfe\xea\xf3\x1a\xc8\x03\xc4\x94\x1e\xb9\xbd\xff\xbe\x29\xf9\x7c\
+\x2c\xf9\x6c\x2c\xe9\x83\x18\x98\xdb\x8f\x5d\xf6\x15\xf3\xfb\xb1\
+\xaf\x27\xa1\x24\x4a\xff\x35\xb9\x2d\xa8\x0d\xbf\x82\x79\x11\x11\
+\x11\x11\x11\x11\x11\x11\x11\x11\x11\x39\x28\x0a\xe5\x45\xf6\x12\
+\x39\xf5\x48\x0f\x2f\xe9\x83\x52\xd8\xcc\xe4\x17\xb4\x86\xfc\x93\
+\x65\x81\xb9\x1c\xf2\x2b\xc5\x58\x8d\xa4\xcb\xec\x43\xa5\x7b\x29\
+\x8c\x43\x4a\x7f\xb9\x0f\xc3\x7b\xe2\x4a\x60\x8b\xc2\xf0\xa0\xc7\
+\x21\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x72\x58\x29\x94\
+\x17\xd9\x47\x01\x42\x28\xb4\x16\xf2\x2b\xec\xe3\xfa\xe6\xf2\xe0\
+\x4a\xa0\x31\xf2\x8b\x40\x5b\x72\xfa\xd1\xa3\xee\x2f\xe4\xfc\x6b\
+\xa1\xb0\xb6\x0f\x43\x7b\xa2\x42\xa1\xa1\x56\xca\x1f\xf6\x8a\x79\
+\x55\xcb\x8b\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\xc8\x41\x50\
+\x28\x2f\xb2\x43\x81\xd4\x5a\xfa\xa3\x07\x7d\x5c\x84\x54\xa0\x94\
+\xc0\x00\x05\xf2\x4f\x95\x90\xf2\x17\x09\xe9\xea\xa3\xec\xc3\xc0\
+\x62\x48\x3f\xd8\xaf\x31\x3d\x41\x31\xd4\x4a\xf9\x50\x18\xd6\x9e\
+\xf6\x76\x90\x03\x3a\x48\x0a\xe6\x45\x44\x44\x44\x44\x44\x44\x44\
+\x44\x44\x44\xe4\x49\x53\x28\x2f\xb2\x43\x09\x0c\x86\x81\xd7\x42\
+\xbe\xff\x60\x3d\x42\x32\xc8\x8f\x73\x5c\xf2\x88\x4a\x3e\x1f\x42\
+\x59\x0a\x8f\x30\x61\xa2\x90\x7f\xe7\x59\xac\x96\xdf\xa9\x04\xba\
+\x83\x1e\x83\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\xc8\x61\
+\xa1\xb5\xae\x45\xf6\x90\xc9\x17\xca\x20\x7d\x3f\x5a\xfe\xf5\x02\
+\xe5\x53\x36\x1f\x18\xb4\x4f\x64\x60\xf2\x48\x4a\x09\x27\x42\xa1\
+\x0d\x91\xc5\x52\x18\x3f\xe8\xe3\x0d\xcc\x52\xfa\x69\xb4\xfc\xeb\
+\x0f\x3b\x86\xf7\xde\x79\xfb\xdd\x87\x7d\xec\xc3\xf8\xc7\xff\xe8\
+\x1f\x1e\xdf\xeb\xf6\xbf\xff\xdf\xfe\x77\x77\x9e\xe4\x38\x9e\x26\
+\x6f\xbd\xf5\x56\x00\xca\x37\xde\x78\xf3\x9b\x07\x3d\x16\x11\x11\
+\x11\x11\x11\x11\x11\x11\x11\x11\x11\x79\xfe\x29\x94\x17\xd9\x5b\
+\x08\x96\xbf\x62\xf1\xbe\x82\x79\x05\xf2\xcf\x90\x12\x68\x28\x8c\
+\x13\xe9\x5f\x67\xf2\x6f\x3f\xe8\xe3\x93\xe5\xbf\x11\x42\xb9\x6e\
+\x25\x9c\x79\x98\xe3\x7f\xfd\x8d\x37\x5f\x7f\x98\xc7\xed\xb7\x7f\
+\xfc\x8f\xfe\xe1\xbb\x0a\xe6\x15\xcc\x8b\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\xc8\xe3\xa7\xf6\xf5\x22\x77\x17\x82\xe5\xaf\xc4\
+\x94\x7e\x40\x60\x21\x42\x8a\x10\x23\xc4\x10\x18\xc5\x98\xbe\x77\
+\xd0\x03\x94\x87\x97\xc9\xbf\x1d\x0b\x1b\x0f\xfa\xb8\x02\xc5\x42\
+\xf3\xc9\xe3\x18\xd3\x93\xf4\xf5\x37\xde\x7c\xfd\x6e\x55\xf4\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\xb2\x7f\x14\xca\x8b\
+\xdc\x5b\xc8\x39\x7f\x31\x86\x72\xa5\x90\x3e\x2c\xa4\x8f\x0a\xe9\
+\xa3\x10\xca\x75\xb3\xfc\x1b\x07\x3d\x38\x79\x34\x16\xcb\xc6\xc3\
+\xac\x31\x3f\x28\x6c\x3e\x8e\xf1\x3c\x69\x87\x3d\x98\x7f\xeb\xad\
+\xb7\xc2\x77\xde\x79\xfb\xdb\x07\x3d\x0e\x11\x11\x11\x11\x11\x11\
+\x11\x11\x11\x11\x11\x79\xbe\x29\x94\x17\xf9\x74\xc1\x2c\x1c\x2b\
+\xe4\x8b\xfd\x97\x59\x38\x76\xd0\x83\x92\x47\x17\x2c\x1c\x35\xd2\
+\x9f\x1e\xf4\x38\x0e\xd2\x61\x0f\xe6\x45\x44\x44\x44\x44\x44\x44\
+\x44\x44\x44\x44\x44\x1e\x37\x85\xf2\x22\x72\x68\x95\xc0\xa0\x81\
+\x57\x1f\xb4\x5a\x3e\x67\x9e\xab\x10\xfb\x30\x07\xf3\xaa\x96\x17\
+\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x91\xc7\xad\x39\xe8\x01\
+\x88\x88\x1c\xa4\x4c\xbe\x40\x48\x7f\x46\xc9\x7f\xf3\x3e\x1f\x32\
+\x28\x21\x5f\x7c\xd8\xe3\xbd\xf7\xce\xdb\xef\x3e\xec\x63\xe5\xf1\
+\x78\xeb\xad\xb7\x02\x50\xbe\xf1\xc6\x9b\xdf\x3c\xe8\xb1\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\xc8\xf3\x47\xa1\xbc\x88\x1c\
+\x76\x81\x92\x7f\x33\x59\xfa\x6e\x8e\xf9\xdf\xfb\x94\x6d\x07\xa9\
+\xa4\x9f\xe6\x90\x5f\x79\xd8\x83\x7d\xfd\x8d\x37\x5f\x7f\xd8\xc7\
+\x3e\xa8\xf7\xde\x79\xfb\xdd\xbd\x8e\xf7\xde\x3b\x6f\xbf\x5b\x83\
+\x68\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x79\xcc\xd4\
+\xbe\x5e\x44\x04\x42\x8e\xf9\x77\x0b\xe9\xff\xb9\x47\x2b\xfb\x47\
+\x0e\xe4\xe5\xe9\xa5\x36\xf6\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\xf2\xb8\xa8\x52\x5e\x44\xc4\x85\x40\xfe\x1d\xcb\xe9\x87\
+\x29\xe6\x57\x4b\xf0\x75\xe3\x43\x20\xe5\x92\xfe\x65\x2a\xbc\x90\
+\x43\x7e\xf5\x80\xc7\x28\x8f\x51\xdf\xc6\xfe\xa0\xc7\x21\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\xcf\x17\x85\xf2\x22\x22\x53\
+\x21\xa4\xfc\xc5\x52\x58\x23\xa4\x8f\xc1\x13\xda\x58\xf2\xaf\x59\
+\x60\xf1\x80\xc7\x26\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\xcf\x20\x85\xf2\x22\x07\xc4\x72\x0e\x31\x25\x55\xe5\x3e\x85\
+\x4a\x60\x91\x92\xa7\x21\xbc\x56\x5f\x3f\x34\xde\x7a\xeb\xad\xf0\
+\xad\x6f\x7d\xab\xa8\x95\xbd\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\xec\x17\x85\xf2\x22\x07\xe4\xf2\x07\x1f\xce\x5d\xfa\xcc\
+\x6b\x1b\x07\x3d\x0e\x11\xd9\xae\x0f\xe6\xbf\xf1\xc6\x9b\xdf\x3c\
+\xe8\xb1\xc8\xe1\xf5\x9d\x77\xde\xfe\x76\x5d\x52\x41\x44\x44\x44\
+\x44\x44\x44\x44\x44\x44\x44\x9e\x71\xf1\xa0\x07\x20\xf2\xb4\x68\
+\xb7\xb6\x9e\x68\xf8\xa1\x40\x5e\xe4\xe9\xf5\xd6\x5b\x6f\x05\x55\
+\xcb\xcb\x41\x51\x20\x2f\x22\x22\x22\x22\x22\x22\x22\x22\x22\xf2\
+\x7c\x51\x28\x2f\x52\xfd\xeb\x7f\xf9\x47\xa7\x0f\x7a\x0c\x8f\xd3\
+\x7b\xef\xbc\xfd\xee\x41\x8f\x41\xe4\x59\xa2\x60\x5e\x0e\x82\x02\
+\x79\x11\x11\x11\x11\x11\x11\x11\x11\x11\x91\xe7\x8f\x42\x79\x91\
+\xea\x77\x7f\xff\xef\xde\x38\xe8\x31\x88\xc8\xd3\x45\xc1\xbc\x3c\
+\x49\x0a\xe4\x45\x44\x44\x44\x44\x44\x44\x44\x44\x44\x9e\x4f\x5a\
+\x53\x5e\x44\x44\xe4\x1e\x6a\x48\xaa\x35\xe6\xe5\xb1\xe9\x27\x7e\
+\x28\x90\x17\x11\x11\x11\x11\x11\x11\x11\x11\x11\x79\x3e\x29\x94\
+\x17\x11\x11\xf9\x14\x0a\xe6\xe5\x71\x51\x75\xbc\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\xc8\xf3\x4f\xed\xeb\x45\x44\x44\xee\x83\x5a\
+\xd9\xcb\x7e\x53\x20\x2f\x22\x22\x22\x22\x22\x22\x22\x22\x22\x72\
+\x38\x28\x94\x17\x11\x11\xb9\x4f\x0a\xe6\x65\xbf\x28\x90\x17\x11\
+\x11\x11\x11\x11\x11\x11\x11\x11\x39\x3c\xd4\xbe\x5e\x44\xe4\x10\
+\xfa\xd6\xb7\xbe\x55\x0e\x7a\x0c\xcf\xb2\xef\xbc\xf3\xf6\xb7\xd5\
+\xca\x5e\x1e\x96\x02\x79\x11\x11\x11\x11\x11\x11\x11\x11\x11\x91\
+\xc3\x45\xa1\xbc\x1c\x7a\xef\xbd\xf3\xf6\xbb\x07\x3d\x86\xa7\x99\
+\xce\xcf\xf3\x49\x81\xf2\xa3\x53\x30\x2f\x0f\x43\x81\xbc\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\xc8\xe1\xa3\x50\x5e\x0e\xbd\xc3\x12\
+\xaa\x3d\x6c\xcb\xed\xc3\x72\x7e\x1e\xd6\x77\xde\x79\xfb\xdd\xaf\
+\xbf\xf1\xe6\xeb\xf7\xbb\xbd\x26\x39\x3c\x3f\xbe\xf1\xc6\x9b\xdf\
+\xec\xdf\x57\x7a\x9f\xc8\xfd\x50\x20\x2f\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x72\x38\x29\x94\x17\x39\x24\x6a\x80\xf8\x2e\xc0\x83\
+\x84\xc8\x72\x6f\x0f\x7a\x5e\x9f\xf4\xb9\x7f\xef\x01\x27\x0d\xc8\
+\x83\xe9\xc3\x78\x55\xcd\xcb\xa7\x51\x20\x2f\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x72\x78\xc5\x83\x1e\x80\x88\x3c\x39\xdf\x78\xe3\
+\xcd\x6f\x7e\xe3\x8d\x37\xbf\xf9\xde\x3b\x6f\xbf\xab\x8a\xed\xfd\
+\x33\x7b\x5e\x0f\x7a\x2c\x3b\x7d\xfd\x8d\x37\x5f\x7f\x1a\xc7\xf5\
+\xbc\x99\xad\x9a\x17\xd9\x49\x81\xbc\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\xc8\xe1\xa6\x50\x5e\xe4\x10\x7a\x9a\x43\xe4\x67\xd9\xd3\
+\x7a\x4e\x15\xcc\x3f\x19\x0a\xe6\x65\x2f\x0a\xe4\x45\x44\x44\x44\
+\x44\x44\x44\x44\x44\x44\x44\xa1\xbc\xc8\x21\xa6\xaa\xf9\xfd\xa7\
+\x73\x7a\xb8\xf5\xc1\xbc\xc2\x79\x01\x05\xf2\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\xe2\x14\xca\x8b\x1c\x72\xaa\x9a\xdf\x7f\xfd\
+\xda\xe2\x4f\xd3\x39\x55\xb5\xfc\x93\xd3\xbf\xa7\x14\xcc\x1f\x5e\
+\xfd\xc4\x0c\x05\xf2\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x02\
+\xd0\x1c\xf4\x00\x44\xe4\xe9\x50\x43\xc4\x77\xc1\x03\xdc\x83\x1e\
+\xcf\xb3\xae\x0f\xe6\xbf\xf3\xce\xdb\xef\x5e\xfc\xc2\x97\xf8\xea\
+\x1f\xfc\xe1\x81\x9f\x53\x05\xf3\x4f\x56\x1f\xcc\xf7\xd7\x82\x1c\
+\x0e\x0a\xe3\x45\x44\x44\x44\x44\x44\x44\x44\x44\x44\x64\x27\x85\
+\xf2\x22\x32\x31\x1b\x24\x1f\xf4\x58\x9e\x17\x7d\x30\xfb\xde\x3b\
+\x3f\x7c\x17\x9e\xae\xea\x79\x79\xfc\x14\xcc\x1f\x2e\x0a\xe4\x45\
+\x44\x44\x44\x44\x44\x44\x44\x44\x44\x64\x2f\x0a\xe5\x45\x64\x97\
+\x99\x70\x5e\xed\xb7\xf7\x81\x02\xd9\xc3\x6d\xb6\x95\xbd\xae\x85\
+\xe7\x97\x02\x79\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\xb9\x1b\
+\x85\xf2\x72\xe8\x29\x78\xbe\x37\x9d\x1f\x91\xfd\xa3\xf7\xd3\xf3\
+\x4b\x81\xbc\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\xdc\x8d\x42\
+\x79\x39\xf4\x54\xb9\x2a\x22\x4f\xca\x77\xde\x79\xfb\xdb\x5f\xff\
+\xaf\xff\x9b\xbf\x17\x63\xb2\x83\x1e\xcb\x61\xf3\xbd\xef\xfc\x2f\
+\xdf\xfe\x8d\x6f\xfc\xbd\x7d\xff\xbc\xd7\x44\x0b\x11\x11\x11\x11\
+\x11\x11\x11\x11\x11\x11\xf9\x34\xf1\xa0\x07\x20\x22\x22\x72\x98\
+\x28\x90\x7f\xfe\xa8\x4a\x5e\x44\x44\x44\x44\x44\x44\x44\x44\x44\
+\x44\xee\x45\xa1\xbc\x88\x88\x88\x3c\xd7\x1e\x57\x95\xbc\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\xc8\xfd\x78\xa6\x42\xf9\xf7\xde\
+\x79\xfb\xdd\x83\x1e\x83\x88\x88\x88\x08\x78\xeb\x7a\x55\xc9\x8b\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\xc8\xa7\x79\xa6\x42\x79\x11\
+\x11\x11\x91\x07\xa1\x2a\x79\x11\x11\x11\x11\x11\x11\x11\x11\x11\
+\x11\x39\x68\xcf\x54\x28\x7f\xf1\x0b\x5f\x52\xb5\xbc\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x3c\x33\x9e\xa9\x50\
+\xfe\xab\x7f\xf0\x87\xaf\x1f\xf4\x18\x44\x44\x44\x44\xd4\xba\x5e\
+\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\xee\xd7\x33\x15\xca\x83\
+\xaa\xe5\x45\x44\x44\xe4\xfe\xa8\x75\xbd\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x3c\x0d\x9e\xb9\x50\x5e\xd5\xf2\x22\x22\xf2\x2c\
+\xb3\x8c\xaa\xab\x9f\x71\xaa\x92\x17\x11\x11\x11\x11\x11\x11\x11\
+\x11\x11\x91\x07\xf1\xcc\x85\xf2\x00\x5f\x7f\xe3\xcd\xd7\x55\x2d\
+\x2f\x22\x22\x22\x77\xa3\x2a\x79\x11\x11\x11\x11\x11\x11\x11\x11\
+\x11\x11\x79\x5a\x3c\x93\xa1\xbc\x88\x88\xc8\x33\x2b\x64\x55\x58\
+\x8b\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x1c\x22\xcf\x6c\x28\
+\xaf\x6a\x79\x11\x11\x11\x79\xd2\xd4\xba\x5e\x44\x44\x44\x44\x44\
+\x44\x44\x44\x44\x44\x1e\xd4\x33\x1b\xca\x03\x5c\xfc\xc2\x97\x50\
+\x30\x2f\x22\x22\xcf\x12\xad\x29\xff\xf8\xa9\x75\xbd\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x3c\x4d\x9a\x83\x1e\xc0\xa3\xf8\xea\
+\x1f\xfc\xe1\xeb\xef\xbd\xf3\x43\x85\xf2\xf2\x48\xbe\xf3\xce\xdb\
+\xdf\x3e\xe8\x31\x88\x88\xc8\xd3\x4f\x55\xf2\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\xf2\x30\x9e\xe9\x50\x1e\xa6\xd5\xf2\x5f\x7f\
+\xe3\xcd\xd7\x0f\x7a\x2c\xf2\x6c\x52\xc0\x22\x22\x4f\xca\xb7\xbe\
+\xf5\xad\x72\xd0\x63\x78\xde\xa9\x4a\x5e\x44\x44\x44\x44\x44\x44\
+\x44\x44\x44\x44\x9e\x36\xcf\x74\xfb\x7a\xf0\x6a\xf9\x83\x1e\x83\
+\x88\x88\xc8\xfd\x8a\x09\x05\xf3\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x87\xc8\x33\x1f\xca\x03\x7c\xfd\x8d\x37\x5f\xd7\xda\
+\xf2\x22\x22\xf2\x2c\xd0\x9a\xf2\xcf\x26\xb5\xae\x17\x11\x11\x11\
+\x11\x11\x11\x11\x11\x11\x91\x87\xf5\x5c\x84\xf2\x22\x22\x22\xcf\
+\x8a\x18\x93\x1d\xf4\x18\x9e\x57\x6a\x5d\x2f\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x4f\xa3\xe7\x26\x94\x57\xb5\xbc\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x3c\x6d\x9e\x9b\x50\
+\x5e\x44\x44\xe4\x59\xa0\x35\xe5\x1f\x8f\xc7\x59\x25\xaf\xd6\xf5\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\xf2\x28\x9a\x83\x1e\xc0\
+\x7e\xea\xab\xe5\x55\x31\x2f\x22\x4f\xa9\x9d\xa1\x9e\xc2\x59\x11\
+\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x91\xe7\xdc\x73\x15\xca\
+\xf7\xbe\xfe\xc6\x9b\xaf\x1f\xf4\x18\xe4\xd9\xa0\x09\x1c\xf2\x04\
+\x05\xe0\x55\xe0\x38\x30\x02\x7e\x00\xac\x1e\xe4\x80\xe4\x60\x58\
+\x26\xa8\x5a\xfe\xd9\xa1\x2a\x79\x11\x11\x11\x11\x11\x11\x11\x11\
+\x11\x11\x79\x54\xcf\x65\x28\x2f\x22\xf2\x14\x4a\xc0\x6f\x01\x47\
+\xea\xd7\x35\x60\x0d\x55\xcb\x8b\x3c\xb2\xc7\xd9\xba\x5e\x44\x44\
+\x44\x44\x44\x44\x44\x44\x44\x44\xe4\x51\x29\x94\x17\x11\x79\x32\
+\x22\x1e\xc0\x5f\x06\xce\xd6\xdb\xd2\xc1\x0d\xe7\xae\x32\x4f\xdf\
+\x44\x81\x88\x9f\xab\xa3\xc0\x66\xfd\xb2\x03\x1d\xd1\x23\x50\x95\
+\xbc\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\xc8\xe1\xa2\x50\x5e\
+\x0e\x25\xcb\x79\xb6\x15\xf1\xb3\xd8\x96\x58\xa1\xde\xb3\x21\x00\
+\x0b\xc0\xcb\x78\xeb\xfa\x8b\xc0\x32\x70\x06\xf8\x3b\xc0\xd2\x8e\
+\xed\x23\xdb\xc3\xe6\xc0\xee\xd7\x7a\xaf\xdb\xee\x76\xec\x07\xbd\
+\x4e\x02\x70\x05\xf8\x21\x70\x87\x83\x09\xbe\x03\x1e\xc0\x8f\xf0\
+\x8e\x02\xa7\x80\x93\xf5\xeb\x1c\xd0\xe2\x13\x1b\x3e\x66\xda\x6d\
+\xa0\x45\xef\x89\x43\xeb\x71\x56\xc9\xab\x75\xbd\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\xec\x07\x85\xf2\x72\xe8\x8c\x37\x36\xe2\
+\xb7\xff\xa7\xff\xf1\x33\xb7\xaf\xde\x5c\xec\x6e\x7e\x02\xf0\x1f\
+\xdd\x65\xd3\xc2\xfe\x05\x7d\x85\xfb\xdb\x5f\x5b\xbf\xf6\xd2\x07\
+\x43\x09\x0f\x4c\xb7\xf0\xd0\xb4\xdf\xaf\x01\x1b\x3b\x8e\x91\x80\
+\x15\xa6\xd5\xcf\xfd\x76\xf7\x3b\x26\x05\x9d\x0f\xae\x0f\x95\x4f\
+\x01\x9f\x03\x5e\xaa\x3f\x0f\x98\x06\xc8\x3f\x02\xc6\x3b\x1e\x37\
+\x82\xf8\x9b\x44\xdb\xc0\xe8\xea\x7e\x3a\xe0\xa7\x6c\xbf\x26\x3e\
+\x87\x07\xfd\xeb\x40\x20\x32\xc0\x58\x01\x3e\x9c\xd9\xa6\x89\xc4\
+\x5f\x37\xe8\xc0\xf2\xec\xed\x78\x95\xf9\xd5\x44\x5a\xc9\xe4\x6e\
+\x8f\xb1\x9f\x03\xce\xd0\x70\x83\x8e\x0f\xf0\x90\xbe\xbf\xce\xf6\
+\x53\x7f\x3d\xc7\x3a\xae\x45\x3c\x78\x3f\x05\x9c\x07\x4e\xcc\x6c\
+\x53\xf0\x6b\x78\xb3\xfe\x7e\x1c\xef\x36\x50\xf0\xf3\xf8\x31\x70\
+\x1d\xb8\xc1\xb4\x8a\x5e\xd7\xae\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x3c\x15\x14\xca\xcb\xa1\x93\xdb\x1c\x7e\xf2\xfd\xef\
+\x5f\x34\xcb\x61\xc1\xf3\xca\x93\xf7\xd8\x7c\xbf\x2a\x24\x03\x1e\
+\x3e\x7e\xda\xfe\x9a\xba\xdd\xbd\xc6\x32\x87\x07\x91\x7d\x70\x9b\
+\x98\x86\xeb\x2d\x1e\x5e\xe6\xba\x9f\x13\x78\x48\xb9\x55\xbf\x8f\
+\x99\x06\xf4\x5d\xdd\xde\xea\xcf\x5b\xf5\x7e\xab\x5f\xeb\x78\xc8\
+\xdf\x87\xff\x6d\xdd\xae\x0f\x3b\x77\x7e\x3f\xec\x02\xfe\xda\x5c\
+\x02\x3e\x8b\x57\xc3\x8f\x80\x51\x4a\x6c\xe6\xcc\x4d\xe0\x16\xbb\
+\x27\x4e\xb8\x86\x8e\xce\x86\x18\x37\x12\x69\x2b\x33\xb9\x36\x2f\
+\x91\xd2\x1d\x72\xde\x48\x89\x9c\x33\xa7\x88\x18\xc6\x18\x62\xc1\
+\xac\x05\x16\x20\x9d\x85\x7c\xbb\xee\x6d\x64\xd8\x31\xe0\x97\xf8\
+\xeb\xdd\x4b\x11\xe6\x0d\x5e\x2b\xe4\x2d\x60\x15\x0f\xb2\x6f\x33\
+\xad\x36\x5f\x05\x06\x74\x9c\x24\xa5\xf3\xe4\xbc\x04\xfc\x04\xf8\
+\x64\xc7\xbe\xf6\x7a\xfe\xec\xf9\xdc\xb6\xdf\x1f\x81\x79\xe0\x18\
+\x1e\xc0\x9f\xc5\x43\xf6\x85\xba\x4d\x60\x7a\xbd\x9d\xc6\xaf\x39\
+\x03\xb6\x48\x44\x32\x56\xcf\x6b\x48\xd0\x66\xdf\xfe\xd5\x7a\xce\
+\x37\xea\xf8\xaf\xe3\xd5\xf4\x4b\x3c\x9d\xed\xf8\xe5\x19\xa0\x2a\
+\x79\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\xd9\x2f\x0a\xe5\xe5\
+\x50\x5a\x38\x72\x6c\x73\xe9\xd6\xad\x23\x5b\xdd\x16\xc0\x05\xbc\
+\xf2\x7c\xa7\x7e\x0d\xeb\x5b\x77\xdd\x51\x22\x90\x59\x88\x70\xd2\
+\x62\xac\xc1\x5f\xed\x40\x6e\x06\x5e\x65\x9c\x99\xb4\x12\x4f\xa1\
+\xe6\x9a\x17\x88\x93\xec\x3d\x60\x16\x99\x86\x9e\x3b\x5b\x86\xcf\
+\x31\x1c\x9e\xa6\xeb\xc6\x18\x2d\xd8\x8d\xba\x5d\xaa\x5f\x19\x20\
+\x25\x42\xce\x0c\x99\x06\xf6\x19\x0f\x29\xc7\x4c\x2b\xad\x47\xf5\
+\x7b\x87\x87\xa0\x4d\xdd\x47\x5f\xad\xdc\x87\xf5\x73\x33\xfb\x36\
+\x3c\xd0\xef\xc3\xd1\x7e\x9f\xeb\xf5\x7b\x1f\xf8\x6f\x01\x43\x3c\
+\x10\xed\x27\x06\xf4\x8f\x79\x9e\x43\xd1\x80\x07\xcc\xbf\x82\xb7\
+\xa9\xef\xab\xe2\x5b\xfc\xbc\xdc\x09\xb9\xb9\x06\xdd\x3c\xa4\x97\
+\x21\x9f\x05\x96\x13\xe9\x72\x9e\xcd\xb8\x4b\x1a\x42\x6e\x81\x8f\
+\x33\x79\x33\x91\x42\x26\x7c\x04\xdd\x19\x72\x7e\x81\x18\xc9\xd9\
+\x00\x16\x08\xe9\x2f\x20\xdf\x01\xeb\xcf\xeb\x10\xf2\xab\xc0\x8b\
+\x40\x17\x89\x8d\x61\x09\xb8\x0c\xa9\x56\xc3\xfb\x25\x63\x09\x20\
+\x87\xe0\xd7\xca\x71\xbc\xa5\xfe\x17\x89\x71\x1d\xb3\x4f\x80\x9b\
+\x34\xcd\x26\xb0\x44\xd7\x81\x4f\x0c\xf8\x6d\x3c\xe0\xfe\xb9\xef\
+\x93\xad\x1d\xcf\xff\x05\x3c\x18\xff\x2b\xb6\xbf\x5f\xa2\x8f\x8d\
+\x45\x3c\x60\x3f\x83\x4f\x14\x39\xc2\xf4\xba\xeb\x27\x7b\xc4\x08\
+\x97\x2c\x71\x93\xcc\xb8\x9e\xc7\x63\xf8\x84\x80\x06\x38\x46\x66\
+\x00\xfc\x5b\x20\x36\x0d\xa3\xd2\x71\x3e\xc1\x7c\x4e\x0c\xc8\x6c\
+\xd6\xfd\x8d\xf0\x89\x11\xbf\x86\xbf\xaf\xaf\xe3\x6d\xee\xaf\xe1\
+\xd7\xee\xbd\x26\x16\xc8\x33\xe6\x71\xb6\xae\x17\x11\x11\x11\x11\
+\x11\x11\x11\x11\x11\x11\xd9\x2f\x0a\xe5\xe5\xd0\x99\x5b\x9c\xb7\
+\xff\xfc\xbf\xfc\xfb\xdf\x5f\xba\x7d\x6b\xf8\x7f\xfd\x93\xff\xf9\
+\xbf\x20\xb1\x4c\x68\x3e\xa6\xeb\x76\x06\xc7\xc7\xf0\x70\xf5\x63\
+\xa0\xd0\x34\x91\xae\x3b\x93\x48\x63\x00\x0f\x54\xd3\x10\x72\xb6\
+\x13\xa7\xe6\x38\x73\x7e\x95\xe1\x7c\x24\x0d\x0b\xb6\x05\xef\xff\
+\x64\xc0\xfa\xea\x55\x3c\xb0\xac\x41\x7b\x06\x68\x39\x72\xfc\x0e\
+\x9f\xf9\xd5\x75\x48\x50\xba\xc8\xc7\xef\x1f\x4f\x37\x6f\x5d\x0d\
+\xe4\xd2\x79\xeb\x6e\xdf\x38\xa5\x42\xce\x37\xb9\xf4\xea\x80\x13\
+\x67\x96\xf9\xe8\xfd\xd3\xe9\xfa\x27\x73\xd9\xc7\xd6\x44\x62\xb0\
+\xc8\x3a\x27\xce\x2c\xe4\xc1\xc0\x58\xb9\x7d\x84\xf5\xf5\x5b\x78\
+\xf0\x49\x8c\xcc\x19\xf1\x0e\xa7\xcf\x36\xac\xad\x35\xac\xaf\x6f\
+\x80\x6d\x44\x48\x06\x46\x8c\x27\x68\x86\xc6\xd6\x66\x8b\xb7\xb9\
+\x8f\x40\x21\xc6\x05\x60\x03\xb3\x3e\x6c\x2f\x78\x50\xdf\xb7\xbf\
+\x5f\xc4\x03\xd6\x84\x7f\x8e\x84\xfa\xfd\x14\x70\x13\xaf\x56\xee\
+\x27\x06\x64\xbc\x6d\xfb\x3a\xd3\x6a\xfd\x71\xfd\x39\xcf\x7c\xef\
+\x5b\xa9\xcf\xb6\x54\x7f\x5a\xc3\xfc\x80\x87\xcd\x17\x81\x57\xf0\
+\xc0\xf9\x28\x30\x20\xa5\x4c\xce\x1b\xc0\x4d\x1a\x96\xe9\x38\xd5\
+\xd1\x7d\x0e\x68\x20\x37\xc4\xf8\x2a\xb0\x9e\x2d\x0f\x26\x7b\x8b\
+\x04\x72\x1e\xe0\xad\xee\xbf\x0b\x2c\xcd\x04\xf6\x37\x80\x1f\x63\
+\x35\x80\x8f\xf1\xb7\xc8\x79\x19\x3f\xcf\xb3\xcb\x0f\x5c\x01\xba\
+\xc1\x00\xda\xd6\x86\x78\x90\x7e\x03\xaf\x88\xaf\xf2\x24\x92\xae\
+\xdf\x3e\xaa\xcf\xe5\x37\x81\x39\x22\x27\x31\xce\xc6\xae\xcb\xe6\
+\x13\x07\x6e\x85\x26\x2f\x77\x1d\x19\xbf\xe6\xfe\x5d\xfc\xb5\xfd\
+\x18\xf8\x19\x1e\x72\x37\xc0\xef\xe0\x6d\xf5\x57\xeb\x78\x4e\xe2\
+\xd7\xc7\x29\xfc\x5a\x19\xd6\xdb\xb7\xf0\x2a\xf9\xbe\x8b\xc3\x0a\
+\xfe\x1e\x33\x60\xc1\x20\x90\xf9\x25\xb0\x8c\xb7\xd1\x5f\x88\xf0\
+\x45\xa0\x33\x6f\xd5\x3f\x8f\xf1\x97\x40\xdb\x75\x74\x7e\xce\x63\
+\x20\xdb\x7a\x7d\xcc\x11\x60\x94\xfc\x45\xa0\xbe\x26\x0b\xc0\x17\
+\xea\xb1\xd7\x80\xab\xf5\x79\xdf\xc6\xaf\xc3\xfd\x5c\xa6\x42\x44\
+\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x64\x17\x85\xf2\x72\xe8\
+\xc4\x94\xca\x2b\x9f\xff\xfc\xc6\x4b\x39\x6f\xfe\xd9\x3f\xfb\xa7\
+\x90\x59\x85\x6e\x93\xdd\xc1\x5c\x83\x07\x7d\x1e\x4a\x97\x72\x11\
+\xf8\x6a\xa1\xdc\xa6\xaf\xfe\x2e\xf9\x38\xf0\x33\x5e\x7c\xf5\x3a\
+\xaf\x7d\x69\x65\xf2\x48\xdb\x8a\x5c\xfe\x70\x81\xf5\xd5\x23\x78\
+\xa8\xd8\xb7\x15\xf7\x70\xb2\x1b\xff\x8c\x53\xa7\x57\x58\x38\x55\
+\x28\x16\xb8\x79\xbd\x04\x6e\x6f\x76\x5e\xe1\xfb\xab\x78\x58\x99\
+\xc8\xf9\x08\x29\xfd\xbf\x2c\x1c\x5f\xe6\x85\x5f\x59\xe6\xf6\x8d\
+\x58\x6e\x7e\x72\x09\xe3\x04\xb0\x66\xd8\x59\x9a\xe1\x9f\xf2\x99\
+\x2f\xdd\xe2\xec\x8b\x9b\x7c\xef\xbb\xc7\x58\xff\xd0\x2b\x8e\x61\
+\xc9\x8c\xc0\xdc\xfc\x0d\xbe\xfc\xdb\x2b\xbc\xff\xe3\x86\x0f\x7e\
+\x92\x81\x53\xd6\x57\x3a\x9f\x38\xfd\x09\xe7\x2f\xb5\xfc\xf8\xfb\
+\xc7\x30\x3b\x85\x87\xa5\xd7\x39\x73\x21\xd2\x0c\x16\xb9\xf2\xd1\
+\x51\xcc\x32\xb0\x48\x13\x33\xc3\xb9\xc0\xfa\xfa\x12\xd3\x30\xf3\
+\x24\x31\x9e\xc3\x6c\xa9\x8e\xf9\x16\x70\x9c\x18\xcf\x60\x76\xbd\
+\x6e\x33\xa9\xe6\xaf\xbf\x37\x4c\xdb\x93\x17\x3c\x14\xce\xf5\xf6\
+\x31\x1e\x42\x6f\xd4\x73\xdf\x07\xf9\x9b\x75\xfb\xbe\xdd\x3e\x6c\
+\xef\x28\xf0\xa8\xa1\xea\xbd\x5a\x54\x87\x99\xfb\xfb\xaa\xf8\x57\
+\xf1\x40\xfe\x34\xd3\x0e\x03\x19\x58\x22\x84\x1b\xf8\xc4\x82\x93\
+\x74\x7c\xb1\xde\x7e\xb9\x7e\x7d\x1e\xb3\x2b\xc0\x2f\xf0\xaa\x72\
+\x00\x1a\x5f\xfc\x7d\x1e\x9f\x90\x71\x03\xaf\x4a\xbf\xcb\x68\x6a\
+\x00\x3d\x1a\xdd\x64\x3c\xee\x03\xe5\xc9\x52\x02\x6d\x4b\x61\x34\
+\x9a\x63\x3c\xde\x04\x6e\x8e\x18\x6d\x8e\x77\x2d\x5f\xbf\x5d\x22\
+\xad\x64\xcb\xef\x03\x97\x19\x30\xb0\xd6\xd7\x6c\xcf\xe4\x4b\x74\
+\x24\x48\x9b\x29\xe5\x5b\xb5\x05\x7f\x43\x4a\x5f\x20\xe7\x97\xf0\
+\xf6\xf8\xbf\xac\xc7\xbf\x09\xfc\x2e\x7e\xad\xf7\xaf\xcd\x5c\x22\
+\xc5\x4c\x2e\x78\x40\x9e\xf0\x6b\x24\xe2\x55\xfa\xeb\xf5\x7c\x1e\
+\xc5\x03\xf5\x1b\x0d\xb5\x3e\xbf\x3f\xdf\x91\x62\xc6\x55\xe0\x18\
+\xc6\x70\xc7\xd0\x23\x58\xdf\xe6\xbe\x00\x7f\x0d\x84\x4c\x1e\xe1\
+\x13\x02\x8e\xc3\xe4\xc9\x0f\xf0\x89\x00\x27\xf1\xf7\xd8\x5a\x3d\
+\xd7\x9f\xe0\x55\xf4\xfd\x44\x12\x50\x48\xff\x4c\x78\x9c\x55\xf2\
+\x6a\x5d\x2f\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\xfb\x49\xa1\
+\xbc\x88\x67\xc6\x85\x66\xfa\x86\xe8\xba\xbd\xaa\x67\xf3\x10\xb8\
+\x69\xd8\x27\xf4\x21\xad\x11\x88\x71\x36\xb4\xad\x9b\x4e\x7e\x1a\
+\xe0\x01\xeb\x27\xf5\xf7\x21\x70\x0e\x33\x68\x2d\x4e\xb7\x2c\x01\
+\xba\x52\xef\xbf\xc1\x34\xb8\x7c\x99\xbc\x2b\x30\x1e\xe0\x61\xe3\
+\x20\x46\x8e\x1a\x40\x4a\xb3\xf7\x17\xf3\x80\xb1\x5f\xc7\xde\xb0\
+\x62\x84\x50\x52\xe2\x78\x29\xfc\x8a\x19\x37\x81\x45\x9a\xe6\xa7\
+\x2c\x1e\xd9\x04\xce\x10\xe3\xd1\x5a\x8d\x3d\xe4\xdc\x4b\x57\x49\
+\xa9\x70\xe5\xa3\x2f\x02\x6d\x84\x05\x1b\x2e\xfe\x15\xe7\x2f\x75\
+\xbc\xff\xe3\x2f\x82\xc5\x18\x31\x8b\xcd\x2d\xe6\x8e\xfe\x94\xf5\
+\x3b\x73\x98\x79\xa8\xdc\x34\x1b\x34\x4d\x66\x73\xf3\x44\x3d\x7e\
+\x82\xb8\x40\x24\x62\xf6\x51\x3d\xaf\x67\x20\x9e\x01\xbb\x91\x48\
+\x37\x32\xf9\x28\x30\x24\xc6\x82\xd9\x51\xa6\x2d\xef\x53\x7d\x1e\
+\x1b\x4c\x2b\xef\xd7\xf0\x09\x00\x9b\xf8\xf3\x9c\xaf\xe7\x78\x05\
+\x0f\xed\xfb\x96\xfb\xb3\x4b\x01\xf4\xed\xf9\xa9\xfb\xeb\x5b\xa7\
+\xf7\x95\xfe\x23\xa6\xcb\x01\x2c\xd4\x73\x3c\xa8\xf7\x0d\xeb\xcf\
+\x05\x0f\x90\xe7\xea\xed\x7d\xeb\xff\x2d\xbc\x4d\xfa\xad\x06\x4a\
+\xe9\xba\xb3\xd9\xdb\xc8\xdf\x04\x7e\x00\xbc\x5f\xc7\xb5\x58\xf7\
+\xfd\x71\xdd\xfe\xfd\xfe\x05\xab\x49\xf0\x11\x3c\xa4\x5e\xaa\xd7\
+\xc0\x5e\x02\x99\x75\x06\xac\x30\x1e\xdf\x38\xc1\x09\x96\x58\xf2\
+\x6b\xd5\xa7\x54\x14\x6e\x50\x18\x8f\xe7\xf1\x30\xfa\xd6\x98\x71\
+\x7f\x2d\xdc\x2d\x68\x8e\xd9\xab\xe9\x2f\x03\xbf\x9c\x2c\x74\x00\
+\x2c\x2e\xd2\xac\xad\x71\x14\xf2\xc5\x9c\x79\x11\x38\x0f\x29\x93\
+\xf3\x9d\xe4\xcf\xfd\xf3\xd9\xdb\xf6\xff\x2a\xf0\xc1\x8e\x73\x39\
+\x00\x4a\xad\x58\x5f\x84\xd8\x81\xad\xe1\x2d\xf0\x8f\x12\xe3\xcb\
+\x98\x5d\xaa\xcf\x77\xbd\x3e\xae\xcc\xb6\x49\x00\x30\x23\xe2\x13\
+\x20\x8e\xb0\x7b\x69\x07\x98\x2e\xd3\x30\xf0\xc3\x77\x46\xd3\x6c\
+\xd2\x75\x0b\x78\x58\xbf\x5e\x4f\x71\x3f\xa9\xa3\x3f\x17\x8b\xf8\
+\x6b\x79\xb1\xde\xbf\x86\x87\xf3\x97\xf1\x89\x05\x1b\xec\x5d\x45\
+\x7f\xaf\xa0\x56\x61\xbe\xec\x87\x4b\x78\xd7\x8c\xfd\xb8\x9e\xfa\
+\x49\x4f\xf2\x74\x68\xd8\xde\x0d\xe6\x7e\xf4\xff\x8f\x31\xfb\xf9\
+\x97\x80\x3f\xc7\x3f\xa7\x44\x44\x44\x44\x44\x44\x44\x44\x44\xe4\
+\x19\xa0\x50\x5e\xc4\xab\x78\xad\xe9\x1a\x3a\x66\x5b\xd8\x37\x65\
+\xfb\xdf\xce\xd3\xa8\xb6\x02\x37\xfc\x0f\xe2\xbe\x46\xb6\xb1\xc6\
+\xc6\xd6\xda\xb6\x5d\x96\x12\x80\x90\xbc\xff\xfc\x96\x4d\x03\xe6\
+\x45\x6a\xf8\x48\xd9\x1e\xee\xd5\x23\xcd\x31\x0d\xa4\xfd\x2b\xb1\
+\x2d\x71\x37\xa3\xe0\x7f\x88\xbf\x66\xc6\x70\x8f\xb8\x25\x02\xaf\
+\x31\x5d\xdb\x7d\xfa\x4c\x33\x46\x9c\xac\x25\x9e\x66\xee\x2d\xb5\
+\x55\xfd\x9c\xaf\x75\x5f\x97\xac\x37\x6b\x80\x39\x83\x79\x02\x85\
+\x08\x60\xc7\xf0\x56\xe9\x2f\x02\x6b\xcc\xcd\xdf\x61\xf5\xce\x45\
+\xbc\xdd\xf8\x0b\x10\xff\x8c\xb9\xc5\xcb\x6c\x6e\xfe\x26\xc4\x45\
+\xb0\x5b\x2c\xcc\xbd\x4f\xd3\x44\x96\x97\x5f\xc4\xdb\xe6\x0f\x99\
+\x9b\x2f\x6c\x6e\x34\xd9\x72\x04\x8e\x32\xbf\x18\x98\x5f\x9c\x63\
+\xe9\x46\x57\x27\x07\x1c\xa1\x69\x86\xb1\xeb\x5a\x9b\x76\x2c\x58\
+\xa8\xe3\x5d\xad\xdf\xfb\xf5\xcc\x57\xf1\x50\xde\x98\xb6\xc7\xef\
+\xcf\xf9\xa0\x9e\x93\x3e\xd8\xe8\x83\xf6\xfe\xfc\xcf\x56\xf1\x1b\
+\xd3\x76\xea\x7d\x78\xdb\xb7\xef\x2f\xf5\xf8\xfd\x76\x2d\xde\x0a\
+\x7d\xa9\x1e\xe7\x65\x83\xc5\xda\x85\x20\xc0\xd1\x7f\xf1\x3a\x2b\
+\xb7\xdf\x9d\x9e\xfe\x7f\xa7\xee\x73\x0d\x9f\x50\x70\x83\xed\xa1\
+\x5b\x1f\x1a\x6f\xd6\x6d\x76\xf9\x3d\x48\x7f\x0c\x99\x96\x0d\x60\
+\xa5\x06\xf2\xee\xd6\xe4\x39\xf4\x3a\x3c\x90\xde\x73\x5f\x33\xfa\
+\x17\xfc\x1a\xd3\x8e\x0e\x00\xac\xf9\x23\xaf\xe3\x41\x7a\x03\x9c\
+\x84\x7c\x11\xb8\x94\xe1\x2c\x7e\xae\xfa\x31\x1f\x4b\xa4\xe5\x4c\
+\x9e\x1d\xff\xaf\xd5\xfd\x5f\x00\xbb\x8a\xbf\x46\x40\x0a\x58\x06\
+\x9f\xe4\x30\xc2\x5f\x8f\x48\x8c\x77\xb0\x6d\xb9\x7b\xc0\xbb\x07\
+\xdc\xc6\x27\xb6\x2c\xee\x18\xfb\x10\x6f\x93\x3f\xa8\xe3\xac\xcf\
+\xbc\x03\x7f\x8d\x96\xeb\xf8\x8e\xe2\xaf\xcb\x4f\xeb\xb6\xf3\x09\
+\x4e\xe4\xe9\xb1\x5b\x7c\x72\xc7\x49\xe0\xf3\x4c\x27\x7e\xdc\xac\
+\xfb\xe8\x3b\x39\xf4\x13\x39\xfa\x6b\xa9\x9f\xbc\x71\xb4\x6e\xfb\
+\x97\x28\x00\x7d\xe6\x1d\x70\x95\x7c\x00\x7e\x0f\xf8\x1a\x3b\xde\
+\x8f\x3d\x9f\x69\xf5\xe9\xb7\xe1\xd7\xf4\xa9\x08\x3f\xb3\xbd\x27\
+\xb4\x3c\x51\x31\x12\x7c\x14\x11\xc3\xca\x8e\x3b\xeb\x7d\x06\xfd\
+\xe7\x58\x8c\x61\x32\xec\xe9\xe8\xeb\x7d\x93\x89\x71\xd3\x5d\xf0\
+\x14\x3c\xc9\x7b\x3b\x86\xff\xbb\xf9\x3e\x0f\x36\xe1\xe2\x34\x3e\
+\x29\xe9\x17\xf5\xf7\xfe\x73\xf1\x7f\xc0\x27\x7e\x89\x88\x88\x88\
+\x88\x88\x88\x88\x88\xc8\x33\x40\xa1\xbc\x3c\x37\xde\x7b\xe7\xed\
+\x77\xbf\xfe\xc6\x9b\xaf\x3f\xc4\x43\x0b\x60\xdd\xb6\x00\x7e\x00\
+\x4d\x29\x74\xd0\x34\x84\xae\xa3\x90\xf3\x10\x7f\xcf\xbc\x84\x87\
+\x83\x05\xd8\x04\x2b\x8c\x57\x8c\xdc\x41\xda\xfe\x96\xca\xe4\x61\
+\x8c\x0c\x30\x5e\x00\x8e\xe3\x3f\x43\x29\x7b\xbd\xf7\x02\x91\x21\
+\x46\x66\x1a\x10\x1e\x49\x39\x5b\x5e\x5d\xc9\xe4\x0e\x32\x44\xa2\
+\x19\x76\x1d\x0f\x5c\xf7\x0a\x8e\x0a\x1e\xe6\xfc\x02\x38\x45\xce\
+\xd3\x3f\xfe\x27\x12\x99\x05\x3c\x68\xdc\x9c\xc4\xfd\x31\xce\x61\
+\xf6\x12\xd0\x62\x76\x79\xb2\x7d\x8c\x03\xcc\x56\x98\x54\xe3\xc5\
+\xfe\x3f\x2f\x9b\x31\x9a\x1e\xd2\xe6\xea\x31\x0b\x91\x0c\xb1\x06\
+\x96\x36\x04\x86\x10\x8d\x5c\x8e\xe0\x55\xd5\x37\x31\xe6\x18\x2d\
+\xfc\x92\xcd\xcd\xcf\x00\x5f\x02\x8e\x10\xe3\x9f\xb1\x78\x74\x9d\
+\x5b\xd7\x3c\x14\x8d\x71\x85\xc5\x93\xd7\x6c\xe5\xe6\x05\xcc\x86\
+\xc0\x16\xa3\xf9\x45\x72\x6e\xe8\xb6\x4e\x42\x1d\x7d\xd3\x34\xb1\
+\xeb\xa8\xdd\x01\x16\xf0\x2a\xd3\xe5\xba\xfe\xf8\x11\xbc\x2a\x1d\
+\xa6\xe1\x7a\x1f\xb8\xf7\xeb\xdd\x27\x3c\x9c\xed\x9f\x4f\x3f\xe9\
+\xa1\xab\x5f\x7d\xa0\xdf\x87\xfc\xcb\x78\x35\x75\xff\xd8\x97\xea\
+\x71\x4f\x9a\x07\xdb\xff\x14\xf8\x7d\xd8\x3a\xfd\xee\x74\xdd\xf7\
+\x53\xc0\xa5\xa6\xe1\x72\xd7\x4d\x5a\xad\x1b\xdb\x33\xa4\x4f\x6d\
+\xc7\xff\xc7\x50\xfc\x25\xcc\xfd\xe3\xef\x16\xec\x94\x99\xef\x9f\
+\x16\xfe\xf4\x95\xed\xfd\xa4\x86\xbb\xd9\xc2\x27\x21\x5c\xc5\x2b\
+\x34\x8f\x02\xaf\x44\xe2\xef\x19\xf1\x87\xd0\xad\x05\xcf\xa3\x4b\
+\x43\x13\x3a\xba\x23\x78\x60\xde\x07\xe1\x93\x71\x24\xa0\x10\xa3\
+\x61\x0d\x1e\xa6\xdf\x01\xce\xef\x71\xf4\x02\xdc\x22\xf1\x01\x99\
+\x86\xdd\xa1\x7c\x3f\xc9\x61\x03\x9f\x18\x30\x6b\x10\xe1\x82\xf9\
+\xeb\xd4\x4f\x1e\xe8\x9f\xc7\x56\x86\x3b\x89\x74\x31\x93\x1b\x52\
+\x4a\xf5\xfd\x0d\xd3\x99\x38\xc7\x81\x2f\xd7\x63\xac\xcf\x8c\xdf\
+\x76\x7c\xf5\x55\xf7\x5b\x78\x78\xf6\x6f\xd9\x3d\xe1\x42\xf6\xd9\
+\xe3\x6c\x5d\xff\x14\xe8\x80\x9f\xe1\x9f\x33\xbb\xec\xf5\x26\xdd\
+\xeb\xb6\x48\x3c\x6a\xd8\x67\x0c\xfe\x82\xc9\xf5\x58\x7b\x5c\xec\
+\x9c\x3b\xf2\x04\xa6\x92\xf4\xf3\x6d\x12\x61\x77\xe7\x0e\xdb\xfd\
+\x0c\x92\x85\x40\x82\x9c\x29\x90\x82\x37\xb5\xa9\xff\x9e\x05\x02\
+\xd9\x97\x3f\x49\xfd\x02\x29\x09\x52\xde\xe3\xa9\xcc\x2e\xa0\x72\
+\x00\x12\x29\xd4\xcf\xec\x33\xf8\x24\xa0\x9f\x70\xbf\x9f\x0f\x3e\
+\xf6\x8b\x31\x72\xce\x8c\x9f\xd4\x5b\x03\xc4\x21\xd8\x83\x56\xdc\
+\x8b\x88\x88\x88\x88\x88\x88\x88\x88\xc8\x01\x52\x28\x2f\xcf\x95\
+\xf7\xde\x79\xfb\x5d\x80\x87\x08\xe7\x0b\x50\x06\x0c\x42\x4b\x5b\
+\xa0\x85\x0e\x23\x25\xba\x2e\xf7\x21\xe3\x39\xfc\x8f\xea\x37\xf1\
+\x75\xb4\xd7\xf0\x35\xaa\x1b\xb6\x5a\x88\x65\x1a\x34\x94\x52\xf3\
+\x49\x4e\x9b\x71\xb1\x3e\xe6\x2a\xc6\x7a\x84\xd3\x96\x52\xc1\x23\
+\x86\xc9\x1f\xd5\xfd\x18\x76\x0c\xec\x78\xbd\x7d\x8c\x87\x87\x89\
+\x8d\x35\x4f\x2c\x12\x18\x16\xf0\xe0\x79\x03\x0f\x46\xf7\x7a\x2e\
+\xeb\xc0\xf9\x48\x1c\x6c\x8b\x3a\xbc\x97\xf8\x15\xbc\xea\xf8\xcc\
+\xe4\x76\x0b\x63\x88\x9f\x78\x7b\xf1\x58\xfa\x63\xd5\x63\xdc\x00\
+\x5e\xe9\x2b\x13\x23\xb1\x18\x76\x0b\x0f\xe0\x4b\xdd\x6e\xbd\x8e\
+\xf7\x62\xdf\x47\x20\x7a\xcc\x72\x9b\xbe\x3a\x3a\xc6\xe9\x53\xc5\
+\x02\x66\x85\x62\x27\xea\xb9\xf1\xd6\xf4\x25\x27\x88\xe7\xc0\x56\
+\x31\x02\xa3\xd1\xc7\xac\x70\x1c\x0f\x48\x6f\xd0\x0c\x3e\x86\x74\
+\x84\x6e\xeb\x35\xa0\x61\x71\xf1\x1a\xa7\x2f\x5c\xb5\x5f\xbe\x7f\
+\x0e\xb3\x2f\x03\x99\xc1\x60\x9e\xf3\x2f\xad\x93\x5b\xe3\xea\x27\
+\x43\xac\xfb\x90\x69\x15\x7a\x1f\xcd\xcc\x56\xc1\xf7\x21\x7d\x3f\
+\xc1\xe1\xae\x81\x76\xe3\x0b\x9e\x1b\x1e\xac\x5c\x4a\x89\xf9\x9c\
+\xb9\x0a\xfc\x69\x7d\xfe\xbf\x8b\x77\x3b\xf8\x08\xc6\xaf\x51\xd7\
+\x38\x07\x7e\x1b\x18\x74\x1d\xab\x78\x70\xfb\xd0\xf2\xfe\xa7\x4b\
+\x7d\x7b\xfe\xfb\xdd\x71\x7f\xee\x96\x81\x1f\x19\xf6\x15\xbc\xec\
+\x7d\xd2\x7a\xbe\x76\x9c\xe8\xaf\xc3\x45\x7c\x82\xc9\xf5\xed\xbb\
+\x31\x03\x6e\x40\xba\x0e\x39\xc1\x1e\x95\xae\x7e\xc3\x66\x1d\xd9\
+\x22\xbb\x27\xa1\x8c\xf1\x30\x7e\xb0\x73\x90\x29\x51\x72\x66\xb3\
+\x8e\x33\xd6\xb1\x4c\xf8\x64\x9b\xec\x6b\xd9\x67\x3f\x40\x8c\x64\
+\x33\x36\xf1\xeb\xfe\x54\x1d\xce\x2a\xd3\x49\x14\xfd\xf3\x1f\x30\
+\xed\xb6\xf0\x02\x31\x5e\xc5\x6c\x0d\xaf\x5e\x3d\x83\x87\xa9\x7f\
+\x81\x5f\xfb\x0a\xe7\xe5\x41\x15\xee\x6f\x42\xcd\x3d\x99\xbf\xc7\
+\x76\x4c\x00\xca\xa4\x9c\x42\xbe\x8f\x7d\x27\xd2\xe4\xfd\x56\x43\
+\xe5\x30\x59\x2a\x25\xef\xfc\xb8\x48\x93\x2d\x3f\xcd\xfd\x7e\x86\
+\x65\x66\x13\xf6\x1d\x69\xfb\xcc\xcf\x93\xa1\xec\xd8\xed\x24\x0c\
+\xaf\xb7\xa7\x44\x98\xdd\x5d\x22\x91\x53\xae\x59\x7f\xff\x1c\x66\
+\x76\xd2\xa7\xfd\x8f\xf8\x91\x3b\xf3\x7c\x3f\x75\xe2\xd5\x1e\x0f\
+\xf6\x07\xda\xb6\xeb\x21\xb0\xb3\xd3\x80\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x3c\xf5\x14\xca\xcb\x73\xe5\x6b\x5f\xfb\x1a\xf0\x80\
+\xe1\x7c\xa2\x90\xbd\xe2\xb5\x9d\x5d\x50\x1b\x4a\xad\xca\x2b\x1d\
+\x5d\xc4\x03\xc0\x9f\xe3\xed\xca\x67\xab\x66\x9b\x69\x99\x1e\xfe\
+\x63\xb0\x52\xff\x9a\xbe\x55\x1f\x73\xab\x3e\xa6\x31\x28\x18\x99\
+\x52\x42\x2d\x19\x06\x42\xe9\xe8\x7c\x8d\x7a\x0f\x2f\x6f\x02\x2d\
+\xc4\x17\x52\xb2\x94\x13\xb9\x66\x1e\xa5\x56\xdb\x77\x78\xb8\x3e\
+\xad\x40\x0e\x56\xdb\xcb\x33\x80\x78\x01\xec\xaa\x61\xeb\xa4\xe4\
+\xe1\xc2\xb4\x09\xfe\xf9\x48\x5c\x30\x0c\x2c\x97\x3a\xe8\x52\x27\
+\x03\x1c\x05\xfb\x39\x84\xfe\xf9\x0d\xf1\x56\xf8\x8b\x78\x28\x30\
+\x1b\xf4\x9c\x04\xd6\xea\x8e\x8f\xf9\x09\xa8\xed\xef\xb3\x15\x3c\
+\x08\x3d\x3a\xf9\x3d\x04\x98\x06\xd2\x1e\x90\x86\xb0\x49\x29\x1d\
+\x1e\x64\xd7\xc7\xd8\x3c\xb0\x42\xa4\x23\x58\xc1\x2c\xe0\x9d\x03\
+\x7c\x02\xc2\x20\x85\x38\xa6\xb3\x48\x8b\x85\x0d\xe6\x16\xc7\xf5\
+\xd8\xaf\x01\xd7\x18\xce\x2d\xf1\xf9\x2f\x5f\xc6\xda\xc8\xad\x1b\
+\x81\x71\x77\x83\x07\x5f\xc3\x77\x4f\x5d\xc7\x02\xde\x2e\x3f\x34\
+\x34\x57\xbb\xdc\xfd\x00\x0f\x60\xfb\x60\x7f\x15\x6f\x53\xff\x03\
+\xbc\x2b\xc0\xb1\x7a\xdb\x69\xfc\x35\xdd\xe9\x6e\x2d\xb2\xef\xa7\
+\x75\xf6\xec\x44\x82\x9d\xe2\x5d\xb6\xd9\x6b\xfb\xd9\x2c\x3c\xdc\
+\x63\x3b\xbf\xed\xf7\x08\xfc\xf1\xe4\xb6\x74\x97\x6d\x7b\x17\xf0\
+\x2e\x02\xdb\x2a\xe5\x33\x99\x48\x3f\xb9\x21\x1f\x83\xc9\xc4\x8b\
+\xed\xeb\x23\x5b\x04\xec\x14\x1e\xc8\x47\x76\x57\xc3\xef\xe0\xcb\
+\x4f\x34\x40\x97\xe9\x98\xae\x57\x3f\xc7\xe4\x8e\x5d\x0f\xea\x43\
+\xcb\x91\x19\xc7\xf1\xc9\x1b\x3f\xc5\x3b\x02\xf4\x4b\x19\xec\xa5\
+\x3f\xb7\x43\xcc\x7e\x86\x87\xf1\x73\xf5\xf1\xaf\xd5\xe7\xbe\x0c\
+\xfc\x11\x6a\x69\xbf\xaf\x1e\x67\x95\xfc\x01\xb7\xae\x9f\x35\x3b\
+\x11\xe4\x51\xf6\x51\xf0\xeb\x6f\xb2\xaf\x07\x0a\xc5\x77\xdd\xb8\
+\x2d\xb4\x0e\x89\x4c\xce\x94\x54\x3f\x07\x3c\xec\x4f\xa1\x2f\x59\
+\x4f\xf5\x1f\xc5\x7c\xd7\x32\xf6\xc7\x67\xe7\xf8\x73\xf6\x31\xd7\
+\xdf\x4a\x4e\x5e\x6d\xef\x37\x13\x72\x7d\x6e\x09\xc8\xc9\x4b\xf4\
+\xb7\x2f\x1e\xf3\xc8\x1e\xf2\xf5\x7c\x06\x1a\xf3\x8b\x88\x88\x88\
+\x88\x88\x88\x88\x88\xc8\xa7\x52\x28\x2f\xcf\xa5\xd9\x70\xfe\x5e\
+\xc1\xbc\xe7\xc4\x93\xf0\x63\x67\xe5\x99\x01\x34\x34\x74\x74\x10\
+\x29\x78\x15\xed\xec\x76\x05\x68\x20\xd5\x20\x7e\xe0\x7f\xc4\xdf\
+\x5c\x2d\x6c\x6e\x66\x3c\xa8\xd8\xd8\xe3\x31\x05\x4a\x0d\x07\xa6\
+\x6f\xc3\x5a\xa9\x7b\x1d\x8f\x0e\x03\x58\xf1\xd6\xbd\xfd\x76\x4d\
+\xc1\x68\xf1\x4a\x77\x0f\xb6\x13\x78\xd5\x5c\x03\x46\x21\xa5\x96\
+\x9c\xaf\xe0\xd5\xfc\x67\x3d\x70\x07\x26\xfb\xa1\x35\xcc\x03\xfd\
+\x38\xec\x43\x87\x50\x9f\xef\x96\xb7\x9f\x07\xcc\x0a\x31\x82\xd9\
+\x1d\xfa\xf6\xdd\xbe\xed\x7c\xf4\xc9\x05\xbe\x57\x72\x89\x91\x55\
+\x33\x96\x7c\x90\x56\x48\x11\xf3\x24\x61\x15\xb3\x7e\x5d\xe4\x82\
+\xb7\x29\xff\x25\xde\xca\x1f\x4a\x59\xa8\xfb\xae\x51\x69\x30\x3c\
+\x48\xbd\x89\xd1\x57\x38\x2e\x4e\xc6\x96\xfc\x27\x83\x0b\x18\xeb\
+\x90\xaf\xcd\x8c\xbf\x00\x63\x4a\xe9\x08\xa1\xd4\x75\xe9\xeb\x79\
+\xeb\xf6\xa3\xaa\xf0\x45\x7c\x62\xc0\x87\xc0\x0f\x3b\xba\x9b\x4c\
+\xc3\xf8\x04\x30\x37\xc7\x8f\xda\x96\xdf\xca\x99\xef\xe3\x9d\x14\
+\xbe\x08\xfc\x98\xc9\x84\x03\x7f\xed\x3d\x00\x9a\xfc\x1e\x66\xbe\
+\x53\xf7\x75\xb7\xcf\xe6\x38\xf3\x7d\xef\x25\x10\xea\x3e\x52\x22\
+\x66\x6f\xf9\x3e\xd8\xe3\xfe\x59\x0b\xf5\x9a\xe9\x2b\xc0\xc3\xab\
+\xaf\x12\x3e\xf8\x60\xd7\x63\xfc\xfb\x8f\xfc\xfb\xd9\xb3\x84\xeb\
+\xd7\x49\x75\x49\x84\x1a\x86\xd7\xf7\x8a\xeb\x97\x51\xf8\x00\x38\
+\xd7\xdf\x58\x73\xf1\xb5\xda\xea\xff\xab\x4c\x83\xec\xae\x56\x7f\
+\xce\xbc\x56\xd6\x9f\xdb\x3b\x78\xd5\xf9\xc9\x99\x5c\xbd\x3f\x67\
+\x27\xf1\x6b\xe4\x46\xff\xa8\xae\xbf\x56\xf3\x64\xdc\x01\x08\x4d\
+\x37\xcd\xe4\x3b\x20\x46\x8e\x98\x71\x16\x7f\xad\xb6\xea\xf7\xcd\
+\xa6\xdf\x87\xdf\xd6\x2f\x6f\x00\x4d\x13\xe8\x6a\xf0\xef\xcb\x5a\
+\x34\xf8\xa2\x15\x63\x1a\x3e\xe8\xba\x66\x0e\xba\xf3\x75\xfb\xa3\
+\xc0\xcb\xc0\x77\xd9\x51\xa5\x2f\x72\x1f\x76\x2e\x6f\xf1\xb0\xfb\
+\xd8\x15\xca\xef\x9b\x3c\x8d\xbd\xb7\x07\xe0\xd3\xf0\xbd\xde\x1e\
+\xf6\xa3\xe2\x7c\x5f\xcc\x4e\x2a\x98\xf9\x79\xf2\x63\x4a\x61\xb2\
+\xb0\x09\xec\xf7\x98\x33\x0f\xd5\x01\x61\x57\x55\xbc\xaa\xe4\x45\
+\x44\x44\x44\x44\x44\x44\x44\x44\x9e\x41\x0a\xe5\xe5\xb9\xf6\xb5\
+\xaf\x7d\xed\x9e\x55\xf3\xa5\x40\xf2\x4a\x39\xeb\x57\x9d\xf6\x04\
+\x73\x40\x4b\x29\x4c\xdb\x70\x47\x8c\xc4\x74\x5d\xea\x3e\xe8\x9b\
+\x07\x16\x28\xc5\xc3\xd2\x3e\x08\xee\x80\x9c\x2d\xfa\xba\xd9\x5b\
+\x4c\x83\xcd\x18\x89\x73\x96\xdb\xc0\xda\x8a\x71\xf2\x7c\xa1\x18\
+\xf5\x18\x03\xb3\x6d\x01\xed\x3c\x5e\xa9\x9e\xc9\xf5\xf1\x81\x12\
+\x7d\x51\xf9\xf3\x78\x7b\xed\x45\x72\x36\x2c\xd4\xc0\x3c\xf4\xd5\
+\xfd\x86\x87\xc8\x73\x33\xa5\x7e\x25\x41\xc9\x1e\x5e\x7a\xf5\xb6\
+\x99\x6f\x9f\x30\x7c\x32\x40\xc4\x28\x58\x2e\xbe\x64\xad\x8d\xf1\
+\xed\x2f\x91\xad\x60\xa1\x10\xd9\x30\xe3\x0a\x93\xea\xf9\x84\x79\
+\xe5\xfe\x02\xde\xce\xff\x97\xb5\x52\x7e\xab\x7e\x8d\x48\xb1\x7f\
+\x8e\x5b\x78\x25\x7f\xc0\x28\x94\xb0\x0e\xe5\x32\xde\xf6\xbb\x7f\
+\xde\x47\x88\xf1\x1c\x70\x95\x34\x69\x93\xbe\x56\xcf\x43\x21\xd4\
+\x35\xbe\x63\xf4\xee\x03\x39\xf4\xcf\x77\x19\xe8\x88\x11\xc2\xc0\
+\xa0\x8d\x1e\x61\x4f\x9f\x2b\xe8\x1e\x00\x00\x20\x00\x49\x44\x41\
+\x54\xab\xa7\xb7\x6b\xe8\xfa\x1b\xbb\x6e\x92\x16\x4f\x43\xdf\x06\
+\x9a\x8e\x99\x20\xf7\x04\xde\x8e\xfe\xdf\xd4\x47\x8d\xc0\xcb\xa3\
+\x6f\xd4\x90\x64\x73\x93\xa5\x94\x68\x81\x57\x19\x0e\x7f\xce\xd6\
+\xd6\xbf\x0f\xe9\xb3\x91\xfc\x62\x48\xfc\x24\x87\xa6\x0e\x27\x47\
+\xa6\x6b\xd8\xf7\x86\x4c\xc3\xf6\x9d\xf7\xcd\xea\xb7\xe9\xdb\xa7\
+\xef\x65\x58\x43\xff\xe1\x8e\x7d\xed\xb5\xfd\x29\x72\x1e\xd7\x7d\
+\x36\x00\x1f\x7c\x40\xe0\x04\x81\xa5\x5d\x8f\x0b\x5c\x85\xa3\x47\
+\x09\xd7\xbd\x19\x7d\x93\x20\x65\x3f\x69\xa5\x9b\x2d\x43\xf7\xdb\
+\x36\x99\xc6\x5a\x5b\xc0\x46\x0d\xbb\x3b\xe0\x23\xfc\x1a\xbd\x5c\
+\xf7\xff\xa2\x41\x99\x09\xc4\xfb\xd7\xf5\x7a\xfd\x1a\x44\x22\xdd\
+\x34\xb8\xef\xdf\x23\x23\x60\x03\xd2\x26\x4d\xa0\x86\xe6\x81\xcc\
+\x00\xaf\x56\xef\x3b\x31\x5c\xeb\xfa\xfd\xd7\xf1\x9a\x07\xfd\xe3\
+\xfa\x55\x98\x76\x6c\x28\xbe\x54\x41\x03\x74\x2f\x03\x2f\x46\x68\
+\xcd\x26\xef\x55\x3a\x7f\xaf\x8e\x80\xb3\x1d\x7c\x8f\x8e\x02\xdd\
+\x06\x3e\x09\x61\x1e\xef\xa8\x30\x8f\xfe\x9d\x7d\x66\x3c\x45\x55\
+\xf2\x00\x06\xc9\xa8\x4d\x52\xf6\xcc\x86\x6b\xf1\x39\x77\xbb\x7f\
+\x1a\xec\xef\x7f\x28\x3f\x33\x41\xe5\xde\x9b\x11\xba\x03\x5f\xf9\
+\x3c\x85\xc9\xe4\xb4\xfe\xf7\x54\xbb\xdb\xe4\xec\x95\xfd\x40\x4a\
+\x99\x9c\x1f\xc3\x02\x21\xfd\x51\x7d\x9d\x8f\x87\x59\x9a\x60\xf7\
+\x63\x54\x3c\x2f\x22\x22\x22\x22\x22\x22\x22\x22\xf2\xcc\x51\x58\
+\x20\xcf\xbd\x4f\xab\x9a\xcf\x7d\xf8\x57\xe3\x76\xff\x16\x80\xd6\
+\x60\xb2\x3e\x76\x5f\xbd\xdc\xff\x7c\x0a\xaf\xd0\xad\xed\xad\x73\
+\x24\xc6\x40\xec\xd7\x94\x6f\x23\xe4\x62\x58\x1f\x9c\x2e\x02\x67\
+\x22\x2c\x18\x96\x20\x19\x5b\x9b\x65\xd2\xbe\xde\x73\xf3\x41\x3d\
+\xc6\x39\xfa\x76\xf0\x91\x88\xd5\x16\xf9\x7d\xb6\xee\xd3\x07\x46\
+\x78\x50\x39\x9a\xb4\xcd\xb7\x49\xe8\x90\x80\x8b\xf5\xfe\x75\xc8\
+\x85\xe0\xed\xe8\xeb\x73\x3d\x0f\x1c\xa9\xe3\xf6\x3a\x5f\x0f\xfd\
+\x5f\xf1\xa7\x1f\xef\x90\x12\x58\xe8\x83\xcf\x97\x81\xe3\xa4\xe8\
+\xeb\xd8\xda\xa4\x75\xfd\x51\x22\xab\x78\x52\x79\x1c\x0f\x20\x27\
+\xa1\x66\x7d\x2e\xc7\x80\xdb\x33\xed\xf0\xcf\xe1\x71\xc2\x18\x42\
+\xa9\xdd\x07\x8e\xd5\xed\xc2\xa4\x7b\x80\xd9\x3a\x31\xb6\xb5\x02\
+\x3b\x7b\x65\x7e\xcc\x90\x4a\x5d\xbf\xfc\x16\x66\x19\x0b\x85\x90\
+\x4b\x6d\xfb\x7f\x12\x68\x31\xdb\x64\xe9\xc6\x90\x76\x63\x40\xce\
+\x4d\x7d\x0e\x61\x92\x0b\x35\x58\x03\x74\xdd\x4c\xd9\xb4\xbf\xd0\
+\xb3\xdf\xfc\xa7\xe9\x26\xb3\x6b\xd0\xcf\xcf\x3c\x8a\x1b\xc0\x11\
+\x8e\xb0\xca\xaa\x9f\xe3\xcc\x65\xe0\x33\x6c\x6d\xfd\x1f\xc0\x4d\
+\xc8\xd9\xe0\xef\x90\x29\x34\x14\x7c\xad\xf3\x44\xdf\x52\x7d\x6a\
+\x04\xa4\x11\x0c\xc7\x30\x3a\x7a\x14\x56\x56\xd8\x4b\x7f\x2d\x0e\
+\x81\x70\x97\xed\xfa\x80\x7f\x76\xed\xf3\x89\x23\x1c\x09\xab\xac\
+\xf6\xbf\x1e\xaf\xcf\x6d\xc4\x6c\xf8\xbe\x04\x8b\x10\xd6\x80\x05\
+\x16\xc2\xba\x17\x7b\x07\x98\x1c\x2f\x00\x69\x5a\xf1\xdf\xd0\x34\
+\x5d\x3d\x73\x4d\x1f\x8e\x97\x7a\xbe\x4e\xe0\xe1\xfb\x3c\x29\xbd\
+\x46\xce\xfe\x1c\x62\x6c\x09\x66\x35\x40\x2f\xc0\xe5\x8e\x6d\x6b\
+\x48\x4c\x27\xc5\xc0\xa2\xf9\x4b\x57\x66\xee\x5b\xc3\x97\x86\x18\
+\x40\x2e\x1e\x8c\xd7\xfb\x52\x32\x72\x5e\xc7\xab\xec\x23\xb5\x63\
+\x45\xe7\x03\x9c\xdd\xff\xec\xf7\x3a\x7e\x0a\x75\xc3\x94\x68\x72\
+\x66\xcd\x60\xdd\x57\x6e\xa8\xfc\xc7\x79\xa6\x4b\x32\x4c\x34\x34\
+\x9b\x1d\x7c\x0c\x5d\x8b\x5f\x33\xb2\x4f\x1e\x67\xeb\xfa\xa7\x8c\
+\xf5\xf5\xdb\x77\x0d\x89\x3f\xbd\xf8\xbc\x0f\xe3\x3b\x68\xfa\x49\
+\x66\x30\xfb\x79\xb0\xf7\x92\x0e\x9f\xee\x7e\x92\xf6\xa6\x09\x5d\
+\xd7\x95\xa6\xf1\xcf\xdf\xc9\x1c\xa8\xfe\xa0\x9d\x4f\x7c\x62\xfb\
+\x9d\x8f\xc1\xf6\xb3\xd4\x10\x42\x97\x29\x33\xe5\xf0\xa1\xa1\xa1\
+\xcb\x94\x86\x26\xf8\x64\xad\x3a\xa8\xc9\xf3\xac\x63\x9d\x1d\xe3\
+\x03\x9e\xbb\xbc\xbd\x52\x7e\x77\x28\xdf\xcf\xbe\xd8\x3d\xd9\x62\
+\xf7\x63\x4c\xd5\xf2\x22\x22\x22\x22\x22\x22\x22\x22\x22\xcf\x1a\
+\x85\xf2\x72\x68\xdc\xa3\x6a\x7e\x8f\x3f\x92\x6f\xed\xbc\xbd\xc1\
+\x83\xbd\x0b\x78\xa0\x5d\xf0\x35\xc2\x57\x80\xf3\xe4\x92\x6a\x97\
+\xde\xba\x8f\x44\x7d\xcc\x49\x3c\x90\x2c\xc0\xaa\xc1\x07\x31\x72\
+\xca\x72\x2e\x93\x3c\xc0\x42\x1f\x74\x0f\x81\xb3\x78\xcb\xef\x5b\
+\xc0\x12\xde\x5a\x1b\xc8\xa5\x86\xee\x05\x0f\x17\xaf\xf8\xf1\xe3\
+\x19\x52\xf2\xe3\xa5\x06\x02\x05\x0f\x35\xaf\xe0\x95\xc8\xa7\x27\
+\x95\xf2\x61\x12\xb2\x67\xe0\x7a\x84\x60\x29\x15\xb6\xc6\x10\x63\
+\xc4\x6c\xc9\x9f\x8f\x65\x6e\x5c\x3d\x42\x93\x1a\xbc\x05\xf7\x1a\
+\x70\x93\x9c\x23\x4b\xb7\x17\x88\xcc\x7b\xd7\x80\x98\x81\x01\x1b\
+\x2b\xe7\xf0\xf6\xdc\x1f\xfb\x92\xf0\xb6\xc0\x78\xfd\x54\x7d\x76\
+\xb7\x80\x65\xf2\xd6\x3c\x25\x8c\xf0\x6a\xf6\x4f\x88\x2c\xb2\xb5\
+\x71\x8a\x52\x16\xf1\xaa\xfd\x96\xb6\x4d\xac\xdc\x39\x86\x87\xa8\
+\x1b\x98\x0d\x58\xb9\xfd\x22\xc4\xd3\x60\xc3\x08\x1f\x5b\x19\x9f\
+\xa0\xcb\x0b\xfe\xbc\x18\xd3\x6e\xae\xf0\xf1\x87\x17\xc0\x06\x75\
+\xdf\xd7\x58\x5f\x5d\xe7\xcf\xbf\x7b\x89\x52\x3e\x47\xce\x73\xf5\
+\x75\xeb\x20\x12\xa1\xb5\xce\x36\x3a\x3f\xc6\x2a\xbe\x46\x79\xad\
+\xe6\x1e\x94\xed\x79\xf0\xac\x49\xfa\x32\xa4\x86\xf2\x73\x73\xb0\
+\xb9\xe9\xd7\xcc\x4c\xc0\xdd\x3f\xe7\xaf\x00\x7f\x40\xdf\x29\x00\
+\x3e\x07\xfc\x70\x26\xa8\xbe\x5b\x28\x1f\xc7\x35\x48\xdf\x2b\x90\
+\x5f\x80\xb0\xbe\x3d\x94\x9f\x06\xf2\x0b\x84\x85\xf5\x49\x9f\xf4\
+\x41\x7d\x81\x86\xec\x48\xa4\xe6\xe7\x09\xab\x1b\xab\xb3\xed\xf2\
+\xfb\x4a\xfa\x3a\x9e\xb9\xd0\x2f\xdd\xbe\x56\xb7\x59\x67\x7d\xaf\
+\xb5\xe6\x23\xdb\x26\xab\x74\x65\x9a\xd3\xf5\x29\x5b\xf7\x02\xfe\
+\x7e\x99\x07\xce\x70\xe4\xf8\x71\x5e\x7c\xf9\x0a\x6b\xcb\xc7\xf9\
+\xe4\xa3\x51\x9d\x4c\xf1\x22\x93\x49\x19\xcd\x47\x35\xc8\x06\x7f\
+\x1f\xfc\x12\xf8\x5b\xf8\xfb\x28\x01\xe3\xda\x22\xbf\xd0\x34\x21\
+\x76\x56\xe7\xac\x30\xa8\xe7\x7a\xfa\x1e\xce\xb9\x8d\xc4\x65\xc3\
+\x36\xea\x73\xdc\x15\x84\xd5\x73\x74\x0c\xbf\xce\x87\xf5\x1c\x5c\
+\x9e\xdd\x6e\xba\x7c\xc4\xfd\x87\x60\xdd\x34\xfc\xdc\xbc\xdf\xc7\
+\x88\xcc\xe8\xbb\x44\x3c\x6a\xd1\xf6\x4c\xfb\xfa\x6e\xef\xba\xea\
+\x3d\x42\xe5\x86\x26\xf4\xef\x31\xff\xcc\x6a\x42\xd3\x74\xfd\x3c\
+\x95\xd2\xd0\x84\xe9\xc3\xef\x91\x4a\xd7\x0f\x84\x6e\x47\x96\x4d\
+\x43\x98\x2c\x2b\x32\xbb\x9e\x44\xd3\x84\x49\x67\x13\xaf\xb0\xef\
+\x97\xc5\xf0\xf1\xd0\x04\x7f\xd8\x34\xe8\xdf\x11\x90\xcf\x7e\xae\
+\xdd\x7d\x58\x7b\x8c\xb9\xbf\xad\x9b\x99\x89\xb5\x6b\xd6\xd6\x6c\
+\x23\x90\xc6\x8f\xd3\x81\x9f\xa7\xe9\x73\x2e\x34\x84\xbb\x9c\x96\
+\xd9\x50\x7e\xf7\xeb\x31\xd3\x32\x7f\xc7\x0b\xbf\xf3\x31\xfd\xd2\
+\x27\x22\x22\x22\x22\x22\x22\x22\x22\x22\xf2\x0c\x51\x28\x2f\x87\
+\xca\x6c\xd5\xfc\xf4\xd6\x04\xe4\x5d\x6b\xca\x37\x0d\x7d\xc8\x58\
+\x52\x62\x21\x67\xce\xe1\x85\xd1\x9f\xe0\x81\xae\x57\xb0\x03\x94\
+\x1c\x31\x2b\x93\x88\xd2\x03\xf0\xbe\xdd\xfd\xed\xfa\xd5\x01\xc1\
+\xac\x5f\x19\xbd\x04\xaf\x46\x2f\x81\x76\xdc\xff\x0d\xbe\x0f\xd3\
+\xfb\xb5\xca\xbd\xda\x39\x0d\xcd\x77\x6c\xc5\xa0\x40\x3c\x06\x36\
+\x04\x5b\x00\xca\x64\x0d\xf5\x98\xa0\x5f\x5b\x1d\xce\x41\x5c\x98\
+\x56\xca\x27\x92\x2f\x4e\x7b\xc3\x60\xc9\xe0\x04\x4b\x4b\xc7\xd9\
+\xfa\xc9\x12\x5d\xb7\x85\xe7\xb9\xf3\xc0\x1a\x9f\x7c\x58\x20\x0d\
+\xc1\x3e\xc2\x27\x01\x9c\x61\x73\x7d\x8b\xcd\xf5\x63\x31\xb2\x6c\
+\x70\x03\x6c\x91\xce\xd6\x58\x5d\x1e\xe0\xc1\xfd\x69\xb0\x23\x74\
+\xf6\x73\xba\x6e\xad\x9e\xa3\xe3\x00\x8c\xc7\x1f\x45\x30\xf3\xdb\
+\x3a\xcc\xae\xb0\xb1\x76\x13\x18\x11\xd9\xc4\x58\x64\x6b\x73\x89\
+\xad\xcd\x21\x1e\x92\x02\xfc\x84\x6e\x6b\x19\xec\xaa\xc1\x10\xec\
+\x3a\xeb\xeb\xbe\x6e\xbd\x77\x10\xd8\xc2\xec\x1a\xab\xcb\x4d\x7d\
+\xbe\x2f\xd7\xf3\xf6\x3d\xba\x6e\x2d\x46\x86\xe6\x13\x22\xce\xd3\
+\x4f\x36\xf0\xe7\xb2\x88\x4f\x7e\x98\xac\x43\x1f\x61\xd3\x68\x97\
+\xf1\x60\x7f\xbd\x6e\x37\x0d\x79\x07\x01\xda\x49\x35\xf9\x3c\xc0\
+\xe6\x5d\xe2\xd6\xa1\x3f\xf0\x07\xc0\xd1\x86\x26\x77\x5e\x09\x7a\
+\x9e\xd9\x40\x26\xd1\x90\xb7\x57\xdc\x0f\x06\xcc\xe7\x96\x64\xbb\
+\x5b\xce\x4f\xd4\xc0\x7d\x5b\xa5\xfc\xec\x9d\x33\x0b\x97\x0f\x33\
+\x93\xf6\xf5\xb3\xe1\x4f\xd8\xd8\xd8\xb1\xd3\xc4\x22\x99\x76\x34\
+\x62\x6e\x3c\x86\x9a\x23\x6f\x0f\xe1\x87\xc3\xc0\xd6\xa4\xe0\xbb\
+\x49\xa4\x97\x48\xf9\x45\x20\xe4\x3c\x79\xbd\xb6\x87\x44\x4d\x57\
+\xe8\x58\xc6\xdb\xb9\x9f\x06\x5a\x16\x16\x2f\xf3\xf9\xbf\xf1\x11\
+\x97\x3f\x38\xce\x27\x1f\x5d\x02\xbb\x04\x2c\x01\x57\x88\x71\x9e\
+\xc8\x6c\xb5\xfb\x38\x91\x96\x32\x79\x23\x46\x3e\x36\xef\x65\x71\
+\xbc\xeb\x97\x94\xe8\x3a\xac\xb6\x8f\xf7\x73\x12\xdb\xd9\xb5\x97\
+\x7d\xa9\xfb\x0c\xd3\x76\xff\xdd\x4c\x6b\x7c\x68\x9a\x90\xbb\x6e\
+\x84\x2f\xbb\xb0\x8a\x4f\xb0\x59\x01\xd6\x7d\xbb\x1a\x1a\x7e\x4a\
+\xf8\x15\xa3\x7f\x1d\x7c\x8b\xee\xe7\xdf\xe3\xac\x92\x7f\xca\x5a\
+\xd7\x83\x7f\x5e\x74\xa9\xbe\x07\xf3\xec\x75\x98\x52\xa8\xcb\x94\
+\x7c\x9a\x0e\x30\x9a\x26\xd3\x75\xbb\x02\xfe\x3e\x5c\xef\xe8\x4a\
+\x03\x61\x3a\xf7\xa8\x4f\xd1\xa7\x89\xf9\xec\xf5\x7d\xcf\x20\xfe\
+\xd3\xec\x6c\x7b\xdf\x34\x35\xc0\xee\x4a\xd3\x75\xd3\x8e\x26\x5d\
+\x33\x19\xce\xf4\x78\xdd\xee\xa1\x4d\x07\xb5\x5f\xea\x35\xd0\x1f\
+\x7f\xef\x1d\x6f\x3b\xfe\xce\xc1\xdc\x7d\x2c\xfd\xbf\x01\xfd\xb2\
+\x02\xf7\xab\xff\xff\x93\xd9\xc7\x28\x94\x17\x11\x11\x11\x11\x11\
+\x11\x11\x11\x79\xc6\x28\x94\x97\x03\xb3\x3d\x18\xdf\x1f\x7f\xf2\
+\x27\x7f\xf2\xc0\x8f\x49\x64\x5f\x53\x1e\xca\x70\x48\xe8\x9b\x4d\
+\x6f\x75\x58\x4a\x90\x33\x56\xab\x65\xfb\xc0\x7c\xf7\x1f\xc3\xd7\
+\xd7\x5b\x36\xd7\x8c\xe1\xa8\xcc\x94\xb8\x05\x6f\xef\xce\x4d\xb6\
+\xff\x31\xdd\xf0\x60\xb5\x23\x84\xc2\xc6\x6a\x61\x73\xad\xc3\x03\
+\xd4\x6e\xc7\xfe\xfd\x71\x66\x46\x08\x7d\x1b\xfa\x01\xd8\x51\x3c\
+\x48\xdc\x00\x0a\xd9\x0a\x4d\xea\xd7\xb4\x6f\x80\x4b\xc0\x6d\xb0\
+\x0d\x2c\x14\x56\x97\x12\x9b\xab\xa3\x1a\xec\x9c\xc6\xc3\xcc\x4d\
+\xc6\xeb\xd7\x19\xaf\x5f\xad\xc7\xfe\x35\x3c\x34\x78\x01\xb8\x03\
+\x79\x00\xf1\x14\xd8\x16\xde\x76\xfe\x4a\x24\x0e\xcc\xec\x28\x3e\
+\xd9\xe0\x2c\x9e\xe0\x76\xf5\xfe\xe0\x63\xe3\x54\x7d\x7e\x2f\x01\
+\x1b\x44\xe6\x30\xce\x9b\x87\xd9\xe7\xa9\xad\xc4\x63\x64\x0b\xe3\
+\x82\x19\x9b\xf8\xd2\xec\xfd\x72\x00\x73\xc0\x55\x88\x17\x6a\xfb\
+\xf9\x63\x78\x70\xfb\x32\xb0\x08\xf1\x68\x6d\x99\x3f\x8a\xc4\x2f\
+\xd5\x96\xe6\xf3\x93\xe3\x79\xe5\xf5\xba\x6f\xcb\x26\x31\x5e\x27\
+\xd8\x4f\xc8\x1c\x37\xbf\x6d\xa1\x1e\xa3\xaf\x36\x1c\x1a\x0c\x22\
+\x9c\xb4\x3e\xfc\xf0\xb6\xfa\xeb\x29\xb1\x9a\x33\xab\xb4\xed\x6a\
+\x3d\xc6\xab\x34\x6c\x10\x06\xab\xb4\x7b\x57\xd5\xd7\x17\x6f\x0b\
+\xb8\xd9\xd1\x41\x20\xd4\xf1\x4c\x3b\x2f\x64\x1a\x76\x54\xca\xb7\
+\x2d\x23\x62\x4c\x98\x0d\x81\xe1\x88\x51\x18\x33\x2e\x23\x08\x63\
+\x28\xa3\x11\xc1\x43\xf3\xed\x95\xf2\x3b\xf4\xa1\x62\xdf\xbe\x7e\
+\x12\xca\x0f\x21\xec\xea\xa3\x3e\x24\x90\x59\x00\x6e\x8d\xc7\x93\
+\x89\x00\x3b\xab\xe2\xfb\x40\x7e\x84\xbf\x7e\x67\x81\x98\x33\x2b\
+\xf8\x64\x8c\xab\xb5\x25\x7d\x43\xdf\x6a\x20\xa5\x40\x97\xaf\x44\
+\xe2\xba\x61\x2d\xfe\x5e\x60\x32\x7a\x67\xf8\x7b\xea\x13\x20\x61\
+\x36\xc2\x6c\xd8\xd0\xc4\x1a\xbc\x87\x4c\xee\x80\xdb\x66\xac\x30\
+\x6d\xaf\x5f\x80\x32\x60\x40\x4b\x9b\xf1\xae\x07\x63\xb0\x4d\x66\
+\xde\x3b\x99\x3c\x87\xbf\x0f\x5a\xfc\xba\xba\x12\x66\xab\xe5\x3d\
+\x18\x5c\xaf\x63\xe8\xa7\x58\xcc\xe1\x2d\xee\x4b\x7d\xfa\x65\xda\
+\x53\x7a\x4f\xc9\x8c\x81\xf9\x12\x0c\x03\xa0\x49\x30\x97\x7d\x3f\
+\xa7\xf1\xc9\x38\x22\x0f\xa3\x03\x76\x27\xe9\xd0\x77\xb5\xbf\xdf\
+\x7d\xd4\xf6\xf5\x3b\x7b\xb8\x37\xa1\xf3\x30\xb9\xd4\x0d\x43\x33\
+\xc9\xbc\x1f\x63\x2f\xf9\x5d\x01\x76\x57\x2b\xe4\x9b\x99\x02\xf5\
+\xee\xd1\x82\xff\x47\xd0\x4c\x96\x3a\x79\x0c\xc7\x4f\xe4\x98\x29\
+\x56\xc3\xf9\x7b\x7e\xb2\xf4\x9f\x3b\xfe\xad\x0f\xf1\xfb\xff\x8f\
+\xb8\x7b\x0b\x7c\x11\x11\x11\x11\x11\x11\x11\x11\x11\x79\x6a\x29\
+\x94\x97\x03\xf5\xad\x6f\xfd\xf7\x04\x8a\xf7\x9c\x0d\x40\x09\x94\
+\x50\x3c\x79\x2b\x30\xcd\x05\x3d\x23\xab\x75\xe5\x53\x65\x66\x8b\
+\xfa\x43\x98\x79\x5c\x09\xfd\xef\x65\xdb\x5f\xaf\x43\xf0\xfc\xfa\
+\x1f\xfc\x83\xff\xaa\xee\x05\x63\x34\x22\x30\x2e\x8c\xf0\xba\x6b\
+\x28\x1e\xc6\x0f\x0a\xb4\x73\x4c\xab\xd5\x26\x12\xc9\x32\x39\x40\
+\x4e\x98\x45\x9a\x26\x93\x73\xc1\x4a\x24\xc6\x11\x6d\x8e\xec\xac\
+\x88\x8b\xd1\x08\x01\x52\xf1\xca\x44\x4f\xfe\x2d\xc1\x42\xe9\x17\
+\xb2\xaf\xc3\x8c\xc4\x61\xc0\xc8\x29\x41\xb0\xfe\x8f\xf0\x63\xbc\
+\xc5\xf6\x95\x48\x3c\x6a\x39\x1b\x81\x3e\xb0\xef\xc7\xb7\x0c\xfc\
+\x02\x38\xc1\xd6\xf8\x14\xdf\xff\xff\xae\xb3\xb5\x71\x87\xba\x6e\
+\x39\x5e\x11\xbc\x89\x37\xae\xff\x92\x19\xe7\xf1\xe0\x7b\x25\x46\
+\x5e\xc0\x48\xe6\xbd\xe8\x5f\xa5\x5f\x0b\x1c\xce\xd6\x80\xf5\x7c\
+\x3d\xc1\xc7\xf0\x30\xbd\xc5\xc3\xdf\x9f\xe3\x6d\xc0\x1b\x88\x5d\
+\xc0\x52\x81\xab\x18\x0b\xf8\x59\x30\xbc\x72\x7d\xb9\x9e\x13\xb3\
+\x69\x30\xdb\x87\xef\x2d\x1e\x94\x6e\x7a\x27\x80\xb8\xe1\xf7\xd9\
+\xa9\xba\xcd\x3a\xd1\x02\xc6\x39\x60\x0e\x6c\x25\xc2\x15\xf3\xc0\
+\x7e\x15\x0f\xdc\xff\x43\xe0\x96\x19\xc3\x18\xb9\x62\x1e\xe0\xaf\
+\x02\x97\x07\x03\x42\xdb\x12\xea\x79\x98\xab\xdb\x9f\x00\x16\xcc\
+\x7f\xf7\xa0\xdc\x48\x11\x8e\xe7\xcc\x09\xa6\x2d\xff\xe7\x80\x63\
+\x74\x9c\x85\xf6\xe3\x7a\x5e\x56\x61\x26\xc2\x6a\x26\x09\xd7\xb4\
+\x05\xb3\xc7\xd4\x83\x44\x3a\x92\x07\xf9\x4a\xad\xb8\xdf\xd5\xbe\
+\xbe\x81\xb9\x0e\xeb\xd7\x81\x1f\x8d\xeb\x45\x38\xae\xf7\xd7\x40\
+\x9e\x44\x6a\x32\x79\x1a\xca\xf7\x55\xec\xb5\x44\x1f\x60\x30\x60\
+\xd8\xb6\x93\x50\xbe\x50\xef\x1a\x40\xd8\x36\x95\x60\x8b\x08\x2c\
+\xd0\x34\xb7\x07\x5d\x98\x6b\xa7\xed\xfb\x03\x93\xed\x07\x40\xfb\
+\x22\x70\x29\x91\xd6\x33\xf9\x72\x26\xdf\xf6\xfd\xa6\x73\x90\x2f\
+\x92\xf3\x31\x60\x35\x46\xe6\xcc\x80\x9c\xcf\x00\xcb\x86\x15\x12\
+\x31\xe6\x38\x67\x66\x2b\x10\x0a\x16\x8a\x2f\xb9\xd0\xb7\xd5\x86\
+\x18\x19\x99\x31\x0f\xfc\x66\x77\x64\x61\x8e\xc1\x60\x8b\x95\x95\
+\x44\xb7\xf5\x63\xfc\xda\x7b\x11\xef\xba\x30\x59\x1b\xbb\xa5\x2d\
+\xf5\x69\xf5\xa1\xfb\xce\x90\x6a\x13\xef\x6c\xb1\x52\xef\x5f\x6b\
+\x77\x57\xa7\xce\x3e\xc6\x3f\x34\xfc\xfd\x58\xa0\x0d\x34\x4d\x83\
+\x57\xd3\xdf\x4d\xac\x4b\x3f\x7c\x1e\x9f\x54\xf2\xcb\x0c\x1d\x89\
+\x2d\x32\x63\xee\xbe\x1e\x82\x3c\x45\x9e\xc2\x2a\xf9\x52\x1b\x3d\
+\xb4\xd3\xd6\xed\xdb\x5b\xba\xdf\xa7\x8e\x18\x8d\xae\x6b\xd9\x79\
+\xed\xef\xd1\xda\xa1\x9b\xf9\xa9\x7e\x56\x4e\x8e\xd5\xff\x3e\x60\
+\x10\x00\xda\x01\xd0\xb6\x65\x30\x20\xd0\x0e\x68\x69\xcb\x80\x41\
+\x68\x07\x2d\x83\x16\xfc\x73\x03\x9f\x3a\xf3\xa9\xa3\xbc\x47\x00\
+\x3e\xf0\x36\x25\x03\xea\x7f\x5b\xe8\xdf\x56\x83\xba\x49\xcb\x60\
+\xd7\x71\xfc\x96\xe9\xb6\xf7\x2b\x78\x5b\x94\x7e\xa2\xc2\xcc\x30\
+\xea\xf9\x18\x0c\x02\x6d\x5b\x06\x10\xee\xf3\xd9\x4d\x65\x3a\x9b\
+\x2e\x4b\x60\xbe\x7c\x7c\x0a\x90\xc9\x9e\xbe\x97\x69\x17\x84\xec\
+\x93\x9b\xfc\x81\x7d\x20\xdf\x0f\x29\xf0\x60\x95\xf6\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\xf2\x14\x50\x28\x2f\x07\x2a\x5b\xee\xe3\
+\x73\xbf\xa1\x84\x49\xca\x5e\x28\xb5\xc8\x78\xfa\x1b\x50\x43\xfc\
+\xe9\x3d\x9e\xe8\xf7\xb7\x95\x1a\xec\x53\xb7\x9d\xd9\x66\x76\xf7\
+\xa5\x4c\xd2\xb8\x0c\x85\xd1\xa8\x30\x1e\x97\x3e\x00\xad\x6a\x08\
+\xdf\xf6\x21\xea\x98\x69\xa5\xae\x8f\x9f\x3c\x5d\x6f\x3e\x01\x21\
+\x17\x7f\x57\x65\xc8\x39\x11\x63\x8b\x59\x3f\x94\x01\x70\x02\xb3\
+\x33\xc0\x47\x94\x52\x6a\xf5\x3b\xe4\x60\x19\x9a\x48\x34\xb0\x79\
+\x3c\x28\x3e\x6a\xd8\x89\x44\xfa\x39\xe4\x76\xa6\x52\xbe\xc4\xc8\
+\xc0\x8c\xd3\x16\xcd\xab\xbd\xb7\x36\x1a\x7e\xfa\xd7\x91\xe5\xdb\
+\x46\x4a\x2d\xa5\xdc\xc1\x6c\x1e\x18\x81\x5d\x66\x63\xf3\x0e\x83\
+\x78\x93\x9c\x2f\x01\xd7\xf0\x0a\xe7\x2f\xe1\x6b\x76\xf7\x95\xfb\
+\x03\xe0\x94\x79\x65\xff\xc7\x78\x60\x7f\xdc\x8c\x5f\xd4\xa7\x7b\
+\x1d\x0f\x41\xaf\x01\x1f\x11\xe3\x18\xec\x16\xc6\x55\x3c\x30\x5d\
+\xc4\xd7\x0f\xff\x10\x6c\xa9\x78\xb8\x7e\x0e\xaf\xf3\xeb\x27\x04\
+\xdc\xc2\x2b\xa3\x87\x66\x2c\xe1\xdb\x1c\x05\x16\x23\x71\x15\x6c\
+\x5c\xdb\xb7\x9f\x01\x6e\x42\x58\xc6\x03\xe8\x01\x5e\x75\xbc\x8c\
+\x4d\x42\xed\xb1\x79\xe0\xba\x5a\xf7\xd3\x01\x2f\x06\xc2\xa0\x50\
+\xd6\x80\x45\xf3\x6d\x8f\x01\x9f\x6d\x1a\xfe\x92\x76\x30\xae\xaf\
+\x67\x57\xcf\xc1\x4d\xbc\xfb\x41\xac\x5f\x7d\x30\x7f\xa4\xb6\xbe\
+\x3f\xc2\x74\xad\xf1\x16\x0f\xe2\x13\xf0\xc5\x48\x3c\x6f\xd8\x12\
+\x70\xa3\xf3\x09\x0d\x93\xee\xca\xfe\xc1\xda\xf4\xd5\x9e\x05\x58\
+\x82\x7c\xa4\x06\xf2\xfd\x35\xb3\xad\x7d\x3d\x34\x73\x58\x17\x69\
+\x18\xd1\xed\xdd\xbe\x1e\xa0\xc4\x9c\x30\x06\x0c\x06\x23\x68\xa1\
+\xf4\xad\x1d\xa6\xdb\xb4\x2d\x43\x22\x09\xdb\x51\x4d\x3f\x20\xcc\
+\x66\x48\x4d\x43\xea\x3a\x46\x94\x12\x5b\xba\xbe\x12\x7d\x52\x2d\
+\x5a\x43\xad\x0b\x29\x31\x97\x33\x3f\xcb\xe4\x1b\x75\xfc\x23\xe0\
+\x33\x90\x8f\xd7\x23\x5f\x86\x14\xcd\x32\xf5\x7c\x5d\x6f\x68\x96\
+\x8d\xee\xa4\x65\x16\x0d\x3b\x1e\x23\x37\x0d\xab\xef\x0f\x2b\x10\
+\x4b\x5d\x7e\xe1\x55\xb3\xda\xb9\x20\xc6\x1b\x7c\xf6\x4b\x97\x39\
+\xf7\xf2\x1a\x7f\xfe\xdd\xcf\x71\xed\x72\xc4\x5f\x87\x25\x3c\x60\
+\x9f\x54\xca\xf7\xa7\xa3\xde\x36\x84\x34\x86\x6d\x2d\xbd\xfb\xe5\
+\x0a\x5a\xa6\x5d\x11\x26\x01\x7c\x9d\xa0\xd0\xe0\x13\x33\x16\xeb\
+\xb8\x17\x6b\x15\xf2\x00\x18\x45\xeb\xa2\x31\x59\xb6\x62\x2f\x1d\
+\x66\x1f\xf8\xf3\x27\x02\x57\xf1\x4e\x08\x44\x98\x33\x55\xb2\xee\
+\x9b\xc7\xd9\xba\xfe\xa9\x94\x69\x1b\x68\x3b\x3a\x68\x9a\x5a\x37\
+\xdf\xff\xdc\xdd\xdf\x75\x95\x52\x4b\xce\x19\x7f\x0f\x3c\x50\x88\
+\xbb\xb3\x11\xc8\xcc\xef\xa1\xde\x50\x03\xfa\xb6\x06\xf4\x35\xa0\
+\xae\xdb\x79\x88\xde\xdf\xf7\x20\x47\xf6\xb0\x1b\xda\xe2\x9f\x57\
+\xf5\x53\x68\x30\xd8\x35\xa8\xfe\xb7\xc1\xa0\xdd\xa3\x71\xc9\x43\
+\xcf\x87\xf1\xcf\x98\x1d\x9f\x95\xed\x8e\x9f\x1e\x26\xf0\x67\xda\
+\xb1\xa0\x76\x30\xf0\xd0\x3d\xa7\x54\x8b\xe2\x13\x19\x9f\x17\x44\
+\x4e\xf5\xa3\x28\x97\x1d\x8f\xeb\xc7\xa8\x50\x5e\x44\x44\x44\x44\
+\x44\x44\x44\x44\xe4\x19\xa3\x50\x5e\x0e\x44\x9f\x8d\xdb\xb6\x36\
+\xbc\x81\x10\x8c\x62\xde\xf1\xbb\x84\xb2\x2b\xd2\x0a\x7d\xff\xe9\
+\x6d\x55\xf4\xbd\xed\x7f\xa3\x0e\x84\x9a\xdf\xb2\x23\x4a\xf7\x5f\
+\x4a\xa9\xfb\x4f\x09\xc6\x63\x0f\xe0\x47\x84\x11\x30\x1e\xfb\x61\
+\xbc\x73\xec\xa0\x40\x3b\x88\xc4\xce\x66\xd6\xac\xc6\xc3\xc2\xd3\
+\x78\x20\x7d\xc5\x43\xf3\xe8\xf7\xa7\x18\x88\x71\x91\xae\x8b\x78\
+\x28\x7c\x0a\x0f\x61\x5b\x3c\x0c\xde\x62\xab\xf5\x35\xe8\x43\x28\
+\x3e\x9b\x80\x63\x86\x7d\x06\x0f\x99\x37\xf1\x10\x7c\x23\x93\x3b\
+\x32\xde\x18\x7b\xda\x6e\xfd\x05\xe0\x0a\x46\x86\xad\x39\x7e\xf4\
+\xe7\x85\x76\xbc\x54\xd7\x72\x3f\x87\xb7\xed\x5e\xc2\xff\x88\xbf\
+\x01\xf6\x0a\xad\xbd\x0a\x5c\x60\x5a\x91\x9e\x81\xab\x66\x74\x75\
+\xfb\x33\x31\xd2\x9a\x57\xb4\x93\x12\xa1\xbe\x3c\x67\xf0\x70\x7a\
+\xf6\x04\x9e\x8d\x66\x27\x89\x5c\x37\x20\x12\x8f\x18\xd6\x07\xd8\
+\xfd\x39\x1a\x32\x0d\xcc\x77\xbd\x0a\xf8\xe3\x16\xea\x39\x6d\xcd\
+\x67\x2f\xf4\xd5\xdd\x9b\x3e\xc6\x0c\x5e\x59\xbf\xc6\xb4\xb2\xdc\
+\xf0\x70\x7f\x3a\x87\x22\xc6\x88\x95\x45\x28\xb1\x50\x7e\x0a\x7c\
+\xbf\x3e\xa7\x1f\x47\x38\x6b\x70\xba\xeb\xf8\x3c\xf0\x23\xb6\xc5\
+\xd7\x13\xb9\x7e\xb5\x78\xd0\x7f\xbd\xa6\x4a\x11\x0f\xe1\xfb\x6a\
+\xed\x93\xf5\xfc\x6d\x18\x96\xf0\xd7\x61\xa1\x9e\xf3\xe5\xfa\xd8\
+\xdc\x25\xfc\x4a\x9d\x59\x1f\x3d\xfb\x36\xfd\xf9\xd9\x55\x29\xdf\
+\x79\x28\x9e\xe8\x9a\x21\x74\x7b\xb5\xa6\xf7\x27\x6f\x75\x4c\x6d\
+\x3b\xd8\x79\xdf\x4c\x75\xeb\x00\x9b\x4c\x04\x99\xa8\xc1\xd5\xe4\
+\x8d\xd3\xf9\xc2\xe9\x0d\x39\x07\x68\xe6\xa0\xeb\xab\x71\x7b\x17\
+\x00\x72\xe6\x43\x60\xb5\xee\xff\x45\xbc\x5b\xc2\x08\x9f\xd4\x50\
+\xf7\x99\xad\xee\x7b\x11\xb8\xdd\xd1\xf5\xe7\xf9\x16\xb0\x6a\x90\
+\x49\x11\x72\x28\x10\xa9\x93\x06\x8e\xe0\xd7\xe9\x87\xf8\x35\x96\
+\x19\x0c\x5b\x16\xe7\x3a\x52\xca\xbe\x7a\x04\x57\xf0\x2f\x9f\xd4\
+\x42\x67\x03\x28\x2d\x10\x23\x8b\x66\x1c\x07\x9a\x7a\xd3\xb6\x86\
+\x18\xf8\xf5\x34\xc2\x5f\xb3\x23\x09\xd6\x6a\x6b\xf9\xb9\x1a\xc8\
+\x7f\x16\x7f\xcd\x97\x99\x2e\xc5\x10\x48\xe9\x16\x39\x77\xf5\xbd\
+\xd1\x5f\x97\x77\xb3\x89\x87\xff\xfd\xf7\x82\x3f\x68\x93\xdd\x1f\
+\x52\x22\xf7\xa3\x00\x6d\xd7\x7f\x56\x75\x33\x0d\xd5\xef\x55\x55\
+\x0e\xd3\x00\xbf\xe9\xa0\xcb\x5b\x40\x66\x38\xcc\x6c\x6d\xdd\x77\
+\xcf\xfb\x7b\x69\xb7\xc5\xd3\x35\x84\x1f\x86\x30\xfb\xb1\xba\x2d\
+\xb0\x7e\xa8\x6c\x7c\x8f\xc7\xb6\xad\x77\x05\x01\xd8\xda\x2a\x30\
+\x9c\x1c\x73\xaf\x95\x44\x1e\x36\x92\x6f\x77\x1d\xdb\x8f\x39\x0c\
+\x5b\x7e\xb4\x07\xdf\xf1\xec\xff\x67\xef\xf8\x3c\xc8\xc5\x73\xf7\
+\xfa\x5b\xfd\x4f\x66\xe6\xc6\x3d\x1f\xf7\xa9\xb7\x8b\x88\x88\x88\
+\x88\x88\x88\x88\x88\xc8\x53\x48\xa1\xbc\x1c\x88\x76\x6b\x2b\x02\
+\x75\x69\xf0\x3e\x49\x2b\x93\x52\xf6\x99\xa6\xf5\xb5\x65\x7d\xad\
+\x8d\x2f\xd3\x2a\xf9\x52\x97\x7c\xee\x6b\xe6\x4b\x29\x7d\x0f\xfc\
+\xba\xc3\x50\x7f\xf5\xdb\x4b\xa9\xb5\xf4\x01\x42\x29\xd3\xc0\x3e\
+\xe7\x02\x58\x0d\xe3\xad\x4f\x7a\x6b\xf0\xd7\x77\x94\x4f\x35\x3c\
+\x0e\x78\x78\x78\x16\x0f\x56\x97\x81\x0d\x32\x81\x0c\xb5\x92\x1d\
+\x36\x37\x0d\x23\xe1\xc1\x70\x5f\xcd\xfd\x01\x1e\xd4\x9d\x02\x32\
+\xe3\xb1\xd1\x76\x46\x88\xb5\x34\x8e\x84\x87\x8f\x97\x99\xae\x2d\
+\xef\x21\x6e\x29\x0d\xd7\xae\x0e\x59\x59\x6a\x80\x31\xc6\x65\xe0\
+\xa3\xda\x7a\x7e\xcc\xc6\xda\x35\x60\x85\xc1\xa0\xd0\xb6\x2f\xe2\
+\x81\xf5\x55\xe0\x73\xc0\x67\xf1\xb6\xe8\xeb\x78\xa4\x70\x1e\x62\
+\xf2\x6a\xe5\xc9\x4c\x86\x8e\xc8\xb5\x1a\xf8\xd6\xd3\x02\xf8\x84\
+\x83\xda\x82\x3f\xd6\xa7\x9f\x07\x78\x95\x7a\x3b\x3d\x89\xac\xe1\
+\xd5\xc4\xb3\x15\xde\x5b\xf8\x7a\xdf\xd3\x8a\xf0\x10\x06\x94\x72\
+\x2a\x46\x36\xbd\x77\xbd\x6d\xe0\x95\xf3\x0d\xd3\xea\xbf\x3b\xc0\
+\xed\xda\x16\xbc\x3f\xfa\x02\xdb\x67\x5d\xa4\xfa\x3a\xdc\x02\xfa\
+\x0b\xe9\x76\xdd\xcf\x56\x3d\xcf\xeb\xc0\x0d\x23\x2d\x43\x7e\x15\
+\x78\xa1\x36\x5d\xfe\x45\x43\x53\xfa\x96\xd0\x77\xb5\x3b\x7c\xb9\
+\x5e\x9f\xe3\x22\x70\xd1\xcf\x4d\x0c\x11\x4b\x36\x69\xdb\xcf\x29\
+\x62\x6c\xc9\x76\x1b\x72\xf6\xf6\xc3\x19\x32\x25\x12\x83\x61\xa7\
+\xd9\x5e\x29\x3f\x3b\x86\x91\x9f\xeb\x6e\x08\x8c\xf6\x5a\xd5\xb9\
+\xa1\x09\x5d\xec\x1a\x6c\x66\x4d\xf9\xa6\x09\x7d\xe5\x6c\x6d\xcd\
+\x0f\x34\x43\xe8\xfa\x09\x0e\xd3\x40\xb9\x69\x42\x4d\xf6\xea\xfe\
+\x18\x74\x7e\xdc\x86\x5a\x29\xef\xed\xb1\xd3\x7c\xa4\xbc\x60\xd8\
+\x3a\xf0\x43\xfc\x7a\x5a\x68\x5b\x5e\x8d\x91\x63\x66\x2c\xd7\x73\
+\x5f\x3b\x0c\x78\xda\x8e\xbf\x86\x09\xef\xa6\x60\x78\x68\x7f\x03\
+\x78\x01\xa3\x90\x29\x0c\x42\xa1\xb1\x82\x59\x5b\xb7\xbb\x5a\x1f\
+\xb3\x08\xc9\xd7\x95\xc8\xde\x11\x22\x4f\x5b\xdc\x07\x1f\x63\x0c\
+\x60\xb4\xbe\x7d\xa8\xa1\xf9\x75\xa0\x8b\xd8\xc8\xe0\x15\x3c\xbc\
+\x1f\x42\xfc\x6c\xed\x3a\xb1\x52\xcf\xf7\x5a\xcd\xbb\x96\xea\xf3\
+\xe9\x03\xf7\xbe\x0b\x46\x89\x91\xf9\x10\xd8\x0a\x21\xdf\xec\xa6\
+\xaf\xcd\x66\x7d\xad\xf6\x0a\xc0\x02\x7e\xed\xaf\xe1\x81\xfc\xea\
+\xe4\x35\x4d\x69\x93\x9c\xcf\xe1\x13\x1b\xfa\x8f\x15\x55\xce\x3f\
+\x84\xc7\x59\x25\xff\x14\xb6\xae\xef\xb5\x6c\x9b\x40\x34\x53\x72\
+\x5e\x7f\x1c\xcc\xdc\xe5\xad\xd5\xfb\x7f\x3d\xdb\x49\x3d\x3b\x90\
+\xd8\xda\x1a\xb1\xcf\x95\xd5\x83\x81\x1f\xa1\x6d\x81\xad\xbd\xe6\
+\x39\xed\xeb\xc1\x7c\x39\x8d\xad\x42\x9d\x8a\x54\x06\x83\xad\xd0\
+\x32\x60\xd0\x3e\x50\x03\xf9\x87\x38\x76\x09\xb4\xfe\xbf\x11\x3b\
+\xce\xf7\xa7\x6b\x38\x79\xbc\xe3\x6f\x0f\x7d\x02\x5f\x01\xe6\x3b\
+\xb8\x14\xe1\xec\xf6\x59\x3e\xd3\xdf\x66\x27\xfe\xc5\x48\x30\xa3\
+\x14\x58\x2c\x70\x24\xd6\x49\x52\x00\x1d\x5c\x58\x87\x9f\xb6\xfe\
+\xff\x15\xb3\x9d\x43\xb4\x64\x86\x88\x88\x88\x88\x88\x88\x88\x88\
+\xc8\x53\x4a\xa1\xbc\x1c\x88\x94\x52\x01\x6a\x67\xdd\x9d\x76\x15\
+\x54\xef\xbd\xc9\xdd\x22\x86\xfa\xf0\x10\xa0\xcc\xf4\x8f\xde\xf6\
+\x90\x00\x65\xfa\xb7\xef\x32\xc7\x5c\xd9\x64\xb3\xc0\x1c\xcc\x6d\
+\xc2\x26\xd4\xf5\xa7\xcb\x80\x41\xc9\xe4\xa1\x61\x43\xe0\x55\x3c\
+\xe8\x5c\xc1\x03\xc5\x0c\x9c\x25\x11\x88\x61\xfa\x97\xf5\xe5\x95\
+\x16\xeb\x56\xa9\x6b\xbf\x33\x2d\x7b\x0b\x7d\xc4\xcd\xc6\x5a\x07\
+\x0d\x34\x19\xba\xdc\x87\x42\xd7\xd9\xfe\x47\xf5\x0c\x44\x6e\x5c\
+\xce\xac\xdc\xdc\x62\x7d\x7d\x03\xaf\xb8\x1e\x03\xd1\x6c\x12\x14\
+\xbe\x40\xe2\x1c\x6d\x3b\x07\x7c\x06\x0f\x09\xc7\xf5\x44\xde\xc1\
+\x83\xc5\xbe\x42\xfb\x1a\xd8\xfb\xf8\x3a\xec\x00\x44\x62\x63\x66\
+\x97\x22\xb1\x35\xec\x97\x40\xbf\xb6\xf6\x32\xde\xe2\xfe\x52\x84\
+\x62\xfe\x34\xb6\x80\x4f\x22\xf1\x62\x2d\xaa\xaf\xcb\xc5\x13\x81\
+\x41\x0d\x9f\xa9\xe7\xe9\x02\xb1\xbf\x1b\x28\x65\x01\x18\x98\xb1\
+\xd1\xdf\x82\x07\xff\xf3\x93\xf3\xe2\xff\x1d\x61\xb6\x05\x10\x2d\
+\x9e\x34\x9f\x54\x70\x7b\xfa\xea\xc5\xb3\x78\xa0\x3f\x7b\xa1\x0c\
+\x09\x2c\x50\xb8\x4a\xc2\xc8\x7d\xbb\xf2\xfc\x11\xb5\x1d\x79\x3d\
+\x77\x17\x3a\x3e\xa5\xda\x74\xb7\xfe\xdc\xb5\xc0\xbf\x00\x3e\x4c\
+\x89\x57\x72\xb6\x4b\x36\x9d\xb8\xb0\x15\x89\x1b\x66\xd6\x01\x67\
+\x20\x26\x72\x5e\x26\x25\x83\x5c\x88\xd6\x62\x9c\x4d\x70\xbb\x10\
+\x93\x61\x73\x3b\x8e\x31\xf0\xe7\xc6\xa8\x9e\xe3\x5d\xa3\xac\xe3\
+\x4e\x50\x43\xf9\x1a\xc8\x37\x10\x68\x66\x8a\x68\x53\x19\x92\x27\
+\x5d\x07\xd2\x74\x07\x93\x3d\xd6\x29\x2d\xf4\x2d\xeb\x87\xc0\x30\
+\x91\xe6\x33\xf9\x04\x31\x6f\x9a\x4f\xfc\xf8\x90\x01\x99\x96\x8b\
+\xf8\x72\x07\x25\x58\xfa\x49\xad\x8a\x4f\xbe\x8b\x54\xea\xef\xfd\
+\xf1\x3a\x3c\xf8\xee\x33\xac\x04\xcc\x45\xb8\x63\x89\xda\x4d\xa2\
+\xa9\x8f\xb3\xfe\x7d\xd1\xf8\x76\xd9\x18\xa6\x3a\x25\xc1\x3b\x43\
+\xc4\xc8\x0b\x66\x9c\xf5\xfd\xdb\x06\x89\xaf\x40\x6a\xc9\xf9\x14\
+\xde\xa9\xe2\x43\xa0\x31\x3f\x67\x7d\xe0\xde\xe2\xf3\x6b\xce\xe0\
+\x93\x33\xfa\xf7\xec\xfb\xd3\xb3\x3d\x08\xb4\xed\x1a\x3e\xa1\xc2\
+\xab\xdb\xfd\x4a\x5d\x1b\x0c\x58\x66\x7a\x6d\xad\xe0\xaf\xf1\x5e\
+\x1f\x4a\x03\x3c\x88\xef\xbb\x39\x4c\x1f\x97\x73\x57\x7f\x4f\x78\
+\x37\x85\x04\x1c\xbf\x76\xed\x1a\xff\xe7\x3f\x7b\xef\xc2\x67\xbf\
+\xf2\x95\x3b\xaf\xbc\xf6\x2b\x9b\xb1\x7e\x16\x8a\xcc\xe8\xc3\xd5\
+\xcd\xe9\x4d\xbb\x7b\xa9\xb7\x3b\xef\x6a\x77\xdd\xb9\x05\xbc\x06\
+\xfc\xc7\x6c\xff\x17\x33\xe0\xef\x2d\xff\xf7\xc3\xa6\x77\xc6\x48\
+\x5d\x71\xe5\xde\xee\x2b\x94\x7e\x68\x3e\xf9\x66\xf2\x4f\x42\xdf\
+\xc2\x7e\xf2\x1f\xbf\x29\xc6\x9d\x81\x7c\x84\x58\x3f\x8a\xcc\x0a\
+\x33\xcf\x2f\xd6\xfb\xed\x41\xe7\x26\xf4\xc7\xde\x56\xb5\xbf\xed\
+\x90\x01\x9b\x4c\xba\x62\xe6\xdf\xb1\xe6\x68\xc7\xaf\xff\x0e\xdc\
+\x3c\x0e\x1b\xa7\x61\x25\xc1\x1d\x83\x2b\xbb\xdb\x6e\xdc\x65\x4c\
+\xb6\xfd\xc7\xd9\xc7\x8d\xe1\xca\x9f\xc0\xef\xff\x04\xbe\x80\x7f\
+\xce\x44\xfc\xdf\xea\x7f\x82\x82\x79\x11\x11\x11\x11\x11\x11\x11\
+\x11\x91\xa7\x92\x42\x79\x39\x50\x96\xfb\x4a\xf9\xe2\x15\xf2\xa5\
+\x5f\x24\xba\xae\x1c\xdf\xf7\xab\xa7\x56\xc6\xd7\xd2\x79\xdf\xae\
+\x5f\x63\x9e\x99\x1c\xbf\x6f\x57\x5f\x1f\x5f\xc2\xb6\x7d\xfb\x7e\
+\xbc\xb6\xbe\xaf\xd2\x6f\xfc\x41\xde\xbe\xbe\x06\xf2\x55\x01\x4a\
+\xeb\x95\xf2\xe7\xf1\xd6\xe5\xd7\xf1\x3f\x7c\xf7\x7f\xf4\x0e\x40\
+\xa6\x94\x21\x64\x88\xc5\x26\xd5\xd1\x1e\x0e\xae\xb2\xa3\x0f\x2d\
+\xc6\x3c\x89\x23\x58\xf6\x75\xaa\x43\x53\xa0\xf4\x6d\xd2\xf7\x4a\
+\x8b\x0b\x39\xaf\xb0\xbe\xde\x87\xfb\x9f\xc1\xdb\xa6\x1f\xc1\x5b\
+\xaa\xbf\x42\x64\xbe\x86\xd0\x63\xfc\x8f\xf3\x0b\x78\x95\x7e\xc3\
+\xb4\xea\xbe\xb7\x05\x1c\xaf\xeb\xd2\xd7\x21\x59\xc6\x27\x19\xac\
+\x4c\xb6\xaa\x1d\x04\xea\xfe\x66\x3f\x2b\x1a\xe0\x65\xc3\x4e\xe0\
+\x13\x0e\x02\xde\x1e\xfc\x38\xde\x05\xe0\x83\xba\x5d\x0b\x5c\x67\
+\x5a\x7d\xdf\x57\x29\x7f\xec\xdb\xa6\x00\x79\xd2\xce\x7d\x9a\x65\
+\x70\xae\x9e\x8b\x8f\xeb\xd8\xd6\xea\xb8\x86\xa4\x14\x7c\x89\x5d\
+\x5b\xc2\x83\x88\x5e\x20\x84\x23\x94\xba\xe2\x40\x9e\x54\x41\x5b\
+\xdd\xff\xcf\xf1\x6a\xe7\xf3\xf8\x2b\x7c\x82\xed\xad\xf6\xef\x65\
+\x84\x57\x41\x5f\x65\x5a\xf1\xb8\x95\x33\x7f\x5d\x9f\xeb\x4b\xf8\
+\xeb\x71\xd6\xb0\xd3\x91\x78\xd3\xb0\xdb\x35\xda\x3a\x1e\x73\x1e\
+\x19\xac\x9a\xb1\x05\x1c\xcb\xa4\x75\xc8\x23\xb6\x2f\x09\xd0\x9f\
+\xd7\x86\x5a\xe9\xbd\xed\x42\x48\x24\xb2\x3f\xb5\x5a\x25\xef\xa1\
+\xfc\xb6\xb6\xd6\x75\x4b\x38\x4a\xce\x4d\x1d\xf7\x10\xc8\x89\x14\
+\x66\x5a\x22\x2f\xfa\xf9\x87\xec\xe7\xe4\x78\x7d\x0e\x4d\x26\x2f\
+\xe1\xaf\xd9\x07\x78\xc8\x7c\x84\x96\x57\x12\x1c\xc9\x5e\xf5\x3e\
+\xc8\x94\x57\xf0\xa0\xfb\xa6\x1f\x35\x47\x20\x26\x52\xf1\xd6\xf0\
+\x79\x09\x6f\x0b\xff\x32\xf0\x45\xfc\xda\x38\x6a\x70\x75\xf2\x2e\
+\x34\x2b\x33\xeb\xbf\x9f\xc5\xdf\x5b\xbe\x2c\x41\x6b\x86\xe5\x82\
+\x75\x86\xbf\x4d\x57\xf0\xaa\xfc\x0c\x2c\xc4\xc2\x31\xb3\xfc\x2f\
+\xeb\x98\x3b\x3c\x98\x9f\x07\xfe\x1a\xf8\xe9\xcc\x59\x3b\x59\x5f\
+\x2f\xf0\x6b\x78\x1d\x9f\xa0\xe2\xc7\xf5\x94\xad\x0f\xe5\x53\x3d\
+\x5f\x47\x80\x6b\x6d\x3b\x99\x00\x02\xf0\x3d\x7c\xd9\x83\xbd\xae\
+\x95\x80\x5f\x4f\x09\xbf\x46\x97\xd8\x1e\xe6\x7f\x82\x5f\x7b\x93\
+\xb9\x41\x27\x4f\x9e\x24\x0d\x07\xf6\xbd\xef\x7e\xf7\xec\xf7\xbe\
+\xfb\x5d\x4e\x9c\x3d\xb5\xf9\xe5\xbf\xf9\xd5\xa5\x33\x67\xcf\xb6\
+\x0a\xe8\x65\x46\xdf\xf1\x03\x46\xa3\xc0\x78\x5c\x00\x46\x8c\xc2\
+\x98\xf1\x3d\xaf\x93\xd1\xc8\xff\x59\x1c\x8f\xd9\xc4\x3b\x5d\xfc\
+\xaf\xa3\x11\xb9\x2e\xcb\x02\x10\x46\x23\x18\x8f\x77\x3f\xf6\x7e\
+\x02\xf9\xfb\xf4\x08\xdd\x07\x6c\xe6\xbf\xfd\x73\xee\x7f\x86\x31\
+\xe3\x32\x62\x14\x26\x7d\x6d\x46\xfd\x92\x33\xfd\xec\x02\xf3\xe3\
+\xdb\xdd\xf6\x78\x77\x23\x08\xe3\x51\x7f\x24\x80\xf1\xec\x42\x29\
+\x77\x1b\xea\x34\xec\xef\x0f\x31\x18\x1c\x3b\xdd\xb6\xaf\xfc\x1a\
+\x7c\xf4\xaf\xe0\xcb\xc7\x61\xfd\x9c\x7f\x3e\xec\x8b\x02\xe1\x84\
+\x8f\xcc\xf0\xff\xcf\x58\xc4\x3f\x13\x9f\xc6\xae\x0f\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x82\x42\x79\x39\x20\x7d\xf8\x94\x6d\xaf\
+\x4a\xf9\x3e\x98\xdf\xfb\xb7\x7b\x9b\xdd\x76\xb6\x46\x7e\xf7\x66\
+\xa5\xde\xdf\x41\xe9\xd8\xf4\xf0\x76\x73\xe7\x56\xbe\xc3\x48\xdc\
+\xb0\x69\x10\x5c\x76\x6c\x03\x30\x64\x73\x9c\x89\x83\x32\xd9\xf1\
+\xee\x80\xbd\x5f\xe3\x7b\x48\xc6\x88\xb1\xe1\xca\x47\x85\xd5\xa5\
+\x86\xd2\x8d\x98\x56\x16\x07\x7c\xdd\xeb\x13\xf5\xeb\x5a\x3d\x4e\
+\xdf\xba\xf6\x02\x1e\x32\xde\xc4\xdb\x75\x0f\xb1\x49\xd5\xbe\xe1\
+\x81\xfc\x02\x5e\x59\xde\xaf\xe7\xde\x8b\x78\xeb\xf5\x1b\x66\x84\
+\x1a\xf3\x12\xbd\x82\x70\xb3\x56\x6f\x6f\xc2\x64\x4d\xf9\x05\xbc\
+\xd2\x72\x71\xda\x56\x37\x02\x76\x87\x69\xe0\x5d\x62\x64\xd5\x8c\
+\x1b\x40\x43\xb4\xc2\x74\x55\x82\x93\xf5\xf9\xf4\x2f\xc2\x00\x0f\
+\x61\x0b\xd3\xaa\xfb\xab\x44\x16\x67\xe2\x92\x65\xe0\x3a\x31\x76\
+\x35\x21\xea\xc3\xa9\x51\xed\xa9\xdf\x4f\x3e\x38\x52\xcf\x81\x4f\
+\x1e\x28\xe5\x36\xfd\x24\x09\x9f\x10\x60\x33\x5f\xe0\xe1\xd4\x00\
+\xef\x76\x70\x0b\xf8\x0b\xa0\xa5\x21\x34\x5d\x43\x47\x57\x9a\x86\
+\xd0\xd1\xcc\xbc\x72\x5d\x81\xf8\x1b\x60\x67\x26\xc7\xd9\xbe\xcf\
+\x31\x1e\x04\x7f\x58\x5f\x8b\x4b\x44\x3b\x8d\x71\xac\x8e\xed\x7a\
+\x5d\xf8\xf8\x12\x1e\x4e\x8f\x20\xb7\xf8\xeb\xbb\xe3\xf3\x37\x46\
+\xb0\x00\x5e\x2b\x3e\xf3\xce\x58\x24\x73\x62\x1a\x62\xc7\x4b\xf5\
+\xfc\x4f\x7b\x46\xa7\xe4\xeb\xa7\xe7\x7c\x81\x69\x45\xff\x1c\x1e\
+\xca\x1b\x4c\x5e\xeb\x79\x20\xa4\xc4\x95\x9c\xeb\xb5\xd1\xd0\xd2\
+\xb1\xd6\x34\xc4\xae\x63\x95\xe9\x44\x8c\x97\xf1\x49\x16\x96\xe1\
+\x83\xba\xd6\x7c\x00\x3b\x12\x23\xa7\xcd\xb8\xc8\xb4\x2a\x7e\x3d\
+\x7b\x38\x3f\x97\xe0\x72\x8e\xf1\x33\x98\x9d\xac\x63\xb8\x0e\x71\
+\x05\x2c\x63\x14\x42\x28\x04\x4a\x5d\x9e\xe0\x22\x1e\x5e\xdf\xf0\
+\x63\x26\xbf\xdf\x4b\x4e\x0b\x60\x31\xb2\x6c\xc6\x1d\x60\x10\x61\
+\xae\x56\xb3\xdf\xc2\xc3\xf4\x7e\xac\xcb\x75\x1f\x7d\xe8\x1e\xea\
+\xd8\x5e\xac\x67\x28\xe0\x01\xf9\x6c\x68\xde\x5f\x97\x2f\xf9\xa9\
+\x99\xbc\x7f\x56\xfb\xfd\x9c\x80\xb0\xb4\xed\xfd\x7e\x22\xc0\xd2\
+\xec\xe3\xfb\x9f\xe7\xea\xf3\xe8\xdf\x17\xd4\xfd\xb0\x63\xdb\x32\
+\x18\x0c\xf8\x0f\xfe\xd3\xff\xec\x9a\xe5\x1c\x7e\xf9\x8b\x5f\xcc\
+\xfd\xf0\xcf\xff\xec\xc4\x1f\xff\xef\xff\xfc\x85\x26\x35\xe5\x85\
+\x4b\x97\xd6\x7e\xf5\x37\x7e\x73\xf9\xf8\x89\x13\x9d\x02\x7a\x77\
+\x48\x5b\xd7\xf7\x95\xf2\xfe\x1e\x9f\x49\xcf\xc7\xf7\x4c\x88\xd9\
+\xb9\xf9\x56\xfd\x5a\x1d\x8f\xb7\x4f\x0e\x1b\x8f\x81\xc5\xc5\xc0\
+\xda\xda\xce\xeb\x6c\xe7\x3f\xa0\xb3\xb7\x3d\xaa\x87\xda\xcf\xec\
+\x73\x1e\xcf\xde\xb6\xb0\x10\x58\x5f\x2f\x3b\x4e\xc9\x23\x8d\x75\
+\xbc\xfd\x3f\x6e\x61\xc1\xf7\xb9\xbe\x5e\x26\xc7\x5c\x20\x2c\xac\
+\x2f\xb0\xbe\xeb\x9f\xd8\xaa\x6d\xe3\x60\xda\xf1\x64\x10\xb6\x9f\
+\xcf\xfd\x52\xf0\xcf\x9d\x65\xfc\x73\xe7\xd8\x63\x38\x86\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\xec\x13\x85\xf2\x72\x20\xfa\x55\xdf\
+\x73\xb6\xba\x3e\x7c\xa9\xeb\xc9\xf7\xa5\xf2\x33\x79\xd7\xa4\xf8\
+\x3d\x50\xfa\x6a\xf8\xc0\x64\x8d\x79\xbf\xb3\xae\x2e\x3f\xb3\xae\
+\x7c\xa9\xf7\xef\xf5\x17\xfa\x42\x5d\x83\x7e\xfa\x6b\x1f\x30\xc3\
+\x3c\x01\xe6\x61\x63\xa3\xbf\x2d\x1a\xd6\x41\xdc\x60\x66\xbd\xd7\
+\x19\x99\xce\x8c\xf1\x7a\x37\x79\x4b\x35\x61\x76\x9f\xb3\xeb\xd0\
+\x7b\xf5\x72\x22\x73\xf3\xda\x80\x7f\xf3\xdd\x55\xc6\xe3\xeb\xf5\
+\xf6\xcf\xe3\x55\xcb\x27\xf1\x1d\x8d\xf1\x50\xfd\x04\x1e\x30\x9e\
+\xc4\xc3\xf6\x8b\x78\x28\xd9\x07\xb3\xab\xcc\xb4\xab\x8d\x91\xce\
+\x8c\x2b\xc0\xd5\x18\x39\xb1\xad\xf2\xd1\xbb\xf7\x5e\xc5\xdb\x78\
+\xbf\x3a\x2d\xbe\xb6\x88\x87\xca\x63\x22\x97\x31\xc8\x99\x42\x8c\
+\x63\xcc\x6e\x02\x27\x7d\x45\xf9\x54\xb2\x87\xca\x4b\x78\xc0\x6b\
+\x24\x8a\x65\x32\x1e\x00\xcf\xd7\x5a\xc5\x5c\x9f\x43\x0b\xac\xd7\
+\x80\x3d\x04\x18\x95\xbe\x6a\x39\xa5\x8e\x92\x13\xc6\x4b\x18\xc7\
+\x89\xb1\x03\x6b\x21\xae\x83\x85\xba\xe6\x78\xdf\x82\xff\xc5\x7a\
+\x3e\xc7\x40\x82\x78\xc6\xb7\x65\x03\xd8\x8c\x91\x2d\x33\x5a\xbc\
+\x5a\x30\xd7\xf3\xd2\x77\x08\xe8\xcf\xc0\x16\xf0\x57\x78\x80\x7a\
+\xae\x9e\xc7\xef\xd3\x51\xfa\x76\xf6\xdd\x4c\xc9\x79\x75\x0e\x6c\
+\x80\x4f\x0a\x58\x9c\xd9\x9f\x0d\x19\x06\x86\x5b\x6c\x31\x84\xad\
+\xad\x4d\xe0\xc7\xc0\x07\x66\xbc\x52\xcf\xe5\x0b\xc0\xb9\xec\xdd\
+\x04\x7e\x5a\xcf\x59\x00\xd6\x19\x0c\x22\x6d\xbb\xe3\x5a\xb2\x04\
+\x71\x0b\xac\xc9\xfd\x7a\xf1\x1e\xb0\x0f\xeb\xb8\x6f\xf9\xe3\xad\
+\x10\x69\x92\x71\x36\xf7\x61\xbb\x4f\x56\x18\x01\x1f\xd5\xd7\x76\
+\x08\xfc\x2d\xea\x44\x0f\x7f\x79\x98\xab\xaf\xc7\xcf\x52\xe2\xc6\
+\x64\xe5\x88\xfa\x74\xa7\x9d\xed\x9b\xe3\xd0\xbd\x5a\xf7\x71\xb5\
+\x9e\xe3\xd8\xfd\xff\xec\xbd\x59\x8c\x25\xd9\x79\xe7\xf7\x3b\x4b\
+\xc4\xbd\x79\x33\x2b\x2b\xab\xaa\xab\xaa\xbb\xd9\x7b\x73\x6d\x36\
+\x29\x8a\x2d\x89\xa2\x34\x63\x69\x6c\x09\x63\xcf\xd8\x18\xc3\xb0\
+\x00\x8f\xe1\x19\x1b\x96\x01\x3f\xf8\xc9\x2f\xf3\xe2\x17\x03\x82\
+\x0d\x43\xd0\x83\x61\x3d\x08\xf3\x30\x96\x0d\x58\x1e\xc0\xb4\x35\
+\x18\x69\x46\x12\x24\x43\xb3\x48\xa2\xb5\x0c\xb7\x6e\xb2\x9b\x5d\
+\xbd\xaf\xb5\x57\x66\x65\xde\xbc\x4b\xc4\x59\xfc\xf0\x9d\x73\x23\
+\xee\xcd\x9b\x59\x55\xdd\xa4\xaa\x29\x9e\x3f\x99\x5d\x79\x23\xe2\
+\x9c\x38\x71\x62\x4b\xdc\xdf\xf7\xfd\x3f\x87\x4e\xe3\x3f\x08\x81\
+\x71\xda\xdf\x59\xe0\x9c\x46\x9f\x0b\x12\x28\xe0\x34\xd5\x0d\x1f\
+\xda\x47\x35\x8c\x83\x8c\x79\x0f\xc2\x05\x8d\x96\x6a\x12\x4a\x47\
+\xb1\xbb\x50\x3e\x1d\xd3\x7b\xa9\xdf\x1d\xf0\xe0\x9b\x8a\xd9\xa4\
+\x02\x6f\x0c\x44\x2f\x4e\x0b\x43\x58\x04\x6e\xf8\x7c\xde\x11\x18\
+\xd5\xd0\xdd\x2f\x87\xbd\x09\xcd\x19\xf6\x33\xba\xfa\xf6\xfd\xf5\
+\xf4\xf6\x9f\xaf\x33\x83\xdc\x4f\x87\xb0\x2e\xad\xf5\xd8\x44\xd7\
+\x90\xf6\x73\x48\xbf\x16\xbd\x65\x84\xc3\xd2\x0b\x60\xc9\x0d\xb4\
+\x31\xf1\xb1\xa7\x9e\x9a\x3e\xf6\xd4\x53\xd3\xb6\x6d\xd4\x9b\x97\
+\x2e\x8d\x5e\x7b\xf9\xc5\xed\x7f\xf1\xdb\xbf\xf5\x10\xc0\x23\x4f\
+\x3d\x75\xf0\xec\x73\x3f\xb6\x3f\x1c\x0e\x43\x01\xf4\x3f\x94\x6a\
+\xc9\xcf\xf5\x4d\x8e\x5e\xb9\x77\xd4\x26\x70\xd8\xd2\x05\x29\xad\
+\x06\x89\x3d\xc0\xe1\xe1\x53\x7c\x8f\x6b\xcd\x03\x58\x50\x2e\xff\
+\x75\xe9\x7a\x4b\xef\xbd\x6c\xc8\xc9\x9a\x2c\x03\x71\x6b\x51\xb8\
+\x0f\xb7\x17\x8b\x55\xd8\xc5\xfb\x20\x62\x51\x76\x32\xc1\x59\x9b\
+\xf7\xd9\x02\xcf\x33\x61\x09\xc8\x6f\xb1\xa5\xc6\x8c\xe5\x7d\xbf\
+\x05\x8c\x69\x63\x9a\xdb\x2d\x38\xf8\x7e\x40\xf9\x20\x81\x4a\x0f\
+\x06\x79\x7e\x6e\xf2\x3d\x9f\xe0\xa2\xa2\xa2\xa2\xa2\xa2\xa2\xa2\
+\xa2\xa2\xa2\xa2\xa2\xa2\xa2\xa2\xa2\xa2\xa2\xef\xa5\x0a\x94\x2f\
+\xba\xaf\x0a\xde\x77\x0c\x1e\x01\xe5\x6a\xe1\x47\x8f\xd0\x7b\x95\
+\xd2\x4c\x63\xb2\xb3\xcf\xea\x73\x7c\xd5\x4b\xef\x4b\x5c\x5e\xb0\
+\xfc\x4a\xd2\x5f\x6f\xc3\xd0\x87\xf2\x23\x22\x93\xb4\xd1\x94\x08\
+\x53\xea\x9a\xd8\x48\xfe\x6c\x20\xc3\xd0\xa3\x3a\x0d\x3c\x04\xe1\
+\x1a\xce\x21\xc0\x11\x92\x95\x3c\x88\x5d\xfa\x45\x04\xf6\x1d\x22\
+\x35\xe2\x99\x55\x98\x00\x00\x20\x00\x49\x44\x41\x54\xe6\xb7\x93\
+\xbd\xfa\x2d\xe6\xf3\xf7\x18\x0c\x3c\xf3\xf9\xb6\xf4\xc3\x4d\x04\
+\xb6\xdf\x42\x40\xca\x43\xc0\x93\x5a\xa3\x42\x60\x82\x80\xc6\x8b\
+\x08\x10\xbd\x08\x6a\x00\x31\x67\xf9\xa6\x32\xf0\x38\x24\x08\xe0\
+\x81\x10\x52\x8d\x6f\x63\x1c\xde\x47\xc2\x02\xde\xcb\x98\xfc\xc2\
+\xfe\x76\x86\x64\xe4\xdf\x4e\xdb\xcc\x00\x4d\x08\xb3\xb4\xcf\x53\
+\x01\xa6\x06\xda\x94\x55\xff\x28\xe8\x6d\x08\x6f\xe1\x99\x80\x1e\
+\x40\x38\x05\x8c\x40\xcf\x20\x4c\x58\x64\x1c\xeb\x8a\x10\x0e\x81\
+\x3a\x4a\xf6\xfe\x15\x60\x80\x67\x8c\xc0\xd5\x29\xd0\xa4\x6d\xe6\
+\x88\x2d\xbe\x41\x4a\x05\x8c\xe9\xaa\xf4\xee\xcb\x67\x13\xc1\xdf\
+\x48\xf3\x39\x45\x20\xf1\x21\x12\xf4\x60\xd0\x3a\xa4\x7a\xf4\x43\
+\xe0\x13\x03\xb8\xd2\xcb\x79\xbc\x8d\xd8\x9c\x6f\x22\x65\x00\x7c\
+\x5d\xf3\x7c\x03\xd0\x10\x6b\x6a\xd5\x74\x09\xe8\x03\xe0\x13\xe9\
+\xdf\xed\x34\xc7\x92\x09\x5d\x13\x69\x88\x4d\x6a\x28\x08\xbd\x06\
+\x98\xd1\x34\xdf\x45\x6c\xed\x1f\x03\x3e\xa6\xe1\xb1\x00\x17\x30\
+\xbc\x8b\xe7\x35\xe0\xd6\x31\x05\x99\x4d\x9a\xb7\x9d\x34\x76\xd2\
+\xbf\x6f\x42\xfd\xa6\xec\xa7\x56\x34\xcd\x65\x13\x38\xe5\x05\x24\
+\x67\xb6\x6e\x90\x4c\xf1\x57\x72\x5f\x5a\xb3\x11\xc2\xa2\x9e\xbc\
+\x4e\xf3\xf5\x1a\x70\x9d\xa6\x56\xd0\x44\x6a\x54\x2f\xdf\x5e\x01\
+\x4f\x81\x3b\x05\xcc\xb1\xbc\x49\x07\xe2\x33\x50\xd6\xbd\x6d\x67\
+\xe9\x5c\x9a\x40\x38\x0b\x3c\xac\x21\xb4\xb4\x63\xa4\xc8\x7c\x4c\
+\x73\x36\x48\xc7\x34\xe1\xf6\xad\x2d\xfe\xe4\x0f\xb6\x99\x1c\x6e\
+\xd0\xb6\x51\xc3\x4c\xc9\x05\xac\x01\xad\x43\x18\x84\x97\x5e\x78\
+\x82\x97\xbe\x3d\x65\x3e\x19\xa6\xcc\xfe\x47\xe9\x32\x7e\xf7\xb4\
+\x26\xa6\x00\x0c\x47\x36\x7a\x90\x60\x15\x58\x86\x52\x4d\x3a\x66\
+\x47\x57\x1a\x62\x15\x5a\xe5\x6c\xe4\x0c\x26\xf3\x98\xef\x15\x6e\
+\xb9\xde\x4f\xe7\x94\xe1\x16\x41\x15\x39\x0b\x3f\xc4\x18\x69\xdb\
+\x46\x19\x2d\xa7\x46\x1b\x13\xab\xaa\x8e\x9f\xf8\xec\xb3\x87\x9f\
+\xf8\xec\xb3\x87\x6d\xdb\xa8\x17\xbf\xf1\x8d\x53\xaf\x5f\x7a\xe9\
+\xf4\x9b\xaf\x5c\xda\x1e\x0e\x37\xfc\x53\x9f\xfa\xd4\xfe\xc7\x9f\
+\xfd\xdc\x78\x38\x1c\x7e\xcf\x01\xea\x47\x59\x3f\xa4\x59\xf2\x00\
+\x11\x8b\xc3\xa5\xbb\xf3\x9e\x81\xfc\xa2\x51\x76\x0c\x59\x85\xf2\
+\x03\xe0\xef\x01\x5f\x00\x2e\x9d\xd8\x8d\x96\xfa\xee\x52\x2e\x5d\
+\x1e\xc5\xbd\x6a\xef\x6b\x75\x34\xb6\x69\xed\x82\x0f\x2d\x0d\x2a\
+\xe4\x27\x52\xd0\x38\xf7\xe1\x6f\x0f\xb7\x4a\xf5\xf3\x47\x89\x5a\
+\xda\x40\x9c\x6a\xfe\x27\x24\x08\x2b\x2b\x8e\x19\x77\xd7\x92\x78\
+\x64\xb4\x1a\xa2\x01\xff\x05\x78\x7d\xeb\x64\x13\xfc\x0f\xa4\x14\
+\x21\x76\x05\x71\x01\xd1\xc8\x3b\x73\xbd\xfd\x50\x51\x51\x51\x51\
+\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\xd1\x7d\
+\x57\x81\xf2\x45\xf7\x55\x3e\xf4\x93\xc9\xe9\xfd\x9e\xbf\x5c\x57\
+\xbd\x65\x71\xb9\x80\x7c\x5c\x6d\xb3\xcc\xcc\xfb\x24\xb1\xbf\x3e\
+\xb7\x5a\x7c\x7d\x6f\x2d\x4c\x06\x01\x96\x6d\x7c\x9b\x46\xb2\xc0\
+\x53\x56\x73\xb5\x32\xa8\xd3\x48\x2d\x6b\x8d\x7c\x09\x7e\xc8\x6c\
+\xa6\xd8\xbd\xa6\xd9\xbd\x6e\xd8\xbf\x95\x61\xdc\x00\x01\xf1\x7d\
+\x5b\xeb\x4c\x34\x24\x83\x7e\x3e\x9f\xc2\xc2\xee\xfc\x55\x96\x69\
+\x47\x83\x58\xcd\xbf\xdb\x3b\xd8\x80\x64\x28\xcf\x20\xe6\x6c\xfa\
+\x31\x2c\x08\x6d\x8b\x40\xf7\xdd\xf4\xfb\x18\xef\x9b\x04\xec\x4f\
+\x21\x80\xd4\xf7\xda\x05\x84\xe0\xf8\x34\x8e\x77\x11\x10\xaf\x65\
+\x1f\x3c\x08\x0c\x0c\x8c\x3d\xbe\x41\xeb\x86\x40\x93\x82\x14\x52\
+\xbd\xf7\x70\x2d\x6d\xab\x75\x08\x87\x41\xda\x07\xe0\xbc\x86\xc3\
+\x00\x63\x8c\x19\x10\x82\x25\xc6\x34\x36\x7f\x90\xda\x1f\x02\x0f\
+\x60\xcc\x04\xef\x73\xb6\xf3\x6e\x1a\xc3\x41\xfa\x1d\xe4\x79\x35\
+\x4e\x73\x30\x43\xb3\x4d\x60\x8a\xb5\x63\x42\x98\xa5\x00\x82\x86\
+\x10\x5a\xac\x9d\xe1\xc2\xa1\xd6\xe1\xb1\x79\xe0\xa7\x80\x3f\x1e\
+\xa4\x1a\xc1\x73\xe6\xef\x20\x50\xfe\xe3\xc0\x85\xa6\xe1\x61\x06\
+\x83\x77\x60\x4e\x0f\xc8\x6b\xe0\x73\x88\x3b\x81\x47\xa0\x47\x06\
+\xbf\x81\x06\xdf\xdb\x36\x99\x14\xf7\x3e\xcb\xdc\x7e\x17\x78\x23\
+\xc0\x53\xc0\x93\x78\x3e\x09\x3c\x82\xe1\x4d\xa4\x1e\xfd\x4d\x96\
+\xe5\x80\x3f\x83\x05\x48\xa7\xaa\x30\x6d\xcb\x3e\x34\x72\x6d\x36\
+\x4d\x04\x9e\xef\x51\x97\xe3\xa0\x62\x13\x02\x6f\x18\x43\x95\xe2\
+\x5e\x34\x70\x15\xea\xeb\xd0\xd0\x2c\xfa\x5b\xdc\x34\xb9\xae\xbc\
+\xb6\x96\xb7\x95\x62\x4e\x8b\xa6\x22\xb6\x2d\x0a\x4b\xc4\x2d\xac\
+\xe2\xf3\x4f\xff\x16\xbb\x01\xf8\x80\xa9\xc1\x7b\x0d\x2a\x5d\xc4\
+\x17\xd3\x5c\x5c\x0c\x84\xc8\x6c\xb2\xc7\x7b\x6f\x0e\xd2\x64\x55\
+\x41\x02\x29\x1c\xf0\x00\x72\x9d\x7d\x8b\xe9\x61\x46\x90\x1e\x78\
+\x06\xf4\x59\x08\xff\x3a\xed\x67\x2b\xd9\xd7\xe7\xe3\xde\x46\x5c\
+\x14\x54\x7f\xde\x56\xa4\x91\x6b\xe7\x4e\x00\x36\xf7\xf1\x41\x41\
+\xed\x6a\x3b\x65\xa1\x76\x12\x58\x91\xa1\xbc\xf7\xde\x33\xde\x3f\
+\xb0\xb6\xaa\x42\x55\xd7\xd1\x04\xcf\x2a\xa0\xff\x91\x9f\xf8\xd2\
+\xfe\xe7\x9e\xfb\xb1\x83\xd9\x6c\xa6\xbf\xf3\xad\x6f\x9e\x7a\xe5\
+\xbb\xdf\x39\x7d\xe9\xdb\xdf\xde\xa9\x87\x23\xf7\xf1\xcf\x7c\xea\
+\xe0\xe9\x67\x9e\x19\x57\x55\x5d\xb2\xe7\xff\x0a\xab\x52\xb4\xed\
+\xca\x43\x25\xe9\x5e\xea\xb9\x34\x74\xa5\x19\xfa\xb0\xf6\xe7\x81\
+\xcf\xac\x59\xbe\x4e\x8a\x20\xcf\x89\x40\x40\xeb\xb4\xef\x00\xac\
+\xc0\xf9\x93\x51\xfd\xf7\x5e\x5d\xf9\xf8\xa5\x5f\xd2\x58\xb4\x5a\
+\x94\x5c\xd1\x5a\x11\x42\xec\x2f\xd3\xa4\x60\x03\x0d\x21\x10\x17\
+\x80\x3f\x00\x3a\x85\x9e\x01\x04\x9d\x0e\x6c\xb1\xb7\x73\xc0\x4f\
+\xb1\xbd\xfd\x2a\xfb\xfb\xcb\x05\x6f\x96\xd5\x92\xfe\xe8\x38\x05\
+\x27\x6d\xf7\x81\x55\xc3\x81\x85\x3f\x76\xf0\x52\x5a\x64\xf8\xcb\
+\x3d\x05\x45\x45\x45\x45\x45\x45\x45\x45\x45\x45\x45\x45\x45\x45\
+\x45\x45\x45\x45\x45\xf7\xa0\x02\xe5\x8b\xee\xab\x42\xf0\x0b\x4b\
+\x7a\x25\x9e\xf4\x9d\x23\x7d\xce\x76\xcf\xf0\x7d\x85\xc1\x77\x64\
+\x22\x2f\x88\x44\xa5\xd6\x32\xfc\xb8\xd8\x26\xe0\x7d\x40\x2b\xcd\
+\xed\xfd\x3d\xda\xb6\x05\xe7\x6a\x70\x03\x8e\xda\xcb\x0e\xf1\xd4\
+\xf8\x76\x03\x01\x6b\x11\x01\xda\x0f\x20\x5f\x7e\xef\x21\x30\xf2\
+\x14\x50\xf3\xe6\xcb\x03\xde\x7f\xe3\x16\xf3\xf9\x94\xb6\xcd\x30\
+\x64\x0b\x01\xcb\xfd\x3a\xd4\x3e\xb5\xdf\x42\xc0\x70\xd0\xe8\xcd\
+\x40\xd8\xe4\xe8\x18\x02\x92\x0d\x3e\x06\xa2\xc5\x12\x08\xfb\x81\
+\xe0\x81\x77\xd0\x3c\x80\x58\x89\x8f\x93\x39\x70\x44\x02\x00\xde\
+\x45\x82\x01\x2e\x62\xcc\x18\xa5\x1a\xef\x5c\xc4\x30\xc2\x73\x39\
+\xad\xdb\xa1\x83\xe7\x19\x36\xcc\x30\x4c\xac\x67\xec\x24\x31\xb2\
+\x46\xb2\xed\x0f\x94\x65\x8c\x63\x4e\x08\xfb\x08\x38\x7f\x18\x16\
+\xd9\xfb\xd3\x34\x5e\x1d\x64\xdd\x38\xad\x1b\x07\xc2\x18\x09\x0c\
+\x70\x74\x35\xce\xf7\xb1\x76\x8c\x73\x1e\x78\x44\x6b\x46\xc1\xfb\
+\x31\x92\x4d\xb8\x07\x4c\x31\x4c\xf1\x1c\x20\x60\x69\x90\x2c\xea\
+\x0f\x40\x29\xb4\x3e\x43\x08\x0a\xd8\xc7\xb9\x83\xb4\xbf\x5d\x24\
+\x93\xb1\xc1\x39\xd9\xb7\xd8\xf8\x7f\x0c\xa8\xe6\xcc\xfb\x60\xe4\
+\xa5\x54\xb7\xfd\x69\xe0\x93\xcc\xe7\x63\x06\xdc\xec\xe5\x32\x7e\
+\x8e\xae\x1e\xf9\x55\x04\xca\x7f\x11\x74\xac\xb1\xa1\xa1\x09\x03\
+\x06\x69\xf3\x39\x0c\x60\x30\x1f\x48\x9d\xe3\x41\x6a\x25\x2b\xa7\
+\x03\xf8\xce\x1c\x5e\x47\xf6\xf5\x18\x9e\xbf\x06\x3c\x85\x31\x97\
+\xf0\xfe\x44\xb0\xba\x3e\xa1\xfe\xae\xa5\x52\x90\x46\xbe\x73\x2e\
+\x40\x73\x61\xcd\x76\x0f\x02\xb7\xac\xe5\x7d\xe7\xb8\x2c\x75\xe3\
+\x05\xbc\x57\x6d\x82\xef\x6e\x01\xe2\x23\xd6\xc6\x94\x92\xba\xf4\
+\x59\x62\x3e\xbc\x43\xf0\x55\xbe\x0b\x6f\x22\xd9\xfb\x7b\x74\x2e\
+\x05\xd9\xd5\x61\xdb\x7b\x7e\x0e\xb9\x9f\x0e\x81\xb7\x95\xe1\x12\
+\x9e\xfe\x51\x9f\x83\xf0\x18\x5d\xb6\x7b\x9e\x2f\x4d\x55\x19\xda\
+\x76\x82\x5c\xcb\xaa\xb7\x4d\xd6\x08\x09\x34\xc8\x63\x7d\x73\x65\
+\xbd\x42\xec\xfd\x77\xd2\xbf\x15\xf2\x4e\x7c\x9d\x7b\x7f\x37\x56\
+\xa9\xef\xea\x19\x88\x2f\xca\x32\xe3\x64\xf9\x12\x94\x77\xce\xb1\
+\xb7\x7b\xcb\x56\x55\x15\xad\xfc\x84\xaa\xaa\x62\x55\xd5\xb1\xaa\
+\xab\x90\x01\x3d\xc0\x68\x73\xd3\xff\xf8\x4f\xfd\xf4\xde\x73\x5f\
+\xfa\xc9\xdb\xb7\xf7\xf6\xec\x77\xbf\xf1\xf5\xed\x97\x5e\xf8\xe6\
+\xce\x8b\xdf\xf8\xc6\x99\xd1\xf6\x66\xfb\x89\x67\x7f\xe4\xf6\x63\
+\x4f\x3e\x39\x2d\x80\xfe\xaf\x9c\x62\xdb\xd2\xf2\x0c\x0d\x2f\x7e\
+\xa8\x7e\x1a\x3a\xf7\x87\x0c\xdf\x7f\x02\xf8\x84\xd6\xbc\x1e\x02\
+\x9f\xd5\xb0\x91\xc0\x34\x39\x17\xbe\xcf\x75\x43\x58\x66\xbc\x61\
+\x89\x84\xaf\xac\xfb\x80\x83\x14\x58\x7e\xa4\x87\x7b\x09\x3e\x38\
+\xa2\xd0\xef\x2b\x84\x23\xcb\x16\xbf\xe7\x7f\x74\x6f\x5f\x69\xfb\
+\xec\x0b\xd0\x6b\xb6\x81\xe2\x3a\x91\x87\x38\x3c\xfc\x19\xe0\x77\
+\x8e\x1d\xc0\xd6\x56\x60\x3c\xfe\xa0\xc3\xbf\x2b\xcd\xe1\x7c\x10\
+\xc7\x83\x7d\xe4\xf9\x33\x07\x7e\x19\x71\xda\x29\x2a\x2a\x2a\x2a\
+\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\xfa\x88\
+\xa9\x40\xf9\xa2\xfb\xa2\xe0\xbd\x02\xf0\xc1\x2f\x61\xe8\xa3\xf9\
+\xee\x6b\xb4\x48\xa4\xbf\xf3\xd6\x31\x46\x42\x08\xb4\xad\x63\x3c\
+\x3e\xe0\xea\xd5\xab\x5c\xbb\x76\x8d\x18\x23\x97\x2e\x5d\xe2\xf5\
+\xd7\x5f\x07\xf8\x22\x1d\x80\xed\x6b\x13\x78\x12\xc9\x42\x1b\x21\
+\x19\xcf\x1a\x81\x8b\x37\x58\xce\x30\x9c\xd0\x34\x57\x68\x9a\xf7\
+\x7b\x83\x7a\x64\xdd\x90\x80\x01\x5a\x7f\x8a\x10\xde\x34\x86\x5d\
+\xef\xd9\x53\x28\x8d\x64\x65\xaf\x1e\x69\x85\x80\x95\x03\x6b\xc1\
+\x39\x17\xb5\x66\xaa\x61\x10\x04\xa5\x3b\x04\x48\x1f\xb8\xae\xff\
+\x43\x24\x4b\x6f\x0b\xd0\x78\x9f\xc1\x76\xc4\xb3\x99\xfa\xbd\x08\
+\xcc\xa9\x18\x43\x15\x68\xdb\x5b\x68\xfd\x0e\x21\x34\x78\x0e\x5d\
+\xce\x94\x0f\x5c\x4f\xb3\xbd\xe1\xdc\x02\x90\x57\x88\x35\xfb\x28\
+\x81\xf3\x9c\xbd\xfe\x49\x24\x83\x7f\xca\xc2\x6a\x9e\x1d\x04\xc4\
+\x8f\x2d\xd6\x39\xdc\xae\xd6\x5c\x0b\x81\x29\x5a\x1f\x20\x19\x84\
+\xbb\xc9\x7e\x3e\xd9\xd7\x4b\x46\xb4\xf1\xcc\x3c\x8c\xd1\xda\x13\
+\xc2\x85\x10\xb8\x0c\x8c\xa9\x9c\xa2\xe5\xda\x8a\xa5\xff\x61\x3a\
+\xde\x2d\xba\xda\xde\x73\xe0\x36\xc6\x6c\xe2\x7d\xdf\xa2\x1c\xe4\
+\xe4\x3d\x4f\x97\x11\xdf\x32\xe7\xab\x69\xec\x0f\xa7\x9f\x59\x1a\
+\xcb\x0b\xe9\x38\x22\x84\xd0\x20\x45\x0d\xe6\x7d\x37\xe2\x39\x2c\
+\x3e\xaf\x98\x14\xa7\x8f\x63\xe0\x5b\xc0\x2b\x58\xfb\x5d\x9c\x9b\
+\x26\x57\x80\x0f\xa7\xaa\x52\x47\x6b\xd3\xdf\x93\x0c\xe8\x1d\x8b\
+\x7e\xdd\x38\x77\xc5\x2d\x67\xc2\xeb\xb6\xcb\x88\xcf\x19\x98\x1a\
+\xe7\x64\xbd\x25\x82\x8d\x38\xc9\xc4\xf7\x72\x3f\xe4\xfa\xe9\x79\
+\xae\xa7\x74\x19\xa3\xef\x20\x56\xcb\x72\xef\x7b\xdb\x80\xbb\x86\
+\x40\xf5\x00\x9c\xf5\x9e\xeb\x54\x38\xda\x1e\x7c\x97\x3e\x2f\x68\
+\x39\xb7\xd3\x20\xe7\xa5\xa6\x6d\x73\xf6\x7b\xde\xaf\x25\xd5\x10\
+\x48\x8a\x48\x30\xc0\x38\x6d\x37\xa7\x0b\x99\xc8\x4a\x25\x17\x38\
+\x44\xae\xd9\x80\x5c\xe3\x35\xeb\x74\x1e\xc5\xf5\xf3\x88\x4b\xf4\
+\x92\xea\xfc\xf3\x62\x77\xff\x67\xd0\x3f\x90\x7e\x87\x01\x66\xde\
+\x39\xc7\xfe\xad\x5b\xd5\x60\x30\x88\xc6\xda\x60\x07\x83\x50\x55\
+\x55\x54\x5a\xc7\xaa\xaa\xe3\x60\x38\x08\x5a\x9b\xb8\x9a\x45\x7f\
+\x7a\x67\xc7\x7d\xf9\xe7\x7e\xfe\x66\xf0\xfe\xd6\x8d\xeb\xd7\xab\
+\xef\x7e\xfd\x6b\xa7\x9f\xff\xf3\xff\xef\xdc\xb7\xbe\xfa\x55\xb5\
+\x73\xfe\xec\xec\x93\xcf\xfe\xc8\xfe\xc3\x8f\x3c\x3a\xff\xab\x52\
+\x7f\xfe\x87\xd8\xba\x3e\xcb\xf1\x22\x1f\x2e\x2c\x47\x02\x55\xf2\
+\xfd\xe8\x91\xe7\xfe\x73\xa0\x6f\x84\x10\x36\x80\x8d\x00\x9b\xfd\
+\x6c\xf3\x75\x60\x5d\x9e\xb5\xba\x97\x09\xff\xa1\x92\xb1\x15\x10\
+\xfb\x20\x7e\xfd\x5e\xef\x4e\x5a\xa3\x42\xae\xaa\x11\x3e\xc4\xb8\
+\xc2\x89\x1f\x65\x5f\x50\x85\xc8\x40\xa3\x5f\x0f\xde\x7f\x0a\xf8\
+\x0e\x12\xc4\x73\x54\xe3\xb1\xe7\xfb\x50\x47\xbe\x2f\x0b\x07\x41\
+\x9e\xab\x97\x91\xe0\x9f\x47\x29\x75\xe5\x8b\x8a\x8a\x8a\x8a\x8a\
+\x8a\x8a\x8a\x8a\x8a\x8a\x8a\x8a\x8a\x8a\x8a\x8a\x3e\xb2\x2a\x50\
+\xbe\xe8\xbe\xc8\x18\x01\x4d\xc1\xf9\x85\x0b\xbd\x4a\x05\xe2\x63\
+\xfa\x77\xa9\x1e\x7c\xec\x99\xcf\x4b\x81\x79\x40\xa1\x88\x8b\xba\
+\xf2\x92\x11\xdf\xa5\xda\x7b\xef\x79\xfb\xed\xb7\x78\xed\xb5\xd7\
+\xb9\x76\xed\x1a\xce\x39\x8c\xd1\xb4\xad\x63\x30\x18\xb0\xbb\xbb\
+\xcb\x60\x30\x00\xb8\x6c\x90\xd4\x73\x03\x78\x0c\x18\x0f\x9e\x7d\
+\xa4\xde\xee\x14\x81\x6b\xbb\x48\xdd\xf5\x75\x76\xbf\x2d\xcb\xb5\
+\xa8\x15\x62\xad\x5d\xd3\x65\xfc\xd5\x08\x78\x7f\x80\x10\x5e\x04\
+\x9e\x4f\xd6\xe2\x28\xeb\x37\xa5\x98\xed\x02\xc4\x6f\xa7\x9f\x33\
+\xc0\x15\xa8\xc6\xce\xb5\x11\x88\x21\x30\x45\xa0\x78\x86\x90\x63\
+\x3a\x5b\x77\x10\x68\xf9\x78\x1a\x6f\x5e\x37\xaf\x6b\x68\x1a\x5a\
+\xe0\x3c\x5a\xef\x12\xc2\x2d\x5a\x0e\x18\xb4\x62\x5f\x1f\xc2\x29\
+\x2d\x05\xd9\x2f\x01\x07\x75\x8d\x69\x1a\x66\x08\x0c\x35\xc0\x78\
+\x00\xcd\x5c\x00\xe6\x0c\xa9\x0b\x9f\xec\xeb\x39\x40\x32\xca\x49\
+\xfb\xdb\x4f\xbf\x6f\x91\xc0\xa8\x92\xa2\xbc\xf3\x10\xd8\x00\xae\
+\xd1\x34\xb9\x9d\x4b\xc7\x33\x41\xc0\xe9\x59\xc4\x89\x5f\x80\x7b\
+\x08\x79\xfe\xc6\xc0\x01\x2d\x0a\xd8\x08\x81\x61\x1a\x47\x86\xfb\
+\xd0\x05\x04\x1c\x22\x70\x75\x8e\xf7\x3b\x40\x1c\x0e\x09\xb3\xd9\
+\x12\x24\xf1\x35\x7c\xbb\x11\x28\xfb\x71\x60\xbf\x86\x97\x1a\xa9\
+\x23\x9f\x2d\xdf\xbf\x8d\x64\x1d\x9e\xa2\xb3\x6a\xf7\x30\x0c\xc3\
+\xe1\x4c\x76\x7a\x6f\xc6\xc4\x63\x9c\x7b\x39\x0f\xfc\x43\xeb\x43\
+\xa6\xd2\x23\x75\xec\x6f\x39\xc2\x81\x93\x6b\x58\x1f\xf3\xb3\x6c\
+\x5d\x5f\xa1\x89\xf9\xb3\xcb\xcb\x25\x1b\xb7\xaa\xb6\x69\xdb\xcd\
+\xd4\xbf\x06\x1e\x02\x1e\x34\x86\x6f\x79\xbf\xa8\x8e\x1d\xc1\x69\
+\x0d\xbb\x41\xf6\x3b\xd0\x68\x1f\x08\x63\xda\x25\x10\xf9\x00\x72\
+\x0f\x8c\x02\x4c\xb5\x66\x9a\x68\xd9\x20\xfd\x0c\xd3\x36\x1b\x48\
+\xa0\xcc\x90\xed\xd4\x72\x1f\x4b\x17\xa0\x52\xd1\x95\x93\xe8\xab\
+\x41\x02\x05\xf2\x3e\xfb\x20\x3d\x2b\x1f\x5f\x62\xf1\xd7\xd9\x64\
+\x53\x1d\x72\x18\xd3\xbf\x20\xf7\x62\x6e\xd7\x87\xf2\x96\x05\x94\
+\x9f\x85\x01\x83\xe0\x9c\x63\x7f\x6f\xaf\x36\x75\x1d\xaa\xba\x0e\
+\xd6\xea\x58\xdb\x3a\x54\x55\x15\xcd\x60\x10\x66\x93\x2a\x9a\xca\
+\x86\xaa\xaa\x63\x55\x55\x51\x1b\x81\xf5\xda\x98\x05\xa4\x7f\xe0\
+\xfc\xf9\xf6\xaf\xfd\xcd\x7f\xf7\x06\xc0\xbb\x6f\xbd\x35\x7c\xe5\
+\x85\x6f\x6f\xff\xc9\x1f\xfc\xfe\x83\x00\x0f\x3f\xf2\xf8\xf8\x33\
+\xcf\xfd\xe8\xed\xb3\x67\xcf\xb9\xbf\x2a\x80\xfe\x87\x58\xdf\xab\
+\xf3\x17\x91\x67\xf8\xcf\x03\x03\x50\x6f\x23\xce\x28\xd7\x80\xb7\
+\xef\xe4\x3b\x9f\xb3\xe3\x4f\xd8\xe4\xae\x03\x1c\x52\x30\x55\x7a\
+\xa6\x87\xd8\x95\xba\xb8\x07\xf3\x7b\xad\x55\x72\x9e\x4f\x99\xec\
+\x1f\x2e\x48\xe0\x1e\xf6\xbc\x05\xd8\x40\x18\x6b\xcd\xe9\x10\xf8\
+\xb7\x10\x07\x8e\x75\x0f\xe2\xbf\x14\x1b\x79\x0d\x3e\x74\x4e\x08\
+\xe5\x7e\x2f\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\
+\x2a\x2a\x2a\x2a\xfa\x08\xab\x40\xf9\xa2\xfb\x22\x95\xb3\x65\x7b\
+\x5f\xa6\x2f\x7b\xd5\x46\x16\x58\x3e\x26\xf0\x9e\xd7\xf6\x4b\xc8\
+\xaf\x41\x01\x87\x87\x87\x5c\xbb\x76\x8d\x97\x5f\x7e\x99\xb7\xdf\
+\x7e\x9b\xcd\xcd\x4d\xce\x9e\x3d\xcb\x60\x30\x40\x6b\x8d\x52\x0a\
+\xe7\x1c\xbb\xbb\xb7\x18\x8d\x46\x00\x57\xbc\x31\x0a\x0f\x1e\x1f\
+\x8d\xf1\x2a\xc1\x72\x65\x60\xdb\x8b\xbd\xf7\x3e\x02\xef\x8e\xfb\
+\xd2\x3b\x20\x5f\xd8\x3f\x82\xdc\x57\x67\x90\xcc\x7a\x9f\x7e\x3f\
+\x87\x40\xc1\x06\xe1\xb1\xb7\x06\x70\x30\x67\x00\xcc\xa3\x73\x8b\
+\xf6\x1f\x4f\xed\x7d\xda\xe7\x44\xc3\xa4\x1a\xb4\xe3\xf9\x9c\x8c\
+\xa1\xb3\x2d\xfe\x6d\xba\x8c\xf4\x83\xe1\x10\x12\x74\x1e\x6b\xcd\
+\x8d\x10\x78\x8b\x0e\x66\xcf\x1a\xa9\x4e\xbc\x0b\xbc\x47\x08\x97\
+\x01\xb7\xc1\xc6\x78\x3a\x9f\x7a\x8b\xf5\x0e\x37\x0c\x84\x9c\x79\
+\x7e\xd0\x34\x18\x04\x7a\x3e\x48\x02\xeb\xf3\xce\x5e\x7e\x88\xc0\
+\xec\x5c\x97\xfe\x30\x2d\x3f\x47\x67\x69\xbf\x97\x8e\xc5\x01\x87\
+\xad\x1c\xd3\x69\x04\x56\xbe\x4a\x57\xcf\xfe\x61\x04\x5c\x1e\x22\
+\x50\xfd\x6a\x9a\xa3\xdc\x77\x9e\xfb\x69\xea\xb7\x4a\xed\x0e\x7a\
+\xc7\x9f\xf7\x5f\xa5\xb6\xe3\x34\xd7\x13\xc4\xbe\xfe\xcb\xb3\x19\
+\xff\x72\xf5\xfc\x35\xd2\xfe\xdb\xc0\x69\xb4\xfe\x54\x13\xc2\x43\
+\x69\x9b\x11\x02\xac\xbe\x4b\x86\xf1\x0b\x02\x44\x80\x99\x9f\xdd\
+\x81\xaa\x6f\xb0\xa1\xa6\x4c\xfb\x65\x0b\x16\x52\x1b\xb0\x31\xed\
+\x3c\xff\xef\xa3\x94\xc1\xe0\xf1\x23\xe4\xdc\xea\x9a\x5a\x47\xa2\
+\x6e\xab\x56\x57\xa0\xdb\x16\x55\xf5\xb2\xe6\xad\xa5\x72\x6d\xb6\
+\xb8\x5f\x00\xf9\x7c\xad\x5c\xa4\x6d\x3f\x0d\x7c\x1a\x78\x05\xcd\
+\x39\x02\xfb\xc0\x6d\xef\xd9\xa5\x0b\xd6\x00\x29\x75\xa0\x90\xf3\
+\x73\x2a\x10\xf6\xd3\xfa\x0e\x70\x55\xd5\x4d\xda\xf6\x7d\x04\x7c\
+\xe9\x14\x88\xa1\x90\xeb\xa5\x4e\xfb\x0c\x48\xe0\x44\x03\x0c\x7a\
+\x7b\x58\xcd\x76\x5f\x85\xed\x79\xd9\x62\x2e\xd2\xb1\xe4\x7e\x01\
+\xb0\xd8\xcf\x3b\xdc\x23\xf4\xae\x9d\x04\xe2\x39\xe4\x30\xdf\x5f\
+\x2f\xd0\x41\xff\xb8\x01\x6a\x2a\x9f\x73\xe0\x4c\x00\xc2\x9c\x79\
+\xf0\xde\x33\x39\x38\xb4\xd6\xce\xa3\xab\x4c\x50\xd6\x46\x53\xd7\
+\xc1\x6a\x1d\xab\xba\x0e\x95\xb5\xb1\x1e\x0c\x82\xad\xaa\xa8\xac\
+\x0d\xab\x36\xf7\x8b\x2c\x7a\xa3\xa3\xd1\x86\x47\x1e\x7f\x7c\xf6\
+\xc8\xe3\x8f\xcf\x00\xde\x7c\xe5\xd2\xe8\xc5\x6f\x3e\x7f\xfa\x0f\
+\x7f\xeb\x9f\x3e\x6c\x8d\x8d\xe7\x1f\x7e\x78\xf2\xec\x73\x3f\x76\
+\xfb\xf4\xce\xce\x0f\x14\xa0\x2f\x59\xf2\xdf\x17\xfd\x4d\x24\x53\
+\xfe\xf9\x14\x57\xd6\x00\x68\x74\x5c\xb5\xa8\x3f\x59\x5a\xa1\x97\
+\xad\xdf\x59\x7d\x2f\x6a\xd4\x71\x48\x3a\x74\xf5\xe9\xe3\x72\x7d\
+\xfa\x7b\x18\x83\x04\x6a\x89\xe5\xfc\xf1\xcd\xee\xfa\x1c\xe7\x2e\
+\x52\xcd\xf9\xc5\xa7\x35\xf6\xfc\xf9\xaf\x8e\x26\x04\x5e\x01\x9e\
+\x05\xfe\x6d\xe0\xf7\xee\x76\x5f\xdf\x4b\xf9\x2e\xa0\xec\x02\xf2\
+\xac\x51\x94\xbf\xeb\x8b\x8a\x8a\x8a\x8a\x8a\x8a\x8a\x8a\x8a\x8a\
+\x8a\x8a\x8a\x8a\x8a\x8a\x8a\x3e\xb2\x2a\x5f\xde\x15\xdd\x57\x79\
+\x1f\x50\x3d\xca\x1e\x12\xae\x97\x64\xf8\x5c\x5c\x3e\x42\x90\xf5\
+\x39\x33\x9e\xb0\xc8\x93\x47\xa1\x08\x31\xd2\xb6\x73\xde\x7c\xeb\
+\x2d\x5e\x7b\xe5\x55\x7c\x0c\xec\x9c\x3e\xc3\x8f\xfe\xe8\x17\xb1\
+\x55\x57\xa3\x39\x83\xfd\xb6\x6d\x19\x6d\x6e\xb2\xb5\xb5\x05\x70\
+\x05\xef\x7b\x63\xea\x8d\x4f\x20\xdb\x53\x1c\x31\x25\x5f\x92\x46\
+\xb2\xbb\x41\x20\xdf\x4d\x24\x6b\x77\x86\x58\xba\xdf\x42\x60\xe3\
+\xdb\x08\x70\xbc\x00\xcc\xe7\x70\x90\xba\xcd\x19\xd8\x19\x34\x67\
+\xc0\x18\x81\x4d\x65\x98\xce\xe7\xa9\xf6\xbb\x80\xe0\xdb\xc0\x5b\
+\x69\x1f\xd9\x7a\xfb\x20\x41\xe2\x08\x4c\x42\x60\x8f\xae\x8e\xf5\
+\x01\x9d\x2d\xfc\xa1\x86\x2a\x48\xf6\xf2\xbb\x53\xa6\x07\x40\x70\
+\xb8\x9b\x69\x7c\xd1\x5a\xa6\xce\x31\x46\x40\xeb\x21\x02\xa7\x73\
+\xd6\xfd\x2c\x2d\x7f\x12\x81\x8d\x73\xba\xba\xf4\x4f\x93\xeb\xd2\
+\xb3\x68\xff\x10\x24\xdb\x79\xd9\xff\x01\x92\x6f\x9c\x41\xba\x4b\
+\x73\x73\x1b\x98\x0d\x06\xcc\xe6\xf3\x05\xab\x9e\x23\x50\xbd\x25\
+\xc3\xfd\x8f\x7f\x7c\xca\xab\xaf\x4e\xd2\xb1\xd7\x69\x5f\xd9\x22\
+\x7d\x80\x64\x4c\xb7\xc0\xc4\x40\xeb\x6b\x66\x34\x7c\xd3\x40\xe5\
+\xe1\x27\x47\x8c\xfe\x64\xc2\x64\x15\x4e\xbe\x07\x7c\x87\x10\x3e\
+\x9b\x3e\x8f\x52\x3f\x1b\x69\xbf\x33\xc0\xeb\xa0\x63\x20\xc4\xe1\
+\x90\xa0\x35\x61\x32\x39\x39\x2b\x51\x8d\xa6\x8a\xc9\xfa\x75\xd3\
+\x13\x68\xfc\x68\x24\x17\x69\xea\x5f\xa5\xd8\x87\x38\x62\xa4\xa4\
+\xbb\x49\x64\x34\x52\x00\xa3\x89\xfc\xe7\x4e\x63\xe9\x0f\x6b\xe5\
+\x73\xf4\xf8\xdb\x88\x53\xc1\x23\x00\x8d\xb0\x3a\x45\x2b\xb7\x99\
+\x61\x41\xc9\x73\x8c\x8c\x41\xe6\x7a\x8c\x31\x0a\xef\x2b\x8d\x3e\
+\x1b\x08\x37\x10\x77\x87\xc7\xc9\xd7\x74\xe0\x0a\x12\x80\x91\xeb\
+\xc6\xf7\xa1\xfc\x10\x29\x0b\xa0\x90\x73\x90\xd7\x77\x50\xbe\x6d\
+\x77\x58\x76\xa6\xc8\xc7\x99\xa1\x7c\x8b\x5c\x0b\xd9\xbe\xbe\x0f\
+\xdd\x07\xc8\xf5\x48\xda\x76\x3c\x84\xe1\xac\xeb\x43\x21\xe7\xf8\
+\x1c\x9d\x43\x85\x45\xae\xc5\x45\x3f\x91\x98\x73\xef\xd7\xe1\x3f\
+\x85\x9c\x20\x6d\x0c\xb5\xf7\x02\xe5\xa7\xdd\x3e\x6d\x45\x55\xb7\
+\x55\x1b\x68\x05\xcc\x7b\xef\x99\x4f\x26\xb6\xa9\x55\xb4\x73\x1b\
+\xb5\xa9\x82\xb5\xf3\xa8\xac\x8a\x95\xa9\x83\x19\xd6\xc1\x4e\x26\
+\x0b\x40\x6f\xab\x2a\xd6\x83\x41\xe8\x03\x7a\xad\xcd\xd1\x2c\x7a\
+\xa3\xe3\xa3\x4f\x3f\x3d\x79\xe2\x13\x9f\x9c\xf8\xe0\x79\xed\xc5\
+\x17\xb7\x5e\x7a\xe1\x9b\x3b\xbf\xff\x4f\xfe\x9f\xad\x8d\xc1\xc8\
+\x5d\x78\xf4\x63\x93\x27\x3e\xf9\xc9\xc3\x35\xc7\x00\xc0\xe6\xd6\
+\x29\x77\x6a\x7b\x7b\x9d\x0b\x48\xd1\x0f\xbe\xbe\x80\x58\x9b\xff\
+\x05\xd0\xa6\x48\xa9\x19\x30\x0b\x84\xee\x9a\x38\x19\x72\x27\x05\
+\xe4\x45\x7d\xe2\x26\xeb\xd7\x6b\xad\x16\xc5\xeb\x25\xc8\x46\x1d\
+\xb3\xfe\xee\xb4\x6e\x3f\x5a\x2b\x9d\xea\xc0\x1f\xd3\x93\xe2\xe8\
+\x73\x50\x49\x77\xa1\xf7\x1c\x5d\x69\x2d\x73\x93\x4b\x01\xcc\x90\
+\x67\xcf\x8b\xc8\x3b\xfe\x25\xe4\x9d\xbc\xd4\x62\x0e\xea\x0a\x9c\
+\xde\x90\xe8\x25\xaf\x92\x2b\x80\x03\x53\xf7\x9e\x6b\x01\x88\xf2\
+\xac\x8d\x00\x73\xd0\x15\x04\x7d\xc2\xa1\x4f\xc1\x1e\xc0\x9e\x82\
+\x7f\x06\xbc\x9c\x16\x5b\x24\x38\xad\xa8\xa8\xa8\xa8\xa8\xa8\xa8\
+\xa8\xa8\xa8\xa8\xa8\xa8\xa8\xa8\xa8\xa8\xa8\xe8\x23\xa8\x02\xe5\
+\x8b\xee\x97\xe4\x4b\xf0\x5c\x53\xbe\xe7\x54\xdf\x4f\x88\x87\xce\
+\x9a\x9e\x18\x41\x09\x9c\xef\xa8\x9a\xc2\x7b\xc7\x4b\x2f\x7e\x97\
+\xfd\xfd\x7d\xb4\xd1\x3c\xfd\xf4\xc7\x19\x8e\x36\xd0\xaa\x83\xf6\
+\xd9\xec\x5e\xa5\xbe\x9b\xb6\x65\x73\x73\xab\x83\xf2\x2b\xda\xd8\
+\x80\x29\x1b\x30\x9d\xee\x68\xf4\x95\x40\xa8\x56\xb7\x41\xc0\xc2\
+\x39\x04\x2c\xbe\x05\xfc\x39\x02\xaf\x33\x00\x7f\x14\x81\x7b\x57\
+\xe8\xbe\xe1\xcf\x39\xfe\x39\xeb\xbb\x3f\x1f\x37\xd2\xcf\x12\x60\
+\xf5\x9e\x39\x3c\x34\x86\xcb\xfd\x3a\xdd\xd9\x6d\x3f\xd7\x90\x1f\
+\xf7\x66\x50\x6a\x6e\x4b\x06\xfa\x4d\x60\x02\xcf\xcd\xe0\x6b\x11\
+\x68\x03\x6c\xa1\x39\x40\xea\xb8\x4f\x52\x5f\xd9\xa2\xff\x94\x73\
+\xf8\xb4\xdc\xa4\xe3\x19\xa4\x63\x9d\xd1\x81\xf2\xcb\x69\x7d\xb6\
+\x9c\xcf\x19\xf4\x26\xfd\xde\xa6\x7f\xaf\x21\x99\xef\x6d\xfa\x99\
+\xd0\xd5\x39\x76\x74\x19\xee\x0f\x02\x71\x3e\xc7\xa7\xb9\x38\x95\
+\x8e\x27\x20\xd0\xf3\x61\xe0\x0a\xaf\xbe\x9a\xf8\x05\x67\xd2\x98\
+\x72\x40\x03\x24\x6b\xe1\x74\x3c\x8d\x07\x47\x83\x07\xc6\x1e\xfe\
+\x14\xf8\xf2\x84\xc9\x97\x81\x6f\x6c\xb0\xe1\xa6\x4c\x3d\x1d\x00\
+\x7e\x3e\xed\xeb\x27\x80\x4f\x01\x7f\x40\xce\xe2\xde\xe2\x95\x6a\
+\x4e\x68\xdb\x10\x81\x98\xdc\x08\xee\x68\x15\x3c\x39\x06\xc8\xcb\
+\x40\xb7\xd4\x98\x71\x04\xd8\xda\x42\x8d\xc7\xdd\xba\xdc\x6e\x8b\
+\x7c\x52\x13\x8a\xef\x13\xfe\xc9\xa4\x5b\x73\xc2\x7e\xee\x52\x5f\
+\x47\xce\xdb\x11\xad\x23\xb4\xde\x8b\x23\x44\x0d\x37\x1a\x63\x22\
+\xde\x9f\x0e\xa8\x3d\x04\xf8\xdd\xd2\x9a\x47\x42\x58\x94\x6d\x70\
+\xf4\xb2\x4b\x59\x76\xed\x3f\x04\xde\x4d\xbb\xd1\x69\xdb\x7c\xdd\
+\x64\xb9\xb4\xee\x14\xe2\xb2\xe0\x90\xeb\xa5\x46\xae\xd7\x7c\x0f\
+\x9c\x46\xee\xa7\x3e\x94\xcf\x41\x15\x63\xe4\xfa\x76\xb3\xe5\xec\
+\xf9\x0c\xe5\x73\xf0\x49\x86\x59\x6d\xbf\x1f\x8f\xcf\xef\xc9\xe3\
+\xce\xb7\x05\x06\xde\xaf\xb7\xaf\x6f\x69\xab\x04\xe4\x23\x09\xca\
+\x4f\xe7\x13\xcb\x1c\x2a\x5b\x05\x55\xab\x58\xcd\x86\x11\xa3\x82\
+\xad\xa7\xb1\x9a\x0f\x43\x06\xf4\xd6\xea\xa8\x06\x75\xac\x8d\x0d\
+\x75\x5d\x07\x5b\x55\xd1\x58\x1b\x74\x55\xc5\xca\x8a\xcd\xbd\x31\
+\x06\x5b\x55\xc1\x68\x43\x1f\xd2\x3f\xfd\xcc\x33\xe3\xa7\x9f\x79\
+\x66\xdc\x36\xad\xfe\xce\xb7\xbe\x79\xea\x5f\xff\xf3\xdf\x7a\xe2\
+\xbb\xcf\x7f\xeb\x70\x63\x34\x3a\x62\xb5\xed\xda\x56\xdb\xaa\x0a\
+\xff\xd1\x7f\xfe\x5f\xbc\x55\x55\xf5\x7d\xcd\xa8\xff\x7e\x66\xc9\
+\xff\x90\xea\x0c\xf0\x0c\xf0\x0a\xa9\x00\x43\xaa\xb1\xb2\x0f\x1c\
+\x60\xb8\xb9\xb8\xd1\x8f\x52\xec\x63\xe1\xbb\xc1\x28\x69\x76\xe4\
+\x29\x71\x5c\x9b\x3e\x70\xcf\xf7\x7a\xb7\xce\x20\x46\xec\xb9\x6f\
+\x29\x21\xb3\x66\xbf\xa8\x63\x22\x47\x52\xd6\x7d\xcf\x66\xdf\xa0\
+\xd6\xf4\x11\x0c\xc6\x7b\x7c\x5c\xdf\x97\x49\xe3\x5f\x5e\x63\x82\
+\x51\x1e\xbf\x0d\x6c\x02\x63\xb0\xe9\xfd\xe5\x76\x80\x9f\x01\xfe\
+\x4f\x96\xeb\xb9\xdf\x7a\x17\x7e\xff\x77\xe1\xb3\x8d\x04\x45\x0c\
+\x95\x3c\x87\x94\x87\x73\x43\xf8\x33\x95\x9e\x75\x1e\x2e\x34\xf0\
+\x09\x23\xef\x6b\xd5\xc2\x85\x0d\xf8\x86\x4e\x41\x4c\x1e\xce\x04\
+\x38\x5d\x89\x63\x08\x01\x68\xe0\xb1\x03\xf8\x3d\x0f\xbf\xcd\x5f\
+\x92\x55\x7e\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\
+\x51\x51\x51\x51\x51\xd1\x87\x53\x81\xf2\x45\xf7\x55\x21\xfb\xc4\
+\x93\xea\xc1\x9f\xc0\x39\xfb\x8e\xf5\x79\xab\xf1\xc1\x01\xaf\xbf\
+\xf1\x06\x93\xc9\x84\x27\x9f\x7c\x92\x9d\xd3\x3b\x09\xc4\x8b\x96\
+\xfa\x56\x71\xb1\xa0\x99\x37\x6c\x8e\x46\xd9\xbe\xfe\xfa\xea\xbe\
+\x24\x93\x79\x0a\xf0\xb1\x40\xb8\x8e\x80\x8d\xfe\x10\xb2\x25\x3d\
+\x08\x68\x7c\x19\x78\x6d\x65\xb7\x53\x04\x99\xf6\xbf\x30\xcf\x10\
+\x79\xce\xb2\x7b\x79\xcd\x7a\x06\x9a\x00\xf0\xe5\x79\xea\x27\x1f\
+\xda\xe3\xa9\xef\x01\x1d\xf0\xce\x32\x48\x36\xfe\x2e\x02\x1b\x3d\
+\x7c\x2d\xc3\x02\x07\x5c\x21\x70\x03\x81\xa4\x39\xf3\x4f\x03\xe7\
+\x53\x5b\xdf\x5b\x36\x40\xb2\xa8\xaf\xf7\xc6\x9e\xe1\xfa\x99\xde\
+\x3e\x1d\x12\x50\x70\xaa\xb7\xac\x45\x32\xa7\x67\xe4\x9a\xdc\x92\
+\x1d\x3d\x00\x5e\x4f\x9f\xab\x74\x2c\x19\xe2\x92\xc6\x9e\xfc\x10\
+\x20\x8d\xe7\x06\x1d\x7e\x36\x69\xfb\x69\xaf\x4d\x48\x63\xdc\xe8\
+\x8d\xb3\xbf\x6e\x0f\xf8\x43\xe0\x17\x81\x53\x53\xa6\x39\xdb\xf1\
+\x0f\xd9\xde\x8e\xec\xef\x83\x64\x3d\xfe\x6d\xe0\xda\x80\xc1\xd7\
+\xe7\xcc\x1f\xd3\xf0\xd3\x61\xcc\xe5\xb6\x5e\x38\x04\x9c\x05\xbe\
+\x9c\xda\xfe\x29\xd0\x70\xea\x94\xe2\xe0\xe0\x9e\x40\xe6\x98\x8e\
+\xc2\xf7\x81\x3c\xbd\xcb\x7b\x79\xf1\xdd\x5b\x31\x7f\x20\x9d\x3a\
+\xe5\x39\x38\x00\xd0\x5b\x6c\xc1\xd6\x78\x65\x5c\x39\x44\x60\x0b\
+\x18\x1f\x02\xae\x81\xb3\x34\xcd\x15\xc0\x80\xbf\x4a\x0a\xb6\x48\
+\xdc\x2d\x67\xa3\x5a\x24\xe0\xe2\x2c\xcb\xe0\x3f\x1f\x8f\x4b\xbf\
+\x1b\x3a\xfb\xe5\xfe\xb1\x6e\x20\x6e\x0b\x87\xc8\x3d\x73\xa8\xd1\
+\x31\x05\xc9\x54\xa9\xdf\xbe\x6d\x73\x1f\xba\x47\xe4\x9a\x98\x21\
+\xd7\xdc\xd2\xfa\xba\x46\x79\x8f\xf7\x9e\x1b\x74\x81\x00\xdd\x76\
+\x75\x0d\x52\xf3\xe1\x0e\xef\x49\x6d\x20\x54\x18\x53\xe1\x7d\xff\
+\x3a\xb6\x72\x5c\xb6\x02\xb7\x04\xe5\x67\xd3\xa9\x35\x46\xc5\xe0\
+\x5b\x1d\x67\x36\x36\xb6\x89\x95\xad\x42\xeb\x54\x6c\x54\x23\xd9\
+\xf3\xf5\x34\x1a\x65\xa3\x99\x9b\xd0\x9a\x61\x98\x5b\x2d\x36\xf7\
+\xd6\x46\x63\x6d\xb0\xd6\xc6\x9c\x39\x9f\xb3\xe8\x95\xae\x62\x55\
+\xcd\x53\x06\xbd\x64\xd4\x1b\x63\xf8\xec\x8f\x7c\xe1\xe0\xd2\xb7\
+\xbe\xb9\xff\xb3\xff\xfe\x7f\xf0\xde\x43\x0f\x7f\xac\xc9\x23\xf7\
+\x41\x1e\x39\xbb\x37\x6f\x55\xbf\xff\x9b\xff\xd7\xa3\x27\x1f\xe7\
+\x0f\xbe\x7e\x08\xad\xeb\x15\xf0\x04\xf0\xea\x88\xd1\x8b\x93\xe5\
+\x08\x1e\x09\xde\xf2\x5d\xa9\x86\xbe\x52\xed\xf7\x63\xe5\x8d\xf7\
+\x78\x5a\x3e\xd8\xb3\x29\x97\x8a\xe8\x75\xd8\xad\xf3\x1c\x01\xf2\
+\x47\x1c\x3e\xe8\xfd\xb1\x20\x01\x02\xfe\x6e\x9f\xc1\x31\x6f\xeb\
+\x8f\xfe\xc1\xa1\x58\xd7\x8f\x31\xca\xfb\xc5\xf2\x19\xb0\x0f\x2e\
+\xbf\x53\xbf\x06\xfc\x14\x62\x63\xff\x07\xbd\x71\x45\x0f\xbf\x7d\
+\x15\x7e\x1f\xf8\xcf\x90\x80\xaf\x19\x12\x60\xf6\x9d\xdb\xf0\x0f\
+\xe9\x02\x02\xbf\x84\xbc\x9b\xf6\xd2\xb1\xce\x0f\xe0\xff\x40\xde\
+\x49\x00\x9f\x43\xce\xe3\x6f\xa7\xcf\x1a\xf8\x4f\x80\x7f\x43\x01\
+\xf2\x45\x45\x45\x45\x45\x45\x45\x45\x45\x45\x45\x45\x45\x45\x45\
+\x45\x45\x45\x3f\x30\x2a\x50\xbe\xe8\xbe\x4a\x6a\xca\x47\x62\x14\
+\x68\xae\x50\xa9\x86\x7c\xf7\x1d\xbc\x78\x66\xa7\xff\x28\x88\x51\
+\x11\x09\xdc\xde\xbb\xcd\xa5\x4b\xaf\xb0\xb5\x35\xe2\xb9\x2f\x3e\
+\x87\x36\xf2\x1d\x7f\x86\xf2\x5d\xd2\xbd\x22\xc6\x98\x93\xec\x01\
+\x08\x95\xf8\xde\x6a\xad\x61\x19\x68\xaf\x2a\x67\xf4\xe5\x2f\xbe\
+\xb7\x90\xba\xbc\x1a\x81\xde\xb7\x90\xcc\xb9\x40\x87\x11\x62\x5a\
+\x9f\x6b\x6d\xf7\x95\x61\x44\xce\xb4\x8e\xbd\x36\x6a\x65\x3b\x10\
+\x88\xd8\x8f\x31\x20\xb5\xbd\x8d\x64\xa1\x9f\x59\x59\x97\x8f\xe7\
+\x72\x5a\x3f\x5b\x59\x1f\xe9\xa0\x7d\x3f\x28\xc0\x03\xef\xaf\x1c\
+\x47\xae\xdd\x3d\x66\x39\x70\x61\x07\xb1\xf4\xcf\x99\xca\x79\x9c\
+\x4f\x21\x60\x3f\x8f\x77\x98\x8e\x35\xdb\xdb\xab\xb4\x6c\x42\xaa\
+\x67\x9c\x96\x1d\xb0\x8c\x60\xf6\x57\xc6\x96\xb3\xf3\xed\x4a\x9b\
+\x7e\x46\x75\x4c\x63\xcd\x76\xe8\x79\x59\x7f\x8e\x0f\x90\x8c\xf8\
+\xef\x02\x3b\x06\x9e\xf5\xe0\xd1\xfb\xfd\xf9\xb9\x0a\x7c\x75\xce\
+\xfc\x15\xe0\xfd\x20\xf5\xce\x1b\x1a\xe6\x74\xce\x00\x17\x91\x60\
+\x83\x6f\x00\xb3\x04\xb3\x61\x07\x76\xf6\x8e\x78\x07\xf7\xc1\x93\
+\xda\x01\x7f\x9c\xb7\xf0\xe9\xd3\xa8\xdb\xb7\x57\x00\xcb\x16\x35\
+\xe3\x63\x23\x55\x96\x40\x95\x98\x3e\x74\x90\x7f\x8b\x2d\x81\xff\
+\x5d\xca\xfd\x42\x23\x46\x66\x09\xd0\x1d\x1c\x50\xc1\xc3\x2d\x3c\
+\x33\x66\x7c\x7b\x75\xfb\xae\x83\xc5\x8a\x0a\x01\xe6\xdb\x48\x96\
+\xfa\x14\xb9\xa6\x3e\x8d\xcc\xcf\x21\x32\xa7\x17\x90\x39\xcb\xc1\
+\x29\xfd\xfb\x21\xd7\x6f\x7f\x20\xf5\xb3\x9b\xd6\xf7\xb7\x69\x90\
+\x73\xf2\x4a\xfa\x6c\x82\xb8\x3a\xd7\xa9\x24\xc1\x04\x39\xaf\xd9\
+\x35\xa1\x0f\xe5\x33\xac\xef\x7f\x5e\xac\x17\xde\xbe\xf6\xfe\xb4\
+\x40\x95\x37\x48\xdb\x9c\x00\x1e\x65\x3c\x78\x6f\xd3\xbc\xac\x40\
+\x79\x67\x2d\x36\xba\x04\xe6\x43\x08\x34\xb3\x99\xd5\xd6\x06\x4d\
+\x8b\xb6\x36\x84\xa0\xa2\x6b\x5b\xad\x94\x8d\xa6\x07\xe8\x4d\xb4\
+\x51\xd5\x2a\x56\xd5\x3c\x18\x65\xa3\xa9\x4d\xb0\xca\xc6\xaa\xae\
+\x17\xb5\xe8\x6b\x01\xf4\xda\x18\xc3\xba\x2c\x7a\xad\x4d\xd4\x46\
+\x47\xe7\x9c\x9e\x1f\x1e\xda\xdb\x7b\x7b\x8b\x6b\x2c\x43\xf9\x83\
+\xfd\xdb\xd6\xfb\xf8\xc3\x04\xab\x7f\x18\xa4\x80\xe7\x10\x27\x8c\
+\xff\xb7\x2b\xdb\x71\x5e\x9d\x3f\x7f\x9d\xeb\xd7\xb9\xa5\x35\x6f\
+\x87\xc0\xb7\x57\xda\x00\xf4\x5d\xe4\xd7\x5a\xbd\xe3\xf3\xf5\xbd\
+\x76\xbf\x27\x7d\x86\xee\xfd\x78\x52\xdb\x23\xed\x8c\x41\x79\xbf\
+\x28\x35\xb1\xd8\xb7\x4f\xaf\x8f\x5e\xf6\xbe\xbc\x4f\xfd\xda\x7e\
+\xb2\xa3\xc5\xdd\x8c\x53\x14\x7d\xff\x9d\x06\xf2\x20\xcc\x7f\x37\
+\x28\xe0\xab\x74\x25\x02\xde\xee\x2d\xcf\x30\x7d\x06\xfc\x19\x5d\
+\x70\xd2\xcb\xc0\x8f\x02\x7f\x0c\xfc\x24\xf2\x5c\xfa\x0b\xba\xf7\
+\xa0\x45\xde\xa7\x6f\x22\xaf\x94\x16\xf9\x5b\x24\x3f\x94\x0c\xeb\
+\x83\xf8\x8a\x8a\x8a\x8a\x8a\x8a\x8a\x8a\x8a\x8a\x8a\x8a\x8a\x8a\
+\x8a\x8a\x8a\x8a\x8a\x3e\xc2\x2a\x50\xbe\xe8\xbe\xca\xfb\xe3\xbf\
+\x57\xee\x6a\xc6\x2f\x13\xe7\x18\x23\x97\xdf\x7f\x9f\xdd\xbd\x3d\
+\x1e\x7a\xe8\x41\x1e\x7e\xf8\x61\x50\x5d\x8a\xee\x62\x3b\xa5\x52\
+\x5d\xfa\x98\xda\x2d\x3a\x26\xf8\x48\x58\x2c\x38\x11\x7a\xe6\x0e\
+\x46\x48\x1d\x75\x83\x7c\x21\x7f\x15\x16\x56\xeb\xeb\xda\xc1\xa2\
+\x54\x2c\xa4\x76\x9b\xc8\x97\xf2\x1b\xbd\x6d\xfa\xf1\x03\x19\xd8\
+\xd7\x08\x6c\x3f\x85\x40\x80\x7e\x1d\xee\x3c\xde\x5b\x08\xf8\xdc\
+\x39\x66\xec\xb9\x0e\xfb\xea\xf8\x0c\x92\xa9\x77\x9b\xa3\x5f\xea\
+\xbb\x74\x9c\x19\x96\xc4\xb4\xef\xeb\x2c\x03\x94\x39\x92\xe1\x97\
+\xad\xe2\xf3\xb6\xb7\xe9\xec\xeb\x41\x80\xe9\x3b\x6b\xb6\xb9\xdd\
+\x1b\x57\x83\x58\xf6\x9e\xed\xf5\xdf\xb7\x38\xcf\xed\xce\x22\xd9\
+\xf2\xf4\xc6\xd2\x1f\x93\x41\xe0\x70\xce\xfc\xcf\xe7\xad\x7f\x0e\
+\x49\xeb\xa6\xc0\xd0\xcb\x1c\x3d\xc2\x01\x3f\x86\xcc\xa5\x41\x5c\
+\x01\xbe\x9a\xfa\x56\x80\xad\xe1\x74\x23\xd9\xda\x4f\x21\xf3\xee\
+\xd3\x76\x3f\x05\xfc\xce\xe2\xf8\x96\x81\xbc\x42\x32\x23\x4f\xd1\
+\x81\x94\xad\xa9\x64\x55\x5e\x63\x8d\x6e\xdf\x5e\x1c\xab\x05\x4e\
+\x5b\xcb\x23\x6e\xcc\x73\x69\x7e\x0e\x38\x11\x0c\x1f\xc9\xb8\xef\
+\xb2\xf1\x8f\x00\x76\x54\x02\xf2\xca\x60\xf0\x78\x52\xdd\xf8\x6d\
+\xe4\x1a\xf8\x0b\x96\xeb\xae\x1f\xa7\x75\xe6\x15\x43\xe0\x6f\xd0\
+\x9d\x83\x6b\x88\x83\xc4\x19\xba\x6c\xf8\xac\x1a\x09\x7a\x30\xc8\
+\xf5\x94\xe1\xfa\x2a\xe8\xcb\x41\x31\x9a\x2e\xb8\xa3\xf2\x5d\x5f\
+\xd9\xfe\x3e\x43\xf1\xac\x0a\x09\x49\xd8\x94\x7f\xf5\x55\x8e\x96\
+\xa1\xb0\xbd\x9f\x1a\x39\x5f\xbe\xd7\x4f\x86\xf4\x9b\xac\xbf\xdf\
+\x35\xa0\x2c\x54\x0e\x2c\xb6\xe7\xf8\xe0\xb0\xdd\xb8\x5c\xcc\x73\
+\xe2\x83\xc7\xbb\x56\x7b\xd7\x6a\x65\xab\xa0\x9d\xd3\x19\xd0\x2b\
+\x63\xa2\xf2\x2a\xba\xb6\x0d\x19\xd0\xab\x46\xc5\xd6\xd8\x68\x8d\
+\x58\xdd\x5b\x95\xea\xd0\xd7\x36\x56\xc6\x84\x99\x15\x48\x6f\xea\
+\x3a\x58\xad\x75\x65\x6d\x6c\x93\xcd\xbd\x31\x06\x65\x6d\x30\xda\
+\xd0\xcc\x66\xf6\xda\xf5\x6b\x03\xd7\xb6\xa9\x7e\xb6\x52\x24\x28\
+\xbf\x7f\xfb\xb6\x0d\xce\x9d\x54\xc2\xfa\x2f\x45\xdf\x4f\xeb\xfa\
+\x1f\x80\x2c\xf9\xfe\xd8\xea\x63\xb7\xba\x7b\x7d\x0a\x79\x9e\xff\
+\x13\x96\x82\x9c\xae\x73\x3d\x85\x58\x85\xc0\xa3\xc0\xe7\xef\xb1\
+\xdf\x7b\x9d\xc3\xe3\xed\xec\xef\xb1\x4d\x8c\x27\xbe\x6f\x17\x70\
+\xfe\x43\x8f\xa3\xab\x6d\x2f\xcf\xb7\xee\x4f\x8b\xec\xa4\xb1\x0a\
+\xe5\xc7\xc8\x3b\xe2\xcb\x48\x70\x5b\x1e\xc8\x8f\x23\xef\x8d\xf7\
+\xd3\xe7\x09\x70\x09\x79\xc6\xfd\x1c\xf2\x77\xc4\xcf\x23\xcf\x48\
+\x9f\xc3\x04\x83\xec\xfc\x6f\x20\x01\x64\xa5\x46\x7c\x51\x51\x51\
+\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\xd1\x5f\
+\x11\x15\x28\x5f\x74\x5f\x25\x99\x9a\x09\xbf\x47\xb5\xc8\x66\x8f\
+\x29\x2b\x3e\x67\xce\xf7\x73\x9f\x0f\x0f\x27\xbc\xfb\xde\x7b\x3c\
+\xf8\xe0\x83\x5c\xbc\x70\x31\x65\xdb\xcb\x4a\x15\x3b\x9b\xfa\x45\
+\x35\xf9\xdc\x45\x82\xf4\x0a\xf0\xde\x11\x42\x48\xd0\x7e\x6d\xc6\
+\x5e\x5f\xb9\xc6\xf9\x3e\x92\x05\xb7\x2e\xb3\xfe\xa8\x1d\xaf\x00\
+\xce\x5c\xdb\xfd\x54\x5a\x3f\x46\xa0\x74\x3f\x33\x3e\xb7\x3d\x4f\
+\x67\xdd\x3e\x43\x60\xec\x9c\x0e\x62\xeb\xde\xf6\x19\x16\x6a\x8e\
+\xee\x5b\x03\x8f\x20\xa0\xf9\xcd\x95\xf5\x01\x01\xa5\xef\xa5\xe3\
+\xe8\x07\x03\x3c\x96\xfe\xad\xba\x7e\x0d\xe0\x2f\xa4\x71\xe7\x6d\
+\xa7\xe9\xf3\xa9\xde\xb2\x16\x81\xe6\x9b\x2c\x67\xb0\x3f\x40\x07\
+\x59\x55\x5a\x3f\x04\xde\x48\xcb\x6a\x24\x93\x30\xf7\x13\xd2\x3c\
+\xf4\x33\xe5\x4f\x23\x70\xb5\xe9\x2d\xdb\x49\x9f\xfb\x7d\xef\xd1\
+\xd5\xf4\xcd\x99\xd3\xfd\xf9\x59\xca\x5a\x4f\xc7\xfb\x20\x9e\x41\
+\x9a\x0f\x03\x0b\x9b\xfa\x5c\xb3\xfc\x5c\x23\xd9\xdf\x43\x04\xd6\
+\xff\x6e\xea\xf7\xef\x00\x3f\x92\xf6\x77\x15\xc9\xf2\xee\x4b\x03\
+\x9f\x41\xb2\x23\xdf\x4e\xfb\xfb\x89\x39\x98\x87\xc0\x5f\xce\xe0\
+\xf6\xa1\x74\x0d\x5c\xc6\x22\xe5\x10\x1e\x42\xe0\x78\x70\x8e\xbd\
+\x34\x0f\x5f\xa7\x83\x3a\x1f\x56\xfd\x60\x88\x90\x21\x96\x97\xe5\
+\x4f\xa6\x31\xdc\x38\xd2\xea\x19\xd4\xc2\x48\x79\x7d\x7f\x20\xc7\
+\xb4\x4b\x72\x81\x48\x04\xdd\xf5\xd6\x2d\x65\xaa\x0f\x87\x98\xa6\
+\xe1\x7a\x08\x1c\xd2\xc1\xf8\xfa\xcc\x19\x14\xbb\x67\xd8\x95\x29\
+\xad\xe8\xae\x8d\x1a\x68\x12\x9a\xcf\x59\xba\xf9\x7a\xdd\x46\xeb\
+\x3d\x42\x58\xbc\xd3\x34\x6c\x05\x99\xcb\x03\xe0\x10\x42\x6b\xb1\
+\x95\x13\x40\x9e\xc7\x7e\x06\xb9\x46\x67\x74\xd9\xa8\x01\xa8\xb0\
+\x36\x3b\x54\x5f\xc6\x30\xc0\x2f\x02\x3e\x56\xa5\x5d\x3a\x3e\xeb\
+\xb0\x6e\x39\x10\x47\x03\xc6\x61\x22\x78\x8d\xb5\x31\x86\x48\xdb\
+\x36\x46\x29\x13\x4d\x0c\x2a\x2a\x1d\xa3\x6b\xb5\x13\x40\x2f\x99\
+\xf3\x08\xa8\x6f\x3d\x58\x6d\x83\x53\x21\x1a\xdb\x6a\xdb\x03\xf4\
+\x8d\xeb\x00\x7d\x35\x9c\x05\x3b\xb1\x51\xad\x01\xf4\x4a\x6b\x5d\
+\x55\x55\x74\xed\xdc\x1c\xec\xde\xac\xe3\xbc\x39\x02\x21\xc7\x07\
+\x87\x95\xef\xb2\x81\xbf\x27\xba\x71\xfd\x5a\xf5\xfc\x9f\xff\xd9\
+\x99\x1f\xff\xeb\x3f\x73\xf3\xd4\xf6\x76\xc9\xea\x3d\x59\x03\xe0\
+\x59\xba\xf7\xc2\x53\x88\x3b\xc4\x07\x3d\x27\x5b\xc0\x67\x11\xa8\
+\xbb\x7b\x4c\x3f\xb7\x81\x3f\x07\x7e\x8f\x93\xea\xc6\x7c\x78\xdd\
+\xf5\x31\x8c\x18\xa9\x15\x8b\xfd\x25\x9d\x90\xbd\x7f\xcf\xfb\xdf\
+\x60\x43\xc1\x74\xe9\x45\xb3\x6e\x47\x2b\xfd\x9c\x03\xfe\x1d\x3a\
+\xb7\x97\x7e\xdf\x7f\x0c\xfc\x2d\xe0\xa7\x81\x3f\xfa\x85\x5f\x40\
+\x7d\xe5\x2b\x1c\x02\x7f\x02\x5c\x62\x30\x00\xe6\x30\x27\xc2\xc0\
+\xc0\xdc\x20\xcf\x93\x77\x90\xe0\x2e\x07\x21\x3f\x60\x14\x1a\x9d\
+\x3e\x9e\xe8\x1e\x50\x54\x54\x54\x54\x54\x54\x54\x54\x54\x54\x54\
+\x54\x54\x54\x54\x54\x54\x54\xf4\x83\xa3\x02\xe5\x8b\xee\xab\x82\
+\x3f\xae\x1c\x6a\x4c\x50\x7d\x69\x11\xb3\xf9\x8c\xd7\xdf\x78\x9d\
+\xed\xed\x6d\xce\x9d\x3b\xc7\x7c\x3e\x07\x9d\xe1\x3d\x02\xf2\xd5\
+\xf2\xf7\xd6\xf2\x51\xf5\x3e\x2b\x9c\x73\x38\xe7\x72\x76\xfd\x6a\
+\xf6\x6c\x5f\x19\xac\x5d\xa5\xab\xab\xbe\x32\xaa\x05\xfc\x5d\xcd\
+\xf0\xdd\x42\x32\x81\x6f\x21\x99\xc0\x63\xe4\x4b\xf8\x9c\xdd\xde\
+\xb3\xc5\xde\x32\x30\xce\x60\x7b\x4c\xb6\xb7\xd7\x0c\x11\xa7\xfd\
+\x3c\x8e\x0c\x37\x9f\x40\xa0\x7b\x06\xe8\xab\xb6\xe0\xf3\x34\xe6\
+\xc9\xca\xfa\xbc\xee\x34\x86\x69\x4a\x92\x06\x81\x42\x0d\x02\x6a\
+\x1c\x0b\x1b\x71\x7f\x1e\xc9\xec\xdf\x65\xd9\x92\xff\xa1\xb4\xef\
+\x1c\x18\x90\xe1\xfa\x0e\x5d\x46\xf4\x26\x02\x3a\xb3\x2d\x79\x86\
+\xe2\x93\x34\x86\xdc\xd7\xed\xb4\x5c\xa5\x7d\xd5\x74\x4e\x04\xd9\
+\x32\xfe\x5d\x99\xbb\x27\x0c\xbc\x99\xf7\x9b\x83\x1b\x32\xdc\x00\
+\x09\x14\xe8\xd7\x27\xaf\x01\xcd\x79\x0c\xd7\x17\xfb\xcb\xa0\x7e\
+\x2f\x1d\xc3\x6b\xc0\x1f\xa5\x36\x9f\x49\x6d\x36\xd3\x9c\x5c\x45\
+\xa0\xca\x83\xc0\xd3\x2c\x97\x10\xb8\x05\x7c\x42\x6b\x2e\x1a\xc3\
+\xbf\x69\xdb\xa5\x6b\x23\xef\xe3\x30\x8d\x3f\xff\x1e\xf6\x79\x78\
+\x32\x00\x00\x20\x00\x49\x44\x41\x54\x2f\x77\x63\x1d\x70\x99\x1d\
+\xe4\x1a\xd9\x4a\xf3\x7e\x03\xb8\xc4\x33\xec\x0b\x04\x37\x4f\x82\
+\x1f\xb3\x2e\xdf\x7d\x59\x7d\xcb\xfe\xe3\x20\x8e\x5a\xfa\xfc\x04\
+\x8a\x37\x8f\xb4\x1d\x20\x73\xb8\xac\x1e\x90\x3f\xc5\x29\x75\xc0\
+\x41\x7f\x6d\xff\xb8\xb3\xbd\x73\x4c\x07\xa9\xd3\xb2\xb3\xc8\x9c\
+\x6e\xe6\x0d\x67\x33\x36\xe8\xe6\x42\xa7\x7d\x6f\xce\x77\x69\x27\
+\x5d\x8c\xc3\x26\x12\xa4\xf1\xa9\xb4\xcd\xbb\x04\xa6\x74\xd9\xed\
+\x39\x60\x43\x13\x42\xba\x1f\x2c\xe0\x08\x72\x3d\x5f\x46\x02\x1b\
+\x06\x1a\x8c\xc3\xd9\xb4\x3a\x6b\x82\x04\x64\x64\x36\x97\x4b\x2e\
+\xd8\xae\x64\x34\x87\x78\x0e\x8f\xcc\x49\x4f\x16\x06\x0e\x8c\x93\
+\x9d\xf7\xed\xeb\xd3\x35\xe7\xe5\x39\xe1\x5c\x0c\x21\xd0\x36\x8d\
+\xd6\x58\xa2\x31\x11\xe3\xa2\x52\x26\x2a\x1f\x94\x31\x3a\x7a\xd7\
+\x6a\xa5\x55\xd4\xce\x6a\x65\x54\x0c\xca\xe9\x9c\x41\x6f\xb5\x0d\
+\x2a\x01\x7a\xd5\xa8\x68\xd7\x00\x7a\x6b\xe7\x51\x59\x15\xab\x6a\
+\x01\xe7\xa3\xb5\x36\x36\xf3\xd6\x1c\xdc\xba\x5d\x7b\xe7\x16\xd7\
+\x40\x74\x4a\x41\x60\xd6\x4c\xcd\xec\x70\x7a\xec\x73\x30\x78\xaf\
+\xb4\x31\xc7\x82\xdb\xe0\x3b\xa0\xef\x83\xe7\xb7\x7f\xe3\x37\x1e\
+\xad\x36\x6a\x7f\xe9\xf9\xe7\xcf\x03\x3c\xfa\xc4\x93\x27\xce\x9f\
+\x0c\x26\x9a\xad\xcf\x7c\xfe\x17\x5f\xf9\xce\xb7\x37\x4f\xda\xec\
+\xcf\xfe\xef\x7f\xfc\x8f\x00\xbe\xf4\x1f\xff\xdd\x5f\xbc\x63\x9f\
+\x3d\xcd\x66\x33\xe8\xca\x7d\x7c\xd4\x74\x0a\x79\x16\x65\x2b\xf9\
+\x1f\x45\x82\x7e\xfa\xf5\xde\x35\xb9\x64\xc6\xc9\xd2\x08\x38\xde\
+\xa7\xbb\x73\xd7\x9d\xbb\x53\x48\xc0\xd1\xaa\x13\xcb\x7d\xd3\x49\
+\x40\xfe\x7b\xad\x35\x38\xfe\x6e\x80\xf7\x16\xe2\x3e\x30\xe7\x68\
+\x70\x9e\x42\xde\x15\x3f\x0d\x3c\xfc\x95\xaf\x3c\x77\x15\xbe\x16\
+\x90\x80\xaa\x37\x98\xf7\x63\xd5\xe6\xf9\xbd\xa7\xe8\xde\x6f\xed\
+\x52\x5f\x81\xdb\x74\xef\xc8\x01\xe2\x68\x30\x5f\xac\x97\x67\x62\
+\x05\xbc\xc5\x72\x20\x5c\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\
+\x51\x51\x51\x51\x51\x51\x51\x51\xd1\x47\x54\x05\xca\x17\xdd\x57\
+\xf9\x10\xba\x4c\xf8\x88\x10\xf4\x64\x2b\xaf\x50\x84\x94\xf5\x2e\
+\x96\xf3\x81\x17\x9e\x7f\x01\x1f\x3c\xcf\x3e\xfb\x2c\xed\xbc\x21\
+\x6a\x85\x4a\xdb\x2f\x51\x07\xa5\x97\x69\xa4\x4e\x3d\x4a\xca\x3c\
+\xcd\xbc\xc1\xf9\x05\x94\x3f\xe9\x3e\xc8\x20\x3a\x67\x95\x1f\x07\
+\xa6\x34\x60\x1e\x7a\x08\x75\xf9\xf2\x62\xd9\x01\x02\x7c\x6f\xf7\
+\xda\xe5\x3e\xb2\xdd\x76\xd2\x58\x21\x70\xa4\xbf\x6d\x46\x96\xf9\
+\x8b\xf9\x7e\x06\xee\x3e\xf2\x65\xff\x05\xd8\xb0\x30\xed\x1f\x43\
+\x44\xe0\xae\x43\x20\x77\x86\xd4\x19\xe8\x3f\xaa\xd1\xfb\xc1\x87\
+\x1b\x5c\xc4\x70\x15\x10\xc8\x7c\x8d\x0e\x4a\xe6\x36\x19\xee\x37\
+\xbd\x65\x5b\xe9\xf7\x69\x3a\x9e\x9c\x59\xde\xd0\xd9\xc0\xe7\xf5\
+\x63\x04\xd4\xe7\xe0\x81\x29\x1a\x45\x58\xd8\x00\xbb\x74\x2c\x0f\
+\xf7\xda\xec\xb1\x1c\x4c\x90\xe7\x6a\x04\x6f\xe6\x36\x37\xd2\xd8\
+\x72\xc6\x74\x0e\x02\x80\xce\xc6\x5c\x91\x03\x07\x66\x0c\xe9\x6a\
+\x8e\x0f\xd2\xbf\x19\x14\x0e\x11\xb8\x6b\x80\xca\x60\x06\x1e\xbf\
+\x99\xb6\x31\x69\x7d\x6e\x77\x5a\x9a\xe8\x81\x8c\x23\x1c\x84\xc0\
+\xab\x21\xf0\x02\xcb\xca\x6e\x05\xa3\xd4\x46\x21\xf5\x86\x3f\x93\
+\xce\xdb\x06\x12\xd8\xf0\x7c\x9a\xf7\xd7\xcf\x73\x7e\x7c\x9d\xeb\
+\x92\x51\xfc\x62\x3e\x26\x9f\x61\xf5\x88\x0c\x8d\xce\x9c\x51\xec\
+\x2e\x25\xe6\x2f\xc3\xf6\xde\xe7\x53\xe9\xdf\x84\xd0\xd5\x16\xa8\
+\x05\xdd\xbf\xbe\xe4\xd4\x40\x9a\xbf\x11\x92\x5d\x7e\xac\x56\x80\
+\x7c\xd2\x50\x31\x9c\x45\x04\xb4\x43\x17\x1c\xf0\x30\xdd\x75\x38\
+\x1c\x0c\xd8\xec\xb1\xa9\x4d\xe4\xfc\x54\x88\x43\x44\x0b\x8c\x26\
+\x7d\x64\x2e\x73\x9f\xa1\xd5\x3c\xfd\x54\xc6\x60\xbd\x5f\x04\x6c\
+\x5c\xa7\x0b\x70\xb1\xbd\xe6\x79\x59\xba\x6f\xb4\x81\x94\x49\xdf\
+\x81\xf9\x6c\x89\xdf\xbf\xaf\x57\x6d\xf6\xef\x28\xd7\x5d\xf3\x7d\
+\x28\xbf\xc8\x94\xa7\x0b\xde\x89\x21\x04\x82\x0b\x26\x6a\x17\x7d\
+\x6c\xa3\xf2\x2a\x6a\x2c\xca\xa8\xe8\x9c\x8a\xc6\x98\xa8\x94\x8a\
+\x5a\x7b\x94\xd3\xd1\x6b\x15\xd1\x36\x1a\xa3\xa2\x53\x4e\x9b\x04\
+\xe8\x2b\xa5\x62\xab\x4c\xb4\x55\x15\x32\xa0\x57\x56\x45\x93\xe0\
+\x7c\x5d\x4f\xa3\xb2\x36\x1a\x53\x85\xca\xd4\xa1\x9d\xcf\xed\x64\
+\x72\x50\x01\x44\x1f\x94\xef\x25\xfd\x4f\x67\xb3\xca\xcd\x5b\xe3\
+\x7d\x50\x55\x25\xe3\xef\x83\xf6\xfc\xf9\x24\x30\x9f\xf5\xce\x6b\
+\xaf\x8d\x6e\xdd\xba\xbe\xf1\x9f\xfe\xd7\xff\xcd\xab\xb7\x6e\xdc\
+\xd8\x78\xe3\xd2\xa5\x9d\xbd\xeb\x37\x86\x77\x6a\x77\xb7\x1a\x3d\
+\xfe\xf1\x7f\x70\xe5\x85\xaf\xff\xf2\x1f\xfc\xaf\xff\xf0\x1f\x3d\
+\xf8\xb9\x2f\xfe\x83\xbb\x69\x73\xe5\x85\xaf\xff\xf2\xaf\xfd\xda\
+\xaf\x7d\x1e\xb9\x27\x3f\x8a\x1a\x21\xd7\x49\x7e\x26\x45\xe4\xde\
+\xe9\xbb\xa3\x7c\x01\x01\xf2\xdf\xba\x43\x5f\x7f\x2d\x6d\xff\x2f\
+\x38\x39\x03\xbe\x41\xee\x9d\xb7\xef\xb0\xdd\xf7\x5b\x1f\x34\xfb\
+\xfb\x4e\xed\x16\x7f\x55\xdc\x43\xdb\x3b\x2d\x3f\xa3\xd1\x17\x03\
+\xa1\x1f\x08\xd6\x6d\xf3\x08\x37\xed\x15\x6e\x38\xc7\x4f\xc3\xd7\
+\x7e\x8b\x2e\x90\x6e\x55\x79\x59\x0e\xde\x5a\x7d\x06\xa9\xde\x7a\
+\x8b\x3c\x07\x03\x2c\x3d\x7c\xff\x15\x52\x22\xe5\x0c\x12\xf4\x57\
+\x54\x54\x54\x54\x54\x54\x54\x54\x54\x54\x54\x54\x54\x54\x54\x54\
+\x54\x54\xf4\x11\x57\x81\xf2\x45\xf7\x55\xc1\x79\x16\x8e\xf3\xf2\
+\x1f\x72\xa2\x7b\xae\x27\x4f\x54\x44\x05\xb7\xf7\xf6\x08\x21\xf0\
+\xc8\xa3\x8f\x32\x9d\x4d\x51\xe9\x7f\xb9\x3d\x80\xd2\x2a\x59\xd5\
+\x27\xbb\x7a\xd2\xb7\xdb\xe9\x97\xfc\xb9\x6d\x5b\xda\xe6\xb8\x4c\
+\xf9\x1d\xd8\xd9\x83\xbd\x45\x16\x76\x06\xca\xeb\xa4\xe8\x80\x8a\
+\xb9\x7c\xb9\xf7\xa5\xbe\x31\x1a\xef\x5b\xd6\x67\xd7\x67\x88\xb7\
+\xd8\x9a\x0e\xa6\xae\x6e\xbf\x0a\xe5\x23\x02\xae\x67\xb2\xfd\x74\
+\x35\x53\x3e\xd7\x46\x3f\x44\x80\xba\x01\xcc\x79\xe0\xba\xfc\x3e\
+\x0e\x04\xc9\xae\xbb\xda\x87\x99\x3c\x9a\xda\xd7\x9c\xc7\x72\x7d\
+\x61\xe7\x3e\x42\xa0\x74\xae\x21\x3f\x43\xb2\x8b\xf3\x71\x5b\x04\
+\xa8\x5e\x4e\xfb\xcd\x30\x72\x03\x81\xad\x37\xe9\xe0\xfd\x39\xc4\
+\xae\x3c\xf6\xda\x3e\x92\xb6\x55\x83\x01\x66\xde\x6a\x08\x61\xb3\
+\x37\x47\x23\x04\x60\xe7\x9a\xf5\x19\xb8\x8f\x7a\xdb\xe4\xa0\x06\
+\xd2\x58\x6b\x40\x5b\x4b\xe5\x1c\x15\x07\x0c\xd2\x3e\x2b\xba\x6c\
+\xfc\x9a\xce\xda\x7e\x3b\xf5\x53\x7b\x7c\x95\xfa\xae\x34\xba\x0a\
+\x84\x6d\x60\x64\x60\xe0\x25\x20\x81\x54\x9b\xdc\x23\xa0\x64\xc0\
+\x32\xc8\xce\xe7\x71\x60\x61\xe4\x3a\x9b\xff\xa8\xd1\xc3\x40\x38\
+\x87\x80\x94\x11\x62\x2f\xdd\x00\xea\x3a\xd7\x57\x33\xd4\x73\xb0\
+\xc3\x29\xfa\x19\x92\x02\xe4\x57\x81\x7a\x7f\xbf\x8b\xe5\x07\x32\
+\x38\x59\x36\x18\xa8\xf1\x7c\x0e\x83\x81\x62\x0e\x1c\xce\x59\xe9\
+\xe3\x14\xb0\x41\x5d\x6f\xd1\xf4\x2b\x05\xdc\x8d\x66\x39\x7f\x77\
+\x63\x65\x4c\x63\x24\x93\x73\x07\x18\xc4\xf9\x02\xda\xe7\x6d\x1f\
+\x95\xc6\x8c\x01\x47\x55\x8d\x68\x55\xdb\x55\x2a\xb0\x03\x70\x13\
+\x3a\xa7\x80\x00\x78\xef\x31\x68\x6d\x09\x21\x03\x2d\x03\xda\x60\
+\x94\xc5\xfb\x88\x31\x0a\xef\x73\x40\x45\xae\x2d\x3f\xc6\x18\x8b\
+\xf3\xe9\x3e\x32\x0a\x7c\x86\x6b\xf9\xba\x38\x0d\x1c\x62\xb0\xf8\
+\xbb\x07\x95\xbd\x20\x81\xd5\xe0\x99\x23\x50\x3e\xc6\x88\xf7\x5e\
+\xe1\xa3\x92\xb6\x2a\x46\xd5\x44\x02\x28\xad\x43\x74\x02\xe8\x51\
+\x2a\x6a\x0d\x4a\x99\x68\x8c\x8f\xd1\xe9\xa8\xb4\x8a\x4e\xdb\xa8\
+\x01\x67\x6d\x30\x26\xc4\xe0\x9c\x56\x46\x00\x7d\xae\x43\x5f\xd9\
+\x2a\xb4\xae\x03\xf4\x95\x9e\xd1\xcc\xe7\xf6\xf0\x70\x5a\xf9\x18\
+\xbb\xf3\x93\xb0\x62\xdb\xce\xcd\x70\x73\xd8\x1a\xa3\xe3\x2a\x8c\
+\xef\xeb\xa4\x75\x59\x51\xeb\x38\x1a\x9d\x6e\x42\x68\xd4\xa9\xcd\
+\xed\xe6\x73\x3f\xfb\xe3\x37\x9f\xfe\xf4\x67\xee\x98\x02\xed\x03\
+\xca\xe8\xbb\x9d\xf3\xbf\xff\x77\x7f\xf3\x57\xfe\xc7\x7f\xfc\x1f\
+\xfe\xbd\xbf\xff\xce\xdd\x6c\xfd\x9b\xbf\xf2\x2e\x74\x59\xe8\x1f\
+\x45\x9d\x42\x9c\x46\xb2\xa6\x88\xad\xfc\x37\xd2\x67\x0d\xfc\x97\
+\x40\xe4\x09\x6c\x72\xb8\x58\x37\x57\x4f\x20\xe5\x18\xfe\x25\xf2\
+\x7c\x3a\xe9\x7c\xb5\x08\x94\x7f\xf3\x03\x8e\x99\x3b\xf4\x7f\xa7\
+\xf5\x77\x63\xcb\x7e\xa7\x6d\xee\x16\xae\xdf\xe9\xf3\x91\xe5\x43\
+\x50\x7d\x4b\x82\x21\x43\x35\x63\xd6\x04\xc2\xe7\x65\x75\xdf\xe9\
+\x26\xe9\x5d\x70\x12\x34\xf1\xb7\x90\xe0\x08\x8b\x3c\x57\x56\xdd\
+\x1f\x72\xf6\x7b\x7e\x07\x8e\xe8\xea\xd0\x43\xe7\x1c\x62\x1f\x78\
+\x80\xea\xc6\x0d\x34\xf0\x2a\x52\x42\x25\xab\x46\x4a\x8e\xe4\x3f\
+\x6b\xee\x67\x60\x45\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\
+\x51\x51\x51\x51\x51\x51\x51\xd1\x5d\xa8\x40\xf9\xa2\xfb\x2a\xa9\
+\x07\xbf\xee\xbb\xe4\xf4\x5d\xb7\x8a\xa8\x08\x21\x46\xde\x7a\xfb\
+\x2d\xac\x35\x68\xa0\x99\x4b\x39\x57\x71\xa6\x4f\xdf\x47\x2f\x7d\
+\x2d\xad\x50\x2a\xd1\xf9\x78\xd4\xc2\xbe\x6d\x1d\xce\xb7\x84\x10\
+\xd8\x62\xab\x02\x18\x33\x4e\xad\xf7\x04\x79\x03\x58\x0c\x8e\x4a\
+\xa3\x07\x81\xb0\x0a\x08\x36\x81\x8b\xe4\x3a\xe9\x3b\xd8\x45\x3b\
+\x00\xef\x73\x16\xdc\x3a\xf5\xa0\xfc\x8e\x82\xbd\x9c\x8d\xdf\xcf\
+\xa8\x97\x11\x1c\x85\xf2\x7a\xa5\x0f\xcb\x32\x94\xb7\x74\xe0\xfc\
+\x20\x7d\x76\xd7\xbb\xf5\x7b\x08\x00\xc8\xfd\x66\x60\x3e\x21\x59\
+\xac\xaf\x58\xbd\x3f\x9a\xd6\x19\x4e\x63\xb8\xbd\x00\xe2\x67\x59\
+\xce\x54\x3f\x0b\x9c\x86\xca\x42\x6b\x11\xe4\x77\x03\xd8\x1b\x0e\
+\xb1\xb3\x40\x45\xc3\x3e\x92\x19\xde\xb7\xe4\xdf\x47\xa0\xab\x99\
+\xcf\x31\x10\x2e\xd2\xc1\xd4\x5c\x87\xfc\x10\x01\x55\x79\xbc\xe7\
+\x90\x5c\xe7\x7e\x6d\xf1\xbc\x2c\x83\x7b\xe3\xdc\x22\x13\xbb\x9f\
+\x29\xbf\x81\x00\x8f\xaa\xd7\xf6\x14\x55\x65\x68\xdb\xbc\xfd\x06\
+\x50\xa5\x8c\xc8\x2d\x60\xc3\xcb\xf2\x4d\x0b\xca\xc9\xef\x3e\xf5\
+\x39\xa4\x2b\x49\x00\x75\xad\x68\x1a\x85\x58\x9a\x0f\x91\xeb\x43\
+\x01\x26\x10\x0e\xd2\x71\xe4\x6c\xfd\xed\x34\x66\xd5\x6b\x4f\x82\
+\xe2\x06\xa8\x2d\x9c\x72\xbd\xfa\xc5\x35\xa8\x1e\x32\x3f\x02\xad\
+\xaa\x0a\xd5\x76\x46\xc8\x6a\x2e\x0b\xd5\xc2\x3e\x79\x3e\xef\xb5\
+\xa9\x54\xcf\x35\x59\xae\xe3\xa6\x39\xd1\x3e\xfc\x0e\x1a\xd2\x05\
+\x3a\x40\x57\xaa\x40\x01\xc3\x06\x86\x50\xa9\x0a\x68\x69\x37\xd0\
+\xba\x25\x84\x77\x91\xb9\x7c\x80\xb6\xcd\xb0\x2b\x1d\x8f\x1b\xb0\
+\x7c\x2f\x40\x0e\xe8\x08\x21\x97\x4d\xb8\x00\x0c\xd1\x4c\xc0\x1b\
+\x8c\x01\x3c\x5a\xb3\x15\x02\x67\x48\xe5\x20\x02\x21\xa6\x72\x0d\
+\xe9\x3e\xf2\x0a\x81\xa1\xa7\x91\x73\xe2\x16\xfd\x7b\x0c\x86\xae\
+\x80\x02\x60\x3c\x80\xc1\xe3\x59\xac\x4b\x4a\x40\x3e\x67\xb5\xf6\
+\xef\xd3\xfc\x93\xa1\x3c\x21\x04\xbc\x77\x1a\x0d\x06\x15\xbd\x43\
+\xa1\x4c\x04\x8d\x31\x41\x65\x40\x8f\x52\x92\x31\x4f\x8d\xb7\x84\
+\x0c\xe8\x95\xf2\x02\xeb\x5d\xab\x9d\x56\x51\xa7\x2c\x7a\x81\xf7\
+\x26\xb6\x5e\x45\xd7\xb6\x41\x29\x1b\x2b\xdb\xc4\xa8\x4c\xb4\x46\
+\x47\xe7\x66\xa6\x9d\xcd\x96\xdf\xf9\x41\xac\xec\x5d\xeb\xf5\xb5\
+\xf7\xdf\xdd\xf9\xcd\xff\xfd\x7f\x7b\xbc\xb2\xd5\x71\x35\x45\xee\
+\x4a\xbb\xbb\xb7\x86\xef\xbf\xf5\xc6\x99\x77\x5f\xff\xd2\x8d\x83\
+\x83\xfd\xba\x99\xcf\xf5\x6c\x36\x3b\x2e\xa8\x49\x86\x21\x66\x26\
+\xb1\xbd\x87\xac\xe9\x10\x02\x77\xea\x17\xe0\x9f\xfd\x2f\xbf\xf2\
+\x1b\xbf\xf4\x4b\xbf\x94\xef\xf5\x8f\xaa\xf2\x33\x6b\xd0\xfb\x0c\
+\xcb\x81\x58\x12\x8c\xf4\xe6\xb1\xc7\xb1\x09\xfc\x1c\xf0\x35\xe4\
+\xb9\x5f\xaf\xd9\xa6\x3f\xbf\xe7\x10\xab\xf5\xad\x63\xfa\xbb\xd7\
+\x6c\xf2\xbb\xda\x46\x8b\x53\xca\x91\x34\xf3\x3b\xad\xbb\x8b\x7d\
+\xdc\x79\x5c\x1a\xa5\x83\x4e\xfd\x9f\xbc\x97\xd9\x4a\x7f\x33\x1a\
+\x85\xcc\xe9\xe3\xc8\x9c\xcd\x56\xf7\xb9\xb1\x81\x9a\x8a\x2b\xfe\
+\x7b\xc0\x7f\x85\x3c\xff\x6e\x00\xe7\x18\xd2\x2f\x3c\xa0\x91\x77\
+\xc6\x67\x90\xe7\xcf\x45\x8e\x42\xf9\x07\x80\x9f\xbd\x71\x83\x4f\
+\x03\x4f\x21\x81\x5c\xfd\x68\xa9\x53\xa9\xfd\x1c\x09\x58\xfb\xe7\
+\x1c\xb5\xd4\x2f\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\
+\x2a\x2a\x2a\x2a\x2a\x2a\xfa\x08\xa9\x40\xf9\xa2\xfb\x2a\x1f\x84\
+\x47\xaa\x55\x77\xf7\x94\xcc\x19\xd3\xa2\x76\x3e\xe7\xd6\xcd\x5b\
+\x7c\xec\x63\x1f\x63\x96\xb2\x78\x17\x79\xf0\x0a\x54\x2f\x5d\x3e\
+\x46\x85\xd6\x8a\x9c\x32\xaf\x16\x5d\xe6\xef\xcf\x23\xae\x6d\xf1\
+\xa9\xa6\xfc\x98\xf1\xf1\xb0\xc6\x09\x68\x4b\x70\x36\x6b\x0b\xf9\
+\x12\x3d\xdb\x0d\xdf\x02\x1c\x7b\xac\x42\xf8\x55\x60\x94\xeb\x6b\
+\x9f\xa3\x03\xc2\xa4\x08\x00\x4d\x07\x99\x73\xe6\xf5\x28\xfd\x64\
+\xd0\x9c\x27\xa9\x42\x40\x79\xae\xd3\xbd\xae\x9e\xfd\x75\x60\x0a\
+\x46\x27\x0b\xf4\xbc\xde\x20\x10\x60\x13\x01\x07\xfd\x0c\xfd\x3d\
+\x3a\xcb\xf6\x0c\xbb\xcf\xc9\xc8\xf5\x2d\x42\x30\xdc\xc6\x20\x30\
+\xe0\x21\x3a\xeb\xdd\xdc\x67\xaa\x27\xdf\xe6\x65\x1e\xad\x2b\x42\
+\xd8\x9a\xcd\x16\x70\x72\x96\xf6\x9d\xfb\x8f\x08\x40\xfa\x18\x1d\
+\x20\xbf\x8d\x58\xbc\xe7\xf1\x4e\x91\x6c\xfb\x7c\x1c\xd9\xca\xf7\
+\x66\x6f\x9b\x6c\xe9\x9f\xb2\xa6\x17\xee\x06\x52\x7b\xbc\xae\x07\
+\x34\x4d\x06\x5b\x19\xc8\x67\xe8\xaf\x2d\x76\x93\xd8\x1a\x27\xe0\
+\x63\x33\xed\x23\xd7\x2d\x1f\x61\xcc\x10\xef\x2b\x60\x23\x91\x5b\
+\x8b\x4c\xac\x0a\xab\x75\xd8\x05\xc8\x67\x80\x33\x00\x3b\xc2\xa2\
+\x70\xae\x62\x01\x67\x35\x92\x6d\x6f\xb7\xc1\xb9\x2a\xc1\xf1\x56\
+\xda\xf7\x33\xad\x2b\x07\xa3\x0a\x9a\x4c\x5b\x9a\xfe\x35\x66\xad\
+\xca\xb5\xcf\x2d\x56\x39\x1c\x7d\x20\xbf\xf8\xad\x6d\x7b\x6d\x50\
+\x9d\xc3\x7b\xdb\xdf\x2e\x3b\x08\x0c\x97\xda\xf6\x8b\xb0\xe7\x37\
+\x86\x7c\x5c\xb5\x86\xce\x35\xe9\xfb\x50\x5e\x01\x4a\x6b\x36\x83\
+\x94\x2c\x18\x2c\x8e\x13\x2a\x42\x38\x90\x43\x5a\x38\x17\x0c\xac\
+\x95\x6b\x35\x1d\x56\x8d\x9c\x93\x4f\xa4\xdf\x2f\x03\xbb\x06\x63\
+\xbc\x5c\xd7\x15\x02\xbe\xf6\x01\x8f\x47\x67\xb6\x15\xe4\x5a\xbb\
+\x8c\x40\xf9\x1c\x88\xb1\x7a\x4f\x4e\x91\x7b\x38\xdb\x42\x6f\x90\
+\xaf\x9d\x8c\xc8\x7c\xff\x9f\xa5\x0f\x18\x50\xde\x00\x18\x93\x32\
+\xf3\x17\xfd\x6b\x8d\x09\x61\x31\x17\xe9\xbc\x1b\x62\x8c\xf8\xe0\
+\x85\x0c\x2a\x13\x51\x44\xb4\x53\x06\x15\x7d\x48\x80\x3e\x68\x8c\
+\x21\xa2\x62\xf4\x6a\x06\xad\x52\x95\x52\xd1\x63\x51\x56\xf7\x00\
+\xbd\x8a\xc6\xc4\xe8\x1d\xa8\x04\xe8\xb5\xb5\x21\xe0\xb4\xb6\x36\
+\xb4\x1e\xac\xb6\xa1\x05\xda\xd6\x99\xf9\x6c\x72\xe4\x9d\x1f\xa3\
+\x57\xbe\x09\x7a\x7b\x67\x67\xf2\xec\x17\x9f\xbb\x69\x8c\xc1\x7b\
+\xbf\xba\xd9\x1d\x15\x83\x52\xe0\x79\xfd\xa5\x97\xb7\x2f\x3d\xff\
+\xcd\x8f\xbd\xf3\xfa\xeb\x9b\x07\x7b\x7b\xc3\x83\xfd\xfd\x6a\xf7\
+\xd6\xcd\x13\xff\xd6\x90\x10\xaa\x78\x4f\x99\xbe\xde\x7b\xee\xd4\
+\x6f\xde\x8e\x0e\x76\x7f\x54\x35\x40\xde\x2b\xb9\xe6\xfd\x68\x65\
+\x7d\xf7\x4c\x3d\x3e\xb8\x60\x0b\x79\x0e\xbf\xc1\x32\x68\x3f\x0e\
+\x56\xcf\x0c\xe6\x4f\x3d\xfe\x77\xee\xb8\xed\x08\xb5\xb6\xdc\xbb\
+\x2c\x5f\x6f\x11\xbf\x81\x62\x7a\x74\xdd\x60\x80\x62\xca\xd1\x8a\
+\xee\x80\x18\xd7\xdc\x43\x46\xfc\x70\xa8\x98\xcd\xd6\xae\x5a\xdb\
+\x26\x40\x18\xd6\x47\xda\x0c\x18\x28\x06\xf3\xe5\xb2\xef\xdd\x80\
+\x53\x40\x53\x00\x39\x3f\x7f\x9b\xce\x65\x65\xb9\xfb\xe9\x40\x25\
+\x53\x13\xad\x50\x17\x23\xf1\x2a\x70\xba\xaa\x38\xdb\xce\xba\xb9\
+\xa8\x2a\x4c\xdb\xf2\x28\xf0\x2c\xe8\x06\xf4\x79\x70\xdd\x4d\x67\
+\xd1\x48\x40\xd9\x55\x24\x88\x6d\x3f\xed\x73\xdc\xdb\xdd\x04\xf8\
+\x5d\xe4\x79\xf5\x93\xc0\x1f\x52\xa0\x7c\x51\x51\x51\x51\x51\x51\
+\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\xd1\x47\x5a\x05\xca\
+\x17\xdd\x17\x35\x09\xac\x07\x1f\xb8\x1b\xe7\xd5\x10\x23\x31\x46\
+\xda\xb6\x45\xa7\x2f\xd4\x55\x82\xec\x2a\x81\xf9\xbe\x94\xea\x2d\
+\x58\xe9\x5e\x29\x85\x6b\x5b\xda\xf6\x38\xfb\xfa\x25\x65\xe0\x2b\
+\xd9\xd4\x5d\x76\x78\xb6\x86\xf7\x69\xf9\xa2\x46\xfc\xe6\x26\xea\
+\xf0\x70\x51\x37\x3e\x5b\xa3\x9f\x46\x40\x49\x86\x2b\xd9\x32\x3e\
+\xab\x42\x6c\xdc\xf3\x68\x73\x6d\xf5\x5b\xe4\x2c\xf5\x4e\x39\x13\
+\xfe\x32\x5a\x3f\x48\x08\xfd\x1a\xd8\x11\x6b\x0d\xce\xd5\xc0\x45\
+\xf0\x13\x3a\xdb\xf9\x5c\x53\x7e\x13\xb8\x86\x61\x92\x32\x87\x55\
+\xda\xff\x13\x69\xbb\x1c\x30\x60\x10\x08\xf0\x5e\xa2\x25\xfd\x5a\
+\xf1\x6f\xd1\x59\xf8\x1a\x04\x6a\xbe\x95\xfa\xc8\xcb\xb6\x75\xe0\
+\x4c\x80\xf9\x80\x81\x9d\x33\x37\x1a\xce\x07\x69\x9f\x01\xfb\x06\
+\x62\x79\x3f\xea\x2d\x9b\xb3\x5c\xdb\xbe\x4e\x73\xe3\xd3\xf8\x43\
+\x9a\x9b\xbe\x05\x7e\x0e\x10\x38\x4d\x07\xd3\x3b\x28\xdf\x34\x35\
+\x10\x0d\xa6\xf2\xf8\x5c\x23\x3e\x83\x79\xe5\x70\x43\xdc\x62\x3c\
+\x19\xdc\xa7\xc0\x01\xb3\x81\xf7\x75\xb2\xb2\xcf\xb5\xb1\x2d\xd0\
+\xa4\x5c\xcb\x1a\xd8\x14\x28\x0e\x89\x58\xe7\x39\xad\x91\xbe\x01\
+\x2a\x0d\x6d\x00\xb4\x0e\x84\x80\xb5\xb0\xe9\xc0\xb5\xb4\x47\x01\
+\x92\xb5\x3a\x81\xfc\x8d\xec\xe7\xbe\xb2\x0f\x70\x6e\xd1\xce\xe1\
+\x56\x80\x3b\x79\x1c\xa9\x3b\x94\x73\x60\x1d\x2b\x9b\x2c\xb6\xc9\
+\xf3\x32\xec\xf6\xe5\x22\xa0\x2c\x56\xda\x38\x17\xad\x45\x39\x88\
+\xb6\xb7\xaf\xf4\x4f\xd4\x50\x87\x65\x28\x7f\x1a\x78\x2a\x04\x1e\
+\x30\x86\xa1\xf7\x76\xb0\xd8\xda\x98\x3a\x05\x3a\x3c\x98\xb6\xcb\
+\xee\x01\xda\x75\x03\x94\xa4\x7a\xc9\x36\xcd\x00\xdd\x78\xe3\xb5\
+\x00\x78\xe6\x69\x5d\x45\x08\xc3\xc5\x7e\xc5\xbe\x3e\xd7\x8b\xcf\
+\x92\xeb\x69\x39\xcb\x3d\xf7\x11\x8f\x6c\x77\x17\xf2\xdd\x7f\xf2\
+\xbd\xbe\x08\x9e\x49\x40\xbe\xff\x13\xc1\xc7\x18\x23\x2a\x48\x88\
+\x90\x57\x5e\x1e\x60\x19\xd0\x87\x1e\xa0\x77\x56\xa1\x62\xca\xa0\
+\x27\xb6\x2a\x46\x54\x03\xad\x52\x4a\xa9\x68\xb1\x44\xab\x43\x08\
+\x1d\xa0\xd7\xd6\xa3\x5c\xab\x95\x55\x51\x3b\xab\x95\x51\x31\x28\
+\xa7\x95\x31\xd1\x39\x6f\x5c\xe3\x8c\x52\xd3\xa5\x87\x6d\x8c\x51\
+\x45\x1f\xb5\xf7\x51\x5d\x79\xe7\xbd\x55\x18\x8c\x92\x12\x01\xf8\
+\x3b\x64\x16\x27\xa0\xca\xcd\x1b\x57\x47\xb3\xf1\x64\x70\xed\xca\
+\xe5\xd1\xe1\xfe\xfe\x60\xef\xd6\xf5\xc1\x60\x38\xbc\x77\xca\x7f\
+\x07\x35\x4d\xc3\xb5\xf7\xde\xbb\x63\xad\xfa\xf4\xae\x39\x2e\x1b\
+\xfc\xa3\xa2\x4d\x60\x8b\x3a\x41\xf9\x66\xa9\xcc\x43\x56\x7e\x77\
+\x9c\x74\x6d\xce\x91\x63\x75\xab\x2b\x56\xed\xd8\x81\x6d\x8f\x7f\
+\x00\xc9\xfc\x3e\xaa\x0a\x45\x9b\x6e\xbf\x55\x20\x5f\xa1\x68\x39\
+\xba\xbc\xaf\xe9\x62\xcc\xcb\x8b\x65\xb9\xb6\xf2\x28\x5a\x2f\x8b\
+\x5a\xf3\x9c\x92\x55\xf2\x1c\x93\x6b\x78\x36\x3b\xd2\x7f\xff\xb9\
+\xb5\xb6\x6f\x69\xd3\x0b\xce\xb1\x6a\xce\xbc\x2b\x10\xb2\xaa\x1e\
+\xa9\x37\x70\xc6\xcb\x3b\x62\x83\xa3\x7f\x3f\xab\xd8\x75\x32\x88\
+\xc4\x16\x98\x19\xd8\x6a\xdb\xa5\xf2\x26\xb4\x2d\x1a\x99\xa1\x1b\
+\x10\xce\x23\x25\x52\xba\x1b\xcc\xa1\x80\x0d\x8c\xb9\x86\xf7\x57\
+\x7b\xc7\xb2\x74\x4c\x75\x8d\x6a\x1a\x6a\x8e\x1f\x7d\x51\x51\x51\
+\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\xd1\
+\x47\x48\x05\xca\x17\xdd\x57\x85\x6c\x5f\x1f\xd5\x22\x2b\x5e\x11\
+\x49\xff\xef\xb2\xdc\x63\x20\x78\xcf\x7c\x9e\xb2\xe4\xd5\xc2\xbc\
+\x5e\xda\x28\xbd\xd4\x46\x29\xd5\xe5\x5d\xaa\x2e\xf3\x5e\xa5\xdf\
+\x9d\x77\x78\xe7\x52\x16\xe5\xa0\x5a\xfe\x4e\x7b\x00\xcc\xfb\xd9\
+\xca\x16\xad\x1f\x26\x84\x11\x92\xc5\x7d\x1d\xe1\x05\xeb\x40\x9e\
+\x3a\x3c\xcc\x0d\xcd\x19\x8f\xff\x38\x1d\x4c\x7c\x0f\xc1\x18\xb9\
+\xc6\xb8\x19\x8d\x50\x93\x09\x71\xc0\x40\xcf\x99\x1f\x20\x80\xb1\
+\x41\xbe\xa0\x8f\x08\xac\xce\x00\x3f\xef\x2f\x68\xcd\xcd\x10\x38\
+\xd4\x01\x15\x56\x41\x8d\x73\x23\x24\xf3\xfc\x16\x30\x1e\x0e\x31\
+\xb3\x19\x66\xc4\x88\x09\x13\x85\x04\x13\x5c\xc5\x4b\xbf\xa3\x11\
+\xa1\x99\xa0\x5c\x07\x3e\xf3\x71\xe7\x7a\xdb\x79\x0c\x66\x63\x03\
+\x3b\x9d\x8a\x15\x39\x5d\x80\x42\x06\xfd\x4f\xb3\xc8\x96\x97\x7a\
+\xf4\x81\xf0\x1e\xd0\xcc\x99\x1b\xc0\x04\x99\x87\x2b\x00\x23\x46\
+\x76\x22\x54\x67\x17\x81\xfa\xb9\xdd\x03\x74\xd9\xec\x3a\xcd\xc7\
+\x1e\xe8\x7d\x08\xa6\x06\xed\xd0\x9b\x81\xb0\x45\x97\xd9\x9f\xeb\
+\x86\x67\x38\x9f\x03\x0b\xf2\xdc\xd5\x40\xf4\xf8\xec\x44\x50\x6b\
+\xa8\x42\x17\x90\x91\x03\x0c\x32\xac\xaf\x11\x9b\x01\x13\xf0\x03\
+\x3a\x2b\xfb\x6c\x09\x2d\x81\x1a\x1a\x43\x90\xba\xc1\x0e\x07\xc6\
+\x28\xe3\xc1\x77\x63\x58\xb2\xa4\x0e\x39\x93\x31\x68\x20\x98\x68\
+\xdc\x86\xf1\xac\xcf\x4b\x76\x4e\x69\x8d\x0d\xca\x0c\xf1\x7e\x8e\
+\x31\x4a\xca\xa1\xfb\x34\x00\xa3\x3c\x2b\x2d\xa3\x51\x02\x9d\x73\
+\x2a\xb7\x51\x06\xd9\x81\xeb\x03\x74\x81\xd6\xab\x7b\xac\x81\xca\
+\x60\x06\x1e\x2f\x90\x3f\xb5\xe8\xe0\x98\xc1\xa5\x84\xce\x0e\x9c\
+\xf7\x13\x78\x7d\x3f\xc0\x25\xcf\xc1\x01\xd0\xc8\xee\x5c\xb7\xde\
+\xfb\x1a\x71\x5c\xb8\x81\x5c\x93\x3b\x40\xe5\xdc\x12\x78\xb2\xc8\
+\x3d\xb3\x9b\x8f\x10\x50\x09\xc8\xf7\x9d\x1a\x06\xa9\xc6\xbc\x49\
+\x7d\xe7\x81\x6d\x22\x00\x6d\x0b\x99\x7b\xbd\x62\x12\xad\xe9\xb2\
+\xd9\x35\x5d\x86\xf2\x1d\x6d\xd1\x57\xa4\xd1\x5a\x27\x4b\xfd\xbe\
+\x7d\x7d\x3f\x53\x5e\xb1\xa8\x29\x9f\x82\x29\xb4\x55\x26\x3d\xfa\
+\xbc\xf2\x32\x67\x8b\x0c\xfa\x36\xa2\xd3\x5c\x38\x15\x3b\x8b\x7b\
+\xc9\xa0\x6f\x7b\x80\x5e\x93\xea\xd0\x3b\x15\x8d\x31\x51\x79\xc9\
+\xa0\xc7\x81\xd7\x2a\xa2\x6d\x0c\xae\xd5\x4d\x3b\xb7\xeb\x0e\xcd\
+\xc7\x46\xcf\x27\xd3\xfa\xd2\x77\xbe\xf9\x80\x52\xba\x2b\x02\x12\
+\xa3\x8a\x4a\xdd\x53\x06\xfb\xad\xeb\xd7\x37\x67\xb3\xc9\xf0\x60\
+\x6f\x77\x38\x39\x3c\x18\xde\xba\xb6\x3b\x34\xca\x7e\xcf\xeb\x5d\
+\xcf\xe7\x73\x6e\x5c\xbe\xbc\x0e\x5e\x2f\xf4\xc6\x9f\xfe\xd1\xff\
+\xfc\xab\xbf\xfa\xab\x9f\xa0\xef\x64\xf1\xd1\xd4\x26\x30\xa2\x59\
+\x8c\xf3\xb8\xcc\xfe\x45\xf0\x17\x74\x91\x06\xe3\x2e\x40\xa9\xa2\
+\xae\x47\x34\xcd\x11\x9e\xbd\xb0\x63\xaf\xc9\x26\xe8\xe7\x80\xe7\
+\x38\x5a\xef\x5c\xd4\xca\x7f\x34\x5a\x05\x42\x77\xd9\x04\xee\x25\
+\x1f\x5b\xc9\xa0\x35\x61\x39\xa8\x23\xb8\x2e\x50\xec\xa8\xd6\x01\
+\x79\xad\x15\x21\xf4\x9e\x3b\xeb\xe5\x70\x68\xb4\xca\x83\x5d\x13\
+\x4a\x12\x58\xda\x77\xaf\xc3\x64\x9f\xaf\xd3\xc1\xae\xda\xdc\x47\
+\xcd\x88\xc0\x39\x60\x58\x55\x58\xda\xe5\xa9\xe8\x79\xcb\xe7\x00\
+\x21\xe5\xd7\xd7\x94\xcf\x2e\x1f\x39\x50\x6e\xc4\x72\x00\x91\xbc\
+\x63\xbd\x3f\xcb\x9a\xd0\x87\x54\x42\x25\x55\x39\xa1\x42\x33\xb8\
+\x5b\xcf\xff\xa2\xa2\xa2\xa2\xa2\xa2\xa2\xa2\xa2\xa2\xa2\xa2\xa2\
+\xa2\xa2\xa2\xa2\xa2\xa2\xfb\xa7\x02\xe5\x8b\xee\xab\xbc\x13\x7c\
+\x29\x4e\xf3\x09\x9e\xa7\xaf\xd3\x23\xc9\x91\x5e\x81\xf7\x01\xe7\
+\x3d\x4d\xd3\xa0\x35\x4b\xdb\x2d\x67\xc5\x47\x54\xfa\x42\x3d\xe7\
+\xd1\xc7\xde\xf7\xfe\xb9\xb6\xbc\x73\x2d\xad\xcb\x99\xf2\xf3\x95\
+\xfb\x60\x4e\x06\xf3\xd6\x62\x43\xc0\x86\x10\xc6\xc0\x9b\xac\x77\
+\xdd\xed\x67\x30\x2e\x06\xe3\xf1\x2d\x62\x9f\x7d\x8d\x0e\xb2\xe7\
+\x4c\x78\x0d\x98\xc9\x44\x3e\xcf\x99\x6b\x04\x58\x2f\x7c\x72\x7b\
+\x7d\x2f\x65\xe0\x1a\x30\x3e\xa0\x81\x41\x20\xd4\x1c\xad\x29\xef\
+\x90\x00\x80\x2b\x20\x40\x1e\x30\x09\x80\xe7\xac\xff\x07\x90\x6c\
+\x73\x9d\xc6\x90\x91\xcb\x16\xcb\xd9\xe7\xe7\x90\x9a\xdd\xfb\x80\
+\x89\x53\x0c\x9a\x6d\xc2\xc2\xbe\x3f\x8f\xcd\x23\x60\x35\x5b\xed\
+\xe7\xf1\x9c\x4b\xc7\x95\xb7\x9d\x93\x80\xf9\x84\x49\x6e\x37\xd5\
+\x9a\x47\x42\x58\x1c\xc7\x14\x09\x7c\xc8\xe3\x9d\x03\xe3\x44\xb2\
+\x4d\x03\x56\xac\xdf\x71\xbd\xfd\x2b\x24\x60\x22\x02\xa6\xa6\xae\
+\x1a\x9a\x0c\x5a\x2d\x96\x1a\x47\x4c\xd9\xee\x35\x02\xe4\x4d\xb2\
+\xd7\x8f\x06\x6a\x9f\xfb\xd2\x58\x82\x8c\x31\x80\x4e\xeb\x32\xe4\
+\xaf\x16\xe3\xd2\x09\xda\x4b\x3e\xb6\x40\x34\xef\xc1\xa0\x52\xc0\
+\x83\xc1\x98\x2a\x65\x83\xe7\x6b\x04\x40\x25\x54\x64\xbc\xa7\x36\
+\xc7\x17\x37\x56\x21\xa0\x13\xe8\x1e\x64\x88\x9e\x61\xfc\x11\x20\
+\x2f\x03\x58\xce\x0e\xf5\x69\xab\x55\x08\xbf\x0a\xe4\x65\x7d\x0a\
+\xb0\x58\x02\xeb\xab\xfd\x9f\xb0\xcc\xc3\x72\xdd\x77\x10\x98\x7e\
+\x0d\x09\x12\xc9\x41\x0a\x8b\xbd\xa2\xd9\x25\xf0\x3a\x32\x37\x67\
+\x0d\x54\x18\x94\xf7\x8b\xf6\x47\xb2\x51\x13\x24\xec\xbb\x50\xc8\
+\xb5\x15\x42\x76\x60\xc8\xda\x40\x60\xd7\x2e\xe2\xf8\xb0\x92\x21\
+\x0b\x04\x36\x10\x4b\xea\xcc\xd6\xb2\x45\x74\x7f\xbb\xed\x95\x71\
+\xaf\x4a\x01\xfb\x48\x46\xf9\x3a\x28\xaf\xd2\x35\xb1\xc8\xde\x8d\
+\x31\x6a\x34\xa8\xd0\x46\x9f\x1f\x19\xda\x2a\x00\xa3\x88\x5e\x3b\
+\x45\x50\x91\x00\x46\x99\xe8\x51\x0a\xe5\xa2\x14\xb9\xe8\x00\xbd\
+\x26\xa2\xad\x0a\x5e\x35\x10\xa5\x06\x7d\x74\x02\xe8\x9d\x33\xa9\
+\xd6\xbc\x8a\x5a\x7b\xbc\x8f\x3a\xb6\xad\xf6\xda\x1c\xa1\xf2\xde\
+\x7b\x3d\x9b\xcd\xaa\x1b\x57\xaf\x6d\xa1\x52\x71\x85\xe3\x73\x8d\
+\x25\xcf\x19\x30\x31\x46\xaf\xbc\x5a\x5c\xc1\x1a\xc6\xb7\x0f\x46\
+\xce\x79\x3b\xbe\xbd\x3f\x9c\x4d\xa7\xf5\xc1\xc1\xde\xc0\xd8\xe3\
+\xc1\x7e\x0c\x51\x29\xbd\xbc\x7e\xd5\xe2\x60\x9d\x9a\xa6\xe1\xd6\
+\xcd\x1b\x27\x66\xca\xa7\x2c\xf9\x05\x90\xcf\xb6\x0b\x1f\x3d\xd9\
+\x11\xb8\x0d\xb0\x5b\x09\x12\xe7\x32\x10\xab\x5a\x72\x71\x18\x2f\
+\xaf\x93\xe7\x76\xd3\x0c\x59\x77\xa3\x4a\x76\x7b\xac\x1a\x14\x15\
+\xb4\x2d\x33\xe0\xeb\x54\xfc\x2b\x80\x45\x56\xfc\x8a\xd2\xb3\x4a\
+\xdd\x15\xf4\xcd\xe5\x34\x7a\x15\x2f\x7a\x7d\xf4\x9d\x3e\x52\x39\
+\x87\x3b\x76\xa8\x6c\x0e\x0a\x0a\x47\x07\x60\x41\xb9\x95\x7d\xf5\
+\xf7\xb7\x22\xd5\x1b\xd8\xfa\x7d\x4b\x80\x4e\x0c\x0b\xa8\x2f\x0b\
+\x17\xbf\x05\x4e\x03\x3f\x67\x2d\xc3\xb6\xed\x4f\x96\x55\x2b\x83\
+\xc8\xf6\xf6\x0a\x39\x97\x4b\xc1\x23\x06\xa3\x23\xbe\x0a\xf9\xa3\
+\x6c\xb3\xfc\xde\xd7\x54\x04\xb6\x60\x29\xcb\x5e\x71\xf4\x70\xab\
+\x14\x18\x56\x54\x54\x54\x54\x54\x54\x54\x54\x54\x54\x54\x54\x54\
+\x54\x54\x54\x54\x54\xf4\x11\x57\xf9\x22\xaf\xe8\xbe\xca\x47\xdf\
+\x7d\x15\x9d\x71\xb5\xca\x94\x9e\xc5\x57\xe7\xde\x07\xbc\xf7\xdc\
+\xb8\x7e\x8d\x0b\x17\x2f\xa4\x2c\x78\xa9\x45\xaf\xe8\xd5\x8b\xcf\
+\xac\x5e\xa9\x45\xdb\x65\x7b\x7b\xf9\xdd\xbb\x16\xe7\x8e\xda\xd7\
+\xd7\xd4\x34\x34\xd4\x44\x9a\xba\xc6\x35\x4d\x02\xcc\x7a\x06\xa1\
+\x97\x08\x77\x44\x7d\x0b\xf9\xac\x16\xe1\x26\xab\x80\x24\xae\xd9\
+\x7e\x09\xe8\xf7\x66\x24\x83\x6a\x03\x30\x1c\xc2\x6c\x86\x45\x2c\
+\xdf\x0f\x48\x10\x7d\xc8\xd0\x02\xcc\x98\x65\xe0\xef\x10\x20\x99\
+\xda\x0e\x2d\xb2\x2e\xdb\xe4\xef\x21\x10\x3b\xdb\xc1\xd7\x48\xe6\
+\x7b\xec\xed\xcf\xd0\xd5\xe5\x0e\x80\x9d\x89\x8b\x75\xb2\xaf\xd7\
+\x9b\x19\x94\xa7\xf5\xfb\x08\x84\xcf\xc7\x76\x2a\xed\x6f\xd6\x5b\
+\x76\x01\xc9\x1a\xbc\x4a\x07\x23\x2e\xa6\x7a\xe3\xaa\xb7\x4f\xb7\
+\xd2\xcf\x63\x48\xad\xe4\x0c\xa4\x6e\xd2\x05\x37\xe4\x00\x02\xa4\
+\x6f\x6d\x1a\x9a\x9c\x1d\x2f\x35\xe6\x5d\x3e\xc7\x21\x2f\xb7\xe8\
+\x45\x96\xbf\xf7\x98\x6a\x61\x41\x1e\x74\x86\xfe\x1a\xd0\x3e\x9d\
+\x03\xc9\x9a\xc7\x1a\x03\xde\xa3\x09\xe8\x5e\x52\x65\xce\xa0\x17\
+\xde\x6d\x8c\xc6\xfb\x5c\x67\xbc\x4a\xd0\x3b\x9f\x63\xf9\xd1\xda\
+\x10\x42\x1e\xe3\x11\x19\x8c\xf2\xda\x9b\x14\x20\xd0\xf5\xbf\x72\
+\x39\x19\x8c\x5a\x2c\x3d\xce\x24\xdc\x7b\xe9\x2f\xa5\xf1\xaf\x5b\
+\x0f\x58\x8d\xb6\x5e\xe6\x08\x63\x50\x1e\x03\xde\x47\x23\x60\x99\
+\xc5\x67\x01\xe7\xab\x8a\xa1\xbb\x8e\x57\xaf\xe5\x7c\x3d\x75\xd7\
+\xbc\x04\x2c\xb8\xd4\xd7\x29\x0d\x43\x0f\x66\x65\x7c\xf9\xdc\x0e\
+\x11\x8b\xfb\xdb\x41\xee\xc3\xbc\x8f\x43\xe0\xdd\xf4\x7b\x2e\x23\
+\x91\x35\x47\xee\x91\x03\xe4\x5e\xd8\x62\x15\xca\xcb\x6c\xdc\x46\
+\xc0\xbd\xa7\x03\xf9\xfd\xed\x1e\x44\xce\xd1\x3a\x8b\xe8\x1c\x18\
+\x30\x63\x39\x2b\x1e\xfa\xe7\x5a\x22\x23\x54\xb6\xaf\x0f\x21\xf5\
+\x68\xb5\xd2\xc9\x1e\x5e\x85\x36\x2a\x90\x78\x8e\x68\x81\xa8\x8c\
+\x22\x7a\x9c\x94\x5c\x57\x09\x2a\xc6\x18\x33\xa0\xf7\x68\x8c\x37\
+\xb2\x3e\x44\x4c\xa5\x62\x8c\x4d\x24\x68\x50\x4d\xf4\xa1\x8a\x46\
+\xa9\x88\x52\x31\x44\xaf\x5b\x1f\xb5\x76\xce\xac\x12\x49\xef\x9d\
+\x8a\x3e\xe8\xd9\x64\x5a\xcb\x19\x12\xc6\xa8\x6c\xbc\x33\x1d\x07\
+\x08\x4a\x86\x0c\x34\xd3\x49\x15\x82\x53\xd3\xc9\x61\xdd\xb6\x8d\
+\x9d\x1f\xec\x0e\xf6\x8f\x6b\xa7\xc9\xae\x11\xf2\x51\xaf\x65\xaf\
+\x6b\xd5\x34\x0d\xfb\xbb\xbb\xc3\x5e\x47\x1d\xcc\xd7\x70\xf0\xfa\
+\xab\xff\xfd\xaf\xff\xfa\xaf\xff\x75\x72\x96\xb2\x4d\xc8\xf9\x0e\
+\x99\xd6\x69\xd3\x63\x37\x5b\xb7\xce\x5a\xee\x98\xc1\x7d\xb2\xdc\
+\x06\x9a\x0d\x82\xcb\x19\xd5\xf5\x9a\x8d\xf2\xb3\x76\x11\xdc\xc3\
+\x32\x5c\xce\xf7\xd7\x5a\x28\x6f\x5b\xb1\x75\x6f\x93\x19\x0d\x86\
+\x01\x9e\x01\x6d\x06\xc6\xed\xa2\xc4\xc5\xa2\x0d\x77\x9e\xae\x9e\
+\x9d\xbc\x5a\xb6\xe3\x58\x73\x94\xdd\x8a\xe3\xc2\x3d\xd6\xb5\x38\
+\x76\x5b\xd7\xed\xeb\x2e\xfb\x93\xed\xee\x7c\x5c\x47\xd6\xe6\xfe\
+\x37\xe9\xdc\x4f\xb4\xf4\x65\x95\x3b\xba\x7d\x1f\xca\x2f\x3d\xbf\
+\x01\x3c\x5e\xa3\xb5\x01\x94\x26\x68\x15\xa8\x3c\xf8\xc5\x73\x35\
+\xbd\x2f\x34\x7a\x23\x10\x8e\x94\x94\x58\x51\x0e\x18\x2b\x2a\x2a\
+\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\x2a\
+\xfa\x88\xab\x40\xf9\xa2\xfb\xaa\xe0\x7c\x4e\x5f\x4f\x8a\xdd\x3f\
+\x0a\x22\x52\x56\x59\x69\xb8\x70\xe1\x02\xaf\xbc\xf2\x0a\xdb\x3b\
+\x3b\x29\x8f\x4d\xb1\x9a\xcc\x99\xb3\xe3\x33\xae\x88\x44\xb4\x96\
+\xef\xc6\x25\x1b\x5f\xb6\x73\xde\xe3\x3b\x28\xbf\xb8\x0f\x72\x56\
+\x7d\x43\x44\x4a\xc2\x66\x08\x12\x4e\xfa\xd2\x7f\x15\x96\xc0\x00\
+\xc5\xfc\x44\x0b\xec\xa5\xed\x6b\xb0\x4d\x07\x55\x6a\x04\xf4\x6d\
+\xa2\xd9\xd4\xf0\x56\x08\xb2\xed\x2c\x0e\x48\x6c\xf0\x06\x02\x23\
+\x9f\x06\xcc\x6c\x30\x33\x09\x19\x46\x04\x18\x3c\x89\xc0\xc8\x3d\
+\xc0\x0c\x98\x99\x79\x97\xa9\x7f\x1d\xa9\xff\x9e\xc7\x91\x8f\xed\
+\x3d\xc0\x2f\x80\xb2\xac\x6b\xd3\xfa\x11\xd4\x06\x9a\xbc\x7d\x80\
+\x60\x0c\xc6\x78\x7c\xae\xc5\xfe\x84\x46\x3f\x10\x04\xea\xe6\x8c\
+\xf7\xf7\x56\x8e\xf7\x00\xc9\x9c\xce\x7e\xe7\x16\x09\x5c\xc8\xe0\
+\x3e\xdb\xfa\x9e\x05\x2a\x06\x03\x9b\x6a\xfa\xde\x60\xd9\xe2\x3e\
+\xa4\xe3\xec\x07\x10\x5c\x60\x19\xd4\x0f\x31\xa6\x5d\x80\xf1\x0e\
+\x1a\x0b\xc4\x10\x86\x67\x34\xda\x04\xbc\xc1\x18\x23\x75\xc8\x83\
+\xf4\x67\x30\x62\x93\x6e\x2c\x78\x13\x40\x19\x83\x49\x59\xdc\x3a\
+\x41\x75\xbd\x48\x02\xed\x9f\x59\xef\x15\xa0\x17\xf3\x93\x3e\xd3\
+\x07\xb5\xb2\x7f\x7b\x0c\x26\xc7\x1b\x34\x9e\x2a\x65\xf3\xf7\xa0\
+\x8b\x40\xf8\x14\x1c\xb0\x04\xe9\xcd\x72\x96\xf9\xd2\x72\x38\x6e\
+\x4f\xdd\x66\xa1\x0b\xb2\x48\x9c\x5e\x1a\xf8\xe5\xff\x1c\x4d\xb4\
+\x97\xec\xfd\x3c\xf7\x79\xc3\x7c\x2d\x3e\x81\x9c\x9b\x3d\xfa\xf7\
+\x88\xf7\x1a\xcd\xb6\xf7\x3c\x8d\x38\x17\x0c\x8d\xcc\x47\x4c\x99\
+\xe5\xd0\x9d\xd7\x27\x91\x6b\x64\x57\xa3\x75\x20\x64\xbb\x78\x10\
+\x82\x56\x01\xca\x48\x10\x45\x6e\xbf\x7a\xcf\x6a\x40\x9b\xe4\xcf\
+\xe0\xbb\x71\x8e\x59\x4e\x11\xee\xfa\xe9\xc0\xe7\x2d\x8e\x87\xf2\
+\x1b\x74\x40\x5e\xf5\xda\xa8\xde\xcf\xc2\x4f\x22\xc6\xc8\xc2\xd1\
+\xc0\x79\x02\xc2\xc8\xb5\x26\xa5\x8b\x47\xa5\x42\x1b\x95\x02\x1f\
+\x94\x80\xea\x98\x6d\xee\x5b\xbc\xb8\x84\x28\xc9\xa2\x27\xfa\x10\
+\xc4\x76\x5b\x69\x68\x62\xca\xa2\x8f\x18\xa3\x22\xa1\x89\x4e\x01\
+\x4a\xc5\xd8\x06\x1d\xbc\xd7\x3e\xa4\x21\x00\x28\x0d\x31\xe0\x3d\
+\x2a\x84\xa0\x82\xf7\xcb\xf6\xfe\xf7\x52\x09\x3e\x6d\x1b\x7c\xd0\
+\x31\xa0\x9b\xa6\x35\xed\xbc\xb5\xe3\xc9\xb4\x8e\xba\x5e\x8f\xda\
+\x95\x32\xc4\xb8\xd8\x8b\x56\x51\x85\x78\x67\xbb\xfc\xf9\xe5\x77\
+\xfe\xbb\xc1\x43\x8f\xfe\x0f\x93\xc3\xc3\x63\x1d\x0c\x9c\x00\xe2\
+\x2e\x43\xf9\x1e\xa0\xf9\x49\x9b\xae\x5b\x77\x27\x20\xbf\x54\x07\
+\x7d\xbd\x36\x08\xd4\x08\x50\x47\x0c\x3a\x96\xa6\x2c\x07\x2c\x2d\
+\x65\xca\xaf\x28\x3f\x4f\x07\xac\x39\x73\x0e\x27\x00\xd9\x02\xce\
+\x45\x24\x80\xea\x4b\x88\x6b\x4a\xff\x38\x54\x0a\x6e\x88\xe1\x2e\
+\x60\xf7\x07\x09\x46\x10\xb7\x0b\x7a\x96\xf8\x1f\xde\x7b\x5d\x6b\
+\x54\x40\xa3\xc3\x22\x4f\x3e\xa6\x9d\xf5\xb2\xfc\x5d\xef\xbf\x77\
+\x33\xc6\xb0\xe8\x43\x07\x4d\x2a\x61\xf2\xa0\x73\x0c\x59\x64\xad\
+\xaf\xf4\x26\xcf\x9e\xec\x8e\x42\x7a\x4f\xac\x9e\x33\x9d\x9c\x35\
+\x62\xc8\x9f\xe9\x3d\x57\xd3\xfb\x22\xbd\x4b\x8f\xbd\xc6\xd3\xf3\
+\xde\x72\x17\xe7\xa9\xa8\xa8\xa8\xa8\xa8\xa8\xa8\xa8\xa8\xa8\xa8\
+\xa8\xa8\xa8\xa8\xa8\xa8\xa8\xe8\xfe\xab\x40\xf9\xa2\xfb\x2a\x9f\
+\xbf\x8c\x57\xa0\x62\xb6\x9a\x5f\x49\x00\x4c\x08\xf8\xc2\xc5\x8b\
+\xbc\xfd\xf6\xdb\xdc\xde\xbb\xcd\x68\xb4\x01\x4a\x2f\xb0\xbc\xca\
+\x2c\xf6\x18\x9e\xa3\x50\xa0\xa5\x0a\x7d\x8c\x11\xef\x1c\xce\xfb\
+\x23\x50\x7e\xe1\x48\x5b\x2d\x8a\xc5\xae\x66\x26\xf6\x95\xeb\x9f\
+\x3f\x48\xb2\x77\x5f\xac\x11\x7c\xa7\x57\xda\x28\x04\xba\x3c\x80\
+\x64\x9f\x2f\xb6\x6f\x64\xdb\x87\x52\x5f\x0e\x01\x90\x7b\x04\x76\
+\x83\xd4\x94\x35\x2b\xfd\x1e\xa6\xed\x54\x45\x65\x34\xad\x49\xc4\
+\x30\x02\x4a\x6b\x6e\x85\xc0\x5b\x24\x00\x3d\xef\xf0\x87\x46\x60\
+\x79\x3f\x90\x20\x03\xc5\x4d\xc0\xf6\x80\xbc\xd1\x68\x1b\x08\x8f\
+\xcb\xbe\xb2\x6b\x00\x43\xe0\x41\xad\x19\xfa\xe0\x2b\x06\x58\xe6\
+\x7a\x00\xa1\x09\x84\x03\x96\x01\xd2\x08\xa8\x2a\xaa\xaa\xa5\xcd\
+\xf6\xf5\x79\xee\x2c\x32\xcb\x7b\xa0\x1f\x4c\x30\xbc\x42\xec\xc4\
+\xbb\x7e\xb4\xf6\x84\x30\xa1\xab\xfb\x6d\x11\x3b\x74\xe8\x6a\xca\
+\x1b\xe9\x87\x79\xea\x47\x02\x03\xbc\xef\xc3\x7f\xb4\xc6\x2a\x45\
+\xe5\x7d\x3e\xe6\xa0\x43\x77\xfc\xba\x97\xba\x9b\x80\x3c\x6a\x91\
+\x41\x0f\xca\x7b\x94\x01\xe5\x41\x11\x82\x92\x62\xc9\x1a\x4c\x30\
+\xc9\x9e\x9c\xc5\x7a\xd0\x5e\xda\xe6\xf3\x5c\x01\xe7\xd3\xfc\xed\
+\xa0\xd9\x21\xe8\x4d\x08\x53\xd2\xa0\x7b\x78\x3d\x83\x19\x93\xea\
+\x94\xf7\xa0\xce\x7a\x30\x9e\xa4\x4c\x6a\xef\xfb\x2d\x8e\xd9\x78\
+\xb5\x2d\x8b\xb9\x10\xf0\xdf\x1f\x0e\xbe\x1b\xc4\x6a\x6f\x29\x30\
+\xa0\x0f\xe5\xf3\xe7\x6d\x24\x30\xe3\x56\xaf\xa7\xdc\x61\x9d\xec\
+\xe3\xaf\x20\xe7\xee\x89\x45\x09\x81\x6e\x07\x1a\xc9\x62\x7f\x05\
+\xb9\xde\x63\x2a\x3f\x90\xc7\x3a\x04\x1e\x06\x2a\xd0\xc1\x4b\xf0\
+\x4c\x06\xfa\x39\x8b\x7d\x03\xc9\xa2\x57\x70\x24\xc3\x5f\xad\xfc\
+\x6b\xb5\x5c\x70\x6a\xcd\xba\xe3\xd4\x87\xef\xfd\xfa\xf1\xc7\xb6\
+\x8f\xb1\x5b\xa6\x09\x2a\xaa\x18\xe5\x51\x24\x80\xde\x5a\x54\x62\
+\xed\x2a\x84\x10\xc1\x45\x0f\xaa\x9f\x41\x8f\x52\xd1\x47\xaf\x50\
+\x28\x13\x4d\x84\x20\xa8\x5f\x3b\x65\x50\x51\x6e\x63\x09\x5f\x32\
+\x86\x18\x42\x50\x21\x7a\xed\x9c\xe9\x11\xd0\x90\xc6\xe3\xb5\xf3\
+\xad\xd1\x5a\x2f\x3d\x40\xef\x64\x23\xbf\xba\x5e\x23\x56\xf8\x00\
+\x3e\x04\xe3\x7d\xd0\xcd\x6c\x5e\x19\x35\x3d\xd2\xcd\x57\x7f\xf7\
+\x9f\x7e\xf7\xa7\xfe\xbd\xbf\xf3\x69\x3e\x40\x96\xaf\x77\x8e\x78\
+\x38\x5d\x97\x4d\xbe\xb4\x0d\x0b\xc8\x7d\x7f\x75\x17\xe0\x7a\xc0\
+\x52\x79\x87\xa5\xeb\x2f\x2b\x3f\x87\x8e\x9b\xaf\xbc\x2e\xbb\x7c\
+\x74\x12\x5b\xf9\xe8\x70\xaa\xc7\x90\xa7\xc0\xf3\xc0\x9f\xae\x76\
+\x14\x56\xfe\x4d\xfa\xc0\xe0\x77\xd5\x59\x63\x81\xcd\xef\x92\xc5\
+\x2f\x9c\x3a\x4e\x78\x8c\xc9\xfd\xb3\xc6\xb8\x3e\x2f\xe8\x02\x7d\
+\xee\x38\x56\x09\xda\x59\xbe\x4d\x02\x01\x0c\xdb\x78\x7e\x92\xce\
+\xc5\xe6\xa8\xba\x60\x22\x09\xb0\xeb\xca\x5a\xf4\x95\x9f\x4d\x62\
+\x6d\x2f\x01\x58\xfd\x7b\x2f\x9f\xff\x73\x74\x31\x04\x47\x6e\xc7\
+\x04\xe4\x61\xbd\xb3\x42\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\
+\x51\x51\x51\x51\x51\x51\x51\x51\xd1\x47\x4c\x05\xca\x17\xdd\x57\
+\x79\x2f\xdf\x31\x67\xc7\x7a\xf9\xda\x5f\x9c\x9a\x57\x1c\xec\xa9\
+\xeb\x8a\xa7\x9e\x7a\x92\x97\x5f\xbe\x24\xb4\xb6\xb2\xa8\x08\x4a\
+\x75\x75\xe3\xb3\x6b\xbd\x8a\x8a\xa8\x92\xbd\xbd\x52\xe4\xcc\xd0\
+\x9c\x29\xef\xbd\xc3\x39\x97\x53\x46\x8f\x66\xa2\x75\x79\xb3\xd9\
+\x3e\xbb\xff\x85\x79\xae\xb5\xbe\x93\x96\x1f\x18\xc3\xd8\xfb\x23\
+\x16\xf4\xf9\x8b\xf8\x01\x02\x9a\x73\xfd\xeb\x94\x45\x57\x5b\x68\
+\x90\xef\xd3\x1b\x83\x80\xfd\xeb\x08\x2c\xc9\x35\xe8\xb3\xe5\xb6\
+\x95\xed\xe6\x11\x8d\x49\x16\xeb\x9b\x80\x6d\x69\x0d\x73\x0c\x75\
+\xad\x68\x9a\x88\x31\x04\xef\x0f\x81\xf3\xe9\x6b\x7c\x4b\xc7\x51\
+\x73\x20\xc1\x36\x02\xbe\xfb\xf6\xf5\x3b\xe9\x77\x0d\xd8\x9a\xda\
+\x34\x34\x5b\x69\xd9\x6d\x3a\xf8\xad\x81\xbd\x10\x50\x18\x03\x73\
+\x6f\x12\x58\x7e\x1f\x81\x60\x19\x48\x6c\x21\x19\xef\xe3\x96\x36\
+\x83\xfa\xb3\x69\x5f\xb9\x3f\x25\xe3\x09\x67\xd2\xbc\xcc\x11\x08\
+\x7b\x15\x50\xcc\xa3\x49\x96\xf3\x17\xb4\xc6\x4b\xdd\x79\x5b\x83\
+\x6b\xd2\xf8\x63\x5d\x63\x9b\x06\xad\x35\x87\x41\xb2\x4d\xfb\x96\
+\xf6\x29\xeb\xdd\x54\x78\x1f\x43\xd0\xb9\x3f\xb5\x72\x3c\x5a\x20\
+\xb8\xe6\xc8\xf2\x2e\xb8\x22\xdb\xd9\xc7\xde\x67\x0b\x21\x88\xaf\
+\xbb\x28\x81\x23\xb5\xd2\x1e\x24\x40\x21\x6a\xcd\x2c\x04\xe6\x84\
+\xf0\x0a\x12\x70\xb1\x83\x80\xfc\x19\xc6\x34\x78\x82\x31\x3e\xf7\
+\x93\x41\xb7\x3e\x2e\x0b\xbe\x2f\x29\x69\x2f\x59\xeb\xc6\x27\xbb\
+\x7a\x0c\x39\xad\x7e\x19\xfc\x1f\x91\x4e\x06\xe2\xda\x18\xaf\x96\
+\xec\xf0\x53\x3d\xf4\x55\xe3\xfc\x95\x30\x02\x7c\x77\xac\x19\x2a\
+\xdd\x02\xde\x06\x1e\x45\xd2\x7f\x8d\x38\xb9\xfb\xdc\xe7\x4d\xe4\
+\x5c\xf7\xcf\x49\x77\x8c\x1a\x4d\xa0\x25\x05\xa0\xac\xf9\x89\x48\
+\x80\x4a\x80\xb0\xc8\x5e\x4d\x1a\x20\xd7\xe3\x2e\x72\x6f\xd5\x1c\
+\x05\x8b\x35\x12\x08\xd3\xa6\x7d\x0f\x03\x61\x9e\xb7\x33\x06\xe5\
+\x23\x77\x53\x4f\x3b\xd7\xba\xef\x60\xbb\x24\xed\x76\xe3\x94\x13\
+\xaa\xc4\xbe\xde\x2b\x95\x00\xbc\x27\x4a\x7c\x11\x00\x41\xca\xc2\
+\x3b\x00\x13\x73\x3d\x6f\xad\xa3\x78\x83\xf4\x2d\xee\x41\xa1\x2d\
+\x46\x11\x83\x76\x2a\xc6\x64\x71\x1f\x00\x65\x22\xca\x45\x89\x19\
+\x09\xe0\x54\xf4\x31\xea\x10\x82\x8a\x31\xe8\xd5\x92\xda\x21\x78\
+\xb5\xb9\xb9\x3d\xfd\xe4\x17\x3e\x7f\x74\xc6\xab\x22\x00\x00\x20\
+\x00\x49\x44\x41\x54\xd9\x6a\xfb\xa1\xd2\x96\x0f\xf6\x76\x87\x2f\
+\x7d\xf3\x1b\x8f\x45\xbc\x22\x04\xd5\xcc\x67\xd6\x18\x7b\xe4\xb2\
+\x9b\xcd\x66\xba\x69\xa6\x1f\xe8\x6f\x90\xe8\x1c\xfe\x84\xb6\x71\
+\xef\xe6\x7f\xfb\x95\xaf\x7c\xe5\x17\x90\x6b\xe0\x07\x41\x7d\xd7\
+\x0f\x38\x0a\x71\xfb\xcf\xab\xe3\xa0\x7c\x85\x04\xa0\x0c\x31\xb4\
+\x4b\x37\xfa\xfa\xa8\x80\x0a\x29\x09\x71\xe1\xb8\x41\x2d\x97\xbc\
+\xb8\xc3\xd3\x63\x55\x5a\xab\xcc\x90\xef\x2e\x26\xe8\x78\x45\xb4\
+\xc2\x87\x3b\x47\x89\x9c\xa4\xfe\x18\x52\xf6\xfc\xba\xee\x4e\x1c\
+\xab\xe7\x14\xb9\xfc\x09\x47\x83\x0d\x7a\xda\x41\x9e\xed\xdb\xac\
+\xf9\xfb\x22\xb5\x6b\x10\xd7\x98\x8b\xc7\x4c\xeb\x08\xa8\xd0\x7a\
+\x40\x08\xf9\x3c\xfd\x11\xbd\x3f\x89\x80\x67\x81\x17\x80\xd7\xd6\
+\x1c\x4a\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\x51\xd1\xff\xcf\
+\xde\x9b\xc5\x5a\x92\xa4\xf7\x7d\xbf\xf8\x22\xcf\x76\xd7\xda\xab\
+\x6b\xe9\x7d\x9f\xe9\x21\x29\xce\x90\x34\x6c\x1a\x34\x04\x9b\xb6\
+\x00\x3f\x18\xb2\x65\x1b\x04\xfc\x20\x10\x10\x60\x41\x7e\x31\x0c\
+\x0b\x30\xa0\x07\x42\x4f\xf4\x9b\x61\xc0\x2f\x86\x5f\x0d\x41\x26\
+\xfc\x60\x83\x90\x25\x1b\xa4\x5a\x30\x0d\x89\xe4\x70\x38\x23\xf6\
+\x2c\x3d\xd3\xd3\xd3\xdd\xb5\x74\xad\xf7\xd6\xdd\xcf\xc9\x8c\x2f\
+\xfc\xf0\x45\x64\xe6\x39\xf7\xdc\xaa\xea\xe9\x9a\xae\x5e\xe2\x87\
+\xba\x75\xcf\xc9\x8c\x8c\xcc\x8c\x8c\xcc\x73\x71\xfe\xdf\xf7\xff\
+\x0a\x85\x42\xa1\x50\x28\x7c\xce\x28\xa2\x7c\xe1\xa9\xa2\xfa\xc9\
+\xbe\xad\xbf\x70\xe1\x22\xf7\xee\xdd\xe7\xe6\xcd\x9b\xac\xaf\xaf\
+\x23\xd2\x69\x17\xfd\xda\xf1\x39\x77\xbe\x5f\xde\xb9\xef\x92\x1f\
+\x42\xa0\x69\x1a\x9c\x2d\x7c\xd8\x7d\x50\x99\x08\x4e\xc0\x7a\x3f\
+\x83\x09\xf2\x11\xb3\x54\x7f\x00\x9c\x26\xf8\x1a\x42\xd7\x8f\x09\
+\xe4\x13\xcc\x5e\xfe\x10\x13\xfd\xee\x61\x42\xf2\xaa\xf5\x35\x4b\
+\xe2\xca\x8c\x01\x83\xaa\xa6\x9e\xa6\xb6\x8b\x83\x22\x0c\x87\x15\
+\xb3\x59\xb4\xef\xe1\x9b\x09\xe8\x73\x58\x76\xf1\xa4\xa2\xf2\x0d\
+\x8d\x67\xd6\x8a\x7f\x23\xe0\xaa\x20\xf7\x55\x35\x8b\xdf\x15\x10\
+\x2b\xaa\x61\x43\x93\xb3\xca\xb3\x1d\x7c\x1e\x99\x9b\xc9\xfc\x57\
+\x00\x3f\xb3\xe3\x3b\x48\xc7\xb4\xda\xeb\xa7\x49\xcb\x57\x73\x36\
+\xb7\x08\x5e\x95\xf3\x58\xf0\x41\xae\xc1\x5e\xab\x89\x0e\x0d\x55\
+\x55\xd1\x34\x3e\x6d\xbb\x4d\x67\x5f\xbf\x8e\x09\x49\xb9\x26\x77\
+\x16\x65\x53\xb6\xe7\xcc\x8b\xb0\xa1\x8a\x57\x65\x66\xeb\x1b\xa1\
+\xb3\x1c\x97\xd9\xcc\x02\x1d\x54\xb9\x60\x7d\x48\x05\x5a\xa5\x63\
+\xb2\xea\xc9\x21\xe5\x8d\xdb\xb5\xcc\xc2\xd6\x19\xda\xda\xc0\x32\
+\xb1\x0c\x79\xf5\xd9\x1e\x3d\x59\x98\x0f\x30\x61\x37\x8b\xfd\x60\
+\x02\xac\x28\x7a\x16\x65\x2c\xc8\xaa\xa2\xb7\x11\xa2\xe8\x9c\x32\
+\xb2\x2a\xc8\x9d\x34\x9e\xa4\xeb\xff\xc7\xaa\xad\xa5\x3f\xab\xab\
+\xb8\xfd\x7d\x4e\x03\x57\x3c\x3c\x17\x42\x38\x0d\x10\x02\x87\xbd\
+\x31\xe9\x67\x78\x3f\x32\x5b\x35\x65\xad\xbb\xd0\x7a\xb4\x87\xde\
+\xba\x47\xa1\xce\xe3\x65\x31\xb3\xde\x83\x0b\xc7\x34\xb9\xf9\x36\
+\xe9\xdd\x62\x86\x6f\xec\xfd\x76\x81\xe4\x34\x10\x88\x29\x00\xc0\
+\xd1\xb9\x23\xac\xa6\x31\xef\x6e\x6a\x9d\xeb\x6f\x44\x17\x34\xe2\
+\x2c\x35\x56\x6a\xd0\x07\x74\xd7\xa9\xbf\xef\x19\xdd\x3c\x5f\x81\
+\x9e\xa5\xf4\x3c\x47\xa9\x5d\x9d\xfa\x58\xf3\x1e\x09\x01\xcb\x4e\
+\xb7\xf9\x72\x9a\x93\xed\xeb\x57\x30\xab\xe9\x7c\xfe\x76\xe8\xf3\
+\x12\xd9\xf1\x6c\xf9\x6c\x61\x0f\xa0\xb9\xcc\x7b\x34\xc1\x10\x40\
+\xd4\xb9\x14\x35\xa4\x51\x20\xba\x48\x85\x13\x05\x88\x16\x8b\xa4\
+\xf5\x5c\x0d\x7a\x04\x7c\x24\x06\xf3\x6a\x70\x81\x80\x8f\x3e\x06\
+\xa2\x53\x55\x47\x74\x2e\x6a\xec\x1d\x83\x73\x82\x65\xee\x5f\x78\
+\xe6\xd2\x83\xdf\xf9\x3b\xff\xe5\x7b\x5e\x3e\x71\xe2\xfa\x1c\xef\
+\xbf\xf7\x93\xc9\xf5\x0f\xde\x3f\x33\x6b\x9a\x2a\x12\x45\xeb\xda\
+\x37\xf5\xec\xd8\x33\xf6\xca\x95\x2b\x2f\x2d\x5b\xfe\x28\xdc\xee\
+\x83\xff\x2a\xae\x6f\xfe\x8f\x3c\x64\x5b\x67\x83\x7f\xa2\xed\xf7\
+\xe7\x90\x9c\xdd\xde\x0f\x6a\xe9\xe3\x7a\x6d\x4e\xba\x40\xbb\x98\
+\x2b\xc5\x37\x08\x7c\xef\x31\xf6\x39\xc1\x82\x65\x1a\x11\x9c\x3d\
+\x2b\xc5\x89\x4d\x30\x14\x08\x1a\xdb\x1b\x5b\x52\x7c\x90\xca\xf1\
+\x2c\xf7\xa5\x5a\xf9\x13\xb0\xa4\x6f\xbb\x42\x11\xc4\x49\xca\x84\
+\xb7\x58\x1d\xb5\xe3\x4d\x4b\x96\xe4\xc8\x9f\x88\xd8\xe7\x84\xbd\
+\x16\x4d\x95\x44\xf2\xc3\xdb\x5e\x77\xfb\xb0\xf6\xa9\xf7\x21\xf6\
+\x2c\x18\x40\x27\xe0\x5b\x79\x10\x72\x59\x8c\x81\x08\x13\x75\xfe\
+\x7f\x26\x84\xd7\x59\x72\xef\xa7\xe0\xaa\x7d\xe0\x27\x58\x60\xc4\
+\x92\x63\x94\x5d\x45\xff\xb4\x52\xb9\xd6\xa0\x2f\x03\x2f\x01\xff\
+\x03\x5d\xe6\xfc\x0a\xf0\x3b\xc0\x3f\xc6\x3e\x0f\x97\x3d\x9f\x0a\
+\x85\x42\xa1\x50\x28\x14\x0a\x85\x42\xa1\x50\x28\x14\x0a\x85\xc2\
+\xe7\x88\x22\xca\x17\x9e\x2a\x41\xd5\x1c\xe7\x5d\x2e\x22\xdf\x2b\
+\xfc\xde\x4b\x95\x8f\x00\xce\xea\xcb\xbf\xfa\xea\x2b\x1c\x1e\x1e\
+\x72\xe3\xc6\x0d\xce\x9c\x39\x83\x73\x32\x5f\x96\x3e\xd1\x8a\xf4\
+\x6d\x9a\x7c\xce\xaa\x07\x6d\x94\xd0\x04\xa4\x12\x48\x5f\xb0\x27\
+\xb5\x39\x56\x54\xae\xa1\x89\xa9\x0e\xb0\x4f\xc2\xe0\x3a\xf6\xa5\
+\x78\xc0\x32\x6f\xef\x63\x5f\xe1\x3b\x20\x06\x42\x16\x94\x01\x18\
+\xc4\x99\xab\x6d\xdd\x0e\x26\x94\x4c\x99\xb7\xb5\x9e\xcb\x78\x8c\
+\x55\xed\x69\x96\x0a\x86\x26\x52\xc7\x98\xc4\xea\x19\x28\x0d\x66\
+\xf9\xfd\x11\xf0\xa6\x89\xec\x83\x94\x75\x4f\x4c\x3f\xb7\x15\xfd\
+\x08\xcb\xd8\xf3\x80\x0c\x18\xb8\x64\xcf\x7f\x07\xfc\x5d\x88\x83\
+\xe4\x9a\xee\x52\xdd\xf4\x8b\x49\x84\xf8\x80\xf9\xac\xcc\x4b\xe9\
+\xf8\xf3\x71\x57\xc0\xc5\xf4\xbb\x1a\x0c\xa8\x42\xcd\x69\x2c\x33\
+\xbe\x26\x09\x47\x29\x11\xf1\x1c\x30\x83\xa6\xa2\xaa\x22\x4d\xb3\
+\x93\xc6\x6d\x33\x6d\x3f\x4d\xe7\x72\x31\x6f\x87\x30\x02\x39\x9f\
+\xea\xf0\x7a\x55\x76\xe8\x32\xa5\xfb\xe3\xd6\x3f\xc6\x51\xda\xf7\
+\x2c\x09\xbd\x8b\xf5\x97\xed\x77\x67\x05\xef\xb0\x0c\x6e\x80\x37\
+\xd3\x38\xac\xe1\xb8\xaa\x51\xbf\x47\x97\xe9\x3e\x49\xe3\x79\x26\
+\x5d\xff\x0d\xcc\x42\xfd\x75\xe0\xa7\xc0\x3f\x51\xf4\x1e\xe6\x76\
+\x2c\x0b\x3a\xd5\xdf\x50\x78\x13\xd8\x37\x1b\x71\x1d\xd3\x39\x13\
+\x00\xb0\xbf\x0f\x58\x70\xc7\xdd\x00\xdf\x07\xce\x78\xb3\x71\xbf\
+\x84\x05\x7f\xe4\x2c\xd6\x21\x24\x19\xbb\x57\x84\x38\x77\x24\xe9\
+\x3f\xed\x2d\x10\xfa\xba\x58\x5b\xbc\x99\x45\x72\xfd\x68\x60\x53\
+\x90\x38\x57\xa3\xbe\x6f\x63\x1f\x88\xc9\xd6\x3e\xe6\xe5\x61\x21\
+\xe5\x7a\x21\x5b\x3c\xaf\x5b\x01\xce\x20\x32\x45\x55\x02\x6d\x36\
+\xbf\x60\xd7\xbd\xbd\x46\x61\x41\xd4\x4f\xc1\x0f\x23\xe0\x39\xec\
+\x5a\xdc\xc5\x02\x42\x52\x3b\x75\xd8\xbc\xcb\x8e\x12\xfd\x6d\x9d\
+\x76\x2a\x5b\xce\x6e\x5d\xbc\xc7\x72\x90\xc8\x41\x7a\x3f\x14\xc4\
+\x25\x07\x8f\x6c\x77\xbd\xc5\xc9\x82\x7e\xae\x37\x9f\x83\x76\xfa\
+\x6d\x16\x33\xfa\xbb\x8d\x92\x7d\xbd\xe0\x88\x2e\xc6\xa5\x02\xbd\
+\xf6\x04\xfa\xa8\xf6\x8c\x6b\xf2\x15\xf4\xb9\x4c\x05\xb9\x06\xbd\
+\x6d\xe3\x2c\x90\x40\x2a\xcb\xf4\x77\x44\xa5\x71\xd1\xb9\x28\xa2\
+\x2e\x6a\x70\xea\x92\x8e\x99\x08\x80\x12\xdd\xc1\x74\x77\x18\x82\
+\x3a\x2f\x3e\x8a\xf7\x73\xc7\x0b\xa0\x21\xb8\xbc\x5c\x2d\x18\x07\
+\xf1\x3e\x2e\x7b\x3d\x9b\xd5\x15\x40\x13\x1b\xd9\xd9\xdb\x5f\x19\
+\x37\x4d\x95\x07\xc4\xa4\x5d\x3f\x38\xf5\xec\x73\x2b\xbb\x3b\x0f\
+\x96\x0c\xe9\x71\xf2\x76\xc3\xe9\xd1\xef\xce\x46\xe3\xff\x85\x9d\
+\x07\x2b\x27\xb5\x1d\x4e\x8f\x7e\xf7\x0f\xff\xf0\x0f\xff\x2e\xf6\
+\xec\x7b\x08\xf9\x0e\xea\xee\xa4\x4f\x93\x88\xfd\x69\x10\x18\x69\
+\x9a\x9f\x3d\xc7\x89\x17\xb0\xb9\x09\xf6\x7c\x5b\xa7\xc2\xd3\x2c\
+\x11\xe5\x87\xc9\x6f\x65\xc6\x1f\x03\xff\x1e\xf6\xac\xfa\xf0\x58\
+\xbb\x79\x6a\xe0\x47\xc0\x9f\x75\xcf\x09\x5d\xd0\xd2\xb5\xf7\xea\
+\x64\xcb\xf9\xe3\x8b\xbc\xf3\xa9\xde\xc5\x9c\xbb\xc7\x63\x5a\xc8\
+\x2f\x43\x5b\xd1\x3c\x5b\xc9\x7b\xe7\x7b\x19\xfc\x3e\xbd\x7c\x9c\
+\xac\xfc\x6c\x75\xdf\x1d\x7c\xba\xab\x92\xcb\x08\xde\x3b\x0d\x21\
+\xe2\x69\xf7\x61\x1f\xc0\x61\x5d\xe1\xdf\x60\x21\x38\x22\x74\xd7\
+\x2d\x02\x6f\xa8\x72\x8b\x61\x78\x97\xc0\xcb\x3c\x3c\x38\xe4\xc4\
+\x08\x98\x3c\xde\xbd\x9a\xf5\x67\x80\x6f\xd0\x89\xf2\xab\xd8\x1c\
+\x0f\x14\x41\xbe\x50\x28\x14\x0a\x85\x42\xa1\x50\x28\x14\x0a\x85\
+\x42\xa1\x50\xf8\x42\x50\x44\xf9\xc2\x53\x45\x1f\xdb\xd7\x36\x42\
+\x34\x91\x3d\xe2\x78\xe3\x8d\xd7\x71\xce\x71\xeb\xd6\x2d\x86\xc3\
+\x21\x55\x95\xa7\x72\x4f\xff\x72\x66\x63\x9f\xeb\xcc\x9b\x48\x9f\
+\x12\xda\x42\xa0\x09\x0d\x95\xab\xa8\x2a\x06\xe6\xee\x5b\x41\x05\
+\x4d\xd3\x44\x68\x1d\x7f\xb3\xb8\x3b\xc4\xb2\xd1\x3e\xe6\x78\xc2\
+\x71\x5f\x2c\x76\x00\xb5\xd9\xdf\x07\x4c\x44\x3c\x9a\x3f\x11\xe0\
+\x78\xc6\x63\x3f\x63\xdd\x63\x5f\xb8\x6f\x62\x59\x79\x77\xa8\xeb\
+\x36\x7b\x58\x40\xd4\xfa\xd4\x24\xd3\x7a\xa8\xad\xaf\x01\x50\x23\
+\x69\x9f\x17\xb1\x60\x82\x31\x10\x92\x20\xef\xed\x7d\x78\x56\xe0\
+\x50\xc1\x0f\x40\x6a\xab\x40\x5e\xa7\xed\x22\xe0\x53\xf6\x7e\xb6\
+\x9b\xbf\xcf\x60\xe0\xa9\xeb\x98\xde\xd7\x24\xa1\xbe\xae\xf1\x58\
+\xd6\xdf\x87\x98\x90\x94\xc7\x62\x88\x09\x08\xfb\x34\x95\x40\x33\
+\x74\xb8\xcb\x91\xb8\x85\x09\x9d\x59\x24\x3d\x47\x97\x61\x3f\x46\
+\xd9\x04\xdd\x03\xdc\x00\xaa\xda\x8e\x27\x07\x40\x54\xe9\x2c\xcf\
+\xa6\xf1\xcd\xb6\xcf\x60\xae\x05\x13\x2c\x55\xbe\x6a\xb4\x95\xa6\
+\x63\xda\xae\xb5\x82\x4f\xed\xef\x02\xff\x22\x8d\x75\x03\x8c\x88\
+\xfc\x1d\xc0\xa5\x4c\x69\xb0\xeb\xfd\x47\xc0\xaf\xa4\xf3\xd9\x4f\
+\xc7\x71\x1d\xf8\x3f\x57\xe1\xaf\xf6\x7b\x17\x71\x35\x35\xc0\x76\
+\xe8\x1b\x74\x13\x4f\x83\x89\xbc\x3e\xed\xf3\x24\x21\x46\x31\x71\
+\xfe\x6e\x3a\xde\x67\xb0\xec\xfa\x23\xbc\xdf\x36\xfb\x7d\x6b\xd8\
+\x8a\x47\xbd\x0d\x4d\xa7\x4a\x59\xe8\xba\x28\x94\x9d\x2c\x35\xf6\
+\xd6\x5c\x51\xf4\x5b\xc9\x4d\x00\x68\xb3\xee\x7b\x64\x4f\xfd\xe8\
+\xd4\xc6\x41\xe9\xdc\x13\x50\xf4\x0a\x9d\x4d\xbc\x60\xc1\x05\x29\
+\x53\xbd\xab\x93\x9d\xfa\x15\xcc\x85\xe1\x03\xa0\x46\xe4\xb5\x54\
+\x7f\xd9\xf5\xce\x51\xb0\x61\x8d\xd8\xfc\x6a\x7a\xfd\x67\x41\x3e\
+\x07\xbc\x64\x61\x3c\x9d\x97\x8e\x30\x21\xeb\x10\x9b\x27\xb1\xbf\
+\x3e\x71\x4c\x44\x5f\xcc\x78\xa7\x13\x46\x4f\xc4\x7b\x86\x21\x1c\
+\x13\xe5\x97\xef\x27\x76\x1a\xa5\x5a\xc4\x51\xbb\xce\x2a\x6d\x24\
+\x91\x1b\x3b\xe2\x18\x93\x40\x2e\x5d\x3b\x21\xb8\xe8\xb0\xf9\xe0\
+\xb2\xe1\x80\x20\xa2\x4e\x10\xa2\xd6\x11\x07\x41\xd3\x2d\x23\xd1\
+\xa9\x46\xa7\x11\x37\xc0\x3c\x21\xb2\xb4\x67\x77\x88\x3a\x8e\xc9\
+\xf0\x1d\x59\x6c\xcf\xbf\x17\x97\xf7\xb9\x74\xe5\xea\xf4\x6b\x7f\
+\xed\x9b\xd7\x3e\xfc\xf1\xbb\xe7\x76\xb7\xb7\xc2\x2f\xff\xda\xaf\
+\xfd\xf4\xfc\xc5\xcb\xfb\xf3\xad\x62\x05\xee\xd1\x95\xd6\x81\x9b\
+\xdf\xfb\xf6\x7f\xdf\xf6\xfd\x4b\xdf\xfc\x6f\x1f\xa3\x3d\xc0\x9f\
+\x3c\xba\xe7\xe3\x95\xd3\x9f\x96\xff\xb7\xc0\xba\xc2\x37\xa1\xfd\
+\x70\x39\x05\xfc\x87\xc0\x6f\xa6\x26\x1e\x98\xd0\xe0\x86\xe0\x4d\
+\x81\x87\x59\xfe\x3c\x99\xa5\x90\x2c\x7b\x7e\x7f\x17\xf8\x0d\x2c\
+\x80\x68\x61\xdc\xe7\xc8\x65\x55\x2e\x3d\xd1\x93\x01\xda\x3b\x7c\
+\xf9\xe3\xe3\x38\x66\x27\x1f\x05\x71\x2a\xba\x10\x50\x74\xd2\x2e\
+\x8e\x3f\x9d\x1e\x47\xf0\xb7\x60\x1d\x48\x9f\x0b\x0b\x9b\xe7\x00\
+\xa4\x36\x10\x89\x28\x38\xd5\x90\x9f\x1d\x6b\xa4\xd2\x28\xde\xe3\
+\xfb\x7f\xbe\xa4\xd7\x17\xb1\x4b\xf1\xe7\xcc\x90\x94\x6e\x7f\x12\
+\xf9\xef\x86\x87\xb9\x9f\xf4\x4b\xa9\x9c\x02\xfe\x06\xdd\x73\xec\
+\x45\xe0\x2f\x68\x2f\x7d\xa1\x50\x28\x14\x0a\x85\x42\xa1\x50\x28\
+\x14\x0a\x85\x42\xa1\x50\xf8\xbc\x53\x44\xf9\xc2\x53\x45\xd5\x4a\
+\xa7\x47\x80\x94\x24\xbf\x58\x4b\x1e\xba\x6f\xad\xf3\xb2\xca\x57\
+\xbc\xfe\xfa\xeb\x00\x5c\xbf\x7e\x1d\x70\x4c\x26\xd9\xbd\xba\xab\
+\x2f\x7f\xd2\xf7\xdd\xaa\x81\x10\x02\x22\x42\x13\xed\x3e\x68\x68\
+\x22\xc7\x65\x22\xfb\xd2\x5c\xd8\x46\xb9\xc5\xc3\x64\x85\x79\xb1\
+\x35\x8b\x92\xcb\xda\x0d\x17\xdb\x37\x0d\x42\x27\xa0\x67\xd1\x71\
+\x97\x2c\xca\xf6\xda\xaa\x09\xf1\x23\xe0\x3c\xe8\x0a\x54\x1e\xb3\
+\xa4\xb7\x03\xf6\x0c\x42\xe0\x85\xb4\xed\x1e\xa6\x35\xf9\xa4\xd8\
+\x8f\x6d\x3b\xae\xab\x09\x36\xbe\xee\xbe\xe4\xbf\x0f\x0c\x3c\xbe\
+\x0a\x04\x5f\x53\x4b\x3a\x86\x2d\xc0\xa7\xc0\x80\x2c\xde\x6f\xa7\
+\xe3\xf5\x0c\xf0\xd4\x6d\x86\x7e\xae\x29\xef\x93\xb5\xf8\x11\x16\
+\xea\x20\x80\x44\xe2\x0e\x70\xad\x37\xb6\x39\xc3\x79\x07\x13\xc3\
+\x63\x08\x6c\xa7\xfe\xa5\x36\xa5\xd1\xa3\x7a\x1e\xd8\x1a\x0c\xf0\
+\x75\xdd\xda\x38\x1f\x32\x2f\x5a\x5c\xc4\x6a\xf0\xbe\xdf\x58\x46\
+\xbc\x4b\xa2\x48\x5f\x88\x5f\x4b\xe7\xef\xb1\x5a\xe6\x75\x3a\x3f\
+\xb0\x6c\x69\x05\xaa\x10\x70\x08\x13\x94\x6a\x38\x44\x67\x33\x02\
+\x66\x35\x9c\x8f\x37\x0c\xe0\xae\x4e\xf0\x1c\x76\x53\xb5\xaf\x80\
+\x35\xf0\x2e\xc0\xca\x08\x0e\x0e\xc0\x12\xc6\x0f\xf2\x1c\x78\x04\
+\x2b\xca\xca\xc1\x0d\x0e\xb8\x09\x28\xa3\x91\xe3\xe0\xa0\xdd\xcf\
+\x12\x39\xca\x96\x7f\xba\xda\xcd\x1f\x02\x11\x7d\xb4\xc8\xa3\x68\
+\x9e\xab\x3b\x98\x58\x74\x97\x9c\x74\x6d\x22\x3a\xd8\x7c\x78\x80\
+\x39\x0a\x3c\x93\x52\x3f\x17\xad\xed\x77\xb1\x41\xa9\x92\x0a\x37\
+\x2f\xdc\x5b\xea\xf2\x36\xe6\x0a\x91\x2d\xbc\xfb\xe2\xf7\x1e\x16\
+\x20\x51\x61\x02\xbc\xf3\x39\x5b\x56\xa8\x51\xee\x61\xf3\x3a\xdb\
+\x4e\xdb\x03\xc2\x7b\x97\x06\x2b\x5b\xd3\x6f\xa4\x3e\xb2\x33\xc2\
+\x43\x84\x32\x8f\x5f\xb8\x02\x0b\xe3\xee\xe6\x7e\xdb\xbe\xda\x6b\
+\x67\xa9\xe6\xf6\x5a\x70\xa8\xf4\xec\xe4\x73\x06\xbd\x80\xc6\xfc\
+\x60\x4c\xc2\xb7\xfa\x5e\x10\x86\x03\xb1\x28\x25\x89\x29\x44\x82\
+\x80\xaa\xd5\xa1\x17\xc1\xd9\xf3\x34\x02\xb5\x59\x21\x98\xe3\x07\
+\xba\xf0\x8c\xcb\x9a\xe1\xca\x78\x7d\xe6\xbd\x2c\xcd\x92\x5f\xb6\
+\x6c\x19\xe2\x7d\x5c\x59\x5d\x0d\xff\xc5\xdf\xfd\x7b\xef\xfd\xe0\
+\xbb\x7f\x79\xeb\x4f\xdf\xfe\xe7\x97\x7e\xf3\xb7\xff\xfd\xeb\xaf\
+\x7e\xfd\xad\xf6\xd6\xf8\xce\x1f\xfc\xaf\xff\xe8\xaf\xfd\x27\xbf\
+\xf3\x9f\x3f\x4e\x7f\xc6\xdf\xfe\x04\x6d\xe1\x0f\x7e\xff\x1a\xf0\
+\x58\xf6\xed\x9f\x1b\x1a\x9b\x7f\xdf\xc2\x9e\x2f\x60\x42\xeb\xff\
+\x07\xfc\xb0\xd7\xcc\x01\xd3\x19\xc8\xf2\x3b\xd4\x22\xb2\xb0\xfb\
+\xe1\x23\xe0\x55\xac\xde\xf8\xd2\x6b\x27\xc2\x58\x95\x4b\x82\x1c\
+\xb6\xc5\x17\x20\x45\x8a\xcc\x35\x74\xa4\x87\x28\xfa\xc9\x6c\xe2\
+\x1f\x9b\x7e\x06\xfc\xb1\x80\xa2\x27\x8c\xa8\xeb\xce\x51\x5c\x2b\
+\xce\xa7\x3a\xf3\xc7\x0e\x6d\xde\x4c\xc1\x1c\x0b\x40\x42\xe8\xb5\
+\xb6\xfb\x7f\x00\x9c\xc7\xfb\xbf\x24\x84\x19\x83\x81\x27\xd4\x15\
+\x26\x9e\x6f\x24\xe7\x8e\x88\x7d\x10\xcc\xb0\xc0\xb2\x01\xf6\xfc\
+\x7c\x95\xf9\xbf\x2d\x1c\xf6\x39\x55\xd1\x7d\xf6\xff\x00\xf8\xb3\
+\xde\x7a\x0f\xfc\x53\x3a\x97\x8f\x42\xa1\x50\x28\x14\x0a\x85\x42\
+\xa1\x50\x28\x14\x0a\x85\x42\xa1\xf0\x39\xa7\x88\xf2\x85\xa7\x4a\
+\x48\xde\xb6\x8e\xd8\x26\x8c\x26\xbf\x66\x6b\x90\xb2\xe3\xd3\x1b\
+\x22\xa9\x5a\x7c\xb4\x1a\xf1\xaf\xbd\xf6\x1a\xa7\x4f\x9d\xe6\xa7\
+\xef\xff\x94\xdb\xb7\x6f\xb3\xb1\xb1\x41\x55\x55\x6d\xcb\x36\xc3\
+\xbe\xed\x38\x12\xa3\x33\x51\xbe\x09\x78\xf1\x10\x4e\xba\x0f\x3c\
+\x10\x7c\xca\x1c\x7e\x58\x16\xec\x04\x13\x84\xef\xd0\x65\x9a\xc3\
+\xbc\x9d\x76\xfe\xf2\xfd\x14\x26\x10\xde\x06\x7c\xb6\xca\xc7\xee\
+\xc5\x11\x5d\x36\x7e\xae\x2d\xbf\x4e\x67\xbd\x9d\xfa\xd5\x09\x70\
+\x05\x13\x95\x23\x7d\x4b\xf7\xba\xfd\x66\x7f\x0b\xf8\x19\x9d\x7d\
+\xbd\x4f\x82\x8d\xda\xbe\xfd\x0d\x21\xae\x2a\x9a\xed\xd4\x87\xc0\
+\xf3\x98\x15\xff\xb5\x0a\xaa\xc6\x8e\xbf\x8d\x83\x80\xaa\x4a\xe9\
+\xb5\x15\x96\x5d\xb9\x02\xfc\x84\xba\xcd\xec\xbf\x0c\x9c\xf2\x78\
+\x1f\x08\x1e\x13\x6e\x27\x74\xb5\xeb\xc1\x04\x84\x09\xc2\xac\xd2\
+\xca\x37\x34\x53\x4c\xb8\x7d\x1e\xf0\x21\x20\xa9\xae\xbd\x4b\xe3\
+\x53\x35\xda\x9c\xc2\x04\xe0\xa6\x8e\x6d\x3f\xdb\x98\xb0\x91\xc5\
+\x89\x2c\xd6\x6e\xa3\x9a\xeb\xd5\x7b\x54\x63\x72\x16\xa8\x80\x97\
+\xd3\x35\x69\x80\xa9\xc7\xdf\x0d\x04\x61\x02\x49\x58\x7f\x03\xb3\
+\x8b\x7f\xc1\x86\x99\x67\x80\x07\xb3\x19\x43\x3c\x62\xc5\xbb\x59\
+\x07\xfe\x12\xb8\x5f\xc3\x56\x05\x32\x99\xc0\x61\x12\xe6\x27\x4c\
+\xdc\x21\x87\x73\xa2\xd6\x41\x2b\x99\x7c\x12\xed\xe4\xa0\xdf\xdc\
+\xf7\x3a\xf9\xc5\x30\x46\xc6\xb0\x7b\x74\xc4\x3f\x1b\x8f\x71\x47\
+\x47\x0f\xc9\x9b\x1e\x31\x60\xca\xf3\x15\x0c\x1b\xaa\x43\x68\xd6\
+\x80\xc3\x11\x7c\xd0\xc0\x4e\xb0\xb9\x99\xc5\xed\x43\x3a\xbb\xe5\
+\xee\xfe\xf1\xde\x11\xa2\x4b\x4a\xd7\x08\x1b\xf7\x55\x7c\xba\xcf\
+\xb2\x3c\x65\xb2\xd7\x62\x7c\xce\xbc\xe8\xbd\xf0\x3a\x74\xdb\x46\
+\x6c\x14\x6b\xe6\x2d\xa4\x5d\x4f\x45\x1f\x8a\x10\x54\x79\x80\xdd\
+\x7b\xfb\xd8\xbc\x7e\x08\x4b\x43\x22\x4e\xb4\xaa\x5f\x14\xf0\xfb\
+\x28\x71\xa1\x06\x41\x5a\xae\xbd\x73\x12\x87\x8b\xf3\x16\xf7\x8e\
+\x8a\x98\xd2\xec\x93\x41\x7f\xca\xae\x57\x17\x5d\x4c\x8e\x0a\x66\
+\x71\x5f\xa5\x3a\xe0\xf1\x33\xcc\x03\x17\xef\xe3\xd7\x7f\xf5\x9b\
+\xbb\x6f\xfe\xf2\xaf\xec\x3d\xae\xa0\xff\x24\xf8\x83\xdf\xff\x87\
+\xff\xe8\xf7\x7e\xef\xf7\x1e\x96\x79\xfc\x79\xe5\x08\x7b\xae\xe4\
+\x80\xac\x33\xd8\xbc\x5d\x9c\x3a\xc9\x11\x65\xc0\x80\x9a\xf4\x2f\
+\xda\xa2\x3a\xbb\xb4\x44\x2c\x83\xfa\x2c\x66\x77\xfe\x57\xcb\x76\
+\xa8\xca\x21\xf0\x9e\xa2\xdf\x7e\xe8\xd4\xd0\xae\xc6\xfc\x43\xe5\
+\x72\xef\xb3\x0d\x4d\x2a\x73\x81\x15\xa4\x60\xee\x2c\x62\xeb\xe6\
+\xe1\x93\xe5\xfb\xa7\x0b\x24\xfa\xc4\x9c\x64\xcf\xdf\x7f\x99\x8e\
+\x31\x0d\xb6\x27\x68\x36\xc9\x0f\x6b\xc0\xaf\xb1\x3c\xe8\xee\x75\
+\xe0\x2e\x21\xfc\x14\x0b\x62\x03\xf8\x0e\x70\xcd\x7b\xf2\xed\x3b\
+\x06\x7e\x1d\x0b\x4c\xbb\x99\x7e\xff\x90\xa5\xc1\x7e\xf2\x63\xd0\
+\x1d\x2c\xc0\xcd\x27\x7f\x8b\xbc\xcf\xfc\xb7\xc5\x67\x76\x6f\x15\
+\x0a\x85\x42\xa1\x50\x28\x14\x0a\x85\x42\xa1\x50\x28\x14\x0a\x85\
+\x4f\x4f\x11\xe5\x0b\x4f\x05\x55\xfb\x86\x3a\x2c\x49\x31\x55\x97\
+\xc5\xf4\xf4\xad\x73\xfb\xd5\xb3\x4b\xe2\x7d\xcc\x6f\x21\xc2\xd9\
+\xf3\xe7\xd8\xd8\xdc\xe0\xdd\x77\xdf\xe5\xee\xdd\xbb\xec\xec\xec\
+\x30\x1e\x8f\xa9\xaa\x2a\x65\xde\xa7\xcc\xf9\xe8\xd2\x96\x11\xd5\
+\x48\xd0\x40\xd0\x80\x87\x41\xf0\x29\xfb\x35\x74\xa2\x81\x07\x17\
+\x91\x4a\x55\xb3\x0d\xfb\xb2\x0c\xe7\x6c\x9b\xed\x81\x17\x45\xa8\
+\x92\xc0\xb7\x83\xdd\x5f\x43\xe0\x2a\x96\x01\x19\xb0\xac\xdd\x9c\
+\xd9\x5d\xe5\x7a\xb1\x55\x85\x6f\x1a\xb6\x81\x1b\x2c\x7e\x41\x2f\
+\x22\x88\x56\x34\xc4\xe4\x13\xde\x80\xdc\x00\xfd\x40\x90\x0d\xa5\
+\xf1\x59\x30\xb7\xf5\xde\x43\x78\x40\x9b\x21\xdf\xd6\x31\x8f\x78\
+\xef\x6d\xd0\xc3\x59\xcb\xc7\x9d\xb3\xcf\xbd\x03\xcc\xc0\x6b\x43\
+\xf0\x66\xbf\xce\x2a\x96\x49\x7c\xd8\xcb\xc6\xcf\xd9\xf0\xb3\x54\
+\x63\x3c\x9f\xcf\x16\x20\xc9\x72\xbc\xc2\x84\xa6\x7b\xc0\x00\xef\
+\x2b\x42\xc8\x59\xc9\x03\x94\xbb\x0d\x8d\x17\xc4\x01\x97\x15\xdd\
+\xcc\xe3\x92\x04\xf9\x09\xb6\x7f\x8f\x89\xa5\x56\x02\xa0\x49\xa5\
+\x7d\x2d\x0b\x3f\x67\x34\x67\x1b\xfc\x2d\xcc\xca\x5c\x52\xb6\x7f\
+\x05\x04\x35\x41\xf6\x55\x2c\xd8\xe1\x5f\x30\x1e\xef\x72\x74\x14\
+\x5b\x0b\xf5\x43\x48\xd7\xe8\x25\xe0\xcf\x81\x6f\x20\xb2\x89\xea\
+\x4d\xe0\x9f\x00\x3b\x74\xd6\xe4\x01\xcb\x42\xbd\x03\x70\x78\x38\
+\x3f\x27\x0e\x53\x67\x4f\x8b\x31\xf3\xb5\x12\x1e\xb5\x3c\xf1\x0a\
+\xb5\xbf\x70\x94\x6e\xc6\xa3\x85\x86\xc9\x46\x3e\xbf\x75\x4c\x19\
+\x02\xa7\x1a\xd8\x4a\x7a\xbb\x07\x4e\x4f\x2d\xb0\xe2\x3c\xf3\xf6\
+\xf2\x40\x5b\x33\x7b\xda\x2e\xb3\x5d\x39\x2c\x98\x25\xdf\x43\xb3\
+\x45\x69\x4a\xc0\xb5\x49\xe5\x70\x1a\x21\xcc\x65\xdc\x0b\x2b\x28\
+\x57\xe9\xe6\x80\xeb\xe5\xb1\xe7\x80\x8d\x11\xb0\x2e\x88\x4f\x73\
+\x2b\x0b\x59\x0e\x38\x52\x65\x8b\xce\xe4\x60\x15\x13\xe5\x1d\x10\
+\x73\x99\x80\x56\x48\x3c\x86\x77\xf4\xca\x08\x2c\xe0\xba\x53\x7d\
+\x0c\x7a\xa2\xa0\x90\x24\x38\x48\x29\xf3\xf3\x16\xf7\x6a\xe3\x6e\
+\x61\x46\x0e\x5c\xca\xa2\x0f\x44\x5c\x6b\x73\xaf\xce\xb9\x18\x1b\
+\xc2\x5c\xa6\xfc\x67\xc9\x67\x29\xc8\x7f\xc1\x99\x61\xa5\x34\x32\
+\x1b\xf4\x83\xad\x16\xa9\x53\x31\x92\xf9\x45\x8b\xfc\x09\xf0\xef\
+\x62\xf7\xe5\x47\x6d\x4f\x5d\x1d\xf6\x31\xf0\x1a\x5d\x76\xfe\xa7\
+\x63\x6e\xa2\x1f\x13\xe3\x8f\x37\x0b\x8f\xe5\x36\xff\x54\x08\x73\
+\x87\xdf\xff\x3f\x65\xc3\x77\x9f\xa9\x99\x0b\xd8\xf3\xed\xcf\xe9\
+\xfd\x9d\x30\x60\x70\xb7\xa6\xbe\x63\xfd\x89\xeb\x8d\xf9\x7b\x90\
+\xeb\xc9\xf8\x6f\x87\xa5\xcf\x90\xf6\x59\x25\x29\xb0\x2c\x3f\xcf\
+\xe0\x64\x27\x9e\x42\xa1\x50\x28\x14\x0a\x85\x42\xa1\x50\x28\x14\
+\x0a\x85\x42\xa1\xf0\x39\xa6\x88\xf2\x85\xa7\x4a\x6b\x5f\x9f\x32\
+\xdf\x33\x66\x67\x9f\xb2\xdd\x5d\xbb\xc4\xac\xed\x5d\x2a\xc3\x9c\
+\xdf\x00\xbe\xf2\xbc\xf1\xe6\x1b\x1c\xec\x1f\x72\xfd\xfa\x47\x7c\
+\xf8\xe1\x87\xec\xed\xd6\x8c\x27\x63\x06\x83\x21\x4e\x52\x16\x7e\
+\xcc\x7d\x07\x54\x15\x55\x25\x40\x45\xb0\xdc\x6e\xfc\xbc\xb6\x90\
+\xec\x66\x6f\x63\xc2\xde\x22\x63\xec\xcb\xf8\x21\xde\xbf\x0b\x61\
+\xa6\x81\x61\x12\xf2\x2e\x62\x42\xf0\x00\x13\x83\xaf\x61\x59\xbb\
+\x11\xab\xa1\xde\xda\xd2\x56\x54\xae\x69\x9a\x87\xd5\x96\x95\x2c\
+\x46\x77\x65\xa0\x75\x96\x8e\x2f\x7d\x51\xdf\xf4\xc4\x9b\x20\x69\
+\xbf\x57\x30\x81\xd1\x03\xbe\xaa\xa0\x69\x42\x85\x09\xd0\x77\x34\
+\x65\xe1\x55\x20\x4d\x27\x36\x04\x08\x77\xe8\x04\xf1\x81\x1d\xb7\
+\xec\x5b\xed\x7a\x00\x66\x22\xdc\x55\xe5\x34\x04\xa9\x2a\xaa\xa6\
+\x61\x96\xce\xef\x1c\x9d\x98\xe4\xb1\xec\xf9\x19\x21\x08\x26\xb4\
+\x3b\x44\xee\xa4\xda\xe1\x5e\xd1\x55\x4c\xdc\xb8\x0f\x78\xef\xa9\
+\x42\xe0\x34\x26\x58\xe4\xf3\x72\xa9\x8d\x54\x54\x55\x24\xfa\x40\
+\x38\x8d\x09\x59\xd2\xdb\x57\x9d\xda\xf6\x03\x03\x00\x2e\x23\xf2\
+\x2f\x51\xfd\xe7\x40\x9d\x54\x67\x37\x62\xe4\xa6\x4c\x23\xe6\x26\
+\xf0\x06\x26\x10\x2b\xf0\x31\xaa\xe2\xe1\x27\xc1\x82\x0a\xfa\x19\
+\x8a\x39\x10\xe0\x73\x29\x88\x1c\xc1\x52\x05\xfe\x21\x82\xbc\x00\
+\xe7\x09\xe1\x3e\x76\xae\x00\x0c\x18\xb8\x9a\xba\x3f\x96\xbe\xaa\
+\x6c\x9c\x9b\x06\xf1\x70\x2f\x74\x41\x1f\xe2\x3d\x3b\x21\xf0\x2a\
+\x76\xaf\x7c\x80\xcd\x7d\x87\x89\xdc\x2f\xa9\x8d\xed\xb2\x74\xff\
+\x03\x2c\xc8\xa1\xc6\x32\x4d\xe7\x48\xaa\xd7\x26\x16\x30\x21\xa2\
+\xdc\xd7\x7e\xe6\xbd\x59\xed\x6f\x61\xd7\x65\x1d\xe6\xf2\xd8\x57\
+\xb0\x20\x90\x3d\x60\xa0\x5d\x8e\xec\xd2\x0c\x7b\xe6\xb3\xdd\x01\
+\x72\x30\x82\x4b\xcf\x84\x25\xf7\x67\xe8\x96\x9b\xfd\xf5\x13\x11\
+\xbe\xb5\xfd\x2f\x75\xbf\xc4\xe2\xde\xf6\x79\x3c\x8b\xbe\xb3\xb9\
+\x8f\x73\x75\xe8\x9d\x10\x89\x9a\x9f\x19\xf3\x44\x25\xc4\xfa\x17\
+\x2e\xda\x7f\x72\xeb\xfa\xaf\x14\xfd\x60\x11\x00\xdf\x73\x27\xb1\
+\x80\xab\x64\x61\x92\xc2\xaf\x1e\x15\xf0\xd0\x00\x3f\x02\x7e\x1b\
+\x78\x40\x60\xb7\x5b\x15\x48\x8e\x24\x77\x80\xf7\x9f\xdc\x29\x7c\
+\x31\xe9\x59\xcb\xcf\xbd\x06\xac\x14\x84\x82\x8a\x80\xea\x1a\xce\
+\x8d\x52\xa4\x5f\xbe\x4e\x15\xf6\x7c\xfb\x2e\xf6\x99\xd4\x7e\x16\
+\xd7\xd4\x29\x50\xce\xde\xd1\x65\xb8\x5b\xe2\x3d\xf4\x03\x88\x96\
+\x61\x25\x27\xec\x9e\xed\x7f\x0e\x3d\xcc\xb9\xa7\x50\x28\x14\x0a\
+\x85\x42\xa1\x50\x28\x14\x0a\x85\x42\xa1\x50\x28\x7c\x4e\x29\xa2\
+\x7c\xe1\xa9\x20\x92\x32\x3b\xfb\x0a\xf8\x13\x30\x63\x9d\x4c\xc6\
+\xbc\xfc\xf2\x2b\x5c\xbc\xf8\x0c\x5b\x5b\x5b\xdc\xbb\x77\x8f\x9d\
+\x9d\x1d\x0e\x0f\x0f\x19\x0e\x87\x54\x55\x85\x88\x10\x63\x6c\x45\
+\x79\x60\xd0\x7e\x43\x6e\xa4\xcc\xd8\x90\x33\x78\x7f\x88\x89\xef\
+\x39\x43\xb7\x4a\xef\xd7\x80\x23\x84\x5d\x42\x70\x15\xd5\x4e\x43\
+\xf3\x71\x35\x0a\x21\x4c\xa9\xe8\x2c\xeb\x6f\xf5\x0e\xd1\xd1\xc9\
+\xa6\xbe\xaa\x70\x29\xf7\xbd\x2f\xca\x3b\x2c\xdb\x78\x1d\x13\xca\
+\xa7\x90\x33\xc4\x6d\xf8\x16\xda\xb6\x19\x95\x49\xad\x1c\x01\x57\
+\x92\xf8\x9d\xeb\xd1\xfb\xa6\x69\xb7\xbd\x87\x59\xdb\x6f\x26\x8d\
+\x47\xd3\x39\xed\x63\x19\xfe\x4d\x7a\x9f\xeb\xb6\x1f\x80\xae\x24\
+\xf1\x1d\x60\xa4\xca\x0b\x20\x13\xd0\xf7\x9a\xa6\xcd\xc6\xbf\x88\
+\xd9\x2e\xe7\x80\x83\x51\x1a\xb3\xc3\xb4\x2c\x00\xbb\xa8\xce\x80\
+\x49\x45\x55\xa9\x34\x33\x55\xee\x63\x76\xf8\x3e\x04\xef\x21\x1c\
+\x00\x0f\xc4\x32\x04\xb3\x8d\xfe\x79\xe0\xb0\x31\x91\x7e\x44\x27\
+\xc2\xfb\x74\x5c\x92\xc6\xcb\x61\xf5\xcd\xb3\x58\x6f\xd7\xcf\x04\
+\xf9\x40\x4f\x4c\x9f\x32\x25\x5d\xa3\x5f\xc2\xac\x9e\xb7\xb1\x0c\
+\xf8\xf3\xc0\x04\xfc\x8e\x25\xda\xcf\x8d\x77\x1e\xc3\xcf\x9b\x28\
+\x1f\x19\xe1\x98\xb2\x54\x81\x1f\x61\x93\x68\xc9\x82\x3c\x4e\xf7\
+\x46\xb0\xc5\x08\xa6\x53\xa8\xa9\xbb\x60\x87\x21\x9e\x19\x92\xae\
+\xb3\x07\xbc\xab\xf0\x34\x48\x55\xd9\xb5\x6e\x1a\x44\x6c\xb0\xb6\
+\x99\x2f\xe1\x30\xc2\x84\xf7\x9b\x74\x62\x7a\x77\xcc\x56\xda\x20\
+\xcf\x8f\x25\x22\x53\x5b\xf3\xf9\x2e\xb0\xa3\x76\xef\x8c\x7a\x6d\
+\x03\x36\x6f\xed\xb3\xac\xab\xdf\xee\xd2\x7e\xef\x61\xc7\x34\x01\
+\xce\x7a\x70\xa1\x2f\x7e\x8a\x38\x54\x57\xb0\x7e\x87\x58\x10\x01\
+\x7c\xf2\xa7\xd1\xd2\x7a\xd4\xcb\xcf\xe9\x93\x12\xe7\x04\x7a\xa9\
+\x62\x17\x5e\xd0\xcf\xa2\x3f\x26\xd0\x57\x44\x6d\x70\xd1\x39\x14\
+\x46\x83\xf1\x6c\xbc\x32\x99\x8d\xc6\x93\x63\x15\xc9\x43\x33\xf3\
+\xe3\xc9\x6a\x1d\x82\xba\xc1\xe0\x8b\x69\x89\xfd\x05\xb6\xae\x5f\
+\xc6\xb1\x60\xab\x26\xfd\xd7\x74\xef\x1e\x87\x1d\x6c\x6e\xbf\x04\
+\xbc\x43\xef\x63\x4e\xd1\x31\xf6\xac\xdb\x03\x7a\x75\xd3\xbb\x02\
+\xea\x3f\x3f\x4f\xa2\x8f\xcf\xae\x6b\xed\x75\xa8\x0b\x9d\x77\xf7\
+\x5a\x2a\xb5\x11\xe3\x2a\xf3\x9f\x09\x5f\xc3\x9e\x4f\xef\xb3\xe4\
+\x73\x61\xe1\x4a\xe5\xed\xe6\x3f\x43\x7c\x76\x10\x21\x59\xff\x87\
+\x7e\xe9\x18\xe8\x9e\x8f\x8b\xf6\xf5\x85\x42\xa1\x50\x28\x14\x0a\
+\x85\x42\xa1\x50\x28\x14\x0a\x85\x42\xe1\x0b\x44\x11\xe5\x0b\x4f\
+\x95\x10\x42\xb2\x98\x4f\xdf\x30\x3b\x2c\x6b\x3e\xad\xcf\x92\x93\
+\x4b\x75\xe1\xa3\x8b\xb8\xe4\x5d\x1f\x5d\xf7\x9d\xb5\x4b\xb5\xe7\
+\x23\x96\x0d\xbf\xba\xba\xc2\xca\xea\x2a\x97\x2f\x5f\xe6\xf0\xe0\
+\x80\xeb\x37\x6e\x72\x70\xb0\xcf\x6c\x36\x63\x3a\x9d\x31\x9d\x4d\
+\xd9\xdd\xdd\x65\x63\x63\x03\x60\x35\x98\x07\xbb\xd9\x4d\xfb\x39\
+\x89\x7e\x03\xa8\x45\x68\xd4\xb2\x60\x2f\xa4\x65\x0d\x96\xe1\x7b\
+\x80\x72\x0a\x18\x34\x34\x0a\xc4\xe9\xb4\x95\x0d\x0e\x58\x9e\x61\
+\xef\x81\x0d\xbc\xbf\xd2\x34\x21\xd7\x46\xf7\x98\x78\xf2\x0c\x26\
+\xf6\xfb\xb4\x8f\xfc\x93\xc5\x99\x5c\x43\x7e\x02\x5c\x14\x61\x4d\
+\xf5\x98\xcd\x71\x04\xee\xa0\xfa\x01\x49\xec\xee\xad\x17\x72\x5d\
+\x77\x98\x60\xe2\x6a\x16\x20\xf3\xf1\xe6\xf6\x59\x98\x7d\x06\xa8\
+\x63\xcc\xd9\xf6\x00\x6c\x21\xec\x27\xfd\xa2\xa2\xb3\x5b\x3e\xec\
+\x6d\x37\xc5\x04\xd3\x61\xaf\x4f\x9f\xc6\xb0\x86\xc6\xa7\x31\x9d\
+\x20\xb2\x81\x6a\x95\xc4\x88\x1a\x13\x78\x45\xa9\x3c\x34\xa7\x31\
+\xb1\x74\x2f\xd9\xe0\x47\x2c\x3b\xda\x32\xe5\x3b\xb1\x78\x42\x2f\
+\x7b\x5b\x04\xd4\xc4\xd2\x07\xbd\x73\x6f\x19\x81\x9b\x9a\x20\x7f\
+\x21\xf5\xf5\x13\xe0\x5d\xe0\xeb\xc0\x1b\x81\xf0\x62\x05\xbb\x0d\
+\xa3\xeb\xd0\x48\x2f\x2b\xfa\xd3\x89\xf2\xc3\xe1\x80\xd9\xec\x1c\
+\x3f\x9f\xb4\xa4\x27\x6e\x37\x05\xaa\xca\xd1\x1c\xcf\xa0\x9d\x13\
+\xe4\xab\xca\x31\x6d\xdb\xd8\x5c\x1c\xe0\xa7\x35\xc2\xb4\x3d\x3f\
+\x0f\x43\x0f\x33\x61\x86\x1f\x80\xaf\xfb\xae\x04\x36\xe6\x7d\xa1\
+\x5e\xd4\xe6\xcf\x0e\x0c\xfe\x99\x10\x76\x14\x3d\x85\x5d\xa7\x9b\
+\xc0\xb3\x0f\x39\xa7\x2c\x0e\x2e\xa9\xe5\xae\x59\xb8\xdf\x06\x9c\
+\x20\xb2\x90\xe9\xed\xb1\x4c\xfa\x09\xe0\xfd\x71\x4b\xec\x86\x87\
+\x89\xeb\xaa\x13\x6c\xce\xef\x60\x73\xb7\x61\xf9\x3d\xfb\x39\x21\
+\xa2\x7d\x95\xaf\xca\x31\x0b\xb4\x02\xbd\x73\xc4\xd0\x04\x8f\xd3\
+\x38\x59\x5d\x9f\x9e\xbb\x70\x61\xf7\xb9\x17\x5e\xde\x7e\xfe\xf5\
+\x57\x77\x9e\x7b\xf9\x95\x13\xeb\x2b\x4c\xa7\x47\x32\x1e\x8f\x7f\
+\x61\x85\xe7\x4b\x96\xfc\x27\x26\xdf\x6f\x9f\x06\x0f\xfc\x58\xa0\
+\x51\x73\xa2\xf8\x41\xb7\x38\x1c\x62\x9f\x61\xef\x00\xbd\xa7\xca\
+\x93\x98\x02\xbf\xb0\x69\xf4\xa9\xbb\x16\xc1\xa9\x3e\x22\xf0\x44\
+\x24\x05\xd9\xa4\x9b\x4b\x70\x66\x50\xa3\x6b\xd8\xe7\x59\xde\xfe\
+\x19\xec\xf1\xfa\xa7\x15\xf8\xf6\x2f\xea\xde\x3d\x9a\x5f\xa6\x8c\
+\xf9\x2c\xa6\xf7\x04\xf6\x36\x90\x08\xbc\x17\x42\x98\x30\x18\xfc\
+\xdb\xac\xac\xf7\xed\x31\x56\xd9\xd9\xba\x9f\xb7\xf1\x20\xa1\x88\
+\xf2\x85\x42\xa1\x50\x28\x14\x0a\x85\x42\xa1\x50\x28\x14\x0a\x85\
+\xc2\x17\x8e\x22\xca\x17\x9e\x2a\x9a\xd3\xd0\xfa\x66\xb0\xe9\x75\
+\xff\x5b\xf3\x85\x55\x3d\x6c\x49\x36\x93\x75\x0b\xcb\x01\xc6\x93\
+\x31\x2f\xbd\xf4\xa2\x2d\x8d\x91\xe9\x6c\xc6\xee\xce\x0e\xa3\xe1\
+\x90\xbb\x77\xef\x02\xb2\xe9\x71\xb7\x09\xa1\xab\x1e\x6b\x52\xc8\
+\x1a\x66\xf5\xbe\xa5\xca\x19\x4c\xf8\xab\xb1\xcc\xf7\xdd\x85\xc3\
+\x19\xe1\xfd\x45\x06\x83\x8a\xa3\xa3\x2c\xee\x2d\x8a\xb7\x5d\x4d\
+\x75\xb8\x4e\x08\x23\xac\xde\x2f\xa9\x7d\xb2\x8f\xe7\x3e\x26\x42\
+\x36\xc0\x1a\xaa\xa7\x00\xdf\x19\xde\xb2\x8a\x09\xc9\x8d\xb9\xef\
+\x9b\x30\xda\xab\x7b\x9d\xc5\xf1\x4d\xb2\x7d\x7d\x27\x66\x4b\x3a\
+\x86\x31\x9d\xa8\x9a\x33\xf3\x2f\xd0\x05\x00\x78\xac\x36\xfd\x66\
+\xda\xe6\x30\x98\x18\x1b\x31\x59\x64\x0f\xd5\x0b\x74\xe2\xfd\x3e\
+\x96\x65\x3e\xa6\x13\x93\x46\x74\xb6\xe5\xd9\x52\x7f\x1d\x13\x31\
+\xea\xd8\x09\xe9\x03\x54\xf3\x71\x98\xa0\x8e\xac\x28\xea\x3d\x8d\
+\x0f\x96\xc9\xb9\x23\xc2\x50\xcd\x06\x5f\xd2\x7e\x56\x81\x61\xd3\
+\x1d\x43\xb6\x31\x77\x80\x53\x4d\x02\x4c\x27\x80\xb4\x53\x2a\x25\
+\x8a\xbf\x08\x5c\x15\xc1\x3b\xc7\x8d\x10\x78\x0f\xf0\x0c\x87\xef\
+\x32\x9b\x0d\x80\x57\x1b\x78\x19\xa6\x3b\xbd\xeb\xac\xa9\x03\x61\
+\xca\x92\x14\xf4\x87\x31\xf4\x30\xbb\xc2\x6c\xf6\x16\xe6\xa0\xf0\
+\xc3\xfe\x5a\xef\x21\x04\x0f\x0b\xca\xf2\x82\x8b\x83\x24\xe1\x26\
+\xd7\x3b\xa7\x8b\x21\xf1\x5d\x81\x83\xae\xae\x3a\xa9\xc6\x7a\xf4\
+\x1e\x47\xf0\x84\x79\xd1\xde\x01\xa7\xa9\x79\x0e\x13\xa6\xed\x1a\
+\x0c\xf0\xd4\xb3\xf4\x1b\x69\x05\x79\x0b\xe2\xf0\x0d\x48\x65\x25\
+\x0e\xf2\xb5\x96\xee\xa7\xde\x4d\x02\xfd\xe9\xde\xf5\x18\x61\x81\
+\x0f\xae\x57\x87\x5d\x30\x51\x8b\x74\x06\xb5\x80\x38\xbc\xa4\x63\
+\x6f\xaf\x65\x6a\x53\x29\xea\x93\xa8\x96\x19\x61\x73\x41\x73\x27\
+\x0b\x63\x36\xc4\x02\x46\x36\xb1\xf9\xb7\xc8\x01\x76\xbf\xe5\xd2\
+\x12\xab\x1c\x13\xe5\xbd\xfb\xdc\x56\xbf\x4e\x97\x52\xb5\x96\x18\
+\x9d\x73\x5e\xf4\xcc\xd9\xf3\x7b\x17\x9f\x7d\x76\xe7\xa5\x57\x5e\
+\xdd\x7e\xf9\x1b\xdf\xd8\xb9\x74\xf9\xca\x0c\xbe\xdc\xf5\xdd\xbf\
+\x64\x59\xf2\x99\x93\x6b\xca\x7f\xb2\x3e\x50\xf8\x53\xe0\x37\x81\
+\xe7\x80\x0f\xd3\x7c\x1e\x01\x2f\xda\xad\x9c\xad\xdb\x71\x8a\x59\
+\x94\x40\x2f\x4b\x1c\x62\x4f\xcc\xce\xe5\x1a\x10\xb5\x86\x5d\x82\
+\xbd\x46\x2b\xe3\x20\x80\xc6\x7e\x7f\xf3\x42\xb8\x38\x01\x54\x14\
+\x54\xda\x0f\x49\xed\x7f\x5a\xaa\x46\x10\x87\x28\x28\x51\xd2\x6b\
+\x55\xa2\x80\x33\x8d\x3c\x7f\xc0\x0a\x2a\x8a\xa8\xfd\x26\x1f\x20\
+\xa4\xcd\x5b\x3b\x7a\xfb\x5c\x48\x71\x73\xed\x5f\x1f\xd2\x39\x5d\
+\x58\x30\x57\x5f\xf9\x4f\x31\x76\xaa\x08\x32\x50\xf4\x74\x5a\x3c\
+\x44\x39\x0f\xbc\x43\x55\x05\x1a\xa4\x69\x9a\x58\x51\x39\x80\xc6\
+\xe4\xf8\x76\xbf\x5d\xe9\x99\xf6\x77\x7a\x1d\xb2\xc3\x47\xae\x9d\
+\x23\x9c\xbb\x34\xe4\x3f\xf8\xcf\xbe\xc3\xa0\xb2\x07\xcf\xad\x6b\
+\xa7\xf8\xa3\xff\x63\xc4\xee\x03\x97\xb6\xf8\xb2\xcd\xf5\x42\xa1\
+\x50\x28\x14\x0a\x85\x42\xa1\x50\x28\x14\x0a\x85\x42\xe1\x2b\x41\
+\x11\xe5\x0b\x4f\x15\x0d\x81\xd6\x29\x3a\x65\xcc\x1f\x63\xd1\x48\
+\xda\xf5\x6a\xc3\xb7\x2b\xe3\x82\x72\xef\x70\x68\xdb\x9f\x03\x62\
+\x6a\x3a\x1a\x0e\x19\x9e\x3d\xc7\xc6\xc6\x06\xef\xbe\xfb\x2e\xa0\
+\x7f\x16\xe0\xa7\xfd\x5d\x86\x00\x0c\x38\x4b\xcd\xc7\x58\x8d\xec\
+\xe7\x30\x8b\xda\x7b\x2c\xe6\xea\x99\x05\x76\xc3\xd5\x97\x94\x67\
+\x5f\x5c\x63\x67\x6b\x8d\x6b\x1f\x0c\xb9\x7f\x3b\x67\x6e\x0f\x30\
+\x7b\xf4\xf5\xb4\x45\xe3\x3d\x37\x42\x68\xad\xf0\xc7\x98\x78\xbe\
+\x83\x1d\x47\xbd\x70\xf6\x92\x45\xf5\x24\x36\x06\x68\x8f\x2b\x0b\
+\xe3\x55\xae\x04\x20\x42\xa5\xca\xf3\x98\xd8\x38\x00\x3c\x21\xe4\
+\x63\x1e\x63\xc1\x06\x37\x81\x41\xea\x37\xa4\x51\xbb\x81\x48\x8d\
+\xaa\x60\x1a\x71\x16\xc4\x1f\x00\x9b\x84\x56\x20\x5a\x05\x36\x11\
+\x26\x74\x59\xfa\x2e\x9d\xc3\x3a\x50\xe1\xa9\xcc\x8a\x97\x7b\xa4\
+\x1c\xee\xd4\x6e\x37\x1d\xfb\x66\xe8\x2c\xf9\xef\xf5\x8e\xbb\x02\
+\xce\xa9\x8b\x87\x44\x7c\xe8\x44\xa9\x90\x04\x22\x9f\x8e\xff\x4c\
+\xea\x2b\x2f\xf3\x69\xac\x27\x79\xcc\xc4\x04\x98\x4a\x60\xa4\x0b\
+\xa2\xfc\xb4\xe2\x0c\x0d\x2f\x00\x03\x55\x7f\x0f\xc2\x3b\x0c\x11\
+\x66\xc0\x6c\x06\x56\x8b\x79\x04\xbc\x89\xf7\xc1\xd4\x72\x9b\x61\
+\x55\x85\x48\x44\x66\x30\x27\xc8\x0f\xd3\xef\x19\x30\x64\x98\x5e\
+\xc1\xcc\x8e\xed\x2a\xd2\xbc\x00\x9c\x47\x59\x03\x7e\x0c\x7c\x77\
+\x08\x71\x36\x1c\xc2\x6c\x46\x08\xc4\x21\xde\xcd\x52\xd6\xe4\x70\
+\x98\x66\xf4\xcc\xfc\xe3\x67\x79\x3e\x84\x1c\x3a\x92\x7e\xb7\x7a\
+\x71\x5f\xcc\xef\x44\xe4\xf9\x76\x4b\xc5\xe5\x1f\x01\x2f\x60\xae\
+\x01\xd7\x81\x03\xea\x34\xa6\x75\x2b\x1e\xcd\x65\xc8\x03\xd2\xe4\
+\x60\x10\xf0\xc1\x02\x05\xd2\xba\xa1\xc0\x2c\x8b\x4f\x63\x2c\xf8\
+\xe1\x59\x4c\xf8\xbe\x08\x61\xbf\x37\x64\x11\xf8\x10\x08\x22\x7c\
+\x4b\x95\x2b\x10\xf2\xe7\x52\xb6\x97\x1f\x61\xe2\xfd\x3a\x70\xa4\
+\x3a\x57\x9b\xfe\x00\x0b\x92\xa9\x80\xb3\x74\x61\x35\x60\xf3\x71\
+\x03\x9b\xc3\xee\xa4\x93\x4f\x9c\x24\x58\x3b\x08\x17\x52\xff\xc7\
+\xdb\x98\x98\x27\xc0\xed\x87\xf4\xfd\x44\xc9\x4e\x01\x31\xa8\x38\
+\x17\xe3\x64\x75\x75\x7a\xfa\xfc\x73\xbb\xcf\xbe\xf0\xe2\x83\x17\
+\xdf\x78\xe3\xc1\x2b\x5f\xfb\xfa\xde\xea\xea\xaa\x7e\x99\x45\xf8\
+\xaf\x08\x4f\x2a\x53\x5e\xaa\x8a\xba\x69\x78\x07\xf8\x15\xec\x3e\
+\xda\xc5\xca\x4c\xfc\x08\xaf\xdf\x21\x90\x82\x76\x00\x88\xea\x7c\
+\xfa\x34\x4d\x19\xdc\x78\x67\xb3\x2e\x05\xf7\x00\x21\x10\xd3\x5c\
+\xb4\x72\x2f\x76\xa8\x31\x65\x98\xd3\xfd\x9f\x3e\x8e\xf3\xfd\x93\
+\x4a\x4c\x28\xe0\xd5\xbb\x40\x88\x8e\xb4\x3f\x07\x39\xe0\x08\x3c\
+\xc1\xb7\x01\x36\xd1\xe1\x5c\x48\xc2\xbe\xeb\x02\xd0\xd2\x6b\x8d\
+\x66\x8b\xe2\x1c\xce\xb7\x71\x4d\x1e\xc0\x07\x7c\x48\x81\x49\x78\
+\x17\x7c\x40\x83\x46\x3b\x8e\x74\x8e\x0e\xd7\x7d\xd0\xf4\xef\x73\
+\x0b\xc8\x49\x61\x39\x51\xd1\x75\xe0\x5b\xe9\xe4\x5e\xc5\x02\xc1\
+\x7e\x46\xd3\x48\x93\xfe\x9c\x6e\x1e\x5e\x5a\xa0\x9f\x29\xdf\x09\
+\xeb\x21\xcc\xb7\xa9\xaa\xc0\xc5\xcb\xbb\x0c\x47\xb6\xa2\x9e\x79\
+\x62\x1c\x52\x6a\xca\x17\x0a\x85\x42\xa1\x50\x28\x14\x0a\x85\x42\
+\xa1\x50\x28\x14\x0a\x5f\x68\x8a\x28\x5f\x78\x2a\x88\xf7\x96\xd9\
+\x9a\x94\xd6\x98\xfe\xcf\x36\xf4\xf6\x36\x62\x6f\xe7\xf3\xe4\xb3\
+\x45\x7d\x6b\x57\x9f\xd6\xc5\x64\x71\xef\x5c\x6a\x9b\x2d\xef\x01\
+\x97\x55\x7c\xd7\x79\xdc\x8b\x88\x79\x9c\x43\x98\x80\x1e\xf6\x77\
+\x02\x71\x00\xa1\x86\xc0\x80\x86\x9a\x03\x4c\xc8\x38\x6e\x9e\x6b\
+\xe7\x50\xb1\x79\xaa\xe6\xf2\xf3\x33\x2e\x3f\x0f\xfb\x7b\x15\xf7\
+\x6f\x0f\x30\x31\x32\x60\x42\xfb\x1d\x4c\x78\x3f\x17\x42\xdb\xcf\
+\x4d\xdb\xe7\xa0\x12\xc2\x25\x87\xea\x12\xe5\x70\x9c\xb2\xea\xb3\
+\x58\xaf\x74\x96\xf7\xfd\x9f\x7c\x38\x92\x8e\xf5\x03\xe0\x72\x5a\
+\xa7\x49\xdc\x50\x41\x6e\x2b\xba\x43\x27\xe8\xe7\x0c\xf5\x73\xe9\
+\x5c\x66\x1e\x5f\x05\xb3\x92\x37\x7b\xf9\xf9\x7d\xd8\xb9\x98\xb8\
+\x9c\x03\x06\xb2\x85\xf8\x08\x10\x13\xf0\x05\xd0\x01\x39\x30\xc0\
+\x9e\x37\x8a\x09\xa5\x79\x99\x62\xd2\xf6\x38\x1d\xb7\x00\xdb\xc4\
+\xb8\x9d\x72\x16\x3d\x26\xde\x9e\x06\xa6\xde\x53\x85\x40\x93\xc6\
+\x32\xd0\x89\xfd\x82\x65\xe5\x67\x44\xd3\x3a\x85\xf7\x98\x17\x31\
+\xc6\x34\xbc\x81\x89\xfb\xbb\x10\x7e\x08\xd4\xc3\x24\x78\xcc\xba\
+\x31\xfe\x31\xb0\x42\x08\x2f\x09\x54\x6a\x56\xcf\x34\x0d\x6e\xd8\
+\x89\x23\x49\x8d\x1f\x9a\x18\x3f\xcb\x42\xfc\x2c\x0e\xa1\x9a\xd9\
+\xf8\xbf\x08\x5c\x49\x63\x7b\x03\xf8\xd7\x03\xb8\x51\xdb\x66\x02\
+\x33\x30\x61\x3e\xce\x2a\xbd\x90\x7a\x8d\x33\x25\x79\x1f\xcf\xf6\
+\x80\x43\x18\xa6\xe3\x9f\x45\x4c\x58\xeb\xab\x3f\x0e\x38\x62\x38\
+\x8c\xcc\x66\x76\x3b\x0d\x87\xc2\x6c\x76\x96\x56\x4c\xae\x3c\x34\
+\xf7\x99\x0f\xfa\x00\x13\xad\xbf\x8f\x05\x9e\x3c\x97\xd6\x7f\x4c\
+\x57\x2a\x61\x5e\x98\x5f\x78\x1f\x40\x30\x07\x83\x61\xba\x1e\xfd\
+\x7a\xc7\x2b\xd8\xf5\xb5\x7a\xcb\x83\xc1\xb3\xac\x9f\xbe\xc7\xec\
+\x68\xc8\xde\xce\x3e\x56\x2e\xe0\x00\xf0\xaa\xfc\x54\x60\x57\x37\
+\x4e\x9d\xa6\xaa\x22\xdb\xf7\x1d\x4e\xdf\xc1\xb2\xdc\xc7\xd8\x35\
+\x8f\x2c\xcf\x78\xb7\xeb\x31\x6f\x2b\x70\x90\xce\x6d\x97\x54\x53\
+\xfe\x21\xaa\x7c\x3e\x9f\x75\xfa\xd7\xb6\x3b\x87\x07\x2c\xf3\x44\
+\xb0\x39\x9b\x4b\x44\xfc\x42\x51\xad\x25\xa8\x13\xef\x9d\x6e\x9e\
+\x3d\xb7\x77\xe1\xf2\xa5\x9d\x97\x5e\x7f\x73\xeb\xb5\xb7\xbe\xb1\
+\x73\xf1\xf2\xe5\xa9\x17\xff\xb9\xcd\x86\x2f\xd6\xf5\x9f\x98\xfc\
+\x4c\x5e\x98\x57\xbe\x13\x8f\x09\x26\x2c\x63\xbe\x18\x79\xde\x2f\
+\xcc\xf1\xfc\x7c\xcf\x81\x23\x1f\x63\x01\x38\xdf\xc7\xee\x89\x57\
+\x08\xf6\x77\xe0\x9c\x2e\x1c\x16\xef\x94\x5e\xff\x4b\x6e\xa2\x87\
+\x04\xfc\x1c\xdf\xa6\xf7\xa6\xf3\xa6\x99\x3f\xf8\xfe\xfb\xb0\xd0\
+\x76\xb1\xbf\xb9\xd7\x69\x83\x6e\x9b\xb9\xff\xda\xf5\x4b\x36\x3c\
+\xe1\xe8\x17\x03\x9f\x18\x61\x01\x61\x97\x6c\xa5\xff\x2e\x38\xe9\
+\xaa\xcc\x64\xcc\xac\xa0\x05\x16\x95\x00\x00\x20\x00\x49\x44\x41\
+\x54\xbe\xff\x7f\xa2\x5f\x53\xde\x9e\x91\xe9\x1a\xf6\xdc\x4f\x96\
+\x88\xed\x4a\xfa\x83\xc6\x2d\xf4\x53\x84\xf9\x42\xa1\x50\x28\x14\
+\x0a\x85\x42\xa1\x50\x28\x14\x0a\x85\x42\xe1\x0b\x44\x11\xe5\x0b\
+\x4f\x85\x2c\xbd\x07\x0d\x3d\x19\xbc\x5d\xd7\xa5\xaa\x39\x07\x51\
+\xc9\xd2\x7c\x4c\x59\xf1\xed\xe2\x5e\x87\x5d\x3f\xcb\x53\xee\x17\
+\x13\xee\x63\x6a\x53\x81\x3b\xec\xbe\xdc\x6e\x7f\xd7\x75\xfa\xd2\
+\xbb\x7e\x74\x1d\x71\x0f\x3e\x38\x17\xf1\xe2\x52\xd1\xf5\x48\x57\
+\xe3\xfc\x1a\x66\xef\x9e\x8f\x70\x00\x28\x9e\x49\x12\x44\x6a\xa8\
+\x2b\x6d\x53\xfe\xdb\x36\xeb\xc0\x69\x11\xd6\x2d\x83\x18\x82\xf5\
+\x33\x06\xce\xa5\xdf\xb9\x96\xbb\xcf\x19\x88\x69\xfb\x2d\x3a\x2b\
+\xfa\x0a\xc8\x62\xbf\x57\x33\x09\xbe\x02\x92\xc5\x76\x07\x0c\xc4\
+\x86\x74\x1f\x68\x02\x39\xeb\x39\xf5\x2f\xcc\x52\x56\x3c\x58\x6d\
+\xef\x55\x45\xcf\x02\x37\x52\x86\xf4\x14\xcb\x78\xef\x05\x09\xe8\
+\x0a\x96\xed\x7c\x90\xec\xe9\x3d\xce\x9d\x23\xc6\x00\xd4\x49\xf8\
+\xf7\x98\x70\xbd\xd1\xdb\x56\x41\x06\xc9\xcc\xb8\xa2\x4b\x42\x0f\
+\x21\xb4\xa2\xf0\x69\x3a\x51\x3e\xff\x1c\x02\x87\x29\x7b\xd9\x09\
+\x52\x39\xaf\xef\x05\xcf\x5f\x31\x9b\x13\x33\xbe\x91\xc6\x6f\xe6\
+\xe1\x5a\xb0\xb1\x72\x49\x4f\xef\x73\x00\xfc\x38\x59\xe9\x5f\xa5\
+\x7b\x5e\x4a\xca\xaa\xb7\x09\x34\x6b\xff\xcb\x82\xfe\x00\xb8\x34\
+\x33\x81\xfb\x6c\xba\x4e\x77\xb1\x2c\xf4\x9f\x01\x87\x49\x15\x97\
+\x6e\x9f\x33\xdb\x4e\xf5\xd7\xb0\x92\x04\xfb\x69\xb6\x0d\x81\xfd\
+\x01\x83\xef\xd4\xcc\xd2\x66\x83\x09\xd4\x7f\x1d\xa8\x05\xa9\xb5\
+\x33\x8f\xbe\xcd\x6c\xf6\x57\x64\x25\xc9\x04\xf9\x6f\xa5\xf3\x00\
+\x9a\x74\x1c\x83\x1f\x42\xbd\xac\xb6\xf8\x87\x98\xbb\xc2\xf3\xe0\
+\x5f\x86\xb0\x85\x89\xda\x26\x58\x7b\xef\x09\x41\xbc\xc7\x07\xbc\
+\x10\x10\xec\xfa\xad\xd0\x95\x4a\x58\x87\x59\x16\x8b\x22\x36\xb6\
+\x37\x80\x0b\x82\xd4\xba\xba\xbe\xc2\xbf\xf3\xdb\x7f\xc1\x87\x1f\
+\xac\xf3\xdd\x7f\xf9\x0c\x75\x3d\xc4\x9c\x17\xce\x02\xa2\x22\xf7\
+\x78\xed\x6b\xef\x70\xe1\xf2\x11\x7f\xfc\x87\x2f\x70\x78\x98\xb7\
+\xbf\x89\xcd\x8d\x0d\xe6\x85\xa8\x35\x3b\xde\xb4\xbf\xe3\xca\x5a\
+\xbe\xa7\x4e\x62\x08\x5c\x49\x17\x20\xd2\xd9\xec\xf7\x51\xec\xbe\
+\x58\x56\xa8\x40\x38\x1e\xe4\xf0\xa9\x51\xd4\x11\xa3\x8b\x6a\x91\
+\x45\x93\xd5\x95\xe9\xb9\x67\x9e\xdb\xb9\xfa\xd2\x4b\xdb\x2f\xbd\
+\xf6\xe6\x83\x17\x5e\x7b\xed\x60\x7d\x7d\x23\x7c\x5e\x45\xf8\xcf\
+\x92\x2f\xa9\x75\x3d\x62\x01\x45\x0b\x7f\xa3\x85\xf9\x29\xde\xba\
+\x66\x9c\x88\x07\x5c\xd3\xb4\x9f\x5d\x7f\x05\x6c\x0a\xbc\xa9\xf6\
+\xbc\xfc\x18\x0b\x3e\x2a\x3c\x06\x02\xeb\x0a\xab\x22\x5c\x50\xe5\
+\x1d\x08\x53\x96\xfe\x5d\xd0\xf4\x2e\xdc\x5c\xe6\xfc\xf1\x9a\xf2\
+\x9d\xe2\xef\xd2\xd5\x75\x6d\x44\x61\x1f\x27\x7d\x11\xbe\x08\xf2\
+\x85\x42\xa1\x50\x28\x14\x0a\x85\x42\xa1\x50\x28\x14\x0a\x85\xc2\
+\x17\x90\x22\xca\x17\x9e\x0a\x21\x84\x64\x81\x1b\x2c\xeb\x3d\x11\
+\x5d\x27\xa8\x5b\xc6\x7b\x2f\x33\xbe\x6d\xd3\x4f\xa6\x8f\x26\xd7\
+\xbb\x9c\x6b\x9f\xe4\xfb\x68\x02\xbe\x73\xa9\x65\xec\x6f\x67\x6f\
+\x34\xed\x27\x7d\x65\xee\x60\xec\x18\x1f\x99\xa9\xef\x78\x0c\x47\
+\x47\xb9\xfe\xb5\x4b\xb6\xee\x27\x5a\x5c\x07\x19\x54\xac\xaf\x0d\
+\x68\x9a\x06\x69\xbf\x3c\x3f\xc2\x04\xc5\xbd\xb9\xd6\x22\x1e\x55\
+\x18\xac\x6e\xf0\xcc\x85\x21\xfb\x3b\x35\xdb\xdb\x63\x08\x23\x4c\
+\x9c\xdc\xc0\x84\xdc\x1a\x33\x13\xf8\x09\xf0\x13\xe0\x8c\xc0\x44\
+\x6d\xbd\x00\x77\x44\x78\x46\x95\xca\x32\xc8\xb3\xd5\x70\x2b\xc4\
+\x5f\x01\xd6\xbd\xf9\xaf\x67\x41\x7d\x80\x09\xd2\x37\x40\x0f\x92\
+\x45\xbd\x03\x50\xcb\x44\xae\x99\xcf\x88\x9e\x02\x3b\x28\x6b\x78\
+\x5f\x41\x70\x44\x59\x55\x55\xd7\x0d\x5d\x6b\x43\x1f\x68\xb3\xea\
+\x7d\x05\x61\x06\x6c\xa3\x3a\x4e\x6d\x06\x10\xa7\x58\xc6\xe6\xe9\
+\x74\x4c\x13\xe0\x10\x64\x0b\xd4\xa7\x8c\xf4\xf3\xa0\xdb\x88\x54\
+\x49\xcc\x3f\xc2\xc4\xe2\xf5\xde\xb9\xcd\x80\xbd\x24\xc0\xe7\xc0\
+\x82\x1d\x60\x80\xa6\x9a\xf2\xe8\x3e\x81\x8f\x4c\x3c\xc6\xe4\xd7\
+\xe0\xdf\x20\x84\xf3\x82\x38\x45\x6f\x0b\x83\x0f\x03\xb5\x64\xdd\
+\x7f\xd8\xd9\xc4\x67\xee\x29\xfa\x01\x96\x1d\x79\x80\x09\xc8\x6e\
+\x36\xc3\x0d\x19\xba\x19\xc0\xd0\x0c\xeb\x99\xcd\x2a\xcc\x19\xe1\
+\x0a\x56\x33\x7e\x8c\x05\x2a\xbc\x9f\x8e\xed\x1c\xf0\xcb\xe9\x75\
+\xc3\x71\xd7\x05\x8f\x6a\x85\x65\xb1\xee\xd1\x99\x48\x3c\x5b\x53\
+\xbf\x05\xdc\xb7\xfa\xf0\xf5\x20\x8d\xf5\x0f\x14\xcd\x82\xb0\x03\
+\xce\x03\xaf\x62\x41\x20\x82\xf7\xe7\x09\xe1\x88\x54\x9a\xa1\xaa\
+\x20\x36\x9c\x0d\xd4\x2f\x61\x01\x02\x47\xa9\x7f\x05\xe2\x10\x74\
+\x66\xe2\xf3\xf7\x21\x5c\x06\x2e\x7a\xfc\xf9\x40\xb8\x89\xd9\xe6\
+\x8b\xc7\xfb\x10\x42\x16\xe3\x4f\x61\xa2\xb8\xa6\xbe\xf6\xb0\x60\
+\x89\x01\x4b\x32\x39\x15\x75\x38\x3f\x45\x86\xca\x70\x08\x01\x27\
+\xc8\x55\x45\x67\x69\x9e\x59\xa0\x80\xab\x14\x11\x35\x7b\x8b\x76\
+\x0e\x2e\x14\xb0\x48\x08\x07\x28\x1f\xa7\x65\x9b\x1c\x67\x88\xcd\
+\x9b\xb3\x2c\xcf\x66\x0f\x08\xfb\x28\xd9\x41\x60\x25\x9d\xc3\x67\
+\x4e\xb6\xa5\x0f\x8d\x7a\x5f\x49\xd8\x3c\x7b\x66\xef\xd2\x95\xe7\
+\x1e\xbc\xfc\xfa\x1b\x5b\x2f\xbc\xf1\xe6\xde\xd5\xe7\x9f\x3f\xfa\
+\x22\x8a\xf0\x25\x4b\xfe\xe7\x43\x9f\x90\x7d\xbd\x08\xe2\x1c\x12\
+\x02\xb1\xaa\x70\x4d\xc3\xb7\x81\x7f\x53\xe0\x25\x35\xb7\x94\x87\
+\xfa\xad\x17\x3a\xd4\x9e\x27\xaf\xab\xf2\x23\xe0\x67\x95\x95\xf1\
+\xa0\xfb\x53\xba\x1b\xca\x13\x06\xb5\x15\xd5\x3d\xb8\x24\xc7\xc7\
+\x6c\x93\x9f\x9c\x3e\x4e\x12\xdb\x17\x45\xf9\x42\xa1\x50\x28\x14\
+\x0a\x85\x42\xa1\x50\x28\x14\x0a\x85\x42\xa1\xf0\x05\xa3\x88\xf2\
+\x85\xa7\x82\xd6\xb5\x00\x68\x58\xd4\x25\x3f\x23\x1c\xc4\x4e\x63\
+\x4f\x59\x6b\x49\x90\x87\xfc\xdb\xa5\x1c\x44\x4d\x82\xfc\xb2\x4c\
+\xf9\x09\x70\x0e\x8f\x95\xd8\x8e\xd1\x6a\x7e\x9b\x97\x7e\xb6\x6b\
+\xef\x23\xc9\xd2\xdd\xb1\xba\xba\xc7\xb7\x7e\xf3\x88\xc3\xc3\xc8\
+\x9f\xfc\xd3\x4d\xf6\x77\xaf\x62\x19\xd5\xdb\x98\x98\x7f\x84\x09\
+\x8a\x43\x2c\x83\xf7\x96\xc2\x8e\x08\xab\xaa\x9c\x05\x76\x55\x19\
+\x03\x97\x43\x60\x07\x13\x45\x0f\xe9\xb2\x7f\xef\x02\xb3\xe0\x83\
+\xf7\xc1\x57\x81\x10\x93\x88\x7d\x0f\xb8\x89\xc8\xb3\x21\x68\xdf\
+\xbe\x7e\x2d\xfd\xce\x19\xef\xb9\x0e\xbb\x02\x43\x13\x65\x21\xa0\
+\x39\xd8\xe0\x3c\x9d\x70\x54\x89\x70\x59\x95\x55\x5b\x16\x44\x10\
+\x51\xf4\x62\x6a\x53\x61\x11\x16\x29\x6b\x5b\x04\xef\x3c\x31\xcc\
+\xec\x78\xf4\x14\x66\x39\x2f\xe9\x3c\xb6\x7a\x7d\x0b\x26\x8a\xbb\
+\xde\xfb\x1d\x41\xbc\xa6\x0c\x7c\x11\x7c\x1a\x93\x31\x70\xdb\xe3\
+\x25\xd9\x00\x77\x42\xc6\x8c\x4b\x10\xae\x00\xab\x8a\xae\x79\xcf\
+\xed\x3a\xd4\xbf\x64\xc7\x93\x92\xcb\x53\x7d\xe4\xbc\x28\x89\x26\
+\xc3\xd4\xaf\xa4\xb1\x70\x80\x6b\xe5\xfb\x38\x18\x50\xcf\xae\x60\
+\x99\xf1\xa7\xe8\x9c\x0a\xae\x01\x07\x78\xbf\x4e\x8c\xcf\xa6\xca\
+\x04\x17\xc5\xec\xec\xf7\x80\x9d\x85\xc9\xe1\xd2\xbe\xf6\x69\xb3\
+\xdb\x89\x58\x26\xeb\xb3\x58\x20\x43\xa4\xb3\x88\xdf\x61\x3e\xab\
+\x7b\x1b\x78\x0d\xf8\x75\x20\x10\xc2\x24\xad\xdf\xab\x2c\x5b\x16\
+\x60\xcf\x7b\x9e\x0b\x81\x5f\x4a\xfb\x3b\x03\xcc\x10\xd9\x9f\xa9\
+\xee\x62\x01\x13\x0f\xb0\xcc\xf4\x7b\x81\xf0\x32\x36\x97\xa6\xc0\
+\x4e\x20\x8c\x04\xce\x21\x8c\x55\x45\x41\x1f\xd0\x05\x9d\x88\x20\
+\x97\x15\xbd\x80\x09\xf3\xab\xe9\x58\x27\xc0\x19\x11\xb6\xd4\x45\
+\x3b\xde\x10\x80\x10\x15\xbd\x47\x5b\xc2\x81\xb3\x80\x43\xbc\x23\
+\x8a\xfd\xcc\xdb\x35\x6f\xb2\x20\xf4\xa3\x6d\xf9\x83\x65\x9f\x65\
+\xb9\xa6\x7c\x2e\x3b\xb1\xec\x61\x13\x50\x76\x39\x9e\x1d\xff\x49\
+\x38\xd1\x41\xe3\x71\x08\xa1\xf1\xce\xc5\x38\x5e\x59\x9d\x9d\x3e\
+\x73\x61\xef\xf2\x8b\xcf\x6f\xbf\xfe\x8d\x5f\xda\x7a\xf5\xeb\x6f\
+\xed\x8f\xc7\xe3\x52\x1b\xfe\x21\x7c\x59\xb3\xe4\x13\x82\xc7\x7b\
+\xac\x7e\x3b\x80\xef\xd5\x52\xcf\xf8\x54\x8f\x3d\xb4\xf5\xdf\xbb\
+\xe5\x81\x20\x0a\x2e\x09\xbd\x92\x9e\x01\xb5\x5a\xd9\x88\xd7\xb0\
+\xe7\xcd\xb2\x72\x10\xbf\x68\x9e\xa6\xfd\xfa\xa7\xd9\xe7\x2a\x56\
+\x0e\xe5\x3b\x80\x7b\x98\x04\x9f\x3f\x47\x16\xae\x57\x6b\x5b\xdf\
+\x73\x37\x48\x82\x7c\xb2\xb1\x5f\x6a\x5f\x4f\x2e\x93\x53\x32\xe5\
+\x0b\x85\x42\xa1\x50\x28\x14\x0a\x85\x42\xa1\x50\x28\x14\x0a\x85\
+\x2f\x30\x45\x94\x2f\x3c\x55\x42\xb0\x84\xd8\x18\x93\x53\x7d\xb4\
+\xac\xf7\xb6\x8e\xfc\x9c\xcc\xd0\xf9\xdc\x77\xe6\xae\xa9\x46\x3c\
+\xbd\x8c\xf9\xe8\x2c\x4b\x9e\x94\x1d\x1f\xe7\xed\xf0\x5d\x36\xc1\
+\xef\x89\xf2\xa3\x11\x32\x9d\x82\x69\xdf\x53\x18\x1d\x81\x0e\xc4\
+\xd7\xb5\x0b\x9d\x38\xdd\x27\xd7\x30\x5f\xc5\x84\x8d\x88\xf7\x10\
+\x75\x31\x93\x6d\xd0\x7b\x7f\x1a\x38\x8d\x09\xe9\xf6\x2d\x7e\x8c\
+\x0e\xef\x23\x2e\x1e\x62\xd9\xcb\xd7\x99\xb7\xc9\xae\x44\x88\xea\
+\xfc\x20\x59\xd3\x8f\x50\x69\x40\x2b\x4c\xc4\x7c\x80\x89\xbf\xab\
+\xc0\x39\x90\x08\x7a\x06\xcb\x2c\x7f\x1f\xab\x19\xec\x03\xa6\xbe\
+\x47\x15\xaf\xe6\x64\x7f\x19\xd5\x24\xc2\x7b\x81\x90\xeb\xb6\xcf\
+\x40\x9c\xc7\xe5\x9a\xf2\xa7\x80\x75\x84\x01\x4a\x15\x20\x24\xb1\
+\x7d\xcd\xd6\xc9\xdd\x54\xf7\x7d\x45\x95\x43\x81\xfb\x6a\xe7\x5a\
+\x21\xba\x22\xca\x4c\x4d\x3c\xce\x02\x7b\xda\x87\x7a\x02\x1e\x61\
+\x88\x09\xce\x67\xe8\x04\x8b\x06\x70\xa8\xf6\xb7\xf1\x02\xbb\xda\
+\x89\xf2\x67\x93\x6d\xfb\x75\xac\x1e\x79\xce\xba\x07\xa8\x7a\x26\
+\xcf\xce\x9c\xf9\xeb\x75\xe0\x95\xd4\x7f\x00\x76\x42\xe0\x54\xd6\
+\xd9\x85\xd0\x9a\xc0\x87\x98\x55\xd6\xac\xc1\x8b\x03\xdd\x42\xa8\
+\x04\x86\x22\x48\xd3\xb4\x25\x06\xae\x52\xd7\x97\x30\xc1\xd8\x83\
+\xec\x24\xa1\xba\x06\x86\x1e\xbf\x19\x42\xb8\x0f\x6c\x81\xdf\x30\
+\x21\x1a\xbc\xe7\x7e\x08\xdc\x9d\x9b\x51\x15\x43\x1a\x5e\xc7\x44\
+\xee\x03\xb0\x52\xf3\xcc\x60\x36\xe4\x07\x43\xfb\x0d\x33\x06\x98\
+\xe0\x7c\x40\x17\x46\x92\xf9\x0e\x50\x0d\xcd\xa6\xe0\x19\xec\x67\
+\xbf\xa7\xde\xc4\x10\xf8\x3e\xdd\x38\x7e\xcd\xe3\x5d\xd0\x70\x0d\
+\x0b\x00\xb9\x02\xbc\x84\x05\x66\x5c\x03\x7e\x64\xf3\x8a\xab\xc0\
+\xaf\x00\x41\x61\x1b\xe5\x96\xc7\x4d\xd3\x28\xb7\x02\x9b\xa2\x53\
+\xac\xde\x72\x9e\xc3\xa7\x53\x9f\x13\x55\xee\x81\x38\xa2\x59\xb3\
+\x5b\x76\xa8\x1e\x02\x8d\xa4\xa0\x0d\xcd\xd6\xcd\x31\x3a\xba\xa0\
+\x8a\x33\xa9\x1f\x73\x43\xb0\xcb\xe2\x7b\xfb\x1d\x63\xf3\x7f\x3e\
+\xab\x58\x38\x4c\x82\x7b\x5b\x53\x9e\x93\xc9\xfb\x1a\x71\x5c\xec\
+\xca\xfb\x58\x26\x82\x09\x8f\x27\x6a\x76\x8e\x01\xaa\xd4\x4d\x53\
+\x79\xef\x74\xf3\xf4\x99\xbd\x0b\x57\xaf\xec\xbc\xf8\xf2\x1b\xdb\
+\xaf\x7e\xe3\xad\x9d\x4b\xcf\x5e\x3d\xfa\x3c\xd7\x86\x2f\x7c\x66\
+\x58\xa0\x58\x40\x1e\x5a\xea\x9d\x63\x86\xf6\x8b\xcb\x25\x3d\xbf\
+\x16\x03\x47\x6e\x01\x7f\x8c\x3d\xb7\x96\x95\x65\x78\x22\x08\x92\
+\x5c\x58\xe6\x5d\x66\x04\xd1\xe4\xf2\x11\x93\xb3\x0c\xad\x13\x8d\
+\x88\x3b\xd1\x95\x46\xc4\x09\x8a\x2a\xd1\xfa\x56\x54\xd2\xa9\xa9\
+\xc6\xfe\xb6\x22\x38\xa5\x17\x31\xa3\xed\x2f\x15\x24\x2c\x1e\xd3\
+\x63\x92\x1d\x70\x8e\xfa\x5d\x2f\xa3\x77\xad\xfa\xcf\x8d\x93\x45\
+\xf5\x65\x17\xb7\x8f\xc8\xf1\x6d\x0a\x85\x42\xa1\x50\x28\x14\x0a\
+\x85\x42\xa1\x50\x28\x14\x0a\x85\xc2\x17\x8a\x22\xca\x17\x9e\x2a\
+\x21\x04\xdc\xe2\xd7\xcc\x59\x7b\xef\x5e\x9c\xf8\xba\xb5\xb6\x77\
+\x0b\x4d\x96\x62\x0d\xda\xe6\x5d\xdd\x79\x37\x9d\xe6\x2d\xa7\xdd\
+\xaf\x41\x9d\xed\x65\xb3\x90\x9b\x7b\x5f\xc7\xb2\xc4\xc1\xb2\x7c\
+\x4f\x13\x42\x85\xab\x22\x4d\x36\xa4\x8d\xf9\xcb\xfb\x35\x4c\x54\
+\xcc\x99\xde\xbb\xc0\x51\x55\x11\x9b\x98\x4f\x22\xba\xa4\xab\xec\
+\x71\x5c\xfc\xb7\x3a\xef\xab\xeb\x03\x2e\xbd\xb8\xc1\xed\xeb\x23\
+\xdd\xba\xbd\x81\xd5\x61\xbf\x95\xda\x4f\xd3\xeb\x03\xcc\x02\xfb\
+\x2d\x4c\xc4\x3c\x03\x9c\x42\x64\x13\xd5\xdd\xd0\x89\x9f\xcf\xd0\
+\x65\xe2\x67\xeb\xf9\x98\xce\x65\x8a\xd5\xb6\x15\xcc\x2b\x7d\x06\
+\xdc\x45\xd9\x48\xef\x21\x59\xb8\x03\x63\x04\x41\xf1\x02\x53\x85\
+\xdb\x6a\xfb\x8c\x98\x50\x3e\x03\x6e\x21\xb2\xd6\x13\xd8\x1b\x2c\
+\x90\xc0\x44\x6c\x45\xd2\xfb\x11\x9d\x70\x3f\x4e\xeb\x6f\xd9\x7b\
+\x39\x12\x74\x47\x4d\x88\xf6\x88\x8c\x51\x1d\x62\x99\xe1\xce\x43\
+\x95\x02\x27\xb6\xd3\x98\xe5\xec\xff\xf4\x53\x0f\x80\x37\xb1\xac\
+\xe9\x3c\x5e\x29\x33\x5a\x7b\xff\xd3\x17\x6e\x7a\x4b\xd5\x2c\xd4\
+\x55\x86\x8a\xee\xa8\x1d\xf3\x4b\x98\x50\x7d\x2a\x35\xda\x15\x64\
+\xaa\x68\x93\xce\xa3\x01\x7e\x16\x08\xbb\xc3\x21\x58\xed\xf8\x70\
+\xd1\xc3\x4e\x80\xd5\xe4\x6c\x70\x7f\xee\x4a\x37\x83\x11\xd4\xb5\
+\x5d\x47\xf6\x21\x6f\x67\x47\xdb\x2b\x5d\x3f\x4c\xfd\x1f\xa4\x1f\
+\xc6\x63\xdc\xd1\x51\x77\x07\xa4\xcd\xd6\xd3\x35\xde\x9b\x2f\x7a\
+\x9e\x02\x4f\x6c\x2c\x6e\x43\xd8\x00\x6e\x30\x1c\x3a\x66\xb3\x77\
+\xb1\x71\xbe\xea\x3d\xaf\x87\xc0\x2e\x56\x3a\xe1\x01\x76\x0f\x9c\
+\x4f\xfb\x9e\xf6\x9c\x08\xfa\x59\xaf\xfb\xe9\xda\x7d\x9b\xaa\xfa\
+\x09\x4d\x13\x05\xf9\x08\x38\xa5\x28\xb8\xe8\xda\x7b\xc4\x42\x6b\
+\x72\xe9\x84\x01\xe0\x19\x0c\x06\x0c\x87\x74\xa2\x3d\x55\xfa\xb9\
+\x8d\x05\x77\x6c\x08\x1c\xa4\x12\x0e\x13\x2c\x30\x26\x8b\x8a\xab\
+\xd8\xfc\x0b\xa4\xa0\x88\xb4\x3c\xd7\xbd\x5f\x26\xa2\x09\x26\xd6\
+\x9f\x4e\xfb\x19\x71\xbc\x44\xf7\xcc\xd6\x4b\x5c\x9e\x6c\xdf\xd6\
+\xa3\x5f\xa4\x4a\x63\xf1\x21\xdd\xf3\xc3\x6d\x6c\x6c\xf0\xe2\x6f\
+\xfc\x5b\xef\xbd\xf4\xb5\xaf\x6f\xbf\xf6\xb5\xaf\xed\x7d\x99\x6b\
+\xc3\x17\xeb\xfa\x4f\x45\xbe\xb7\x3e\x0d\x92\x32\xac\x97\xf5\xf3\
+\xb3\x4f\xd9\xf7\x23\xd1\xe5\xf7\xcb\xfc\x72\x5d\xf4\x0b\x71\xce\
+\xf7\xe2\x6b\xb2\x03\x80\x05\x0f\x81\xfa\xfc\x41\xa4\x04\x88\xb6\
+\xbd\x9f\x13\xf6\x3d\xb8\xa0\xf9\x45\xfe\xd8\x0a\x6d\xaf\x79\xff\
+\xf9\x7d\x30\x0b\x18\xb2\x7f\x7c\xc6\xf6\xb4\x54\x2c\x97\xe3\xad\
+\x1f\x8b\xfe\xb3\xf2\x61\x36\xf5\xcb\xf1\xde\x25\xf1\xbe\x88\xf3\
+\x85\x42\xa1\x50\x28\x14\x0a\x85\x42\xa1\x50\x28\x14\x0a\x85\xc2\
+\x17\x90\x22\xca\x17\x9e\x2a\xaa\x4a\xd6\xb3\xb2\xae\x8e\x73\x38\
+\x8d\xbd\xec\xf6\xb6\x49\x7a\xe9\x68\xc5\xb1\x85\x75\x9d\x58\x1f\
+\xe7\x34\xfc\x5c\xaa\xde\xb2\xe7\x2d\x5b\x5e\x35\xef\x7f\x4e\xc4\
+\x35\x59\x8e\x11\x4c\xa7\x0e\xdf\x5a\xff\xc6\xd4\xee\x2a\x26\x1a\
+\x67\xab\x6f\x80\xd3\x78\xbf\x4f\xd0\x88\x97\xd6\xfa\x1c\xf0\x82\
+\xbc\xa0\xe8\x16\x26\x18\xdf\x23\x65\xd8\x37\x0d\x0e\x3f\x30\xa1\
+\x24\x46\x87\x48\x6b\x6b\xdb\x63\x00\x9c\x41\x79\xc0\xda\x66\xe0\
+\xb5\x6f\x1c\x31\x3d\x1c\xb0\x75\x7b\x8a\x65\x88\x7f\x84\x89\xfe\
+\x39\x53\xf7\x08\x06\x01\xf4\x0e\x84\xb7\x20\x59\xda\xab\xd6\x20\
+\xe7\x4c\x8a\x50\xb3\xf3\x16\xb9\x85\xea\x73\xb6\xcf\x10\x11\x11\
+\x54\x2f\x02\x0d\xa2\xf7\x50\x72\xa0\xc0\x0c\x13\x7e\x37\xc1\x3b\
+\x7c\x70\x04\x3d\x22\x67\xf4\xcf\x5b\xea\xe6\x8c\xf1\xbe\x58\xfb\
+\xac\xa8\xaa\x82\x13\x70\x6a\x35\xc0\xa7\xcc\x65\xc5\xcb\x14\x74\
+\xd8\xdb\x6e\x0d\x88\x62\x97\x4d\x02\xda\xa4\xab\xed\x3d\x5e\x82\
+\xc6\x90\xc6\x32\x05\x10\xb4\xdb\x35\x98\x48\x7e\xb7\x77\x4c\x0e\
+\x78\x03\xcb\xf6\x3e\xc4\x84\xa8\x6b\x3c\x36\x03\x06\xd4\xd4\xe0\
+\x52\xd9\x81\x4b\xc0\x6b\x48\xeb\x78\xb0\x07\x4c\x11\xa9\x55\xf5\
+\x01\x70\x67\xc8\xf0\x43\xcf\xcc\x2c\xdd\x27\xb8\xc3\x43\x18\xc1\
+\x70\x0a\x2b\x0e\x3e\xf2\xf8\xb5\x40\xd8\x05\xee\x33\xc1\xa5\x4a\
+\xea\x40\x3d\xf2\x9e\x3a\x0c\xc6\x87\x1c\x1d\x1d\xb0\x5c\xe8\x25\
+\x9d\x67\x12\xe5\xd7\xf7\x61\x97\xa3\xc5\x7c\x79\xe3\x30\xfd\xec\
+\xcd\x2f\xee\x12\x63\x07\x03\xee\xd6\x35\xa7\x81\x03\x44\x72\x70\
+\xc6\x2e\x70\x2b\x04\xd6\x81\x57\x3c\xbc\x1e\xe0\x67\x83\x01\xdf\
+\xaf\xeb\x6a\x13\xe2\x4b\x10\xaf\x80\xee\xa4\xfe\x1d\x78\xf1\x3e\
+\xb8\x10\x68\xb0\xf9\x78\x9e\xa6\xb9\x07\x3c\x50\xcb\x86\xcf\xb6\
+\xfe\xce\xee\x91\xe8\x52\x29\x85\x35\x4c\x5c\x5f\x13\x44\xb5\x1a\
+\x1e\x32\x9c\xa4\xac\xd1\xe8\x3c\xc4\x80\x6c\x61\x36\xf7\x96\x4d\
+\xaf\x7c\x9b\xee\x7e\xfc\x26\x16\x78\x90\xdd\x03\xae\xa5\xdf\x23\
+\xac\x94\xc2\x1a\x5d\xa6\xfc\x4a\x3a\xf9\x1a\xbb\x43\x9b\xb4\x6c\
+\x1f\xbb\x57\x0e\xb1\xbb\x3f\x07\x5a\x40\x17\xac\xc2\x09\x82\x7c\
+\x3b\x94\x4b\x96\x1d\x60\xf7\xfd\xff\xd5\x1f\xf4\x97\x5f\x7e\x99\
+\xff\xf8\x6f\xff\xee\x07\x5f\x56\x21\xfe\xb3\xe2\x4b\x6e\x5d\x0f\
+\xf6\x8c\x7c\x4c\x51\xbe\x27\x0f\xcf\x2b\xc5\x22\x96\x96\xfe\x70\
+\x81\xff\xe7\x50\x97\x7f\x61\x84\x63\x32\x78\xb2\x7b\x4f\x4b\xc3\
+\xdc\xa1\xba\x76\xe1\x5c\x5b\x7a\x6d\xbb\xd6\x8b\xa7\x18\x4e\x7e\
+\xc1\xdc\x3e\x4f\x3a\x54\x00\xef\x9d\x49\xf7\x9e\xe4\x66\x63\xd8\
+\xdf\x0e\xd1\xdb\xe7\x66\xb6\xb1\x7f\xf4\xf5\x14\x71\x4b\x1f\x35\
+\xaa\xfd\x6c\xfa\x2f\xf3\xbc\x2f\x14\x0a\x85\x42\xa1\x50\x28\x14\
+\x0a\x85\x42\xa1\x50\x28\x14\xbe\xb4\x14\x51\xbe\xf0\x54\x89\xb1\
+\xfb\xf6\x39\x76\x0b\x8f\xbb\xd6\xcf\xbd\x3c\xb6\xe0\xd1\xeb\x62\
+\x6f\x51\xaf\x7f\xed\xb2\x08\xbb\x2f\xcb\xa7\xe9\xbf\xc1\x40\xd0\
+\x3a\x0b\xbe\x2b\x98\x20\x9b\xed\xe2\xb3\x0c\x6a\xeb\x95\x19\x5e\
+\xb2\x2d\xb7\x7d\x21\x0f\xaa\xe8\x5d\x4c\x08\xce\x27\x3a\x48\xf6\
+\xdb\xca\xfa\xfa\x00\x3c\x0c\x87\x8e\xd5\xd5\x8a\xfd\x1d\x30\x79\
+\x64\x1d\xcb\xf8\xcd\x35\xb1\xdf\x05\x8d\x48\x12\x32\x6d\x9f\x96\
+\xfc\x2c\xe2\xf0\x5e\xb8\x70\xf5\x0c\x4d\xb3\xce\xad\x8f\xf2\xb7\
+\xf6\xf7\x30\xd1\x7e\x02\x5c\x07\x37\x01\xa6\x82\x3c\xaf\xe8\x6a\
+\x12\xe4\xcf\x03\x63\xef\x39\x32\x53\x75\x1a\x41\x0e\x54\x35\x25\
+\x5a\x7b\x07\x41\x40\xae\x82\x4e\x7c\x36\x01\x10\x22\x2a\x8a\xb0\
+\xd2\x65\x39\xca\x0a\x66\x47\xdc\x4a\xcc\xe9\x5c\xf6\xd5\xc6\x2a\
+\x47\x4b\x0c\x81\x0b\x02\xc3\xb4\xe5\x18\xf4\xbc\x83\x49\xef\x72\
+\x3d\x00\xee\x76\xb9\x8c\x71\x0c\xba\x86\x88\x06\x0d\x49\x38\x16\
+\x9f\x6c\xfa\xef\xf5\xf6\xf7\x0c\xf6\x4c\x8b\x1e\xef\x03\xa1\xc2\
+\xea\xb7\xaf\x02\xb5\xf7\x7c\x1c\x02\x1f\x32\x18\xb8\x41\x0d\x35\
+\xf5\x71\x51\x74\x90\xc6\xb7\x66\x58\xc1\xb0\xa1\x5e\xab\xed\x7a\
+\xe4\x1f\xcb\xe8\x36\x17\x80\xa3\x74\xbe\x37\x50\xff\xd1\x06\xfa\
+\xe3\x1d\x38\x9c\x31\x6b\x03\x3c\xce\x1f\xe2\x0e\x81\xa9\x59\xf4\
+\xd3\xc0\x6e\x92\x72\x76\x81\xad\x76\xb4\x2e\x5e\x74\xdc\xba\x35\
+\x09\x81\x19\xe1\xe8\x90\x94\x29\x0f\xd8\xac\xbb\x39\x77\x4b\x64\
+\x41\xf9\x10\x76\xf7\x00\xae\x72\xd5\x5d\x9b\x8f\x35\x88\xe9\xd8\
+\x8e\x30\x51\xde\x01\x9c\x3b\x07\xdc\x85\xbb\xe9\x56\x10\x61\x2b\
+\xb5\x3f\xe0\xe8\x68\xb1\x30\xf2\x1e\x70\x2b\xc0\x6f\x00\xaf\xd5\
+\x35\xef\x43\xb3\xc3\x60\xf0\x3d\xea\xfa\x32\x70\x19\x64\xc3\x04\
+\xf3\x90\xf5\x22\x49\x99\xec\x17\xa9\xd8\xb6\x22\x0d\x32\x01\x3d\
+\x0d\x6c\xa1\x58\x10\x8a\x45\xd6\xe4\xb9\xbe\x05\x7c\xa4\xa8\x39\
+\x30\xc4\x68\xf5\xe4\x55\x09\x50\x63\x36\xd3\x15\x96\xcd\x3e\x4a\
+\xe7\x16\x7a\xe3\x90\xb9\x8b\xd5\x7b\xce\xec\x60\xc1\x18\xfb\x69\
+\xfb\x01\x9e\x6b\x04\x86\xd8\x7d\x31\xc1\xee\xa3\xad\x74\x3d\x48\
+\xcb\x36\xd2\xb8\xe5\xe0\x87\x9c\x79\xbf\x4c\xa1\x7b\x94\xb0\x7e\
+\x80\xcd\xe7\x36\x6c\xc2\x39\xf7\x95\xb0\xa7\x2f\x59\xf2\x9f\x9a\
+\x4f\x60\x57\x1e\x96\xbe\xc4\x82\x58\xa0\xab\xc5\xf1\xc8\xcd\x7f\
+\x91\x2c\xa9\xb3\xee\x20\xc5\x04\x78\x9f\x45\xe7\xe8\xf1\x2e\x67\
+\xb7\xe7\x88\x01\xdf\x8b\x1c\x08\x5d\x7f\x8f\x74\x7d\xff\x85\xd3\
+\x06\x11\x2c\x64\xb0\xdb\x42\x17\xba\x28\x02\xb7\xe4\xe7\x38\x27\
+\x5d\xa5\xe3\xf6\xf5\x45\x98\x2f\x14\x0a\x85\x42\xa1\x50\x28\x14\
+\x0a\x85\x42\xa1\x50\x28\x14\xbe\x60\x14\x51\xbe\xf0\x54\x18\xae\
+\xae\xd6\x7f\xf3\xef\xff\x83\xbf\xf5\xa4\xfb\xfd\xdf\x7f\xff\x1f\
+\xfe\x6f\xbf\xf5\x5b\xbf\xf5\x58\x6d\xdf\x7e\xfb\xed\xce\xc2\x7e\
+\x38\xec\x44\xf9\xec\x19\x5e\xb7\xa6\xdf\x39\x0b\x7b\x1b\xf8\x80\
+\x79\x21\xce\x03\x8a\x77\x4d\xa7\x0e\x84\xa4\x14\x08\xa0\x7b\xcc\
+\x7f\xcd\x9e\xc5\x91\x88\x1f\xd0\x8a\xf8\xe3\x95\x2c\xfc\x5f\xa5\
+\xcb\x6e\xfe\x00\x38\xe3\x61\x16\x02\x62\x5f\xec\xb7\x96\xdf\x29\
+\x8b\x5e\xc7\x38\x37\xe3\x85\xd7\x0f\x18\x4f\x66\xec\x6f\xad\xb1\
+\xb7\xa7\x98\xc8\x98\xed\xda\x87\x10\xa6\xc0\x2d\x35\x15\xfd\x35\
+\x68\xc5\xd8\x8d\x10\x38\x8d\x89\x97\xf7\x14\x9d\x09\x32\x52\x74\
+\x24\x12\x3c\xb0\xae\xaa\x7b\x82\x34\x81\x30\x04\x51\x51\x1d\x82\
+\x3e\x8f\x72\x06\xe4\x63\x41\xc7\x88\xd6\x28\xd7\x80\x49\xb2\x97\
+\x3f\xb2\x72\xc6\x6c\xa5\xda\xf5\x23\x85\xa1\x83\x8d\x08\xdb\x6a\
+\x32\x45\x16\x58\xef\x44\x73\x1f\x18\x09\xe2\xd2\x31\x4e\xd2\x71\
+\x8f\x52\xbb\x5d\x54\x05\x61\x0c\x32\x41\xf5\x3c\x70\x88\xc8\x00\
+\xd5\xdc\x26\x0b\x9f\x2f\x24\x41\xfe\x19\x4c\x10\xfd\x99\xc7\xbf\
+\x17\x42\xf8\x31\xe0\x06\x35\xce\x04\xf9\x81\x87\xda\xdb\x7e\x58\
+\x05\xbf\x49\x1d\x26\xf6\x9a\x95\xa6\x13\x4e\x14\x7b\x56\x4e\x10\
+\x39\x44\xd5\x21\x1c\xa1\x7c\x08\xbc\x0b\xbc\x07\xf5\x74\xe7\xf8\
+\x14\xe3\x4e\x77\xcd\x9f\xf7\xf8\xfd\x40\x88\xc9\x82\x78\x3e\x80\
+\xe1\xd6\xad\xdc\x2e\x42\x2b\xf8\x1b\xf3\x82\x3c\xe7\xcf\xe3\xef\
+\xdc\x21\x62\x42\xf1\x14\xe0\xda\xf2\xe4\xff\xbc\xbe\xdd\xcf\x5d\
+\xab\x62\xdf\xf6\x37\x9d\xb6\x25\x13\x0e\xc8\x81\x1e\x74\x6d\xbe\
+\x06\xee\xfb\xf0\x7f\x03\x6f\x81\x7f\xb9\x22\xec\x35\x75\x7d\x0f\
+\x73\x4a\xb8\x0f\xfa\x32\x36\x77\xa6\xe9\x98\x83\x5a\x5f\x17\x69\
+\xd8\x04\x2e\x62\x62\xfb\x38\x8d\x84\x6b\x65\xee\xd6\x3e\x9f\x8f\
+\xd3\xf8\xae\x31\x3d\x1c\xf0\xaf\xff\xec\x32\x4e\x66\x84\xfa\x14\
+\x9d\xbd\x7c\xce\xb4\x3f\xa0\xbd\x87\x06\x4e\xa4\x1e\xa9\x72\x16\
+\xbb\x86\x37\x99\x17\xaa\xf2\x18\x85\xd4\xff\x0e\x81\xeb\x79\xe5\
+\x60\x80\xab\x6b\x0e\xb0\xb9\x96\x99\xa5\x73\xbb\x89\xcd\xa9\x15\
+\xe0\x79\xdb\x1f\x53\xf2\xbd\x6b\xfd\x6a\xfa\x1d\xad\x8a\x83\x2e\
+\x73\xbb\x28\xfc\x02\xf8\x0a\x64\xc9\x03\x38\xef\x91\x9c\x81\xbd\
+\x90\x71\x7d\xe2\x36\x49\xe1\x06\x1f\x48\x2e\x2f\x4f\xc2\x06\xff\
+\x91\x98\x90\x6e\xcf\x37\x4f\x48\x9e\xf0\x10\x7c\x2b\xa1\xa7\xcc\
+\xf3\x24\xae\x2f\x2a\xea\xbd\xd7\x29\xef\x7c\x4e\x82\x5f\x96\xb5\
+\xfe\xd4\x05\xf9\x4f\x8a\x9d\xd4\x23\x32\xe6\x3b\xf7\xa0\xf9\xc5\
+\x73\x6a\xfd\x97\x7d\xee\x17\x0a\x85\x42\xa1\x50\x28\x14\x0a\x85\
+\x42\xa1\x50\x28\x14\x0a\x5f\x4a\x8a\x28\x5f\xf8\x4a\xf2\xf6\xdb\
+\x6f\xf3\x1f\xfd\x37\xff\xdd\x7f\xfa\x3f\xfd\xd7\x7f\xef\x1f\x03\
+\x2e\x09\xf1\x8b\x5f\x74\x3b\x80\x01\xb8\xda\x04\xf9\xc5\x4c\xe2\
+\xdc\x46\x40\xc0\x89\xb6\x2d\xbc\x07\x34\x2b\xf3\x73\xed\x45\x69\
+\x04\x7c\xe3\x5d\xb4\xec\xb7\x56\x59\xc8\xb5\xe1\x6f\x62\x0b\x05\
+\x11\x09\xaa\xa9\x3e\x76\x93\x9b\x8e\x30\xf1\xfe\x8e\xed\xdf\x47\
+\x62\x2d\xb0\x96\x95\x8b\x0a\x78\x01\x13\xa4\xb7\x18\x8f\x3d\x17\
+\xae\x8c\xd9\xbe\xb7\xc2\xce\x76\xae\xcf\x7d\x1d\xb3\xf6\xbe\x0f\
+\x28\x48\x48\x02\x6b\x50\x74\x0a\x9c\x4b\xb5\xd3\x15\xb8\xad\xe8\
+\x4b\xc0\x25\x81\x4a\x61\x55\x84\x6b\xaa\x44\x81\x53\x0a\x03\x51\
+\xd6\xd3\xb9\xe6\x2c\xff\x35\xd0\x33\x68\x5b\x2b\x7e\x06\x10\x23\
+\x87\xe9\xb8\x5f\x03\x2e\xd3\x65\x2b\x0f\x81\x35\x15\x0d\x68\x2b\
+\xa6\xef\x08\x9c\x01\xd1\x54\xab\xfd\x3c\xca\x69\xd0\xb5\xd4\xdf\
+\x36\xaa\x1b\x69\x9f\x9b\x58\x20\xc3\x1e\x22\x23\x54\x9b\x34\x8e\
+\x43\x44\x0e\x82\x84\xf7\x69\x58\x01\x56\x6a\xea\x35\x60\x05\xea\
+\x8d\x34\x96\x1e\xc4\x0b\x11\xed\x2e\x46\xc4\xac\x9f\x51\x6d\x2d\
+\xdd\x41\x75\x1f\xf8\x11\xca\x8f\x81\xf7\xd3\x75\x7a\x54\xd6\x73\
+\x05\x9c\x0f\x84\x8f\x01\xb7\xa0\x24\xcd\x6d\x9b\x84\x2d\x78\x48\
+\x56\x6b\x12\xe4\xf3\xb6\x0f\xdb\x77\x5e\xaf\x0b\xcb\xfa\xec\x91\
+\x84\x65\xe6\x45\x79\x00\xbe\xdf\xbd\xfc\xcb\xe1\x30\x1c\xcd\x66\
+\x7c\x0b\xb8\x80\xcd\x9f\x83\xd4\xe4\x19\xe0\x15\x2c\x93\x7d\x06\
+\x28\xc2\x59\x94\xcb\xe9\xfd\x4d\xe0\x40\x24\x65\xed\x4a\x34\x0b\
+\x7b\x13\x99\x22\xe0\x10\x59\x41\x75\x42\xd3\x7c\xd7\xdf\xbf\xe9\
+\x92\xf0\xb8\x8d\x95\x06\x00\xd5\x3b\xe9\x58\x37\xa1\x72\xd0\x38\
+\xa8\xb3\x4e\x95\x83\x0f\xa6\x1c\xcf\x24\xdd\xc0\xe6\xf9\x0a\x0b\
+\xa2\x7d\x17\x73\x83\xc7\xe6\xe1\x18\x58\xf7\xf8\x1b\x81\xf0\xb3\
+\x5e\x3f\x39\x58\x62\x4a\x57\xe3\x5e\xb0\x39\x3b\x02\x9e\x53\xf4\
+\x43\x40\x05\xce\x6b\x17\x78\xb3\x89\xcd\xe3\x42\xe1\xe7\xc1\x85\
+\x5c\x2b\x1d\x80\xe0\xf2\xa3\xc3\x9b\x8b\x09\xa6\xd7\xcf\xdd\xd3\
+\x29\xf3\xbc\x73\xae\xc0\x3e\x0b\x06\x3c\xfa\x39\xf5\xa9\xe8\xec\
+\xe5\xe7\x32\xc7\x97\x58\xc3\x77\xed\x16\xd7\xcc\xf7\xf7\x39\x47\
+\xc4\xa1\x1a\x05\x2b\x59\xa3\xe6\xe8\xd1\x6f\xe0\x3a\x7b\x82\xb4\
+\x2e\xe0\x70\xee\x62\x6b\xdd\x73\x62\xdf\xae\x88\xee\x85\x42\xa1\
+\x50\x28\x14\x0a\x85\x42\xa1\x50\x28\x14\x0a\x85\xc2\x97\x90\x22\
+\xca\x17\xbe\x72\xbc\xfd\xf6\xdb\xfc\xcd\xbf\xff\x0f\xfe\x96\x86\
+\x60\x02\x86\x47\x7c\x18\xfa\x19\xb3\xc5\xa6\x0e\x13\xe4\x5b\xdb\
+\xd8\x25\x76\xb9\xf6\xbd\xfb\x60\x18\xf1\xde\x04\xc7\x2e\x0b\x38\
+\xb4\x42\xa4\x31\x02\xb9\xa4\xe8\x8e\x56\x95\xc7\x11\x21\x58\xb6\
+\x7c\xd0\x28\x50\x27\xab\xf7\x6e\x0f\xaa\xb2\xb0\x37\x27\x48\xad\
+\x68\xae\x29\xbf\x02\x98\xdd\xb7\x8f\x0e\xdf\xd6\x6a\xdf\xc1\x32\
+\xed\x57\x70\xae\xe6\xe5\xaf\x1f\xf1\xb3\x1f\x09\xfb\xbb\xab\x29\
+\x4b\xfb\x94\xc0\x44\x07\x83\x29\x7e\xb8\xc3\xd1\xfe\x1e\x26\x3c\
+\x1f\x00\x3f\x4e\xc7\x9f\x6b\x70\x07\x4c\x80\x7e\x47\xd1\xb3\x80\
+\x57\xe5\xbe\x08\x1b\xaa\x7a\x1d\x68\xd4\x04\xc8\xb3\xe9\x98\xbf\
+\x0f\x20\xc2\x48\x01\x34\x59\xbc\x1b\x1b\x98\x98\x79\x03\xb3\xf5\
+\x1f\x27\x0b\xf4\x00\xfc\x04\xa5\x1f\x34\xf0\x3d\x87\xbf\x17\x08\
+\x9b\x08\x9b\xc0\xfb\x28\xef\x60\xe2\xef\x11\xf6\xfc\xfa\x3e\x9d\
+\xcd\xff\xaf\x00\xf7\x71\xfa\x97\x78\x66\x04\xde\x04\x46\xa8\x6e\
+\xa2\xfc\x3a\x96\x89\x8f\x9a\x4c\x32\xa3\x13\x68\x1d\xa8\x24\x41\
+\x7e\x06\x1c\x7a\x78\x10\x3c\x07\x1a\xd8\xa7\xaa\xa6\x34\x4d\x03\
+\xbc\x85\x65\xc6\xff\xbf\xcc\x0b\xdd\x8f\x12\x50\x22\x9d\x0d\x7a\
+\x6a\x3b\x72\x30\x3d\x66\x61\xdc\xcb\x06\x7d\xb4\x28\xb3\x89\xe3\
+\x41\xaf\x9d\xc9\xdb\x73\xb6\xd0\x0b\xc7\xb0\x8c\x1a\x13\xa5\x57\
+\xb1\x6b\x7f\x22\xb3\x19\x3f\xc4\x1c\x16\x5e\x07\x9e\x03\xce\x58\
+\xf6\x7f\xac\xa8\xf4\x2f\x68\x08\x15\x54\x54\xd0\x80\x78\xc7\x30\
+\x04\x4e\xa5\x7e\x37\xdb\xfb\x20\xa4\xff\x4c\xd4\xda\x04\xd6\x50\
+\x1d\x22\x78\x94\x9b\x21\xcc\x05\x07\x8c\x51\xdd\xc6\x04\x7a\x6f\
+\xe7\xd5\xd8\xb8\x0d\x06\x8e\x3a\xd4\xa0\xfb\x74\x35\xdd\xfb\xe7\
+\x9d\x5d\x0f\x76\x81\x7d\xbc\xaf\x49\xf7\x7c\xc6\xe6\x30\x97\xe9\
+\x44\xfd\x69\x20\xd4\x4b\xc6\x2f\x8f\x61\x4d\x17\xbc\xb0\x9f\x8e\
+\xe9\x3c\xf0\x1d\x60\xaa\x55\xe5\x69\x9a\x61\x3a\x9e\x4d\x38\xfe\
+\x50\xf9\x2a\x50\xac\xeb\x9f\x08\xae\x37\x5f\x5d\xbf\x8e\x7a\x98\
+\x17\xbc\xe7\xe7\xea\x5c\xcd\x75\x71\xa0\x77\x80\x1f\xf0\x30\xfb\
+\xfa\x5f\x00\xe9\xb3\xef\xa1\xea\xf3\x62\x1b\x01\xa7\xf4\xdf\xcb\
+\xdc\xb9\xa9\xa4\x53\xc8\xdb\x08\xce\x0c\x2a\xda\x00\x9f\xb6\x26\
+\x7b\xae\x12\x93\x88\xd6\xb6\xb7\x27\x00\xe9\xbc\xfd\x51\xeb\xe5\
+\xe1\x3e\xff\xbd\xcd\xd3\x03\x4d\x8f\xb5\xce\x3d\x1c\x5f\x83\x95\
+\xe7\x18\x0a\x22\x8a\x9e\xf4\x8c\x3f\xbe\x5c\x1f\xb2\xae\x50\x28\
+\x14\x0a\x85\x42\xa1\x50\x28\x14\x0a\x85\x42\xa1\x50\x28\x7c\x61\
+\x28\xa2\x7c\xe1\x2b\x45\x16\xe4\xfb\xcb\x42\xc0\x85\xf4\x65\xf7\
+\x90\xa1\x9b\x31\xb3\x2f\xf7\x2b\x84\x06\xa8\x70\x3e\xe2\x42\x38\
+\x96\x95\x68\xad\xa0\x66\x3c\x16\x56\x57\xa5\x55\x55\x73\x4d\x79\
+\xcb\x36\x5f\xc1\x2c\xbe\xc7\xa0\x63\xe0\x0e\x0d\x8e\xa0\x91\xd8\
+\x65\xca\x6b\x27\x80\x3b\xb2\xc4\x6a\xdf\xf0\x4f\x81\x21\xd1\xe7\
+\x8c\x3c\x30\xb1\x2f\x89\x10\xd1\xfa\x18\x4f\x1c\x2b\xeb\x15\x7b\
+\x7b\x11\xcb\x80\x47\x04\xaf\xe0\x40\x1c\xc3\x89\x4b\x76\xc6\xe7\
+\x80\x07\x0a\x87\x6c\x9c\xdd\xe3\xd5\x37\x67\xbc\xf3\x17\x1b\xb2\
+\xfb\x60\xcb\xda\xb2\xc2\x85\x67\x1c\xb3\xfa\x0c\xdb\xf7\xce\xa4\
+\x63\xd8\xc7\xfb\x75\xfc\xe0\x2a\xb3\xa3\x67\x80\x23\x55\x36\x81\
+\x7d\x26\xab\xbb\x32\xdd\x3f\x9f\x34\x8a\x07\xc0\x90\xc9\x64\x43\
+\x0f\x0f\x1d\x26\x9e\xaf\x50\x55\xe7\x81\x40\xd3\x9c\x4b\x63\x36\
+\x63\x32\x39\xc5\x74\x7a\x09\xd5\xdd\xd4\x6e\x1d\xa9\xbc\x68\x73\
+\x90\x8e\x63\x3d\x48\x5c\x43\x11\x94\x1b\x40\x40\xe4\x22\x26\xb4\
+\x5f\x4a\x63\xb0\xc9\x68\x54\x31\x9d\x7a\x2c\x43\x7f\x8f\xc0\x3e\
+\xde\xcf\x44\xc2\xc0\xca\x92\x93\x4b\x03\xf8\x64\x8d\xaf\xc0\x00\
+\x91\x26\xed\x3b\xff\xec\x57\x15\xb3\xc6\x0a\x11\xc4\x56\xd9\x6a\
+\x1a\x52\x1f\x21\x9d\xdf\x28\x15\x7a\xef\xcf\x85\xc5\xd7\xcf\x62\
+\x19\xe5\x15\x26\x0c\xbf\x40\xeb\x6c\x80\x83\xa9\x70\x5c\x48\xae\
+\xba\x6b\xfe\xcd\x0a\xbe\xcd\x09\x78\xc0\x6d\x44\xdc\x4e\x5f\xa4\
+\x71\x73\x7d\xe5\xd7\x6e\x6e\xed\xb2\xce\x3c\x21\x04\x46\x0f\x6b\
+\xd3\xe3\x16\x16\x34\x31\x01\xce\x05\x2b\x2f\xf0\xdb\xc9\x21\x62\
+\xd6\xc0\x2c\xbb\x45\x04\xcb\x50\xcf\xc7\xbb\x01\xec\x41\x18\x70\
+\xf0\x60\xcc\xc1\xc1\x18\x18\x0a\x0c\x15\xee\x61\x59\xec\xa7\xe6\
+\x8e\xb5\xc2\xc6\xa8\x69\x97\xad\x63\x63\x69\xe7\x15\xa3\x4b\x6a\
+\xd5\x20\xf5\xdf\x2c\x9c\xc3\x91\x20\x1f\x2b\x7a\x00\x8c\x08\x21\
+\x2e\xac\x47\x95\x7d\xba\xac\x7f\x80\x51\x8a\xbc\xf9\xa4\xe2\x97\
+\x39\x12\x34\x4d\xb6\xb4\x07\x2b\x1b\xb0\xf1\x09\xfb\x29\x3c\x82\
+\xaf\x88\x75\x3d\xe4\x79\x6e\xf3\x31\xe2\x71\x3e\xcc\xd5\x5e\xef\
+\x59\xbc\xa7\x77\xbe\x13\xeb\xad\x99\x02\x1c\x82\xbf\x6f\x95\x25\
+\x3e\x3b\xf4\x31\xf6\xb6\xd8\x66\x71\x93\x63\xb2\xf6\xf1\x06\xc7\
+\x17\xb6\x62\x79\xc2\xca\x85\xc4\xf9\x66\xad\xb8\xef\x80\xa8\x80\
+\x07\x67\x86\xfb\xde\x06\x96\x5c\x01\x20\xe4\xb7\x56\x15\x00\xfb\
+\x3b\xc0\xe7\x40\x89\xec\xc6\xcf\xf2\x18\x89\x05\x1c\xd0\x2c\x95\
+\xeb\x1f\x86\x90\x6b\xca\xf7\xfb\x29\x14\x0a\x85\x42\xa1\x50\x28\
+\x14\x0a\x85\x42\xa1\x50\x28\x14\x0a\x5f\x30\x8a\x28\x5f\xf8\xca\
+\xb0\x4c\x90\x07\x4c\x40\x0f\x33\x07\x03\x37\x23\x02\x03\x07\x35\
+\x34\xe9\x8b\x6f\x73\x8d\x77\x98\x55\x75\x26\xbf\x7f\x16\xd8\x36\
+\x05\x04\xba\x6f\xef\x81\x4e\x9c\x5d\xc3\x04\xba\x6b\xb4\xd9\xe7\
+\x0d\x6d\xa6\x7c\x00\xcb\x68\x24\xdb\xdd\x3b\x4c\x7c\x3c\x2f\xc8\
+\xba\x5a\x16\x39\x3d\xf7\xfc\x7e\xf6\xbc\x65\xff\xc5\xf4\x85\xbd\
+\x1f\x88\xb7\xb4\xf3\x33\xc0\xa6\xb6\x22\x7f\x80\xf5\x75\xcf\x40\
+\x86\xd4\x41\x30\xd1\xde\xea\x0f\xaf\x9d\x6d\x30\x61\xe2\x59\x40\
+\x11\xd9\xe1\xfc\xd5\xfb\x1c\xee\x8f\xd8\xbe\x77\x4e\x90\x6d\x45\
+\xf7\x18\x8c\x56\xd8\x3c\x53\x73\xfb\xfa\x3a\x31\x3e\x03\x08\x2b\
+\x6b\xc2\x0b\xaf\x3d\xd0\x77\xbf\x77\x16\x6d\x76\x80\xab\x8c\x57\
+\x22\xa7\x2f\x1e\x32\xfd\x60\x88\xea\x69\xa0\x66\x6d\x63\x9f\x10\
+\xa6\xec\x3e\x98\x62\xa2\xee\x3a\xe7\x9e\x39\xe2\xd6\xcd\x19\xb3\
+\xa3\x8f\x45\x78\x5e\x87\xe3\x8a\xd5\xcd\x4a\xef\xdd\xda\x4c\x23\
+\xf9\x11\xab\xeb\xf7\xd9\xdf\xd5\x94\x51\x7d\xc4\x64\xf5\x63\x70\
+\x63\xd9\xdf\x89\x0a\x0f\x10\x81\xcd\x33\xdb\xdc\xbe\x79\x39\x9d\
+\xd3\x7d\x06\xa3\x67\xb8\x78\x79\x5f\xa7\x07\x07\xdc\xbb\x33\x40\
+\xf5\x46\x1a\xbc\x6c\x41\xbe\x03\x1c\x25\x8b\xfb\xb9\x92\x04\x4d\
+\xf7\x6e\x99\xe8\xe1\x30\x31\x7a\xcd\x34\xe4\x35\x60\xaf\x6f\x25\
+\x9f\xf1\xc0\x6f\x60\x59\xe5\xb7\x80\x43\x41\x0e\x15\xa9\xd2\xee\
+\x1c\x30\xe4\x34\x63\xb6\xe6\xfa\xce\x56\xff\x15\x7c\x7b\x78\x7c\
+\xf7\xe7\x5d\xaa\x52\x3f\x00\x64\x47\xd7\x2a\xd8\x1b\x9c\x70\xac\
+\x58\x3f\x78\x3a\xf1\x7f\x19\x82\xcd\xcd\x35\xcc\xc1\xe0\x71\x69\
+\xb0\x5a\xf0\x1e\xcb\x62\xa7\x02\xb7\x50\xdf\xc1\x81\xac\x82\x3e\
+\x87\x09\xea\x1f\xf0\x60\x47\xf9\x57\x7f\xfc\x02\x21\x0c\x68\x9a\
+\xa6\x27\xc8\x57\x49\xa7\x1a\x54\xe9\x8e\x68\x1a\xae\x60\xae\x08\
+\x1b\xd8\xfd\x50\x01\xa1\x4a\x62\xa5\x99\x17\xb0\x89\x5d\x13\x97\
+\x8e\xc3\x59\x33\x1b\xe7\x64\x29\xed\xfa\x3f\x55\x05\x4d\x43\x4c\
+\x36\xf8\x91\xc5\x12\x04\x26\x78\x3a\x52\x43\xba\x6b\xb3\x6c\x9c\
+\x3d\xdd\x5d\x3f\x8f\x1d\xc6\x57\x4e\x3c\x2b\x59\xf2\x4f\x00\x8f\
+\x93\x98\x5c\x56\xf2\x7c\xcc\x1f\x15\x27\xda\xbe\x87\xc5\x05\xbd\
+\xa0\x9c\x70\xcc\x95\xe3\xc9\x1c\xa6\xd5\x91\xf7\xe0\x42\x57\x2f\
+\xbd\xbf\xff\xee\xbd\xef\x59\xf1\x07\xfb\xb0\xf4\x16\x65\x30\x57\
+\x2f\xde\x27\x75\xbb\xab\x44\xbf\x10\x78\xb0\xf0\x2e\x2f\x0b\xc7\
+\x56\xfb\xde\xbe\x1e\x7a\xee\x8e\xb9\x5e\xbb\x9d\x2f\x18\xee\xf7\
+\x57\xb9\xfe\xb2\x63\xdb\x3f\x62\x5f\x4f\x82\xe4\x2a\x50\x28\x14\
+\x0a\x85\x42\xa1\x50\x28\x14\x0a\x85\x42\xa1\x50\x28\x14\xbe\x40\
+\x14\x51\xbe\xf0\xa5\xe7\xed\xb7\xdf\x06\x58\x2a\xc8\xc7\x18\x49\
+\xd9\xe3\xb2\xa4\xa4\x76\x5f\xc8\xa8\x53\xad\x72\xac\x2d\x97\xb1\
+\x1a\xd4\x63\x60\xb7\x4d\xe9\x93\x98\xc4\x71\xef\xb0\xba\xbf\xdb\
+\x98\xf5\xfb\x0c\x40\x84\x4d\x55\x66\x80\x67\x30\xb1\x9e\x45\x1d\
+\x5d\x3d\xda\xcb\xbd\xfd\xd6\x8a\xf6\x6a\x52\x57\x66\x54\x6f\x5f\
+\xc6\x9f\x02\x2a\x11\xd6\x35\x1f\x63\x20\xd7\xf3\x1d\xa4\xe3\xfa\
+\x18\xa5\xc6\x7b\x87\x44\x97\x32\xed\x14\x91\xfb\xa8\xee\x27\x4b\
+\xf8\xb4\x21\x0a\xdc\xc5\x2c\xb9\x67\x38\xa7\xa8\x2a\x70\x00\xba\
+\x03\x32\x02\x05\xef\x03\xce\xed\x13\xe3\x47\xc0\x04\x91\x48\x35\
+\x8c\x80\x8a\x30\x56\x65\x83\x10\x1c\xa3\xc1\x0c\x53\x46\x3f\x02\
+\x3c\x22\x81\x5a\x1b\x81\x43\xcd\xd9\xe0\xbe\xda\x37\xa9\x89\x8d\
+\x18\xd9\xc0\x79\x65\xb4\x62\x99\xf5\x76\x1c\xca\x64\xe5\x88\xfd\
+\xdd\x35\x10\x0f\xba\x0d\x2e\x10\xb5\x56\x13\xbc\xed\x82\x55\x55\
+\x48\x56\xe8\x4e\x60\x45\x57\x27\x35\x5f\xfb\xd5\x3d\x42\xf8\x21\
+\xff\xea\xff\x19\xb1\xb7\x77\x8d\xb9\x74\xca\xca\x41\x93\xa5\x5b\
+\xd7\x4a\xb8\x3d\x2a\xa0\xc9\x4f\xc7\xbe\x50\x5f\xb1\x42\xc3\x3a\
+\xc0\x88\x3d\xa6\x9d\xe8\xd4\x17\xa3\x9e\xc3\x04\xe2\x3f\x1a\x0c\
+\x78\xa3\xae\x59\x53\x74\x64\x25\xc7\xdb\x6b\x3b\x60\xab\x27\xf4\
+\xae\xae\x3a\xf6\xf7\x53\x7d\x7b\x06\x1c\x17\xc8\xb3\x20\x4f\x5a\
+\xe7\xd9\xdb\x1b\x30\x1f\x28\xb2\x48\x05\x0c\xce\x71\x6e\x74\x97\
+\xbb\x00\xf1\x1c\xb8\xbb\xf3\x6d\x62\x08\x1c\x51\x55\xe7\x68\x9a\
+\x9b\x0f\xe9\xeb\xe4\x7d\x78\x2a\xc2\x31\x41\x1e\x40\x40\x57\x31\
+\xf1\xfe\x06\x70\x88\x36\xef\xb1\xbf\x9b\x4b\x0f\x5c\xc4\x1c\x04\
+\xc0\xe6\xd2\x3a\xaa\xaf\x34\x56\xd6\x60\x8f\x3c\x4e\xf6\x93\x2d\
+\xec\x37\x7b\xfb\xc9\x65\x1a\xee\xd2\x53\xe2\x7b\x17\x2c\x67\xd7\
+\x6f\x02\xab\x82\xdc\x55\xd4\x99\x20\x8f\xeb\x05\x48\xa4\x63\x65\
+\x88\x05\x01\xd4\x15\x95\x6b\x9a\x26\x5f\xd3\xbb\xa9\x0f\xda\x2c\
+\x5a\xcb\xba\x07\xbb\xee\x9d\x6b\x45\xff\xd8\x1a\x4e\x63\xd6\xf6\
+\x42\xe1\x89\xf0\x95\xc9\x92\x0f\xed\x03\xeb\xe7\x3e\xd7\xd0\xa5\
+\x6d\xa7\x1f\x2f\x1e\xc0\x87\xb6\x82\x04\x80\xef\x8b\xda\x3d\x8e\
+\x09\xde\x4b\x0f\xd3\x04\xef\x5e\x7f\x8b\xc7\xbb\x20\xc4\x2f\x6c\
+\xdd\x3f\x90\x13\x9a\x1d\x0b\x3c\x38\xf6\x2e\x9c\xb0\xfa\x73\x59\
+\x95\xfe\x89\x05\x47\xe8\xe3\x19\xed\x17\x0a\x85\x42\xa1\x50\x28\
+\x14\x0a\x85\x42\xa1\x50\x28\x14\x0a\x85\xcf\x11\x45\x94\x2f\x7c\
+\xa9\x39\x31\x3b\x7e\x1e\x07\xb8\x01\x38\x53\x79\x73\x62\x71\xdd\
+\xb7\xfe\xde\x45\x35\x62\x19\xe8\x67\x30\x11\xee\x3a\xb0\xe9\x61\
+\x16\xd0\x88\xd3\xd8\x66\xe7\x8d\x56\x04\x4f\x43\x94\x7b\xa8\x66\
+\xb5\xdf\xa9\xd9\xe5\x4e\x59\x59\x19\xb0\xba\xd1\x89\x75\xb6\xd9\
+\x44\x84\x15\x55\x3e\xc2\x04\xc8\x01\x26\xbe\x3b\xbc\x8f\xd0\x40\
+\xf4\x4e\xed\xbe\x3d\x07\xec\xa9\x72\x90\xfd\x74\x11\x75\x88\x77\
+\x98\x58\xfd\x31\x96\x85\xbc\x49\x08\x0e\x8d\x9d\xa7\xaf\x6a\x00\
+\xce\xa3\x8c\x88\xdc\xc1\xb7\xb6\xb8\xfb\x56\x2a\x57\x81\x00\x03\
+\x01\x91\x75\x55\x5d\x01\x3d\x20\xca\x3d\x0b\x3a\xd0\x88\x65\x2f\
+\xaf\xa3\x1c\xa5\x62\xbc\xeb\xaa\x80\x48\xc4\xa4\x9f\x2c\x52\x6e\
+\xa4\xb3\xbb\x87\xe0\xd4\xc6\xae\x26\x0b\x95\x8e\x09\x42\x1d\x95\
+\x29\x22\xa0\x9a\x33\x9e\x2d\xeb\xd9\x74\x95\x43\x0b\x0c\xa0\xc6\
+\x8b\x4b\x96\xc3\x23\x2c\xf0\xe0\x9e\xa9\x38\x0a\x70\x51\x61\x8f\
+\x28\x16\x80\xd0\x34\x7d\xa1\xa8\x27\x84\x34\xbd\xff\x8f\x0b\xf2\
+\xed\xb2\xf9\x15\xd6\x47\xc3\xa5\xc1\x80\xad\xba\x26\x4c\xe7\x37\
+\xc9\xe7\x2b\xc0\x55\xe0\x4f\x81\xb7\xea\x9a\xdf\xc4\x32\xf8\x47\
+\x73\xfd\x98\x00\x3c\x02\xdc\x18\x1c\xfb\xfb\x1c\xc1\x28\x99\x4e\
+\x2f\x13\xe5\xfb\x0c\xd2\x7e\xb2\x60\xdd\x3f\x46\xc0\x94\xe8\x5d\
+\x5b\x57\xdd\xe5\x6e\xdb\x66\x41\x90\xcf\x04\x1f\x9b\x8d\x60\xe3\
+\xf9\x49\xf1\xc9\x4f\x7b\x6e\xff\x89\x88\xcd\xc1\x8f\x81\xcb\x02\
+\x57\x15\xea\x0a\xde\x8f\x70\x26\x98\x33\xc3\x18\x78\x1e\x98\xa0\
+\x9a\xe7\x7b\xbf\x2f\xc5\x02\x30\x6e\x93\x6c\xfb\x53\x46\xfe\xe2\
+\xbe\x06\xd8\xbc\xea\x2f\x1f\x63\x01\x1e\x7b\xc0\x3d\x45\xf7\x16\
+\xfa\xce\x6d\xae\xd0\x39\x29\xe0\x81\x26\x0b\xf6\x26\xf5\x5f\xc3\
+\x5c\x2e\x58\x92\x8d\x9c\xae\x55\x15\x7b\x13\x66\x82\xcd\xf3\x3c\
+\x9e\x45\x39\x2b\x7c\x62\x9e\x70\x26\xb4\x03\xb3\xc0\xcf\x25\x58\
+\x7c\xbe\x0f\x52\xb6\x7a\x2b\xd8\x27\x2b\x76\xb2\x4b\x7e\xeb\x03\
+\xe1\xf1\x21\xcb\xe0\xf3\x19\xeb\x74\x4d\x3e\xa7\x5a\xf8\xe7\x86\
+\x27\x18\x50\x52\x1e\x2b\x85\x42\xa1\x50\x28\x14\x0a\x85\x42\xa1\
+\x50\x28\x14\x0a\x85\xc2\x17\x8d\x22\xca\x17\xbe\xb4\x3c\xa6\x20\
+\x0f\x29\x73\xbb\xcb\x93\xaf\xfb\xcb\xf3\xef\x1a\xcb\x80\xbe\x83\
+\x09\x8d\x5b\x00\x62\xe2\xe2\x11\x59\x94\xcd\x82\xc4\x70\x6c\xe2\
+\xab\xea\xbc\xd5\x3c\x0c\x3d\xbe\x0e\x4d\x14\x2a\x1f\x5b\xe3\x6c\
+\xdb\x6e\x5f\x55\x3e\x02\xbd\x9f\x96\x4e\xda\x35\x2b\xa7\xaa\xde\
+\xed\x8e\xc2\xbc\xac\x00\x00\x20\x00\x49\x44\x41\x54\xda\x60\x96\
+\xdf\xd7\x80\xb3\x08\xae\x15\xd6\xb5\xad\x9b\xad\x64\xe1\x3b\x8a\
+\x43\xab\x5c\x53\xd7\x81\x5c\x01\xb5\xac\x78\x47\x24\x68\xc4\xe4\
+\x94\xe7\xd4\xea\xb6\x1f\x82\xec\xa2\x2e\xf7\xb5\x45\xae\xb9\x1d\
+\x10\x94\x09\xb0\x0a\x12\x90\xb6\xf6\xfa\x14\x78\x60\xd9\xe0\xad\
+\x2a\xb3\x0a\x1c\x21\x32\xb5\x7d\x47\x9f\xc6\x71\x0b\x38\x4d\x88\
+\x82\x32\x45\xb9\x43\x67\x41\x9e\xcf\x7b\x03\x10\x13\xe1\x35\x00\
+\x6b\x82\x54\x8a\x42\x50\x11\x38\xa5\xb0\x4b\x6b\xed\x2f\x15\xc4\
+\x29\xc4\x9d\xf9\x4b\xdb\x1e\x4b\x27\x86\xe4\x91\x6c\x68\xf3\xab\
+\x9b\xbc\x30\xa9\xf1\xbd\x24\xf9\x58\x81\x6b\xcc\xca\xfc\x63\xe0\
+\x6a\x5d\xf3\x2d\xe0\x7e\x45\x75\xb7\x49\xfe\xe6\x15\x15\x8d\x59\
+\xa1\x9f\xc3\xe6\xc3\x0d\x3c\xbf\x4a\xe0\x5a\x05\x5b\x8a\x9c\x6b\
+\xcd\x14\x10\xa7\xe8\x10\x46\x13\x98\x72\x94\xf6\x35\x84\xf1\x8c\
+\xe0\xed\x25\x35\xe3\xb1\xe3\xe8\x28\x8e\x19\xbb\xa3\xb6\x95\x35\
+\x15\xf0\x83\x11\xc3\xe9\x74\x79\xa6\xfc\x6e\xdb\x25\x15\x8f\xb6\
+\xa5\x8f\x21\xb0\xca\xcf\x2b\xca\xdb\x31\xcf\x8b\x4d\x55\xe5\x68\
+\x1a\x87\x48\x44\x95\x14\x6c\x72\x04\xad\x74\xad\x74\xc1\x25\x77\
+\x31\x47\x85\x53\xd0\xda\xca\xf3\xff\xb3\x77\xef\xb1\x75\x9d\xe7\
+\xbd\xe7\x7f\xcf\xbb\xf6\x26\x75\xa3\x6e\x24\x7d\xef\x89\x6c\x65\
+\x92\x36\x99\x5b\x6c\xb9\x98\x62\x50\x8c\x83\x40\xb4\x0f\x30\xb2\
+\x1c\xbb\x96\x9d\x49\x81\x54\x98\x49\xd4\x26\xe9\x00\x9e\x88\x99\
+\xb4\x07\x33\x56\xd0\x7f\x92\x50\x18\x63\x60\x3b\xb5\xdb\x22\xe9\
+\x29\x82\xa9\x23\x1f\x67\x4c\x39\x98\xc8\xe4\xc9\x1c\x61\x0e\x7a\
+\x32\xad\xa5\xe6\xb4\xe9\xe4\xd2\x44\xb6\x92\x38\x96\x6c\x5e\x4c\
+\x89\xe2\x7d\xaf\xf7\x9d\x3f\xd6\xda\x17\x52\x94\xc4\x2d\x71\xef\
+\xb5\xf7\x5e\xdf\x0f\xa0\x88\xe4\x5e\x7b\xaf\x87\x8b\x8f\x5e\xef\
+\xf0\xb7\xde\xf7\xd5\xe5\xb3\x4a\xbb\x24\x6d\x58\x31\x53\x7e\xb3\
+\xa4\x9b\xd2\xd7\x3a\x9f\x06\xf6\x21\x3d\xff\xbc\x92\x30\x3f\xd9\
+\x53\x5e\xe5\x19\xf2\xaa\xfd\xf9\x96\x54\xbd\x09\x24\x48\xda\x9a\
+\x4e\x52\x4e\x7a\xb1\xb4\x62\x09\xee\xab\xdb\x28\x45\x37\xa7\x37\
+\x55\x2c\xa4\xdf\xe3\xc5\xcb\xae\x4d\x07\x63\xe9\xfa\xf5\x73\xa3\
+\x33\xe5\x25\xc9\xb9\xca\x8d\x60\xd5\x3f\x91\x4c\xb1\x42\xcd\xf2\
+\xf0\xe9\x12\xf4\x91\xc5\xd5\x99\xf1\x41\x8a\x92\x3d\xd6\xd3\x60\
+\x3e\x8e\x6b\x97\x88\x8f\x43\xb2\x12\x8c\xb4\x7c\xf1\xf9\xab\xe7\
+\xf2\xd7\x9d\xd9\x77\x4e\xd8\x9f\x9b\xb1\x00\x00\x00\x00\x00\x00\
+\x00\xc0\xe5\x08\xe5\xd1\x91\xea\x08\xe4\xa5\x28\x72\x8a\xdd\x65\
+\xcb\xd7\x17\x24\x57\x33\x23\x77\x4e\x49\x70\xf7\x0b\x25\x81\x9b\
+\x94\xcc\x64\x4c\xa3\xdc\x28\x99\xd5\x5d\xfe\x17\xe5\x9c\x49\x51\
+\x49\x8a\xcb\x4b\x96\x6f\x51\xb2\x94\x75\x6f\x1c\x29\x28\x99\x08\
+\xb9\x32\xec\x8b\x9d\xf3\x05\x5f\x9d\x00\x57\x50\x52\x54\xd0\x86\
+\xe2\xca\x5f\xe6\x97\x8f\xb2\xca\x47\xb1\x94\xce\x94\x37\x25\x01\
+\x67\x8f\xca\x51\x86\x73\xc9\x12\xf6\x21\x2e\x48\x7e\x4e\x49\x08\
+\xda\x53\x3d\xb3\x97\x92\x25\xe3\xa7\x25\x5f\x9d\x04\xee\x35\x2b\
+\xe9\x42\x5a\x7f\x79\x96\xfa\x25\x49\x6f\x4a\xbe\xa7\xfa\xda\x5a\
+\x92\x97\x93\x4f\x8f\x93\x33\x79\xcd\x48\xba\x20\xaf\xcd\x69\xa9\
+\x71\x7a\x1d\x7b\x24\x45\x72\x32\x85\x50\x4a\xaf\x4b\xb2\x3c\xb8\
+\x59\x39\xe0\xf5\xc9\x35\x8c\x25\xe7\xfa\xe4\x7d\xd1\xcb\x9f\x55\
+\xac\x20\x53\xec\xa5\xd8\x39\x05\x2f\xd7\x25\xe7\x9c\xa4\x71\x29\
+\xfc\x07\x27\x37\xeb\x97\xe6\x0b\x7a\xe3\x9f\xb7\xab\x54\x8a\xe5\
+\xfd\x46\x49\x53\x2a\x28\x56\xb2\x8f\xf8\x92\x4a\xa5\x50\xf9\xb9\
+\x26\x4b\x99\x87\x72\x3c\x9b\xfe\x30\x43\x6d\xf0\x9b\xe4\xf4\x25\
+\x29\x99\xf1\x7e\x41\xd2\x4e\x27\xdd\x52\x52\xe9\x56\x49\x97\xa2\
+\xe4\x26\x8d\xc5\x24\xdc\xd2\xcd\x5d\xd2\xff\xbb\x28\xf5\x2b\xd6\
+\x4e\x49\x6f\x94\xa4\xa2\xe4\xcb\x01\xf2\x45\xef\xbc\xc9\xab\x4b\
+\x5a\xe8\x56\x57\x97\x69\x71\x51\x92\xb4\x98\x04\xc7\xd5\x50\x7e\
+\x3e\x09\xe2\xe7\x93\x39\xf4\xa6\xea\x4f\xa5\x4b\x4e\xd1\xc2\xc2\
+\xaa\xcb\xdc\xd7\x2a\xcf\xa4\xbf\x56\x28\x3f\x9f\xd6\xb6\x51\x5d\
+\x92\x16\xab\x21\x74\x57\x57\x35\x44\x5a\x54\x97\xb4\xb8\xb8\xb2\
+\x67\xa3\xca\xcd\x12\xb5\x81\x53\x72\xbd\xe4\xbc\xba\xbc\xf4\x1e\
+\xef\xb5\x53\xd2\xf9\x74\x0f\xea\x72\x8f\x7a\x39\x8d\xc9\xa7\x5b\
+\x1c\x54\x9e\x9f\x04\xf2\xe9\xb1\x4a\x1f\xbb\x4d\x49\x0f\x96\x8f\
+\xb3\x34\x78\x5f\x50\x12\xba\x7b\x49\x8b\xe9\xcf\xcd\x6a\xf6\x82\
+\x77\x4a\x6e\xf2\xd8\xa6\xf4\x46\x9a\xca\x19\x12\x5e\x52\x70\x4e\
+\x3d\xc9\xb6\x12\xd1\x45\x29\x9e\x48\x8f\xdf\x99\x5e\xbb\x4b\xe9\
+\x6b\x14\x94\x04\xf4\x0b\x4a\x37\x8b\x88\x92\xd9\xc4\x9b\xa4\xd2\
+\xae\xe4\x65\xe3\x58\xc9\xbf\xd9\x25\x49\x3f\x97\xf4\xb3\xf4\xfa\
+\xe2\x06\xe5\x66\xe9\xfa\x75\x54\xf3\xdf\x12\x93\x22\x17\xc7\x97\
+\xdf\xa4\x54\x5e\xe6\x3e\x5e\xb6\x91\x7b\x64\xcb\x96\xad\xaf\x0d\
+\xc4\x2b\xab\x8f\x5c\xb6\x78\xfc\x2a\x0b\x49\x2c\x77\xdd\xb9\xfa\
+\x5a\x53\xff\xd6\x47\xff\x02\x00\x00\x00\x00\x00\x00\x39\xd6\x36\
+\xa1\x7c\xfa\xcb\xf8\xb0\xe6\xa0\x15\xb9\x55\x57\x20\x2f\x49\x71\
+\x6c\x4a\x82\x42\xa9\x28\x93\x8a\xd2\xd2\x52\x28\x2d\xff\x05\xfa\
+\x92\x92\x59\xaf\x97\xef\x1d\x2d\xcd\x2b\xd2\xc6\xea\x32\xbf\xa9\
+\x24\x3c\xd8\xa0\x64\xdf\xec\x82\x92\xd0\x7b\x42\xb1\x16\x14\x69\
+\x83\x5c\xb4\x2c\x5a\x88\x22\x95\xe2\x58\x2e\x7d\xe6\x76\x49\xb7\
+\xca\xe9\x97\xb2\xc8\xc9\x2e\x3b\xef\x16\x49\xb7\xcb\xb9\x2d\x72\
+\xaa\x6e\xc4\x6b\x95\x99\xe6\x9b\x25\xbd\xe5\x9c\xbc\x57\x2c\xf9\
+\xa5\x64\x69\xfd\x28\x2a\xc9\xfb\x77\xd3\x73\xa4\x15\x07\x93\x39\
+\xaf\x24\x5c\x96\xe4\x92\x1b\x0c\xa2\xc8\xcb\x69\xb3\xbc\xee\x54\
+\xb2\x62\xf1\xa4\x9c\x24\xe7\xbc\xbc\xdf\x2a\x69\xbb\xbc\xe6\xd2\
+\x7a\x36\x29\x99\xdd\x9e\x2e\x95\x6e\x41\x4e\x3d\x49\x48\xef\x17\
+\xe5\x34\xa3\x38\x38\x49\xbd\x92\x8a\x72\x6e\x41\x8a\x25\xb3\x4d\
+\xe9\xf3\x67\xe4\xbd\x97\x8f\xbb\xd3\x6b\x7d\x41\xd2\x45\x2d\xf9\
+\x8d\x4a\xc2\xd4\x82\xa4\x05\xf9\xa5\xdb\x92\x9c\x5e\xd3\xde\xab\
+\x24\xa7\x1d\x7a\x77\x7c\xab\xbc\x5f\x88\x14\x8d\xc5\x8a\x97\x34\
+\x3b\xbb\x43\x3f\xf9\x87\x64\xa6\x7d\x39\x94\x2e\x29\x0d\x4b\x4b\
+\x4b\x4a\x82\xd6\x8d\xe9\xcf\x72\x4e\xc9\x9e\xe0\x25\x49\x21\x24\
+\xd3\x3e\x63\x49\xdd\x8a\xe4\xd3\x8f\x97\x92\xef\x3f\x4a\xd7\x1a\
+\xb0\x0b\xbe\x54\x9a\x50\xa4\xed\x52\x74\x4b\x1c\xc7\x77\x49\xa5\
+\x92\x73\x8a\xe5\x35\xb5\x28\xfd\xb3\xa4\xff\x46\x95\x39\xa6\x92\
+\xa4\x49\xc9\xf5\x4a\xfe\x6d\x79\x49\x51\xd4\xa5\x38\xee\xd6\xe2\
+\x62\xda\x77\x45\x53\x58\xea\x52\xa9\xa6\xe6\x8a\x2e\xd3\xc2\x62\
+\xed\xcf\xbe\xcb\xfb\xd5\x8e\xab\xea\xee\x96\xa5\xa1\xfd\x5a\x66\
+\xca\x97\xd2\xeb\xb1\xa5\xb8\x58\x2c\x49\xd2\x92\x96\x82\x54\xb4\
+\x10\x96\xb4\xb4\x54\xee\xbd\xb0\x72\xd6\xb8\x49\xea\xf2\xf2\x57\
+\x9c\x61\xef\xe5\x77\x2a\x59\x5d\xe2\xbc\xa4\xf8\xf2\xdd\xa9\x5d\
+\x29\xbd\xbf\x64\xbb\x92\x99\xfa\xb3\xe5\x47\xe2\x28\x96\x0b\x32\
+\xef\xb5\x43\xc9\xe4\xff\xf3\xaa\x9d\xcd\x9f\x04\xef\xb1\x92\xd0\
+\xbb\x28\x49\x05\x15\x2c\x5d\xb1\x40\x4a\xfe\x0d\xdc\x51\xfb\x9a\
+\xaa\xae\xc6\x50\x9e\xcd\x3f\x27\x49\x3e\xb9\x81\x64\x51\x8a\x37\
+\x2a\xe9\xd1\xa5\xf4\xba\x94\x8f\x5f\x54\x12\xc6\x97\x3f\xf6\x92\
+\x2c\x8e\x55\x54\x32\x1b\x5f\x52\x7a\x4b\x83\xf4\x96\xa4\x7f\x54\
+\xb2\x02\xc0\x5a\x67\xd9\xb7\x3d\x66\xc9\xb7\xac\xf4\x26\x98\xb5\
+\x27\xd9\x2b\x67\xbf\xb7\x94\x96\x2d\x6c\x4d\x08\xe5\x01\x00\x00\
+\x00\x00\x00\x80\x1c\x6b\x9b\x50\x1e\x58\xab\xeb\xb8\x71\xa3\x76\
+\x79\xdf\xf2\x84\xf9\x95\x4b\x67\xfb\xf4\x91\xda\xe8\xdd\x29\x59\
+\x93\xdd\xc7\xb1\x82\xbc\x85\x65\x8f\xc6\x71\x79\x76\xf4\xb4\x92\
+\xa5\xe6\x4b\x92\x7e\x2d\xd9\xba\x3e\xde\x98\xee\x51\x5f\x73\xb8\
+\x62\x25\x21\xe2\x36\x29\x0d\x83\xbd\x2e\x26\x37\x0c\x14\x6a\x8f\
+\x75\xe9\xeb\xbe\x2b\xf9\x79\x29\x0a\x32\xe7\x6a\x5e\x6f\x41\x49\
+\x80\x39\xef\x93\x99\xeb\xaa\xcc\x3a\xf7\x95\xfd\xe0\x8b\xae\x3c\
+\x3f\x3e\x96\x14\x42\x21\xa9\x4d\xc9\x6c\xf6\x48\x92\xeb\xf2\x92\
+\x0a\x4e\x6e\xca\xcb\xcf\x28\x56\x90\x73\x52\x12\x8c\x6e\x93\xca\
+\xb3\xcc\xcb\xe7\x74\x8b\x92\x4f\x96\x53\x4f\xae\xc3\x05\x25\x61\
+\xfd\x9c\xe4\x9c\x0a\xc5\x0b\x92\xfe\x56\x4e\x5e\xf2\x9b\xe5\x43\
+\x51\x91\xfd\x47\x49\xd3\x72\x6e\xab\xe2\xa5\x2e\x5d\xba\xb8\x49\
+\xd2\xbf\x97\x74\x51\xde\xf7\xea\xe2\xc4\x2d\x4e\x7e\xd2\x27\x37\
+\x0c\x94\x34\x37\xb7\x5d\xd2\x45\x2f\xfd\x4a\x52\x49\xde\x77\x69\
+\x7e\xde\x24\x2d\xc6\xd5\x1d\x90\xa7\xd2\xfa\xe6\x94\x04\xb2\xe5\
+\xe0\xdf\x94\x84\xb7\x5e\xc9\x0d\x12\x5e\xd5\xe5\xf2\x25\x69\x31\
+\x8e\xd5\x25\x29\x92\x73\x85\x74\x59\x7f\xa5\xc7\x38\xc5\x71\x49\
+\xc9\xec\xe9\xc9\x28\xd2\xbb\x71\xac\x31\x29\xfe\x51\xfa\xfa\xb7\
+\x7b\xaf\xf7\xa4\xd7\x74\x57\x7a\x2d\xa7\x54\xbe\x49\x21\xd2\x05\
+\xc5\xfa\x35\x29\xba\x25\x99\x4e\x1a\x77\xa5\xd7\x31\xed\xb9\x25\
+\x49\xe9\xb9\x93\xbf\x6b\xa2\xa7\x24\x90\x2f\xaa\x68\xd2\x92\x96\
+\xa4\xa2\x73\x8a\xbc\xaf\x3d\xae\xab\x72\x9c\x24\x2d\x2c\x54\xbe\
+\x58\x90\xd4\xd5\x25\x59\xe5\xd1\xae\xe4\x7f\xba\xb4\xa8\xc5\xc5\
+\x2e\x25\x93\xfc\xcb\x37\x2a\x2c\x25\x95\x14\xd3\x9a\x96\x2d\x1e\
+\xb1\x54\xbe\x86\xdd\x92\x76\x44\x91\x76\xc4\xb1\xdb\x2c\xf9\xa2\
+\xa4\x5b\xd3\x9f\xf7\x25\xa9\xe0\xa5\x52\x9c\x1e\xbb\xa8\xe4\x67\
+\xb7\x4d\x5a\x65\x92\xab\xf7\x1b\x24\xdd\x99\x9e\x71\x79\x80\x9d\
+\xac\x23\x1f\x94\xac\x50\xf0\x66\xfa\xf4\xd5\x6e\x00\x70\x4a\x7a\
+\x7a\xaa\x32\x03\x3e\x09\xdc\x67\x94\xf4\xc9\x8c\x92\x7f\x2f\xb1\
+\x24\x15\x54\x70\x25\x95\x22\x95\x4a\x3d\x4a\x96\xf3\xf6\x8a\xa3\
+\x42\xfa\xcf\xe1\x42\xfa\xfd\x15\x6a\xfe\x5e\x54\x79\xc5\x8a\xea\
+\xf9\xca\x2b\x60\x94\x9f\xd3\xa7\xe4\xe6\x83\xbf\x55\xb2\xb5\xc4\
+\x15\x37\x7c\xde\xbd\x7b\xb7\xbe\xff\x6f\xfe\x8f\x17\xae\xf4\x38\
+\x2e\xc7\x2c\xf9\x1b\x66\x51\x12\xb5\x27\xcb\xce\x47\xb1\xa2\xf2\
+\x68\x99\x2e\x46\x91\xce\x7b\x0f\x4a\x6e\x36\x09\xe9\xca\x1f\x65\
+\xe9\x72\xf5\xf1\x15\x67\xaa\x47\x57\x8d\xf2\xd7\x38\xbd\x7d\x3d\
+\x66\xc1\xb7\xf7\x4c\xfa\x2a\x77\xed\x43\x00\x00\x00\x00\x00\x00\
+\x00\xb4\x97\xb6\x0a\xe5\x99\x2d\x8f\x6b\xb9\xce\xde\x30\x15\xe4\
+\x54\x52\x9a\x3b\x56\x92\x48\x27\x95\x67\xdf\x2a\x96\x4a\x8b\x4a\
+\x82\xba\x39\x25\x81\x5c\x41\x52\x1c\x47\x91\x57\x4f\x4f\xa4\xa8\
+\xe6\x9f\x53\x32\xf3\x3c\x72\xd2\xbb\x3e\x09\xe9\xca\xfb\x59\x2f\
+\x25\x53\x7c\xbb\x96\x07\x4c\xa6\x20\x45\x41\x8a\x97\x94\x1c\x7f\
+\x51\xd2\xcd\x92\x96\x14\x45\x4e\x05\xab\x0d\xf9\xbc\x92\xd9\xb9\
+\x6f\xca\xab\x37\x79\x6e\xbc\xfc\xd5\xa4\x7f\x91\xbe\xc6\x42\xed\
+\x03\x0a\xae\x20\xc5\x9b\x24\x4d\xfa\xf2\x37\x5a\xbd\x91\xc0\x4b\
+\x9a\x95\xf7\xf3\x49\xbe\xed\x82\xa4\x8b\x5e\x5e\x2e\x59\xaa\xdf\
+\xa5\x8b\xe5\x5f\x52\xf9\x06\x05\x97\x86\xca\x66\xbf\x4a\x57\x7a\
+\x1f\x93\xd9\x92\xe6\xe6\xb6\xca\xec\xc7\xe9\xeb\xf6\x68\x66\x7a\
+\x57\xba\x5a\xff\x19\x79\x15\x9c\xb4\xc3\x8f\xbd\xd3\xa7\xc5\x85\
+\x49\x49\x73\xf2\x7e\x49\x8b\x8b\x1b\xb4\xb8\xf8\x76\x7a\x7d\x17\
+\x24\x4d\x29\x8e\x5f\x4f\xb7\x08\x28\x2f\x45\x7e\x51\xcb\xb6\x04\
+\xd7\x25\x25\xc1\xfb\x6c\xfa\x58\x79\x46\xf3\x62\xfa\x3a\x52\x12\
+\xf8\x5a\xfa\x9d\x96\x57\x22\x28\xd6\xbc\x4e\x39\x68\x2e\x7f\x3d\
+\x92\xf7\x51\xfa\xb5\x0d\xaa\x06\xc6\x51\xfa\x77\x21\x8e\x75\x8b\
+\x9c\xeb\x91\xd9\x92\xe2\x78\x52\xc9\x32\xe5\xbf\x30\x45\xb7\x4a\
+\xf1\xbf\x94\xdc\x6d\x92\xff\xff\xca\x57\x3d\xf9\xf1\xf8\x8b\x4a\
+\xf6\x3f\xb7\x28\x52\x57\x6c\xda\xa0\x92\x54\x28\xc8\xd2\xd5\xde\
+\x8b\xaa\xce\xee\x2f\xe7\xcb\x95\x3e\x59\xaa\xf6\x65\xed\x4c\xf9\
+\xf4\xb8\x45\x49\xb2\x62\xe5\xd8\xca\xeb\x15\x24\x75\x2d\x9b\x67\
+\xbf\x98\xfc\xcf\x62\xf5\x13\xa5\xe7\xdd\xb4\x54\xee\x97\xa5\xe4\
+\x99\x4b\xc9\xab\x77\x45\x91\x7a\xe2\x58\x5b\x95\x84\xdf\x92\xb4\
+\x10\xc7\xba\x28\xf9\x25\x25\x2b\x19\xbc\x4f\xd2\xdb\x92\xe6\xa5\
+\x52\x57\xfa\x33\x98\x77\x72\xe7\xbc\x7c\x41\xc9\x4c\xf8\xe9\x78\
+\x79\x60\x16\xa5\xd7\xe3\x57\x4a\x42\xf7\x9b\xb4\x42\xba\x27\xf6\
+\x15\x03\x6e\x25\x61\xff\x86\xb4\xfe\x0b\x2a\xa4\xbb\xc4\x97\x4a\
+\x21\xfd\xde\xd3\xed\x14\x54\x4a\xcf\x7c\x6b\x49\xa5\x1d\x4a\x7e\
+\x8e\x4b\x92\x66\x14\x6b\x29\x2d\xaa\xbc\xdc\xff\x05\x25\xb3\xdd\
+\xc7\x95\xdc\x50\x53\xbe\xf0\xb5\x31\x99\xd3\xf2\xff\x7e\x46\x4a\
+\xc2\xff\x9a\x95\xf1\x57\x77\xe6\xcc\x19\xfd\xce\xff\xfc\xbf\x74\
+\xe4\x8c\x72\x66\xcb\xb7\xa8\x28\xb2\x38\x8e\xd3\xff\x06\xc5\xd5\
+\x65\xe6\x2f\x5f\x9f\xbe\x3c\xde\xd8\x8a\x5c\xbb\x3a\xd3\xfe\x0a\
+\x81\xf7\xd5\xe7\xd6\xaf\x31\x25\x5f\xcb\x61\x51\x64\x8a\xe3\xf2\
+\x4d\x03\x21\x52\x64\x71\x14\x4b\x71\x7a\xd3\x4c\x9c\x1e\x23\x49\
+\x71\x1c\xca\x4b\xf1\x47\x92\xe2\xb8\x7a\x73\x41\x54\x49\xef\x6b\
+\x6f\x26\x88\x14\x45\x2b\xd7\xe0\x8f\x6a\x96\x3c\x89\x6b\x4e\x21\
+\xc5\x71\xf5\x56\x84\x28\x39\xb4\xb2\x68\x4d\xfa\xf2\xe5\xff\xee\
+\xd7\x73\xaf\x80\x69\x76\x76\x9b\xfe\xfd\xab\xef\xab\xac\xce\x72\
+\x61\x6a\xab\x4a\xa5\xa5\x6b\x3c\x0f\x00\x00\x00\x00\x00\x00\x40\
+\x8b\x6b\xab\x50\x1e\x68\x10\x53\xa9\x66\x66\x7c\x35\xf2\x35\x49\
+\x2a\x15\x24\x95\x4a\xc1\xc9\xcd\x78\xa9\x2f\x99\x9d\x2e\x49\xe9\
+\x5e\xe9\xb1\x62\x6d\xd8\xb4\xca\x2c\x4e\x27\xaf\xca\x8c\x68\xaf\
+\x72\xe0\x5b\x9e\x75\xd8\xe5\x6a\x7e\x47\x6f\x41\x52\x2c\xe7\x66\
+\xe4\x7d\xb7\x92\x7d\xd6\x77\x44\xd2\xd9\x38\x8e\x4d\x56\xde\x1d\
+\xb8\xf2\x94\x4d\x4a\x96\xd9\x76\x72\x8a\xa4\xa8\x24\xe7\x4c\xc9\
+\x7e\xf5\x05\x27\x39\xef\xdc\xbc\x7c\xba\x3f\xbc\xf7\xc9\x4c\x7e\
+\x55\x42\xf5\x8d\x92\x62\x85\x50\xd0\xfc\xbc\x93\xd3\x94\xa4\x4b\
+\x4e\xce\xf9\xc8\x2e\xe9\xc2\xc4\x76\x99\x15\x65\xf6\x63\x45\x1a\
+\xb3\x58\x25\x29\xfc\xba\x66\x2e\xf5\xca\xfb\x1f\x2a\x09\xbc\xbb\
+\xb4\xb4\xd0\xad\x5f\xfe\xf3\x9d\x8a\x63\x27\xf9\x49\x49\x53\x9a\
+\x9f\xdf\xaa\xb7\xcf\x15\x15\xc7\xc5\xf4\xb8\x49\x2d\xcc\xcd\x28\
+\x09\x6a\x67\x24\x45\x5e\x9a\xd1\xfc\x6c\x79\xd6\x7a\x29\xfd\x53\
+\x5e\x16\x7c\x87\x92\xd9\xd5\xef\x2a\x09\x45\x67\xd3\xd7\x29\xff\
+\x29\xa9\xba\x8f\x78\xd0\xf2\x19\xfb\x65\x57\x5a\x36\xbc\xde\xd9\
+\xb6\x2b\x57\x4c\x28\x48\xba\x45\xd2\x6e\x79\x7f\x8b\x92\x9f\xd3\
+\x66\x25\xa1\xf3\x5c\xac\xf8\xbc\xa4\x5f\x4a\xfe\x7c\xfa\x58\x5f\
+\x5a\xeb\x05\x49\x0b\x4e\xae\xdf\xcb\x6f\x8b\x63\x4d\x29\x09\xfd\
+\x15\x4a\x95\xd7\x2f\xf7\x47\x97\xae\x32\xd3\x3a\x7d\xdc\x49\x2a\
+\x16\x54\xf0\xa5\x9a\x1c\x78\x45\x6a\x93\x86\xcc\xc5\xae\xcb\x1e\
+\xb9\xfc\x7b\x8c\x55\xee\xe7\xe4\xf3\x0d\x0a\xd1\x36\x29\xde\xaa\
+\xe4\x26\x84\xc5\x28\xd2\xc5\x38\xd6\xeb\x52\x61\x41\x2a\x6d\x4d\
+\x4f\xf7\xb6\x92\x1b\x12\xde\x55\x12\x90\x17\x54\x5d\x2e\xbe\xe0\
+\xe5\x27\xd2\xef\xe9\x4d\x49\x1b\x15\x6b\x9b\x92\xa0\xbc\x3c\x8b\
+\x7f\x4a\xd2\x92\x93\xb6\x7a\xe7\x0a\xb5\x9b\x60\x4b\x92\xf7\x95\
+\x50\x2b\xd9\xe3\xdd\x29\x92\x53\x6d\xf4\x7d\x51\xc9\x0c\xf5\xa2\
+\xa4\x58\xa5\xca\xcf\xdd\x94\xf4\xd0\x52\x7a\xad\x96\x94\x5c\xef\
+\xcd\xaa\xf6\x4e\xf9\x76\x94\x0b\x4a\x02\xf8\xf3\xe9\x73\x16\xb5\
+\x7a\x4f\xe1\x1a\x3e\xf4\x3b\xff\xdd\xe3\x04\xf3\x2d\x28\x49\x8a\
+\x3b\x63\xa5\x81\xf4\x7b\x29\x6f\xd8\x12\x57\x37\xb2\xb7\x15\xc7\
+\x24\x5f\x8b\xab\x41\xba\x6a\x6e\x2e\xa8\x06\xf1\xb5\x51\x79\x5c\
+\xf3\x54\x2d\x7b\x7c\xe5\x97\xe3\x78\x95\x57\x59\xfe\x52\xcb\x6a\
+\xaa\x9c\xbf\x7c\x6b\xdb\x95\x2d\x68\xe2\xed\x37\xf4\x37\xff\x36\
+\x4a\xfe\xdb\x2e\xc9\xfb\xcd\x4e\x7e\xde\xd7\x6e\xbf\x01\x00\x00\
+\x00\x00\x00\x00\xa0\xed\xb4\x5d\x28\xcf\x6c\x79\xdc\x08\x1f\xc7\
+\x76\xfe\x17\xbf\xe8\x7e\xeb\xe7\x67\x37\xf6\xde\x72\xfb\x42\xba\
+\x58\x77\x41\x2a\x74\x25\x49\x5f\x41\x52\x32\xdb\x36\x92\x8a\xb1\
+\xd4\x5d\x28\x29\x52\xb2\xe4\xf5\x05\x49\xdb\xe4\xb4\x51\x72\x92\
+\xf7\x4e\xd2\x84\x14\x17\x35\x73\x69\xa3\x26\xdf\x9e\xaf\x9c\xe8\
+\xd2\x54\xb7\x22\x5b\x54\x12\xbe\x6e\x74\x92\x57\x32\xeb\xf7\x82\
+\x24\x27\xb3\xad\x9a\x9a\x96\xe6\x97\x92\x14\xa0\x34\xdf\x25\xc5\
+\xe3\xf2\xd1\xeb\xaa\xfe\x22\xff\xdd\x38\x59\xba\x7b\xa7\xa6\xde\
+\xdd\xa8\xc2\x5b\x91\xe6\xe7\x36\x49\xfa\xb1\xa4\x5f\x44\x8a\x2c\
+\x56\x7c\x5e\xde\x4a\xfa\xe5\xcf\xb6\x68\xfc\x6d\xe9\xc2\x85\x8d\
+\x92\xce\x79\xe9\xff\x96\xf7\x25\x49\x5d\x8a\xe3\x7e\xfd\xec\x9f\
+\x16\x34\x3f\xbf\x55\xe6\xc7\x25\xfd\x63\xa4\x28\xc4\x52\xd0\xc4\
+\xd8\x1d\xfa\xfe\xdf\xf4\x69\x66\x46\x92\xa6\xbd\xfc\x92\x14\x45\
+\x3a\xff\x66\xb2\xb4\xba\xf7\xdb\x24\x75\xc7\xd2\xac\x16\xe6\x66\
+\xb5\xb4\xf0\xf3\x48\x9a\x8e\xcb\x37\x19\x2c\x2c\x5c\xd4\xc2\xc2\
+\x3b\x4a\x42\xfe\x92\x92\xfd\xbd\x63\x95\x16\x22\x25\xc7\xcc\xa7\
+\x7f\x97\xf7\x6e\xaf\x9d\xcd\xbe\xa0\xe5\x41\xfb\x9c\x92\xf0\xb4\
+\xbc\xec\xf9\xca\x59\xc7\xeb\x11\x46\xd4\xfb\x1a\x2b\x8f\x8f\x25\
+\xfd\x5c\xd2\x2f\x24\xf5\x48\xda\xad\x64\x55\x82\x9b\x95\x04\xf0\
+\xe5\xfd\xcf\xa7\x24\xbd\x1d\x29\xda\x16\x2b\xbe\x45\xc9\xf2\xee\
+\xf2\x49\xea\x7c\x93\x92\x20\x78\x83\x24\xc5\x69\x48\xe3\x9c\x0a\
+\x5e\xea\x92\xbf\x72\x28\x9f\xce\xaa\x2f\x3a\x29\xf2\x05\x75\x95\
+\x4a\xa5\xab\x7d\x3f\x45\x27\x15\xbd\x96\xae\xb5\xa7\x7c\xb2\x0a\
+\x81\xd3\x4d\xe9\x59\x37\x4a\x32\x85\xf8\x92\x92\x59\xec\x17\x0a\
+\x2a\x2c\x96\xe2\x52\x31\xf9\xfe\x4a\x96\x5e\x83\x9f\xa5\xdf\xa7\
+\x29\x09\xd9\x6f\x93\xf4\x43\x25\x21\xf9\x76\x25\x41\xfa\x62\xfa\
+\xf8\x45\x95\x57\x2a\x88\xa2\x5b\x15\xc7\xe5\xed\x0f\x7e\x2c\xa9\
+\xdb\x4b\xdb\xe5\x7d\x94\x2e\xcb\x9f\xa8\x4e\x2d\xbd\x4d\x49\x90\
+\x3e\x25\xaf\x78\x95\x2b\xd3\xa3\xa4\x97\x66\x95\xcc\xe4\x2f\xcf\
+\x9e\x8f\x54\xed\xad\x72\x0f\x16\xd2\x5a\xde\x51\xb2\x22\xc5\x44\
+\xfa\xf5\xf2\x0d\x1e\x68\x31\x2c\x5d\xbf\x2e\x2c\x9d\xda\x2d\x29\
+\xfd\xa7\xb5\xda\x4c\xee\xf2\x6d\x2a\x57\x98\xd2\x7d\xf9\x6c\xef\
+\xd5\xe7\x7f\x5f\xf9\x65\xae\xb4\xc8\x7d\x13\x97\xb7\xcf\x98\xf3\
+\x57\xbf\xe3\x4a\xc9\x78\xf5\x8f\xf2\xa5\xda\x03\x6f\xf7\xc9\x4d\
+\x5e\x8c\x51\x00\x00\x00\x00\x00\x00\x40\x1b\x6b\xbb\x50\x1e\xb8\
+\x51\x27\xbf\xf3\x7f\xdd\xf6\x1f\xfe\xed\x89\x0f\xf4\xde\x74\xf3\
+\x54\xfc\xee\xa4\x24\x6d\x93\x4a\xc9\x5e\xe8\x69\x20\x2f\x49\x71\
+\x12\xec\x6d\x29\xa9\x54\x3b\x6b\xf6\x9d\xe4\x17\xe5\xcb\x7e\xad\
+\x7e\xa7\xde\x7a\x63\x9b\xce\x9d\x4d\xf7\x2e\x77\x52\x88\x0b\x2a\
+\x95\x66\x95\x84\xea\x2b\x9f\x72\xbb\x16\x66\xfb\xf4\x83\xbf\xdb\
+\x92\xc4\xb1\x5e\x8a\xe3\x82\x24\xa7\x48\xa5\xca\x32\xbc\x89\x5b\
+\x24\xf5\xe9\xec\x99\x6e\xfd\xe2\xcc\x82\x4a\xa5\x82\xd2\xfd\xe6\
+\x93\xfd\x81\x35\xaf\x78\x71\x87\xce\xbd\xb9\x49\xf2\x9b\x54\xdd\
+\x33\x7d\x83\x92\x40\x7c\x41\x4b\x4b\x41\xbf\x3a\x2b\x25\x91\x46\
+\xb7\xa4\x10\x27\xfb\x67\xcf\xc9\xeb\xac\x66\xa6\xcb\x31\x47\x52\
+\x61\x1c\x47\x4a\x66\xd3\x2b\xfd\xbe\xbb\x95\x84\xac\x33\xf2\x7e\
+\x21\xae\x5e\x8b\xf2\x9e\xed\xc9\x79\x92\xbf\xcb\x4b\xcf\x97\x03\
+\xf6\x05\x55\x97\x0a\x2f\xd5\xbc\x66\xbb\xcf\x44\x0e\x4a\xc2\xdd\
+\xff\x28\xe9\x9f\x94\x04\xc7\xbb\xd3\xbf\xcb\xe1\xfc\x6c\xac\xf8\
+\x82\x92\xf0\x7a\x83\xa4\xf7\x28\x09\xaf\x27\x94\x2e\xa3\xef\xe4\
+\xcc\x7b\x1f\xd2\xbf\x0b\xaa\x2e\xb1\x5f\x1b\xa4\x3b\x25\xab\x22\
+\x74\x97\x4a\xda\x28\x49\x5e\xda\xa8\xd2\x65\xfb\xb0\x6f\x4c\xff\
+\x94\x67\x81\x6f\xf5\x4e\x05\x39\x75\x5d\x61\x51\xf5\x48\xc9\xcc\
+\xf1\x1d\x4e\xee\x0e\xef\xfd\x94\x92\xa0\xfa\xbc\xa4\x0b\xf2\xe5\
+\x7d\xd4\x0b\xdd\x25\x95\xfa\x95\xfc\x0c\xcb\x61\xfc\x85\x15\xe7\
+\x7e\x53\x49\x9f\xfc\x20\xfd\xd8\xa5\x9f\xf7\xa4\xb5\xf7\x2b\x09\
+\xcc\x37\xa6\x2b\x28\x4c\xa5\xaf\x31\xab\x24\xb8\x9f\x91\xd4\xe3\
+\xbd\x6e\x95\x74\xbb\xa2\x68\x42\x71\xbc\x49\x4e\x91\xbc\xde\x92\
+\xe4\x5d\x92\x67\x6d\xac\xbd\x2e\x91\xa2\x77\xe2\x64\x3b\x06\x2f\
+\xa9\xe0\x9c\xde\xe3\x7d\xa5\xe7\xe6\x94\xfc\x5b\x29\xaf\x54\x70\
+\x4e\xc9\x8c\xf8\x4b\x4a\x7a\xb1\x9d\xfb\xaf\x65\x31\x5b\xbe\x65\
+\x98\x9c\x93\xbc\x2f\x2f\xe5\x5e\x79\xa0\x66\x56\xb7\xad\xf8\xda\
+\x55\x67\x62\x5f\x9e\x87\xaf\x9e\x90\x5f\x39\x37\xbf\xd2\x22\xf7\
+\xeb\xb8\xbc\x7d\x8b\x4b\xdf\x06\x38\xd5\xb7\x72\x41\x79\xfb\x16\
+\xab\xf9\x1c\x00\x00\x00\x00\x00\x00\x40\x9b\x69\xcb\x50\x9e\xd9\
+\xf2\xb8\x11\xb7\xdc\x7e\xfb\xcc\xf6\xde\xbe\x8b\x37\xdd\x76\xc7\
+\xd4\x7c\xf2\x2b\xf2\x7f\xbe\xc1\x97\xfc\xa5\x4a\xa5\x72\x98\xe1\
+\xb4\x7c\xef\xe9\x2b\x39\xa7\xd2\xc2\xe5\xe1\xc7\xe5\x6b\xe7\x4a\
+\xd2\xf9\x74\xd6\x5c\xb4\xda\x83\x92\xc6\x56\xdc\x24\x50\xfe\x05\
+\x7e\x79\x1f\xf4\x69\x55\xf7\x63\x2f\x3f\x56\x5e\x4e\xbf\x5c\xeb\
+\x82\xaa\xc1\x79\x9c\xfe\x3d\xad\xea\xfe\xec\x5e\x49\xb0\x59\x9e\
+\xe5\x5e\x3e\xae\x1c\xae\xaf\x9c\xfc\x97\x97\xc0\xb3\x7c\xc3\xc1\
+\x2f\x24\xfd\x52\x49\xf0\xbc\x2b\xfd\x73\xb3\x92\x9b\x2a\x76\x2a\
+\x09\x9d\x7f\x2a\x69\x2e\x5d\x8c\x21\xbd\x4f\x23\xb9\x6c\xe9\xdf\
+\x1b\xe5\xdc\x3d\xf2\xb6\x29\x6d\x84\xf2\xbe\xe8\xfd\x4a\xae\xef\
+\xac\x93\x2b\x7a\xa7\x72\xd0\xd6\xad\xea\xcf\x6f\x4b\x7a\x5c\x57\
+\x5a\x4f\xaf\x73\xea\xf6\x5e\x73\xf2\xea\x2d\xef\xbf\x9c\x1e\xbb\
+\x51\xd2\x16\x97\xcc\x50\xf7\x92\xa6\x4c\xf6\x37\x4a\x96\xa0\xaf\
+\x5d\xe7\xbe\x4b\x52\xaf\x54\x5a\x4c\xbf\xb7\x9f\xea\xf2\x30\xbe\
+\x7c\x0d\x4e\x2b\xb9\x41\xa1\x1c\x76\x97\xc3\xf0\x59\x25\xb3\xd2\
+\x7f\xac\xa4\x17\x37\xa4\xd7\x68\xa7\x92\x9b\x17\xb6\xd4\x9c\xab\
+\xbc\x65\x41\x2c\xc5\x3d\x92\x8a\x92\x8b\x24\xff\xa6\x24\xf3\xd5\
+\x7e\xdd\x5c\xfe\x13\x2b\x2e\x7f\xff\x45\x49\x8b\xde\x6b\x51\x49\
+\x8f\x4e\xa6\x35\xbf\xad\xea\xea\x0c\xe5\x5a\xd1\x60\x04\xf3\x37\
+\x6c\x51\x52\x6f\xb2\xd4\x79\x7a\x3b\x8a\xd2\x59\xd6\xce\xa5\x1f\
+\xfb\xd5\x67\x5c\x27\x41\xbc\x24\xf5\xcb\xfb\x9b\x94\xfc\x7b\x2b\
+\xe8\x9a\x13\xb4\x65\xaa\x6e\x35\xd1\x01\xf1\x77\xd3\x6c\x56\x32\
+\x9e\x5d\xeb\xfa\x4a\x4e\x45\x79\xfd\xba\x49\xb7\x06\xe9\xec\x9a\
+\x9e\x93\xe8\x49\xcf\xf3\x9f\xa6\x9f\x9b\xaa\xe3\x3d\x00\x00\x00\
+\x00\x00\x00\x80\x36\xd1\x96\xa1\x3c\x70\x23\x66\x67\xe6\x0a\x73\
+\x97\x66\x37\x4c\xbe\xf3\xce\x16\x37\x3f\x2f\x25\xb3\x9a\x57\x53\
+\x9e\x8d\x76\xad\x20\xaf\x76\xd6\x5a\x23\x67\x80\xaf\x75\x76\x5c\
+\x79\xcf\xee\x49\x2d\xdf\x8b\x7d\x5e\xd5\xd9\xeb\xe5\xb0\x3d\x59\
+\x6e\x3e\x09\x07\x6a\xff\x5e\xeb\x1e\xed\x48\x94\x7f\xee\x53\x92\
+\xfe\x41\xd2\x4f\x24\xdd\xa1\x64\x76\xfc\x6d\x4a\x96\xac\xef\x91\
+\x34\xa7\x52\x65\x79\xfb\xc5\x65\xaf\x50\x50\x50\xc9\x17\x24\xdd\
+\x25\xc9\x3b\x39\x97\x2e\x77\xff\x2b\x25\x01\x4e\x12\xde\x7b\x75\
+\x3b\xe9\x26\x2f\xbd\xdf\x49\xa5\x74\x9f\x61\x2f\xe9\x8c\x92\xa5\
+\xe3\x4d\x52\xe4\xbd\xb6\x49\xda\x2d\xa7\x5b\x62\x5f\xbe\x0f\x43\
+\x4a\x5f\x77\xca\x47\x7a\x43\xb1\x66\x24\xc5\xb5\xf3\x57\x0b\x2a\
+\x74\x85\xa8\xd4\x1f\xc7\x5a\x50\x32\x33\xfe\x27\x4a\x6e\xd0\xb8\
+\x5a\x0f\x78\x5d\x39\x60\xaa\xbd\x71\x63\x29\x7d\xad\xb7\xd2\xc7\
+\x8a\x4a\x6e\x2e\xd8\x91\x5e\xa3\xed\x92\xb6\xa6\x33\x76\x67\xe5\
+\x7d\x79\xdb\x83\xa2\x92\x5e\xed\x4d\xaf\xe9\x8c\xaa\x37\xc0\xc4\
+\xaa\x2e\x47\xff\xab\xf4\xda\xce\xa9\xfd\x57\x63\x68\x6b\xeb\x11\
+\xcc\xe7\x74\xe9\xfa\x20\xe9\xbb\x92\x7e\x5c\x59\x62\x25\xfd\x97\
+\x95\x7c\xea\xab\x1f\xaf\x26\x79\xdc\x24\x7d\x42\xd2\xef\x28\x09\
+\xda\xd7\xfa\xef\xe0\x07\x92\xfe\x5a\xc9\xbf\x27\x5c\x9b\x29\xb9\
+\xc6\xbf\xa7\x64\x8c\xba\xba\xe4\x87\x16\x05\xe9\x6f\x25\x0d\x29\
+\xb9\x61\xe8\x7a\x75\x29\xb9\x51\x0a\x00\x00\x00\x00\x00\x00\x40\
+\x9b\x68\xdb\x50\x9e\xd9\xf2\xb8\x1e\x2e\x8a\xc2\xfd\xbf\xf3\xc8\
+\x5b\x1f\xbc\xfb\x9e\x77\xbb\xbb\x8b\xfe\xff\xf9\xc6\xd7\x24\xe9\
+\xd5\x75\x3c\x45\x79\x96\x79\x23\xac\x75\x56\x9d\xb4\x7c\xf7\xdd\
+\x50\xf3\x37\x21\x65\xe3\x95\x97\x4e\xff\xa9\x92\xa0\x7c\xa7\x92\
+\xa0\xfd\x56\x49\xff\xc2\x39\xf5\x7a\xef\x9c\xe4\x67\x94\x84\xcb\
+\xe9\xb3\x22\x49\xf1\x3b\x8a\xe4\x15\x2b\x4e\xe7\xc1\x3a\x45\x51\
+\x1c\xc5\xf1\xaf\x49\x91\x62\x49\x51\x14\x4b\xd2\x5b\x51\xba\xbb\
+\x7a\x65\xab\xe8\x48\xdd\x8a\xa3\x3b\xa2\x28\x2e\xc5\x52\x29\x8a\
+\x23\xc5\x8a\x5f\x97\x97\xa2\xca\xfd\x1c\x51\xb9\x29\x42\x14\xab\
+\x3b\x8e\xa2\x6e\xc5\x71\x88\x24\x93\x22\xa7\x28\xee\x2d\xc5\xa5\
+\xb7\x14\xeb\x75\x25\x61\xfc\x25\x35\xa6\x67\xca\xaf\x59\x9e\xd9\
+\x3e\xad\x64\x66\xbb\x29\x09\xb7\x36\x29\x99\xe1\x7b\x93\x92\xc0\
+\x7e\xab\x92\x9b\x4d\x5c\x7a\xec\x05\x25\xe1\xfb\x5b\xaa\x2e\x49\
+\xcf\xbe\xf0\x2d\x86\x19\xf3\xd7\xed\x42\xfa\xe7\x7a\x99\x92\x6d\
+\x28\xca\xdb\x61\xac\x55\x49\xc9\xaa\x16\xe7\x6f\xe0\xdc\x79\x62\
+\x4a\x56\x16\x28\x6f\x3d\xb2\x56\x8b\x92\x7e\xa8\x64\x0c\x03\x00\
+\x00\x00\x00\x00\x00\x90\x13\x6d\x1b\xca\x4b\x04\xf3\xb8\x3e\xc5\
+\xae\xae\x70\xe7\xaf\xbf\x6f\x56\x92\xba\xba\xba\xa4\xea\xfe\xe9\
+\x9d\x84\xe5\x87\x5b\x83\x57\x12\x1a\x4f\x28\x99\xd9\xf8\x5f\x79\
+\xaf\xf7\x4b\x7e\x41\xc9\x92\xf7\x3f\xab\x1c\x59\xde\xba\x20\xf9\
+\x2b\x52\x39\xe4\xa9\xcc\x63\x8f\x97\x1d\x56\x7d\x5e\xed\xdf\xb1\
+\xc5\xb1\x8a\x92\x8a\xb5\xb3\xdf\xe3\xe5\x07\xd5\x1c\xbe\xec\x95\
+\x37\x2a\xd6\x3b\x4a\x96\xa1\x9f\x51\xf3\x03\xee\xf2\x4d\x23\xe5\
+\x95\x1c\xde\x55\x32\x53\xdf\x29\xb9\x16\xe5\x90\xfe\xbc\x92\x19\
+\xa6\x84\xf0\x1d\x2c\xa7\xb3\xe4\x01\x00\x00\x00\x00\x00\x00\x00\
+\x1d\xaa\xad\x43\x79\x00\x68\x13\xe5\xb0\xf9\x0d\x49\x1f\x54\xb2\
+\x14\xfb\x3b\x4a\x66\x59\xae\x16\x2c\x67\x19\x46\xb6\x5a\xd0\x5d\
+\x5e\x1a\x7f\x42\xc9\x96\x0c\xad\x56\x1f\xae\x82\xd9\xf2\x00\x00\
+\x00\x00\x00\x00\x00\x00\xd4\xb7\xac\x69\x4b\xfa\xe2\x17\xbf\x68\
+\xdf\xfa\xf2\x9f\xbc\x98\x75\x1d\x00\xb0\x06\x0b\x92\xde\x56\x75\
+\xcf\xf3\x2b\x09\x19\xfe\x69\x65\xad\x5e\x1f\x56\x51\x0e\xe6\xb3\
+\xae\x03\x00\x00\x00\x00\x00\x00\x00\x80\xac\xb4\x7d\x28\x0f\x00\
+\x6d\xe4\x1d\x49\xc3\x92\xfe\x4f\x25\x7b\x37\x13\x32\x23\x17\xea\
+\x09\xe6\x59\xba\x7e\x5d\xf0\xfe\xae\x39\xba\x74\x7d\xe3\x38\x63\
+\x3f\x00\x00\x00\x00\x00\x00\x90\x33\x1d\xb1\x7c\x3d\x7b\xcb\x03\
+\x68\x13\x41\x52\x29\xeb\x22\x00\x74\x34\x53\xb2\x2a\xc7\x37\x94\
+\x6c\xf9\xb0\x16\x4e\xd2\x76\x65\xbb\x75\x46\xbb\x31\x25\x5b\x6b\
+\x1c\x93\x34\xb6\xc6\xe7\x38\x49\x5b\x25\x15\x1b\x55\x14\x00\x00\
+\x00\x00\x00\x00\x80\xd6\xd4\x11\xa1\x3c\x00\x00\x68\x6d\x6b\xd9\
+\x5f\x9e\x59\xf2\xeb\x22\x48\x9a\x90\xf4\xbf\x49\xfa\xa7\x35\x3e\
+\xa7\x28\xe9\xa0\x98\xc1\x5d\x8f\xa0\x24\x8c\xff\xdf\x25\xfd\xfd\
+\x1a\x9f\x53\x94\xf4\x09\x49\x4b\x8d\x2a\x0a\x00\x00\x00\x00\x00\
+\x00\x40\x6b\xea\x98\x50\xbe\x3c\x5b\x3e\xeb\x3a\x00\x00\xc0\xea\
+\xd6\x12\xcc\x63\xdd\x78\x49\xf1\x1a\x8f\x8d\xc4\x7b\xa8\xeb\x55\
+\xef\x75\x36\xb1\x22\x01\x00\x00\x00\x00\x00\x00\x90\x3b\xec\x39\
+\x0a\x00\x00\x9a\xa6\x9e\xfd\xe5\x81\x0e\xc4\xcd\x0f\x00\x00\x00\
+\x00\x00\x00\x40\x0e\x75\xcc\x4c\x79\x29\x99\x2d\xff\xe4\x93\x4f\
+\x86\x6f\x7d\xf9\x4f\x5e\xcc\xba\x16\x00\x00\xb0\xba\xd5\x66\xcc\
+\xb3\x74\x3d\x00\x00\x00\x00\x00\x00\x00\xa0\x53\x75\x54\x28\x2f\
+\x55\x96\xb1\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x73\
+\x1d\x17\xca\x03\x00\x80\xd6\x57\x3b\x5b\x9e\x59\xf2\x0d\x71\x87\
+\xa4\x0b\x6b\x3c\xb6\x28\x69\x53\x03\x6b\xe9\x64\xdb\x24\xed\x58\
+\xe3\xb1\xc5\xf4\x0f\x00\x00\x00\x00\x00\x00\x80\x9c\x21\x94\x07\
+\x00\xa0\x89\xfe\xcd\x97\xff\x84\xfd\xd4\x6b\xb1\xbf\x7c\x23\xdc\
+\x2c\xe9\x7f\x95\x14\xd7\xf1\x9c\xf3\x92\xfe\xba\x31\xe5\x74\xac\
+\x9d\x92\x3e\x2f\x69\xb1\x8e\xe7\x5c\x90\x44\xcf\x03\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x40\x9b\x32\x49\xff\x93\x92\x40\x3e\xd4\
+\xf1\xe7\x35\x49\xb7\x64\x50\x6f\xbb\x32\x49\xff\x83\xa4\x25\xd5\
+\x77\x9d\x4f\x2a\x99\x5d\x0f\x00\x00\x00\x00\x00\x00\x20\x47\x5c\
+\xd6\x05\x00\x00\x00\x00\x6d\x28\x5c\xc7\x73\x9c\x92\x40\x1f\x00\
+\x00\x00\x00\x00\x00\x40\x8e\x10\xca\x03\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\xd0\x20\x84\xf2\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x34\x48\x21\xeb\x02\x00\x00\x00\xb0\xae\x9c\xea\x5f\
+\x5a\x9d\x25\xd5\xeb\x17\x49\x8a\x55\xdf\x4d\xae\x5c\x67\x00\x00\
+\x00\x00\x00\x00\x20\x87\x08\xe5\x01\x00\x00\x3a\xcb\x0f\x24\x3d\
+\xa7\x24\x30\x5e\x0b\x93\x34\x2e\xc9\x37\xac\xa2\xce\xf4\x4f\x92\
+\xbe\x24\xa9\xb4\xc6\xe3\xcb\xd7\x79\xad\xc7\x03\x00\x00\x00\x00\
+\x00\x00\xe8\x10\xcc\xd6\x01\x00\x00\xe8\x2c\x4e\xc9\x2c\xee\x7a\
+\x98\xa4\xc5\x06\xd4\xd2\xc9\x4c\xf5\x6f\x05\xe5\x24\x2d\x35\xa0\
+\x16\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x60\
+\x9d\xd8\x1f\x1c\xfb\xbb\x90\x75\x11\xc8\x97\x3f\x3d\xf0\x9b\x6c\
+\x9b\x00\x34\xd0\xb3\xcf\x3e\xcb\xb8\x8e\xa6\xfa\xcc\x67\x3e\xc3\
+\xb8\x0e\x74\x88\xd1\xf1\x03\x17\x83\x6c\xf3\x40\xdf\x37\xeb\xdd\
+\x02\x01\x68\x6b\xe3\xa3\xa3\x17\x15\xc2\xe6\xbe\x81\x01\x7a\x1f\
+\xb9\x32\x7e\x66\xe8\xa2\x4c\x9b\xfb\xee\x1a\xa4\xf7\x91\x2b\x43\
+\xa7\xc6\x2f\xca\xb4\x79\xf0\x9e\x3e\x7a\x1f\xb9\x32\x3c\x3c\x7c\
+\x31\x84\xb0\xf9\xa1\x87\x1e\xa2\xf7\x01\x00\x68\xb2\x02\x01\x29\
+\x00\x74\x16\x02\x52\x00\x40\xbd\x46\xc7\x1f\x7b\x58\xd2\xbf\x92\
+\xf4\x8a\x14\xde\xcd\xba\x1e\xa0\x59\xc6\x47\x47\x6b\x7a\x5f\xf4\
+\x3e\x72\x63\xfc\xcc\xd1\x87\xa5\x90\xf6\xbe\xd1\xfb\xc8\x8d\xa3\
+\xa7\xc7\x1f\x0e\x21\x19\xf7\x8d\x71\x1f\x39\x32\x3c\x3c\xfc\xb0\
+\xa4\x7f\x65\x66\xbc\xe7\x01\x00\x00\x00\x00\x00\x00\x9a\xe5\x58\
+\x78\xb4\x69\xb3\x63\x42\x90\x85\xf0\xa4\x0b\x41\xdc\x38\x86\xcc\
+\x85\x63\xc7\x9a\xd8\xfb\xc1\x42\x08\x2e\x84\x40\xef\x23\x73\xe1\
+\x58\x33\xc7\xfd\x90\x8e\xfb\xf4\x3e\xb2\xf7\xe8\xb1\xd0\xd4\xde\
+\x7f\x92\x71\x1f\x2d\xe2\x18\xef\x79\x00\x00\x68\x29\xfc\x47\x12\
+\x00\x00\x00\x68\x53\x23\xe3\x07\xda\x6d\xcb\x92\x1f\xf9\xd0\xf5\
+\x91\x07\xfa\xbf\x71\x2e\xeb\x42\xd0\xde\xc6\x47\x46\xda\xae\xf7\
+\x83\xf7\x1f\xe9\x7f\xe0\x01\x7a\x1f\x37\x64\xfc\xcc\x50\x7b\xf5\
+\xbe\xe9\x47\xc1\x15\x3e\xd2\xbf\xeb\x09\x7a\x1f\x37\x64\xe8\xd4\
+\x78\x7b\xf5\xbe\xf4\xa3\x82\xc2\x47\x9e\xd8\xd3\x4f\xef\xe3\x86\
+\x0c\x0f\x0f\xb7\x55\xef\x87\x10\x7e\x14\xc7\xf1\x47\x1e\x79\xe4\
+\x11\x7a\x1f\x00\x80\x15\x5c\xd6\x05\x00\x00\x00\x00\xa8\xdf\xa9\
+\xf0\xa9\x62\xd6\x35\x5c\x87\xdf\x70\xb6\xf0\xcc\x89\xb1\xdf\xbd\
+\x35\xeb\x42\xd0\xbe\xc2\xa9\x53\x6d\xd9\xfb\xe6\xdc\x33\x63\x27\
+\x4e\xd0\xfb\xb8\x6e\xe1\xd4\xf3\xed\xd7\xfb\x41\xbf\x61\x71\xe9\
+\x99\xb1\xb3\x4f\xd1\xfb\xb8\x6e\xcf\x9f\x0a\xed\xd7\xfb\xd2\x6f\
+\x94\xcc\x9e\x79\xea\xd4\x18\xbd\x8f\xeb\xf6\xfc\xf3\xed\x37\xee\
+\x9b\xd9\x6f\x14\x0a\x85\x67\x5e\x7a\xe9\x25\x7a\x1f\x00\x80\x15\
+\x08\xe5\x01\x00\x00\x80\x36\x74\x8f\xfe\xac\x94\x75\x0d\xd7\xc7\
+\x1e\x26\x98\xc7\x0d\xb9\xe7\x9e\x36\xed\x7d\x3d\x4c\x30\x8f\x1b\
+\x72\xcf\xa7\xda\xb7\xf7\x09\xe6\x71\x03\x3e\x75\x8f\xda\xb3\xf7\
+\x83\x1e\x26\x98\xc7\x8d\xf8\xd4\xa7\xda\x77\xdc\x27\x98\x07\x00\
+\xe0\x72\x2c\x5f\x0f\x00\x00\x00\xe4\xc8\x89\xb1\xc7\xee\x8e\x5c\
+\xd8\xa7\x60\x0f\xca\xc2\x5d\x21\x68\xfb\xca\x63\x06\xfa\x8e\xad\
+\xfb\xff\x4f\x18\x99\x7c\xec\x90\x05\x3d\x1d\x42\x65\xb6\xdb\x69\
+\x0b\xee\xf0\xde\xfe\x17\x4e\xae\xf7\xb9\x80\xd5\x8c\x9d\x38\x71\
+\xb7\x8b\xa2\x7d\x41\x7a\xd0\xa4\xbb\x42\x08\x97\xf5\x7e\xdf\xc0\
+\xc0\xba\xf7\xfe\xe4\xc8\xc8\xa1\x60\xb6\xac\xf7\x83\xd9\xe1\xfe\
+\xbd\x7b\x4f\xae\xf7\xb9\x80\xd5\x8c\xfd\xf4\x2b\x77\x3b\x17\xed\
+\x0b\xf2\x0f\x9a\xd9\xea\xbd\xbf\x7b\x70\xfd\x7b\xff\x8d\xa1\x43\
+\xc1\xdb\xd3\x41\xe5\xde\xb7\xd3\xc1\x85\xc3\xfd\x77\x0e\x9e\x5c\
+\xef\x73\x01\xab\xf9\xca\xa9\xb1\xbb\x23\x73\xfb\x7c\x08\x57\xec\
+\xfd\xc1\x3d\x7d\xeb\xde\xfb\x43\xa7\x27\x0f\x99\x42\x65\xdc\x37\
+\xd3\xe9\xe0\xc3\xe1\xc1\x7b\xfb\x4f\xae\xf7\xb9\x80\xd5\x1c\x3f\
+\x7e\xfc\xee\x10\xc2\x3e\x49\x0f\x4a\xba\x4b\xba\xfc\xfd\xfe\xfe\
+\xfd\xfb\xd7\xbd\xf7\x8f\x1f\x3f\x7e\x28\x84\xf0\xb4\xa4\xca\x7b\
+\x1e\xe7\xdc\xe1\x7d\xfb\xf6\x9d\x5c\xef\x73\x01\x00\xd0\x8e\x08\
+\xe5\x01\x00\x00\x80\x1c\x5a\x1e\xce\xeb\x96\x10\xc2\x6d\xe5\xc7\
+\x1a\x11\xca\x4b\xab\x04\xf3\x66\x67\xcd\xdb\x41\x82\x79\x34\xd3\
+\x8a\x70\x7e\x59\xef\x37\x22\x94\x97\x2e\x0f\xe6\x4d\x3a\xeb\xcd\
+\x0e\x12\xcc\xa3\x99\x96\x87\xf3\xba\x25\x04\x55\x7b\xbf\x01\xa1\
+\xbc\x74\x79\x30\x6f\x66\x67\xbd\x85\x83\x04\xf3\x68\xa6\xda\x70\
+\x5e\x66\xb7\xa8\x66\xdc\x6f\x44\x28\x2f\xad\x16\xcc\xdb\xd9\xe0\
+\xfd\x41\x82\x79\x34\xd3\x8a\x70\xfe\x16\xa9\x3a\xee\x37\x22\x94\
+\x4f\xcf\xb9\x32\x98\x3f\xeb\x9c\x3b\x48\x30\x0f\x00\x00\xa1\x3c\
+\x00\x00\x00\x90\x6b\x27\xc6\x1e\xbb\x3b\x32\xfd\x79\x50\xf8\x75\
+\x49\x9b\xa4\xc6\x85\xf2\x52\x1a\xcc\xfb\x30\x14\xa4\x1e\x49\x04\
+\xf3\xc8\xcc\xd8\x89\x13\x77\x5b\x14\xfd\xb9\x42\xb5\xf7\x1b\x15\
+\xca\x4b\x49\x30\xef\xcd\x86\x14\x42\x8f\x44\x30\x8f\xec\x8c\xfd\
+\xf4\x2b\x77\x9b\xb3\x3f\x97\xe9\xd7\x15\xd2\xde\x6f\x50\x28\x2f\
+\x25\xc1\xbc\xf7\x1a\x52\x3a\xee\x13\xcc\x23\x2b\x5f\x39\x35\x76\
+\xb7\x69\x79\xef\x37\x2a\x94\x97\x92\x60\x5e\xc1\x2f\xeb\x7d\x82\
+\x79\x64\x21\x0d\xe7\xff\x5c\x52\xe5\x3d\x4f\xa3\x42\xf9\xf4\x7c\
+\x87\x42\x08\x95\xde\x17\xc1\x3c\x00\x00\x92\x08\xe5\x01\x00\x00\
+\x00\x28\x09\xe7\x9d\x0b\xdf\xb3\xa0\x85\xbd\x7d\xc7\xb6\x36\xf2\
+\x5c\xa3\x63\x8f\xdf\x17\x5c\xf8\xba\x42\xd8\x25\x89\x60\x1e\x99\
+\x1a\x3b\x71\xe2\x6e\xe7\xdc\xf7\x82\xd9\x42\xdf\xde\xbd\x0d\xed\
+\xfd\xb1\xd1\xd1\xfb\x5c\x08\x5f\x0f\xd2\x2e\x89\x60\x1e\xd9\x4a\
+\x66\xce\xdb\xf7\x82\xb4\xd0\xb7\x7b\xb0\xb1\xbd\xff\xc6\xd0\x7d\
+\x2e\xd8\xd7\x43\x3a\xee\x13\xcc\x23\x4b\x5f\x39\x35\x76\xb7\x99\
+\xfb\x9e\x42\x58\x18\xdc\xd3\xd7\xd0\xde\x1f\x7a\x6d\xec\x3e\x73\
+\x6e\x59\xef\x13\xcc\x23\x2b\x69\x38\xff\x3d\x49\x0b\xfb\xf7\xef\
+\x6f\x68\xef\xbf\xf2\xca\x2b\xf7\x79\xef\xbf\xae\xf4\x3d\x8f\x08\
+\xe6\x01\x00\x20\x94\x07\x00\x00\x00\x50\x75\x62\xec\xb1\xbb\x1f\
+\xe8\xff\xe6\xdf\x37\xfa\x3c\x04\xf3\x68\x35\x63\x27\x4e\xdc\xdd\
+\xff\xc0\x03\x0d\xef\x7d\x82\x79\xb4\x9a\xb1\x9f\x7e\xe5\xee\xfe\
+\xff\xe4\xf3\x8d\xef\x7d\x82\x79\xb4\x98\xaf\x9c\x1a\xbb\xfb\xf3\
+\x7b\xfa\x1b\xde\xfb\x04\xf3\x68\x35\xc7\x8f\x1f\xbf\xfb\xc1\x07\
+\x1f\x6c\x78\xef\x13\xcc\x03\x00\xb0\x1c\xa1\x3c\x00\x00\x00\x80\
+\x4c\x10\xcc\x23\xaf\x08\xe6\x91\x57\x04\xf3\xc8\x2b\x82\x79\xe4\
+\x15\xc1\x3c\x00\x00\x55\x84\xf2\x00\x00\x00\x00\x32\x43\x30\x8f\
+\xbc\x22\x98\x47\x5e\x11\xcc\x23\xaf\x08\xe6\x91\x57\x04\xf3\x00\
+\x00\x24\x08\xe5\x01\x00\x00\x00\x64\x8a\x60\x1e\x79\x45\x30\x8f\
+\xbc\x22\x98\x47\x5e\x11\xcc\x23\xaf\x08\xe6\x01\x00\x20\x94\x07\
+\x00\x00\x00\xd0\x02\x08\xe6\x91\x57\x04\xf3\xc8\x2b\x82\x79\xe4\
+\x15\xc1\x3c\xf2\x8a\x60\x1e\x00\x90\x77\x84\xf2\x00\x00\x00\x00\
+\x5a\x02\xc1\x3c\xf2\x8a\x60\x1e\x79\x45\x30\x8f\xbc\x22\x98\x47\
+\x5e\x11\xcc\x03\x00\xf2\x8c\x50\x1e\x00\x00\x00\x40\xcb\x20\x98\
+\x47\x5e\x11\xcc\x23\xaf\x08\xe6\x91\x57\x04\xf3\xc8\x2b\x82\x79\
+\x00\x40\x5e\x11\xca\x03\x00\x00\x00\x68\x29\x04\xf3\xc8\x2b\x82\
+\x79\xe4\x15\xc1\x3c\xf2\x8a\x60\x1e\x79\x45\x30\x0f\x00\xc8\x23\
+\x42\x79\x00\x00\x00\x00\x2d\x87\x60\x1e\x79\x45\x30\x8f\xbc\x22\
+\x98\x47\x5e\x11\xcc\x23\xaf\x08\xe6\x01\x00\x79\x43\x28\x0f\x00\
+\x00\x00\xa0\x25\x11\xcc\x23\xaf\x08\xe6\x91\x57\x04\xf3\xc8\x2b\
+\x82\x79\xe4\x15\xc1\x3c\x00\x20\x4f\x08\xe5\x01\x00\x00\x00\xb4\
+\x2c\x82\x79\xe4\x15\xc1\x3c\xf2\x8a\x60\x1e\x79\x45\x30\x8f\xbc\
+\x22\x98\x07\x00\xe4\x05\xa1\x3c\x00\x00\x00\x80\x96\x46\x30\x8f\
+\xbc\x22\x98\x47\x5e\x11\xcc\x23\xaf\x08\xe6\x91\x57\x04\xf3\x00\
+\x80\x3c\x20\x94\x07\x00\x00\x00\xd0\xf2\x08\xe6\x91\x57\x04\xf3\
+\xc8\x2b\x82\x79\xe4\x15\xc1\x3c\xf2\x8a\x60\x1e\x00\xd0\xe9\x08\
+\xe5\x01\x00\x00\x00\xb4\x05\x82\x79\xe4\x15\xc1\x3c\xf2\x8a\x60\
+\x1e\x79\x45\x30\x8f\xbc\x22\x98\x07\x00\x74\x32\x42\x79\x00\x00\
+\x00\x00\x6d\x83\x60\x1e\x79\x45\x30\x8f\xbc\x22\x98\x47\x5e\x11\
+\xcc\x23\xaf\x08\xe6\x01\x00\x9d\x8a\x50\x1e\x00\x00\x00\x40\x5b\
+\x21\x98\x47\x5e\x11\xcc\x23\xaf\x08\xe6\x91\x57\x04\xf3\xc8\x2b\
+\x82\x79\x00\x40\x27\x22\x94\x07\x00\x00\x00\xd0\x76\x08\xe6\x91\
+\x57\x04\xf3\xc8\x2b\x82\x79\xe4\x15\xc1\x3c\xf2\x8a\x60\x1e\x00\
+\xd0\x69\x08\xe5\x01\x00\x00\x00\xb4\x25\x82\x79\xe4\x15\xc1\x3c\
+\xf2\x8a\x60\x1e\x79\x45\x30\x8f\xbc\x22\x98\x07\x00\x74\x12\x42\
+\x79\x00\x00\x00\x00\x6d\x8b\x60\x1e\x79\x45\x30\x8f\xbc\x22\x98\
+\x47\x5e\x11\xcc\x23\xaf\x08\xe6\x01\x00\x9d\x82\x50\x1e\x00\x00\
+\x00\x40\x5b\x23\x98\x47\x5e\x11\xcc\x23\xaf\x08\xe6\x91\x57\x04\
+\xf3\xc8\x2b\x82\x79\x00\x40\x27\x70\x59\x17\x00\x00\x00\x00\x00\
+\x37\x62\x6f\xff\x0b\x27\xcd\xdb\x41\x99\x9d\x95\x24\x85\xb0\x2b\
+\xb8\xf0\xf5\x6c\xab\x02\x1a\xaf\x7f\xef\xde\x93\xde\xd3\x8f\xb9\
+\xbb\x00\x00\x20\x00\x49\x44\x41\x54\xec\xa0\x49\x67\x25\x29\x48\
+\xbb\x5c\xa0\xf7\xd1\xf9\xfa\xef\x1c\x3c\xe9\x2d\x1c\xb4\x74\xdc\
+\x0f\x21\xec\x72\xc1\xe8\x7d\x74\xbc\xc1\x7b\xfb\x4f\x06\xef\x97\
+\xf5\xbe\x39\x47\xef\xa3\xe3\xed\xdb\xb7\xef\xa4\x73\xee\xa0\xd2\
+\xf7\x3c\x92\x76\xa5\x21\x3d\x00\x00\x6d\x23\x77\xa1\xfc\xd1\x9f\
+\x84\xbe\xe7\x4f\x85\x62\xd6\x75\x00\x00\xd6\xc7\xf1\x7f\xf7\xef\
+\xfa\x9e\x3f\x75\x8a\x71\x1d\x00\x72\x6e\xb5\x60\x5e\x92\x46\x26\
+\x1f\x3b\x94\x61\x59\x40\xc3\xad\x16\xcc\x4b\xd2\xe4\xc8\x08\xbd\
+\x8f\x8e\xb6\x5a\x30\x2f\x49\x93\x6f\x0c\xd1\xfb\xe8\x68\xab\x05\
+\xf3\x92\x34\x74\x7a\x92\xde\x47\x47\x5b\x2d\x98\x97\xa4\xe3\xc7\
+\x8f\xd3\xfb\x00\x80\xb6\x90\xbb\x50\xfe\xf0\xfb\x6d\xfc\xd0\x1e\
+\x5b\xca\xba\x0e\x00\xc0\xfa\x78\xf0\xc3\x1f\x1e\x3f\xb4\x67\x0f\
+\xe3\x3a\x00\x60\x59\x30\x6f\xb2\xbf\x97\x24\x0b\x7a\x9a\x60\x1e\
+\x9d\x6e\x59\x30\x6f\x49\xef\x07\xb3\xa7\x09\xe6\xd1\xe9\x56\x04\
+\xf3\x49\xef\x7b\x7b\x9a\x60\x1e\x9d\x6e\x45\x30\x9f\xbc\xe7\x51\
+\x78\x9a\x60\x1e\x9d\x6e\x45\x30\x9f\x8c\xfb\x21\x3c\x4d\x30\x0f\
+\x00\x68\x07\xb9\x0b\xe5\x01\x00\x00\x00\x74\xae\x4a\x30\xef\xf4\
+\x1d\x49\x0a\x21\x14\x09\xe6\x91\x07\xe5\x60\xde\xa9\xda\xfb\x04\
+\xf3\xc8\x83\x72\x30\xef\x2c\xed\x7d\x85\x22\xc1\x3c\xf2\xa0\x1c\
+\xcc\xcb\x5c\xf5\x3d\x0f\xc1\x3c\x72\xa0\x1c\xcc\x9b\xd9\x77\xd2\
+\x2f\x15\x09\xe6\x01\x00\xed\x80\x50\x1e\x00\x00\x00\x40\x47\xd9\
+\xdb\xff\xc2\xc9\x82\x2d\x1c\x2d\x7f\x1e\x42\x28\xca\x87\xe7\x46\
+\xc7\x1f\xfb\x46\x96\x75\x01\x8d\xd6\xbf\x77\xef\x49\x2b\x14\x96\
+\xf5\xbe\x97\x9e\x1b\x1f\x1d\xa5\xf7\xd1\xd1\xfa\xef\x1c\x3c\x69\
+\x56\xd3\xfb\x0a\x45\xef\xf5\xdc\xf8\x99\xa3\xf4\x3e\x3a\xda\xe0\
+\xbd\xfd\x27\x0b\xce\x96\xbf\xe7\x09\xfe\xb9\xa3\xa7\xc6\xe9\x7d\
+\x74\xb4\x7d\xfb\xf6\x9d\x8c\xe3\xf8\x68\xcd\x97\x8a\x21\x84\xe7\
+\x86\x87\x87\xe9\x7d\x00\x40\xcb\x22\x94\x07\x00\x00\x00\xd0\x71\
+\x3e\xbc\xe3\xe5\x29\x49\x92\xe9\x6f\xca\x5f\x0b\xa6\xc7\x33\x2b\
+\x08\x68\x92\x1d\x1f\xfe\xf0\x94\x24\x99\xaa\xbd\x6f\x21\xd0\xfb\
+\xe8\x78\x3b\xee\x7c\xe2\xf2\xde\x67\xdc\x47\x0e\x3c\xf1\xa1\x1d\
+\xc9\x7b\x1e\xd9\xdf\x54\xbf\x6a\xf4\x3e\x3a\xde\x47\x3f\xfa\xd1\
+\xb4\xf7\x55\xd3\xfb\x8c\xfb\x00\x80\xd6\x45\x28\x0f\x00\x00\x00\
+\xa0\x73\x99\xaa\xb3\x65\x42\x28\x65\x58\x09\xd0\x54\xa6\x6a\xef\
+\x07\x89\xde\x47\x6e\x98\xac\xda\xfb\x81\xde\x47\x7e\x98\xab\xf6\
+\xbe\x8c\xf7\x3c\xc8\x95\xda\xd9\xf1\xf4\x3e\x00\xa0\x65\x11\xca\
+\x03\x00\x00\x00\xe8\x58\x21\xb6\xf2\x0c\x1a\x99\x69\x2e\xcb\x5a\
+\x80\x66\x8a\x43\xa8\xe9\x7d\xa3\xf7\x91\x1b\xcb\x7b\x9f\x71\x1f\
+\xf9\x11\xe2\x78\xaa\xfa\x19\xe3\x3e\x72\xa5\xa6\xf7\x19\xf7\x01\
+\x00\xad\x8b\x50\x1e\x00\x00\x00\x40\x2e\x04\xc9\x67\x5d\x03\x90\
+\x89\x10\xe8\x7d\xe4\x15\xbd\x8f\x7c\x0a\xf4\x3e\xf2\x29\xf0\x9e\
+\x07\x00\xd0\xc2\x08\xe5\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x68\x10\x42\x79\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x1a\x84\x50\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x06\
+\x21\x94\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa0\x41\x08\
+\xe5\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x68\x10\x42\x79\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x84\x50\x1e\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x06\x21\x94\x07\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\xa0\x41\x08\xe5\x01\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\xed\xc5\xb2\x2e\x00\x00\x00\x00\x00\x1a\xe5\xd5\xb1\
+\xc7\x1e\x37\x0b\x7f\x2d\x49\x32\x4d\x0e\xf4\x1e\xeb\xcd\xb8\x24\
+\xa0\x29\xc6\x5e\x7d\xf5\x71\x33\xfb\x6b\x49\x32\x69\xb2\x77\x60\
+\x80\xde\x47\x2e\x8c\xfd\x6c\xe8\x71\x33\x25\xbd\x6f\x36\xd9\x7b\
+\xd7\x61\x7a\x1f\xb9\x30\xf4\xda\xd8\xe3\xaa\x8c\xfb\x36\x79\x78\
+\x4f\x2f\xbd\x8f\x5c\x18\x1e\x1e\x7e\x5c\x4a\xc6\xfd\x10\xc2\xe4\
+\x43\x0f\x3d\x44\xef\x03\x00\x5a\x12\xcb\xd7\x03\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\xd0\x20\x84\xf2\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x34\x08\xa1\x3c\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x0d\x42\x28\x0f\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x40\x83\x14\xb2\x2e\x00\x00\x00\x00\x00\x6a\xbd\x7a\xfe\
+\xa3\x37\x59\xa1\xeb\x4b\x52\xf8\x6d\x99\xfe\x6a\xa0\xf7\xd8\x9f\
+\x64\x5d\x13\xd0\x0c\xe7\x5f\x7d\xf5\xa6\x82\xd9\x97\x24\xfd\xb6\
+\x49\x7f\xd5\x3b\x30\x40\xef\x23\x17\xce\xff\x6c\xe8\xa6\x82\xe9\
+\x4b\x92\xfd\xb6\x59\xf8\xab\xde\xbb\x06\xe9\x7d\xe4\xc2\xd0\x3f\
+\x9c\xbf\x49\xa5\xc2\x97\x2c\xe8\xb7\x83\xec\xaf\x06\xf7\xf4\xd2\
+\xfb\xc8\x85\x6f\x7d\xeb\x5b\x37\x15\x0a\x85\x2f\x85\x10\x7e\x5b\
+\xd2\x5f\xed\xdf\xbf\x9f\xde\x07\x00\x74\x3c\x66\xca\x03\x00\x00\
+\x00\x68\x29\xa1\xbb\xeb\x56\x59\xf8\xb8\xa4\xf7\x5a\xb0\x3f\x3a\
+\x16\x1e\x8d\xb2\xae\x09\x68\x86\xee\x10\x6e\x35\xe9\xe3\x92\xde\
+\x1b\xcc\xfe\x28\x1c\x3b\x46\xef\x23\x17\xba\x9d\x4b\x7b\x3f\xbc\
+\x37\xc8\xfe\x28\x1c\x63\xdc\x47\x3e\xb8\xb8\xfb\x56\xc9\x3e\x1e\
+\xa4\xf7\x9a\xc2\x1f\x3d\x7a\x2c\xd0\xfb\xc8\x85\x62\xb1\x78\x6b\
+\x08\xc9\xfb\x7d\x49\x7f\x74\x8c\xf7\x3c\x00\x80\x1c\x20\x94\x07\
+\x00\x00\x00\xd0\x52\xbc\x5f\x9a\x30\xd9\x45\x49\x0a\x0a\x1b\xf5\
+\xa6\xba\x46\xc7\x1f\xfb\x8d\xac\xeb\x02\x1a\xcd\x7b\x3f\x21\x4b\
+\x7a\x5f\x21\x6c\x7c\x53\xea\x1a\x1f\x1d\xa5\xf7\xd1\xf1\x7c\x5c\
+\x9a\x90\x6a\x7a\xff\xb7\x7e\xab\x6b\xfc\xec\x53\xf4\x3e\x3a\x5e\
+\x69\xd1\x4f\x98\x94\xbe\xe7\xd1\xc6\xdf\xba\xe3\xcd\xae\xa7\x4e\
+\x8f\xd3\xfb\xe8\x78\x8b\x8b\x8b\x13\x4a\x7b\x5f\xd2\x46\x49\x5d\
+\xdf\xfe\xf6\xb7\xe9\x7d\x00\x40\x47\x23\x94\x07\x00\x00\x00\xd0\
+\x52\x2e\xed\x8c\xce\x05\xe9\xd3\x66\xf6\x96\x24\x6d\x70\x73\x26\
+\x85\xc3\x23\x93\x8f\x1d\xca\xba\x36\xa0\x91\x76\x5e\xba\x74\x4e\
+\x21\x54\x7a\xdf\x6d\xd8\x60\x92\x0e\x4f\x8e\x8c\xd0\xfb\xe8\x68\
+\x3b\xbf\x7f\xea\x9c\xcc\x7f\xda\x4c\x49\xef\xbb\x0b\xa6\x38\x3e\
+\x3c\xf9\xc6\x10\xbd\x8f\x8e\x76\xea\x17\x3b\xcf\xf9\xa0\x4f\x2b\
+\x1d\xf7\x2f\x74\x39\x8b\xa5\xc3\x43\xa7\x27\xe9\x7d\x74\xb4\x38\
+\x8e\xcf\x49\xfa\xb4\x94\x8c\xfb\x1b\x36\x6c\xb0\x38\x8e\x0f\x1f\
+\x3f\x7e\x9c\xde\x07\x00\x74\x2c\x42\x79\x00\x00\x00\x00\x2d\xe5\
+\x80\xbd\x18\x0f\xf4\x7e\xf3\x45\x79\xfb\xb8\xcc\xce\x26\x5f\xb5\
+\x0d\x16\xf4\x34\xc1\x3c\x3a\x99\x1d\x38\x10\xf7\x0e\x0c\xbc\xe8\
+\xa5\x8f\x9b\x74\x36\xfd\xf2\x86\x60\xf6\x34\xc1\x3c\x3a\x99\x1d\
+\x78\x31\xee\xbd\xeb\xf3\x2f\x7a\xd3\xc7\xad\x32\xee\x87\x0d\xc1\
+\xdb\xd3\x04\xf3\xe8\x64\x2f\x1e\xb0\xf8\xf3\x7b\x7a\x5f\x94\xf7\
+\x95\xde\x0f\x41\x1b\x4c\xe1\x69\x82\x79\x74\xb2\x03\x07\x0e\xc4\
+\xfb\xf7\xef\x7f\xd1\x39\xf7\x71\xa5\xef\x79\xcc\x6c\x43\x08\xe1\
+\x69\x82\x79\x00\x40\xa7\x22\x94\x07\x00\x00\x00\xd0\x92\xf6\xf6\
+\xbf\x70\xd2\xbc\x1d\xec\xb9\xad\xcf\x4b\x52\x08\xa1\x48\x30\x8f\
+\x3c\xe8\xdf\xbb\xf7\xa4\x37\x3b\x78\x5b\x4f\x4f\xa5\xf7\x09\xe6\
+\x91\x07\xfd\x77\x0e\x9e\xf4\x16\x0e\xde\xb6\xb8\x2b\xe9\x7d\x85\
+\x22\xc1\x3c\xf2\x60\xf0\xde\xfe\x93\xc1\xfb\x83\xbb\x7a\x6f\xab\
+\xbe\xe7\x21\x98\x47\x0e\xec\xdb\xb7\xef\xa4\x73\xee\x60\x4f\xfa\
+\x9e\x47\x52\x91\x60\x1e\x00\xd0\xa9\x08\xe5\x01\x00\x00\x00\xb4\
+\xac\xbd\xfd\x2f\x9c\xbc\x4f\x7f\xb9\x20\xd3\x6b\x52\xf2\x4b\x6a\
+\xf9\xf0\xdc\xab\x13\x07\x8e\x64\x5c\x1a\xd0\x50\xfd\x7b\xf7\x9e\
+\xd4\x7d\xf7\x2d\x98\xaa\xbd\xef\xa5\xe7\x26\x5e\x7d\xf5\x48\xc6\
+\xa5\x01\x0d\xd5\x7f\xe7\xe0\x49\xed\xfa\xbd\x6a\xef\x2b\x14\xbd\
+\xd7\x73\x13\x67\x86\x8e\x64\x5c\x1a\xd0\x50\x83\xf7\xf6\x9f\xfc\
+\xbd\x5d\x5a\x90\x59\xf5\x3d\x4f\xf0\xcf\x0d\xbd\x36\x71\x24\xe3\
+\xd2\x80\x86\xda\xb7\x6f\xdf\xc9\xfb\xee\xbb\x6f\x41\xe9\xb8\xaf\
+\x24\x98\x7f\x6e\x78\x78\xf8\x48\x86\x65\x01\x00\xb0\xee\x08\xe5\
+\x01\x00\x00\x00\xb4\x34\x33\x85\x82\x5b\xf8\x4b\x29\x7c\xab\xf2\
+\xb5\xa0\x27\x09\xe6\xd1\xe9\xcc\x2c\xb8\x42\xe1\x2f\x25\x55\x7a\
+\x3f\x98\x3d\x49\x30\x8f\x4e\x67\x66\xc1\xb9\x15\xbd\x2f\x3d\x49\
+\x30\x8f\x4e\x67\x66\xa1\xe0\xdc\x5f\xca\xaa\xbd\x2f\x0b\x4f\x12\
+\xcc\xa3\xd3\x99\x59\x88\xe3\xf8\x2f\x55\x33\xee\x4b\x7a\x92\x60\
+\x1e\x00\xd0\x49\x08\xe5\x01\x00\x00\x00\xb4\xbc\x0f\xef\x78\x79\
+\xca\x87\xee\xcf\x9a\xd9\x9f\x95\xbf\x66\x41\x4f\x8e\x4e\x3c\xf6\
+\xfc\x89\xb1\xdf\xbd\x35\xcb\xda\x80\x46\xda\xf1\xe1\x0f\x4f\x05\
+\xef\x97\xf5\x7e\x30\x7b\x72\x62\x74\xf4\xf9\xb1\x13\x27\xe8\x7d\
+\x74\xac\x1d\x77\x3e\x31\x15\xa2\xc2\xf2\xde\x97\x9e\x9c\x78\xfd\
+\xe8\xf3\x63\x67\x9f\xa2\xf7\xd1\xb1\x9e\xf8\xd0\x8e\xa9\x42\x08\
+\xcb\x7a\x5f\x16\x9e\x3c\x7a\x7a\xe2\xf9\xa7\x4e\x8d\xd1\xfb\xe8\
+\x58\x1f\xfd\xe8\x47\xa7\x4a\xa5\xd2\x67\x25\xfd\x59\xcd\x97\x9f\
+\x1c\x1e\x1e\x7e\xfe\xa5\x97\x5e\xa2\xf7\x01\x00\x6d\x8f\x50\x1e\
+\x00\x00\x00\x40\x5b\x78\xa0\xff\x1b\xe7\xf6\xf6\x7e\xf3\x50\x30\
+\x7d\xb1\xfc\xb5\x10\xc2\xa7\x9c\x2d\x3c\x43\x30\x8f\x4e\xd6\xff\
+\xc0\x03\xe7\x7a\xf7\xee\x3d\x64\x21\x2c\xeb\x7d\x73\xee\x19\x82\
+\x79\x74\xb2\xfe\x5d\x4f\x9c\xeb\xbd\xeb\xf0\x21\xd3\xf2\x71\xdf\
+\xe2\xd2\x33\x04\xf3\xe8\x64\x4f\xec\xe9\x3f\x77\xf8\x9e\xde\x43\
+\x0a\xb6\xac\xf7\x4b\x66\xcf\x10\xcc\xa3\x93\x3d\xf2\xc8\x23\xe7\
+\xf6\xef\xdf\x7f\x48\x35\xe3\xbe\xa4\x4f\x15\x0a\x85\x67\x08\xe6\
+\x01\x00\xed\x8e\x50\x1e\x00\x00\x00\x40\x5b\xb9\xbf\xf7\xd8\x91\
+\xda\x60\x5e\xb2\x87\x23\xb7\x74\x6a\x74\xec\xf1\xfb\x32\x2b\x0a\
+\x68\x82\xde\xfb\xef\x3f\x52\x1b\xcc\x4b\x7a\xd8\x45\xd1\xa9\xb1\
+\xd1\xd1\xfb\xb2\xaa\x09\x68\x86\xde\xdd\x83\x47\x6c\x79\x40\xf3\
+\xb0\xf3\xa5\x53\x63\x6f\x0c\xdd\x97\x55\x4d\x40\x33\x0c\xde\xdb\
+\x7b\xa4\x36\x98\x57\xd0\xc3\x25\x73\xa7\x86\x5e\x1b\xbb\x2f\xbb\
+\xaa\x80\xc6\xdb\xbf\x7f\xff\x11\xad\x18\xf7\x0b\x85\xc2\xa9\x57\
+\x5e\x79\xe5\xbe\x6c\x2a\x02\x00\xe0\xc6\x11\xca\x03\x00\x00\x00\
+\x68\x3b\xf7\xf7\x1e\x3b\x22\x67\xbf\x2f\x99\x97\xa4\x10\xc2\x6d\
+\xc1\xc2\x27\xb2\xae\x0b\x68\xb4\xde\xfb\xef\x3f\xe2\xa4\xdf\x97\
+\x54\xe9\x7d\x0b\xf4\x3e\x3a\x5f\xef\xee\xc1\x23\xce\xe9\xf7\x65\
+\xe5\xde\xd7\x6d\xe6\x8d\xde\x47\xc7\x1b\xbc\xb7\xf7\x88\xcc\x55\
+\x7a\x5f\x21\xdc\x66\x8e\xde\x47\xe7\xdb\xbf\x7f\xff\x11\x33\xfb\
+\xfd\x10\x82\x4f\xbf\x74\x5b\x1c\xc7\xf4\x3e\x00\xa0\x6d\x11\xca\
+\x03\x00\x00\x00\x68\x4b\x03\x3b\xbf\xf9\xbc\x4c\x3f\x2a\x7f\x6e\
+\x16\x6e\xc9\xb2\x1e\xa0\x59\x76\x0e\x0c\x3c\x6f\xaa\xed\x7d\xa3\
+\xf7\x91\x0b\x3b\xef\x1c\x7c\xde\x82\x31\xee\x23\x77\x06\xef\xd9\
+\xb9\xac\xf7\x83\x18\xf7\x91\x0f\x0f\x3e\xf8\xe0\xf3\x66\xc6\x7b\
+\x1e\x00\x40\x47\x20\x94\x07\x00\x00\x00\xd0\xb6\x4c\xe1\x97\x59\
+\xd7\x00\x64\xc2\x8c\xde\x47\x3e\x19\xe3\x3e\xf2\x29\x98\xe8\x7d\
+\xe4\x15\xbd\x0f\x00\xe8\x08\x84\xf2\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x34\x08\xa1\x3c\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x0d\x42\x28\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x40\x83\x10\xca\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\xd0\x20\x84\xf2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x34\
+\x08\xa1\x3c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0d\x42\
+\x28\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x40\x83\x14\xb2\
+\x2e\x00\xf9\xf2\x07\xc7\xfe\x2e\x34\xfb\x9c\x7f\x7a\xe0\x37\x2d\
+\xcb\x3a\x56\x3b\x7f\xbd\xb2\xbe\x6e\x59\x9f\x1f\x40\xeb\x7a\xf6\
+\xd9\x67\x9b\x3e\x3e\x7c\xe6\x33\x9f\xb9\x6c\x7c\x68\x66\x1d\xab\
+\x9d\xbf\x5e\x59\x5f\xb7\xac\xcf\x0f\x00\x00\x00\x00\x00\x00\x00\
+\x79\x42\x28\x8f\xa6\x8b\x23\x77\xdb\xfb\xfe\xf3\x7b\xfe\xeb\x66\
+\x9c\xeb\xcc\xf7\x5f\x7b\xf1\x4a\x8f\xed\xfe\xd0\xbd\x8f\x66\x79\
+\xfe\x7a\x65\x7d\xdd\x9a\x75\xfe\xf3\x6f\x9c\x79\x71\x66\x6a\xb2\
+\xd1\xa7\x01\xb0\x8e\x16\x17\x17\x6f\xbb\xf3\x3f\xfb\x2f\x9b\x32\
+\x3e\xfd\xea\x27\x3f\xbc\xe2\xb8\x7a\xfb\xfb\x3f\xd0\xf0\x71\xfd\
+\x6a\xe7\xaf\x57\xd6\xd7\xad\x59\xe7\x9f\x7c\xeb\xcd\x17\xe7\xa6\
+\x2f\x36\xfa\x34\x00\x00\x00\x00\x00\x00\x00\xd0\xb2\x58\xbe\x1e\
+\x4d\xd7\xac\x60\xb9\xd3\x64\x7d\xdd\xb2\x3e\x3f\x80\xd6\xd5\xac\
+\x60\xb9\xd3\x64\x7d\xdd\xb2\x3e\x3f\x00\x00\x00\x00\x00\x00\x00\
+\xe4\x05\xa1\x3c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0d\
+\x42\x28\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x40\x83\x10\
+\xca\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd0\x20\x84\xf2\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x34\x48\x21\xeb\x02\
+\x00\x00\x00\x00\x5c\xd9\xe8\xf8\x63\xaf\x04\x85\xff\x76\xe5\xd7\
+\x07\xfa\x8e\xd9\xc8\xf8\x81\x90\x45\x4d\xad\x24\x84\x65\x1f\xdf\
+\x93\x5d\x25\x58\x6f\xe3\xa3\xa3\xaf\x28\x5c\xde\xfb\x7d\x03\x03\
+\x36\x3e\x32\x42\xef\xd7\x34\x7f\x08\x81\xde\xef\x20\xe3\x67\x8e\
+\xbe\xa2\x55\xc6\xfd\xbe\xdd\x83\x36\x7e\x66\x88\xde\x67\xdc\xef\
+\x58\x47\x4f\x8d\xbf\x12\xa4\xcb\x7a\x7f\x70\x4f\x9f\x0d\x9d\x1a\
+\xcf\x7d\xef\x2f\x6b\x7e\x31\xee\x77\x92\xe1\xe1\xe1\x57\xb4\x4a\
+\xef\xef\xdf\xbf\xdf\x86\x87\x87\xe9\xfd\x1a\x66\x46\xef\x03\x00\
+\xda\x16\xa1\x3c\x5a\xd2\x99\xef\xbf\xf6\xe2\x95\x1e\xdb\xfd\xa1\
+\x7b\x1f\xcd\x5b\x1d\xf5\xc8\xb2\xe6\x76\xbc\x5e\x00\x9a\xe3\x57\
+\x3f\xf9\xe1\x15\xc7\x87\xdb\xdf\xff\x81\xa6\x8d\x0f\xad\x52\x47\
+\x3d\xb2\xac\xb9\x1d\xaf\x57\x27\x5a\x2d\x90\xc7\x15\xf5\x5f\xf5\
+\xd1\xa0\x9d\xa3\xe3\x07\x7c\x93\x6a\x69\x59\x41\xb2\x81\xbe\x63\
+\x36\x32\x71\x60\x41\xd2\xa5\xb5\x3c\x67\xa0\xf7\x58\xef\xc8\xc4\
+\x81\x89\x46\xd4\x63\x41\x45\x99\x6d\x08\x41\xb1\x4c\x5f\x1d\xe8\
+\xfd\xe6\xe7\x92\x42\xe9\xfd\x3a\x5c\xb5\xf7\x83\xb4\x73\x7c\x74\
+\x34\xf7\xbd\xaf\x10\xac\x6f\x60\xc0\x26\x46\x46\xd6\xdc\xfb\xbd\
+\x03\x03\xbd\x13\x23\x23\x0d\xe9\xfd\x60\x56\x34\x69\x43\x08\x21\
+\x36\xe9\xab\xbd\x03\x03\x9f\x4b\x1f\xa1\xf7\xd7\xee\xea\xbd\x1f\
+\xc2\xce\xf1\xd7\x8f\xd2\xfb\x21\x58\xdf\xee\x41\x9b\x38\x33\xb4\
+\x20\xb3\xb5\xf5\xfe\x5d\x87\x7b\x27\x5e\x3f\xda\x98\xde\x0f\xa1\
+\x68\xb2\x0d\x41\x69\xef\xef\x1e\xfc\x9c\x24\xad\x16\xc8\xe3\x0a\
+\xc2\xb5\xc6\xfd\xb0\xf3\xe8\xe9\xf1\xdc\xf7\x7e\x08\xb2\xc1\x3d\
+\x7d\x36\x74\x7a\x62\xc1\xc2\xda\xc6\xfd\xc3\x7b\x7a\x7b\x8f\x9e\
+\x9a\x68\x4c\xef\x2b\x14\xcd\x6c\x43\x08\x21\x96\xec\xab\x83\x7b\
+\x7a\xd3\x71\x9f\xde\x5f\xab\x10\xc2\x55\x7b\xdf\xcc\x76\x0e\x0f\
+\x0f\xe7\xbe\xf7\x25\x59\x7a\x53\xc7\x42\x08\x61\x4d\xbd\xff\xd0\
+\x43\x0f\xf5\xbe\xfc\xf2\xcb\x8d\x79\xbf\x6f\x56\x94\xb4\x41\x52\
+\x2c\xe9\xab\xfb\xf7\xef\xff\xdc\x35\x9e\x02\x00\x1d\x89\x50\x1e\
+\x2d\xe5\x6a\xa1\xee\xca\x63\x1a\x19\xf2\xb6\x4a\x1d\xf5\xc8\xb2\
+\xe6\x76\xbc\x5e\x00\x9a\xe3\x6a\xa1\xee\xca\x63\x1a\x19\xf2\xb6\
+\x4a\x1d\xf5\xc8\xb2\xe6\x76\xbc\x5e\x9d\xcc\x64\x73\x41\x61\x63\
+\xd6\x75\xb4\x89\xb1\x6b\x1d\x10\x24\x6b\x46\x21\x6d\x21\xa8\x4b\
+\xd2\xce\x3a\x8e\x5f\xfb\xb1\x75\x95\xa1\xf2\xec\xbf\xa2\x05\xfb\
+\x03\x49\xc9\x2f\xe9\xcc\xe6\x14\xe8\xfd\x35\xba\x66\xef\x2b\x04\
+\x7a\x3f\x15\x54\x5f\xef\x87\x7a\xfe\x9d\xd4\x55\x48\x50\x3a\xfd\
+\xb1\x18\x8c\xde\xbf\x4e\xf4\x7e\x1d\x82\xd4\xa5\x10\xd6\xde\xfb\
+\x75\x1c\x5b\x7f\x2d\xc9\xb8\x5f\xdb\xfb\x26\xcd\x05\x89\xde\x5f\
+\x0b\x5b\xc3\x7b\x9e\xc0\x7b\x9e\x8a\x10\xba\xea\x19\xcb\x83\x1a\
+\xd8\xfb\xe5\xf7\x3c\x0a\xd5\x71\x5f\x9a\x13\xbd\xbf\x26\x66\x76\
+\xed\x71\x9f\xf7\xfb\xb5\xba\xcc\x6c\xcd\xfd\x5c\xcf\xb1\xd7\xa9\
+\x28\xa9\xb6\xf7\x01\x20\x57\x08\xe5\xd1\x32\xd6\x12\xec\xae\x3c\
+\xbe\x11\x01\x6f\xab\xd4\x51\x6f\x0d\xf5\x1e\xbf\x5e\x35\xb7\xe3\
+\xf5\x02\xd0\x1c\x6b\x09\x76\x57\x1e\xdf\x88\x80\xb7\x55\xea\xa8\
+\xb7\x86\x7a\x8f\x5f\xaf\x9a\xdb\xf1\x7a\x75\xba\x60\x61\x4e\x21\
+\xf9\x25\x5d\x08\xf6\xb1\xfb\xfb\xbf\xf9\x42\xf9\xb1\x81\xbe\x63\
+\xb9\xff\x85\xd3\xe8\xc4\x81\xef\x84\xa0\x07\x24\xc9\x4c\xa7\xb3\
+\xae\x07\x37\x26\x98\xc6\xcb\x1f\x5b\x08\x95\x70\x26\x84\xf0\xb1\
+\xfe\xfb\xef\xaf\xf4\x7e\xdf\xc0\x40\xee\x7b\x7f\x62\x74\xf4\x3b\
+\x21\x84\xb4\xf7\x8d\xde\x6f\x73\x16\x42\xb5\xf7\x6b\x82\xc9\x10\
+\xf4\xb1\xfe\xf7\x0e\x56\x7b\x7f\xf7\x20\xbd\xff\xfa\x10\xe3\x7e\
+\x07\xb1\x50\x1d\xf7\x25\x9b\x53\xf9\x46\xc4\x10\x3e\x36\x78\x6f\
+\x7f\xa5\xf7\x07\xf7\xf4\xe5\xbe\xf7\x87\x4e\x4f\x7c\x47\xe9\xb8\
+\x2f\x31\xee\xb7\x3f\xab\xf4\x7e\x08\x61\xce\xcc\xca\xa1\xfc\xc7\
+\xf6\xef\xdf\x5f\xe9\xfd\xfd\xfb\xf7\xe7\xbe\xf7\x87\x87\x87\xbf\
+\x23\x25\xe3\x7e\x08\x81\xde\x6f\x7f\xe3\xd7\x3e\x04\x00\x3a\x13\
+\xa1\x3c\x5a\x42\x6d\xb0\xbb\xb8\xb8\xa8\x77\xde\x79\x67\xd9\xe3\
+\x66\xa6\x28\x8a\xd4\xdd\xdd\xad\xad\x5b\xb7\x2a\x8a\xa2\xca\xf3\
+\xd6\x33\xe0\x6d\x95\x3a\xea\x91\x65\xcd\xed\x78\xbd\x00\x34\x47\
+\x6d\xb0\xbb\xb4\xb4\xa4\xc9\xc9\xc9\x65\x8f\x9b\x99\x9c\x73\xea\
+\xee\xee\xd6\xe6\xcd\x9b\xe5\x9c\xab\x3c\x6f\x3d\x03\xde\x56\xa9\
+\xa3\x1e\x59\xd6\xdc\x8e\xd7\x0b\xa8\x8f\xcd\x9b\xc2\x9f\x67\x5d\
+\x45\xa6\xcc\xde\x17\x42\xb8\x3f\xfd\x6c\x36\x04\xfb\xef\xd7\xfa\
+\xd4\x10\xec\x63\x0d\x29\xc9\x85\x2f\x28\xe8\xbf\x90\x24\x0b\xe1\
+\x67\x8d\x38\x07\x34\x2f\xb3\x5c\xf7\xbe\x49\x2b\x7a\x3f\xd4\xd1\
+\xfb\xa1\x21\xbd\xef\xcc\xbe\x10\x94\xf4\x7e\x30\xa3\xf7\x1b\x83\
+\xde\xaf\xed\x7d\xd3\x6c\xf0\xaa\xa3\xf7\xd5\x98\xde\x77\xf6\x85\
+\x10\x42\xd2\xfb\x12\xbd\xdf\x18\xf3\x26\xe5\xba\xf7\x97\xbd\xe7\
+\x31\xcd\xca\xaf\x7d\xdc\x57\x83\xc6\x7d\x73\xae\xd2\xfb\x12\xef\
+\x79\x1a\x64\x3e\x84\x7c\xbf\xdf\x37\xb3\xf7\x49\xaa\xbc\xe7\x91\
+\xd6\x3e\xee\x4b\x8d\x19\xf7\x25\x7d\x41\xe9\x7b\x1e\x31\xee\x03\
+\xc8\x31\x42\x79\x64\x6e\x2d\x33\xad\x43\x08\x2a\x95\x4a\x2a\x95\
+\x4a\x9a\x9b\x9b\xd3\xcd\x37\xdf\xbc\xee\x01\x6f\xab\xd4\x51\x8f\
+\x2c\x6b\x6e\xc7\xeb\x05\xa0\x39\xd6\x32\xd3\x3a\x84\xa0\x38\x8e\
+\x35\x3b\x3b\xab\xf9\xf9\x79\xf5\xf6\xf6\xae\x7b\xc0\xdb\x2a\x75\
+\xd4\x23\xcb\x9a\xdb\xf1\x7a\x01\x75\xb3\x30\xbb\xb7\xf7\xd8\xff\
+\x98\x75\x19\x59\x7a\x75\xec\xb1\xc7\xcd\x54\xfe\x05\xf5\xfc\xfd\
+\x7d\xd5\x95\x17\xae\xa5\x76\x95\x86\xf5\x34\x3a\x71\xe0\x13\xe5\
+\x60\x52\xa6\x85\x46\x9c\x23\xef\x4c\x9a\xed\xdd\xbb\x37\xd7\xbd\
+\x3f\xf6\xea\xab\x8f\x9b\xd9\xfd\x92\x64\xd2\x7c\x5f\xcd\xca\x0b\
+\xd7\xd2\x5f\xc7\xb1\xf5\x98\x18\x1d\xfd\x84\xd2\x70\xc6\x44\xef\
+\x37\x82\x99\xcd\xf6\xde\x75\x38\xdf\xbd\xff\xb3\xa1\xca\xb8\x6f\
+\xb2\xf9\xbe\xf7\x1e\x5e\x7b\xef\xd7\xac\xd2\xb0\x9e\x26\x5e\x1f\
+\xfa\x84\xd2\x71\xdf\x2c\xd0\xfb\x0d\x60\xb2\xd9\xc3\x7b\x7a\x73\
+\xdd\xfb\x43\xaf\x8d\x3d\xae\xf2\xb8\x1f\x6c\xfe\xf0\xbd\x7d\x6b\
+\xee\xe7\xda\x55\x1a\xd6\xb5\xa6\xd3\x13\x95\xde\x0f\x66\xf4\x7e\
+\x03\x84\x10\x66\x1f\x7a\xe8\xa1\x5c\xf7\xfe\xf0\xf0\xf0\xe3\x4a\
+\x43\xf9\x10\xc2\xfc\x43\x0f\x3d\xb4\xe6\x7e\xae\x5d\xa5\x61\x9d\
+\x6b\xaa\xf4\xbe\x78\xcf\x03\x20\xc7\x08\xe5\xd1\xb2\x7a\x7a\x7a\
+\xb4\x6d\xdb\xb6\xca\xe7\x4b\x4b\x4b\x9a\x9a\x9a\xd2\xc2\xc2\x82\
+\xe6\xe6\xe6\xb4\x65\xcb\x96\x5c\xd5\x51\x8f\x2c\x6b\x6e\xc7\xeb\
+\x05\xa0\x39\x36\x6f\xde\xbc\x6c\x0c\x28\x95\x4a\x9a\x9e\x9e\xd6\
+\xe2\xe2\xa2\xe6\xe7\xe7\xb5\x69\xd3\xa6\x5c\xd5\x51\x8f\x2c\x6b\
+\x6e\xc7\xeb\x05\x00\x00\x00\x00\x00\x00\x00\xad\xc4\x65\x5d\x00\
+\xf2\xad\x9e\xfd\xc8\x8b\xc5\xa2\x7a\x7a\x7a\x24\x25\x33\xf5\xae\
+\xf7\x75\x5a\xb9\x8e\x7a\x64\x59\x73\x3b\x5e\x2f\x00\xcd\x51\xcf\
+\x7e\xe4\x85\x42\xa1\x12\xe8\xae\x1c\x1f\xea\xdd\xd7\xbc\x55\xeb\
+\xa8\x47\x96\x35\xb7\xe3\xf5\x02\x00\x00\x00\x00\x00\x00\x80\x76\
+\xc1\x4c\x79\xb4\x85\xf2\x72\xb9\x97\x2e\x5d\x92\x24\x75\x77\x77\
+\xe7\xba\x8e\x7a\x64\x59\x73\x3b\x5e\x2f\x00\xcd\x13\xc7\xb1\xe6\
+\xe6\xe6\x24\x49\x5d\x5d\x5d\xb9\xaf\xa3\x1e\x59\xd6\xdc\x8e\xd7\
+\x0b\x00\x00\x00\x00\x00\x00\x00\xb2\x44\x28\x8f\x96\x35\x3d\x3d\
+\xad\xe9\xe9\xe9\x65\x5f\x2b\x14\x0a\xda\xb9\x73\x67\x53\x43\x80\
+\x56\xa9\xa3\x1e\x59\xd6\xdc\x8e\xd7\x0b\x40\x73\xcc\xcc\xcc\x68\
+\x66\x66\x66\xd9\xd7\xa2\x28\xd2\xb6\x6d\xdb\x54\x2c\x16\x73\x57\
+\x47\x3d\xb2\xac\xb9\x1d\xaf\x17\x00\x00\x00\x00\x00\x00\x00\xb4\
+\x12\x96\xaf\x47\x5b\x89\xe3\x58\x0b\x0b\x0b\x97\x2d\x97\x9b\xd7\
+\x3a\xea\x91\x65\xcd\xed\x78\xbd\x00\x34\x87\xf7\x5e\x8b\x8b\x8b\
+\x59\x97\xd1\x32\x75\xd4\x23\xcb\x9a\xdb\xf1\x7a\x01\x00\x00\x00\
+\x00\x00\x00\x40\x56\x98\x29\x8f\x96\xd5\xd3\xd3\xa3\x6d\xdb\xb6\
+\x55\x3e\x8f\xe3\x58\xd3\xd3\xd3\xba\x74\xe9\x92\xcc\x4c\xdb\xb7\
+\x6f\xcf\x55\x1d\xf5\xc8\xb2\xe6\x76\xbc\x5e\x00\x9a\x63\xf3\xe6\
+\xcd\xda\xb2\x65\x4b\xe5\x73\xef\xbd\x66\x66\x66\x34\x3b\x3b\x2b\
+\x33\x53\x4f\x4f\x4f\xae\xea\xa8\x47\x96\x35\xb7\xe3\xf5\x02\x00\
+\x00\x00\x00\x00\x00\x80\x56\xc2\x4c\x79\xb4\x8d\x28\x8a\xb4\x7d\
+\xfb\x76\x45\x51\x74\xd9\x32\xba\x79\xac\xa3\x1e\x59\xd6\xdc\x8e\
+\xd7\x0b\x40\x73\x38\xe7\xd4\xd3\xd3\xa3\x28\x8a\x2a\x7b\x94\xe7\
+\xb9\x8e\x7a\x64\x59\x73\x3b\x5e\x2f\x00\x00\x00\x00\x00\x00\x00\
+\xc8\x12\xa1\x3c\xda\x52\x08\xa1\x25\x96\x42\x6f\x95\x3a\xea\x91\
+\x65\xcd\xed\x78\xbd\x00\x34\x47\xab\x8c\x0f\xad\x52\x47\x3d\x18\
+\xd7\x01\x00\x00\x00\x00\x00\x00\xa0\xb5\x11\xca\x23\x53\xbb\x3f\
+\x74\xef\xa3\x6b\x3d\x36\x8e\x63\x4d\x4d\x4d\x29\x8e\x63\x45\x51\
+\x24\x33\xbb\xae\xd7\x69\xe5\x3a\xea\x91\x65\xcd\xed\x78\xbd\x00\
+\x34\xc7\xed\xef\xff\x40\x5d\xe3\xc3\xf4\xf4\xf4\xaa\xe3\x43\x3d\
+\xaf\xd3\xca\x75\xd4\x23\xcb\x9a\xdb\xf1\x7a\x01\x00\x00\x00\x00\
+\x00\x00\x40\xbb\x60\x4f\x79\xb4\xac\xe9\xe9\x69\x4d\x4f\x4f\xaf\
+\xfa\x58\xed\x9e\xe5\x79\xa9\xa3\x1e\x59\xd6\xdc\x8e\xd7\x0b\x40\
+\x73\xcc\xcc\xcc\x5c\x71\x1b\x8b\xda\x3d\xcb\xf3\x52\x47\x3d\xb2\
+\xac\xb9\x1d\xaf\x17\x00\x00\x00\x00\x00\x00\x00\xb4\x12\x66\xca\
+\x23\x73\x6b\x9d\x2d\xed\x9c\xd3\x86\x0d\x1b\xd4\xd7\xd7\xa7\x4d\
+\x9b\x36\xd5\xfd\xfc\x76\xa9\xa3\x1e\x59\xd6\xdc\x8e\xd7\x0b\x40\
+\x73\xac\x75\xb6\xb4\x73\x4e\xdd\xdd\xdd\xda\xb1\x63\x87\x36\x6c\
+\xd8\x50\xf7\xf3\xdb\xa5\x8e\x7a\x64\x59\x73\x3b\x5e\x2f\x00\x00\
+\x00\x00\x00\x00\x00\x68\x07\xcc\x94\x47\x4b\xd8\xfd\xa1\x7b\x1f\
+\x3d\xf3\xfd\xd7\x5e\x94\xa4\xae\xae\x2e\xdd\x71\xc7\x1d\x6b\x7e\
+\x5e\x27\xd6\x51\x8f\x2c\x6b\x6e\xc7\xeb\x05\xa0\x39\x6e\x7f\xff\
+\x07\x1e\xfd\xd5\x4f\x7e\xf8\xa2\x24\x15\x8b\x45\xdd\x7c\xf3\xcd\
+\x6b\x7e\x5e\x27\xd6\x51\x8f\x2c\x6b\x6e\xc7\xeb\x05\x00\x00\x00\
+\x00\x00\x00\x00\xad\x8e\x99\xf2\x68\x19\xf5\x06\xb5\x8d\x0a\x76\
+\x5b\xa5\x8e\x46\xd6\xb0\x9e\x35\xb7\xe3\xf5\x02\xd0\x1c\xf5\x06\
+\xb5\x8d\x0a\x76\x5b\xa5\x8e\x46\xd6\xb0\x9e\x35\xb7\xe3\xf5\x02\
+\x00\x00\x00\x00\x00\x00\x80\x56\xc6\x4c\x79\xb4\x94\x72\x60\x5b\
+\x9e\x7d\x7d\xb5\x63\xf2\x50\x47\x3d\xb2\xac\xb9\x1d\xaf\x17\x80\
+\xe6\x28\x07\xb6\xe5\xd9\xd7\x57\x3b\x26\x0f\x75\xd4\x23\xcb\x9a\
+\xdb\xf1\x7a\x01\x00\x00\x00\x00\x00\x00\x40\xab\x22\x94\x47\x4b\
+\x6a\x95\x00\xb7\x55\xea\xa8\x47\xd6\x4b\xe9\x67\x75\x6e\x00\xad\
+\xad\x55\x02\xdc\x56\xa9\xa3\x1e\x59\x2f\xa5\x9f\xd5\xb9\x01\x00\
+\x00\x00\x00\x00\x00\xa0\x53\xb0\x7c\x3d\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x0d\x42\x28\x0f\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x40\x83\xb0\x7c\x3d\x9a\xee\x6a\xfb\x8e\x37\x53\xab\
+\xd4\xb1\x56\x59\xd7\x9b\xf5\xf9\x01\xb4\xae\xab\xed\x3b\xde\x4c\
+\xad\x52\xc7\x5a\x65\x5d\x6f\xd6\xe7\x07\xd0\xf9\x46\x26\x1f\x3b\
+\x64\x41\x5f\x96\xb4\x14\x42\x18\x1a\xe8\x3b\xf6\x95\xac\x6b\x02\
+\x9a\x61\x72\x64\xe4\x50\x30\xab\xf4\x7e\xdf\xc0\x00\xbd\x8f\x5c\
+\x98\x7c\x63\xe8\x50\x08\xfa\xb2\x82\x2d\x85\xe0\x87\xfa\xde\xfb\
+\x79\x7a\x1f\xb9\x30\x74\x7a\xf2\x90\x14\xbe\x6c\xd2\x92\x57\x18\
+\xfa\xfc\x3d\x7d\xf4\x3e\x72\xe1\xf8\xf1\xe3\x87\x42\x08\x5f\x96\
+\xb4\x24\x69\x68\xff\xfe\xfd\xf4\x3e\x00\x5c\x05\xa1\x3c\x9a\xea\
+\x4f\x0f\xfc\xa6\x35\xf7\x8c\x61\xd5\xf3\x35\xbf\x8e\x1b\x93\xf5\
+\x75\xcb\xfa\xfc\x00\x5a\xd7\x67\x3e\xf3\x99\x66\xff\x7b\x5d\xf5\
+\x7c\x19\xd4\x71\x43\xb2\xbe\x6e\x59\x9f\x1f\x40\x4e\x84\xf0\xc7\
+\x21\x68\x5b\xfa\xd9\x97\x47\x27\x1e\xdb\x1d\xfb\xe2\x91\x07\xfa\
+\xbf\x71\x2e\xd3\xba\x80\x06\x0b\xd2\x1f\x87\x10\x2a\xbd\x3f\x31\
+\x3a\xba\xdb\xc7\xf1\x91\xfe\x07\x1e\xa0\xf7\xd1\xd1\x82\xd7\x1f\
+\x07\x69\x9b\x14\x24\xb3\x2f\x4f\xbc\x7e\x74\xb7\x77\xd1\x91\xfe\
+\x5d\x4f\xd0\xfb\xe8\x6c\x21\xfc\xb1\x14\xb6\x05\x49\x26\x7d\xf9\
+\xe8\xe9\x89\xdd\x51\xf0\x47\x9e\xd8\xd3\x4f\xef\xa3\xa3\x85\x10\
+\xfe\x58\xaa\xbe\xdf\x1f\x1e\x1e\xde\x5d\x2a\x95\x8e\x3c\xf2\xc8\
+\x23\xf4\x3e\x00\xac\x82\xe5\xeb\xd1\xe1\x2c\x64\x5d\x41\x7b\xca\
+\xfa\xba\x65\x7d\x7e\x00\x2d\x8c\xf1\xe1\xfa\x64\x7d\xdd\xb2\x3e\
+\x3f\x80\x6c\x6c\xa9\xfd\x24\x84\xf0\x29\x67\x0b\xcf\x9c\x18\xfb\
+\xdd\x5b\xb3\x2a\x08\x68\x92\xcb\x7a\xdf\x9c\x7b\x66\xec\xc4\x09\
+\x7a\x1f\x9d\xcd\xec\xf2\xde\x8f\x4b\xcf\x8c\x9d\x7d\x8a\xde\x47\
+\x47\xb3\x55\xc6\xfd\x92\xd9\x33\x4f\x9d\x1a\xa3\xf7\xd1\xd1\x42\
+\x08\x5b\x56\x7c\xe9\x53\x85\x42\xe1\x99\x97\x5e\x7a\x89\xde\x07\
+\x80\x55\x30\x53\x1e\x4d\xf5\x07\xc7\xfe\xae\xe9\xbf\x94\x5f\x6d\
+\x96\xf7\xa7\x8f\xbd\x76\x3a\x28\xdc\x9d\xd5\xf9\xeb\x95\xf5\x75\
+\xcb\xfa\xfc\x00\x5a\xd7\xb3\xcf\x3e\xdb\xf4\xf1\x61\xb5\x59\xde\
+\xcf\x3e\xfb\xec\x69\x49\x4d\x19\xd7\xd7\x63\x96\x79\xd6\xd7\x2d\
+\xeb\xf3\x03\xc8\x33\x7b\xd8\xd9\xe2\x7b\x46\xc7\x1e\x3f\xbc\xb7\
+\xff\x85\x93\x59\x57\x03\x34\xd1\xc3\xe6\xdc\x7b\xc6\x46\x47\x0f\
+\xf7\xef\xdd\x7b\x32\xeb\x62\x80\x26\x7a\xd8\xe2\xf8\x3d\x63\x6f\
+\x0c\x1d\xee\xbf\x73\xf0\x64\xd6\xc5\x00\x4d\x13\xf4\x70\x6c\xf6\
+\x9e\xa1\xd7\xc6\x0e\x0f\xde\xdb\x7f\x32\xeb\x72\x80\x26\x7a\xb8\
+\x50\x28\xbc\xe7\x95\x57\x5e\x39\xbc\x6f\xdf\xbe\x93\x59\x17\x03\
+\x00\xad\x84\x50\x1e\x4d\xb7\xfb\x43\xf7\x3e\xda\xac\x73\x5d\x69\
+\x1f\xf4\xa0\x70\x77\x33\xea\x58\xcf\x7d\xd8\xb3\xbe\x6e\xcd\x3a\
+\xff\xf9\x37\xce\xbc\x38\x33\x35\xd9\x8c\x53\x01\x58\x27\xb7\xbf\
+\xff\x03\x4d\x1b\x9f\xae\xb2\x0f\xfa\xdd\xcd\xa8\x63\x3d\xf7\x61\
+\xcf\xfa\xba\x35\xeb\xfc\x93\x6f\xbd\xf9\xe2\xdc\xf4\xc5\x66\x9c\
+\x0a\x40\x2b\x33\xfb\x0b\x93\x3e\x11\x42\x28\x4a\xba\x27\xb8\xf0\
+\xf5\xd1\xb1\xc7\x0f\x12\xcc\xa3\xd3\x99\xf4\x17\x32\xab\xf4\xbe\
+\x0b\xe1\xeb\x63\xa3\xa3\x07\x09\xe6\xd1\xe9\xcc\xec\x2f\x14\xf4\
+\x89\xa0\x50\x94\xc2\x3d\x2e\xd8\xd7\xc7\xde\x18\x3a\x48\x30\x8f\
+\x4e\x67\xb2\xbf\x90\x25\xef\x79\x42\xd0\x3d\xe6\xdc\xd7\x87\x5e\
+\x1b\x3b\x48\x30\x8f\x4e\x67\x66\x7f\x11\x42\xf8\x84\xa4\xa2\xa4\
+\x7b\xbc\xf7\x5f\x7f\xe5\x95\x57\x0e\x12\xcc\x03\x40\x15\xcb\xd7\
+\x03\x00\x00\x00\x00\x1a\x2a\x78\x7d\x37\x98\xfe\xd0\xa4\xe9\xe4\
+\x0b\x61\x97\xcc\x1f\x1f\x99\x7c\xec\x50\xc6\xa5\x01\x0d\xe5\x43\
+\xf8\xae\x85\xf0\x87\x32\x9b\x96\xa4\x20\xed\x32\xe9\xf8\xe4\xc8\
+\x08\xbd\x8f\x8e\xe6\x7d\xf8\xae\xb9\xf0\x87\x4a\xc7\xfd\x10\xc2\
+\x2e\xf3\x3a\x3e\xf9\xc6\x10\xbd\x8f\x8e\x16\x82\xff\x6e\x90\x2d\
+\xeb\x7d\x99\x1d\x1f\x3a\x3d\x49\xef\xa3\xa3\x85\x10\xbe\x6b\x56\
+\xed\x7d\x49\xbb\xbc\xf7\xc7\x8f\x1f\x3f\x4e\xef\x03\x40\x8a\x50\
+\x1e\x00\x00\x00\x00\xd0\x70\x03\x3b\xbf\xf9\xbc\x82\x7b\x50\x66\
+\x67\x25\x29\x48\x3d\x16\xf4\x74\x90\xfd\x5a\xc6\xa5\x01\x0d\xb5\
+\x73\x60\xe0\xf9\x20\x3d\x68\xd2\x59\x49\x52\x08\x3d\xc1\xec\x69\
+\x85\x40\xef\xa3\xa3\xed\xbc\x73\xf0\xf9\xe0\xf4\xa0\xa5\xe3\xbe\
+\xa4\x9e\xe0\xed\x69\x05\xc6\x7d\x74\xb6\xc1\x7b\x76\x3e\xaf\x10\
+\x96\xf5\xbe\x29\x3c\x6d\x41\xf4\x3e\x3a\xda\x83\x0f\x3e\xf8\xbc\
+\x73\xee\x41\x95\xdf\xf3\x48\x3d\x21\x84\xa7\x25\x7a\x1f\x00\x24\
+\x42\x79\x00\x00\x00\x00\x40\x93\xec\xed\x7f\xe1\xa4\x79\x3b\x28\
+\xe9\xb4\x24\x85\x10\x8a\x0a\xe1\x83\x19\x97\x05\x34\x5c\xff\xde\
+\xbd\x27\xbd\x2d\xef\xfd\x20\xd1\xfb\xe8\x78\xfd\x77\x0e\x9e\xf4\
+\x16\x0e\x4a\x96\xf4\xbe\x42\x31\x88\x71\x1f\x9d\x6f\xf0\xde\xfe\
+\x93\xc1\xfb\x83\x66\xb5\xe3\x3e\xbd\x8f\xce\xb7\x6f\xdf\xbe\x93\
+\xce\xb9\xca\x7b\x1e\x25\xcb\xd9\xd3\xfb\x00\x20\xf6\x94\x07\x00\
+\x00\x00\x00\x34\xc0\x40\xef\xb1\xde\xd5\xbe\xbe\xb7\xff\x85\x93\
+\x27\xc6\x7e\x77\x9f\xb3\x85\x67\x24\x7b\xb8\xd9\x75\x01\x8d\xd6\
+\x3b\x30\xb0\x6a\xef\xf7\xef\xdd\x7b\x72\xec\xc4\x89\x7d\xe6\xdc\
+\x33\x92\xe8\x7d\x74\x9c\xde\xbb\x0e\xaf\xde\xfb\x77\x0e\x9e\x1c\
+\x3b\xfb\xd4\x3e\x8b\x4b\xf4\x3e\x3a\xd2\xe1\x3d\xbd\xab\xf6\xfe\
+\xe0\xbd\xfd\x27\x9f\x3a\x35\xb6\xaf\x64\xf6\x8c\x02\xbd\x8f\xce\
+\xf3\xd0\x43\x0f\xad\xda\xfb\xfb\xf6\xed\x3b\xf9\xd2\x4b\x2f\xed\
+\x2b\x14\x0a\x8c\xfb\x00\x50\x83\x50\x1e\x00\x00\x00\x68\x61\x16\
+\x54\x0c\xe9\xc7\xce\xf4\xb5\x91\x89\x03\xcf\x4a\x49\xe0\x39\x32\
+\x71\x60\x22\xc3\xd2\x5a\x84\xf5\x48\xc9\x15\x62\x19\xf4\xf6\xf1\
+\x40\xff\x37\xce\x9d\x18\xfb\xdd\xcf\x46\x6e\x69\x3c\x84\xf0\xa9\
+\xf2\xd7\x43\xb0\xf3\x95\x8f\xcd\x8a\x0a\xc9\xcf\xd6\x9c\xfb\xda\
+\xc4\xc8\xc8\xb3\x52\x12\x78\x4e\x8c\x8c\xd0\xfb\x52\x4f\xe5\x23\
+\x96\x41\x6f\x1b\xfd\x0f\x3c\x70\x6e\xec\xc4\x89\xcf\xba\x28\x5a\
+\xd1\xfb\xe1\x7c\xcd\xc7\xc5\xf2\xc7\xe6\xec\x6b\x13\xaf\x1f\x4d\
+\x7a\xff\xae\xc3\xbd\x13\xaf\x1f\xa5\xf7\x83\x2a\xe3\x3e\xcb\xa0\
+\xb7\x8f\xfe\x5d\x4f\x9c\x1b\x3b\xfb\xd4\x67\x9d\x8f\xaf\x3c\xee\
+\xab\xa6\xf7\xcd\xbe\x76\xf4\xd4\xc4\xb3\x52\x12\x78\x1e\x3d\x35\
+\x41\xef\x4b\x3d\xe5\xf7\x84\x2c\x83\xde\x3e\x9e\xd8\xd3\x7f\xee\
+\xa9\x53\x63\x9f\x8d\xcd\x2d\xeb\x7d\x53\x75\xdc\x37\xb3\x62\xcd\
+\x53\xbe\xf6\xf2\xcb\x2f\x3f\x2b\x25\x81\xe7\xcb\x2f\xbf\x4c\xef\
+\xd7\xbe\xe7\x61\x19\xf4\xb6\xf1\xc8\x23\x8f\x9c\x7b\xe9\xa5\x97\
+\x3e\x5b\x28\x14\xc6\x25\xad\xfa\x9e\x07\x00\xf2\x86\x50\x1e\x00\
+\x00\x00\x68\x61\x41\xea\xaa\x7e\x1c\x36\x2a\x68\x63\xcd\x83\x3b\
+\x33\x29\xaa\x85\x84\x72\x30\x23\xc9\x82\xee\xba\xda\xb1\x26\xeb\
+\x19\x9d\x38\xf0\x9d\x86\x17\xd5\xc2\x82\xc2\xad\xe5\x4b\x66\x41\
+\xc5\xab\x1f\xbd\x0e\xe7\x0b\x4f\x3a\xe9\x8b\xc1\xac\xe6\x07\x95\
+\x7a\xa0\xff\x1b\xe7\x24\x1d\x1a\x99\x78\xec\x92\x85\xf0\x49\xc9\
+\xce\x29\xd8\xbf\xae\x79\x72\x57\xcd\xc7\x1b\x83\xaa\xbd\x1f\x44\
+\xef\x97\x6f\x58\x90\xa4\x60\x76\xd5\xde\x97\x59\xcf\xc4\xe8\x68\
+\xae\x7b\x5f\x21\xdc\x5a\xbe\x62\x61\x79\xf8\xd1\xa0\xd3\x05\x97\
+\x9c\xca\x2e\xeb\xfd\xfe\x07\x1e\x38\x27\xe9\xd0\xc4\xc8\xc8\xa5\
+\x60\xf6\x49\x49\xe7\x82\x54\xed\x7d\x59\x57\x35\x74\x5e\xd1\xfb\
+\x21\xd0\xfb\x35\x82\x5d\x7d\xdc\x57\x50\xcf\xc4\xeb\x43\xf9\xee\
+\x7d\xd9\xad\x21\x1d\x2f\x6a\x6f\xf8\x68\x94\x64\xdc\x3f\xb2\x7a\
+\xef\xef\x7a\x22\xe9\xfd\x33\x43\x97\x82\xf4\x49\x99\x9d\x0b\x16\
+\x2a\xbd\x6f\xa6\xae\xf2\xd0\x96\xf4\x7d\xa8\x19\xf7\xe9\xfd\xe5\
+\xff\x25\x0d\xd7\x18\xf7\xd5\x33\x74\x7a\x22\xd7\xbd\x6f\x52\xb5\
+\xf7\xd5\xf8\xde\x7f\x32\x04\x77\xe4\x0a\xe3\xfe\x13\x7b\xfa\xcf\
+\x49\x3a\x34\x74\x6a\xe2\x92\x14\x3e\x69\xd2\xb9\xe0\x43\xcd\xb8\
+\x5f\x7d\xbf\x2f\x69\xa3\x99\x55\x7a\xdf\xcc\xe8\xfd\xe5\xae\xfe\
+\x7e\xdf\xac\x67\x78\x78\x38\xd7\xbd\x2f\xe9\xd6\xf2\x07\x96\xf1\
+\x7b\x9e\x47\x1e\x79\xe4\x9c\xa4\x43\xc3\xc3\xc3\x97\x24\x7d\x52\
+\xd2\xb9\x28\x8a\xfe\xf5\xca\xe3\x00\x20\x2f\x08\xe5\xd1\x92\xce\
+\x7c\xff\xb5\x17\xaf\xf4\xd8\xee\x0f\xdd\xfb\x68\xde\xea\xa8\x47\
+\x96\x35\xb7\xe3\xf5\x02\xd0\x1c\xbf\xfa\xc9\x0f\xaf\x38\x3e\xdc\
+\xfe\xfe\x0f\x34\x6d\x7c\x68\x95\x3a\xea\x91\x65\xcd\xed\x78\xbd\
+\x3a\x91\x99\xb9\x10\x2e\xfb\xfd\x06\x56\xf7\xdd\xab\x3d\x98\x86\
+\x11\x0f\x34\xa9\x96\xd6\x67\xb6\xa1\x91\x2f\x9f\x04\x33\x92\xf4\
+\xa4\x49\x5f\xbc\x62\x13\x0f\xf4\x7e\xf3\x73\x92\x3e\xb7\xf2\xeb\
+\xf4\x7e\x5d\xe8\xfd\x3a\x98\xd4\xe0\xde\x0f\xae\x7a\xaa\xcb\x6f\
+\x48\x29\xeb\x1d\x18\x58\xbd\xf7\x25\x47\xe7\xaf\x51\xb8\x46\xef\
+\x2b\x14\x15\xf2\xde\xfb\x35\x37\xaf\xa9\x59\xe3\xfe\x91\xab\xf7\
+\xfe\xee\xc1\x55\x7b\x5f\x32\x77\x95\xa7\x61\x39\xc6\xfd\x6b\xa8\
+\xed\x24\x6b\xf0\x7b\x9e\x27\xd3\x71\xff\xc8\x35\xc6\xfd\xc1\x3d\
+\xbd\x57\xe8\x7d\xb9\x55\xbe\x86\xd5\x5d\xb5\xf7\x95\xec\x5f\x9e\
+\xeb\xde\x5f\xa1\x25\xde\xf3\xec\xdf\xbf\xff\x4a\xbd\x0f\x00\xb9\
+\x42\x28\x8f\x96\x72\xb5\x50\x77\xe5\x31\x8d\x0c\x79\x5b\xa5\x8e\
+\x7a\x64\x59\x73\x3b\x5e\x2f\x00\xcd\x71\xb5\x50\x77\xe5\x31\x8d\
+\x0c\x79\x5b\xa5\x8e\x7a\x64\x59\x73\x3b\x5e\xaf\xbc\x30\xb3\x9f\
+\x7b\xaf\x2f\x94\x3f\x0f\xc1\x3e\x96\x65\x3d\xad\xc4\x9c\x26\x63\
+\x5f\xfc\xc1\x6a\x5f\xe7\xf7\xfb\xab\x0b\x41\x71\x23\x5f\xdf\xec\
+\x8b\x7e\xfd\x5e\xcb\x7e\xee\xbd\xaf\xe9\xfd\x40\xef\xa7\x9c\xd9\
+\xa4\x8f\xe3\xcb\x7a\xdf\x99\x4d\xd2\xfa\xab\x0b\x21\x34\xb8\xf7\
+\x6d\xfd\x7a\x5f\xfa\xb9\x0f\xb5\xe3\xbe\xe8\xfd\x94\x73\x61\xd2\
+\xbb\xc2\xe5\xbd\xef\xc2\x64\x08\x96\x45\x49\x2d\x2f\xa8\xd1\xbd\
+\xbf\x7e\xe3\xbe\x64\x3f\x57\xa8\x8e\xfb\x62\xdc\xaf\x08\xe6\x26\
+\x0b\xf2\x97\xf5\x7e\x30\x37\xb9\xca\xc2\x34\x50\xe3\xc7\xfd\x2f\
+\xae\xe3\xb8\x1f\x42\xf8\xb9\x99\x7d\xa1\xe6\x4b\xf4\x7e\xca\xcc\
+\x26\x97\x96\x96\x2e\x7f\xbf\x6f\x36\xc9\x8d\x9c\x57\xd4\x36\xef\
+\x79\x00\x20\x0f\x08\xe5\xd1\x32\xd6\x12\xec\xae\x3c\xbe\x11\x01\
+\x6f\xab\xd4\x51\x6f\x0d\xf5\x1e\xbf\x5e\x35\xb7\xe3\xf5\x02\xd0\
+\x1c\x6b\x09\x76\x57\x1e\xdf\x88\x80\xb7\x55\xea\xa8\xb7\x86\x7a\
+\x8f\x5f\xaf\x9a\xdb\xf1\x7a\xe5\x49\x50\x98\xba\xbf\xff\xd8\x0b\
+\xe5\xcf\xef\xef\xff\xe6\x0b\x57\x3b\x1e\x92\xf7\xc5\x1f\x44\xb6\
+\xf4\x6d\x49\x1f\x09\xa6\xd7\x4d\xe1\x97\x59\xd7\x94\xa9\xa0\xee\
+\x60\xf6\x5e\x49\x92\xe9\xab\x19\x57\xb3\x76\x21\x4c\xf5\xdf\x7f\
+\x7f\xa5\xdf\x6b\x3f\xc6\xea\xbc\xf7\x3f\xb0\x28\xfa\xb6\xa4\x8f\
+\x58\x08\xaf\xcb\x2c\xd7\xbd\x1f\xa4\x6e\x0b\xe1\xbd\x92\x64\x6a\
+\xa3\xde\x37\x9b\xea\xdf\x7d\xb8\xda\xfb\xef\x1d\xa4\xf7\xaf\xc1\
+\xbb\xe2\x0f\x2c\x8e\xbf\x2d\xd3\x47\x2c\xe8\x75\x59\xbe\xc7\xfd\
+\x10\xac\xdb\xa4\xb6\xeb\x7d\x33\x4d\x1d\xde\xd3\x5f\xe9\xf7\xc1\
+\x7b\xfb\xe9\xfd\x6b\x28\xca\xff\x20\x96\x7d\x5b\xd2\x47\x24\x7b\
+\x3d\x98\x72\xdd\xfb\x16\x42\xb7\x94\xbe\xe7\x91\xb5\x51\xef\xdb\
+\xd4\xfe\xfd\xfb\x2b\xfd\x5e\xfb\x31\x56\xb7\xb4\xb4\xf4\x83\x42\
+\xa1\x90\xf6\xbe\x5e\x97\xf2\xdd\xfb\x92\xba\x95\x8e\xfb\x6a\xa3\
+\x71\x1f\x00\xf2\x80\x50\x1e\x2d\xa1\x36\xd8\x5d\x5c\x5c\xd4\x3b\
+\xef\xbc\xb3\xec\x71\x33\x53\x14\x45\xea\xee\xee\xd6\xd6\xad\x5b\
+\x15\x45\x51\xe5\x79\xeb\x19\xf0\xb6\x4a\x1d\xf5\xc8\xb2\xe6\x76\
+\xbc\x5e\x00\x9a\xa3\x36\xd8\x5d\x5a\x5a\xd2\xe4\xe4\xe4\xb2\xc7\
+\xcd\x4c\xce\x39\x75\x77\x77\x6b\xf3\xe6\xcd\x72\xce\x55\x9e\xb7\
+\x9e\x01\x6f\xab\xd4\x51\x8f\x2c\x6b\x6e\xc7\xeb\x05\x5c\x4b\xba\
+\x6f\xf9\xbe\xac\xeb\x68\x45\xe9\xb2\xf1\xe8\x50\xe9\xbe\xe5\xf4\
+\xfe\x2a\xd2\x65\xe3\xd1\xa1\xd2\x7d\xcb\xe9\xfd\x55\xa4\xcb\xc6\
+\xa3\x43\xa5\xfb\x96\xd3\xfb\xab\x48\x97\x8d\x47\x87\x4a\xf7\x2d\
+\xa7\xf7\x57\x91\x2e\x1b\x0f\x00\x68\x11\xec\x57\x83\xcc\xad\x65\
+\xa6\x75\x08\x41\xa5\x52\x49\x33\x33\x33\x7a\xfb\xed\xb7\x15\xc7\
+\xd5\x95\x77\xea\x9d\xa9\xdd\xea\x75\xd4\x23\xcb\x9a\xdb\xf1\x7a\
+\x01\x68\x8e\xb5\xcc\xb4\x0e\x21\x28\x8e\x63\xcd\xce\xce\x6a\x62\
+\x62\x42\xde\x57\x57\x3c\xab\x77\xa6\x76\xab\xd7\x51\x8f\x2c\x6b\
+\x6e\xc7\xeb\x95\x17\xcb\x96\x18\x0f\xb6\x94\x61\x29\x40\x5d\x46\
+\x26\x0e\x4c\x8c\x8c\x1f\x08\x23\xe3\x07\xc2\xab\x63\x8f\x3d\x5e\
+\xef\xf3\x6b\x97\x9a\x0d\x12\xbd\x8f\xb6\x31\x31\x32\x32\x31\x3e\
+\x32\x12\xc6\x47\x46\xc2\xd8\xab\xaf\xd6\xdf\xfb\x35\x4b\x8c\x87\
+\x10\xe8\x7d\xb4\x8d\x89\xd7\x8f\x4e\x8c\x9f\x19\x0a\xe3\x67\x86\
+\xc2\xd8\xcf\x86\x6e\x70\xdc\xa7\xf7\xd1\x3e\x8e\x9e\x9a\x98\x18\
+\x3a\x35\x1e\x86\x4e\x8d\x87\xa1\xd7\xc6\xea\xee\x7d\x2d\x5f\x62\
+\x9c\xde\x47\xdb\x78\xf9\xe5\x97\x27\x86\x87\x87\x43\xfa\xe7\x7a\
+\x7a\x1f\x00\x72\x85\x99\xf2\x68\x59\x3d\x3d\x3d\xda\xb6\x6d\x5b\
+\xe5\xf3\xa5\xa5\x25\x4d\x4d\x4d\x69\x61\x61\x41\x73\x73\x73\xda\
+\xb2\x65\x4b\xae\xea\xa8\x47\x96\x35\xb7\xe3\xf5\x02\xd0\x1c\x9b\
+\x37\x6f\x5e\x36\x06\x94\x4a\x25\x4d\x4f\x4f\x6b\x71\x71\x51\xf3\
+\xf3\xf3\xda\xb4\x69\x53\xae\xea\xa8\x47\x96\x35\xb7\xe3\xf5\xea\
+\x38\xa6\x33\x0a\xfa\x60\xf2\x61\x98\xce\xba\x1c\xa0\x59\x4c\x3a\
+\x13\x94\xf4\xbe\xcc\xe8\x7d\xe4\x86\xc9\xce\x04\x85\x0f\xa6\x9f\
+\xd1\xfb\xc8\x8d\xda\xde\xb7\x20\x7a\x1f\x79\x72\x46\xe5\xf7\x3c\
+\xa2\xf7\x01\x00\xe8\x54\xcc\x94\x47\xa6\xea\x99\x2d\x5d\x2c\x16\
+\xd5\xd3\xd3\x23\x29\x99\xa9\x77\xbd\xaf\xd3\xca\x75\xd4\x23\xcb\
+\x9a\xdb\xf1\x7a\x01\x68\x8e\x7a\x66\x4b\x17\x0a\x85\x4a\xa0\xbb\
+\x72\x7c\xb8\xd1\x59\xd7\xad\x52\x47\x13\xf7\x55\x8d\x00\x00\x20\
+\x00\x49\x44\x41\x54\x3d\xb2\xac\xb9\x1d\xaf\x57\x9e\x2c\xdb\x03\
+\xdd\xb4\x90\x61\x29\x40\x73\xd5\xec\x81\x6e\xa2\xf7\x91\x23\x35\
+\x7b\xa0\x9b\x05\x7a\x1f\xb9\x51\xbb\x07\x7a\x30\xa3\xf7\x91\x27\
+\xb5\x7b\xa0\xd3\xfb\x00\x00\x74\x28\x66\xca\xa3\x2d\x94\x97\xcb\
+\xbd\x74\xe9\x92\x24\xa9\xbb\xbb\x3b\xd7\x75\xd4\x23\xcb\x9a\xdb\
+\xf1\x7a\x01\x68\x9e\x38\x8e\x35\x37\x37\x27\x49\xea\xea\xea\xca\
+\x7d\x1d\xf5\xc8\xb2\xe6\x76\xbc\x5e\x00\x00\x00\x00\x00\x00\x00\
+\x90\x25\x42\x79\xb4\xac\xe9\xe9\x69\x4d\x4f\x2f\x5f\xb1\xa9\x50\
+\x28\x68\xe7\xce\x9d\x4d\x0d\x01\x5a\xa5\x8e\x7a\x64\x59\x73\x3b\
+\x5e\x2f\x00\xcd\x31\x33\x33\xa3\x99\x99\x99\x65\x5f\x8b\xa2\x48\
+\xdb\xb6\x6d\x53\xb1\x58\xcc\x5d\x1d\xf5\xc8\xb2\xe6\x76\xbc\x5e\
+\x00\x00\x00\x00\x00\x00\x00\xd0\x4a\x58\xbe\x1e\x6d\x25\x8e\x63\
+\x2d\x2c\x2c\x5c\xb6\x5c\x6e\x5e\xeb\xa8\x47\x96\x35\xb7\xe3\xf5\
+\x02\xd0\x1c\xde\x7b\x2d\x2e\x2e\x66\x5d\x46\xcb\xd4\x51\x8f\x2c\
+\x6b\x6e\xc7\xeb\x05\x00\x00\x00\x00\x00\x00\x00\x59\x61\xa6\x3c\
+\x5a\x56\x4f\x4f\x8f\xb6\x6d\xdb\x56\xf9\x3c\x8e\x63\x4d\x4f\x4f\
+\xeb\xd2\xa5\x4b\x32\x33\x6d\xdf\xbe\x3d\x57\x75\xd4\x23\xcb\x9a\
+\xdb\xf1\x7a\x01\x68\x8e\xcd\x9b\x37\x6b\xcb\x96\x2d\x95\xcf\xbd\
+\xf7\x9a\x99\x99\xd1\xec\xec\xac\xcc\x4c\x3d\x3d\x3d\xb9\xaa\xa3\
+\x1e\x59\xd6\xdc\x8e\xd7\x0b\x00\x00\x00\x00\x00\x00\x00\x5a\x09\
+\x33\xe5\xd1\x36\xa2\x28\xd2\xf6\xed\xdb\x15\x45\xd1\x65\xcb\xe8\
+\xe6\xb1\x8e\x7a\x64\x59\x73\x3b\x5e\x2f\x00\xcd\xe1\x9c\x53\x4f\
+\x4f\x8f\xa2\x28\xaa\xec\x51\x9e\xe7\x3a\xea\x91\x65\xcd\xed\x78\
+\xbd\x00\x00\x00\x00\xfc\xff\xed\xdd\x7d\x70\x5c\xf5\x7d\xef\xf1\
+\xcf\xf7\xec\x4a\x96\x1f\x90\x6a\x61\xb7\xf6\xa5\x61\x48\x72\x49\
+\xa9\x53\xee\x5c\x62\xd9\x10\x53\x83\xd2\xe1\xc1\x9d\x8b\xed\xcc\
+\xa4\xe1\x16\xa8\x33\xc6\x38\x76\x43\x68\x1d\x07\x3b\x4c\x9a\x3f\
+\x3c\xfc\x11\x67\xb8\x76\xab\x28\x25\xa1\x26\x36\x1e\x6a\x02\x6d\
+\x19\x66\x10\xf8\x4e\x7d\x4d\x26\x11\x56\xa1\xb1\x2d\xc1\xcc\x4d\
+\x01\xe7\x32\x26\xa6\x4c\x83\xef\xb5\x0c\x48\x7e\xc2\x92\xf6\x7c\
+\xef\x1f\xda\x95\xf5\xb0\x7a\xd8\x27\x9d\x3d\xbb\xef\xd7\x8c\x12\
+\xed\x6a\xf7\xb7\x9f\xaf\xf4\x9b\xaf\x64\xbe\x7b\xce\x01\x00\x00\
+\x40\x94\x18\xca\x23\x96\xdc\xbd\x2c\x4e\x85\x5e\x2e\x39\x72\x11\
+\x65\xe6\x38\x7e\xbf\x00\x4c\x8f\x72\xe9\x0f\xe5\x92\x23\x17\xf4\
+\x75\x00\x00\x00\x00\x00\x00\x00\x28\x6f\x0c\xe5\x11\xa9\x4f\x5f\
+\xb7\xe4\xcb\x53\x7d\x6c\x2a\x95\xd2\x47\x1f\x7d\xa4\x54\x2a\xa5\
+\x44\x22\x21\x33\xcb\x6b\x9d\x72\xce\x91\x8b\x28\x33\xc7\xf1\xfb\
+\x05\x60\x7a\x5c\xf1\x7b\x8b\x72\xea\x0f\x67\xce\x9c\xc9\xda\x1f\
+\x72\x59\xa7\x9c\x73\xe4\x22\xca\xcc\x71\xfc\x7e\x01\x00\x00\x00\
+\x00\x00\x00\x40\x5c\x70\x4d\x79\x94\xad\x33\x67\xce\xe8\xcc\x99\
+\x33\x59\xbf\x36\xfc\x9a\xe5\xd5\x92\x23\x17\x51\x66\x8e\xe3\xf7\
+\x0b\xc0\xf4\x38\x77\xee\xdc\xb8\x97\xb1\x18\x7e\xcd\xf2\x6a\xc9\
+\x91\x8b\x28\x33\xc7\xf1\xfb\x05\x00\x00\x00\x00\x00\x00\x00\xe5\
+\x84\x23\xe5\x11\xb9\xa9\x1e\x2d\x1d\x04\x81\xea\xea\xea\x34\x6f\
+\xde\x3c\xcd\x9a\x35\x2b\xe7\xe7\xc7\x25\x47\x2e\xa2\xcc\x1c\xc7\
+\xef\x17\x80\xe9\x31\xd5\xa3\xa5\x83\x20\xd0\x8c\x19\x33\x34\x77\
+\xee\x5c\xd5\xd5\xd5\xe5\xfc\xfc\xb8\xe4\xc8\x45\x94\x99\xe3\xf8\
+\xfd\xaa\x52\x37\x1c\xec\xfe\xef\x7b\x5f\x3a\xf5\xa7\xcd\x51\x07\
+\x01\xa6\xd9\x0d\xdd\x07\x0f\xee\x3d\xf5\xd2\x4b\xcd\x51\x07\x01\
+\xa6\x97\xdd\xd0\x7d\x7c\xe7\xde\x53\xbf\xde\xd1\x1c\x75\x12\x60\
+\x3a\x99\x74\xc3\xce\xae\xee\xbd\x3b\x8e\x9e\x6a\x8e\x3a\x0b\x30\
+\xcd\x6e\x78\xfe\xf9\xe7\xf7\xbe\xf8\xe2\x8b\xcd\x51\x07\x01\x00\
+\x00\xc5\xc5\x91\xf2\x28\x0b\x9f\xbe\x6e\xc9\x97\x8f\xbf\x7e\xf4\
+\x59\x49\xaa\xad\xad\xd5\xef\xfe\xee\xef\x4e\xf9\x79\x95\x98\x23\
+\x17\x51\x66\x8e\xe3\xf7\x0b\xc0\xf4\xb8\xe2\xf7\x16\x7d\xf9\x3f\
+\x7e\xf5\xe6\xb3\x92\x54\x53\x53\xa3\xdf\xf9\x9d\xdf\x99\xf2\xf3\
+\x2a\x31\x47\x2e\xa2\xcc\x1c\xc7\xef\x57\x35\x70\xb7\x93\x92\xa7\
+\x3f\xd7\x6f\x49\xbe\xd6\xcd\xd7\x4a\xb2\x9f\x76\xdf\xf9\x6d\x37\
+\x75\xa7\xc2\xda\xfd\x2b\xe6\x3f\xf5\x7e\xa4\x41\x81\x22\x73\xf7\
+\x93\xc3\x3e\xff\x2d\x49\x6b\xcd\x07\xf7\x7e\xf7\x4f\x7f\xfa\x6d\
+\x73\xef\x0e\x53\xa9\xfd\xf3\x57\xac\x60\xef\xa3\xa2\x8c\xec\xfb\
+\xe9\xbd\x1f\x6a\xad\x24\xeb\x3e\xbe\xe3\xdb\x66\xea\x0e\x83\xe4\
+\xfe\xf9\x57\x6d\x66\xef\xa3\xa2\x98\xfc\xa4\xa7\x3f\xcf\xec\x7d\
+\x99\xad\x95\x64\x3b\x3a\xbb\xbf\x2d\xb3\xee\xa4\x87\xfb\x37\x37\
+\xcd\x67\xef\xa3\xa2\xb8\xfb\xc9\x61\x97\x05\xfb\x2d\x33\x5b\x1b\
+\x86\xe1\x5a\x49\xd6\xd6\xd6\xf6\x6d\x49\xdd\x03\x03\x03\xfb\xbf\
+\xf4\xa5\x2f\xb1\xf7\x01\x00\x88\x31\x86\xf2\x28\x1b\xc3\x07\xbc\
+\x53\x7d\x7c\x25\xe7\xc8\x45\x94\x99\xe3\xf8\xfd\x02\x30\x3d\x86\
+\x0f\x78\xa7\xfa\xf8\x4a\xce\x91\x8b\x28\x33\xc7\xf1\xfb\x55\xe9\
+\xcc\xed\x49\x05\xba\xcd\xdd\xff\xd3\xe8\xaf\x85\x52\xaf\xb9\x35\
+\x27\xac\xbf\xf9\xa5\xd3\x77\x9a\xdc\xde\x75\xd9\x91\x8f\x2f\x5a\
+\xc7\xaa\x2b\x9e\xe9\x8e\x22\x2f\x50\x2c\x6e\xf6\x64\xa0\xec\x7b\
+\x5f\x61\xd8\xeb\x66\xcd\x96\x48\x34\x9f\x7e\xe9\x25\x73\xe9\x5d\
+\xb9\x1f\xb9\xf8\xf1\xc7\x1d\x57\xac\x5a\xc5\xde\x47\xac\x79\xe0\
+\x4f\x06\xae\xdb\xdc\x35\x76\xef\x9b\xf7\xba\x5b\xb3\xa5\x06\x9a\
+\x4f\x1f\xdf\x79\x69\xef\xa7\xac\xe3\x8a\xdf\xdb\xc2\xde\x47\xac\
+\x79\xe8\x4f\x2a\x08\x6e\x53\x96\xbe\xef\xa6\x5e\x73\x6f\x1e\x90\
+\x35\xef\xec\x3c\x6d\x92\xbf\xeb\xa6\x23\xe6\x17\x3b\xb6\x34\x5d\
+\xc1\xde\x47\xac\x25\x12\x89\x27\xc3\x30\xbc\x4d\x1a\xdb\xf7\xdd\
+\xbd\x37\x08\x82\xe6\x9a\x9a\x9a\xe6\xb6\xb6\x36\x33\xb3\x77\xc3\
+\x30\x3c\x12\x04\x41\xc7\x2a\xfe\xe6\x01\x00\x20\x56\x18\xca\xa3\
+\xac\x64\x06\xb6\x13\x0d\x79\xa7\x63\xa8\x5b\x2e\x39\x72\x11\x65\
+\xe6\x38\x7e\xbf\x00\x4c\x8f\xcc\xc0\x76\xa2\x21\xef\x74\x0c\x75\
+\xcb\x25\x47\x2e\xa2\xcc\x1c\xc7\xef\x57\x25\xbb\x75\xfe\x3f\xb4\
+\x1f\x38\xf5\x67\x4d\x89\xa0\xef\x0e\x49\xb7\xb8\xf4\x19\xb9\xfe\
+\xab\x24\x7d\x74\xb9\xff\xb8\xee\x37\xe7\xf7\x4a\xd2\xaa\x2b\xf6\
+\x9f\x8f\x34\x28\x50\x64\xf3\x6f\xbd\xb5\xfd\xd4\x81\x03\x4d\x41\
+\x22\x71\x87\xa4\x5b\xe4\xfe\x19\xd7\xe0\xde\xbf\xfc\xa3\x8f\x7e\
+\xfc\x9b\xba\xba\xbd\x92\x74\xc5\xaa\x55\xec\x7d\x54\x94\xf9\x9f\
+\xdc\xda\x7e\xea\x44\x4b\x53\x10\x0e\x0c\xee\x7d\xe9\x33\x9e\xee\
+\xfb\x97\x9f\x3f\xf7\xe3\xdf\xcc\xd5\xe0\xde\xbf\xe2\x61\xf6\x3e\
+\x2a\xca\xd6\x25\xf3\xdb\x5b\x3a\x4f\x35\x0d\x58\x70\x87\x7c\x70\
+\xef\x4b\xfe\x5f\x25\xe9\xdc\x8c\xcb\x7f\xac\x8f\x7f\xb3\x57\x92\
+\x1e\x6e\xba\x82\xbd\x8f\x8a\xb2\x72\xe5\xca\xf6\xe7\x9e\x7b\xae\
+\x29\x99\x4c\x0e\xf5\x7d\xa5\xff\xe6\xe9\xeb\xeb\xfb\x71\x5d\xfa\
+\x6f\x9e\xd5\xab\x57\xb3\xf7\x01\x00\x88\x31\x86\xf2\x28\x4b\xe5\
+\x32\xc0\x2d\x97\x1c\xb9\x88\xfa\x54\xfa\x51\xbd\x36\x80\xf2\x56\
+\x2e\x03\xdc\x72\xc9\x91\x8b\xa8\x4f\xa5\x1f\xd5\x6b\x63\xa4\xf4\
+\xa9\xe9\x7f\x9c\xfe\xd0\x81\x53\x7f\xb6\x50\x92\x1a\x4f\xdb\x83\
+\x61\xdd\xac\x2d\x72\x35\x1e\xec\xbe\x73\xfc\x05\x4c\xa7\xe5\x7a\
+\xcd\x4c\xcf\x72\xaa\x7b\xc4\x49\xfa\xd4\xf4\x43\x7b\xff\xd4\x81\
+\x03\x0b\x25\xe9\x74\x63\xe3\x83\x75\x61\xb8\xc5\xa5\xc6\xee\x83\
+\x07\xc7\x7d\xbe\x49\xa7\x5d\x7a\xcd\xcc\x9e\xe5\x54\xf7\x88\x93\
+\xf4\xa9\xe9\x2f\xed\xfd\x13\x2d\x83\x7b\x7f\xe6\x9c\x07\xeb\x2e\
+\xda\x16\x77\x6f\xec\x3e\xbe\x63\xdc\xe7\x9b\xe9\xb4\xbb\xbd\x66\
+\xe6\xcf\x72\xaa\x7b\xc4\x49\xfa\xd4\xf4\x43\x7b\xbf\xa5\xf3\xd4\
+\x42\x49\x9a\xf3\xf1\xe9\x07\x4d\x75\x5b\x5c\xde\xb8\xa3\x73\xa2\
+\x83\x83\xed\xb4\xc9\x5f\x73\xb3\x67\x39\xd5\x3d\xe2\x24\x7d\x6a\
+\xfa\xa1\xbd\xff\xdc\x73\xcf\x2d\x94\xa4\x19\x33\x66\x3c\x18\x86\
+\xe1\x16\x33\x6b\x6c\x6b\x6b\x9b\x68\x89\xd3\x92\x5e\x93\xf4\x2c\
+\xa7\xba\x07\x00\xa0\x3c\x31\x94\x07\x00\x00\x00\x62\x26\x33\x54\
+\xbf\x65\xde\x3f\x7d\x4f\xd2\xf7\x5e\x3a\xf5\xa7\xcd\x6e\xe1\x5a\
+\x33\x7d\x46\xb2\x45\xee\xde\x30\xe2\x09\xae\xcb\x25\xdd\xea\xae\
+\x5b\x13\x41\x7f\xcf\x4b\xa7\xef\x7c\xd3\xdd\x7e\x65\x6e\x4f\xde\
+\x3a\xff\x1f\xda\xa7\xbf\x02\x20\x3f\x99\xa1\xfa\xbc\x5b\x6e\xf9\
+\x9e\xa4\xef\x9d\x7a\xe9\xa5\x66\x73\x5f\x6b\x66\x9f\x91\x34\x66\
+\xef\xbb\x32\x7b\xdf\x6f\x0d\x12\x89\x9e\xd3\x2f\xbd\xf4\xa6\xbb\
+\xff\xca\xcd\x9e\x9c\x7f\xeb\xad\xed\xd3\x5f\x01\x90\x9f\xcc\x50\
+\x7d\xde\xa7\xb7\x0e\xee\xfd\x5f\xef\x68\x36\xb7\xb5\x26\x4f\xef\
+\x7d\x8d\xdc\xfb\xae\xcb\x25\xbf\xd5\x5d\xb7\x06\xe1\x40\xcf\xe9\
+\x77\x76\xbc\xe9\x6e\xbf\xf2\xc0\x9f\x9c\xff\xc9\xad\xed\x11\x94\
+\x00\xe4\x25\x33\x54\xdf\xda\x34\xef\x7b\x92\xbe\xb7\xe3\xe8\xa9\
+\x66\x33\x5b\xeb\xe9\xbe\xaf\xd1\x7f\xf3\xc8\x2f\x77\xe9\x56\xb9\
+\xdf\x3a\x60\x41\xcf\x8e\xae\xd3\x6f\x9a\xfc\x57\x1e\xfa\x93\x5b\
+\x97\xcc\x6f\x9f\xf6\x02\x80\x3c\x65\x86\xea\xab\x57\xaf\xfe\x9e\
+\xa4\xef\xbd\xf8\xe2\x8b\xcd\x61\x18\xae\x75\xf7\xcf\x98\xd9\x22\
+\x49\xa3\xf6\xfe\xe0\xdf\x3c\x92\x6e\x4d\x26\x93\x3d\xcf\x3f\xff\
+\xfc\x9b\x92\x7e\x95\x48\x24\x9e\x5c\xb9\x72\x65\xfb\xb4\x86\x07\
+\x00\x00\x59\x31\x94\x07\x00\x00\x00\x62\x2e\x3d\x58\x6f\x97\x06\
+\x8f\xa2\x4f\x04\x7d\x77\xb8\xeb\xcb\x32\x2d\x96\xab\x71\xf8\x63\
+\xd3\x43\xcb\xcf\x4b\xfe\x79\x37\x5f\x7b\xb0\xfb\xce\xae\xd0\x6b\
+\x57\x72\xf4\x3c\xe2\x28\x3d\x58\x6f\x97\x06\x8f\xa2\x0f\x12\x89\
+\x3b\xdc\xfd\xcb\x26\x2d\x76\x8d\xb7\xf7\xf5\x79\x73\x5f\xdb\x7d\
+\xf0\x60\x97\x87\xe1\x4a\x8e\x9e\x47\x1c\xa5\x07\xeb\xed\xd2\xe0\
+\x51\xf4\x41\x38\x70\x87\xbb\x7d\xd9\x4c\x8b\xdd\x7d\xd4\xde\xd7\
+\x50\xdf\xb7\x50\x6b\xbb\x8f\xef\xec\xf2\x44\x62\x25\x47\xcf\x23\
+\x8e\xd2\x83\xf5\x76\x69\xf0\x28\xfa\x01\x0b\xee\x30\xf7\x2f\x4b\
+\xb6\xd8\x35\x72\xef\xa7\x07\xf6\x9f\x77\xe9\xf3\x32\x5b\xbb\xb3\
+\xab\xbb\x2b\xe1\xbe\x92\xa3\xe7\x11\x47\xe9\xc1\x7a\xbb\x34\x78\
+\x14\x7d\xfa\x54\xf7\x5f\x76\xf7\xc5\x66\xd6\x38\xea\xe1\x0d\x66\
+\xf6\x79\x49\x9f\x0f\xc3\x70\x6d\x5b\x5b\x5b\xd7\xc0\xc0\xc0\x4a\
+\x8e\x9e\x07\x00\x20\x5a\x0c\xe5\x31\xed\x26\xba\xee\xf8\x74\x2a\
+\x97\x1c\x53\x15\x75\xde\xa8\x5f\x1f\x40\xf9\x9a\xe8\xba\xe3\xd3\
+\xa9\x5c\x72\x4c\x55\xd4\x79\xa3\x7e\x7d\x94\x4e\xb6\x53\xdd\x67\
+\x86\xf4\x66\xb6\x74\xcc\x51\xf4\xd2\xe2\x20\xe8\xbf\x56\x12\xff\
+\x91\x0e\xb1\x96\xed\x54\xf7\x43\x43\xfa\x71\xf7\x7e\xc0\xde\x47\
+\xec\x65\x3b\xd5\xfd\xa5\x21\xbd\x2f\x1d\x7d\x14\xbd\xe4\x8b\x83\
+\x90\xbe\x8f\xf8\xcb\x76\xaa\xfb\xcc\x90\xde\xcd\x96\x8e\x3e\x8a\
+\xde\x5d\x8b\xfb\x45\xdf\x47\xfc\x65\x3b\xd5\x7d\x66\x48\x2f\x69\
+\xa9\xc6\x1e\x45\xbf\xb8\xa6\xa6\x86\xbd\x0f\x00\x40\xc4\x2c\xea\
+\x00\x00\x00\x00\x00\xa6\x47\x66\x40\x2f\xe9\x16\x97\x7d\x49\xee\
+\x09\x49\x72\xb7\xbb\x6e\x9f\xff\x8f\xff\x10\x71\x3c\x54\x98\x83\
+\xa7\xef\x7c\x57\xae\x2b\x25\x49\x66\xb7\xdf\x76\xf9\x3f\x8e\x7f\
+\xf1\xf7\x12\xcb\x0c\xe8\x25\xdd\x22\xf7\x2f\xb9\x94\xde\xfb\x7e\
+\xd7\xfc\xdb\x6f\x67\xef\xa3\xa8\x4e\x1f\x3c\xf8\xae\x6b\x70\xef\
+\x9b\x74\xfb\xe5\xb7\xdd\x16\xdd\xde\x4f\x0f\xe8\x25\xdd\x22\xd9\
+\x97\x7c\xa8\xef\xeb\xae\xf9\xff\x79\x2b\x7b\x1f\x45\x75\xfa\xf8\
+\x8e\x4b\x7b\xdf\xfc\xf6\xcb\x3f\xf5\xad\xc8\xf6\x7e\x66\x40\x2f\
+\xd7\x2d\x26\x7d\xc9\x35\xb8\xf7\xe5\x7e\xd7\xd6\x25\xf3\xd9\xfb\
+\x28\xaa\x1d\x9d\xa7\xdf\x95\xfc\x4a\x49\x72\xd9\xed\xdf\x6a\xba\
+\x3c\xb2\xbd\x3f\x6c\x40\x7f\x8b\xa4\x2f\x29\xfd\x37\x8f\xa4\xbb\
+\x56\xaf\x5e\xcd\xde\x47\x51\xb5\xb5\xb5\xbd\xab\xa1\xbe\x6f\xb7\
+\xaf\x5a\xb5\x2a\xb2\xbd\x0f\x00\x71\xc0\x91\xf2\x00\x00\x00\x40\
+\x95\x18\x7e\x14\xfd\xc1\xee\x3b\xff\xaf\xa4\xdf\x96\xa4\x20\xb0\
+\xdf\x8d\x34\x18\x2a\x93\xd9\x76\xb9\x6f\x33\xb3\x17\x53\x61\xcd\
+\x2f\xa3\x8c\x32\xfc\x28\xfa\xee\x83\x07\x87\xed\xfd\x80\xbd\x8f\
+\xa2\x33\x69\xbb\x4b\xdb\xcc\xec\xc5\x30\x95\x8a\x76\xef\x0f\x3b\
+\x8a\xbe\xfb\xf8\x0e\xf6\x3e\x4a\xca\x02\x6d\x77\xb7\x6d\x26\xbd\
+\x18\x06\xc9\x48\xf7\xfe\xf0\xa3\xe8\x77\x74\x75\xff\x5f\x79\x7a\
+\xef\x1b\x7b\x1f\x25\x60\xb6\xdd\xdc\xb7\xc9\xec\xc5\xa4\x87\x91\
+\xee\xfd\xe1\x47\xd1\xb7\xb5\xb5\x0d\xf5\x7d\x33\xfe\xde\x47\xf1\
+\x99\xd9\x76\x77\xdf\x26\xe9\xc5\xfe\xfe\xfe\x48\xf7\x3e\x00\xc4\
+\x01\x43\x79\x00\x00\x00\xa0\x0a\x99\xe9\xb8\xa7\xff\x03\xb5\x14\
+\x2e\x89\x36\x0d\x2a\xd1\x6d\x8d\xff\xb8\x4b\xd2\xae\xa8\x73\x8c\
+\x66\x66\xc7\xdd\x3d\xbd\xf7\xc5\xde\x47\xd1\x35\xde\x76\x5b\x99\
+\xee\x7d\xfa\x3e\x4a\xab\xf1\x93\x5b\xcb\x72\xef\x4b\x76\x5c\x1a\
+\xec\xfb\x21\x7d\x1f\x25\xb0\x75\x71\x63\x59\xee\x7d\x77\x3f\x6e\
+\x66\xbf\x9d\xfe\x9c\xbd\x8f\xa2\x5b\xb5\x6a\x55\x59\xee\x7d\x00\
+\x28\x57\x41\xd4\x01\x00\x00\x00\x00\x44\xa2\x67\xd8\xe7\xf5\x91\
+\xa5\x00\xa6\x1f\x7b\x1f\xd5\x8a\xbd\x8f\x6a\x75\x69\xef\x1b\x7b\
+\x1f\xd5\xc3\xcc\xe8\xfb\x00\x00\x94\x11\x86\xf2\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x94\x08\xa7\xaf\x07\x00\x00\x00\xaa\
+\x9c\xcb\xea\x0f\x9c\xfa\xef\x9f\xcb\xdc\x5e\x31\xff\x1f\x5f\x8b\
+\x32\x0f\x30\x6d\xdc\xeb\x4f\x1d\x38\x30\xb4\xf7\xe7\xaf\x58\xc1\
+\xde\x47\x75\x70\xab\x3f\xf5\xf6\xff\xb8\xb4\xf7\xaf\xfe\x16\x7b\
+\x1f\x55\xc1\xa4\xfa\xff\xd1\x79\x6a\x68\xef\x7f\xab\x69\x3e\x7b\
+\x1f\xd5\xa2\xfe\x85\x17\x5e\x18\xda\xfb\xab\x56\xad\x62\xef\x03\
+\x00\x30\xcd\x18\xca\x03\x00\x00\x00\x55\xe0\x60\xf7\x9d\x7f\x25\
+\xe9\xbb\x99\xdb\xee\xc3\xbe\xe8\xbe\x2c\x61\xea\x74\xa9\x4f\xd2\
+\x0c\x49\x36\xdd\xf9\x80\x52\xe9\x3e\x78\x70\xd4\xde\xbf\xb4\xf9\
+\x5d\x5a\x66\x89\x44\xa7\xdc\xd9\xfb\xa8\x38\xdd\xef\xec\xfc\x2b\
+\xb9\x67\xed\xfb\x2e\x5f\x66\x89\xa0\x53\xae\x3e\xc9\xd9\xfb\xa8\
+\x28\x3b\xbb\xba\xff\xca\xfd\x52\xdf\x1f\xbe\xf9\xdd\x7d\x59\x60\
+\xd6\x29\xa9\xcf\x9d\xbe\x8f\xca\xf2\xc2\x0b\x2f\xfc\x95\x0f\xeb\
+\xfb\xa3\x2c\x73\xf7\x4e\xf1\xf7\x3e\x00\x00\x91\xe1\xf4\xf5\x00\
+\x00\x00\x40\x15\xb8\x6d\xde\x3f\x6d\x37\xd3\x47\xe3\x7d\xdd\x07\
+\xff\xc3\xdc\x0c\x93\xde\x9c\xc6\x58\x40\xc9\xcd\xbb\xed\xb6\xed\
+\x66\x36\xee\xde\x97\xbb\x49\x9a\x21\x33\xf6\x3e\x2a\xca\xbc\x4f\
+\x6d\x99\xc2\xde\xf7\x19\xa2\xef\xa3\xc2\x6c\x59\x3c\x6f\xc2\xbd\
+\xef\x2e\x73\xd7\x0c\x19\x7b\x1f\x95\x65\xd5\xaa\x55\xdb\xa5\xf1\
+\xff\xde\x57\xfa\xef\x7d\xd1\xf7\x01\x00\x88\x04\xef\x88\x03\x00\
+\x00\x00\xaa\xc8\xc1\xee\x3b\xdd\xcc\xfa\xe5\x9e\xf4\x2c\xff\x1e\
+\xb8\x6d\xde\x3f\xf1\x6f\x04\x54\xa4\xee\x83\x07\xdd\xcc\xfa\x5d\
+\x4a\xa6\x07\xf1\x23\xcc\xbb\xed\x36\xf6\x3e\x2a\x52\xf7\xf1\x1d\
+\x6e\xb2\x7e\xb7\x71\xf6\xfe\xa7\xb7\xb2\xf7\x51\x91\x76\x74\x76\
+\x0f\xfe\xcd\x23\x4f\xba\x8f\xfd\x9b\x67\x6b\xd3\x3c\xf6\x3e\x2a\
+\x52\x5b\x5b\x9b\x4b\xea\xd7\xe0\x59\x72\xc7\xec\xf3\xd5\xab\x57\
+\xb3\xf7\x01\x00\x88\x00\x47\xca\x03\x00\x00\x00\x55\xc4\xcc\x7e\
+\xe3\xee\x35\xd9\x06\xf2\x92\x75\x4e\x7f\x22\x60\x7a\x64\xf6\x7e\
+\xb6\xa1\xa4\x24\xf6\x3e\x2a\x96\x99\x7e\xe3\x62\xef\xa3\x0a\x65\
+\xfe\xe6\xc9\x32\x90\x97\xb1\xf7\x51\xd1\x7e\x23\xa9\x46\xd9\x0f\
+\xc8\x63\xef\x03\x00\x10\x11\xde\x15\x07\x00\x00\x00\x54\x99\x97\
+\xba\xef\x0c\x39\x4a\x1e\xd5\xa8\xfb\xa5\x97\x42\x8e\x92\x47\x35\
+\xea\x7e\x67\x67\xf6\xbd\xcf\x51\xf2\xa8\x70\x3b\xbb\xba\x43\x8e\
+\x92\x47\x35\x6a\x6b\x6b\x0b\xc5\x51\xf2\x00\x00\x94\x15\x8e\x94\
+\x07\x00\x00\x00\xaa\x8e\xfd\x6c\xf0\xff\xec\x43\x93\xdc\x24\x9f\
+\xe8\x7a\xf3\x40\x05\xf9\x99\x24\x99\xf4\xa1\xcc\x5c\x66\x3e\xe1\
+\x35\xb7\x81\x4a\xe1\xe9\xbd\x6f\xec\x7d\x54\x9d\x4b\x7f\xf3\x98\
+\x7c\xf0\x83\xbd\x8f\xca\x67\x96\xfe\x7b\x5f\xfa\x50\x92\xa7\x3f\
+\xd8\xfb\x00\x00\x44\x88\x77\xc6\x01\x00\x00\x00\x55\xe8\x60\xf7\
+\x9d\x6e\x92\x67\x8e\x98\xe7\x28\x79\x54\x8b\xee\x83\x07\x5d\x66\
+\x9e\x39\x6a\x98\xa3\xe4\x51\x2d\xba\x8f\xef\x18\xb9\xf7\x39\x4a\
+\x1e\x55\x62\xf0\xda\xf2\xf2\xcc\x11\xf3\x1c\x25\x8f\x6a\x91\xbe\
+\xb6\xbc\x2b\xfd\xf7\x3e\x47\xc9\x03\x00\x10\x2d\x8e\x94\x07\x00\
+\x00\x00\xaa\x90\x99\x9e\x1b\x76\x0a\xfb\xae\x48\xc3\x00\xd3\xc8\
+\xcc\x9e\x1b\x76\x1a\x6f\xf6\x3e\xaa\x86\x99\x86\xed\x7d\x63\xef\
+\xa3\x7a\x98\x3d\x97\x19\xc8\x9b\xd1\xf7\x51\x3d\xcc\xec\x39\xf1\
+\xf7\x3e\x00\x00\x00\x00\x00\x00\x10\xad\x83\xdd\x77\xfa\xc1\xee\
+\x3b\x3d\xea\x1c\xc0\x74\xeb\x3e\x78\xd0\xbb\x0f\x1e\x64\xef\xa3\
+\xea\x74\x1f\xdf\xe1\xdd\xc7\x77\xb0\xf7\x51\x75\x76\x74\x76\xfb\
+\x8e\xce\x6e\xf6\x3e\xaa\x4e\x5b\x5b\x9b\xa7\x8f\x98\x07\x00\x00\
+\x11\x4b\x46\x1d\x00\x00\x00\x00\x40\x34\x4c\xf6\x9a\x4c\x9d\x51\
+\xe7\x00\xa6\x9d\xd9\x6b\x26\xf6\x3e\xaa\xd2\x6b\x66\xc6\xde\x47\
+\x35\x62\xef\xa3\x5a\xbd\x26\xfe\xe6\x01\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x45\xb5\xe4\x5b\x3f\xf2\xa8\x33\xc4\x51\xd4\
+\xdf\xb7\xa8\x5f\x1f\x40\xf9\xfa\xfa\xd7\xbf\x4e\x7f\xc8\x43\xd4\
+\xdf\xb7\xa8\x5f\x1f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\xd5\xca\x32\x9f\xb4\x76\x5c\xcb\x29\x32\x01\xa0\x0a\
+\x6c\x5a\xfe\x4b\x1b\x7e\xbb\xa3\xb5\x95\xfe\x0f\x00\x55\x60\xf9\
+\xa6\x4d\x23\xfb\xff\xfe\x75\xf4\x7f\x00\xa8\x02\xcb\xef\x78\x62\
+\x44\xff\x5f\xb7\xaf\x83\xfe\x0f\x00\x55\xe0\x89\x35\xcb\x47\xf4\
+\xff\x96\x96\x16\xfa\x3f\x00\x54\x81\xcd\x9b\x37\xdb\xe4\x8f\x9a\
+\x9a\x4e\xdf\xb0\xd0\x14\x2c\x77\xd9\xf5\x26\x2d\x92\xfc\x4a\x97\
+\x16\x98\xd4\x20\x49\x2e\xf5\x98\x74\x52\xd2\x7b\x2e\x7b\xc3\xe4\
+\x87\x5d\x61\x47\x93\x3d\xfe\x7e\xb1\x32\x14\x83\x77\x76\x2e\x94\
+\xd9\x72\xb9\x5f\x2f\xb3\x45\x92\xae\x94\xfb\x02\x99\x35\x0c\x3e\
+\xc0\x7b\x64\x76\x52\xd2\x7b\x72\x7f\x43\x66\x87\xe5\xde\x61\x4d\
+\x4d\x45\xad\x23\x29\x0d\x0e\xe4\x67\xcf\x9e\xad\x39\x73\xe6\x48\
+\x92\xc2\x30\x2c\xe6\x6b\x00\x00\xca\x40\x10\x04\xe9\xcf\x7e\x39\
+\x74\x5f\x47\x6b\x2b\xfd\x1f\x00\x2a\xdc\xa5\xfe\x7f\x49\xc7\xfe\
+\x75\xf4\x7f\x00\xa8\x70\xd9\xfa\xff\xba\x7d\x1d\xf4\x7f\x00\xa8\
+\x70\xd9\xfa\x7f\x4b\x4b\x8b\xcf\x9a\x35\x4b\x33\x67\xce\x94\x44\
+\xff\x07\x80\x4a\x63\x66\x32\x2b\xce\x2c\xfe\x55\xbf\xaf\x71\x86\
+\x6a\xef\x92\x74\xb7\xa4\xa5\x92\x92\x97\x56\x36\x0d\x7f\x15\x93\
+\x1a\x35\xf8\xb1\xc8\xa4\xdb\x07\xbf\x9e\x18\xe8\xf2\xaf\x1d\x91\
+\xf4\xf4\x45\xf5\x3d\xb3\xcc\xf6\x7c\x50\x94\x60\x39\xf2\x57\x5f\
+\x6d\xd4\x8c\x19\x23\xea\xd0\xf0\xef\xd1\xc8\xcf\x87\xea\x90\xd9\
+\xed\xe9\xfb\x06\xbc\xab\xeb\x88\xa4\xa7\x75\xf1\xe2\x33\xb6\x6c\
+\x59\xc1\x75\x24\x33\x03\xf9\xc6\xc6\xc6\x42\xd7\x02\x00\xc4\x48\
+\x66\x20\x4f\xff\x07\x80\xea\x92\x19\xc8\xd3\xff\x01\xa0\xba\x64\
+\x06\xf2\xf4\x7f\x00\xa8\x2e\x99\x81\x7c\x7d\x7d\x7d\xd4\x51\x00\
+\x00\x65\xac\xd3\x37\x2c\x94\x12\x5b\x24\xad\x97\x54\xc8\x2f\x8d\
+\xa4\xa4\x65\x92\x96\xd5\xaa\x76\x7b\xa7\x7f\x6d\xb7\x94\xda\x39\
+\x5d\x47\xcf\x7b\x67\xe7\x42\x49\x45\xad\x43\xb5\xb5\xdb\xbd\xb3\
+\x73\xb7\xa4\x9d\x85\x1c\x3d\x1f\x48\xd2\xec\xd9\xb3\x0b\xc8\x04\
+\x00\x88\x2b\xfa\x3f\x00\x54\x27\xfa\x3f\x00\x54\x27\xfa\x3f\x00\
+\x54\xa7\xba\xba\xba\xa8\x23\x00\x00\xca\x54\xa7\x6f\xa8\xe9\xf2\
+\xaf\x6d\x35\x05\x6f\x99\xf4\x4d\x2b\x6c\x90\x3d\x82\x49\xf5\x83\
+\x6b\x06\x6f\x75\xf9\xd7\xb6\x76\xfa\x86\x9a\x62\xad\x3d\x9a\x77\
+\x76\xd6\x78\x57\xd7\x56\x99\xbd\x25\xb3\x6f\xca\xac\x78\xef\x46\
+\x33\xab\x4f\xaf\xf9\x96\x77\x75\x6d\xf5\xce\xce\xbc\xea\x08\x24\
+\x4e\x57\x03\x00\xd5\x8a\xfe\x0f\x00\xd5\x89\xfe\x0f\x00\xd5\x89\
+\xfe\x0f\x00\xd5\xc9\x9d\xcb\xc9\x03\x00\xc6\x7a\xdd\x37\x5e\x6d\
+\x4a\xbc\x22\xf9\x23\x52\xfa\xfa\xea\x25\x61\x0d\x92\x3f\x62\x4a\
+\xbc\xf2\xba\x6f\xbc\xba\xd8\xab\xfb\xeb\xaf\x5f\x2d\xb3\x57\x24\
+\x3d\xa2\xf4\xf5\xee\x4b\xa4\x41\xd2\x23\x32\x7b\xc5\x5f\x7f\x3d\
+\xe7\x3a\x92\xd2\xd8\x7f\x94\xb9\xbb\xfa\xfa\xfa\xf8\x65\x0d\x00\
+\x15\x24\xdb\x35\xc5\xe8\xff\x00\x50\xf9\xe8\xff\x00\x50\x9d\xe8\
+\xff\x00\x50\x9d\xa6\xda\xff\xfb\xfb\xfb\xe9\xff\x00\x50\x21\xf2\
+\xb9\xa6\x7c\x97\xdf\xbf\x32\x94\xef\x93\xd4\x20\x15\xe7\x7a\xf4\
+\x13\x33\x93\xb4\x24\x54\x70\xb4\xcb\xef\x5f\xb3\xd8\x7e\xf4\x62\
+\x31\x56\xf5\xae\xae\x95\x0a\xc3\x74\x1d\xd3\xc2\x24\x2d\x51\x18\
+\x1e\xf5\xae\xae\x35\xb6\x78\xf1\x94\xeb\x48\x66\xbb\x33\x95\x4a\
+\xe9\xc3\x0f\x3f\x54\x7f\x7f\x7f\xd1\x12\x02\x00\xca\x1f\xfd\x1f\
+\x00\xaa\x13\xfd\x1f\x00\xaa\x13\xfd\x1f\x00\xaa\x53\x18\x86\xea\
+\xed\xed\xd5\xc0\xc0\x40\xd4\x51\x00\x00\x11\xe8\xf2\x3f\xff\xaa\
+\xe4\x3f\x94\x54\xb2\xd3\xc9\x4f\xa0\x41\xf2\xe7\xba\xfc\xcf\xbf\
+\xbe\xd8\xfe\xee\xc7\x85\x2c\xe4\x5d\x5d\x5f\x95\x14\x61\x1d\x7a\
+\xce\xbb\xba\xbe\x6e\x8b\x17\x4f\xa9\x8e\xac\x43\xf9\x8c\x4d\xcb\
+\x7f\x39\x1d\x6f\x8d\x00\x00\x94\x99\xe5\x9b\x36\xd1\xff\x01\xa0\
+\x0a\x2d\xbf\xe3\x09\xfa\x3f\x00\x54\xa1\x27\xd6\x2c\xa7\xff\x03\
+\x40\x15\xda\xbc\x79\x33\xfd\x1f\x00\xaa\x4c\x97\x7f\x6d\x83\xcb\
+\x7f\x64\x52\x22\xc2\x18\x35\x2e\x3d\xd6\xe5\x5f\xb3\xc5\xf6\xd8\
+\xe3\xf9\x2c\xe0\x5d\x5d\x1b\xe4\xfe\x23\x99\x45\x5a\x87\xdc\x1f\
+\xf3\xae\x2e\xb3\xc5\x8b\x27\xad\x63\xec\xb9\x6c\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x15\xe3\xa8\x7f\x6d\x95\xa4\x47\x4d\
+\x91\x0e\xb2\x25\x49\xe9\x0c\x8f\xa6\x33\xe5\xc4\x8f\x1e\x5d\x25\
+\xe9\xd1\x88\x07\xf2\x83\x06\x33\x3c\x9a\xce\x34\x21\x86\xf2\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x50\xa1\x5e\xf7\x8d\x57\x9b\
+\xb4\x4f\xd1\x9c\xea\x7d\x3c\x35\x26\xed\x3b\xec\x5f\xfd\xcc\x54\
+\x9f\xe0\xaf\xbf\x7e\xb5\xcc\xca\xae\x0e\x99\xed\xf3\xc3\x87\x27\
+\xac\x83\xa1\x3c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x54\xa0\
+\x4e\xdf\x50\x13\x2a\xf8\x89\x49\xf5\x51\x67\x19\xcd\xa4\xfa\x1a\
+\x25\x9f\xea\xf4\x0d\x93\x0e\xd9\xbd\xb3\xb3\x46\x61\xf8\x13\x99\
+\x95\x5d\x1d\x32\xab\x57\x4d\xcd\x53\xde\xd9\x39\x6e\x1d\x0c\xe5\
+\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa0\x02\x99\x12\xdf\x90\
+\xbc\x29\xea\x1c\xe3\x71\x79\xd3\x60\xc6\x49\x98\x7d\x43\x52\xd9\
+\xd6\x21\xf7\xa6\x74\xc6\xac\x18\xca\x03\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x40\x85\xe9\xf4\x0d\x0b\x25\xff\x8e\x64\x16\x75\x96\
+\xf1\x99\x49\xfe\x9d\xc1\xac\xd9\x79\x67\xe7\x42\x49\xdf\x91\x54\
+\xc6\x75\xc8\x24\x7d\x27\x9d\x75\x0c\x86\xf2\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x50\x71\x12\x5b\x24\x6b\x88\x3a\xc5\xe4\xac\
+\x61\x30\xeb\xb8\xb6\x48\x8a\x41\x1d\x6a\xd0\x60\xd6\x31\x18\xca\
+\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x40\x05\xf9\x37\xbf\xaf\
+\xd1\xa4\xf5\x51\xe7\xc8\xc1\xfa\x57\xfd\xbe\xc6\xd1\x77\xfa\xbf\
+\xfd\x5b\xa3\xcc\x62\x55\x87\xbf\xfa\xea\x98\x3a\x18\xca\x03\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x40\x05\xb9\xa8\x9a\xbb\x25\xd5\
+\x47\x9d\x63\xaa\x4c\xaa\x9f\xa1\xda\xbb\xc6\x7c\xe1\xe2\xc5\x58\
+\xd5\x21\xb3\x7a\xcd\x98\x31\xa6\x0e\x86\xf2\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x50\x51\x6c\xec\x80\xbb\xfc\xdd\x9d\xe5\xbe\
+\x8a\xa8\x83\xa1\x3c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x54\
+\x88\x23\xbe\x76\x81\xa4\xa5\x51\xe7\xc8\xc3\xd2\x23\x7e\xff\x82\
+\xcc\x0d\x3f\x72\x24\xb6\x75\xa4\xb3\x0f\x61\x28\x0f\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x15\xa2\x46\x33\x97\x4b\x4a\x46\x9d\
+\x23\x0f\xc9\x1a\xf9\xf2\xa1\x5b\x35\x35\xb1\xad\x23\x9d\x7d\xd8\
+\x1d\x79\x68\xed\xb8\xd6\xf3\x4d\xb0\x69\xf9\x2f\x2d\xdf\xe7\x02\
+\x00\xa2\xd5\xd1\xda\x9a\x77\xff\x5f\xbe\x69\x13\xfd\x1f\x00\x62\
+\xaa\x63\xff\xba\xfc\xfb\xff\x1d\x4f\xd0\xff\x01\x20\xa6\xd6\xed\
+\xeb\xc8\xbb\xff\x3f\xb1\x66\x39\xfd\x1f\x00\x62\xaa\xa5\xa5\x25\
+\xef\xfe\xbf\x79\xf3\x66\xfa\x3f\x00\x94\x81\x94\x74\x43\x5c\x1b\
+\x72\x4a\xba\x41\xd2\xb3\x83\x37\x52\x37\xc8\x62\x5a\x49\x2a\x75\
+\xa9\x0e\xe5\x31\x94\x6f\xed\xb8\xd6\xe7\xcc\x99\xa3\xd9\xb3\x67\
+\x4b\x92\xc2\x30\x9c\xf4\x39\x41\x30\x78\x40\xfe\xd9\xb3\x67\xd5\
+\xda\x71\xad\x4f\x36\x98\x2f\xf5\xd0\x3f\xee\xeb\x03\x40\x14\x3a\
+\x5a\x5b\x0b\xea\xff\x1d\xad\xad\x3e\xd9\x60\xbe\xd4\x43\xff\xb8\
+\xaf\x0f\x00\x51\xe8\xd8\xbf\xae\xb0\xfe\xbf\x7f\x9d\x4f\x36\x98\
+\x2f\xf5\xd0\x3f\xee\xeb\x03\x40\x14\xd6\xed\xeb\x28\xa8\xff\xaf\
+\xdb\xd7\xe1\x93\x0d\xe6\x4b\x3d\xf4\x8f\xfb\xfa\x00\x10\x85\x96\
+\x96\x16\x9f\x35\x6b\x96\x66\xce\x9c\x29\x29\xb7\xfe\x7f\xe1\xc2\
+\x05\xb5\xb4\xb4\xf8\x64\x83\xf9\x52\x0f\xfd\xe3\xbe\x3e\x00\x14\
+\x83\x49\x8b\xa2\xce\x90\xaf\x11\xd9\xcd\x62\x5b\xc7\xe8\xec\xd6\
+\xda\x71\xad\x37\x36\x36\x0e\xfd\x23\x4b\x92\x06\x06\x06\xd4\xdd\
+\xdd\xad\xfb\x6f\x78\x6d\xc4\x2f\x88\xcc\x40\x7e\xee\xdc\xb9\x79\
+\xbf\xfe\x07\x1f\x7c\xa0\x73\xe7\xce\x8d\x3b\x7c\x6e\xed\xb8\xd6\
+\x67\xcf\x9e\xad\xd9\xb3\x67\x2b\x0c\xc3\x29\xfd\xd2\x4f\x24\x12\
+\x92\xa4\x73\xe7\xce\xe9\xfc\xf9\xf3\x13\x0e\xb6\xf3\x59\x3f\x08\
+\x02\x05\x41\xa0\x73\xe7\xce\x4d\x98\x7d\x3a\xf2\x03\x40\xb1\x74\
+\xb4\xb6\x8e\xdb\xff\x6f\xb8\xff\x7e\x1b\xfd\xd8\x62\xf5\xff\xf1\
+\x86\xcf\x1d\xad\xad\x05\xf7\xcf\x89\x06\xdb\xf9\xac\x3f\xba\xff\
+\x17\x7b\xfd\x5c\xf2\x03\x40\xb1\x74\xec\x5f\x37\x7e\xff\xbf\x7d\
+\x97\x8d\x7e\x6c\xd1\xfa\xff\x38\xc3\xe7\x8e\xfd\xeb\x0a\xef\x9f\
+\x13\x0c\xb6\xf3\x59\x7f\x4c\xff\x2f\xf2\xfa\xb9\xe4\x07\x80\x62\
+\x59\xb7\xaf\x63\xdc\xfe\xbf\xeb\x4f\x47\x1e\x44\x93\x19\xc8\x17\
+\xa3\xff\x8f\x37\x7c\x5e\xb7\xaf\xa3\xe0\xfe\x39\xd1\x60\x3b\x9f\
+\xf5\x47\xf7\xff\x62\xaf\x9f\x4b\x7e\x00\x28\x96\x96\x96\x16\x6f\
+\x68\x68\x18\x1a\xb2\x4b\x52\x2a\x95\xd2\x87\x1f\x7e\xa8\xbf\xf8\
+\x8b\xbf\xb0\xd1\x8f\x9d\x35\x6b\x96\xea\xeb\xeb\xf3\x7e\xbd\xde\
+\xde\x5e\x9d\x3f\x7f\x7e\xdc\xe1\x73\xe6\x35\xea\xea\xea\xe4\xee\
+\x53\xee\xcf\x66\xa6\x0b\x17\x2e\xe8\xc2\x85\x0b\x13\x0e\xb6\x0b\
+\x59\xff\xe3\x8f\x3f\x9e\x30\xfb\x74\xe4\x07\x80\x62\xe9\xf2\x3f\
+\x7f\x43\x8a\xeb\x40\xdb\xdf\x5c\x6c\x7f\xf7\x59\x49\xf2\xae\xae\
+\x37\x14\xdf\x37\x18\xbc\x69\x8b\x17\x7f\x36\x73\x23\xe7\x23\xe5\
+\x87\xff\xe3\x2d\x1f\xb3\x67\xcf\xd6\xb9\x73\xe7\xb2\x7e\x2d\x33\
+\xd0\x6e\x6c\x6c\xcc\x6b\xed\xba\xba\xba\xa1\x75\xb2\x0d\xb6\x0b\
+\x5d\x7f\xc6\x8c\x19\x25\x5d\x7f\xb2\xfc\x00\x10\xa5\x52\xf6\xff\
+\xcc\x40\xbb\xd0\xfe\x39\xde\xd1\xf8\x85\xae\x9f\xe9\xff\xa5\x5a\
+\x7f\xb2\xfc\x00\x10\xa5\x92\xf6\xff\xf4\x40\xbb\xe0\xfe\x39\xce\
+\xd1\xf8\x85\xae\x3f\xd4\xff\x4b\xb4\xfe\x64\xf9\x01\x20\x4a\xa5\
+\xec\xff\x99\x81\x76\xa1\xfd\x73\xbc\xa3\xf1\x0b\x5d\x3f\xd3\xff\
+\x4b\xb5\xfe\x64\xf9\x01\x20\x4a\xc3\x87\xf7\xf9\xa8\xab\xab\xd3\
+\xf9\xf3\xe7\xb3\x7e\xad\xd0\xa1\x7f\x6d\x6d\xed\xd0\x3a\xd9\x06\
+\xdb\x71\x5f\x1f\x00\x8a\xc9\xa5\x05\x71\x6d\x34\x2e\x2d\xb8\x74\
+\xc3\x17\xc4\xf6\xf4\xf5\xee\x0b\x86\xdf\x0c\xa6\xfb\xf5\x27\x7b\
+\xe7\xd8\x9c\x39\x73\x0a\x5a\x7f\xb2\x7f\x34\x16\xba\xfe\x64\xcf\
+\x2f\x75\x7e\x00\x88\x2b\xfa\xff\xc4\xe8\xff\x00\x2a\x15\xfd\x7f\
+\x62\xf4\x7f\x00\x95\x8a\xfe\x3f\x31\xfa\x3f\x80\x4a\xe5\x3e\xf1\
+\x99\xdd\x0b\x1d\xfa\x4f\xf6\xfc\xb8\xaf\x0f\x00\xc5\x62\x52\x43\
+\xd4\x19\xf2\x65\xb2\x4b\xd9\xcd\x62\x5b\xc7\xe8\xec\x39\x1f\x29\
+\x3f\xfa\x1f\x55\x61\x18\xaa\xaf\xaf\x6f\x9c\xd7\x32\xd5\xd6\xd6\
+\xca\x86\xbd\x83\x61\x2a\xa7\x73\x01\x00\x94\x1f\xfa\x3f\x00\x54\
+\x27\xfa\x3f\x00\x54\x27\xfa\x3f\x00\x54\xa7\x6c\xfd\xbf\xbf\xbf\
+\x3f\xeb\x63\xcd\x4c\x35\x35\x35\xd3\xda\xff\x27\x1b\xfa\x97\xbb\
+\xb8\xe7\x07\x80\xe9\xe0\x52\x65\x34\xcb\x51\x4d\x3f\xe7\xa1\xfc\
+\x68\x7d\x7d\x7d\x3a\x75\xea\x54\xd6\xaf\xd5\xd4\xd4\x68\xde\xbc\
+\x79\x4a\x26\xa7\xfe\x32\xa3\x7f\x69\xbb\xbb\x52\xa9\x54\xd6\xc7\
+\x9a\xd9\xd0\xf5\xb8\x32\xc6\x7b\x6c\x3e\xeb\x4b\x83\xd7\xfb\xca\
+\xe5\x8f\x8a\x52\xe7\x07\x80\x72\x41\xff\xcf\x7f\x7d\xfa\x3f\x80\
+\x38\xa3\xff\xe7\xbf\x3e\xfd\x1f\x40\x9c\xd1\xff\xf3\x5f\x9f\xfe\
+\x0f\x20\xce\xfa\xfb\xfb\xf5\xe1\x87\x1f\x66\xfd\x5a\x32\x99\xd4\
+\xdc\xb9\x73\xc7\xf4\xb8\x89\x64\xeb\x9f\x13\xf5\xdc\xd1\x6b\xe7\
+\xd3\x9f\x27\x7a\x4e\xe6\x7a\xef\xc3\x1f\x5f\xcc\xf5\x73\xcd\x0f\
+\x00\xc5\xe2\x52\x8f\x49\xf9\x5d\x6f\x29\x72\xde\x7b\xe9\x53\xef\
+\x91\x59\x4c\xeb\x50\xef\xf0\x1b\x05\x0f\xe5\x33\xb2\x5d\x03\xfd\
+\x47\xbf\xf8\x5c\xc1\xef\x64\xe8\xeb\xeb\x2b\xea\x2f\xfd\x5c\xd6\
+\x97\xa4\xb9\x73\xe7\x0e\x5d\x4b\xac\xd8\xeb\x17\x23\x3f\x00\x44\
+\x2d\xdb\x35\xd0\x7f\xf1\xa3\x1f\xd1\xff\xe9\xff\x00\x2a\x5c\xb6\
+\x6b\xa0\xff\xe2\x7f\x6d\xa4\xff\xd3\xff\x01\x54\xb8\x6c\xd7\x40\
+\xdf\xf8\x0f\xbf\xa0\xff\xd3\xff\x01\x54\xb8\x6c\xd7\x40\xff\xdb\
+\xbf\xfd\xdb\x82\xfb\x7f\x7f\x7f\xbf\xce\x9c\x39\x93\xf5\x6b\x89\
+\x44\x42\x97\x5d\x76\x59\x41\xfd\x73\xa2\xf5\x25\xe9\xb2\xcb\x2e\
+\x1b\xba\xd6\xbb\x94\xfb\x91\xec\xa5\xce\x0f\x00\xf9\x32\xd9\x49\
+\xc5\x74\x28\x6f\xd2\xc9\x4b\x37\xe2\x5b\x47\x3a\xfb\x90\xa2\x0d\
+\xe5\x4b\xc5\xdd\xd5\xdf\xdf\x3f\xee\xd0\xbf\xd0\xd3\xbd\x4c\xb4\
+\x7e\x6b\xc7\xb5\x25\x5d\xbf\x18\xf9\x01\xa0\x52\x65\xfa\xe7\x78\
+\x43\xff\x62\xf5\xe7\x6c\xeb\x77\xb4\xb6\x96\x74\xfd\x62\xe4\x07\
+\x80\x4a\x35\xd4\x3f\xc7\x19\xfa\x17\xad\x3f\x67\x59\xbf\x63\xff\
+\xba\x92\xae\x5f\x8c\xfc\x00\x50\xa9\x32\xfd\x73\xbc\xa1\x7f\xb1\
+\xfa\x73\xb6\xf5\xd7\xed\xeb\x28\xe9\xfa\xc5\xc8\x0f\x00\x95\x2a\
+\xd3\x3f\x4b\x35\xf4\x9f\x68\xfd\x96\x96\x96\xa2\xf5\xff\x52\xe5\
+\x07\x80\x02\xfc\xbb\xa4\x45\x51\x87\xc8\x8f\xfd\xfb\xb0\x1b\x31\
+\xae\x43\xc3\xeb\x50\x10\x55\x0a\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x40\x71\xb9\xf4\x66\xd4\x19\xf2\x35\x22\xbb\x7b\x6c\xeb\
+\x18\x9d\x9d\xa1\x3c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x54\
+\x88\x84\xf4\x8b\xa8\x33\xe4\xcb\xe4\x87\x87\x6e\x24\x12\xb1\xad\
+\x43\x66\x87\x87\xdf\x2c\xe9\x50\xde\xdd\x73\xbe\x06\x0b\x00\x20\
+\xfe\xe8\xff\x00\x50\x9d\xe8\xff\x00\x50\x9d\xe8\xff\x00\x50\x9d\
+\xe8\xff\x00\x50\xbe\xfa\x65\x1d\x92\x06\xa2\xce\x91\x87\x81\x94\
+\x82\x43\x43\xb7\xfa\xfb\x63\x5b\x87\x52\xa9\x43\xc3\xef\x28\xe9\
+\x50\x3e\x95\x4a\x8d\xf9\xa5\x1c\x04\x1c\x9c\x0f\x00\x95\x8e\xfe\
+\x0f\x00\xd5\x89\xfe\x0f\x00\xd5\x89\xfe\x0f\x00\xd5\x29\x0c\x43\
+\xfa\x3f\x00\x94\xa9\xa5\xf6\xa3\x93\x92\x8e\x44\x9d\x23\x77\x7e\
+\x34\x9d\x5d\x92\x64\x4b\x97\xc6\xb4\x0e\x1d\x4d\x67\x1f\x52\xf2\
+\x23\xe5\xc3\x30\x1c\x71\x9f\x99\x95\xf2\x25\x01\x00\x65\x80\xfe\
+\x0f\x00\xd5\x89\xfe\x0f\x00\xd5\x89\xfe\x0f\x00\xd5\x89\x23\xe5\
+\x01\xa0\xdc\xf9\x33\x51\x27\xc8\xc3\xd3\x59\xee\xab\x88\x3a\x78\
+\xdb\x1a\x00\x00\x00\x00\x00\x00\x00\x00\xc8\x19\x43\x79\x00\x28\
+\x5f\x33\xd4\xff\xb4\xa4\xde\xa8\x73\x4c\x95\x4b\xbd\x17\x07\x33\
+\x8f\x34\x63\x46\xac\xea\x90\x7b\xaf\x2e\x5e\x64\x28\x0f\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x95\xec\x0f\x6c\xcf\x07\x2e\xed\
+\x8e\x3a\x47\x0e\x76\x2f\xb3\x3d\x1f\x8c\xbe\xd3\xfe\xe0\x0f\x3e\
+\x90\x7b\xac\xea\xb0\x65\xcb\xc6\xd4\xc1\x50\x1e\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x2a\x4e\x6a\xa7\xe4\x3d\x51\xa7\x98\x9c\
+\xf7\x0c\x66\x1d\xd7\x4e\x49\x31\xa8\x43\x3d\x1a\xcc\x3a\x06\x43\
+\x79\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa8\x30\x4d\xf6\xf8\
+\xfb\x92\x7d\x57\x2a\xe7\xeb\x8d\xb8\x87\xd2\xf6\xc1\xac\xd9\x59\
+\x53\xd3\xfb\x92\xbe\x2b\xa9\x8c\xeb\x90\x2b\x0c\xb7\xa7\xb3\x8e\
+\xc1\x50\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x2a\x90\x2b\
+\xf5\x7d\xc9\x3a\xa3\xce\x31\x81\x2e\x53\xd8\x32\xe9\xa3\xdc\xbf\
+\x2f\xa9\xac\xeb\x90\xd9\xb8\x75\x30\x94\x07\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x80\x0a\xd4\x64\x8f\xf7\x07\x0a\xef\x71\xa9\x37\
+\xea\x2c\xa3\xb9\xd4\x3b\xa0\xd4\x3d\x4d\xf6\x78\xff\x64\x8f\xb5\
+\xa6\xa6\x7e\x05\xc1\x3d\x72\x2f\xbb\x3a\xe4\xde\xab\x81\x81\x7b\
+\xac\xa9\x69\xdc\x3a\x18\xca\x03\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x40\x85\xba\xce\x76\xbd\xed\xd2\x1a\x49\x93\x0e\xbf\xa7\x51\
+\x7f\x20\xad\xb9\xde\x7e\xfc\x7f\xa6\xfa\x04\xbb\xee\xba\xb7\xe5\
+\x5e\x76\x75\x28\x08\xd6\xd8\xf5\xd7\x4f\x58\x07\x43\x79\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\xa8\x60\x4b\xec\xb1\x17\x24\x3d\
+\xe0\xf2\x54\xd4\x59\xd2\x19\x1e\xf8\xdc\x60\xa6\x9c\xd8\x92\x25\
+\x2f\x48\x7a\x40\x1e\x7d\x1d\xe9\x0c\x0f\xd8\xe7\x3e\x37\x69\x1d\
+\x0c\xe5\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa0\xc2\x2d\xb6\
+\xc7\x1e\x37\xd9\xfd\x8a\xf6\x48\xf3\x7e\x93\xdd\xbf\xd8\x1e\x7b\
+\x3c\xdf\x05\x6c\xf1\xe2\xc7\x65\xd1\xd7\x21\xb3\xfb\x6d\xf1\xe2\
+\x29\xd5\xc1\x50\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaa\
+\xc0\xe0\x60\x5e\x7f\x22\xa9\x27\x82\x97\xef\x31\xe9\x4f\x0a\x19\
+\xc8\x67\xa4\x07\xf3\x91\xd5\x21\xb3\x3f\x99\xea\x40\x5e\x62\x28\
+\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x55\xe3\x73\xf6\xd8\
+\x0b\x81\xc2\x25\x92\x8e\x4a\xee\xa5\x7f\x45\x77\x49\x47\x03\x85\
+\x4b\xf2\x39\x65\xfd\x78\xec\x73\x9f\x7b\x41\x41\x90\xae\x43\xd3\
+\x50\x87\x5c\xd2\x51\x05\xc1\x92\xa9\x9c\xb2\x7e\x38\x86\xf2\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x50\x45\xae\xb3\x5d\x6f\xbb\
+\x52\x37\x4a\xf6\x90\xe4\xa5\x3c\xda\xbc\x47\xb2\x87\x5c\xa9\x1b\
+\xaf\xb3\x5d\x6f\x17\x7b\x71\xbb\xee\xba\xb7\xe5\x7e\xa3\xa4\x87\
+\x54\xda\xa3\xe6\x7b\x24\x3d\x24\xf7\x1b\xed\xba\xeb\x72\xae\x23\
+\x59\x82\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x32\xd6\
+\x64\x8f\xf7\x4b\xda\xd1\xe9\x1b\x9e\x92\x12\x5b\x24\xad\x37\xa9\
+\xbe\x18\x6b\xbb\xd4\x2b\x69\xb7\x94\xda\xd9\x64\x8f\xbf\x5f\x8c\
+\x35\xc7\x63\x4d\x4d\xfd\x92\x76\x78\x67\xe7\x53\x92\xb6\x48\x5a\
+\x2f\xb3\xa2\xd4\x21\xf7\x74\x1d\xda\x69\x4d\x4d\x79\xd7\xc1\x50\
+\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x8c\x61\x66\x51\x47\x00\x00\
+\x4c\x83\xf4\xd0\xfc\xc1\x57\xfd\xbe\xef\xce\x50\xed\x5d\x92\xee\
+\x96\xb4\x54\xb9\xcf\x92\x07\x24\x1d\x91\xf4\x74\x9f\xfa\x9e\x59\
+\x66\x7b\x3e\x28\x72\xd4\x09\xa5\x87\xe6\x0f\xfa\xab\xaf\x7e\x57\
+\x33\x66\x14\xa5\x0e\xf5\xf5\x3d\x63\xcb\x96\x15\x5c\x47\xce\x43\
+\x79\x1f\x75\x59\x81\x20\x08\xf8\xc5\x0c\x00\x55\x80\xfe\x0f\x00\
+\xd5\x89\xfe\x0f\x00\xd5\x89\xfe\x0f\x00\x90\x06\x87\xf2\xf4\x7f\
+\x00\xa8\x1e\xe9\x21\xfa\x0f\x25\xfd\xb0\xd3\x37\x2c\x34\x05\xcb\
+\x5d\x76\xbd\x49\x8b\x24\x5d\xe9\xf2\x05\x26\x6b\x90\xe4\x2e\xef\
+\x35\xd9\x49\x49\xef\xb9\xf4\x86\xc9\x0f\xbb\xc2\x8e\x52\x1f\x15\
+\x3f\x15\xe9\x21\xfa\x0f\x25\xfd\xd0\x3b\x3b\x17\xca\x6c\xb9\xdc\
+\xaf\x97\xd9\x22\x49\x57\xca\x7d\x81\x6c\xb0\x0e\xb9\xf7\xca\x06\
+\xeb\x90\xfb\x1b\x32\x3b\x2c\xf7\x8e\x42\x8e\x8a\xcf\x26\xe7\xa1\
+\x7c\x18\x86\x23\x6e\x9b\x99\x12\x89\x44\xd1\x02\x01\x00\xca\x13\
+\xfd\x1f\x00\xaa\x13\xfd\x1f\x00\xaa\x13\xfd\x1f\x00\xaa\x53\xb6\
+\xfe\x1f\x04\x41\x44\x69\x00\x00\x51\x4a\x0f\xd7\xff\x29\xfd\x11\
+\x5b\xe9\xe1\x7a\xe4\x75\x14\xfc\xdb\x94\x77\xca\x01\x40\x75\xa2\
+\xff\x03\x40\x75\xa2\xff\x03\x40\x75\xa2\xff\x03\x40\x75\xa2\xff\
+\x03\x00\x50\x1c\xbc\xc5\x0d\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x80\x12\x61\x28\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x40\x89\x30\x94\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa0\
+\x44\x18\xca\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x50\x22\
+\x0c\xe5\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x11\x86\
+\xf2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x94\x08\x43\x79\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x4a\x84\xa1\x3c\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x25\xc2\x50\x1e\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x80\x12\x61\x28\x0f\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x40\x89\x24\xa3\x7a\xe1\xd6\x8e\x6b\
+\x9d\xf5\xa3\x5b\x1f\x40\xf5\xda\xb4\xfc\x97\x16\xe5\xeb\x77\xb4\
+\xb6\x96\xb4\xbf\xb1\x3e\x00\x64\xb7\x7c\xd3\xa6\x68\xfb\xff\xfe\
+\x75\xa5\xed\x9f\xac\x0f\x00\x59\x2d\xbf\xe3\x89\x48\xfb\xff\xba\
+\x7d\x1d\x25\xed\x6f\xfd\xd4\x13\xb2\x00\x00\x12\xe7\x49\x44\x41\
+\x54\xac\x0f\x00\xd9\x3d\xb1\x66\x79\xa4\xfd\xbf\xa5\xa5\xa5\xa4\
+\xfd\x8d\xf5\x01\x20\xbb\xcd\x9b\x37\x47\xda\xff\x31\xbe\xac\x43\
+\x79\x33\x53\x32\x99\xd4\x0f\xff\xf5\x3a\x4f\xa5\x52\x72\x2f\xde\
+\xef\x87\xda\xda\x5a\xcd\x9f\x3f\x7f\xc2\xaf\x17\xa2\xae\xae\xae\
+\xa4\xeb\x47\x9d\x1f\x00\x0a\x91\x4a\xa5\x26\xfc\x7a\xa6\xff\xff\
+\xeb\x0f\x7f\x48\xff\xcf\xf2\x7c\xfa\x3f\x80\xb8\x9a\x72\xff\x3f\
+\xb0\x81\xfe\x9f\xe5\xf9\xf4\x7f\x00\x71\x35\xd5\xfe\xbf\xe1\x99\
+\x7f\xa5\xff\x67\x79\x3e\xfd\x1f\x40\x5c\x4d\xd6\xff\x25\x29\x99\
+\x4c\xea\x07\x3f\xf8\x81\x87\x61\x58\xd4\xfe\x5f\x53\x53\xa3\xb9\
+\x73\xe7\x4e\xf8\xf5\x42\xd4\xd6\xd6\x96\x74\xfd\xa8\xf3\x03\x40\
+\x21\xc2\x30\x8c\x3a\x02\x26\x90\x75\x28\x9f\x48\x24\x34\x77\xee\
+\x5c\x65\x7e\x21\x0f\xff\x21\xe6\xfa\x4b\x27\x08\x82\x31\xb7\xeb\
+\xea\xea\xf2\x7e\xfe\x68\x66\x23\xdf\xf0\x91\x48\x24\x94\x48\x24\
+\x8a\xb6\x7e\xb9\xe7\x07\x80\x62\xa2\xff\x8f\xff\xf5\x72\xcb\x0f\
+\x00\xc5\x44\xff\x1f\xff\xeb\xe5\x96\x1f\x00\x8a\x89\xfe\x3f\xfe\
+\xd7\xcb\x2d\x3f\x00\x14\x53\x22\x91\xd0\x65\x97\x5d\x26\x77\x1f\
+\xf1\x21\x0d\x0e\xeb\x73\x91\xad\x7f\xce\x98\x31\x23\xef\xe7\x4f\
+\x66\x3a\xfa\x7f\x39\xe5\x07\x00\x54\x8e\xa4\xa4\xac\xbf\x04\xa6\
+\xfa\xcb\x61\xf4\x3f\x2a\xa6\x53\x31\xdf\xc1\x17\x85\xb8\xe7\x07\
+\x10\x7f\xf4\xff\x68\xc4\x3d\x3f\x80\xf8\xa3\xff\x47\x23\xee\xf9\
+\x01\xc4\x1f\xfd\x3f\x1a\x71\xcf\x0f\x20\xfe\xb2\x0d\x8e\xe3\x30\
+\x18\x8e\x7b\xff\x8c\x7b\x7e\x00\x40\x71\xe5\xf6\x36\xae\x2c\x86\
+\xbf\x8b\x2e\x9b\x73\xe7\xce\x15\xb4\xfe\x44\xcf\x4f\xa5\x52\x3a\
+\x7f\xfe\x7c\xc9\xd6\x9f\xca\xd7\x0b\x59\xbf\x18\xf9\x01\x20\x2a\
+\xf4\xff\xfc\xd7\xa7\xff\x03\x88\x33\xfa\x7f\xfe\xeb\xd3\xff\x01\
+\xc4\x19\xfd\x3f\xff\xf5\xe9\xff\x00\xa2\x56\xe8\x1b\xab\x26\xea\
+\xff\x17\x2e\x5c\x28\x68\xed\x89\x9e\x1f\x86\xa1\x2e\x5e\xbc\x58\
+\xb2\xf5\xa7\xf2\xf5\x42\xd6\x2f\x46\x7e\x00\x40\xe5\xb0\xd6\x8e\
+\x6b\x7d\xd6\xac\x59\xba\xfc\xf2\xcb\xf3\x5a\xe0\xcc\x99\x33\xea\
+\xe9\xe9\xd1\x5f\xfe\xe1\xff\xce\xfa\x9b\xbd\xb5\xe3\x5a\x9f\x33\
+\x67\x8e\x66\xcf\x9e\x2d\x69\x6a\xd7\x33\xc8\xbc\x73\xef\xdc\xb9\
+\x73\x3a\x7b\xf6\xac\x36\x2d\xff\xe5\xb8\x7f\x35\xfc\xe0\x5f\xfe\
+\x8b\x5f\x76\xd9\x65\x9a\x39\x73\x66\x49\xd6\x2f\xc7\xfc\x00\x90\
+\xaf\x54\x2a\xa5\x35\x9f\x7d\xd9\x24\xa9\xa3\xb5\xb5\x28\xfd\xff\
+\x0f\xff\xf2\x2f\xb3\xf6\xb8\x8e\xd6\xd6\x82\xfb\xe7\xf2\x4d\x9b\
+\xc6\xed\x9f\xff\xf2\x83\x1f\x14\xdc\xff\x27\x5a\xbf\x1c\xf3\x03\
+\x40\xbe\x52\xa9\x94\x3e\xbb\x66\xcd\x60\xff\xdf\xbf\xae\x38\xfd\
+\xff\xbf\xed\xc9\xde\xff\xf7\xaf\x2b\xbc\x7f\xde\xf1\xc4\xf8\xfd\
+\xf3\x7f\xde\x57\x78\xff\x9f\x60\xfd\x72\xcc\x0f\x00\xf9\x4a\xa5\
+\x52\xfa\xec\xb2\x9d\x26\x49\xeb\xf6\x75\x14\xa5\xff\xef\xf9\xb3\
+\x3f\xcc\xda\xe3\xd6\xed\xeb\x28\xb8\x7f\x3e\xb1\x66\xf9\xb8\xfd\
+\xf3\xbe\xa7\xfe\xa5\xe0\xfe\x3f\xd1\xfa\xe5\x98\x1f\x00\xf2\x95\
+\x4a\xa5\xb4\xf3\xbf\x7d\xd6\x24\xa9\xa5\xa5\xc5\x67\xce\x9c\xa9\
+\x86\x86\x86\xbc\xd6\x3a\x7f\xfe\xbc\xce\x9c\x39\xa3\x6f\x7c\xe3\
+\x1b\x59\x7b\x5c\x4b\x4b\x8b\xcf\x9a\x35\x2b\xaf\xfe\x7c\xe1\xc2\
+\x05\x9d\x3f\x7f\x5e\x9b\x37\x6f\x1e\xb7\x7f\x7e\xff\xfb\xdf\xf7\
+\xd9\xb3\x67\x0f\x9d\x52\xbe\xd8\xeb\x97\x63\x7e\x00\xc8\x57\x18\
+\x86\x5a\xb7\x6e\x5d\x74\xa7\xb8\xc2\x84\x4c\x1a\x1c\x3c\xcf\x9a\
+\x35\x6b\xe8\x1f\x1e\xa9\x54\x6a\xe8\x01\x41\x10\x8c\x79\x27\x9d\
+\x99\xc9\xcc\x74\xfe\xfc\x79\x9d\x3d\x7b\x76\xdc\x81\x7c\x46\x6b\
+\xc7\xb5\x79\x9f\xa7\x65\xa2\x81\x36\xeb\x03\x40\xee\x86\xf7\xa5\
+\xcc\x60\x3e\xdf\xfe\x3f\xde\x40\x7e\xf8\xfa\xf9\xe6\x9c\x68\xa0\
+\xcd\xfa\x00\x90\xbb\xe1\x7d\x29\x33\x98\xcf\xbb\xff\x8f\x33\x90\
+\x1f\xbe\x7e\xde\x39\x27\x18\x68\xb3\x3e\x00\xe4\x6e\x78\x5f\xca\
+\x0c\xe6\xf3\xed\xff\xe3\x0d\xe4\x87\xaf\x9f\x6f\xce\x89\x06\xda\
+\xac\x0f\x00\xb9\x1b\xde\x97\x32\x83\xf9\xcc\xe0\x79\x74\xff\x1f\
+\x2d\xd3\xff\x3f\xfe\xf8\x63\x9d\x3f\x7f\x7e\xdc\x81\xfc\xf0\xf5\
+\xf3\xcd\x39\xd1\x40\x9b\xf5\x01\x20\x77\x53\xe9\x4b\x88\xc6\xd0\
+\x0f\x26\xdf\xc1\xf0\x54\x86\xce\x00\x80\xf2\x95\xef\x60\x78\x2a\
+\x43\x67\x00\x40\xf9\xca\x77\x30\x3c\x95\xa1\x33\x00\xa0\x7c\xe5\
+\x3b\x18\x9e\xca\xd0\x19\x00\x50\xbe\xf2\x1d\x0c\x33\xdc\x01\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x80\x6a\x54\x94\x53\xcf\xf8\xa9\x5d\
+\x0b\x55\x93\x5c\x2e\xd3\xf5\x72\x2d\x92\xdb\x95\x32\x2d\x90\xd4\
+\x90\x7e\x48\x8f\x4c\x27\xe5\x7a\x4f\xe6\x6f\xc8\x75\x58\xfd\x03\
+\x1d\x36\x7f\xe3\xfb\xc5\x78\xfd\x62\xd9\xf5\xa6\x2f\x4c\xd6\x69\
+\xb9\xa4\xeb\x65\x5a\x64\xd2\x95\xd2\xa8\x3a\xa4\x93\x92\xde\x73\
+\xd7\x1b\x92\x0e\x0f\x7c\xac\x8e\x8d\x8b\xac\xac\xea\x38\x70\xe0\
+\xc0\xc2\xda\xda\xda\xe5\x41\x10\x5c\x2f\x69\x91\xc6\xa9\xc3\xdd\
+\xdf\x33\xb3\x37\xc2\x30\x3c\xdc\xd7\xd7\xd7\xb1\x62\xc5\x8a\xb2\
+\xa9\x63\x5b\xdb\x15\x43\xa7\x53\x7a\x78\xf5\x7f\x94\xc5\x29\x92\
+\xca\x31\x53\xdb\xb6\x6d\x43\x99\x56\x3f\xfc\x30\x99\xc6\xd1\xf6\
+\xf7\x5f\xbc\x94\xe9\x2b\xcf\x93\x69\x1c\x5f\x6c\x6d\x1b\xca\xf4\
+\xfc\xa6\xd5\x64\x1a\xc7\xc3\x0f\x3f\x3c\x94\x69\xdb\xb6\x6d\x64\
+\x02\x00\x00\x00\x00\x00\x00\x00\x00\x13\x4a\xe6\xfb\x44\xef\xd9\
+\xdd\x28\xd9\x5d\x0a\xed\x6e\x05\x5a\x2a\x57\x52\x99\x91\xc0\xd8\
+\x71\x40\xa3\x5c\x8d\x92\x16\xc9\xed\x76\x49\x52\x6d\xcd\x80\x7f\
+\xf8\xc4\x11\x05\xfe\xb4\xe4\xcf\x58\xc3\xfa\x0f\xf2\xcd\x52\x88\
+\xdd\xef\x79\xa3\xa5\x74\x97\xb9\xee\x96\xa5\xeb\x18\x5f\x63\xfa\
+\x63\x91\x99\x6e\x97\xa4\x9a\x59\x1a\x78\xe2\xd7\x7e\xc4\x4d\x4f\
+\x7b\x42\xcf\xac\xff\x84\x45\x52\xc7\x81\x03\x07\x1a\x67\xce\x9c\
+\x79\x97\xbb\xdf\x2d\x69\xa9\x26\xfe\xd9\x36\x4a\x6a\x34\xb3\x45\
+\x92\x6e\x0f\x82\x40\x75\x75\x75\x03\xed\xed\xed\x47\xcc\xec\xe9\
+\x0b\x17\x2e\x3c\xb3\x62\xc5\x8a\x48\xea\x18\xee\x9a\x6b\xae\xd1\
+\xb1\x63\xc7\xa2\x8e\x31\x02\x99\xa6\x86\x4c\x53\x43\xa6\xa9\x29\
+\xc7\x4c\x57\x5d\x75\x95\x4e\x9c\x38\x11\x75\x8c\x11\xca\x31\x13\
+\x00\x00\x00\x00\x00\x00\x00\x00\xc8\x63\x28\xef\xa7\x76\x2d\x54\
+\x6d\x72\x8b\x42\x5b\x2f\x53\xbd\x4c\x1a\x1a\xc6\xe7\xb4\x90\x92\
+\x32\x2d\x93\xdb\x32\xb9\x6d\xf7\x9e\x3d\xbb\xd5\x37\xb0\x73\xba\
+\x8e\x9e\xdf\x75\xc2\x17\x26\x43\x6d\xb1\x7e\x0d\xd6\x31\x98\x29\
+\x77\x83\x43\xfc\x65\xe6\x5a\x66\xfd\xda\xbe\xe7\x1d\xdf\x3d\x10\
+\x68\xe7\xc6\xab\xa6\xe7\xe8\xf9\x43\x87\x0e\x2d\x0c\xc3\x70\x8b\
+\xa4\xf5\xee\x5e\x5f\xc0\x52\x49\x49\xcb\xdc\x7d\x59\x5d\x5d\xdd\
+\xf6\xf6\xf6\xf6\xdd\x41\x10\xec\xbc\xe9\xa6\x9b\xca\xe6\xe8\x79\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x9b\x60\xaa\x0f\x74\
+\xdf\x55\xe3\x1f\xed\xd9\xaa\x9a\xe4\x5b\x72\xfb\xe6\xd0\x20\xbb\
+\x18\x4c\xf5\x72\xfb\xa6\x6a\x92\x6f\xf9\x47\x7b\xb6\xba\xef\xaa\
+\x29\xda\xda\xa3\xec\xea\xf4\x9a\x3d\xef\xf8\xd6\xa4\xeb\x2d\x33\
+\x15\xbd\x0e\x33\x7d\x33\xe9\x7a\x6b\xcf\x3b\xbe\x75\x57\xa7\x97\
+\xac\x8e\xce\xce\xce\x9a\xf6\xf6\xf6\xad\xa9\x54\xea\x2d\x49\xdf\
+\x94\x8a\x58\xc7\xe0\x5a\xdf\x4c\xa5\x52\x6f\xb5\xb7\xb7\x6f\xed\
+\xec\xec\x2c\x59\x1d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x50\
+\xc9\xa6\x34\x94\xf7\x9e\xbd\x57\xab\xa7\xe6\x15\xc9\x1e\x91\xac\
+\x61\xf2\x67\xe4\xcb\x1a\x24\x7b\x44\x3d\x35\xaf\x78\xcf\xde\xab\
+\x8b\xbd\xfa\xde\xe3\x7e\x75\x4d\xa3\x5e\x31\xd3\x23\x76\xe9\xfa\
+\xea\x45\x67\x52\x83\x99\x1e\xa9\x69\xd4\x2b\x7b\x8f\x7b\xd1\xeb\
+\x78\xf9\xe5\x97\xaf\x3e\x7b\xf6\xec\x2b\x92\x1e\x31\x2b\xdd\xcf\
+\x23\xbd\xf6\x23\x67\xcf\x9e\x7d\xe5\xe5\x97\x5f\x2e\x7a\x1d\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x50\xe9\x26\x1d\xca\x7b\xef\
+\xde\x95\x72\x3f\x2a\x69\x89\xb2\x5d\x2d\xbe\xf8\x4c\xd2\x12\xb9\
+\x1f\xf5\xde\xbd\x2b\x8b\xb5\xe8\xde\x77\x7d\xa5\x07\x3a\x2a\x9b\
+\xc6\x3a\x4c\x4b\x3c\xd0\xd1\xbd\xef\x7a\xd1\xea\x68\x6f\x6f\x5f\
+\xe9\x11\xfc\x3c\xdc\xfd\x68\x7b\x7b\x7b\xd1\xea\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x80\x6a\x30\xe1\x50\xde\x3f\xda\xf3\x55\
+\xb9\x3f\xa7\x12\x1e\x55\x3e\x81\x06\xb9\x3f\xe7\x1f\xed\xf9\x6a\
+\xa1\x0b\xed\x79\xc7\xbf\xea\xa1\x22\xab\xc3\x43\x3d\xb7\xe7\x1d\
+\x2f\xb8\x8e\xf6\xf6\xf6\xaf\x4a\xd1\xd5\x21\xe9\xb9\x74\x06\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x14\x8c\x3b\x94\xf7\x8f\
+\xf6\x6c\x90\xec\x31\xb9\xa2\xbb\x9e\xb8\xab\x46\xb2\xc7\x06\xb3\
+\xe4\x67\xcf\x3b\xbe\xc1\x4c\x8f\x49\x11\xd6\x21\xd5\x98\xe9\xb1\
+\x3d\xef\x78\xde\x75\xb4\xb7\xb7\x6f\x70\xf7\xc8\xeb\x70\xf7\xc7\
+\xda\xdb\xdb\xf3\xae\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\xaa\x49\xd6\xa1\xbc\x7f\xb8\x67\x95\x64\x8f\x4a\x4a\x4c\x73\x9e\
+\x6c\x12\x92\x3d\x3a\x98\x29\x37\x7b\xde\xf1\x55\x66\x2a\x9b\x3a\
+\xcc\xf4\xe8\x9e\x77\x3c\xe7\x3a\x7e\xf6\xb3\x9f\xad\x92\xf4\xa8\
+\x99\x45\x5e\x47\x3a\xc3\xa3\xe9\x4c\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x80\x09\x8c\x19\xca\x7b\xcf\xde\xab\x25\xdb\xa7\x68\
+\x8f\xc8\x1e\xad\x46\x66\xfb\xfc\xd4\xe3\x9f\x99\xea\x13\xf6\xbe\
+\xe7\x57\x9b\x54\x76\x75\x98\xb4\xef\xf1\xe3\x3e\xe5\x3a\x5e\x7e\
+\xf9\xe5\xab\x83\x20\x28\xbb\x3a\x82\x20\xd8\xf7\xd3\x9f\xfe\x74\
+\xca\x75\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x40\x35\x1a\x31\
+\x94\x77\xdf\x55\x23\xf7\x9f\xc8\x54\x1f\x55\xa0\x09\xd4\xab\x26\
+\xf9\x94\xfb\xae\x49\x87\xd3\xbb\x3a\xbd\xc6\xfb\x55\x9e\x75\x98\
+\xea\x93\x81\x9e\xda\xd5\xe9\x93\xd6\xd1\xd9\xd9\x59\xe3\xee\x3f\
+\x91\xca\xb0\x0e\xa9\x3e\x99\x4c\x3e\xd5\xd9\xd9\x59\x4e\x6f\x16\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\xb2\x32\xf2\x48\xf9\
+\x9e\xda\x6f\x48\x6a\x8a\x26\xca\x94\x34\xa5\x33\x4e\xa8\x76\x9e\
+\xbe\x21\x2b\xef\x3a\x6a\xe7\x69\xd2\x3a\xce\x9e\x3d\x5b\xf6\x3f\
+\x8f\x74\x46\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x40\x16\x43\
+\x43\x79\x3f\xb5\x6b\xa1\x14\x7e\x47\x92\x45\x98\x67\x32\x26\x85\
+\xdf\x19\xcc\x9a\xdd\xae\x13\xbe\x30\x74\x95\x7d\x1d\xa1\xeb\x3b\
+\xbb\x4e\xf8\xb8\x75\x1c\x3a\x74\x68\xa1\xbb\x97\x7d\x1d\xee\xfe\
+\x9d\x43\x87\x0e\x8d\x5b\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x54\xb3\x4b\x47\xca\xd7\x26\xb7\x48\xd6\x10\x61\x96\x29\xb2\
+\x86\xc1\xac\xd9\x25\x43\x6d\x31\xa9\xec\xeb\x30\xa9\x21\x19\x6a\
+\xdc\x3a\xc2\x30\xdc\x62\x56\xfe\x3f\x0f\x33\x6b\x08\xc3\x70\xdc\
+\x3a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa0\x9a\x05\x92\xe4\
+\x3d\xbb\x1b\xe5\xb6\x3e\xea\x30\x53\x16\xda\x7a\xef\xd9\xdd\x38\
+\xfa\xee\xdd\xef\x79\xa3\x99\x62\x53\x87\x49\xeb\x77\xbf\xe7\x63\
+\xea\x78\xf5\xd5\x57\x1b\xa5\xf8\xd4\x21\x69\xfd\x81\x03\x07\xc6\
+\xd4\x51\xa8\x63\xc7\x8e\x15\x7b\xc9\x82\x91\x69\x6a\xc8\x34\x35\
+\x64\x9a\x9a\x72\xcc\x74\xe2\xc4\x89\xa8\x23\x8c\x51\x8e\x99\x00\
+\x00\x00\x00\x00\x00\x00\x00\xc0\xd0\x91\xf2\xc1\xdd\x92\xea\x23\
+\x4d\x92\x0b\x53\xbd\x64\x77\x8d\xbe\x3b\x48\x29\x76\x75\x58\x4a\
+\x63\xea\xb8\x78\xf1\x62\xbc\xea\x90\xea\x67\xce\x9c\x39\xa6\x8e\
+\x7c\x6d\x6b\xbb\xc2\xaf\xb9\xe6\x1a\x65\x3e\xb6\xb5\x5d\xe1\xc5\
+\x5a\xbb\x92\x32\xb5\x6d\xdb\x36\x22\x53\xdb\xb6\x6d\x64\xca\x96\
+\xe9\xef\xbf\x38\x32\xd3\xdf\x7f\x91\x4c\x59\x7c\xb1\xb5\x6d\x44\
+\xa6\x2f\xb6\xb6\x91\x29\x8b\x87\x1f\x7e\xd8\xaf\xba\xea\x2a\x65\
+\x3e\x1e\x7e\xf8\x61\x32\x01\x00\x00\x00\x00\x00\x00\x00\x80\x09\
+\x99\x24\xf9\x87\x4f\xbc\x22\xd3\xb2\xa8\xc3\xe4\xc4\xf5\xaa\xcd\
+\x5d\x77\xe3\xf0\xbb\x9e\xf8\xb5\xbf\x22\xc5\xac\x0e\xe9\xd5\x75\
+\x9f\xb4\x11\x75\xb4\xb7\xb7\xc7\xb2\x8e\xe6\xe6\xe6\xa1\x3a\x0a\
+\x19\x5a\x5f\x73\xcd\x35\x63\xee\x2b\xe4\x48\xd9\x87\x57\xff\x87\
+\x95\x6b\xa6\x42\x86\xd6\xc5\xce\xb4\xfa\xe1\x87\xcb\x37\x53\x01\
+\x43\xeb\xa2\x67\xfa\xca\xf3\x65\x9b\xa9\x90\xa1\x75\xb1\x33\x3d\
+\xbf\x69\x75\xd9\x66\x2a\x64\x68\x7d\xd5\x55\x57\x8d\xb9\xaf\x90\
+\x23\xd4\xb7\x6d\xdb\x56\xb6\x99\x00\x00\x00\x00\x00\x00\x00\x00\
+\x40\x71\x24\xfd\xff\xed\x5d\x20\x0b\x97\xa6\xe7\xf3\xf1\x61\xbe\
+\xd4\xff\xdf\xde\x05\xf6\xdb\xf7\x9e\x94\xa4\xbd\xbf\xf6\x05\xa1\
+\x69\xa9\xc5\xec\xf8\x40\x37\x2d\xdd\xfb\x6b\x5f\x70\xef\x27\xed\
+\xa4\x24\xfd\xfc\xe7\x3f\x5f\x20\x69\x69\xc4\xb1\xf2\xb1\xf4\xe7\
+\x3f\xff\xf9\x82\x2f\x7c\xe1\x0b\x27\x33\x77\x64\x1b\xa8\x4d\x66\
+\xa2\x81\x5b\x31\xd6\x23\x13\x99\xc8\x44\x26\x29\xfb\x20\x7b\x32\
+\x13\x0d\xba\x8b\xb1\x5e\x39\x66\x02\x00\x00\x00\x00\x00\x00\x00\
+\x00\x85\x4b\xaa\x56\xcb\x25\x4b\x46\x1d\x24\x77\x96\xce\xae\x67\
+\x25\x49\x81\x96\x5b\xa8\xd8\xd5\x61\xae\xa4\x82\x4b\x75\x98\xd9\
+\x72\x29\x7e\x75\x48\x4a\xa6\xb3\x3f\x9b\xb9\xa3\xd8\xd7\x81\x2e\
+\xc6\x7a\x64\x9a\xbe\x35\x8a\xbd\x1e\x99\xa6\x6f\x8d\x62\xaf\x57\
+\x8e\x99\x8a\x3d\x7c\x2e\xc6\x7a\xe5\x98\x09\x00\x00\x00\x00\x00\
+\x00\x00\x00\x14\xce\xbc\x67\xcf\x5f\xcb\xed\x9b\x51\x07\xc9\x8b\
+\xf9\xdf\x58\xc3\x7d\x0f\x4a\xd2\x9e\x77\xfc\xaf\xcd\x14\xcb\x3a\
+\xdc\xf5\x37\xf7\x7d\xca\x1e\x94\xa4\xf6\xf6\xf6\xbf\x96\xe2\x59\
+\x87\xa4\xbf\x69\x6e\x6e\x7e\xb0\xd0\x45\x32\xd7\x6f\xcf\x38\x76\
+\xec\xd8\xd0\xe9\xde\xa3\x52\x8e\x99\x32\xd7\x6f\xcf\x38\x76\xec\
+\xd8\xd0\xe9\xde\xa3\x52\x96\x99\xd2\xd7\x6f\xcf\x38\x76\xec\xd8\
+\xd0\xe9\xde\xa3\x52\x8e\x99\x32\xd7\x6f\xcf\x38\x76\xec\xd8\xd0\
+\xe9\xde\xa3\x52\x8e\x99\x32\xd7\x6f\xcf\x38\x71\xe2\x44\xe4\xa7\
+\x7b\x2f\xc7\x4c\x00\x00\x00\x00\x00\x00\x00\x00\xe0\x12\xf3\x8f\
+\xf6\xfc\xb3\x64\x2b\xa2\x0e\x92\x17\xf3\x03\xd6\x70\xdf\x1f\x4b\
+\xd2\x9e\x5f\xfb\x3f\x9b\x14\xcb\x3a\x5c\x3a\x70\xdf\x27\xed\x8f\
+\x25\xa9\xbd\xbd\xfd\x9f\x15\xd3\x3a\x24\x1d\x68\x6e\x6e\xfe\xe3\
+\x62\x2c\x34\xfc\xfa\xef\x51\x0f\xbf\x33\xca\x31\xd3\xf0\xeb\xbf\
+\x47\x3d\xfc\xce\x28\xcb\x4c\xc3\xae\xff\x1e\xf5\xf0\x3b\xa3\x1c\
+\x33\x0d\xbf\xfe\x7b\xd4\xc3\xef\x8c\x72\xcc\x34\xfc\xfa\xef\xe5\
+\x32\xfc\x2e\xc7\x4c\x00\x00\x00\x00\x00\x00\x00\x00\x60\x50\x20\
+\xb3\x2b\xa3\x0e\x91\xb7\xf0\x52\x76\x93\x62\x5b\xc7\xa8\xec\xb1\
+\xad\x43\x45\xce\x9e\xcf\x75\xa3\x4b\x8d\x4c\x53\x43\xa6\xa9\x21\
+\xd3\xd4\x94\x63\xa6\x7c\xae\xd7\x5e\x6a\xe5\x98\x09\x00\x00\x00\
+\x00\x00\x00\x00\x00\x48\x81\x5c\x0b\xa2\x0e\x91\x37\x1b\x91\x3d\
+\xbe\x75\xa8\x22\xeb\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\
+\xaa\x17\x48\x6a\x88\x3a\x44\x01\x1a\xc6\xf9\x3c\x5e\xac\x42\xea\
+\x88\x77\x76\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\xba\x20\
+\xea\x00\x85\x71\x9f\xfc\x31\xe5\xcf\x43\x55\x44\x1d\x52\xc5\xd4\
+\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x11\x48\xea\x89\
+\x3a\x44\xfe\xac\x77\xd8\x8d\xd8\xd6\x61\xa6\x8a\xa8\x43\x1a\x51\
+\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x54\xbd\x40\xa6\x93\
+\x51\x87\xc8\x9b\x8f\xc8\x1e\xdf\x3a\x54\x91\x75\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x40\xd5\x0b\xe4\xfe\xef\x51\x87\xc8\x5b\
+\x70\x29\xbb\x4b\xb1\xad\x63\x54\xf6\xd8\xd6\xa1\x78\x67\x07\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x80\xa2\x0b\x64\x7a\x33\xea\x10\
+\x05\xb8\x94\xdd\x63\x5c\xc7\xc8\xec\xf1\xad\x23\xde\xd9\x01\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\xa0\xe8\x02\x79\xf0\x8b\xa8\x43\
+\xe4\xcd\x75\x38\xf3\x69\x90\x50\x7c\xeb\xd0\xa5\x3a\xa4\xf8\xd6\
+\x11\x86\xe1\xe1\xc9\x1f\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\xd5\x23\x50\x9f\x3a\x24\x1f\x88\x3a\x48\xee\x7c\x40\xc9\xe0\
+\xd0\xd0\xcd\x50\x1d\x6e\x8a\x5d\x1d\x6e\x1a\x08\x4c\x43\x75\xb8\
+\x7b\x87\x14\xbf\x3a\x24\x0d\x98\xd9\xa1\xc9\x1f\x06\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\xd5\x23\xb0\xdf\xbe\xf7\xa4\xdc\x8e\
+\x44\x1d\x24\x0f\x47\x6d\xce\xbd\x27\x33\x37\xee\xfd\xa4\x9d\x34\
+\x57\xfc\xea\x70\x1d\xbd\xf7\x93\x36\x54\xc7\x17\xbe\xf0\x85\x93\
+\x52\x0c\xeb\x90\x8e\xa6\xb3\x03\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\xd2\x82\xf4\xff\x3e\x13\x71\x8e\xdc\x85\xf6\xf4\x98\xfb\
+\x2c\x7e\x75\x98\x6b\x4c\x1d\xee\x1e\xbb\x3a\xdc\x7d\xec\xcf\x03\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaa\xdc\xe0\x50\x5e\xe1\
+\xd3\x92\x7a\x23\x4d\x92\x0b\x57\xaf\x12\xe1\x98\x21\x70\x98\x50\
+\xec\xea\x08\x6b\xc6\x0e\xe5\x67\xcc\x98\x11\xaf\x3a\xa4\xde\x8b\
+\x17\x2f\x32\x94\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x51\
+\x02\x49\xb2\x86\xf5\x1f\xc8\x7c\x77\xd4\x61\xa6\x2c\xf0\xdd\xd6\
+\xb0\xfe\x83\xd1\x77\xaf\xff\x84\x7d\xe0\xae\xd8\xd4\xe1\xd2\xee\
+\xf5\x9f\xb0\x31\x75\x2c\x5b\xb6\xec\x03\x29\x3e\x75\x48\xda\xbd\
+\x62\xc5\x8a\x31\x75\x14\xea\xd8\xb1\x63\xc5\x5e\xb2\x60\x64\x9a\
+\x1a\x32\x4d\x0d\x99\xa6\xa6\x1c\x33\x9d\x38\x71\x22\xea\x08\x63\
+\x94\x63\x26\x00\x00\x00\x00\x00\x00\x00\x00\x20\x59\xe6\x13\x3f\
+\xb5\x6b\xa1\x6a\x92\x6f\x49\xd6\x10\x65\xa0\xc9\x79\x8f\x6a\x06\
+\x7e\xdf\x66\x6f\x7c\x3f\xdb\x57\x77\x9d\xf0\x85\x49\xd7\x5b\x26\
+\x95\x75\x1d\x2e\xf5\x0c\x98\x7e\x7f\xe3\x55\x96\xb5\x8e\x43\x87\
+\x0e\x2d\x4c\xa5\x52\x6f\x99\x95\xf7\xcf\xc3\xdd\x7b\x12\x89\xc4\
+\xef\xdf\x74\xd3\x4d\x59\xeb\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x80\x6a\x16\x64\x3e\xb1\xf9\x1b\xdf\x97\x82\xef\x4a\xf2\x08\
+\xf3\x4c\xc6\x25\xdb\x3e\xde\x40\x5e\x92\x36\x5e\x65\xef\x07\xa6\
+\xb2\xaf\xc3\xa4\xed\xe3\x0d\xe4\x25\xe9\xa6\x9b\x6e\x7a\xdf\xcc\
+\xca\xbe\x0e\x77\xdf\xce\x40\x1e\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\xb2\x0b\x46\xdc\x6a\xe8\xfb\xbe\xa4\xce\x68\xa2\x4c\x85\
+\x77\xa9\xa1\xbf\x65\xb2\x47\xf5\x75\xeb\xfb\xf2\xf2\xad\xc3\x5d\
+\x5d\xfd\xa7\x35\x69\x1d\x73\xe6\xcc\x29\xeb\x9f\x87\xbb\x77\xd5\
+\xd7\xd7\x4f\x5a\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x54\
+\xab\x11\x43\x79\xb3\x8d\xfd\x32\xbb\x47\x52\x6f\x44\x79\x26\xd2\
+\xab\xfe\xd4\x3d\x66\x1b\xfb\x27\x7b\xe0\xc6\x26\xeb\xb7\x1a\xdd\
+\x23\x2f\xc3\x3a\x5c\xbd\x29\xd7\x3d\x1b\x9b\x6c\xd2\x3a\x9a\x9a\
+\x9a\xfa\xad\x8c\x7f\x1e\xa9\x54\xea\x9e\xa6\xa6\xa6\x49\xeb\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x6a\x15\x8c\xbe\xc3\x1a\
+\xee\x7d\x5b\xee\x6b\x24\x95\xd3\xb0\xb5\x5f\xee\x6b\x6c\xfe\x86\
+\xff\x33\xd5\x27\xdc\xfb\x09\x7b\xdb\xa5\xb2\xab\xc3\xa5\x35\x1b\
+\x3e\x6d\x53\xae\xe3\xe6\x9b\x6f\x7e\x3b\x0c\xc3\xb2\xab\xc3\xcc\
+\xd6\xdc\x72\xcb\x2d\x53\xae\x03\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\xaa\xd1\x98\xa1\xbc\x24\xd9\xdc\xfb\x5e\x90\xfc\x01\x49\
+\xa9\x69\xce\x93\x4d\x4a\xf2\x07\x06\x33\xe5\xe6\xbe\x4f\xd9\x0b\
+\xee\x2a\x9b\x3a\xdc\xf5\xc0\x7d\x9f\xb2\x9c\xeb\xf8\xa3\x3f\xfa\
+\xa3\x17\x24\x3d\xe0\xee\x91\xd7\x91\xce\xf0\xc0\xcd\x37\xdf\x9c\
+\x73\x1d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x50\x6d\xb2\x0e\
+\xe5\x25\xc9\x7e\xeb\xbe\xc7\x25\xbf\x5f\x16\xe1\x11\xda\xa6\x7e\
+\xc9\xef\x1f\xcc\x92\x9f\xfb\x3e\x65\x8f\xbb\xeb\x7e\x45\x7b\xa4\
+\x79\xbf\xbb\xee\xbf\xef\x53\x96\x77\x1d\xcd\xcd\xcd\x8f\x9b\x59\
+\xe4\x75\x98\xd9\xfd\xcd\xcd\xcd\x79\xd7\x01\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\xd5\xc4\x26\x7b\x80\x7f\xb8\x67\x95\xcc\xfe\
+\x5e\x52\xc3\x34\xe4\x19\xae\x47\xee\x5f\xc9\xe7\x08\xf9\x6c\xf6\
+\xbc\xe3\xab\xcc\x14\x49\x1d\xee\xfa\x4a\x3e\x47\xc8\x67\xf3\xf2\
+\xcb\x2f\xaf\x72\xf7\x48\xea\x30\xb3\xaf\x70\x84\x3c\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x4c\xdd\xa4\x43\x79\x49\xf2\x9e\xbd\
+\x57\xcb\xfd\x27\x92\x9a\xa6\xfa\x9c\x02\xb8\xa4\x4e\x99\xdd\x63\
+\x0d\xf7\xbe\x5d\xcc\x85\xf7\x1e\xf7\xab\xdd\xf4\x13\xd9\x34\xd5\
+\xe1\xea\xb4\x1a\xdd\x73\xef\x27\xac\xa8\x75\xbc\xfc\xf2\xcb\x57\
+\xfb\x34\xff\x3c\xcc\xec\x9e\x9b\x6f\xbe\xb9\xa8\x75\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x40\xa5\x1b\xf7\xf4\xf5\xc3\x59\xc3\
+\xbd\x6f\xab\xa1\xff\x46\xc9\x1e\x92\xbc\xa7\x74\x71\xbc\x47\x81\
+\x3d\xa4\x86\xfe\x1b\x8b\x3d\x90\x97\xa4\x7b\x3f\x6d\x6f\xf7\x7f\
+\xa0\x1b\xcd\xf4\x90\x4b\x25\xab\xc3\xa5\x1e\x33\x3d\xd4\xff\x81\
+\x6e\x2c\xf6\x40\x5e\x92\x6e\xbe\xf9\xe6\xb7\xe7\xcc\x99\x73\xa3\
+\xa4\x87\xdc\x4b\xf9\xf3\x50\x8f\xa4\x87\xe6\xcc\x99\x73\x23\x03\
+\x79\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc8\x5d\xce\x47\x59\
+\xfb\xa9\x5d\x0b\x55\x9b\xdc\xa2\xd0\xd6\xcb\x54\x5f\x94\x14\xae\
+\x5e\x05\xbe\x5b\x7d\x03\x3b\x6d\xfe\xc6\xf7\x8b\xb2\xe6\x24\x76\
+\x9d\xf0\x85\xc9\x50\x5b\x4c\x2a\x6a\x1d\x2e\xed\x1e\x08\xb4\x73\
+\xe3\x55\x36\x2d\x75\x1c\x3a\x74\x68\x61\x18\x86\x5b\x24\xad\x97\
+\x8a\x54\x87\xd4\x2b\x69\x77\x10\x04\x3b\x6f\xba\xe9\xa6\x69\xa9\
+\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x2a\x51\xde\xa7\x3e\
+\xf7\x9e\xdd\x8d\x92\xdd\xa5\xd0\xee\x56\xa0\xa5\x72\x25\x73\x7c\
+\xe5\x01\x85\x3a\xa2\xc0\x9f\x96\xfc\x19\x6b\x58\xff\x41\xbe\x59\
+\x0a\xb1\xfb\x3d\x6f\xb4\x94\xee\x32\xd7\xdd\xb2\x3c\xeb\x70\x1d\
+\x71\xd3\xd3\x9e\xd0\x33\xeb\x3f\x61\x91\xd4\x71\xe0\xc0\x81\xc6\
+\x99\x33\x67\xde\xe5\xee\x77\x4b\x5a\x2a\xe5\x58\x87\x34\x20\xe9\
+\x88\x99\x3d\x7d\xe1\xc2\x85\x67\x56\xac\x58\x11\x49\x1d\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x50\x49\x8a\x72\x3d\x72\x3f\xb5\
+\x6b\xa1\x6a\x92\xcb\x65\xba\x5e\xd2\x22\xc9\xae\x94\x6b\x81\xa4\
+\x06\xc9\x5d\xb2\x5e\x99\x4e\xca\xf5\x9e\xcc\xdf\x90\xeb\xb0\xfa\
+\x07\x3a\xa6\xeb\xa8\xf8\xa9\x4a\x1f\x3d\xbf\x5c\xd2\xf5\x32\x2d\
+\x32\xe9\x4a\x49\x0b\x64\x6a\xf0\x50\x6e\xa6\xa1\x3a\xdc\xf5\x86\
+\xa4\xc3\x03\x81\x3a\xa6\xeb\xa8\xf8\xa9\x3a\x70\xe0\xc0\xc2\xda\
+\xda\xda\xe5\x41\x10\xa4\x7f\x1e\xe9\x3a\xa4\x06\x0d\x5e\x23\xbe\
+\xd7\xcc\x4e\x4a\x7a\xcf\xdd\xdf\x08\xc3\xf0\x70\x5f\x5f\x5f\xc7\
+\x8a\x15\x2b\xca\xaa\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x88\xbb\xff\x0f\xc8\xc9\x23\xe2\xaf\xb4\x21\xa3\x00\x00\x00\x00\
+\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x0f\xda\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x03\x92\x00\x00\x02\x52\x08\x06\x00\x00\x00\xb1\xee\xfa\x12\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\
+\x0e\xc4\x01\x95\x2b\x0e\x1b\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
+\xe2\x06\x0e\x11\x3b\x31\x88\x4f\xb4\xff\x00\x00\x0f\x67\x49\x44\
+\x41\x54\x78\xda\xed\xdd\x5f\x88\xa5\x75\x1d\xc7\xf1\xcf\xac\x33\
+\xab\x46\xfe\x61\x2d\x71\xa5\xc0\x44\x24\x8b\x7e\x85\x4b\x11\x41\
+\xb0\x60\x94\x17\xae\x17\x1b\xc1\x2e\x05\xba\x44\x6e\x85\x76\xb3\
+\x5e\xa8\x5d\x68\x44\x92\x79\xb9\x26\x4d\x46\x66\x14\x2c\x48\x5e\
+\xb4\x82\x57\xc6\x42\x44\x50\xee\x5e\x7c\x05\x45\xc8\x50\x04\xd7\
+\x68\x57\xc7\x3f\xa8\xab\xee\x4e\x17\xf3\x8c\xfb\xec\xec\xcc\x99\
+\x99\x76\x67\x77\xce\x9c\xd7\x0b\x0e\x3e\xe7\x39\x67\x3c\x87\xef\
+\x39\x3b\x9c\xf7\xfc\x9e\x73\x4e\x02\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x2c\x51\x55\xbd\x51\x55\x47\x4d\x02\x00\x60\x34\x8c\x1b\x01\
+\x70\x0a\x01\xb9\x35\xc9\x8f\x93\xec\x4d\xf2\x9a\x89\x00\x00\x8c\
+\x86\x31\x23\x00\x96\x19\x8f\xe7\x24\x99\x77\xf5\xb1\xb5\x76\xba\
+\x6f\x6b\xac\xfb\x3d\x35\xdd\x5a\x9b\x36\x7d\x00\x00\x21\x09\x9c\
+\x9d\x10\x4c\x92\x61\x8b\xb2\x67\x93\x5c\xd7\x5a\x3b\xe8\x11\x04\
+\x00\x38\xfb\xd6\x19\x01\x8c\x9c\x89\x21\xbc\xcf\xd7\x24\x79\xa0\
+\xaa\x36\x7a\xf8\x00\x00\x84\x24\x70\xe6\x7d\x30\xa4\xf7\x7b\xab\
+\x98\x04\x00\x58\x1d\x1c\xda\x0a\x2c\x49\x55\x5d\x9b\x64\x4b\x92\
+\x1b\x93\x5c\x99\xe4\xe2\xb9\xd7\x69\xad\x8d\xad\xc0\xed\xee\x4c\
+\xb2\x3b\xc7\x57\x52\xf7\x27\xb9\xbd\xb5\xb6\xcf\xa3\x02\x00\x20\
+\x24\x81\xe1\x0b\xca\xcb\x92\x5c\xbe\x92\x21\xb9\x40\x4c\xbe\x90\
+\x64\x87\x98\x04\x00\x10\x92\xc0\xf0\x05\xe5\x43\x49\x3e\x9d\xe4\
+\x23\x2b\x19\x92\xbd\x98\xbc\x3f\xc9\x05\x62\x12\x00\x40\x48\x02\
+\xc3\x1f\x94\x7f\x4f\x72\xa4\xb5\x76\xe1\x0a\xdf\xd6\xe6\x24\x0f\
+\x27\xb9\x42\x4c\x02\x00\x08\x49\x60\x0d\x04\x65\x6b\xed\xc0\x19\
+\xb8\x1d\x31\x09\x00\x20\x24\x01\xc4\x24\x00\x80\x90\x04\x10\x93\
+\x00\x00\x42\x12\x40\x4c\x02\x00\x20\x24\x01\x31\x09\x00\x80\x90\
+\x04\xc4\xa4\x98\x04\x00\x10\x92\x00\x62\x12\x00\x40\x48\x02\x88\
+\x49\x00\x00\x21\x09\x20\x26\x01\x00\x84\x24\x80\x98\x04\x00\x40\
+\x48\x02\x62\x12\x00\x00\x21\x09\x20\x26\x01\x00\x84\x24\x80\x98\
+\x04\x00\x10\x92\x00\x62\x12\x00\x40\x48\x02\x88\x49\x00\x00\x21\
+\x09\x20\x26\x01\x00\x10\x92\x00\x62\x12\x00\x40\x48\x02\x88\x49\
+\x00\x00\x21\x09\x20\x26\x01\x00\x84\x24\x80\x98\x04\x00\x10\x92\
+\x00\x6b\x3f\x26\x3f\xd5\x5a\x33\x1c\x00\x80\x05\xac\x33\x02\x60\
+\x94\x75\xab\x8f\x3b\xba\x80\xcc\x6c\x50\x56\xd5\x4e\xd3\x01\x00\
+\x98\x9f\x15\x49\x80\x9c\xb0\x32\xf9\x6a\x92\x4d\x49\xde\x4b\x72\
+\x5b\x6b\x6d\xd2\x74\x00\x00\x4e\x64\x45\x12\x20\x27\xac\x4c\x3e\
+\xd1\xed\x9a\x48\xb2\xdb\xca\x24\x00\xc0\xc9\xac\x48\x02\xf4\x54\
+\xd5\xc5\x49\xa6\x92\x4c\xf7\x76\xff\xb1\xb5\xf6\x1d\xd3\x01\x00\
+\x98\x61\x45\x12\xa0\xa7\xb5\x36\xd5\x6d\xfe\xad\xb7\x7b\x9b\xc9\
+\x00\x00\x08\x49\x80\x41\x31\x99\x24\x7f\xe8\xed\xfa\xc0\x54\x00\
+\x00\x84\x24\xc0\x62\xa6\x7a\xdb\xef\x18\x07\x00\x80\x90\x04\x58\
+\x8e\x63\x46\x00\x00\x20\x24\x01\x00\x00\x10\x92\x00\x00\x00\x08\
+\x49\x00\x00\x00\x84\x24\x00\x00\x00\x42\x12\x00\x00\x00\x21\x09\
+\x00\x00\x00\x42\x12\x00\x00\x00\x21\x09\x00\x00\x80\x90\x04\x00\
+\x00\x40\x48\x02\x0c\xa1\x3d\x49\xc6\xba\xd3\x25\xc6\x01\x00\x20\
+\x24\x01\x16\xb3\x2d\xc9\x74\x77\x3a\x6c\x1c\x00\x00\x42\x12\x00\
+\x00\x00\x21\x09\x00\x00\x80\x90\x04\x00\x00\x40\x48\x02\x00\x00\
+\x30\xdc\xc6\x8d\x00\x58\x2b\xaa\xea\xd2\x24\x3f\x4f\xf2\xd5\x24\
+\xbf\x6f\xad\xfd\xd4\x54\x00\x00\x4e\x3f\x2b\x92\xc0\x5a\xb2\x31\
+\xc9\xb7\x93\x5c\x95\xe4\xce\xaa\x3a\xc7\x48\x00\x00\x84\x24\xc0\
+\x20\x87\x93\xbc\xd1\x6d\x9f\x9f\x64\x7d\x55\x5d\x63\x2c\x00\x00\
+\x42\x12\x60\x21\x07\x93\xfc\x30\xc9\xcb\xdd\xf9\xb1\x24\xb7\x57\
+\xd5\x4e\xa3\x01\x00\x10\x92\x00\x27\x69\xad\x1d\x6d\xad\x3d\x9a\
+\x99\xc3\x5b\x5f\xe8\x76\x9f\x97\x64\xb7\x98\x04\x00\x10\x92\x00\
+\x83\x82\x72\x5f\x92\x1d\x49\x8e\x75\xbb\x26\xc4\x24\x00\x80\x90\
+\x04\x58\x4a\x4c\x1e\x49\xf2\xcf\x5e\x4c\xfe\xaa\xaa\xee\x31\x1d\
+\x00\x00\x21\x09\xb0\x50\x4c\x4e\x27\xf9\x5d\x92\xc7\x7a\xbb\xef\
+\x16\x93\x00\x00\x42\x12\x60\x50\x4c\x4e\x25\xb9\x35\xc9\xaf\xe7\
+\xc4\xe4\x64\x55\x6d\x34\x21\x00\x00\x21\x09\x30\x5f\x4c\x1e\x6c\
+\xad\xed\x4c\xf2\x93\xde\xee\x5b\x92\x3c\x20\x26\x01\x00\x84\x24\
+\xc0\xa0\xa0\xbc\x67\x4e\x4c\x6e\x4d\xf2\x54\x55\x6d\x36\x1d\x00\
+\x00\x21\x09\x30\x28\x26\xbf\x9f\xe3\x9f\xe8\x7a\x79\x92\x9b\x4c\
+\x06\x00\x40\x48\x02\x0c\x8a\xc9\xc9\x24\xcf\xf6\x76\x5d\x66\x2a\
+\x00\x00\x42\x12\x60\x31\x2f\x19\x01\x00\x80\x90\x04\x00\x00\x40\
+\x48\x02\x00\x00\x20\x24\x01\x00\x00\x10\x92\x00\x00\x00\x08\x49\
+\x00\x00\x00\x10\x92\x00\x00\x00\x08\x49\x00\x00\x00\x84\x24\x00\
+\x00\x00\x42\x12\x00\x00\x00\x21\x09\x00\x00\x80\x90\x04\x00\x00\
+\x00\x21\x09\x00\x00\x80\x90\x04\x00\x00\x40\x48\x02\x00\x00\x30\
+\x2c\xc6\x8d\x00\xd6\xa6\xaa\xda\x9b\xe4\x86\x79\x2e\x1a\x4b\x32\
+\x6d\x42\x27\xd8\x64\x04\x00\x00\x42\x12\x98\x3f\x22\x99\xdf\xc7\
+\x17\xb9\x7c\x43\x55\x1d\x33\xa6\x8c\x75\xa7\x23\x49\xde\x5a\xe2\
+\xcf\x5c\x92\xe4\xf0\x0a\xdd\x9f\x89\x24\xe7\x25\x39\x9a\xe4\xc1\
+\xd6\xda\x2e\x0f\x11\x00\x08\x49\xe0\xd4\xbc\x93\xe4\x7c\x63\x58\
+\x92\xff\x2e\x31\xa2\x98\xb1\x3e\xc9\x86\x65\x5c\x7f\xc3\x0a\xdf\
+\x9f\x89\x24\x3f\x48\x22\x24\x01\x40\x48\x02\xa7\x31\x24\xb7\xb7\
+\xd6\xf6\x88\xa2\xe3\xaa\xea\x89\x24\xd7\x77\x67\xf7\x7b\xba\x0c\
+\xbd\x43\x46\x00\x00\x42\x12\x60\x35\x79\x37\xc9\x43\x23\x3e\x83\
+\xab\x93\x7c\xa3\xdb\x7e\x3b\xc9\x77\x97\xf1\xb3\xdb\x57\xe8\x3e\
+\xdd\x91\xe4\xf3\xdd\xf6\xbf\x3c\x4d\x01\x40\x48\x02\xac\x26\x6f\
+\xb7\xd6\x7e\x34\xca\x03\xa8\xaa\x6d\xbd\x90\x7c\x77\xce\x0a\xf7\
+\x62\xf6\xac\xd0\x7d\xba\xa9\x17\x92\x47\x3c\x4d\x01\xe0\xcc\xf1\
+\xf5\x1f\x00\x00\x00\x08\x49\x00\x00\x00\x84\x24\x00\x00\x00\x42\
+\x12\x00\x00\x00\x21\x09\x00\x00\x80\x90\x04\x00\x00\x00\x21\x09\
+\x00\x00\x80\x90\x04\x00\x00\x40\x48\x02\x00\x00\x20\x24\x01\x00\
+\x00\x10\x92\x00\x00\x00\x08\x49\x00\x00\x00\x10\x92\x00\x00\x00\
+\x08\x49\x00\x00\x00\x84\x24\x00\x00\x00\x42\x12\x00\x00\x00\x21\
+\x09\x00\x00\xc0\xc8\x1a\x37\x02\x00\x56\x93\xaa\xda\x99\xe4\xbe\
+\x24\xef\x27\xb9\xbf\xb5\xf6\x0b\x53\x01\x80\xd5\xc5\x8a\x24\x00\
+\xab\xcd\x5d\x49\x2e\x4a\xf2\xb1\x24\xf7\x55\xd5\x64\x55\x6d\x34\
+\x16\x00\x10\x92\x00\xb0\x90\x8f\xce\x39\x7f\x4b\x92\x07\xc4\x24\
+\x00\x08\x49\x00\x58\x8e\xad\x49\xf6\x56\xd5\x66\xa3\x00\x00\x21\
+\x09\x00\x83\xfc\x26\x33\xef\x95\x4c\x92\x4d\x49\x1e\x16\x93\x00\
+\x20\x24\x01\x60\x90\x27\x93\xdc\x96\xe4\xcd\xee\xfc\x15\x49\xfe\
+\xdc\x7d\x20\x0f\x00\x20\x24\x01\xe0\x64\xad\xb5\xc9\x24\x37\x26\
+\x79\xa1\xdb\x75\x41\x92\xdd\x49\x3e\x69\x3a\x00\x20\x24\x01\x60\
+\xa1\x98\xdc\x97\x64\x47\x92\xfd\xdd\xae\x89\x24\x9f\x35\x19\x00\
+\x10\x92\x00\x90\x24\x97\x24\x19\xeb\x4e\x7b\xe6\xc4\xe4\x96\x24\
+\x8f\x19\x11\x00\x9c\x5d\xe3\x46\x00\x6b\xd6\x44\x6f\xfb\xb7\x55\
+\xf5\xcb\xde\x8b\xf4\xc3\xc6\x93\x0b\x7a\xdb\x0e\x91\x1c\x12\xad\
+\xb5\x83\x55\x75\x6b\x92\x43\x99\xf9\x5a\x90\x59\xaf\x98\x0e\x00\
+\x08\x49\xe0\xd4\xad\xef\x6d\x9f\xdf\x9d\x66\x6d\x30\x9e\x13\x5c\
+\xb9\x58\x74\x56\xd5\x13\x23\x3e\xa3\xfe\x77\x38\x4e\x9c\x81\xdb\
+\x5b\x97\x64\xba\x3b\x9d\x14\x93\x49\x76\x56\xd5\x5b\x49\xbe\x97\
+\xe4\x60\x92\x47\x3c\x8d\x01\x40\x48\x02\xa7\xe7\x85\x38\x4b\xf3\
+\xe4\x22\x97\x4f\x24\xb9\xde\x98\x3e\x74\xde\x19\x7a\xee\x8e\xcd\
+\x17\x92\xbd\xa0\xdc\x95\x64\x97\x87\x03\x00\x84\x24\xb0\x32\x5e\
+\x4c\x72\x47\xef\xfc\x76\x23\xf9\xd0\xab\x49\x9e\x5e\x60\x3f\xf3\
+\x3b\xba\xc2\xff\xff\x63\x46\x0c\x00\x42\x12\x38\xfb\xa6\x5a\x6b\
+\x7b\x7a\xe7\xf7\x18\xc9\xa2\x9e\x4e\xf2\x78\x92\xeb\x92\xfc\x3b\
+\xc9\x4b\x23\x3e\x8f\x73\x93\x5c\xd5\x6d\x3f\xe8\xe9\x01\x00\x42\
+\x12\x80\x39\xba\xf7\xe1\x6d\x31\x89\x79\x39\x9c\x14\x00\x46\x9c\
+\xf7\x50\xc1\xda\xd5\x3f\xfc\xf0\x7d\xe3\x60\x88\x1c\xce\xf1\x0f\
+\xda\xd9\x66\x1c\x00\x20\x24\x81\x33\xe7\xf9\xde\xf6\x9b\xc6\x01\
+\x00\x80\x90\x04\x16\xd3\x7f\x4f\xdf\x11\xe3\x00\x00\x40\x48\x02\
+\x00\x00\x20\x24\x01\x00\x00\x10\x92\x00\x00\x00\x08\x49\x00\x00\
+\x00\x84\x24\x00\x00\x00\x08\x49\x00\x00\x00\x84\x24\x00\x00\x00\
+\x42\x12\x00\x00\x00\x21\x09\xac\x3e\x5f\xae\xaa\x87\xab\x6a\xb3\
+\x51\x00\x00\x70\xaa\xc6\x8d\x00\xd6\xac\x57\x7a\xdb\x17\x27\xb9\
+\x39\xc9\xcd\x55\x35\x96\xe4\xce\x24\x87\x92\x3c\xde\x5a\x3b\x68\
+\x54\x00\x00\x08\x49\x20\x49\x1e\x49\xf2\xf5\x24\x97\xcf\x73\xd9\
+\x1b\x49\x36\x27\xd9\xdc\x85\xe5\x8b\x49\xfe\x91\xe4\xaf\xad\xb5\
+\x43\x46\x07\x00\xc0\x20\x63\x46\x00\x6b\x57\x55\x6d\x4c\x72\x43\
+\x92\xaf\x25\xb9\x3a\xc9\x17\xba\x7f\xf7\xeb\x73\xfc\x0f\x49\x6f\
+\x2f\xf4\xf3\xad\x35\x43\xe4\x6c\x3c\x6f\x0f\x27\xd9\xd0\x9d\xdd\
+\xde\x5a\xdb\x63\x2a\x00\xb0\xba\x58\x91\x84\x35\xac\x3b\x6c\xf5\
+\xa1\xee\x34\x1b\x96\x49\xb2\x2b\xc9\xed\xbd\x17\xeb\x83\x5e\xd0\
+\x1f\x48\xf2\x68\x1c\x06\x0b\x00\x40\xc7\x8a\x24\x8c\xb0\xee\xc3\
+\x77\x6e\xce\xcc\x6a\xe5\x67\x92\x5c\x34\xe0\xea\xaf\x27\x79\x26\
+\xc9\x73\x49\x1e\x69\xad\xed\x33\x41\x56\xe8\x79\x69\x45\x12\x00\
+\x84\x24\x30\x24\x2f\xde\x67\x0f\x83\xfd\x56\x92\x4d\x59\x64\xb5\
+\x32\xc9\xfe\x24\x5b\xac\x52\x22\x24\x01\x60\xf4\x38\xb4\x15\x48\
+\xb2\xe0\x61\xb0\xb3\x61\xf9\xa5\x9c\xbc\x5a\xb9\x29\xc9\xe7\x92\
+\x08\x49\x00\x00\x21\x09\x70\x62\x58\xce\xf9\xd0\x9e\x6f\x26\x39\
+\xa7\xbb\xda\x06\x93\x62\x05\xbc\xd5\x7b\x6e\xbd\x6a\x1c\x00\x20\
+\x24\x81\xe1\x8f\xca\xff\x24\xb9\xb4\xbb\xe8\x13\xa6\xc3\x0a\xb8\
+\x37\xc9\xdd\x49\xf6\x26\x79\xda\x38\x00\x40\x48\x02\xc3\xef\xf9\
+\x5e\x48\x7e\xd1\x38\x38\xdd\x5a\x6b\x93\x49\x26\x4d\x02\x00\x56\
+\xaf\x75\x46\x00\x2c\xd3\xeb\xbd\xed\x0b\x8d\x03\x00\x40\x48\x02\
+\x00\x00\xc0\x40\x0e\x6d\x05\x4e\xc5\x85\x55\x75\xed\xec\x99\xd6\
+\xda\x01\x23\x01\x00\x10\x92\xc0\x88\xab\xaa\xbb\x92\xfc\x6c\x81\
+\x8b\xbf\x92\xe4\xa9\x24\xef\x25\x39\x37\xbe\x9b\x16\x00\x60\x24\
+\x38\xb4\x15\x18\xa8\xb5\x76\x6f\x92\xa9\x01\x57\x19\xeb\x22\xf2\
+\x19\xd3\x02\x00\x18\x0d\x56\x0f\x80\x25\xa9\xaa\xe9\x24\xef\x67\
+\xe6\x48\x86\xb1\x79\x82\xd3\xef\x13\x00\x80\x11\x61\x45\x12\x58\
+\xaa\x97\x93\x4c\x64\xfe\x3f\x40\x3d\x65\x3c\x00\x00\xa3\xc3\x0a\
+\x02\xb0\x64\x55\x75\x2c\x56\x23\x01\x00\x46\x9e\x15\x49\x60\x39\
+\xfe\xd2\xfd\xf7\xb5\x24\xd3\xdd\x69\xca\x58\x00\x00\x46\x8b\x55\
+\x04\x60\x59\xba\xf7\x4a\x4e\xcf\xfe\xfe\xb0\x1a\x09\x00\x30\x7a\
+\xac\x48\x02\xcb\xf5\xa7\x1c\xff\x23\xd4\x7e\xe3\x00\x00\x00\x60\
+\x51\x55\x35\xdd\xad\x4c\x02\x00\x30\x82\xc6\x8d\x00\xf8\x3f\x1c\
+\x88\x4f\x6a\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x58\xfd\xfe\x07\xd3\x27\x4b\xb9\x62\x15\x48\x68\x00\x00\x00\
+\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x04\xc1\
+\x7b\
+\x22\x76\x65\x72\x73\x69\x6f\x6e\x22\x3a\x31\x2c\x22\x73\x74\x61\
+\x74\x65\x73\x22\x3a\x7b\x22\x30\x22\x3a\x5b\x31\x37\x30\x2c\x32\
+\x35\x35\x2c\x30\x2c\x31\x35\x30\x5d\x2c\x22\x31\x22\x3a\x5b\x32\
+\x35\x35\x2c\x31\x37\x30\x2c\x31\x37\x30\x2c\x31\x35\x30\x5d\x2c\
+\x22\x32\x22\x3a\x5b\x32\x35\x35\x2c\x32\x33\x30\x2c\x39\x30\x2c\
+\x31\x35\x30\x5d\x2c\x22\x33\x22\x3a\x5b\x39\x30\x2c\x32\x30\x30\
+\x2c\x32\x35\x35\x2c\x31\x35\x30\x5d\x2c\x22\x34\x22\x3a\x5b\x31\
+\x36\x30\x2c\x31\x36\x30\x2c\x31\x36\x30\x2c\x31\x37\x30\x5d\x7d\
+\x2c\x22\x73\x70\x72\x69\x74\x65\x73\x22\x3a\x7b\x22\x69\x6d\x67\
+\x2f\x74\x65\x6d\x70\x22\x3a\x5b\x7b\x22\x73\x69\x7a\x65\x22\x3a\
+\x5b\x34\x38\x2c\x34\x38\x5d\x2c\x22\x72\x65\x63\x74\x73\x22\x3a\
+\x7b\x22\x30\x22\x3a\x5b\x31\x39\x32\x30\x2c\x36\x32\x30\x2c\x34\
+\x38\x2c\x34\x38\x2c\x30\x2c\x30\x5d\x2c\x22\x31\x22\x3a\x5b\x31\
+\x39\x37\x30\x2c\x36\x32\x30\x2c\x34\x38\x2c\x34\x38\x2c\x30\x2c\
+\x30\x5d\x2c\x22\x32\x22\x3a\x5b\x30\x2c\x36\x39\x30\x2c\x34\x38\
+\x2c\x34\x38\x2c\x30\x2c\x30\x5d\x2c\x22\x33\x22\x3a\x5b\x35\x30\
+\x2c\x36\x39\x30\x2c\x34\x38\x2c\x34\x38\x2c\x30\x2c\x30\x5d\x2c\
+\x22\x34\x22\x3a\x5b\x31\x30\x30\x2c\x36\x39\x30\x2c\x34\x38\x2c\
+\x34\x38\x2c\x30\x2c\x30\x5d\x7d\x7d\x5d\x2c\x22\x69\x6d\x67\x2f\
+\xd0\xb2\xd1\x82\xd0\xb3\x22\x3a\x5b\x7b\x22\x73\x69\x7a\x65\x22\
+\x3a\x5b\x39\x31\x34\x2c\x35\x39\x34\x5d\x2c\x22\x72\x65\x63\x74\
+\x73\x22\x3a\x7b\x22\x30\x22\x3a\x5b\x39\x30\x31\x2c\x30\x2c\x33\
+\x37\x32\x2c\x31\x37\x33\x2c\x31\x30\x30\x2c\x32\x33\x35\x5d\x2c\
+\x22\x31\x22\x3a\x5b\x31\x32\x37\x35\x2c\x30\x2c\x33\x37\x32\x2c\
+\x31\x37\x33\x2c\x31\x30\x30\x2c\x32\x33\x35\x5d\x2c\x22\x32\x22\
+\x3a\x5b\x31\x36\x34\x39\x2c\x30\x2c\x33\x37\x32\x2c\x31\x37\x33\
+\x2c\x31\x30\x30\x2c\x32\x33\x35\x5d\x2c\x22\x33\x22\x3a\x5b\x30\
+\x2c\x34\x34\x35\x2c\x33\x37\x32\x2c\x31\x37\x33\x2c\x31\x30\x30\
+\x2c\x32\x33\x35\x5d\x2c\x22\x34\x22\x3a\x5b\x33\x37\x34\x2c\x34\
+\x34\x35\x2c\x33\x37\x32\x2c\x31\x37\x33\x2c\x31\x30\x30\x2c\x32\
+\x33\x35\x5d\x7d\x7d\x5d\x2c\x22\x69\x6d\x67\x2f\xd0\xb2\xd1\x82\
+\xd0\xb3\x32\x22\x3a\x5b\x7b\x22\x73\x69\x7a\x65\x22\x3a\x5b\x39\
+\x31\x34\x2c\x35\x39\x34\x5d\x2c\x22\x72\x65\x63\x74\x73\x22\x3a\
+\x7b\x22\x30\x22\x3a\x5b\x37\x34\x38\x2c\x34\x34\x35\x2c\x31\x38\
+\x39\x2c\x31\x35\x35\x2c\x32\x34\x37\x2c\x32\x34\x36\x5d\x2c\x22\
+\x31\x22\x3a\x5b\x39\x33\x39\x2c\x34\x34\x35\x2c\x31\x38\x39\x2c\
+\x31\x35\x35\x2c\x32\x34\x37\x2c\x32\x34\x36\x5d\x2c\x22\x32\x22\
+\x3a\x5b\x31\x31\x33\x30\x2c\x34\x34\x35\x2c\x31\x38\x39\x2c\x31\
+\x35\x35\x2c\x32\x34\x37\x2c\x32\x34\x36\x5d\x2c\x22\x33\x22\x3a\
+\x5b\x31\x33\x32\x31\x2c\x34\x34\x35\x2c\x31\x38\x39\x2c\x31\x35\
+\x35\x2c\x32\x34\x37\x2c\x32\x34\x36\x5d\x2c\x22\x34\x22\x3a\x5b\
+\x31\x35\x31\x32\x2c\x34\x34\x35\x2c\x31\x38\x39\x2c\x31\x35\x35\
+\x2c\x32\x34\x37\x2c\x32\x34\x36\x5d\x7d\x7d\x5d\x2c\x22\x69\x6d\
+\x67\x2f\xd0\xb7\xd1\x83\xd0\xba\xd1\x83\x22\x3a\x5b\x7b\x22\x73\
+\x69\x7a\x65\x22\x3a\x5b\x39\x31\x34\x2c\x35\x39\x34\x5d\x2c\x22\
+\x72\x65\x63\x74\x73\x22\x3a\x7b\x22\x30\x22\x3a\x5b\x30\x2c\x36\
+\x32\x30\x2c\x33\x38\x32\x2c\x36\x38\x2c\x35\x33\x32\x2c\x32\x38\
+\x32\x5d\x2c\x22\x31\x22\x3a\x5b\x33\x38\x34\x2c\x36\x32\x30\x2c\
+\x33\x38\x32\x2c\x36\x38\x2c\x35\x33\x32\x2c\x32\x38\x32\x5d\x2c\
+\x22\x32\x22\x3a\x5b\x37\x36\x38\x2c\x36\x32\x30\x2c\x33\x38\x32\
+\x2c\x36\x38\x2c\x35\x33\x32\x2c\x32\x38\x32\x5d\x2c\x22\x33\x22\
+\x3a\x5b\x31\x31\x35\x32\x2c\x36\x32\x30\x2c\x33\x38\x32\x2c\x36\
+\x38\x2c\x35\x33\x32\x2c\x32\x38\x32\x5d\x2c\x22\x34\x22\x3a\x5b\
+\x31\x35\x33\x36\x2c\x36\x32\x30\x2c\x33\x38\x32\x2c\x36\x38\x2c\
+\x35\x33\x32\x2c\x32\x38\x32\x5d\x7d\x7d\x5d\x2c\x22\x69\x6d\x67\
+\x2f\xd0\xb7\xd1\x83\xd0\xba\xd1\x83\x33\x22\x3a\x5b\x7b\x22\x73\
+\x69\x7a\x65\x22\x3a\x5b\x39\x31\x34\x2c\x35\x39\x34\x5d\x2c\x22\
+\x72\x65\x63\x74\x73\x22\x3a\x7b\x22\x30\x22\x3a\x5b\x31\x35\x30\
+\x2c\x36\x39\x30\x2c\x37\x32\x2c\x33\x35\x2c\x35\x35\x34\x2c\x31\
+\x35\x37\x5d\x2c\x22\x31\x22\x3a\x5b\x32\x32\x34\x2c\x36\x39\x30\
+\x2c\x37\x32\x2c\x33\x35\x2c\x35\x35\x34\x2c\x31\x35\x37\x5d\x2c\
+\x22\x32\x22\x3a\x5b\x32\x39\x38\x2c\x36\x39\x30\x2c\x37\x32\x2c\
+\x33\x35\x2c\x35\x35\x34\x2c\x31\x35\x37\x5d\x2c\x22\x33\x22\x3a\
+\x5b\x33\x37\x32\x2c\x36\x39\x30\x2c\x37\x32\x2c\x33\x35\x2c\x35\
+\x35\x34\x2c\x31\x35\x37\x5d\x2c\x22\x34\x22\x3a\x5b\x34\x34\x36\
+\x2c\x36\x39\x30\x2c\x37\x32\x2c\x33\x35\x2c\x35\x35\x34\x2c\x31\
+\x35\x37\x5d\x7d\x7d\x5d\x2c\x22\x72\x61\x77\x5f\x69\x6d\x67\x2f\
+\xd0\xb3\xd1\x82\xd1\x83\x5f\x30\x22\x3a\x5b\x7b\x22\x73\x69\x7a\
+\x65\x22\x3a\x5b\x39\x31\x34\x2c\x35\x39\x34\x5d\x2c\x22\x72\x65\
+\x63\x74\x73\x22\x3a\x7b\x22\x2d\x22\x3a\x5b\x30\x2c\x30\x2c\x37\
+\x35\x38\x2c\x34\x34\x33\x2c\x36\x31\x2c\x37\x37\x5d\x7d\x7d\x5d\
+\x2c\x22\x72\x61\x77\x5f\x69\x6d\x67\x2f\xd0\xb3\xd1\x82\xd1\x83\
+\x5f\x32\x22\x3a\x5b\x7b\x22\x73\x69\x7a\x65\x22\x3a\x5b\x39\x31\
+\x34\x2c\x35\x39\x34\x5d\x2c\x22\x72\x65\x63\x74\x73\x22\x3a\x7b\
+\x22\x2d\x22\x3a\x5b\x37\x36\x30\x2c\x30\x2c\x31\x33\x39\x2c\x32\
+\x36\x35\x2c\x35\x32\x30\x2c\x31\x30\x33\x5d\x7d\x7d\x5d\x7d\x7d\
+\
+\x00\x00\x04\x21\
+\x00\
+\x00\x0d\xc6\x78\x9c\xeb\x0c\xf0\x73\xe7\xe5\x92\xe2\x62\x60\x60\
+\xe0\xf5\xf4\x70\x09\x62\x60\x60\x9e\xc4\xc0\xc0\x14\xc4\xc1\x06\
+\x14\xd9\xf8\xee\x97\x10\x90\x62\x4b\xf2\x76\x77\x61\xf8\x0f\x82\
+\x0b\xf6\x2e\x9f\x0c\x14\xe1\x2c\xf0\x88\x2c\x66\x60\xe0\x3b\x02\
+\xc2\x8c\x53\xb5\xf9\xa4\x81\x82\xec\x25\x9e\xbe\xae\xec\x8f\x58\
+\xa5\x04\x2d\xb4\x36\xde\x99\x72\x02\x68\x62\xb0\xa7\x8b\x63\x48\
+\xc5\xad\xb7\x77\xf7\xfa\x49\x73\x8a\xb3\x3d\x48\xae\x7b\xe2\xb8\
+\xc8\xe0\x93\x59\x0d\x2b\x07\xe7\xc3\xb6\xae\xb2\xec\x75\x0a\xa7\
+\xb6\x2e\xe9\x7e\x5a\xb2\x53\xcc\xec\x52\x1c\x9b\xd0\xaf\x59\xba\
+\x61\x45\x99\x1f\xc4\x4c\xc4\x78\xb3\x7d\x0f\x56\x68\x5f\x98\xc4\
+\x9a\x24\x6c\x50\x3c\xe3\xb9\xe6\xc1\x6f\x7b\xaa\x74\x95\xe6\xce\
+\xf9\xd9\xc9\x30\x0a\x46\xc1\x28\x20\x1b\x34\xb8\x65\xaf\x5c\x10\
+\xf7\xeb\xef\x3f\x1f\x6e\x9d\xcb\x09\x06\x1f\xde\xd3\xd5\x76\x07\
+\xe3\x3f\x1f\xbf\x9f\xd5\xaf\xff\x53\xbb\x79\x1d\x27\x5d\x6d\x26\
+\x09\x34\xec\xdc\x1a\xc2\x70\xf6\xea\xfb\xef\xe9\xa7\xed\x9e\x25\
+\x18\x64\xec\x4d\xed\x6b\xef\x9b\xbf\x76\xfb\xae\x9a\x7c\x06\x87\
+\xe2\xb5\x2b\x19\xa4\xde\xd7\xcb\xdb\xd5\xfe\x2b\x95\x64\xff\xf5\
+\xed\xeb\xe9\x93\xc9\xfb\x7f\x7f\x78\xf9\xf9\xf8\x76\x9b\xba\x43\
+\xf7\xa6\x15\xfd\xb9\x7c\xbf\xde\xfa\x67\xf6\x8f\xe5\xfb\x85\x18\
+\x1e\xcc\x13\x15\x75\xd8\xac\x9b\x2d\x71\x69\xf6\x7b\x5e\x06\x03\
+\x0f\x26\x06\x86\x84\x09\x2c\x40\x2b\x9a\x55\x80\x04\x9b\x27\x90\
+\xe0\x01\x96\xb8\x0c\x4b\x1e\x7e\x94\x3f\xc0\xbf\xf7\x6b\xb2\xf5\
+\xab\x69\xca\xde\xcf\x7a\x6a\x19\x81\x92\x0f\x64\xf9\x27\xdc\xdf\
+\xff\xcc\x94\x7d\xf2\xae\x27\x27\x26\x59\x26\xc7\x33\x38\xe8\xf9\
+\xe5\xb2\xce\xb3\xed\xf9\x73\xe6\xf5\xe6\xa7\x50\x21\x3b\xb3\x49\
+\x07\x26\x1f\x3e\x7a\xf5\x6a\xe8\x9c\xb9\x73\xef\xfe\xfe\x7b\xea\
+\x94\xd7\x96\xdb\x6f\x5f\x94\xed\xde\xb8\x7d\xbb\xb8\x6b\xe0\x9d\
+\xbd\xef\x55\xcd\x63\x4a\x4f\x4e\x54\x2d\x3e\xb6\x8f\xa1\x61\x4e\
+\x8e\x4a\xa3\x7b\xfb\xc4\xe3\x21\xa1\xa2\x97\x5f\x9a\x1c\x7b\x5c\
+\x38\x67\xde\x3c\xb7\xc8\x69\xdc\x7b\xed\x83\xfb\x74\x66\x1a\x7f\
+\x63\x65\x78\x92\xaa\xcc\x79\x26\xb5\xbc\xdc\x9c\x8f\x8f\x4f\x49\
+\x29\xc9\x6c\xf6\xd1\xaf\x5f\x4b\x79\xda\x0f\xcf\xf0\x51\x2b\xac\
+\xac\x94\xb4\xb6\xb6\xee\x3d\x05\x35\xec\xd7\xe6\x89\x2c\xef\xce\
+\xec\x9e\x9a\xb5\x35\x6a\xe3\xce\x9d\x95\xe6\x2d\x77\xee\xdc\xb1\
+\x79\x5d\xfc\x6a\x1e\xd4\x0b\x3b\x6f\x7a\x30\x71\xef\xb6\x75\xfd\
+\xf4\xe8\x91\x92\x92\xd2\xb6\x6d\xdb\xa4\xe6\xc2\x3d\xa7\xb0\xf1\
+\x62\x86\xc8\xe2\x8b\x2f\xee\x9d\x37\x33\x33\x7b\xf4\xe1\x83\x81\
+\xd5\x5c\xbf\xc7\x45\x29\x27\xe7\x6c\xd4\x67\x58\xf0\x6f\xce\x2d\
+\x2e\x9b\xe8\xc8\x69\x86\x33\x7d\x16\xad\xd2\xb2\x14\x4a\x3d\x77\
+\x43\x9c\x21\x40\x1f\xe8\xd3\x98\x7d\xfb\x33\xbd\x81\x12\x52\xbd\
+\x8f\xfe\xfc\xb1\xb9\x76\xed\xda\xa2\xeb\xaf\x4d\xb5\xdc\xa7\x9d\
+\x91\xfc\xcd\xc4\xf0\xea\xbc\x9b\x50\x44\xc4\xea\xab\x5d\x8b\x34\
+\x80\xc2\xae\xbb\xef\xf6\x7d\xac\xb8\xf3\x42\x26\xd2\x28\xfd\x0d\
+\x37\x28\xf0\xdf\x87\x84\x86\xfe\xdf\xc9\x9c\x31\xb9\x18\x62\xcf\
+\x01\x05\xce\x2b\x67\xda\xfd\xe7\xdb\x9f\xfb\xbc\xeb\x66\x8e\x18\
+\x30\x40\xda\x0e\x27\x4e\x49\x95\x74\x0d\x3c\xf2\xea\xd5\xab\x43\
+\xf3\x83\xbf\x43\xf5\x9e\x38\x6b\x0a\xb4\x5a\x6e\xd7\xef\xe7\x6b\
+\xff\xfe\xfd\x7b\x0c\x16\xf4\x7f\x81\xfe\xfb\x0e\xf4\x7f\x54\x7c\
+\x7c\x7f\xde\x76\x69\x77\x77\xf7\x8d\x7b\xf7\xee\xfd\xf0\x7b\x33\
+\x2c\xba\xe2\x80\x2e\x6e\x76\x3e\xb9\x7d\x7d\xbc\x9f\x92\x12\xd0\
+\x83\x32\xf2\xf2\xfb\x5f\x18\x4c\xd6\x85\xba\xb7\x68\xd3\x44\x96\
+\xb8\x94\x1d\x15\x6b\x13\x97\xe8\x59\x6e\x4a\x01\x79\x72\x42\x7f\
+\xaf\xca\x87\xc3\x8a\x8f\xcb\x4e\x7f\x0d\x6b\xf6\x88\x2d\x82\x3b\
+\x74\xcf\xe5\xc6\xa0\xbe\x98\x99\xbc\xdd\x0c\x07\xb2\x0b\xb3\xb4\
+\x61\xa9\x27\xae\x3f\x38\x7a\xe1\xc3\x79\xbb\xfa\xd6\x75\x5a\x6e\
+\x7a\x72\xf6\x9a\x38\x03\xc3\x81\xcd\x5f\x7e\xff\x9d\x26\xf6\xe9\
+\xeb\xb3\x6a\x66\x50\x6a\x7e\xb0\xfc\x47\x7c\x5a\xc6\x86\xba\xfd\
+\xf6\xd1\xdf\x0c\xd9\x9b\x1d\x5f\x37\xca\xfc\xef\xef\x58\xbc\xdd\
+\xaa\x6e\xdb\xbd\x57\x9f\xf6\x32\x32\x9c\x7d\x2a\xe5\x99\xb1\x23\
+\xd5\x4e\xe9\x51\xe7\xeb\x5f\x7d\xd3\x26\x3e\x56\x5d\xaf\x5d\xf3\
+\xfa\xde\xb4\x52\x78\x4a\xb6\x17\x61\x78\x20\x57\x9e\xcb\xca\x00\
+\x72\x09\x30\x7f\x38\x0a\x61\x26\xe1\x0f\xf9\x72\xff\x19\xff\x5c\
+\x08\xee\x3f\xbb\xe2\xe4\x63\xe7\x69\xb3\x46\x93\xf1\x68\x32\xa6\
+\x24\x19\x0f\x0c\xe0\x9e\xb1\x52\x21\x35\x7f\x9f\xf9\x40\xd9\x3f\
+\x0a\x46\x01\x2e\x50\x11\xf8\x9f\xa1\x43\x38\x24\xe0\x68\x9a\xe8\
+\x1a\x10\xdf\xd3\xd5\xcf\x65\x9d\x53\x42\x13\x00\x71\x8e\x04\xdf\
+\
+\x00\x00\x12\x93\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x03\x92\x00\x00\x02\x52\x08\x06\x00\x00\x00\xb1\xee\xfa\x12\
+\x00\x00\x05\xee\x7a\x54\x58\x74\x52\x61\x77\x20\x70\x72\x6f\x66\
+\x69\x6c\x65\x20\x74\x79\x70\x65\x20\x65\x78\x69\x66\x00\x00\x78\
+\xda\xed\x58\x6d\x72\xe4\x38\x08\xfd\xaf\x53\xec\x11\x04\x12\x42\
+\x3a\x8e\x3e\x50\xd5\xdc\x60\x8f\xbf\x0f\xb5\xd3\x3d\x49\x7a\x52\
+\x99\x64\x7f\x6c\x6d\x4d\xbb\x62\xbb\x69\x19\x30\x0f\x1e\x28\xc1\
+\xfe\xfe\xb1\xc3\x5f\xf8\xb0\x44\x0e\x59\xb4\x96\x56\x4a\xc4\x27\
+\xb7\xdc\xb8\xe3\xa6\xc6\xdb\xe7\x76\xa5\x98\xcf\xf9\x7c\x1a\xc7\
+\x74\x49\x5f\xc9\x83\x70\xe4\x73\xc7\x10\xf9\x92\xdb\xb2\x58\xec\
+\x76\xa5\x0e\xb9\x3c\x1e\xd0\x7c\xc9\xc7\x6b\x79\xd0\x79\xbb\xe1\
+\x7a\x29\xba\x7e\x78\x51\x98\xdc\xb2\x9b\xba\xd6\xd5\x4b\x51\xe2\
+\x9b\x9c\xae\xef\xa1\x5d\xcf\xf5\xfc\xd3\xeb\x5c\x7f\x63\x5d\x32\
+\xb9\x5d\xde\x7e\xcf\x8a\x60\x2c\x04\x08\x6a\x03\x5b\xa2\x14\x71\
+\x66\xb7\x92\xe0\x41\xaa\xa9\xe3\x5a\xce\x59\x3d\x24\x90\xf5\x94\
+\x71\xb8\x84\x9e\xc7\x2e\xdc\x6f\xdf\x04\xaf\x97\xcb\xfa\x9b\xd8\
+\xc5\x7e\xad\x48\xaf\x43\x11\xe2\xcb\x03\xe5\x4d\x8c\x2e\x39\xc9\
+\xf3\xd8\x9d\x08\xfd\xec\x11\xbd\xdc\xf2\xeb\x1f\xc6\x23\x09\xde\
+\xc5\x6e\xef\x55\xf7\xb6\xdb\xdb\xf5\x5c\x10\xa9\x12\xae\x97\x8a\
+\x97\x8a\x73\x87\x85\xd0\x93\xd3\x79\xac\xe0\x50\xfc\x09\xee\xf5\
+\x1c\x0d\x47\xc5\x2b\x4e\x20\xb6\x80\xe6\xc0\x31\x03\x35\x62\x44\
+\x7b\x53\xa6\x45\x9d\x36\xd9\xb9\x4e\x9a\x70\x31\xb3\x31\xc2\xcd\
+\xcc\x93\xd3\x91\x55\x84\xbf\xf1\x3c\x00\x78\xf8\x33\x6d\xd6\xd4\
+\xd2\x0a\xc0\x88\xd3\x04\x6a\x09\x62\xbe\xfb\x42\xc7\x6e\x3b\xf6\
+\x26\x55\x58\x5e\x84\x95\x4c\x50\x46\x78\xe2\xdd\x11\x9e\x09\xbf\
+\x72\xdc\x15\xed\xed\xa9\x4b\xe4\xc1\xec\xe5\xc4\x0a\x7e\xb1\xe7\
+\x34\xdc\x70\xe4\xfc\x8c\x55\x00\x84\xf6\x15\x53\x39\xf1\x3d\x47\
+\xb8\xc3\xfa\xf8\x38\xb0\x09\x08\xca\x09\x73\xc5\x0b\xf6\x38\x6e\
+\x2a\x86\xd0\x23\xb7\xd2\xc1\x39\x61\x9d\xc4\x1c\xe2\xad\x34\x48\
+\xd7\xa5\x00\x21\x82\x6d\x81\x33\x94\x80\x40\x2c\x94\x84\x0a\x45\
+\x65\x56\x22\xc4\xb1\x02\x9f\x0e\xcf\x39\x65\x1e\x40\x80\x44\x78\
+\x51\xd8\xc0\x26\xa5\x02\x70\x2a\xbb\x6d\x3c\xa3\x74\xd6\xb2\xf0\
+\x4d\x0c\x6a\x01\x10\x82\xa2\x51\x40\xd3\x52\x07\x58\x39\x0b\xf2\
+\x47\x73\x45\x0e\x75\x49\x92\x83\x88\x14\x51\xa9\xd2\xa4\x97\x54\
+\x72\x91\x52\x8a\x16\xe7\xa8\xae\x49\xb3\x8a\x16\x55\xad\xda\xb4\
+\xd7\x54\x73\x95\x5a\xaa\xd6\x5a\x5b\xed\x8d\x5b\x02\x85\x49\x2b\
+\x4d\x43\xab\xad\xb5\xde\x61\xb4\x43\x75\xc7\xd3\x1d\x2b\x7a\x1f\
+\x3c\xd2\xc8\x43\x46\x19\x3a\xea\x68\xa3\x4f\xa4\xcf\xcc\x53\x66\
+\x99\x3a\xeb\x6c\xb3\x2f\x5e\x69\xa1\xfc\x57\x59\x1a\x56\x5d\x6d\
+\x75\x23\x43\x2a\x59\x36\xb1\x62\x6a\xd5\x9a\xf5\x8d\x5c\xdb\x69\
+\xe7\x2d\xbb\x6c\xdd\x75\xb7\xdd\xef\xa8\x5d\xa8\xbe\x46\x8d\xde\
+\x20\xf7\x31\x6a\x74\xa1\xe6\x88\xe5\xb3\x4e\x1f\xa8\x41\xac\xfa\
+\xa2\x82\x9c\x4e\xc4\x31\x03\x62\x9c\x09\x88\xab\x23\x80\x84\x66\
+\xc7\x2c\x56\xca\x99\x1d\x39\xc7\x0c\x24\x8e\xa2\x10\x06\x6a\x24\
+\x0e\xce\x22\x47\x0c\x08\x66\x23\x96\x4d\x77\xec\x1e\xc8\x7d\x88\
+\x5b\x90\xfc\x5b\xb8\xf1\xaf\x90\x0b\x0e\xdd\xbf\x81\x5c\x70\xe8\
+\x2e\xe4\xde\xe3\xf6\x04\xb5\xd5\x4f\x47\x49\x07\x20\xaf\x42\x8f\
+\x69\x4c\x1b\xc4\x86\x05\x56\x3b\xd7\xee\x3d\xe9\xcb\xd7\xf0\x5d\
+\x05\x7f\x14\xfd\xaf\x14\x8d\x54\xb4\xeb\x32\xeb\x68\x09\x59\x51\
+\x33\xaa\xa4\x19\x5f\x35\x31\x78\x35\xa5\x16\x91\xca\x35\x72\x37\
+\xdd\xde\xee\x8c\xd1\x51\x3b\x68\x04\x15\xb1\x37\xc8\x82\x91\xbd\
+\x98\x57\x8a\x08\x49\x07\x6d\x78\x9f\x9d\xa8\xa8\x84\x7c\x8d\xd2\
+\x9b\x4b\x0c\xc4\x8c\xfc\xa5\xfc\x93\x8e\x33\x57\x94\xe0\x5a\xbc\
+\x33\xbf\xd7\xf3\x46\xcb\x33\x1d\xfd\xe1\x46\xf8\x9e\x1f\x0f\x37\
+\xc2\xf7\xfc\x78\xb8\x11\xbe\xe7\xc7\xc3\x8d\xf0\x3d\x3f\x28\x8b\
+\x4f\xa3\x38\x85\x97\x9b\xaf\x5c\x69\x35\x05\x87\xcf\x0e\x72\x0b\
+\x33\xab\xe5\x59\x17\xe5\xb1\x57\x33\x74\x61\xb0\x67\xec\x6d\x19\
+\x12\x26\x4b\x99\xcb\xb4\xca\x96\x5a\xd9\xfa\xb2\xd5\xd7\x9e\xb2\
+\x55\xd3\x1c\xa0\x76\x5e\x75\xc2\xc5\x46\x31\xe4\x62\x92\x14\x9c\
+\xb8\x69\x6e\x72\x62\x1c\xd2\x08\x63\x1d\xb5\x0a\x56\x25\xcc\x78\
+\x6d\x9f\xe8\x80\x45\xcb\x18\xb3\xa1\x03\x14\x34\x07\xe2\xde\xe7\
+\x24\x9d\xb9\xd1\x48\xe8\x6b\xa9\xc7\x3d\xb8\x5a\xde\x86\xa9\x9e\
+\xe6\xc8\xcd\x68\x2c\x74\xa2\xcd\x94\x11\x93\x3c\x0b\xf2\x1b\xf6\
+\xfb\x5c\xca\xe0\xe1\x39\x1b\xfa\x95\xd4\x85\xb9\x10\xc4\x6d\x3a\
+\x10\xdc\x50\x1a\x9c\xa0\xb2\x4a\x5d\x26\x78\x4f\xd6\x3a\xb9\x54\
+\x8b\xb5\x7a\x77\x2b\x89\xf3\xa8\x98\xdc\xc6\xd6\x5c\x52\x9a\xe8\
+\x47\xb4\x2b\x7c\x13\x87\x61\x61\x14\x99\xdc\x56\x4d\x21\x67\x14\
+\x0e\xa1\x29\x60\xbf\xd2\x62\x49\x1b\xbd\x6c\xa8\x32\x1a\xc6\xb2\
+\x5c\x38\x1a\xfa\x04\x26\xd7\x68\xe8\x68\x3b\x79\x45\x6e\xb6\x85\
+\x26\xc5\xd0\x96\x6d\x09\x9b\x4d\x19\x41\xda\x30\x2d\xa3\x34\xf8\
+\x85\x91\xd3\x68\xc6\x02\x2d\x19\xa5\xbb\x07\x5a\xde\xb6\xb5\x57\
+\x51\x38\xcf\x0b\xe0\x7b\xfe\xe0\xa5\xb7\x25\xd1\x81\xf0\x74\x15\
+\x74\x9a\xda\x35\x88\x6a\x46\xff\xaa\x68\x8b\x63\x35\x60\xc3\xe8\
+\xad\x11\xef\xa9\x0b\x4c\x90\x10\xbe\x2d\xd1\x03\x4e\xe3\xa4\xe9\
+\x00\x52\x9e\x61\xd1\xd5\x95\x6d\x23\xb9\x34\x53\x28\x27\xaf\x31\
+\x40\x36\xd8\xa3\x8e\x27\x75\x4b\xbb\xe5\xf0\x90\xf3\x9b\x45\xa4\
+\x06\xe2\x92\x05\x09\x82\xde\x89\x2c\xc5\xb7\x79\x90\xdc\xad\x9c\
+\xba\xe8\xe1\xf3\x36\x3f\x36\x19\x3e\x6f\xf3\x63\x93\xe1\xf3\x36\
+\x3f\x36\x19\x3e\x6f\xf3\x03\x93\xc0\x36\xfc\x0a\x5c\xa8\x2b\x62\
+\xd8\x9c\x40\x96\x0c\x84\xbd\xb7\x9a\x0c\xb0\x41\xdd\x36\xc7\xca\
+\xe0\x0a\x9d\xc8\xf3\x6d\x7b\xc2\xf3\xe0\x7c\x20\xb9\x1f\xfa\x87\
+\x53\x5f\xbe\x86\x73\xe3\xdb\x9c\xb6\x14\x13\xdc\x8a\x3e\x98\xea\
+\x4a\x6c\x0d\xc5\x8e\x82\x44\x23\xc1\xe6\x2f\x22\xcb\x51\x1d\x96\
+\x91\xf7\x90\x81\xbf\x26\xb6\x3e\x28\x3e\x6c\x92\x40\x69\x32\x03\
+\xa7\x35\x51\x17\x18\xbc\xb0\x71\x2f\x56\x26\xca\x1e\xd5\xe7\xdb\
+\xbb\xc9\x23\x9a\xd7\xc4\x2a\x98\x05\x93\x61\xd6\xc2\x08\x87\x1f\
+\x31\x04\x8e\x8a\x78\x26\x1f\xc5\x30\x02\x0e\x64\x70\x28\xd3\xc0\
+\x48\x98\x0b\x91\xdf\x9e\xea\xb2\xe0\x09\x33\xb8\x04\xe3\xfc\x68\
+\xc5\x53\xbd\x62\x1e\x1d\x8e\xdd\xe6\x01\x64\x22\x82\x05\xaa\xc9\
+\xe2\xff\x05\xf0\xe8\xe3\x65\x6a\xe8\x4e\xb0\x49\x51\x32\x1b\xdb\
+\x91\x17\xf4\x0c\xfb\xea\xed\x4c\xbb\x62\xe9\x06\x9a\xd8\x08\xbb\
+\x91\xcc\x7d\x63\x46\x2c\x9c\xac\x62\x88\xfc\x49\x0e\x1f\xfd\xb0\
+\x78\x43\xaf\xa3\x01\xee\xb1\x31\x85\x6e\x10\xf7\x81\x49\x6f\x58\
+\x75\x82\x56\x34\xd7\xbb\x03\xf1\xb8\x70\xf3\x40\xf4\xe4\x97\xae\
+\xe0\x4e\x7c\xce\x05\x8c\x8e\x2f\x4e\xb8\x0b\xaf\x3c\xc0\x2e\xfb\
+\xee\xc4\xe5\x02\x92\xf0\x89\x13\x6f\x5c\x78\x12\x84\xf0\xdc\x85\
+\xdf\xef\x2b\xe1\x6b\x8d\xe8\x8f\xa2\xff\xb2\x22\xe4\x17\x98\x30\
+\xfc\x03\x69\x77\xd4\xfb\x28\x9b\xd4\x4a\x00\x00\x00\x06\x62\x4b\
+\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\x09\
+\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\x0e\
+\x1b\x00\x00\x00\x07\x74\x49\x4d\x45\x07\xe2\x06\x06\x14\x2c\x02\
+\xf1\x63\xbb\x7b\x00\x00\x0c\x26\x49\x44\x41\x54\x78\xda\xed\xdd\
+\xcf\x6a\x13\x6d\x14\xc0\xe1\x33\x93\xc4\x84\x50\x2a\x4a\x11\x4c\
+\x42\xdd\x1a\x8a\x0b\xf1\xba\x06\x5c\x09\xde\x85\x92\xeb\x72\xab\
+\xe0\xce\xd2\x08\xdd\x46\x37\x63\x66\xf2\x7e\x8b\x0f\x4a\xab\x4d\
+\xd2\x24\x13\xed\x9f\xe7\xd9\xa5\x71\x0e\x2f\x67\x51\xf2\x23\xce\
+\x34\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x80\xcd\x64\x56\x00\x00\x34\xa5\
+\x28\x8a\x64\x0b\x00\x42\x12\x00\xe0\xc6\x11\x39\x1a\x8d\x62\x34\
+\x1a\x45\x44\xc4\x7c\x3e\xb7\x14\x80\xfb\x14\x8f\x59\x16\xed\x76\
+\x5b\x48\x02\x00\xcd\x46\xe4\xc9\xc9\x89\x65\x00\x3c\x00\xb9\x15\
+\x00\x00\x4d\x18\x0c\x06\x96\x00\x20\x24\x01\x00\x6e\xae\xaa\x2a\
+\x4b\x00\x78\x20\xda\x56\x00\x00\x34\xa1\x2c\xcb\x2b\xaf\xeb\xba\
+\x8e\xd9\x6c\x16\x75\x5d\x5b\x0e\xc0\x3d\x90\x65\x59\x74\x3a\x9d\
+\x48\x29\x09\x49\x00\x60\x7f\x61\xf9\xf9\xf3\xe7\xf8\xf9\xf3\xa7\
+\x65\x00\xdc\x33\x42\x12\x00\xd8\xab\xc9\x64\xe2\xe1\x7e\x00\xf7\
+\x8c\x7b\x24\x01\x00\x00\x10\x92\x00\x00\x00\x08\x49\x00\x00\x00\
+\x84\x24\x00\x00\x00\x42\x12\x00\x00\x00\x21\x09\x00\x00\x00\x42\
+\x12\x00\x00\x00\x21\x09\x00\x00\x80\x90\x04\x00\x00\x40\x48\x02\
+\x00\x00\x20\x24\x01\x00\x00\x78\x50\xda\x56\x00\x00\xfc\x0b\x45\
+\x51\xa4\x6d\xaf\x9d\x4c\x26\x99\x0d\x02\x08\x49\x00\xe0\x81\x45\
+\xe4\xf1\xf1\x71\x0c\x87\xc3\x48\x29\xc5\x7c\x3e\x5f\x7b\x4d\xa7\
+\xd3\x89\x88\x88\xb3\xb3\xb3\x28\x8a\x22\xad\x8b\xc9\x7d\x87\xea\
+\x5d\x9f\x0f\x20\x24\x01\x80\x3b\x17\x91\xe3\xf1\x78\xab\xeb\x1f\
+\x3f\x7e\x7c\x31\x67\x59\x30\x15\x45\x91\x46\xa3\x51\x0c\x06\x83\
+\xa8\xaa\x2a\xca\xb2\x5c\x39\x33\xcb\xb2\xe8\x76\xbb\x91\x65\x59\
+\x4c\xa7\xd3\xb5\xa1\xba\xe9\xfc\x88\x88\x6e\xb7\x1b\xed\x76\x3b\
+\xbe\x7f\xff\xde\xf8\xfc\x4d\xcf\x0f\x20\x24\x01\x80\x3b\x67\x38\
+\x1c\xee\x74\xfd\x60\x30\x88\xb3\xb3\xb3\x95\x11\x76\x72\x72\xb2\
+\xd5\xec\xa7\x4f\x9f\xae\x0c\xd5\x5d\xe7\x3f\x79\xf2\x64\xaf\xf3\
+\xd7\x9d\x1f\xa0\x09\x1e\xb6\x03\x00\xfc\x75\x29\xa5\x9d\xae\xaf\
+\xaa\x6a\xe5\xfb\xa3\xd1\x68\xeb\xd9\x59\x96\xad\x0d\xdd\x5d\xe6\
+\xdf\xe4\xfa\x7d\x9f\x1f\x60\x57\xbe\x91\x04\x00\xfe\xba\xdf\xef\
+\x89\xfc\xf5\xeb\x57\xcc\x66\xb3\x6b\xff\x6d\xab\xd5\x8a\xc3\xc3\
+\xc3\x68\xb5\x5a\x17\x3f\xbb\xc9\x7f\x25\xfd\x97\xa1\x7b\xd7\x43\
+\x1d\x40\x48\x02\x00\xb7\xde\x6c\x36\x8b\x4f\x9f\x3e\x5d\xfb\xde\
+\xc1\xc1\x41\xbc\x7e\xfd\x3a\xfa\xfd\xfe\xd6\xa1\x5a\xd7\xf5\xd2\
+\xf8\xcc\xf3\xfc\xe2\xfe\xc2\xcb\x61\xdb\xd4\xfc\x88\xff\xef\x8f\
+\xbc\x1c\xc2\xeb\xbe\x51\xdd\xf7\xf9\x01\x84\x24\x00\x70\x6f\x5c\
+\x77\x4f\xdf\xfb\xf7\xef\x77\xfe\x7a\x6d\x36\x9b\xc5\x97\x2f\x5f\
+\xae\x7d\xaf\xdf\xef\xc7\xcb\x97\x2f\xa3\xd7\xeb\x5d\xfc\x6c\xb1\
+\x58\x34\x36\x3f\x22\x62\x3c\x1e\x5f\xdc\x1b\x19\xb1\xf9\x37\x86\
+\xfb\x3e\x3f\x80\x90\x04\x00\xf8\x4d\x5d\xd7\xf1\xe3\xc7\x8f\xa5\
+\xa1\xba\x6b\x78\xad\x9a\x5f\x14\x45\xaa\xeb\xfa\x56\x9f\x1f\x60\
+\x53\x1e\xb6\x03\x00\x00\x80\x90\x04\x00\x00\x40\x48\x02\x00\x0f\
+\x54\x5d\xd7\x7f\xdc\xf3\x97\xe7\x3e\xc2\x00\x08\x49\x00\x80\x25\
+\xca\xb2\xfc\xe3\x29\xa7\x9d\x4e\xc7\x62\x00\x84\x24\x00\xc0\xf5\
+\x16\x8b\x45\xfc\xfe\xb0\x9a\xcb\x7f\xea\x02\x00\x21\x09\x00\xf0\
+\x87\x4d\xff\x5c\x06\x00\x42\x12\x00\x00\x00\x21\x09\x00\x00\x80\
+\x90\x04\x00\x00\x40\x48\x02\x00\x00\x80\x90\x04\x00\x00\x40\x48\
+\x02\x00\x00\x20\x24\x01\x00\x00\x10\x92\x00\x00\x00\x08\x49\x00\
+\x00\x00\x84\x24\x00\x00\x00\x08\x49\x00\x00\x00\x84\x24\x00\x00\
+\x00\x42\x12\x00\x78\xa0\xb2\x2c\xb3\x04\x00\x21\x09\x00\xb0\x5c\
+\x4a\xe9\xca\xeb\x56\xab\x15\x79\xee\x63\x09\x80\x90\x04\x00\x58\
+\x62\x3e\x9f\x5f\x79\xdd\x6e\xb7\xa3\xdb\xed\x5a\x0c\x80\x90\x04\
+\x00\xb8\xde\x62\xb1\xb8\xfa\x81\x24\xcf\xa3\xd5\x6a\x59\x0c\x80\
+\x90\x04\x00\x00\x40\x48\x02\x00\x00\x20\x24\xad\x00\x00\x00\x00\
+\x21\x09\x00\x00\x80\x90\x04\x00\x00\x40\x48\x02\x00\x00\x20\x24\
+\x01\x00\x00\x10\x92\x00\x00\x00\x20\x24\x01\x00\x00\x10\x92\x00\
+\x00\x00\xfc\x15\x6d\x2b\x00\x00\xee\xaa\xa2\x28\x92\xf9\xff\x6e\
+\x3e\x20\x24\x01\x00\x1a\x95\xe7\x79\xf4\xfb\xfd\x78\xf7\xee\x5d\
+\x2a\xcb\x32\x16\x8b\x45\x63\xb3\x0f\x0f\x0f\xe3\xcd\x9b\x37\x2b\
+\xdf\xdf\xc5\xd1\xd1\xd1\x5e\xe7\xff\xeb\xf3\x03\xec\xa2\x2c\x4b\
+\x21\x09\x00\x34\x23\xcb\xb2\x2b\xaf\xbb\xdd\x6e\x8c\xc7\xe3\xa8\
+\xaa\x2a\xaa\xaa\x8a\xba\xae\x23\xa5\xff\xbf\x20\x3b\x38\x38\xd8\
+\x68\x76\xa7\xd3\xb9\xf2\xfa\xd1\xa3\x47\x71\x74\x74\xb4\xf5\xf5\
+\xd7\x45\xef\x65\xbd\x5e\x2f\x7a\xbd\x5e\x63\xf3\x6f\xfb\xf9\x01\
+\x36\x25\x24\x01\x80\x46\x74\xbb\xdd\x3f\xc2\xf2\xa6\x31\xf3\x7b\
+\x08\xad\x8b\xd4\x5d\x23\xf7\xb2\xba\xae\x1b\x8f\xe8\xbb\x76\x7e\
+\x80\x4d\x79\xd8\x0e\x00\xd0\x88\x5d\x62\x29\xa5\xb4\x32\x88\xa6\
+\xd3\xe9\x4e\x67\x5b\x75\x7d\x59\x96\x71\x7e\x7e\xbe\xb7\xf9\x77\
+\xe1\xfc\x00\x1b\xff\xce\xb7\x02\x00\x60\x57\x45\x51\xa4\xe7\xcf\
+\x9f\xc7\xab\x57\xaf\xb6\x0a\xca\x6f\xdf\xbe\xc5\xd7\xaf\x5f\xe3\
+\xe3\xc7\x8f\xd9\xb2\xf9\xc7\xc7\xc7\x31\x1c\x0e\x23\xa5\x14\xf3\
+\xf9\x7c\xed\xcc\x4e\xa7\x13\x59\x96\xc5\x74\x3a\x8d\xd3\xd3\xd3\
+\x98\x4c\x26\x4b\x0f\xf6\xf6\xed\xdb\xf4\xe2\xc5\x8b\x78\xf6\xec\
+\x59\xa4\x94\xa2\xaa\xaa\x46\xe7\xdf\xc6\xf3\x03\x6c\xab\x2c\x4b\
+\x21\x09\x00\x34\x1b\x93\xc3\xe1\xf0\xe2\x83\x46\x4a\x29\xb2\x2c\
+\xbb\x88\xa2\xcb\x5a\xad\x56\xe4\x79\x1e\xe7\xe7\xe7\x71\x7a\x7a\
+\x1a\x1f\x3e\x7c\xc8\xd6\xcd\xdf\xf6\x6c\xab\x22\xcc\x7c\x80\xcd\
+\x09\x49\x00\xa0\xd1\x98\xdc\x57\x28\x01\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x2c\xf3\x1f\x0c\x23\
+\xf1\x14\x27\xdc\x19\x41\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
+\x60\x82\
+\x00\x00\x22\xfa\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\xfa\x00\x00\x00\xfa\x08\x06\x00\x00\x00\x88\xec\x5a\x3d\
+\x00\x00\x13\x0d\x7a\x54\x58\x74\x52\x61\x77\x20\x70\x72\x6f\x66\
+\x69\x6c\x65\x20\x74\x79\x70\x65\x20\x65\x78\x69\x66\x00\x00\x78\
+\xda\xd5\x9a\x57\x72\x1c\xb1\x15\x45\xff\xb1\x0a\x2f\x01\x39\x2c\
+\x07\xb1\xca\x3b\xf0\xf2\x7d\x2e\xa6\x49\x49\x14\xad\x60\xc9\x1f\
+\x26\x4b\x1c\x4e\x73\x1a\x0d\xbc\x70\x03\x20\xb3\xff\xf5\xcf\x63\
+\xfe\xc1\x57\x0a\xb6\x9a\x98\x4a\xcd\x2d\x67\xcb\x57\x6c\xb1\xf9\
+\xce\x2f\xd5\xbe\xbe\x5e\xaf\xce\xc6\xfb\xf3\x7e\x9d\xfe\xfc\xcd\
+\x7d\x7b\xdd\xbc\xff\xc1\x73\x29\xf0\x1a\x5e\x6f\xf3\x7e\x3e\xdf\
+\xb9\x9e\xbe\xdc\x50\xe2\x73\x7d\x7c\x7b\xdd\x94\xf9\x8c\x53\x9f\
+\x81\xdc\xfb\xc0\xf7\x2b\xe8\xc9\xfa\xfd\xf9\x5c\x7d\x06\x0a\xfe\
+\x75\xdd\x3d\xef\x4d\x7b\xee\xeb\xf1\xab\xe5\x3c\xff\xfc\x7c\x86\
+\x7d\x06\xff\xf8\x3e\x16\x82\xb1\x12\xe3\x05\x6f\xfc\x0e\x2e\x58\
+\x7e\x7a\x3d\x25\x30\x83\x50\x43\xe7\x35\xf1\xd3\x87\xac\x0f\x85\
+\xc0\xef\x8e\xef\xce\x6f\xee\xf3\xd8\x99\xf7\x5f\x3f\x04\xef\xfd\
+\xb7\x0f\xb1\xb3\xfd\xb9\x1e\xbe\x0d\x85\xb1\xf9\xf9\x40\xfe\x10\
+\xa3\xe7\xba\x4b\x1f\xae\x87\xf7\xc7\xf8\x6f\x66\xe4\xbe\x3c\xf9\
+\x9b\x3f\xf4\xe4\x82\xfd\xfa\xeb\xab\xd8\x9d\xb3\xea\x39\xfb\xb5\
+\xba\x1e\x33\x91\xca\xe6\x59\xd4\xdb\x52\xee\x6f\x7c\x70\x10\xca\
+\x70\x6f\xcb\x7c\x17\xfe\x25\x7e\x2f\xf7\xbb\xf1\x5d\x59\xe2\x24\
+\x63\x8b\x6c\x0e\xbe\xa7\x71\xcd\x79\x9e\x7d\x5c\x74\xcb\x75\x77\
+\xdc\xbe\xaf\xd3\x4d\xa6\x18\xfd\xf6\x85\x57\xef\xa7\x0f\xf7\x5a\
+\x0d\xc5\x37\x3f\x6f\x52\xa2\xbe\xdd\xf1\x25\xb4\xb0\x0c\x39\xf2\
+\x61\x92\xb5\xc0\x65\xff\x3e\x17\x77\x9f\xdb\xee\xf3\xa6\xab\x3c\
+\x79\x39\x3e\xe9\x1d\x83\x39\xee\xf8\xee\xdb\x7c\x76\xf1\xbf\xf9\
+\x7e\x1f\xe8\x1c\x95\xae\x73\xb6\xbe\xc7\x8a\x79\x79\xd5\x34\xd3\
+\x50\xe6\xf4\x93\x4f\x91\x10\x77\x9e\x98\xa6\x1b\xdf\xfb\x6d\xbe\
+\xaa\x1b\xfb\x55\x62\x03\x19\x4c\x37\xcc\x95\x05\x76\x3b\x5e\x43\
+\x8c\xe4\xbe\xd4\x56\xb8\x79\x0e\x7c\x2e\xd9\x68\xec\xab\x35\x5c\
+\x59\xcf\x00\x84\x88\x67\x27\x26\x43\x2d\x47\x67\xb3\x0b\xc9\x65\
+\x67\x8b\xf7\xc5\x39\xe2\x58\xc9\x4f\x67\xe6\x3e\x44\x3f\xc8\x80\
+\x4b\xc9\x2f\x67\x0e\xb9\x09\x74\x42\xf1\xd5\xeb\xd9\xdc\x53\xdc\
+\xfd\xac\x4f\xfe\x75\x19\x68\x21\x11\x29\xe4\x50\x48\x4d\x0b\x9d\
+\x64\xc5\x98\xa8\x9f\x12\x2b\x35\xd4\x53\x48\xd1\xa4\x94\x72\x2a\
+\xa9\xa6\x96\x7a\x0e\x39\xe6\x94\x73\x2e\x59\x18\xd5\x4b\x28\xb1\
+\xa4\x92\x4b\x29\xb5\xb4\xd2\x6b\xa8\xb1\xa6\x9a\x6b\xa9\xb5\xb6\
+\xda\x9b\x6f\x01\x08\x4b\x2d\xb7\x62\x5a\x6d\xad\xf5\xce\x43\x3b\
+\x43\x77\xee\xee\x7c\xa2\xf7\xe1\x47\x18\x71\xa4\x91\x47\x19\x75\
+\xb4\xd1\x27\xe5\x33\xe3\x4c\x33\xcf\x32\xeb\x6c\xb3\x2f\xbf\xc2\
+\xa2\xfd\x57\x5e\xc5\xac\xba\xda\xea\xdb\x6d\x4a\x69\xc7\x9d\x76\
+\xde\x65\xd7\xdd\x76\x3f\xd4\xda\x09\x27\x9e\x74\xf2\x29\xa7\x9e\
+\x76\xfa\x7b\xd6\x9e\xac\x7e\x9b\x35\xf7\x21\x73\x3f\xce\x9a\x7b\
+\xb2\xa6\x8c\xc5\xfb\xb9\xf2\x25\x6b\x5c\x2e\xe5\x6d\x08\x27\x38\
+\x49\xca\x19\x19\xf3\xd1\x91\xf1\xa2\x0c\x50\xd0\x5e\x39\xb3\xd5\
+\xc5\xe8\x95\x39\xe5\xcc\x36\xc1\x55\xf2\x64\xcd\x25\x25\x67\x39\
+\x65\x8c\x0c\xc6\xed\x7c\x3a\xee\x3d\x77\x5f\x32\xf7\xc3\xbc\x99\
+\x14\x7f\x2b\x6f\xfe\x3f\x65\xce\x28\x75\x7f\x23\x73\x46\xa9\x7b\
+\x32\xf7\x7d\xde\x3e\xc9\xda\xea\x97\x51\xc2\x4d\x90\xba\x50\x31\
+\xb5\xe1\x00\x6c\x7c\x60\xd7\xee\x6b\x17\x27\x7d\xff\xda\xa3\x4a\
+\xbe\x6f\x1e\xe4\x99\x58\xa9\x3d\xb6\x5e\x5a\x9a\x3e\x16\x37\x73\
+\x4f\xad\xad\xda\xa6\x10\xd2\x6e\x08\xb6\xd4\x99\x2e\xc1\xa4\xd2\
+\x77\xa9\x6e\x6c\x1b\xf6\x48\xdb\xbb\x58\xf7\x39\x69\x97\x16\x62\
+\x19\xf0\x4d\x2c\x0d\x1c\x24\x1b\xc9\x6b\x6e\xee\x34\xf0\xca\x9a\
+\x6a\xeb\x5a\x35\x67\xd6\x0b\x94\xe6\x46\xcb\xf6\x53\xca\xa1\x72\
+\x66\xc8\xc7\xf6\x52\xc1\x4e\x5f\x96\x1f\xb1\xd7\xb3\x57\x25\x7e\
+\xe3\xe8\xf3\xad\xe5\x34\x6b\xf2\x3d\x55\x97\xcd\x16\x16\xce\x12\
+\x78\x16\x89\xdd\xad\x4e\xca\x8f\xe5\xd2\xa7\xf6\xe8\x4a\x28\x87\
+\x40\xf4\xbd\x96\xdb\x71\x85\x6d\xd7\x4e\xae\xe7\x15\x0b\x48\x41\
+\xb9\x95\x70\xa8\xda\x65\x76\x74\x5b\x51\x8b\xe4\xe0\xe4\x50\x09\
+\xee\x72\xe1\x30\xc5\x45\x99\xad\x53\xf2\x20\x0f\x69\xf1\x76\x80\
+\x2c\xab\x65\xdb\x87\xf3\x33\x43\x24\xad\x92\x17\xab\x1c\x16\x67\
+\xa8\x8b\xb4\xdb\xd2\xa3\xd7\xba\x11\xde\x64\x6a\x9e\x9a\xca\xb6\
+\x79\x81\xe7\xeb\x8c\x50\xb4\xf8\x1c\x4f\x28\x6e\x8c\xbd\x72\x67\
+\x04\x57\x27\x2c\xbd\x29\xb7\x35\x68\xda\x91\x43\x60\xc4\x6e\xfb\
+\x1e\x1e\xb4\x72\x94\x0d\x99\x59\x7b\x6d\x5f\xb7\xab\xde\x47\xdb\
+\xdc\x2c\xae\xd7\x44\xf1\xbe\xf8\x31\x88\xe0\x18\x25\xf9\x24\x11\
+\xc1\x8f\x64\xde\x7e\xb9\xaf\xc5\x97\xde\xca\x0c\xb4\x77\xcc\x7d\
+\xe4\x3d\x6c\x9a\xcc\x26\xc4\x45\x47\x14\x4b\x80\xa8\x49\xbf\xd6\
+\x08\x00\x64\xcb\xf5\x64\x5a\x8d\xc8\x92\xfe\x12\x0f\x7d\xb9\xb2\
+\x46\x02\x4b\x4e\x9f\x67\x4f\x50\xc5\x9d\x31\xd6\x3e\xf0\x68\xa7\
+\x62\x3b\x75\x7c\x7c\x2b\x8c\xe0\xfb\x9a\x31\xd7\x4a\x90\xbd\x27\
+\x4e\x69\xd4\x0d\x06\x98\x41\xac\x61\x38\x58\x2e\xed\xd4\x04\x38\
+\xce\x1f\xaa\x88\xae\x5a\xbe\xef\x06\x63\xf6\x62\xd1\x71\x39\x53\
+\x48\xbb\x04\x4f\x85\x10\x8f\xbc\x61\x50\x31\xa3\x6d\x13\x28\xa8\
+\x26\xb4\x79\x6c\x71\x27\x91\xde\x28\xc8\xf2\x91\x75\x2d\xba\xcb\
+\x79\x82\x38\x63\x12\xa6\x4f\x5a\xc7\x53\x99\xbc\xeb\xf4\x18\x6b\
+\xa4\xdc\x0f\x31\x25\xbe\x6a\xd1\x33\x4c\x01\xb0\x1a\x93\x3a\x76\
+\x95\x3a\xc6\x1c\x94\x4c\x6e\xd0\xc8\x9a\x8d\xc9\xfa\x49\xc2\x19\
+\x00\x75\x52\x2c\x8b\xb5\x95\x1c\x1d\xf8\x7a\x00\x28\x14\x25\x0c\
+\x9d\xb6\x23\xe5\x26\x9f\xd5\x68\x4e\xca\x76\x94\x76\x92\xa5\xa4\
+\x17\x63\xf4\xba\xc6\x04\x2f\x08\x6e\xcf\xe9\x1c\xca\x0c\x7c\xa4\
+\xf4\x7a\xe5\x72\xd9\x87\x36\x73\x51\x82\x84\x8a\xa0\x76\x9d\x41\
+\x25\x80\x48\x75\x90\xa0\x41\xd1\xf9\xe3\x23\xd8\xc1\xc0\x6d\x2f\
+\xbf\x3b\x53\x3f\x35\xd3\x88\x93\x14\x22\x13\xeb\xec\x6d\x03\x68\
+\xa0\xe6\x71\xbd\x9f\xf7\x9c\x9b\xaf\x92\xff\x83\xd7\xd2\x3d\x55\
+\xd1\x4e\x8d\x8b\x46\xab\x20\x8e\x27\xa5\x19\x30\xe5\xb1\x87\x8e\
+\x2a\x2c\x8d\x59\xd0\x6e\xae\xf3\x99\x68\xe1\x4e\x3d\x52\x68\x40\
+\x2f\x2f\xc4\xe4\x5a\xb1\xea\x2f\xa1\x0d\xb2\x42\xfb\x9d\x14\x0f\
+\x51\x19\x2d\x9f\x5e\x48\x6b\xa6\x79\xa2\x37\xe4\xd8\xa7\x49\x77\
+\xc4\x34\x9a\x5f\xcd\xee\xe2\xf7\x44\x14\x91\x19\x09\xcf\x46\x4f\
+\x80\xde\x93\x62\x4a\x88\xb4\xc4\x42\x4f\x77\xa5\xda\x3d\x27\x88\
+\x98\xdd\x09\x23\x01\xe9\x06\x90\xa3\x21\x0f\x98\xb0\x04\x88\x2d\
+\x00\xf9\x5c\xa3\xdc\xd0\x56\x67\x74\x46\xa7\xfe\xa8\x06\xa1\x81\
+\x55\x42\xb7\xa3\x05\x57\x89\xd4\x0b\xfd\x27\x2c\x8e\x76\x27\x73\
+\xb2\x14\x58\x6a\xf5\x24\x3f\x27\xa5\x90\xa9\x31\x54\x61\x20\x4b\
+\x01\x05\x9b\x7a\x8b\xbf\x12\x47\xf3\xc3\x0f\xb8\x79\x4e\x1d\x61\
+\xba\xa2\xd5\x30\x8b\x9d\x46\xa0\xf7\x97\x30\x01\xe0\xa5\xa7\x61\
+\x1d\x66\x42\x8c\x26\x7a\x90\x1a\xb2\x47\xe5\xba\x53\x6c\x32\x07\
+\xc4\xa2\xcc\xee\x00\x14\x24\x15\x3c\xd4\xc1\x49\x7b\x52\x05\xb2\
+\x1b\x68\x39\x80\x9d\xb8\x21\xc7\xdc\xa1\x8b\x3c\x2b\x65\x6f\x26\
+\x41\x18\xd3\x01\x57\x93\xaa\x75\xd4\x0f\x2d\xab\xaa\x45\xf7\x9c\
+\x4c\x84\xc3\x4a\x85\x27\xb9\x45\x94\xc6\xa8\x8b\x52\x0e\x83\x62\
+\xdf\x79\xee\xed\xe0\xc1\x01\x0e\x22\x8f\xdd\x99\x0c\x5d\xa4\xae\
+\x26\xfd\xe3\x84\x40\x15\xdc\xb7\xb3\x7b\xf0\x2a\x50\xb0\xf4\x31\
+\x05\x4b\x0f\xa5\x09\x4c\xd0\xe5\x8e\x96\x8e\xa3\x2f\x1b\xbd\x6b\
+\xb0\x0c\xe0\xbe\x0d\x91\x9e\x16\x4e\xa7\x0b\xc9\x7b\x0d\x01\x04\
+\x0f\x80\x99\x85\x5c\xe3\x12\x0d\x6e\x50\xac\x5f\x82\xfa\xfc\xf5\
+\xc4\x48\xa1\x9a\xa5\x9c\x66\x5a\x07\x0a\x76\x14\x2c\xf5\x05\xb3\
+\x0b\x8e\x62\x51\x84\xe2\x68\xa1\x34\x40\x16\xc9\xd0\x9c\xf3\x0d\
+\xc4\xa5\x5c\x6d\xa2\xba\xa6\xa7\xf9\x62\xa7\xa5\x43\x34\xdc\x13\
+\xca\xf4\xb9\x8d\x89\x02\x80\x09\x67\x1e\x28\x8c\x3b\x56\xa5\x27\
+\xa8\x2a\x90\x8d\x96\x3d\xbe\x8b\xca\x51\x31\xe0\xb7\x3b\x1b\x32\
+\x2e\x1e\x60\x27\x0f\x2c\x27\x8b\xb2\xf7\xc3\xa0\xa1\x66\x5b\x9b\
+\x7d\x18\x14\x8d\x49\x01\x5c\xbb\x77\x9b\x1c\x02\x45\xef\x38\xc0\
+\x16\x5c\x48\x19\x1a\x77\x11\x0a\x61\x92\x16\xa0\x0a\xa6\xae\xc8\
+\xa3\x90\x3d\xc2\x73\xa7\xfb\xa8\x0e\x34\xc6\x4f\x02\xf3\xdd\xab\
+\xf9\x95\x0f\x9e\x36\x03\xb8\x4c\xf6\x36\x80\xde\x15\xbe\x4a\x28\
+\x10\xc3\xeb\x1c\x90\x79\x53\x03\x66\x11\xb4\x55\x0e\xac\x36\x56\
+\x8e\x78\x14\x02\x1c\xe6\xa1\x78\x4e\x25\x24\x00\xc4\xde\x65\xb9\
+\x03\x13\x59\xfc\xaf\x7b\x69\x03\x08\x8c\xee\x75\xe2\xbb\x41\x11\
+\x83\x81\x06\x7b\x49\x9a\x20\x1c\x37\x1a\xb9\xd8\x34\x6d\x84\xca\
+\x8b\x67\x99\x04\x71\x83\xd0\x8b\x02\x83\xce\x04\xaf\x14\x58\x9a\
+\xa8\x86\x25\x57\xac\x3e\x7a\xbd\x82\xe7\x18\xbf\xb8\xd0\x64\xd4\
+\xf1\x50\x10\x3d\xf4\x3e\x11\xb9\x3e\x10\x40\xb5\xf1\x9e\x17\x50\
+\x11\xfe\x6a\xe4\xac\x62\x2d\x34\x1f\x88\xc2\xac\x2f\xb5\xd2\x7f\
+\xa0\x92\xe9\x70\x55\xdc\xcb\x4a\x6b\x34\x29\xbd\xe6\xf2\x86\x6f\
+\x22\xf4\x02\x12\x21\x51\xa0\x55\x04\xad\x8f\x10\x10\x2a\x37\xa8\
+\x71\x36\xab\x0e\x89\xe2\x28\x23\x22\x09\x16\x7e\xce\xd0\x2d\xa9\
+\xb3\x38\x5a\x86\x4e\xb6\x2a\xb4\x95\xda\xb8\xe6\x3c\x02\x95\xcc\
+\x8c\x02\xcc\xa3\x1d\x41\x1a\xdd\x3c\x20\x1c\x4a\x0c\xe5\xc4\x63\
+\x22\x37\xf5\x44\xb8\x8f\x81\x5b\xb7\x6c\x07\xc0\x50\xa0\x17\x3b\
+\xdb\x2e\x19\xb3\x40\x66\x22\x61\x86\x3a\x5c\x87\x0b\x7f\x9a\x5c\
+\xf3\x9b\xe5\xf2\xfd\x2b\xad\x8d\x57\x5e\x66\x50\xe3\xbd\x80\xda\
+\x4c\x36\x96\xad\x75\x22\x18\x8e\x9d\xb3\x8d\x5a\x97\x68\x95\x3c\
+\xa3\x47\x2a\xb9\x2b\x1d\x9c\x82\x96\x9d\xe0\x0b\x7d\x72\x84\x52\
+\x74\x29\x3d\x6a\xc2\xdc\x4d\xf4\x8c\xcc\x82\x29\x43\x6b\x29\xcd\
+\xa9\xe5\xf0\xd9\x89\x87\xa0\x6d\xdc\x8a\x37\xe8\x41\x0d\xfb\x8a\
+\x36\xf8\x42\xe9\xf1\xbc\xc6\x4d\xd4\xe1\x44\xf9\x97\xd4\xe1\xa8\
+\x80\xac\x40\x17\x83\x35\x68\x02\x2b\xb9\x1e\x53\x68\x29\xa3\x02\
+\x37\x88\x29\x14\x6d\x9a\x58\x9b\x4b\x85\x19\xa9\x1e\x95\x03\xa6\
+\x50\xe2\x64\xe4\x63\xe4\x0a\x81\xa0\xe3\xa4\xdf\xd1\x3a\x0e\x34\
+\xd4\x16\x49\xbd\x0a\x41\x52\x81\xd6\x7b\x61\x12\xab\xd0\x5a\x10\
+\x72\x49\x8b\xab\x2d\x21\x76\xa1\x4b\x60\x27\x3b\xd3\x81\xba\x30\
+\xb9\x0f\x44\x04\x7b\x66\xcd\x49\xaa\xce\x6b\x73\x60\x8a\x9b\x67\
+\x8b\x13\xa1\x89\xc8\x06\xe3\x90\x7d\x81\x32\x58\xa0\x31\x8a\xb7\
+\x0a\xc9\xa1\x25\x0f\x94\x18\xea\x17\xce\x07\x62\x90\x1a\x08\x5f\
+\xe9\xd9\x5d\x8a\xb3\x2a\x11\xcd\x05\x97\x54\x32\x05\xc5\xfa\x56\
+\x15\xb1\x5c\x4d\xf6\x3d\xe5\x98\xf8\x6b\xe4\xff\xd3\xd7\x4f\x06\
+\x82\x84\x69\x82\x65\x51\xb5\xad\x42\x20\x0b\x95\x5c\x40\x35\x35\
+\x13\xb9\xa7\x27\xcf\xc0\x16\x1d\x97\x74\xcb\x81\x50\x12\x82\xc0\
+\x50\x3d\xa3\x57\xa8\x85\x3e\x6e\x91\xce\x9c\x23\x81\x36\x50\xfd\
+\x20\xc1\x15\xee\x10\xb0\x4c\x9f\xd6\x46\x39\x25\xec\xb6\xf3\x18\
+\x2e\xde\xc7\x04\xa3\x63\xf4\xa8\x49\x84\x9c\x71\x0b\xa5\x44\x37\
+\xb7\x52\x90\x8c\xe0\x44\x90\x7c\x46\x4c\x56\x29\x12\x9a\x0c\xb1\
+\x89\x92\xde\x58\x1a\x34\x41\xd3\xa6\x0b\x88\x5e\x78\x97\x20\xd9\
+\xcb\x63\x16\x73\x02\x8c\x20\x97\x15\x42\x88\x07\xc9\x61\x1d\x18\
+\x45\xe5\x82\x02\x3d\xad\xc1\xb3\x71\x95\x07\x21\x84\xa1\x73\x2d\
+\x81\x10\x2a\x70\xb8\x77\x77\x75\x65\xa2\x3c\x20\x53\x2a\xbe\x18\
+\xad\x12\x16\xad\x68\x16\xe4\x22\x25\xe0\xb1\x21\x19\x25\x89\xca\
+\x67\x26\xea\x65\x09\xc9\x10\x00\xd2\xe5\x84\xee\x25\xcf\x40\x4f\
+\x05\xca\xb3\x00\x5b\x67\x54\x3e\x9c\xa9\xec\xf8\x1f\x8c\xda\xef\
+\xbd\x9a\xdf\xbc\x61\x6c\xf1\xea\x1a\xdd\x8a\x96\x89\x41\xa6\xf0\
+\x7c\xa2\xfb\xb3\x25\xfc\x8e\xb7\xf0\x58\x6b\x95\x46\x46\xb4\xa2\
+\xdc\x76\x8d\xb3\xde\xe8\xd3\x30\xc2\xa6\x8a\x0f\x1c\x24\xbd\xe0\
+\x46\xa5\x1a\xce\x40\xbd\x21\xb2\xe6\x4a\x8b\x44\x9a\x02\xf9\xa3\
+\xf5\x66\x5c\x83\x1e\x02\xab\x5b\x22\x36\x59\x99\x6f\x4d\x98\x0f\
+\x21\x9f\x06\x18\xb6\x2b\x2e\x46\x95\x6f\xea\x90\x08\x40\x00\x65\
+\x6b\x27\xe9\x80\x9a\xcd\x2c\x7a\x1e\xa2\x42\xc9\x0c\x4c\x0c\xc9\
+\x6b\xb8\xe8\x01\xb0\xe0\x0e\x42\x41\x8f\x2f\x29\xcf\x00\x10\x65\
+\x97\xb4\x61\x40\x87\xd2\xec\x0f\x57\x38\xa9\x2b\x58\xc7\xc3\xb4\
+\x34\x9b\xed\xea\xb2\xbb\xf1\x78\xf7\x23\x64\x0b\x7e\x37\x05\xa6\
+\xfe\x8d\x9c\xa1\x58\x0c\x15\xbc\x3a\x95\x81\x8a\x47\x17\x1d\xf1\
+\xdb\x44\xf3\x4b\x34\xb3\x38\x48\x12\xfd\x11\x46\xf7\x58\x45\x60\
+\x09\xdf\x1a\x24\x9d\xe5\xb7\x56\x40\xa6\xa4\xf6\x90\xa4\x79\x67\
+\xcb\x3f\x7c\xfd\x3f\x1e\x08\xbb\x0b\x47\x95\x44\xaf\x25\xf9\x08\
+\x5c\xda\x82\xaf\x1c\x24\x01\x4b\x23\x22\xc6\xd5\x1d\x48\xcf\x18\
+\x51\x0f\x59\xc4\x80\xa3\x02\x98\x0a\x7e\xb3\xd3\x88\x98\xef\x5f\
+\x61\x4b\xf3\x67\x34\xfb\xf9\x40\x3b\xc2\x61\x10\x7f\xb2\x1b\xa6\
+\xb1\x13\x68\x42\xef\x04\x99\x58\x7c\x79\x04\x95\x74\x5a\x80\x22\
+\x68\x11\x9d\xdb\x69\xae\x00\x15\x03\xc8\x27\x4f\x41\x6d\x93\xe7\
+\x70\xd7\xa4\xe3\xd5\x17\xf5\xe4\x71\x32\x1b\xc3\x85\x83\x9a\xd0\
+\x62\xc9\x3e\x81\xb4\xc5\x57\x98\xbb\x8f\xe9\xc1\x2a\x70\x90\xee\
+\x73\x6a\xc6\x02\x8e\xed\x68\x1a\xe6\x76\xe1\x16\x3c\x16\x11\x5f\
+\x0d\x19\x47\xe9\xe2\x91\xfd\xf0\x23\x22\x95\x33\x93\x5d\x59\x7d\
+\xdd\x69\x6d\xb0\xcc\x76\xed\x2a\x44\xaf\x30\xd3\x91\x58\xf5\x37\
+\x84\xc4\xa9\xff\x79\x05\x98\xdf\xbe\x11\x85\x25\xf0\x40\x3f\x6d\
+\xec\x6c\x96\x90\xc8\xad\x75\x13\xbd\xf4\x88\x4f\x67\x2d\x94\xc8\
+\xc8\x0e\xe3\x08\x7b\xe1\xb6\x51\x07\x27\x1c\x6d\xc1\x44\xe9\xf2\
+\xe3\xb7\x34\x7e\x42\xed\xa1\x6d\x30\x05\x6e\x14\xc8\x7f\x95\xb1\
+\x3d\x32\xd9\x20\xf0\x16\xe6\x0a\xfa\xf3\x50\x54\x0f\x1e\x0d\xc1\
+\xb8\xb8\x88\xed\x68\xcc\x58\xa5\x40\x44\x3c\xa0\xcc\x1e\xbc\x87\
+\x7c\x8e\x8a\xed\x6e\x56\x38\x0c\xd3\x98\xd4\x63\x30\xda\xad\xa0\
+\xa5\x9b\x0e\x65\x5e\xbb\x15\x10\x15\xbc\x25\x2d\xb2\x33\xa2\x01\
+\x6f\x8d\x6e\x68\xe8\x21\x3c\xcf\x41\x40\x37\x84\xac\xab\x47\x46\
+\x0f\xd1\x78\xd6\x56\xf0\x89\x91\x88\x0f\x4e\x41\x78\xf0\xb7\xc1\
+\xea\x94\x89\xa9\x5d\x25\x88\xba\x42\x56\x41\x2e\x9d\xa8\x40\xe2\
+\xb0\xd0\xe5\x5d\x9d\x40\x1c\x0c\x75\x92\xac\xe1\x41\x60\xa5\xe1\
+\x41\x03\xbb\x4c\x04\x10\x37\xc1\x6d\x08\x1b\x34\xda\xdd\x79\x11\
+\x6c\xa4\x36\xea\x2c\x19\xa7\x87\xa3\x46\xbf\xb8\x86\x87\x02\xaa\
+\xa6\x8d\x13\x11\x45\xe4\x60\x5b\x62\xe2\x0d\x9a\x21\xfe\x0d\x3d\
+\x62\x7e\xe7\x06\x77\x17\x06\xca\xe3\xea\x2f\x7f\x54\x38\xc5\x9f\
+\x84\x77\xb0\x46\x4a\x16\xb3\x3f\x1c\xe6\xa5\x59\xfa\x0d\x26\xae\
+\x35\xe2\x42\x21\x34\xed\xf6\x11\x54\x54\x01\x74\x52\x15\x7b\xe4\
+\xca\x2e\xaf\x7d\x52\xd4\x85\xf4\xc5\xb3\x4f\x6a\xe8\x26\x8f\xbd\
+\x7d\x36\x4a\x9b\x3e\x28\xab\x89\xe8\x2c\x08\xa1\xab\x85\x65\x84\
+\x4e\xa2\xc9\x24\xfa\x69\x31\x14\x13\x04\x89\xa4\xd1\x8e\xd0\xe8\
+\x2e\xa7\x1c\x9c\x59\x13\xb1\x32\xa8\x24\x0f\x2d\xb6\x84\x1c\x26\
+\x64\xc7\x5b\xf1\xdf\xa9\x32\x38\x52\x2d\x65\x91\xef\x6b\xc1\x4e\
+\x74\x4b\xe2\x58\xdb\x5e\xf6\xe8\x0a\x1d\x4d\xe7\x9a\x70\x52\x86\
+\x6b\x31\x12\x01\xf6\x8d\x58\x63\xe1\x40\x24\x8b\xbb\x23\x17\x99\
+\xb8\x2b\xab\x23\x20\xb5\x35\xdb\x59\xe5\xd6\xbe\x18\x4a\xb2\x8f\
+\xd7\x5e\x5a\xbe\x71\x43\x67\xb3\x2a\x94\x1e\x32\xdc\x6a\x0b\x74\
+\x24\xe6\xb5\x61\xed\x81\x5a\x96\x52\x70\x8b\x94\x3b\x8a\x96\xf7\
+\xc0\x82\xa3\xce\x9d\xef\x09\xef\x95\x91\x81\x4b\x5b\x16\x58\x65\
+\x7b\xa8\xec\x72\xde\xbc\x80\x76\xb1\x76\x7c\xb3\x02\x52\x0b\x8e\
+\x87\xb5\xc7\x0a\xb0\xd6\xce\xfd\xd7\x0a\xa0\xb7\xdc\x4b\xdc\xe1\
+\xa4\xb1\x02\x61\x19\x14\x56\x7a\xfc\x08\xf2\x62\x11\xef\x37\x3f\
+\xd2\x42\xd4\xde\xdb\xcb\x8f\xb8\x14\xa4\xdf\xe5\x25\x3b\xa0\x93\
+\xea\x47\xac\x35\xfd\x2f\x81\xf6\x97\x81\x76\x39\x93\xf0\xf8\xa9\
+\x4d\x33\x84\x6d\xda\x04\x8c\x9c\x6b\xa7\x17\x70\xf4\x3a\x49\xd4\
+\x7e\x73\xa0\x58\x0a\xb2\x03\xa8\x26\x16\x00\x43\x4d\xd0\x94\x35\
+\x72\xf9\xab\x8e\x33\xf6\x28\x28\xc5\xb8\x47\xe3\xcd\xc4\xb0\x0c\
+\x04\x6d\xaa\xac\xb4\x81\xee\x2d\x0c\x6a\x5b\x91\xd3\x76\xa8\x0e\
+\x34\x23\xc2\x77\x87\xed\xc9\x80\xf2\x26\xa8\x45\x1f\xa0\x9f\x50\
+\x0c\xb1\xf1\x40\xa4\x30\xf2\xe1\x8c\xa0\x3d\x36\xba\x14\x8c\xca\
+\x13\xad\x45\x7c\xb5\x4b\xe6\x75\x7c\x81\xc1\xd5\xce\x90\xdd\xd2\
+\x5e\xad\x68\x1a\x66\xd4\x15\x4f\x72\xef\xf3\x98\xa3\x8f\x2e\xcb\
+\xa5\x79\x54\xae\x53\xf0\x77\x1e\xda\x25\x89\xcc\xa3\x9f\x0f\x7d\
+\x78\xf7\x01\x9c\xa9\xda\x4a\x79\x36\x02\x6a\x99\x61\xf5\x49\x83\
+\x3d\xfb\x00\xf0\x4d\x64\xa4\x67\x1f\x40\xe7\x01\xaf\x7d\x00\x6d\
+\x38\x69\x1f\x00\x43\xb6\xf3\xdd\x07\x90\x17\x71\x87\x8a\xa1\x18\
+\x02\xe3\xb8\x7d\xea\x0c\x54\x81\x6c\x22\x8d\xc5\x53\x94\x05\x3a\
+\x94\xc8\x96\x2c\xac\x0a\x24\xa5\x8c\xd2\x41\x51\x7a\xa6\xe9\x0c\
+\x85\x9e\x0c\x86\x86\x99\xe3\x94\xb0\xeb\xf9\x5f\xe9\xec\x81\x36\
+\xbe\xf3\x73\xb5\xa0\x85\x31\x4c\x32\xaa\x4c\x13\x76\x61\x7e\x83\
+\xf8\x6f\x3a\x8d\x5c\xdc\xac\xe9\x24\x07\xbd\x6d\x2f\x16\x1f\xb5\
+\x30\x0b\x91\xa8\xc6\xfb\x6c\x0c\x53\x41\xd4\x4a\x12\xcc\xc5\xfa\
+\x70\x5c\x18\x47\x92\x70\xf0\x86\x6d\xd9\x4c\x27\x00\x0e\x60\x85\
+\x37\xa0\x72\xac\x68\x5c\x30\x08\xa5\x38\xa4\x6a\xe9\x03\xed\x5f\
+\x34\x1c\x93\xdb\x3a\xbb\xf9\x21\x78\xde\xa4\x05\x8b\x18\x9d\xa7\
+\xe0\x51\x3b\x78\x87\x84\x67\xce\xf0\x47\xc3\x7a\xdb\x0a\x2f\x4d\
+\x22\x0a\xa3\x83\xf6\xd5\xc6\xbb\xad\x9e\xe9\xf8\x5c\x2c\xed\x0f\
+\xc5\x31\x25\x3a\x3c\x2a\x6d\xe6\x62\x0a\xb6\xa9\xa5\x4e\x85\x53\
+\xd7\xb2\x57\x6a\xe2\x4c\xd3\x97\x82\x99\x2c\xb6\x01\xb1\x4d\xff\
+\x23\x01\x8b\x9d\x21\xbc\x5b\x07\xa2\xbf\x7b\x4a\x5b\x88\xa6\x66\
+\x74\x6d\x7c\xd0\x16\x8e\x2d\xb4\x14\x60\x62\x55\xe5\x1b\x28\x2e\
+\x14\x65\x44\xdc\xc8\x2e\x78\x1d\x14\x59\xb4\x5c\xb0\x29\x5b\xf0\
+\x14\xe9\xac\xdd\xfb\x2a\x81\xd4\x4f\x37\x03\x39\x04\xae\x81\x9b\
+\x63\x0a\x87\x51\x39\xb9\x8e\x02\x25\xe8\xa4\x42\x9b\x1b\x14\x3a\
+\x11\x74\x39\xbb\x26\xb7\x4a\xe4\x75\xf6\xdd\x89\x2c\x7a\xc6\xe6\
+\xaa\xbd\xe1\xab\xfc\xff\x08\x44\x88\x01\x94\x82\xdc\x34\xdd\x41\
+\xe6\x45\xdb\xea\x2c\x25\xa0\x54\x53\xc3\x8d\x31\x1d\xca\x78\xd3\
+\xb0\xf2\x48\xaf\x43\x02\xb1\x0d\xa6\x2b\x82\xe4\x77\x4b\x39\x0b\
+\xce\x2b\x6a\x6c\x6b\xe7\xc0\xe4\xbe\xcf\x94\xef\x2c\x3a\x38\xc2\
+\x2e\x1f\x1f\x11\x67\xdc\xe0\x41\x60\xe2\x00\x5c\x03\x1f\xbc\xcf\
+\x92\x33\x1d\x39\xe3\x88\x3d\xe6\xbb\x90\x1a\x49\x38\x17\x3c\x89\
+\x07\x8f\x30\xee\x80\xfe\xd1\x36\xb0\xfa\x1b\x4a\xd2\xf9\x38\xbe\
+\x0d\x97\x74\x42\xcb\x01\xa6\xc3\xcf\xa2\xa3\xa3\xbd\x3e\x1a\xf0\
+\x8e\xe7\x29\x9b\x4b\x93\x9d\xb2\x31\xf4\x3b\x75\x43\x98\x6d\x23\
+\x21\x40\x8e\x95\xbb\x4e\x5b\x9b\x6a\x51\xc0\x93\x9c\x36\x6b\x1c\
+\x0a\xa9\x49\xd1\x62\x23\xd1\xb4\xb4\xfb\xcf\x94\x7f\xbe\x27\x77\
+\x03\x67\x47\x43\x20\x57\x98\x31\x82\x05\x8a\xcb\xb9\xfa\x44\x69\
+\x00\x27\xb0\x48\xec\x50\x67\xbf\x07\x24\xd1\xab\x52\x75\x76\xb4\
+\xde\x24\x81\x4e\x34\x11\x54\x55\xaa\x40\x5c\x9a\xf0\x90\xfa\xcb\
+\x3d\x8a\x99\xc2\x1a\x34\x12\xe5\x62\x9b\xf6\x49\x4f\x87\x5a\x24\
+\x98\xa6\x2b\x71\x99\xdb\xac\xa8\xbf\x5f\x1b\x2a\x55\xd8\xfd\x3c\
+\x47\x3a\xe8\xab\x61\xd1\x66\xf7\x48\x47\x5b\x63\xc8\x02\x1d\x68\
+\xde\x33\x9d\x28\x97\x7a\xcf\x74\x3c\xf8\xd1\xd7\x05\x76\xba\x2e\
+\x88\x4f\x0f\x99\x7c\x6d\x24\x7a\x5a\xec\xfe\xa5\x75\x69\x42\x1b\
+\x8f\x11\xd8\x2c\x48\xfd\x02\xa1\x55\x05\x51\xba\x2a\x57\x28\x05\
+\x89\x27\xdf\xbc\x20\x11\xd0\xc5\x66\xe1\x49\x1d\x30\x27\x18\x5f\
+\xb4\x61\xed\xd7\x9e\x7e\x9d\xad\xf3\x35\x4b\x55\x20\x5b\x02\xd7\
+\x51\xc8\x30\x3b\x42\x81\x8c\x6d\x46\x1b\x20\xd8\x94\xd3\xae\x6f\
+\x67\x66\xd3\x51\xbf\xfd\x3c\x67\x66\x98\xfe\x50\x9f\x33\xb3\x60\
+\xfc\xc2\xd3\xdb\x7b\x68\x66\xef\xe9\xce\x84\xf4\xb4\xb5\xe7\xbf\
+\x8e\x2b\xcd\xf0\x44\x56\x52\x94\xd8\x0a\x23\x49\x92\xa5\xb4\xe1\
+\x55\xa4\xb2\x79\xb4\x32\x93\x52\x99\xde\x5d\xbb\x4a\xcd\xc6\xca\
+\xa4\xf3\x6b\x67\xe7\x1e\x96\xbe\x09\x66\x9d\x50\x2c\x41\x20\x42\
+\x6f\x59\x42\x97\x04\xa1\x51\x27\x35\x38\x98\x98\x56\x2e\xc8\x04\
+\xa7\x2d\x80\x59\xb0\xd3\xad\x84\xd8\x89\xf8\x6a\xd4\xf4\xd4\x7e\
+\xc4\x49\x34\xda\x64\xe0\x1d\x58\x02\x1f\xa2\x9a\x0a\x9a\x88\x27\
+\x43\x5f\x64\x2d\x2f\xbb\x2e\x58\x2e\x64\xae\x5f\x94\x73\x72\xc4\
+\xa7\x62\xc8\x91\x39\x09\x6a\x43\xbf\x00\xfc\x60\xe3\x60\xa8\xa2\
+\xe3\x68\x11\x2c\x8e\xa9\xaa\xf9\xb3\x0e\x3b\x19\x48\xfb\x18\x41\
+\x9b\x67\x25\x57\xbc\x1f\xda\x0f\xaa\x45\x9d\xde\xb3\x58\x42\x90\
+\x9a\x43\xb6\x51\x43\x09\xd6\x04\xc0\xc0\xe4\x4f\x4f\xa5\xd4\x22\
+\x09\xcb\x31\xa4\x7f\x74\x0e\x99\x1a\x09\x83\x43\x0b\xf4\x6e\xab\
+\xbd\x5b\xd4\x50\x02\x74\x41\x2d\x75\xd6\x00\x82\x6e\x26\x05\xe2\
+\x70\x9b\xf6\xeb\x74\xa4\x33\x9b\xd9\xaa\x1b\x31\xea\x5e\x57\x02\
+\x54\x28\x18\xab\x41\xdd\x31\x47\x12\xda\x11\xcd\xc4\x60\xa9\xf2\
+\x42\xb2\xce\x4b\xa0\xb5\x1a\xfc\xa0\x78\x78\xb8\xce\x92\x24\x98\
+\x6f\x8b\xd4\x09\x7c\x07\xd0\xa5\x2e\x8c\x0b\x6b\x03\xb1\xef\xa9\
+\x56\x82\xc1\xa2\x3a\x80\x65\x83\xb6\x43\x33\x6d\xcc\xc1\xed\x6a\
+\x79\x9a\x25\xe8\xa0\x0c\x64\x80\x86\x44\x93\x38\x3a\x4c\x4e\x04\
+\x2b\x8f\xb7\x00\xb9\x5b\xd7\xf9\x96\x34\x37\x00\xc8\x1d\x9d\x82\
+\x81\x3b\x26\xfa\x06\xed\x3c\x32\x48\x78\x37\xee\xc1\x6e\xed\x02\
+\x17\x1d\x9b\x1a\x2a\x31\xd7\x80\x9d\x4a\x70\x14\x52\x8b\x22\xd4\
+\x49\x77\x6e\x0b\xa3\xd3\x81\xa1\x81\x21\x1c\x67\x69\x5f\x0b\x4f\
+\x35\x6d\xa7\xf2\xda\xd1\xa9\x08\x98\xa7\xad\x61\x82\x88\x0a\x46\
+\xf9\x9f\x0b\x3f\xb0\x23\x4c\x84\x9c\x85\x5d\x5d\x3f\x3a\x9c\x90\
+\x5a\x4f\xf2\x01\x71\xd8\xd6\xbe\x58\x83\xa4\x9f\x60\x67\xd7\xff\
+\x41\x53\xc3\xaa\x5f\xcd\xa7\x0d\x8b\xba\x41\xb7\x1f\x1d\xc9\x71\
+\xd3\xf1\x07\x64\x2c\x63\x40\x4c\x81\xd6\x44\x69\x46\x56\x35\xf2\
+\xfd\xbf\x83\xb3\x5c\x29\x68\x50\x35\xb8\xcf\x6b\xd2\x7f\x86\x48\
+\x3f\xec\x3d\xa3\xe6\x83\x6c\x03\x82\xee\x8f\x06\x33\x6f\x9d\xfc\
+\xa7\x83\x99\xaf\x61\xe1\x19\xec\xf2\x00\x77\xa1\x00\x59\xfb\xbf\
+\x01\xc8\xe6\xaa\x3f\xbd\x26\xb7\x19\x00\x00\x00\x06\x62\x4b\x47\
+\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\x09\x70\
+\x48\x59\x73\x00\x00\x2e\x23\x00\x00\x2e\x23\x01\x78\xa5\x3f\x76\
+\x00\x00\x00\x07\x74\x49\x4d\x45\x07\xe2\x05\x1a\x12\x0b\x21\xd0\
+\x23\x96\x29\x00\x00\x0f\x6e\x49\x44\x41\x54\x78\xda\xed\xdd\x5b\
+\x70\x5d\xd5\x7d\xc7\xf1\xaf\xb6\x05\xb2\x25\x70\x6c\x64\x1b\xd9\
+\xb2\x09\xf1\x14\xd3\x60\x3b\xc5\x6d\x21\xa1\x04\x6c\x42\xc2\x04\
+\x02\x34\xd0\x60\x12\xa0\xb4\x65\xd2\x86\x66\x9a\xe6\xa1\x79\x68\
+\x08\x4d\xa6\x33\x79\x6b\x26\x74\x06\x86\xe9\x25\x4f\x30\x9d\x86\
+\x5c\xc8\x85\x10\xe8\x14\xc7\xdc\x92\x66\x4c\x8c\x81\x40\x28\x30\
+\xa5\xc1\xb2\x2d\x61\x5b\xbe\x11\xc9\x08\x63\xab\x0f\x6b\xc9\x95\
+\x85\x2e\xe7\xe8\xdc\xf6\x5e\xfb\xfb\x99\xf1\xf8\x82\x90\xce\xf9\
+\xaf\xf5\x3b\x6b\xed\xdb\x5a\x6d\xa3\xa3\xa3\xa8\x90\x3a\x80\x85\
+\xc0\x52\x60\x11\x70\x3a\xb0\x0c\x58\x01\xf4\xc6\x5f\xa7\x00\x0b\
+\x80\x93\x81\x79\x40\xd7\x84\xef\x31\x04\x1c\x06\xde\x02\x0e\x00\
+\xbf\x01\x76\xc6\x5f\x7d\xc0\x2e\xe0\x75\x60\x6f\xfc\x7d\x3f\xf0\
+\x26\x60\xa7\x29\x98\x36\x83\x9e\x6b\x73\x81\xe5\xc0\x7b\x81\x75\
+\xc0\x5a\xe0\x77\x80\x95\xc0\x9c\x16\xbe\xae\x5d\xc0\x36\xe0\x17\
+\xc0\x56\xe0\x45\x60\x47\xfc\x10\x90\x41\xd7\x34\xe6\x01\xab\x81\
+\x4b\x80\x4b\x81\x0f\x4e\x32\x02\xe7\xdd\x10\xf0\x24\xb0\x09\xd8\
+\x0c\xbc\x10\x67\x0c\x32\xe8\xa5\xb5\x18\x38\x1f\xb8\x0a\xb8\x06\
+\x58\x92\xe8\xfb\xdc\x0d\x7c\x0f\x78\x00\xd8\x02\xec\xb1\xe9\x0d\
+\x7a\xca\xba\x80\x0b\x81\x3f\x8e\xc1\xee\x2a\x69\x1d\x86\x62\xf0\
+\xef\x05\x7e\x1a\xff\x2e\x83\x5e\x68\xcb\x80\x8d\xc0\xad\xc0\xd9\
+\x96\x63\x52\x2f\x01\xff\x0c\xdc\x17\x8f\xfd\x65\xd0\x0b\xa1\x07\
+\xb8\x01\xf8\x02\xe1\x8c\xb8\x2a\xd7\x0f\xdc\x11\x47\xfb\x01\xcb\
+\x61\xd0\xf3\x66\x01\x70\x73\x0c\xf7\x0a\xcb\x51\x17\x7d\xc0\xd7\
+\x80\x7b\x08\x97\xfe\x64\xd0\x5b\x53\x3b\xe0\x62\xe0\xab\x84\x33\
+\xe4\x6a\x9c\x27\x81\xdb\x81\xc7\xf1\x1a\xbe\x41\x6f\x92\x6e\xe0\
+\xaf\xe3\xe8\xdd\x69\x39\x9a\x6a\x38\x8e\xf2\x77\xe1\xd9\x7b\x83\
+\xde\x20\xe7\xc4\x0e\x76\x89\xa5\xc8\x85\xcd\xc0\x5f\x01\xbf\xb2\
+\x14\x06\xbd\x1e\xd3\xf3\x0f\x01\x77\x03\xab\x2c\x47\x2e\xbd\x0c\
+\x7c\x16\xf8\x89\xd3\xfa\xa9\x65\x96\x60\xca\x80\xdf\x10\xa7\x87\
+\x8f\x18\xf2\x5c\x5b\x15\xdb\x68\x4f\x6c\xb3\x36\x4b\xe2\x88\x5e\
+\x49\xc0\xaf\x01\xfe\x25\x1e\x8b\xab\x78\x06\x81\xcf\x00\xf7\x3b\
+\xc2\x1b\xf4\xc9\x02\x7e\x05\xf0\x0d\xc2\x75\x70\x15\xdf\x00\xf0\
+\x69\xe0\xc7\x06\xde\xa0\x03\xfc\x3e\xf0\x5d\xe0\x0c\xb3\x91\xa4\
+\xed\xc0\x27\x80\xa7\x0c\x7a\x39\x2d\x03\xbe\x0f\x9c\x67\x16\x4a\
+\xe1\x29\xe0\xe3\x94\xf4\x36\xdb\x32\x9e\x8c\x3b\x09\xb8\x93\xb0\
+\xb8\x82\x21\x2f\x8f\xf3\x62\x9b\xdf\x19\xfb\x80\x23\x7a\xc2\xae\
+\x00\xbe\x8d\x37\xba\x94\xdd\x30\x70\x5d\x3c\x7e\x37\xe8\x09\x99\
+\x0f\xfc\x00\xd8\x60\x1f\xd7\x38\x8f\x01\x57\x03\x87\x9c\xba\x17\
+\xdf\x2d\x84\x4b\x2e\x86\x5c\x13\xad\x8f\x7d\xe3\x16\x47\xf4\xe2\
+\xea\x26\xdc\x26\xb9\xd6\xfe\xac\x0a\xfc\x92\x70\x7b\xf3\xa0\x23\
+\x7a\x71\x5c\x4f\xb8\x8e\x6a\xc8\x55\xa9\xb5\xb1\xcf\x5c\xef\x88\
+\x9e\x7f\x1d\x84\x6b\xe2\x1f\xb3\xdf\xaa\x06\x0f\x13\x2e\xc5\x8d\
+\x18\xf4\xfc\x39\x37\x4e\xd5\x17\xd8\x4f\x55\x07\x07\xe2\x54\xfe\
+\x19\xa7\xee\xf9\xf1\xb7\x84\x75\xc6\x0d\xb9\xea\x65\x41\xec\x53\
+\x5f\x74\x44\x6f\xbd\x93\x80\x1f\x01\x97\xd9\x2f\xd5\x40\x8f\x10\
+\xee\xc1\x38\x62\xd0\x9b\xaf\x07\x78\x1a\x17\x60\x54\x73\xf4\x03\
+\xbf\x4b\x41\x17\xad\x2c\xea\xd4\xfd\x32\xc2\x16\x40\x86\x5c\xcd\
+\xb2\x34\xf6\xb9\xcb\x0c\x7a\x73\x7c\x11\xf8\x0f\x5a\xbb\xf7\x98\
+\xca\x69\x4e\xec\x7b\xb7\x39\x75\x6f\xec\x87\xd2\x7d\x84\x47\x0e\
+\xa5\x56\xfb\x0e\xe1\x9a\xfb\x31\x83\x5e\x3f\x27\x11\x96\xfc\x3d\
+\xdf\xfe\xa5\x1c\xd9\x42\x58\xea\xfb\x88\x41\xaf\x5d\x27\xf0\x3c\
+\xf0\x1e\xfb\x95\x72\xe8\x7f\x81\x35\x84\x27\xe2\x0c\xfa\x2c\xcd\
+\x27\xec\xcd\xe5\xf2\x4e\xca\xb3\x01\xc2\xde\x7a\x87\x0c\x7a\xf5\
+\xba\x81\x57\x80\x85\xf6\x23\x15\xc0\x7e\xe0\x2c\x72\xfa\x50\x4c\
+\x5e\xcf\xba\x2f\x8d\x53\x22\x43\xae\xa2\x58\x18\xfb\xec\x52\x83\
+\x5e\x99\x33\x80\xff\x01\x4e\xb5\xef\xa8\x60\x4e\x8d\x7d\x37\x77\
+\x0b\x8d\xe6\x6d\xea\xbe\x22\x4e\xd7\x3b\xec\x33\x2a\xb0\x91\x38\
+\x8d\xef\x73\x44\x7f\xa7\x1e\xe0\x45\x43\xae\x04\x74\x00\xff\x9d\
+\xa7\x69\x7c\x5e\x46\xf4\x85\xf1\xd3\xaf\xcb\x3e\xa2\x84\x0c\xc5\
+\x59\xea\x7e\x47\xf4\x10\xee\x97\x0c\xb9\x12\x94\x9b\xbe\xdd\xea\
+\xa0\xb7\x03\xcf\x01\x8b\xed\x13\x4a\xd4\xe2\xd8\xc7\xdb\xcb\x1a\
+\xf4\x36\xe0\x71\x60\xa5\x7d\x41\x89\x5b\x19\xfb\x7a\x5b\x19\x83\
+\xfe\x4d\xe0\x02\xfb\x80\x4a\xe2\x82\xd8\xe7\x4b\x15\xf4\xdb\x81\
+\x8d\xb6\xbd\x4a\x66\x23\xf0\x77\x2d\x99\x3e\xb7\xe0\xac\xfb\xe5\
+\x94\x68\x2b\x1c\x69\x12\x57\x00\x0f\xa5\x1c\xf4\xe5\xc0\xaf\x71\
+\xd1\x08\x95\xdb\x51\xe0\x4c\xc2\x8a\x35\xc9\x05\xbd\x23\xbe\xb1\
+\x45\xb6\xb3\xc4\x20\xd0\x4b\x93\xd6\x8e\x6f\xd6\x31\x7a\x1b\xf0\
+\x9f\x86\x5c\x3a\xae\x3b\x66\xa2\x2d\xa5\xa0\x7f\x09\xb8\xc8\xb6\
+\x95\x4e\x70\x11\xe1\xc4\x74\x12\x53\xf7\xf7\x01\xcf\xda\xa6\xd2\
+\x94\xd6\xd1\xe0\x1d\x61\x1a\x1d\xf4\x0e\xc2\xea\x1b\xee\xa0\x22\
+\x4d\xed\x10\xe1\xa1\xae\xc3\x45\x9d\xba\xdf\x6f\xc8\xa5\x19\xcd\
+\xa7\xc1\x97\xdb\x1a\x19\xf4\x8d\x84\xeb\x85\x92\x66\xb6\x1e\xf8\
+\xd3\xa2\x4d\xdd\x4f\x03\x76\xe3\xf5\x72\xa9\x1a\x47\xe3\x14\x7e\
+\x6f\x51\x46\xf4\xc7\x0d\xb9\x54\xb5\x39\xc0\xa3\x45\x99\xba\xdf\
+\x02\xac\xb6\xcd\xa4\x59\x59\x1d\x33\x94\xeb\xa9\xfb\x7c\xc2\x1d\
+\x3f\xed\xb6\x97\x34\x6b\x6f\x13\x6e\xa8\xa9\xdb\x3a\xf1\xf5\x1e\
+\xd1\x7f\x68\xc8\xa5\x9a\xb5\xc7\x2c\xe5\x72\xea\xfe\x31\xc2\x99\
+\x43\x49\xb5\x5b\x1f\x33\x95\xab\xa9\xfb\xc9\xc0\x3e\x5c\xf7\x4d\
+\xaa\xa7\x61\xc2\xc2\xa9\x6f\xe5\x65\x44\xbf\xc3\x90\x4b\x75\xd7\
+\x19\xb3\x95\x8b\x11\xbd\x97\x26\x3e\x57\x2b\x95\xd0\x72\x60\x67\
+\xab\x47\xf4\xef\xd8\x0e\x52\x43\xd5\x9c\xb1\x5a\x83\xfe\x7e\xe0\
+\x03\xb6\x83\xd4\x50\x1f\xa8\x35\x67\xb5\x4c\xdd\xdb\x80\xd7\x08\
+\x3b\x51\x48\x6a\xac\x3e\xe0\xdd\xc0\xac\x02\x5b\xcb\x88\x7e\xb9\
+\x21\x97\x9a\x66\x45\xcc\x5c\x53\x47\xf4\x36\xc2\x73\xe6\x4b\xac\
+\xbf\xd4\x34\xbb\x09\x0f\xbd\x54\x1d\xda\xd9\x8e\xe8\x1f\x37\xe4\
+\x52\xd3\x2d\x01\xae\x69\xd6\x88\x9e\xc5\x4f\x96\x6e\xeb\x2e\x35\
+\xdd\x60\x0c\xfc\xb1\x46\x8f\xe8\x9f\x34\xe4\x52\xcb\x74\x03\x9f\
+\x6a\xf4\x88\xde\x06\xec\x31\xe8\x52\xcb\x47\xf5\xc5\xd5\x1c\xab\
+\x57\x3b\xa2\x7f\xd4\x90\x4b\xb9\x18\xd5\x37\x34\x72\x44\x7f\x0d\
+\x38\xc3\x3a\x4b\x2d\xf7\x0a\xb0\xaa\x11\x23\xfa\xb9\x86\x5c\xca\
+\x8d\xb3\x80\xf7\x36\x22\xe8\xff\x68\x6d\xa5\x5c\xb9\xb3\xde\x53\
+\xf7\x45\x84\x93\x70\x92\xf2\x65\x31\x15\xac\x1a\x5b\xe9\x88\xfe\
+\x37\xd6\x53\xca\xa5\xcf\xd5\x6b\x44\x9f\x03\x0c\x11\xb6\x57\x92\
+\x94\x2f\xc3\xc0\x29\xcc\x70\xa9\xad\x92\x11\xfd\x23\x86\x5c\xca\
+\xad\x4e\x2a\xd8\xa9\xb8\x92\x11\x7d\x0b\x70\x9e\xf5\x94\x72\xeb\
+\x67\xc0\x85\xb5\x04\xfd\x34\xc2\x5d\x38\x92\xf2\x6d\x21\x70\x60\
+\xb6\x53\xf7\x1b\xad\x9f\x54\x08\x37\xd7\x32\xa2\x6f\xc7\xc5\x25\
+\xa4\x22\xe8\x63\x9a\x1b\xda\xa6\x0b\x7a\x0f\xd0\x6f\xfd\xa4\xc2\
+\x58\x4a\x58\x10\xa6\xaa\xa9\xfb\x0d\xd6\x4d\x2a\x94\x9b\x66\x33\
+\xa2\xef\x04\x96\x59\x3b\xa9\x30\xfa\xa7\xca\xec\x54\x23\xfa\x32\
+\x43\x2e\x15\x72\xea\x5e\x55\xd0\xaf\xb5\x66\x52\x21\x5d\x5b\xcd\
+\xd4\xfd\x69\x60\x9d\x35\x93\x0a\xe7\x59\xc2\x23\xe5\x33\x06\xbd\
+\x03\x78\xd3\x7a\x49\x85\x35\x17\x18\x99\x69\xea\x7e\xbe\x75\x92\
+\x0a\xed\xfd\x95\x1c\xa3\xff\x89\x75\x92\x0a\xed\xe6\x4a\xa6\xee\
+\x87\x80\x53\xad\x95\x54\x58\x43\x84\x47\x57\xa7\x1c\xd1\xbb\x0d\
+\xb9\x54\x78\x5d\x4c\x58\xad\x39\x9b\x69\x6e\x2f\xa9\xf8\xc7\xe9\
+\x13\x83\x7e\xb5\xf5\x91\x92\xf0\x87\xd3\x1d\xa3\xf7\x13\x1e\x66\
+\x91\x54\x6c\x03\x84\x3b\xe5\xde\x11\xf4\x79\x84\xf5\xa7\x24\xa5\
+\xa1\x13\x38\x3c\x71\xea\xbe\xc6\xba\x48\x49\x59\x33\xd9\x31\xfa\
+\x7a\xeb\x22\x25\x65\xc3\x64\x41\xff\xb0\x75\x91\x92\x72\xe9\x64\
+\xc7\xe8\xbf\x21\x5c\x7f\x93\x94\x86\xe1\xb1\x4c\x8f\x8d\xe8\x73\
+\x0d\xb9\x94\x9c\x4e\xc2\x49\xf6\xe3\x41\xef\xb5\x26\x52\x92\x7a\
+\xc7\x07\xdd\x33\xee\x52\x9a\xd6\x8c\x0f\xba\x8b\x4c\x48\x69\x5a\
+\x37\x3e\xe8\xef\xb3\x1e\x52\x92\xd6\x3a\x75\x97\x4a\x32\x75\x1f\
+\xbb\xbc\xf6\x36\x61\x7b\x64\x49\x69\x39\x0a\xb4\x67\x84\x35\xe2\
+\x0c\xb9\x94\xa6\x39\x40\x47\x46\xd8\x31\x55\x52\xba\x16\x66\x8c\
+\x7b\x94\x4d\x52\x92\x96\x65\xc0\x22\xeb\x20\x25\xad\x3b\x03\x4e\
+\xb7\x0e\x52\xd2\x7a\x32\x60\xb9\x75\x90\x92\xb6\xdc\x63\x74\x29\
+\x7d\x4b\x33\x7c\xa0\x45\x4a\x5d\xaf\x23\xba\x94\x3e\xcf\xba\x4b\
+\x25\xd0\x9d\x11\x1f\x4c\x97\x94\xac\xae\x0c\x57\x96\x91\x52\x37\
+\x2f\x03\xda\xad\x83\x94\xb4\x8e\xb6\xd1\x49\xb6\x53\x95\x94\x96\
+\xcc\x12\x48\x06\x5d\x92\x41\x97\x54\x00\x87\x32\xe0\x0d\xeb\x20\
+\x25\xed\x68\x46\x58\x46\x4a\x52\xba\x0e\x67\xc0\x90\x75\x90\x92\
+\x36\x94\x11\xf7\x4f\x96\x94\xac\x63\x19\xb0\xd7\x3a\x48\x49\xdb\
+\x97\x01\xfd\xd6\x41\x4a\xda\x40\x06\xec\xb4\x0e\x52\xd2\x76\x38\
+\xa2\x4b\xe9\xeb\xcf\x80\x5d\xd6\x41\x72\x44\x97\x94\xc0\x31\xba\
+\x67\xdd\xa5\xb4\x0d\x66\xc0\x80\x75\x90\x92\xb6\xab\x6d\x74\x74\
+\xb4\x03\x78\xd3\x5a\x48\xc9\x9a\xeb\xb6\xc9\x52\xda\x8e\x6f\x9b\
+\x0c\xf0\xaa\xf5\x90\x92\xf4\x2a\xfc\xff\xf3\xe8\xcf\x5b\x0f\x29\
+\x49\xcf\x8f\x0f\xfa\x73\xd6\x43\x4a\xd2\x2f\xc7\x07\x7d\x9b\xf5\
+\x90\x92\xb4\x6d\x7c\xd0\x5f\xb0\x1e\x52\xba\x53\xf7\xb1\xb3\xee\
+\xf3\x80\x61\x6b\x22\x25\xa7\x93\xb8\xc2\x0c\x84\xc5\x27\x0c\xba\
+\x94\x96\xe1\x98\xed\x13\x56\x81\x7d\xc2\xba\x48\x49\x39\x9e\xe9\
+\xf1\x41\x7f\xc4\xba\x48\x49\xd9\x34\x59\xd0\x1f\xb3\x2e\x52\x52\
+\x1e\x1d\xfb\x43\xdb\xb8\xad\xd7\x3c\x21\x27\xa5\xa5\x73\xb2\x63\
+\xf4\xc3\xf8\x24\x9b\x94\x8a\xdd\x8c\x5b\xe1\x79\xe2\x96\x4c\x3f\
+\xb4\x3e\x52\x12\xbe\x3f\xfe\x2f\x13\x83\xfe\x03\xeb\x23\x25\xe1\
+\x84\x2c\xb7\x4d\xd8\x1e\xbd\x1b\x57\x9c\x91\x52\xb0\x78\x7c\x96\
+\x27\x06\x1d\xc2\x16\x4d\x9d\xd6\x49\x2a\xac\x61\xa0\x6b\xba\xa9\
+\x3b\xc0\xbf\x5b\x27\xa9\xd0\xde\x91\xe1\xc9\x82\x7e\x8f\x75\x92\
+\x0a\xed\xde\x89\xff\x30\xd9\xd4\xdd\x35\xe4\xa4\x62\x9b\x0b\x8c\
+\xcc\x34\xa2\x8f\x00\xcf\x5a\x2b\xa9\x90\x9e\x9b\x18\xf2\xa9\x82\
+\x0e\xf0\x0d\xeb\x25\x15\xd2\xbf\x4e\xf6\x8f\x93\x4d\xdd\x01\x96\
+\xe1\xe6\x8b\x52\x11\xf5\x32\xc9\x36\x6b\x53\x05\x9d\xf8\xc5\x4b\
+\xad\x9b\x54\x18\x7b\x09\xd7\xcf\xa9\x74\xea\x0e\xf0\x75\xeb\x26\
+\x15\xca\x9d\x53\xfd\x87\xe9\x46\xf4\x1e\xdc\x80\x51\x2a\x92\x33\
+\x81\xd7\xaa\x1d\xd1\x07\x80\x3e\x6b\x27\x15\xc2\xc0\x54\x21\x9f\
+\x29\xe8\x00\xff\x60\xfd\xa4\x42\x98\x36\xab\xd3\x4d\xdd\x01\x4e\
+\x03\x06\xad\xa1\x94\x7b\x0b\x81\x03\xb3\x1d\xd1\xf7\x01\x5b\xad\
+\xa1\x94\x6b\x3f\x9b\x2e\xe4\x95\x04\x1d\xe0\x76\xeb\x28\xe5\xda\
+\x6d\x33\x7d\xc1\x4c\x53\x77\x08\xdb\x29\x0f\x11\xee\x81\x97\x94\
+\x2f\xc3\xc0\x29\xc0\x68\xad\x23\xfa\x51\xe0\x0e\xeb\x29\xe5\xd2\
+\xd7\x67\x0a\x79\xa5\x23\x3a\x84\xbb\x6d\x76\x5b\x53\x29\x77\x4e\
+\x58\x49\xa6\x96\x11\x1d\x60\x0f\xae\xfb\x2e\xe5\xcd\x66\x2a\x5c\
+\xfa\xad\xd2\x11\x1d\xe0\x5c\xdc\x5e\x59\xca\x93\x73\x80\x17\xeb\
+\x1d\x74\x08\x77\xde\x9c\x61\x7d\xa5\x96\x7b\x05\x58\x55\xe9\x17\
+\x67\x55\x7e\xf3\xbf\xb4\xbe\x52\x2e\xdc\x5a\xcd\x17\x57\x3b\xa2\
+\xb7\xc5\xe3\xf5\x6e\xeb\x2c\xb5\xcc\x20\xe1\x24\x5c\xc5\xe1\xad\
+\x76\x44\x1f\x05\x3e\x6f\x9d\xa5\x96\xfa\x7c\x35\x21\x9f\xcd\x88\
+\x3e\xf6\xe1\xb0\xdb\x51\x5d\x6a\x89\xfd\xc0\x22\xe0\x58\xb5\xa1\
+\xad\xd6\x31\xe0\x2f\xac\xb7\xd4\x12\x9f\xae\x36\xe4\xb3\x1d\xd1\
+\xc7\x8e\xd5\x07\x80\x25\xd6\x5d\x6a\x9a\x3d\xc0\xe9\xd5\x4e\xdb\
+\x67\x3b\xa2\x8f\x1d\xab\xdf\x62\xdd\xa5\xa6\xfa\xb3\xd9\x84\xbc\
+\x96\x11\x7d\x6c\x54\xdf\x0e\x2c\xb7\xfe\x52\xc3\xed\x20\xdc\xc3\
+\x32\xab\xc0\x66\x35\xfc\xe0\x51\xe0\x3a\xeb\x2f\x35\xc5\x75\xb3\
+\x0d\x79\xad\x41\x07\xf8\x79\xfc\x25\xa9\x71\xb6\xd4\x9a\xb3\x5a\
+\xa6\xee\x63\x7a\xe3\xb4\x42\x52\x63\x2c\xa7\xc6\x0d\x55\xb2\x3a\
+\xbc\x88\x9d\xc0\xdd\xb6\x85\xd4\x10\x77\x53\x87\x5d\x93\xea\x31\
+\xa2\x03\x9c\x4c\xb8\x90\xdf\x69\xbb\x48\x75\x73\x18\x58\x00\xbc\
+\x55\xeb\x37\xca\xea\xf4\x82\xde\x02\x36\xda\x2e\x52\x5d\x6d\xac\
+\x47\xc8\xeb\x39\xa2\x8f\x79\x14\x58\x6f\xfb\x48\x35\x7b\x02\xb8\
+\xb8\x5e\xdf\xac\xde\x41\x9f\x4f\x78\xb2\xa6\xdd\x76\x92\x66\xed\
+\x28\xe1\x59\x92\x83\xf5\xfa\x86\x59\x9d\x5f\xe0\x21\xe0\x33\xb6\
+\x93\x54\x93\x5b\xeb\x19\xf2\x46\x8c\xe8\x63\x9e\x07\x56\xdb\x5e\
+\x52\xd5\x5e\x00\xd6\xd4\xfb\x9b\x36\x2a\xe8\xdd\xc0\xeb\x84\x35\
+\xe1\x25\x55\x3e\x65\x5f\x4a\x78\x78\xa5\xae\xb2\x06\xbd\xe0\x41\
+\xe0\x46\xdb\x4d\xaa\xca\x9f\x37\x22\xe4\x8d\x1c\xd1\xc7\x3c\x08\
+\x5c\x61\xfb\x49\x33\x7a\x0c\xd8\xd0\xa8\x6f\xde\xe8\xa0\x77\xc4\
+\x29\xfc\xbb\x6c\x47\x69\x4a\x6f\x10\x9e\x33\x3f\xdc\xa8\x1f\x90\
+\x35\xf8\x0d\x8c\x34\xf2\x53\x4a\x4a\xc4\x86\x46\x86\xbc\x19\x41\
+\x07\x78\x06\xf8\xb2\x6d\x29\x4d\xea\xcb\xc0\xd3\x8d\xfe\x21\x8d\
+\x9e\xba\x1f\xff\x39\xf1\x18\xe4\x22\xdb\x55\x3a\xee\x49\xc2\xdd\
+\x6f\xa3\xa9\x04\x7d\xec\x78\x7d\x27\xae\x1e\x2b\x41\xb8\x32\xd5\
+\x1b\x0f\x6f\x1b\x2e\x6b\xe2\x1b\x1b\x01\xd6\x11\xae\x15\x4a\x65\
+\x76\x34\x66\x61\xa4\x59\x3f\x30\x6b\xf2\x1b\xec\x03\xae\xb2\x9d\
+\x55\x72\x57\xc7\x2c\x90\x6a\xd0\x01\x1e\x02\xbe\x62\x5b\xab\xa4\
+\xfe\x1e\xf8\x71\xb3\x7f\x68\x33\x8f\xd1\x27\xba\x0f\x9f\x61\x57\
+\xb9\x7c\x0b\xb8\xbe\x15\x3f\xb8\x95\x41\x6f\x03\x7e\x0a\x5c\x60\
+\xfb\xab\x04\xfe\x0b\xb8\x90\x26\x9c\x61\xcf\x5b\xd0\x21\x3c\xb7\
+\xfe\x12\xb0\xd2\x7e\xa0\x84\xbd\x0a\x9c\x0d\xbc\xdd\xb2\x51\xb5\
+\xc5\x41\x07\xe8\x02\x7e\x4d\xd8\x38\x4e\x4a\xcd\x5e\xe0\x4c\x60\
+\xa8\x95\x2f\x22\x0f\x41\x07\x58\x48\x38\x0b\xd9\x65\xbf\x50\x42\
+\x86\x80\x15\x84\x85\x53\x5b\x2a\xcb\x49\x41\xf6\x03\x67\x01\xc3\
+\xf6\x0d\x25\x62\x18\x58\x95\x87\x90\xe7\x29\xe8\x00\xfd\xc0\x6f\
+\xd3\xc4\x9b\x08\xa4\x06\x19\x89\x7d\x79\x57\x5e\x5e\x50\x96\xb3\
+\x02\xf5\x19\x76\x25\x10\xf2\xb3\x69\xf2\x0d\x31\x45\x0b\x3a\x84\
+\x13\x73\x4e\xe3\x55\xd4\xe9\xfa\x59\xc0\x6b\x79\x7b\x61\x59\x4e\
+\x0b\xd6\x07\xfc\x16\xe1\x81\x7c\xa9\x08\xde\x88\x21\xef\xcb\xe3\
+\x8b\xcb\x72\x5c\xb8\x7e\xc2\x65\x89\x3d\xf6\x21\xe5\xdc\xd8\x25\
+\xb4\x5d\x79\x7d\x81\x59\xce\x0b\xb8\x0f\x78\x4f\x1e\xa7\x42\x52\
+\xb4\x3d\x86\x7c\x5f\x9e\x5f\x64\x56\x80\x42\x0e\xc5\x29\xd1\x56\
+\xfb\x94\x72\x66\x6b\x3c\xc4\x1c\xca\xfb\x0b\xcd\x0a\x52\xd0\x23\
+\xc0\xf9\xc0\xfd\xf6\x2d\xe5\xc4\xfd\xb1\x4f\x1e\x29\xc2\x8b\xcd\
+\x0a\x54\xd8\x63\xc0\x1f\xe1\x23\xae\x6a\xbd\xaf\xc4\xbe\x78\xac\
+\x28\x2f\x38\x2f\xb7\xc0\x56\xeb\xa3\xc0\x8f\x70\x27\x18\x35\xd7\
+\x51\xc2\xc2\x29\x0f\x15\xed\x85\x17\x35\xe8\x10\xb6\xae\xd9\x1a\
+\x7f\x97\x1a\xad\x1f\xf8\xbd\xf8\x7b\xe1\x64\x05\x2f\xfc\xbb\x81\
+\x47\xec\x83\x6a\xb0\x4d\xb1\xaf\xf5\x17\xf5\x0d\x64\x05\x6f\x80\
+\x23\xc0\x47\x80\xdb\xec\x8b\x6a\x90\x2f\x01\x1f\xa6\x20\x27\xdd\
+\x52\x9c\xba\x4f\x74\x2e\xb0\x19\x58\x60\xdf\x54\x1d\x1c\x04\x2e\
+\x01\xb6\xa5\xf0\x66\xb2\x84\x1a\xe6\x19\xa0\x07\x78\xd8\x3e\xaa\
+\x1a\x3d\x4c\xd8\x0b\x6d\x5b\x2a\x6f\x28\x4b\xac\x81\x46\x80\xcb\
+\x81\x4f\xd2\xc2\x65\x7b\x54\x58\x47\x81\x4f\xc5\x3e\x94\xd4\x13\
+\x94\x29\x4d\xdd\x27\xea\x06\x1e\x07\xce\xb1\xff\xaa\x02\xbf\x22\
+\x6c\x8f\x34\x98\xe2\x9b\xcb\x12\x6e\xb8\x41\x60\x35\x61\x73\x79\
+\x47\x77\x4d\xe5\xed\xd8\x47\xd6\xa4\x1a\xf2\xd4\x47\xf4\xf1\xde\
+\x05\x3c\x80\x9b\x3c\xea\x44\x4f\x10\x6e\x80\x39\x98\xfa\x1b\xcd\
+\x4a\xd2\xa0\x07\xe3\xb4\xec\x4a\x5c\xd0\x42\xa1\x0f\x5c\x19\xfb\
+\xc4\xc1\x32\xbc\xe1\xac\x64\x0d\xfc\x20\x61\xc5\xd9\xbb\xec\xeb\
+\xa5\x75\x57\xec\x03\x0f\x96\xe9\x4d\x97\x65\xea\x3e\x99\x5e\xe0\
+\x7b\xc0\x79\xf6\xfd\x52\x78\x0a\xb8\x16\xd8\x51\xc6\x37\x9f\x95\
+\xb8\xe1\x77\x12\x1e\x33\xbc\x80\xb0\x78\x80\xd2\xb4\x1d\xf8\x83\
+\xd8\xd6\x3b\xca\x5a\x84\xcc\x7e\xc0\xcf\x09\x2b\x84\x5c\x09\xec\
+\xb6\x1c\xc9\xd8\x1d\xdb\xf4\x4c\xc2\xbe\x67\xa5\x66\xd0\x83\xd1\
+\x78\xcc\xd6\x03\x7c\x82\x84\x2f\xb3\x94\xc0\x20\x61\x97\xde\x9e\
+\xd8\xa6\xa3\x96\xc4\xa0\x4f\x16\xf8\xef\x02\x4b\x80\x9b\x0c\x7c\
+\xe1\x02\x7e\x53\x6c\xbb\x6f\x1b\xf0\x13\x95\xf9\x64\x5c\x45\xf5\
+\x01\x3e\x04\xdc\x4d\xd8\x5e\x47\xf9\xf3\x32\xf0\x59\xe0\x27\x86\
+\xdb\x11\xbd\x96\x11\x7e\x13\x61\xe7\x8d\xd5\x84\xa7\xe3\x94\x0f\
+\x9b\x63\x9b\x9c\x1d\xdb\xc8\x90\x3b\xa2\xd7\xd5\x22\xe0\x73\xc0\
+\x17\x80\x4e\xcb\xd1\x54\xc3\xc0\xd7\x08\xd7\xc2\x5d\xef\xdf\xa0\
+\x37\x6d\x5a\x7f\x31\xf0\x55\xe0\x83\x96\xa3\xa1\x9e\x04\x6e\x27\
+\x3c\xa4\x64\x87\x35\xe8\x2d\xb3\x00\xb8\x39\x8e\xf2\x2b\x2c\x47\
+\x5d\xf4\xc5\xd1\xfb\x1e\xe0\x80\xe5\x30\xe8\x79\xd3\x03\xdc\x10\
+\x43\xef\xc2\x95\xd5\xe9\x07\xee\x00\xee\x05\x06\x2c\x87\x41\x2f\
+\x8a\x65\x84\x6b\xba\xb7\x12\x4e\x1a\xe9\x9d\x5e\x06\xfe\x09\xb8\
+\x8f\x1c\xef\x5d\x66\xd0\x55\xa9\x2e\xc2\x63\xb2\x37\x02\xd7\xc4\
+\xbf\x97\xd1\x10\xe1\x19\x83\x7f\x23\x3c\x26\x3a\x64\xd7\x30\xe8\
+\x29\x5b\x4c\xb8\xff\xfa\xaa\x18\xfc\x25\x89\xbe\xcf\xdd\x31\xd8\
+\x0f\x00\x5b\xf0\x6c\xb9\x41\x2f\xb9\x79\x84\xeb\xc2\x97\x00\x97\
+\x12\xce\xe4\x17\x6d\xd4\x1f\x22\x9c\x21\xdf\x44\xb8\xce\xfd\x02\
+\x70\xd8\xa6\x35\xe8\x9a\xde\x5c\x60\x39\x61\x99\xa3\x75\xc0\xda\
+\xf8\xe7\x95\xb4\x76\x3b\xaa\x5d\xc0\x73\x84\x9d\x72\x7e\x11\x03\
+\xdd\x07\xbc\x69\x93\x19\x74\xd5\x57\x07\x61\x01\xcc\x1e\xc2\x4d\
+\x3c\xa7\xc7\x0f\x85\xe5\x84\x67\xed\x97\xc5\x19\xc1\x69\x40\x3b\
+\xe1\x12\x60\xfb\x84\xd1\x77\x6c\xb4\xdd\x43\xb8\x3e\x3d\x14\x43\
+\xbc\x93\xf0\x48\xe7\x0e\xe0\x75\x60\x6f\x9c\x82\xef\x8b\xff\x8f\
+\x9d\xa6\x60\xfe\x0f\x74\x0e\xb8\x29\xfa\x0c\x67\x85\x00\x00\x00\
+\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\x89\
+\x00\
+\x00\x09\x7a\x78\x9c\xeb\x0c\xf0\x73\xe7\xe5\x92\xe2\x62\x60\x60\
+\xe0\xf5\xf4\x70\x09\x62\x60\x60\x9e\xc4\xc0\xc0\x14\xc4\xc1\x06\
+\x14\xd9\xf8\xee\x97\x10\x90\x62\x4b\xf2\x76\x77\x61\xf8\x0f\x82\
+\x0b\xf6\x2e\x9f\x0c\x14\xe1\x2c\xf0\x88\x2c\x66\x60\xe0\x3b\x02\
+\xc2\x8c\x53\xb5\xf9\xa4\x81\x82\xec\x25\x9e\xbe\xae\xec\x8f\xd8\
+\xf8\x84\x98\xcc\xa4\x5e\x0a\xed\x07\x2a\x63\xf7\x74\x71\x0c\xa9\
+\xb8\xf5\xf6\x6e\x2c\x57\x93\x83\x44\xdb\x45\xc3\x5b\x37\x74\x52\
+\xc3\xbe\xe9\xa6\x4e\x4b\x0b\x77\xf2\x50\xf9\x79\xfc\x78\xc9\xb9\
+\xa9\x2c\x27\xbb\xc5\x0f\x35\x7b\x2e\x65\x18\x05\xa3\x80\x48\x50\
+\xb0\xf3\xa4\x2a\x03\x83\x5b\x68\xf6\xdc\xe9\x8f\xef\xfd\x4e\x11\
+\x3e\x60\x29\xa7\xc7\xc8\x60\xb0\xe9\xda\x2c\x5f\x06\x27\x50\x9a\
+\x55\xe4\x64\x60\x68\x98\xc0\xc2\xc0\xe0\xe0\xc1\x84\xcc\x52\x50\
+\x61\x64\x60\x10\x00\x26\x71\x06\x0e\x4f\x20\xd1\xa2\x82\xc2\x02\
+\x6a\x7d\xb0\xa3\x63\x03\xe7\x83\x14\xff\xe9\x0c\x0c\x12\x81\x6b\
+\x4b\xf3\xd6\xee\xad\x37\xf9\x7e\x4f\x7d\x36\x43\x5f\xf1\x63\x26\
+\x86\xa0\xe3\x0f\xee\xbd\x5f\xd7\xb4\x76\x4a\xd1\x1b\xcf\x07\x42\
+\x35\x92\xe6\x8c\x77\xce\x0a\x7b\x32\x28\x6c\xf5\xff\xb8\xf5\x69\
+\xf4\x9c\xb9\x85\xfb\x7a\x66\x83\x8c\x3a\xe0\x7a\xb0\xe4\xd8\x4f\
+\xa3\x3c\xa6\x1d\x93\xe7\x3b\x33\x30\x38\x47\xed\xef\x97\x10\x54\
+\xbd\x6d\x3d\x49\xd2\x8c\x11\x68\x5d\x43\xe8\x0e\xdd\xe3\x91\x4d\
+\xba\x8f\xd5\x1a\xe2\x7f\xfe\xe6\x67\x48\xc8\xa8\xbe\x67\xff\xe7\
+\x38\x56\xb7\x83\x5d\x8c\xd3\xed\x60\x0d\x30\x56\x82\xb3\xcb\x0d\
+\x96\x81\x89\x90\x51\x30\x0a\x46\xc1\x28\x18\x05\x18\x60\x7b\x15\
+\xe3\xe3\x8c\x08\x46\xc7\x88\x97\x71\x20\xae\xa7\xab\x9f\xcb\x3a\
+\xa7\x84\x26\x00\x2b\x15\x85\x94\
+"
+
+qt_resource_name = b"\
+\x00\x03\
+\x00\x00\x70\x37\
+\x00\x69\
+\x00\x6d\x00\x67\
+\x00\x07\
+\x08\x8d\x60\xd7\
+\x00\x72\
+\x00\x61\x00\x77\x00\x5f\x00\x69\x00\x6d\x00\x67\
+\x00\x09\
+\x09\x2b\xa1\x87\
+\x04\x33\
+\x04\x42\x04\x43\x00\x5f\x00\x30\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x09\x2d\xa1\x87\
+\x04\x33\
+\x04\x42\x04\x43\x00\x5f\x00\x32\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x02\x86\x86\x27\
+\x00\x61\
+\x00\x74\x00\x6c\x00\x61\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x05\x65\xd8\x07\
+\x04\x32\
+\x04\x42\x04\x33\x00\x32\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x08\x68\x10\x1e\
+\x00\x61\
+\x00\x74\x00\x6c\x00\x61\x00\x73\x00\x2e\x00\x6a\x00\x73\x00\x6f\x00\x6e\
+\x00\x07\
+\x0a\x56\x5f\xa7\
+\x04\x32\
+\x04\x42\x04\x33\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x0a\xe6\xd8\xa7\
+\x04\x37\
+\x04\x43\x04\x3a\x04\x43\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x0c\x43\x58\x07\
+\x00\x74\
+\x00\x65\x00\x6d\x00\x70\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x0e\x6e\xa8\x07\
+\x04\x37\
+\x04\x43\x04\x3a\x04\x43\x00\x33\x00\x2e\x00\x70\x00\x6e\x00\x67\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x07\x00\x00\x00\x05\
+\x00\x00\x00\x0c\x00\x02\x00\x00\x00\x02\x00\x00\x00\x03\
+\x00\x00\x00\x20\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x38\x00\x00\x00\x00\x00\x01\x00\x00\xee\x32\
+\x00\x00\x00\x50\x00\x00\x00\x00\x00\x01\x00\x00\xfc\x1a\
+\x00\x00\x00\x68\x00\x00\x00\x00\x00\x01\x00\x02\x6f\xd7\
+\x00\x00\x00\x7e\x00\x00\x00\x00\x00\x01\x00\x02\x7f\xb5\
+\x00\x00\x00\x98\x00\x01\x00\x00\x00\x01\x00\x02\x84\x7a\
+\x00\x00\x00\xac\x00\x00\x00\x00\x00\x01\x00\x02\x88\x9f\
+\x00\x00\x00\xc2\x00\x00\x00\x00\x00\x01\x00\x02\x9b\x36\
+\x00\x00\x00\xd8\x00\x01\x00\x00\x00\x01\x00\x02\xbe\x34\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x07\x00\x00\x00\x05\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x0c\x00\x02\x00\x00\x00\x02\x00\x00\x00\x03\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x20\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x63\xff\x88\x1f\x08\
+\x00\x00\x00\x38\x00\x00\x00\x00\x00\x01\x00\x00\xee\x32\
+\x00\x00\x01\x63\xff\x88\x1f\x08\
+\x00\x00\x00\x50\x00\x00\x00\x00\x00\x01\x00\x00\xfc\x1a\
+\x00\x00\x01\xa1\x4f\x0a\x73\xd3\
+\x00\x00\x00\x68\x00\x00\x00\x00\x00\x01\x00\x02\x6f\xd7\
+\x00\x00\x01\x63\xff\x88\x1f\x08\
+\x00\x00\x00\x7e\x00\x00\x00\x00\x00\x01\x00\x02\x7f\xb5\
+\x00\x00\x01\xa1\x4f\x0a\x73\xda\
+\x00\x00\x00\x98\x00\x01\x00\x00\x00\x01\x00\x02\x84\x7a\
+\x00\x00\x01\x63\xff\x88\x1f\x08\
+\x00\x00\x00\xac\x00\x00\x00\x00\x00\x01\x00\x02\x88\x9f\
+\x00\x00\x01\x63\xff\x88\x1f\x08\
+\x00\x00\x00\xc2\x00\x00\x00\x00\x00\x01\x00\x02\x9b\x36\
+\x00\x00\x01\x63\xff\x88\x1f\x08\
+\x00\x00\x00\xd8\x00\x01\x00\x00\x00\x01\x00\x02\xbe\x34\
+\x00\x00\x01\x63\xff\x88\x1f\x08\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
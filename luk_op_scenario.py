@@ -0,0 +1,589 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''Декларативные сценарии тренажера: загрузка, проверка и компиляция в план выполнения.
+
+Файл сценария - JSON вида
+    {
+        "name": "test",
+        "actions": {
+            "человекочитаемый_ключ": {
+                "do": ["операция", аргумент, ...],
+                "when": "граничное условие",         (необязательно)
+                "check": "условие внутри действия",  (необязательно, только для set_state/change_state)
+                "check_desc": "описание для журнала",
+                "period": периодичность в секундах, не меньше MIN_PERIOD (-1 или отсутствует - однократное действие),
+                "catch_up": "skip", "burst" или "merge" (необязательно, догон пропущенных сроков, см. luk_op_actions),
+                "delay": задержка старта от начала сценария в секундах
+            },
+            ...
+        },
+        "process": {...}                             (необязательно, модель процесса, см. luk_op_process)
+    }
+
+Условия записываются выражениями на подмножестве Python: имена переменных контроллера
+(temp, crit_t, timer, start_time, current_time), коды элементов (их значение - состояние элемента),
+числа, арифметика, сравнения, and/or/not. Например: "temp < crit_t and зугт == 0".
+
+Операция apply_states задает состояния многих элементов и переменные temp, crit_t, timer одной
+групповой операцией (одна перепроверка условий, одно обновление интерфейса, одна запись журнала):
+    "do": ["apply_states", {"crit_t": 200, "temp": 60.5, "зугт": 0, "втг": 1}, "Сброс состояний"]
+
+Скомпилированный план кешируется на диске (каталог __pycache__ рядом с файлом) по хешу содержимого.
+'''
+
+import os
+import ast
+import sys
+import json
+import pickle
+import hashlib
+import operator
+import functools
+
+from luk_op_engine import BATCH_VARIABLES
+from luk_op_actions import CATCH_UP_POLICIES, MIN_PERIOD
+
+PLAN_VERSION = 4  # меняется при несовместимых изменениях формата плана или правил проверки
+
+PROCESS_KEY = 'модель_процесса'  # ключ периодического действия, продвигающего модель процесса
+
+# Переменные контроллера, доступные в условиях
+VARIABLES = ('temp', 'crit_t', 'timer', 'start_time', 'current_time')
+
+_COMPARE_OPS = {
+    ast.Eq: operator.eq, ast.NotEq: operator.ne,
+    ast.Lt: operator.lt, ast.LtE: operator.le,
+    ast.Gt: operator.gt, ast.GtE: operator.ge,
+}
+_ARITH_OPS = {
+    ast.Add: operator.add, ast.Sub: operator.sub,
+    ast.Mult: operator.mul, ast.Div: operator.truediv,
+}
+
+
+class ScenarioError(Exception):
+    '''Ошибка в описании сценария'''
+
+
+# Узлы разобранного условия. Хранят только данные (сериализуются в кеш),
+# bind() превращает узел в готовую к вызову функцию без разбора во время выполнения.
+# Узлы с shared = True при связывании попадают в общую сеть условий контроллера (luk_op_network)
+class Const:
+    shared = False
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def names(self):
+        return set()
+
+    def bind(self, ctx):
+        value = self.value
+        return lambda: value
+
+
+class Var:
+    shared = False
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        self.name = name
+
+    def names(self):
+        return {self.name}
+
+    def bind(self, ctx):
+        return functools.partial(getattr, ctx.controller, self.name)
+
+
+class State:
+    shared = False
+    __slots__ = ('code',)
+
+    def __init__(self, code):
+        self.code = code
+
+    def names(self):
+        return {self.code}
+
+    def bind(self, ctx):
+        return functools.partial(getattr, ctx.element(self.code), 'state')
+
+
+class Arith:
+    shared = False
+    __slots__ = ('op', 'left', 'right')
+
+    def __init__(self, op, left, right):
+        self.op, self.left, self.right = op, left, right
+
+    def names(self):
+        return self.left.names() | self.right.names()
+
+    def bind(self, ctx):
+        op, left, right = self.op, self.left.bind(ctx), self.right.bind(ctx)
+        return lambda: op(left(), right())
+
+
+class Compare:
+    shared = True
+    __slots__ = ('ops', 'operands')
+
+    def __init__(self, ops, operands):
+        self.ops, self.operands = ops, operands
+
+    def names(self):
+        return set().union(*(o.names() for o in self.operands))
+
+    def bind(self, ctx):
+        if len(self.ops) == 1:
+            op, left = self.ops[0], self.operands[0].bind(ctx)
+            if isinstance(self.operands[1], Const):  # частый случай: сравнение с константой
+                value = self.operands[1].value
+                return lambda: op(left(), value)
+            right = self.operands[1].bind(ctx)
+            return lambda: op(left(), right())
+        ops, operands = self.ops, [o.bind(ctx) for o in self.operands]
+
+        def chained():
+            left = operands[0]()
+            for op, operand in zip(ops, operands[1:]):
+                right = operand()
+                if not op(left, right):
+                    return False
+                left = right
+            return True
+        return chained
+
+
+class BoolOp:
+    shared = True
+    __slots__ = ('is_and', 'items')
+
+    def __init__(self, is_and, items):
+        self.is_and, self.items = is_and, items
+
+    def names(self):
+        return set().union(*(i.names() for i in self.items))
+
+    def bind(self, ctx):
+        if self.is_and:
+            items = self.bind_masked(ctx)
+        else:
+            items = tuple(ctx.bind(i) for i in self.items)
+        if self.is_and:
+            def conjunction():
+                for f in items:
+                    if not f():
+                        return False
+                return True
+            return conjunction
+
+        def disjunction():
+            for f in items:
+                if f():
+                    return True
+            return False
+        return disjunction
+
+    def bind_masked(self, ctx):
+        '''Сравнения состояний элементов с 0 и 1 внутри "and" заменяются одной проверкой битовых масок
+        хранилища состояний; остальные члены вычисляются как обычно'''
+        tests = [_state_test(i) for i in self.items]
+        pairs = [t for t in tests if t is not None]
+        stores = {ctx.element(code).store for code, _ in pairs}
+        if len(pairs) < 2 or len(stores) != 1:
+            return tuple(ctx.bind(i) for i in self.items)
+        store = stores.pop()
+        ones, zeros = store.mask(pairs)
+        match = functools.partial(store.match, ones, zeros)
+        items = []
+        for item, test in zip(self.items, tests):
+            if test is None:
+                items.append(ctx.bind(item))
+            elif match is not None:  # проверка масок - на месте первого из замененных сравнений
+                items.append(match)
+                match = None
+        return tuple(items)
+
+
+def _state_test(node):
+    '''Пара (код, состояние), если узел - сравнение "элемент == 0" или "элемент == 1", иначе None'''
+    if isinstance(node, Compare) and len(node.ops) == 1 and node.ops[0] is operator.eq:
+        left, right = node.operands
+        if isinstance(right, State):
+            left, right = right, left
+        if isinstance(left, State) and isinstance(right, Const) and right.value in (0, 1):
+            return left.code, right.value
+    return None
+
+
+class Not:
+    shared = True
+    __slots__ = ('item',)
+
+    def __init__(self, item):
+        self.item = item
+
+    def names(self):
+        return self.item.names()
+
+    def bind(self, ctx):
+        item = ctx.bind(self.item)
+        return lambda: not item()
+
+
+def parse_condition(source):
+    '''Разобрать текст условия в дерево узлов'''
+    try:
+        tree = ast.parse(source.strip(), mode='eval')
+    except SyntaxError as e:
+        raise ScenarioError('синтаксическая ошибка в условии "%s": %s' % (source, e.msg))
+    return _convert(tree.body, source)
+
+
+def _convert(node, source):
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+        return Const(node.value)
+    if isinstance(node, ast.Name):
+        return Var(node.id) if node.id in VARIABLES else State(node.id)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        return Arith(operator.sub, Const(0), _convert(node.operand, source))
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        return Not(_convert(node.operand, source))
+    if isinstance(node, ast.BinOp) and type(node.op) in _ARITH_OPS:
+        return Arith(_ARITH_OPS[type(node.op)], _convert(node.left, source), _convert(node.right, source))
+    if isinstance(node, ast.Compare) and all(type(op) in _COMPARE_OPS for op in node.ops):
+        return Compare([_COMPARE_OPS[type(op)] for op in node.ops],
+                       [_convert(o, source) for o in [node.left] + node.comparators])
+    if isinstance(node, ast.BoolOp):
+        return BoolOp(isinstance(node.op, ast.And), [_convert(v, source) for v in node.values])
+    raise ScenarioError('недопустимая конструкция "%s" в условии "%s"' % (ast.dump(node)[:40], source))
+
+
+# Операции действий: имя -> (допустимое число аргументов, функция связывания с контроллером)
+def _element_op(method):
+    def bind(ctx, args, check):
+        elem = ctx.element(args[0])
+        return lambda: getattr(elem, method)(*args[1:], check) if check is not None else getattr(elem, method)(*args[1:])
+    return bind
+
+
+def _controller_op(method):
+    def bind(ctx, args, check):
+        return functools.partial(getattr(ctx.controller, method), *args)
+    return bind
+
+
+def _scaled_op(method, default):
+    '''Операция с величиной изменения (raise_temp, lower_temp): объединенный вызов за n сроков
+    повторяемого действия (догон MERGE) изменяет на n величин за раз'''
+    def bind(ctx, args, check):
+        func = getattr(ctx.controller, method)
+        amount = args[0] if args else default
+        bound = functools.partial(func, amount)
+        bound.merge = lambda n: func(amount * n)
+        return bound
+    return bind
+
+
+def _widget_op(method):
+    def bind(ctx, args, check):
+        return functools.partial(getattr(ctx.controller, method), ctx.widget(args[0]))
+    return bind
+
+
+def _copy_state(ctx, args, check):
+    src, dst = ctx.element(args[0]), ctx.element(args[1])
+    return lambda: dst.set_state(src.state)
+
+
+def _apply_states(ctx, args, check):
+    for key in args[0]:
+        if key not in BATCH_VARIABLES:
+            ctx.element(key)
+    return functools.partial(ctx.controller.apply_states, *args)
+
+
+OPERATIONS = {
+    'log': ((1,), _controller_op('log')),
+    'set_crit_t': ((1,), _controller_op('set_crit_t')),
+    'set_temp': ((1,), _controller_op('set_temp')),
+    'raise_temp': ((0, 1), _scaled_op('raise_temp', 15)),
+    'lower_temp': ((0, 1), _scaled_op('lower_temp', 15)),
+    'reset_timer': ((0, 1), _controller_op('reset_timer')),
+    'make_call': ((0,), _controller_op('make_call')),
+    'fail': ((0,), _controller_op('fail')),
+    'global_style_reset': ((0,), _controller_op('global_style_reset')),
+    'highlight': ((1,), _widget_op('highlight')),
+    'style_reset': ((1,), _widget_op('style_reset')),
+    'set_state': ((2,), _element_op('set_state')),
+    'change_state': ((1,), _element_op('change_state')),
+    'copy_state': ((2,), _copy_state),
+    'apply_states': ((1, 2), _apply_states),
+}
+
+
+# Действие скомпилированного плана
+class PlanAction:
+    __slots__ = ('index', 'key', 'op', 'args', 'when', 'when_source', 'check', 'check_desc', 'period', 'delay',
+                 'catch_up')
+
+    def __init__(self, index, key, op, args, when, when_source, check, check_desc, period, delay, catch_up=None):
+        self.index = index
+        self.key = key
+        self.op = op
+        self.args = args
+        self.when = when
+        self.when_source = when_source
+        self.check = check
+        self.check_desc = check_desc
+        self.period = period
+        self.delay = delay
+        self.catch_up = catch_up
+
+    def with_args(self, args):
+        '''Копия действия с другими аргументами операции'''
+        return PlanAction(self.index, self.key, self.op, args, self.when, self.when_source, self.check,
+                          self.check_desc, self.period, self.delay, self.catch_up)
+
+    def element_codes(self):
+        '''Коды элементов, на которые ссылается действие'''
+        codes = set()
+        for cond in (self.when, self.check):
+            if cond is not None:
+                codes |= cond.names() - set(VARIABLES)
+        if self.op in ('set_state', 'change_state'):
+            codes.add(self.args[0])
+        elif self.op == 'copy_state':
+            codes.update(self.args)
+        elif self.op == 'apply_states':
+            codes.update(set(self.args[0]) - set(BATCH_VARIABLES))
+        return codes
+
+
+# Окружение, с которым связывается план: контроллер, элементы, (необязательно) окно с кнопками
+# и сеть условий, в которой общие подусловия связываются один раз
+class BindContext:
+    def __init__(self, controller, elems, window=None, network=None):
+        self.controller = controller
+        self.elems = elems
+        self.window = window
+        self.network = network
+
+    def bind(self, node):
+        '''Связать узел условия (через сеть, если она есть и узел в нее попадает)'''
+        if self.network is None or not node.shared:
+            return node.bind(self)
+        return self.network.bind(node, self, {_dep_key(name) for name in node.names()})
+
+    def element(self, code):
+        if code not in self.elems:
+            raise ScenarioError('неизвестный элемент "%s"' % code)
+        return self.elems[code]
+
+    def widget(self, name):
+        if self.window is None:
+            return None  # без интерфейса подсветка кнопок ничего не делает
+        widget = getattr(self.window, name, None)
+        if widget is None:
+            raise ScenarioError('в интерфейсе нет виджета "%s"' % name)
+        return widget
+
+
+# Скомпилированный сценарий: индексированные действия с разобранными условиями
+class ScenarioPlan:
+    def __init__(self, name, actions, digest=None, process=None):
+        self.name = name
+        self.actions = actions
+        self.digest = digest
+        self.process = process  # описание модели процесса (раздел "process") или None
+
+    def __len__(self):
+        return len(self.actions)
+
+    def with_args(self, **op_args):
+        '''Копия плана, в которой у всех действий операции op аргументы заменены на op_args[op]
+        (например, with_args(raise_temp=(40,)) - другой шаг нагрева).
+        Для apply_states передается словарь: в действиях заменяются значения только этих ключей
+        (with_args(apply_states={'crit_t': 100}) - другая Ткрит при сбросе состояний).
+        Замена, не совпавшая ни с одним действием (или ключ, которого нет ни в одном apply_states), - ошибка'''
+        for op in op_args:
+            if op not in OPERATIONS:
+                raise ScenarioError('неизвестная операция "%s"' % op)
+        unmatched = set(op_args) - {'apply_states'}
+        unmatched_keys = set(op_args.get('apply_states', ()))
+        actions = []
+        for action in self.actions:
+            if action.op == 'apply_states' and 'apply_states' in op_args:
+                values = action.args[0]
+                override = {key: value for key, value in op_args['apply_states'].items() if key in values}
+                if override:
+                    unmatched_keys -= set(override)
+                    action = action.with_args((dict(values, **override),) + tuple(action.args[1:]))
+            elif action.op in op_args:
+                args = tuple(op_args[action.op])
+                if len(args) not in OPERATIONS[action.op][0]:
+                    raise ScenarioError('операция %s принимает аргументов: %s' % (action.op, OPERATIONS[action.op][0]))
+                unmatched.discard(action.op)
+                action = action.with_args(args)
+            actions.append(action)
+        if unmatched or unmatched_keys:
+            raise ScenarioError('в сценарии %s нет действий для замены: %s' % (
+                self.name, ', '.join(sorted(unmatched) + ['apply_states.' + key for key in sorted(unmatched_keys)])))
+        return ScenarioPlan(self.name, actions, self.digest, self.process)
+
+    def with_crit_t(self, value):
+        '''Копия плана с другой Ткрит: заменяется значение, которое сценарий устанавливает сам
+        (операцией set_crit_t или ключом crit_t в apply_states)'''
+        if any(action.op == 'set_crit_t' for action in self.actions):
+            return self.with_args(set_crit_t=(value,))
+        return self.with_args(apply_states={'crit_t': value})
+
+    def bind(self, controller, elems, window=None):
+        '''Связать план с контроллером и элементами.
+        Возвращает словарь действий в формате, который принимает ScenarioController.execute_scenario.
+        Условия связываются через сеть условий контроллера (controller.conditions), общую для всех его сценариев'''
+        network = getattr(controller, 'conditions', None)
+        if network is None:
+            from luk_op_network import ConditionNetwork
+            network = controller.conditions = ConditionNetwork()
+        ctx = BindContext(controller, elems, window, network)
+        scenario = {}
+        for action in self.actions:
+            check = None
+            if action.check is not None:
+                check_fn, desc = ctx.bind(action.check), action.check_desc
+                check = lambda check_fn=check_fn, desc=desc: controller.check(desc, check_fn)
+            func = OPERATIONS[action.op][1](ctx, action.args, check)
+            if action.catch_up is not None:
+                func.catch_up = action.catch_up
+            when = None
+            if action.when is not None:
+                when = ctx.bind(action.when)
+                when.deps = frozenset(_dep_key(name) for name in action.when.names())
+                network.watch(when)
+            scenario[action.key] = (func, when, action.period, action.delay)
+        if self.process is not None:
+            from luk_op_process import ProcessModel
+            model = ProcessModel(self.process)
+            for code in model.input_codes:
+                ctx.element(code)
+            scenario[PROCESS_KEY] = (model.bind(controller), None, model.dt, model.delay)
+        return scenario
+
+
+def _dep_key(name):
+    '''Ключ зависимости в терминах ScenarioController.notify_change'''
+    return 'sc.' + name if name in VARIABLES else name
+
+
+def compile_scenario(data, name=None):
+    '''Проверить описание сценария (распарсенный JSON) и скомпилировать его в план.
+    Все найденные ошибки собираются и выдаются одним исключением ScenarioError'''
+    errors = []
+    if not isinstance(data, dict) or not isinstance(data.get('actions'), dict):
+        raise ScenarioError('сценарий должен быть объектом с полем "actions"')
+    actions = []
+    for index, (key, spec) in enumerate(data['actions'].items()):
+        try:
+            actions.append(_compile_action(index, key, spec))
+        except ScenarioError as e:
+            errors.append('%s: %s' % (key, e))
+    process = data.get('process')
+    if process is not None:
+        from luk_op_process import validate_process
+        errors += ['process: ' + e for e in validate_process(process)]
+    if errors:
+        raise ScenarioError('ошибки в сценарии:\n  ' + '\n  '.join(errors))
+    return ScenarioPlan(data.get('name', name), actions, process=process)
+
+
+def _compile_action(index, key, spec):
+    if not isinstance(spec, dict):
+        raise ScenarioError('описание действия должно быть объектом')
+    unknown = set(spec) - {'do', 'when', 'check', 'check_desc', 'period', 'delay', 'catch_up'}
+    if unknown:
+        raise ScenarioError('неизвестные поля ' + ', '.join(sorted(unknown)))
+    do = spec.get('do')
+    if not isinstance(do, list) or not do or do[0] not in OPERATIONS:
+        raise ScenarioError('поле "do" должно начинаться с одной из операций: ' + ', '.join(sorted(OPERATIONS)))
+    op, args = do[0], tuple(do[1:])
+    if len(args) not in OPERATIONS[op][0]:
+        raise ScenarioError('операция %s принимает аргументов: %s, передано %d' % (op, OPERATIONS[op][0], len(args)))
+    if op == 'apply_states':
+        values = args[0]
+        if not isinstance(values, dict) or not values or \
+                any(isinstance(v, bool) or not isinstance(v, (int, float)) for v in values.values()):
+            raise ScenarioError('apply_states принимает непустой объект {код элемента или переменная: число}')
+        if len(args) > 1 and not isinstance(args[1], str):
+            raise ScenarioError('заголовок apply_states должен быть строкой')
+    check = spec.get('check')
+    if check is not None and op not in ('set_state', 'change_state'):
+        raise ScenarioError('поле "check" допустимо только для set_state и change_state')
+    period = spec.get('period', -1)
+    delay = spec.get('delay', 0)
+    for field, value in (('period', period), ('delay', delay)):
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ScenarioError('поле "%s" должно быть числом' % field)
+    if period != -1 and period < MIN_PERIOD or delay < 0:
+        raise ScenarioError('period должен быть -1 или не меньше %g, delay - неотрицательным' % MIN_PERIOD)
+    catch_up = spec.get('catch_up')
+    if catch_up is not None and catch_up not in CATCH_UP_POLICIES:
+        raise ScenarioError('поле "catch_up" должно быть одним из: ' + ', '.join(CATCH_UP_POLICIES))
+    if catch_up is not None and period == -1:
+        raise ScenarioError('поле "catch_up" допустимо только для повторяемых действий')
+    when = spec.get('when')
+    return PlanAction(index, key, op, args,
+                      parse_condition(when) if when is not None else None, when,
+                      parse_condition(check) if check is not None else None,
+                      spec.get('check_desc', check), period, delay, catch_up)
+
+
+def load_scenario(path, use_cache=True):
+    '''Загрузить сценарий из файла; скомпилированный план берется из кеша, если файл не менялся'''
+    with open(path, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw + str(PLAN_VERSION).encode()).hexdigest()
+    cache_path = os.path.join(os.path.dirname(os.path.abspath(path)), '__pycache__',
+                              '%s.%s.plan' % (os.path.basename(path), digest[:16]))
+    if use_cache and os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            print('Warning: поврежден кеш сценария %s (%s), компилируем заново' % (cache_path, e), file=sys.stderr)
+    try:
+        data = json.loads(raw.decode('utf-8'))
+    except ValueError as e:
+        raise ScenarioError('%s: некорректный JSON: %s' % (path, e))
+    plan = compile_scenario(data, os.path.splitext(os.path.basename(path))[0])
+    plan.digest = digest
+    if use_cache:
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path + '.tmp', 'wb') as f:
+                pickle.dump(plan, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(cache_path + '.tmp', cache_path)
+        except OSError as e:
+            print('Warning: не удалось сохранить кеш сценария: %s' % e, file=sys.stderr)
+    return plan
+
+
+if __name__ == '__main__':
+    # Проверка файлов сценариев без запуска тренажера: python luk_op_scenario.py scenarios/*.json
+    status = 0
+    for path in sys.argv[1:]:
+        try:
+            plan = load_scenario(path, use_cache=False)
+        except (ScenarioError, OSError) as e:
+            print('%s: %s' % (path, e))
+            status = 1
+        else:
+            codes = set().union(*(a.element_codes() for a in plan.actions)) if plan.actions else set()
+            if plan.process is not None:
+                codes.update(code for var in plan.process['variables'].values() for code in var.get('inputs', {}))
+            print('%s: OK, действий: %d, элементы: %s' % (path, len(plan), ', '.join(sorted(codes))))
+    sys.exit(status)
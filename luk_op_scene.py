@@ -0,0 +1,144 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''Мнемосхема на QGraphicsScene - альтернатива картинкам-QLabel из дизайнера (ключ --scene).
+
+Спрайты элементов и статичные картинки схемы становятся объектами одной сцены в координатах дизайнера,
+а масштаб окна - преобразованием вида вместо новой геометрии каждого виджета. Объект хранит готовую
+картинку в разрешении устройства (окрашенную, растянутую и обрезанную по непрозрачной части) и собирает
+ее заново только при смене состояния или масштаба; отрисовка - копирование этой картинки без
+преобразований. Границы объекта - непрозрачная часть спрайта (по атласу), поэтому при смене состояния
+элемента перерисовывается только эта область вида, а не весь прямоугольник виджета - у наложений схемы
+он размером с окно. Программный растеризатор Qt, OpenGL не нужен.
+'''
+
+import math
+from collections import OrderedDict
+
+from PyQt5 import QtGui, QtCore, QtWidgets
+
+from luk_op_sprites import sprite_cache, sprite_atlas
+
+SPILL = 1  # запас границ объекта (пикселей дизайнера) на сглаживание при растяжении спрайта
+RENDERED_LIMIT = 512  # собранных картинок в общем кеше вида (на все состояния и масштабы)
+
+
+# Спрайт на сцене: прямоугольник виджета из дизайнера, показывающий картинку в цвет состояния.
+# Отрисовку и границы объекта выполняет Qt (QGraphicsPixmapItem), Python вызывается только при смене
+# состояния или масштаба: картинка собрана в пикселях устройства, и ее devicePixelRatio равен числу
+# пикселей устройства на единицу сцены, поэтому на виде она копируется один к одному
+class SpriteItem(QtWidgets.QGraphicsPixmapItem):
+    def __init__(self, rect, name, code=None, source=None, state=None, rendered=None):
+        super().__init__()
+        self.setPos(rect.topLeft())
+        self.setShapeMode(QtWidgets.QGraphicsPixmapItem.BoundingRectShape)
+        self.local = QtCore.QRectF(0, 0, rect.width(), rect.height())
+        self.name = name  # имя спрайта в атласе (img/втг, raw_img/гту_0)
+        self.code = code  # код элемента для окрашивания на лету, если спрайта нет в атласе (None - статичная картинка)
+        self.source = source  # картинка из дизайнера: показывается до первой смены состояния и при отсутствии атласа
+        self.state = state  # None - неокрашенная картинка
+        self.device_scale = None  # пикселей устройства на единицу сцены (масштаб вида с учетом экрана)
+        self.renders = 0  # сколько раз собиралась картинка (смены состояния и масштаба)
+        self.rendered = rendered  # общий кеш собранных картинок: одинаковые символы собираются один раз
+        atlas = sprite_atlas()
+        area = atlas.opaque_rect(name, rect.width(), rect.height()) if atlas is not None else None
+        if area is None:
+            self.bounds = QtCore.QRectF(self.local)
+        else:
+            self.bounds = area.adjusted(-SPILL, -SPILL, SPILL, SPILL).intersected(self.local)
+
+    def set_state(self, state):
+        '''Сменить состояние: на виде помечается для перерисовки только непрозрачная часть спрайта'''
+        if state != self.state:
+            self.state = state
+            self.refresh()
+
+    def set_device_scale(self, scale):
+        if scale != self.device_scale:
+            self.device_scale = scale
+            self.refresh()
+
+    def refresh(self):
+        scale = self.device_scale
+        if scale is None:
+            return
+        pixmap, offset = self.rendered_pixmap(round(self.local.width() * scale), round(self.local.height() * scale),
+                                              scale)
+        self.setOffset(offset)
+        self.setPixmap(pixmap)
+
+    def rendered_pixmap(self, width, height, scale):
+        '''Картинка и ее смещение из общего кеша (собирается при первом запросе)'''
+        if self.rendered is None:
+            return self.render(width, height, scale)
+        key = (self.name, self.state, width, height, scale, self.bounds.getRect())
+        entry = self.rendered.get(key)
+        if entry is None:
+            entry = self.rendered[key] = self.render(width, height, scale)
+            if len(self.rendered) > RENDERED_LIMIT:
+                self.rendered.popitem(last=False)
+        else:
+            self.rendered.move_to_end(key)
+        return entry
+
+    def render(self, width, height, scale):
+        '''Собрать картинку для виджета width x height пикселей устройства: только непрозрачную часть'''
+        self.renders += 1
+        sx, sy = width / self.local.width(), height / self.local.height()
+        b = self.bounds
+        crop = QtCore.QRect(math.floor(b.x() * sx), math.floor(b.y() * sy),
+                            math.ceil(b.width() * sx) + 1, math.ceil(b.height() * sy) + 1)
+        crop = crop.intersected(QtCore.QRect(0, 0, width, height))
+        pixmap = QtGui.QPixmap(max(crop.width(), 1), max(crop.height(), 1))
+        pixmap.fill(QtCore.Qt.transparent)
+        painter = QtGui.QPainter(pixmap)
+        painter.translate(-crop.x(), -crop.y())
+        full = QtCore.QRectF(0, 0, width, height)
+        atlas = sprite_atlas()
+        if atlas is None or not atlas.draw(painter, self.name, self.state, full):
+            if self.state is not None and self.code is not None:
+                painter.drawPixmap(0, 0, sprite_cache.get(self.code, self.state, QtCore.QSize(width, height)))
+            elif self.source is not None:
+                painter.drawPixmap(0, 0, self.source.scaled(width, height, QtCore.Qt.IgnoreAspectRatio,
+                                                            QtCore.Qt.SmoothTransformation))
+        painter.end()
+        pixmap.setDevicePixelRatio(scale)
+        return pixmap, QtCore.QPointF(crop.x() / scale, crop.y() / scale)
+
+
+# Вид мнемосхемы: лежит под остальными виджетами окна и занимает его целиком; сцена - в координатах дизайнера
+class MimicView(QtWidgets.QGraphicsView):
+    def __init__(self, parent, rect):
+        scene = QtWidgets.QGraphicsScene(QtCore.QRectF(rect), parent)
+        super().__init__(scene, parent)
+        self.setObjectName('mimic')
+        self.setGeometry(rect)
+        self.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop)
+        self.setInteractive(False)
+        self.setBackgroundBrush(parent.palette().window())
+        self.setViewportUpdateMode(QtWidgets.QGraphicsView.MinimalViewportUpdate)  # только измененные области
+        self.setOptimizationFlags(QtWidgets.QGraphicsView.DontSavePainterState |
+                                  QtWidgets.QGraphicsView.DontAdjustForAntialiasing)
+        self.sprites = []  # объекты в порядке наложения
+        self.rendered = OrderedDict()  # (спрайт, состояние, размер, ...) -> (картинка, смещение), LRU
+
+    def add_label(self, label, rect, name, code=None, state=None):
+        '''Добавить объект вместо картинки label (прямоугольник rect - в координатах дизайнера)'''
+        pixmap = label.pixmap()
+        item = SpriteItem(rect, name, code, QtGui.QPixmap(pixmap) if pixmap is not None else None, state,
+                          self.rendered)
+        item.setZValue(len(self.sprites))
+        item.set_device_scale(self.transform().m11() * self.devicePixelRatioF())
+        self.scene().addItem(item)
+        self.sprites.append(item)
+        return item
+
+    def set_scale(self, scale):
+        '''Масштаб вида; картинки объектов собираются под новое разрешение (одинаковые - один раз)'''
+        self.setTransform(QtGui.QTransform.fromScale(scale, scale))
+        device_scale = scale * self.devicePixelRatioF()
+        for item in self.sprites:
+            item.set_device_scale(device_scale)
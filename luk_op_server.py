@@ -0,0 +1,238 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''Сервер тренажера: много сеансов обучаемых в одном процессе.
+
+Все сеансы выполняет один поток-планировщик (общая очередь сроков и общее условие пробуждения),
+интерфейс каждого обучаемого - тонкий клиент (luk_op_client), подключенный по локальному сокету.
+
+Протокол: строки JSON в UTF-8, по одному сообщению на строку.
+    клиент -> сервер: {"op": "start", "scenario": "test"}, {"op": "press", "button": "btn_gt"}, {"op": "status"},
+        {"op": "disable", "action": "ключ действия сценария"}, {"op": "enable", "action": "..."}
+    сервер -> клиент: {"event": "opened", "session": N} при подключении, далее события сеанса
+        (temp, state, log, highlight, style_reset, global_style_reset, ended - см. luk_op_session)
+        и ответ на status: {"event": "status", "sessions": [...]}
+
+Пример:
+    python luk_op_server.py --port 8765
+'''
+
+import os
+import sys
+import json
+import heapq
+import queue
+import argparse
+import threading
+import socketserver
+
+from luk_op_engine import WallClock
+from luk_op_scenario import load_scenario, ScenarioError
+from luk_op_session import Session
+
+SCENARIO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scenarios')
+DEFAULT_PORT = 8765
+
+
+# Общий планировщик: выполняет шаги всех сеансов в одном потоке.
+# Команды клиентов тоже выполняются здесь, поэтому состояние сеансов меняет только этот поток
+class SessionScheduler(threading.Thread):
+    def __init__(self):
+        threading.Thread.__init__(self, name='luk-scheduler', daemon=True)
+        self.clock = WallClock()
+        self.wakeup = threading.Condition()
+        self.sessions = {}
+        self.dirty = set()  # сеансы с изменениями состояния (заполняет Session.notify_change)
+        self.commands = []
+        self.running = True
+        self._heap = []  # (срок, номер, сеанс)
+        self._due = {}  # сеанс -> срок его актуальной записи в очереди
+        self._seq = 0
+        self._next_id = 0
+
+    def new_session(self):
+        with self.wakeup:
+            self._next_id += 1
+            session = Session(self._next_id, clock=self.clock, wakeup=self.wakeup)
+            session.dirty = self.dirty
+            self.sessions[session.id] = session
+        return session
+
+    def submit(self, func, *args):
+        '''Выполнить func(*args) в потоке планировщика'''
+        with self.wakeup:
+            self.commands.append((func, args))
+            self.wakeup.notify()
+
+    def start_scenario(self, session, scenario):
+        session.log("=== Сценарий начат ===")
+        session.begin_scenario(scenario)
+        self.dirty.add(session)
+
+    def close_session(self, session):
+        session.stop()
+        session.listeners = []
+        with self.wakeup:
+            self.sessions.pop(session.id, None)
+        self._due.pop(session, None)
+
+    def stop(self):
+        with self.wakeup:
+            self.running = False
+            self.wakeup.notify()
+
+    def run(self):
+        while self.running:
+            with self.wakeup:
+                commands, self.commands = self.commands, []
+            for func, args in commands:
+                try:
+                    func(*args)
+                except Exception as e:  # ошибка одного сеанса не должна останавливать остальные
+                    print('Ошибка команды %s: %s' % (getattr(func, '__name__', func), e), file=sys.stderr)
+            now = self.clock.now()
+            with self.wakeup:
+                ready = set(self.dirty)
+                self.dirty.clear()
+            while self._heap and self._heap[0][0] <= now:
+                due, _, session = heapq.heappop(self._heap)
+                if self._due.get(session) == due:
+                    del self._due[session]
+                    ready.add(session)
+            for session in ready:
+                if session.active:
+                    self.step(session)
+            with self.wakeup:
+                if self.running and not self.commands and not self.dirty:
+                    timeout = self._heap[0][0] - self.clock.now() if self._heap else None
+                    if timeout is None or timeout > 0:
+                        self.wakeup.wait(timeout)
+
+    def step(self, session):
+        deadline = session.step()
+        if session.active and deadline is not None and self._due.get(session, float('inf')) > deadline:
+            self._due[session] = deadline
+            self._seq += 1
+            heapq.heappush(self._heap, (deadline, self._seq, session))
+
+    def status(self):
+        with self.wakeup:
+            sessions = list(self.sessions.values())
+        return [{'session': s.id, 'active': s.active, 'temp': s._temp, 'crit_t': s._crit_t, 'result': s.result}
+                for s in sessions]
+
+
+# Соединение с клиентом: один сеанс на соединение; события сеанса пишет отдельный поток,
+# чтобы медленный клиент не задерживал планировщик
+class ClientHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        scheduler = self.server.scheduler
+        self.outbox = queue.SimpleQueue()
+        writer = threading.Thread(target=self.write_events, daemon=True)
+        writer.start()
+        self.session = scheduler.new_session()
+        self.session.listeners.append(self.outbox.put)
+        self.outbox.put({'event': 'opened', 'session': self.session.id})
+        try:
+            for line in self.rfile:
+                try:
+                    self.dispatch(json.loads(line.decode('utf-8')))
+                except (ValueError, KeyError, ScenarioError) as e:
+                    self.outbox.put({'event': 'error', 'msg': str(e)})
+        finally:
+            scheduler.submit(scheduler.close_session, self.session)
+            self.outbox.put(None)
+            writer.join()
+
+    def dispatch(self, msg):
+        scheduler = self.server.scheduler
+        op = msg['op']
+        if op == 'start':
+            scheduler.submit(self.start_scenario, msg.get('scenario', 'test'))
+        elif op == 'press':
+            scheduler.submit(self.session.press, msg['button'])
+        elif op in ('enable', 'disable'):
+            self.session.set_action_enabled(msg['action'], op == 'enable')
+        elif op == 'status':
+            self.outbox.put({'event': 'status', 'sessions': scheduler.status()})
+        else:
+            raise ValueError('неизвестная команда: %s' % op)
+
+    def start_scenario(self, name):
+        '''Связать сценарий с сеансом и запустить (в потоке планировщика: связывание меняет сеть условий сеанса);
+        ошибка сценария - ответ клиенту, а не разрыв соединения'''
+        try:
+            scenario = self.session.bind(self.server.plan(name))
+        except (ValueError, ScenarioError) as e:
+            self.outbox.put({'event': 'error', 'msg': str(e)})
+            return
+        self.server.scheduler.start_scenario(self.session, scenario)
+
+    def write_events(self):
+        while True:
+            events = [self.outbox.get()]
+            try:
+                while len(events) < 1000:
+                    events.append(self.outbox.get_nowait())
+            except queue.Empty:
+                pass
+            data = ''.join(json.dumps(e, ensure_ascii=False) + '\n' for e in events if e is not None)
+            try:
+                if data:
+                    self.wfile.write(data.encode('utf-8'))
+                    self.wfile.flush()
+            except OSError:
+                break
+            if None in events:
+                break
+
+
+class SessionServer(socketserver.ThreadingTCPServer):
+
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128  # классы подключаются одновременно
+
+    def __init__(self, address, scenario_dir=SCENARIO_DIR):
+        socketserver.ThreadingTCPServer.__init__(self, address, ClientHandler)
+        self.scenario_dir = scenario_dir
+        self.plans = {}  # сценарии компилируются один раз на сервер и связываются с каждым сеансом
+        self.plans_lock = threading.Lock()
+        self.scheduler = SessionScheduler()
+        self.scheduler.start()
+
+    def plan(self, name):
+        with self.plans_lock:
+            plan = self.plans.get(name)
+            if plan is None:
+                if os.path.basename(name) != name:
+                    raise ValueError('недопустимое имя сценария: %s' % name)
+                try:
+                    plan = load_scenario(os.path.join(self.scenario_dir, name + '.json'))
+                except (ScenarioError, OSError) as e:
+                    raise ValueError('%s: %s' % (name, e))
+                self.plans[name] = plan
+            return plan
+
+    def server_close(self):
+        self.scheduler.stop()
+        socketserver.ThreadingTCPServer.server_close(self)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Сервер тренажера: сеансы обучаемых в одном процессе')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    args = parser.parse_args(argv)
+    with SessionServer((args.host, args.port)) as server:
+        print('Сервер тренажера: %s:%d' % (args.host, args.port))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
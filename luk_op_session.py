@@ -0,0 +1,101 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''Сеанс тренажера без интерфейса: элементы, переменные процесса, таймеры и журнал одного обучаемого.
+
+Все, что интерфейс показывает (табло, состояния элементов, подсветка кнопок, журнал, завершение),
+сеанс выдает событиями-словарями своим слушателям: так его можно выполнять в прогоне без интерфейса
+или на сервере, который передает события тонкому клиенту (luk_op_server, luk_op_client).
+'''
+
+from luk_op_engine import ScenarioEngine
+from luk_op_elements import Element, ELEMENTS, BUTTONS
+
+
+# Подставляется вместо окна при связывании сценария: вместо виджетов кнопок - их имена,
+# по которым клиент найдет свои виджеты
+class WidgetNames:
+    def __getattr__(self, name):
+        return name
+
+
+class Session(ScenarioEngine):
+
+    headless = True
+    dirty = None  # множество сеансов с изменениями, которое разбирает общий планировщик (None - свой цикл)
+
+    def __init__(self, session_id=None, temp=60, critical_temp=200, timer=60.0, clock=None, wakeup=None):
+        self.listeners = []  # функции, получающие события сеанса
+        self.elems = {}
+        ScenarioEngine.__init__(self, temp, critical_temp, timer, clock, wakeup)
+        self.id = session_id
+        self.result = None  # код завершения сценария (0 - успех, 1 - провал, None - не завершен)
+        self.end_time = None  # время завершения от начала сценария
+        for code, widget_name, initial_state in ELEMENTS:
+            self.elems[code] = Element(self, code, None, initial_state)
+
+    def emit(self, event):
+        for listener in self.listeners:
+            listener(event)
+
+    def begin_scenario(self, scenario):
+        self.result = None
+        self.end_time = None
+        ScenarioEngine.begin_scenario(self, scenario)
+
+    def bind(self, plan):
+        '''Связать скомпилированный сценарий с элементами сеанса'''
+        return plan.bind(self, self.elems, WidgetNames())
+
+    def notify_change(self, key):
+        if self.conditions is not None:
+            self.conditions.invalidate(key)
+        with self._wakeup:
+            self._changed.add(key)
+            if self.dirty is not None:
+                self.dirty.add(self)
+            self._wakeup.notify()
+        if self.listeners and key in self.elems:
+            self.emit({'event': 'state', 'code': key, 'state': self.states.value(key)})
+
+    def set_action_enabled(self, key, enabled=True):
+        ScenarioEngine.set_action_enabled(self, key, enabled)
+        with self._wakeup:
+            if self.dirty is not None:
+                self.dirty.add(self)
+
+    def press(self, button):
+        '''Нажатие кнопки оператором (как в интерфейсе)'''
+        if button == 'btn_call':
+            self.make_call()
+            return
+        for name, code, new_state in BUTTONS:
+            if name == button:
+                self.elems[code].set_state(new_state)
+                return
+        raise ValueError('неизвестная кнопка: %s' % button)
+
+    def log(self, msg, level='info', code=None):
+        ScenarioEngine.log(self, msg, level, code)
+        if self.listeners:
+            self.emit({'event': 'log', 'time': self.clock.now(), 'msg': msg, 'level': level, 'code': code})
+
+    def display_temp(self):
+        if self.listeners:
+            self.emit({'event': 'temp', 'temp': self.temp, 'crit_t': self.crit_t})
+
+    def end_scenario(self, code):
+        if self.result is None:
+            self.result = code
+            self.end_time = self.clock.now() - self.started_at
+        self.stop()
+        self.emit({'event': 'ended', 'code': code})
+
+    def highlight(self, button):
+        self.emit({'event': 'highlight', 'button': button})
+
+    def style_reset(self, button):
+        self.emit({'event': 'style_reset', 'button': button})
+
+    def global_style_reset(self):
+        self.emit({'event': 'global_style_reset'})
@@ -0,0 +1,197 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''Спрайты элементов, окрашенные в цвет состояния: атлас, подготовленный заранее, и кеш окрашенных на лету.
+
+Картинки берутся из ресурсов Qt (luk_op_resources.qrc, скомпилирован в luk_op_resources_rc), поэтому
+не зависят от текущего каталога. Атлас (img/atlas.png и индекс img/atlas.json) собирает luk_op_atlas
+из img/*.png и raw_img/*.png: все состояния во всех используемых размерах, обрезанные по непрозрачной
+части. Элемент, для которого в атласе есть вариант, рисуется копированием прямоугольника атласа;
+остальные окрашиваются на лету (SpriteCache). После изменения картинок атлас и ресурсы пересобираются:
+    python luk_op_atlas.py
+    pyrcc5 luk_op_resources.qrc -o luk_op_resources_rc.py
+'''
+
+import json
+from collections import OrderedDict
+
+from PyQt5 import QtGui, QtCore
+
+import luk_op_resources_rc  # регистрирует ресурсы :/img и :/raw_img
+
+IMG_DIR = ':/img'
+FALLBACK_SPRITE = 'temp'
+ATLAS_PATH = ':/img/atlas'  # без расширения: .png - картинка атласа, .json - индекс
+
+# Цвет, накладываемый на спрайт в каждом состоянии (RGBA)
+STATE_COLORS = {
+    0: (170, 255, 0, 150),
+    1: (255, 170, 170, 150),
+    2: (255, 230, 90, 150),  # открывается
+    3: (90, 200, 255, 150),  # закрывается
+    4: (160, 160, 160, 170),  # неисправность
+}
+PLAIN = '-'  # ключ неокрашенного варианта в атласе (статичные картинки raw_img)
+
+
+def color_key(color_state):
+    '''Состояние, цвет которого накладывается (неизвестные состояния окрашиваются как 1)'''
+    return color_state if color_state in STATE_COLORS else 1
+
+
+# Окрашенные спрайты хранятся по ключу (файл, состояние): элементы без собственной картинки
+# делят один спрайт-заглушку. Старые записи вытесняются при превышении лимита памяти (LRU)
+class SpriteCache:
+    def __init__(self, max_bytes=64 * 1024 * 1024, img_dir=IMG_DIR):
+        self.max_bytes = max_bytes
+        self.img_dir = img_dir
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._paths = {}  # код элемента -> путь к файлу спрайта
+        self._pixmaps = OrderedDict()  # (путь, состояние) -> окрашенный QPixmap
+
+    def sprite_path(self, code):
+        '''Путь к спрайту элемента (или к заглушке); проверка диска выполняется один раз на код'''
+        path = self._paths.get(code)
+        if path is None:
+            path = self.img_dir + '/' + code + '.png'
+            if not QtCore.QFile.exists(path):  # и для ресурсов Qt, и для каталога на диске
+                path = self.img_dir + '/' + FALLBACK_SPRITE + '.png'
+            self._paths[code] = path
+        return path
+
+    def sprite_name(self, code):
+        '''Имя спрайта элемента в атласе: путь относительно каталога программы без расширения (img/втг)'''
+        return self.sprite_path(code)[2:-4]
+
+    def get(self, code, color_state=0, size=None):
+        '''Спрайт элемента code, окрашенный в цвет состояния color_state;
+        если задан size (QSize), спрайт заранее растянут до этого размера (как в QLabel с масштабированием содержимого)'''
+        key = (self.sprite_path(code), color_key(color_state))
+        if size is not None:
+            key += (size.width(), size.height())
+        pxm = self._pixmaps.get(key)
+        if pxm is not None:
+            self._pixmaps.move_to_end(key)
+            self.hits += 1
+            return pxm
+        self.misses += 1
+        if size is not None:
+            pxm = self.get(code, color_state).scaled(size, QtCore.Qt.IgnoreAspectRatio, QtCore.Qt.SmoothTransformation)
+        else:
+            pxm = self.render(*key)
+        self._pixmaps[key] = pxm
+        self.used_bytes += self.pixmap_bytes(pxm)
+        while self.used_bytes > self.max_bytes and len(self._pixmaps) > 1:
+            _, old = self._pixmaps.popitem(last=False)
+            self.used_bytes -= self.pixmap_bytes(old)
+        return pxm
+
+    def render(self, path, color_state):
+        '''Загрузить спрайт с диска и наложить цвет состояния'''
+        pxm = QtGui.QPixmap(path)
+        p = QtGui.QPainter(pxm)
+        p.setCompositionMode(QtGui.QPainter.CompositionMode_SourceAtop)
+        p.fillRect(pxm.rect(), QtGui.QColor(*STATE_COLORS[color_state]))
+        p.end()
+        return pxm
+
+    def preload(self, codes, states=tuple(STATE_COLORS)):
+        '''Заранее подготовить спрайты всех состояний для перечисленных элементов (вызывать из GUI-потока)'''
+        for code in codes:
+            for state in states:
+                self.get(code, state)
+
+    def clear(self):
+        self._pixmaps.clear()
+        self._paths.clear()
+        self.used_bytes = 0
+
+    @staticmethod
+    def pixmap_bytes(pxm):
+        return pxm.width() * pxm.height() * max(pxm.depth(), 8) // 8
+
+
+sprite_cache = SpriteCache()
+
+
+# Атлас спрайтов: одна картинка со всеми вариантами и индекс
+#   {"sprites": {имя: [{"size": [ш, в], "rects": {состояние: [x, y, ш, в, смещение x, смещение y]}}, ...]}}
+# Вариант - спрайт, растянутый до размера виджета size и окрашенный в цвет состояния; в атласе хранится
+# только его непрозрачная часть (прямоугольник x, y, ш, в), смещенная внутри виджета на (смещение x, y)
+class SpriteAtlas:
+    def __init__(self, pixmap, index):
+        self.pixmap = pixmap
+        self.sprites = {}  # имя -> [(ш, в, {ключ состояния: прямоугольники})]
+        for name, variants in index['sprites'].items():
+            self.sprites[name] = [(v['size'][0], v['size'][1],
+                                   {key: (QtCore.QRectF(*r[:4]), r[4], r[5]) for key, r in v['rects'].items()})
+                                  for v in variants]
+
+    @classmethod
+    def load(cls, path=ATLAS_PATH):
+        '''Загрузить атлас (None, если он не собран)'''
+        index_file = QtCore.QFile(path + '.json')
+        if not index_file.open(QtCore.QIODevice.ReadOnly):
+            return None
+        try:
+            index = json.loads(bytes(index_file.readAll()).decode('utf-8'))
+        finally:
+            index_file.close()
+        pixmap = QtGui.QPixmap(path + '.png')
+        if pixmap.isNull():
+            return None
+        return cls(pixmap, index)
+
+    def has(self, name, state):
+        variants = self.sprites.get(name)
+        return variants is not None and self._key(state) in variants[0][2]
+
+    @staticmethod
+    def _key(state):
+        return PLAIN if state is None else str(color_key(state))
+
+    def variant(self, name, width, height):
+        '''Вариант точно под размер виджета, а если его нет - ближайший по площади'''
+        return min(self.sprites[name], key=lambda v: abs(v[0] * v[1] - width * height))
+
+    def opaque_rect(self, name, width, height):
+        '''Часть виджета width x height, непрозрачная хотя бы в одном из состояний спрайта name
+        (QRectF в координатах виджета; None - спрайта нет в атласе)'''
+        if name not in self.sprites:
+            return None
+        w, h, rects = self.variant(name, width, height)
+        sx, sy = width / w, height / h
+        area = QtCore.QRectF()
+        for source, ox, oy in rects.values():
+            area = area.united(QtCore.QRectF(ox * sx, oy * sy, source.width() * sx, source.height() * sy))
+        return area
+
+    def draw(self, painter, name, state, rect):
+        '''Нарисовать спрайт name в состоянии state (None - неокрашенный) в прямоугольнике виджета rect.
+        Вариант нужного размера копируется из атласа без обработки; False - варианта нет'''
+        variants = self.sprites.get(name)
+        if variants is None:
+            return False
+        width, height, rects = self.variant(name, rect.width(), rect.height())
+        entry = rects.get(self._key(state))
+        if entry is None:
+            return False
+        source, ox, oy = entry
+        sx, sy = rect.width() / width, rect.height() / height
+        if sx != 1 or sy != 1:  # размер виджета не из атласа - растягиваем ближайший вариант
+            painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform)
+        target = QtCore.QRectF(rect.x() + ox * sx, rect.y() + oy * sy, source.width() * sx, source.height() * sy)
+        painter.drawPixmap(target, self.pixmap, source)
+        return True
+
+
+_atlas = []
+
+
+def sprite_atlas():
+    '''Атлас из ресурсов (загружается при первом обращении; None, если он не собран)'''
+    if not _atlas:
+        _atlas.append(SpriteAtlas.load())
+    return _atlas[0]
@@ -0,0 +1,88 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''Хранилище состояний элементов установки.
+
+Коды элементов интернируются в целочисленные индексы, состояния лежат в упакованном массиве.
+Дополнительно хранятся две битовые маски (состояние равно 1 / равно 0), поэтому условие вида
+"зугт == 0 and зуку == 0 and втг == 1 ..." по любому числу элементов проверяется одной операцией
+над масками (match) вместо обращения к каждому элементу.
+
+Состояния меняют два потока (GUI-поток - по нажатиям оператора, поток контроллера - в сценарии),
+а обновление масок - чтение-изменение-запись, поэтому запись выполняется под блокировкой:
+иначе одно из обновлений маски может потеряться, и маска разойдется со значениями.
+'''
+
+import sys
+import threading
+from array import array
+
+
+class StateStore:
+    def __init__(self):
+        self.codes = []  # индекс -> код элемента
+        self.index = {}  # код элемента -> индекс
+        self.values = array('l')  # индекс -> состояние
+        self.ones = 0  # бит i установлен, если состояние элемента i равно 1
+        self.zeros = 0  # бит i установлен, если состояние элемента i равно 0
+        self.lock = threading.Lock()  # запись значения и масок
+
+    def __len__(self):
+        return len(self.codes)
+
+    def add(self, code, state=0):
+        '''Зарегистрировать элемент (повторная регистрация кода только задает состояние); вернуть индекс'''
+        i = self.index.get(code)
+        if i is None:
+            code = sys.intern(code)
+            with self.lock:
+                i = len(self.codes)
+                self.codes.append(code)
+                self.index[code] = i
+                self.values.append(state)
+                self._update_bits(i, state)
+        else:
+            self.set(i, state)
+        return i
+
+    def get(self, i):
+        return self.values[i]
+
+    def value(self, code):
+        return self.values[self.index[code]]
+
+    def set(self, i, state):
+        '''Установить состояние элемента с индексом i; вернуть True, если оно изменилось'''
+        with self.lock:
+            if self.values[i] == state:
+                return False
+            self.values[i] = state
+            self._update_bits(i, state)
+        return True
+
+    def _update_bits(self, i, state):
+        '''Обновить маски для элемента i (вызывать под self.lock)'''
+        bit = 1 << i
+        self.ones = self.ones | bit if state == 1 else self.ones & ~bit
+        self.zeros = self.zeros | bit if state == 0 else self.zeros & ~bit
+
+    def mask(self, pairs):
+        '''Маски для match по парам (код, состояние 0 или 1)'''
+        ones = zeros = 0
+        for code, state in pairs:
+            bit = 1 << self.index[code]
+            if state == 1:
+                ones |= bit
+            elif state == 0:
+                zeros |= bit
+            else:
+                raise ValueError('маской проверяются только состояния 0 и 1, а не %r' % (state,))
+        return ones, zeros
+
+    def match(self, ones, zeros):
+        '''Все элементы из маски ones в состоянии 1, а из маски zeros - в состоянии 0'''
+        return self.ones & ones == ones and self.zeros & zeros == zeros
+
+    def snapshot(self):
+        '''Копия состояний всех элементов (по индексам)'''
+        return self.values.tolist()
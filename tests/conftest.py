@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+
+'''Модули тренажера лежат в корне репозитория: тесты запускаются и как pytest, и как python -m pytest'''
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+'''Архив журналов сеансов (luk_op_archive): строки по ключу, условия и интервалы по сеансам.
+Журналы пишутся прогонами test.json без интерфейса на виртуальных часах'''
+
+import os
+
+import numpy as np
+import pytest
+
+from luk_op_archive import Archive, build_archive, _merge
+from luk_op_headless import HeadlessController
+from luk_op_journal import Recorder, STATE, VAR, END
+from luk_op_elements import BUTTONS
+from luk_op_scenario import load_scenario
+
+SCENARIO = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scenarios', 'test.json')
+CLOSE_ALL = [(25.0, button) for button, _, _ in BUTTONS] + [(90.0, 'btn_call')]
+
+
+def record(path, clicks=()):
+    sc = HeadlessController()
+    recorder = Recorder(path).attach(sc, [b for b, _, _ in BUTTONS] + ['btn_call'])
+    sc.run_plan(load_scenario(SCENARIO, use_cache=False), clicks)
+    recorder.detach()
+    return path
+
+
+@pytest.fixture(scope='module')
+def archive(tmp_path_factory):
+    '''Сеанс 0 - оператор бездействует (провал по таймеру), сеанс 1 - закрывает все на 25-й секунде и звонит на 90-й'''
+    tmp = tmp_path_factory.mktemp('archive')
+    journals = [record(str(tmp / 'idle.lukj')), record(str(tmp / 'operator.lukj'), CLOSE_ALL)]
+    build_archive(str(tmp / 'archive'), journals)
+    return Archive(str(tmp / 'archive'))
+
+
+def test_merge_disjoint():
+    rng = np.random.default_rng(1)
+    rows = rng.permutation(1000)
+    a, b = np.sort(rows[:300]), np.sort(rows[300:])
+    assert np.array_equal(_merge(a, b), np.arange(1000))
+    assert np.array_equal(_merge(a, b[:0]), a)
+
+
+def test_rows_by_name_kind_and_session(archive):
+    temp = archive.rows(name='temp')
+    assert len(temp) and np.all(np.diff(temp) > 0)
+    assert np.all(archive.kind[temp] == VAR)
+    assert np.all(archive.kind[archive.rows(name='сс')] == STATE)
+    assert len(archive.rows(kind=END)) == 2
+    lo, hi = archive.session_start[1], archive.session_start[2]
+    assert np.array_equal(archive.rows(session=1), np.arange(lo, hi))
+    in_session = archive.rows(name='temp', session=1)
+    assert np.all((in_session >= lo) & (in_session < hi))
+    assert np.array_equal(in_session, temp[(temp >= lo) & (temp < hi)])
+    assert len(archive.rows(name='нет_такого')) == 0
+
+
+def test_evaluate_points_are_union_of_operands(archive):
+    points, satisfied = archive.evaluate('temp > crit_t')
+    assert np.array_equal(points, np.union1d(archive.rows(name='temp'), archive.rows(name='crit_t')))
+    assert len(satisfied) == len(points)
+
+
+def test_evaluate_name_compared_with_itself(archive):
+    temp = archive.rows(name='temp')
+    points, satisfied = archive.evaluate('temp == temp')
+    assert np.array_equal(points, temp)
+    assert satisfied.all()
+    points, satisfied = archive.evaluate('temp > temp')
+    assert np.array_equal(points, temp)
+    assert not satisfied.any()
+
+
+def test_evaluate_rejects_unknown_name_and_syntax(archive):
+    with pytest.raises(ValueError):
+        archive.evaluate('давление > 1')
+    with pytest.raises(ValueError):
+        archive.evaluate('temp >')
+
+
+def test_first_and_results(archive):
+    assert archive.first(archive.where('temp > crit_t')) == pytest.approx([19.0, 19.0])
+    assert archive.first(archive.where('сс == 1')) == pytest.approx([19.1, 19.1])
+    codes, times = archive.results()
+    assert codes.tolist() == [1, 0]
+    assert times == pytest.approx([79.1, 90.0])
+
+
+def test_between(archive):
+    t0, t1, duration = archive.between('temp > crit_t', 'зугт == 1')
+    assert t0 == pytest.approx([19.0, 19.0])
+    assert np.isnan(t1[0]) and np.isnan(duration[0])  # оператор не закрыл запорное устройство
+    assert t1[1] == pytest.approx(25.0)
+    assert duration[1] == pytest.approx(6.0)
+
+
+def test_between_condition_already_held(archive):
+    # crit_t задана до превышения температуры: условие stop выполнено уже в момент start
+    t0, t1, duration = archive.between('temp > crit_t', 'crit_t > 0')
+    assert np.array_equal(t1, t0)
+    assert duration == pytest.approx([0.0, 0.0])
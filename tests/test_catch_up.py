@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+'''Догон пропущенных сроков повторяемых действий (luk_op_actions, ScenarioEngine.periodic_calls)
+на виртуальных часах: цикл контроллера "зависает" на 3.2 с, и действие с периодом 1 с пропускает два срока.
+Первое срабатывание повторяемого действия - через период после старта'''
+
+import pytest
+
+from luk_op_actions import due_periods, SKIP, BURST, MERGE
+from luk_op_engine import ScenarioEngine, VirtualClock
+
+
+def run(policy, merge=True, stall_at=2.5, stall=3.2, stop_at=8.0):
+    '''Прогнать сценарий из одного действия с периодом 1 с; вернуть (контроллер, моменты вызовов, вызовы merge)'''
+    clock = VirtualClock()
+    engine = ScenarioEngine(clock=clock)
+    engine.log = lambda *args, **kwargs: None
+    engine.catch_up = policy
+    calls, merged = [], []
+
+    def tick():
+        calls.append(engine.current_time)
+    if merge:
+        tick.merge = lambda n: merged.append((engine.current_time, n))
+
+    def hang():
+        clock.t += stall  # долгая операция в цикле контроллера
+    engine.begin_scenario({'tick': (tick, None, 1.0, 0)})
+    engine.call_at(stall_at, hang)
+    engine.call_at(stop_at, engine.stop)
+    while engine.active:
+        deadline = engine.step()
+        if not engine.active or not clock.wait_until(None, deadline):
+            break
+    return engine, calls, merged
+
+
+@pytest.mark.parametrize('last, period, now, expected', [
+    (0.0, 1.0, 1.0, 1),
+    (0.0, 1.0, 1.9, 1),
+    (0.0, 1.0, 3.5, 3),
+    (0.0, 1.0, 0.5, 1),  # раньше срока - все равно один
+    (0.0, 0.0, 5.0, 1),  # без периода догона нет
+])
+def test_due_periods(last, period, now, expected):
+    assert due_periods(last, period, now) == expected
+
+
+def test_no_stall_no_overruns():
+    engine, calls, _ = run(SKIP, stall=0.0)
+    assert calls == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0]
+    stats = engine.overrun_stats()
+    assert (stats['fired'], stats['overruns'], stats['missed'], stats['max_lag']) == (7, 0, 0, 0.0)
+    assert stats['worst'] is None
+
+
+def test_skip_runs_once_and_keeps_grid():
+    engine, calls, merged = run(SKIP)
+    assert calls == pytest.approx([1.0, 2.0, 5.7, 6.0, 7.0])  # сроки 3, 4, 5 - один вызов, дальше по сетке
+    assert merged == []
+    stats = engine.overrun_stats()
+    assert (stats['fired'], stats['overruns'], stats['missed']) == (5, 1, 2)
+    assert stats['max_lag'] == pytest.approx(2.7)
+    assert stats['worst'] == 'tick'
+    assert engine.actions.by_key['tick'].runs == 5
+
+
+def test_burst_runs_every_missed_period():
+    engine, calls, _ = run(BURST)
+    assert calls == pytest.approx([1.0, 2.0, 5.7, 5.7, 5.7, 6.0, 7.0])
+    assert engine.actions.by_key['tick'].runs == 7
+    assert engine.overrun_stats()['missed'] == 2
+
+
+def test_burst_limited_by_max_burst():
+    engine, calls, _ = run(BURST, stall=20.0, stop_at=30.0)
+    assert calls.count(pytest.approx(22.5)) == ScenarioEngine.MAX_BURST
+    assert engine.overrun_stats()['missed'] == 19
+
+
+def test_merge_calls_merged_function_once():
+    engine, calls, merged = run(MERGE)
+    assert calls == pytest.approx([1.0, 2.0, 6.0, 7.0])
+    assert merged == [(pytest.approx(5.7), 3)]
+    assert engine.actions.by_key['tick'].runs == 5
+
+
+def test_merge_without_merged_function_bursts():
+    _, calls, _ = run(MERGE, merge=False)
+    assert calls == pytest.approx([1.0, 2.0, 5.7, 5.7, 5.7, 6.0, 7.0])
+
+
+def test_action_policy_overrides_controller():
+    clock = VirtualClock()
+    engine = ScenarioEngine(clock=clock)
+    calls = []
+
+    def tick():
+        calls.append(engine.current_time)
+    tick.catch_up = BURST
+    engine.begin_scenario({'tick': (tick, None, 1.0, 0)})
+    clock.t = 1.0
+    engine.step()  # первое срабатывание
+    clock.t = 4.5
+    engine.step()  # наступили сроки 2, 3 и 4
+    assert engine.catch_up == SKIP
+    assert calls == [1.0, 4.5, 4.5, 4.5]
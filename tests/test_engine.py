@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+'''Планировщик ScenarioEngine на виртуальных часах: очередь сроков, step(), условия и задержки старта'''
+
+import pytest
+
+from luk_op_actions import MIN_PERIOD, DONE, DISABLED, PERIODIC
+from luk_op_engine import ScenarioEngine, VirtualClock
+
+ONCE = -1
+
+
+def make_engine():
+    return ScenarioEngine(clock=VirtualClock())
+
+
+def run(engine, scenario, until, events=()):
+    '''Выполнить сценарий циклом execute_scenario до момента until; events - пары (момент, функция) как
+    внешние события. Возвращает число итераций цикла'''
+    for at, func in events:
+        engine.call_at(at, func)
+    engine.call_at(until, engine.stop)
+    step = engine.step
+    iterations = []
+
+    def counted_step():
+        iterations.append(engine.current_time)
+        return step()
+    engine.step = counted_step
+    engine.execute_scenario(scenario)
+    return len(iterations)
+
+
+def recorder(engine, calls, name):
+    return lambda: calls.append((name, engine.current_time))
+
+
+def test_one_shot_actions_run_in_deadline_order():
+    engine = make_engine()
+    calls = []
+    scenario = {key: (recorder(engine, calls, key), None, ONCE, delay)
+                for key, delay in (('в', 3.0), ('а', 1.0), ('б', 2.0), ('сразу', 0))}
+    run(engine, scenario, 10.0)
+    assert calls == [('сразу', 0), ('а', 1.0), ('б', 2.0), ('в', 3.0)]
+    assert all(record.state == DONE for record in engine.actions.records)
+
+
+def test_step_returns_next_deadline():
+    engine = make_engine()
+    engine.begin_scenario({'а': (lambda: None, None, ONCE, 2.0), 'б': (lambda: None, None, ONCE, 5.0)})
+    assert engine.step() == 2.0
+    engine.clock.t = 2.0
+    assert engine.step() == 5.0
+    engine.clock.t = 5.0
+    assert engine.step() is None  # больше ничего не запланировано
+    engine.call_at(7.0, lambda: None)
+    assert engine.step() == 7.0
+
+
+def test_earlier_schedule_replaces_later_and_stale_entries_skipped():
+    engine = make_engine()
+    calls = []
+    engine.begin_scenario({'а': (recorder(engine, calls, 'а'), None, ONCE, 5.0)})
+    record = engine.actions.by_key['а']
+    engine.schedule(record, 1.0)
+    engine.schedule(record, 3.0)  # более поздний срок не вытесняет ранний
+    assert record.due == 1.0
+    assert len(engine._queue) == 2
+    engine.clock.t = 1.0
+    engine.step()  # задержка еще не истекла: действие перепланировано на 5
+    assert calls == [] and record.due == 5.0
+    engine.clock.t = 5.0
+    engine.step()
+    assert calls == [('а', 5.0)]
+    assert engine._queue == []  # устаревшая запись на 3 снята из очереди без выполнения
+
+
+def test_condition_waits_for_change_of_its_variables():
+    engine = make_engine()
+    calls, checks = [], []
+
+    def hot():
+        checks.append(engine._current_time)  # без записи в зависимости условия
+        return engine.temp > 100
+    scenario = {'перегрев': (recorder(engine, calls, 'перегрев'), hot, ONCE, 0)}
+    events = [(2.0, lambda: setattr(engine, 'timer', 30)),  # условие не читает timer
+              (4.0, lambda: setattr(engine, 'temp', 90)),
+              (6.0, lambda: setattr(engine, 'temp', 150))]
+    run(engine, scenario, 10.0, events)
+    assert calls == [('перегрев', 6.0)]
+    assert checks == [0, 4.0, 6.0]  # без опроса: только при изменении temp
+
+
+def test_time_condition_polled():
+    engine = make_engine()
+    calls = []
+    late = lambda: engine.current_time - engine.start_time >= 1.05
+    run(engine, {'поздно': (recorder(engine, calls, 'поздно'), late, ONCE, 0)}, 5.0)
+    assert calls == [('поздно', pytest.approx(1.1))]
+
+
+def test_reset_timer_regates_delayed_action():
+    engine = make_engine()
+    calls = []
+    scenario = {'после_задержки': (recorder(engine, calls, 'после_задержки'), None, ONCE, 5.0)}
+    run(engine, scenario, 20.0, [(3.0, engine.reset_timer)])
+    assert calls == [('после_задержки', 8.0)]
+
+
+def test_disabled_action_not_run_and_enable_restarts_delay():
+    engine = make_engine()
+    calls = []
+    scenario = {'а': (recorder(engine, calls, 'а'), None, ONCE, 2.0)}
+    events = [(1.0, lambda: engine.switch_action('а', False)),
+              (4.0, lambda: engine.switch_action('а', True))]
+    engine.begin_scenario(scenario)
+    for at, func in events:
+        engine.call_at(at, func)
+    engine.clock.t = 1.0
+    engine.step()
+    assert engine.actions.by_key['а'].state == DISABLED
+    engine.clock.t = 2.0
+    engine.step()
+    assert calls == []
+    engine.clock.t = 4.0
+    engine.step()  # задержка уже прошла от start_time - действие выполняется сразу
+    assert calls == [('а', 4.0)]
+
+
+def test_periodic_action_on_grid():
+    engine = make_engine()
+    calls = []
+    run(engine, {'тик': (recorder(engine, calls, 'тик'), None, 0.5, 1.0)}, 3.2)
+    assert [t for _, t in calls] == [1.0, 1.5, 2.0, 2.5, 3.0]  # первый раз - по окончании задержки
+
+
+@pytest.mark.parametrize('period', [0, 0.0, MIN_PERIOD / 10])
+def test_period_below_minimum_clamped(period):
+    engine = make_engine()
+    calls = []
+    iterations = run(engine, {'тик': (recorder(engine, calls, 'тик'), None, period, 0)}, 1.0)
+    record = engine.actions.by_key['тик']
+    assert record.period == MIN_PERIOD and record.state == PERIODIC
+    assert len(calls) == pytest.approx(1.0 / MIN_PERIOD, abs=2)
+    assert iterations < 2 * len(calls) + 10  # каждая итерация продвигает время
+    times = [t for _, t in calls]
+    assert all(b - a >= MIN_PERIOD - 1e-9 for a, b in zip(times, times[1:]))
+
+
+def test_period_zero_with_time_condition_terminates():
+    engine = make_engine()
+    calls = []
+    cond = lambda: engine.current_time >= 0.5
+    run(engine, {'тик': (recorder(engine, calls, 'тик'), cond, 0, 0)}, 1.0)
+    assert calls and calls[0][1] == pytest.approx(0.5, abs=MIN_PERIOD)
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+'''Журнал сеанса (luk_op_journal): запись прогона без интерфейса, чтение, состояние на момент и переход'''
+
+import os
+
+import numpy as np
+import pytest
+
+from luk_op_headless import HeadlessController
+from luk_op_journal import JournalReader, Recorder, Replayer, RECORD, STATE, VAR, CLICK, END, SNAPSHOT
+from luk_op_elements import BUTTONS
+from luk_op_scenario import load_scenario
+
+SCENARIO = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scenarios', 'test.json')
+CLICKS = [(25.0, button) for button, _, _ in BUTTONS] + [(90.0, 'btn_call')]
+SAMPLES = (0.03, 15.03, 19.05, 25.03, 47.77, 89.93)  # моменты между сроками действий сценария
+
+
+@pytest.fixture(scope='module')
+def session(tmp_path_factory):
+    '''Прогон test.json с записью журнала; возвращает (путь журнала, состояния и переменные в моменты SAMPLES)'''
+    path = str(tmp_path_factory.mktemp('journal') / 'run.lukj')
+    sc = HeadlessController()
+    recorder = Recorder(path, scenario='test').attach(sc, [b for b, _, _ in BUTTONS] + ['btn_call'])
+    seen = {}
+
+    def sample(at):
+        seen[at] = (dict(zip(sc.states.codes, sc.states.snapshot())),
+                    {name: getattr(sc, '_' + name) for name in ('temp', 'crit_t', 'timer')})
+    start = sc.clock.now()
+    for at in SAMPLES:
+        sc.call_at(start + at, lambda at=at: sample(at))
+    assert sc.run_plan(load_scenario(SCENARIO, use_cache=False), CLICKS) == 0
+    sample('end')
+    recorder.detach()
+    return path, seen
+
+
+def test_header_and_records(session):
+    path, _ = session
+    reader = JournalReader(path)
+    assert reader.header['meta'] == {'scenario': 'test'}
+    assert reader.buttons[-1] == 'btn_call'
+    times = reader.records['time']
+    assert np.all(np.diff(times) >= 0)
+    kinds = reader.records['kind']
+    assert set(np.unique(kinds)) == {STATE, VAR, CLICK, END, SNAPSHOT}
+    assert (kinds == CLICK).sum() == len(CLICKS)
+    end = reader.records[kinds == END]
+    assert len(end) == 1 and end['arg'][0] == 0
+    assert reader.duration == pytest.approx(90.0)
+
+
+def test_snapshots_every_interval(session):
+    reader = JournalReader(session[0])
+    assert reader.snapshot_times[0] == 0.0
+    assert np.all(np.diff(reader.snapshot_times) >= reader.header['snapshot_interval'])
+    for start in reader.snapshots:  # за снимком - полное состояние
+        n = reader.records['arg'][start]
+        assert n == len(reader.codes) + len(reader.variables)
+        block = reader.records['kind'][start + 1:start + 1 + n]
+        assert np.all(np.isin(block, (STATE, VAR)))
+
+
+@pytest.mark.parametrize('at', SAMPLES)
+def test_state_at_matches_live_state(session, at):
+    path, seen = session
+    states, variables = JournalReader(path).state_at(at)
+    live_states, live_variables = seen[at]
+    assert states == live_states
+    assert variables == pytest.approx(live_variables)
+
+
+def test_events_skip_snapshot_duplicates(session):
+    reader = JournalReader(session[0])
+    events = [event for _, event in reader.events(0, len(reader))]
+    in_snapshots = sum(int(reader.records['arg'][s]) for s in reader.snapshots)
+    states = (reader.records['kind'] == STATE).sum() + (reader.records['kind'] == VAR).sum()
+    assert sum(e['event'] in ('state', 'var') for e in events) == states - in_snapshots
+    assert events[-1] == {'event': 'ended', 'code': 0}
+
+
+@pytest.mark.parametrize('at', [19.05, 47.77])
+def test_seek_then_play_reaches_final_state(session, at):
+    path, seen = session
+    reader = JournalReader(path)
+    states = {}
+    events = []
+
+    def sink(event):
+        events.append(event)
+        if event['event'] == 'state':
+            states[event['code']] = event['state']
+    replayer = Replayer(reader, sink, speed=None)
+    replayer.seek(at)
+    assert states == seen[at][0]  # переход выставляет состояние без промежуточных событий
+    assert events[-1]['event'] == 'temp' and events[-1]['temp'] == pytest.approx(seen[at][1]['temp'])
+    assert replayer.index == reader.find(at)
+    replayer.run()
+    assert replayer.finished
+    assert states == seen['end'][0]
+    assert events[-1] == {'event': 'ended', 'code': 0}
+
+
+def test_seek_clamped_to_journal(session):
+    reader = JournalReader(session[0])
+    replayer = Replayer(reader, lambda event: None, speed=None)
+    replayer.seek(-5)
+    assert replayer.position == 0.0
+    replayer.seek(1e6)
+    assert replayer.position == reader.duration and replayer.finished
+
+
+def test_truncated_record_dropped(session, tmp_path):
+    path = str(tmp_path / 'cut.lukj')
+    with open(session[0], 'rb') as f:
+        data = f.read()
+    with open(path, 'wb') as f:
+        f.write(data[:-RECORD.size // 2])  # сеанс прерван посреди записи
+    assert len(JournalReader(path)) == len(JournalReader(session[0])) - 1
+
+
+def test_not_a_journal(tmp_path):
+    path = tmp_path / 'bad.lukj'
+    path.write_bytes(b'NOPE' + bytes(16))
+    with pytest.raises(ValueError):
+        JournalReader(str(path))
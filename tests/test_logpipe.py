@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+'''Буферизованный журнал (luk_op_logpipe.LogPipeline): пачки для интерфейса и переполнение буфера'''
+
+import pytest
+
+from luk_op_logpipe import LogPipeline
+
+
+@pytest.fixture
+def pipeline(tmp_path):
+    pipeline = LogPipeline(console=False, path=str(tmp_path / 'run.log'), gui_capacity=5)
+    yield pipeline
+    pipeline.close()
+
+
+def test_drain_returns_entries_in_order(pipeline):
+    for i in range(3):
+        pipeline.write('m%d' % i, 'warning' if i == 1 else 'info', 'сс' if i == 2 else None)
+    entries = pipeline.drain()
+    assert [(e.msg, e.level, e.code) for e in entries] == [('m0', 'info', None), ('m1', 'warning', None),
+                                                          ('m2', 'info', 'сс')]
+    assert pipeline.drain() == []
+    assert pipeline.dropped == 0
+
+
+def test_overflow_counted_and_reported_once(pipeline):
+    for i in range(12):
+        pipeline.write('m%d' % i)
+    entries = pipeline.drain()
+    assert pipeline.dropped == 7
+    assert entries[0].level == 'warning' and '7' in entries[0].msg and pipeline.path in entries[0].msg
+    assert [e.msg for e in entries[1:]] == ['m7', 'm8', 'm9', 'm10', 'm11']
+    pipeline.write('x')
+    assert [e.msg for e in pipeline.drain()] == ['x']
+
+
+def test_file_keeps_every_entry(pipeline):
+    for i in range(12):
+        pipeline.write('m%d' % i)
+    pipeline.drain()
+    pipeline.close()
+    with open(pipeline.path, encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    assert [line.split(' ', 2)[2] for line in lines[:12]] == ['m%d' % i for i in range(12)]
+    assert 'не показано записей - 7' in lines[12]
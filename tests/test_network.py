@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+'''Сеть условий (luk_op_network): общие узлы и сброс запомненных значений по ключу'''
+
+from luk_op_network import ConditionNetwork, signature
+from luk_op_scenario import BindContext, parse_condition
+
+
+# Контроллер и элемент, считающие чтения своих значений
+class Controller:
+    def __init__(self):
+        self.reads = {'temp': 0, 'crit_t': 0}
+        self._temp, self._crit_t = 60, 200
+
+    @property
+    def temp(self):
+        self.reads['temp'] += 1
+        return self._temp
+
+    @property
+    def crit_t(self):
+        self.reads['crit_t'] += 1
+        return self._crit_t
+
+
+class Elem:
+    store = None
+
+    def __init__(self, state=0):
+        self._state = state
+        self.reads = 0
+
+    @property
+    def state(self):
+        self.reads += 1
+        return self._state
+
+
+def make_context():
+    controller = Controller()
+    elems = {'втг': Elem(), 'зугт': Elem(1)}
+    return BindContext(controller, elems, network=ConditionNetwork())
+
+
+def test_identical_conditions_share_one_node():
+    ctx = make_context()
+    first = ctx.bind(parse_condition('temp > crit_t'))
+    second = ctx.bind(parse_condition('temp  >  crit_t'))
+    assert first is second
+    assert ctx.network.refs == 2
+    assert len(ctx.network) == 1
+
+
+def test_subcondition_shared_between_conditions():
+    ctx = make_context()
+    hot = ctx.bind(parse_condition('temp > crit_t'))
+    ctx.bind(parse_condition('temp > crit_t or втг == 1'))
+    ctx.bind(parse_condition('not temp > crit_t'))
+    assert len(ctx.network) == 4  # temp > crit_t связано один раз; еще втг == 1, "or" и "not"
+    assert ctx.network.refs == 6
+    assert ctx.network.nodes[signature(parse_condition('temp > crit_t'))] is hot
+
+
+def test_memo_kept_until_dependency_invalidated():
+    ctx = make_context()
+    hot = ctx.bind(parse_condition('temp > crit_t'))
+    assert hot() is False
+    assert hot() is False
+    assert ctx.controller.reads == {'temp': 1, 'crit_t': 1}
+    ctx.controller._temp = 250
+    assert hot() is False  # значение запомнено до сообщения об изменении
+    ctx.network.invalidate('sc.temp')
+    assert hot() is True
+    assert ctx.controller.reads == {'temp': 2, 'crit_t': 2}
+
+
+def test_invalidation_is_per_key():
+    ctx = make_context()
+    elems = ctx.elems
+    hot = ctx.bind(parse_condition('temp > crit_t'))
+    closed = ctx.bind(parse_condition('зугт == 1'))
+    either = ctx.bind(parse_condition('temp > crit_t or зугт == 1'))
+    assert (hot(), closed(), either()) == (False, True, True)
+    reads = elems['зугт'].reads
+    ctx.network.invalidate('sc.temp')
+    assert (hot(), closed(), either()) == (False, True, True)
+    assert elems['зугт'].reads == reads  # узлы, не читающие temp, не пересчитываются
+    assert ctx.controller.reads['temp'] == 2
+    elems['зугт']._state = 0
+    ctx.network.invalidate('зугт')
+    assert (hot(), closed(), either()) == (False, False, False)
+    assert ctx.controller.reads['temp'] == 2  # "or" пересчитан, но его общий подузел temp > crit_t - нет
+
+
+def test_time_dependent_nodes_not_memoized():
+    ctx = make_context()
+    ctx.controller.current_time = 0
+    late = ctx.bind(parse_condition('current_time > 10'))
+    assert late not in ctx.network.memos
+    ctx.controller.current_time = 11
+    assert late() is True
+
+
+def test_watched_root_and_wrapper():
+    ctx = make_context()
+    network = ctx.network
+    hot = ctx.bind(parse_condition('temp > crit_t'))
+    network.watch(hot)
+    assert network.watches(hot)
+    assert network.watched['sc.temp'] == [hot]
+
+    def wrapper():
+        return hot()
+    assert network.watch_as(hot, wrapper)
+    assert network.watches(wrapper)
+    assert wrapper in network.watched['sc.crit_t']
+    network.unwatch(wrapper)
+    assert not network.watches(wrapper)
+    assert network.watched['sc.temp'] == [hot]
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+'''Масштабирование окна (LukWidget.scale_elems): от геометрии из дизайнера, серия изменений размера -
+одно масштабирование. Окно создается без экрана (платформа Qt offscreen)'''
+
+import gc
+import os
+import tempfile
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import pytest
+from PyQt5 import QtWidgets
+from PyQt5.QtTest import QTest
+
+from luk_op_proto import LukWidget, ScenarioController, Element
+from luk_op_elements import ELEMENTS
+
+NAMES = ('btn_gt', 'btn_call', 'log_view')
+
+
+@pytest.fixture(scope='module')
+def controller():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    _apps.append(app)  # приложение живет до конца процесса: окна тестов создаются в нем
+    sc = ScenarioController(log_file=None)
+    sc.log_pipeline.writer.console = False
+    yield sc
+    sc.log_pipeline.close()
+    del sc
+    gc.collect()  # контроллер (QThread) освобождается, пока приложение еще существует
+
+
+_apps = []
+
+
+@pytest.fixture
+def window(controller):
+    app = QtWidgets.QApplication.instance()
+    sc = controller
+    with tempfile.TemporaryDirectory() as tmp:
+        window = LukWidget(sc, log_spill_path=os.path.join(tmp, 'spill.log'))
+        window.log_timer.stop()
+        for code, widget_name, initial_state in ELEMENTS:
+            window.add_sprite_element(Element(sc, code, getattr(window, widget_name), initial_state))
+        window.show()
+        QTest.qWait(2 * window.RELAYOUT_INTERVAL)
+        yield window
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+
+
+def geometry(window):
+    return {name: getattr(window, name).geometry().getRect() for name in NAMES}
+
+
+def test_scaled_from_design_geometry(window):
+    design = geometry(window)
+    width, height = window.width(), window.height()
+    window.resize(round(width * 1.5), round(height * 1.5))
+    window.scale_elems()
+    assert window.scale == pytest.approx(1.5, abs=1e-2)
+    for name, (x, y, w, h) in design.items():
+        assert geometry(window)[name] == (round(x * window.scale), round(y * window.scale),
+                                          round(w * window.scale), round(h * window.scale))
+
+
+def test_no_drift_after_many_resizes(window):
+    design = geometry(window)
+    width, height = window.width(), window.height()
+    for factor in (1.13, 0.71, 1.37, 0.93, 1.61, 0.87, 1.09):
+        window.resize(round(width * factor), round(height * factor))
+        window.scale_elems()
+    window.resize(width, height)
+    window.scale_elems()
+    assert window.scale == 1.0
+    assert geometry(window) == design
+
+
+def test_resize_burst_coalesced(window):
+    fired = []
+    window.relayout_timer.setInterval(200)
+    window.relayout_timer.timeout.connect(lambda: fired.append(window.height()))
+    design = geometry(window)
+    width, height = window.width(), window.height()
+    for step in range(1, 31):
+        window.resize(width + step * 4, height + step * 3)
+        QtWidgets.QApplication.processEvents()
+    assert fired == [] and window.relayout_timer.isActive()
+    assert geometry(window) == design  # до конца серии виджеты не двигаются
+    QTest.qWait(400)
+    assert fired == [height + 90]  # одно масштабирование под итоговый размер
+    assert window.scale == pytest.approx((height + 90) / height)
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+'''Проверка описания сценария при компиляции (luk_op_scenario.compile_scenario)'''
+
+import pytest
+
+from luk_op_actions import MIN_PERIOD
+from luk_op_scenario import compile_scenario, ScenarioError
+
+
+def plan_with(**fields):
+    return compile_scenario({'actions': {'действие': dict({'do': ['set_state', 'сс', 1]}, **fields)}}, 'проверка')
+
+
+@pytest.mark.parametrize('period', [-1, MIN_PERIOD, 0.1, 5])
+def test_valid_periods(period):
+    assert plan_with(period=period).actions[0].period == period
+
+
+@pytest.mark.parametrize('period', [0, 0.0, MIN_PERIOD / 2, -0.5, -2])
+def test_unrunnable_period_rejected(period):
+    with pytest.raises(ScenarioError, match='period'):
+        plan_with(period=period)
+
+
+def test_period_must_be_number():
+    with pytest.raises(ScenarioError, match='period'):
+        plan_with(period=True)
+
+
+def test_negative_delay_rejected():
+    with pytest.raises(ScenarioError, match='delay'):
+        plan_with(delay=-1)
+
+
+def test_all_errors_reported_together():
+    with pytest.raises(ScenarioError) as info:
+        compile_scenario({'actions': {'а': {'do': ['set_state', 'сс', 1], 'period': 0},
+                                      'б': {'do': ['нет_такой']}}})
+    assert 'а:' in str(info.value) and 'б:' in str(info.value)
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+'''Хранилище состояний элементов (luk_op_state.StateStore): интернирование кодов и битовые маски'''
+
+import sys
+import threading
+
+import pytest
+
+from luk_op_state import StateStore
+
+
+@pytest.fixture
+def store():
+    store = StateStore()
+    for code, state in (('зугт', 0), ('зуку', 0), ('втг', 1), ('сс', 2)):
+        store.add(code, state)
+    return store
+
+
+def test_codes_interned_to_indexes(store):
+    assert len(store) == 4
+    assert store.codes == ['зугт', 'зуку', 'втг', 'сс']
+    assert [store.index[code] for code in store.codes] == [0, 1, 2, 3]
+    code = ''.join(['в', 'т', 'г'])  # равная, но другая строка
+    assert store.codes[store.add(code, 1)] is sys.intern(code)
+    assert len(store) == 4  # повторная регистрация не добавляет элемент
+
+
+def test_readd_sets_state(store):
+    assert store.add('втг', 0) == 2
+    assert store.value('втг') == 0
+    assert store.match(*store.mask([('втг', 0)]))
+
+
+def test_set_reports_change(store):
+    assert store.set(0, 1) is True
+    assert store.set(0, 1) is False
+    assert store.get(0) == 1 and store.value('зугт') == 1
+    assert store.snapshot() == [1, 0, 1, 2]
+
+
+def test_masks_follow_values(store):
+    assert store.ones == 0b0100
+    assert store.zeros == 0b0011
+    store.set(3, 1)  # 2 -> 1: бит появляется в ones
+    store.set(2, 5)  # 1 -> 5: бит уходит из обеих масок
+    assert store.ones == 0b1000
+    assert store.zeros == 0b0011
+
+
+def test_match(store):
+    closed = store.mask([('зугт', 0), ('зуку', 0), ('втг', 1)])
+    assert store.match(*closed)
+    store.set(store.index['зуку'], 1)
+    assert not store.match(*closed)
+    assert store.match(*store.mask([('зуку', 1), ('втг', 1), ('зугт', 0)]))
+    assert store.match(0, 0)  # пустое условие выполнено
+
+
+def test_mask_rejects_other_states(store):
+    with pytest.raises(ValueError):
+        store.mask([('сс', 2)])
+
+
+def test_concurrent_writers_keep_masks_consistent():
+    store = StateStore()
+    for i in range(64):
+        store.add('э%d' % i, 0)
+
+    def writer(offset):
+        for n in range(2000):
+            i = (n * 7 + offset) % 64
+            store.set(i, (n + offset) % 3)
+    threads = [threading.Thread(target=writer, args=(k,)) for k in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    values = store.snapshot()
+    assert store.ones == sum(1 << i for i, v in enumerate(values) if v == 1)
+    assert store.zeros == sum(1 << i for i, v in enumerate(values) if v == 0)